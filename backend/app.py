@@ -1,24 +1,31 @@
+import asyncio
+import contextlib
 import os
 import threading
+import time
+from collections import deque
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, AsyncIterator, Iterator, Tuple
 
-from fastapi import FastAPI, WebSocket, WebSocketDisconnect, Request
-from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import HTMLResponse, JSONResponse
-from fastapi.staticfiles import StaticFiles
+_IMPORT_STARTED = time.perf_counter()
+_IMPORT_STARTED_WALL = time.time()
 
-from .llm import chat_once, chat_stream
+from fastapi import FastAPI, WebSocket, WebSocketDisconnect, Request, Response
+from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import HTMLResponse, JSONResponse, StreamingResponse
+
+from . import archive, coalesce
+from .llm import POOL_KEEPALIVE, chat_once, chat_stream, prewarm as prewarm_sdks, prewarm_provider, sdk, sdk_import_ms
+from .storage import ConversationNotFound, ConversationStore, MessageNotFound, VersionConflict, clean_message, new_message_id
+from . import streams
+from .reasoning import ANSWER, ANSWER_RESET, REASONING, ReasoningDelta, split_reasoning
+from .static import AssetFiles, IndexPage, live_assets
+from .usage import UsageStore
 from dotenv import load_dotenv
 import platform
 import getpass
 import hashlib
 import uuid
-import httpx
-try:
-    import ollama as ollama_sdk
-except Exception:
-    ollama_sdk = None  # type: ignore
 
 ROOT = Path(__file__).resolve().parents[1]
 # Prefer the built React app under web/dist, fall back to legacy frontend/
@@ -28,9 +35,76 @@ FRONTEND_DIR = WEB_DIST_DIR if WEB_DIST_DIR.exists() else LEGACY_FRONTEND_DIR
 ASSETS_DIR = ROOT / "Assets"
 DATA_DIR = ROOT / "data" / "conversations"
 DATA_DIR.mkdir(parents=True, exist_ok=True)
+# Write-behind is opt-in (FERN_WRITE_BEHIND_MS, see storage.py): it is only
+# safe while a single process owns the store
+store = ConversationStore(DATA_DIR)
 SETTINGS_PATH = ROOT / "settings.json"
+usage_store = UsageStore(ROOT / "data" / "usage")
+
+# --- Startup ---
+# Timings for the cold-start report (GET /api/startup). Launchers can export
+# FERN_LAUNCH_T0 (epoch seconds) when they spawn the backend so the report
+# covers interpreter boot too; otherwise it starts at this module's import.
+STARTUP: Dict[str, Any] = {}
+STARTUP_BUDGET_MS = int(os.environ.get("FERN_STARTUP_BUDGET_MS", "3000"))
+# Provider SDKs are imported in the background shortly after startup so the
+# first chat does not pay for them; 0 disables, leaving them fully lazy
+SDK_PREWARM_DELAY = float(os.environ.get("FERN_PREWARM_SDKS_AFTER", "1.0"))
+# Background conversion of stored conversations to the configured format
+CONV_MIGRATE_DELAY = 5.0
+
+
+def _launch_t0() -> float:
+    try:
+        return float(os.environ["FERN_LAUNCH_T0"])
+    except (KeyError, ValueError):
+        return _IMPORT_STARTED_WALL
+
+
+async def _resolve_static_assets() -> None:
+    # Off the ready path: builds without a Vite manifest need a scan of the bundles
+    started = time.perf_counter()
+    static_files.live = await asyncio.to_thread(live_assets, FRONTEND_DIR)
+    STARTUP["static_assets_ms"] = int((time.perf_counter() - started) * 1000)
+
+
+async def _migrate_conversations_later() -> None:
+    # Converts snapshots left in another format (see FERN_CONV_COMPRESSION)
+    await asyncio.sleep(CONV_MIGRATE_DELAY)
+    converted, before, after = await store.migrate_in_background()
+    if converted:
+        print(f"[storage] converted {converted} conversations to {store.compression}: {before} -> {after} bytes")
+
+
+async def _prewarm_sdks_later() -> None:
+    await asyncio.sleep(SDK_PREWARM_DELAY)
+    started = time.perf_counter()
+    await asyncio.to_thread(prewarm_sdks)
+    STARTUP["sdk_prewarm_ms"] = int((time.perf_counter() - started) * 1000)
+
+
+@contextlib.asynccontextmanager
+async def lifespan(app: FastAPI):
+    started = time.perf_counter()
+    _machine_guard_wipe_if_mismatch()
+    index_page.load()
+    STARTUP["lifespan_ms"] = int((time.perf_counter() - started) * 1000)
+    STARTUP["ready_ms"] = int((time.time() - _launch_t0()) * 1000)
+    prewarm = asyncio.create_task(_prewarm_sdks_later()) if SDK_PREWARM_DELAY > 0 else None
+    resolve = asyncio.create_task(_resolve_static_assets())
+    migrate = asyncio.create_task(_migrate_conversations_later()) if store.compression != "none" else None
+    try:
+        yield
+    finally:
+        resolve.cancel()
+        if migrate is not None:
+            migrate.cancel()
+        if prewarm is not None:
+            prewarm.cancel()
+        store.flush()
+
 
-app = FastAPI(title="ChatUI")
+app = FastAPI(title="ChatUI", lifespan=lifespan)
 
 # CORS for local dev/desktop
 app.add_middleware(
@@ -44,38 +118,70 @@ app.add_middleware(
 # Load environment variables from .env if present
 load_dotenv()
 
-# Serve static frontend
+# Serve static frontend. Hashed bundles from the current build are cached for
+# good; ones left behind by older builds are not served
+static_files = AssetFiles(directory=str(FRONTEND_DIR), check_dir=False)
+index_page = IndexPage(FRONTEND_DIR / "index.html")
 if FRONTEND_DIR.exists():
-    app.mount("/static", StaticFiles(directory=str(FRONTEND_DIR)), name="static")
+    app.mount("/static", static_files, name="static")
 if ASSETS_DIR.exists():
-    app.mount("/assets", StaticFiles(directory=str(ASSETS_DIR)), name="assets")
+    app.mount("/assets", AssetFiles(directory=str(ASSETS_DIR)), name="assets")
 
 
 # --- Conversation persistence helpers ---
-def _conv_path(cid: str) -> Path:
-    return DATA_DIR / f"{cid}.json"
+def _load_conv(cid: str) -> Dict[str, Any]:
+    return store.load(cid)
 
 
-def _now_iso() -> str:
-    from datetime import datetime, timezone
-    return datetime.now(timezone.utc).isoformat()
+def _save_conv(cid: str, conv: Dict[str, Any]) -> None:
+    store.save(cid, conv)
 
 
-def _load_conv(cid: str) -> Dict[str, Any]:
-    p = _conv_path(cid)
-    if p.exists():
+async def _record_turn(cid: str, messages: List[Dict], assistant: Dict[str, Any]) -> None:
+    """Persist a chat turn: the request messages plus the assistant reply."""
+    new_msgs = list(messages) + [assistant]
+    async with store.lock(cid):
+        conv = _load_conv(cid)
+        if conv.get("messages") and store.exists(cid):
+            store.append_messages(cid, new_msgs)
+            return
+        # Set a better title from the first user prompt if new
         try:
-            import json
-            return json.loads(p.read_text(encoding="utf-8"))
+            last_user = ""
+            for m in reversed(messages):
+                if m.get("role") == "user" and isinstance(m.get("content"), str):
+                    last_user = m["content"]
+                    break
+            if last_user:
+                conv["title"] = last_user[:40] + ("…" if len(last_user) > 40 else "")
         except Exception:
-            return {"id": cid, "title": "Conversation", "messages": []}
-    return {"id": cid, "title": "Conversation", "messages": []}
+            pass
+        conv["messages"] = [m for m in (clean_message(m) for m in new_msgs) if m]
+        _save_conv(cid, conv)
 
 
-def _save_conv(cid: str, conv: Dict[str, Any]) -> None:
-    import json
-    conv["updated_at"] = _now_iso()
-    _conv_path(cid).write_text(json.dumps(conv, indent=2), encoding="utf-8")
+async def _update_message(cid: str, mid: str, fields: Dict[str, Any], extend: bool = False) -> None:
+    async with store.lock(cid):
+        try:
+            (store.extend_message if extend else store.edit_message)(cid, mid, fields)
+        except (MessageNotFound, ConversationNotFound):
+            pass  # removed by another client while streaming
+
+
+def _etag(conv: Dict[str, Any]) -> str:
+    return f'"{int(conv.get("version") or 0)}"'
+
+
+def _if_match(request: Request) -> int | None:
+    """Parse an If-Match header carrying a conversation version."""
+    raw = (request.headers.get("if-match") or "").strip()
+    if not raw or raw == "*":
+        return None
+    raw = raw[2:] if raw.startswith("W/") else raw
+    try:
+        return int(raw.strip('"'))
+    except ValueError:
+        return -1  # never matches; forces a 412
 
 
 def read_settings() -> Dict[str, Any]:
@@ -153,23 +259,34 @@ def _machine_guard_wipe_if_mismatch() -> None:
     except Exception as e:
         print(f"[security] Machine guard error: {e}")
 
-# Run guard at import/startup
-_machine_guard_wipe_if_mismatch()
-
 
 @app.get("/")
-async def index():
-    index_path = FRONTEND_DIR / "index.html"
-    if index_path.exists():
-        return HTMLResponse(index_path.read_text(encoding="utf-8"))
-    return HTMLResponse("<h1>ChatUI</h1><p>Frontend not found.</p>")
+async def index(request: Request):
+    return index_page.response(request) or HTMLResponse("<h1>ChatUI</h1><p>Frontend not found.</p>")
 
 
 @app.get("/api/health")
 async def health():
+    if "first_health_ms" not in STARTUP:
+        _report_startup()
     return {"status": "ok"}
 
 
+def _report_startup() -> None:
+    STARTUP["first_health_ms"] = int((time.time() - _launch_t0()) * 1000)
+    print(
+        f"[startup] import {STARTUP.get('import_ms')} ms, lifespan {STARTUP.get('lifespan_ms')} ms, "
+        f"first health OK {STARTUP['first_health_ms']} ms after launch"
+    )
+    if STARTUP["first_health_ms"] > STARTUP_BUDGET_MS:
+        print(f"[startup] Cold start exceeded the {STARTUP_BUDGET_MS} ms budget")
+
+
+@app.get("/api/startup")
+async def startup_report():
+    return {**STARTUP, "sdk_import_ms": dict(sdk_import_ms), "budget_ms": STARTUP_BUDGET_MS}
+
+
 @app.get("/api/settings")
 async def get_settings(request: Request):
     data = read_settings()
@@ -241,12 +358,11 @@ async def save_settings(body: Dict[str, Any], request: Request):
 @app.get("/api/conversations")
 async def list_conversations():
     items = []
-    for f in sorted(DATA_DIR.glob("*.json")):
+    for cid in store.ids():
         try:
-            import json
-            data = json.loads(f.read_text(encoding="utf-8"))
+            data = store.load(cid)
             items.append({
-                "id": data.get("id") or f.stem,
+                "id": data.get("id") or cid,
                 "title": data.get("title") or "Conversation",
                 "pinned": bool(data.get("pinned")),
                 "updated_at": data.get("updated_at"),
@@ -272,18 +388,33 @@ async def create_conversation(body: Dict[str, Any]):
         "temperature": body.get("temperature"),
         "top_p": body.get("top_p"),
     }
-    _save_conv(cid, conv)
+    async with store.lock(cid):
+        _save_conv(cid, conv)
     return conv
 
 
 @app.get("/api/conversations/{cid}")
-async def get_conversation(cid: str):
-    return _load_conv(cid)
+async def get_conversation(cid: str, response: Response):
+    conv = _load_conv(cid)
+    response.headers["ETag"] = _etag(conv)
+    return conv
 
 
 @app.patch("/api/conversations/{cid}")
-async def rename_conversation(cid: str, body: Dict[str, Any]):
-    conv = _load_conv(cid)
+async def rename_conversation(cid: str, body: Dict[str, Any], request: Request, response: Response):
+    async with store.lock(cid):
+        conv = _load_conv(cid)
+        expected = _if_match(request)
+        if expected is not None and expected != int(conv.get("version") or 0):
+            return JSONResponse({"error": "version mismatch", "version": conv.get("version")}, status_code=412)
+        _apply_conv_patch(conv, body)
+        # Settings panels PATCH on every change; coalesce bursts into one write
+        store.save_later(cid, conv)
+    response.headers["ETag"] = _etag(conv)
+    return conv
+
+
+def _apply_conv_patch(conv: Dict[str, Any], body: Dict[str, Any]) -> None:
     title = body.get("title")
     if title:
         conv["title"] = title
@@ -299,69 +430,179 @@ async def rename_conversation(cid: str, body: Dict[str, Any]):
         # Replace conversation messages entirely if provided; basic validation
         msgs = body.get("messages")
         if isinstance(msgs, list):
-            clean: List[Dict[str, Any]] = []
-            for m in msgs:
-                try:
-                    r = m.get("role")
-                    c = m.get("content")
-                    if r in ("system", "user", "assistant") and isinstance(c, str):
-                        item = {"role": r, "content": c}
-                        if "reasoning" in m and isinstance(m.get("reasoning"), str):
-                            item["reasoning"] = m.get("reasoning")
-                        clean.append(item)
-                except Exception:
-                    pass
-            conv["messages"] = clean
-    _save_conv(cid, conv)
-    return conv
+            conv["messages"] = [m for m in (clean_message(m) for m in msgs) if m]
 
 
 @app.delete("/api/conversations/{cid}")
 async def delete_conversation(cid: str):
-    p = _conv_path(cid)
-    if p.exists():
-        p.unlink()
+    async with store.lock(cid):
+        store.delete(cid)
     return {"ok": True}
 
 
-@app.post("/api/chat")
-async def chat(body: Dict[str, Any]):
-    messages: List[Dict] = body.get("messages", [])
-    defaults = read_settings()
-    provider: str = body.get("provider") or defaults.get("provider", "openai")
-    model: str = body.get("model") or defaults.get("model", "gpt-4o-mini")
-    conversation_id: str | None = body.get("conversation_id")
-    reasoning: bool = bool(body.get("reasoning"))
+# --- Export / import ---
+# The whole store as one download and back. Export streams conversation by
+# conversation; import spools the upload to disk and writes it in batches
+# from a worker thread, which takes each conversation's lock in turn. Imported conversations go through
+# the store's write-through cache, so the listing reflects them immediately.
+@app.get("/api/export")
+async def export_conversations(request: Request):
+    """Download every conversation: ``format`` ndjson|tar, ``compression`` none|gzip|zstd."""
+    fmt = request.query_params.get("format", "ndjson")
+    compression = request.query_params.get("compression", "none")
+    try:
+        archive.check_options(fmt, compression)
+    except ValueError as e:
+        return JSONResponse({"error": str(e)}, status_code=400)
+    return StreamingResponse(
+        archive.export_stream(store, fmt, compression),
+        media_type=archive.media_type(fmt, compression),
+        headers={"Content-Disposition": f'attachment; filename="{archive.file_name(fmt, compression)}"'},
+    )
+
+
+@app.post("/api/import")
+async def import_conversations(request: Request):
+    """Ingest an archive as produced by /api/export (format and compression are detected).
+
+    Conversations keep their ids; ``on_conflict`` (newer|skip|replace,
+    default newer) decides what happens to ids that already exist.
+    """
+    on_conflict = request.query_params.get("on_conflict", "newer")
+    if on_conflict not in archive.CONFLICT_POLICIES:
+        return JSONResponse({"error": f"on_conflict must be one of {', '.join(archive.CONFLICT_POLICIES)}"}, status_code=400)
+    started = time.monotonic()
+    spool = await _spool_upload(request)
+    summary: Dict[str, Any] = {"imported": 0, "replaced": 0, "skipped": 0, "invalid": 0, "batches": 0}
+    errors: List[str] = []
+    try:
+        records = archive.read_archive(spool)
+        while True:
+            batch, bad, duplicates = await asyncio.to_thread(
+                archive.next_batch, records, archive.IMPORT_BATCH, on_conflict)
+            summary["invalid"] += len(bad)
+            summary["skipped"] += duplicates
+            errors.extend(bad[: archive.MAX_REPORTED_ERRORS - len(errors)])
+            if not batch:
+                if not bad:
+                    break
+                continue
+            counts = await asyncio.to_thread(store.import_conversations, batch, on_conflict)
+            for k, v in counts.items():
+                summary[k] += v
+            summary["batches"] += 1
+    except Exception as e:  # corrupt or truncated upload
+        summary["error"] = f"archive unreadable: {e}"
+    finally:
+        spool.close()
+    summary["errors"] = errors
+    summary["total_ms"] = int((time.monotonic() - started) * 1000)
+    return JSONResponse(summary, status_code=400 if "error" in summary and not summary["batches"] else 200)
 
-    # Export API keys to process for provider SDKs during this request
-    for env_key in [
-        "OPENAI_API_KEY",
-        "OPENROUTER_API_KEY",
-        "ANTHROPIC_API_KEY",
-        "GEMINI_API_KEY",
-        "GOOGLE_API_KEY",
-        "AZURE_OPENAI_ENDPOINT",
-        "AZURE_OPENAI_API_KEY",
-        "TOGETHER_API_KEY",
-        "FIREWORKS_API_KEY",
-        "PERPLEXITY_API_KEY",
-        "MISTRAL_API_KEY",
-        "DEEPSEEK_API_KEY",
-        "COHERE_API_KEY",
-    ]:
-        val = body.get(env_key) if env_key in body else defaults.get(env_key)
+
+# --- Message-level API ---
+# These map to single journal writes in the store, so editing one message of a
+# long chat does not rewrite the whole file. Pass the conversation ETag in
+# If-Match to reject writes made against a stale copy.
+async def _message_op(fn, cid: str, request: Request, *args, **kwargs):
+    try:
+        # The store refuses to write to a conversation without a snapshot, so
+        # one deleted while this waited for the lock is not recreated
+        async with store.lock(cid):
+            conv = fn(cid, *args, expected_version=_if_match(request), **kwargs)
+    except ConversationNotFound:
+        return JSONResponse({"error": "conversation not found"}, status_code=404)
+    except VersionConflict as e:
+        return JSONResponse({"error": "version mismatch", "version": e.current}, status_code=412)
+    except MessageNotFound:
+        return JSONResponse({"error": "message not found"}, status_code=404)
+    return conv
+
+
+@app.post("/api/conversations/{cid}/messages")
+async def append_messages(cid: str, body: Dict[str, Any], request: Request):
+    raw = body.get("messages") if isinstance(body.get("messages"), list) else [body]
+    items = [m for m in (clean_message(m) for m in raw) if m]
+    if not items:
+        return JSONResponse({"error": "no valid messages"}, status_code=400)
+    conv = await _message_op(store.append_messages, cid, request, items)
+    if isinstance(conv, Response):
+        return conv
+    return JSONResponse({"version": conv["version"], "messages": items}, headers={"ETag": _etag(conv)})
+
+
+@app.patch("/api/conversations/{cid}/messages/{mid}")
+async def edit_message(cid: str, mid: str, body: Dict[str, Any], request: Request):
+    conv = await _message_op(store.edit_message, cid, request, mid, body or {})
+    if isinstance(conv, Response):
+        return conv
+    msg = next((m for m in conv["messages"] if m.get("id") == mid), None)
+    return JSONResponse({"version": conv["version"], "message": msg}, headers={"ETag": _etag(conv)})
+
+
+@app.delete("/api/conversations/{cid}/messages/{mid}")
+async def delete_message(cid: str, mid: str, request: Request):
+    conv = await _message_op(store.delete_message, cid, request, mid)
+    if isinstance(conv, Response):
+        return conv
+    return JSONResponse({"version": conv["version"]}, headers={"ETag": _etag(conv)})
+
+
+@app.post("/api/conversations/{cid}/truncate")
+async def truncate_conversation(cid: str, body: Dict[str, Any], request: Request):
+    """Drop messages after ``after`` (used for "regenerate from here")."""
+    mid = body.get("after")
+    if not isinstance(mid, str) or not mid:
+        return JSONResponse({"error": "'after' message id required"}, status_code=400)
+    conv = await _message_op(store.truncate_after, cid, request, mid, inclusive=bool(body.get("inclusive")))
+    if isinstance(conv, Response):
+        return conv
+    return JSONResponse(
+        {"version": conv["version"], "count": len(conv["messages"])},
+        headers={"ETag": _etag(conv)},
+    )
+
+
+# Provider settings a request may carry (falling back to saved settings);
+# the SDKs read them from the environment
+PROVIDER_ENV_KEYS = [
+    "OPENAI_API_KEY",
+    "OPENROUTER_API_KEY",
+    "ANTHROPIC_API_KEY",
+    "GEMINI_API_KEY",
+    "GOOGLE_API_KEY",
+    "AZURE_OPENAI_ENDPOINT",
+    "AZURE_OPENAI_API_KEY",
+    "TOGETHER_API_KEY",
+    "FIREWORKS_API_KEY",
+    "PERPLEXITY_API_KEY",
+    "MISTRAL_API_KEY",
+    "DEEPSEEK_API_KEY",
+    "COHERE_API_KEY",
+    "LITELLM_API_KEY",
+    "VLLM_API_KEY",
+    "LITELLM_BASE_URL",
+    "VLLM_BASE_URL",
+]
+
+
+def _export_provider_env(data: Dict[str, Any], defaults: Dict[str, Any]) -> None:
+    for env_key in PROVIDER_ENV_KEYS:
+        val = data.get(env_key) if env_key in data else defaults.get(env_key)
         if val:
             os.environ[env_key] = str(val)
 
-    # Add a brief reasoning instruction (concise rationale only)
+
+def _build_prompt(messages: List[Dict], conversation_id: str | None, reasoning: bool) -> List[Dict]:
+    """Prepend the conversation's system prompt and the brief-reasoning instruction."""
     final_msgs = list(messages)
-    # If conversation has a system_prompt, prepend it
     if conversation_id:
         conv0 = _load_conv(conversation_id)
         sp = (conv0.get("system_prompt") or "").strip()
         if sp:
             final_msgs = [{"role": "system", "content": sp}] + final_msgs
     if reasoning:
+        # Concise rationale only
         final_msgs = [{
             "role": "system",
             "content": (
@@ -369,54 +610,548 @@ async def chat(body: Dict[str, Any]):
                 "Do not reveal chain-of-thought; keep it concise and high-level."
             ),
         }] + final_msgs
-
-    answer = chat_once(final_msgs, provider=provider, model=model)
+    return final_msgs
+
+
+def _coalesce_key(kind: str, data: Dict[str, Any], provider: str, model: str, final_msgs: List[Dict], conversation_id: str | None) -> str:
+    # Credentials sent with the request are part of the key (hashed, never
+    # kept) so callers using different accounts never share an answer
+    credentials = {k: str(data[k]) for k in PROVIDER_ENV_KEYS if data.get(k)}
+    return coalesce.request_key(
+        kind,
+        provider=provider,
+        model=model,
+        messages=final_msgs,
+        conversation_id=conversation_id,
+        user=data.get("user"),
+        credentials=credentials,
+    )
+
+
+_chat_calls = coalesce.Coalescer()
+
+
+async def _chat_turn(
+    messages: List[Dict], final_msgs: List[Dict], provider: str, model: str, conversation_id: str | None, user: str | None
+) -> Dict[str, Any]:
+    usage: Dict[str, int] = {}
+    started = time.monotonic()
+    answer = await asyncio.to_thread(chat_once, final_msgs, provider=provider, model=model, on_usage=usage.update)
+    await _record_usage(
+        provider, model, usage,
+        duration_ms=int((time.monotonic() - started) * 1000),
+        error=answer.startswith("[Provider error:"),
+        conversation_id=conversation_id,
+        user=user,
+    )
 
     # Parse out optional 'Reasoning:' header if present
-    reasoning_text = None
-    final_answer = answer
-    if isinstance(answer, str) and "Reasoning:" in answer:
-        parts = answer.split("Reasoning:", 1)
-        tail = parts[1]
-        if "Answer:" in tail:
-            r, a = tail.split("Answer:", 1)
-            reasoning_text = r.strip()
-            final_answer = a.strip()
-        else:
-            chunks = tail.strip().split("\n\n", 1)
-            reasoning_text = chunks[0].strip()
-            final_answer = (chunks[1].strip() if len(chunks) > 1 else answer)
+    reasoning_text, final_answer = split_reasoning(answer)
 
     # Save to conversation if specified
     if conversation_id:
-        conv = _load_conv(conversation_id)
-        # Set a better title from the first user prompt if new
-        if not conv.get("messages") and messages:
-            try:
-                last_user = ""
-                for m in reversed(messages):
-                    if m.get("role") == "user" and isinstance(m.get("content"), str):
-                        last_user = m["content"]
-                        break
-                if last_user:
-                    conv["title"] = last_user[:40] + ("…" if len(last_user) > 40 else "")
-            except Exception:
-                pass
-        conv_msgs = conv.get("messages", [])
-        conv_msgs.extend(messages)
-        conv_msgs.append({
+        await _record_turn(conversation_id, messages, {
             "role": "assistant",
             "content": final_answer,
             "reasoning": reasoning_text,
         })
-        conv["messages"] = conv_msgs
-        _save_conv(conversation_id, conv)
 
     return {"answer": final_answer, "reasoning": reasoning_text, "model": model}
 
 
+@app.post("/api/chat")
+async def chat(body: Dict[str, Any]):
+    """One answer, non-streaming. With ``coalesce`` (see coalesce.py), identical
+    requests already in flight share their answer instead of calling the provider again."""
+    messages: List[Dict] = body.get("messages", [])
+    defaults = read_settings()
+    provider: str = body.get("provider") or defaults.get("provider", "openai")
+    model: str = body.get("model") or defaults.get("model", "gpt-4o-mini")
+    conversation_id: str | None = body.get("conversation_id")
+    reasoning: bool = bool(body.get("reasoning"))
+
+    # Export API keys to process for provider SDKs during this request
+    _export_provider_env(body, defaults)
+    final_msgs = _build_prompt(messages, conversation_id, reasoning)
+
+    def turn():
+        return _chat_turn(messages, final_msgs, provider, model, conversation_id, body.get("user"))
+
+    if not coalesce.wanted(body, defaults):
+        return await turn()
+    key = _coalesce_key("chat", body, provider, model, final_msgs, conversation_id)
+    result, joined = await _chat_calls.run(key, turn)
+    return {**result, "coalesced": True} if joined else result
+
+
+# --- Usage ---
+async def _record_usage(
+    provider: str,
+    model: str,
+    usage: Dict[str, int] | None = None,
+    ttft_ms: int | None = None,
+    duration_ms: int | None = None,
+    error: bool = False,
+    conversation_id: str | None = None,
+    user: str | None = None,
+    kind: str = "chat",
+) -> None:
+    try:
+        await asyncio.to_thread(
+            usage_store.record,
+            provider, model, usage or None, ttft_ms, duration_ms, error, conversation_id, user, kind,
+        )
+    except Exception as e:
+        print(f"[usage] could not record {provider}/{model}: {e}")
+
+
+def _usage_recorder(provider: str, model: str, conversation_id: str | None, user: str | None, kind: str):
+    """on_finish hook recording a stream's usage and timing."""
+    async def record(st: streams.StreamSession) -> None:
+        timing = st.timing()
+        await _record_usage(
+            provider, model, st.usage,
+            ttft_ms=timing["ttft_ms"],
+            duration_ms=timing["total_ms"],
+            error=bool(st.error),
+            conversation_id=conversation_id,
+            user=user,
+            kind=kind,
+        )
+    return record
+
+
+@app.get("/api/usage")
+async def get_usage(request: Request):
+    """Token usage, latency and (with ``usage_prices`` in settings) cost over time.
+
+    Query: ``from``/``to`` (UTC ISO date or date-hour, default the last 30
+    days), ``granularity`` hour|day|total, ``group_by`` (comma separated:
+    provider, model, conversation_id, user, kind) and filters on the same
+    fields. Prices are USD per million tokens, keyed "provider/model" or model:
+    ``{"openai/gpt-4o-mini": {"prompt": 0.15, "cached": 0.075, "completion": 0.6}}``.
+    """
+    q = request.query_params
+    group_by = [g.strip() for g in q.get("group_by", "provider,model").split(",")]
+    filters = {k: q.get(k) for k in ("provider", "model", "conversation_id", "user", "kind")}
+    try:
+        return await asyncio.to_thread(
+            usage_store.query,
+            q.get("from"),
+            q.get("to"),
+            q.get("granularity") or "day",
+            group_by,
+            filters,
+            read_settings().get("usage_prices"),
+        )
+    except ValueError as e:
+        return JSONResponse({"error": str(e)}, status_code=400)
+
+
+# --- Prewarming ---
+# The UI posts the selected provider/model to /api/prewarm whenever its
+# selector changes, so the connection (and for Ollama the model) is ready
+# before the first prompt. Streamed turns are labelled by what preceded them:
+# "prewarmed" when the last thing done for that provider/model within the
+# pool keep-alive window was a prewarm, "cold" when nothing was, and the TTFT
+# of both kinds is kept for comparison (GET /api/prewarm).
+PREWARM_SAMPLES = 50
+_prewarm_calls = coalesce.Coalescer()
+# (provider, model) -> (monotonic time, "prewarm" | "turn")
+_warm_state: Dict[Tuple[str, str], Tuple[float, str]] = {}
+_first_ttft: Dict[Tuple[str, str], Dict[str, deque]] = {}
+
+
+def _turn_label(provider: str, model: str) -> str | None:
+    """Classify a turn about to start; None for turns on an already warm connection."""
+    now = time.monotonic()
+    prev = _warm_state.get((provider, model))
+    _warm_state[(provider, model)] = (now, "turn")
+    if prev is None or now - prev[0] > POOL_KEEPALIVE:
+        return "cold"
+    return "prewarmed" if prev[1] == "prewarm" else None
+
+
+def _note_ttft(provider: str, model: str, label: str | None, ttft_ms: int | None) -> None:
+    if label is None or ttft_ms is None:
+        return
+    samples = _first_ttft.setdefault((provider, model), {
+        "cold": deque(maxlen=PREWARM_SAMPLES),
+        "prewarmed": deque(maxlen=PREWARM_SAMPLES),
+    })
+    samples[label].append(ttft_ms)
+
+
+def _ttft_summary(provider: str, model: str) -> Dict[str, Any]:
+    out: Dict[str, Any] = {}
+    for label, values in _first_ttft.get((provider, model), {}).items():
+        if values:
+            out[label] = {"n": len(values), "avg_ms": int(sum(values) / len(values)), "last_ms": values[-1]}
+    if "cold" in out and "prewarmed" in out:
+        out["saved_ms"] = out["cold"]["avg_ms"] - out["prewarmed"]["avg_ms"]
+    return out
+
+
+@app.post("/api/prewarm")
+async def prewarm_model(body: Dict[str, Any]):
+    """Open a pooled connection for ``provider``/``model`` (and load an Ollama model).
+
+    Repeated calls while one is running share it. The response has the
+    per-step timings and the first-turn TTFT seen so far, cold vs prewarmed.
+    """
+    defaults = read_settings()
+    _export_provider_env(body, defaults)
+    provider: str = body.get("provider") or defaults.get("provider", "openai")
+    model: str = body.get("model") or defaults.get("model", "gpt-4o-mini")
+    key = _coalesce_key("prewarm", body, provider, model, [], None)
+    report, _ = await _prewarm_calls.run(key, lambda: asyncio.to_thread(prewarm_provider, provider, model))
+    if report.get("ok"):
+        _warm_state[(provider, model)] = (time.monotonic(), "prewarm")
+    return {**report, "first_turn_ttft": _ttft_summary(provider, model)}
+
+
+@app.get("/api/prewarm")
+async def prewarm_report():
+    """First-turn TTFT per provider/model, cold vs after a prewarm."""
+    return {
+        "window_s": POOL_KEEPALIVE,
+        "first_turn_ttft": {f"{p}/{m}": _ttft_summary(p, m) for p, m in _first_ttft},
+    }
+
+
+# --- Batch chat ---
+# Many independent prompts through a bounded worker pool. Results stream back
+# as NDJSON in completion order, one line per item with its index. Provider
+# native batch APIs (OpenAI/Anthropic batches) would slot in as another
+# backend for _batch_item later.
+BATCH_CONCURRENCY = int(os.environ.get("FERN_BATCH_CONCURRENCY", "8"))
+MAX_BATCH_CONCURRENCY = 32
+# Per-provider caps so one batch cannot trip rate limits or swamp a local model
+PROVIDER_CONCURRENCY: Dict[str, int] = {"ollama": 1}
+DEFAULT_PROVIDER_CONCURRENCY = 4
+_provider_slots: Dict[str, asyncio.Semaphore] = {}
+
+
+def _provider_slot(provider: str) -> asyncio.Semaphore:
+    sem = _provider_slots.get(provider)
+    if sem is None:
+        sem = asyncio.Semaphore(PROVIDER_CONCURRENCY.get(provider, DEFAULT_PROVIDER_CONCURRENCY))
+        _provider_slots[provider] = sem
+    return sem
+
+
+async def _batch_item(index: int, item: Any, defaults: Dict[str, Any]) -> Dict[str, Any]:
+    result: Dict[str, Any] = {"index": index}
+    if not isinstance(item, dict):
+        result["error"] = "item must be a JSON object"
+        return result
+    if "id" in item:
+        result["id"] = item["id"]
+    messages = item.get("messages")
+    if not isinstance(messages, list):
+        prompt = item.get("prompt")
+        messages = [{"role": "user", "content": prompt}] if isinstance(prompt, str) else None
+    if not messages:
+        result["error"] = "messages or prompt required"
+        return result
+    provider = str(item.get("provider") or defaults.get("provider") or "openai").lower()
+    model = str(item.get("model") or defaults.get("model") or "gpt-4o-mini")
+    conversation_id = item.get("conversation_id")
+    result.update({"provider": provider, "model": model})
+    started = time.monotonic()
+    try:
+        final_msgs = _build_prompt(messages, conversation_id, bool(item.get("reasoning")))
+        usage: Dict[str, int] = {}
+        async with _provider_slot(provider):
+            answer = await asyncio.to_thread(chat_once, final_msgs, provider=provider, model=model, on_usage=usage.update)
+        await _record_usage(
+            provider, model, usage,
+            duration_ms=int((time.monotonic() - started) * 1000),
+            error=answer.startswith("[Provider error:"),
+            conversation_id=conversation_id,
+            user=item.get("user") or defaults.get("user"),
+            kind="batch",
+        )
+        if usage:
+            result["usage"] = usage
+        if isinstance(answer, str) and answer.startswith("[Provider error:"):
+            result["error"] = answer[len("[Provider error:"):].rstrip("]").strip()
+        else:
+            reasoning_text, final_answer = split_reasoning(answer)
+            result.update({"answer": final_answer, "reasoning": reasoning_text})
+            if conversation_id:
+                await _record_turn(conversation_id, messages, {
+                    "role": "assistant",
+                    "content": final_answer,
+                    "reasoning": reasoning_text,
+                })
+    except Exception as e:
+        result["error"] = str(e)
+    result["total_ms"] = int((time.monotonic() - started) * 1000)
+    return result
+
+
+async def _spool_upload(request: Request):
+    """Copy the request body to a temp file (memory only while small).
+
+    The body must be fully received before the streaming response starts:
+    Starlette's StreamingResponse listens on the same receive channel.
+    """
+    import tempfile
+    spool = tempfile.SpooledTemporaryFile(max_size=1 << 20)
+    async for part in request.stream():
+        spool.write(part)
+    spool.seek(0)
+    return spool
+
+
+async def _ndjson_items(spool) -> AsyncIterator[Tuple[int, Any]]:
+    """Parse a spooled JSONL upload line by line."""
+    import json
+    index = 0
+    try:
+        for line in spool:
+            if not line.strip():
+                continue
+            try:
+                item = json.loads(line)
+            except Exception as e:
+                item = f"invalid JSON: {e}"
+            yield index, item
+            index += 1
+    finally:
+        spool.close()
+
+
+async def _list_items(items: List[Any]) -> AsyncIterator[Tuple[int, Any]]:
+    for i, item in enumerate(items):
+        yield i, item
+
+
+async def _run_batch(items: AsyncIterator[Tuple[int, Any]], defaults: Dict[str, Any], concurrency: int) -> AsyncIterator[str]:
+    import json
+    limit = asyncio.Semaphore(concurrency)
+    done: asyncio.Queue = asyncio.Queue()
+    tasks: set = set()
+
+    async def run_one(index: int, item: Any) -> None:
+        # Every item produces a line, whatever goes wrong while running it
+        result: Dict[str, Any] = {"index": index, "error": "failed"}
+        try:
+            if isinstance(item, str):  # unparseable input line
+                result["error"] = item
+            else:
+                result = await _batch_item(index, item, defaults)
+        except Exception as e:
+            result["error"] = str(e) or type(e).__name__
+        finally:
+            limit.release()
+        await done.put(result)
+
+    async def feed() -> None:
+        try:
+            async for index, item in items:
+                # Backpressure: do not read further input until a worker is free
+                await limit.acquire()
+                t = asyncio.create_task(run_one(index, item))
+                tasks.add(t)
+                t.add_done_callback(tasks.discard)
+        except Exception as e:
+            await done.put({"error": f"input aborted: {e}"})
+        finally:
+            if tasks:
+                await asyncio.gather(*tasks, return_exceptions=True)
+            await done.put(None)
+
+    feeder = asyncio.create_task(feed())
+    try:
+        while True:
+            result = await done.get()
+            if result is None:
+                break
+            yield json.dumps(result, ensure_ascii=False) + "\n"
+    finally:
+        feeder.cancel()
+        for t in list(tasks):
+            t.cancel()
+
+
+@app.post("/api/chat/batch")
+async def chat_batch(request: Request):
+    """Run many chat requests concurrently; streams one NDJSON result line per item.
+
+    Accepts either a JSON body ``{"items": [...], "concurrency": n, "provider",
+    "model"}`` or a JSONL upload (``Content-Type: application/x-ndjson``) with
+    one item per line. Items look like /api/chat bodies (``messages`` or a bare
+    ``prompt``) plus an optional ``id`` echoed back in the result.
+    """
+    defaults = read_settings()
+    ctype = (request.headers.get("content-type") or "").split(";")[0].strip().lower()
+    concurrency = BATCH_CONCURRENCY
+    if ctype in ("application/x-ndjson", "application/jsonl", "application/json-lines", "text/plain"):
+        _export_provider_env({}, defaults)
+        items = _ndjson_items(await _spool_upload(request))
+        try:
+            concurrency = int(request.query_params.get("concurrency") or concurrency)
+        except ValueError:
+            pass
+    else:
+        try:
+            body = await request.json()
+        except Exception:
+            return JSONResponse({"error": "expected a JSON body or an NDJSON upload"}, status_code=400)
+        if not isinstance(body, dict) or not isinstance(body.get("items"), list):
+            return JSONResponse({"error": "items: list required"}, status_code=400)
+        _export_provider_env(body, defaults)
+        defaults = {**defaults, **{k: body[k] for k in ("provider", "model") if body.get(k)}}
+        items = _list_items(body["items"])
+        try:
+            concurrency = int(body.get("concurrency") or concurrency)
+        except (TypeError, ValueError):
+            pass
+    concurrency = max(1, min(concurrency, MAX_BATCH_CONCURRENCY))
+    return StreamingResponse(_run_batch(items, defaults, concurrency), media_type="application/x-ndjson")
+
+
+# --- Multi-model comparison ---
+# One prompt fanned out to several provider/model targets at once. Each target
+# streams through its own StreamSession; the results are saved as a single
+# assistant turn whose ``alternatives`` hold every answer with its latency.
+MAX_COMPARE_TARGETS = 8
+
+
+def _compare_targets(data: Dict[str, Any]) -> List[Dict[str, str]]:
+    targets: List[Dict[str, str]] = []
+    for t in data.get("compare") or data.get("targets") or []:
+        if isinstance(t, dict) and t.get("provider") and t.get("model"):
+            targets.append({"provider": str(t["provider"]).lower(), "model": str(t["model"])})
+    return targets[:MAX_COMPARE_TARGETS]
+
+
+def _raising_provider_errors(chunks: Iterator[str]) -> Iterator[str]:
+    """Pass chunks through, raising on chat_once's "[Provider error: ...]" reply.
+
+    A failed target then ends its session with ``error`` set instead of
+    returning the error text as its answer.
+    """
+    for chunk in chunks:
+        if isinstance(chunk, str) and chunk.startswith("[Provider error:"):
+            raise RuntimeError(chunk[len("[Provider error:"):].rstrip("]").strip())
+        yield chunk
+
+
+def _start_comparison(
+    final_msgs: List[Dict],
+    targets: List[Dict[str, str]],
+    conversation_id: str | None = None,
+    user: str | None = None,
+) -> List[streams.StreamSession]:
+    sessions: List[streams.StreamSession] = []
+    try:
+        for t in targets:
+            st = streams.create()
+            sessions.append(streams.start(
+                st,
+                _raising_provider_errors(
+                    chat_stream(final_msgs, provider=t["provider"], model=t["model"], on_usage=st.set_usage)
+                ),
+                on_finish=_usage_recorder(t["provider"], t["model"], conversation_id, user, "compare"),
+            ))
+    except Exception:
+        for st in sessions:
+            st.cancel()
+        raise
+    return sessions
+
+
+def _comparison_results(targets: List[Dict[str, str]], sessions: List[streams.StreamSession]) -> List[Dict[str, Any]]:
+    results: List[Dict[str, Any]] = []
+    for t, st in zip(targets, sessions):
+        reasoning_text, answer = st.split()
+        item: Dict[str, Any] = {**t, "content": answer, **st.timing()}
+        if st.usage:
+            item["usage"] = st.usage
+        if reasoning_text is not None:
+            item["reasoning"] = reasoning_text
+        if st.error:
+            item["error"] = st.error
+        results.append(item)
+    return results
+
+
+async def _record_comparison(cid: str, messages: List[Dict], results: List[Dict[str, Any]]) -> None:
+    best = next((r for r in results if not r.get("error")), results[0])
+    await _record_turn(cid, messages, {
+        "role": "assistant",
+        "content": best["content"],
+        "reasoning": best.get("reasoning"),
+        "alternatives": results,
+    })
+
+
+@app.post("/api/chat/compare")
+async def chat_compare(body: Dict[str, Any]):
+    """Run one prompt against several ``targets`` concurrently and return every answer."""
+    targets = _compare_targets(body)
+    if not targets:
+        return JSONResponse({"error": "targets: list of {provider, model} required"}, status_code=400)
+    messages: List[Dict] = body.get("messages", [])
+    conversation_id: str | None = body.get("conversation_id")
+    _export_provider_env(body, read_settings())
+    final_msgs = _build_prompt(messages, conversation_id, bool(body.get("reasoning")))
+    sessions = _start_comparison(final_msgs, targets, conversation_id, body.get("user"))
+    await asyncio.gather(*(st.task for st in sessions if st.task is not None))
+    results = _comparison_results(targets, sessions)
+    if conversation_id:
+        await _record_comparison(conversation_id, messages, results)
+    return {"results": results}
+
+
+# Event names for ReasoningSplitter pieces on the JSON/SSE transports
+_PIECE_EVENTS = {ANSWER: "token", REASONING: "reasoning", ANSWER_RESET: "answer_reset"}
+
+
+async def _compare_ws(
+    ws: WebSocket,
+    final_msgs: List[Dict],
+    targets: List[Dict[str, str]],
+    messages: List[Dict],
+    conversation_id: str | None,
+    user: str | None = None,
+) -> None:
+    """Multiplex the targets' token streams over one socket as tagged JSON events."""
+    sessions = _start_comparison(final_msgs, targets, conversation_id, user)
+    queue: asyncio.Queue = asyncio.Queue()
+
+    async def relay(i: int, st: streams.StreamSession) -> None:
+        async for _, pieces in st.follow_parts():
+            for channel, text in pieces:
+                await queue.put({"type": _PIECE_EVENTS[channel], "target": i, "text": text})
+        await queue.put({"type": "end", "target": i, "error": st.error, "usage": st.usage, **st.timing()})
+
+    relays = [asyncio.create_task(relay(i, st)) for i, st in enumerate(sessions)]
+    try:
+        await ws.send_json({"type": "start", "targets": targets})
+        remaining = len(sessions)
+        while remaining:
+            event = await queue.get()
+            await ws.send_json(event)
+            if event["type"] == "end":
+                remaining -= 1
+        results = _comparison_results(targets, sessions)
+        if conversation_id:
+            await _record_comparison(conversation_id, messages, results)
+        await ws.send_json({"type": "done", "results": results})
+    finally:
+        for st in sessions:
+            st.cancel()
+        for r in relays:
+            r.cancel()
+
+
 @app.get("/api/models/{provider}")
 async def list_models(provider: str):
+    import httpx
     provider = (provider or "").lower()
     defaults = read_settings()
     # Make env available for outbound requests if needed
@@ -489,6 +1224,7 @@ async def list_models(provider: str):
                 return {"models": []}
 
         if provider == "ollama":
+            ollama_sdk = await asyncio.to_thread(sdk, "ollama")
             if ollama_sdk is None:
                 return {"models": [], "note": "ollama package missing"}
             try:
@@ -582,108 +1318,349 @@ async def list_models(provider: str):
         return {"models": [], "error": str(e)}
 
 
+# --- Streaming sessions ---
+@app.get("/api/streams")
+async def list_streams(conversation_id: str | None = None):
+    return {"streams": [st.info() for st in streams.active(conversation_id)]}
+
+
+@app.delete("/api/streams/{sid}")
+async def cancel_stream(sid: str):
+    st = streams.get(sid)
+    if st is None:
+        return JSONResponse({"error": "stream not found"}, status_code=404)
+    st.cancel()
+    return {"ok": True}
+
+
+def _start_generation(
+    session: streams.StreamSession,
+    final_msgs: List[Dict],
+    provider: str,
+    model: str,
+    mid: str,
+    user: str | None = None,
+) -> streams.StreamSession:
+    """Run chat_stream in the background, checkpointing the partial reply to the conversation."""
+    conversation_id = session.conversation_id
+    session.message_id = mid
+    record_usage = _usage_recorder(provider, model, conversation_id, user, "stream")
+    label = _turn_label(provider, model)
+
+    def fields(st: streams.StreamSession) -> Dict[str, Any]:
+        reasoning_text, answer = st.split()
+        out: Dict[str, Any] = {"content": answer}
+        if reasoning_text is not None:
+            out["reasoning"] = reasoning_text
+        return out
+
+    # Checkpoints journal only the text that arrived since the previous one,
+    # so a long reply costs a journal size linear in its length; the final
+    # write replaces the fields with the cleaned-up split
+    saved = {"chunks": 0}
+
+    async def checkpoint(st: streams.StreamSession) -> None:
+        upto = len(st.parts)
+        delta: Dict[str, str] = {}
+        reset = False
+        for pieces in st.parts[saved["chunks"]:upto]:
+            for channel, text in pieces:
+                if channel == ANSWER_RESET:
+                    reset = True
+                    continue
+                key = "content" if channel == ANSWER else "reasoning"
+                delta[key] = delta.get(key, "") + text
+        saved["chunks"] = upto
+        if reset:
+            # Saved answer text turned out to be reasoning; rewrite both (rare)
+            await _update_message(conversation_id, mid, fields(st))
+        elif delta:
+            await _update_message(conversation_id, mid, delta, extend=True)
+
+    async def finish(st: streams.StreamSession) -> None:
+        await record_usage(st)
+        if not st.error:
+            _note_ttft(provider, model, label, st.timing()["ttft_ms"])
+        if not conversation_id:
+            return
+        if st.error:
+            if st.chunks:
+                # Keep what was generated, but it is no longer in progress
+                await _update_message(conversation_id, mid, {**fields(st), "partial": False})
+            else:
+                async with store.lock(conversation_id):
+                    try:
+                        store.delete_message(conversation_id, mid)
+                    except (MessageNotFound, ConversationNotFound):
+                        pass
+            return
+        await _update_message(conversation_id, mid, {**fields(st), "partial": False})
+
+    return streams.start(
+        session,
+        chat_stream(final_msgs, provider=provider, model=model, on_usage=session.set_usage),
+        checkpoint=checkpoint if conversation_id else None,
+        on_finish=finish,
+    )
+
+
+async def _open_stream(
+    messages: List[Dict],
+    final_msgs: List[Dict],
+    provider: str,
+    model: str,
+    conversation_id: str | None,
+    stream_id: str | None = None,
+    user: str | None = None,
+    key: str | None = None,
+) -> streams.StreamSession:
+    """Record the turn and start generating; shared by /ws/chat and the SSE endpoint.
+
+    With a coalescing ``key``, an identical generation already running is
+    joined instead: the caller follows it from the start and the turn is not
+    recorded a second time. The returned session is held for the caller.
+    Raises ValueError when ``stream_id`` is already taken.
+    """
+    if stream_id and streams.get(stream_id) is not None:
+        raise ValueError("stream_id already in use")
+    running = streams.inflight(key) if key else None
+    if running is not None:
+        if stream_id:
+            streams.alias(stream_id, running)
+        running.joined += 1
+        running.hold()
+        return running
+    # Registered before anything is awaited so a duplicate arriving meanwhile
+    # joins it; the generation itself starts once the turn is saved
+    mid = new_message_id()
+    session = streams.create(stream_id, conversation_id, key)
+    session.message_id = mid
+    session.hold()
+    # Save the prompt and an empty assistant reply up front; the reply is
+    # checkpointed while streaming and finalized when generation ends
+    if conversation_id:
+        try:
+            await _record_turn(conversation_id, messages, {
+                "id": mid,
+                "role": "assistant",
+                "content": "",
+                "partial": True,
+            })
+        except BaseException as e:
+            session.finish(str(e) or "cancelled")
+            raise
+    return _start_generation(session, final_msgs, provider, model, mid, user)
+
+
+async def _follow_stream(ws: WebSocket, session: streams.StreamSession, offset: int = 0, channels: bool = False) -> None:
+    if channels:
+        # JSON events with reasoning and answer already separated
+        async for _, pieces in session.follow_parts(offset):
+            for channel, text in pieces:
+                await ws.send_json({"type": channel, "text": text})
+        await session.settled()
+        reasoning_text, answer = session.split()
+        await ws.send_json({"type": "end", "reasoning": reasoning_text, "answer": answer, "error": session.error})
+        return
+    # Plain text: provider-native reasoning is framed with the same markers the
+    # prompt asks for, so clients parsing the raw stream keep working
+    native = offset > 0 and isinstance(session.chunks[min(offset, len(session.chunks)) - 1], ReasoningDelta)
+    async for chunk in session.follow(offset):
+        if isinstance(chunk, ReasoningDelta):
+            chunk = chunk if native else "Reasoning: " + chunk
+            native = True
+        elif native:
+            chunk = "\n\nAnswer: " + chunk
+            native = False
+        await ws.send_text(chunk)
+    await session.settled()
+    if session.error:
+        await ws.send_text(f"[Error: {session.error}]")
+    else:
+        await ws.send_text("[END]")
+
+
 @app.websocket("/ws/chat")
 async def chat_ws(ws: WebSocket):
+    """Stream one answer.
+
+    With ``compare: [{provider, model}, ...]`` the prompt goes to every target
+    at once and the socket carries JSON events
+    (start/token/reasoning/answer_reset/end/done) tagged with the target
+    index instead of raw text.
+
+    With ``channels: true`` the socket carries JSON events instead of raw
+    text: ``{"type": "reasoning"|"answer", "text"}`` as the reply streams in,
+    then ``{"type": "end", "reasoning", "answer", "error"}``. An
+    ``{"type": "answer_reset", "text"}`` event means that text, already sent
+    as answer, turned out to be reasoning: cut it from the end of the answer
+    (it is sent again as reasoning).
+
+    Send ``stream_id`` with the request to make the generation resumable: it
+    then keeps running if the socket drops, and a new socket can send
+    ``{"resume": stream_id, "offset": <chunks received>}`` to pick it up.
+    Without it, closing the socket stops the generation (the "Stop" button).
+    """
     await ws.accept()
+    session: streams.StreamSession | None = None
+    resumable = False
     try:
         data = await ws.receive_json()
+        if data.get("resume"):
+            session = streams.get(str(data.get("resume")))
+            if session is None:
+                await ws.send_text("[Error: unknown or expired stream]")
+                return
+            resumable = True
+            await _follow_stream(ws, session, int(data.get("offset") or 0), bool(data.get("channels")))
+            return
         # Ensure provider API keys are available to SDKs
         defaults = read_settings()
-        for env_key in [
-            "OPENAI_API_KEY",
-            "OPENROUTER_API_KEY",
-            "ANTHROPIC_API_KEY",
-            "GEMINI_API_KEY",
-            "GOOGLE_API_KEY",
-            "AZURE_OPENAI_ENDPOINT",
-            "AZURE_OPENAI_API_KEY",
-            "TOGETHER_API_KEY",
-            "FIREWORKS_API_KEY",
-            "PERPLEXITY_API_KEY",
-            "MISTRAL_API_KEY",
-            "DEEPSEEK_API_KEY",
-            "COHERE_API_KEY",
-            "LITELLM_API_KEY",
-            "VLLM_API_KEY",
-            "LITELLM_BASE_URL",
-            "VLLM_BASE_URL",
-        ]:
-            val = data.get(env_key) if env_key in data else defaults.get(env_key)
-            if val:
-                os.environ[env_key] = str(val)
+        _export_provider_env(data, defaults)
         messages: List[Dict] = data.get("messages", [])
         provider: str = data.get("provider", "openai")
         model: str = data.get("model", "gpt-4o-mini")
         conversation_id: str | None = data.get("conversation_id")
         reasoning: bool = bool(data.get("reasoning"))
+        stream_id: str | None = data.get("stream_id") or None
+        resumable = bool(stream_id)
 
         # Apply system prompt and brief reasoning instruction if requested
-        final_msgs = list(messages)
-        if conversation_id:
-            conv0 = _load_conv(conversation_id)
-            sp = (conv0.get("system_prompt") or "").strip()
-            if sp:
-                final_msgs = [{"role": "system", "content": sp}] + final_msgs
-        if reasoning:
-            final_msgs = [{
-                "role": "system",
-                "content": (
-                    "Include a short 'Reasoning:' section (1-3 sentences) before the final answer. "
-                    "Do not reveal chain-of-thought; keep it concise and high-level."
-                ),
-            }] + final_msgs
+        final_msgs = _build_prompt(messages, conversation_id, reasoning)
 
-        # Stream chunks and accumulate final text
-        full_text = ""
-        for chunk in chat_stream(final_msgs, provider=provider, model=model):
-            full_text += chunk
-            await ws.send_text(chunk)
-        await ws.send_text("[END]")
-
-        # Parse reasoning from full_text
-        reasoning_text = None
-        final_answer = full_text
-        if isinstance(full_text, str) and "Reasoning:" in full_text:
-            parts = full_text.split("Reasoning:", 1)
-            tail = parts[1]
-            if "Answer:" in tail:
-                r, a = tail.split("Answer:", 1)
-                reasoning_text = r.strip()
-                final_answer = a.strip()
-            else:
-                chunks = tail.strip().split("\n\n", 1)
-                reasoning_text = chunks[0].strip()
-                final_answer = (chunks[1].strip() if len(chunks) > 1 else full_text)
+        targets = _compare_targets(data)
+        if targets:
+            await _compare_ws(ws, final_msgs, targets, messages, conversation_id, data.get("user"))
+            return
 
-        # Save to conversation if provided
-        if conversation_id:
-            conv = _load_conv(conversation_id)
-            if not conv.get("messages") and messages:
-                try:
-                    last_user = ""
-                    for m in reversed(messages):
-                        if m.get("role") == "user" and isinstance(m.get("content"), str):
-                            last_user = m["content"]
-                            break
-                    if last_user:
-                        conv["title"] = last_user[:40] + ("…" if len(last_user) > 40 else "")
-                except Exception:
-                    pass
-            conv_msgs = conv.get("messages", [])
-            conv_msgs.extend(messages)
-            conv_msgs.append({
-                "role": "assistant",
-                "content": final_answer,
-                "reasoning": reasoning_text,
-            })
-            conv["messages"] = conv_msgs
-            _save_conv(conversation_id, conv)
+        key = _coalesce_key("stream", data, provider, model, final_msgs, conversation_id) if coalesce.wanted(data, defaults) else None
+        try:
+            session = await _open_stream(messages, final_msgs, provider, model, conversation_id, stream_id, data.get("user"), key)
+        except ValueError as e:
+            await ws.send_text(f"[Error: {e}]")
+            return
+        await _follow_stream(ws, session, channels=bool(data.get("channels")))
     except WebSocketDisconnect:
         pass
     except Exception as e:
-        await ws.send_text(f"[Error: {e}]")
+        try:
+            await ws.send_text(f"[Error: {e}]")
+        except Exception:
+            pass
     finally:
+        if session is not None and not resumable:
+            session.release()
         try:
             await ws.close()
         except Exception:
             pass
+
+
+
+# --- Server-Sent Events ---
+# The same background generations as /ws/chat over plain HTTP, for setups where
+# WebSockets do not make it through a proxy. Each token event's id is the
+# number of chunks sent so far, so a reconnect with Last-Event-ID continues
+# where the client left off. An answer_reset event takes back answer text that
+# turned out to be reasoning (see ANSWER_RESET). Generations outlive the
+# response here; use DELETE /api/streams/{sid} to stop one.
+SSE_KEEPALIVE = float(os.environ.get("FERN_SSE_KEEPALIVE", "15"))
+SSE_RETRY_MS = 2000
+
+
+def _sse(event: str, data: Any, eid: int | None = None) -> str:
+    import json
+    head = f"id: {eid}\n" if eid is not None else ""
+    return f"{head}event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+
+def _last_event_id(request: Request) -> int:
+    raw = request.headers.get("last-event-id") or request.query_params.get("last_event_id") or "0"
+    try:
+        return max(0, int(raw))
+    except ValueError:
+        return 0
+
+
+async def _sse_events(session: streams.StreamSession, offset: int) -> AsyncIterator[str]:
+    yield f"retry: {SSE_RETRY_MS}\n" + _sse("start", {
+        "stream_id": session.id,
+        "conversation_id": session.conversation_id,
+        "message_id": session.message_id,
+        "offset": offset,
+    })
+    eid = offset
+    async for step in session.follow_parts(offset, idle=SSE_KEEPALIVE):
+        if step is None:
+            yield ": keep-alive\n\n"
+            continue
+        eid, pieces = step
+        # Only the last event of a chunk carries its id, so a resume never skips text
+        for n, (channel, text) in enumerate(pieces, 1):
+            yield _sse(_PIECE_EVENTS[channel], {"text": text}, eid if n == len(pieces) else None)
+    # "end" means the reply is saved: a client reloading the conversation
+    # right after it sees the final text
+    await session.settled()
+    reasoning_text, answer = session.split()
+    yield _sse("usage", {
+        **(session.usage or {}),
+        **session.timing(),
+        "chunks": len(session.chunks),
+        "characters": len(session.text()),
+    })
+    yield _sse("end", {
+        "stream_id": session.id,
+        "message_id": session.message_id,
+        "reasoning": reasoning_text,
+        "answer": answer,
+        "error": session.error,
+    }, eid)
+
+
+def _sse_response(session: streams.StreamSession, offset: int = 0) -> StreamingResponse:
+    return StreamingResponse(
+        _sse_events(session, offset),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@app.post("/api/chat/stream")
+async def chat_sse(body: Dict[str, Any], request: Request):
+    """Stream one answer as text/event-stream: start, reasoning/token..., usage, end.
+
+    Takes the same body as /ws/chat (without compare). Re-posting with the
+    same ``stream_id`` and a Last-Event-ID header resumes instead of starting
+    a new generation.
+    """
+    stream_id: str | None = body.get("stream_id") or None
+    existing = streams.get(stream_id) if stream_id else None
+    if existing is not None and request.headers.get("last-event-id") is not None:
+        return _sse_response(existing, _last_event_id(request))
+
+    defaults = read_settings()
+    _export_provider_env(body, defaults)
+    messages: List[Dict] = body.get("messages", [])
+    provider: str = body.get("provider") or defaults.get("provider", "openai")
+    model: str = body.get("model") or defaults.get("model", "gpt-4o-mini")
+    conversation_id: str | None = body.get("conversation_id")
+    final_msgs = _build_prompt(messages, conversation_id, bool(body.get("reasoning")))
+    key = _coalesce_key("stream", body, provider, model, final_msgs, conversation_id) if coalesce.wanted(body, defaults) else None
+    try:
+        session = await _open_stream(messages, final_msgs, provider, model, conversation_id, stream_id, body.get("user"), key)
+    except ValueError as e:
+        return JSONResponse({"error": str(e)}, status_code=409)
+    except RuntimeError as e:
+        return JSONResponse({"error": str(e)}, status_code=503)
+    return _sse_response(session)
+
+
+@app.get("/api/chat/stream/{sid}")
+async def resume_chat_sse(sid: str, request: Request):
+    """Follow a running or recently finished generation (EventSource-friendly)."""
+    session = streams.get(sid)
+    if session is None:
+        return JSONResponse({"error": "stream not found"}, status_code=404)
+    return _sse_response(session, _last_event_id(request))
+
+STARTUP["import_ms"] = int((time.perf_counter() - _IMPORT_STARTED) * 1000)
@@ -0,0 +1,220 @@
+import gzip
+import io
+import json
+import tarfile
+import time
+import zlib
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
+
+try:  # optional; enables .zst archives
+    import zstandard  # type: ignore
+except ImportError:
+    zstandard = None
+
+from .storage import ConversationStore, clean_conversation, newer_than
+
+# --- Conversation archive ---
+# The whole conversation store as one stream: NDJSON (one conversation per
+# line) or a tar of conversations/<id>.json members, either one optionally
+# gzip or zstd compressed. Export reads one conversation at a time, so memory
+# stays flat however large the store is. Import parses an upload incrementally
+# and hands it to the store in batches; compression and format are detected
+# from the data itself.
+
+FORMATS = ("ndjson", "tar")
+COMPRESSIONS = ("none", "gzip", "zstd")
+CONFLICT_POLICIES = ("newer", "skip", "replace")
+EXTENSIONS = {"ndjson": ".ndjson", "tar": ".tar", "none": "", "gzip": ".gz", "zstd": ".zst"}
+IMPORT_BATCH = 200
+# Larger members/lines are reported and skipped rather than read into memory
+MAX_CONVERSATION_BYTES = 64 * 1024 * 1024
+MAX_REPORTED_ERRORS = 50
+
+_GZIP_MAGIC = b"\x1f\x8b"
+_ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+
+
+def media_type(fmt: str, compression: str) -> str:
+    if compression != "none":
+        return f"application/{compression}"
+    return "application/x-ndjson" if fmt == "ndjson" else "application/x-tar"
+
+
+def file_name(fmt: str, compression: str) -> str:
+    return f"fern-conversations-{time.strftime('%Y%m%d')}{EXTENSIONS[fmt]}{EXTENSIONS[compression]}"
+
+
+def check_options(fmt: str, compression: str) -> None:
+    if fmt not in FORMATS:
+        raise ValueError(f"format must be one of {', '.join(FORMATS)}")
+    if compression not in COMPRESSIONS:
+        raise ValueError(f"compression must be one of {', '.join(COMPRESSIONS)}")
+    if compression == "zstd" and zstandard is None:
+        raise ValueError("zstd needs the zstandard package")
+
+
+# --- Export ---
+
+class _Sink:
+    """Write-only file object collecting what tarfile writes so it can be yielded."""
+
+    def __init__(self):
+        self._parts: List[bytes] = []
+
+    def write(self, data: bytes) -> int:
+        self._parts.append(bytes(data))
+        return len(data)
+
+    def drain(self) -> bytes:
+        data = b"".join(self._parts)
+        self._parts.clear()
+        return data
+
+
+def _compressor(compression: str) -> Optional[Tuple[Callable[[bytes], bytes], Callable[[], bytes]]]:
+    if compression == "gzip":
+        c = zlib.compressobj(6, zlib.DEFLATED, 31)  # wbits 31: gzip container
+        return c.compress, c.flush
+    if compression == "zstd":
+        z = zstandard.ZstdCompressor(level=3).compressobj()
+        return z.compress, z.flush
+    return None
+
+
+def _conversations(store: ConversationStore) -> Iterator[Tuple[str, bytes]]:
+    for cid in store.ids():
+        try:
+            conv = store.load(cid, cache=False)
+        except Exception as e:
+            print(f"[archive] Skipping {cid} in export: {e}")
+            continue
+        yield cid, json.dumps(conv, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def _export_ndjson(store: ConversationStore) -> Iterator[bytes]:
+    for _, data in _conversations(store):
+        yield data + b"\n"
+
+
+def _export_tar(store: ConversationStore) -> Iterator[bytes]:
+    sink = _Sink()
+    with tarfile.open(fileobj=sink, mode="w|", format=tarfile.PAX_FORMAT) as tar:
+        for cid, data in _conversations(store):
+            info = tarfile.TarInfo(f"conversations/{cid}.json")
+            info.size = len(data)
+            info.mtime = int(time.time())
+            tar.addfile(info, io.BytesIO(data))
+            yield sink.drain()
+    yield sink.drain()
+
+
+def export_stream(store: ConversationStore, fmt: str = "ndjson", compression: str = "none") -> Iterator[bytes]:
+    """The archive as a stream of byte chunks, built as it is consumed."""
+    check_options(fmt, compression)
+    compress = _compressor(compression)
+    for chunk in _export_tar(store) if fmt == "tar" else _export_ndjson(store):
+        if compress is not None:
+            chunk = compress[0](chunk)
+        if chunk:
+            yield chunk
+    if compress is not None:
+        yield compress[1]()
+
+
+# --- Import ---
+
+def _decompressed(upload) -> Any:
+    """A reader over the upload's decompressed bytes, from the start."""
+    upload.seek(0)
+    magic = upload.read(4)
+    upload.seek(0)
+    if magic[:2] == _GZIP_MAGIC:
+        return gzip.GzipFile(fileobj=upload, mode="rb")
+    if magic == _ZSTD_MAGIC:
+        if zstandard is None:
+            raise ValueError("zstd archive but the zstandard package is not installed")
+        return io.BufferedReader(zstandard.ZstdDecompressor().stream_reader(upload, closefd=False))
+    return upload
+
+
+def _is_tar(upload) -> bool:
+    head = _decompressed(upload).read(512)
+    return len(head) >= 262 and head[257:262] == b"ustar"
+
+
+def _ndjson_records(reader) -> Iterator[Union[Dict[str, Any], str]]:
+    line_no = 0
+    while True:
+        line = reader.readline(MAX_CONVERSATION_BYTES + 1)
+        if not line:
+            return
+        line_no += 1
+        if len(line) > MAX_CONVERSATION_BYTES and not line.endswith(b"\n"):
+            while line and not line.endswith(b"\n"):
+                line = reader.readline(MAX_CONVERSATION_BYTES)
+            yield f"line {line_no}: larger than {MAX_CONVERSATION_BYTES} bytes"
+            continue
+        if not line.strip():
+            continue
+        try:
+            yield json.loads(line)
+        except ValueError as e:
+            yield f"line {line_no}: invalid JSON: {e}"
+
+
+def _tar_records(reader) -> Iterator[Union[Dict[str, Any], str]]:
+    with tarfile.open(fileobj=reader, mode="r|*") as tar:
+        for member in tar:
+            if not member.isfile() or not member.name.endswith(".json"):
+                continue
+            if member.size > MAX_CONVERSATION_BYTES:
+                yield f"{member.name}: larger than {MAX_CONVERSATION_BYTES} bytes"
+                continue
+            try:
+                yield json.loads(tar.extractfile(member).read())
+            except ValueError as e:
+                yield f"{member.name}: invalid JSON: {e}"
+
+
+def read_archive(upload) -> Iterator[Union[Dict[str, Any], str]]:
+    """Parse a seekable upload into conversations; unusable entries come out as error strings."""
+    tar = _is_tar(upload)
+    reader = _decompressed(upload)
+    for record in _tar_records(reader) if tar else _ndjson_records(reader):
+        if isinstance(record, str):
+            yield record
+            continue
+        conv = clean_conversation(record)
+        if conv is None:
+            cid = record.get("id") if isinstance(record, dict) else None
+            yield f"conversation {str(cid)[:80]!r}: missing or invalid id or messages"
+            continue
+        yield conv
+
+
+def next_batch(records: Iterator[Union[Dict[str, Any], str]], size: int, on_conflict: str) -> Tuple[List[Dict[str, Any]], List[str], int]:
+    """Up to ``size`` conversations from ``records``; returns (batch, errors, duplicates dropped).
+
+    A conversation listed twice within the batch is resolved by the same
+    ``on_conflict`` rule used against the store. An empty batch with no
+    errors means the archive is exhausted.
+    """
+    batch: Dict[str, Dict[str, Any]] = {}
+    errors: List[str] = []
+    duplicates = 0
+    read = 0
+    for record in records:
+        read += 1
+        if isinstance(record, str):
+            errors.append(record)
+        else:
+            cid = record["id"]
+            seen = batch.get(cid)
+            if seen is not None:
+                duplicates += 1
+                if on_conflict == "skip" or (on_conflict == "newer" and not newer_than(record, seen)):
+                    record = seen
+            batch[cid] = record
+        if read >= size:
+            break
+    return list(batch.values()), errors, duplicates
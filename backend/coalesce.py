@@ -0,0 +1,64 @@
+import asyncio
+import hashlib
+import json
+from typing import Any, Awaitable, Callable, Dict, Tuple, TypeVar
+
+# --- Request coalescing ---
+# Double-clicks, UI retries and several open tabs can send the very same chat
+# request at the same moment. A request that opts in is keyed by a hash of
+# everything that decides its answer (provider, model, the final prompt, the
+# conversation it is saved to, the caller and their credentials), and
+# concurrent duplicates share one upstream call: streamed requests follow the
+# running StreamSession from its first chunk, /api/chat callers await the same
+# task. Nothing is cached once the call finishes.
+#
+# Sharing is opt-in because a sampled reply is one draw among many: two
+# identical requests may well want two different answers. It is enabled per
+# request with "coalesce": true or for every request with the
+# "coalesce_requests" setting; "coalesce": false opts a request out again.
+
+T = TypeVar("T")
+
+
+def wanted(request: Dict[str, Any], settings: Dict[str, Any]) -> bool:
+    """Whether ``request`` may share a generation with identical ones."""
+    explicit = request.get("coalesce")
+    if explicit is not None:
+        return bool(explicit)
+    return bool(settings.get("coalesce_requests"))
+
+
+def request_key(kind: str, **parts: Any) -> str:
+    """Canonical hash of a request; equal for requests that must produce the same answer."""
+    payload = json.dumps({"kind": kind, **parts}, sort_keys=True, ensure_ascii=False, separators=(",", ":"), default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class Coalescer:
+    """Runs one task per key; identical calls made while it runs await the same result."""
+
+    def __init__(self):
+        self._inflight: Dict[str, asyncio.Task] = {}
+        self.joined = 0
+
+    def _done(self, key: str, task: asyncio.Task) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if not task.cancelled():
+            task.exception()  # retrieved here in case every caller went away
+
+    async def run(self, key: str, factory: Callable[[], Awaitable[T]]) -> Tuple[T, bool]:
+        """Result of ``factory()`` or of the identical call already running; returns (result, joined).
+
+        The call runs as its own task, so it completes (and saves its turn)
+        even if the request that started it disconnects.
+        """
+        task = self._inflight.get(key)
+        joined = task is not None
+        if task is None:
+            task = asyncio.ensure_future(factory())
+            self._inflight[key] = task
+            task.add_done_callback(lambda t: self._done(key, t))
+        else:
+            self.joined += 1
+        return await asyncio.shield(task), joined
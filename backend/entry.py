@@ -1,9 +1,28 @@
+import argparse
+import json
 import os
+import socket
+import sys
+import time
+
+# Reference point for the backend's cold-start report; keep a launcher's value
+os.environ.setdefault("FERN_LAUNCH_T0", str(time.time()))
+# This launcher always runs a single server process, so deferred conversation
+# saves are safe here (see storage.WRITE_BEHIND_DELAY)
+os.environ.setdefault("FERN_WRITE_BEHIND_MS", "250")
+
 import uvicorn
 
-# Ensure a predictable host/port to match Electron expectations
+# Defaults match Electron's expectations. Without FERN_PORT the server keeps
+# to DEFAULT_PORT so the web UI's origin (and with it localStorage: client id,
+# settings, theme) stays the same across launches, and only falls back to an
+# ephemeral port while that one is taken. An explicit FERN_PORT is used as is;
+# FERN_PORT=0 always binds an ephemeral port.
 HOST = os.environ.get("FERN_HOST", "127.0.0.1")
-PORT = int(os.environ.get("FERN_PORT", "8000"))
+DEFAULT_PORT = 8000
+PORT = int(os.environ["FERN_PORT"]) if os.environ.get("FERN_PORT") else None
+UDS = os.environ.get("FERN_UDS") or None
+READY_PREFIX = "FERN_READY "
 
 # Import the FastAPI app
 try:
@@ -15,6 +34,99 @@ except Exception as e:
     except Exception:
         raise
 
-if __name__ == "__main__":
+
+def bind_socket(host: str = HOST, port: int = DEFAULT_PORT, uds: str | None = None, fallback: bool = False) -> socket.socket:
+    """Bind the listening socket up front so the real address is known before serving.
+
+    With ``fallback``, an ephemeral port is used when ``port`` is taken.
+    """
+    if uds:
+        if not hasattr(socket, "AF_UNIX"):
+            raise RuntimeError("Unix domain sockets are not supported on this platform")
+        if os.path.exists(uds):
+            os.unlink(uds)
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.bind(uds)
+    else:
+        sock = socket.socket(socket.AF_INET6 if ":" in host else socket.AF_INET, socket.SOCK_STREAM)
+        if os.name != "nt":
+            # On Windows this would let us bind a port another process listens on
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        try:
+            sock.bind((host, port))
+        except OSError:
+            if not fallback or port == 0:
+                sock.close()
+                raise
+            sock.bind((host, 0))
+    return sock
+
+
+def describe(sock: socket.socket) -> dict:
+    addr = sock.getsockname()
+    if isinstance(addr, str):
+        # No URL: a browser cannot load a socket path, clients connect to "uds"
+        return {"uds": addr, "pid": os.getpid()}
+    host, port = addr[0], addr[1]
+    shown = f"[{host}]" if ":" in host else host
+    return {"host": host, "port": port, "url": f"http://{shown}:{port}", "pid": os.getpid()}
+
+
+class ReadyServer(uvicorn.Server):
+    """uvicorn server that reports its address once lifespan startup is done and it is listening."""
+
+    def __init__(self, config: uvicorn.Config, on_ready=None):
+        super().__init__(config)
+        self.on_ready = on_ready
+
+    async def startup(self, sockets=None) -> None:
+        await super().startup(sockets=sockets)
+        if self.started and self.on_ready is not None and sockets:
+            self.on_ready(describe(sockets[0]))
+
+
+def announce(info: dict, fd: int | None = None) -> None:
+    """Write the readiness line to stdout, or to an inherited pipe when ``fd`` is given."""
+    line = READY_PREFIX + json.dumps(info) + "\n"
+    if fd is None:
+        sys.stdout.write(line)
+        sys.stdout.flush()
+        return
+    try:
+        os.write(fd, line.encode("utf-8"))
+    finally:
+        os.close(fd)
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Fern backend")
+    parser.add_argument("--host", default=HOST)
+    parser.add_argument(
+        "--port",
+        type=int,
+        default=PORT,
+        help=f"0 picks a free port; by default {DEFAULT_PORT}, or a free port while it is taken",
+    )
+    parser.add_argument("--uds", default=UDS, help="serve on a Unix domain socket instead")
+    parser.add_argument(
+        "--ready-fd",
+        type=int,
+        default=int(os.environ["FERN_READY_FD"]) if os.environ.get("FERN_READY_FD") else None,
+        help="write the readiness line to this file descriptor instead of stdout",
+    )
+    args = parser.parse_args(argv)
+
+    if args.port is None:
+        sock = bind_socket(args.host, DEFAULT_PORT, args.uds, fallback=True)
+    else:
+        sock = bind_socket(args.host, args.port, args.uds)
+    server = ReadyServer(
+        uvicorn.Config(app, log_level="info"),
+        on_ready=lambda info: announce(info, args.ready_fd),
+    )
     # Run uvicorn programmatically to avoid needing a CLI
-    uvicorn.run(app, host=HOST, port=PORT, log_level="info")
+    server.run(sockets=[sock])
+
+
+if __name__ == "__main__":
+    main()
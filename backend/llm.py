@@ -1,26 +1,47 @@
+import importlib
 import os
-from typing import List, Dict, Generator, Optional
-import httpx
+import threading
+import time
+from typing import Any, Callable, List, Dict, Generator, Optional, Tuple
 
-try:
-    from openai import OpenAI  # OpenAI and OpenRouter compatible
-except Exception:
-    OpenAI = None  # type: ignore
+from .reasoning import ReasoningDelta
+
+# --- Provider SDKs ---
+# The SDKs are imported on first use (or by prewarm() once the server is up)
+# rather than at module import; together they add well over a second to cold
+# start. A missing SDK resolves to None, as the old optional imports did.
+# httpx is imported where it is used for the same reason.
+SDK_MODULES: Dict[str, str] = {
+    "openai": "openai",  # OpenAI and OpenRouter compatible
+    "anthropic": "anthropic",
+    "gemini": "google.generativeai",
+    "ollama": "ollama",
+}
+_sdks: Dict[str, Any] = {}
+_sdks_lock = threading.Lock()
+# Import cost per SDK in milliseconds, for the startup report
+sdk_import_ms: Dict[str, int] = {}
 
-try:
-    import anthropic
-except Exception:
-    anthropic = None  # type: ignore
 
-try:
-    import google.generativeai as genai
-except Exception:
-    genai = None  # type: ignore
+def sdk(name: str) -> Any:
+    """Return the SDK module for ``name`` (see SDK_MODULES), importing it on first use."""
+    if name in _sdks:
+        return _sdks[name]
+    with _sdks_lock:
+        if name not in _sdks:
+            started = time.perf_counter()
+            try:
+                _sdks[name] = importlib.import_module(SDK_MODULES[name])
+            except Exception:
+                _sdks[name] = None
+            sdk_import_ms[name] = int((time.perf_counter() - started) * 1000)
+        return _sdks[name]
 
-try:
-    import ollama as ollama_sdk
-except Exception:
-    ollama_sdk = None  # type: ignore
+
+def prewarm(names: Optional[List[str]] = None) -> None:
+    """Import provider SDKs ahead of the first request (run in a background thread)."""
+    for name in names or list(SDK_MODULES):
+        sdk(name)
 
 
 def _concat_messages(messages: List[Dict]) -> str:
@@ -32,23 +53,93 @@ def _concat_messages(messages: List[Dict]) -> str:
     return "\n".join(parts)
 
 
+# --- Client pool ---
+# SDK clients wrap an HTTP connection pool; reusing them keeps TLS sessions
+# warm across requests and lets concurrent calls share connections. Keys
+# include the credentials so changing a key in Settings gets a fresh client.
+# Idle connections are kept for POOL_KEEPALIVE seconds instead of httpx's 5,
+# long enough for a prewarmed connection to survive until the first prompt.
+_clients: Dict[Tuple, Any] = {}
+_clients_lock = threading.Lock()
+POOL_KEEPALIVE = float(os.environ.get("FERN_POOL_KEEPALIVE", "90"))
+
+
+def _http_limits() -> Any:
+    import httpx
+    return httpx.Limits(max_connections=100, max_keepalive_connections=20, keepalive_expiry=POOL_KEEPALIVE)
+
+
+def _sdk_http_client(module: Any) -> Any:
+    # The SDKs' own httpx subclass keeps their default timeouts and redirects
+    factory = getattr(module, "DefaultHttpxClient", None)
+    return factory(limits=_http_limits()) if factory is not None else None
+
+
+# httpx client injected into each pooled SDK client, by id() of the SDK client
+# (pooled clients live as long as the process); prewarming connects through it
+_transports: Dict[int, Any] = {}
+
+
+def _sdk_client(module: Any, build: Callable[[Any], Any]) -> Any:
+    """``build(http_client)`` with our pooled-limits httpx client, remembering it for prewarming."""
+    http = _sdk_http_client(module)
+    client = build(http)
+    if http is not None:
+        _transports[id(client)] = http
+    return client
+
+
+def _pooled(key: Tuple, factory: Callable[[], Any]) -> Any:
+    with _clients_lock:
+        client = _clients.get(key)
+        if client is None:
+            client = factory()
+            _clients[key] = client
+        return client
+
+
 def _get_openai_client(base_url: Optional[str] = None, api_key_env: str = "OPENAI_API_KEY"):
     api_key = os.getenv(api_key_env)
-    if not api_key or OpenAI is None:
+    openai_sdk = sdk("openai") if api_key else None
+    if openai_sdk is None:
         return None
-    if base_url:
-        return OpenAI(api_key=api_key, base_url=base_url)
-    return OpenAI(api_key=api_key)
+    OpenAI = openai_sdk.OpenAI
+    return _pooled(
+        ("openai", base_url or None, api_key),
+        lambda: _sdk_client(openai_sdk, lambda http: OpenAI(api_key=api_key, base_url=base_url or None, http_client=http)),
+    )
 
 
 def _get_azure_openai_client():
     # Uses OpenAI client pointed at Azure endpoint
     endpoint = os.getenv("AZURE_OPENAI_ENDPOINT")  # e.g. https://YOUR-RESOURCE.openai.azure.com
     api_key = os.getenv("AZURE_OPENAI_API_KEY")
-    if not endpoint or not api_key or OpenAI is None:
+    openai_sdk = sdk("openai") if endpoint and api_key else None
+    if openai_sdk is None:
         return None
+    OpenAI = openai_sdk.OpenAI
     base_url = endpoint.rstrip("/") + "/openai"
-    return OpenAI(api_key=api_key, base_url=base_url)
+    return _pooled(
+        ("openai", base_url, api_key),
+        lambda: _sdk_client(openai_sdk, lambda http: OpenAI(api_key=api_key, base_url=base_url, http_client=http)),
+    )
+
+
+def _get_anthropic_client(key: str):
+    anthropic_sdk = sdk("anthropic")
+    return _pooled(
+        ("anthropic", key),
+        lambda: _sdk_client(anthropic_sdk, lambda http: anthropic_sdk.Anthropic(api_key=key, http_client=http)),
+    )
+
+
+def _get_ollama_client():
+    return _pooled(("ollama", os.getenv("OLLAMA_HOST")), lambda: sdk("ollama").Client(limits=_http_limits()))
+
+
+def _get_http_client():
+    import httpx
+    return _pooled(("httpx",), lambda: httpx.Client(timeout=30, limits=_http_limits()))
 
 
 OPENAI_COMPAT: Dict[str, Dict[str, Optional[str]]] = {
@@ -66,7 +157,94 @@ OPENAI_COMPAT: Dict[str, Dict[str, Optional[str]]] = {
 }
 
 
-def chat_once(messages: List[Dict], provider: str = "openai", model: str = "gpt-4o-mini") -> str:
+def _compat_client(provider: str):
+    """Pooled client for an OpenAI-compatible provider or Azure; None when not configured."""
+    if provider == "azure":
+        return _get_azure_openai_client()
+    base_url = OPENAI_COMPAT[provider]["base_url"]
+    api_key_env = OPENAI_COMPAT[provider]["env"] or "OPENAI_API_KEY"
+    # Allow ENV override for base_url for local gateways (e.g., LITELLM_BASE_URL, VLLM_BASE_URL)
+    if base_url is None:
+        env_base = os.getenv(f"{provider.upper()}_BASE_URL")
+        if env_base:
+            base_url = env_base
+    return _get_openai_client(base_url=base_url, api_key_env=api_key_env)
+
+
+# --- Usage ---
+# Token counts as the providers report them, normalized to prompt/completion/
+# cached tokens. The chat functions only return text, so counts go to an
+# optional on_usage callback.
+UsageCallback = Optional[Callable[[Dict[str, int]], None]]
+# OpenAI-compatible APIs that send a final usage chunk when streaming only if
+# asked to via stream_options
+STREAM_USAGE_PROVIDERS = {"openai", "openrouter", "together", "fireworks", "deepseek", "litellm", "vllm"}
+
+
+def _field(obj: Any, name: str) -> Any:
+    if obj is None:
+        return None
+    if isinstance(obj, dict):
+        return obj.get(name)
+    return getattr(obj, name, None)
+
+
+def usage_from(provider: str, raw: Any) -> Optional[Dict[str, int]]:
+    """Normalize a provider's usage block; None when it has no counts."""
+    if raw is None:
+        return None
+    if provider == "anthropic":
+        # input_tokens leaves out the cached part (read or written); count the
+        # whole prompt like the other providers do
+        read = _field(raw, "cache_read_input_tokens")
+        prompt = _field(raw, "input_tokens")
+        if prompt is not None:
+            prompt = int(prompt) + int(read or 0) + int(_field(raw, "cache_creation_input_tokens") or 0)
+        counts = (prompt, _field(raw, "output_tokens"), read)
+    elif provider == "gemini":
+        counts = (_field(raw, "prompt_token_count"), _field(raw, "candidates_token_count"), _field(raw, "cached_content_token_count"))
+    elif provider == "ollama":
+        counts = (_field(raw, "prompt_eval_count"), _field(raw, "eval_count"), None)
+    elif provider == "cohere":
+        billed = _field(raw, "billed_units")
+        counts = (_field(billed, "input_tokens"), _field(billed, "output_tokens"), None)
+    else:
+        cached = _field(_field(raw, "prompt_tokens_details"), "cached_tokens")
+        if cached is None:
+            cached = _field(raw, "prompt_cache_hit_tokens")  # DeepSeek
+        counts = (_field(raw, "prompt_tokens"), _field(raw, "completion_tokens"), cached)
+    if counts[0] is None and counts[1] is None:
+        return None
+    prompt, completion, cached = (int(c or 0) for c in counts)
+    return {"prompt_tokens": prompt, "completion_tokens": completion, "cached_tokens": cached}
+
+
+def _report(on_usage: UsageCallback, provider: str, raw: Any) -> None:
+    if on_usage is None:
+        return
+    usage = usage_from(provider, raw)
+    if usage is not None:
+        try:
+            on_usage(usage)
+        except Exception:
+            pass
+
+
+def _with_reasoning(message: Any) -> str:
+    """Message text, with provider-native reasoning (reasoning_content) as a 'Reasoning:' section."""
+    content = getattr(message, "content", None) or ""
+    thinking = getattr(message, "reasoning_content", None)
+    if thinking:
+        return f"Reasoning: {thinking.strip()}\n\nAnswer: {content}"
+    return content
+
+
+def chat_once(
+    messages: List[Dict],
+    provider: str = "openai",
+    model: str = "gpt-4o-mini",
+    on_usage: UsageCallback = None,
+) -> str:
     """
     Return a single assistant message for the given conversation.
     Falls back to a local echo if no provider/key is configured.
@@ -83,7 +261,8 @@ def chat_once(messages: List[Dict], provider: str = "openai", model: str = "gpt-
                     messages=messages,
                     temperature=0.2,
                 )
-                return resp.choices[0].message.content or ""
+                _report(on_usage, provider, getattr(resp, "usage", None))
+                return _with_reasoning(resp.choices[0].message)
 
         if provider == "azure":
             # model should be Azure deployment name
@@ -94,12 +273,13 @@ def chat_once(messages: List[Dict], provider: str = "openai", model: str = "gpt-
                     messages=messages,
                     temperature=0.2,
                 )
+                _report(on_usage, provider, getattr(resp, "usage", None))
                 return resp.choices[0].message.content or ""
 
-        if provider == "anthropic" and anthropic is not None:
+        if provider == "anthropic" and sdk("anthropic") is not None:
             key = os.getenv("ANTHROPIC_API_KEY")
             if key:
-                aclient = anthropic.Anthropic(api_key=key)
+                aclient = _get_anthropic_client(key)
                 # Anthropics expects a different message shape; simplify by concatenating
                 prompt_text = _concat_messages(messages)
                 msg = aclient.messages.create(
@@ -107,6 +287,7 @@ def chat_once(messages: List[Dict], provider: str = "openai", model: str = "gpt-
                     max_tokens=1024,
                     messages=[{"role": "user", "content": prompt_text}],
                 )
+                _report(on_usage, provider, getattr(msg, "usage", None))
                 # content is a list; join text segments
                 chunks = []
                 for block in getattr(msg, "content", []) or []:
@@ -114,20 +295,23 @@ def chat_once(messages: List[Dict], provider: str = "openai", model: str = "gpt-
                         chunks.append(getattr(block, "text", ""))
                 return "".join(chunks) or ""
 
-        if provider == "gemini" and genai is not None:
+        if provider == "gemini" and sdk("gemini") is not None:
             key = os.getenv("GEMINI_API_KEY") or os.getenv("GOOGLE_API_KEY")
             if key:
+                genai = sdk("gemini")
                 genai.configure(api_key=key)
                 prompt_text = _concat_messages(messages)
                 mdl = genai.GenerativeModel(model)
                 resp = mdl.generate_content(prompt_text)
+                _report(on_usage, provider, getattr(resp, "usage_metadata", None))
                 return getattr(resp, "text", "") or ""
 
-        if provider == "ollama" and ollama_sdk is not None:
+        if provider == "ollama" and sdk("ollama") is not None:
             # Requires local Ollama running
-            client = ollama_sdk.Client()
+            client = _get_ollama_client()
             # Keep only user/assistant parts; Ollama supports chat format
             resp = client.chat(model=model, messages=[{"role": m.get("role", "user"), "content": m.get("content", "")} for m in messages if m.get("role") in ("user", "assistant", "system")])
+            _report(on_usage, provider, resp)
             msg = resp.get("message", {})
             return msg.get("content", "")
 
@@ -152,15 +336,15 @@ def chat_once(messages: List[Dict], provider: str = "openai", model: str = "gpt-
                     "chat_history": chat_history,
                 }
                 try:
-                    with httpx.Client(timeout=30) as h:
-                        r = h.post(
-                            "https://api.cohere.com/v1/chat",
-                            headers={"Authorization": f"Bearer {key}", "Content-Type": "application/json"},
-                            json=payload,
-                        )
-                        r.raise_for_status()
-                        data = r.json()
-                        return data.get("text") or data.get("response", {}).get("text", "") or ""
+                    r = _get_http_client().post(
+                        "https://api.cohere.com/v1/chat",
+                        headers={"Authorization": f"Bearer {key}", "Content-Type": "application/json"},
+                        json=payload,
+                    )
+                    r.raise_for_status()
+                    data = r.json()
+                    _report(on_usage, provider, data.get("meta"))
+                    return data.get("text") or data.get("response", {}).get("text", "") or ""
                 except Exception as e:
                     return f"[Provider error: {e}]"
     except Exception as e:
@@ -170,36 +354,43 @@ def chat_once(messages: List[Dict], provider: str = "openai", model: str = "gpt-
     return f"You said: {last_user}"
 
 
-def chat_stream(messages: List[Dict], provider: str = "openai", model: str = "gpt-4o-mini") -> Generator[str, None, None]:
+def chat_stream(
+    messages: List[Dict],
+    provider: str = "openai",
+    model: str = "gpt-4o-mini",
+    on_usage: UsageCallback = None,
+) -> Generator[str, None, None]:
     """
     Stream assistant tokens. Falls back to a single chunk if streaming isn't available.
+    Usage, where the provider reports it, is passed to ``on_usage`` once the stream ends.
     """
     # 1) OpenAI-compatible (OpenAI, OpenRouter, Together, Fireworks, Perplexity, Mistral, DeepSeek) + Azure
     if provider in set(OPENAI_COMPAT.keys()) | {"azure"}:
         try:
-            if provider == "azure":
-                client = _get_azure_openai_client()
-            else:
-                base_url = OPENAI_COMPAT[provider]["base_url"]
-                api_key_env = OPENAI_COMPAT[provider]["env"] or "OPENAI_API_KEY"
-                # Allow ENV override for base_url for local gateways (e.g., LITELLM_BASE_URL, VLLM_BASE_URL)
-                if base_url is None:
-                    env_base = os.getenv(f"{provider.upper()}_BASE_URL")
-                    if env_base:
-                        base_url = env_base
-                client = _get_openai_client(base_url=base_url, api_key_env=api_key_env)
+            client = _compat_client(provider)
             if client is not None:
                 # Prefer simple iterator API if available
                 try:
+                    extra: Dict[str, Any] = {}
+                    if provider in STREAM_USAGE_PROVIDERS:
+                        extra["stream_options"] = {"include_usage": True}
                     iterator = client.chat.completions.create(
                         model=model,
                         messages=messages,
                         temperature=0.2,
                         stream=True,
+                        **extra,
                     )
+                    usage = None
                     for event in iterator:
+                        # The usage chunk (if any) comes last, with no choices
+                        usage = getattr(event, "usage", None) or usage
                         try:
                             delta = event.choices[0].delta  # type: ignore[attr-defined]
+                            # DeepSeek-style reasoning deltas go out as their own channel
+                            thinking = getattr(delta, "reasoning_content", None) if delta else None
+                            if thinking:
+                                yield ReasoningDelta(thinking)
                             if delta and getattr(delta, "content", None):
                                 yield delta.content  # type: ignore[index]
                         except Exception:
@@ -207,6 +398,7 @@ def chat_stream(messages: List[Dict], provider: str = "openai", model: str = "gp
                             piece = getattr(event, "delta", None)
                             if piece and getattr(piece, "content", None):
                                 yield piece.content
+                    _report(on_usage, provider, usage)
                     return
                 except Exception:
                     # Fallback to with_streaming_response if present
@@ -227,11 +419,11 @@ def chat_stream(messages: List[Dict], provider: str = "openai", model: str = "gp
             pass
 
     # 2) Anthropic streaming
-    if provider == "anthropic" and anthropic is not None:
+    if provider == "anthropic" and sdk("anthropic") is not None:
         try:
             key = os.getenv("ANTHROPIC_API_KEY")
             if key:
-                aclient = anthropic.Anthropic(api_key=key)
+                aclient = _get_anthropic_client(key)
                 prompt_text = _concat_messages(messages)
                 with aclient.messages.stream(
                     model=model,
@@ -244,25 +436,33 @@ def chat_stream(messages: List[Dict], provider: str = "openai", model: str = "gp
                                 yield event.delta.text
                         except Exception:
                             pass
+                    try:
+                        _report(on_usage, provider, stream.get_final_message().usage)
+                    except Exception:
+                        pass
                     return
         except Exception:
             pass
 
     # 3) Gemini streaming
-    if provider == "gemini" and genai is not None:
+    if provider == "gemini" and sdk("gemini") is not None:
         try:
             key = os.getenv("GEMINI_API_KEY") or os.getenv("GOOGLE_API_KEY")
             if key:
+                genai = sdk("gemini")
                 genai.configure(api_key=key)
                 prompt_text = _concat_messages(messages)
                 mdl = genai.GenerativeModel(model)
+                usage = None
                 for chunk in mdl.generate_content(prompt_text, stream=True):
+                    usage = getattr(chunk, "usage_metadata", None) or usage
                     try:
                         text = getattr(chunk, "text", None)
                         if text:
                             yield text
                     except Exception:
                         pass
+                _report(on_usage, provider, usage)
                 return
         except Exception:
             pass
@@ -271,5 +471,83 @@ def chat_stream(messages: List[Dict], provider: str = "openai", model: str = "gp
     # If needed, implement streaming later; otherwise fallback below
 
     # Fallback non-streaming
-    yield chat_once(messages, provider=provider, model=model)
+    yield chat_once(messages, provider=provider, model=model, on_usage=on_usage)
+
+
+# --- Prewarming ---
+# Picking a model is a strong hint that a request for it follows shortly.
+# prewarm_provider() takes the one-off costs out of that first request's TTFT:
+# importing the SDK, building the pooled client, opening a connection (DNS,
+# TCP, TLS) that then waits in the pool for up to POOL_KEEPALIVE seconds, and
+# for Ollama loading the model into memory for OLLAMA_KEEP_ALIVE.
+OLLAMA_KEEP_ALIVE = os.environ.get("FERN_OLLAMA_KEEP_ALIVE", "30m")
+PREWARM_TIMEOUT = 10.0
+COHERE_BASE_URL = "https://api.cohere.com"
+
+
+def _connect(client: Any) -> None:
+    # Any response to a HEAD of the API root leaves an open connection in the
+    # pool of the httpx client the SDK client sends through, without spending
+    # an API call or needing a valid key
+    http = _transports.get(id(client))
+    if http is None:
+        return
+    http.head(str(client.base_url), timeout=PREWARM_TIMEOUT)
+
+
+def prewarm_provider(provider: str, model: str) -> Dict[str, Any]:
+    """Get ``provider``/``model`` ready for a request; blocking, run it in a thread.
+
+    Returns per-step timings; failures are reported in ``error`` rather than
+    raised, since a failed prewarm only means the first request pays as usual.
+    """
+    report: Dict[str, Any] = {"provider": provider, "model": model, "ok": True}
+
+    def step(name: str, fn: Callable[[], Any]) -> Any:
+        started = time.perf_counter()
+        try:
+            return fn()
+        except Exception as e:
+            report["ok"] = False
+            report.setdefault("error", f"{name}: {e}")
+        finally:
+            report[f"{name}_ms"] = int((time.perf_counter() - started) * 1000)
+
+    def unconfigured() -> Dict[str, Any]:
+        report.update(ok=False, error="provider not configured")
+        return report
 
+    if provider in OPENAI_COMPAT or provider == "azure":
+        step("sdk", lambda: sdk("openai"))
+        client = step("client", lambda: _compat_client(provider))
+        if client is None:
+            return unconfigured()
+        step("connect", lambda: _connect(client))
+    elif provider == "anthropic":
+        key = os.getenv("ANTHROPIC_API_KEY")
+        if step("sdk", lambda: sdk("anthropic")) is None or not key:
+            return unconfigured()
+        client = step("client", lambda: _get_anthropic_client(key))
+        step("connect", lambda: _connect(client))
+    elif provider == "gemini":
+        key = os.getenv("GEMINI_API_KEY") or os.getenv("GOOGLE_API_KEY")
+        genai = step("sdk", lambda: sdk("gemini"))
+        if genai is None or not key:
+            return unconfigured()
+        genai.configure(api_key=key)
+        # Model metadata goes over the same transport a generation would use
+        step("connect", lambda: genai.get_model(model if model.startswith("models/") else f"models/{model}"))
+    elif provider == "ollama":
+        if step("sdk", lambda: sdk("ollama")) is None:
+            return unconfigured()
+        client = step("client", _get_ollama_client)
+        # An empty prompt only loads the model
+        step("load", lambda: client.generate(model=model, prompt="", keep_alive=OLLAMA_KEEP_ALIVE))
+        report["keep_alive"] = OLLAMA_KEEP_ALIVE
+    elif provider == "cohere":
+        if not os.getenv("COHERE_API_KEY"):
+            return unconfigured()
+        step("connect", lambda: _get_http_client().head(COHERE_BASE_URL, timeout=PREWARM_TIMEOUT))
+    else:
+        return unconfigured()
+    return report
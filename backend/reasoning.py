@@ -0,0 +1,200 @@
+from typing import List, Optional, Tuple
+
+# --- Reasoning / answer split ---
+# With reasoning enabled the model is asked for a "Reasoning:" section before
+# its answer. ReasoningSplitter separates the two while the reply streams in:
+# it is fed chunks as they arrive and returns (channel, text) pieces, holding
+# back only the few characters that could still turn out to be part of a
+# marker. Providers that stream reasoning natively (DeepSeek's
+# reasoning_content) yield ReasoningDelta chunks, which pass straight through.
+
+REASONING = "reasoning"
+ANSWER = "answer"
+# Withdraws answer text already sent: the piece's text is to be cut from the
+# end of the answer (it follows again on the reasoning channel)
+ANSWER_RESET = "answer_reset"
+REASONING_MARKER = "Reasoning:"
+ANSWER_MARKER = "Answer:"
+# Whitespace and markdown decoration allowed around a marker ("**Answer:**")
+DECORATION = " \t\r\n*_#>"
+_SPACE = " \t\r\n"
+
+Piece = Tuple[str, str]
+
+
+class ReasoningDelta(str):
+    """A chunk of provider-native reasoning, as opposed to answer text."""
+
+
+def _marker_tail(buf: str, marker: str) -> int:
+    """Index where a possible (partial) marker plus its leading decoration starts."""
+    cut = len(buf)
+    for k in range(min(len(marker) - 1, len(buf)), 0, -1):
+        if marker.startswith(buf[-k:]):
+            cut = len(buf) - k
+            break
+    while cut > 0 and buf[cut - 1] in DECORATION:
+        cut -= 1
+    return cut
+
+
+class ReasoningSplitter:
+    """Incremental 'Reasoning: ... Answer: ...' parser.
+
+    The reasoning section ends at "Answer:" or, failing that, at the first
+    blank line. Text after that blank line streams as answer right away, but
+    if an "Answer:" marker still follows, an ANSWER_RESET piece takes it
+    back and it is sent again on the reasoning channel. Applying the pieces
+    in order always gives what result() returns. A reply that does not open with "Reasoning:" is all answer and is passed on
+    without delay.
+    """
+
+    def __init__(self):
+        self.state = "start"
+        self._buf = ""
+        # Decoration seen before the last marker, dropped again right after it
+        self._decoration = ""
+        self._after = ANSWER
+        # Set while the answer began at a blank line and "Answer:" may follow:
+        # where it began in _answer and the blank line itself
+        self._tentative = False
+        self._gap_at = 0
+        self._gap = ""
+        self._raw: List[str] = []
+        self._reasoning: List[str] = []
+        self._answer: List[str] = []
+        self.marked = False
+        self.native = False
+        self.closed = False
+
+    def _emit(self, out: List[Piece], channel: str, text: str) -> None:
+        if text:
+            (self._reasoning if channel == REASONING else self._answer).append(text)
+            out.append((channel, text))
+
+    def feed(self, chunk: str) -> List[Piece]:
+        out: List[Piece] = []
+        if isinstance(chunk, ReasoningDelta):
+            self.native = True
+            self._emit(out, REASONING, str(chunk))
+            return out
+        self._raw.append(chunk)
+        self._buf += chunk
+        self._step(out)
+        return out
+
+    def _step(self, out: List[Piece]) -> None:
+        while True:
+            buf = self._buf
+            if self.state == "answer":
+                if not self._tentative:
+                    self._buf = ""
+                    self._emit(out, ANSWER, buf)
+                    return
+                at = buf.find(ANSWER_MARKER)
+                if at < 0:
+                    cut = _marker_tail(buf, ANSWER_MARKER)
+                    self._emit(out, ANSWER, buf[:cut])
+                    self._buf = buf[cut:]
+                    return
+                # The reasoning went on past the blank line; take it back
+                moved = "".join(self._answer[self._gap_at:])
+                del self._answer[self._gap_at:]
+                if moved:
+                    out.append((ANSWER_RESET, moved))
+                self._tentative = False
+                self._buf = self._gap + moved + buf
+                self.state = "reasoning"
+                continue
+
+            if self.state == "start":
+                rest = buf.lstrip(DECORATION)
+                if rest.startswith(REASONING_MARKER):
+                    self.marked = True
+                    self._decoration = buf[: len(buf) - len(rest)].strip(_SPACE)
+                    self._after = REASONING
+                    self._buf = rest[len(REASONING_MARKER):]
+                    self.state = "lead"
+                    continue
+                if not rest or REASONING_MARKER.startswith(rest):
+                    return
+                self.state = "answer"
+                continue
+
+            if self.state == "lead":
+                # Skip the decoration closing the marker and the space after it
+                rest = buf.lstrip(_SPACE)
+                if self._decoration:
+                    if not rest or (len(rest) < len(self._decoration) and self._decoration.startswith(rest)):
+                        return
+                    if rest.startswith(self._decoration):
+                        rest = rest[len(self._decoration):]
+                rest = rest.lstrip(_SPACE)
+                if not rest:
+                    self._buf = ""
+                    return
+                self._buf = rest
+                self.state = self._after
+                continue
+
+            # Reasoning
+            at = buf.find(ANSWER_MARKER)
+            if at >= 0:
+                before = buf[:at]
+                text = before.rstrip(DECORATION)
+                self._emit(out, REASONING, text)
+                self._decoration = before[len(text):].strip(_SPACE)
+                self._after = ANSWER
+                self._buf = buf[at + len(ANSWER_MARKER):]
+                self.state = "lead"
+                continue
+            gap = buf.find("\n\n")
+            if gap >= 0:
+                self._emit(out, REASONING, buf[:gap])
+                rest = buf[gap:].lstrip(DECORATION)
+                if not rest or ANSWER_MARKER.startswith(rest):
+                    # Might still be "\n\nAnswer:"; wait for more
+                    self._buf = buf[gap:]
+                    return
+                rest = buf[gap:].lstrip(_SPACE)
+                self._gap = buf[gap:len(buf) - len(rest)]
+                self._gap_at = len(self._answer)
+                self._tentative = True
+                self._buf = rest
+                self.state = "answer"
+                continue
+            cut = _marker_tail(buf, ANSWER_MARKER)
+            self._emit(out, REASONING, buf[:cut])
+            self._buf = buf[cut:]
+            return
+
+    def close(self) -> List[Piece]:
+        """Flush whatever was held back once the reply is complete."""
+        out: List[Piece] = []
+        buf, self._buf = self._buf, ""
+        if self.state in ("start", "answer"):
+            self._emit(out, ANSWER, buf)
+        elif self.state == "reasoning":
+            self._emit(out, REASONING, buf.rstrip(DECORATION))
+        self.state = "answer"
+        self.closed = True
+        return out
+
+    def result(self) -> Tuple[Optional[str], str]:
+        """(reasoning, answer) for everything fed so far."""
+        answer = "".join(self._answer)
+        if not self.marked and not self.native:
+            return None, answer
+        reasoning = "".join(self._reasoning).strip()
+        if self.closed and self.marked and not answer.strip():
+            # Never got past the reasoning section; keep the reply readable
+            return reasoning, "".join(self._raw)
+        return reasoning, answer.strip() if self.marked else answer
+
+
+def split_reasoning(text: str) -> Tuple[Optional[str], str]:
+    """Parse out an optional 'Reasoning:' header; returns (reasoning, answer)."""
+    splitter = ReasoningSplitter()
+    splitter.feed(text or "")
+    splitter.close()
+    return splitter.result()
@@ -0,0 +1,310 @@
+import gzip
+import hashlib
+import json
+import mimetypes
+import os
+import re
+import stat
+import sys
+import threading
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+import anyio
+from starlette.datastructures import Headers
+from starlette.exceptions import HTTPException
+from starlette.requests import Request
+from starlette.responses import FileResponse, Response
+from starlette.staticfiles import StaticFiles
+from starlette.types import Scope
+
+try:  # optional; only used to write .br variants ahead of time
+    import brotli  # type: ignore
+except ImportError:  # pragma: no cover
+    brotli = None
+
+# --- Static files ---
+# Vite names build outputs "<name>-<8 char hash>.<ext>", so those files never
+# change under the same URL and can be cached forever. Everything else is
+# revalidated with an ETag. Compressed variants come from ".br"/".gz" files
+# next to the original (written by `python -m backend.static`) or, failing
+# that, are gzipped once on first request and kept in memory.
+
+IMMUTABLE = "public, max-age=31536000, immutable"
+REVALIDATE = "no-cache"
+COMPRESSIBLE = {".js", ".mjs", ".css", ".html", ".svg", ".json", ".map", ".txt", ".xml", ".ttf"}
+MIN_COMPRESS_SIZE = 1024
+MEMORY_BUDGET = 64 * 1024 * 1024
+# Preferred first
+ENCODINGS: Tuple[Tuple[str, str], ...] = (("br", ".br"), ("gzip", ".gz"))
+
+_HASHED = re.compile(r"-[A-Za-z0-9_-]{8}\.[A-Za-z0-9]+$")
+_REFERENCE = re.compile(r"""(?:src|href)\s*=\s*["']([^"']+)["']""")
+# A hashed file name right after a quote, slash or "(" inside a JS/CSS bundle
+_MENTION = re.compile(r"[\"'/(]([\w.$-]{1,120}-[\w-]{8}\.[A-Za-z0-9]{1,6})\b")
+
+
+def is_hashed(name: str) -> bool:
+    return bool(_HASHED.search(name))
+
+
+def compressible(path: Path) -> bool:
+    return path.suffix.lower() in COMPRESSIBLE
+
+
+def accepted_encodings(headers: Headers) -> Set[str]:
+    accepted = set()
+    for part in headers.get("accept-encoding", "").split(","):
+        token, _, params = part.strip().partition(";")
+        if token and params.replace(" ", "") not in ("q=0", "q=0.0", "q=0.00", "q=0.000"):
+            accepted.add(token.strip().lower())
+    return accepted
+
+
+def _not_modified(etag: str, headers: Headers) -> bool:
+    # Weak comparison: a gzip and a brotli body share the same validator
+    tags = headers.get("if-none-match")
+    if not tags:
+        return False
+    bare = etag[2:] if etag.startswith("W/") else etag
+    for tag in tags.split(","):
+        tag = tag.strip()
+        if tag == "*" or (tag[2:] if tag.startswith("W/") else tag) == bare:
+            return True
+    return False
+
+
+def _stat_etag(st: os.stat_result) -> str:
+    base = f"{st.st_mtime}-{st.st_size}".encode()
+    return '"' + hashlib.md5(base, usedforsecurity=False).hexdigest() + '"'
+
+
+# --- Build manifest ---
+
+def _from_manifest(path: Path) -> Set[str]:
+    live: Set[str] = set()
+    for chunk in json.loads(path.read_text(encoding="utf-8")).values():
+        if chunk.get("file"):
+            live.add(chunk["file"])
+        live.update(chunk.get("css") or [])
+        live.update(chunk.get("assets") or [])
+    return live
+
+
+def _from_index(root: Path) -> Set[str]:
+    """Walk what index.html references, then whatever those files mention by name."""
+    hashed = {}
+    for p in root.rglob("*"):
+        if p.is_file() and is_hashed(p.name) and p.suffix not in (".gz", ".br"):
+            hashed.setdefault(p.name, []).append(p.relative_to(root).as_posix())
+    if not hashed:
+        return set()
+    html = (root / "index.html").read_text(encoding="utf-8", errors="replace")
+    pending = [Path(ref.split("?")[0]).name for ref in _REFERENCE.findall(html)]
+    live: Set[str] = set()
+    while pending:
+        name = pending.pop()
+        for rel in hashed.get(name, ()):
+            if rel in live:
+                continue
+            live.add(rel)
+            full = root / rel
+            if full.suffix in (".js", ".mjs", ".css"):
+                pending.extend(_MENTION.findall(full.read_text(encoding="utf-8", errors="replace")))
+    return live
+
+
+def live_assets(root: Path) -> Optional[Set[str]]:
+    """Relative paths of the hashed files the current build uses, or None if that is unknown.
+
+    Prefers Vite's ``.vite/manifest.json``; older builds without one are
+    resolved from ``index.html``.
+    """
+    manifest = root / ".vite" / "manifest.json"
+    try:
+        if manifest.exists():
+            return _from_manifest(manifest)
+        if (root / "index.html").exists():
+            return _from_index(root)
+    except (OSError, ValueError) as e:
+        print(f"[static] could not resolve build assets in {root}: {e}")
+    return None
+
+
+def orphans(root: Path, live: Optional[Set[str]] = None) -> List[Path]:
+    """Hashed files (and their compressed variants) no longer referenced by the build."""
+    live = live_assets(root) if live is None else live
+    if not live:
+        return []
+    stale = []
+    for p in root.rglob("*"):
+        if not p.is_file():
+            continue
+        original = p.with_suffix("") if p.suffix in (".gz", ".br") else p
+        if is_hashed(original.name) and original.relative_to(root).as_posix() not in live:
+            stale.append(p)
+    return sorted(stale)
+
+
+def precompress(root: Path, paths: Optional[Iterable[Path]] = None) -> int:
+    """Write .gz (and .br when brotli is installed) next to compressible files; returns files written."""
+    written = 0
+    for p in paths if paths is not None else sorted(root.rglob("*")):
+        if not p.is_file() or not compressible(p) or p.stat().st_size < MIN_COMPRESS_SIZE:
+            continue
+        raw = None
+        for encoding, suffix in ENCODINGS:
+            if encoding == "br" and brotli is None:
+                continue
+            target = p.with_name(p.name + suffix)
+            if target.exists() and target.stat().st_mtime >= p.stat().st_mtime:
+                continue
+            raw = p.read_bytes() if raw is None else raw
+            data = brotli.compress(raw, quality=11) if encoding == "br" else gzip.compress(raw, 9, mtime=0)
+            if len(data) >= len(raw):
+                continue
+            target.write_bytes(data)
+            written += 1
+    return written
+
+
+# --- Serving ---
+
+class AssetFiles(StaticFiles):
+    """StaticFiles with long-lived caching for hashed files and compressed responses.
+
+    When ``live`` is given, hashed files outside it (bundles from older builds)
+    answer 404 instead of being served.
+    """
+
+    def __init__(self, *args, live: Optional[Set[str]] = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.live = live
+        self._memory: Dict[Tuple[str, str], bytes] = {}
+        self._memory_bytes = 0
+        self._memory_lock = threading.Lock()
+
+    def _variant(self, full_path: str, st: os.stat_result, accepted: Set[str]) -> Optional[Tuple[str, object]]:
+        """(encoding, path or bytes) for the best compressed body the client accepts."""
+        path = Path(full_path)
+        if not accepted or not compressible(path) or st.st_size < MIN_COMPRESS_SIZE:
+            return None
+        for encoding, suffix in ENCODINGS:
+            if encoding not in accepted:
+                continue
+            sibling = path.with_name(path.name + suffix)
+            try:
+                if sibling.stat().st_mtime >= st.st_mtime:
+                    return encoding, str(sibling)
+            except OSError:
+                pass
+        if "gzip" not in accepted:
+            return None
+        key = (full_path, _stat_etag(st))
+        data = self._memory.get(key)
+        if data is None:
+            data = gzip.compress(path.read_bytes(), 6, mtime=0)
+            with self._memory_lock:
+                if self._memory_bytes + len(data) <= MEMORY_BUDGET:
+                    self._memory[key] = data
+                    self._memory_bytes += len(data)
+        return "gzip", data
+
+    async def get_response(self, path: str, scope: Scope) -> Response:
+        if scope["method"] not in ("GET", "HEAD"):
+            raise HTTPException(status_code=405)
+        try:
+            full_path, st = await anyio.to_thread.run_sync(self.lookup_path, path)
+        except PermissionError:
+            raise HTTPException(status_code=401)
+        if not st or not stat.S_ISREG(st.st_mode):
+            return await super().get_response(path, scope)
+
+        rel = path.replace(os.sep, "/")
+        hashed = is_hashed(rel)
+        if hashed and self.live is not None and rel not in self.live:
+            raise HTTPException(status_code=404)
+
+        request_headers = Headers(scope=scope)
+        etag = _stat_etag(st)
+        headers = {
+            "ETag": etag,
+            "Cache-Control": IMMUTABLE if hashed else REVALIDATE,
+            "Vary": "Accept-Encoding",
+        }
+        if _not_modified(etag, request_headers):
+            return Response(status_code=304, headers=headers)
+
+        variant = await anyio.to_thread.run_sync(self._variant, full_path, st, accepted_encodings(request_headers))
+        if variant is None:
+            return FileResponse(full_path, stat_result=st, headers=headers)
+        encoding, body = variant
+        headers["Content-Encoding"] = encoding
+        headers["ETag"] = "W/" + etag
+        media_type = mimetypes.guess_type(full_path)[0] or "application/octet-stream"
+        if isinstance(body, bytes):
+            return Response(body, media_type=media_type, headers=headers)
+        return FileResponse(body, media_type=media_type, headers=headers)
+
+
+class IndexPage:
+    """index.html held in memory (plain and gzipped), reloaded when the file changes."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._signature: Optional[Tuple[float, int]] = None
+        self.body = b""
+        self.gzipped = b""
+        self.etag = ""
+
+    def load(self) -> bool:
+        try:
+            st = self.path.stat()
+        except OSError:
+            return False
+        signature = (st.st_mtime, st.st_size)
+        if signature != self._signature:
+            body = self.path.read_bytes()
+            self.body, self.gzipped = body, gzip.compress(body, 9, mtime=0)
+            self.etag = '"' + hashlib.sha1(body).hexdigest()[:20] + '"'
+            self._signature = signature
+        return True
+
+    def response(self, request: Request) -> Optional[Response]:
+        if not self.load():
+            return None
+        headers = {"ETag": self.etag, "Cache-Control": REVALIDATE, "Vary": "Accept-Encoding"}
+        if _not_modified(self.etag, request.headers):
+            return Response(status_code=304, headers=headers)
+        if "gzip" in accepted_encodings(request.headers):
+            headers["Content-Encoding"] = "gzip"
+            return Response(self.gzipped, media_type="text/html", headers=headers)
+        return Response(self.body, media_type="text/html", headers=headers)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Precompress built frontend assets and prune stale bundles")
+    parser.add_argument("dirs", nargs="*", type=Path, help="build directories (default: web/dist and frontend)")
+    parser.add_argument("--prune", action="store_true", help="delete hashed bundles the current build no longer uses")
+    parser.add_argument("--dry-run", action="store_true", help="only list what --prune would delete")
+    args = parser.parse_args(argv)
+
+    root = Path(__file__).resolve().parents[1]
+    dirs = args.dirs or [d for d in (root / "web" / "dist", root / "frontend") if d.exists()]
+    for d in dirs:
+        if args.prune:
+            stale = orphans(d)
+            for p in stale:
+                print(f"{'would remove' if args.dry_run else 'removing'} {p}")
+                if not args.dry_run:
+                    p.unlink()
+            if not stale:
+                print(f"{d}: no stale bundles")
+        if not args.dry_run:
+            print(f"{d}: wrote {precompress(d)} compressed variants" + ("" if brotli else " (gzip only; pip install brotli for .br)"))
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,886 @@
+import asyncio
+import contextlib
+import gzip
+import json
+import os
+import re
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None  # type: ignore
+    import msvcrt
+
+try:  # optional; enables the zstd snapshot format
+    import zstandard  # type: ignore
+except ImportError:
+    zstandard = None
+
+# --- Conversation storage ---
+# Each conversation lives in a JSON snapshot (<id>.json) plus an append-only
+# journal (<id>.log) of message-level operations. Appends, edits, extends
+# (text appended to a streaming reply), deletes and truncations write a single
+# journal line instead of rewriting the snapshot;
+# the journal is folded back into the snapshot once it grows past
+# JOURNAL_COMPACT_OPS entries or whenever the whole conversation is saved.
+#
+# Snapshots are replaced atomically (temp file + fsync + rename) and journal
+# lines are fsynced, so a crash leaves either the old or the new state. Writers
+# serialize per conversation with an asyncio lock inside the process and an
+# OS file lock across processes (several uvicorn workers).
+
+SNAPSHOT_SUFFIX = ".json"
+JOURNAL_SUFFIX = ".log"
+JOURNAL_COMPACT_OPS = 200
+
+# Snapshots can also be stored compressed. New snapshots use
+# FERN_CONV_COMPRESSION (none, gzip or zstd); every format stays readable, so
+# the setting can change at any time and migrate() converts existing files.
+# zstd can use a shared dictionary trained from the conversations themselves
+# (see train_dictionary); dictionaries are kept by id under .dicts/ so files
+# written with an older one stay readable.
+SNAPSHOT_FORMATS = {"none": SNAPSHOT_SUFFIX, "gzip": ".json.gz", "zstd": ".json.zst"}
+COMPRESSION = os.environ.get("FERN_CONV_COMPRESSION", "none").strip().lower() or "none"
+GZIP_LEVEL = 6
+ZSTD_LEVEL = 9
+DICT_SIZE = 64 * 1024
+
+# Parsed conversations are kept in a bounded LRU (FERN_CONV_CACHE_MB, 0 turns
+# it off) so one chat turn and the UI's reload right after it don't parse the
+# same file again and again. Saves write through to it. Each entry remembers
+# the stat signature of the files it came from, so a write by another worker
+# or a hand edit is picked up on the next read.
+CACHE_BYTES = int(float(os.environ.get("FERN_CONV_CACHE_MB", "32")) * 1024 * 1024)
+
+MESSAGE_ROLES = ("system", "user", "assistant")
+# Ids become file names; anything else is refused on import
+_CONV_ID = re.compile(r"^[A-Za-z0-9][A-Za-z0-9_.-]{0,199}$")
+
+# Delay before a deferred save is flushed; saves of the same conversation
+# arriving within the window are written once. 0 (the default) makes
+# save_later synchronous. Only enable it when a single process serves the
+# store: the queue lives in that process's memory, so with several workers
+# each would buffer its own copy and overwrite the others' writes. The
+# single-process launcher (backend/entry.py) turns it on.
+WRITE_BEHIND_DELAY = float(os.environ.get("FERN_WRITE_BEHIND_MS", "0")) / 1000.0
+
+
+class VersionConflict(Exception):
+    """Raised when a write's expected version does not match the stored one."""
+
+    def __init__(self, current: int):
+        super().__init__(f"version mismatch (current {current})")
+        self.current = current
+
+
+class MessageNotFound(KeyError):
+    pass
+
+
+class ConversationNotFound(KeyError):
+    pass
+
+
+def now_iso() -> str:
+    from datetime import datetime, timezone
+    return datetime.now(timezone.utc).isoformat()
+
+
+def new_message_id() -> str:
+    return uuid.uuid4().hex[:16]
+
+
+def _clean_alternative(a: Any) -> Optional[Dict[str, Any]]:
+    """One answer of a multi-model comparison, kept alongside the assistant message."""
+    if not isinstance(a, dict) or not isinstance(a.get("content"), str):
+        return None
+    item: Dict[str, Any] = {"content": a["content"]}
+    for k in ("provider", "model", "reasoning", "error"):
+        if isinstance(a.get(k), str):
+            item[k] = a[k]
+    for k in ("ttft_ms", "total_ms"):
+        if isinstance(a.get(k), int):
+            item[k] = a[k]
+    aid = a.get("id")
+    item["id"] = aid if isinstance(aid, str) and aid else new_message_id()
+    return item
+
+
+def clean_message(m: Any) -> Optional[Dict[str, Any]]:
+    """Validate a client-supplied message; returns None if it is unusable."""
+    try:
+        r = m.get("role")
+        c = m.get("content")
+        if r not in MESSAGE_ROLES or not isinstance(c, str):
+            return None
+        item: Dict[str, Any] = {"role": r, "content": c}
+        if isinstance(m.get("reasoning"), str):
+            item["reasoning"] = m.get("reasoning")
+        if m.get("partial") is True:
+            item["partial"] = True  # still being generated
+        if isinstance(m.get("alternatives"), list):
+            alts = [a for a in (_clean_alternative(a) for a in m["alternatives"]) if a]
+            if alts:
+                item["alternatives"] = alts
+        mid = m.get("id")
+        item["id"] = mid if isinstance(mid, str) and mid else new_message_id()
+        return item
+    except Exception:
+        return None
+
+
+def valid_id(cid: Any) -> bool:
+    return isinstance(cid, str) and bool(_CONV_ID.match(cid))
+
+
+def clean_conversation(conv: Any) -> Optional[Dict[str, Any]]:
+    """Validate a conversation from outside (an imported archive); None if unusable."""
+    if not isinstance(conv, dict) or not valid_id(conv.get("id")) or not isinstance(conv.get("messages", []), list):
+        return None
+    item = dict(conv)
+    item["messages"] = [m for m in (clean_message(m) for m in conv.get("messages") or []) if m]
+    try:
+        item["version"] = int(conv.get("version") or 0)
+    except (TypeError, ValueError):
+        item["version"] = 0
+    if not isinstance(item.get("title"), str):
+        item["title"] = "Conversation"
+    return item
+
+
+def newer_than(a: Dict[str, Any], b: Dict[str, Any]) -> bool:
+    return (str(a.get("updated_at") or ""), int(a.get("version") or 0)) > (
+        str(b.get("updated_at") or ""), int(b.get("version") or 0))
+
+
+def _sync_dir(path: Path) -> None:
+    if fcntl is None:
+        return
+    dfd = os.open(str(path), os.O_RDONLY)
+    try:
+        os.fsync(dfd)
+    finally:
+        os.close(dfd)
+
+
+def _atomic_write(path: Path, data: bytes, sync_dir: bool = True) -> None:
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    with open(tmp, "wb") as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+    if sync_dir:
+        # Persist the rename itself
+        _sync_dir(path.parent)
+
+
+def _repair_journal(path: Path) -> None:
+    """Make the journal end in a newline again after an append cut short by a crash.
+
+    A partial last line is cut off (replay already ignores it); otherwise
+    the next append would be glued onto it and lost along with everything
+    after it.
+    """
+    try:
+        f = open(path, "r+b")
+    except FileNotFoundError:
+        return
+    with f:
+        end = f.seek(0, os.SEEK_END)
+        if end == 0:
+            return
+        f.seek(end - 1)
+        if f.read(1) == b"\n":
+            return
+        keep = 0
+        pos = end
+        while pos > 0:
+            start = max(0, pos - 4096)
+            f.seek(start)
+            nl = f.read(pos - start).rfind(b"\n")
+            if nl >= 0:
+                keep = start + nl + 1
+                break
+            pos = start
+        f.seek(keep)
+        try:
+            json.loads(f.read())
+        except ValueError:
+            f.truncate(keep)
+        else:
+            f.write(b"\n")  # only the newline was lost; keep the record
+        f.flush()
+        os.fsync(f.fileno())
+
+
+def _format_of(path: Path) -> Optional[str]:
+    for name, suffix in SNAPSHOT_FORMATS.items():
+        if path.name.endswith(suffix) and not path.name.startswith("."):
+            return name
+    return None
+
+
+class _FileLock:
+    """Exclusive advisory lock on a sidecar file, shared across processes."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._fh = None
+
+    def acquire(self, blocking: bool = True) -> bool:
+        """Take the lock; with ``blocking=False`` returns False instead of waiting."""
+        fh = open(self.path, "a+b")
+        try:
+            if fcntl is not None:
+                try:
+                    fcntl.flock(fh.fileno(), fcntl.LOCK_EX | (0 if blocking else fcntl.LOCK_NB))
+                except BlockingIOError:
+                    fh.close()
+                    return False
+            else:
+                while True:
+                    try:
+                        fh.seek(0)
+                        msvcrt.locking(fh.fileno(), msvcrt.LK_NBLCK, 1)
+                        break
+                    except OSError:
+                        if not blocking:
+                            fh.close()
+                            return False
+                        time.sleep(0.01)
+        except Exception:
+            fh.close()
+            raise
+        self._fh = fh
+        return True
+
+    def release(self) -> None:
+        fh, self._fh = self._fh, None
+        if fh is None:
+            return
+        try:
+            if fcntl is not None:
+                fcntl.flock(fh.fileno(), fcntl.LOCK_UN)
+            else:
+                fh.seek(0)
+                msvcrt.locking(fh.fileno(), msvcrt.LK_UNLCK, 1)
+        finally:
+            fh.close()
+
+
+def _copy_conv(conv: Dict[str, Any]) -> Dict[str, Any]:
+    # Callers edit the top level and replace or update messages, never
+    # anything nested deeper, so two levels are enough to keep them off the
+    # cached copy (and far cheaper than a deepcopy or a re-parse).
+    out = dict(conv)
+    msgs = conv.get("messages")
+    if isinstance(msgs, list):
+        out["messages"] = [dict(m) if isinstance(m, dict) else m for m in msgs]
+    return out
+
+
+def _ensure_ids(messages: List[Dict[str, Any]]) -> None:
+    # Snapshots written before message ids existed get positional ids; they
+    # stay stable until the next snapshot write, which persists them.
+    for i, m in enumerate(messages):
+        if isinstance(m, dict) and not m.get("id"):
+            m["id"] = f"legacy-{i}"
+
+
+def _index_of(messages: List[Dict[str, Any]], mid: str) -> int:
+    for i, m in enumerate(messages):
+        if m.get("id") == mid:
+            return i
+    raise MessageNotFound(mid)
+
+
+def _apply(conv: Dict[str, Any], rec: Dict[str, Any]) -> None:
+    msgs: List[Dict[str, Any]] = conv.setdefault("messages", [])
+    op = rec.get("op")
+    if op == "append":
+        msgs.extend(rec.get("messages") or [])
+    elif op == "edit":
+        i = _index_of(msgs, rec["id"])
+        fields = rec.get("fields") or {}
+        merged = {**msgs[i], **fields}
+        for k, v in fields.items():
+            if v is None:
+                merged.pop(k, None)
+        msgs[i] = merged
+    elif op == "extend":
+        i = _index_of(msgs, rec["id"])
+        merged = dict(msgs[i])
+        for k, v in (rec.get("fields") or {}).items():
+            merged[k] = (merged.get(k) or "") + v
+        msgs[i] = merged
+    elif op == "delete":
+        del msgs[_index_of(msgs, rec["id"])]
+    elif op == "truncate":
+        i = _index_of(msgs, rec["id"])
+        del msgs[i if rec.get("inclusive") else i + 1:]
+    conv["version"] = rec["v"]
+    conv["updated_at"] = rec["at"]
+
+
+class ConversationStore:
+    """Conversation files under ``root``.
+
+    Coroutines that read-modify-write a conversation should hold
+    ``async with store.lock(cid)``; the synchronous methods additionally take
+    the cross-process file lock themselves, so they are safe to call from
+    scripts running next to the server.
+    """
+
+    def __init__(
+        self,
+        root: Path,
+        write_behind_delay: float = WRITE_BEHIND_DELAY,
+        compression: str = COMPRESSION,
+        cache_bytes: int = CACHE_BYTES,
+    ):
+        self.root = root
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.lock_dir = root / ".locks"
+        self.lock_dir.mkdir(exist_ok=True)
+        self.dict_dir = root / ".dicts"
+        self.write_behind_delay = write_behind_delay
+        if compression not in SNAPSHOT_FORMATS:
+            print(f"[storage] Unknown compression {compression!r}; storing plain JSON")
+            compression = "none"
+        if compression == "zstd" and zstandard is None:
+            print("[storage] zstd needs the zstandard package; using gzip")
+            compression = "gzip"
+        self.compression = compression
+        self._zdicts: Dict[int, Any] = {}
+        self._zdict = self._current_dictionary()
+        self._alocks: Dict[str, asyncio.Lock] = {}
+        # cid -> (OS lock, depth, owning thread); guarded by _flocks_lock since
+        # imports and migrations take conversation locks from worker threads
+        self._flocks: Dict[str, Tuple[_FileLock, int, int]] = {}
+        self._flocks_lock = threading.Lock()
+        self._pending: Dict[str, Dict[str, Any]] = {}
+        self._flush_task: Optional[asyncio.Task] = None
+        # cid -> (file signature, conv, journal ops, approximate bytes)
+        self.cache_bytes = cache_bytes
+        self._cache: "OrderedDict[str, Tuple[Tuple, Dict[str, Any], int, int]]" = OrderedDict()
+        self._cache_used = 0
+        self._cache_lock = threading.Lock()
+        self._cache_hits = 0
+        self._cache_misses = 0
+
+    # --- locking ---
+    # Re-entrant within a thread: only the outermost holder touches the OS lock.
+    # Another thread of this process opens the lock file anew and waits on the
+    # OS lock like another process would.
+    def _acquire(self, cid: str, blocking: bool = True) -> bool:
+        me = threading.get_ident()
+        with self._flocks_lock:
+            held = self._flocks.get(cid)
+            if held is not None and held[2] == me:
+                self._flocks[cid] = (held[0], held[1] + 1, me)
+                return True
+        fl = _FileLock(self.lock_dir / f"{cid}.lock")
+        if not fl.acquire(blocking):
+            return False
+        self._owned(cid, fl)
+        return True
+
+    def _owned(self, cid: str, fl: _FileLock) -> None:
+        with self._flocks_lock:
+            self._flocks[cid] = (fl, 1, threading.get_ident())
+
+    def _release(self, cid: str) -> None:
+        with self._flocks_lock:
+            fl, n, owner = self._flocks[cid]
+            if n > 1:
+                self._flocks[cid] = (fl, n - 1, owner)
+                return
+            del self._flocks[cid]
+        fl.release()
+
+    @contextlib.contextmanager
+    def _file_lock(self, cid: str) -> Iterator[None]:
+        self._acquire(cid)
+        try:
+            yield
+        finally:
+            self._release(cid)
+
+    @contextlib.asynccontextmanager
+    async def lock(self, cid: str):
+        """Serialize writers of one conversation within and across processes."""
+        alock = self._alocks.setdefault(cid, asyncio.Lock())
+        async with alock:
+            # Uncontended, the OS lock is taken right here. When another
+            # worker holds it, the wait happens in a thread so the event loop
+            # keeps serving; the lock is then owned by the loop's thread.
+            if not self._acquire(cid, blocking=False):
+                fl = _FileLock(self.lock_dir / f"{cid}.lock")
+                await asyncio.to_thread(fl.acquire)
+                self._owned(cid, fl)
+            try:
+                yield
+            finally:
+                self._release(cid)
+
+    def snapshot_path(self, cid: str, compression: Optional[str] = None) -> Path:
+        """Where a new snapshot is written (in the configured format by default)."""
+        return self.root / f"{cid}{SNAPSHOT_FORMATS[compression or self.compression]}"
+
+    def find_snapshot(self, cid: str) -> Optional[Path]:
+        """The current snapshot in whichever format it was written; newest wins."""
+        found = [p for p in (self.root / f"{cid}{suffix}" for suffix in SNAPSHOT_FORMATS.values()) if p.exists()]
+        if len(found) > 1:
+            # Only after a crash mid-conversion
+            found.sort(key=lambda p: p.stat().st_mtime, reverse=True)
+        return found[0] if found else None
+
+    def journal_path(self, cid: str) -> Path:
+        return self.root / f"{cid}{JOURNAL_SUFFIX}"
+
+    def exists(self, cid: str) -> bool:
+        return self.find_snapshot(cid) is not None or self.journal_path(cid).exists()
+
+    def ids(self) -> List[str]:
+        seen = set()
+        for p in self.root.iterdir():
+            fmt = _format_of(p)
+            if fmt is not None:
+                seen.add(p.name[: -len(SNAPSHOT_FORMATS[fmt])])
+            elif p.suffix == JOURNAL_SUFFIX:
+                seen.add(p.stem)
+        return sorted(seen)
+
+    # --- formats ---
+    def _current_dictionary(self) -> Any:
+        if zstandard is None:
+            return None
+        try:
+            current = int((self.dict_dir / "current").read_text().strip())
+        except (OSError, ValueError):
+            return None
+        return self._dictionary(current)
+
+    def _dictionary(self, dict_id: int) -> Any:
+        d = self._zdicts.get(dict_id)
+        if d is None:
+            d = zstandard.ZstdCompressionDict((self.dict_dir / f"{dict_id}.zdict").read_bytes())
+            self._zdicts[dict_id] = d
+        return d
+
+    def _encode(self, conv: Dict[str, Any], compression: str) -> Tuple[bytes, int]:
+        """(bytes to write, size of the JSON before compression)."""
+        if compression == "none":
+            data = json.dumps(conv, indent=2).encode("utf-8")
+            return data, len(data)
+        raw = json.dumps(conv, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        if compression == "gzip":
+            return gzip.compress(raw, GZIP_LEVEL, mtime=0), len(raw)
+        return zstandard.ZstdCompressor(level=ZSTD_LEVEL, dict_data=self._zdict).compress(raw), len(raw)
+
+    def _inflate(self, path: Path) -> bytes:
+        """The snapshot's JSON text, decompressed."""
+        data = path.read_bytes()
+        fmt = _format_of(path)
+        if fmt == "gzip":
+            data = gzip.decompress(data)
+        elif fmt == "zstd":
+            if zstandard is None:
+                raise RuntimeError("zstd snapshot but the zstandard package is not installed")
+            dict_id = zstandard.get_frame_parameters(data).dict_id
+            zdict = self._dictionary(dict_id) if dict_id else None
+            data = zstandard.ZstdDecompressor(dict_data=zdict).decompress(data)
+        return data
+
+    # --- cache ---
+    def _signature(self, cid: str) -> Optional[Tuple]:
+        """Stat of every file the conversation is read from; None when there are none."""
+        sig = []
+        for suffix in (*SNAPSHOT_FORMATS.values(), JOURNAL_SUFFIX):
+            try:
+                st = os.stat(self.root / f"{cid}{suffix}")
+            except OSError:
+                continue
+            sig.append((suffix, st.st_ino, st.st_mtime_ns, st.st_size))
+        return tuple(sig) or None
+
+    def _cached(self, cid: str, sig: Optional[Tuple]) -> Optional[Tuple[Dict[str, Any], int, int]]:
+        with self._cache_lock:
+            entry = self._cache.get(cid)
+            if entry is None or sig is None or entry[0] != sig:
+                self._cache_misses += 1
+                return None
+            self._cache.move_to_end(cid)
+            self._cache_hits += 1
+            return entry[1], entry[2], entry[3]
+
+    def _remember(self, cid: str, conv: Dict[str, Any], ops: int, size: int, sig: Optional[Tuple] = None) -> None:
+        """Cache ``conv`` as the state of the files with signature ``sig`` (default: as they are now)."""
+        sig = sig or self._signature(cid)
+        if sig is None or size > self.cache_bytes:
+            self._forget(cid)
+            return
+        entry = (sig, _copy_conv(conv), ops, size)
+        with self._cache_lock:
+            old = self._cache.pop(cid, None)
+            if old is not None:
+                self._cache_used -= old[3]
+            self._cache[cid] = entry
+            self._cache_used += size
+            while self._cache_used > self.cache_bytes:
+                _, evicted = self._cache.popitem(last=False)
+                self._cache_used -= evicted[3]
+
+    def _forget(self, cid: str) -> None:
+        with self._cache_lock:
+            old = self._cache.pop(cid, None)
+            if old is not None:
+                self._cache_used -= old[3]
+
+    def cache_info(self) -> Dict[str, int]:
+        with self._cache_lock:
+            return {
+                "entries": len(self._cache),
+                "bytes": self._cache_used,
+                "limit": self.cache_bytes,
+                "hits": self._cache_hits,
+                "misses": self._cache_misses,
+            }
+
+    # --- reads ---
+    def _read(self, cid: str, cache: bool = True) -> Tuple[Dict[str, Any], int]:
+        """Load the snapshot and replay the journal; returns (conv, journal ops)."""
+        conv: Dict[str, Any] = {"id": cid, "title": "Conversation", "messages": []}
+        pending = self._pending.get(cid)
+        if pending is not None:
+            return pending, 0
+        sig = self._signature(cid) if self.cache_bytes > 0 else None
+        hit = self._cached(cid, sig) if sig is not None else None
+        if hit is not None:
+            return _copy_conv(hit[0]), hit[1]
+        size = 0
+        p = self.find_snapshot(cid)
+        if p is not None:
+            try:
+                raw = self._inflate(p)
+                conv = json.loads(raw.decode("utf-8"))
+                size = len(raw)
+            except Exception as e:
+                sig = None
+                # Keep the unreadable file for inspection instead of overwriting it
+                bad = p.with_name(f"{p.name}.corrupt-{int(time.time())}")
+                try:
+                    os.replace(p, bad)
+                    print(f"[storage] Unreadable conversation {cid} moved to {bad.name}: {e}")
+                except OSError:
+                    pass
+        if not isinstance(conv.get("messages"), list):
+            conv["messages"] = []
+        _ensure_ids(conv["messages"])
+        base = int(conv.get("version") or 0)
+        ops = 0
+        j = self.journal_path(cid)
+        if j.exists():
+            text = j.read_text(encoding="utf-8")
+            size += len(text)
+            for line in text.splitlines():
+                try:
+                    rec = json.loads(line)
+                except Exception:
+                    break  # torn tail from an interrupted append
+                # Records already folded into the snapshot are skipped
+                if int(rec.get("v") or 0) <= base:
+                    continue
+                try:
+                    _apply(conv, rec)
+                except MessageNotFound:
+                    pass
+                ops += 1
+        if sig is not None and cache:
+            # Stat taken before reading: if the files changed in between,
+            # the entry just misses next time
+            self._remember(cid, conv, ops, size, sig)
+        return conv, ops
+
+    def load(self, cid: str, cache: bool = True) -> Dict[str, Any]:
+        """The conversation; ``cache=False`` for one-off scans that should not evict hot entries."""
+        return self._read(cid, cache)[0]
+
+    # --- writes ---
+    def _write_snapshot(
+        self, cid: str, conv: Dict[str, Any], compression: Optional[str] = None, sync_dir: bool = True,
+    ) -> None:
+        compression = compression or self.compression
+        with self._file_lock(cid):
+            target = self.snapshot_path(cid, compression)
+            data, size = self._encode(conv, compression)
+            _atomic_write(target, data, sync_dir)
+            for suffix in SNAPSHOT_FORMATS.values():
+                other = self.root / f"{cid}{suffix}"
+                if other != target and other.exists():
+                    other.unlink()
+            j = self.journal_path(cid)
+            if j.exists():
+                j.unlink()
+            if self.cache_bytes > 0:
+                self._remember(cid, conv, 0, size)
+
+    def _stamp(self, conv: Dict[str, Any]) -> Dict[str, Any]:
+        msgs = conv.get("messages")
+        if isinstance(msgs, list):
+            for m in msgs:
+                if isinstance(m, dict) and not m.get("id"):
+                    m["id"] = new_message_id()
+        conv["version"] = int(conv.get("version") or 0) + 1
+        conv["updated_at"] = now_iso()
+        return conv
+
+    def save(self, cid: str, conv: Dict[str, Any]) -> Dict[str, Any]:
+        """Write the whole conversation as a new snapshot."""
+        self._pending.pop(cid, None)
+        self._write_snapshot(cid, self._stamp(conv))
+        return conv
+
+    def save_later(self, cid: str, conv: Dict[str, Any]) -> Dict[str, Any]:
+        """Queue a snapshot write; rapid saves of one conversation are flushed once.
+
+        Reads in this process see the queued state immediately. Must be called
+        from the event loop; falls back to a synchronous save when write-behind
+        is disabled or no loop is running.
+        """
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+        if loop is None or self.write_behind_delay <= 0:
+            return self.save(cid, conv)
+        self._pending[cid] = self._stamp(conv)
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = loop.create_task(self._flush_soon())
+        return conv
+
+    async def _flush_soon(self) -> None:
+        await asyncio.sleep(self.write_behind_delay)
+        while self._pending:
+            cid = next(iter(self._pending))
+            async with self.lock(cid):
+                conv = self._pending.pop(cid, None)
+                if conv is not None:
+                    try:
+                        self._write_snapshot(cid, conv)
+                    except Exception as e:
+                        print(f"[storage] Deferred save of {cid} failed: {e}")
+
+    def flush(self) -> None:
+        """Write every queued save now (e.g. at shutdown)."""
+        for cid in list(self._pending):
+            conv = self._pending.pop(cid, None)
+            if conv is not None:
+                self._write_snapshot(cid, conv)
+
+    def delete(self, cid: str) -> None:
+        with self._file_lock(cid):
+            self._pending.pop(cid, None)
+            self._forget(cid)
+            paths = [self.root / f"{cid}{suffix}" for suffix in SNAPSHOT_FORMATS.values()]
+            for p in paths + [self.journal_path(cid)]:
+                if p.exists():
+                    p.unlink()
+
+    def _mutate(self, cid: str, rec: Dict[str, Any], expected_version: Optional[int]) -> Dict[str, Any]:
+        with self._file_lock(cid):
+            if cid in self._pending:
+                self._write_snapshot(cid, self._pending.pop(cid))
+            if self.find_snapshot(cid) is None:
+                # Deleted meanwhile (or never saved); do not bring it back
+                raise ConversationNotFound(cid)
+            _repair_journal(self.journal_path(cid))
+            conv, ops = self._read(cid)
+            current = int(conv.get("version") or 0)
+            if expected_version is not None and expected_version != current:
+                raise VersionConflict(current)
+            rec = {**rec, "v": current + 1, "at": now_iso()}
+            _apply(conv, rec)  # raises before anything is written
+            if ops + 1 >= JOURNAL_COMPACT_OPS:
+                self._write_snapshot(cid, conv)
+            else:
+                line = (json.dumps(rec, ensure_ascii=False) + "\n").encode("utf-8")
+                with open(self.journal_path(cid), "ab") as f:
+                    f.write(line)
+                    f.flush()
+                    os.fsync(f.fileno())
+                if self.cache_bytes > 0:
+                    with self._cache_lock:
+                        entry = self._cache.get(cid)
+                    size = entry[3] if entry is not None else 0
+                    self._remember(cid, conv, ops + 1, size + len(line))
+            return conv
+
+    def append_messages(self, cid: str, messages: List[Dict[str, Any]], expected_version: Optional[int] = None) -> Dict[str, Any]:
+        items = [m for m in (clean_message(m) for m in messages) if m]
+        return self._mutate(cid, {"op": "append", "messages": items}, expected_version)
+
+    def edit_message(self, cid: str, mid: str, fields: Dict[str, Any], expected_version: Optional[int] = None) -> Dict[str, Any]:
+        changes: Dict[str, Any] = {}
+        if fields.get("role") in MESSAGE_ROLES:
+            changes["role"] = fields["role"]
+        for k in ("content", "reasoning"):
+            if isinstance(fields.get(k), str):
+                changes[k] = fields[k]
+        if "partial" in fields:
+            changes["partial"] = True if fields["partial"] else None
+        return self._mutate(cid, {"op": "edit", "id": mid, "fields": changes}, expected_version)
+
+    def extend_message(self, cid: str, mid: str, fields: Dict[str, str], expected_version: Optional[int] = None) -> Dict[str, Any]:
+        """Append text to a message's content/reasoning; the journal line holds only the new text."""
+        changes = {k: v for k, v in fields.items() if k in ("content", "reasoning") and isinstance(v, str) and v}
+        return self._mutate(cid, {"op": "extend", "id": mid, "fields": changes}, expected_version)
+
+    def delete_message(self, cid: str, mid: str, expected_version: Optional[int] = None) -> Dict[str, Any]:
+        return self._mutate(cid, {"op": "delete", "id": mid}, expected_version)
+
+    def truncate_after(self, cid: str, mid: str, inclusive: bool = False, expected_version: Optional[int] = None) -> Dict[str, Any]:
+        """Drop every message after ``mid`` (and ``mid`` itself if inclusive)."""
+        return self._mutate(cid, {"op": "truncate", "id": mid, "inclusive": bool(inclusive)}, expected_version)
+
+    # --- bulk import ---
+    def import_conversations(self, convs: List[Dict[str, Any]], on_conflict: str = "newer") -> Dict[str, int]:
+        """Write conversations (already passed through clean_conversation) under their own ids.
+
+        ``on_conflict`` decides what happens when an id already exists:
+        "newer" keeps whichever was updated last, "skip" keeps the stored one,
+        "replace" overwrites it. A replaced conversation gets a version above
+        both, so stale ETags held by clients stop matching. The directory is
+        fsynced once for the whole batch rather than once per file.
+        """
+        counts = {"imported": 0, "replaced": 0, "skipped": 0}
+        for conv in convs:
+            cid = conv["id"]
+            with self._file_lock(cid):
+                existing = self._read(cid, cache=False)[0] if cid in self._pending or self.exists(cid) else None
+                if existing is not None:
+                    if on_conflict == "skip" or (on_conflict == "newer" and not newer_than(conv, existing)):
+                        counts["skipped"] += 1
+                        continue
+                    conv = {**conv, "version": max(int(conv.get("version") or 0), int(existing.get("version") or 0)) + 1}
+                self._pending.pop(cid, None)
+                self._write_snapshot(cid, conv, sync_dir=False)
+                counts["imported" if existing is None else "replaced"] += 1
+        if counts["imported"] or counts["replaced"]:
+            _sync_dir(self.root)
+        return counts
+
+    # --- format migration ---
+    def migrate_one(self, cid: str, compression: Optional[str] = None, force: bool = False) -> Tuple[int, int]:
+        """Rewrite one conversation in ``compression`` (default: the configured format).
+
+        The journal is folded in and the version is kept. Returns the bytes on
+        disk before and after; (n, n) when it was already in that format and
+        ``force`` (e.g. to apply a new dictionary) is not set.
+        """
+        compression = compression or self.compression
+        with self._file_lock(cid):
+            current = self.find_snapshot(cid)
+            journal = self.journal_path(cid)
+            before = (current.stat().st_size if current else 0) + (journal.stat().st_size if journal.exists() else 0)
+            unchanged = current is not None and _format_of(current) == compression and not journal.exists()
+            if cid in self._pending or (unchanged and not force):
+                return before, before
+            conv, _ = self._read(cid)
+            self._write_snapshot(cid, conv, compression)
+            return before, self.snapshot_path(cid, compression).stat().st_size
+
+    def migrate(self, compression: Optional[str] = None, force: bool = False) -> Tuple[int, int, int]:
+        """Convert every conversation; returns (converted, bytes before, bytes after)."""
+        converted = before = after = 0
+        for cid in self.ids():
+            try:
+                b, a = self.migrate_one(cid, compression, force)
+            except Exception as e:
+                print(f"[storage] Could not convert {cid}: {e}")
+                continue
+            converted += int(a != b)
+            before += b
+            after += a
+        return converted, before, after
+
+    async def migrate_in_background(self, pause: float = 0.01) -> Tuple[int, int, int]:
+        """migrate() one conversation at a time off the event loop, yielding between files.
+
+        The worker thread takes each conversation's lock itself; writers on
+        the loop wait for it like for another process.
+        """
+        converted = before = after = 0
+        for cid in self.ids():
+            try:
+                b, a = await asyncio.to_thread(self.migrate_one, cid)
+            except Exception as e:
+                print(f"[storage] Could not convert {cid}: {e}")
+                continue
+            converted += int(a != b)
+            before += b
+            after += a
+            await asyncio.sleep(pause)
+        return converted, before, after
+
+    def train_dictionary(self, size: int = DICT_SIZE) -> int:
+        """Train a zstd dictionary from the stored conversations and make it current.
+
+        Only new writes use it; migrate(force=True) recompresses existing files.
+        Returns the dictionary id.
+        """
+        if zstandard is None:
+            raise RuntimeError("training a dictionary needs the zstandard package")
+        samples = []
+        for cid in self.ids():
+            try:
+                conv = self.load(cid)
+            except Exception:
+                continue
+            samples.append(json.dumps(conv, ensure_ascii=False, separators=(",", ":")).encode("utf-8"))
+        try:
+            zdict = zstandard.train_dictionary(size, samples)
+        except zstandard.ZstdError as e:
+            raise RuntimeError(f"could not train a dictionary from {len(samples)} conversations: {e}")
+        dict_id = zdict.dict_id()
+        self.dict_dir.mkdir(exist_ok=True)
+        _atomic_write(self.dict_dir / f"{dict_id}.zdict", zdict.as_bytes())
+        _atomic_write(self.dict_dir / "current", str(dict_id).encode())
+        self._zdicts[dict_id] = zdict
+        self._zdict = zdict
+        return dict_id
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    import argparse
+
+    default_root = Path(__file__).resolve().parents[1] / "data" / "conversations"
+    parser = argparse.ArgumentParser(description="Convert stored conversations between snapshot formats")
+    parser.add_argument("root", nargs="?", type=Path, default=default_root)
+    parser.add_argument("--compression", choices=sorted(SNAPSHOT_FORMATS), default=COMPRESSION)
+    parser.add_argument("--train-dict", action="store_true", help="train a shared zstd dictionary first")
+    parser.add_argument("--dict-size", type=int, default=DICT_SIZE)
+    args = parser.parse_args(argv)
+
+    store = ConversationStore(args.root, write_behind_delay=0, compression=args.compression)
+    trained = False
+    if args.train_dict:
+        try:
+            print(f"trained dictionary {store.train_dictionary(args.dict_size)}")
+            trained = True
+        except RuntimeError as e:
+            print(e)
+    converted, before, after = store.migrate(force=trained)
+    ratio = f" ({before / after:.1f}x)" if after else ""
+    print(f"converted {converted} conversations to {store.compression}: {before} -> {after} bytes{ratio}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,266 @@
+import asyncio
+import time
+import uuid
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Iterator, List, Optional, Tuple
+
+from .reasoning import Piece, ReasoningSplitter
+
+# --- In-flight generations ---
+# Every streamed answer runs as a background task that appends chunks to a
+# StreamSession. Sockets only follow a session, so a client that drops can
+# reconnect and resume from the number of chunks it already received while the
+# upstream generation keeps going. Finished sessions stay replayable for
+# STREAM_TTL seconds; the chunk list doubles as the replay buffer since the
+# full text is needed for the final save anyway. Each chunk is also run through
+# a ReasoningSplitter as it arrives; parts[i] holds the reasoning/answer pieces
+# chunk i produced, and tail what was held back until the end.
+#
+# A session started from a coalesced request carries that request's key so
+# identical requests arriving while it runs can follow it instead of starting
+# their own (see coalesce.py). Every client following a session holds it; a
+# client that would stop the generation when it leaves releases its hold, and
+# the generation is only cancelled once nobody holds it any more.
+
+STREAM_TTL = 120.0
+MAX_STREAMS = 64
+CHECKPOINT_INTERVAL = 2.0
+
+_DONE = object()
+
+
+class StreamSession:
+    def __init__(self, sid: str, conversation_id: Optional[str] = None, key: Optional[str] = None):
+        self.id = sid
+        self.conversation_id = conversation_id
+        self.key = key
+        self.holders = 0
+        # Requests that joined this generation instead of starting their own
+        self.joined = 0
+        # Assistant message the text is saved into, when there is a conversation
+        self.message_id: Optional[str] = None
+        self.chunks: List[str] = []
+        self.parts: List[List[Piece]] = []
+        self.tail: List[Piece] = []
+        self.splitter = ReasoningSplitter()
+        self.done = False
+        self.error: Optional[str] = None
+        self.started_at = time.monotonic()
+        self.first_chunk_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+        self.task: Optional[asyncio.Task] = None
+        # Token counts reported by the provider, once the stream ends
+        self.usage: Optional[Dict[str, int]] = None
+        self._changed = asyncio.Event()
+
+    def text(self) -> str:
+        return "".join(self.chunks)
+
+    def push(self, chunk: str) -> None:
+        if self.first_chunk_at is None:
+            self.first_chunk_at = time.monotonic()
+        self.parts.append(self.splitter.feed(chunk))
+        self.chunks.append(chunk)
+        self._wake()
+
+    def set_usage(self, usage: Dict[str, int]) -> None:
+        self.usage = usage
+
+    def split(self) -> Tuple[Optional[str], str]:
+        """(reasoning, answer) so far."""
+        return self.splitter.result()
+
+    def finish(self, error: Optional[str] = None) -> None:
+        self.tail = self.splitter.close()
+        self.done = True
+        self.error = error
+        self.finished_at = time.monotonic()
+        self._wake()
+
+    def _wake(self) -> None:
+        self._changed.set()
+        self._changed = asyncio.Event()
+
+    async def follow(self, offset: int = 0, idle: Optional[float] = None) -> AsyncIterator[Optional[str]]:
+        """Yield chunks from ``offset`` on, waiting for new ones until the session ends.
+
+        With ``idle`` set, yields None whenever that many seconds pass without
+        a new chunk (for keep-alives).
+        """
+        i = max(0, offset)
+        while True:
+            changed = self._changed
+            while i < len(self.chunks):
+                yield self.chunks[i]
+                i += 1
+            if self.done:
+                return
+            if idle is None:
+                await changed.wait()
+                continue
+            try:
+                await asyncio.wait_for(changed.wait(), idle)
+            except asyncio.TimeoutError:
+                yield None
+
+    async def follow_parts(
+        self, offset: int = 0, idle: Optional[float] = None
+    ) -> AsyncIterator[Optional[Tuple[int, List[Piece]]]]:
+        """Like follow(), but yields (chunks so far, reasoning/answer pieces of that chunk).
+
+        The pieces held back until the end come last, under the final count.
+        """
+        i = max(0, offset)
+        async for chunk in self.follow(offset, idle):
+            if chunk is None:
+                yield None
+                continue
+            i += 1
+            yield i, self.parts[i - 1]
+        yield max(i, len(self.chunks)), self.tail
+
+    async def settled(self) -> None:
+        """Wait for the generation task to end, final save included."""
+        if self.task is not None and not self.task.done() and self.task is not asyncio.current_task():
+            await asyncio.wait({self.task})
+
+    def hold(self) -> None:
+        self.holders += 1
+
+    def release(self) -> None:
+        """Drop one hold; the last one to go stops the generation."""
+        self.holders -= 1
+        if self.holders <= 0:
+            self.cancel()
+
+    def cancel(self) -> None:
+        # Once the text is complete the task is only finalizing; let it save
+        if not self.done and self.task is not None and not self.task.done():
+            self.task.cancel()
+
+    def timing(self) -> Dict[str, Optional[int]]:
+        """Time to first chunk and total duration so far, in milliseconds."""
+        def ms(t: Optional[float]) -> Optional[int]:
+            return None if t is None else int((t - self.started_at) * 1000)
+        return {"ttft_ms": ms(self.first_chunk_at), "total_ms": ms(self.finished_at or time.monotonic())}
+
+    def info(self) -> Dict[str, Any]:
+        return {
+            "stream_id": self.id,
+            "conversation_id": self.conversation_id,
+            "message_id": self.message_id,
+            "chunks": len(self.chunks),
+            "joined": self.joined,
+            "done": self.done,
+            "error": self.error,
+            "usage": self.usage,
+            **self.timing(),
+        }
+
+
+# Keyed by stream id; a coalesced session is also listed under the ids its
+# joiners asked for, so each of them can resume it by their own id
+_sessions: Dict[str, StreamSession] = {}
+
+
+def _prune() -> None:
+    now = time.monotonic()
+    for sid, s in list(_sessions.items()):
+        if s.done and s.finished_at is not None and now - s.finished_at > STREAM_TTL:
+            del _sessions[sid]
+
+
+def _unique() -> List[StreamSession]:
+    return list({id(s): s for s in _sessions.values()}.values())
+
+
+def get(sid: str) -> Optional[StreamSession]:
+    _prune()
+    return _sessions.get(sid)
+
+
+def active(conversation_id: Optional[str] = None) -> List[StreamSession]:
+    _prune()
+    return [s for s in _unique() if conversation_id is None or s.conversation_id == conversation_id]
+
+
+def inflight(key: str) -> Optional[StreamSession]:
+    """The running session started for request ``key``, if any."""
+    for s in _sessions.values():
+        if s.key == key and not s.done:
+            return s
+    return None
+
+
+def alias(sid: str, session: StreamSession) -> None:
+    """Make ``session`` reachable under another stream id as well."""
+    if sid in _sessions:
+        raise ValueError(f"stream {sid} already exists")
+    _sessions[sid] = session
+
+
+def create(sid: Optional[str] = None, conversation_id: Optional[str] = None, key: Optional[str] = None) -> StreamSession:
+    _prune()
+    sid = sid or uuid.uuid4().hex
+    if sid in _sessions:
+        raise ValueError(f"stream {sid} already exists")
+    sessions = _unique()
+    if len(sessions) >= MAX_STREAMS:
+        # Drop the oldest finished session; refuse if everything is still running
+        finished = sorted((s for s in sessions if s.done), key=lambda s: s.finished_at or 0)
+        if not finished:
+            raise RuntimeError("too many concurrent streams")
+        for other, s in list(_sessions.items()):
+            if s is finished[0]:
+                del _sessions[other]
+    s = StreamSession(sid, conversation_id, key)
+    _sessions[sid] = s
+    return s
+
+
+async def pump(
+    session: StreamSession,
+    chunks: Iterator[str],
+    checkpoint: Optional[Callable[[StreamSession], Awaitable[None]]] = None,
+    on_finish: Optional[Callable[[StreamSession], Awaitable[None]]] = None,
+    interval: float = CHECKPOINT_INTERVAL,
+) -> None:
+    """Drain a (blocking) chunk iterator into ``session`` off the event loop.
+
+    ``checkpoint`` is called at most every ``interval`` seconds while chunks arrive;
+    ``on_finish`` runs once the iterator is exhausted, fails or is cancelled.
+    """
+    last = time.monotonic()
+    error: Optional[str] = None
+    try:
+        while True:
+            chunk = await asyncio.to_thread(next, chunks, _DONE)
+            if chunk is _DONE:
+                break
+            session.push(chunk)
+            if checkpoint is not None and time.monotonic() - last >= interval:
+                last = time.monotonic()
+                try:
+                    await checkpoint(session)
+                except Exception as e:
+                    print(f"[stream] checkpoint failed for {session.id}: {e}")
+    except asyncio.CancelledError:
+        error = "cancelled"
+    except Exception as e:
+        error = str(e)
+    finally:
+        session.finish(error)
+        if on_finish is not None:
+            try:
+                await asyncio.shield(on_finish(session))
+            except BaseException as e:
+                print(f"[stream] finalize failed for {session.id}: {e!r}")
+
+
+def start(
+    session: StreamSession,
+    chunks: Iterator[str],
+    checkpoint: Optional[Callable[[StreamSession], Awaitable[None]]] = None,
+    on_finish: Optional[Callable[[StreamSession], Awaitable[None]]] = None,
+) -> StreamSession:
+    session.task = asyncio.get_running_loop().create_task(pump(session, chunks, checkpoint, on_finish))
+    return session
@@ -0,0 +1,357 @@
+import contextlib
+import json
+import os
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .storage import _FileLock
+
+# --- Usage accounting ---
+# Every model call appends one JSON line to raw/<day>.ndjson (UTC). Queries
+# read rollups instead: hourly/<day>.json holds one bucket per hour and
+# provider/model, daily/<month>.json one per day. Both are tiny, are rewritten
+# on every record, and are rebuilt from the raw log when they fall behind it,
+# so a query over months reads one small file per month. Writes happen under a
+# lock file and start from the rollups on disk, so several worker processes
+# recording into the same directory add to each other's counts. Grouping by
+# conversation or user has to scan the raw log for the requested days.
+
+METRICS = (
+    "requests",
+    "errors",
+    "prompt_tokens",
+    "completion_tokens",
+    "cached_tokens",
+    "ttft_ms",
+    "ttft_count",
+    "duration_ms",
+)
+ROLLUP_GROUPS = ("provider", "model")
+GROUPS = ROLLUP_GROUPS + ("conversation_id", "user", "kind")
+GRANULARITIES = ("hour", "day", "total")
+# Rollup files record how many raw lines they cover under this key
+_COUNT = "_n"
+
+Prices = Dict[str, Dict[str, float]]
+
+
+def _utc(ts: float) -> datetime:
+    return datetime.fromtimestamp(ts, tz=timezone.utc)
+
+
+def _write_json(path: Path, data: Any) -> None:
+    # Derived data: an atomic replace is enough, no fsync
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    tmp.write_text(json.dumps(data, separators=(",", ":")), encoding="utf-8")
+    os.replace(tmp, path)
+
+
+def _read_json(path: Path) -> Optional[Dict[str, Any]]:
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+
+
+def _metrics(rec: Dict[str, Any]) -> List[int]:
+    ttft = rec.get("ttft_ms")
+    return [
+        1,
+        1 if rec.get("error") else 0,
+        int(rec.get("prompt_tokens") or 0),
+        int(rec.get("completion_tokens") or 0),
+        int(rec.get("cached_tokens") or 0),
+        int(ttft or 0),
+        0 if ttft is None else 1,
+        int(rec.get("duration_ms") or 0),
+    ]
+
+
+def _add(into: List[int], values: Iterable[int]) -> None:
+    for i, v in enumerate(values):
+        into[i] += v
+
+
+def _price(prices: Optional[Prices], provider: str, model: str) -> Optional[Dict[str, float]]:
+    if not prices:
+        return None
+    return prices.get(f"{provider}/{model}") or prices.get(model)
+
+
+def _cost(price: Optional[Dict[str, float]], m: List[int]) -> float:
+    """USD for one bucket; prices are per million tokens."""
+    if not price:
+        return 0.0
+    prompt, completion, cached = m[2], m[3], m[4]
+    cached_rate = price.get("cached", price.get("prompt", 0.0))
+    return (
+        (prompt - cached) * price.get("prompt", 0.0)
+        + cached * cached_rate
+        + completion * price.get("completion", 0.0)
+    ) / 1_000_000
+
+
+def _bounds(start: Optional[str], end: Optional[str], default_days: int) -> Tuple[str, str]:
+    """Inclusive hour keys ("YYYY-MM-DDTHH") for an ISO date/datetime range."""
+    now = _utc(time.time())
+    end_key = (end or now.strftime("%Y-%m-%d"))[:13]
+    if len(end_key) == 10:
+        end_key += "T23"
+    if start:
+        start_key = start[:13]
+    else:
+        start_key = (datetime.strptime(end_key[:10], "%Y-%m-%d") - timedelta(days=default_days - 1)).strftime("%Y-%m-%d")
+    if len(start_key) == 10:
+        start_key += "T00"
+    start_key, end_key = start_key.replace(" ", "T"), end_key.replace(" ", "T")
+    for key in (start_key, end_key):
+        datetime.strptime(key, "%Y-%m-%dT%H")  # ValueError on junk
+    return start_key, end_key
+
+
+def _days(start_key: str, end_key: str) -> Iterator[str]:
+    day = datetime.strptime(start_key[:10], "%Y-%m-%d")
+    last = datetime.strptime(end_key[:10], "%Y-%m-%d")
+    while day <= last:
+        yield day.strftime("%Y-%m-%d")
+        day += timedelta(days=1)
+
+
+class UsageStore:
+    def __init__(self, root: Path):
+        self.root = Path(root)
+        self._lock = threading.Lock()
+        # Days whose rollups were checked against the raw log by this process
+        self._verified: set = set()
+
+    def _path(self, kind: str, name: str) -> Path:
+        d = self.root / kind
+        d.mkdir(parents=True, exist_ok=True)
+        return d / name
+
+    @contextlib.contextmanager
+    def _locked(self) -> Iterator[None]:
+        """Exclusive access to the files, across threads and processes."""
+        with self._lock:
+            fl = _FileLock(self._path("", ".lock"))
+            fl.acquire()
+            try:
+                yield
+            finally:
+                fl.release()
+
+    def _raw_records(self, day: str) -> Iterator[Dict[str, Any]]:
+        try:
+            fh = open(self.root / "raw" / f"{day}.ndjson", "r", encoding="utf-8")
+        except OSError:
+            return
+        with fh:
+            for line in fh:
+                try:
+                    yield json.loads(line)
+                except ValueError:
+                    continue  # torn last line after a crash
+
+    # --- Rollups ---
+
+    def _build_hourly(self, day: str) -> Dict[str, Any]:
+        hourly: Dict[str, Any] = {_COUNT: 0}
+        for rec in self._raw_records(day):
+            hour = _utc(rec["ts"]).strftime("%H")
+            key = f"{rec.get('provider', '')}|{rec.get('model', '')}"
+            _add(hourly.setdefault(hour, {}).setdefault(key, [0] * len(METRICS)), _metrics(rec))
+            hourly[_COUNT] += 1
+        return hourly
+
+    def _raw_count(self, day: str) -> int:
+        try:
+            with open(self.root / "raw" / f"{day}.ndjson", "rb") as fh:
+                return sum(1 for _ in fh)
+        except OSError:
+            return 0
+
+    def _day_rollup(self, hourly: Dict[str, Any]) -> Dict[str, List[int]]:
+        totals: Dict[str, List[int]] = {}
+        for hour, buckets in hourly.items():
+            if hour == _COUNT:
+                continue
+            for key, m in buckets.items():
+                _add(totals.setdefault(key, [0] * len(METRICS)), m)
+        return totals
+
+    def hourly(self, day: str) -> Dict[str, Any]:
+        """Hour buckets for one day ("YYYY-MM-DD"); call with the store locked."""
+        data = _read_json(self.root / "hourly" / f"{day}.json")
+        if day not in self._verified:
+            # Once per process: a crash between the raw append and the rollup
+            # write leaves the rollups behind; rebuild both from the raw log
+            self._verified.add(day)
+            if (data or {}).get(_COUNT, 0) != self._raw_count(day):
+                data = self._build_hourly(day)
+                _write_json(self._path("hourly", f"{day}.json"), data)
+                month = self._monthly(day[:7])
+                month[day] = self._day_rollup(data)
+                _write_json(self._path("daily", f"{day[:7]}.json"), month)
+        return data or {_COUNT: 0}
+
+    def _monthly(self, month: str) -> Dict[str, Any]:
+        return _read_json(self.root / "daily" / f"{month}.json") or {}
+
+    def daily(self, month: str) -> Dict[str, Any]:
+        """Day buckets for one month ("YYYY-MM"); call with the store locked."""
+        raw_dir = self.root / "raw"
+        if raw_dir.exists():
+            for p in raw_dir.glob(f"{month}-*.ndjson"):
+                if p.stem not in self._verified:
+                    self.hourly(p.stem)
+        return self._monthly(month)
+
+    # --- Writing ---
+
+    def record(
+        self,
+        provider: str,
+        model: str,
+        usage: Optional[Dict[str, int]] = None,
+        ttft_ms: Optional[int] = None,
+        duration_ms: Optional[int] = None,
+        error: bool = False,
+        conversation_id: Optional[str] = None,
+        user: Optional[str] = None,
+        kind: str = "chat",
+        ts: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        rec: Dict[str, Any] = {"ts": round(ts if ts is not None else time.time(), 3), "provider": provider, "model": model, "kind": kind}
+        if conversation_id:
+            rec["conversation_id"] = conversation_id
+        if user:
+            rec["user"] = user
+        rec.update(usage or {})
+        if ttft_ms is not None:
+            rec["ttft_ms"] = int(ttft_ms)
+        if duration_ms is not None:
+            rec["duration_ms"] = int(duration_ms)
+        if error:
+            rec["error"] = True
+
+        when = _utc(rec["ts"])
+        day, hour, month = when.strftime("%Y-%m-%d"), when.strftime("%H"), when.strftime("%Y-%m")
+        key = f"{provider}|{model}"
+        with self._locked():
+            hourly = self.hourly(day)
+            with open(self._path("raw", f"{day}.ndjson"), "a", encoding="utf-8") as fh:
+                fh.write(json.dumps(rec, separators=(",", ":"), ensure_ascii=False) + "\n")
+            m = _metrics(rec)
+            _add(hourly.setdefault(hour, {}).setdefault(key, [0] * len(METRICS)), m)
+            hourly[_COUNT] = hourly.get(_COUNT, 0) + 1
+            monthly = self._monthly(month)
+            _add(monthly.setdefault(day, {}).setdefault(key, [0] * len(METRICS)), m)
+            _write_json(self._path("hourly", f"{day}.json"), hourly)
+            _write_json(self._path("daily", f"{month}.json"), monthly)
+        return rec
+
+    # --- Queries ---
+
+    def _rollup_rows(self, start_key: str, end_key: str, granularity: str) -> Iterator[Tuple[str, str, str, List[int]]]:
+        if granularity == "hour":
+            for day in _days(start_key, end_key):
+                with self._locked():
+                    data = self.hourly(day)
+                for hour, buckets in data.items():
+                    if hour == _COUNT or not start_key <= f"{day}T{hour}" <= end_key:
+                        continue
+                    for key, m in buckets.items():
+                        provider, _, model = key.partition("|")
+                        yield f"{day}T{hour}", provider, model, m
+            return
+        # Whole days only; days partly outside an hour-precise range are included
+        months = sorted({day[:7] for day in _days(start_key, end_key)})
+        for month in months:
+            with self._locked():
+                days = self.daily(month)
+            for day, buckets in days.items():
+                if not start_key[:10] <= day <= end_key[:10]:
+                    continue
+                for key, m in buckets.items():
+                    provider, _, model = key.partition("|")
+                    yield day, provider, model, m
+
+    def query(
+        self,
+        start: Optional[str] = None,
+        end: Optional[str] = None,
+        granularity: str = "day",
+        group_by: Iterable[str] = ROLLUP_GROUPS,
+        filters: Optional[Dict[str, str]] = None,
+        prices: Optional[Prices] = None,
+        default_days: int = 30,
+    ) -> Dict[str, Any]:
+        """Aggregate usage between ``start`` and ``end`` (ISO dates or datetimes, UTC, inclusive).
+
+        ``granularity`` is hour, day or total; ``group_by`` any of GROUPS.
+        Raises ValueError for an unknown granularity, group or malformed date.
+        """
+        if granularity not in GRANULARITIES:
+            raise ValueError(f"granularity must be one of {', '.join(GRANULARITIES)}")
+        group_by = [g for g in group_by if g]
+        unknown = [g for g in group_by if g not in GROUPS]
+        if unknown:
+            raise ValueError(f"cannot group by {', '.join(unknown)}")
+        filters = {k: v for k, v in (filters or {}).items() if v}
+        if any(k not in GROUPS for k in filters):
+            raise ValueError(f"can only filter on {', '.join(GROUPS)}")
+        start_key, end_key = _bounds(start, end, default_days)
+
+        rows: Dict[Tuple, List[float]] = {}
+        costs: Dict[Tuple, float] = {}
+
+        def add(t: Optional[str], fields: Dict[str, Any], m: List[int]) -> None:
+            key = (t,) + tuple(fields.get(g) for g in group_by)
+            _add(rows.setdefault(key, [0] * len(METRICS)), m)
+            if prices:
+                costs[key] = costs.get(key, 0.0) + _cost(_price(prices, fields.get("provider", ""), fields.get("model", "")), m)
+
+        if set(group_by) <= set(ROLLUP_GROUPS) and set(filters) <= set(ROLLUP_GROUPS):
+            source = "rollup"
+            for t, provider, model, m in self._rollup_rows(start_key, end_key, "hour" if granularity == "hour" else "day"):
+                fields = {"provider": provider, "model": model}
+                if all(fields[k] == v for k, v in filters.items()):
+                    add(None if granularity == "total" else t, fields, m)
+        else:
+            source = "raw"
+            for day in _days(start_key, end_key):
+                for rec in self._raw_records(day):
+                    t = _utc(rec["ts"]).strftime("%Y-%m-%dT%H")
+                    if not start_key <= t <= end_key or any(rec.get(k) != v for k, v in filters.items()):
+                        continue
+                    bucket = {"hour": t, "day": t[:10]}.get(granularity)
+                    add(bucket, rec, _metrics(rec))
+
+        def shape(key: Tuple, m: List[int]) -> Dict[str, Any]:
+            item: Dict[str, Any] = {} if key[0] is None else {"t": key[0]}
+            item.update(zip(group_by, key[1:]))
+            item.update(zip(METRICS[:5], m[:5]))
+            item["avg_ttft_ms"] = round(m[5] / m[6]) if m[6] else None
+            item["avg_duration_ms"] = round(m[7] / m[0]) if m[0] else None
+            if prices:
+                item["cost"] = round(costs.get(key, 0.0), 6)
+            return item
+
+        total = [0] * len(METRICS)
+        for m in rows.values():
+            _add(total, m)
+        totals = shape((None,), total)
+        if prices:
+            totals["cost"] = round(sum(costs.values()), 6)
+        return {
+            "from": start_key,
+            "to": end_key,
+            "granularity": granularity,
+            "group_by": group_by,
+            "source": source,
+            "rows": [shape(k, m) for k, m in sorted(rows.items(), key=lambda kv: tuple(str(x) for x in kv[0]))],
+            "totals": totals,
+        }
@@ -1,48 +1,56 @@
 import os
 import threading
 import time
-import contextlib
-from urllib.request import urlopen
-from urllib.error import URLError
 import webview
 import sys
 
 
-def run_server():
-    # Start uvicorn programmatically
+def start_server(timeout: float = 20.0) -> str:
+    """Run uvicorn in a background thread; returns its URL once it is listening.
+
+    Raises RuntimeError when the server exits or is not ready within ``timeout``.
+    """
     import uvicorn
-    uvicorn.run("backend.app:app", host="127.0.0.1", port=8000, reload=False, log_level="info")
+    from backend.entry import DEFAULT_PORT, ReadyServer, bind_socket
+
+    ready = threading.Event()
+    info = {}
 
+    def on_ready(addr):
+        info.update(addr)
+        ready.set()
 
-def wait_for_server(url: str, timeout: float = 15.0):
-    start = time.time()
-    while time.time() - start < timeout:
-        try:
-            with contextlib.closing(urlopen(url, timeout=2.0)) as r:
-                if getattr(r, 'status', 200) in (200, 204):
-                    return True
-        except URLError:
-            pass
-        except Exception:
-            pass
-        time.sleep(0.25)
-    return False
+    # A stable port keeps the page origin, and so its localStorage, across launches
+    sock = bind_socket("127.0.0.1", DEFAULT_PORT, fallback=True)
+    server = ReadyServer(uvicorn.Config("backend.app:app", log_level="info"), on_ready=on_ready)
+    t = threading.Thread(target=server.run, kwargs={"sockets": [sock]}, daemon=True)
+    t.start()
+    # Signalled by the server itself after lifespan startup; no health polling
+    deadline = time.monotonic() + timeout
+    while not ready.wait(0.1):
+        if not t.is_alive():
+            raise RuntimeError("backend exited before it was ready")
+        if time.monotonic() >= deadline:
+            server.should_exit = True
+            raise RuntimeError(f"backend not ready after {timeout:.0f}s")
+    return info["url"]
 
 
 def main():
     # Ensure working directory at project root
     os.chdir(os.path.dirname(os.path.abspath(__file__)))
+    os.environ.setdefault("FERN_LAUNCH_T0", str(time.time()))
 
-    t = threading.Thread(target=run_server, daemon=True)
-    t.start()
-
-    # Wait for server health
-    wait_for_server("http://127.0.0.1:8000/api/health", timeout=20.0)
+    try:
+        url = start_server(timeout=20.0)
+    except RuntimeError as e:
+        print(f"[desktop] {e}", file=sys.stderr)
+        sys.exit(1)
 
     # Launch desktop window pointing to local server
     window = webview.create_window(
         "ChatUI",
-        "http://127.0.0.1:8000",
+        url,
         width=1100,
         height=800,
         min_size=(900, 600),
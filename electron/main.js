@@ -8,6 +8,12 @@ let pyProc = null
 let mainWindow = null
 let shuttingDown = false
 const DEBUG = !!process.env.FERN_DEBUG
+// Backend we started ourselves prefers this port (a stable origin keeps the UI's
+// localStorage) and reports the port it actually bound; this is also the
+// address probed for a backend that is already running (dev setups)
+const DEFAULT_URL = `http://127.0.0.1:${process.env.FERN_PORT || 8000}`
+const READY_PREFIX = 'FERN_READY '
+let backendUrl = DEFAULT_URL
 
 function getLogPath() {
   try {
@@ -23,28 +29,49 @@ function log(...args) {
   try { console.log(...args) } catch {}
 }
 
-function waitForServer(url, timeoutMs = 15000) {
-  const started = Date.now()
+function probeServer(url, timeoutMs = 500) {
+  // Single health request; used to detect an already running backend
+  return new Promise((resolve) => {
+    const req = http.get(url, res => {
+      res.resume()
+      resolve(res.statusCode >= 200 && res.statusCode < 300)
+    })
+    req.setTimeout(timeoutMs, () => { req.destroy(); resolve(false) })
+    req.on('error', () => resolve(false))
+  })
+}
+
+function waitForReady(proc, timeoutMs = 15000) {
+  // Resolve with the address the backend prints once it is listening
+  // (backend/entry.py: "FERN_READY {json}"); no polling involved
   return new Promise((resolve, reject) => {
-    const tryOnce = () => {
-      const req = http.get(url, res => {
-        if (res.statusCode >= 200 && res.statusCode < 300) {
-          resolve()
-        } else {
-          setTimeout(next, 300)
-        }
-        res.resume()
-      })
-      req.on('error', () => setTimeout(next, 300))
-      const next = () => {
-        if (Date.now() - started > timeoutMs) {
-          reject(new Error('Server start timeout'))
-        } else {
-          tryOnce()
+    let buf = ''
+    let settled = false
+    const finish = (fn, v) => {
+      if (settled) return
+      settled = true
+      clearTimeout(timer)
+      fn(v)
+    }
+    const timer = setTimeout(() => finish(reject, new Error('Server start timeout')), timeoutMs)
+    proc.stdout.on('data', data => {
+      buf += data.toString()
+      let nl
+      while ((nl = buf.indexOf('\n')) >= 0) {
+        const line = buf.slice(0, nl).trim()
+        buf = buf.slice(nl + 1)
+        if (line.startsWith(READY_PREFIX)) {
+          try { finish(resolve, JSON.parse(line.slice(READY_PREFIX.length))) } catch (e) { finish(reject, e) }
+        } else if (line) {
+          log('[backend]', line)
         }
       }
-    }
-    tryOnce()
+    })
+    proc.stderr.on('data', data => {
+      data.toString().split(/\r?\n/).filter(Boolean).forEach(l => log('[backend]', l))
+    })
+    proc.on('exit', code => finish(reject, new Error(`Backend exited with code ${code}`)))
+    proc.on('error', err => finish(reject, err))
   })
 }
 
@@ -152,7 +179,7 @@ function createWindow(offline = false) {
       }
     })
   } else {
-    win.loadURL('http://127.0.0.1:8000')
+    win.loadURL(backendUrl)
   }
   return win
 }
@@ -185,67 +212,29 @@ function pyAvailable() {
 async function startPython() {
   const appRoot = getAppRoot()
   const backendBin = resolveBackendBinary()
-  let proc
+  // Without FERN_PORT the backend binds 8000, or a free port while 8000 is
+  // taken; it reports the real address on stdout when ready
+  const env = { ...process.env, FERN_LAUNCH_T0: String(Date.now() / 1000) }
+  const opts = { env, windowsHide: true, stdio: ['ignore', 'pipe', 'pipe'] }
   if (backendBin) {
     log('Starting bundled backend binary:', backendBin)
     const cwd = path.dirname(path.dirname(backendBin)) // .../backend
-    if (process.platform === 'win32') {
-      // Open in a separate console window
-      proc = spawn('cmd.exe', ['/c', 'start', '"Fern Backend"', '"' + backendBin + '"'], {
-        cwd,
-        env: process.env,
-        windowsHide: false,
-        shell: false,
-        detached: true,
-        stdio: 'ignore',
-      })
-    } else {
-      proc = spawn(backendBin, [], { cwd, env: process.env, detached: true, stdio: 'ignore' })
-    }
-  } else {
-    // Fallback to python/uvicorn
-    const venvPython = process.platform === 'win32'
-      ? path.join(appRoot, '.venv', 'Scripts', 'python.exe')
-      : path.join(appRoot, '.venv', 'bin', 'python')
-    const hasVenv = fs.existsSync(venvPython)
-    if (hasVenv) {
-      log('Starting backend using venv python:', venvPython)
-      const args = ['-m', 'uvicorn', 'backend.app:app', '--host', '127.0.0.1', '--port', '8000']
-      if (process.platform === 'win32') {
-        proc = spawn('cmd.exe', ['/c', 'start', '"Fern Backend"', '"' + venvPython + '"', ...args], {
-          cwd: appRoot,
-          env: process.env,
-          windowsHide: false,
-          shell: false,
-          detached: true,
-          stdio: 'ignore',
-        })
-      } else {
-        proc = spawn(venvPython, args, { cwd: appRoot, env: process.env, detached: true, stdio: 'ignore' })
-      }
-    } else {
-      log('Bundled backend not found; trying system Python')
-      const hasPy = await pyAvailable()
-      if (!hasPy) throw new Error('Python not available')
-      const pyCmd = process.platform === 'win32' ? 'python' : 'python3'
-      const args = ['-m', 'uvicorn', 'backend.app:app', '--host', '127.0.0.1', '--port', '8000']
-      if (process.platform === 'win32') {
-        proc = spawn('cmd.exe', ['/c', 'start', '"Fern Backend"', pyCmd, ...args], {
-          cwd: appRoot,
-          env: process.env,
-          windowsHide: false,
-          shell: false,
-          detached: true,
-          stdio: 'ignore',
-        })
-      } else {
-        proc = spawn(pyCmd, args, { cwd: appRoot, env: process.env, detached: true, stdio: 'ignore' })
-      }
-    }
+    return spawn(backendBin, [], { ...opts, cwd })
+  }
+  // Fallback to python running backend/entry.py
+  const venvPython = process.platform === 'win32'
+    ? path.join(appRoot, '.venv', 'Scripts', 'python.exe')
+    : path.join(appRoot, '.venv', 'bin', 'python')
+  const args = ['-m', 'backend.entry']
+  if (fs.existsSync(venvPython)) {
+    log('Starting backend using venv python:', venvPython)
+    return spawn(venvPython, args, { ...opts, cwd: appRoot })
   }
-  // When using 'start', proc represents the cmd stub; logs come from the console window.
-  // We still health-check for readiness elsewhere.
-  return proc
+  log('Bundled backend not found; trying system Python')
+  const hasPy = await pyAvailable()
+  if (!hasPy) throw new Error('Python not available')
+  const pyCmd = process.platform === 'win32' ? 'python' : 'python3'
+  return spawn(pyCmd, args, { ...opts, cwd: appRoot })
 }
 
 function stopPython() {
@@ -268,14 +257,14 @@ app.on('ready', async () => {
   if (!mainWindow) createWindow(true)
 
   // First, check if a server is already running
-  try {
-    await waitForServer('http://127.0.0.1:8000/api/health', 2500)
-    mainWindow?.loadURL('http://127.0.0.1:8000')
+  if (await probeServer(`${DEFAULT_URL}/api/health`)) {
+    backendUrl = DEFAULT_URL
+    mainWindow?.loadURL(backendUrl)
     log('Detected running backend; switched to online')
     return
-  } catch {}
+  }
 
-  // Start backend (bundled binary preferred) and switch when ready
+  // Start backend (bundled binary preferred) and switch as soon as it reports ready
   try {
     pyProc = await startPython()
   } catch (err) {
@@ -284,9 +273,10 @@ app.on('ready', async () => {
   }
 
   try {
-    await waitForServer('http://127.0.0.1:8000/api/health', 15000)
-    mainWindow?.loadURL('http://127.0.0.1:8000')
-    log('Backend started; switched to online')
+    const ready = await waitForReady(pyProc, 15000)
+    backendUrl = ready.url
+    mainWindow?.loadURL(backendUrl)
+    log('Backend started; switched to online', ready)
   } catch (err) {
     log('Backend not ready in time; staying offline', err?.message || String(err))
   }
@@ -1,40 +0,0 @@
-(function(){const t=document.createElement("link").relList;if(t&&t.supports&&t.supports("modulepreload"))return;for(const l of document.querySelectorAll('link[rel="modulepreload"]'))r(l);new MutationObserver(l=>{for(const u of l)if(u.type==="childList")for(const o of u.addedNodes)o.tagName==="LINK"&&o.rel==="modulepreload"&&r(o)}).observe(document,{childList:!0,subtree:!0});function n(l){const u={};return l.integrity&&(u.integrity=l.integrity),l.referrerPolicy&&(u.referrerPolicy=l.referrerPolicy),l.crossOrigin==="use-credentials"?u.credentials="include":l.crossOrigin==="anonymous"?u.credentials="omit":u.credentials="same-origin",u}function r(l){if(l.ep)return;l.ep=!0;const u=n(l);fetch(l.href,u)}})();function rc(e){return e&&e.__esModule&&Object.prototype.hasOwnProperty.call(e,"default")?e.default:e}var Wi={exports:{}},ll={},Qi={exports:{}},R={};/**
- * @license React
- * react.production.min.js
- *
- * Copyright (c) Facebook, Inc. and its affiliates.
- *
- * This source code is licensed under the MIT license found in the
- * LICENSE file in the root directory of this source tree.
- */var bn=Symbol.for("react.element"),lc=Symbol.for("react.portal"),uc=Symbol.for("react.fragment"),oc=Symbol.for("react.strict_mode"),ic=Symbol.for("react.profiler"),sc=Symbol.for("react.provider"),ac=Symbol.for("react.context"),cc=Symbol.for("react.forward_ref"),fc=Symbol.for("react.suspense"),dc=Symbol.for("react.memo"),pc=Symbol.for("react.lazy"),Do=Symbol.iterator;function mc(e){return e===null||typeof e!="object"?null:(e=Do&&e[Do]||e["@@iterator"],typeof e=="function"?e:null)}var Ki={isMounted:function(){return!1},enqueueForceUpdate:function(){},enqueueReplaceState:function(){},enqueueSetState:function(){}},Yi=Object.assign,Xi={};function fn(e,t,n){this.props=e,this.context=t,this.refs=Xi,this.updater=n||Ki}fn.prototype.isReactComponent={};fn.prototype.setState=function(e,t){if(typeof e!="object"&&typeof e!="function"&&e!=null)throw Error("setState(...): takes an object of state variables to update or a function which returns an object of state variables.");this.updater.enqueueSetState(this,e,t,"setState")};fn.prototype.forceUpdate=function(e){this.updater.enqueueForceUpdate(this,e,"forceUpdate")};function Gi(){}Gi.prototype=fn.prototype;function Au(e,t,n){this.props=e,this.context=t,this.refs=Xi,this.updater=n||Ki}var Vu=Au.prototype=new Gi;Vu.constructor=Au;Yi(Vu,fn.prototype);Vu.isPureReactComponent=!0;var Io=Array.isArray,Zi=Object.prototype.hasOwnProperty,Bu={current:null},Ji={key:!0,ref:!0,__self:!0,__source:!0};function qi(e,t,n){var r,l={},u=null,o=null;if(t!=null)for(r in t.ref!==void 0&&(o=t.ref),t.key!==void 0&&(u=""+t.key),t)Zi.call(t,r)&&!Ji.hasOwnProperty(r)&&(l[r]=t[r]);var i=arguments.length-2;if(i===1)l.children=n;else if(1<i){for(var s=Array(i),f=0;f<i;f++)s[f]=arguments[f+2];l.children=s}if(e&&e.defaultProps)for(r in i=e.defaultProps,i)l[r]===void 0&&(l[r]=i[r]);return{$$typeof:bn,type:e,key:u,ref:o,props:l,_owner:Bu.current}}function hc(e,t){return{$$typeof:bn,type:e.type,key:t,ref:e.ref,props:e.props,_owner:e._owner}}function Hu(e){return typeof e=="object"&&e!==null&&e.$$typeof===bn}function vc(e){var t={"=":"=0",":":"=2"};return"$"+e.replace(/[=:]/g,function(n){return t[n]})}var Fo=/\/+/g;function xl(e,t){return typeof e=="object"&&e!==null&&e.key!=null?vc(""+e.key):t.toString(36)}function xr(e,t,n,r,l){var u=typeof e;(u==="undefined"||u==="boolean")&&(e=null);var o=!1;if(e===null)o=!0;else switch(u){case"string":case"number":o=!0;break;case"object":switch(e.$$typeof){case bn:case lc:o=!0}}if(o)return o=e,l=l(o),e=r===""?"."+xl(o,0):r,Io(l)?(n="",e!=null&&(n=e.replace(Fo,"$&/")+"/"),xr(l,t,n,"",function(f){return f})):l!=null&&(Hu(l)&&(l=hc(l,n+(!l.key||o&&o.key===l.key?"":(""+l.key).replace(Fo,"$&/")+"/")+e)),t.push(l)),1;if(o=0,r=r===""?".":r+":",Io(e))for(var i=0;i<e.length;i++){u=e[i];var s=r+xl(u,i);o+=xr(u,t,n,s,l)}else if(s=mc(e),typeof s=="function")for(e=s.call(e),i=0;!(u=e.next()).done;)u=u.value,s=r+xl(u,i++),o+=xr(u,t,n,s,l);else if(u==="object")throw t=String(e),Error("Objects are not valid as a React child (found: "+(t==="[object Object]"?"object with keys {"+Object.keys(e).join(", ")+"}":t)+"). If you meant to render a collection of children, use an array instead.");return o}function ur(e,t,n){if(e==null)return e;var r=[],l=0;return xr(e,r,"","",function(u){return t.call(n,u,l++)}),r}function yc(e){if(e._status===-1){var t=e._result;t=t(),t.then(function(n){(e._status===0||e._status===-1)&&(e._status=1,e._result=n)},function(n){(e._status===0||e._status===-1)&&(e._status=2,e._result=n)}),e._status===-1&&(e._status=0,e._result=t)}if(e._status===1)return e._result.default;throw e._result}var ce={current:null},Er={transition:null},gc={ReactCurrentDispatcher:ce,ReactCurrentBatchConfig:Er,ReactCurrentOwner:Bu};function bi(){throw Error("act(...) is not supported in production builds of React.")}R.Children={map:ur,forEach:function(e,t,n){ur(e,function(){t.apply(this,arguments)},n)},count:function(e){var t=0;return ur(e,function(){t++}),t},toArray:function(e){return ur(e,function(t){return t})||[]},only:function(e){if(!Hu(e))throw Error("React.Children.only expected to receive a single React element child.");return e}};R.Component=fn;R.Fragment=uc;R.Profiler=ic;R.PureComponent=Au;R.StrictMode=oc;R.Suspense=fc;R.__SECRET_INTERNALS_DO_NOT_USE_OR_YOU_WILL_BE_FIRED=gc;R.act=bi;R.cloneElement=function(e,t,n){if(e==null)throw Error("React.cloneElement(...): The argument must be a React element, but you passed "+e+".");var r=Yi({},e.props),l=e.key,u=e.ref,o=e._owner;if(t!=null){if(t.ref!==void 0&&(u=t.ref,o=Bu.current),t.key!==void 0&&(l=""+t.key),e.type&&e.type.defaultProps)var i=e.type.defaultProps;for(s in t)Zi.call(t,s)&&!Ji.hasOwnProperty(s)&&(r[s]=t[s]===void 0&&i!==void 0?i[s]:t[s])}var s=arguments.length-2;if(s===1)r.children=n;else if(1<s){i=Array(s);for(var f=0;f<s;f++)i[f]=arguments[f+2];r.children=i}return{$$typeof:bn,type:e.type,key:l,ref:u,props:r,_owner:o}};R.createContext=function(e){return e={$$typeof:ac,_currentValue:e,_currentValue2:e,_threadCount:0,Provider:null,Consumer:null,_defaultValue:null,_globalName:null},e.Provider={$$typeof:sc,_context:e},e.Consumer=e};R.createElement=qi;R.createFactory=function(e){var t=qi.bind(null,e);return t.type=e,t};R.createRef=function(){return{current:null}};R.forwardRef=function(e){return{$$typeof:cc,render:e}};R.isValidElement=Hu;R.lazy=function(e){return{$$typeof:pc,_payload:{_status:-1,_result:e},_init:yc}};R.memo=function(e,t){return{$$typeof:dc,type:e,compare:t===void 0?null:t}};R.startTransition=function(e){var t=Er.transition;Er.transition={};try{e()}finally{Er.transition=t}};R.unstable_act=bi;R.useCallback=function(e,t){return ce.current.useCallback(e,t)};R.useContext=function(e){return ce.current.useContext(e)};R.useDebugValue=function(){};R.useDeferredValue=function(e){return ce.current.useDeferredValue(e)};R.useEffect=function(e,t){return ce.current.useEffect(e,t)};R.useId=function(){return ce.current.useId()};R.useImperativeHandle=function(e,t,n){return ce.current.useImperativeHandle(e,t,n)};R.useInsertionEffect=function(e,t){return ce.current.useInsertionEffect(e,t)};R.useLayoutEffect=function(e,t){return ce.current.useLayoutEffect(e,t)};R.useMemo=function(e,t){return ce.current.useMemo(e,t)};R.useReducer=function(e,t,n){return ce.current.useReducer(e,t,n)};R.useRef=function(e){return ce.current.useRef(e)};R.useState=function(e){return ce.current.useState(e)};R.useSyncExternalStore=function(e,t,n){return ce.current.useSyncExternalStore(e,t,n)};R.useTransition=function(){return ce.current.useTransition()};R.version="18.3.1";Qi.exports=R;var ie=Qi.exports;const wc=rc(ie);/**
- * @license React
- * react-jsx-runtime.production.min.js
- *
- * Copyright (c) Facebook, Inc. and its affiliates.
- *
- * This source code is licensed under the MIT license found in the
- * LICENSE file in the root directory of this source tree.
- */var Sc=ie,kc=Symbol.for("react.element"),xc=Symbol.for("react.fragment"),Ec=Object.prototype.hasOwnProperty,Cc=Sc.__SECRET_INTERNALS_DO_NOT_USE_OR_YOU_WILL_BE_FIRED.ReactCurrentOwner,_c={key:!0,ref:!0,__self:!0,__source:!0};function es(e,t,n){var r,l={},u=null,o=null;n!==void 0&&(u=""+n),t.key!==void 0&&(u=""+t.key),t.ref!==void 0&&(o=t.ref);for(r in t)Ec.call(t,r)&&!_c.hasOwnProperty(r)&&(l[r]=t[r]);if(e&&e.defaultProps)for(r in t=e.defaultProps,t)l[r]===void 0&&(l[r]=t[r]);return{$$typeof:kc,type:e,key:u,ref:o,props:l,_owner:Cc.current}}ll.Fragment=xc;ll.jsx=es;ll.jsxs=es;Wi.exports=ll;var T=Wi.exports,ts={exports:{}},xe={},ns={exports:{}},rs={};/**
- * @license React
- * scheduler.production.min.js
- *
- * Copyright (c) Facebook, Inc. and its affiliates.
- *
- * This source code is licensed under the MIT license found in the
- * LICENSE file in the root directory of this source tree.
- */(function(e){function t(E,L){var z=E.length;E.push(L);e:for(;0<z;){var W=z-1>>>1,G=E[W];if(0<l(G,L))E[W]=L,E[z]=G,z=W;else break e}}function n(E){return E.length===0?null:E[0]}function r(E){if(E.length===0)return null;var L=E[0],z=E.pop();if(z!==L){E[0]=z;e:for(var W=0,G=E.length,It=G>>>1;W<It;){var St=2*(W+1)-1,kl=E[St],kt=St+1,lr=E[kt];if(0>l(kl,z))kt<G&&0>l(lr,kl)?(E[W]=lr,E[kt]=z,W=kt):(E[W]=kl,E[St]=z,W=St);else if(kt<G&&0>l(lr,z))E[W]=lr,E[kt]=z,W=kt;else break e}}return L}function l(E,L){var z=E.sortIndex-L.sortIndex;return z!==0?z:E.id-L.id}if(typeof performance=="object"&&typeof performance.now=="function"){var u=performance;e.unstable_now=function(){return u.now()}}else{var o=Date,i=o.now();e.unstable_now=function(){return o.now()-i}}var s=[],f=[],h=1,m=null,p=3,g=!1,S=!1,k=!1,D=typeof setTimeout=="function"?setTimeout:null,c=typeof clearTimeout=="function"?clearTimeout:null,a=typeof setImmediate<"u"?setImmediate:null;typeof navigator<"u"&&navigator.scheduling!==void 0&&navigator.scheduling.isInputPending!==void 0&&navigator.scheduling.isInputPending.bind(navigator.scheduling);function d(E){for(var L=n(f);L!==null;){if(L.callback===null)r(f);else if(L.startTime<=E)r(f),L.sortIndex=L.expirationTime,t(s,L);else break;L=n(f)}}function v(E){if(k=!1,d(E),!S)if(n(s)!==null)S=!0,Be(x);else{var L=n(f);L!==null&&wt(v,L.startTime-E)}}function x(E,L){S=!1,k&&(k=!1,c(P),P=-1),g=!0;var z=p;try{for(d(L),m=n(s);m!==null&&(!(m.expirationTime>L)||E&&!de());){var W=m.callback;if(typeof W=="function"){m.callback=null,p=m.priorityLevel;var G=W(m.expirationTime<=L);L=e.unstable_now(),typeof G=="function"?m.callback=G:m===n(s)&&r(s),d(L)}else r(s);m=n(s)}if(m!==null)var It=!0;else{var St=n(f);St!==null&&wt(v,St.startTime-L),It=!1}return It}finally{m=null,p=z,g=!1}}var _=!1,N=null,P=-1,A=5,j=-1;function de(){return!(e.unstable_now()-j<A)}function w(){if(N!==null){var E=e.unstable_now();j=E;var L=!0;try{L=N(!0,E)}finally{L?Y():(_=!1,N=null)}}else _=!1}var Y;if(typeof a=="function")Y=function(){a(w)};else if(typeof MessageChannel<"u"){var mn=new MessageChannel,Sl=mn.port2;mn.port1.onmessage=w,Y=function(){Sl.postMessage(null)}}else Y=function(){D(w,0)};function Be(E){N=E,_||(_=!0,Y())}function wt(E,L){P=D(function(){E(e.unstable_now())},L)}e.unstable_IdlePriority=5,e.unstable_ImmediatePriority=1,e.unstable_LowPriority=4,e.unstable_NormalPriority=3,e.unstable_Profiling=null,e.unstable_UserBlockingPriority=2,e.unstable_cancelCallback=function(E){E.callback=null},e.unstable_continueExecution=function(){S||g||(S=!0,Be(x))},e.unstable_forceFrameRate=function(E){0>E||125<E?console.error("forceFrameRate takes a positive int between 0 and 125, forcing frame rates higher than 125 fps is not supported"):A=0<E?Math.floor(1e3/E):5},e.unstable_getCurrentPriorityLevel=function(){return p},e.unstable_getFirstCallbackNode=function(){return n(s)},e.unstable_next=function(E){switch(p){case 1:case 2:case 3:var L=3;break;default:L=p}var z=p;p=L;try{return E()}finally{p=z}},e.unstable_pauseExecution=function(){},e.unstable_requestPaint=function(){},e.unstable_runWithPriority=function(E,L){switch(E){case 1:case 2:case 3:case 4:case 5:break;default:E=3}var z=p;p=E;try{return L()}finally{p=z}},e.unstable_scheduleCallback=function(E,L,z){var W=e.unstable_now();switch(typeof z=="object"&&z!==null?(z=z.delay,z=typeof z=="number"&&0<z?W+z:W):z=W,E){case 1:var G=-1;break;case 2:G=250;break;case 5:G=1073741823;break;case 4:G=1e4;break;default:G=5e3}return G=z+G,E={id:h++,callback:L,priorityLevel:E,startTime:z,expirationTime:G,sortIndex:-1},z>W?(E.sortIndex=z,t(f,E),n(s)===null&&E===n(f)&&(k?(c(P),P=-1):k=!0,wt(v,z-W))):(E.sortIndex=G,t(s,E),S||g||(S=!0,Be(x))),E},e.unstable_shouldYield=de,e.unstable_wrapCallback=function(E){var L=p;return function(){var z=p;p=L;try{return E.apply(this,arguments)}finally{p=z}}}})(rs);ns.exports=rs;var Nc=ns.exports;/**
- * @license React
- * react-dom.production.min.js
- *
- * Copyright (c) Facebook, Inc. and its affiliates.
- *
- * This source code is licensed under the MIT license found in the
- * LICENSE file in the root directory of this source tree.
- */var Pc=ie,ke=Nc;function y(e){for(var t="https://reactjs.org/docs/error-decoder.html?invariant="+e,n=1;n<arguments.length;n++)t+="&args[]="+encodeURIComponent(arguments[n]);return"Minified React error #"+e+"; visit "+t+" for the full message or use the non-minified dev environment for full errors and additional helpful warnings."}var ls=new Set,In={};function Mt(e,t){rn(e,t),rn(e+"Capture",t)}function rn(e,t){for(In[e]=t,e=0;e<t.length;e++)ls.add(t[e])}var Xe=!(typeof window>"u"||typeof window.document>"u"||typeof window.document.createElement>"u"),Xl=Object.prototype.hasOwnProperty,zc=/^[:A-Z_a-z\u00C0-\u00D6\u00D8-\u00F6\u00F8-\u02FF\u0370-\u037D\u037F-\u1FFF\u200C-\u200D\u2070-\u218F\u2C00-\u2FEF\u3001-\uD7FF\uF900-\uFDCF\uFDF0-\uFFFD][:A-Z_a-z\u00C0-\u00D6\u00D8-\u00F6\u00F8-\u02FF\u0370-\u037D\u037F-\u1FFF\u200C-\u200D\u2070-\u218F\u2C00-\u2FEF\u3001-\uD7FF\uF900-\uFDCF\uFDF0-\uFFFD\-.0-9\u00B7\u0300-\u036F\u203F-\u2040]*$/,Uo={},$o={};function Lc(e){return Xl.call($o,e)?!0:Xl.call(Uo,e)?!1:zc.test(e)?$o[e]=!0:(Uo[e]=!0,!1)}function Tc(e,t,n,r){if(n!==null&&n.type===0)return!1;switch(typeof t){case"function":case"symbol":return!0;case"boolean":return r?!1:n!==null?!n.acceptsBooleans:(e=e.toLowerCase().slice(0,5),e!=="data-"&&e!=="aria-");default:return!1}}function jc(e,t,n,r){if(t===null||typeof t>"u"||Tc(e,t,n,r))return!0;if(r)return!1;if(n!==null)switch(n.type){case 3:return!t;case 4:return t===!1;case 5:return isNaN(t);case 6:return isNaN(t)||1>t}return!1}function fe(e,t,n,r,l,u,o){this.acceptsBooleans=t===2||t===3||t===4,this.attributeName=r,this.attributeNamespace=l,this.mustUseProperty=n,this.propertyName=e,this.type=t,this.sanitizeURL=u,this.removeEmptyString=o}var ne={};"children dangerouslySetInnerHTML defaultValue defaultChecked innerHTML suppressContentEditableWarning suppressHydrationWarning style".split(" ").forEach(function(e){ne[e]=new fe(e,0,!1,e,null,!1,!1)});[["acceptCharset","accept-charset"],["className","class"],["htmlFor","for"],["httpEquiv","http-equiv"]].forEach(function(e){var t=e[0];ne[t]=new fe(t,1,!1,e[1],null,!1,!1)});["contentEditable","draggable","spellCheck","value"].forEach(function(e){ne[e]=new fe(e,2,!1,e.toLowerCase(),null,!1,!1)});["autoReverse","externalResourcesRequired","focusable","preserveAlpha"].forEach(function(e){ne[e]=new fe(e,2,!1,e,null,!1,!1)});"allowFullScreen async autoFocus autoPlay controls default defer disabled disablePictureInPicture disableRemotePlayback formNoValidate hidden loop noModule noValidate open playsInline readOnly required reversed scoped seamless itemScope".split(" ").forEach(function(e){ne[e]=new fe(e,3,!1,e.toLowerCase(),null,!1,!1)});["checked","multiple","muted","selected"].forEach(function(e){ne[e]=new fe(e,3,!0,e,null,!1,!1)});["capture","download"].forEach(function(e){ne[e]=new fe(e,4,!1,e,null,!1,!1)});["cols","rows","size","span"].forEach(function(e){ne[e]=new fe(e,6,!1,e,null,!1,!1)});["rowSpan","start"].forEach(function(e){ne[e]=new fe(e,5,!1,e.toLowerCase(),null,!1,!1)});var Wu=/[\-:]([a-z])/g;function Qu(e){return e[1].toUpperCase()}"accent-height alignment-baseline arabic-form baseline-shift cap-height clip-path clip-rule color-interpolation color-interpolation-filters color-profile color-rendering dominant-baseline enable-background fill-opacity fill-rule flood-color flood-opacity font-family font-size font-size-adjust font-stretch font-style font-variant font-weight glyph-name glyph-orientation-horizontal glyph-orientation-vertical horiz-adv-x horiz-origin-x image-rendering letter-spacing lighting-color marker-end marker-mid marker-start overline-position overline-thickness paint-order panose-1 pointer-events rendering-intent shape-rendering stop-color stop-opacity strikethrough-position strikethrough-thickness stroke-dasharray stroke-dashoffset stroke-linecap stroke-linejoin stroke-miterlimit stroke-opacity stroke-width text-anchor text-decoration text-rendering underline-position underline-thickness unicode-bidi unicode-range units-per-em v-alphabetic v-hanging v-ideographic v-mathematical vector-effect vert-adv-y vert-origin-x vert-origin-y word-spacing writing-mode xmlns:xlink x-height".split(" ").forEach(function(e){var t=e.replace(Wu,Qu);ne[t]=new fe(t,1,!1,e,null,!1,!1)});"xlink:actuate xlink:arcrole xlink:role xlink:show xlink:title xlink:type".split(" ").forEach(function(e){var t=e.replace(Wu,Qu);ne[t]=new fe(t,1,!1,e,"http://www.w3.org/1999/xlink",!1,!1)});["xml:base","xml:lang","xml:space"].forEach(function(e){var t=e.replace(Wu,Qu);ne[t]=new fe(t,1,!1,e,"http://www.w3.org/XML/1998/namespace",!1,!1)});["tabIndex","crossOrigin"].forEach(function(e){ne[e]=new fe(e,1,!1,e.toLowerCase(),null,!1,!1)});ne.xlinkHref=new fe("xlinkHref",1,!1,"xlink:href","http://www.w3.org/1999/xlink",!0,!1);["src","href","action","formAction"].forEach(function(e){ne[e]=new fe(e,1,!1,e.toLowerCase(),null,!0,!0)});function Ku(e,t,n,r){var l=ne.hasOwnProperty(t)?ne[t]:null;(l!==null?l.type!==0:r||!(2<t.length)||t[0]!=="o"&&t[0]!=="O"||t[1]!=="n"&&t[1]!=="N")&&(jc(t,n,l,r)&&(n=null),r||l===null?Lc(t)&&(n===null?e.removeAttribute(t):e.setAttribute(t,""+n)):l.mustUseProperty?e[l.propertyName]=n===null?l.type===3?!1:"":n:(t=l.attributeName,r=l.attributeNamespace,n===null?e.removeAttribute(t):(l=l.type,n=l===3||l===4&&n===!0?"":""+n,r?e.setAttributeNS(r,t,n):e.setAttribute(t,n))))}var qe=Pc.__SECRET_INTERNALS_DO_NOT_USE_OR_YOU_WILL_BE_FIRED,or=Symbol.for("react.element"),$t=Symbol.for("react.portal"),At=Symbol.for("react.fragment"),Yu=Symbol.for("react.strict_mode"),Gl=Symbol.for("react.profiler"),us=Symbol.for("react.provider"),os=Symbol.for("react.context"),Xu=Symbol.for("react.forward_ref"),Zl=Symbol.for("react.suspense"),Jl=Symbol.for("react.suspense_list"),Gu=Symbol.for("react.memo"),et=Symbol.for("react.lazy"),is=Symbol.for("react.offscreen"),Ao=Symbol.iterator;function hn(e){return e===null||typeof e!="object"?null:(e=Ao&&e[Ao]||e["@@iterator"],typeof e=="function"?e:null)}var H=Object.assign,El;function En(e){if(El===void 0)try{throw Error()}catch(n){var t=n.stack.trim().match(/\n( *(at )?)/);El=t&&t[1]||""}return`
-`+El+e}var Cl=!1;function _l(e,t){if(!e||Cl)return"";Cl=!0;var n=Error.prepareStackTrace;Error.prepareStackTrace=void 0;try{if(t)if(t=function(){throw Error()},Object.defineProperty(t.prototype,"props",{set:function(){throw Error()}}),typeof Reflect=="object"&&Reflect.construct){try{Reflect.construct(t,[])}catch(f){var r=f}Reflect.construct(e,[],t)}else{try{t.call()}catch(f){r=f}e.call(t.prototype)}else{try{throw Error()}catch(f){r=f}e()}}catch(f){if(f&&r&&typeof f.stack=="string"){for(var l=f.stack.split(`
-`),u=r.stack.split(`
-`),o=l.length-1,i=u.length-1;1<=o&&0<=i&&l[o]!==u[i];)i--;for(;1<=o&&0<=i;o--,i--)if(l[o]!==u[i]){if(o!==1||i!==1)do if(o--,i--,0>i||l[o]!==u[i]){var s=`
-`+l[o].replace(" at new "," at ");return e.displayName&&s.includes("<anonymous>")&&(s=s.replace("<anonymous>",e.displayName)),s}while(1<=o&&0<=i);break}}}finally{Cl=!1,Error.prepareStackTrace=n}return(e=e?e.displayName||e.name:"")?En(e):""}function Rc(e){switch(e.tag){case 5:return En(e.type);case 16:return En("Lazy");case 13:return En("Suspense");case 19:return En("SuspenseList");case 0:case 2:case 15:return e=_l(e.type,!1),e;case 11:return e=_l(e.type.render,!1),e;case 1:return e=_l(e.type,!0),e;default:return""}}function ql(e){if(e==null)return null;if(typeof e=="function")return e.displayName||e.name||null;if(typeof e=="string")return e;switch(e){case At:return"Fragment";case $t:return"Portal";case Gl:return"Profiler";case Yu:return"StrictMode";case Zl:return"Suspense";case Jl:return"SuspenseList"}if(typeof e=="object")switch(e.$$typeof){case os:return(e.displayName||"Context")+".Consumer";case us:return(e._context.displayName||"Context")+".Provider";case Xu:var t=e.render;return e=e.displayName,e||(e=t.displayName||t.name||"",e=e!==""?"ForwardRef("+e+")":"ForwardRef"),e;case Gu:return t=e.displayName||null,t!==null?t:ql(e.type)||"Memo";case et:t=e._payload,e=e._init;try{return ql(e(t))}catch{}}return null}function Oc(e){var t=e.type;switch(e.tag){case 24:return"Cache";case 9:return(t.displayName||"Context")+".Consumer";case 10:return(t._context.displayName||"Context")+".Provider";case 18:return"DehydratedFragment";case 11:return e=t.render,e=e.displayName||e.name||"",t.displayName||(e!==""?"ForwardRef("+e+")":"ForwardRef");case 7:return"Fragment";case 5:return t;case 4:return"Portal";case 3:return"Root";case 6:return"Text";case 16:return ql(t);case 8:return t===Yu?"StrictMode":"Mode";case 22:return"Offscreen";case 12:return"Profiler";case 21:return"Scope";case 13:return"Suspense";case 19:return"SuspenseList";case 25:return"TracingMarker";case 1:case 0:case 17:case 2:case 14:case 15:if(typeof t=="function")return t.displayName||t.name||null;if(typeof t=="string")return t}return null}function mt(e){switch(typeof e){case"boolean":case"number":case"string":case"undefined":return e;case"object":return e;default:return""}}function ss(e){var t=e.type;return(e=e.nodeName)&&e.toLowerCase()==="input"&&(t==="checkbox"||t==="radio")}function Mc(e){var t=ss(e)?"checked":"value",n=Object.getOwnPropertyDescriptor(e.constructor.prototype,t),r=""+e[t];if(!e.hasOwnProperty(t)&&typeof n<"u"&&typeof n.get=="function"&&typeof n.set=="function"){var l=n.get,u=n.set;return Object.defineProperty(e,t,{configurable:!0,get:function(){return l.call(this)},set:function(o){r=""+o,u.call(this,o)}}),Object.defineProperty(e,t,{enumerable:n.enumerable}),{getValue:function(){return r},setValue:function(o){r=""+o},stopTracking:function(){e._valueTracker=null,delete e[t]}}}}function ir(e){e._valueTracker||(e._valueTracker=Mc(e))}function as(e){if(!e)return!1;var t=e._valueTracker;if(!t)return!0;var n=t.getValue(),r="";return e&&(r=ss(e)?e.checked?"true":"false":e.value),e=r,e!==n?(t.setValue(e),!0):!1}function Mr(e){if(e=e||(typeof document<"u"?document:void 0),typeof e>"u")return null;try{return e.activeElement||e.body}catch{return e.body}}function bl(e,t){var n=t.checked;return H({},t,{defaultChecked:void 0,defaultValue:void 0,value:void 0,checked:n??e._wrapperState.initialChecked})}function Vo(e,t){var n=t.defaultValue==null?"":t.defaultValue,r=t.checked!=null?t.checked:t.defaultChecked;n=mt(t.value!=null?t.value:n),e._wrapperState={initialChecked:r,initialValue:n,controlled:t.type==="checkbox"||t.type==="radio"?t.checked!=null:t.value!=null}}function cs(e,t){t=t.checked,t!=null&&Ku(e,"checked",t,!1)}function eu(e,t){cs(e,t);var n=mt(t.value),r=t.type;if(n!=null)r==="number"?(n===0&&e.value===""||e.value!=n)&&(e.value=""+n):e.value!==""+n&&(e.value=""+n);else if(r==="submit"||r==="reset"){e.removeAttribute("value");return}t.hasOwnProperty("value")?tu(e,t.type,n):t.hasOwnProperty("defaultValue")&&tu(e,t.type,mt(t.defaultValue)),t.checked==null&&t.defaultChecked!=null&&(e.defaultChecked=!!t.defaultChecked)}function Bo(e,t,n){if(t.hasOwnProperty("value")||t.hasOwnProperty("defaultValue")){var r=t.type;if(!(r!=="submit"&&r!=="reset"||t.value!==void 0&&t.value!==null))return;t=""+e._wrapperState.initialValue,n||t===e.value||(e.value=t),e.defaultValue=t}n=e.name,n!==""&&(e.name=""),e.defaultChecked=!!e._wrapperState.initialChecked,n!==""&&(e.name=n)}function tu(e,t,n){(t!=="number"||Mr(e.ownerDocument)!==e)&&(n==null?e.defaultValue=""+e._wrapperState.initialValue:e.defaultValue!==""+n&&(e.defaultValue=""+n))}var Cn=Array.isArray;function Jt(e,t,n,r){if(e=e.options,t){t={};for(var l=0;l<n.length;l++)t["$"+n[l]]=!0;for(n=0;n<e.length;n++)l=t.hasOwnProperty("$"+e[n].value),e[n].selected!==l&&(e[n].selected=l),l&&r&&(e[n].defaultSelected=!0)}else{for(n=""+mt(n),t=null,l=0;l<e.length;l++){if(e[l].value===n){e[l].selected=!0,r&&(e[l].defaultSelected=!0);return}t!==null||e[l].disabled||(t=e[l])}t!==null&&(t.selected=!0)}}function nu(e,t){if(t.dangerouslySetInnerHTML!=null)throw Error(y(91));return H({},t,{value:void 0,defaultValue:void 0,children:""+e._wrapperState.initialValue})}function Ho(e,t){var n=t.value;if(n==null){if(n=t.children,t=t.defaultValue,n!=null){if(t!=null)throw Error(y(92));if(Cn(n)){if(1<n.length)throw Error(y(93));n=n[0]}t=n}t==null&&(t=""),n=t}e._wrapperState={initialValue:mt(n)}}function fs(e,t){var n=mt(t.value),r=mt(t.defaultValue);n!=null&&(n=""+n,n!==e.value&&(e.value=n),t.defaultValue==null&&e.defaultValue!==n&&(e.defaultValue=n)),r!=null&&(e.defaultValue=""+r)}function Wo(e){var t=e.textContent;t===e._wrapperState.initialValue&&t!==""&&t!==null&&(e.value=t)}function ds(e){switch(e){case"svg":return"http://www.w3.org/2000/svg";case"math":return"http://www.w3.org/1998/Math/MathML";default:return"http://www.w3.org/1999/xhtml"}}function ru(e,t){return e==null||e==="http://www.w3.org/1999/xhtml"?ds(t):e==="http://www.w3.org/2000/svg"&&t==="foreignObject"?"http://www.w3.org/1999/xhtml":e}var sr,ps=function(e){return typeof MSApp<"u"&&MSApp.execUnsafeLocalFunction?function(t,n,r,l){MSApp.execUnsafeLocalFunction(function(){return e(t,n,r,l)})}:e}(function(e,t){if(e.namespaceURI!=="http://www.w3.org/2000/svg"||"innerHTML"in e)e.innerHTML=t;else{for(sr=sr||document.createElement("div"),sr.innerHTML="<svg>"+t.valueOf().toString()+"</svg>",t=sr.firstChild;e.firstChild;)e.removeChild(e.firstChild);for(;t.firstChild;)e.appendChild(t.firstChild)}});function Fn(e,t){if(t){var n=e.firstChild;if(n&&n===e.lastChild&&n.nodeType===3){n.nodeValue=t;return}}e.textContent=t}var Pn={animationIterationCount:!0,aspectRatio:!0,borderImageOutset:!0,borderImageSlice:!0,borderImageWidth:!0,boxFlex:!0,boxFlexGroup:!0,boxOrdinalGroup:!0,columnCount:!0,columns:!0,flex:!0,flexGrow:!0,flexPositive:!0,flexShrink:!0,flexNegative:!0,flexOrder:!0,gridArea:!0,gridRow:!0,gridRowEnd:!0,gridRowSpan:!0,gridRowStart:!0,gridColumn:!0,gridColumnEnd:!0,gridColumnSpan:!0,gridColumnStart:!0,fontWeight:!0,lineClamp:!0,lineHeight:!0,opacity:!0,order:!0,orphans:!0,tabSize:!0,widows:!0,zIndex:!0,zoom:!0,fillOpacity:!0,floodOpacity:!0,stopOpacity:!0,strokeDasharray:!0,strokeDashoffset:!0,strokeMiterlimit:!0,strokeOpacity:!0,strokeWidth:!0},Dc=["Webkit","ms","Moz","O"];Object.keys(Pn).forEach(function(e){Dc.forEach(function(t){t=t+e.charAt(0).toUpperCase()+e.substring(1),Pn[t]=Pn[e]})});function ms(e,t,n){return t==null||typeof t=="boolean"||t===""?"":n||typeof t!="number"||t===0||Pn.hasOwnProperty(e)&&Pn[e]?(""+t).trim():t+"px"}function hs(e,t){e=e.style;for(var n in t)if(t.hasOwnProperty(n)){var r=n.indexOf("--")===0,l=ms(n,t[n],r);n==="float"&&(n="cssFloat"),r?e.setProperty(n,l):e[n]=l}}var Ic=H({menuitem:!0},{area:!0,base:!0,br:!0,col:!0,embed:!0,hr:!0,img:!0,input:!0,keygen:!0,link:!0,meta:!0,param:!0,source:!0,track:!0,wbr:!0});function lu(e,t){if(t){if(Ic[e]&&(t.children!=null||t.dangerouslySetInnerHTML!=null))throw Error(y(137,e));if(t.dangerouslySetInnerHTML!=null){if(t.children!=null)throw Error(y(60));if(typeof t.dangerouslySetInnerHTML!="object"||!("__html"in t.dangerouslySetInnerHTML))throw Error(y(61))}if(t.style!=null&&typeof t.style!="object")throw Error(y(62))}}function uu(e,t){if(e.indexOf("-")===-1)return typeof t.is=="string";switch(e){case"annotation-xml":case"color-profile":case"font-face":case"font-face-src":case"font-face-uri":case"font-face-format":case"font-face-name":case"missing-glyph":return!1;default:return!0}}var ou=null;function Zu(e){return e=e.target||e.srcElement||window,e.correspondingUseElement&&(e=e.correspondingUseElement),e.nodeType===3?e.parentNode:e}var iu=null,qt=null,bt=null;function Qo(e){if(e=nr(e)){if(typeof iu!="function")throw Error(y(280));var t=e.stateNode;t&&(t=al(t),iu(e.stateNode,e.type,t))}}function vs(e){qt?bt?bt.push(e):bt=[e]:qt=e}function ys(){if(qt){var e=qt,t=bt;if(bt=qt=null,Qo(e),t)for(e=0;e<t.length;e++)Qo(t[e])}}function gs(e,t){return e(t)}function ws(){}var Nl=!1;function Ss(e,t,n){if(Nl)return e(t,n);Nl=!0;try{return gs(e,t,n)}finally{Nl=!1,(qt!==null||bt!==null)&&(ws(),ys())}}function Un(e,t){var n=e.stateNode;if(n===null)return null;var r=al(n);if(r===null)return null;n=r[t];e:switch(t){case"onClick":case"onClickCapture":case"onDoubleClick":case"onDoubleClickCapture":case"onMouseDown":case"onMouseDownCapture":case"onMouseMove":case"onMouseMoveCapture":case"onMouseUp":case"onMouseUpCapture":case"onMouseEnter":(r=!r.disabled)||(e=e.type,r=!(e==="button"||e==="input"||e==="select"||e==="textarea")),e=!r;break e;default:e=!1}if(e)return null;if(n&&typeof n!="function")throw Error(y(231,t,typeof n));return n}var su=!1;if(Xe)try{var vn={};Object.defineProperty(vn,"passive",{get:function(){su=!0}}),window.addEventListener("test",vn,vn),window.removeEventListener("test",vn,vn)}catch{su=!1}function Fc(e,t,n,r,l,u,o,i,s){var f=Array.prototype.slice.call(arguments,3);try{t.apply(n,f)}catch(h){this.onError(h)}}var zn=!1,Dr=null,Ir=!1,au=null,Uc={onError:function(e){zn=!0,Dr=e}};function $c(e,t,n,r,l,u,o,i,s){zn=!1,Dr=null,Fc.apply(Uc,arguments)}function Ac(e,t,n,r,l,u,o,i,s){if($c.apply(this,arguments),zn){if(zn){var f=Dr;zn=!1,Dr=null}else throw Error(y(198));Ir||(Ir=!0,au=f)}}function Dt(e){var t=e,n=e;if(e.alternate)for(;t.return;)t=t.return;else{e=t;do t=e,t.flags&4098&&(n=t.return),e=t.return;while(e)}return t.tag===3?n:null}function ks(e){if(e.tag===13){var t=e.memoizedState;if(t===null&&(e=e.alternate,e!==null&&(t=e.memoizedState)),t!==null)return t.dehydrated}return null}function Ko(e){if(Dt(e)!==e)throw Error(y(188))}function Vc(e){var t=e.alternate;if(!t){if(t=Dt(e),t===null)throw Error(y(188));return t!==e?null:e}for(var n=e,r=t;;){var l=n.return;if(l===null)break;var u=l.alternate;if(u===null){if(r=l.return,r!==null){n=r;continue}break}if(l.child===u.child){for(u=l.child;u;){if(u===n)return Ko(l),e;if(u===r)return Ko(l),t;u=u.sibling}throw Error(y(188))}if(n.return!==r.return)n=l,r=u;else{for(var o=!1,i=l.child;i;){if(i===n){o=!0,n=l,r=u;break}if(i===r){o=!0,r=l,n=u;break}i=i.sibling}if(!o){for(i=u.child;i;){if(i===n){o=!0,n=u,r=l;break}if(i===r){o=!0,r=u,n=l;break}i=i.sibling}if(!o)throw Error(y(189))}}if(n.alternate!==r)throw Error(y(190))}if(n.tag!==3)throw Error(y(188));return n.stateNode.current===n?e:t}function xs(e){return e=Vc(e),e!==null?Es(e):null}function Es(e){if(e.tag===5||e.tag===6)return e;for(e=e.child;e!==null;){var t=Es(e);if(t!==null)return t;e=e.sibling}return null}var Cs=ke.unstable_scheduleCallback,Yo=ke.unstable_cancelCallback,Bc=ke.unstable_shouldYield,Hc=ke.unstable_requestPaint,K=ke.unstable_now,Wc=ke.unstable_getCurrentPriorityLevel,Ju=ke.unstable_ImmediatePriority,_s=ke.unstable_UserBlockingPriority,Fr=ke.unstable_NormalPriority,Qc=ke.unstable_LowPriority,Ns=ke.unstable_IdlePriority,ul=null,Ae=null;function Kc(e){if(Ae&&typeof Ae.onCommitFiberRoot=="function")try{Ae.onCommitFiberRoot(ul,e,void 0,(e.current.flags&128)===128)}catch{}}var Me=Math.clz32?Math.clz32:Gc,Yc=Math.log,Xc=Math.LN2;function Gc(e){return e>>>=0,e===0?32:31-(Yc(e)/Xc|0)|0}var ar=64,cr=4194304;function _n(e){switch(e&-e){case 1:return 1;case 2:return 2;case 4:return 4;case 8:return 8;case 16:return 16;case 32:return 32;case 64:case 128:case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:return e&4194240;case 4194304:case 8388608:case 16777216:case 33554432:case 67108864:return e&130023424;case 134217728:return 134217728;case 268435456:return 268435456;case 536870912:return 536870912;case 1073741824:return 1073741824;default:return e}}function Ur(e,t){var n=e.pendingLanes;if(n===0)return 0;var r=0,l=e.suspendedLanes,u=e.pingedLanes,o=n&268435455;if(o!==0){var i=o&~l;i!==0?r=_n(i):(u&=o,u!==0&&(r=_n(u)))}else o=n&~l,o!==0?r=_n(o):u!==0&&(r=_n(u));if(r===0)return 0;if(t!==0&&t!==r&&!(t&l)&&(l=r&-r,u=t&-t,l>=u||l===16&&(u&4194240)!==0))return t;if(r&4&&(r|=n&16),t=e.entangledLanes,t!==0)for(e=e.entanglements,t&=r;0<t;)n=31-Me(t),l=1<<n,r|=e[n],t&=~l;return r}function Zc(e,t){switch(e){case 1:case 2:case 4:return t+250;case 8:case 16:case 32:case 64:case 128:case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:return t+5e3;case 4194304:case 8388608:case 16777216:case 33554432:case 67108864:return-1;case 134217728:case 268435456:case 536870912:case 1073741824:return-1;default:return-1}}function Jc(e,t){for(var n=e.suspendedLanes,r=e.pingedLanes,l=e.expirationTimes,u=e.pendingLanes;0<u;){var o=31-Me(u),i=1<<o,s=l[o];s===-1?(!(i&n)||i&r)&&(l[o]=Zc(i,t)):s<=t&&(e.expiredLanes|=i),u&=~i}}function cu(e){return e=e.pendingLanes&-1073741825,e!==0?e:e&1073741824?1073741824:0}function Ps(){var e=ar;return ar<<=1,!(ar&4194240)&&(ar=64),e}function Pl(e){for(var t=[],n=0;31>n;n++)t.push(e);return t}function er(e,t,n){e.pendingLanes|=t,t!==536870912&&(e.suspendedLanes=0,e.pingedLanes=0),e=e.eventTimes,t=31-Me(t),e[t]=n}function qc(e,t){var n=e.pendingLanes&~t;e.pendingLanes=t,e.suspendedLanes=0,e.pingedLanes=0,e.expiredLanes&=t,e.mutableReadLanes&=t,e.entangledLanes&=t,t=e.entanglements;var r=e.eventTimes;for(e=e.expirationTimes;0<n;){var l=31-Me(n),u=1<<l;t[l]=0,r[l]=-1,e[l]=-1,n&=~u}}function qu(e,t){var n=e.entangledLanes|=t;for(e=e.entanglements;n;){var r=31-Me(n),l=1<<r;l&t|e[r]&t&&(e[r]|=t),n&=~l}}var M=0;function zs(e){return e&=-e,1<e?4<e?e&268435455?16:536870912:4:1}var Ls,bu,Ts,js,Rs,fu=!1,fr=[],ot=null,it=null,st=null,$n=new Map,An=new Map,nt=[],bc="mousedown mouseup touchcancel touchend touchstart auxclick dblclick pointercancel pointerdown pointerup dragend dragstart drop compositionend compositionstart keydown keypress keyup input textInput copy cut paste click change contextmenu reset submit".split(" ");function Xo(e,t){switch(e){case"focusin":case"focusout":ot=null;break;case"dragenter":case"dragleave":it=null;break;case"mouseover":case"mouseout":st=null;break;case"pointerover":case"pointerout":$n.delete(t.pointerId);break;case"gotpointercapture":case"lostpointercapture":An.delete(t.pointerId)}}function yn(e,t,n,r,l,u){return e===null||e.nativeEvent!==u?(e={blockedOn:t,domEventName:n,eventSystemFlags:r,nativeEvent:u,targetContainers:[l]},t!==null&&(t=nr(t),t!==null&&bu(t)),e):(e.eventSystemFlags|=r,t=e.targetContainers,l!==null&&t.indexOf(l)===-1&&t.push(l),e)}function ef(e,t,n,r,l){switch(t){case"focusin":return ot=yn(ot,e,t,n,r,l),!0;case"dragenter":return it=yn(it,e,t,n,r,l),!0;case"mouseover":return st=yn(st,e,t,n,r,l),!0;case"pointerover":var u=l.pointerId;return $n.set(u,yn($n.get(u)||null,e,t,n,r,l)),!0;case"gotpointercapture":return u=l.pointerId,An.set(u,yn(An.get(u)||null,e,t,n,r,l)),!0}return!1}function Os(e){var t=Ct(e.target);if(t!==null){var n=Dt(t);if(n!==null){if(t=n.tag,t===13){if(t=ks(n),t!==null){e.blockedOn=t,Rs(e.priority,function(){Ts(n)});return}}else if(t===3&&n.stateNode.current.memoizedState.isDehydrated){e.blockedOn=n.tag===3?n.stateNode.containerInfo:null;return}}}e.blockedOn=null}function Cr(e){if(e.blockedOn!==null)return!1;for(var t=e.targetContainers;0<t.length;){var n=du(e.domEventName,e.eventSystemFlags,t[0],e.nativeEvent);if(n===null){n=e.nativeEvent;var r=new n.constructor(n.type,n);ou=r,n.target.dispatchEvent(r),ou=null}else return t=nr(n),t!==null&&bu(t),e.blockedOn=n,!1;t.shift()}return!0}function Go(e,t,n){Cr(e)&&n.delete(t)}function tf(){fu=!1,ot!==null&&Cr(ot)&&(ot=null),it!==null&&Cr(it)&&(it=null),st!==null&&Cr(st)&&(st=null),$n.forEach(Go),An.forEach(Go)}function gn(e,t){e.blockedOn===t&&(e.blockedOn=null,fu||(fu=!0,ke.unstable_scheduleCallback(ke.unstable_NormalPriority,tf)))}function Vn(e){function t(l){return gn(l,e)}if(0<fr.length){gn(fr[0],e);for(var n=1;n<fr.length;n++){var r=fr[n];r.blockedOn===e&&(r.blockedOn=null)}}for(ot!==null&&gn(ot,e),it!==null&&gn(it,e),st!==null&&gn(st,e),$n.forEach(t),An.forEach(t),n=0;n<nt.length;n++)r=nt[n],r.blockedOn===e&&(r.blockedOn=null);for(;0<nt.length&&(n=nt[0],n.blockedOn===null);)Os(n),n.blockedOn===null&&nt.shift()}var en=qe.ReactCurrentBatchConfig,$r=!0;function nf(e,t,n,r){var l=M,u=en.transition;en.transition=null;try{M=1,eo(e,t,n,r)}finally{M=l,en.transition=u}}function rf(e,t,n,r){var l=M,u=en.transition;en.transition=null;try{M=4,eo(e,t,n,r)}finally{M=l,en.transition=u}}function eo(e,t,n,r){if($r){var l=du(e,t,n,r);if(l===null)Fl(e,t,r,Ar,n),Xo(e,r);else if(ef(l,e,t,n,r))r.stopPropagation();else if(Xo(e,r),t&4&&-1<bc.indexOf(e)){for(;l!==null;){var u=nr(l);if(u!==null&&Ls(u),u=du(e,t,n,r),u===null&&Fl(e,t,r,Ar,n),u===l)break;l=u}l!==null&&r.stopPropagation()}else Fl(e,t,r,null,n)}}var Ar=null;function du(e,t,n,r){if(Ar=null,e=Zu(r),e=Ct(e),e!==null)if(t=Dt(e),t===null)e=null;else if(n=t.tag,n===13){if(e=ks(t),e!==null)return e;e=null}else if(n===3){if(t.stateNode.current.memoizedState.isDehydrated)return t.tag===3?t.stateNode.containerInfo:null;e=null}else t!==e&&(e=null);return Ar=e,null}function Ms(e){switch(e){case"cancel":case"click":case"close":case"contextmenu":case"copy":case"cut":case"auxclick":case"dblclick":case"dragend":case"dragstart":case"drop":case"focusin":case"focusout":case"input":case"invalid":case"keydown":case"keypress":case"keyup":case"mousedown":case"mouseup":case"paste":case"pause":case"play":case"pointercancel":case"pointerdown":case"pointerup":case"ratechange":case"reset":case"resize":case"seeked":case"submit":case"touchcancel":case"touchend":case"touchstart":case"volumechange":case"change":case"selectionchange":case"textInput":case"compositionstart":case"compositionend":case"compositionupdate":case"beforeblur":case"afterblur":case"beforeinput":case"blur":case"fullscreenchange":case"focus":case"hashchange":case"popstate":case"select":case"selectstart":return 1;case"drag":case"dragenter":case"dragexit":case"dragleave":case"dragover":case"mousemove":case"mouseout":case"mouseover":case"pointermove":case"pointerout":case"pointerover":case"scroll":case"toggle":case"touchmove":case"wheel":case"mouseenter":case"mouseleave":case"pointerenter":case"pointerleave":return 4;case"message":switch(Wc()){case Ju:return 1;case _s:return 4;case Fr:case Qc:return 16;case Ns:return 536870912;default:return 16}default:return 16}}var lt=null,to=null,_r=null;function Ds(){if(_r)return _r;var e,t=to,n=t.length,r,l="value"in lt?lt.value:lt.textContent,u=l.length;for(e=0;e<n&&t[e]===l[e];e++);var o=n-e;for(r=1;r<=o&&t[n-r]===l[u-r];r++);return _r=l.slice(e,1<r?1-r:void 0)}function Nr(e){var t=e.keyCode;return"charCode"in e?(e=e.charCode,e===0&&t===13&&(e=13)):e=t,e===10&&(e=13),32<=e||e===13?e:0}function dr(){return!0}function Zo(){return!1}function Ee(e){function t(n,r,l,u,o){this._reactName=n,this._targetInst=l,this.type=r,this.nativeEvent=u,this.target=o,this.currentTarget=null;for(var i in e)e.hasOwnProperty(i)&&(n=e[i],this[i]=n?n(u):u[i]);return this.isDefaultPrevented=(u.defaultPrevented!=null?u.defaultPrevented:u.returnValue===!1)?dr:Zo,this.isPropagationStopped=Zo,this}return H(t.prototype,{preventDefault:function(){this.defaultPrevented=!0;var n=this.nativeEvent;n&&(n.preventDefault?n.preventDefault():typeof n.returnValue!="unknown"&&(n.returnValue=!1),this.isDefaultPrevented=dr)},stopPropagation:function(){var n=this.nativeEvent;n&&(n.stopPropagation?n.stopPropagation():typeof n.cancelBubble!="unknown"&&(n.cancelBubble=!0),this.isPropagationStopped=dr)},persist:function(){},isPersistent:dr}),t}var dn={eventPhase:0,bubbles:0,cancelable:0,timeStamp:function(e){return e.timeStamp||Date.now()},defaultPrevented:0,isTrusted:0},no=Ee(dn),tr=H({},dn,{view:0,detail:0}),lf=Ee(tr),zl,Ll,wn,ol=H({},tr,{screenX:0,screenY:0,clientX:0,clientY:0,pageX:0,pageY:0,ctrlKey:0,shiftKey:0,altKey:0,metaKey:0,getModifierState:ro,button:0,buttons:0,relatedTarget:function(e){return e.relatedTarget===void 0?e.fromElement===e.srcElement?e.toElement:e.fromElement:e.relatedTarget},movementX:function(e){return"movementX"in e?e.movementX:(e!==wn&&(wn&&e.type==="mousemove"?(zl=e.screenX-wn.screenX,Ll=e.screenY-wn.screenY):Ll=zl=0,wn=e),zl)},movementY:function(e){return"movementY"in e?e.movementY:Ll}}),Jo=Ee(ol),uf=H({},ol,{dataTransfer:0}),of=Ee(uf),sf=H({},tr,{relatedTarget:0}),Tl=Ee(sf),af=H({},dn,{animationName:0,elapsedTime:0,pseudoElement:0}),cf=Ee(af),ff=H({},dn,{clipboardData:function(e){return"clipboardData"in e?e.clipboardData:window.clipboardData}}),df=Ee(ff),pf=H({},dn,{data:0}),qo=Ee(pf),mf={Esc:"Escape",Spacebar:" ",Left:"ArrowLeft",Up:"ArrowUp",Right:"ArrowRight",Down:"ArrowDown",Del:"Delete",Win:"OS",Menu:"ContextMenu",Apps:"ContextMenu",Scroll:"ScrollLock",MozPrintableKey:"Unidentified"},hf={8:"Backspace",9:"Tab",12:"Clear",13:"Enter",16:"Shift",17:"Control",18:"Alt",19:"Pause",20:"CapsLock",27:"Escape",32:" ",33:"PageUp",34:"PageDown",35:"End",36:"Home",37:"ArrowLeft",38:"ArrowUp",39:"ArrowRight",40:"ArrowDown",45:"Insert",46:"Delete",112:"F1",113:"F2",114:"F3",115:"F4",116:"F5",117:"F6",118:"F7",119:"F8",120:"F9",121:"F10",122:"F11",123:"F12",144:"NumLock",145:"ScrollLock",224:"Meta"},vf={Alt:"altKey",Control:"ctrlKey",Meta:"metaKey",Shift:"shiftKey"};function yf(e){var t=this.nativeEvent;return t.getModifierState?t.getModifierState(e):(e=vf[e])?!!t[e]:!1}function ro(){return yf}var gf=H({},tr,{key:function(e){if(e.key){var t=mf[e.key]||e.key;if(t!=="Unidentified")return t}return e.type==="keypress"?(e=Nr(e),e===13?"Enter":String.fromCharCode(e)):e.type==="keydown"||e.type==="keyup"?hf[e.keyCode]||"Unidentified":""},code:0,location:0,ctrlKey:0,shiftKey:0,altKey:0,metaKey:0,repeat:0,locale:0,getModifierState:ro,charCode:function(e){return e.type==="keypress"?Nr(e):0},keyCode:function(e){return e.type==="keydown"||e.type==="keyup"?e.keyCode:0},which:function(e){return e.type==="keypress"?Nr(e):e.type==="keydown"||e.type==="keyup"?e.keyCode:0}}),wf=Ee(gf),Sf=H({},ol,{pointerId:0,width:0,height:0,pressure:0,tangentialPressure:0,tiltX:0,tiltY:0,twist:0,pointerType:0,isPrimary:0}),bo=Ee(Sf),kf=H({},tr,{touches:0,targetTouches:0,changedTouches:0,altKey:0,metaKey:0,ctrlKey:0,shiftKey:0,getModifierState:ro}),xf=Ee(kf),Ef=H({},dn,{propertyName:0,elapsedTime:0,pseudoElement:0}),Cf=Ee(Ef),_f=H({},ol,{deltaX:function(e){return"deltaX"in e?e.deltaX:"wheelDeltaX"in e?-e.wheelDeltaX:0},deltaY:function(e){return"deltaY"in e?e.deltaY:"wheelDeltaY"in e?-e.wheelDeltaY:"wheelDelta"in e?-e.wheelDelta:0},deltaZ:0,deltaMode:0}),Nf=Ee(_f),Pf=[9,13,27,32],lo=Xe&&"CompositionEvent"in window,Ln=null;Xe&&"documentMode"in document&&(Ln=document.documentMode);var zf=Xe&&"TextEvent"in window&&!Ln,Is=Xe&&(!lo||Ln&&8<Ln&&11>=Ln),ei=" ",ti=!1;function Fs(e,t){switch(e){case"keyup":return Pf.indexOf(t.keyCode)!==-1;case"keydown":return t.keyCode!==229;case"keypress":case"mousedown":case"focusout":return!0;default:return!1}}function Us(e){return e=e.detail,typeof e=="object"&&"data"in e?e.data:null}var Vt=!1;function Lf(e,t){switch(e){case"compositionend":return Us(t);case"keypress":return t.which!==32?null:(ti=!0,ei);case"textInput":return e=t.data,e===ei&&ti?null:e;default:return null}}function Tf(e,t){if(Vt)return e==="compositionend"||!lo&&Fs(e,t)?(e=Ds(),_r=to=lt=null,Vt=!1,e):null;switch(e){case"paste":return null;case"keypress":if(!(t.ctrlKey||t.altKey||t.metaKey)||t.ctrlKey&&t.altKey){if(t.char&&1<t.char.length)return t.char;if(t.which)return String.fromCharCode(t.which)}return null;case"compositionend":return Is&&t.locale!=="ko"?null:t.data;default:return null}}var jf={color:!0,date:!0,datetime:!0,"datetime-local":!0,email:!0,month:!0,number:!0,password:!0,range:!0,search:!0,tel:!0,text:!0,time:!0,url:!0,week:!0};function ni(e){var t=e&&e.nodeName&&e.nodeName.toLowerCase();return t==="input"?!!jf[e.type]:t==="textarea"}function $s(e,t,n,r){vs(r),t=Vr(t,"onChange"),0<t.length&&(n=new no("onChange","change",null,n,r),e.push({event:n,listeners:t}))}var Tn=null,Bn=null;function Rf(e){Zs(e,0)}function il(e){var t=Wt(e);if(as(t))return e}function Of(e,t){if(e==="change")return t}var As=!1;if(Xe){var jl;if(Xe){var Rl="oninput"in document;if(!Rl){var ri=document.createElement("div");ri.setAttribute("oninput","return;"),Rl=typeof ri.oninput=="function"}jl=Rl}else jl=!1;As=jl&&(!document.documentMode||9<document.documentMode)}function li(){Tn&&(Tn.detachEvent("onpropertychange",Vs),Bn=Tn=null)}function Vs(e){if(e.propertyName==="value"&&il(Bn)){var t=[];$s(t,Bn,e,Zu(e)),Ss(Rf,t)}}function Mf(e,t,n){e==="focusin"?(li(),Tn=t,Bn=n,Tn.attachEvent("onpropertychange",Vs)):e==="focusout"&&li()}function Df(e){if(e==="selectionchange"||e==="keyup"||e==="keydown")return il(Bn)}function If(e,t){if(e==="click")return il(t)}function Ff(e,t){if(e==="input"||e==="change")return il(t)}function Uf(e,t){return e===t&&(e!==0||1/e===1/t)||e!==e&&t!==t}var Ie=typeof Object.is=="function"?Object.is:Uf;function Hn(e,t){if(Ie(e,t))return!0;if(typeof e!="object"||e===null||typeof t!="object"||t===null)return!1;var n=Object.keys(e),r=Object.keys(t);if(n.length!==r.length)return!1;for(r=0;r<n.length;r++){var l=n[r];if(!Xl.call(t,l)||!Ie(e[l],t[l]))return!1}return!0}function ui(e){for(;e&&e.firstChild;)e=e.firstChild;return e}function oi(e,t){var n=ui(e);e=0;for(var r;n;){if(n.nodeType===3){if(r=e+n.textContent.length,e<=t&&r>=t)return{node:n,offset:t-e};e=r}e:{for(;n;){if(n.nextSibling){n=n.nextSibling;break e}n=n.parentNode}n=void 0}n=ui(n)}}function Bs(e,t){return e&&t?e===t?!0:e&&e.nodeType===3?!1:t&&t.nodeType===3?Bs(e,t.parentNode):"contains"in e?e.contains(t):e.compareDocumentPosition?!!(e.compareDocumentPosition(t)&16):!1:!1}function Hs(){for(var e=window,t=Mr();t instanceof e.HTMLIFrameElement;){try{var n=typeof t.contentWindow.location.href=="string"}catch{n=!1}if(n)e=t.contentWindow;else break;t=Mr(e.document)}return t}function uo(e){var t=e&&e.nodeName&&e.nodeName.toLowerCase();return t&&(t==="input"&&(e.type==="text"||e.type==="search"||e.type==="tel"||e.type==="url"||e.type==="password")||t==="textarea"||e.contentEditable==="true")}function $f(e){var t=Hs(),n=e.focusedElem,r=e.selectionRange;if(t!==n&&n&&n.ownerDocument&&Bs(n.ownerDocument.documentElement,n)){if(r!==null&&uo(n)){if(t=r.start,e=r.end,e===void 0&&(e=t),"selectionStart"in n)n.selectionStart=t,n.selectionEnd=Math.min(e,n.value.length);else if(e=(t=n.ownerDocument||document)&&t.defaultView||window,e.getSelection){e=e.getSelection();var l=n.textContent.length,u=Math.min(r.start,l);r=r.end===void 0?u:Math.min(r.end,l),!e.extend&&u>r&&(l=r,r=u,u=l),l=oi(n,u);var o=oi(n,r);l&&o&&(e.rangeCount!==1||e.anchorNode!==l.node||e.anchorOffset!==l.offset||e.focusNode!==o.node||e.focusOffset!==o.offset)&&(t=t.createRange(),t.setStart(l.node,l.offset),e.removeAllRanges(),u>r?(e.addRange(t),e.extend(o.node,o.offset)):(t.setEnd(o.node,o.offset),e.addRange(t)))}}for(t=[],e=n;e=e.parentNode;)e.nodeType===1&&t.push({element:e,left:e.scrollLeft,top:e.scrollTop});for(typeof n.focus=="function"&&n.focus(),n=0;n<t.length;n++)e=t[n],e.element.scrollLeft=e.left,e.element.scrollTop=e.top}}var Af=Xe&&"documentMode"in document&&11>=document.documentMode,Bt=null,pu=null,jn=null,mu=!1;function ii(e,t,n){var r=n.window===n?n.document:n.nodeType===9?n:n.ownerDocument;mu||Bt==null||Bt!==Mr(r)||(r=Bt,"selectionStart"in r&&uo(r)?r={start:r.selectionStart,end:r.selectionEnd}:(r=(r.ownerDocument&&r.ownerDocument.defaultView||window).getSelection(),r={anchorNode:r.anchorNode,anchorOffset:r.anchorOffset,focusNode:r.focusNode,focusOffset:r.focusOffset}),jn&&Hn(jn,r)||(jn=r,r=Vr(pu,"onSelect"),0<r.length&&(t=new no("onSelect","select",null,t,n),e.push({event:t,listeners:r}),t.target=Bt)))}function pr(e,t){var n={};return n[e.toLowerCase()]=t.toLowerCase(),n["Webkit"+e]="webkit"+t,n["Moz"+e]="moz"+t,n}var Ht={animationend:pr("Animation","AnimationEnd"),animationiteration:pr("Animation","AnimationIteration"),animationstart:pr("Animation","AnimationStart"),transitionend:pr("Transition","TransitionEnd")},Ol={},Ws={};Xe&&(Ws=document.createElement("div").style,"AnimationEvent"in window||(delete Ht.animationend.animation,delete Ht.animationiteration.animation,delete Ht.animationstart.animation),"TransitionEvent"in window||delete Ht.transitionend.transition);function sl(e){if(Ol[e])return Ol[e];if(!Ht[e])return e;var t=Ht[e],n;for(n in t)if(t.hasOwnProperty(n)&&n in Ws)return Ol[e]=t[n];return e}var Qs=sl("animationend"),Ks=sl("animationiteration"),Ys=sl("animationstart"),Xs=sl("transitionend"),Gs=new Map,si="abort auxClick cancel canPlay canPlayThrough click close contextMenu copy cut drag dragEnd dragEnter dragExit dragLeave dragOver dragStart drop durationChange emptied encrypted ended error gotPointerCapture input invalid keyDown keyPress keyUp load loadedData loadedMetadata loadStart lostPointerCapture mouseDown mouseMove mouseOut mouseOver mouseUp paste pause play playing pointerCancel pointerDown pointerMove pointerOut pointerOver pointerUp progress rateChange reset resize seeked seeking stalled submit suspend timeUpdate touchCancel touchEnd touchStart volumeChange scroll toggle touchMove waiting wheel".split(" ");function vt(e,t){Gs.set(e,t),Mt(t,[e])}for(var Ml=0;Ml<si.length;Ml++){var Dl=si[Ml],Vf=Dl.toLowerCase(),Bf=Dl[0].toUpperCase()+Dl.slice(1);vt(Vf,"on"+Bf)}vt(Qs,"onAnimationEnd");vt(Ks,"onAnimationIteration");vt(Ys,"onAnimationStart");vt("dblclick","onDoubleClick");vt("focusin","onFocus");vt("focusout","onBlur");vt(Xs,"onTransitionEnd");rn("onMouseEnter",["mouseout","mouseover"]);rn("onMouseLeave",["mouseout","mouseover"]);rn("onPointerEnter",["pointerout","pointerover"]);rn("onPointerLeave",["pointerout","pointerover"]);Mt("onChange","change click focusin focusout input keydown keyup selectionchange".split(" "));Mt("onSelect","focusout contextmenu dragend focusin keydown keyup mousedown mouseup selectionchange".split(" "));Mt("onBeforeInput",["compositionend","keypress","textInput","paste"]);Mt("onCompositionEnd","compositionend focusout keydown keypress keyup mousedown".split(" "));Mt("onCompositionStart","compositionstart focusout keydown keypress keyup mousedown".split(" "));Mt("onCompositionUpdate","compositionupdate focusout keydown keypress keyup mousedown".split(" "));var Nn="abort canplay canplaythrough durationchange emptied encrypted ended error loadeddata loadedmetadata loadstart pause play playing progress ratechange resize seeked seeking stalled suspend timeupdate volumechange waiting".split(" "),Hf=new Set("cancel close invalid load scroll toggle".split(" ").concat(Nn));function ai(e,t,n){var r=e.type||"unknown-event";e.currentTarget=n,Ac(r,t,void 0,e),e.currentTarget=null}function Zs(e,t){t=(t&4)!==0;for(var n=0;n<e.length;n++){var r=e[n],l=r.event;r=r.listeners;e:{var u=void 0;if(t)for(var o=r.length-1;0<=o;o--){var i=r[o],s=i.instance,f=i.currentTarget;if(i=i.listener,s!==u&&l.isPropagationStopped())break e;ai(l,i,f),u=s}else for(o=0;o<r.length;o++){if(i=r[o],s=i.instance,f=i.currentTarget,i=i.listener,s!==u&&l.isPropagationStopped())break e;ai(l,i,f),u=s}}}if(Ir)throw e=au,Ir=!1,au=null,e}function F(e,t){var n=t[wu];n===void 0&&(n=t[wu]=new Set);var r=e+"__bubble";n.has(r)||(Js(t,e,2,!1),n.add(r))}function Il(e,t,n){var r=0;t&&(r|=4),Js(n,e,r,t)}var mr="_reactListening"+Math.random().toString(36).slice(2);function Wn(e){if(!e[mr]){e[mr]=!0,ls.forEach(function(n){n!=="selectionchange"&&(Hf.has(n)||Il(n,!1,e),Il(n,!0,e))});var t=e.nodeType===9?e:e.ownerDocument;t===null||t[mr]||(t[mr]=!0,Il("selectionchange",!1,t))}}function Js(e,t,n,r){switch(Ms(t)){case 1:var l=nf;break;case 4:l=rf;break;default:l=eo}n=l.bind(null,t,n,e),l=void 0,!su||t!=="touchstart"&&t!=="touchmove"&&t!=="wheel"||(l=!0),r?l!==void 0?e.addEventListener(t,n,{capture:!0,passive:l}):e.addEventListener(t,n,!0):l!==void 0?e.addEventListener(t,n,{passive:l}):e.addEventListener(t,n,!1)}function Fl(e,t,n,r,l){var u=r;if(!(t&1)&&!(t&2)&&r!==null)e:for(;;){if(r===null)return;var o=r.tag;if(o===3||o===4){var i=r.stateNode.containerInfo;if(i===l||i.nodeType===8&&i.parentNode===l)break;if(o===4)for(o=r.return;o!==null;){var s=o.tag;if((s===3||s===4)&&(s=o.stateNode.containerInfo,s===l||s.nodeType===8&&s.parentNode===l))return;o=o.return}for(;i!==null;){if(o=Ct(i),o===null)return;if(s=o.tag,s===5||s===6){r=u=o;continue e}i=i.parentNode}}r=r.return}Ss(function(){var f=u,h=Zu(n),m=[];e:{var p=Gs.get(e);if(p!==void 0){var g=no,S=e;switch(e){case"keypress":if(Nr(n)===0)break e;case"keydown":case"keyup":g=wf;break;case"focusin":S="focus",g=Tl;break;case"focusout":S="blur",g=Tl;break;case"beforeblur":case"afterblur":g=Tl;break;case"click":if(n.button===2)break e;case"auxclick":case"dblclick":case"mousedown":case"mousemove":case"mouseup":case"mouseout":case"mouseover":case"contextmenu":g=Jo;break;case"drag":case"dragend":case"dragenter":case"dragexit":case"dragleave":case"dragover":case"dragstart":case"drop":g=of;break;case"touchcancel":case"touchend":case"touchmove":case"touchstart":g=xf;break;case Qs:case Ks:case Ys:g=cf;break;case Xs:g=Cf;break;case"scroll":g=lf;break;case"wheel":g=Nf;break;case"copy":case"cut":case"paste":g=df;break;case"gotpointercapture":case"lostpointercapture":case"pointercancel":case"pointerdown":case"pointermove":case"pointerout":case"pointerover":case"pointerup":g=bo}var k=(t&4)!==0,D=!k&&e==="scroll",c=k?p!==null?p+"Capture":null:p;k=[];for(var a=f,d;a!==null;){d=a;var v=d.stateNode;if(d.tag===5&&v!==null&&(d=v,c!==null&&(v=Un(a,c),v!=null&&k.push(Qn(a,v,d)))),D)break;a=a.return}0<k.length&&(p=new g(p,S,null,n,h),m.push({event:p,listeners:k}))}}if(!(t&7)){e:{if(p=e==="mouseover"||e==="pointerover",g=e==="mouseout"||e==="pointerout",p&&n!==ou&&(S=n.relatedTarget||n.fromElement)&&(Ct(S)||S[Ge]))break e;if((g||p)&&(p=h.window===h?h:(p=h.ownerDocument)?p.defaultView||p.parentWindow:window,g?(S=n.relatedTarget||n.toElement,g=f,S=S?Ct(S):null,S!==null&&(D=Dt(S),S!==D||S.tag!==5&&S.tag!==6)&&(S=null)):(g=null,S=f),g!==S)){if(k=Jo,v="onMouseLeave",c="onMouseEnter",a="mouse",(e==="pointerout"||e==="pointerover")&&(k=bo,v="onPointerLeave",c="onPointerEnter",a="pointer"),D=g==null?p:Wt(g),d=S==null?p:Wt(S),p=new k(v,a+"leave",g,n,h),p.target=D,p.relatedTarget=d,v=null,Ct(h)===f&&(k=new k(c,a+"enter",S,n,h),k.target=d,k.relatedTarget=D,v=k),D=v,g&&S)t:{for(k=g,c=S,a=0,d=k;d;d=Ft(d))a++;for(d=0,v=c;v;v=Ft(v))d++;for(;0<a-d;)k=Ft(k),a--;for(;0<d-a;)c=Ft(c),d--;for(;a--;){if(k===c||c!==null&&k===c.alternate)break t;k=Ft(k),c=Ft(c)}k=null}else k=null;g!==null&&ci(m,p,g,k,!1),S!==null&&D!==null&&ci(m,D,S,k,!0)}}e:{if(p=f?Wt(f):window,g=p.nodeName&&p.nodeName.toLowerCase(),g==="select"||g==="input"&&p.type==="file")var x=Of;else if(ni(p))if(As)x=Ff;else{x=Df;var _=Mf}else(g=p.nodeName)&&g.toLowerCase()==="input"&&(p.type==="checkbox"||p.type==="radio")&&(x=If);if(x&&(x=x(e,f))){$s(m,x,n,h);break e}_&&_(e,p,f),e==="focusout"&&(_=p._wrapperState)&&_.controlled&&p.type==="number"&&tu(p,"number",p.value)}switch(_=f?Wt(f):window,e){case"focusin":(ni(_)||_.contentEditable==="true")&&(Bt=_,pu=f,jn=null);break;case"focusout":jn=pu=Bt=null;break;case"mousedown":mu=!0;break;case"contextmenu":case"mouseup":case"dragend":mu=!1,ii(m,n,h);break;case"selectionchange":if(Af)break;case"keydown":case"keyup":ii(m,n,h)}var N;if(lo)e:{switch(e){case"compositionstart":var P="onCompositionStart";break e;case"compositionend":P="onCompositionEnd";break e;case"compositionupdate":P="onCompositionUpdate";break e}P=void 0}else Vt?Fs(e,n)&&(P="onCompositionEnd"):e==="keydown"&&n.keyCode===229&&(P="onCompositionStart");P&&(Is&&n.locale!=="ko"&&(Vt||P!=="onCompositionStart"?P==="onCompositionEnd"&&Vt&&(N=Ds()):(lt=h,to="value"in lt?lt.value:lt.textContent,Vt=!0)),_=Vr(f,P),0<_.length&&(P=new qo(P,e,null,n,h),m.push({event:P,listeners:_}),N?P.data=N:(N=Us(n),N!==null&&(P.data=N)))),(N=zf?Lf(e,n):Tf(e,n))&&(f=Vr(f,"onBeforeInput"),0<f.length&&(h=new qo("onBeforeInput","beforeinput",null,n,h),m.push({event:h,listeners:f}),h.data=N))}Zs(m,t)})}function Qn(e,t,n){return{instance:e,listener:t,currentTarget:n}}function Vr(e,t){for(var n=t+"Capture",r=[];e!==null;){var l=e,u=l.stateNode;l.tag===5&&u!==null&&(l=u,u=Un(e,n),u!=null&&r.unshift(Qn(e,u,l)),u=Un(e,t),u!=null&&r.push(Qn(e,u,l))),e=e.return}return r}function Ft(e){if(e===null)return null;do e=e.return;while(e&&e.tag!==5);return e||null}function ci(e,t,n,r,l){for(var u=t._reactName,o=[];n!==null&&n!==r;){var i=n,s=i.alternate,f=i.stateNode;if(s!==null&&s===r)break;i.tag===5&&f!==null&&(i=f,l?(s=Un(n,u),s!=null&&o.unshift(Qn(n,s,i))):l||(s=Un(n,u),s!=null&&o.push(Qn(n,s,i)))),n=n.return}o.length!==0&&e.push({event:t,listeners:o})}var Wf=/\r\n?/g,Qf=/\u0000|\uFFFD/g;function fi(e){return(typeof e=="string"?e:""+e).replace(Wf,`
-`).replace(Qf,"")}function hr(e,t,n){if(t=fi(t),fi(e)!==t&&n)throw Error(y(425))}function Br(){}var hu=null,vu=null;function yu(e,t){return e==="textarea"||e==="noscript"||typeof t.children=="string"||typeof t.children=="number"||typeof t.dangerouslySetInnerHTML=="object"&&t.dangerouslySetInnerHTML!==null&&t.dangerouslySetInnerHTML.__html!=null}var gu=typeof setTimeout=="function"?setTimeout:void 0,Kf=typeof clearTimeout=="function"?clearTimeout:void 0,di=typeof Promise=="function"?Promise:void 0,Yf=typeof queueMicrotask=="function"?queueMicrotask:typeof di<"u"?function(e){return di.resolve(null).then(e).catch(Xf)}:gu;function Xf(e){setTimeout(function(){throw e})}function Ul(e,t){var n=t,r=0;do{var l=n.nextSibling;if(e.removeChild(n),l&&l.nodeType===8)if(n=l.data,n==="/$"){if(r===0){e.removeChild(l),Vn(t);return}r--}else n!=="$"&&n!=="$?"&&n!=="$!"||r++;n=l}while(n);Vn(t)}function at(e){for(;e!=null;e=e.nextSibling){var t=e.nodeType;if(t===1||t===3)break;if(t===8){if(t=e.data,t==="$"||t==="$!"||t==="$?")break;if(t==="/$")return null}}return e}function pi(e){e=e.previousSibling;for(var t=0;e;){if(e.nodeType===8){var n=e.data;if(n==="$"||n==="$!"||n==="$?"){if(t===0)return e;t--}else n==="/$"&&t++}e=e.previousSibling}return null}var pn=Math.random().toString(36).slice(2),$e="__reactFiber$"+pn,Kn="__reactProps$"+pn,Ge="__reactContainer$"+pn,wu="__reactEvents$"+pn,Gf="__reactListeners$"+pn,Zf="__reactHandles$"+pn;function Ct(e){var t=e[$e];if(t)return t;for(var n=e.parentNode;n;){if(t=n[Ge]||n[$e]){if(n=t.alternate,t.child!==null||n!==null&&n.child!==null)for(e=pi(e);e!==null;){if(n=e[$e])return n;e=pi(e)}return t}e=n,n=e.parentNode}return null}function nr(e){return e=e[$e]||e[Ge],!e||e.tag!==5&&e.tag!==6&&e.tag!==13&&e.tag!==3?null:e}function Wt(e){if(e.tag===5||e.tag===6)return e.stateNode;throw Error(y(33))}function al(e){return e[Kn]||null}var Su=[],Qt=-1;function yt(e){return{current:e}}function U(e){0>Qt||(e.current=Su[Qt],Su[Qt]=null,Qt--)}function I(e,t){Qt++,Su[Qt]=e.current,e.current=t}var ht={},oe=yt(ht),he=yt(!1),Lt=ht;function ln(e,t){var n=e.type.contextTypes;if(!n)return ht;var r=e.stateNode;if(r&&r.__reactInternalMemoizedUnmaskedChildContext===t)return r.__reactInternalMemoizedMaskedChildContext;var l={},u;for(u in n)l[u]=t[u];return r&&(e=e.stateNode,e.__reactInternalMemoizedUnmaskedChildContext=t,e.__reactInternalMemoizedMaskedChildContext=l),l}function ve(e){return e=e.childContextTypes,e!=null}function Hr(){U(he),U(oe)}function mi(e,t,n){if(oe.current!==ht)throw Error(y(168));I(oe,t),I(he,n)}function qs(e,t,n){var r=e.stateNode;if(t=t.childContextTypes,typeof r.getChildContext!="function")return n;r=r.getChildContext();for(var l in r)if(!(l in t))throw Error(y(108,Oc(e)||"Unknown",l));return H({},n,r)}function Wr(e){return e=(e=e.stateNode)&&e.__reactInternalMemoizedMergedChildContext||ht,Lt=oe.current,I(oe,e),I(he,he.current),!0}function hi(e,t,n){var r=e.stateNode;if(!r)throw Error(y(169));n?(e=qs(e,t,Lt),r.__reactInternalMemoizedMergedChildContext=e,U(he),U(oe),I(oe,e)):U(he),I(he,n)}var We=null,cl=!1,$l=!1;function bs(e){We===null?We=[e]:We.push(e)}function Jf(e){cl=!0,bs(e)}function gt(){if(!$l&&We!==null){$l=!0;var e=0,t=M;try{var n=We;for(M=1;e<n.length;e++){var r=n[e];do r=r(!0);while(r!==null)}We=null,cl=!1}catch(l){throw We!==null&&(We=We.slice(e+1)),Cs(Ju,gt),l}finally{M=t,$l=!1}}return null}var Kt=[],Yt=0,Qr=null,Kr=0,Ce=[],_e=0,Tt=null,Qe=1,Ke="";function xt(e,t){Kt[Yt++]=Kr,Kt[Yt++]=Qr,Qr=e,Kr=t}function ea(e,t,n){Ce[_e++]=Qe,Ce[_e++]=Ke,Ce[_e++]=Tt,Tt=e;var r=Qe;e=Ke;var l=32-Me(r)-1;r&=~(1<<l),n+=1;var u=32-Me(t)+l;if(30<u){var o=l-l%5;u=(r&(1<<o)-1).toString(32),r>>=o,l-=o,Qe=1<<32-Me(t)+l|n<<l|r,Ke=u+e}else Qe=1<<u|n<<l|r,Ke=e}function oo(e){e.return!==null&&(xt(e,1),ea(e,1,0))}function io(e){for(;e===Qr;)Qr=Kt[--Yt],Kt[Yt]=null,Kr=Kt[--Yt],Kt[Yt]=null;for(;e===Tt;)Tt=Ce[--_e],Ce[_e]=null,Ke=Ce[--_e],Ce[_e]=null,Qe=Ce[--_e],Ce[_e]=null}var Se=null,we=null,$=!1,Oe=null;function ta(e,t){var n=Ne(5,null,null,0);n.elementType="DELETED",n.stateNode=t,n.return=e,t=e.deletions,t===null?(e.deletions=[n],e.flags|=16):t.push(n)}function vi(e,t){switch(e.tag){case 5:var n=e.type;return t=t.nodeType!==1||n.toLowerCase()!==t.nodeName.toLowerCase()?null:t,t!==null?(e.stateNode=t,Se=e,we=at(t.firstChild),!0):!1;case 6:return t=e.pendingProps===""||t.nodeType!==3?null:t,t!==null?(e.stateNode=t,Se=e,we=null,!0):!1;case 13:return t=t.nodeType!==8?null:t,t!==null?(n=Tt!==null?{id:Qe,overflow:Ke}:null,e.memoizedState={dehydrated:t,treeContext:n,retryLane:1073741824},n=Ne(18,null,null,0),n.stateNode=t,n.return=e,e.child=n,Se=e,we=null,!0):!1;default:return!1}}function ku(e){return(e.mode&1)!==0&&(e.flags&128)===0}function xu(e){if($){var t=we;if(t){var n=t;if(!vi(e,t)){if(ku(e))throw Error(y(418));t=at(n.nextSibling);var r=Se;t&&vi(e,t)?ta(r,n):(e.flags=e.flags&-4097|2,$=!1,Se=e)}}else{if(ku(e))throw Error(y(418));e.flags=e.flags&-4097|2,$=!1,Se=e}}}function yi(e){for(e=e.return;e!==null&&e.tag!==5&&e.tag!==3&&e.tag!==13;)e=e.return;Se=e}function vr(e){if(e!==Se)return!1;if(!$)return yi(e),$=!0,!1;var t;if((t=e.tag!==3)&&!(t=e.tag!==5)&&(t=e.type,t=t!=="head"&&t!=="body"&&!yu(e.type,e.memoizedProps)),t&&(t=we)){if(ku(e))throw na(),Error(y(418));for(;t;)ta(e,t),t=at(t.nextSibling)}if(yi(e),e.tag===13){if(e=e.memoizedState,e=e!==null?e.dehydrated:null,!e)throw Error(y(317));e:{for(e=e.nextSibling,t=0;e;){if(e.nodeType===8){var n=e.data;if(n==="/$"){if(t===0){we=at(e.nextSibling);break e}t--}else n!=="$"&&n!=="$!"&&n!=="$?"||t++}e=e.nextSibling}we=null}}else we=Se?at(e.stateNode.nextSibling):null;return!0}function na(){for(var e=we;e;)e=at(e.nextSibling)}function un(){we=Se=null,$=!1}function so(e){Oe===null?Oe=[e]:Oe.push(e)}var qf=qe.ReactCurrentBatchConfig;function Sn(e,t,n){if(e=n.ref,e!==null&&typeof e!="function"&&typeof e!="object"){if(n._owner){if(n=n._owner,n){if(n.tag!==1)throw Error(y(309));var r=n.stateNode}if(!r)throw Error(y(147,e));var l=r,u=""+e;return t!==null&&t.ref!==null&&typeof t.ref=="function"&&t.ref._stringRef===u?t.ref:(t=function(o){var i=l.refs;o===null?delete i[u]:i[u]=o},t._stringRef=u,t)}if(typeof e!="string")throw Error(y(284));if(!n._owner)throw Error(y(290,e))}return e}function yr(e,t){throw e=Object.prototype.toString.call(t),Error(y(31,e==="[object Object]"?"object with keys {"+Object.keys(t).join(", ")+"}":e))}function gi(e){var t=e._init;return t(e._payload)}function ra(e){function t(c,a){if(e){var d=c.deletions;d===null?(c.deletions=[a],c.flags|=16):d.push(a)}}function n(c,a){if(!e)return null;for(;a!==null;)t(c,a),a=a.sibling;return null}function r(c,a){for(c=new Map;a!==null;)a.key!==null?c.set(a.key,a):c.set(a.index,a),a=a.sibling;return c}function l(c,a){return c=pt(c,a),c.index=0,c.sibling=null,c}function u(c,a,d){return c.index=d,e?(d=c.alternate,d!==null?(d=d.index,d<a?(c.flags|=2,a):d):(c.flags|=2,a)):(c.flags|=1048576,a)}function o(c){return e&&c.alternate===null&&(c.flags|=2),c}function i(c,a,d,v){return a===null||a.tag!==6?(a=Kl(d,c.mode,v),a.return=c,a):(a=l(a,d),a.return=c,a)}function s(c,a,d,v){var x=d.type;return x===At?h(c,a,d.props.children,v,d.key):a!==null&&(a.elementType===x||typeof x=="object"&&x!==null&&x.$$typeof===et&&gi(x)===a.type)?(v=l(a,d.props),v.ref=Sn(c,a,d),v.return=c,v):(v=Or(d.type,d.key,d.props,null,c.mode,v),v.ref=Sn(c,a,d),v.return=c,v)}function f(c,a,d,v){return a===null||a.tag!==4||a.stateNode.containerInfo!==d.containerInfo||a.stateNode.implementation!==d.implementation?(a=Yl(d,c.mode,v),a.return=c,a):(a=l(a,d.children||[]),a.return=c,a)}function h(c,a,d,v,x){return a===null||a.tag!==7?(a=zt(d,c.mode,v,x),a.return=c,a):(a=l(a,d),a.return=c,a)}function m(c,a,d){if(typeof a=="string"&&a!==""||typeof a=="number")return a=Kl(""+a,c.mode,d),a.return=c,a;if(typeof a=="object"&&a!==null){switch(a.$$typeof){case or:return d=Or(a.type,a.key,a.props,null,c.mode,d),d.ref=Sn(c,null,a),d.return=c,d;case $t:return a=Yl(a,c.mode,d),a.return=c,a;case et:var v=a._init;return m(c,v(a._payload),d)}if(Cn(a)||hn(a))return a=zt(a,c.mode,d,null),a.return=c,a;yr(c,a)}return null}function p(c,a,d,v){var x=a!==null?a.key:null;if(typeof d=="string"&&d!==""||typeof d=="number")return x!==null?null:i(c,a,""+d,v);if(typeof d=="object"&&d!==null){switch(d.$$typeof){case or:return d.key===x?s(c,a,d,v):null;case $t:return d.key===x?f(c,a,d,v):null;case et:return x=d._init,p(c,a,x(d._payload),v)}if(Cn(d)||hn(d))return x!==null?null:h(c,a,d,v,null);yr(c,d)}return null}function g(c,a,d,v,x){if(typeof v=="string"&&v!==""||typeof v=="number")return c=c.get(d)||null,i(a,c,""+v,x);if(typeof v=="object"&&v!==null){switch(v.$$typeof){case or:return c=c.get(v.key===null?d:v.key)||null,s(a,c,v,x);case $t:return c=c.get(v.key===null?d:v.key)||null,f(a,c,v,x);case et:var _=v._init;return g(c,a,d,_(v._payload),x)}if(Cn(v)||hn(v))return c=c.get(d)||null,h(a,c,v,x,null);yr(a,v)}return null}function S(c,a,d,v){for(var x=null,_=null,N=a,P=a=0,A=null;N!==null&&P<d.length;P++){N.index>P?(A=N,N=null):A=N.sibling;var j=p(c,N,d[P],v);if(j===null){N===null&&(N=A);break}e&&N&&j.alternate===null&&t(c,N),a=u(j,a,P),_===null?x=j:_.sibling=j,_=j,N=A}if(P===d.length)return n(c,N),$&&xt(c,P),x;if(N===null){for(;P<d.length;P++)N=m(c,d[P],v),N!==null&&(a=u(N,a,P),_===null?x=N:_.sibling=N,_=N);return $&&xt(c,P),x}for(N=r(c,N);P<d.length;P++)A=g(N,c,P,d[P],v),A!==null&&(e&&A.alternate!==null&&N.delete(A.key===null?P:A.key),a=u(A,a,P),_===null?x=A:_.sibling=A,_=A);return e&&N.forEach(function(de){return t(c,de)}),$&&xt(c,P),x}function k(c,a,d,v){var x=hn(d);if(typeof x!="function")throw Error(y(150));if(d=x.call(d),d==null)throw Error(y(151));for(var _=x=null,N=a,P=a=0,A=null,j=d.next();N!==null&&!j.done;P++,j=d.next()){N.index>P?(A=N,N=null):A=N.sibling;var de=p(c,N,j.value,v);if(de===null){N===null&&(N=A);break}e&&N&&de.alternate===null&&t(c,N),a=u(de,a,P),_===null?x=de:_.sibling=de,_=de,N=A}if(j.done)return n(c,N),$&&xt(c,P),x;if(N===null){for(;!j.done;P++,j=d.next())j=m(c,j.value,v),j!==null&&(a=u(j,a,P),_===null?x=j:_.sibling=j,_=j);return $&&xt(c,P),x}for(N=r(c,N);!j.done;P++,j=d.next())j=g(N,c,P,j.value,v),j!==null&&(e&&j.alternate!==null&&N.delete(j.key===null?P:j.key),a=u(j,a,P),_===null?x=j:_.sibling=j,_=j);return e&&N.forEach(function(w){return t(c,w)}),$&&xt(c,P),x}function D(c,a,d,v){if(typeof d=="object"&&d!==null&&d.type===At&&d.key===null&&(d=d.props.children),typeof d=="object"&&d!==null){switch(d.$$typeof){case or:e:{for(var x=d.key,_=a;_!==null;){if(_.key===x){if(x=d.type,x===At){if(_.tag===7){n(c,_.sibling),a=l(_,d.props.children),a.return=c,c=a;break e}}else if(_.elementType===x||typeof x=="object"&&x!==null&&x.$$typeof===et&&gi(x)===_.type){n(c,_.sibling),a=l(_,d.props),a.ref=Sn(c,_,d),a.return=c,c=a;break e}n(c,_);break}else t(c,_);_=_.sibling}d.type===At?(a=zt(d.props.children,c.mode,v,d.key),a.return=c,c=a):(v=Or(d.type,d.key,d.props,null,c.mode,v),v.ref=Sn(c,a,d),v.return=c,c=v)}return o(c);case $t:e:{for(_=d.key;a!==null;){if(a.key===_)if(a.tag===4&&a.stateNode.containerInfo===d.containerInfo&&a.stateNode.implementation===d.implementation){n(c,a.sibling),a=l(a,d.children||[]),a.return=c,c=a;break e}else{n(c,a);break}else t(c,a);a=a.sibling}a=Yl(d,c.mode,v),a.return=c,c=a}return o(c);case et:return _=d._init,D(c,a,_(d._payload),v)}if(Cn(d))return S(c,a,d,v);if(hn(d))return k(c,a,d,v);yr(c,d)}return typeof d=="string"&&d!==""||typeof d=="number"?(d=""+d,a!==null&&a.tag===6?(n(c,a.sibling),a=l(a,d),a.return=c,c=a):(n(c,a),a=Kl(d,c.mode,v),a.return=c,c=a),o(c)):n(c,a)}return D}var on=ra(!0),la=ra(!1),Yr=yt(null),Xr=null,Xt=null,ao=null;function co(){ao=Xt=Xr=null}function fo(e){var t=Yr.current;U(Yr),e._currentValue=t}function Eu(e,t,n){for(;e!==null;){var r=e.alternate;if((e.childLanes&t)!==t?(e.childLanes|=t,r!==null&&(r.childLanes|=t)):r!==null&&(r.childLanes&t)!==t&&(r.childLanes|=t),e===n)break;e=e.return}}function tn(e,t){Xr=e,ao=Xt=null,e=e.dependencies,e!==null&&e.firstContext!==null&&(e.lanes&t&&(me=!0),e.firstContext=null)}function ze(e){var t=e._currentValue;if(ao!==e)if(e={context:e,memoizedValue:t,next:null},Xt===null){if(Xr===null)throw Error(y(308));Xt=e,Xr.dependencies={lanes:0,firstContext:e}}else Xt=Xt.next=e;return t}var _t=null;function po(e){_t===null?_t=[e]:_t.push(e)}function ua(e,t,n,r){var l=t.interleaved;return l===null?(n.next=n,po(t)):(n.next=l.next,l.next=n),t.interleaved=n,Ze(e,r)}function Ze(e,t){e.lanes|=t;var n=e.alternate;for(n!==null&&(n.lanes|=t),n=e,e=e.return;e!==null;)e.childLanes|=t,n=e.alternate,n!==null&&(n.childLanes|=t),n=e,e=e.return;return n.tag===3?n.stateNode:null}var tt=!1;function mo(e){e.updateQueue={baseState:e.memoizedState,firstBaseUpdate:null,lastBaseUpdate:null,shared:{pending:null,interleaved:null,lanes:0},effects:null}}function oa(e,t){e=e.updateQueue,t.updateQueue===e&&(t.updateQueue={baseState:e.baseState,firstBaseUpdate:e.firstBaseUpdate,lastBaseUpdate:e.lastBaseUpdate,shared:e.shared,effects:e.effects})}function Ye(e,t){return{eventTime:e,lane:t,tag:0,payload:null,callback:null,next:null}}function ct(e,t,n){var r=e.updateQueue;if(r===null)return null;if(r=r.shared,O&2){var l=r.pending;return l===null?t.next=t:(t.next=l.next,l.next=t),r.pending=t,Ze(e,n)}return l=r.interleaved,l===null?(t.next=t,po(r)):(t.next=l.next,l.next=t),r.interleaved=t,Ze(e,n)}function Pr(e,t,n){if(t=t.updateQueue,t!==null&&(t=t.shared,(n&4194240)!==0)){var r=t.lanes;r&=e.pendingLanes,n|=r,t.lanes=n,qu(e,n)}}function wi(e,t){var n=e.updateQueue,r=e.alternate;if(r!==null&&(r=r.updateQueue,n===r)){var l=null,u=null;if(n=n.firstBaseUpdate,n!==null){do{var o={eventTime:n.eventTime,lane:n.lane,tag:n.tag,payload:n.payload,callback:n.callback,next:null};u===null?l=u=o:u=u.next=o,n=n.next}while(n!==null);u===null?l=u=t:u=u.next=t}else l=u=t;n={baseState:r.baseState,firstBaseUpdate:l,lastBaseUpdate:u,shared:r.shared,effects:r.effects},e.updateQueue=n;return}e=n.lastBaseUpdate,e===null?n.firstBaseUpdate=t:e.next=t,n.lastBaseUpdate=t}function Gr(e,t,n,r){var l=e.updateQueue;tt=!1;var u=l.firstBaseUpdate,o=l.lastBaseUpdate,i=l.shared.pending;if(i!==null){l.shared.pending=null;var s=i,f=s.next;s.next=null,o===null?u=f:o.next=f,o=s;var h=e.alternate;h!==null&&(h=h.updateQueue,i=h.lastBaseUpdate,i!==o&&(i===null?h.firstBaseUpdate=f:i.next=f,h.lastBaseUpdate=s))}if(u!==null){var m=l.baseState;o=0,h=f=s=null,i=u;do{var p=i.lane,g=i.eventTime;if((r&p)===p){h!==null&&(h=h.next={eventTime:g,lane:0,tag:i.tag,payload:i.payload,callback:i.callback,next:null});e:{var S=e,k=i;switch(p=t,g=n,k.tag){case 1:if(S=k.payload,typeof S=="function"){m=S.call(g,m,p);break e}m=S;break e;case 3:S.flags=S.flags&-65537|128;case 0:if(S=k.payload,p=typeof S=="function"?S.call(g,m,p):S,p==null)break e;m=H({},m,p);break e;case 2:tt=!0}}i.callback!==null&&i.lane!==0&&(e.flags|=64,p=l.effects,p===null?l.effects=[i]:p.push(i))}else g={eventTime:g,lane:p,tag:i.tag,payload:i.payload,callback:i.callback,next:null},h===null?(f=h=g,s=m):h=h.next=g,o|=p;if(i=i.next,i===null){if(i=l.shared.pending,i===null)break;p=i,i=p.next,p.next=null,l.lastBaseUpdate=p,l.shared.pending=null}}while(!0);if(h===null&&(s=m),l.baseState=s,l.firstBaseUpdate=f,l.lastBaseUpdate=h,t=l.shared.interleaved,t!==null){l=t;do o|=l.lane,l=l.next;while(l!==t)}else u===null&&(l.shared.lanes=0);Rt|=o,e.lanes=o,e.memoizedState=m}}function Si(e,t,n){if(e=t.effects,t.effects=null,e!==null)for(t=0;t<e.length;t++){var r=e[t],l=r.callback;if(l!==null){if(r.callback=null,r=n,typeof l!="function")throw Error(y(191,l));l.call(r)}}}var rr={},Ve=yt(rr),Yn=yt(rr),Xn=yt(rr);function Nt(e){if(e===rr)throw Error(y(174));return e}function ho(e,t){switch(I(Xn,t),I(Yn,e),I(Ve,rr),e=t.nodeType,e){case 9:case 11:t=(t=t.documentElement)?t.namespaceURI:ru(null,"");break;default:e=e===8?t.parentNode:t,t=e.namespaceURI||null,e=e.tagName,t=ru(t,e)}U(Ve),I(Ve,t)}function sn(){U(Ve),U(Yn),U(Xn)}function ia(e){Nt(Xn.current);var t=Nt(Ve.current),n=ru(t,e.type);t!==n&&(I(Yn,e),I(Ve,n))}function vo(e){Yn.current===e&&(U(Ve),U(Yn))}var V=yt(0);function Zr(e){for(var t=e;t!==null;){if(t.tag===13){var n=t.memoizedState;if(n!==null&&(n=n.dehydrated,n===null||n.data==="$?"||n.data==="$!"))return t}else if(t.tag===19&&t.memoizedProps.revealOrder!==void 0){if(t.flags&128)return t}else if(t.child!==null){t.child.return=t,t=t.child;continue}if(t===e)break;for(;t.sibling===null;){if(t.return===null||t.return===e)return null;t=t.return}t.sibling.return=t.return,t=t.sibling}return null}var Al=[];function yo(){for(var e=0;e<Al.length;e++)Al[e]._workInProgressVersionPrimary=null;Al.length=0}var zr=qe.ReactCurrentDispatcher,Vl=qe.ReactCurrentBatchConfig,jt=0,B=null,Z=null,q=null,Jr=!1,Rn=!1,Gn=0,bf=0;function re(){throw Error(y(321))}function go(e,t){if(t===null)return!1;for(var n=0;n<t.length&&n<e.length;n++)if(!Ie(e[n],t[n]))return!1;return!0}function wo(e,t,n,r,l,u){if(jt=u,B=t,t.memoizedState=null,t.updateQueue=null,t.lanes=0,zr.current=e===null||e.memoizedState===null?rd:ld,e=n(r,l),Rn){u=0;do{if(Rn=!1,Gn=0,25<=u)throw Error(y(301));u+=1,q=Z=null,t.updateQueue=null,zr.current=ud,e=n(r,l)}while(Rn)}if(zr.current=qr,t=Z!==null&&Z.next!==null,jt=0,q=Z=B=null,Jr=!1,t)throw Error(y(300));return e}function So(){var e=Gn!==0;return Gn=0,e}function Ue(){var e={memoizedState:null,baseState:null,baseQueue:null,queue:null,next:null};return q===null?B.memoizedState=q=e:q=q.next=e,q}function Le(){if(Z===null){var e=B.alternate;e=e!==null?e.memoizedState:null}else e=Z.next;var t=q===null?B.memoizedState:q.next;if(t!==null)q=t,Z=e;else{if(e===null)throw Error(y(310));Z=e,e={memoizedState:Z.memoizedState,baseState:Z.baseState,baseQueue:Z.baseQueue,queue:Z.queue,next:null},q===null?B.memoizedState=q=e:q=q.next=e}return q}function Zn(e,t){return typeof t=="function"?t(e):t}function Bl(e){var t=Le(),n=t.queue;if(n===null)throw Error(y(311));n.lastRenderedReducer=e;var r=Z,l=r.baseQueue,u=n.pending;if(u!==null){if(l!==null){var o=l.next;l.next=u.next,u.next=o}r.baseQueue=l=u,n.pending=null}if(l!==null){u=l.next,r=r.baseState;var i=o=null,s=null,f=u;do{var h=f.lane;if((jt&h)===h)s!==null&&(s=s.next={lane:0,action:f.action,hasEagerState:f.hasEagerState,eagerState:f.eagerState,next:null}),r=f.hasEagerState?f.eagerState:e(r,f.action);else{var m={lane:h,action:f.action,hasEagerState:f.hasEagerState,eagerState:f.eagerState,next:null};s===null?(i=s=m,o=r):s=s.next=m,B.lanes|=h,Rt|=h}f=f.next}while(f!==null&&f!==u);s===null?o=r:s.next=i,Ie(r,t.memoizedState)||(me=!0),t.memoizedState=r,t.baseState=o,t.baseQueue=s,n.lastRenderedState=r}if(e=n.interleaved,e!==null){l=e;do u=l.lane,B.lanes|=u,Rt|=u,l=l.next;while(l!==e)}else l===null&&(n.lanes=0);return[t.memoizedState,n.dispatch]}function Hl(e){var t=Le(),n=t.queue;if(n===null)throw Error(y(311));n.lastRenderedReducer=e;var r=n.dispatch,l=n.pending,u=t.memoizedState;if(l!==null){n.pending=null;var o=l=l.next;do u=e(u,o.action),o=o.next;while(o!==l);Ie(u,t.memoizedState)||(me=!0),t.memoizedState=u,t.baseQueue===null&&(t.baseState=u),n.lastRenderedState=u}return[u,r]}function sa(){}function aa(e,t){var n=B,r=Le(),l=t(),u=!Ie(r.memoizedState,l);if(u&&(r.memoizedState=l,me=!0),r=r.queue,ko(da.bind(null,n,r,e),[e]),r.getSnapshot!==t||u||q!==null&&q.memoizedState.tag&1){if(n.flags|=2048,Jn(9,fa.bind(null,n,r,l,t),void 0,null),b===null)throw Error(y(349));jt&30||ca(n,t,l)}return l}function ca(e,t,n){e.flags|=16384,e={getSnapshot:t,value:n},t=B.updateQueue,t===null?(t={lastEffect:null,stores:null},B.updateQueue=t,t.stores=[e]):(n=t.stores,n===null?t.stores=[e]:n.push(e))}function fa(e,t,n,r){t.value=n,t.getSnapshot=r,pa(t)&&ma(e)}function da(e,t,n){return n(function(){pa(t)&&ma(e)})}function pa(e){var t=e.getSnapshot;e=e.value;try{var n=t();return!Ie(e,n)}catch{return!0}}function ma(e){var t=Ze(e,1);t!==null&&De(t,e,1,-1)}function ki(e){var t=Ue();return typeof e=="function"&&(e=e()),t.memoizedState=t.baseState=e,e={pending:null,interleaved:null,lanes:0,dispatch:null,lastRenderedReducer:Zn,lastRenderedState:e},t.queue=e,e=e.dispatch=nd.bind(null,B,e),[t.memoizedState,e]}function Jn(e,t,n,r){return e={tag:e,create:t,destroy:n,deps:r,next:null},t=B.updateQueue,t===null?(t={lastEffect:null,stores:null},B.updateQueue=t,t.lastEffect=e.next=e):(n=t.lastEffect,n===null?t.lastEffect=e.next=e:(r=n.next,n.next=e,e.next=r,t.lastEffect=e)),e}function ha(){return Le().memoizedState}function Lr(e,t,n,r){var l=Ue();B.flags|=e,l.memoizedState=Jn(1|t,n,void 0,r===void 0?null:r)}function fl(e,t,n,r){var l=Le();r=r===void 0?null:r;var u=void 0;if(Z!==null){var o=Z.memoizedState;if(u=o.destroy,r!==null&&go(r,o.deps)){l.memoizedState=Jn(t,n,u,r);return}}B.flags|=e,l.memoizedState=Jn(1|t,n,u,r)}function xi(e,t){return Lr(8390656,8,e,t)}function ko(e,t){return fl(2048,8,e,t)}function va(e,t){return fl(4,2,e,t)}function ya(e,t){return fl(4,4,e,t)}function ga(e,t){if(typeof t=="function")return e=e(),t(e),function(){t(null)};if(t!=null)return e=e(),t.current=e,function(){t.current=null}}function wa(e,t,n){return n=n!=null?n.concat([e]):null,fl(4,4,ga.bind(null,t,e),n)}function xo(){}function Sa(e,t){var n=Le();t=t===void 0?null:t;var r=n.memoizedState;return r!==null&&t!==null&&go(t,r[1])?r[0]:(n.memoizedState=[e,t],e)}function ka(e,t){var n=Le();t=t===void 0?null:t;var r=n.memoizedState;return r!==null&&t!==null&&go(t,r[1])?r[0]:(e=e(),n.memoizedState=[e,t],e)}function xa(e,t,n){return jt&21?(Ie(n,t)||(n=Ps(),B.lanes|=n,Rt|=n,e.baseState=!0),t):(e.baseState&&(e.baseState=!1,me=!0),e.memoizedState=n)}function ed(e,t){var n=M;M=n!==0&&4>n?n:4,e(!0);var r=Vl.transition;Vl.transition={};try{e(!1),t()}finally{M=n,Vl.transition=r}}function Ea(){return Le().memoizedState}function td(e,t,n){var r=dt(e);if(n={lane:r,action:n,hasEagerState:!1,eagerState:null,next:null},Ca(e))_a(t,n);else if(n=ua(e,t,n,r),n!==null){var l=ae();De(n,e,r,l),Na(n,t,r)}}function nd(e,t,n){var r=dt(e),l={lane:r,action:n,hasEagerState:!1,eagerState:null,next:null};if(Ca(e))_a(t,l);else{var u=e.alternate;if(e.lanes===0&&(u===null||u.lanes===0)&&(u=t.lastRenderedReducer,u!==null))try{var o=t.lastRenderedState,i=u(o,n);if(l.hasEagerState=!0,l.eagerState=i,Ie(i,o)){var s=t.interleaved;s===null?(l.next=l,po(t)):(l.next=s.next,s.next=l),t.interleaved=l;return}}catch{}finally{}n=ua(e,t,l,r),n!==null&&(l=ae(),De(n,e,r,l),Na(n,t,r))}}function Ca(e){var t=e.alternate;return e===B||t!==null&&t===B}function _a(e,t){Rn=Jr=!0;var n=e.pending;n===null?t.next=t:(t.next=n.next,n.next=t),e.pending=t}function Na(e,t,n){if(n&4194240){var r=t.lanes;r&=e.pendingLanes,n|=r,t.lanes=n,qu(e,n)}}var qr={readContext:ze,useCallback:re,useContext:re,useEffect:re,useImperativeHandle:re,useInsertionEffect:re,useLayoutEffect:re,useMemo:re,useReducer:re,useRef:re,useState:re,useDebugValue:re,useDeferredValue:re,useTransition:re,useMutableSource:re,useSyncExternalStore:re,useId:re,unstable_isNewReconciler:!1},rd={readContext:ze,useCallback:function(e,t){return Ue().memoizedState=[e,t===void 0?null:t],e},useContext:ze,useEffect:xi,useImperativeHandle:function(e,t,n){return n=n!=null?n.concat([e]):null,Lr(4194308,4,ga.bind(null,t,e),n)},useLayoutEffect:function(e,t){return Lr(4194308,4,e,t)},useInsertionEffect:function(e,t){return Lr(4,2,e,t)},useMemo:function(e,t){var n=Ue();return t=t===void 0?null:t,e=e(),n.memoizedState=[e,t],e},useReducer:function(e,t,n){var r=Ue();return t=n!==void 0?n(t):t,r.memoizedState=r.baseState=t,e={pending:null,interleaved:null,lanes:0,dispatch:null,lastRenderedReducer:e,lastRenderedState:t},r.queue=e,e=e.dispatch=td.bind(null,B,e),[r.memoizedState,e]},useRef:function(e){var t=Ue();return e={current:e},t.memoizedState=e},useState:ki,useDebugValue:xo,useDeferredValue:function(e){return Ue().memoizedState=e},useTransition:function(){var e=ki(!1),t=e[0];return e=ed.bind(null,e[1]),Ue().memoizedState=e,[t,e]},useMutableSource:function(){},useSyncExternalStore:function(e,t,n){var r=B,l=Ue();if($){if(n===void 0)throw Error(y(407));n=n()}else{if(n=t(),b===null)throw Error(y(349));jt&30||ca(r,t,n)}l.memoizedState=n;var u={value:n,getSnapshot:t};return l.queue=u,xi(da.bind(null,r,u,e),[e]),r.flags|=2048,Jn(9,fa.bind(null,r,u,n,t),void 0,null),n},useId:function(){var e=Ue(),t=b.identifierPrefix;if($){var n=Ke,r=Qe;n=(r&~(1<<32-Me(r)-1)).toString(32)+n,t=":"+t+"R"+n,n=Gn++,0<n&&(t+="H"+n.toString(32)),t+=":"}else n=bf++,t=":"+t+"r"+n.toString(32)+":";return e.memoizedState=t},unstable_isNewReconciler:!1},ld={readContext:ze,useCallback:Sa,useContext:ze,useEffect:ko,useImperativeHandle:wa,useInsertionEffect:va,useLayoutEffect:ya,useMemo:ka,useReducer:Bl,useRef:ha,useState:function(){return Bl(Zn)},useDebugValue:xo,useDeferredValue:function(e){var t=Le();return xa(t,Z.memoizedState,e)},useTransition:function(){var e=Bl(Zn)[0],t=Le().memoizedState;return[e,t]},useMutableSource:sa,useSyncExternalStore:aa,useId:Ea,unstable_isNewReconciler:!1},ud={readContext:ze,useCallback:Sa,useContext:ze,useEffect:ko,useImperativeHandle:wa,useInsertionEffect:va,useLayoutEffect:ya,useMemo:ka,useReducer:Hl,useRef:ha,useState:function(){return Hl(Zn)},useDebugValue:xo,useDeferredValue:function(e){var t=Le();return Z===null?t.memoizedState=e:xa(t,Z.memoizedState,e)},useTransition:function(){var e=Hl(Zn)[0],t=Le().memoizedState;return[e,t]},useMutableSource:sa,useSyncExternalStore:aa,useId:Ea,unstable_isNewReconciler:!1};function je(e,t){if(e&&e.defaultProps){t=H({},t),e=e.defaultProps;for(var n in e)t[n]===void 0&&(t[n]=e[n]);return t}return t}function Cu(e,t,n,r){t=e.memoizedState,n=n(r,t),n=n==null?t:H({},t,n),e.memoizedState=n,e.lanes===0&&(e.updateQueue.baseState=n)}var dl={isMounted:function(e){return(e=e._reactInternals)?Dt(e)===e:!1},enqueueSetState:function(e,t,n){e=e._reactInternals;var r=ae(),l=dt(e),u=Ye(r,l);u.payload=t,n!=null&&(u.callback=n),t=ct(e,u,l),t!==null&&(De(t,e,l,r),Pr(t,e,l))},enqueueReplaceState:function(e,t,n){e=e._reactInternals;var r=ae(),l=dt(e),u=Ye(r,l);u.tag=1,u.payload=t,n!=null&&(u.callback=n),t=ct(e,u,l),t!==null&&(De(t,e,l,r),Pr(t,e,l))},enqueueForceUpdate:function(e,t){e=e._reactInternals;var n=ae(),r=dt(e),l=Ye(n,r);l.tag=2,t!=null&&(l.callback=t),t=ct(e,l,r),t!==null&&(De(t,e,r,n),Pr(t,e,r))}};function Ei(e,t,n,r,l,u,o){return e=e.stateNode,typeof e.shouldComponentUpdate=="function"?e.shouldComponentUpdate(r,u,o):t.prototype&&t.prototype.isPureReactComponent?!Hn(n,r)||!Hn(l,u):!0}function Pa(e,t,n){var r=!1,l=ht,u=t.contextType;return typeof u=="object"&&u!==null?u=ze(u):(l=ve(t)?Lt:oe.current,r=t.contextTypes,u=(r=r!=null)?ln(e,l):ht),t=new t(n,u),e.memoizedState=t.state!==null&&t.state!==void 0?t.state:null,t.updater=dl,e.stateNode=t,t._reactInternals=e,r&&(e=e.stateNode,e.__reactInternalMemoizedUnmaskedChildContext=l,e.__reactInternalMemoizedMaskedChildContext=u),t}function Ci(e,t,n,r){e=t.state,typeof t.componentWillReceiveProps=="function"&&t.componentWillReceiveProps(n,r),typeof t.UNSAFE_componentWillReceiveProps=="function"&&t.UNSAFE_componentWillReceiveProps(n,r),t.state!==e&&dl.enqueueReplaceState(t,t.state,null)}function _u(e,t,n,r){var l=e.stateNode;l.props=n,l.state=e.memoizedState,l.refs={},mo(e);var u=t.contextType;typeof u=="object"&&u!==null?l.context=ze(u):(u=ve(t)?Lt:oe.current,l.context=ln(e,u)),l.state=e.memoizedState,u=t.getDerivedStateFromProps,typeof u=="function"&&(Cu(e,t,u,n),l.state=e.memoizedState),typeof t.getDerivedStateFromProps=="function"||typeof l.getSnapshotBeforeUpdate=="function"||typeof l.UNSAFE_componentWillMount!="function"&&typeof l.componentWillMount!="function"||(t=l.state,typeof l.componentWillMount=="function"&&l.componentWillMount(),typeof l.UNSAFE_componentWillMount=="function"&&l.UNSAFE_componentWillMount(),t!==l.state&&dl.enqueueReplaceState(l,l.state,null),Gr(e,n,l,r),l.state=e.memoizedState),typeof l.componentDidMount=="function"&&(e.flags|=4194308)}function an(e,t){try{var n="",r=t;do n+=Rc(r),r=r.return;while(r);var l=n}catch(u){l=`
-Error generating stack: `+u.message+`
-`+u.stack}return{value:e,source:t,stack:l,digest:null}}function Wl(e,t,n){return{value:e,source:null,stack:n??null,digest:t??null}}function Nu(e,t){try{console.error(t.value)}catch(n){setTimeout(function(){throw n})}}var od=typeof WeakMap=="function"?WeakMap:Map;function za(e,t,n){n=Ye(-1,n),n.tag=3,n.payload={element:null};var r=t.value;return n.callback=function(){el||(el=!0,Iu=r),Nu(e,t)},n}function La(e,t,n){n=Ye(-1,n),n.tag=3;var r=e.type.getDerivedStateFromError;if(typeof r=="function"){var l=t.value;n.payload=function(){return r(l)},n.callback=function(){Nu(e,t)}}var u=e.stateNode;return u!==null&&typeof u.componentDidCatch=="function"&&(n.callback=function(){Nu(e,t),typeof r!="function"&&(ft===null?ft=new Set([this]):ft.add(this));var o=t.stack;this.componentDidCatch(t.value,{componentStack:o!==null?o:""})}),n}function _i(e,t,n){var r=e.pingCache;if(r===null){r=e.pingCache=new od;var l=new Set;r.set(t,l)}else l=r.get(t),l===void 0&&(l=new Set,r.set(t,l));l.has(n)||(l.add(n),e=Sd.bind(null,e,t,n),t.then(e,e))}function Ni(e){do{var t;if((t=e.tag===13)&&(t=e.memoizedState,t=t!==null?t.dehydrated!==null:!0),t)return e;e=e.return}while(e!==null);return null}function Pi(e,t,n,r,l){return e.mode&1?(e.flags|=65536,e.lanes=l,e):(e===t?e.flags|=65536:(e.flags|=128,n.flags|=131072,n.flags&=-52805,n.tag===1&&(n.alternate===null?n.tag=17:(t=Ye(-1,1),t.tag=2,ct(n,t,1))),n.lanes|=1),e)}var id=qe.ReactCurrentOwner,me=!1;function se(e,t,n,r){t.child=e===null?la(t,null,n,r):on(t,e.child,n,r)}function zi(e,t,n,r,l){n=n.render;var u=t.ref;return tn(t,l),r=wo(e,t,n,r,u,l),n=So(),e!==null&&!me?(t.updateQueue=e.updateQueue,t.flags&=-2053,e.lanes&=~l,Je(e,t,l)):($&&n&&oo(t),t.flags|=1,se(e,t,r,l),t.child)}function Li(e,t,n,r,l){if(e===null){var u=n.type;return typeof u=="function"&&!To(u)&&u.defaultProps===void 0&&n.compare===null&&n.defaultProps===void 0?(t.tag=15,t.type=u,Ta(e,t,u,r,l)):(e=Or(n.type,null,r,t,t.mode,l),e.ref=t.ref,e.return=t,t.child=e)}if(u=e.child,!(e.lanes&l)){var o=u.memoizedProps;if(n=n.compare,n=n!==null?n:Hn,n(o,r)&&e.ref===t.ref)return Je(e,t,l)}return t.flags|=1,e=pt(u,r),e.ref=t.ref,e.return=t,t.child=e}function Ta(e,t,n,r,l){if(e!==null){var u=e.memoizedProps;if(Hn(u,r)&&e.ref===t.ref)if(me=!1,t.pendingProps=r=u,(e.lanes&l)!==0)e.flags&131072&&(me=!0);else return t.lanes=e.lanes,Je(e,t,l)}return Pu(e,t,n,r,l)}function ja(e,t,n){var r=t.pendingProps,l=r.children,u=e!==null?e.memoizedState:null;if(r.mode==="hidden")if(!(t.mode&1))t.memoizedState={baseLanes:0,cachePool:null,transitions:null},I(Zt,ge),ge|=n;else{if(!(n&1073741824))return e=u!==null?u.baseLanes|n:n,t.lanes=t.childLanes=1073741824,t.memoizedState={baseLanes:e,cachePool:null,transitions:null},t.updateQueue=null,I(Zt,ge),ge|=e,null;t.memoizedState={baseLanes:0,cachePool:null,transitions:null},r=u!==null?u.baseLanes:n,I(Zt,ge),ge|=r}else u!==null?(r=u.baseLanes|n,t.memoizedState=null):r=n,I(Zt,ge),ge|=r;return se(e,t,l,n),t.child}function Ra(e,t){var n=t.ref;(e===null&&n!==null||e!==null&&e.ref!==n)&&(t.flags|=512,t.flags|=2097152)}function Pu(e,t,n,r,l){var u=ve(n)?Lt:oe.current;return u=ln(t,u),tn(t,l),n=wo(e,t,n,r,u,l),r=So(),e!==null&&!me?(t.updateQueue=e.updateQueue,t.flags&=-2053,e.lanes&=~l,Je(e,t,l)):($&&r&&oo(t),t.flags|=1,se(e,t,n,l),t.child)}function Ti(e,t,n,r,l){if(ve(n)){var u=!0;Wr(t)}else u=!1;if(tn(t,l),t.stateNode===null)Tr(e,t),Pa(t,n,r),_u(t,n,r,l),r=!0;else if(e===null){var o=t.stateNode,i=t.memoizedProps;o.props=i;var s=o.context,f=n.contextType;typeof f=="object"&&f!==null?f=ze(f):(f=ve(n)?Lt:oe.current,f=ln(t,f));var h=n.getDerivedStateFromProps,m=typeof h=="function"||typeof o.getSnapshotBeforeUpdate=="function";m||typeof o.UNSAFE_componentWillReceiveProps!="function"&&typeof o.componentWillReceiveProps!="function"||(i!==r||s!==f)&&Ci(t,o,r,f),tt=!1;var p=t.memoizedState;o.state=p,Gr(t,r,o,l),s=t.memoizedState,i!==r||p!==s||he.current||tt?(typeof h=="function"&&(Cu(t,n,h,r),s=t.memoizedState),(i=tt||Ei(t,n,i,r,p,s,f))?(m||typeof o.UNSAFE_componentWillMount!="function"&&typeof o.componentWillMount!="function"||(typeof o.componentWillMount=="function"&&o.componentWillMount(),typeof o.UNSAFE_componentWillMount=="function"&&o.UNSAFE_componentWillMount()),typeof o.componentDidMount=="function"&&(t.flags|=4194308)):(typeof o.componentDidMount=="function"&&(t.flags|=4194308),t.memoizedProps=r,t.memoizedState=s),o.props=r,o.state=s,o.context=f,r=i):(typeof o.componentDidMount=="function"&&(t.flags|=4194308),r=!1)}else{o=t.stateNode,oa(e,t),i=t.memoizedProps,f=t.type===t.elementType?i:je(t.type,i),o.props=f,m=t.pendingProps,p=o.context,s=n.contextType,typeof s=="object"&&s!==null?s=ze(s):(s=ve(n)?Lt:oe.current,s=ln(t,s));var g=n.getDerivedStateFromProps;(h=typeof g=="function"||typeof o.getSnapshotBeforeUpdate=="function")||typeof o.UNSAFE_componentWillReceiveProps!="function"&&typeof o.componentWillReceiveProps!="function"||(i!==m||p!==s)&&Ci(t,o,r,s),tt=!1,p=t.memoizedState,o.state=p,Gr(t,r,o,l);var S=t.memoizedState;i!==m||p!==S||he.current||tt?(typeof g=="function"&&(Cu(t,n,g,r),S=t.memoizedState),(f=tt||Ei(t,n,f,r,p,S,s)||!1)?(h||typeof o.UNSAFE_componentWillUpdate!="function"&&typeof o.componentWillUpdate!="function"||(typeof o.componentWillUpdate=="function"&&o.componentWillUpdate(r,S,s),typeof o.UNSAFE_componentWillUpdate=="function"&&o.UNSAFE_componentWillUpdate(r,S,s)),typeof o.componentDidUpdate=="function"&&(t.flags|=4),typeof o.getSnapshotBeforeUpdate=="function"&&(t.flags|=1024)):(typeof o.componentDidUpdate!="function"||i===e.memoizedProps&&p===e.memoizedState||(t.flags|=4),typeof o.getSnapshotBeforeUpdate!="function"||i===e.memoizedProps&&p===e.memoizedState||(t.flags|=1024),t.memoizedProps=r,t.memoizedState=S),o.props=r,o.state=S,o.context=s,r=f):(typeof o.componentDidUpdate!="function"||i===e.memoizedProps&&p===e.memoizedState||(t.flags|=4),typeof o.getSnapshotBeforeUpdate!="function"||i===e.memoizedProps&&p===e.memoizedState||(t.flags|=1024),r=!1)}return zu(e,t,n,r,u,l)}function zu(e,t,n,r,l,u){Ra(e,t);var o=(t.flags&128)!==0;if(!r&&!o)return l&&hi(t,n,!1),Je(e,t,u);r=t.stateNode,id.current=t;var i=o&&typeof n.getDerivedStateFromError!="function"?null:r.render();return t.flags|=1,e!==null&&o?(t.child=on(t,e.child,null,u),t.child=on(t,null,i,u)):se(e,t,i,u),t.memoizedState=r.state,l&&hi(t,n,!0),t.child}function Oa(e){var t=e.stateNode;t.pendingContext?mi(e,t.pendingContext,t.pendingContext!==t.context):t.context&&mi(e,t.context,!1),ho(e,t.containerInfo)}function ji(e,t,n,r,l){return un(),so(l),t.flags|=256,se(e,t,n,r),t.child}var Lu={dehydrated:null,treeContext:null,retryLane:0};function Tu(e){return{baseLanes:e,cachePool:null,transitions:null}}function Ma(e,t,n){var r=t.pendingProps,l=V.current,u=!1,o=(t.flags&128)!==0,i;if((i=o)||(i=e!==null&&e.memoizedState===null?!1:(l&2)!==0),i?(u=!0,t.flags&=-129):(e===null||e.memoizedState!==null)&&(l|=1),I(V,l&1),e===null)return xu(t),e=t.memoizedState,e!==null&&(e=e.dehydrated,e!==null)?(t.mode&1?e.data==="$!"?t.lanes=8:t.lanes=1073741824:t.lanes=1,null):(o=r.children,e=r.fallback,u?(r=t.mode,u=t.child,o={mode:"hidden",children:o},!(r&1)&&u!==null?(u.childLanes=0,u.pendingProps=o):u=hl(o,r,0,null),e=zt(e,r,n,null),u.return=t,e.return=t,u.sibling=e,t.child=u,t.child.memoizedState=Tu(n),t.memoizedState=Lu,e):Eo(t,o));if(l=e.memoizedState,l!==null&&(i=l.dehydrated,i!==null))return sd(e,t,o,r,i,l,n);if(u){u=r.fallback,o=t.mode,l=e.child,i=l.sibling;var s={mode:"hidden",children:r.children};return!(o&1)&&t.child!==l?(r=t.child,r.childLanes=0,r.pendingProps=s,t.deletions=null):(r=pt(l,s),r.subtreeFlags=l.subtreeFlags&14680064),i!==null?u=pt(i,u):(u=zt(u,o,n,null),u.flags|=2),u.return=t,r.return=t,r.sibling=u,t.child=r,r=u,u=t.child,o=e.child.memoizedState,o=o===null?Tu(n):{baseLanes:o.baseLanes|n,cachePool:null,transitions:o.transitions},u.memoizedState=o,u.childLanes=e.childLanes&~n,t.memoizedState=Lu,r}return u=e.child,e=u.sibling,r=pt(u,{mode:"visible",children:r.children}),!(t.mode&1)&&(r.lanes=n),r.return=t,r.sibling=null,e!==null&&(n=t.deletions,n===null?(t.deletions=[e],t.flags|=16):n.push(e)),t.child=r,t.memoizedState=null,r}function Eo(e,t){return t=hl({mode:"visible",children:t},e.mode,0,null),t.return=e,e.child=t}function gr(e,t,n,r){return r!==null&&so(r),on(t,e.child,null,n),e=Eo(t,t.pendingProps.children),e.flags|=2,t.memoizedState=null,e}function sd(e,t,n,r,l,u,o){if(n)return t.flags&256?(t.flags&=-257,r=Wl(Error(y(422))),gr(e,t,o,r)):t.memoizedState!==null?(t.child=e.child,t.flags|=128,null):(u=r.fallback,l=t.mode,r=hl({mode:"visible",children:r.children},l,0,null),u=zt(u,l,o,null),u.flags|=2,r.return=t,u.return=t,r.sibling=u,t.child=r,t.mode&1&&on(t,e.child,null,o),t.child.memoizedState=Tu(o),t.memoizedState=Lu,u);if(!(t.mode&1))return gr(e,t,o,null);if(l.data==="$!"){if(r=l.nextSibling&&l.nextSibling.dataset,r)var i=r.dgst;return r=i,u=Error(y(419)),r=Wl(u,r,void 0),gr(e,t,o,r)}if(i=(o&e.childLanes)!==0,me||i){if(r=b,r!==null){switch(o&-o){case 4:l=2;break;case 16:l=8;break;case 64:case 128:case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:case 4194304:case 8388608:case 16777216:case 33554432:case 67108864:l=32;break;case 536870912:l=268435456;break;default:l=0}l=l&(r.suspendedLanes|o)?0:l,l!==0&&l!==u.retryLane&&(u.retryLane=l,Ze(e,l),De(r,e,l,-1))}return Lo(),r=Wl(Error(y(421))),gr(e,t,o,r)}return l.data==="$?"?(t.flags|=128,t.child=e.child,t=kd.bind(null,e),l._reactRetry=t,null):(e=u.treeContext,we=at(l.nextSibling),Se=t,$=!0,Oe=null,e!==null&&(Ce[_e++]=Qe,Ce[_e++]=Ke,Ce[_e++]=Tt,Qe=e.id,Ke=e.overflow,Tt=t),t=Eo(t,r.children),t.flags|=4096,t)}function Ri(e,t,n){e.lanes|=t;var r=e.alternate;r!==null&&(r.lanes|=t),Eu(e.return,t,n)}function Ql(e,t,n,r,l){var u=e.memoizedState;u===null?e.memoizedState={isBackwards:t,rendering:null,renderingStartTime:0,last:r,tail:n,tailMode:l}:(u.isBackwards=t,u.rendering=null,u.renderingStartTime=0,u.last=r,u.tail=n,u.tailMode=l)}function Da(e,t,n){var r=t.pendingProps,l=r.revealOrder,u=r.tail;if(se(e,t,r.children,n),r=V.current,r&2)r=r&1|2,t.flags|=128;else{if(e!==null&&e.flags&128)e:for(e=t.child;e!==null;){if(e.tag===13)e.memoizedState!==null&&Ri(e,n,t);else if(e.tag===19)Ri(e,n,t);else if(e.child!==null){e.child.return=e,e=e.child;continue}if(e===t)break e;for(;e.sibling===null;){if(e.return===null||e.return===t)break e;e=e.return}e.sibling.return=e.return,e=e.sibling}r&=1}if(I(V,r),!(t.mode&1))t.memoizedState=null;else switch(l){case"forwards":for(n=t.child,l=null;n!==null;)e=n.alternate,e!==null&&Zr(e)===null&&(l=n),n=n.sibling;n=l,n===null?(l=t.child,t.child=null):(l=n.sibling,n.sibling=null),Ql(t,!1,l,n,u);break;case"backwards":for(n=null,l=t.child,t.child=null;l!==null;){if(e=l.alternate,e!==null&&Zr(e)===null){t.child=l;break}e=l.sibling,l.sibling=n,n=l,l=e}Ql(t,!0,n,null,u);break;case"together":Ql(t,!1,null,null,void 0);break;default:t.memoizedState=null}return t.child}function Tr(e,t){!(t.mode&1)&&e!==null&&(e.alternate=null,t.alternate=null,t.flags|=2)}function Je(e,t,n){if(e!==null&&(t.dependencies=e.dependencies),Rt|=t.lanes,!(n&t.childLanes))return null;if(e!==null&&t.child!==e.child)throw Error(y(153));if(t.child!==null){for(e=t.child,n=pt(e,e.pendingProps),t.child=n,n.return=t;e.sibling!==null;)e=e.sibling,n=n.sibling=pt(e,e.pendingProps),n.return=t;n.sibling=null}return t.child}function ad(e,t,n){switch(t.tag){case 3:Oa(t),un();break;case 5:ia(t);break;case 1:ve(t.type)&&Wr(t);break;case 4:ho(t,t.stateNode.containerInfo);break;case 10:var r=t.type._context,l=t.memoizedProps.value;I(Yr,r._currentValue),r._currentValue=l;break;case 13:if(r=t.memoizedState,r!==null)return r.dehydrated!==null?(I(V,V.current&1),t.flags|=128,null):n&t.child.childLanes?Ma(e,t,n):(I(V,V.current&1),e=Je(e,t,n),e!==null?e.sibling:null);I(V,V.current&1);break;case 19:if(r=(n&t.childLanes)!==0,e.flags&128){if(r)return Da(e,t,n);t.flags|=128}if(l=t.memoizedState,l!==null&&(l.rendering=null,l.tail=null,l.lastEffect=null),I(V,V.current),r)break;return null;case 22:case 23:return t.lanes=0,ja(e,t,n)}return Je(e,t,n)}var Ia,ju,Fa,Ua;Ia=function(e,t){for(var n=t.child;n!==null;){if(n.tag===5||n.tag===6)e.appendChild(n.stateNode);else if(n.tag!==4&&n.child!==null){n.child.return=n,n=n.child;continue}if(n===t)break;for(;n.sibling===null;){if(n.return===null||n.return===t)return;n=n.return}n.sibling.return=n.return,n=n.sibling}};ju=function(){};Fa=function(e,t,n,r){var l=e.memoizedProps;if(l!==r){e=t.stateNode,Nt(Ve.current);var u=null;switch(n){case"input":l=bl(e,l),r=bl(e,r),u=[];break;case"select":l=H({},l,{value:void 0}),r=H({},r,{value:void 0}),u=[];break;case"textarea":l=nu(e,l),r=nu(e,r),u=[];break;default:typeof l.onClick!="function"&&typeof r.onClick=="function"&&(e.onclick=Br)}lu(n,r);var o;n=null;for(f in l)if(!r.hasOwnProperty(f)&&l.hasOwnProperty(f)&&l[f]!=null)if(f==="style"){var i=l[f];for(o in i)i.hasOwnProperty(o)&&(n||(n={}),n[o]="")}else f!=="dangerouslySetInnerHTML"&&f!=="children"&&f!=="suppressContentEditableWarning"&&f!=="suppressHydrationWarning"&&f!=="autoFocus"&&(In.hasOwnProperty(f)?u||(u=[]):(u=u||[]).push(f,null));for(f in r){var s=r[f];if(i=l!=null?l[f]:void 0,r.hasOwnProperty(f)&&s!==i&&(s!=null||i!=null))if(f==="style")if(i){for(o in i)!i.hasOwnProperty(o)||s&&s.hasOwnProperty(o)||(n||(n={}),n[o]="");for(o in s)s.hasOwnProperty(o)&&i[o]!==s[o]&&(n||(n={}),n[o]=s[o])}else n||(u||(u=[]),u.push(f,n)),n=s;else f==="dangerouslySetInnerHTML"?(s=s?s.__html:void 0,i=i?i.__html:void 0,s!=null&&i!==s&&(u=u||[]).push(f,s)):f==="children"?typeof s!="string"&&typeof s!="number"||(u=u||[]).push(f,""+s):f!=="suppressContentEditableWarning"&&f!=="suppressHydrationWarning"&&(In.hasOwnProperty(f)?(s!=null&&f==="onScroll"&&F("scroll",e),u||i===s||(u=[])):(u=u||[]).push(f,s))}n&&(u=u||[]).push("style",n);var f=u;(t.updateQueue=f)&&(t.flags|=4)}};Ua=function(e,t,n,r){n!==r&&(t.flags|=4)};function kn(e,t){if(!$)switch(e.tailMode){case"hidden":t=e.tail;for(var n=null;t!==null;)t.alternate!==null&&(n=t),t=t.sibling;n===null?e.tail=null:n.sibling=null;break;case"collapsed":n=e.tail;for(var r=null;n!==null;)n.alternate!==null&&(r=n),n=n.sibling;r===null?t||e.tail===null?e.tail=null:e.tail.sibling=null:r.sibling=null}}function le(e){var t=e.alternate!==null&&e.alternate.child===e.child,n=0,r=0;if(t)for(var l=e.child;l!==null;)n|=l.lanes|l.childLanes,r|=l.subtreeFlags&14680064,r|=l.flags&14680064,l.return=e,l=l.sibling;else for(l=e.child;l!==null;)n|=l.lanes|l.childLanes,r|=l.subtreeFlags,r|=l.flags,l.return=e,l=l.sibling;return e.subtreeFlags|=r,e.childLanes=n,t}function cd(e,t,n){var r=t.pendingProps;switch(io(t),t.tag){case 2:case 16:case 15:case 0:case 11:case 7:case 8:case 12:case 9:case 14:return le(t),null;case 1:return ve(t.type)&&Hr(),le(t),null;case 3:return r=t.stateNode,sn(),U(he),U(oe),yo(),r.pendingContext&&(r.context=r.pendingContext,r.pendingContext=null),(e===null||e.child===null)&&(vr(t)?t.flags|=4:e===null||e.memoizedState.isDehydrated&&!(t.flags&256)||(t.flags|=1024,Oe!==null&&($u(Oe),Oe=null))),ju(e,t),le(t),null;case 5:vo(t);var l=Nt(Xn.current);if(n=t.type,e!==null&&t.stateNode!=null)Fa(e,t,n,r,l),e.ref!==t.ref&&(t.flags|=512,t.flags|=2097152);else{if(!r){if(t.stateNode===null)throw Error(y(166));return le(t),null}if(e=Nt(Ve.current),vr(t)){r=t.stateNode,n=t.type;var u=t.memoizedProps;switch(r[$e]=t,r[Kn]=u,e=(t.mode&1)!==0,n){case"dialog":F("cancel",r),F("close",r);break;case"iframe":case"object":case"embed":F("load",r);break;case"video":case"audio":for(l=0;l<Nn.length;l++)F(Nn[l],r);break;case"source":F("error",r);break;case"img":case"image":case"link":F("error",r),F("load",r);break;case"details":F("toggle",r);break;case"input":Vo(r,u),F("invalid",r);break;case"select":r._wrapperState={wasMultiple:!!u.multiple},F("invalid",r);break;case"textarea":Ho(r,u),F("invalid",r)}lu(n,u),l=null;for(var o in u)if(u.hasOwnProperty(o)){var i=u[o];o==="children"?typeof i=="string"?r.textContent!==i&&(u.suppressHydrationWarning!==!0&&hr(r.textContent,i,e),l=["children",i]):typeof i=="number"&&r.textContent!==""+i&&(u.suppressHydrationWarning!==!0&&hr(r.textContent,i,e),l=["children",""+i]):In.hasOwnProperty(o)&&i!=null&&o==="onScroll"&&F("scroll",r)}switch(n){case"input":ir(r),Bo(r,u,!0);break;case"textarea":ir(r),Wo(r);break;case"select":case"option":break;default:typeof u.onClick=="function"&&(r.onclick=Br)}r=l,t.updateQueue=r,r!==null&&(t.flags|=4)}else{o=l.nodeType===9?l:l.ownerDocument,e==="http://www.w3.org/1999/xhtml"&&(e=ds(n)),e==="http://www.w3.org/1999/xhtml"?n==="script"?(e=o.createElement("div"),e.innerHTML="<script><\/script>",e=e.removeChild(e.firstChild)):typeof r.is=="string"?e=o.createElement(n,{is:r.is}):(e=o.createElement(n),n==="select"&&(o=e,r.multiple?o.multiple=!0:r.size&&(o.size=r.size))):e=o.createElementNS(e,n),e[$e]=t,e[Kn]=r,Ia(e,t,!1,!1),t.stateNode=e;e:{switch(o=uu(n,r),n){case"dialog":F("cancel",e),F("close",e),l=r;break;case"iframe":case"object":case"embed":F("load",e),l=r;break;case"video":case"audio":for(l=0;l<Nn.length;l++)F(Nn[l],e);l=r;break;case"source":F("error",e),l=r;break;case"img":case"image":case"link":F("error",e),F("load",e),l=r;break;case"details":F("toggle",e),l=r;break;case"input":Vo(e,r),l=bl(e,r),F("invalid",e);break;case"option":l=r;break;case"select":e._wrapperState={wasMultiple:!!r.multiple},l=H({},r,{value:void 0}),F("invalid",e);break;case"textarea":Ho(e,r),l=nu(e,r),F("invalid",e);break;default:l=r}lu(n,l),i=l;for(u in i)if(i.hasOwnProperty(u)){var s=i[u];u==="style"?hs(e,s):u==="dangerouslySetInnerHTML"?(s=s?s.__html:void 0,s!=null&&ps(e,s)):u==="children"?typeof s=="string"?(n!=="textarea"||s!=="")&&Fn(e,s):typeof s=="number"&&Fn(e,""+s):u!=="suppressContentEditableWarning"&&u!=="suppressHydrationWarning"&&u!=="autoFocus"&&(In.hasOwnProperty(u)?s!=null&&u==="onScroll"&&F("scroll",e):s!=null&&Ku(e,u,s,o))}switch(n){case"input":ir(e),Bo(e,r,!1);break;case"textarea":ir(e),Wo(e);break;case"option":r.value!=null&&e.setAttribute("value",""+mt(r.value));break;case"select":e.multiple=!!r.multiple,u=r.value,u!=null?Jt(e,!!r.multiple,u,!1):r.defaultValue!=null&&Jt(e,!!r.multiple,r.defaultValue,!0);break;default:typeof l.onClick=="function"&&(e.onclick=Br)}switch(n){case"button":case"input":case"select":case"textarea":r=!!r.autoFocus;break e;case"img":r=!0;break e;default:r=!1}}r&&(t.flags|=4)}t.ref!==null&&(t.flags|=512,t.flags|=2097152)}return le(t),null;case 6:if(e&&t.stateNode!=null)Ua(e,t,e.memoizedProps,r);else{if(typeof r!="string"&&t.stateNode===null)throw Error(y(166));if(n=Nt(Xn.current),Nt(Ve.current),vr(t)){if(r=t.stateNode,n=t.memoizedProps,r[$e]=t,(u=r.nodeValue!==n)&&(e=Se,e!==null))switch(e.tag){case 3:hr(r.nodeValue,n,(e.mode&1)!==0);break;case 5:e.memoizedProps.suppressHydrationWarning!==!0&&hr(r.nodeValue,n,(e.mode&1)!==0)}u&&(t.flags|=4)}else r=(n.nodeType===9?n:n.ownerDocument).createTextNode(r),r[$e]=t,t.stateNode=r}return le(t),null;case 13:if(U(V),r=t.memoizedState,e===null||e.memoizedState!==null&&e.memoizedState.dehydrated!==null){if($&&we!==null&&t.mode&1&&!(t.flags&128))na(),un(),t.flags|=98560,u=!1;else if(u=vr(t),r!==null&&r.dehydrated!==null){if(e===null){if(!u)throw Error(y(318));if(u=t.memoizedState,u=u!==null?u.dehydrated:null,!u)throw Error(y(317));u[$e]=t}else un(),!(t.flags&128)&&(t.memoizedState=null),t.flags|=4;le(t),u=!1}else Oe!==null&&($u(Oe),Oe=null),u=!0;if(!u)return t.flags&65536?t:null}return t.flags&128?(t.lanes=n,t):(r=r!==null,r!==(e!==null&&e.memoizedState!==null)&&r&&(t.child.flags|=8192,t.mode&1&&(e===null||V.current&1?J===0&&(J=3):Lo())),t.updateQueue!==null&&(t.flags|=4),le(t),null);case 4:return sn(),ju(e,t),e===null&&Wn(t.stateNode.containerInfo),le(t),null;case 10:return fo(t.type._context),le(t),null;case 17:return ve(t.type)&&Hr(),le(t),null;case 19:if(U(V),u=t.memoizedState,u===null)return le(t),null;if(r=(t.flags&128)!==0,o=u.rendering,o===null)if(r)kn(u,!1);else{if(J!==0||e!==null&&e.flags&128)for(e=t.child;e!==null;){if(o=Zr(e),o!==null){for(t.flags|=128,kn(u,!1),r=o.updateQueue,r!==null&&(t.updateQueue=r,t.flags|=4),t.subtreeFlags=0,r=n,n=t.child;n!==null;)u=n,e=r,u.flags&=14680066,o=u.alternate,o===null?(u.childLanes=0,u.lanes=e,u.child=null,u.subtreeFlags=0,u.memoizedProps=null,u.memoizedState=null,u.updateQueue=null,u.dependencies=null,u.stateNode=null):(u.childLanes=o.childLanes,u.lanes=o.lanes,u.child=o.child,u.subtreeFlags=0,u.deletions=null,u.memoizedProps=o.memoizedProps,u.memoizedState=o.memoizedState,u.updateQueue=o.updateQueue,u.type=o.type,e=o.dependencies,u.dependencies=e===null?null:{lanes:e.lanes,firstContext:e.firstContext}),n=n.sibling;return I(V,V.current&1|2),t.child}e=e.sibling}u.tail!==null&&K()>cn&&(t.flags|=128,r=!0,kn(u,!1),t.lanes=4194304)}else{if(!r)if(e=Zr(o),e!==null){if(t.flags|=128,r=!0,n=e.updateQueue,n!==null&&(t.updateQueue=n,t.flags|=4),kn(u,!0),u.tail===null&&u.tailMode==="hidden"&&!o.alternate&&!$)return le(t),null}else 2*K()-u.renderingStartTime>cn&&n!==1073741824&&(t.flags|=128,r=!0,kn(u,!1),t.lanes=4194304);u.isBackwards?(o.sibling=t.child,t.child=o):(n=u.last,n!==null?n.sibling=o:t.child=o,u.last=o)}return u.tail!==null?(t=u.tail,u.rendering=t,u.tail=t.sibling,u.renderingStartTime=K(),t.sibling=null,n=V.current,I(V,r?n&1|2:n&1),t):(le(t),null);case 22:case 23:return zo(),r=t.memoizedState!==null,e!==null&&e.memoizedState!==null!==r&&(t.flags|=8192),r&&t.mode&1?ge&1073741824&&(le(t),t.subtreeFlags&6&&(t.flags|=8192)):le(t),null;case 24:return null;case 25:return null}throw Error(y(156,t.tag))}function fd(e,t){switch(io(t),t.tag){case 1:return ve(t.type)&&Hr(),e=t.flags,e&65536?(t.flags=e&-65537|128,t):null;case 3:return sn(),U(he),U(oe),yo(),e=t.flags,e&65536&&!(e&128)?(t.flags=e&-65537|128,t):null;case 5:return vo(t),null;case 13:if(U(V),e=t.memoizedState,e!==null&&e.dehydrated!==null){if(t.alternate===null)throw Error(y(340));un()}return e=t.flags,e&65536?(t.flags=e&-65537|128,t):null;case 19:return U(V),null;case 4:return sn(),null;case 10:return fo(t.type._context),null;case 22:case 23:return zo(),null;case 24:return null;default:return null}}var wr=!1,ue=!1,dd=typeof WeakSet=="function"?WeakSet:Set,C=null;function Gt(e,t){var n=e.ref;if(n!==null)if(typeof n=="function")try{n(null)}catch(r){Q(e,t,r)}else n.current=null}function Ru(e,t,n){try{n()}catch(r){Q(e,t,r)}}var Oi=!1;function pd(e,t){if(hu=$r,e=Hs(),uo(e)){if("selectionStart"in e)var n={start:e.selectionStart,end:e.selectionEnd};else e:{n=(n=e.ownerDocument)&&n.defaultView||window;var r=n.getSelection&&n.getSelection();if(r&&r.rangeCount!==0){n=r.anchorNode;var l=r.anchorOffset,u=r.focusNode;r=r.focusOffset;try{n.nodeType,u.nodeType}catch{n=null;break e}var o=0,i=-1,s=-1,f=0,h=0,m=e,p=null;t:for(;;){for(var g;m!==n||l!==0&&m.nodeType!==3||(i=o+l),m!==u||r!==0&&m.nodeType!==3||(s=o+r),m.nodeType===3&&(o+=m.nodeValue.length),(g=m.firstChild)!==null;)p=m,m=g;for(;;){if(m===e)break t;if(p===n&&++f===l&&(i=o),p===u&&++h===r&&(s=o),(g=m.nextSibling)!==null)break;m=p,p=m.parentNode}m=g}n=i===-1||s===-1?null:{start:i,end:s}}else n=null}n=n||{start:0,end:0}}else n=null;for(vu={focusedElem:e,selectionRange:n},$r=!1,C=t;C!==null;)if(t=C,e=t.child,(t.subtreeFlags&1028)!==0&&e!==null)e.return=t,C=e;else for(;C!==null;){t=C;try{var S=t.alternate;if(t.flags&1024)switch(t.tag){case 0:case 11:case 15:break;case 1:if(S!==null){var k=S.memoizedProps,D=S.memoizedState,c=t.stateNode,a=c.getSnapshotBeforeUpdate(t.elementType===t.type?k:je(t.type,k),D);c.__reactInternalSnapshotBeforeUpdate=a}break;case 3:var d=t.stateNode.containerInfo;d.nodeType===1?d.textContent="":d.nodeType===9&&d.documentElement&&d.removeChild(d.documentElement);break;case 5:case 6:case 4:case 17:break;default:throw Error(y(163))}}catch(v){Q(t,t.return,v)}if(e=t.sibling,e!==null){e.return=t.return,C=e;break}C=t.return}return S=Oi,Oi=!1,S}function On(e,t,n){var r=t.updateQueue;if(r=r!==null?r.lastEffect:null,r!==null){var l=r=r.next;do{if((l.tag&e)===e){var u=l.destroy;l.destroy=void 0,u!==void 0&&Ru(t,n,u)}l=l.next}while(l!==r)}}function pl(e,t){if(t=t.updateQueue,t=t!==null?t.lastEffect:null,t!==null){var n=t=t.next;do{if((n.tag&e)===e){var r=n.create;n.destroy=r()}n=n.next}while(n!==t)}}function Ou(e){var t=e.ref;if(t!==null){var n=e.stateNode;switch(e.tag){case 5:e=n;break;default:e=n}typeof t=="function"?t(e):t.current=e}}function $a(e){var t=e.alternate;t!==null&&(e.alternate=null,$a(t)),e.child=null,e.deletions=null,e.sibling=null,e.tag===5&&(t=e.stateNode,t!==null&&(delete t[$e],delete t[Kn],delete t[wu],delete t[Gf],delete t[Zf])),e.stateNode=null,e.return=null,e.dependencies=null,e.memoizedProps=null,e.memoizedState=null,e.pendingProps=null,e.stateNode=null,e.updateQueue=null}function Aa(e){return e.tag===5||e.tag===3||e.tag===4}function Mi(e){e:for(;;){for(;e.sibling===null;){if(e.return===null||Aa(e.return))return null;e=e.return}for(e.sibling.return=e.return,e=e.sibling;e.tag!==5&&e.tag!==6&&e.tag!==18;){if(e.flags&2||e.child===null||e.tag===4)continue e;e.child.return=e,e=e.child}if(!(e.flags&2))return e.stateNode}}function Mu(e,t,n){var r=e.tag;if(r===5||r===6)e=e.stateNode,t?n.nodeType===8?n.parentNode.insertBefore(e,t):n.insertBefore(e,t):(n.nodeType===8?(t=n.parentNode,t.insertBefore(e,n)):(t=n,t.appendChild(e)),n=n._reactRootContainer,n!=null||t.onclick!==null||(t.onclick=Br));else if(r!==4&&(e=e.child,e!==null))for(Mu(e,t,n),e=e.sibling;e!==null;)Mu(e,t,n),e=e.sibling}function Du(e,t,n){var r=e.tag;if(r===5||r===6)e=e.stateNode,t?n.insertBefore(e,t):n.appendChild(e);else if(r!==4&&(e=e.child,e!==null))for(Du(e,t,n),e=e.sibling;e!==null;)Du(e,t,n),e=e.sibling}var ee=null,Re=!1;function be(e,t,n){for(n=n.child;n!==null;)Va(e,t,n),n=n.sibling}function Va(e,t,n){if(Ae&&typeof Ae.onCommitFiberUnmount=="function")try{Ae.onCommitFiberUnmount(ul,n)}catch{}switch(n.tag){case 5:ue||Gt(n,t);case 6:var r=ee,l=Re;ee=null,be(e,t,n),ee=r,Re=l,ee!==null&&(Re?(e=ee,n=n.stateNode,e.nodeType===8?e.parentNode.removeChild(n):e.removeChild(n)):ee.removeChild(n.stateNode));break;case 18:ee!==null&&(Re?(e=ee,n=n.stateNode,e.nodeType===8?Ul(e.parentNode,n):e.nodeType===1&&Ul(e,n),Vn(e)):Ul(ee,n.stateNode));break;case 4:r=ee,l=Re,ee=n.stateNode.containerInfo,Re=!0,be(e,t,n),ee=r,Re=l;break;case 0:case 11:case 14:case 15:if(!ue&&(r=n.updateQueue,r!==null&&(r=r.lastEffect,r!==null))){l=r=r.next;do{var u=l,o=u.destroy;u=u.tag,o!==void 0&&(u&2||u&4)&&Ru(n,t,o),l=l.next}while(l!==r)}be(e,t,n);break;case 1:if(!ue&&(Gt(n,t),r=n.stateNode,typeof r.componentWillUnmount=="function"))try{r.props=n.memoizedProps,r.state=n.memoizedState,r.componentWillUnmount()}catch(i){Q(n,t,i)}be(e,t,n);break;case 21:be(e,t,n);break;case 22:n.mode&1?(ue=(r=ue)||n.memoizedState!==null,be(e,t,n),ue=r):be(e,t,n);break;default:be(e,t,n)}}function Di(e){var t=e.updateQueue;if(t!==null){e.updateQueue=null;var n=e.stateNode;n===null&&(n=e.stateNode=new dd),t.forEach(function(r){var l=xd.bind(null,e,r);n.has(r)||(n.add(r),r.then(l,l))})}}function Te(e,t){var n=t.deletions;if(n!==null)for(var r=0;r<n.length;r++){var l=n[r];try{var u=e,o=t,i=o;e:for(;i!==null;){switch(i.tag){case 5:ee=i.stateNode,Re=!1;break e;case 3:ee=i.stateNode.containerInfo,Re=!0;break e;case 4:ee=i.stateNode.containerInfo,Re=!0;break e}i=i.return}if(ee===null)throw Error(y(160));Va(u,o,l),ee=null,Re=!1;var s=l.alternate;s!==null&&(s.return=null),l.return=null}catch(f){Q(l,t,f)}}if(t.subtreeFlags&12854)for(t=t.child;t!==null;)Ba(t,e),t=t.sibling}function Ba(e,t){var n=e.alternate,r=e.flags;switch(e.tag){case 0:case 11:case 14:case 15:if(Te(t,e),Fe(e),r&4){try{On(3,e,e.return),pl(3,e)}catch(k){Q(e,e.return,k)}try{On(5,e,e.return)}catch(k){Q(e,e.return,k)}}break;case 1:Te(t,e),Fe(e),r&512&&n!==null&&Gt(n,n.return);break;case 5:if(Te(t,e),Fe(e),r&512&&n!==null&&Gt(n,n.return),e.flags&32){var l=e.stateNode;try{Fn(l,"")}catch(k){Q(e,e.return,k)}}if(r&4&&(l=e.stateNode,l!=null)){var u=e.memoizedProps,o=n!==null?n.memoizedProps:u,i=e.type,s=e.updateQueue;if(e.updateQueue=null,s!==null)try{i==="input"&&u.type==="radio"&&u.name!=null&&cs(l,u),uu(i,o);var f=uu(i,u);for(o=0;o<s.length;o+=2){var h=s[o],m=s[o+1];h==="style"?hs(l,m):h==="dangerouslySetInnerHTML"?ps(l,m):h==="children"?Fn(l,m):Ku(l,h,m,f)}switch(i){case"input":eu(l,u);break;case"textarea":fs(l,u);break;case"select":var p=l._wrapperState.wasMultiple;l._wrapperState.wasMultiple=!!u.multiple;var g=u.value;g!=null?Jt(l,!!u.multiple,g,!1):p!==!!u.multiple&&(u.defaultValue!=null?Jt(l,!!u.multiple,u.defaultValue,!0):Jt(l,!!u.multiple,u.multiple?[]:"",!1))}l[Kn]=u}catch(k){Q(e,e.return,k)}}break;case 6:if(Te(t,e),Fe(e),r&4){if(e.stateNode===null)throw Error(y(162));l=e.stateNode,u=e.memoizedProps;try{l.nodeValue=u}catch(k){Q(e,e.return,k)}}break;case 3:if(Te(t,e),Fe(e),r&4&&n!==null&&n.memoizedState.isDehydrated)try{Vn(t.containerInfo)}catch(k){Q(e,e.return,k)}break;case 4:Te(t,e),Fe(e);break;case 13:Te(t,e),Fe(e),l=e.child,l.flags&8192&&(u=l.memoizedState!==null,l.stateNode.isHidden=u,!u||l.alternate!==null&&l.alternate.memoizedState!==null||(No=K())),r&4&&Di(e);break;case 22:if(h=n!==null&&n.memoizedState!==null,e.mode&1?(ue=(f=ue)||h,Te(t,e),ue=f):Te(t,e),Fe(e),r&8192){if(f=e.memoizedState!==null,(e.stateNode.isHidden=f)&&!h&&e.mode&1)for(C=e,h=e.child;h!==null;){for(m=C=h;C!==null;){switch(p=C,g=p.child,p.tag){case 0:case 11:case 14:case 15:On(4,p,p.return);break;case 1:Gt(p,p.return);var S=p.stateNode;if(typeof S.componentWillUnmount=="function"){r=p,n=p.return;try{t=r,S.props=t.memoizedProps,S.state=t.memoizedState,S.componentWillUnmount()}catch(k){Q(r,n,k)}}break;case 5:Gt(p,p.return);break;case 22:if(p.memoizedState!==null){Fi(m);continue}}g!==null?(g.return=p,C=g):Fi(m)}h=h.sibling}e:for(h=null,m=e;;){if(m.tag===5){if(h===null){h=m;try{l=m.stateNode,f?(u=l.style,typeof u.setProperty=="function"?u.setProperty("display","none","important"):u.display="none"):(i=m.stateNode,s=m.memoizedProps.style,o=s!=null&&s.hasOwnProperty("display")?s.display:null,i.style.display=ms("display",o))}catch(k){Q(e,e.return,k)}}}else if(m.tag===6){if(h===null)try{m.stateNode.nodeValue=f?"":m.memoizedProps}catch(k){Q(e,e.return,k)}}else if((m.tag!==22&&m.tag!==23||m.memoizedState===null||m===e)&&m.child!==null){m.child.return=m,m=m.child;continue}if(m===e)break e;for(;m.sibling===null;){if(m.return===null||m.return===e)break e;h===m&&(h=null),m=m.return}h===m&&(h=null),m.sibling.return=m.return,m=m.sibling}}break;case 19:Te(t,e),Fe(e),r&4&&Di(e);break;case 21:break;default:Te(t,e),Fe(e)}}function Fe(e){var t=e.flags;if(t&2){try{e:{for(var n=e.return;n!==null;){if(Aa(n)){var r=n;break e}n=n.return}throw Error(y(160))}switch(r.tag){case 5:var l=r.stateNode;r.flags&32&&(Fn(l,""),r.flags&=-33);var u=Mi(e);Du(e,u,l);break;case 3:case 4:var o=r.stateNode.containerInfo,i=Mi(e);Mu(e,i,o);break;default:throw Error(y(161))}}catch(s){Q(e,e.return,s)}e.flags&=-3}t&4096&&(e.flags&=-4097)}function md(e,t,n){C=e,Ha(e)}function Ha(e,t,n){for(var r=(e.mode&1)!==0;C!==null;){var l=C,u=l.child;if(l.tag===22&&r){var o=l.memoizedState!==null||wr;if(!o){var i=l.alternate,s=i!==null&&i.memoizedState!==null||ue;i=wr;var f=ue;if(wr=o,(ue=s)&&!f)for(C=l;C!==null;)o=C,s=o.child,o.tag===22&&o.memoizedState!==null?Ui(l):s!==null?(s.return=o,C=s):Ui(l);for(;u!==null;)C=u,Ha(u),u=u.sibling;C=l,wr=i,ue=f}Ii(e)}else l.subtreeFlags&8772&&u!==null?(u.return=l,C=u):Ii(e)}}function Ii(e){for(;C!==null;){var t=C;if(t.flags&8772){var n=t.alternate;try{if(t.flags&8772)switch(t.tag){case 0:case 11:case 15:ue||pl(5,t);break;case 1:var r=t.stateNode;if(t.flags&4&&!ue)if(n===null)r.componentDidMount();else{var l=t.elementType===t.type?n.memoizedProps:je(t.type,n.memoizedProps);r.componentDidUpdate(l,n.memoizedState,r.__reactInternalSnapshotBeforeUpdate)}var u=t.updateQueue;u!==null&&Si(t,u,r);break;case 3:var o=t.updateQueue;if(o!==null){if(n=null,t.child!==null)switch(t.child.tag){case 5:n=t.child.stateNode;break;case 1:n=t.child.stateNode}Si(t,o,n)}break;case 5:var i=t.stateNode;if(n===null&&t.flags&4){n=i;var s=t.memoizedProps;switch(t.type){case"button":case"input":case"select":case"textarea":s.autoFocus&&n.focus();break;case"img":s.src&&(n.src=s.src)}}break;case 6:break;case 4:break;case 12:break;case 13:if(t.memoizedState===null){var f=t.alternate;if(f!==null){var h=f.memoizedState;if(h!==null){var m=h.dehydrated;m!==null&&Vn(m)}}}break;case 19:case 17:case 21:case 22:case 23:case 25:break;default:throw Error(y(163))}ue||t.flags&512&&Ou(t)}catch(p){Q(t,t.return,p)}}if(t===e){C=null;break}if(n=t.sibling,n!==null){n.return=t.return,C=n;break}C=t.return}}function Fi(e){for(;C!==null;){var t=C;if(t===e){C=null;break}var n=t.sibling;if(n!==null){n.return=t.return,C=n;break}C=t.return}}function Ui(e){for(;C!==null;){var t=C;try{switch(t.tag){case 0:case 11:case 15:var n=t.return;try{pl(4,t)}catch(s){Q(t,n,s)}break;case 1:var r=t.stateNode;if(typeof r.componentDidMount=="function"){var l=t.return;try{r.componentDidMount()}catch(s){Q(t,l,s)}}var u=t.return;try{Ou(t)}catch(s){Q(t,u,s)}break;case 5:var o=t.return;try{Ou(t)}catch(s){Q(t,o,s)}}}catch(s){Q(t,t.return,s)}if(t===e){C=null;break}var i=t.sibling;if(i!==null){i.return=t.return,C=i;break}C=t.return}}var hd=Math.ceil,br=qe.ReactCurrentDispatcher,Co=qe.ReactCurrentOwner,Pe=qe.ReactCurrentBatchConfig,O=0,b=null,X=null,te=0,ge=0,Zt=yt(0),J=0,qn=null,Rt=0,ml=0,_o=0,Mn=null,pe=null,No=0,cn=1/0,He=null,el=!1,Iu=null,ft=null,Sr=!1,ut=null,tl=0,Dn=0,Fu=null,jr=-1,Rr=0;function ae(){return O&6?K():jr!==-1?jr:jr=K()}function dt(e){return e.mode&1?O&2&&te!==0?te&-te:qf.transition!==null?(Rr===0&&(Rr=Ps()),Rr):(e=M,e!==0||(e=window.event,e=e===void 0?16:Ms(e.type)),e):1}function De(e,t,n,r){if(50<Dn)throw Dn=0,Fu=null,Error(y(185));er(e,n,r),(!(O&2)||e!==b)&&(e===b&&(!(O&2)&&(ml|=n),J===4&&rt(e,te)),ye(e,r),n===1&&O===0&&!(t.mode&1)&&(cn=K()+500,cl&&gt()))}function ye(e,t){var n=e.callbackNode;Jc(e,t);var r=Ur(e,e===b?te:0);if(r===0)n!==null&&Yo(n),e.callbackNode=null,e.callbackPriority=0;else if(t=r&-r,e.callbackPriority!==t){if(n!=null&&Yo(n),t===1)e.tag===0?Jf($i.bind(null,e)):bs($i.bind(null,e)),Yf(function(){!(O&6)&&gt()}),n=null;else{switch(zs(r)){case 1:n=Ju;break;case 4:n=_s;break;case 16:n=Fr;break;case 536870912:n=Ns;break;default:n=Fr}n=Ja(n,Wa.bind(null,e))}e.callbackPriority=t,e.callbackNode=n}}function Wa(e,t){if(jr=-1,Rr=0,O&6)throw Error(y(327));var n=e.callbackNode;if(nn()&&e.callbackNode!==n)return null;var r=Ur(e,e===b?te:0);if(r===0)return null;if(r&30||r&e.expiredLanes||t)t=nl(e,r);else{t=r;var l=O;O|=2;var u=Ka();(b!==e||te!==t)&&(He=null,cn=K()+500,Pt(e,t));do try{gd();break}catch(i){Qa(e,i)}while(!0);co(),br.current=u,O=l,X!==null?t=0:(b=null,te=0,t=J)}if(t!==0){if(t===2&&(l=cu(e),l!==0&&(r=l,t=Uu(e,l))),t===1)throw n=qn,Pt(e,0),rt(e,r),ye(e,K()),n;if(t===6)rt(e,r);else{if(l=e.current.alternate,!(r&30)&&!vd(l)&&(t=nl(e,r),t===2&&(u=cu(e),u!==0&&(r=u,t=Uu(e,u))),t===1))throw n=qn,Pt(e,0),rt(e,r),ye(e,K()),n;switch(e.finishedWork=l,e.finishedLanes=r,t){case 0:case 1:throw Error(y(345));case 2:Et(e,pe,He);break;case 3:if(rt(e,r),(r&130023424)===r&&(t=No+500-K(),10<t)){if(Ur(e,0)!==0)break;if(l=e.suspendedLanes,(l&r)!==r){ae(),e.pingedLanes|=e.suspendedLanes&l;break}e.timeoutHandle=gu(Et.bind(null,e,pe,He),t);break}Et(e,pe,He);break;case 4:if(rt(e,r),(r&4194240)===r)break;for(t=e.eventTimes,l=-1;0<r;){var o=31-Me(r);u=1<<o,o=t[o],o>l&&(l=o),r&=~u}if(r=l,r=K()-r,r=(120>r?120:480>r?480:1080>r?1080:1920>r?1920:3e3>r?3e3:4320>r?4320:1960*hd(r/1960))-r,10<r){e.timeoutHandle=gu(Et.bind(null,e,pe,He),r);break}Et(e,pe,He);break;case 5:Et(e,pe,He);break;default:throw Error(y(329))}}}return ye(e,K()),e.callbackNode===n?Wa.bind(null,e):null}function Uu(e,t){var n=Mn;return e.current.memoizedState.isDehydrated&&(Pt(e,t).flags|=256),e=nl(e,t),e!==2&&(t=pe,pe=n,t!==null&&$u(t)),e}function $u(e){pe===null?pe=e:pe.push.apply(pe,e)}function vd(e){for(var t=e;;){if(t.flags&16384){var n=t.updateQueue;if(n!==null&&(n=n.stores,n!==null))for(var r=0;r<n.length;r++){var l=n[r],u=l.getSnapshot;l=l.value;try{if(!Ie(u(),l))return!1}catch{return!1}}}if(n=t.child,t.subtreeFlags&16384&&n!==null)n.return=t,t=n;else{if(t===e)break;for(;t.sibling===null;){if(t.return===null||t.return===e)return!0;t=t.return}t.sibling.return=t.return,t=t.sibling}}return!0}function rt(e,t){for(t&=~_o,t&=~ml,e.suspendedLanes|=t,e.pingedLanes&=~t,e=e.expirationTimes;0<t;){var n=31-Me(t),r=1<<n;e[n]=-1,t&=~r}}function $i(e){if(O&6)throw Error(y(327));nn();var t=Ur(e,0);if(!(t&1))return ye(e,K()),null;var n=nl(e,t);if(e.tag!==0&&n===2){var r=cu(e);r!==0&&(t=r,n=Uu(e,r))}if(n===1)throw n=qn,Pt(e,0),rt(e,t),ye(e,K()),n;if(n===6)throw Error(y(345));return e.finishedWork=e.current.alternate,e.finishedLanes=t,Et(e,pe,He),ye(e,K()),null}function Po(e,t){var n=O;O|=1;try{return e(t)}finally{O=n,O===0&&(cn=K()+500,cl&&gt())}}function Ot(e){ut!==null&&ut.tag===0&&!(O&6)&&nn();var t=O;O|=1;var n=Pe.transition,r=M;try{if(Pe.transition=null,M=1,e)return e()}finally{M=r,Pe.transition=n,O=t,!(O&6)&&gt()}}function zo(){ge=Zt.current,U(Zt)}function Pt(e,t){e.finishedWork=null,e.finishedLanes=0;var n=e.timeoutHandle;if(n!==-1&&(e.timeoutHandle=-1,Kf(n)),X!==null)for(n=X.return;n!==null;){var r=n;switch(io(r),r.tag){case 1:r=r.type.childContextTypes,r!=null&&Hr();break;case 3:sn(),U(he),U(oe),yo();break;case 5:vo(r);break;case 4:sn();break;case 13:U(V);break;case 19:U(V);break;case 10:fo(r.type._context);break;case 22:case 23:zo()}n=n.return}if(b=e,X=e=pt(e.current,null),te=ge=t,J=0,qn=null,_o=ml=Rt=0,pe=Mn=null,_t!==null){for(t=0;t<_t.length;t++)if(n=_t[t],r=n.interleaved,r!==null){n.interleaved=null;var l=r.next,u=n.pending;if(u!==null){var o=u.next;u.next=l,r.next=o}n.pending=r}_t=null}return e}function Qa(e,t){do{var n=X;try{if(co(),zr.current=qr,Jr){for(var r=B.memoizedState;r!==null;){var l=r.queue;l!==null&&(l.pending=null),r=r.next}Jr=!1}if(jt=0,q=Z=B=null,Rn=!1,Gn=0,Co.current=null,n===null||n.return===null){J=1,qn=t,X=null;break}e:{var u=e,o=n.return,i=n,s=t;if(t=te,i.flags|=32768,s!==null&&typeof s=="object"&&typeof s.then=="function"){var f=s,h=i,m=h.tag;if(!(h.mode&1)&&(m===0||m===11||m===15)){var p=h.alternate;p?(h.updateQueue=p.updateQueue,h.memoizedState=p.memoizedState,h.lanes=p.lanes):(h.updateQueue=null,h.memoizedState=null)}var g=Ni(o);if(g!==null){g.flags&=-257,Pi(g,o,i,u,t),g.mode&1&&_i(u,f,t),t=g,s=f;var S=t.updateQueue;if(S===null){var k=new Set;k.add(s),t.updateQueue=k}else S.add(s);break e}else{if(!(t&1)){_i(u,f,t),Lo();break e}s=Error(y(426))}}else if($&&i.mode&1){var D=Ni(o);if(D!==null){!(D.flags&65536)&&(D.flags|=256),Pi(D,o,i,u,t),so(an(s,i));break e}}u=s=an(s,i),J!==4&&(J=2),Mn===null?Mn=[u]:Mn.push(u),u=o;do{switch(u.tag){case 3:u.flags|=65536,t&=-t,u.lanes|=t;var c=za(u,s,t);wi(u,c);break e;case 1:i=s;var a=u.type,d=u.stateNode;if(!(u.flags&128)&&(typeof a.getDerivedStateFromError=="function"||d!==null&&typeof d.componentDidCatch=="function"&&(ft===null||!ft.has(d)))){u.flags|=65536,t&=-t,u.lanes|=t;var v=La(u,i,t);wi(u,v);break e}}u=u.return}while(u!==null)}Xa(n)}catch(x){t=x,X===n&&n!==null&&(X=n=n.return);continue}break}while(!0)}function Ka(){var e=br.current;return br.current=qr,e===null?qr:e}function Lo(){(J===0||J===3||J===2)&&(J=4),b===null||!(Rt&268435455)&&!(ml&268435455)||rt(b,te)}function nl(e,t){var n=O;O|=2;var r=Ka();(b!==e||te!==t)&&(He=null,Pt(e,t));do try{yd();break}catch(l){Qa(e,l)}while(!0);if(co(),O=n,br.current=r,X!==null)throw Error(y(261));return b=null,te=0,J}function yd(){for(;X!==null;)Ya(X)}function gd(){for(;X!==null&&!Bc();)Ya(X)}function Ya(e){var t=Za(e.alternate,e,ge);e.memoizedProps=e.pendingProps,t===null?Xa(e):X=t,Co.current=null}function Xa(e){var t=e;do{var n=t.alternate;if(e=t.return,t.flags&32768){if(n=fd(n,t),n!==null){n.flags&=32767,X=n;return}if(e!==null)e.flags|=32768,e.subtreeFlags=0,e.deletions=null;else{J=6,X=null;return}}else if(n=cd(n,t,ge),n!==null){X=n;return}if(t=t.sibling,t!==null){X=t;return}X=t=e}while(t!==null);J===0&&(J=5)}function Et(e,t,n){var r=M,l=Pe.transition;try{Pe.transition=null,M=1,wd(e,t,n,r)}finally{Pe.transition=l,M=r}return null}function wd(e,t,n,r){do nn();while(ut!==null);if(O&6)throw Error(y(327));n=e.finishedWork;var l=e.finishedLanes;if(n===null)return null;if(e.finishedWork=null,e.finishedLanes=0,n===e.current)throw Error(y(177));e.callbackNode=null,e.callbackPriority=0;var u=n.lanes|n.childLanes;if(qc(e,u),e===b&&(X=b=null,te=0),!(n.subtreeFlags&2064)&&!(n.flags&2064)||Sr||(Sr=!0,Ja(Fr,function(){return nn(),null})),u=(n.flags&15990)!==0,n.subtreeFlags&15990||u){u=Pe.transition,Pe.transition=null;var o=M;M=1;var i=O;O|=4,Co.current=null,pd(e,n),Ba(n,e),$f(vu),$r=!!hu,vu=hu=null,e.current=n,md(n),Hc(),O=i,M=o,Pe.transition=u}else e.current=n;if(Sr&&(Sr=!1,ut=e,tl=l),u=e.pendingLanes,u===0&&(ft=null),Kc(n.stateNode),ye(e,K()),t!==null)for(r=e.onRecoverableError,n=0;n<t.length;n++)l=t[n],r(l.value,{componentStack:l.stack,digest:l.digest});if(el)throw el=!1,e=Iu,Iu=null,e;return tl&1&&e.tag!==0&&nn(),u=e.pendingLanes,u&1?e===Fu?Dn++:(Dn=0,Fu=e):Dn=0,gt(),null}function nn(){if(ut!==null){var e=zs(tl),t=Pe.transition,n=M;try{if(Pe.transition=null,M=16>e?16:e,ut===null)var r=!1;else{if(e=ut,ut=null,tl=0,O&6)throw Error(y(331));var l=O;for(O|=4,C=e.current;C!==null;){var u=C,o=u.child;if(C.flags&16){var i=u.deletions;if(i!==null){for(var s=0;s<i.length;s++){var f=i[s];for(C=f;C!==null;){var h=C;switch(h.tag){case 0:case 11:case 15:On(8,h,u)}var m=h.child;if(m!==null)m.return=h,C=m;else for(;C!==null;){h=C;var p=h.sibling,g=h.return;if($a(h),h===f){C=null;break}if(p!==null){p.return=g,C=p;break}C=g}}}var S=u.alternate;if(S!==null){var k=S.child;if(k!==null){S.child=null;do{var D=k.sibling;k.sibling=null,k=D}while(k!==null)}}C=u}}if(u.subtreeFlags&2064&&o!==null)o.return=u,C=o;else e:for(;C!==null;){if(u=C,u.flags&2048)switch(u.tag){case 0:case 11:case 15:On(9,u,u.return)}var c=u.sibling;if(c!==null){c.return=u.return,C=c;break e}C=u.return}}var a=e.current;for(C=a;C!==null;){o=C;var d=o.child;if(o.subtreeFlags&2064&&d!==null)d.return=o,C=d;else e:for(o=a;C!==null;){if(i=C,i.flags&2048)try{switch(i.tag){case 0:case 11:case 15:pl(9,i)}}catch(x){Q(i,i.return,x)}if(i===o){C=null;break e}var v=i.sibling;if(v!==null){v.return=i.return,C=v;break e}C=i.return}}if(O=l,gt(),Ae&&typeof Ae.onPostCommitFiberRoot=="function")try{Ae.onPostCommitFiberRoot(ul,e)}catch{}r=!0}return r}finally{M=n,Pe.transition=t}}return!1}function Ai(e,t,n){t=an(n,t),t=za(e,t,1),e=ct(e,t,1),t=ae(),e!==null&&(er(e,1,t),ye(e,t))}function Q(e,t,n){if(e.tag===3)Ai(e,e,n);else for(;t!==null;){if(t.tag===3){Ai(t,e,n);break}else if(t.tag===1){var r=t.stateNode;if(typeof t.type.getDerivedStateFromError=="function"||typeof r.componentDidCatch=="function"&&(ft===null||!ft.has(r))){e=an(n,e),e=La(t,e,1),t=ct(t,e,1),e=ae(),t!==null&&(er(t,1,e),ye(t,e));break}}t=t.return}}function Sd(e,t,n){var r=e.pingCache;r!==null&&r.delete(t),t=ae(),e.pingedLanes|=e.suspendedLanes&n,b===e&&(te&n)===n&&(J===4||J===3&&(te&130023424)===te&&500>K()-No?Pt(e,0):_o|=n),ye(e,t)}function Ga(e,t){t===0&&(e.mode&1?(t=cr,cr<<=1,!(cr&130023424)&&(cr=4194304)):t=1);var n=ae();e=Ze(e,t),e!==null&&(er(e,t,n),ye(e,n))}function kd(e){var t=e.memoizedState,n=0;t!==null&&(n=t.retryLane),Ga(e,n)}function xd(e,t){var n=0;switch(e.tag){case 13:var r=e.stateNode,l=e.memoizedState;l!==null&&(n=l.retryLane);break;case 19:r=e.stateNode;break;default:throw Error(y(314))}r!==null&&r.delete(t),Ga(e,n)}var Za;Za=function(e,t,n){if(e!==null)if(e.memoizedProps!==t.pendingProps||he.current)me=!0;else{if(!(e.lanes&n)&&!(t.flags&128))return me=!1,ad(e,t,n);me=!!(e.flags&131072)}else me=!1,$&&t.flags&1048576&&ea(t,Kr,t.index);switch(t.lanes=0,t.tag){case 2:var r=t.type;Tr(e,t),e=t.pendingProps;var l=ln(t,oe.current);tn(t,n),l=wo(null,t,r,e,l,n);var u=So();return t.flags|=1,typeof l=="object"&&l!==null&&typeof l.render=="function"&&l.$$typeof===void 0?(t.tag=1,t.memoizedState=null,t.updateQueue=null,ve(r)?(u=!0,Wr(t)):u=!1,t.memoizedState=l.state!==null&&l.state!==void 0?l.state:null,mo(t),l.updater=dl,t.stateNode=l,l._reactInternals=t,_u(t,r,e,n),t=zu(null,t,r,!0,u,n)):(t.tag=0,$&&u&&oo(t),se(null,t,l,n),t=t.child),t;case 16:r=t.elementType;e:{switch(Tr(e,t),e=t.pendingProps,l=r._init,r=l(r._payload),t.type=r,l=t.tag=Cd(r),e=je(r,e),l){case 0:t=Pu(null,t,r,e,n);break e;case 1:t=Ti(null,t,r,e,n);break e;case 11:t=zi(null,t,r,e,n);break e;case 14:t=Li(null,t,r,je(r.type,e),n);break e}throw Error(y(306,r,""))}return t;case 0:return r=t.type,l=t.pendingProps,l=t.elementType===r?l:je(r,l),Pu(e,t,r,l,n);case 1:return r=t.type,l=t.pendingProps,l=t.elementType===r?l:je(r,l),Ti(e,t,r,l,n);case 3:e:{if(Oa(t),e===null)throw Error(y(387));r=t.pendingProps,u=t.memoizedState,l=u.element,oa(e,t),Gr(t,r,null,n);var o=t.memoizedState;if(r=o.element,u.isDehydrated)if(u={element:r,isDehydrated:!1,cache:o.cache,pendingSuspenseBoundaries:o.pendingSuspenseBoundaries,transitions:o.transitions},t.updateQueue.baseState=u,t.memoizedState=u,t.flags&256){l=an(Error(y(423)),t),t=ji(e,t,r,n,l);break e}else if(r!==l){l=an(Error(y(424)),t),t=ji(e,t,r,n,l);break e}else for(we=at(t.stateNode.containerInfo.firstChild),Se=t,$=!0,Oe=null,n=la(t,null,r,n),t.child=n;n;)n.flags=n.flags&-3|4096,n=n.sibling;else{if(un(),r===l){t=Je(e,t,n);break e}se(e,t,r,n)}t=t.child}return t;case 5:return ia(t),e===null&&xu(t),r=t.type,l=t.pendingProps,u=e!==null?e.memoizedProps:null,o=l.children,yu(r,l)?o=null:u!==null&&yu(r,u)&&(t.flags|=32),Ra(e,t),se(e,t,o,n),t.child;case 6:return e===null&&xu(t),null;case 13:return Ma(e,t,n);case 4:return ho(t,t.stateNode.containerInfo),r=t.pendingProps,e===null?t.child=on(t,null,r,n):se(e,t,r,n),t.child;case 11:return r=t.type,l=t.pendingProps,l=t.elementType===r?l:je(r,l),zi(e,t,r,l,n);case 7:return se(e,t,t.pendingProps,n),t.child;case 8:return se(e,t,t.pendingProps.children,n),t.child;case 12:return se(e,t,t.pendingProps.children,n),t.child;case 10:e:{if(r=t.type._context,l=t.pendingProps,u=t.memoizedProps,o=l.value,I(Yr,r._currentValue),r._currentValue=o,u!==null)if(Ie(u.value,o)){if(u.children===l.children&&!he.current){t=Je(e,t,n);break e}}else for(u=t.child,u!==null&&(u.return=t);u!==null;){var i=u.dependencies;if(i!==null){o=u.child;for(var s=i.firstContext;s!==null;){if(s.context===r){if(u.tag===1){s=Ye(-1,n&-n),s.tag=2;var f=u.updateQueue;if(f!==null){f=f.shared;var h=f.pending;h===null?s.next=s:(s.next=h.next,h.next=s),f.pending=s}}u.lanes|=n,s=u.alternate,s!==null&&(s.lanes|=n),Eu(u.return,n,t),i.lanes|=n;break}s=s.next}}else if(u.tag===10)o=u.type===t.type?null:u.child;else if(u.tag===18){if(o=u.return,o===null)throw Error(y(341));o.lanes|=n,i=o.alternate,i!==null&&(i.lanes|=n),Eu(o,n,t),o=u.sibling}else o=u.child;if(o!==null)o.return=u;else for(o=u;o!==null;){if(o===t){o=null;break}if(u=o.sibling,u!==null){u.return=o.return,o=u;break}o=o.return}u=o}se(e,t,l.children,n),t=t.child}return t;case 9:return l=t.type,r=t.pendingProps.children,tn(t,n),l=ze(l),r=r(l),t.flags|=1,se(e,t,r,n),t.child;case 14:return r=t.type,l=je(r,t.pendingProps),l=je(r.type,l),Li(e,t,r,l,n);case 15:return Ta(e,t,t.type,t.pendingProps,n);case 17:return r=t.type,l=t.pendingProps,l=t.elementType===r?l:je(r,l),Tr(e,t),t.tag=1,ve(r)?(e=!0,Wr(t)):e=!1,tn(t,n),Pa(t,r,l),_u(t,r,l,n),zu(null,t,r,!0,e,n);case 19:return Da(e,t,n);case 22:return ja(e,t,n)}throw Error(y(156,t.tag))};function Ja(e,t){return Cs(e,t)}function Ed(e,t,n,r){this.tag=e,this.key=n,this.sibling=this.child=this.return=this.stateNode=this.type=this.elementType=null,this.index=0,this.ref=null,this.pendingProps=t,this.dependencies=this.memoizedState=this.updateQueue=this.memoizedProps=null,this.mode=r,this.subtreeFlags=this.flags=0,this.deletions=null,this.childLanes=this.lanes=0,this.alternate=null}function Ne(e,t,n,r){return new Ed(e,t,n,r)}function To(e){return e=e.prototype,!(!e||!e.isReactComponent)}function Cd(e){if(typeof e=="function")return To(e)?1:0;if(e!=null){if(e=e.$$typeof,e===Xu)return 11;if(e===Gu)return 14}return 2}function pt(e,t){var n=e.alternate;return n===null?(n=Ne(e.tag,t,e.key,e.mode),n.elementType=e.elementType,n.type=e.type,n.stateNode=e.stateNode,n.alternate=e,e.alternate=n):(n.pendingProps=t,n.type=e.type,n.flags=0,n.subtreeFlags=0,n.deletions=null),n.flags=e.flags&14680064,n.childLanes=e.childLanes,n.lanes=e.lanes,n.child=e.child,n.memoizedProps=e.memoizedProps,n.memoizedState=e.memoizedState,n.updateQueue=e.updateQueue,t=e.dependencies,n.dependencies=t===null?null:{lanes:t.lanes,firstContext:t.firstContext},n.sibling=e.sibling,n.index=e.index,n.ref=e.ref,n}function Or(e,t,n,r,l,u){var o=2;if(r=e,typeof e=="function")To(e)&&(o=1);else if(typeof e=="string")o=5;else e:switch(e){case At:return zt(n.children,l,u,t);case Yu:o=8,l|=8;break;case Gl:return e=Ne(12,n,t,l|2),e.elementType=Gl,e.lanes=u,e;case Zl:return e=Ne(13,n,t,l),e.elementType=Zl,e.lanes=u,e;case Jl:return e=Ne(19,n,t,l),e.elementType=Jl,e.lanes=u,e;case is:return hl(n,l,u,t);default:if(typeof e=="object"&&e!==null)switch(e.$$typeof){case us:o=10;break e;case os:o=9;break e;case Xu:o=11;break e;case Gu:o=14;break e;case et:o=16,r=null;break e}throw Error(y(130,e==null?e:typeof e,""))}return t=Ne(o,n,t,l),t.elementType=e,t.type=r,t.lanes=u,t}function zt(e,t,n,r){return e=Ne(7,e,r,t),e.lanes=n,e}function hl(e,t,n,r){return e=Ne(22,e,r,t),e.elementType=is,e.lanes=n,e.stateNode={isHidden:!1},e}function Kl(e,t,n){return e=Ne(6,e,null,t),e.lanes=n,e}function Yl(e,t,n){return t=Ne(4,e.children!==null?e.children:[],e.key,t),t.lanes=n,t.stateNode={containerInfo:e.containerInfo,pendingChildren:null,implementation:e.implementation},t}function _d(e,t,n,r,l){this.tag=t,this.containerInfo=e,this.finishedWork=this.pingCache=this.current=this.pendingChildren=null,this.timeoutHandle=-1,this.callbackNode=this.pendingContext=this.context=null,this.callbackPriority=0,this.eventTimes=Pl(0),this.expirationTimes=Pl(-1),this.entangledLanes=this.finishedLanes=this.mutableReadLanes=this.expiredLanes=this.pingedLanes=this.suspendedLanes=this.pendingLanes=0,this.entanglements=Pl(0),this.identifierPrefix=r,this.onRecoverableError=l,this.mutableSourceEagerHydrationData=null}function jo(e,t,n,r,l,u,o,i,s){return e=new _d(e,t,n,i,s),t===1?(t=1,u===!0&&(t|=8)):t=0,u=Ne(3,null,null,t),e.current=u,u.stateNode=e,u.memoizedState={element:r,isDehydrated:n,cache:null,transitions:null,pendingSuspenseBoundaries:null},mo(u),e}function Nd(e,t,n){var r=3<arguments.length&&arguments[3]!==void 0?arguments[3]:null;return{$$typeof:$t,key:r==null?null:""+r,children:e,containerInfo:t,implementation:n}}function qa(e){if(!e)return ht;e=e._reactInternals;e:{if(Dt(e)!==e||e.tag!==1)throw Error(y(170));var t=e;do{switch(t.tag){case 3:t=t.stateNode.context;break e;case 1:if(ve(t.type)){t=t.stateNode.__reactInternalMemoizedMergedChildContext;break e}}t=t.return}while(t!==null);throw Error(y(171))}if(e.tag===1){var n=e.type;if(ve(n))return qs(e,n,t)}return t}function ba(e,t,n,r,l,u,o,i,s){return e=jo(n,r,!0,e,l,u,o,i,s),e.context=qa(null),n=e.current,r=ae(),l=dt(n),u=Ye(r,l),u.callback=t??null,ct(n,u,l),e.current.lanes=l,er(e,l,r),ye(e,r),e}function vl(e,t,n,r){var l=t.current,u=ae(),o=dt(l);return n=qa(n),t.context===null?t.context=n:t.pendingContext=n,t=Ye(u,o),t.payload={element:e},r=r===void 0?null:r,r!==null&&(t.callback=r),e=ct(l,t,o),e!==null&&(De(e,l,o,u),Pr(e,l,o)),o}function rl(e){if(e=e.current,!e.child)return null;switch(e.child.tag){case 5:return e.child.stateNode;default:return e.child.stateNode}}function Vi(e,t){if(e=e.memoizedState,e!==null&&e.dehydrated!==null){var n=e.retryLane;e.retryLane=n!==0&&n<t?n:t}}function Ro(e,t){Vi(e,t),(e=e.alternate)&&Vi(e,t)}function Pd(){return null}var ec=typeof reportError=="function"?reportError:function(e){console.error(e)};function Oo(e){this._internalRoot=e}yl.prototype.render=Oo.prototype.render=function(e){var t=this._internalRoot;if(t===null)throw Error(y(409));vl(e,t,null,null)};yl.prototype.unmount=Oo.prototype.unmount=function(){var e=this._internalRoot;if(e!==null){this._internalRoot=null;var t=e.containerInfo;Ot(function(){vl(null,e,null,null)}),t[Ge]=null}};function yl(e){this._internalRoot=e}yl.prototype.unstable_scheduleHydration=function(e){if(e){var t=js();e={blockedOn:null,target:e,priority:t};for(var n=0;n<nt.length&&t!==0&&t<nt[n].priority;n++);nt.splice(n,0,e),n===0&&Os(e)}};function Mo(e){return!(!e||e.nodeType!==1&&e.nodeType!==9&&e.nodeType!==11)}function gl(e){return!(!e||e.nodeType!==1&&e.nodeType!==9&&e.nodeType!==11&&(e.nodeType!==8||e.nodeValue!==" react-mount-point-unstable "))}function Bi(){}function zd(e,t,n,r,l){if(l){if(typeof r=="function"){var u=r;r=function(){var f=rl(o);u.call(f)}}var o=ba(t,r,e,0,null,!1,!1,"",Bi);return e._reactRootContainer=o,e[Ge]=o.current,Wn(e.nodeType===8?e.parentNode:e),Ot(),o}for(;l=e.lastChild;)e.removeChild(l);if(typeof r=="function"){var i=r;r=function(){var f=rl(s);i.call(f)}}var s=jo(e,0,!1,null,null,!1,!1,"",Bi);return e._reactRootContainer=s,e[Ge]=s.current,Wn(e.nodeType===8?e.parentNode:e),Ot(function(){vl(t,s,n,r)}),s}function wl(e,t,n,r,l){var u=n._reactRootContainer;if(u){var o=u;if(typeof l=="function"){var i=l;l=function(){var s=rl(o);i.call(s)}}vl(t,o,e,l)}else o=zd(n,t,e,l,r);return rl(o)}Ls=function(e){switch(e.tag){case 3:var t=e.stateNode;if(t.current.memoizedState.isDehydrated){var n=_n(t.pendingLanes);n!==0&&(qu(t,n|1),ye(t,K()),!(O&6)&&(cn=K()+500,gt()))}break;case 13:Ot(function(){var r=Ze(e,1);if(r!==null){var l=ae();De(r,e,1,l)}}),Ro(e,1)}};bu=function(e){if(e.tag===13){var t=Ze(e,134217728);if(t!==null){var n=ae();De(t,e,134217728,n)}Ro(e,134217728)}};Ts=function(e){if(e.tag===13){var t=dt(e),n=Ze(e,t);if(n!==null){var r=ae();De(n,e,t,r)}Ro(e,t)}};js=function(){return M};Rs=function(e,t){var n=M;try{return M=e,t()}finally{M=n}};iu=function(e,t,n){switch(t){case"input":if(eu(e,n),t=n.name,n.type==="radio"&&t!=null){for(n=e;n.parentNode;)n=n.parentNode;for(n=n.querySelectorAll("input[name="+JSON.stringify(""+t)+'][type="radio"]'),t=0;t<n.length;t++){var r=n[t];if(r!==e&&r.form===e.form){var l=al(r);if(!l)throw Error(y(90));as(r),eu(r,l)}}}break;case"textarea":fs(e,n);break;case"select":t=n.value,t!=null&&Jt(e,!!n.multiple,t,!1)}};gs=Po;ws=Ot;var Ld={usingClientEntryPoint:!1,Events:[nr,Wt,al,vs,ys,Po]},xn={findFiberByHostInstance:Ct,bundleType:0,version:"18.3.1",rendererPackageName:"react-dom"},Td={bundleType:xn.bundleType,version:xn.version,rendererPackageName:xn.rendererPackageName,rendererConfig:xn.rendererConfig,overrideHookState:null,overrideHookStateDeletePath:null,overrideHookStateRenamePath:null,overrideProps:null,overridePropsDeletePath:null,overridePropsRenamePath:null,setErrorHandler:null,setSuspenseHandler:null,scheduleUpdate:null,currentDispatcherRef:qe.ReactCurrentDispatcher,findHostInstanceByFiber:function(e){return e=xs(e),e===null?null:e.stateNode},findFiberByHostInstance:xn.findFiberByHostInstance||Pd,findHostInstancesForRefresh:null,scheduleRefresh:null,scheduleRoot:null,setRefreshHandler:null,getCurrentFiber:null,reconcilerVersion:"18.3.1-next-f1338f8080-20240426"};if(typeof __REACT_DEVTOOLS_GLOBAL_HOOK__<"u"){var kr=__REACT_DEVTOOLS_GLOBAL_HOOK__;if(!kr.isDisabled&&kr.supportsFiber)try{ul=kr.inject(Td),Ae=kr}catch{}}xe.__SECRET_INTERNALS_DO_NOT_USE_OR_YOU_WILL_BE_FIRED=Ld;xe.createPortal=function(e,t){var n=2<arguments.length&&arguments[2]!==void 0?arguments[2]:null;if(!Mo(t))throw Error(y(200));return Nd(e,t,null,n)};xe.createRoot=function(e,t){if(!Mo(e))throw Error(y(299));var n=!1,r="",l=ec;return t!=null&&(t.unstable_strictMode===!0&&(n=!0),t.identifierPrefix!==void 0&&(r=t.identifierPrefix),t.onRecoverableError!==void 0&&(l=t.onRecoverableError)),t=jo(e,1,!1,null,null,n,!1,r,l),e[Ge]=t.current,Wn(e.nodeType===8?e.parentNode:e),new Oo(t)};xe.findDOMNode=function(e){if(e==null)return null;if(e.nodeType===1)return e;var t=e._reactInternals;if(t===void 0)throw typeof e.render=="function"?Error(y(188)):(e=Object.keys(e).join(","),Error(y(268,e)));return e=xs(t),e=e===null?null:e.stateNode,e};xe.flushSync=function(e){return Ot(e)};xe.hydrate=function(e,t,n){if(!gl(t))throw Error(y(200));return wl(null,e,t,!0,n)};xe.hydrateRoot=function(e,t,n){if(!Mo(e))throw Error(y(405));var r=n!=null&&n.hydratedSources||null,l=!1,u="",o=ec;if(n!=null&&(n.unstable_strictMode===!0&&(l=!0),n.identifierPrefix!==void 0&&(u=n.identifierPrefix),n.onRecoverableError!==void 0&&(o=n.onRecoverableError)),t=ba(t,null,e,1,n??null,l,!1,u,o),e[Ge]=t.current,Wn(e),r)for(e=0;e<r.length;e++)n=r[e],l=n._getVersion,l=l(n._source),t.mutableSourceEagerHydrationData==null?t.mutableSourceEagerHydrationData=[n,l]:t.mutableSourceEagerHydrationData.push(n,l);return new yl(t)};xe.render=function(e,t,n){if(!gl(t))throw Error(y(200));return wl(null,e,t,!1,n)};xe.unmountComponentAtNode=function(e){if(!gl(e))throw Error(y(40));return e._reactRootContainer?(Ot(function(){wl(null,null,e,!1,function(){e._reactRootContainer=null,e[Ge]=null})}),!0):!1};xe.unstable_batchedUpdates=Po;xe.unstable_renderSubtreeIntoContainer=function(e,t,n,r){if(!gl(n))throw Error(y(200));if(e==null||e._reactInternals===void 0)throw Error(y(38));return wl(e,t,n,!1,r)};xe.version="18.3.1-next-f1338f8080-20240426";function tc(){if(!(typeof __REACT_DEVTOOLS_GLOBAL_HOOK__>"u"||typeof __REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE!="function"))try{__REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE(tc)}catch(e){console.error(e)}}tc(),ts.exports=xe;var jd=ts.exports,nc,Hi=jd;nc=Hi.createRoot,Hi.hydrateRoot;async function Ut(e,t){const n=await fetch(e,t);if(!n.ok)throw new Error(`${n.status}`);return n.json()}function Rd(){const[e,t]=ie.useState([]),[n,r]=ie.useState(""),[l,u]=ie.useState(null),[o,i]=ie.useState([{role:"system",content:"You are a helpful assistant."}]),[s,f]=ie.useState(""),[h,m]=ie.useState("openai"),[p,g]=ie.useState(""),[S,k]=ie.useState([]),[D,c]=ie.useState(!1),[a,d]=ie.useState(!1),v=ie.useMemo(()=>e.filter(w=>(w.title||"").toLowerCase().includes(n.toLowerCase())),[e,n]);ie.useEffect(()=>{(async()=>(await x(),await A()))()},[]);async function x(){var Y;const w=await Ut("/api/conversations");t(w.conversations||[]),!l&&((Y=w.conversations)!=null&&Y[0])&&await _(w.conversations[0].id)}async function _(w){u(w);const Y=await Ut(`/api/conversations/${encodeURIComponent(w)}`);i(Y.messages||[{role:"system",content:"You are a helpful assistant."}])}async function N(){const w=await Ut("/api/conversations",{method:"POST",headers:{"Content-Type":"application/json"},body:JSON.stringify({})});u(w.id),await x(),await _(w.id)}async function P(w){await Ut(`/api/conversations/${encodeURIComponent(w.id)}`,{method:"PATCH",headers:{"Content-Type":"application/json"},body:JSON.stringify({pinned:!w.pinned})}),await x()}async function A(){const w=await Ut("/api/settings");w.provider&&m(w.provider),await j(w.provider||h),w.model&&g(w.model)}async function j(w){const Y=await Ut(`/api/models?provider=${encodeURIComponent(w)}`);k(Y.models||[])}async function de(){const w=s.trim();if(!w||!l)return;f("");const Y={role:"user",content:w},mn=[...o,Y];i(mn);const Sl=window.location.protocol==="https:"?"wss":"ws",Be=new WebSocket(`${Sl}://${window.location.host}/ws/chat`);c(!0);let wt="";Be.onopen=()=>{Be.send(JSON.stringify({messages:mn,provider:h,model:p,conversation_id:l,reasoning:a}))},Be.onmessage=E=>{const L=E.data;if(L==="[END]"){c(!1),i(z=>[...z,{role:"assistant",content:wt}]),x();return}wt+=L,i(z=>[...z.filter((G,It)=>It!==z.length-1||z[z.length-1].role!=="assistant"),{role:"assistant",content:wt}])},Be.onerror=()=>c(!1),Be.onclose=()=>c(!1)}return T.jsxs("div",{className:"h-screen grid grid-cols-[300px_1fr] gap-0",children:[T.jsxs("aside",{className:"border-r border-white/10 bg-slate-900/60 backdrop-blur",children:[T.jsxs("div",{className:"p-3 flex items-center gap-2",children:[T.jsx("button",{className:"btn-primary",onClick:N,children:"New"}),T.jsx("input",{className:"ml-auto bg-slate-800/60 border border-white/10 rounded px-2 py-1 w-full",placeholder:"Search",value:n,onChange:w=>r(w.target.value)})]}),T.jsx("div",{className:"px-3 space-y-1 overflow-y-auto h-[calc(100vh-48px)]",children:v.map(w=>T.jsxs("div",{className:`flex items-center gap-2 px-2 py-2 rounded hover:bg-white/5 cursor-pointer ${w.id===l?"bg-white/10":""}`,onClick:()=>_(w.id),children:[T.jsxs("div",{className:"flex-1 truncate",children:[T.jsx("div",{className:"text-sm font-medium",children:w.title||"Conversation"}),T.jsx("div",{className:"text-xs text-slate-400",children:w.updated_at?new Date(w.updated_at).toLocaleString():""})]}),T.jsx("button",{className:"text-yellow-400",title:w.pinned?"Unpin":"Pin",onClick:Y=>{Y.stopPropagation(),P(w)},children:w.pinned?"★":"☆"})]},w.id))})]}),T.jsxs("main",{className:"flex flex-col min-h-0",children:[T.jsxs("header",{className:"flex items-center justify-between px-4 py-2 border-b border-white/10 bg-slate-900/60 backdrop-blur",children:[T.jsx("h1",{className:"font-semibold",children:"ChatUI"}),T.jsxs("div",{className:"flex items-center gap-2",children:[T.jsxs("select",{className:"bg-slate-800/60 border border-white/10 rounded px-2 py-1",value:h,onChange:w=>{m(w.target.value),j(w.target.value)},children:[T.jsx("option",{value:"openai",children:"OpenAI"}),T.jsx("option",{value:"openrouter",children:"OpenRouter"}),T.jsx("option",{value:"azure",children:"Azure OpenAI"}),T.jsx("option",{value:"anthropic",children:"Anthropic"}),T.jsx("option",{value:"gemini",children:"Gemini"}),T.jsx("option",{value:"ollama",children:"Ollama (local)"})]}),T.jsxs("select",{className:"bg-slate-800/60 border border-white/10 rounded px-2 py-1",value:p,onChange:w=>g(w.target.value),children:[T.jsx("option",{value:"",children:"Select a model"}),S.map(w=>T.jsx("option",{value:w.id,children:w.name||w.id},w.id))]}),T.jsxs("label",{className:"text-sm flex items-center gap-1",children:[T.jsx("input",{type:"checkbox",checked:a,onChange:w=>d(w.target.checked)})," Reasoning"]})]})]}),T.jsxs("div",{className:"flex-1 overflow-y-auto p-4",children:[o.filter(w=>w.role!=="system").length===0&&T.jsxs("div",{className:"max-w-2xl mx-auto p-4 rounded-lg border border-white/10 bg-slate-900/60",children:[T.jsx("div",{className:"mb-2 text-slate-300",children:"Try one of these"}),T.jsx("div",{className:"flex flex-wrap gap-2",children:["Summarize an article","Write Python","Explain a concept","Create a plan"].map((w,Y)=>T.jsx("button",{className:"px-3 py-1 rounded border border-white/10 hover:bg-white/5",onClick:()=>f(w),children:w},Y))})]}),T.jsx("div",{className:"max-w-3xl mx-auto space-y-3",children:o.filter(w=>w.role!=="system").map((w,Y)=>T.jsxs("div",{className:`flex gap-3 ${w.role==="user"?"justify-end":""}`,children:[w.role==="assistant"&&T.jsx("div",{className:"w-8 h-8 rounded-full bg-brand flex items-center justify-center",children:"A"}),T.jsx("div",{className:`rounded-2xl px-3 py-2 border ${w.role==="user"?"bg-slate-800/60 border-white/10":"bg-slate-900/60 border-white/10"}`,style:{maxWidth:"80%"},children:T.jsx("div",{className:"whitespace-pre-wrap text-slate-100 text-sm",children:w.content})}),w.role==="user"&&T.jsx("div",{className:"w-8 h-8 rounded-full bg-brand flex items-center justify-center",children:"U"})]},Y))})]}),T.jsxs("form",{className:"border-t border-white/10 p-3 flex items-end gap-2 bg-slate-900/60",onSubmit:w=>{w.preventDefault(),de()},children:[T.jsx("textarea",{className:"flex-1 bg-slate-800/60 border border-white/10 rounded-md p-2 min-h-[44px] max-h-40",placeholder:"Ask something...",value:s,onChange:w=>f(w.target.value),onKeyDown:w=>{w.key==="Enter"&&!w.shiftKey&&(w.preventDefault(),de())}}),T.jsx("button",{className:"btn-primary",disabled:!s.trim()||D,type:"submit",children:"Send"})]})]})]})}const Od=document.getElementById("root");nc(Od).render(T.jsx(wc.StrictMode,{children:T.jsx(Rd,{})}));
@@ -1,45 +0,0 @@
-(function(){const t=document.createElement("link").relList;if(t&&t.supports&&t.supports("modulepreload"))return;for(const l of document.querySelectorAll('link[rel="modulepreload"]'))r(l);new MutationObserver(l=>{for(const o of l)if(o.type==="childList")for(const i of o.addedNodes)i.tagName==="LINK"&&i.rel==="modulepreload"&&r(i)}).observe(document,{childList:!0,subtree:!0});function n(l){const o={};return l.integrity&&(o.integrity=l.integrity),l.referrerPolicy&&(o.referrerPolicy=l.referrerPolicy),l.crossOrigin==="use-credentials"?o.credentials="include":l.crossOrigin==="anonymous"?o.credentials="omit":o.credentials="same-origin",o}function r(l){if(l.ep)return;l.ep=!0;const o=n(l);fetch(l.href,o)}})();function Sc(e){return e&&e.__esModule&&Object.prototype.hasOwnProperty.call(e,"default")?e.default:e}var os={exports:{}},vl={},is={exports:{}},R={};/**
- * @license React
- * react.production.min.js
- *
- * Copyright (c) Facebook, Inc. and its affiliates.
- *
- * This source code is licensed under the MIT license found in the
- * LICENSE file in the root directory of this source tree.
- */var fr=Symbol.for("react.element"),kc=Symbol.for("react.portal"),Ec=Symbol.for("react.fragment"),Cc=Symbol.for("react.strict_mode"),Nc=Symbol.for("react.profiler"),_c=Symbol.for("react.provider"),jc=Symbol.for("react.context"),Pc=Symbol.for("react.forward_ref"),Tc=Symbol.for("react.suspense"),zc=Symbol.for("react.memo"),Lc=Symbol.for("react.lazy"),Xi=Symbol.iterator;function Mc(e){return e===null||typeof e!="object"?null:(e=Xi&&e[Xi]||e["@@iterator"],typeof e=="function"?e:null)}var us={isMounted:function(){return!1},enqueueForceUpdate:function(){},enqueueReplaceState:function(){},enqueueSetState:function(){}},ss=Object.assign,as={};function Cn(e,t,n){this.props=e,this.context=t,this.refs=as,this.updater=n||us}Cn.prototype.isReactComponent={};Cn.prototype.setState=function(e,t){if(typeof e!="object"&&typeof e!="function"&&e!=null)throw Error("setState(...): takes an object of state variables to update or a function which returns an object of state variables.");this.updater.enqueueSetState(this,e,t,"setState")};Cn.prototype.forceUpdate=function(e){this.updater.enqueueForceUpdate(this,e,"forceUpdate")};function cs(){}cs.prototype=Cn.prototype;function ei(e,t,n){this.props=e,this.context=t,this.refs=as,this.updater=n||us}var ti=ei.prototype=new cs;ti.constructor=ei;ss(ti,Cn.prototype);ti.isPureReactComponent=!0;var Gi=Array.isArray,fs=Object.prototype.hasOwnProperty,ni={current:null},ds={key:!0,ref:!0,__self:!0,__source:!0};function ps(e,t,n){var r,l={},o=null,i=null;if(t!=null)for(r in t.ref!==void 0&&(i=t.ref),t.key!==void 0&&(o=""+t.key),t)fs.call(t,r)&&!ds.hasOwnProperty(r)&&(l[r]=t[r]);var u=arguments.length-2;if(u===1)l.children=n;else if(1<u){for(var s=Array(u),c=0;c<u;c++)s[c]=arguments[c+2];l.children=s}if(e&&e.defaultProps)for(r in u=e.defaultProps,u)l[r]===void 0&&(l[r]=u[r]);return{$$typeof:fr,type:e,key:o,ref:i,props:l,_owner:ni.current}}function Rc(e,t){return{$$typeof:fr,type:e.type,key:t,ref:e.ref,props:e.props,_owner:e._owner}}function ri(e){return typeof e=="object"&&e!==null&&e.$$typeof===fr}function Dc(e){var t={"=":"=0",":":"=2"};return"$"+e.replace(/[=:]/g,function(n){return t[n]})}var Zi=/\/+/g;function Dl(e,t){return typeof e=="object"&&e!==null&&e.key!=null?Dc(""+e.key):t.toString(36)}function Dr(e,t,n,r,l){var o=typeof e;(o==="undefined"||o==="boolean")&&(e=null);var i=!1;if(e===null)i=!0;else switch(o){case"string":case"number":i=!0;break;case"object":switch(e.$$typeof){case fr:case kc:i=!0}}if(i)return i=e,l=l(i),e=r===""?"."+Dl(i,0):r,Gi(l)?(n="",e!=null&&(n=e.replace(Zi,"$&/")+"/"),Dr(l,t,n,"",function(c){return c})):l!=null&&(ri(l)&&(l=Rc(l,n+(!l.key||i&&i.key===l.key?"":(""+l.key).replace(Zi,"$&/")+"/")+e)),t.push(l)),1;if(i=0,r=r===""?".":r+":",Gi(e))for(var u=0;u<e.length;u++){o=e[u];var s=r+Dl(o,u);i+=Dr(o,t,n,s,l)}else if(s=Mc(e),typeof s=="function")for(e=s.call(e),u=0;!(o=e.next()).done;)o=o.value,s=r+Dl(o,u++),i+=Dr(o,t,n,s,l);else if(o==="object")throw t=String(e),Error("Objects are not valid as a React child (found: "+(t==="[object Object]"?"object with keys {"+Object.keys(e).join(", ")+"}":t)+"). If you meant to render a collection of children, use an array instead.");return i}function gr(e,t,n){if(e==null)return e;var r=[],l=0;return Dr(e,r,"","",function(o){return t.call(n,o,l++)}),r}function Oc(e){if(e._status===-1){var t=e._result;t=t(),t.then(function(n){(e._status===0||e._status===-1)&&(e._status=1,e._result=n)},function(n){(e._status===0||e._status===-1)&&(e._status=2,e._result=n)}),e._status===-1&&(e._status=0,e._result=t)}if(e._status===1)return e._result.default;throw e._result}var me={current:null},Or={transition:null},Ic={ReactCurrentDispatcher:me,ReactCurrentBatchConfig:Or,ReactCurrentOwner:ni};function hs(){throw Error("act(...) is not supported in production builds of React.")}R.Children={map:gr,forEach:function(e,t,n){gr(e,function(){t.apply(this,arguments)},n)},count:function(e){var t=0;return gr(e,function(){t++}),t},toArray:function(e){return gr(e,function(t){return t})||[]},only:function(e){if(!ri(e))throw Error("React.Children.only expected to receive a single React element child.");return e}};R.Component=Cn;R.Fragment=Ec;R.Profiler=Nc;R.PureComponent=ei;R.StrictMode=Cc;R.Suspense=Tc;R.__SECRET_INTERNALS_DO_NOT_USE_OR_YOU_WILL_BE_FIRED=Ic;R.act=hs;R.cloneElement=function(e,t,n){if(e==null)throw Error("React.cloneElement(...): The argument must be a React element, but you passed "+e+".");var r=ss({},e.props),l=e.key,o=e.ref,i=e._owner;if(t!=null){if(t.ref!==void 0&&(o=t.ref,i=ni.current),t.key!==void 0&&(l=""+t.key),e.type&&e.type.defaultProps)var u=e.type.defaultProps;for(s in t)fs.call(t,s)&&!ds.hasOwnProperty(s)&&(r[s]=t[s]===void 0&&u!==void 0?u[s]:t[s])}var s=arguments.length-2;if(s===1)r.children=n;else if(1<s){u=Array(s);for(var c=0;c<s;c++)u[c]=arguments[c+2];r.children=u}return{$$typeof:fr,type:e.type,key:l,ref:o,props:r,_owner:i}};R.createContext=function(e){return e={$$typeof:jc,_currentValue:e,_currentValue2:e,_threadCount:0,Provider:null,Consumer:null,_defaultValue:null,_globalName:null},e.Provider={$$typeof:_c,_context:e},e.Consumer=e};R.createElement=ps;R.createFactory=function(e){var t=ps.bind(null,e);return t.type=e,t};R.createRef=function(){return{current:null}};R.forwardRef=function(e){return{$$typeof:Pc,render:e}};R.isValidElement=ri;R.lazy=function(e){return{$$typeof:Lc,_payload:{_status:-1,_result:e},_init:Oc}};R.memo=function(e,t){return{$$typeof:zc,type:e,compare:t===void 0?null:t}};R.startTransition=function(e){var t=Or.transition;Or.transition={};try{e()}finally{Or.transition=t}};R.unstable_act=hs;R.useCallback=function(e,t){return me.current.useCallback(e,t)};R.useContext=function(e){return me.current.useContext(e)};R.useDebugValue=function(){};R.useDeferredValue=function(e){return me.current.useDeferredValue(e)};R.useEffect=function(e,t){return me.current.useEffect(e,t)};R.useId=function(){return me.current.useId()};R.useImperativeHandle=function(e,t,n){return me.current.useImperativeHandle(e,t,n)};R.useInsertionEffect=function(e,t){return me.current.useInsertionEffect(e,t)};R.useLayoutEffect=function(e,t){return me.current.useLayoutEffect(e,t)};R.useMemo=function(e,t){return me.current.useMemo(e,t)};R.useReducer=function(e,t,n){return me.current.useReducer(e,t,n)};R.useRef=function(e){return me.current.useRef(e)};R.useState=function(e){return me.current.useState(e)};R.useSyncExternalStore=function(e,t,n){return me.current.useSyncExternalStore(e,t,n)};R.useTransition=function(){return me.current.useTransition()};R.version="18.3.1";is.exports=R;var O=is.exports;const Fc=Sc(O);/**
- * @license React
- * react-jsx-runtime.production.min.js
- *
- * Copyright (c) Facebook, Inc. and its affiliates.
- *
- * This source code is licensed under the MIT license found in the
- * LICENSE file in the root directory of this source tree.
- */var Uc=O,$c=Symbol.for("react.element"),Ac=Symbol.for("react.fragment"),Wc=Object.prototype.hasOwnProperty,Vc=Uc.__SECRET_INTERNALS_DO_NOT_USE_OR_YOU_WILL_BE_FIRED.ReactCurrentOwner,Bc={key:!0,ref:!0,__self:!0,__source:!0};function ms(e,t,n){var r,l={},o=null,i=null;n!==void 0&&(o=""+n),t.key!==void 0&&(o=""+t.key),t.ref!==void 0&&(i=t.ref);for(r in t)Wc.call(t,r)&&!Bc.hasOwnProperty(r)&&(l[r]=t[r]);if(e&&e.defaultProps)for(r in t=e.defaultProps,t)l[r]===void 0&&(l[r]=t[r]);return{$$typeof:$c,type:e,key:o,ref:i,props:l,_owner:Vc.current}}vl.Fragment=Ac;vl.jsx=ms;vl.jsxs=ms;os.exports=vl;var d=os.exports,vs={exports:{}},_e={},gs={exports:{}},ys={};/**
- * @license React
- * scheduler.production.min.js
- *
- * Copyright (c) Facebook, Inc. and its affiliates.
- *
- * This source code is licensed under the MIT license found in the
- * LICENSE file in the root directory of this source tree.
- */(function(e){function t(C,T){var L=C.length;C.push(T);e:for(;0<L;){var W=L-1>>>1,G=C[W];if(0<l(G,T))C[W]=T,C[L]=G,L=W;else break e}}function n(C){return C.length===0?null:C[0]}function r(C){if(C.length===0)return null;var T=C[0],L=C.pop();if(L!==T){C[0]=L;e:for(var W=0,G=C.length,st=G>>>1;W<st;){var Ge=2*(W+1)-1,v=C[Ge],z=Ge+1,V=C[z];if(0>l(v,L))z<G&&0>l(V,v)?(C[W]=V,C[z]=L,W=z):(C[W]=v,C[Ge]=L,W=Ge);else if(z<G&&0>l(V,L))C[W]=V,C[z]=L,W=z;else break e}}return T}function l(C,T){var L=C.sortIndex-T.sortIndex;return L!==0?L:C.id-T.id}if(typeof performance=="object"&&typeof performance.now=="function"){var o=performance;e.unstable_now=function(){return o.now()}}else{var i=Date,u=i.now();e.unstable_now=function(){return i.now()-u}}var s=[],c=[],g=1,m=null,h=3,x=!1,S=!1,k=!1,F=typeof setTimeout=="function"?setTimeout:null,f=typeof clearTimeout=="function"?clearTimeout:null,a=typeof setImmediate<"u"?setImmediate:null;typeof navigator<"u"&&navigator.scheduling!==void 0&&navigator.scheduling.isInputPending!==void 0&&navigator.scheduling.isInputPending.bind(navigator.scheduling);function p(C){for(var T=n(c);T!==null;){if(T.callback===null)r(c);else if(T.startTime<=C)r(c),T.sortIndex=T.expirationTime,t(s,T);else break;T=n(c)}}function y(C){if(k=!1,p(C),!S)if(n(s)!==null)S=!0,We(E);else{var T=n(c);T!==null&&ut(y,T.startTime-C)}}function E(C,T){S=!1,k&&(k=!1,f(P),P=-1),x=!0;var L=h;try{for(p(T),m=n(s);m!==null&&(!(m.expirationTime>T)||C&&!fe());){var W=m.callback;if(typeof W=="function"){m.callback=null,h=m.priorityLevel;var G=W(m.expirationTime<=T);T=e.unstable_now(),typeof G=="function"?m.callback=G:m===n(s)&&r(s),p(T)}else r(s);m=n(s)}if(m!==null)var st=!0;else{var Ge=n(c);Ge!==null&&ut(y,Ge.startTime-T),st=!1}return st}finally{m=null,h=L,x=!1}}var _=!1,j=null,P=-1,H=5,M=-1;function fe(){return!(e.unstable_now()-M<H)}function Dt(){if(j!==null){var C=e.unstable_now();M=C;var T=!0;try{T=j(!0,C)}finally{T?Xe():(_=!1,j=null)}}else _=!1}var Xe;if(typeof a=="function")Xe=function(){a(Dt)};else if(typeof MessageChannel<"u"){var Zt=new MessageChannel,vr=Zt.port2;Zt.port1.onmessage=Dt,Xe=function(){vr.postMessage(null)}}else Xe=function(){F(Dt,0)};function We(C){j=C,_||(_=!0,Xe())}function ut(C,T){P=F(function(){C(e.unstable_now())},T)}e.unstable_IdlePriority=5,e.unstable_ImmediatePriority=1,e.unstable_LowPriority=4,e.unstable_NormalPriority=3,e.unstable_Profiling=null,e.unstable_UserBlockingPriority=2,e.unstable_cancelCallback=function(C){C.callback=null},e.unstable_continueExecution=function(){S||x||(S=!0,We(E))},e.unstable_forceFrameRate=function(C){0>C||125<C?console.error("forceFrameRate takes a positive int between 0 and 125, forcing frame rates higher than 125 fps is not supported"):H=0<C?Math.floor(1e3/C):5},e.unstable_getCurrentPriorityLevel=function(){return h},e.unstable_getFirstCallbackNode=function(){return n(s)},e.unstable_next=function(C){switch(h){case 1:case 2:case 3:var T=3;break;default:T=h}var L=h;h=T;try{return C()}finally{h=L}},e.unstable_pauseExecution=function(){},e.unstable_requestPaint=function(){},e.unstable_runWithPriority=function(C,T){switch(C){case 1:case 2:case 3:case 4:case 5:break;default:C=3}var L=h;h=C;try{return T()}finally{h=L}},e.unstable_scheduleCallback=function(C,T,L){var W=e.unstable_now();switch(typeof L=="object"&&L!==null?(L=L.delay,L=typeof L=="number"&&0<L?W+L:W):L=W,C){case 1:var G=-1;break;case 2:G=250;break;case 5:G=1073741823;break;case 4:G=1e4;break;default:G=5e3}return G=L+G,C={id:g++,callback:T,priorityLevel:C,startTime:L,expirationTime:G,sortIndex:-1},L>W?(C.sortIndex=L,t(c,C),n(s)===null&&C===n(c)&&(k?(f(P),P=-1):k=!0,ut(y,L-W))):(C.sortIndex=G,t(s,C),S||x||(S=!0,We(E))),C},e.unstable_shouldYield=fe,e.unstable_wrapCallback=function(C){var T=h;return function(){var L=h;h=T;try{return C.apply(this,arguments)}finally{h=L}}}})(ys);gs.exports=ys;var Hc=gs.exports;/**
- * @license React
- * react-dom.production.min.js
- *
- * Copyright (c) Facebook, Inc. and its affiliates.
- *
- * This source code is licensed under the MIT license found in the
- * LICENSE file in the root directory of this source tree.
- */var Qc=O,Ne=Hc;function w(e){for(var t="https://reactjs.org/docs/error-decoder.html?invariant="+e,n=1;n<arguments.length;n++)t+="&args[]="+encodeURIComponent(arguments[n]);return"Minified React error #"+e+"; visit "+t+" for the full message or use the non-minified dev environment for full errors and additional helpful warnings."}var ws=new Set,Xn={};function Xt(e,t){gn(e,t),gn(e+"Capture",t)}function gn(e,t){for(Xn[e]=t,e=0;e<t.length;e++)ws.add(t[e])}var nt=!(typeof window>"u"||typeof window.document>"u"||typeof window.document.createElement>"u"),io=Object.prototype.hasOwnProperty,Kc=/^[:A-Z_a-z\u00C0-\u00D6\u00D8-\u00F6\u00F8-\u02FF\u0370-\u037D\u037F-\u1FFF\u200C-\u200D\u2070-\u218F\u2C00-\u2FEF\u3001-\uD7FF\uF900-\uFDCF\uFDF0-\uFFFD][:A-Z_a-z\u00C0-\u00D6\u00D8-\u00F6\u00F8-\u02FF\u0370-\u037D\u037F-\u1FFF\u200C-\u200D\u2070-\u218F\u2C00-\u2FEF\u3001-\uD7FF\uF900-\uFDCF\uFDF0-\uFFFD\-.0-9\u00B7\u0300-\u036F\u203F-\u2040]*$/,Ji={},qi={};function Yc(e){return io.call(qi,e)?!0:io.call(Ji,e)?!1:Kc.test(e)?qi[e]=!0:(Ji[e]=!0,!1)}function Xc(e,t,n,r){if(n!==null&&n.type===0)return!1;switch(typeof t){case"function":case"symbol":return!0;case"boolean":return r?!1:n!==null?!n.acceptsBooleans:(e=e.toLowerCase().slice(0,5),e!=="data-"&&e!=="aria-");default:return!1}}function Gc(e,t,n,r){if(t===null||typeof t>"u"||Xc(e,t,n,r))return!0;if(r)return!1;if(n!==null)switch(n.type){case 3:return!t;case 4:return t===!1;case 5:return isNaN(t);case 6:return isNaN(t)||1>t}return!1}function ve(e,t,n,r,l,o,i){this.acceptsBooleans=t===2||t===3||t===4,this.attributeName=r,this.attributeNamespace=l,this.mustUseProperty=n,this.propertyName=e,this.type=t,this.sanitizeURL=o,this.removeEmptyString=i}var ie={};"children dangerouslySetInnerHTML defaultValue defaultChecked innerHTML suppressContentEditableWarning suppressHydrationWarning style".split(" ").forEach(function(e){ie[e]=new ve(e,0,!1,e,null,!1,!1)});[["acceptCharset","accept-charset"],["className","class"],["htmlFor","for"],["httpEquiv","http-equiv"]].forEach(function(e){var t=e[0];ie[t]=new ve(t,1,!1,e[1],null,!1,!1)});["contentEditable","draggable","spellCheck","value"].forEach(function(e){ie[e]=new ve(e,2,!1,e.toLowerCase(),null,!1,!1)});["autoReverse","externalResourcesRequired","focusable","preserveAlpha"].forEach(function(e){ie[e]=new ve(e,2,!1,e,null,!1,!1)});"allowFullScreen async autoFocus autoPlay controls default defer disabled disablePictureInPicture disableRemotePlayback formNoValidate hidden loop noModule noValidate open playsInline readOnly required reversed scoped seamless itemScope".split(" ").forEach(function(e){ie[e]=new ve(e,3,!1,e.toLowerCase(),null,!1,!1)});["checked","multiple","muted","selected"].forEach(function(e){ie[e]=new ve(e,3,!0,e,null,!1,!1)});["capture","download"].forEach(function(e){ie[e]=new ve(e,4,!1,e,null,!1,!1)});["cols","rows","size","span"].forEach(function(e){ie[e]=new ve(e,6,!1,e,null,!1,!1)});["rowSpan","start"].forEach(function(e){ie[e]=new ve(e,5,!1,e.toLowerCase(),null,!1,!1)});var li=/[\-:]([a-z])/g;function oi(e){return e[1].toUpperCase()}"accent-height alignment-baseline arabic-form baseline-shift cap-height clip-path clip-rule color-interpolation color-interpolation-filters color-profile color-rendering dominant-baseline enable-background fill-opacity fill-rule flood-color flood-opacity font-family font-size font-size-adjust font-stretch font-style font-variant font-weight glyph-name glyph-orientation-horizontal glyph-orientation-vertical horiz-adv-x horiz-origin-x image-rendering letter-spacing lighting-color marker-end marker-mid marker-start overline-position overline-thickness paint-order panose-1 pointer-events rendering-intent shape-rendering stop-color stop-opacity strikethrough-position strikethrough-thickness stroke-dasharray stroke-dashoffset stroke-linecap stroke-linejoin stroke-miterlimit stroke-opacity stroke-width text-anchor text-decoration text-rendering underline-position underline-thickness unicode-bidi unicode-range units-per-em v-alphabetic v-hanging v-ideographic v-mathematical vector-effect vert-adv-y vert-origin-x vert-origin-y word-spacing writing-mode xmlns:xlink x-height".split(" ").forEach(function(e){var t=e.replace(li,oi);ie[t]=new ve(t,1,!1,e,null,!1,!1)});"xlink:actuate xlink:arcrole xlink:role xlink:show xlink:title xlink:type".split(" ").forEach(function(e){var t=e.replace(li,oi);ie[t]=new ve(t,1,!1,e,"http://www.w3.org/1999/xlink",!1,!1)});["xml:base","xml:lang","xml:space"].forEach(function(e){var t=e.replace(li,oi);ie[t]=new ve(t,1,!1,e,"http://www.w3.org/XML/1998/namespace",!1,!1)});["tabIndex","crossOrigin"].forEach(function(e){ie[e]=new ve(e,1,!1,e.toLowerCase(),null,!1,!1)});ie.xlinkHref=new ve("xlinkHref",1,!1,"xlink:href","http://www.w3.org/1999/xlink",!0,!1);["src","href","action","formAction"].forEach(function(e){ie[e]=new ve(e,1,!1,e.toLowerCase(),null,!0,!0)});function ii(e,t,n,r){var l=ie.hasOwnProperty(t)?ie[t]:null;(l!==null?l.type!==0:r||!(2<t.length)||t[0]!=="o"&&t[0]!=="O"||t[1]!=="n"&&t[1]!=="N")&&(Gc(t,n,l,r)&&(n=null),r||l===null?Yc(t)&&(n===null?e.removeAttribute(t):e.setAttribute(t,""+n)):l.mustUseProperty?e[l.propertyName]=n===null?l.type===3?!1:"":n:(t=l.attributeName,r=l.attributeNamespace,n===null?e.removeAttribute(t):(l=l.type,n=l===3||l===4&&n===!0?"":""+n,r?e.setAttributeNS(r,t,n):e.setAttribute(t,n))))}var it=Qc.__SECRET_INTERNALS_DO_NOT_USE_OR_YOU_WILL_BE_FIRED,yr=Symbol.for("react.element"),qt=Symbol.for("react.portal"),bt=Symbol.for("react.fragment"),ui=Symbol.for("react.strict_mode"),uo=Symbol.for("react.profiler"),xs=Symbol.for("react.provider"),Ss=Symbol.for("react.context"),si=Symbol.for("react.forward_ref"),so=Symbol.for("react.suspense"),ao=Symbol.for("react.suspense_list"),ai=Symbol.for("react.memo"),dt=Symbol.for("react.lazy"),ks=Symbol.for("react.offscreen"),bi=Symbol.iterator;function jn(e){return e===null||typeof e!="object"?null:(e=bi&&e[bi]||e["@@iterator"],typeof e=="function"?e:null)}var Y=Object.assign,Ol;function On(e){if(Ol===void 0)try{throw Error()}catch(n){var t=n.stack.trim().match(/\n( *(at )?)/);Ol=t&&t[1]||""}return`
-`+Ol+e}var Il=!1;function Fl(e,t){if(!e||Il)return"";Il=!0;var n=Error.prepareStackTrace;Error.prepareStackTrace=void 0;try{if(t)if(t=function(){throw Error()},Object.defineProperty(t.prototype,"props",{set:function(){throw Error()}}),typeof Reflect=="object"&&Reflect.construct){try{Reflect.construct(t,[])}catch(c){var r=c}Reflect.construct(e,[],t)}else{try{t.call()}catch(c){r=c}e.call(t.prototype)}else{try{throw Error()}catch(c){r=c}e()}}catch(c){if(c&&r&&typeof c.stack=="string"){for(var l=c.stack.split(`
-`),o=r.stack.split(`
-`),i=l.length-1,u=o.length-1;1<=i&&0<=u&&l[i]!==o[u];)u--;for(;1<=i&&0<=u;i--,u--)if(l[i]!==o[u]){if(i!==1||u!==1)do if(i--,u--,0>u||l[i]!==o[u]){var s=`
-`+l[i].replace(" at new "," at ");return e.displayName&&s.includes("<anonymous>")&&(s=s.replace("<anonymous>",e.displayName)),s}while(1<=i&&0<=u);break}}}finally{Il=!1,Error.prepareStackTrace=n}return(e=e?e.displayName||e.name:"")?On(e):""}function Zc(e){switch(e.tag){case 5:return On(e.type);case 16:return On("Lazy");case 13:return On("Suspense");case 19:return On("SuspenseList");case 0:case 2:case 15:return e=Fl(e.type,!1),e;case 11:return e=Fl(e.type.render,!1),e;case 1:return e=Fl(e.type,!0),e;default:return""}}function co(e){if(e==null)return null;if(typeof e=="function")return e.displayName||e.name||null;if(typeof e=="string")return e;switch(e){case bt:return"Fragment";case qt:return"Portal";case uo:return"Profiler";case ui:return"StrictMode";case so:return"Suspense";case ao:return"SuspenseList"}if(typeof e=="object")switch(e.$$typeof){case Ss:return(e.displayName||"Context")+".Consumer";case xs:return(e._context.displayName||"Context")+".Provider";case si:var t=e.render;return e=e.displayName,e||(e=t.displayName||t.name||"",e=e!==""?"ForwardRef("+e+")":"ForwardRef"),e;case ai:return t=e.displayName||null,t!==null?t:co(e.type)||"Memo";case dt:t=e._payload,e=e._init;try{return co(e(t))}catch{}}return null}function Jc(e){var t=e.type;switch(e.tag){case 24:return"Cache";case 9:return(t.displayName||"Context")+".Consumer";case 10:return(t._context.displayName||"Context")+".Provider";case 18:return"DehydratedFragment";case 11:return e=t.render,e=e.displayName||e.name||"",t.displayName||(e!==""?"ForwardRef("+e+")":"ForwardRef");case 7:return"Fragment";case 5:return t;case 4:return"Portal";case 3:return"Root";case 6:return"Text";case 16:return co(t);case 8:return t===ui?"StrictMode":"Mode";case 22:return"Offscreen";case 12:return"Profiler";case 21:return"Scope";case 13:return"Suspense";case 19:return"SuspenseList";case 25:return"TracingMarker";case 1:case 0:case 17:case 2:case 14:case 15:if(typeof t=="function")return t.displayName||t.name||null;if(typeof t=="string")return t}return null}function Tt(e){switch(typeof e){case"boolean":case"number":case"string":case"undefined":return e;case"object":return e;default:return""}}function Es(e){var t=e.type;return(e=e.nodeName)&&e.toLowerCase()==="input"&&(t==="checkbox"||t==="radio")}function qc(e){var t=Es(e)?"checked":"value",n=Object.getOwnPropertyDescriptor(e.constructor.prototype,t),r=""+e[t];if(!e.hasOwnProperty(t)&&typeof n<"u"&&typeof n.get=="function"&&typeof n.set=="function"){var l=n.get,o=n.set;return Object.defineProperty(e,t,{configurable:!0,get:function(){return l.call(this)},set:function(i){r=""+i,o.call(this,i)}}),Object.defineProperty(e,t,{enumerable:n.enumerable}),{getValue:function(){return r},setValue:function(i){r=""+i},stopTracking:function(){e._valueTracker=null,delete e[t]}}}}function wr(e){e._valueTracker||(e._valueTracker=qc(e))}function Cs(e){if(!e)return!1;var t=e._valueTracker;if(!t)return!0;var n=t.getValue(),r="";return e&&(r=Es(e)?e.checked?"true":"false":e.value),e=r,e!==n?(t.setValue(e),!0):!1}function Kr(e){if(e=e||(typeof document<"u"?document:void 0),typeof e>"u")return null;try{return e.activeElement||e.body}catch{return e.body}}function fo(e,t){var n=t.checked;return Y({},t,{defaultChecked:void 0,defaultValue:void 0,value:void 0,checked:n??e._wrapperState.initialChecked})}function eu(e,t){var n=t.defaultValue==null?"":t.defaultValue,r=t.checked!=null?t.checked:t.defaultChecked;n=Tt(t.value!=null?t.value:n),e._wrapperState={initialChecked:r,initialValue:n,controlled:t.type==="checkbox"||t.type==="radio"?t.checked!=null:t.value!=null}}function Ns(e,t){t=t.checked,t!=null&&ii(e,"checked",t,!1)}function po(e,t){Ns(e,t);var n=Tt(t.value),r=t.type;if(n!=null)r==="number"?(n===0&&e.value===""||e.value!=n)&&(e.value=""+n):e.value!==""+n&&(e.value=""+n);else if(r==="submit"||r==="reset"){e.removeAttribute("value");return}t.hasOwnProperty("value")?ho(e,t.type,n):t.hasOwnProperty("defaultValue")&&ho(e,t.type,Tt(t.defaultValue)),t.checked==null&&t.defaultChecked!=null&&(e.defaultChecked=!!t.defaultChecked)}function tu(e,t,n){if(t.hasOwnProperty("value")||t.hasOwnProperty("defaultValue")){var r=t.type;if(!(r!=="submit"&&r!=="reset"||t.value!==void 0&&t.value!==null))return;t=""+e._wrapperState.initialValue,n||t===e.value||(e.value=t),e.defaultValue=t}n=e.name,n!==""&&(e.name=""),e.defaultChecked=!!e._wrapperState.initialChecked,n!==""&&(e.name=n)}function ho(e,t,n){(t!=="number"||Kr(e.ownerDocument)!==e)&&(n==null?e.defaultValue=""+e._wrapperState.initialValue:e.defaultValue!==""+n&&(e.defaultValue=""+n))}var In=Array.isArray;function fn(e,t,n,r){if(e=e.options,t){t={};for(var l=0;l<n.length;l++)t["$"+n[l]]=!0;for(n=0;n<e.length;n++)l=t.hasOwnProperty("$"+e[n].value),e[n].selected!==l&&(e[n].selected=l),l&&r&&(e[n].defaultSelected=!0)}else{for(n=""+Tt(n),t=null,l=0;l<e.length;l++){if(e[l].value===n){e[l].selected=!0,r&&(e[l].defaultSelected=!0);return}t!==null||e[l].disabled||(t=e[l])}t!==null&&(t.selected=!0)}}function mo(e,t){if(t.dangerouslySetInnerHTML!=null)throw Error(w(91));return Y({},t,{value:void 0,defaultValue:void 0,children:""+e._wrapperState.initialValue})}function nu(e,t){var n=t.value;if(n==null){if(n=t.children,t=t.defaultValue,n!=null){if(t!=null)throw Error(w(92));if(In(n)){if(1<n.length)throw Error(w(93));n=n[0]}t=n}t==null&&(t=""),n=t}e._wrapperState={initialValue:Tt(n)}}function _s(e,t){var n=Tt(t.value),r=Tt(t.defaultValue);n!=null&&(n=""+n,n!==e.value&&(e.value=n),t.defaultValue==null&&e.defaultValue!==n&&(e.defaultValue=n)),r!=null&&(e.defaultValue=""+r)}function ru(e){var t=e.textContent;t===e._wrapperState.initialValue&&t!==""&&t!==null&&(e.value=t)}function js(e){switch(e){case"svg":return"http://www.w3.org/2000/svg";case"math":return"http://www.w3.org/1998/Math/MathML";default:return"http://www.w3.org/1999/xhtml"}}function vo(e,t){return e==null||e==="http://www.w3.org/1999/xhtml"?js(t):e==="http://www.w3.org/2000/svg"&&t==="foreignObject"?"http://www.w3.org/1999/xhtml":e}var xr,Ps=function(e){return typeof MSApp<"u"&&MSApp.execUnsafeLocalFunction?function(t,n,r,l){MSApp.execUnsafeLocalFunction(function(){return e(t,n,r,l)})}:e}(function(e,t){if(e.namespaceURI!=="http://www.w3.org/2000/svg"||"innerHTML"in e)e.innerHTML=t;else{for(xr=xr||document.createElement("div"),xr.innerHTML="<svg>"+t.valueOf().toString()+"</svg>",t=xr.firstChild;e.firstChild;)e.removeChild(e.firstChild);for(;t.firstChild;)e.appendChild(t.firstChild)}});function Gn(e,t){if(t){var n=e.firstChild;if(n&&n===e.lastChild&&n.nodeType===3){n.nodeValue=t;return}}e.textContent=t}var $n={animationIterationCount:!0,aspectRatio:!0,borderImageOutset:!0,borderImageSlice:!0,borderImageWidth:!0,boxFlex:!0,boxFlexGroup:!0,boxOrdinalGroup:!0,columnCount:!0,columns:!0,flex:!0,flexGrow:!0,flexPositive:!0,flexShrink:!0,flexNegative:!0,flexOrder:!0,gridArea:!0,gridRow:!0,gridRowEnd:!0,gridRowSpan:!0,gridRowStart:!0,gridColumn:!0,gridColumnEnd:!0,gridColumnSpan:!0,gridColumnStart:!0,fontWeight:!0,lineClamp:!0,lineHeight:!0,opacity:!0,order:!0,orphans:!0,tabSize:!0,widows:!0,zIndex:!0,zoom:!0,fillOpacity:!0,floodOpacity:!0,stopOpacity:!0,strokeDasharray:!0,strokeDashoffset:!0,strokeMiterlimit:!0,strokeOpacity:!0,strokeWidth:!0},bc=["Webkit","ms","Moz","O"];Object.keys($n).forEach(function(e){bc.forEach(function(t){t=t+e.charAt(0).toUpperCase()+e.substring(1),$n[t]=$n[e]})});function Ts(e,t,n){return t==null||typeof t=="boolean"||t===""?"":n||typeof t!="number"||t===0||$n.hasOwnProperty(e)&&$n[e]?(""+t).trim():t+"px"}function zs(e,t){e=e.style;for(var n in t)if(t.hasOwnProperty(n)){var r=n.indexOf("--")===0,l=Ts(n,t[n],r);n==="float"&&(n="cssFloat"),r?e.setProperty(n,l):e[n]=l}}var ef=Y({menuitem:!0},{area:!0,base:!0,br:!0,col:!0,embed:!0,hr:!0,img:!0,input:!0,keygen:!0,link:!0,meta:!0,param:!0,source:!0,track:!0,wbr:!0});function go(e,t){if(t){if(ef[e]&&(t.children!=null||t.dangerouslySetInnerHTML!=null))throw Error(w(137,e));if(t.dangerouslySetInnerHTML!=null){if(t.children!=null)throw Error(w(60));if(typeof t.dangerouslySetInnerHTML!="object"||!("__html"in t.dangerouslySetInnerHTML))throw Error(w(61))}if(t.style!=null&&typeof t.style!="object")throw Error(w(62))}}function yo(e,t){if(e.indexOf("-")===-1)return typeof t.is=="string";switch(e){case"annotation-xml":case"color-profile":case"font-face":case"font-face-src":case"font-face-uri":case"font-face-format":case"font-face-name":case"missing-glyph":return!1;default:return!0}}var wo=null;function ci(e){return e=e.target||e.srcElement||window,e.correspondingUseElement&&(e=e.correspondingUseElement),e.nodeType===3?e.parentNode:e}var xo=null,dn=null,pn=null;function lu(e){if(e=hr(e)){if(typeof xo!="function")throw Error(w(280));var t=e.stateNode;t&&(t=Sl(t),xo(e.stateNode,e.type,t))}}function Ls(e){dn?pn?pn.push(e):pn=[e]:dn=e}function Ms(){if(dn){var e=dn,t=pn;if(pn=dn=null,lu(e),t)for(e=0;e<t.length;e++)lu(t[e])}}function Rs(e,t){return e(t)}function Ds(){}var Ul=!1;function Os(e,t,n){if(Ul)return e(t,n);Ul=!0;try{return Rs(e,t,n)}finally{Ul=!1,(dn!==null||pn!==null)&&(Ds(),Ms())}}function Zn(e,t){var n=e.stateNode;if(n===null)return null;var r=Sl(n);if(r===null)return null;n=r[t];e:switch(t){case"onClick":case"onClickCapture":case"onDoubleClick":case"onDoubleClickCapture":case"onMouseDown":case"onMouseDownCapture":case"onMouseMove":case"onMouseMoveCapture":case"onMouseUp":case"onMouseUpCapture":case"onMouseEnter":(r=!r.disabled)||(e=e.type,r=!(e==="button"||e==="input"||e==="select"||e==="textarea")),e=!r;break e;default:e=!1}if(e)return null;if(n&&typeof n!="function")throw Error(w(231,t,typeof n));return n}var So=!1;if(nt)try{var Pn={};Object.defineProperty(Pn,"passive",{get:function(){So=!0}}),window.addEventListener("test",Pn,Pn),window.removeEventListener("test",Pn,Pn)}catch{So=!1}function tf(e,t,n,r,l,o,i,u,s){var c=Array.prototype.slice.call(arguments,3);try{t.apply(n,c)}catch(g){this.onError(g)}}var An=!1,Yr=null,Xr=!1,ko=null,nf={onError:function(e){An=!0,Yr=e}};function rf(e,t,n,r,l,o,i,u,s){An=!1,Yr=null,tf.apply(nf,arguments)}function lf(e,t,n,r,l,o,i,u,s){if(rf.apply(this,arguments),An){if(An){var c=Yr;An=!1,Yr=null}else throw Error(w(198));Xr||(Xr=!0,ko=c)}}function Gt(e){var t=e,n=e;if(e.alternate)for(;t.return;)t=t.return;else{e=t;do t=e,t.flags&4098&&(n=t.return),e=t.return;while(e)}return t.tag===3?n:null}function Is(e){if(e.tag===13){var t=e.memoizedState;if(t===null&&(e=e.alternate,e!==null&&(t=e.memoizedState)),t!==null)return t.dehydrated}return null}function ou(e){if(Gt(e)!==e)throw Error(w(188))}function of(e){var t=e.alternate;if(!t){if(t=Gt(e),t===null)throw Error(w(188));return t!==e?null:e}for(var n=e,r=t;;){var l=n.return;if(l===null)break;var o=l.alternate;if(o===null){if(r=l.return,r!==null){n=r;continue}break}if(l.child===o.child){for(o=l.child;o;){if(o===n)return ou(l),e;if(o===r)return ou(l),t;o=o.sibling}throw Error(w(188))}if(n.return!==r.return)n=l,r=o;else{for(var i=!1,u=l.child;u;){if(u===n){i=!0,n=l,r=o;break}if(u===r){i=!0,r=l,n=o;break}u=u.sibling}if(!i){for(u=o.child;u;){if(u===n){i=!0,n=o,r=l;break}if(u===r){i=!0,r=o,n=l;break}u=u.sibling}if(!i)throw Error(w(189))}}if(n.alternate!==r)throw Error(w(190))}if(n.tag!==3)throw Error(w(188));return n.stateNode.current===n?e:t}function Fs(e){return e=of(e),e!==null?Us(e):null}function Us(e){if(e.tag===5||e.tag===6)return e;for(e=e.child;e!==null;){var t=Us(e);if(t!==null)return t;e=e.sibling}return null}var $s=Ne.unstable_scheduleCallback,iu=Ne.unstable_cancelCallback,uf=Ne.unstable_shouldYield,sf=Ne.unstable_requestPaint,Z=Ne.unstable_now,af=Ne.unstable_getCurrentPriorityLevel,fi=Ne.unstable_ImmediatePriority,As=Ne.unstable_UserBlockingPriority,Gr=Ne.unstable_NormalPriority,cf=Ne.unstable_LowPriority,Ws=Ne.unstable_IdlePriority,gl=null,Ke=null;function ff(e){if(Ke&&typeof Ke.onCommitFiberRoot=="function")try{Ke.onCommitFiberRoot(gl,e,void 0,(e.current.flags&128)===128)}catch{}}var Ue=Math.clz32?Math.clz32:hf,df=Math.log,pf=Math.LN2;function hf(e){return e>>>=0,e===0?32:31-(df(e)/pf|0)|0}var Sr=64,kr=4194304;function Fn(e){switch(e&-e){case 1:return 1;case 2:return 2;case 4:return 4;case 8:return 8;case 16:return 16;case 32:return 32;case 64:case 128:case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:return e&4194240;case 4194304:case 8388608:case 16777216:case 33554432:case 67108864:return e&130023424;case 134217728:return 134217728;case 268435456:return 268435456;case 536870912:return 536870912;case 1073741824:return 1073741824;default:return e}}function Zr(e,t){var n=e.pendingLanes;if(n===0)return 0;var r=0,l=e.suspendedLanes,o=e.pingedLanes,i=n&268435455;if(i!==0){var u=i&~l;u!==0?r=Fn(u):(o&=i,o!==0&&(r=Fn(o)))}else i=n&~l,i!==0?r=Fn(i):o!==0&&(r=Fn(o));if(r===0)return 0;if(t!==0&&t!==r&&!(t&l)&&(l=r&-r,o=t&-t,l>=o||l===16&&(o&4194240)!==0))return t;if(r&4&&(r|=n&16),t=e.entangledLanes,t!==0)for(e=e.entanglements,t&=r;0<t;)n=31-Ue(t),l=1<<n,r|=e[n],t&=~l;return r}function mf(e,t){switch(e){case 1:case 2:case 4:return t+250;case 8:case 16:case 32:case 64:case 128:case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:return t+5e3;case 4194304:case 8388608:case 16777216:case 33554432:case 67108864:return-1;case 134217728:case 268435456:case 536870912:case 1073741824:return-1;default:return-1}}function vf(e,t){for(var n=e.suspendedLanes,r=e.pingedLanes,l=e.expirationTimes,o=e.pendingLanes;0<o;){var i=31-Ue(o),u=1<<i,s=l[i];s===-1?(!(u&n)||u&r)&&(l[i]=mf(u,t)):s<=t&&(e.expiredLanes|=u),o&=~u}}function Eo(e){return e=e.pendingLanes&-1073741825,e!==0?e:e&1073741824?1073741824:0}function Vs(){var e=Sr;return Sr<<=1,!(Sr&4194240)&&(Sr=64),e}function $l(e){for(var t=[],n=0;31>n;n++)t.push(e);return t}function dr(e,t,n){e.pendingLanes|=t,t!==536870912&&(e.suspendedLanes=0,e.pingedLanes=0),e=e.eventTimes,t=31-Ue(t),e[t]=n}function gf(e,t){var n=e.pendingLanes&~t;e.pendingLanes=t,e.suspendedLanes=0,e.pingedLanes=0,e.expiredLanes&=t,e.mutableReadLanes&=t,e.entangledLanes&=t,t=e.entanglements;var r=e.eventTimes;for(e=e.expirationTimes;0<n;){var l=31-Ue(n),o=1<<l;t[l]=0,r[l]=-1,e[l]=-1,n&=~o}}function di(e,t){var n=e.entangledLanes|=t;for(e=e.entanglements;n;){var r=31-Ue(n),l=1<<r;l&t|e[r]&t&&(e[r]|=t),n&=~l}}var I=0;function Bs(e){return e&=-e,1<e?4<e?e&268435455?16:536870912:4:1}var Hs,pi,Qs,Ks,Ys,Co=!1,Er=[],St=null,kt=null,Et=null,Jn=new Map,qn=new Map,vt=[],yf="mousedown mouseup touchcancel touchend touchstart auxclick dblclick pointercancel pointerdown pointerup dragend dragstart drop compositionend compositionstart keydown keypress keyup input textInput copy cut paste click change contextmenu reset submit".split(" ");function uu(e,t){switch(e){case"focusin":case"focusout":St=null;break;case"dragenter":case"dragleave":kt=null;break;case"mouseover":case"mouseout":Et=null;break;case"pointerover":case"pointerout":Jn.delete(t.pointerId);break;case"gotpointercapture":case"lostpointercapture":qn.delete(t.pointerId)}}function Tn(e,t,n,r,l,o){return e===null||e.nativeEvent!==o?(e={blockedOn:t,domEventName:n,eventSystemFlags:r,nativeEvent:o,targetContainers:[l]},t!==null&&(t=hr(t),t!==null&&pi(t)),e):(e.eventSystemFlags|=r,t=e.targetContainers,l!==null&&t.indexOf(l)===-1&&t.push(l),e)}function wf(e,t,n,r,l){switch(t){case"focusin":return St=Tn(St,e,t,n,r,l),!0;case"dragenter":return kt=Tn(kt,e,t,n,r,l),!0;case"mouseover":return Et=Tn(Et,e,t,n,r,l),!0;case"pointerover":var o=l.pointerId;return Jn.set(o,Tn(Jn.get(o)||null,e,t,n,r,l)),!0;case"gotpointercapture":return o=l.pointerId,qn.set(o,Tn(qn.get(o)||null,e,t,n,r,l)),!0}return!1}function Xs(e){var t=Ut(e.target);if(t!==null){var n=Gt(t);if(n!==null){if(t=n.tag,t===13){if(t=Is(n),t!==null){e.blockedOn=t,Ys(e.priority,function(){Qs(n)});return}}else if(t===3&&n.stateNode.current.memoizedState.isDehydrated){e.blockedOn=n.tag===3?n.stateNode.containerInfo:null;return}}}e.blockedOn=null}function Ir(e){if(e.blockedOn!==null)return!1;for(var t=e.targetContainers;0<t.length;){var n=No(e.domEventName,e.eventSystemFlags,t[0],e.nativeEvent);if(n===null){n=e.nativeEvent;var r=new n.constructor(n.type,n);wo=r,n.target.dispatchEvent(r),wo=null}else return t=hr(n),t!==null&&pi(t),e.blockedOn=n,!1;t.shift()}return!0}function su(e,t,n){Ir(e)&&n.delete(t)}function xf(){Co=!1,St!==null&&Ir(St)&&(St=null),kt!==null&&Ir(kt)&&(kt=null),Et!==null&&Ir(Et)&&(Et=null),Jn.forEach(su),qn.forEach(su)}function zn(e,t){e.blockedOn===t&&(e.blockedOn=null,Co||(Co=!0,Ne.unstable_scheduleCallback(Ne.unstable_NormalPriority,xf)))}function bn(e){function t(l){return zn(l,e)}if(0<Er.length){zn(Er[0],e);for(var n=1;n<Er.length;n++){var r=Er[n];r.blockedOn===e&&(r.blockedOn=null)}}for(St!==null&&zn(St,e),kt!==null&&zn(kt,e),Et!==null&&zn(Et,e),Jn.forEach(t),qn.forEach(t),n=0;n<vt.length;n++)r=vt[n],r.blockedOn===e&&(r.blockedOn=null);for(;0<vt.length&&(n=vt[0],n.blockedOn===null);)Xs(n),n.blockedOn===null&&vt.shift()}var hn=it.ReactCurrentBatchConfig,Jr=!0;function Sf(e,t,n,r){var l=I,o=hn.transition;hn.transition=null;try{I=1,hi(e,t,n,r)}finally{I=l,hn.transition=o}}function kf(e,t,n,r){var l=I,o=hn.transition;hn.transition=null;try{I=4,hi(e,t,n,r)}finally{I=l,hn.transition=o}}function hi(e,t,n,r){if(Jr){var l=No(e,t,n,r);if(l===null)Gl(e,t,r,qr,n),uu(e,r);else if(wf(l,e,t,n,r))r.stopPropagation();else if(uu(e,r),t&4&&-1<yf.indexOf(e)){for(;l!==null;){var o=hr(l);if(o!==null&&Hs(o),o=No(e,t,n,r),o===null&&Gl(e,t,r,qr,n),o===l)break;l=o}l!==null&&r.stopPropagation()}else Gl(e,t,r,null,n)}}var qr=null;function No(e,t,n,r){if(qr=null,e=ci(r),e=Ut(e),e!==null)if(t=Gt(e),t===null)e=null;else if(n=t.tag,n===13){if(e=Is(t),e!==null)return e;e=null}else if(n===3){if(t.stateNode.current.memoizedState.isDehydrated)return t.tag===3?t.stateNode.containerInfo:null;e=null}else t!==e&&(e=null);return qr=e,null}function Gs(e){switch(e){case"cancel":case"click":case"close":case"contextmenu":case"copy":case"cut":case"auxclick":case"dblclick":case"dragend":case"dragstart":case"drop":case"focusin":case"focusout":case"input":case"invalid":case"keydown":case"keypress":case"keyup":case"mousedown":case"mouseup":case"paste":case"pause":case"play":case"pointercancel":case"pointerdown":case"pointerup":case"ratechange":case"reset":case"resize":case"seeked":case"submit":case"touchcancel":case"touchend":case"touchstart":case"volumechange":case"change":case"selectionchange":case"textInput":case"compositionstart":case"compositionend":case"compositionupdate":case"beforeblur":case"afterblur":case"beforeinput":case"blur":case"fullscreenchange":case"focus":case"hashchange":case"popstate":case"select":case"selectstart":return 1;case"drag":case"dragenter":case"dragexit":case"dragleave":case"dragover":case"mousemove":case"mouseout":case"mouseover":case"pointermove":case"pointerout":case"pointerover":case"scroll":case"toggle":case"touchmove":case"wheel":case"mouseenter":case"mouseleave":case"pointerenter":case"pointerleave":return 4;case"message":switch(af()){case fi:return 1;case As:return 4;case Gr:case cf:return 16;case Ws:return 536870912;default:return 16}default:return 16}}var wt=null,mi=null,Fr=null;function Zs(){if(Fr)return Fr;var e,t=mi,n=t.length,r,l="value"in wt?wt.value:wt.textContent,o=l.length;for(e=0;e<n&&t[e]===l[e];e++);var i=n-e;for(r=1;r<=i&&t[n-r]===l[o-r];r++);return Fr=l.slice(e,1<r?1-r:void 0)}function Ur(e){var t=e.keyCode;return"charCode"in e?(e=e.charCode,e===0&&t===13&&(e=13)):e=t,e===10&&(e=13),32<=e||e===13?e:0}function Cr(){return!0}function au(){return!1}function je(e){function t(n,r,l,o,i){this._reactName=n,this._targetInst=l,this.type=r,this.nativeEvent=o,this.target=i,this.currentTarget=null;for(var u in e)e.hasOwnProperty(u)&&(n=e[u],this[u]=n?n(o):o[u]);return this.isDefaultPrevented=(o.defaultPrevented!=null?o.defaultPrevented:o.returnValue===!1)?Cr:au,this.isPropagationStopped=au,this}return Y(t.prototype,{preventDefault:function(){this.defaultPrevented=!0;var n=this.nativeEvent;n&&(n.preventDefault?n.preventDefault():typeof n.returnValue!="unknown"&&(n.returnValue=!1),this.isDefaultPrevented=Cr)},stopPropagation:function(){var n=this.nativeEvent;n&&(n.stopPropagation?n.stopPropagation():typeof n.cancelBubble!="unknown"&&(n.cancelBubble=!0),this.isPropagationStopped=Cr)},persist:function(){},isPersistent:Cr}),t}var Nn={eventPhase:0,bubbles:0,cancelable:0,timeStamp:function(e){return e.timeStamp||Date.now()},defaultPrevented:0,isTrusted:0},vi=je(Nn),pr=Y({},Nn,{view:0,detail:0}),Ef=je(pr),Al,Wl,Ln,yl=Y({},pr,{screenX:0,screenY:0,clientX:0,clientY:0,pageX:0,pageY:0,ctrlKey:0,shiftKey:0,altKey:0,metaKey:0,getModifierState:gi,button:0,buttons:0,relatedTarget:function(e){return e.relatedTarget===void 0?e.fromElement===e.srcElement?e.toElement:e.fromElement:e.relatedTarget},movementX:function(e){return"movementX"in e?e.movementX:(e!==Ln&&(Ln&&e.type==="mousemove"?(Al=e.screenX-Ln.screenX,Wl=e.screenY-Ln.screenY):Wl=Al=0,Ln=e),Al)},movementY:function(e){return"movementY"in e?e.movementY:Wl}}),cu=je(yl),Cf=Y({},yl,{dataTransfer:0}),Nf=je(Cf),_f=Y({},pr,{relatedTarget:0}),Vl=je(_f),jf=Y({},Nn,{animationName:0,elapsedTime:0,pseudoElement:0}),Pf=je(jf),Tf=Y({},Nn,{clipboardData:function(e){return"clipboardData"in e?e.clipboardData:window.clipboardData}}),zf=je(Tf),Lf=Y({},Nn,{data:0}),fu=je(Lf),Mf={Esc:"Escape",Spacebar:" ",Left:"ArrowLeft",Up:"ArrowUp",Right:"ArrowRight",Down:"ArrowDown",Del:"Delete",Win:"OS",Menu:"ContextMenu",Apps:"ContextMenu",Scroll:"ScrollLock",MozPrintableKey:"Unidentified"},Rf={8:"Backspace",9:"Tab",12:"Clear",13:"Enter",16:"Shift",17:"Control",18:"Alt",19:"Pause",20:"CapsLock",27:"Escape",32:" ",33:"PageUp",34:"PageDown",35:"End",36:"Home",37:"ArrowLeft",38:"ArrowUp",39:"ArrowRight",40:"ArrowDown",45:"Insert",46:"Delete",112:"F1",113:"F2",114:"F3",115:"F4",116:"F5",117:"F6",118:"F7",119:"F8",120:"F9",121:"F10",122:"F11",123:"F12",144:"NumLock",145:"ScrollLock",224:"Meta"},Df={Alt:"altKey",Control:"ctrlKey",Meta:"metaKey",Shift:"shiftKey"};function Of(e){var t=this.nativeEvent;return t.getModifierState?t.getModifierState(e):(e=Df[e])?!!t[e]:!1}function gi(){return Of}var If=Y({},pr,{key:function(e){if(e.key){var t=Mf[e.key]||e.key;if(t!=="Unidentified")return t}return e.type==="keypress"?(e=Ur(e),e===13?"Enter":String.fromCharCode(e)):e.type==="keydown"||e.type==="keyup"?Rf[e.keyCode]||"Unidentified":""},code:0,location:0,ctrlKey:0,shiftKey:0,altKey:0,metaKey:0,repeat:0,locale:0,getModifierState:gi,charCode:function(e){return e.type==="keypress"?Ur(e):0},keyCode:function(e){return e.type==="keydown"||e.type==="keyup"?e.keyCode:0},which:function(e){return e.type==="keypress"?Ur(e):e.type==="keydown"||e.type==="keyup"?e.keyCode:0}}),Ff=je(If),Uf=Y({},yl,{pointerId:0,width:0,height:0,pressure:0,tangentialPressure:0,tiltX:0,tiltY:0,twist:0,pointerType:0,isPrimary:0}),du=je(Uf),$f=Y({},pr,{touches:0,targetTouches:0,changedTouches:0,altKey:0,metaKey:0,ctrlKey:0,shiftKey:0,getModifierState:gi}),Af=je($f),Wf=Y({},Nn,{propertyName:0,elapsedTime:0,pseudoElement:0}),Vf=je(Wf),Bf=Y({},yl,{deltaX:function(e){return"deltaX"in e?e.deltaX:"wheelDeltaX"in e?-e.wheelDeltaX:0},deltaY:function(e){return"deltaY"in e?e.deltaY:"wheelDeltaY"in e?-e.wheelDeltaY:"wheelDelta"in e?-e.wheelDelta:0},deltaZ:0,deltaMode:0}),Hf=je(Bf),Qf=[9,13,27,32],yi=nt&&"CompositionEvent"in window,Wn=null;nt&&"documentMode"in document&&(Wn=document.documentMode);var Kf=nt&&"TextEvent"in window&&!Wn,Js=nt&&(!yi||Wn&&8<Wn&&11>=Wn),pu=" ",hu=!1;function qs(e,t){switch(e){case"keyup":return Qf.indexOf(t.keyCode)!==-1;case"keydown":return t.keyCode!==229;case"keypress":case"mousedown":case"focusout":return!0;default:return!1}}function bs(e){return e=e.detail,typeof e=="object"&&"data"in e?e.data:null}var en=!1;function Yf(e,t){switch(e){case"compositionend":return bs(t);case"keypress":return t.which!==32?null:(hu=!0,pu);case"textInput":return e=t.data,e===pu&&hu?null:e;default:return null}}function Xf(e,t){if(en)return e==="compositionend"||!yi&&qs(e,t)?(e=Zs(),Fr=mi=wt=null,en=!1,e):null;switch(e){case"paste":return null;case"keypress":if(!(t.ctrlKey||t.altKey||t.metaKey)||t.ctrlKey&&t.altKey){if(t.char&&1<t.char.length)return t.char;if(t.which)return String.fromCharCode(t.which)}return null;case"compositionend":return Js&&t.locale!=="ko"?null:t.data;default:return null}}var Gf={color:!0,date:!0,datetime:!0,"datetime-local":!0,email:!0,month:!0,number:!0,password:!0,range:!0,search:!0,tel:!0,text:!0,time:!0,url:!0,week:!0};function mu(e){var t=e&&e.nodeName&&e.nodeName.toLowerCase();return t==="input"?!!Gf[e.type]:t==="textarea"}function ea(e,t,n,r){Ls(r),t=br(t,"onChange"),0<t.length&&(n=new vi("onChange","change",null,n,r),e.push({event:n,listeners:t}))}var Vn=null,er=null;function Zf(e){fa(e,0)}function wl(e){var t=rn(e);if(Cs(t))return e}function Jf(e,t){if(e==="change")return t}var ta=!1;if(nt){var Bl;if(nt){var Hl="oninput"in document;if(!Hl){var vu=document.createElement("div");vu.setAttribute("oninput","return;"),Hl=typeof vu.oninput=="function"}Bl=Hl}else Bl=!1;ta=Bl&&(!document.documentMode||9<document.documentMode)}function gu(){Vn&&(Vn.detachEvent("onpropertychange",na),er=Vn=null)}function na(e){if(e.propertyName==="value"&&wl(er)){var t=[];ea(t,er,e,ci(e)),Os(Zf,t)}}function qf(e,t,n){e==="focusin"?(gu(),Vn=t,er=n,Vn.attachEvent("onpropertychange",na)):e==="focusout"&&gu()}function bf(e){if(e==="selectionchange"||e==="keyup"||e==="keydown")return wl(er)}function ed(e,t){if(e==="click")return wl(t)}function td(e,t){if(e==="input"||e==="change")return wl(t)}function nd(e,t){return e===t&&(e!==0||1/e===1/t)||e!==e&&t!==t}var Ae=typeof Object.is=="function"?Object.is:nd;function tr(e,t){if(Ae(e,t))return!0;if(typeof e!="object"||e===null||typeof t!="object"||t===null)return!1;var n=Object.keys(e),r=Object.keys(t);if(n.length!==r.length)return!1;for(r=0;r<n.length;r++){var l=n[r];if(!io.call(t,l)||!Ae(e[l],t[l]))return!1}return!0}function yu(e){for(;e&&e.firstChild;)e=e.firstChild;return e}function wu(e,t){var n=yu(e);e=0;for(var r;n;){if(n.nodeType===3){if(r=e+n.textContent.length,e<=t&&r>=t)return{node:n,offset:t-e};e=r}e:{for(;n;){if(n.nextSibling){n=n.nextSibling;break e}n=n.parentNode}n=void 0}n=yu(n)}}function ra(e,t){return e&&t?e===t?!0:e&&e.nodeType===3?!1:t&&t.nodeType===3?ra(e,t.parentNode):"contains"in e?e.contains(t):e.compareDocumentPosition?!!(e.compareDocumentPosition(t)&16):!1:!1}function la(){for(var e=window,t=Kr();t instanceof e.HTMLIFrameElement;){try{var n=typeof t.contentWindow.location.href=="string"}catch{n=!1}if(n)e=t.contentWindow;else break;t=Kr(e.document)}return t}function wi(e){var t=e&&e.nodeName&&e.nodeName.toLowerCase();return t&&(t==="input"&&(e.type==="text"||e.type==="search"||e.type==="tel"||e.type==="url"||e.type==="password")||t==="textarea"||e.contentEditable==="true")}function rd(e){var t=la(),n=e.focusedElem,r=e.selectionRange;if(t!==n&&n&&n.ownerDocument&&ra(n.ownerDocument.documentElement,n)){if(r!==null&&wi(n)){if(t=r.start,e=r.end,e===void 0&&(e=t),"selectionStart"in n)n.selectionStart=t,n.selectionEnd=Math.min(e,n.value.length);else if(e=(t=n.ownerDocument||document)&&t.defaultView||window,e.getSelection){e=e.getSelection();var l=n.textContent.length,o=Math.min(r.start,l);r=r.end===void 0?o:Math.min(r.end,l),!e.extend&&o>r&&(l=r,r=o,o=l),l=wu(n,o);var i=wu(n,r);l&&i&&(e.rangeCount!==1||e.anchorNode!==l.node||e.anchorOffset!==l.offset||e.focusNode!==i.node||e.focusOffset!==i.offset)&&(t=t.createRange(),t.setStart(l.node,l.offset),e.removeAllRanges(),o>r?(e.addRange(t),e.extend(i.node,i.offset)):(t.setEnd(i.node,i.offset),e.addRange(t)))}}for(t=[],e=n;e=e.parentNode;)e.nodeType===1&&t.push({element:e,left:e.scrollLeft,top:e.scrollTop});for(typeof n.focus=="function"&&n.focus(),n=0;n<t.length;n++)e=t[n],e.element.scrollLeft=e.left,e.element.scrollTop=e.top}}var ld=nt&&"documentMode"in document&&11>=document.documentMode,tn=null,_o=null,Bn=null,jo=!1;function xu(e,t,n){var r=n.window===n?n.document:n.nodeType===9?n:n.ownerDocument;jo||tn==null||tn!==Kr(r)||(r=tn,"selectionStart"in r&&wi(r)?r={start:r.selectionStart,end:r.selectionEnd}:(r=(r.ownerDocument&&r.ownerDocument.defaultView||window).getSelection(),r={anchorNode:r.anchorNode,anchorOffset:r.anchorOffset,focusNode:r.focusNode,focusOffset:r.focusOffset}),Bn&&tr(Bn,r)||(Bn=r,r=br(_o,"onSelect"),0<r.length&&(t=new vi("onSelect","select",null,t,n),e.push({event:t,listeners:r}),t.target=tn)))}function Nr(e,t){var n={};return n[e.toLowerCase()]=t.toLowerCase(),n["Webkit"+e]="webkit"+t,n["Moz"+e]="moz"+t,n}var nn={animationend:Nr("Animation","AnimationEnd"),animationiteration:Nr("Animation","AnimationIteration"),animationstart:Nr("Animation","AnimationStart"),transitionend:Nr("Transition","TransitionEnd")},Ql={},oa={};nt&&(oa=document.createElement("div").style,"AnimationEvent"in window||(delete nn.animationend.animation,delete nn.animationiteration.animation,delete nn.animationstart.animation),"TransitionEvent"in window||delete nn.transitionend.transition);function xl(e){if(Ql[e])return Ql[e];if(!nn[e])return e;var t=nn[e],n;for(n in t)if(t.hasOwnProperty(n)&&n in oa)return Ql[e]=t[n];return e}var ia=xl("animationend"),ua=xl("animationiteration"),sa=xl("animationstart"),aa=xl("transitionend"),ca=new Map,Su="abort auxClick cancel canPlay canPlayThrough click close contextMenu copy cut drag dragEnd dragEnter dragExit dragLeave dragOver dragStart drop durationChange emptied encrypted ended error gotPointerCapture input invalid keyDown keyPress keyUp load loadedData loadedMetadata loadStart lostPointerCapture mouseDown mouseMove mouseOut mouseOver mouseUp paste pause play playing pointerCancel pointerDown pointerMove pointerOut pointerOver pointerUp progress rateChange reset resize seeked seeking stalled submit suspend timeUpdate touchCancel touchEnd touchStart volumeChange scroll toggle touchMove waiting wheel".split(" ");function Lt(e,t){ca.set(e,t),Xt(t,[e])}for(var Kl=0;Kl<Su.length;Kl++){var Yl=Su[Kl],od=Yl.toLowerCase(),id=Yl[0].toUpperCase()+Yl.slice(1);Lt(od,"on"+id)}Lt(ia,"onAnimationEnd");Lt(ua,"onAnimationIteration");Lt(sa,"onAnimationStart");Lt("dblclick","onDoubleClick");Lt("focusin","onFocus");Lt("focusout","onBlur");Lt(aa,"onTransitionEnd");gn("onMouseEnter",["mouseout","mouseover"]);gn("onMouseLeave",["mouseout","mouseover"]);gn("onPointerEnter",["pointerout","pointerover"]);gn("onPointerLeave",["pointerout","pointerover"]);Xt("onChange","change click focusin focusout input keydown keyup selectionchange".split(" "));Xt("onSelect","focusout contextmenu dragend focusin keydown keyup mousedown mouseup selectionchange".split(" "));Xt("onBeforeInput",["compositionend","keypress","textInput","paste"]);Xt("onCompositionEnd","compositionend focusout keydown keypress keyup mousedown".split(" "));Xt("onCompositionStart","compositionstart focusout keydown keypress keyup mousedown".split(" "));Xt("onCompositionUpdate","compositionupdate focusout keydown keypress keyup mousedown".split(" "));var Un="abort canplay canplaythrough durationchange emptied encrypted ended error loadeddata loadedmetadata loadstart pause play playing progress ratechange resize seeked seeking stalled suspend timeupdate volumechange waiting".split(" "),ud=new Set("cancel close invalid load scroll toggle".split(" ").concat(Un));function ku(e,t,n){var r=e.type||"unknown-event";e.currentTarget=n,lf(r,t,void 0,e),e.currentTarget=null}function fa(e,t){t=(t&4)!==0;for(var n=0;n<e.length;n++){var r=e[n],l=r.event;r=r.listeners;e:{var o=void 0;if(t)for(var i=r.length-1;0<=i;i--){var u=r[i],s=u.instance,c=u.currentTarget;if(u=u.listener,s!==o&&l.isPropagationStopped())break e;ku(l,u,c),o=s}else for(i=0;i<r.length;i++){if(u=r[i],s=u.instance,c=u.currentTarget,u=u.listener,s!==o&&l.isPropagationStopped())break e;ku(l,u,c),o=s}}}if(Xr)throw e=ko,Xr=!1,ko=null,e}function $(e,t){var n=t[Mo];n===void 0&&(n=t[Mo]=new Set);var r=e+"__bubble";n.has(r)||(da(t,e,2,!1),n.add(r))}function Xl(e,t,n){var r=0;t&&(r|=4),da(n,e,r,t)}var _r="_reactListening"+Math.random().toString(36).slice(2);function nr(e){if(!e[_r]){e[_r]=!0,ws.forEach(function(n){n!=="selectionchange"&&(ud.has(n)||Xl(n,!1,e),Xl(n,!0,e))});var t=e.nodeType===9?e:e.ownerDocument;t===null||t[_r]||(t[_r]=!0,Xl("selectionchange",!1,t))}}function da(e,t,n,r){switch(Gs(t)){case 1:var l=Sf;break;case 4:l=kf;break;default:l=hi}n=l.bind(null,t,n,e),l=void 0,!So||t!=="touchstart"&&t!=="touchmove"&&t!=="wheel"||(l=!0),r?l!==void 0?e.addEventListener(t,n,{capture:!0,passive:l}):e.addEventListener(t,n,!0):l!==void 0?e.addEventListener(t,n,{passive:l}):e.addEventListener(t,n,!1)}function Gl(e,t,n,r,l){var o=r;if(!(t&1)&&!(t&2)&&r!==null)e:for(;;){if(r===null)return;var i=r.tag;if(i===3||i===4){var u=r.stateNode.containerInfo;if(u===l||u.nodeType===8&&u.parentNode===l)break;if(i===4)for(i=r.return;i!==null;){var s=i.tag;if((s===3||s===4)&&(s=i.stateNode.containerInfo,s===l||s.nodeType===8&&s.parentNode===l))return;i=i.return}for(;u!==null;){if(i=Ut(u),i===null)return;if(s=i.tag,s===5||s===6){r=o=i;continue e}u=u.parentNode}}r=r.return}Os(function(){var c=o,g=ci(n),m=[];e:{var h=ca.get(e);if(h!==void 0){var x=vi,S=e;switch(e){case"keypress":if(Ur(n)===0)break e;case"keydown":case"keyup":x=Ff;break;case"focusin":S="focus",x=Vl;break;case"focusout":S="blur",x=Vl;break;case"beforeblur":case"afterblur":x=Vl;break;case"click":if(n.button===2)break e;case"auxclick":case"dblclick":case"mousedown":case"mousemove":case"mouseup":case"mouseout":case"mouseover":case"contextmenu":x=cu;break;case"drag":case"dragend":case"dragenter":case"dragexit":case"dragleave":case"dragover":case"dragstart":case"drop":x=Nf;break;case"touchcancel":case"touchend":case"touchmove":case"touchstart":x=Af;break;case ia:case ua:case sa:x=Pf;break;case aa:x=Vf;break;case"scroll":x=Ef;break;case"wheel":x=Hf;break;case"copy":case"cut":case"paste":x=zf;break;case"gotpointercapture":case"lostpointercapture":case"pointercancel":case"pointerdown":case"pointermove":case"pointerout":case"pointerover":case"pointerup":x=du}var k=(t&4)!==0,F=!k&&e==="scroll",f=k?h!==null?h+"Capture":null:h;k=[];for(var a=c,p;a!==null;){p=a;var y=p.stateNode;if(p.tag===5&&y!==null&&(p=y,f!==null&&(y=Zn(a,f),y!=null&&k.push(rr(a,y,p)))),F)break;a=a.return}0<k.length&&(h=new x(h,S,null,n,g),m.push({event:h,listeners:k}))}}if(!(t&7)){e:{if(h=e==="mouseover"||e==="pointerover",x=e==="mouseout"||e==="pointerout",h&&n!==wo&&(S=n.relatedTarget||n.fromElement)&&(Ut(S)||S[rt]))break e;if((x||h)&&(h=g.window===g?g:(h=g.ownerDocument)?h.defaultView||h.parentWindow:window,x?(S=n.relatedTarget||n.toElement,x=c,S=S?Ut(S):null,S!==null&&(F=Gt(S),S!==F||S.tag!==5&&S.tag!==6)&&(S=null)):(x=null,S=c),x!==S)){if(k=cu,y="onMouseLeave",f="onMouseEnter",a="mouse",(e==="pointerout"||e==="pointerover")&&(k=du,y="onPointerLeave",f="onPointerEnter",a="pointer"),F=x==null?h:rn(x),p=S==null?h:rn(S),h=new k(y,a+"leave",x,n,g),h.target=F,h.relatedTarget=p,y=null,Ut(g)===c&&(k=new k(f,a+"enter",S,n,g),k.target=p,k.relatedTarget=F,y=k),F=y,x&&S)t:{for(k=x,f=S,a=0,p=k;p;p=Jt(p))a++;for(p=0,y=f;y;y=Jt(y))p++;for(;0<a-p;)k=Jt(k),a--;for(;0<p-a;)f=Jt(f),p--;for(;a--;){if(k===f||f!==null&&k===f.alternate)break t;k=Jt(k),f=Jt(f)}k=null}else k=null;x!==null&&Eu(m,h,x,k,!1),S!==null&&F!==null&&Eu(m,F,S,k,!0)}}e:{if(h=c?rn(c):window,x=h.nodeName&&h.nodeName.toLowerCase(),x==="select"||x==="input"&&h.type==="file")var E=Jf;else if(mu(h))if(ta)E=td;else{E=bf;var _=qf}else(x=h.nodeName)&&x.toLowerCase()==="input"&&(h.type==="checkbox"||h.type==="radio")&&(E=ed);if(E&&(E=E(e,c))){ea(m,E,n,g);break e}_&&_(e,h,c),e==="focusout"&&(_=h._wrapperState)&&_.controlled&&h.type==="number"&&ho(h,"number",h.value)}switch(_=c?rn(c):window,e){case"focusin":(mu(_)||_.contentEditable==="true")&&(tn=_,_o=c,Bn=null);break;case"focusout":Bn=_o=tn=null;break;case"mousedown":jo=!0;break;case"contextmenu":case"mouseup":case"dragend":jo=!1,xu(m,n,g);break;case"selectionchange":if(ld)break;case"keydown":case"keyup":xu(m,n,g)}var j;if(yi)e:{switch(e){case"compositionstart":var P="onCompositionStart";break e;case"compositionend":P="onCompositionEnd";break e;case"compositionupdate":P="onCompositionUpdate";break e}P=void 0}else en?qs(e,n)&&(P="onCompositionEnd"):e==="keydown"&&n.keyCode===229&&(P="onCompositionStart");P&&(Js&&n.locale!=="ko"&&(en||P!=="onCompositionStart"?P==="onCompositionEnd"&&en&&(j=Zs()):(wt=g,mi="value"in wt?wt.value:wt.textContent,en=!0)),_=br(c,P),0<_.length&&(P=new fu(P,e,null,n,g),m.push({event:P,listeners:_}),j?P.data=j:(j=bs(n),j!==null&&(P.data=j)))),(j=Kf?Yf(e,n):Xf(e,n))&&(c=br(c,"onBeforeInput"),0<c.length&&(g=new fu("onBeforeInput","beforeinput",null,n,g),m.push({event:g,listeners:c}),g.data=j))}fa(m,t)})}function rr(e,t,n){return{instance:e,listener:t,currentTarget:n}}function br(e,t){for(var n=t+"Capture",r=[];e!==null;){var l=e,o=l.stateNode;l.tag===5&&o!==null&&(l=o,o=Zn(e,n),o!=null&&r.unshift(rr(e,o,l)),o=Zn(e,t),o!=null&&r.push(rr(e,o,l))),e=e.return}return r}function Jt(e){if(e===null)return null;do e=e.return;while(e&&e.tag!==5);return e||null}function Eu(e,t,n,r,l){for(var o=t._reactName,i=[];n!==null&&n!==r;){var u=n,s=u.alternate,c=u.stateNode;if(s!==null&&s===r)break;u.tag===5&&c!==null&&(u=c,l?(s=Zn(n,o),s!=null&&i.unshift(rr(n,s,u))):l||(s=Zn(n,o),s!=null&&i.push(rr(n,s,u)))),n=n.return}i.length!==0&&e.push({event:t,listeners:i})}var sd=/\r\n?/g,ad=/\u0000|\uFFFD/g;function Cu(e){return(typeof e=="string"?e:""+e).replace(sd,`
-`).replace(ad,"")}function jr(e,t,n){if(t=Cu(t),Cu(e)!==t&&n)throw Error(w(425))}function el(){}var Po=null,To=null;function zo(e,t){return e==="textarea"||e==="noscript"||typeof t.children=="string"||typeof t.children=="number"||typeof t.dangerouslySetInnerHTML=="object"&&t.dangerouslySetInnerHTML!==null&&t.dangerouslySetInnerHTML.__html!=null}var Lo=typeof setTimeout=="function"?setTimeout:void 0,cd=typeof clearTimeout=="function"?clearTimeout:void 0,Nu=typeof Promise=="function"?Promise:void 0,fd=typeof queueMicrotask=="function"?queueMicrotask:typeof Nu<"u"?function(e){return Nu.resolve(null).then(e).catch(dd)}:Lo;function dd(e){setTimeout(function(){throw e})}function Zl(e,t){var n=t,r=0;do{var l=n.nextSibling;if(e.removeChild(n),l&&l.nodeType===8)if(n=l.data,n==="/$"){if(r===0){e.removeChild(l),bn(t);return}r--}else n!=="$"&&n!=="$?"&&n!=="$!"||r++;n=l}while(n);bn(t)}function Ct(e){for(;e!=null;e=e.nextSibling){var t=e.nodeType;if(t===1||t===3)break;if(t===8){if(t=e.data,t==="$"||t==="$!"||t==="$?")break;if(t==="/$")return null}}return e}function _u(e){e=e.previousSibling;for(var t=0;e;){if(e.nodeType===8){var n=e.data;if(n==="$"||n==="$!"||n==="$?"){if(t===0)return e;t--}else n==="/$"&&t++}e=e.previousSibling}return null}var _n=Math.random().toString(36).slice(2),Qe="__reactFiber$"+_n,lr="__reactProps$"+_n,rt="__reactContainer$"+_n,Mo="__reactEvents$"+_n,pd="__reactListeners$"+_n,hd="__reactHandles$"+_n;function Ut(e){var t=e[Qe];if(t)return t;for(var n=e.parentNode;n;){if(t=n[rt]||n[Qe]){if(n=t.alternate,t.child!==null||n!==null&&n.child!==null)for(e=_u(e);e!==null;){if(n=e[Qe])return n;e=_u(e)}return t}e=n,n=e.parentNode}return null}function hr(e){return e=e[Qe]||e[rt],!e||e.tag!==5&&e.tag!==6&&e.tag!==13&&e.tag!==3?null:e}function rn(e){if(e.tag===5||e.tag===6)return e.stateNode;throw Error(w(33))}function Sl(e){return e[lr]||null}var Ro=[],ln=-1;function Mt(e){return{current:e}}function A(e){0>ln||(e.current=Ro[ln],Ro[ln]=null,ln--)}function U(e,t){ln++,Ro[ln]=e.current,e.current=t}var zt={},ce=Mt(zt),we=Mt(!1),Bt=zt;function yn(e,t){var n=e.type.contextTypes;if(!n)return zt;var r=e.stateNode;if(r&&r.__reactInternalMemoizedUnmaskedChildContext===t)return r.__reactInternalMemoizedMaskedChildContext;var l={},o;for(o in n)l[o]=t[o];return r&&(e=e.stateNode,e.__reactInternalMemoizedUnmaskedChildContext=t,e.__reactInternalMemoizedMaskedChildContext=l),l}function xe(e){return e=e.childContextTypes,e!=null}function tl(){A(we),A(ce)}function ju(e,t,n){if(ce.current!==zt)throw Error(w(168));U(ce,t),U(we,n)}function pa(e,t,n){var r=e.stateNode;if(t=t.childContextTypes,typeof r.getChildContext!="function")return n;r=r.getChildContext();for(var l in r)if(!(l in t))throw Error(w(108,Jc(e)||"Unknown",l));return Y({},n,r)}function nl(e){return e=(e=e.stateNode)&&e.__reactInternalMemoizedMergedChildContext||zt,Bt=ce.current,U(ce,e),U(we,we.current),!0}function Pu(e,t,n){var r=e.stateNode;if(!r)throw Error(w(169));n?(e=pa(e,t,Bt),r.__reactInternalMemoizedMergedChildContext=e,A(we),A(ce),U(ce,e)):A(we),U(we,n)}var qe=null,kl=!1,Jl=!1;function ha(e){qe===null?qe=[e]:qe.push(e)}function md(e){kl=!0,ha(e)}function Rt(){if(!Jl&&qe!==null){Jl=!0;var e=0,t=I;try{var n=qe;for(I=1;e<n.length;e++){var r=n[e];do r=r(!0);while(r!==null)}qe=null,kl=!1}catch(l){throw qe!==null&&(qe=qe.slice(e+1)),$s(fi,Rt),l}finally{I=t,Jl=!1}}return null}var on=[],un=0,rl=null,ll=0,Pe=[],Te=0,Ht=null,be=1,et="";function It(e,t){on[un++]=ll,on[un++]=rl,rl=e,ll=t}function ma(e,t,n){Pe[Te++]=be,Pe[Te++]=et,Pe[Te++]=Ht,Ht=e;var r=be;e=et;var l=32-Ue(r)-1;r&=~(1<<l),n+=1;var o=32-Ue(t)+l;if(30<o){var i=l-l%5;o=(r&(1<<i)-1).toString(32),r>>=i,l-=i,be=1<<32-Ue(t)+l|n<<l|r,et=o+e}else be=1<<o|n<<l|r,et=e}function xi(e){e.return!==null&&(It(e,1),ma(e,1,0))}function Si(e){for(;e===rl;)rl=on[--un],on[un]=null,ll=on[--un],on[un]=null;for(;e===Ht;)Ht=Pe[--Te],Pe[Te]=null,et=Pe[--Te],Pe[Te]=null,be=Pe[--Te],Pe[Te]=null}var Ce=null,Ee=null,B=!1,Fe=null;function va(e,t){var n=ze(5,null,null,0);n.elementType="DELETED",n.stateNode=t,n.return=e,t=e.deletions,t===null?(e.deletions=[n],e.flags|=16):t.push(n)}function Tu(e,t){switch(e.tag){case 5:var n=e.type;return t=t.nodeType!==1||n.toLowerCase()!==t.nodeName.toLowerCase()?null:t,t!==null?(e.stateNode=t,Ce=e,Ee=Ct(t.firstChild),!0):!1;case 6:return t=e.pendingProps===""||t.nodeType!==3?null:t,t!==null?(e.stateNode=t,Ce=e,Ee=null,!0):!1;case 13:return t=t.nodeType!==8?null:t,t!==null?(n=Ht!==null?{id:be,overflow:et}:null,e.memoizedState={dehydrated:t,treeContext:n,retryLane:1073741824},n=ze(18,null,null,0),n.stateNode=t,n.return=e,e.child=n,Ce=e,Ee=null,!0):!1;default:return!1}}function Do(e){return(e.mode&1)!==0&&(e.flags&128)===0}function Oo(e){if(B){var t=Ee;if(t){var n=t;if(!Tu(e,t)){if(Do(e))throw Error(w(418));t=Ct(n.nextSibling);var r=Ce;t&&Tu(e,t)?va(r,n):(e.flags=e.flags&-4097|2,B=!1,Ce=e)}}else{if(Do(e))throw Error(w(418));e.flags=e.flags&-4097|2,B=!1,Ce=e}}}function zu(e){for(e=e.return;e!==null&&e.tag!==5&&e.tag!==3&&e.tag!==13;)e=e.return;Ce=e}function Pr(e){if(e!==Ce)return!1;if(!B)return zu(e),B=!0,!1;var t;if((t=e.tag!==3)&&!(t=e.tag!==5)&&(t=e.type,t=t!=="head"&&t!=="body"&&!zo(e.type,e.memoizedProps)),t&&(t=Ee)){if(Do(e))throw ga(),Error(w(418));for(;t;)va(e,t),t=Ct(t.nextSibling)}if(zu(e),e.tag===13){if(e=e.memoizedState,e=e!==null?e.dehydrated:null,!e)throw Error(w(317));e:{for(e=e.nextSibling,t=0;e;){if(e.nodeType===8){var n=e.data;if(n==="/$"){if(t===0){Ee=Ct(e.nextSibling);break e}t--}else n!=="$"&&n!=="$!"&&n!=="$?"||t++}e=e.nextSibling}Ee=null}}else Ee=Ce?Ct(e.stateNode.nextSibling):null;return!0}function ga(){for(var e=Ee;e;)e=Ct(e.nextSibling)}function wn(){Ee=Ce=null,B=!1}function ki(e){Fe===null?Fe=[e]:Fe.push(e)}var vd=it.ReactCurrentBatchConfig;function Mn(e,t,n){if(e=n.ref,e!==null&&typeof e!="function"&&typeof e!="object"){if(n._owner){if(n=n._owner,n){if(n.tag!==1)throw Error(w(309));var r=n.stateNode}if(!r)throw Error(w(147,e));var l=r,o=""+e;return t!==null&&t.ref!==null&&typeof t.ref=="function"&&t.ref._stringRef===o?t.ref:(t=function(i){var u=l.refs;i===null?delete u[o]:u[o]=i},t._stringRef=o,t)}if(typeof e!="string")throw Error(w(284));if(!n._owner)throw Error(w(290,e))}return e}function Tr(e,t){throw e=Object.prototype.toString.call(t),Error(w(31,e==="[object Object]"?"object with keys {"+Object.keys(t).join(", ")+"}":e))}function Lu(e){var t=e._init;return t(e._payload)}function ya(e){function t(f,a){if(e){var p=f.deletions;p===null?(f.deletions=[a],f.flags|=16):p.push(a)}}function n(f,a){if(!e)return null;for(;a!==null;)t(f,a),a=a.sibling;return null}function r(f,a){for(f=new Map;a!==null;)a.key!==null?f.set(a.key,a):f.set(a.index,a),a=a.sibling;return f}function l(f,a){return f=Pt(f,a),f.index=0,f.sibling=null,f}function o(f,a,p){return f.index=p,e?(p=f.alternate,p!==null?(p=p.index,p<a?(f.flags|=2,a):p):(f.flags|=2,a)):(f.flags|=1048576,a)}function i(f){return e&&f.alternate===null&&(f.flags|=2),f}function u(f,a,p,y){return a===null||a.tag!==6?(a=lo(p,f.mode,y),a.return=f,a):(a=l(a,p),a.return=f,a)}function s(f,a,p,y){var E=p.type;return E===bt?g(f,a,p.props.children,y,p.key):a!==null&&(a.elementType===E||typeof E=="object"&&E!==null&&E.$$typeof===dt&&Lu(E)===a.type)?(y=l(a,p.props),y.ref=Mn(f,a,p),y.return=f,y):(y=Qr(p.type,p.key,p.props,null,f.mode,y),y.ref=Mn(f,a,p),y.return=f,y)}function c(f,a,p,y){return a===null||a.tag!==4||a.stateNode.containerInfo!==p.containerInfo||a.stateNode.implementation!==p.implementation?(a=oo(p,f.mode,y),a.return=f,a):(a=l(a,p.children||[]),a.return=f,a)}function g(f,a,p,y,E){return a===null||a.tag!==7?(a=Vt(p,f.mode,y,E),a.return=f,a):(a=l(a,p),a.return=f,a)}function m(f,a,p){if(typeof a=="string"&&a!==""||typeof a=="number")return a=lo(""+a,f.mode,p),a.return=f,a;if(typeof a=="object"&&a!==null){switch(a.$$typeof){case yr:return p=Qr(a.type,a.key,a.props,null,f.mode,p),p.ref=Mn(f,null,a),p.return=f,p;case qt:return a=oo(a,f.mode,p),a.return=f,a;case dt:var y=a._init;return m(f,y(a._payload),p)}if(In(a)||jn(a))return a=Vt(a,f.mode,p,null),a.return=f,a;Tr(f,a)}return null}function h(f,a,p,y){var E=a!==null?a.key:null;if(typeof p=="string"&&p!==""||typeof p=="number")return E!==null?null:u(f,a,""+p,y);if(typeof p=="object"&&p!==null){switch(p.$$typeof){case yr:return p.key===E?s(f,a,p,y):null;case qt:return p.key===E?c(f,a,p,y):null;case dt:return E=p._init,h(f,a,E(p._payload),y)}if(In(p)||jn(p))return E!==null?null:g(f,a,p,y,null);Tr(f,p)}return null}function x(f,a,p,y,E){if(typeof y=="string"&&y!==""||typeof y=="number")return f=f.get(p)||null,u(a,f,""+y,E);if(typeof y=="object"&&y!==null){switch(y.$$typeof){case yr:return f=f.get(y.key===null?p:y.key)||null,s(a,f,y,E);case qt:return f=f.get(y.key===null?p:y.key)||null,c(a,f,y,E);case dt:var _=y._init;return x(f,a,p,_(y._payload),E)}if(In(y)||jn(y))return f=f.get(p)||null,g(a,f,y,E,null);Tr(a,y)}return null}function S(f,a,p,y){for(var E=null,_=null,j=a,P=a=0,H=null;j!==null&&P<p.length;P++){j.index>P?(H=j,j=null):H=j.sibling;var M=h(f,j,p[P],y);if(M===null){j===null&&(j=H);break}e&&j&&M.alternate===null&&t(f,j),a=o(M,a,P),_===null?E=M:_.sibling=M,_=M,j=H}if(P===p.length)return n(f,j),B&&It(f,P),E;if(j===null){for(;P<p.length;P++)j=m(f,p[P],y),j!==null&&(a=o(j,a,P),_===null?E=j:_.sibling=j,_=j);return B&&It(f,P),E}for(j=r(f,j);P<p.length;P++)H=x(j,f,P,p[P],y),H!==null&&(e&&H.alternate!==null&&j.delete(H.key===null?P:H.key),a=o(H,a,P),_===null?E=H:_.sibling=H,_=H);return e&&j.forEach(function(fe){return t(f,fe)}),B&&It(f,P),E}function k(f,a,p,y){var E=jn(p);if(typeof E!="function")throw Error(w(150));if(p=E.call(p),p==null)throw Error(w(151));for(var _=E=null,j=a,P=a=0,H=null,M=p.next();j!==null&&!M.done;P++,M=p.next()){j.index>P?(H=j,j=null):H=j.sibling;var fe=h(f,j,M.value,y);if(fe===null){j===null&&(j=H);break}e&&j&&fe.alternate===null&&t(f,j),a=o(fe,a,P),_===null?E=fe:_.sibling=fe,_=fe,j=H}if(M.done)return n(f,j),B&&It(f,P),E;if(j===null){for(;!M.done;P++,M=p.next())M=m(f,M.value,y),M!==null&&(a=o(M,a,P),_===null?E=M:_.sibling=M,_=M);return B&&It(f,P),E}for(j=r(f,j);!M.done;P++,M=p.next())M=x(j,f,P,M.value,y),M!==null&&(e&&M.alternate!==null&&j.delete(M.key===null?P:M.key),a=o(M,a,P),_===null?E=M:_.sibling=M,_=M);return e&&j.forEach(function(Dt){return t(f,Dt)}),B&&It(f,P),E}function F(f,a,p,y){if(typeof p=="object"&&p!==null&&p.type===bt&&p.key===null&&(p=p.props.children),typeof p=="object"&&p!==null){switch(p.$$typeof){case yr:e:{for(var E=p.key,_=a;_!==null;){if(_.key===E){if(E=p.type,E===bt){if(_.tag===7){n(f,_.sibling),a=l(_,p.props.children),a.return=f,f=a;break e}}else if(_.elementType===E||typeof E=="object"&&E!==null&&E.$$typeof===dt&&Lu(E)===_.type){n(f,_.sibling),a=l(_,p.props),a.ref=Mn(f,_,p),a.return=f,f=a;break e}n(f,_);break}else t(f,_);_=_.sibling}p.type===bt?(a=Vt(p.props.children,f.mode,y,p.key),a.return=f,f=a):(y=Qr(p.type,p.key,p.props,null,f.mode,y),y.ref=Mn(f,a,p),y.return=f,f=y)}return i(f);case qt:e:{for(_=p.key;a!==null;){if(a.key===_)if(a.tag===4&&a.stateNode.containerInfo===p.containerInfo&&a.stateNode.implementation===p.implementation){n(f,a.sibling),a=l(a,p.children||[]),a.return=f,f=a;break e}else{n(f,a);break}else t(f,a);a=a.sibling}a=oo(p,f.mode,y),a.return=f,f=a}return i(f);case dt:return _=p._init,F(f,a,_(p._payload),y)}if(In(p))return S(f,a,p,y);if(jn(p))return k(f,a,p,y);Tr(f,p)}return typeof p=="string"&&p!==""||typeof p=="number"?(p=""+p,a!==null&&a.tag===6?(n(f,a.sibling),a=l(a,p),a.return=f,f=a):(n(f,a),a=lo(p,f.mode,y),a.return=f,f=a),i(f)):n(f,a)}return F}var xn=ya(!0),wa=ya(!1),ol=Mt(null),il=null,sn=null,Ei=null;function Ci(){Ei=sn=il=null}function Ni(e){var t=ol.current;A(ol),e._currentValue=t}function Io(e,t,n){for(;e!==null;){var r=e.alternate;if((e.childLanes&t)!==t?(e.childLanes|=t,r!==null&&(r.childLanes|=t)):r!==null&&(r.childLanes&t)!==t&&(r.childLanes|=t),e===n)break;e=e.return}}function mn(e,t){il=e,Ei=sn=null,e=e.dependencies,e!==null&&e.firstContext!==null&&(e.lanes&t&&(ye=!0),e.firstContext=null)}function Me(e){var t=e._currentValue;if(Ei!==e)if(e={context:e,memoizedValue:t,next:null},sn===null){if(il===null)throw Error(w(308));sn=e,il.dependencies={lanes:0,firstContext:e}}else sn=sn.next=e;return t}var $t=null;function _i(e){$t===null?$t=[e]:$t.push(e)}function xa(e,t,n,r){var l=t.interleaved;return l===null?(n.next=n,_i(t)):(n.next=l.next,l.next=n),t.interleaved=n,lt(e,r)}function lt(e,t){e.lanes|=t;var n=e.alternate;for(n!==null&&(n.lanes|=t),n=e,e=e.return;e!==null;)e.childLanes|=t,n=e.alternate,n!==null&&(n.childLanes|=t),n=e,e=e.return;return n.tag===3?n.stateNode:null}var pt=!1;function ji(e){e.updateQueue={baseState:e.memoizedState,firstBaseUpdate:null,lastBaseUpdate:null,shared:{pending:null,interleaved:null,lanes:0},effects:null}}function Sa(e,t){e=e.updateQueue,t.updateQueue===e&&(t.updateQueue={baseState:e.baseState,firstBaseUpdate:e.firstBaseUpdate,lastBaseUpdate:e.lastBaseUpdate,shared:e.shared,effects:e.effects})}function tt(e,t){return{eventTime:e,lane:t,tag:0,payload:null,callback:null,next:null}}function Nt(e,t,n){var r=e.updateQueue;if(r===null)return null;if(r=r.shared,D&2){var l=r.pending;return l===null?t.next=t:(t.next=l.next,l.next=t),r.pending=t,lt(e,n)}return l=r.interleaved,l===null?(t.next=t,_i(r)):(t.next=l.next,l.next=t),r.interleaved=t,lt(e,n)}function $r(e,t,n){if(t=t.updateQueue,t!==null&&(t=t.shared,(n&4194240)!==0)){var r=t.lanes;r&=e.pendingLanes,n|=r,t.lanes=n,di(e,n)}}function Mu(e,t){var n=e.updateQueue,r=e.alternate;if(r!==null&&(r=r.updateQueue,n===r)){var l=null,o=null;if(n=n.firstBaseUpdate,n!==null){do{var i={eventTime:n.eventTime,lane:n.lane,tag:n.tag,payload:n.payload,callback:n.callback,next:null};o===null?l=o=i:o=o.next=i,n=n.next}while(n!==null);o===null?l=o=t:o=o.next=t}else l=o=t;n={baseState:r.baseState,firstBaseUpdate:l,lastBaseUpdate:o,shared:r.shared,effects:r.effects},e.updateQueue=n;return}e=n.lastBaseUpdate,e===null?n.firstBaseUpdate=t:e.next=t,n.lastBaseUpdate=t}function ul(e,t,n,r){var l=e.updateQueue;pt=!1;var o=l.firstBaseUpdate,i=l.lastBaseUpdate,u=l.shared.pending;if(u!==null){l.shared.pending=null;var s=u,c=s.next;s.next=null,i===null?o=c:i.next=c,i=s;var g=e.alternate;g!==null&&(g=g.updateQueue,u=g.lastBaseUpdate,u!==i&&(u===null?g.firstBaseUpdate=c:u.next=c,g.lastBaseUpdate=s))}if(o!==null){var m=l.baseState;i=0,g=c=s=null,u=o;do{var h=u.lane,x=u.eventTime;if((r&h)===h){g!==null&&(g=g.next={eventTime:x,lane:0,tag:u.tag,payload:u.payload,callback:u.callback,next:null});e:{var S=e,k=u;switch(h=t,x=n,k.tag){case 1:if(S=k.payload,typeof S=="function"){m=S.call(x,m,h);break e}m=S;break e;case 3:S.flags=S.flags&-65537|128;case 0:if(S=k.payload,h=typeof S=="function"?S.call(x,m,h):S,h==null)break e;m=Y({},m,h);break e;case 2:pt=!0}}u.callback!==null&&u.lane!==0&&(e.flags|=64,h=l.effects,h===null?l.effects=[u]:h.push(u))}else x={eventTime:x,lane:h,tag:u.tag,payload:u.payload,callback:u.callback,next:null},g===null?(c=g=x,s=m):g=g.next=x,i|=h;if(u=u.next,u===null){if(u=l.shared.pending,u===null)break;h=u,u=h.next,h.next=null,l.lastBaseUpdate=h,l.shared.pending=null}}while(!0);if(g===null&&(s=m),l.baseState=s,l.firstBaseUpdate=c,l.lastBaseUpdate=g,t=l.shared.interleaved,t!==null){l=t;do i|=l.lane,l=l.next;while(l!==t)}else o===null&&(l.shared.lanes=0);Kt|=i,e.lanes=i,e.memoizedState=m}}function Ru(e,t,n){if(e=t.effects,t.effects=null,e!==null)for(t=0;t<e.length;t++){var r=e[t],l=r.callback;if(l!==null){if(r.callback=null,r=n,typeof l!="function")throw Error(w(191,l));l.call(r)}}}var mr={},Ye=Mt(mr),or=Mt(mr),ir=Mt(mr);function At(e){if(e===mr)throw Error(w(174));return e}function Pi(e,t){switch(U(ir,t),U(or,e),U(Ye,mr),e=t.nodeType,e){case 9:case 11:t=(t=t.documentElement)?t.namespaceURI:vo(null,"");break;default:e=e===8?t.parentNode:t,t=e.namespaceURI||null,e=e.tagName,t=vo(t,e)}A(Ye),U(Ye,t)}function Sn(){A(Ye),A(or),A(ir)}function ka(e){At(ir.current);var t=At(Ye.current),n=vo(t,e.type);t!==n&&(U(or,e),U(Ye,n))}function Ti(e){or.current===e&&(A(Ye),A(or))}var Q=Mt(0);function sl(e){for(var t=e;t!==null;){if(t.tag===13){var n=t.memoizedState;if(n!==null&&(n=n.dehydrated,n===null||n.data==="$?"||n.data==="$!"))return t}else if(t.tag===19&&t.memoizedProps.revealOrder!==void 0){if(t.flags&128)return t}else if(t.child!==null){t.child.return=t,t=t.child;continue}if(t===e)break;for(;t.sibling===null;){if(t.return===null||t.return===e)return null;t=t.return}t.sibling.return=t.return,t=t.sibling}return null}var ql=[];function zi(){for(var e=0;e<ql.length;e++)ql[e]._workInProgressVersionPrimary=null;ql.length=0}var Ar=it.ReactCurrentDispatcher,bl=it.ReactCurrentBatchConfig,Qt=0,K=null,b=null,te=null,al=!1,Hn=!1,ur=0,gd=0;function ue(){throw Error(w(321))}function Li(e,t){if(t===null)return!1;for(var n=0;n<t.length&&n<e.length;n++)if(!Ae(e[n],t[n]))return!1;return!0}function Mi(e,t,n,r,l,o){if(Qt=o,K=t,t.memoizedState=null,t.updateQueue=null,t.lanes=0,Ar.current=e===null||e.memoizedState===null?Sd:kd,e=n(r,l),Hn){o=0;do{if(Hn=!1,ur=0,25<=o)throw Error(w(301));o+=1,te=b=null,t.updateQueue=null,Ar.current=Ed,e=n(r,l)}while(Hn)}if(Ar.current=cl,t=b!==null&&b.next!==null,Qt=0,te=b=K=null,al=!1,t)throw Error(w(300));return e}function Ri(){var e=ur!==0;return ur=0,e}function He(){var e={memoizedState:null,baseState:null,baseQueue:null,queue:null,next:null};return te===null?K.memoizedState=te=e:te=te.next=e,te}function Re(){if(b===null){var e=K.alternate;e=e!==null?e.memoizedState:null}else e=b.next;var t=te===null?K.memoizedState:te.next;if(t!==null)te=t,b=e;else{if(e===null)throw Error(w(310));b=e,e={memoizedState:b.memoizedState,baseState:b.baseState,baseQueue:b.baseQueue,queue:b.queue,next:null},te===null?K.memoizedState=te=e:te=te.next=e}return te}function sr(e,t){return typeof t=="function"?t(e):t}function eo(e){var t=Re(),n=t.queue;if(n===null)throw Error(w(311));n.lastRenderedReducer=e;var r=b,l=r.baseQueue,o=n.pending;if(o!==null){if(l!==null){var i=l.next;l.next=o.next,o.next=i}r.baseQueue=l=o,n.pending=null}if(l!==null){o=l.next,r=r.baseState;var u=i=null,s=null,c=o;do{var g=c.lane;if((Qt&g)===g)s!==null&&(s=s.next={lane:0,action:c.action,hasEagerState:c.hasEagerState,eagerState:c.eagerState,next:null}),r=c.hasEagerState?c.eagerState:e(r,c.action);else{var m={lane:g,action:c.action,hasEagerState:c.hasEagerState,eagerState:c.eagerState,next:null};s===null?(u=s=m,i=r):s=s.next=m,K.lanes|=g,Kt|=g}c=c.next}while(c!==null&&c!==o);s===null?i=r:s.next=u,Ae(r,t.memoizedState)||(ye=!0),t.memoizedState=r,t.baseState=i,t.baseQueue=s,n.lastRenderedState=r}if(e=n.interleaved,e!==null){l=e;do o=l.lane,K.lanes|=o,Kt|=o,l=l.next;while(l!==e)}else l===null&&(n.lanes=0);return[t.memoizedState,n.dispatch]}function to(e){var t=Re(),n=t.queue;if(n===null)throw Error(w(311));n.lastRenderedReducer=e;var r=n.dispatch,l=n.pending,o=t.memoizedState;if(l!==null){n.pending=null;var i=l=l.next;do o=e(o,i.action),i=i.next;while(i!==l);Ae(o,t.memoizedState)||(ye=!0),t.memoizedState=o,t.baseQueue===null&&(t.baseState=o),n.lastRenderedState=o}return[o,r]}function Ea(){}function Ca(e,t){var n=K,r=Re(),l=t(),o=!Ae(r.memoizedState,l);if(o&&(r.memoizedState=l,ye=!0),r=r.queue,Di(ja.bind(null,n,r,e),[e]),r.getSnapshot!==t||o||te!==null&&te.memoizedState.tag&1){if(n.flags|=2048,ar(9,_a.bind(null,n,r,l,t),void 0,null),ne===null)throw Error(w(349));Qt&30||Na(n,t,l)}return l}function Na(e,t,n){e.flags|=16384,e={getSnapshot:t,value:n},t=K.updateQueue,t===null?(t={lastEffect:null,stores:null},K.updateQueue=t,t.stores=[e]):(n=t.stores,n===null?t.stores=[e]:n.push(e))}function _a(e,t,n,r){t.value=n,t.getSnapshot=r,Pa(t)&&Ta(e)}function ja(e,t,n){return n(function(){Pa(t)&&Ta(e)})}function Pa(e){var t=e.getSnapshot;e=e.value;try{var n=t();return!Ae(e,n)}catch{return!0}}function Ta(e){var t=lt(e,1);t!==null&&$e(t,e,1,-1)}function Du(e){var t=He();return typeof e=="function"&&(e=e()),t.memoizedState=t.baseState=e,e={pending:null,interleaved:null,lanes:0,dispatch:null,lastRenderedReducer:sr,lastRenderedState:e},t.queue=e,e=e.dispatch=xd.bind(null,K,e),[t.memoizedState,e]}function ar(e,t,n,r){return e={tag:e,create:t,destroy:n,deps:r,next:null},t=K.updateQueue,t===null?(t={lastEffect:null,stores:null},K.updateQueue=t,t.lastEffect=e.next=e):(n=t.lastEffect,n===null?t.lastEffect=e.next=e:(r=n.next,n.next=e,e.next=r,t.lastEffect=e)),e}function za(){return Re().memoizedState}function Wr(e,t,n,r){var l=He();K.flags|=e,l.memoizedState=ar(1|t,n,void 0,r===void 0?null:r)}function El(e,t,n,r){var l=Re();r=r===void 0?null:r;var o=void 0;if(b!==null){var i=b.memoizedState;if(o=i.destroy,r!==null&&Li(r,i.deps)){l.memoizedState=ar(t,n,o,r);return}}K.flags|=e,l.memoizedState=ar(1|t,n,o,r)}function Ou(e,t){return Wr(8390656,8,e,t)}function Di(e,t){return El(2048,8,e,t)}function La(e,t){return El(4,2,e,t)}function Ma(e,t){return El(4,4,e,t)}function Ra(e,t){if(typeof t=="function")return e=e(),t(e),function(){t(null)};if(t!=null)return e=e(),t.current=e,function(){t.current=null}}function Da(e,t,n){return n=n!=null?n.concat([e]):null,El(4,4,Ra.bind(null,t,e),n)}function Oi(){}function Oa(e,t){var n=Re();t=t===void 0?null:t;var r=n.memoizedState;return r!==null&&t!==null&&Li(t,r[1])?r[0]:(n.memoizedState=[e,t],e)}function Ia(e,t){var n=Re();t=t===void 0?null:t;var r=n.memoizedState;return r!==null&&t!==null&&Li(t,r[1])?r[0]:(e=e(),n.memoizedState=[e,t],e)}function Fa(e,t,n){return Qt&21?(Ae(n,t)||(n=Vs(),K.lanes|=n,Kt|=n,e.baseState=!0),t):(e.baseState&&(e.baseState=!1,ye=!0),e.memoizedState=n)}function yd(e,t){var n=I;I=n!==0&&4>n?n:4,e(!0);var r=bl.transition;bl.transition={};try{e(!1),t()}finally{I=n,bl.transition=r}}function Ua(){return Re().memoizedState}function wd(e,t,n){var r=jt(e);if(n={lane:r,action:n,hasEagerState:!1,eagerState:null,next:null},$a(e))Aa(t,n);else if(n=xa(e,t,n,r),n!==null){var l=he();$e(n,e,r,l),Wa(n,t,r)}}function xd(e,t,n){var r=jt(e),l={lane:r,action:n,hasEagerState:!1,eagerState:null,next:null};if($a(e))Aa(t,l);else{var o=e.alternate;if(e.lanes===0&&(o===null||o.lanes===0)&&(o=t.lastRenderedReducer,o!==null))try{var i=t.lastRenderedState,u=o(i,n);if(l.hasEagerState=!0,l.eagerState=u,Ae(u,i)){var s=t.interleaved;s===null?(l.next=l,_i(t)):(l.next=s.next,s.next=l),t.interleaved=l;return}}catch{}finally{}n=xa(e,t,l,r),n!==null&&(l=he(),$e(n,e,r,l),Wa(n,t,r))}}function $a(e){var t=e.alternate;return e===K||t!==null&&t===K}function Aa(e,t){Hn=al=!0;var n=e.pending;n===null?t.next=t:(t.next=n.next,n.next=t),e.pending=t}function Wa(e,t,n){if(n&4194240){var r=t.lanes;r&=e.pendingLanes,n|=r,t.lanes=n,di(e,n)}}var cl={readContext:Me,useCallback:ue,useContext:ue,useEffect:ue,useImperativeHandle:ue,useInsertionEffect:ue,useLayoutEffect:ue,useMemo:ue,useReducer:ue,useRef:ue,useState:ue,useDebugValue:ue,useDeferredValue:ue,useTransition:ue,useMutableSource:ue,useSyncExternalStore:ue,useId:ue,unstable_isNewReconciler:!1},Sd={readContext:Me,useCallback:function(e,t){return He().memoizedState=[e,t===void 0?null:t],e},useContext:Me,useEffect:Ou,useImperativeHandle:function(e,t,n){return n=n!=null?n.concat([e]):null,Wr(4194308,4,Ra.bind(null,t,e),n)},useLayoutEffect:function(e,t){return Wr(4194308,4,e,t)},useInsertionEffect:function(e,t){return Wr(4,2,e,t)},useMemo:function(e,t){var n=He();return t=t===void 0?null:t,e=e(),n.memoizedState=[e,t],e},useReducer:function(e,t,n){var r=He();return t=n!==void 0?n(t):t,r.memoizedState=r.baseState=t,e={pending:null,interleaved:null,lanes:0,dispatch:null,lastRenderedReducer:e,lastRenderedState:t},r.queue=e,e=e.dispatch=wd.bind(null,K,e),[r.memoizedState,e]},useRef:function(e){var t=He();return e={current:e},t.memoizedState=e},useState:Du,useDebugValue:Oi,useDeferredValue:function(e){return He().memoizedState=e},useTransition:function(){var e=Du(!1),t=e[0];return e=yd.bind(null,e[1]),He().memoizedState=e,[t,e]},useMutableSource:function(){},useSyncExternalStore:function(e,t,n){var r=K,l=He();if(B){if(n===void 0)throw Error(w(407));n=n()}else{if(n=t(),ne===null)throw Error(w(349));Qt&30||Na(r,t,n)}l.memoizedState=n;var o={value:n,getSnapshot:t};return l.queue=o,Ou(ja.bind(null,r,o,e),[e]),r.flags|=2048,ar(9,_a.bind(null,r,o,n,t),void 0,null),n},useId:function(){var e=He(),t=ne.identifierPrefix;if(B){var n=et,r=be;n=(r&~(1<<32-Ue(r)-1)).toString(32)+n,t=":"+t+"R"+n,n=ur++,0<n&&(t+="H"+n.toString(32)),t+=":"}else n=gd++,t=":"+t+"r"+n.toString(32)+":";return e.memoizedState=t},unstable_isNewReconciler:!1},kd={readContext:Me,useCallback:Oa,useContext:Me,useEffect:Di,useImperativeHandle:Da,useInsertionEffect:La,useLayoutEffect:Ma,useMemo:Ia,useReducer:eo,useRef:za,useState:function(){return eo(sr)},useDebugValue:Oi,useDeferredValue:function(e){var t=Re();return Fa(t,b.memoizedState,e)},useTransition:function(){var e=eo(sr)[0],t=Re().memoizedState;return[e,t]},useMutableSource:Ea,useSyncExternalStore:Ca,useId:Ua,unstable_isNewReconciler:!1},Ed={readContext:Me,useCallback:Oa,useContext:Me,useEffect:Di,useImperativeHandle:Da,useInsertionEffect:La,useLayoutEffect:Ma,useMemo:Ia,useReducer:to,useRef:za,useState:function(){return to(sr)},useDebugValue:Oi,useDeferredValue:function(e){var t=Re();return b===null?t.memoizedState=e:Fa(t,b.memoizedState,e)},useTransition:function(){var e=to(sr)[0],t=Re().memoizedState;return[e,t]},useMutableSource:Ea,useSyncExternalStore:Ca,useId:Ua,unstable_isNewReconciler:!1};function Oe(e,t){if(e&&e.defaultProps){t=Y({},t),e=e.defaultProps;for(var n in e)t[n]===void 0&&(t[n]=e[n]);return t}return t}function Fo(e,t,n,r){t=e.memoizedState,n=n(r,t),n=n==null?t:Y({},t,n),e.memoizedState=n,e.lanes===0&&(e.updateQueue.baseState=n)}var Cl={isMounted:function(e){return(e=e._reactInternals)?Gt(e)===e:!1},enqueueSetState:function(e,t,n){e=e._reactInternals;var r=he(),l=jt(e),o=tt(r,l);o.payload=t,n!=null&&(o.callback=n),t=Nt(e,o,l),t!==null&&($e(t,e,l,r),$r(t,e,l))},enqueueReplaceState:function(e,t,n){e=e._reactInternals;var r=he(),l=jt(e),o=tt(r,l);o.tag=1,o.payload=t,n!=null&&(o.callback=n),t=Nt(e,o,l),t!==null&&($e(t,e,l,r),$r(t,e,l))},enqueueForceUpdate:function(e,t){e=e._reactInternals;var n=he(),r=jt(e),l=tt(n,r);l.tag=2,t!=null&&(l.callback=t),t=Nt(e,l,r),t!==null&&($e(t,e,r,n),$r(t,e,r))}};function Iu(e,t,n,r,l,o,i){return e=e.stateNode,typeof e.shouldComponentUpdate=="function"?e.shouldComponentUpdate(r,o,i):t.prototype&&t.prototype.isPureReactComponent?!tr(n,r)||!tr(l,o):!0}function Va(e,t,n){var r=!1,l=zt,o=t.contextType;return typeof o=="object"&&o!==null?o=Me(o):(l=xe(t)?Bt:ce.current,r=t.contextTypes,o=(r=r!=null)?yn(e,l):zt),t=new t(n,o),e.memoizedState=t.state!==null&&t.state!==void 0?t.state:null,t.updater=Cl,e.stateNode=t,t._reactInternals=e,r&&(e=e.stateNode,e.__reactInternalMemoizedUnmaskedChildContext=l,e.__reactInternalMemoizedMaskedChildContext=o),t}function Fu(e,t,n,r){e=t.state,typeof t.componentWillReceiveProps=="function"&&t.componentWillReceiveProps(n,r),typeof t.UNSAFE_componentWillReceiveProps=="function"&&t.UNSAFE_componentWillReceiveProps(n,r),t.state!==e&&Cl.enqueueReplaceState(t,t.state,null)}function Uo(e,t,n,r){var l=e.stateNode;l.props=n,l.state=e.memoizedState,l.refs={},ji(e);var o=t.contextType;typeof o=="object"&&o!==null?l.context=Me(o):(o=xe(t)?Bt:ce.current,l.context=yn(e,o)),l.state=e.memoizedState,o=t.getDerivedStateFromProps,typeof o=="function"&&(Fo(e,t,o,n),l.state=e.memoizedState),typeof t.getDerivedStateFromProps=="function"||typeof l.getSnapshotBeforeUpdate=="function"||typeof l.UNSAFE_componentWillMount!="function"&&typeof l.componentWillMount!="function"||(t=l.state,typeof l.componentWillMount=="function"&&l.componentWillMount(),typeof l.UNSAFE_componentWillMount=="function"&&l.UNSAFE_componentWillMount(),t!==l.state&&Cl.enqueueReplaceState(l,l.state,null),ul(e,n,l,r),l.state=e.memoizedState),typeof l.componentDidMount=="function"&&(e.flags|=4194308)}function kn(e,t){try{var n="",r=t;do n+=Zc(r),r=r.return;while(r);var l=n}catch(o){l=`
-Error generating stack: `+o.message+`
-`+o.stack}return{value:e,source:t,stack:l,digest:null}}function no(e,t,n){return{value:e,source:null,stack:n??null,digest:t??null}}function $o(e,t){try{console.error(t.value)}catch(n){setTimeout(function(){throw n})}}var Cd=typeof WeakMap=="function"?WeakMap:Map;function Ba(e,t,n){n=tt(-1,n),n.tag=3,n.payload={element:null};var r=t.value;return n.callback=function(){dl||(dl=!0,Go=r),$o(e,t)},n}function Ha(e,t,n){n=tt(-1,n),n.tag=3;var r=e.type.getDerivedStateFromError;if(typeof r=="function"){var l=t.value;n.payload=function(){return r(l)},n.callback=function(){$o(e,t)}}var o=e.stateNode;return o!==null&&typeof o.componentDidCatch=="function"&&(n.callback=function(){$o(e,t),typeof r!="function"&&(_t===null?_t=new Set([this]):_t.add(this));var i=t.stack;this.componentDidCatch(t.value,{componentStack:i!==null?i:""})}),n}function Uu(e,t,n){var r=e.pingCache;if(r===null){r=e.pingCache=new Cd;var l=new Set;r.set(t,l)}else l=r.get(t),l===void 0&&(l=new Set,r.set(t,l));l.has(n)||(l.add(n),e=Ud.bind(null,e,t,n),t.then(e,e))}function $u(e){do{var t;if((t=e.tag===13)&&(t=e.memoizedState,t=t!==null?t.dehydrated!==null:!0),t)return e;e=e.return}while(e!==null);return null}function Au(e,t,n,r,l){return e.mode&1?(e.flags|=65536,e.lanes=l,e):(e===t?e.flags|=65536:(e.flags|=128,n.flags|=131072,n.flags&=-52805,n.tag===1&&(n.alternate===null?n.tag=17:(t=tt(-1,1),t.tag=2,Nt(n,t,1))),n.lanes|=1),e)}var Nd=it.ReactCurrentOwner,ye=!1;function pe(e,t,n,r){t.child=e===null?wa(t,null,n,r):xn(t,e.child,n,r)}function Wu(e,t,n,r,l){n=n.render;var o=t.ref;return mn(t,l),r=Mi(e,t,n,r,o,l),n=Ri(),e!==null&&!ye?(t.updateQueue=e.updateQueue,t.flags&=-2053,e.lanes&=~l,ot(e,t,l)):(B&&n&&xi(t),t.flags|=1,pe(e,t,r,l),t.child)}function Vu(e,t,n,r,l){if(e===null){var o=n.type;return typeof o=="function"&&!Bi(o)&&o.defaultProps===void 0&&n.compare===null&&n.defaultProps===void 0?(t.tag=15,t.type=o,Qa(e,t,o,r,l)):(e=Qr(n.type,null,r,t,t.mode,l),e.ref=t.ref,e.return=t,t.child=e)}if(o=e.child,!(e.lanes&l)){var i=o.memoizedProps;if(n=n.compare,n=n!==null?n:tr,n(i,r)&&e.ref===t.ref)return ot(e,t,l)}return t.flags|=1,e=Pt(o,r),e.ref=t.ref,e.return=t,t.child=e}function Qa(e,t,n,r,l){if(e!==null){var o=e.memoizedProps;if(tr(o,r)&&e.ref===t.ref)if(ye=!1,t.pendingProps=r=o,(e.lanes&l)!==0)e.flags&131072&&(ye=!0);else return t.lanes=e.lanes,ot(e,t,l)}return Ao(e,t,n,r,l)}function Ka(e,t,n){var r=t.pendingProps,l=r.children,o=e!==null?e.memoizedState:null;if(r.mode==="hidden")if(!(t.mode&1))t.memoizedState={baseLanes:0,cachePool:null,transitions:null},U(cn,ke),ke|=n;else{if(!(n&1073741824))return e=o!==null?o.baseLanes|n:n,t.lanes=t.childLanes=1073741824,t.memoizedState={baseLanes:e,cachePool:null,transitions:null},t.updateQueue=null,U(cn,ke),ke|=e,null;t.memoizedState={baseLanes:0,cachePool:null,transitions:null},r=o!==null?o.baseLanes:n,U(cn,ke),ke|=r}else o!==null?(r=o.baseLanes|n,t.memoizedState=null):r=n,U(cn,ke),ke|=r;return pe(e,t,l,n),t.child}function Ya(e,t){var n=t.ref;(e===null&&n!==null||e!==null&&e.ref!==n)&&(t.flags|=512,t.flags|=2097152)}function Ao(e,t,n,r,l){var o=xe(n)?Bt:ce.current;return o=yn(t,o),mn(t,l),n=Mi(e,t,n,r,o,l),r=Ri(),e!==null&&!ye?(t.updateQueue=e.updateQueue,t.flags&=-2053,e.lanes&=~l,ot(e,t,l)):(B&&r&&xi(t),t.flags|=1,pe(e,t,n,l),t.child)}function Bu(e,t,n,r,l){if(xe(n)){var o=!0;nl(t)}else o=!1;if(mn(t,l),t.stateNode===null)Vr(e,t),Va(t,n,r),Uo(t,n,r,l),r=!0;else if(e===null){var i=t.stateNode,u=t.memoizedProps;i.props=u;var s=i.context,c=n.contextType;typeof c=="object"&&c!==null?c=Me(c):(c=xe(n)?Bt:ce.current,c=yn(t,c));var g=n.getDerivedStateFromProps,m=typeof g=="function"||typeof i.getSnapshotBeforeUpdate=="function";m||typeof i.UNSAFE_componentWillReceiveProps!="function"&&typeof i.componentWillReceiveProps!="function"||(u!==r||s!==c)&&Fu(t,i,r,c),pt=!1;var h=t.memoizedState;i.state=h,ul(t,r,i,l),s=t.memoizedState,u!==r||h!==s||we.current||pt?(typeof g=="function"&&(Fo(t,n,g,r),s=t.memoizedState),(u=pt||Iu(t,n,u,r,h,s,c))?(m||typeof i.UNSAFE_componentWillMount!="function"&&typeof i.componentWillMount!="function"||(typeof i.componentWillMount=="function"&&i.componentWillMount(),typeof i.UNSAFE_componentWillMount=="function"&&i.UNSAFE_componentWillMount()),typeof i.componentDidMount=="function"&&(t.flags|=4194308)):(typeof i.componentDidMount=="function"&&(t.flags|=4194308),t.memoizedProps=r,t.memoizedState=s),i.props=r,i.state=s,i.context=c,r=u):(typeof i.componentDidMount=="function"&&(t.flags|=4194308),r=!1)}else{i=t.stateNode,Sa(e,t),u=t.memoizedProps,c=t.type===t.elementType?u:Oe(t.type,u),i.props=c,m=t.pendingProps,h=i.context,s=n.contextType,typeof s=="object"&&s!==null?s=Me(s):(s=xe(n)?Bt:ce.current,s=yn(t,s));var x=n.getDerivedStateFromProps;(g=typeof x=="function"||typeof i.getSnapshotBeforeUpdate=="function")||typeof i.UNSAFE_componentWillReceiveProps!="function"&&typeof i.componentWillReceiveProps!="function"||(u!==m||h!==s)&&Fu(t,i,r,s),pt=!1,h=t.memoizedState,i.state=h,ul(t,r,i,l);var S=t.memoizedState;u!==m||h!==S||we.current||pt?(typeof x=="function"&&(Fo(t,n,x,r),S=t.memoizedState),(c=pt||Iu(t,n,c,r,h,S,s)||!1)?(g||typeof i.UNSAFE_componentWillUpdate!="function"&&typeof i.componentWillUpdate!="function"||(typeof i.componentWillUpdate=="function"&&i.componentWillUpdate(r,S,s),typeof i.UNSAFE_componentWillUpdate=="function"&&i.UNSAFE_componentWillUpdate(r,S,s)),typeof i.componentDidUpdate=="function"&&(t.flags|=4),typeof i.getSnapshotBeforeUpdate=="function"&&(t.flags|=1024)):(typeof i.componentDidUpdate!="function"||u===e.memoizedProps&&h===e.memoizedState||(t.flags|=4),typeof i.getSnapshotBeforeUpdate!="function"||u===e.memoizedProps&&h===e.memoizedState||(t.flags|=1024),t.memoizedProps=r,t.memoizedState=S),i.props=r,i.state=S,i.context=s,r=c):(typeof i.componentDidUpdate!="function"||u===e.memoizedProps&&h===e.memoizedState||(t.flags|=4),typeof i.getSnapshotBeforeUpdate!="function"||u===e.memoizedProps&&h===e.memoizedState||(t.flags|=1024),r=!1)}return Wo(e,t,n,r,o,l)}function Wo(e,t,n,r,l,o){Ya(e,t);var i=(t.flags&128)!==0;if(!r&&!i)return l&&Pu(t,n,!1),ot(e,t,o);r=t.stateNode,Nd.current=t;var u=i&&typeof n.getDerivedStateFromError!="function"?null:r.render();return t.flags|=1,e!==null&&i?(t.child=xn(t,e.child,null,o),t.child=xn(t,null,u,o)):pe(e,t,u,o),t.memoizedState=r.state,l&&Pu(t,n,!0),t.child}function Xa(e){var t=e.stateNode;t.pendingContext?ju(e,t.pendingContext,t.pendingContext!==t.context):t.context&&ju(e,t.context,!1),Pi(e,t.containerInfo)}function Hu(e,t,n,r,l){return wn(),ki(l),t.flags|=256,pe(e,t,n,r),t.child}var Vo={dehydrated:null,treeContext:null,retryLane:0};function Bo(e){return{baseLanes:e,cachePool:null,transitions:null}}function Ga(e,t,n){var r=t.pendingProps,l=Q.current,o=!1,i=(t.flags&128)!==0,u;if((u=i)||(u=e!==null&&e.memoizedState===null?!1:(l&2)!==0),u?(o=!0,t.flags&=-129):(e===null||e.memoizedState!==null)&&(l|=1),U(Q,l&1),e===null)return Oo(t),e=t.memoizedState,e!==null&&(e=e.dehydrated,e!==null)?(t.mode&1?e.data==="$!"?t.lanes=8:t.lanes=1073741824:t.lanes=1,null):(i=r.children,e=r.fallback,o?(r=t.mode,o=t.child,i={mode:"hidden",children:i},!(r&1)&&o!==null?(o.childLanes=0,o.pendingProps=i):o=jl(i,r,0,null),e=Vt(e,r,n,null),o.return=t,e.return=t,o.sibling=e,t.child=o,t.child.memoizedState=Bo(n),t.memoizedState=Vo,e):Ii(t,i));if(l=e.memoizedState,l!==null&&(u=l.dehydrated,u!==null))return _d(e,t,i,r,u,l,n);if(o){o=r.fallback,i=t.mode,l=e.child,u=l.sibling;var s={mode:"hidden",children:r.children};return!(i&1)&&t.child!==l?(r=t.child,r.childLanes=0,r.pendingProps=s,t.deletions=null):(r=Pt(l,s),r.subtreeFlags=l.subtreeFlags&14680064),u!==null?o=Pt(u,o):(o=Vt(o,i,n,null),o.flags|=2),o.return=t,r.return=t,r.sibling=o,t.child=r,r=o,o=t.child,i=e.child.memoizedState,i=i===null?Bo(n):{baseLanes:i.baseLanes|n,cachePool:null,transitions:i.transitions},o.memoizedState=i,o.childLanes=e.childLanes&~n,t.memoizedState=Vo,r}return o=e.child,e=o.sibling,r=Pt(o,{mode:"visible",children:r.children}),!(t.mode&1)&&(r.lanes=n),r.return=t,r.sibling=null,e!==null&&(n=t.deletions,n===null?(t.deletions=[e],t.flags|=16):n.push(e)),t.child=r,t.memoizedState=null,r}function Ii(e,t){return t=jl({mode:"visible",children:t},e.mode,0,null),t.return=e,e.child=t}function zr(e,t,n,r){return r!==null&&ki(r),xn(t,e.child,null,n),e=Ii(t,t.pendingProps.children),e.flags|=2,t.memoizedState=null,e}function _d(e,t,n,r,l,o,i){if(n)return t.flags&256?(t.flags&=-257,r=no(Error(w(422))),zr(e,t,i,r)):t.memoizedState!==null?(t.child=e.child,t.flags|=128,null):(o=r.fallback,l=t.mode,r=jl({mode:"visible",children:r.children},l,0,null),o=Vt(o,l,i,null),o.flags|=2,r.return=t,o.return=t,r.sibling=o,t.child=r,t.mode&1&&xn(t,e.child,null,i),t.child.memoizedState=Bo(i),t.memoizedState=Vo,o);if(!(t.mode&1))return zr(e,t,i,null);if(l.data==="$!"){if(r=l.nextSibling&&l.nextSibling.dataset,r)var u=r.dgst;return r=u,o=Error(w(419)),r=no(o,r,void 0),zr(e,t,i,r)}if(u=(i&e.childLanes)!==0,ye||u){if(r=ne,r!==null){switch(i&-i){case 4:l=2;break;case 16:l=8;break;case 64:case 128:case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:case 4194304:case 8388608:case 16777216:case 33554432:case 67108864:l=32;break;case 536870912:l=268435456;break;default:l=0}l=l&(r.suspendedLanes|i)?0:l,l!==0&&l!==o.retryLane&&(o.retryLane=l,lt(e,l),$e(r,e,l,-1))}return Vi(),r=no(Error(w(421))),zr(e,t,i,r)}return l.data==="$?"?(t.flags|=128,t.child=e.child,t=$d.bind(null,e),l._reactRetry=t,null):(e=o.treeContext,Ee=Ct(l.nextSibling),Ce=t,B=!0,Fe=null,e!==null&&(Pe[Te++]=be,Pe[Te++]=et,Pe[Te++]=Ht,be=e.id,et=e.overflow,Ht=t),t=Ii(t,r.children),t.flags|=4096,t)}function Qu(e,t,n){e.lanes|=t;var r=e.alternate;r!==null&&(r.lanes|=t),Io(e.return,t,n)}function ro(e,t,n,r,l){var o=e.memoizedState;o===null?e.memoizedState={isBackwards:t,rendering:null,renderingStartTime:0,last:r,tail:n,tailMode:l}:(o.isBackwards=t,o.rendering=null,o.renderingStartTime=0,o.last=r,o.tail=n,o.tailMode=l)}function Za(e,t,n){var r=t.pendingProps,l=r.revealOrder,o=r.tail;if(pe(e,t,r.children,n),r=Q.current,r&2)r=r&1|2,t.flags|=128;else{if(e!==null&&e.flags&128)e:for(e=t.child;e!==null;){if(e.tag===13)e.memoizedState!==null&&Qu(e,n,t);else if(e.tag===19)Qu(e,n,t);else if(e.child!==null){e.child.return=e,e=e.child;continue}if(e===t)break e;for(;e.sibling===null;){if(e.return===null||e.return===t)break e;e=e.return}e.sibling.return=e.return,e=e.sibling}r&=1}if(U(Q,r),!(t.mode&1))t.memoizedState=null;else switch(l){case"forwards":for(n=t.child,l=null;n!==null;)e=n.alternate,e!==null&&sl(e)===null&&(l=n),n=n.sibling;n=l,n===null?(l=t.child,t.child=null):(l=n.sibling,n.sibling=null),ro(t,!1,l,n,o);break;case"backwards":for(n=null,l=t.child,t.child=null;l!==null;){if(e=l.alternate,e!==null&&sl(e)===null){t.child=l;break}e=l.sibling,l.sibling=n,n=l,l=e}ro(t,!0,n,null,o);break;case"together":ro(t,!1,null,null,void 0);break;default:t.memoizedState=null}return t.child}function Vr(e,t){!(t.mode&1)&&e!==null&&(e.alternate=null,t.alternate=null,t.flags|=2)}function ot(e,t,n){if(e!==null&&(t.dependencies=e.dependencies),Kt|=t.lanes,!(n&t.childLanes))return null;if(e!==null&&t.child!==e.child)throw Error(w(153));if(t.child!==null){for(e=t.child,n=Pt(e,e.pendingProps),t.child=n,n.return=t;e.sibling!==null;)e=e.sibling,n=n.sibling=Pt(e,e.pendingProps),n.return=t;n.sibling=null}return t.child}function jd(e,t,n){switch(t.tag){case 3:Xa(t),wn();break;case 5:ka(t);break;case 1:xe(t.type)&&nl(t);break;case 4:Pi(t,t.stateNode.containerInfo);break;case 10:var r=t.type._context,l=t.memoizedProps.value;U(ol,r._currentValue),r._currentValue=l;break;case 13:if(r=t.memoizedState,r!==null)return r.dehydrated!==null?(U(Q,Q.current&1),t.flags|=128,null):n&t.child.childLanes?Ga(e,t,n):(U(Q,Q.current&1),e=ot(e,t,n),e!==null?e.sibling:null);U(Q,Q.current&1);break;case 19:if(r=(n&t.childLanes)!==0,e.flags&128){if(r)return Za(e,t,n);t.flags|=128}if(l=t.memoizedState,l!==null&&(l.rendering=null,l.tail=null,l.lastEffect=null),U(Q,Q.current),r)break;return null;case 22:case 23:return t.lanes=0,Ka(e,t,n)}return ot(e,t,n)}var Ja,Ho,qa,ba;Ja=function(e,t){for(var n=t.child;n!==null;){if(n.tag===5||n.tag===6)e.appendChild(n.stateNode);else if(n.tag!==4&&n.child!==null){n.child.return=n,n=n.child;continue}if(n===t)break;for(;n.sibling===null;){if(n.return===null||n.return===t)return;n=n.return}n.sibling.return=n.return,n=n.sibling}};Ho=function(){};qa=function(e,t,n,r){var l=e.memoizedProps;if(l!==r){e=t.stateNode,At(Ye.current);var o=null;switch(n){case"input":l=fo(e,l),r=fo(e,r),o=[];break;case"select":l=Y({},l,{value:void 0}),r=Y({},r,{value:void 0}),o=[];break;case"textarea":l=mo(e,l),r=mo(e,r),o=[];break;default:typeof l.onClick!="function"&&typeof r.onClick=="function"&&(e.onclick=el)}go(n,r);var i;n=null;for(c in l)if(!r.hasOwnProperty(c)&&l.hasOwnProperty(c)&&l[c]!=null)if(c==="style"){var u=l[c];for(i in u)u.hasOwnProperty(i)&&(n||(n={}),n[i]="")}else c!=="dangerouslySetInnerHTML"&&c!=="children"&&c!=="suppressContentEditableWarning"&&c!=="suppressHydrationWarning"&&c!=="autoFocus"&&(Xn.hasOwnProperty(c)?o||(o=[]):(o=o||[]).push(c,null));for(c in r){var s=r[c];if(u=l!=null?l[c]:void 0,r.hasOwnProperty(c)&&s!==u&&(s!=null||u!=null))if(c==="style")if(u){for(i in u)!u.hasOwnProperty(i)||s&&s.hasOwnProperty(i)||(n||(n={}),n[i]="");for(i in s)s.hasOwnProperty(i)&&u[i]!==s[i]&&(n||(n={}),n[i]=s[i])}else n||(o||(o=[]),o.push(c,n)),n=s;else c==="dangerouslySetInnerHTML"?(s=s?s.__html:void 0,u=u?u.__html:void 0,s!=null&&u!==s&&(o=o||[]).push(c,s)):c==="children"?typeof s!="string"&&typeof s!="number"||(o=o||[]).push(c,""+s):c!=="suppressContentEditableWarning"&&c!=="suppressHydrationWarning"&&(Xn.hasOwnProperty(c)?(s!=null&&c==="onScroll"&&$("scroll",e),o||u===s||(o=[])):(o=o||[]).push(c,s))}n&&(o=o||[]).push("style",n);var c=o;(t.updateQueue=c)&&(t.flags|=4)}};ba=function(e,t,n,r){n!==r&&(t.flags|=4)};function Rn(e,t){if(!B)switch(e.tailMode){case"hidden":t=e.tail;for(var n=null;t!==null;)t.alternate!==null&&(n=t),t=t.sibling;n===null?e.tail=null:n.sibling=null;break;case"collapsed":n=e.tail;for(var r=null;n!==null;)n.alternate!==null&&(r=n),n=n.sibling;r===null?t||e.tail===null?e.tail=null:e.tail.sibling=null:r.sibling=null}}function se(e){var t=e.alternate!==null&&e.alternate.child===e.child,n=0,r=0;if(t)for(var l=e.child;l!==null;)n|=l.lanes|l.childLanes,r|=l.subtreeFlags&14680064,r|=l.flags&14680064,l.return=e,l=l.sibling;else for(l=e.child;l!==null;)n|=l.lanes|l.childLanes,r|=l.subtreeFlags,r|=l.flags,l.return=e,l=l.sibling;return e.subtreeFlags|=r,e.childLanes=n,t}function Pd(e,t,n){var r=t.pendingProps;switch(Si(t),t.tag){case 2:case 16:case 15:case 0:case 11:case 7:case 8:case 12:case 9:case 14:return se(t),null;case 1:return xe(t.type)&&tl(),se(t),null;case 3:return r=t.stateNode,Sn(),A(we),A(ce),zi(),r.pendingContext&&(r.context=r.pendingContext,r.pendingContext=null),(e===null||e.child===null)&&(Pr(t)?t.flags|=4:e===null||e.memoizedState.isDehydrated&&!(t.flags&256)||(t.flags|=1024,Fe!==null&&(qo(Fe),Fe=null))),Ho(e,t),se(t),null;case 5:Ti(t);var l=At(ir.current);if(n=t.type,e!==null&&t.stateNode!=null)qa(e,t,n,r,l),e.ref!==t.ref&&(t.flags|=512,t.flags|=2097152);else{if(!r){if(t.stateNode===null)throw Error(w(166));return se(t),null}if(e=At(Ye.current),Pr(t)){r=t.stateNode,n=t.type;var o=t.memoizedProps;switch(r[Qe]=t,r[lr]=o,e=(t.mode&1)!==0,n){case"dialog":$("cancel",r),$("close",r);break;case"iframe":case"object":case"embed":$("load",r);break;case"video":case"audio":for(l=0;l<Un.length;l++)$(Un[l],r);break;case"source":$("error",r);break;case"img":case"image":case"link":$("error",r),$("load",r);break;case"details":$("toggle",r);break;case"input":eu(r,o),$("invalid",r);break;case"select":r._wrapperState={wasMultiple:!!o.multiple},$("invalid",r);break;case"textarea":nu(r,o),$("invalid",r)}go(n,o),l=null;for(var i in o)if(o.hasOwnProperty(i)){var u=o[i];i==="children"?typeof u=="string"?r.textContent!==u&&(o.suppressHydrationWarning!==!0&&jr(r.textContent,u,e),l=["children",u]):typeof u=="number"&&r.textContent!==""+u&&(o.suppressHydrationWarning!==!0&&jr(r.textContent,u,e),l=["children",""+u]):Xn.hasOwnProperty(i)&&u!=null&&i==="onScroll"&&$("scroll",r)}switch(n){case"input":wr(r),tu(r,o,!0);break;case"textarea":wr(r),ru(r);break;case"select":case"option":break;default:typeof o.onClick=="function"&&(r.onclick=el)}r=l,t.updateQueue=r,r!==null&&(t.flags|=4)}else{i=l.nodeType===9?l:l.ownerDocument,e==="http://www.w3.org/1999/xhtml"&&(e=js(n)),e==="http://www.w3.org/1999/xhtml"?n==="script"?(e=i.createElement("div"),e.innerHTML="<script><\/script>",e=e.removeChild(e.firstChild)):typeof r.is=="string"?e=i.createElement(n,{is:r.is}):(e=i.createElement(n),n==="select"&&(i=e,r.multiple?i.multiple=!0:r.size&&(i.size=r.size))):e=i.createElementNS(e,n),e[Qe]=t,e[lr]=r,Ja(e,t,!1,!1),t.stateNode=e;e:{switch(i=yo(n,r),n){case"dialog":$("cancel",e),$("close",e),l=r;break;case"iframe":case"object":case"embed":$("load",e),l=r;break;case"video":case"audio":for(l=0;l<Un.length;l++)$(Un[l],e);l=r;break;case"source":$("error",e),l=r;break;case"img":case"image":case"link":$("error",e),$("load",e),l=r;break;case"details":$("toggle",e),l=r;break;case"input":eu(e,r),l=fo(e,r),$("invalid",e);break;case"option":l=r;break;case"select":e._wrapperState={wasMultiple:!!r.multiple},l=Y({},r,{value:void 0}),$("invalid",e);break;case"textarea":nu(e,r),l=mo(e,r),$("invalid",e);break;default:l=r}go(n,l),u=l;for(o in u)if(u.hasOwnProperty(o)){var s=u[o];o==="style"?zs(e,s):o==="dangerouslySetInnerHTML"?(s=s?s.__html:void 0,s!=null&&Ps(e,s)):o==="children"?typeof s=="string"?(n!=="textarea"||s!=="")&&Gn(e,s):typeof s=="number"&&Gn(e,""+s):o!=="suppressContentEditableWarning"&&o!=="suppressHydrationWarning"&&o!=="autoFocus"&&(Xn.hasOwnProperty(o)?s!=null&&o==="onScroll"&&$("scroll",e):s!=null&&ii(e,o,s,i))}switch(n){case"input":wr(e),tu(e,r,!1);break;case"textarea":wr(e),ru(e);break;case"option":r.value!=null&&e.setAttribute("value",""+Tt(r.value));break;case"select":e.multiple=!!r.multiple,o=r.value,o!=null?fn(e,!!r.multiple,o,!1):r.defaultValue!=null&&fn(e,!!r.multiple,r.defaultValue,!0);break;default:typeof l.onClick=="function"&&(e.onclick=el)}switch(n){case"button":case"input":case"select":case"textarea":r=!!r.autoFocus;break e;case"img":r=!0;break e;default:r=!1}}r&&(t.flags|=4)}t.ref!==null&&(t.flags|=512,t.flags|=2097152)}return se(t),null;case 6:if(e&&t.stateNode!=null)ba(e,t,e.memoizedProps,r);else{if(typeof r!="string"&&t.stateNode===null)throw Error(w(166));if(n=At(ir.current),At(Ye.current),Pr(t)){if(r=t.stateNode,n=t.memoizedProps,r[Qe]=t,(o=r.nodeValue!==n)&&(e=Ce,e!==null))switch(e.tag){case 3:jr(r.nodeValue,n,(e.mode&1)!==0);break;case 5:e.memoizedProps.suppressHydrationWarning!==!0&&jr(r.nodeValue,n,(e.mode&1)!==0)}o&&(t.flags|=4)}else r=(n.nodeType===9?n:n.ownerDocument).createTextNode(r),r[Qe]=t,t.stateNode=r}return se(t),null;case 13:if(A(Q),r=t.memoizedState,e===null||e.memoizedState!==null&&e.memoizedState.dehydrated!==null){if(B&&Ee!==null&&t.mode&1&&!(t.flags&128))ga(),wn(),t.flags|=98560,o=!1;else if(o=Pr(t),r!==null&&r.dehydrated!==null){if(e===null){if(!o)throw Error(w(318));if(o=t.memoizedState,o=o!==null?o.dehydrated:null,!o)throw Error(w(317));o[Qe]=t}else wn(),!(t.flags&128)&&(t.memoizedState=null),t.flags|=4;se(t),o=!1}else Fe!==null&&(qo(Fe),Fe=null),o=!0;if(!o)return t.flags&65536?t:null}return t.flags&128?(t.lanes=n,t):(r=r!==null,r!==(e!==null&&e.memoizedState!==null)&&r&&(t.child.flags|=8192,t.mode&1&&(e===null||Q.current&1?ee===0&&(ee=3):Vi())),t.updateQueue!==null&&(t.flags|=4),se(t),null);case 4:return Sn(),Ho(e,t),e===null&&nr(t.stateNode.containerInfo),se(t),null;case 10:return Ni(t.type._context),se(t),null;case 17:return xe(t.type)&&tl(),se(t),null;case 19:if(A(Q),o=t.memoizedState,o===null)return se(t),null;if(r=(t.flags&128)!==0,i=o.rendering,i===null)if(r)Rn(o,!1);else{if(ee!==0||e!==null&&e.flags&128)for(e=t.child;e!==null;){if(i=sl(e),i!==null){for(t.flags|=128,Rn(o,!1),r=i.updateQueue,r!==null&&(t.updateQueue=r,t.flags|=4),t.subtreeFlags=0,r=n,n=t.child;n!==null;)o=n,e=r,o.flags&=14680066,i=o.alternate,i===null?(o.childLanes=0,o.lanes=e,o.child=null,o.subtreeFlags=0,o.memoizedProps=null,o.memoizedState=null,o.updateQueue=null,o.dependencies=null,o.stateNode=null):(o.childLanes=i.childLanes,o.lanes=i.lanes,o.child=i.child,o.subtreeFlags=0,o.deletions=null,o.memoizedProps=i.memoizedProps,o.memoizedState=i.memoizedState,o.updateQueue=i.updateQueue,o.type=i.type,e=i.dependencies,o.dependencies=e===null?null:{lanes:e.lanes,firstContext:e.firstContext}),n=n.sibling;return U(Q,Q.current&1|2),t.child}e=e.sibling}o.tail!==null&&Z()>En&&(t.flags|=128,r=!0,Rn(o,!1),t.lanes=4194304)}else{if(!r)if(e=sl(i),e!==null){if(t.flags|=128,r=!0,n=e.updateQueue,n!==null&&(t.updateQueue=n,t.flags|=4),Rn(o,!0),o.tail===null&&o.tailMode==="hidden"&&!i.alternate&&!B)return se(t),null}else 2*Z()-o.renderingStartTime>En&&n!==1073741824&&(t.flags|=128,r=!0,Rn(o,!1),t.lanes=4194304);o.isBackwards?(i.sibling=t.child,t.child=i):(n=o.last,n!==null?n.sibling=i:t.child=i,o.last=i)}return o.tail!==null?(t=o.tail,o.rendering=t,o.tail=t.sibling,o.renderingStartTime=Z(),t.sibling=null,n=Q.current,U(Q,r?n&1|2:n&1),t):(se(t),null);case 22:case 23:return Wi(),r=t.memoizedState!==null,e!==null&&e.memoizedState!==null!==r&&(t.flags|=8192),r&&t.mode&1?ke&1073741824&&(se(t),t.subtreeFlags&6&&(t.flags|=8192)):se(t),null;case 24:return null;case 25:return null}throw Error(w(156,t.tag))}function Td(e,t){switch(Si(t),t.tag){case 1:return xe(t.type)&&tl(),e=t.flags,e&65536?(t.flags=e&-65537|128,t):null;case 3:return Sn(),A(we),A(ce),zi(),e=t.flags,e&65536&&!(e&128)?(t.flags=e&-65537|128,t):null;case 5:return Ti(t),null;case 13:if(A(Q),e=t.memoizedState,e!==null&&e.dehydrated!==null){if(t.alternate===null)throw Error(w(340));wn()}return e=t.flags,e&65536?(t.flags=e&-65537|128,t):null;case 19:return A(Q),null;case 4:return Sn(),null;case 10:return Ni(t.type._context),null;case 22:case 23:return Wi(),null;case 24:return null;default:return null}}var Lr=!1,ae=!1,zd=typeof WeakSet=="function"?WeakSet:Set,N=null;function an(e,t){var n=e.ref;if(n!==null)if(typeof n=="function")try{n(null)}catch(r){X(e,t,r)}else n.current=null}function Qo(e,t,n){try{n()}catch(r){X(e,t,r)}}var Ku=!1;function Ld(e,t){if(Po=Jr,e=la(),wi(e)){if("selectionStart"in e)var n={start:e.selectionStart,end:e.selectionEnd};else e:{n=(n=e.ownerDocument)&&n.defaultView||window;var r=n.getSelection&&n.getSelection();if(r&&r.rangeCount!==0){n=r.anchorNode;var l=r.anchorOffset,o=r.focusNode;r=r.focusOffset;try{n.nodeType,o.nodeType}catch{n=null;break e}var i=0,u=-1,s=-1,c=0,g=0,m=e,h=null;t:for(;;){for(var x;m!==n||l!==0&&m.nodeType!==3||(u=i+l),m!==o||r!==0&&m.nodeType!==3||(s=i+r),m.nodeType===3&&(i+=m.nodeValue.length),(x=m.firstChild)!==null;)h=m,m=x;for(;;){if(m===e)break t;if(h===n&&++c===l&&(u=i),h===o&&++g===r&&(s=i),(x=m.nextSibling)!==null)break;m=h,h=m.parentNode}m=x}n=u===-1||s===-1?null:{start:u,end:s}}else n=null}n=n||{start:0,end:0}}else n=null;for(To={focusedElem:e,selectionRange:n},Jr=!1,N=t;N!==null;)if(t=N,e=t.child,(t.subtreeFlags&1028)!==0&&e!==null)e.return=t,N=e;else for(;N!==null;){t=N;try{var S=t.alternate;if(t.flags&1024)switch(t.tag){case 0:case 11:case 15:break;case 1:if(S!==null){var k=S.memoizedProps,F=S.memoizedState,f=t.stateNode,a=f.getSnapshotBeforeUpdate(t.elementType===t.type?k:Oe(t.type,k),F);f.__reactInternalSnapshotBeforeUpdate=a}break;case 3:var p=t.stateNode.containerInfo;p.nodeType===1?p.textContent="":p.nodeType===9&&p.documentElement&&p.removeChild(p.documentElement);break;case 5:case 6:case 4:case 17:break;default:throw Error(w(163))}}catch(y){X(t,t.return,y)}if(e=t.sibling,e!==null){e.return=t.return,N=e;break}N=t.return}return S=Ku,Ku=!1,S}function Qn(e,t,n){var r=t.updateQueue;if(r=r!==null?r.lastEffect:null,r!==null){var l=r=r.next;do{if((l.tag&e)===e){var o=l.destroy;l.destroy=void 0,o!==void 0&&Qo(t,n,o)}l=l.next}while(l!==r)}}function Nl(e,t){if(t=t.updateQueue,t=t!==null?t.lastEffect:null,t!==null){var n=t=t.next;do{if((n.tag&e)===e){var r=n.create;n.destroy=r()}n=n.next}while(n!==t)}}function Ko(e){var t=e.ref;if(t!==null){var n=e.stateNode;switch(e.tag){case 5:e=n;break;default:e=n}typeof t=="function"?t(e):t.current=e}}function ec(e){var t=e.alternate;t!==null&&(e.alternate=null,ec(t)),e.child=null,e.deletions=null,e.sibling=null,e.tag===5&&(t=e.stateNode,t!==null&&(delete t[Qe],delete t[lr],delete t[Mo],delete t[pd],delete t[hd])),e.stateNode=null,e.return=null,e.dependencies=null,e.memoizedProps=null,e.memoizedState=null,e.pendingProps=null,e.stateNode=null,e.updateQueue=null}function tc(e){return e.tag===5||e.tag===3||e.tag===4}function Yu(e){e:for(;;){for(;e.sibling===null;){if(e.return===null||tc(e.return))return null;e=e.return}for(e.sibling.return=e.return,e=e.sibling;e.tag!==5&&e.tag!==6&&e.tag!==18;){if(e.flags&2||e.child===null||e.tag===4)continue e;e.child.return=e,e=e.child}if(!(e.flags&2))return e.stateNode}}function Yo(e,t,n){var r=e.tag;if(r===5||r===6)e=e.stateNode,t?n.nodeType===8?n.parentNode.insertBefore(e,t):n.insertBefore(e,t):(n.nodeType===8?(t=n.parentNode,t.insertBefore(e,n)):(t=n,t.appendChild(e)),n=n._reactRootContainer,n!=null||t.onclick!==null||(t.onclick=el));else if(r!==4&&(e=e.child,e!==null))for(Yo(e,t,n),e=e.sibling;e!==null;)Yo(e,t,n),e=e.sibling}function Xo(e,t,n){var r=e.tag;if(r===5||r===6)e=e.stateNode,t?n.insertBefore(e,t):n.appendChild(e);else if(r!==4&&(e=e.child,e!==null))for(Xo(e,t,n),e=e.sibling;e!==null;)Xo(e,t,n),e=e.sibling}var le=null,Ie=!1;function ct(e,t,n){for(n=n.child;n!==null;)nc(e,t,n),n=n.sibling}function nc(e,t,n){if(Ke&&typeof Ke.onCommitFiberUnmount=="function")try{Ke.onCommitFiberUnmount(gl,n)}catch{}switch(n.tag){case 5:ae||an(n,t);case 6:var r=le,l=Ie;le=null,ct(e,t,n),le=r,Ie=l,le!==null&&(Ie?(e=le,n=n.stateNode,e.nodeType===8?e.parentNode.removeChild(n):e.removeChild(n)):le.removeChild(n.stateNode));break;case 18:le!==null&&(Ie?(e=le,n=n.stateNode,e.nodeType===8?Zl(e.parentNode,n):e.nodeType===1&&Zl(e,n),bn(e)):Zl(le,n.stateNode));break;case 4:r=le,l=Ie,le=n.stateNode.containerInfo,Ie=!0,ct(e,t,n),le=r,Ie=l;break;case 0:case 11:case 14:case 15:if(!ae&&(r=n.updateQueue,r!==null&&(r=r.lastEffect,r!==null))){l=r=r.next;do{var o=l,i=o.destroy;o=o.tag,i!==void 0&&(o&2||o&4)&&Qo(n,t,i),l=l.next}while(l!==r)}ct(e,t,n);break;case 1:if(!ae&&(an(n,t),r=n.stateNode,typeof r.componentWillUnmount=="function"))try{r.props=n.memoizedProps,r.state=n.memoizedState,r.componentWillUnmount()}catch(u){X(n,t,u)}ct(e,t,n);break;case 21:ct(e,t,n);break;case 22:n.mode&1?(ae=(r=ae)||n.memoizedState!==null,ct(e,t,n),ae=r):ct(e,t,n);break;default:ct(e,t,n)}}function Xu(e){var t=e.updateQueue;if(t!==null){e.updateQueue=null;var n=e.stateNode;n===null&&(n=e.stateNode=new zd),t.forEach(function(r){var l=Ad.bind(null,e,r);n.has(r)||(n.add(r),r.then(l,l))})}}function De(e,t){var n=t.deletions;if(n!==null)for(var r=0;r<n.length;r++){var l=n[r];try{var o=e,i=t,u=i;e:for(;u!==null;){switch(u.tag){case 5:le=u.stateNode,Ie=!1;break e;case 3:le=u.stateNode.containerInfo,Ie=!0;break e;case 4:le=u.stateNode.containerInfo,Ie=!0;break e}u=u.return}if(le===null)throw Error(w(160));nc(o,i,l),le=null,Ie=!1;var s=l.alternate;s!==null&&(s.return=null),l.return=null}catch(c){X(l,t,c)}}if(t.subtreeFlags&12854)for(t=t.child;t!==null;)rc(t,e),t=t.sibling}function rc(e,t){var n=e.alternate,r=e.flags;switch(e.tag){case 0:case 11:case 14:case 15:if(De(t,e),Be(e),r&4){try{Qn(3,e,e.return),Nl(3,e)}catch(k){X(e,e.return,k)}try{Qn(5,e,e.return)}catch(k){X(e,e.return,k)}}break;case 1:De(t,e),Be(e),r&512&&n!==null&&an(n,n.return);break;case 5:if(De(t,e),Be(e),r&512&&n!==null&&an(n,n.return),e.flags&32){var l=e.stateNode;try{Gn(l,"")}catch(k){X(e,e.return,k)}}if(r&4&&(l=e.stateNode,l!=null)){var o=e.memoizedProps,i=n!==null?n.memoizedProps:o,u=e.type,s=e.updateQueue;if(e.updateQueue=null,s!==null)try{u==="input"&&o.type==="radio"&&o.name!=null&&Ns(l,o),yo(u,i);var c=yo(u,o);for(i=0;i<s.length;i+=2){var g=s[i],m=s[i+1];g==="style"?zs(l,m):g==="dangerouslySetInnerHTML"?Ps(l,m):g==="children"?Gn(l,m):ii(l,g,m,c)}switch(u){case"input":po(l,o);break;case"textarea":_s(l,o);break;case"select":var h=l._wrapperState.wasMultiple;l._wrapperState.wasMultiple=!!o.multiple;var x=o.value;x!=null?fn(l,!!o.multiple,x,!1):h!==!!o.multiple&&(o.defaultValue!=null?fn(l,!!o.multiple,o.defaultValue,!0):fn(l,!!o.multiple,o.multiple?[]:"",!1))}l[lr]=o}catch(k){X(e,e.return,k)}}break;case 6:if(De(t,e),Be(e),r&4){if(e.stateNode===null)throw Error(w(162));l=e.stateNode,o=e.memoizedProps;try{l.nodeValue=o}catch(k){X(e,e.return,k)}}break;case 3:if(De(t,e),Be(e),r&4&&n!==null&&n.memoizedState.isDehydrated)try{bn(t.containerInfo)}catch(k){X(e,e.return,k)}break;case 4:De(t,e),Be(e);break;case 13:De(t,e),Be(e),l=e.child,l.flags&8192&&(o=l.memoizedState!==null,l.stateNode.isHidden=o,!o||l.alternate!==null&&l.alternate.memoizedState!==null||($i=Z())),r&4&&Xu(e);break;case 22:if(g=n!==null&&n.memoizedState!==null,e.mode&1?(ae=(c=ae)||g,De(t,e),ae=c):De(t,e),Be(e),r&8192){if(c=e.memoizedState!==null,(e.stateNode.isHidden=c)&&!g&&e.mode&1)for(N=e,g=e.child;g!==null;){for(m=N=g;N!==null;){switch(h=N,x=h.child,h.tag){case 0:case 11:case 14:case 15:Qn(4,h,h.return);break;case 1:an(h,h.return);var S=h.stateNode;if(typeof S.componentWillUnmount=="function"){r=h,n=h.return;try{t=r,S.props=t.memoizedProps,S.state=t.memoizedState,S.componentWillUnmount()}catch(k){X(r,n,k)}}break;case 5:an(h,h.return);break;case 22:if(h.memoizedState!==null){Zu(m);continue}}x!==null?(x.return=h,N=x):Zu(m)}g=g.sibling}e:for(g=null,m=e;;){if(m.tag===5){if(g===null){g=m;try{l=m.stateNode,c?(o=l.style,typeof o.setProperty=="function"?o.setProperty("display","none","important"):o.display="none"):(u=m.stateNode,s=m.memoizedProps.style,i=s!=null&&s.hasOwnProperty("display")?s.display:null,u.style.display=Ts("display",i))}catch(k){X(e,e.return,k)}}}else if(m.tag===6){if(g===null)try{m.stateNode.nodeValue=c?"":m.memoizedProps}catch(k){X(e,e.return,k)}}else if((m.tag!==22&&m.tag!==23||m.memoizedState===null||m===e)&&m.child!==null){m.child.return=m,m=m.child;continue}if(m===e)break e;for(;m.sibling===null;){if(m.return===null||m.return===e)break e;g===m&&(g=null),m=m.return}g===m&&(g=null),m.sibling.return=m.return,m=m.sibling}}break;case 19:De(t,e),Be(e),r&4&&Xu(e);break;case 21:break;default:De(t,e),Be(e)}}function Be(e){var t=e.flags;if(t&2){try{e:{for(var n=e.return;n!==null;){if(tc(n)){var r=n;break e}n=n.return}throw Error(w(160))}switch(r.tag){case 5:var l=r.stateNode;r.flags&32&&(Gn(l,""),r.flags&=-33);var o=Yu(e);Xo(e,o,l);break;case 3:case 4:var i=r.stateNode.containerInfo,u=Yu(e);Yo(e,u,i);break;default:throw Error(w(161))}}catch(s){X(e,e.return,s)}e.flags&=-3}t&4096&&(e.flags&=-4097)}function Md(e,t,n){N=e,lc(e)}function lc(e,t,n){for(var r=(e.mode&1)!==0;N!==null;){var l=N,o=l.child;if(l.tag===22&&r){var i=l.memoizedState!==null||Lr;if(!i){var u=l.alternate,s=u!==null&&u.memoizedState!==null||ae;u=Lr;var c=ae;if(Lr=i,(ae=s)&&!c)for(N=l;N!==null;)i=N,s=i.child,i.tag===22&&i.memoizedState!==null?Ju(l):s!==null?(s.return=i,N=s):Ju(l);for(;o!==null;)N=o,lc(o),o=o.sibling;N=l,Lr=u,ae=c}Gu(e)}else l.subtreeFlags&8772&&o!==null?(o.return=l,N=o):Gu(e)}}function Gu(e){for(;N!==null;){var t=N;if(t.flags&8772){var n=t.alternate;try{if(t.flags&8772)switch(t.tag){case 0:case 11:case 15:ae||Nl(5,t);break;case 1:var r=t.stateNode;if(t.flags&4&&!ae)if(n===null)r.componentDidMount();else{var l=t.elementType===t.type?n.memoizedProps:Oe(t.type,n.memoizedProps);r.componentDidUpdate(l,n.memoizedState,r.__reactInternalSnapshotBeforeUpdate)}var o=t.updateQueue;o!==null&&Ru(t,o,r);break;case 3:var i=t.updateQueue;if(i!==null){if(n=null,t.child!==null)switch(t.child.tag){case 5:n=t.child.stateNode;break;case 1:n=t.child.stateNode}Ru(t,i,n)}break;case 5:var u=t.stateNode;if(n===null&&t.flags&4){n=u;var s=t.memoizedProps;switch(t.type){case"button":case"input":case"select":case"textarea":s.autoFocus&&n.focus();break;case"img":s.src&&(n.src=s.src)}}break;case 6:break;case 4:break;case 12:break;case 13:if(t.memoizedState===null){var c=t.alternate;if(c!==null){var g=c.memoizedState;if(g!==null){var m=g.dehydrated;m!==null&&bn(m)}}}break;case 19:case 17:case 21:case 22:case 23:case 25:break;default:throw Error(w(163))}ae||t.flags&512&&Ko(t)}catch(h){X(t,t.return,h)}}if(t===e){N=null;break}if(n=t.sibling,n!==null){n.return=t.return,N=n;break}N=t.return}}function Zu(e){for(;N!==null;){var t=N;if(t===e){N=null;break}var n=t.sibling;if(n!==null){n.return=t.return,N=n;break}N=t.return}}function Ju(e){for(;N!==null;){var t=N;try{switch(t.tag){case 0:case 11:case 15:var n=t.return;try{Nl(4,t)}catch(s){X(t,n,s)}break;case 1:var r=t.stateNode;if(typeof r.componentDidMount=="function"){var l=t.return;try{r.componentDidMount()}catch(s){X(t,l,s)}}var o=t.return;try{Ko(t)}catch(s){X(t,o,s)}break;case 5:var i=t.return;try{Ko(t)}catch(s){X(t,i,s)}}}catch(s){X(t,t.return,s)}if(t===e){N=null;break}var u=t.sibling;if(u!==null){u.return=t.return,N=u;break}N=t.return}}var Rd=Math.ceil,fl=it.ReactCurrentDispatcher,Fi=it.ReactCurrentOwner,Le=it.ReactCurrentBatchConfig,D=0,ne=null,J=null,oe=0,ke=0,cn=Mt(0),ee=0,cr=null,Kt=0,_l=0,Ui=0,Kn=null,ge=null,$i=0,En=1/0,Je=null,dl=!1,Go=null,_t=null,Mr=!1,xt=null,pl=0,Yn=0,Zo=null,Br=-1,Hr=0;function he(){return D&6?Z():Br!==-1?Br:Br=Z()}function jt(e){return e.mode&1?D&2&&oe!==0?oe&-oe:vd.transition!==null?(Hr===0&&(Hr=Vs()),Hr):(e=I,e!==0||(e=window.event,e=e===void 0?16:Gs(e.type)),e):1}function $e(e,t,n,r){if(50<Yn)throw Yn=0,Zo=null,Error(w(185));dr(e,n,r),(!(D&2)||e!==ne)&&(e===ne&&(!(D&2)&&(_l|=n),ee===4&&gt(e,oe)),Se(e,r),n===1&&D===0&&!(t.mode&1)&&(En=Z()+500,kl&&Rt()))}function Se(e,t){var n=e.callbackNode;vf(e,t);var r=Zr(e,e===ne?oe:0);if(r===0)n!==null&&iu(n),e.callbackNode=null,e.callbackPriority=0;else if(t=r&-r,e.callbackPriority!==t){if(n!=null&&iu(n),t===1)e.tag===0?md(qu.bind(null,e)):ha(qu.bind(null,e)),fd(function(){!(D&6)&&Rt()}),n=null;else{switch(Bs(r)){case 1:n=fi;break;case 4:n=As;break;case 16:n=Gr;break;case 536870912:n=Ws;break;default:n=Gr}n=dc(n,oc.bind(null,e))}e.callbackPriority=t,e.callbackNode=n}}function oc(e,t){if(Br=-1,Hr=0,D&6)throw Error(w(327));var n=e.callbackNode;if(vn()&&e.callbackNode!==n)return null;var r=Zr(e,e===ne?oe:0);if(r===0)return null;if(r&30||r&e.expiredLanes||t)t=hl(e,r);else{t=r;var l=D;D|=2;var o=uc();(ne!==e||oe!==t)&&(Je=null,En=Z()+500,Wt(e,t));do try{Id();break}catch(u){ic(e,u)}while(!0);Ci(),fl.current=o,D=l,J!==null?t=0:(ne=null,oe=0,t=ee)}if(t!==0){if(t===2&&(l=Eo(e),l!==0&&(r=l,t=Jo(e,l))),t===1)throw n=cr,Wt(e,0),gt(e,r),Se(e,Z()),n;if(t===6)gt(e,r);else{if(l=e.current.alternate,!(r&30)&&!Dd(l)&&(t=hl(e,r),t===2&&(o=Eo(e),o!==0&&(r=o,t=Jo(e,o))),t===1))throw n=cr,Wt(e,0),gt(e,r),Se(e,Z()),n;switch(e.finishedWork=l,e.finishedLanes=r,t){case 0:case 1:throw Error(w(345));case 2:Ft(e,ge,Je);break;case 3:if(gt(e,r),(r&130023424)===r&&(t=$i+500-Z(),10<t)){if(Zr(e,0)!==0)break;if(l=e.suspendedLanes,(l&r)!==r){he(),e.pingedLanes|=e.suspendedLanes&l;break}e.timeoutHandle=Lo(Ft.bind(null,e,ge,Je),t);break}Ft(e,ge,Je);break;case 4:if(gt(e,r),(r&4194240)===r)break;for(t=e.eventTimes,l=-1;0<r;){var i=31-Ue(r);o=1<<i,i=t[i],i>l&&(l=i),r&=~o}if(r=l,r=Z()-r,r=(120>r?120:480>r?480:1080>r?1080:1920>r?1920:3e3>r?3e3:4320>r?4320:1960*Rd(r/1960))-r,10<r){e.timeoutHandle=Lo(Ft.bind(null,e,ge,Je),r);break}Ft(e,ge,Je);break;case 5:Ft(e,ge,Je);break;default:throw Error(w(329))}}}return Se(e,Z()),e.callbackNode===n?oc.bind(null,e):null}function Jo(e,t){var n=Kn;return e.current.memoizedState.isDehydrated&&(Wt(e,t).flags|=256),e=hl(e,t),e!==2&&(t=ge,ge=n,t!==null&&qo(t)),e}function qo(e){ge===null?ge=e:ge.push.apply(ge,e)}function Dd(e){for(var t=e;;){if(t.flags&16384){var n=t.updateQueue;if(n!==null&&(n=n.stores,n!==null))for(var r=0;r<n.length;r++){var l=n[r],o=l.getSnapshot;l=l.value;try{if(!Ae(o(),l))return!1}catch{return!1}}}if(n=t.child,t.subtreeFlags&16384&&n!==null)n.return=t,t=n;else{if(t===e)break;for(;t.sibling===null;){if(t.return===null||t.return===e)return!0;t=t.return}t.sibling.return=t.return,t=t.sibling}}return!0}function gt(e,t){for(t&=~Ui,t&=~_l,e.suspendedLanes|=t,e.pingedLanes&=~t,e=e.expirationTimes;0<t;){var n=31-Ue(t),r=1<<n;e[n]=-1,t&=~r}}function qu(e){if(D&6)throw Error(w(327));vn();var t=Zr(e,0);if(!(t&1))return Se(e,Z()),null;var n=hl(e,t);if(e.tag!==0&&n===2){var r=Eo(e);r!==0&&(t=r,n=Jo(e,r))}if(n===1)throw n=cr,Wt(e,0),gt(e,t),Se(e,Z()),n;if(n===6)throw Error(w(345));return e.finishedWork=e.current.alternate,e.finishedLanes=t,Ft(e,ge,Je),Se(e,Z()),null}function Ai(e,t){var n=D;D|=1;try{return e(t)}finally{D=n,D===0&&(En=Z()+500,kl&&Rt())}}function Yt(e){xt!==null&&xt.tag===0&&!(D&6)&&vn();var t=D;D|=1;var n=Le.transition,r=I;try{if(Le.transition=null,I=1,e)return e()}finally{I=r,Le.transition=n,D=t,!(D&6)&&Rt()}}function Wi(){ke=cn.current,A(cn)}function Wt(e,t){e.finishedWork=null,e.finishedLanes=0;var n=e.timeoutHandle;if(n!==-1&&(e.timeoutHandle=-1,cd(n)),J!==null)for(n=J.return;n!==null;){var r=n;switch(Si(r),r.tag){case 1:r=r.type.childContextTypes,r!=null&&tl();break;case 3:Sn(),A(we),A(ce),zi();break;case 5:Ti(r);break;case 4:Sn();break;case 13:A(Q);break;case 19:A(Q);break;case 10:Ni(r.type._context);break;case 22:case 23:Wi()}n=n.return}if(ne=e,J=e=Pt(e.current,null),oe=ke=t,ee=0,cr=null,Ui=_l=Kt=0,ge=Kn=null,$t!==null){for(t=0;t<$t.length;t++)if(n=$t[t],r=n.interleaved,r!==null){n.interleaved=null;var l=r.next,o=n.pending;if(o!==null){var i=o.next;o.next=l,r.next=i}n.pending=r}$t=null}return e}function ic(e,t){do{var n=J;try{if(Ci(),Ar.current=cl,al){for(var r=K.memoizedState;r!==null;){var l=r.queue;l!==null&&(l.pending=null),r=r.next}al=!1}if(Qt=0,te=b=K=null,Hn=!1,ur=0,Fi.current=null,n===null||n.return===null){ee=1,cr=t,J=null;break}e:{var o=e,i=n.return,u=n,s=t;if(t=oe,u.flags|=32768,s!==null&&typeof s=="object"&&typeof s.then=="function"){var c=s,g=u,m=g.tag;if(!(g.mode&1)&&(m===0||m===11||m===15)){var h=g.alternate;h?(g.updateQueue=h.updateQueue,g.memoizedState=h.memoizedState,g.lanes=h.lanes):(g.updateQueue=null,g.memoizedState=null)}var x=$u(i);if(x!==null){x.flags&=-257,Au(x,i,u,o,t),x.mode&1&&Uu(o,c,t),t=x,s=c;var S=t.updateQueue;if(S===null){var k=new Set;k.add(s),t.updateQueue=k}else S.add(s);break e}else{if(!(t&1)){Uu(o,c,t),Vi();break e}s=Error(w(426))}}else if(B&&u.mode&1){var F=$u(i);if(F!==null){!(F.flags&65536)&&(F.flags|=256),Au(F,i,u,o,t),ki(kn(s,u));break e}}o=s=kn(s,u),ee!==4&&(ee=2),Kn===null?Kn=[o]:Kn.push(o),o=i;do{switch(o.tag){case 3:o.flags|=65536,t&=-t,o.lanes|=t;var f=Ba(o,s,t);Mu(o,f);break e;case 1:u=s;var a=o.type,p=o.stateNode;if(!(o.flags&128)&&(typeof a.getDerivedStateFromError=="function"||p!==null&&typeof p.componentDidCatch=="function"&&(_t===null||!_t.has(p)))){o.flags|=65536,t&=-t,o.lanes|=t;var y=Ha(o,u,t);Mu(o,y);break e}}o=o.return}while(o!==null)}ac(n)}catch(E){t=E,J===n&&n!==null&&(J=n=n.return);continue}break}while(!0)}function uc(){var e=fl.current;return fl.current=cl,e===null?cl:e}function Vi(){(ee===0||ee===3||ee===2)&&(ee=4),ne===null||!(Kt&268435455)&&!(_l&268435455)||gt(ne,oe)}function hl(e,t){var n=D;D|=2;var r=uc();(ne!==e||oe!==t)&&(Je=null,Wt(e,t));do try{Od();break}catch(l){ic(e,l)}while(!0);if(Ci(),D=n,fl.current=r,J!==null)throw Error(w(261));return ne=null,oe=0,ee}function Od(){for(;J!==null;)sc(J)}function Id(){for(;J!==null&&!uf();)sc(J)}function sc(e){var t=fc(e.alternate,e,ke);e.memoizedProps=e.pendingProps,t===null?ac(e):J=t,Fi.current=null}function ac(e){var t=e;do{var n=t.alternate;if(e=t.return,t.flags&32768){if(n=Td(n,t),n!==null){n.flags&=32767,J=n;return}if(e!==null)e.flags|=32768,e.subtreeFlags=0,e.deletions=null;else{ee=6,J=null;return}}else if(n=Pd(n,t,ke),n!==null){J=n;return}if(t=t.sibling,t!==null){J=t;return}J=t=e}while(t!==null);ee===0&&(ee=5)}function Ft(e,t,n){var r=I,l=Le.transition;try{Le.transition=null,I=1,Fd(e,t,n,r)}finally{Le.transition=l,I=r}return null}function Fd(e,t,n,r){do vn();while(xt!==null);if(D&6)throw Error(w(327));n=e.finishedWork;var l=e.finishedLanes;if(n===null)return null;if(e.finishedWork=null,e.finishedLanes=0,n===e.current)throw Error(w(177));e.callbackNode=null,e.callbackPriority=0;var o=n.lanes|n.childLanes;if(gf(e,o),e===ne&&(J=ne=null,oe=0),!(n.subtreeFlags&2064)&&!(n.flags&2064)||Mr||(Mr=!0,dc(Gr,function(){return vn(),null})),o=(n.flags&15990)!==0,n.subtreeFlags&15990||o){o=Le.transition,Le.transition=null;var i=I;I=1;var u=D;D|=4,Fi.current=null,Ld(e,n),rc(n,e),rd(To),Jr=!!Po,To=Po=null,e.current=n,Md(n),sf(),D=u,I=i,Le.transition=o}else e.current=n;if(Mr&&(Mr=!1,xt=e,pl=l),o=e.pendingLanes,o===0&&(_t=null),ff(n.stateNode),Se(e,Z()),t!==null)for(r=e.onRecoverableError,n=0;n<t.length;n++)l=t[n],r(l.value,{componentStack:l.stack,digest:l.digest});if(dl)throw dl=!1,e=Go,Go=null,e;return pl&1&&e.tag!==0&&vn(),o=e.pendingLanes,o&1?e===Zo?Yn++:(Yn=0,Zo=e):Yn=0,Rt(),null}function vn(){if(xt!==null){var e=Bs(pl),t=Le.transition,n=I;try{if(Le.transition=null,I=16>e?16:e,xt===null)var r=!1;else{if(e=xt,xt=null,pl=0,D&6)throw Error(w(331));var l=D;for(D|=4,N=e.current;N!==null;){var o=N,i=o.child;if(N.flags&16){var u=o.deletions;if(u!==null){for(var s=0;s<u.length;s++){var c=u[s];for(N=c;N!==null;){var g=N;switch(g.tag){case 0:case 11:case 15:Qn(8,g,o)}var m=g.child;if(m!==null)m.return=g,N=m;else for(;N!==null;){g=N;var h=g.sibling,x=g.return;if(ec(g),g===c){N=null;break}if(h!==null){h.return=x,N=h;break}N=x}}}var S=o.alternate;if(S!==null){var k=S.child;if(k!==null){S.child=null;do{var F=k.sibling;k.sibling=null,k=F}while(k!==null)}}N=o}}if(o.subtreeFlags&2064&&i!==null)i.return=o,N=i;else e:for(;N!==null;){if(o=N,o.flags&2048)switch(o.tag){case 0:case 11:case 15:Qn(9,o,o.return)}var f=o.sibling;if(f!==null){f.return=o.return,N=f;break e}N=o.return}}var a=e.current;for(N=a;N!==null;){i=N;var p=i.child;if(i.subtreeFlags&2064&&p!==null)p.return=i,N=p;else e:for(i=a;N!==null;){if(u=N,u.flags&2048)try{switch(u.tag){case 0:case 11:case 15:Nl(9,u)}}catch(E){X(u,u.return,E)}if(u===i){N=null;break e}var y=u.sibling;if(y!==null){y.return=u.return,N=y;break e}N=u.return}}if(D=l,Rt(),Ke&&typeof Ke.onPostCommitFiberRoot=="function")try{Ke.onPostCommitFiberRoot(gl,e)}catch{}r=!0}return r}finally{I=n,Le.transition=t}}return!1}function bu(e,t,n){t=kn(n,t),t=Ba(e,t,1),e=Nt(e,t,1),t=he(),e!==null&&(dr(e,1,t),Se(e,t))}function X(e,t,n){if(e.tag===3)bu(e,e,n);else for(;t!==null;){if(t.tag===3){bu(t,e,n);break}else if(t.tag===1){var r=t.stateNode;if(typeof t.type.getDerivedStateFromError=="function"||typeof r.componentDidCatch=="function"&&(_t===null||!_t.has(r))){e=kn(n,e),e=Ha(t,e,1),t=Nt(t,e,1),e=he(),t!==null&&(dr(t,1,e),Se(t,e));break}}t=t.return}}function Ud(e,t,n){var r=e.pingCache;r!==null&&r.delete(t),t=he(),e.pingedLanes|=e.suspendedLanes&n,ne===e&&(oe&n)===n&&(ee===4||ee===3&&(oe&130023424)===oe&&500>Z()-$i?Wt(e,0):Ui|=n),Se(e,t)}function cc(e,t){t===0&&(e.mode&1?(t=kr,kr<<=1,!(kr&130023424)&&(kr=4194304)):t=1);var n=he();e=lt(e,t),e!==null&&(dr(e,t,n),Se(e,n))}function $d(e){var t=e.memoizedState,n=0;t!==null&&(n=t.retryLane),cc(e,n)}function Ad(e,t){var n=0;switch(e.tag){case 13:var r=e.stateNode,l=e.memoizedState;l!==null&&(n=l.retryLane);break;case 19:r=e.stateNode;break;default:throw Error(w(314))}r!==null&&r.delete(t),cc(e,n)}var fc;fc=function(e,t,n){if(e!==null)if(e.memoizedProps!==t.pendingProps||we.current)ye=!0;else{if(!(e.lanes&n)&&!(t.flags&128))return ye=!1,jd(e,t,n);ye=!!(e.flags&131072)}else ye=!1,B&&t.flags&1048576&&ma(t,ll,t.index);switch(t.lanes=0,t.tag){case 2:var r=t.type;Vr(e,t),e=t.pendingProps;var l=yn(t,ce.current);mn(t,n),l=Mi(null,t,r,e,l,n);var o=Ri();return t.flags|=1,typeof l=="object"&&l!==null&&typeof l.render=="function"&&l.$$typeof===void 0?(t.tag=1,t.memoizedState=null,t.updateQueue=null,xe(r)?(o=!0,nl(t)):o=!1,t.memoizedState=l.state!==null&&l.state!==void 0?l.state:null,ji(t),l.updater=Cl,t.stateNode=l,l._reactInternals=t,Uo(t,r,e,n),t=Wo(null,t,r,!0,o,n)):(t.tag=0,B&&o&&xi(t),pe(null,t,l,n),t=t.child),t;case 16:r=t.elementType;e:{switch(Vr(e,t),e=t.pendingProps,l=r._init,r=l(r._payload),t.type=r,l=t.tag=Vd(r),e=Oe(r,e),l){case 0:t=Ao(null,t,r,e,n);break e;case 1:t=Bu(null,t,r,e,n);break e;case 11:t=Wu(null,t,r,e,n);break e;case 14:t=Vu(null,t,r,Oe(r.type,e),n);break e}throw Error(w(306,r,""))}return t;case 0:return r=t.type,l=t.pendingProps,l=t.elementType===r?l:Oe(r,l),Ao(e,t,r,l,n);case 1:return r=t.type,l=t.pendingProps,l=t.elementType===r?l:Oe(r,l),Bu(e,t,r,l,n);case 3:e:{if(Xa(t),e===null)throw Error(w(387));r=t.pendingProps,o=t.memoizedState,l=o.element,Sa(e,t),ul(t,r,null,n);var i=t.memoizedState;if(r=i.element,o.isDehydrated)if(o={element:r,isDehydrated:!1,cache:i.cache,pendingSuspenseBoundaries:i.pendingSuspenseBoundaries,transitions:i.transitions},t.updateQueue.baseState=o,t.memoizedState=o,t.flags&256){l=kn(Error(w(423)),t),t=Hu(e,t,r,n,l);break e}else if(r!==l){l=kn(Error(w(424)),t),t=Hu(e,t,r,n,l);break e}else for(Ee=Ct(t.stateNode.containerInfo.firstChild),Ce=t,B=!0,Fe=null,n=wa(t,null,r,n),t.child=n;n;)n.flags=n.flags&-3|4096,n=n.sibling;else{if(wn(),r===l){t=ot(e,t,n);break e}pe(e,t,r,n)}t=t.child}return t;case 5:return ka(t),e===null&&Oo(t),r=t.type,l=t.pendingProps,o=e!==null?e.memoizedProps:null,i=l.children,zo(r,l)?i=null:o!==null&&zo(r,o)&&(t.flags|=32),Ya(e,t),pe(e,t,i,n),t.child;case 6:return e===null&&Oo(t),null;case 13:return Ga(e,t,n);case 4:return Pi(t,t.stateNode.containerInfo),r=t.pendingProps,e===null?t.child=xn(t,null,r,n):pe(e,t,r,n),t.child;case 11:return r=t.type,l=t.pendingProps,l=t.elementType===r?l:Oe(r,l),Wu(e,t,r,l,n);case 7:return pe(e,t,t.pendingProps,n),t.child;case 8:return pe(e,t,t.pendingProps.children,n),t.child;case 12:return pe(e,t,t.pendingProps.children,n),t.child;case 10:e:{if(r=t.type._context,l=t.pendingProps,o=t.memoizedProps,i=l.value,U(ol,r._currentValue),r._currentValue=i,o!==null)if(Ae(o.value,i)){if(o.children===l.children&&!we.current){t=ot(e,t,n);break e}}else for(o=t.child,o!==null&&(o.return=t);o!==null;){var u=o.dependencies;if(u!==null){i=o.child;for(var s=u.firstContext;s!==null;){if(s.context===r){if(o.tag===1){s=tt(-1,n&-n),s.tag=2;var c=o.updateQueue;if(c!==null){c=c.shared;var g=c.pending;g===null?s.next=s:(s.next=g.next,g.next=s),c.pending=s}}o.lanes|=n,s=o.alternate,s!==null&&(s.lanes|=n),Io(o.return,n,t),u.lanes|=n;break}s=s.next}}else if(o.tag===10)i=o.type===t.type?null:o.child;else if(o.tag===18){if(i=o.return,i===null)throw Error(w(341));i.lanes|=n,u=i.alternate,u!==null&&(u.lanes|=n),Io(i,n,t),i=o.sibling}else i=o.child;if(i!==null)i.return=o;else for(i=o;i!==null;){if(i===t){i=null;break}if(o=i.sibling,o!==null){o.return=i.return,i=o;break}i=i.return}o=i}pe(e,t,l.children,n),t=t.child}return t;case 9:return l=t.type,r=t.pendingProps.children,mn(t,n),l=Me(l),r=r(l),t.flags|=1,pe(e,t,r,n),t.child;case 14:return r=t.type,l=Oe(r,t.pendingProps),l=Oe(r.type,l),Vu(e,t,r,l,n);case 15:return Qa(e,t,t.type,t.pendingProps,n);case 17:return r=t.type,l=t.pendingProps,l=t.elementType===r?l:Oe(r,l),Vr(e,t),t.tag=1,xe(r)?(e=!0,nl(t)):e=!1,mn(t,n),Va(t,r,l),Uo(t,r,l,n),Wo(null,t,r,!0,e,n);case 19:return Za(e,t,n);case 22:return Ka(e,t,n)}throw Error(w(156,t.tag))};function dc(e,t){return $s(e,t)}function Wd(e,t,n,r){this.tag=e,this.key=n,this.sibling=this.child=this.return=this.stateNode=this.type=this.elementType=null,this.index=0,this.ref=null,this.pendingProps=t,this.dependencies=this.memoizedState=this.updateQueue=this.memoizedProps=null,this.mode=r,this.subtreeFlags=this.flags=0,this.deletions=null,this.childLanes=this.lanes=0,this.alternate=null}function ze(e,t,n,r){return new Wd(e,t,n,r)}function Bi(e){return e=e.prototype,!(!e||!e.isReactComponent)}function Vd(e){if(typeof e=="function")return Bi(e)?1:0;if(e!=null){if(e=e.$$typeof,e===si)return 11;if(e===ai)return 14}return 2}function Pt(e,t){var n=e.alternate;return n===null?(n=ze(e.tag,t,e.key,e.mode),n.elementType=e.elementType,n.type=e.type,n.stateNode=e.stateNode,n.alternate=e,e.alternate=n):(n.pendingProps=t,n.type=e.type,n.flags=0,n.subtreeFlags=0,n.deletions=null),n.flags=e.flags&14680064,n.childLanes=e.childLanes,n.lanes=e.lanes,n.child=e.child,n.memoizedProps=e.memoizedProps,n.memoizedState=e.memoizedState,n.updateQueue=e.updateQueue,t=e.dependencies,n.dependencies=t===null?null:{lanes:t.lanes,firstContext:t.firstContext},n.sibling=e.sibling,n.index=e.index,n.ref=e.ref,n}function Qr(e,t,n,r,l,o){var i=2;if(r=e,typeof e=="function")Bi(e)&&(i=1);else if(typeof e=="string")i=5;else e:switch(e){case bt:return Vt(n.children,l,o,t);case ui:i=8,l|=8;break;case uo:return e=ze(12,n,t,l|2),e.elementType=uo,e.lanes=o,e;case so:return e=ze(13,n,t,l),e.elementType=so,e.lanes=o,e;case ao:return e=ze(19,n,t,l),e.elementType=ao,e.lanes=o,e;case ks:return jl(n,l,o,t);default:if(typeof e=="object"&&e!==null)switch(e.$$typeof){case xs:i=10;break e;case Ss:i=9;break e;case si:i=11;break e;case ai:i=14;break e;case dt:i=16,r=null;break e}throw Error(w(130,e==null?e:typeof e,""))}return t=ze(i,n,t,l),t.elementType=e,t.type=r,t.lanes=o,t}function Vt(e,t,n,r){return e=ze(7,e,r,t),e.lanes=n,e}function jl(e,t,n,r){return e=ze(22,e,r,t),e.elementType=ks,e.lanes=n,e.stateNode={isHidden:!1},e}function lo(e,t,n){return e=ze(6,e,null,t),e.lanes=n,e}function oo(e,t,n){return t=ze(4,e.children!==null?e.children:[],e.key,t),t.lanes=n,t.stateNode={containerInfo:e.containerInfo,pendingChildren:null,implementation:e.implementation},t}function Bd(e,t,n,r,l){this.tag=t,this.containerInfo=e,this.finishedWork=this.pingCache=this.current=this.pendingChildren=null,this.timeoutHandle=-1,this.callbackNode=this.pendingContext=this.context=null,this.callbackPriority=0,this.eventTimes=$l(0),this.expirationTimes=$l(-1),this.entangledLanes=this.finishedLanes=this.mutableReadLanes=this.expiredLanes=this.pingedLanes=this.suspendedLanes=this.pendingLanes=0,this.entanglements=$l(0),this.identifierPrefix=r,this.onRecoverableError=l,this.mutableSourceEagerHydrationData=null}function Hi(e,t,n,r,l,o,i,u,s){return e=new Bd(e,t,n,u,s),t===1?(t=1,o===!0&&(t|=8)):t=0,o=ze(3,null,null,t),e.current=o,o.stateNode=e,o.memoizedState={element:r,isDehydrated:n,cache:null,transitions:null,pendingSuspenseBoundaries:null},ji(o),e}function Hd(e,t,n){var r=3<arguments.length&&arguments[3]!==void 0?arguments[3]:null;return{$$typeof:qt,key:r==null?null:""+r,children:e,containerInfo:t,implementation:n}}function pc(e){if(!e)return zt;e=e._reactInternals;e:{if(Gt(e)!==e||e.tag!==1)throw Error(w(170));var t=e;do{switch(t.tag){case 3:t=t.stateNode.context;break e;case 1:if(xe(t.type)){t=t.stateNode.__reactInternalMemoizedMergedChildContext;break e}}t=t.return}while(t!==null);throw Error(w(171))}if(e.tag===1){var n=e.type;if(xe(n))return pa(e,n,t)}return t}function hc(e,t,n,r,l,o,i,u,s){return e=Hi(n,r,!0,e,l,o,i,u,s),e.context=pc(null),n=e.current,r=he(),l=jt(n),o=tt(r,l),o.callback=t??null,Nt(n,o,l),e.current.lanes=l,dr(e,l,r),Se(e,r),e}function Pl(e,t,n,r){var l=t.current,o=he(),i=jt(l);return n=pc(n),t.context===null?t.context=n:t.pendingContext=n,t=tt(o,i),t.payload={element:e},r=r===void 0?null:r,r!==null&&(t.callback=r),e=Nt(l,t,i),e!==null&&($e(e,l,i,o),$r(e,l,i)),i}function ml(e){if(e=e.current,!e.child)return null;switch(e.child.tag){case 5:return e.child.stateNode;default:return e.child.stateNode}}function es(e,t){if(e=e.memoizedState,e!==null&&e.dehydrated!==null){var n=e.retryLane;e.retryLane=n!==0&&n<t?n:t}}function Qi(e,t){es(e,t),(e=e.alternate)&&es(e,t)}function Qd(){return null}var mc=typeof reportError=="function"?reportError:function(e){console.error(e)};function Ki(e){this._internalRoot=e}Tl.prototype.render=Ki.prototype.render=function(e){var t=this._internalRoot;if(t===null)throw Error(w(409));Pl(e,t,null,null)};Tl.prototype.unmount=Ki.prototype.unmount=function(){var e=this._internalRoot;if(e!==null){this._internalRoot=null;var t=e.containerInfo;Yt(function(){Pl(null,e,null,null)}),t[rt]=null}};function Tl(e){this._internalRoot=e}Tl.prototype.unstable_scheduleHydration=function(e){if(e){var t=Ks();e={blockedOn:null,target:e,priority:t};for(var n=0;n<vt.length&&t!==0&&t<vt[n].priority;n++);vt.splice(n,0,e),n===0&&Xs(e)}};function Yi(e){return!(!e||e.nodeType!==1&&e.nodeType!==9&&e.nodeType!==11)}function zl(e){return!(!e||e.nodeType!==1&&e.nodeType!==9&&e.nodeType!==11&&(e.nodeType!==8||e.nodeValue!==" react-mount-point-unstable "))}function ts(){}function Kd(e,t,n,r,l){if(l){if(typeof r=="function"){var o=r;r=function(){var c=ml(i);o.call(c)}}var i=hc(t,r,e,0,null,!1,!1,"",ts);return e._reactRootContainer=i,e[rt]=i.current,nr(e.nodeType===8?e.parentNode:e),Yt(),i}for(;l=e.lastChild;)e.removeChild(l);if(typeof r=="function"){var u=r;r=function(){var c=ml(s);u.call(c)}}var s=Hi(e,0,!1,null,null,!1,!1,"",ts);return e._reactRootContainer=s,e[rt]=s.current,nr(e.nodeType===8?e.parentNode:e),Yt(function(){Pl(t,s,n,r)}),s}function Ll(e,t,n,r,l){var o=n._reactRootContainer;if(o){var i=o;if(typeof l=="function"){var u=l;l=function(){var s=ml(i);u.call(s)}}Pl(t,i,e,l)}else i=Kd(n,t,e,l,r);return ml(i)}Hs=function(e){switch(e.tag){case 3:var t=e.stateNode;if(t.current.memoizedState.isDehydrated){var n=Fn(t.pendingLanes);n!==0&&(di(t,n|1),Se(t,Z()),!(D&6)&&(En=Z()+500,Rt()))}break;case 13:Yt(function(){var r=lt(e,1);if(r!==null){var l=he();$e(r,e,1,l)}}),Qi(e,1)}};pi=function(e){if(e.tag===13){var t=lt(e,134217728);if(t!==null){var n=he();$e(t,e,134217728,n)}Qi(e,134217728)}};Qs=function(e){if(e.tag===13){var t=jt(e),n=lt(e,t);if(n!==null){var r=he();$e(n,e,t,r)}Qi(e,t)}};Ks=function(){return I};Ys=function(e,t){var n=I;try{return I=e,t()}finally{I=n}};xo=function(e,t,n){switch(t){case"input":if(po(e,n),t=n.name,n.type==="radio"&&t!=null){for(n=e;n.parentNode;)n=n.parentNode;for(n=n.querySelectorAll("input[name="+JSON.stringify(""+t)+'][type="radio"]'),t=0;t<n.length;t++){var r=n[t];if(r!==e&&r.form===e.form){var l=Sl(r);if(!l)throw Error(w(90));Cs(r),po(r,l)}}}break;case"textarea":_s(e,n);break;case"select":t=n.value,t!=null&&fn(e,!!n.multiple,t,!1)}};Rs=Ai;Ds=Yt;var Yd={usingClientEntryPoint:!1,Events:[hr,rn,Sl,Ls,Ms,Ai]},Dn={findFiberByHostInstance:Ut,bundleType:0,version:"18.3.1",rendererPackageName:"react-dom"},Xd={bundleType:Dn.bundleType,version:Dn.version,rendererPackageName:Dn.rendererPackageName,rendererConfig:Dn.rendererConfig,overrideHookState:null,overrideHookStateDeletePath:null,overrideHookStateRenamePath:null,overrideProps:null,overridePropsDeletePath:null,overridePropsRenamePath:null,setErrorHandler:null,setSuspenseHandler:null,scheduleUpdate:null,currentDispatcherRef:it.ReactCurrentDispatcher,findHostInstanceByFiber:function(e){return e=Fs(e),e===null?null:e.stateNode},findFiberByHostInstance:Dn.findFiberByHostInstance||Qd,findHostInstancesForRefresh:null,scheduleRefresh:null,scheduleRoot:null,setRefreshHandler:null,getCurrentFiber:null,reconcilerVersion:"18.3.1-next-f1338f8080-20240426"};if(typeof __REACT_DEVTOOLS_GLOBAL_HOOK__<"u"){var Rr=__REACT_DEVTOOLS_GLOBAL_HOOK__;if(!Rr.isDisabled&&Rr.supportsFiber)try{gl=Rr.inject(Xd),Ke=Rr}catch{}}_e.__SECRET_INTERNALS_DO_NOT_USE_OR_YOU_WILL_BE_FIRED=Yd;_e.createPortal=function(e,t){var n=2<arguments.length&&arguments[2]!==void 0?arguments[2]:null;if(!Yi(t))throw Error(w(200));return Hd(e,t,null,n)};_e.createRoot=function(e,t){if(!Yi(e))throw Error(w(299));var n=!1,r="",l=mc;return t!=null&&(t.unstable_strictMode===!0&&(n=!0),t.identifierPrefix!==void 0&&(r=t.identifierPrefix),t.onRecoverableError!==void 0&&(l=t.onRecoverableError)),t=Hi(e,1,!1,null,null,n,!1,r,l),e[rt]=t.current,nr(e.nodeType===8?e.parentNode:e),new Ki(t)};_e.findDOMNode=function(e){if(e==null)return null;if(e.nodeType===1)return e;var t=e._reactInternals;if(t===void 0)throw typeof e.render=="function"?Error(w(188)):(e=Object.keys(e).join(","),Error(w(268,e)));return e=Fs(t),e=e===null?null:e.stateNode,e};_e.flushSync=function(e){return Yt(e)};_e.hydrate=function(e,t,n){if(!zl(t))throw Error(w(200));return Ll(null,e,t,!0,n)};_e.hydrateRoot=function(e,t,n){if(!Yi(e))throw Error(w(405));var r=n!=null&&n.hydratedSources||null,l=!1,o="",i=mc;if(n!=null&&(n.unstable_strictMode===!0&&(l=!0),n.identifierPrefix!==void 0&&(o=n.identifierPrefix),n.onRecoverableError!==void 0&&(i=n.onRecoverableError)),t=hc(t,null,e,1,n??null,l,!1,o,i),e[rt]=t.current,nr(e),r)for(e=0;e<r.length;e++)n=r[e],l=n._getVersion,l=l(n._source),t.mutableSourceEagerHydrationData==null?t.mutableSourceEagerHydrationData=[n,l]:t.mutableSourceEagerHydrationData.push(n,l);return new Tl(t)};_e.render=function(e,t,n){if(!zl(t))throw Error(w(200));return Ll(null,e,t,!1,n)};_e.unmountComponentAtNode=function(e){if(!zl(e))throw Error(w(40));return e._reactRootContainer?(Yt(function(){Ll(null,null,e,!1,function(){e._reactRootContainer=null,e[rt]=null})}),!0):!1};_e.unstable_batchedUpdates=Ai;_e.unstable_renderSubtreeIntoContainer=function(e,t,n,r){if(!zl(n))throw Error(w(200));if(e==null||e._reactInternals===void 0)throw Error(w(38));return Ll(e,t,n,!1,r)};_e.version="18.3.1-next-f1338f8080-20240426";function vc(){if(!(typeof __REACT_DEVTOOLS_GLOBAL_HOOK__>"u"||typeof __REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE!="function"))try{__REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE(vc)}catch(e){console.error(e)}}vc(),vs.exports=_e;var Gd=vs.exports,gc,ns=Gd;gc=ns.createRoot,ns.hydrateRoot;function ht(e,t,n){return d.jsxs("svg",{width:t,height:t,viewBox:"0 0 24 24","aria-label":n,role:"img",children:[d.jsx("title",{children:n}),e]})}const mt=({children:e})=>d.jsx("g",{fill:"none",stroke:"currentColor",strokeWidth:1.6,strokeLinecap:"round",strokeLinejoin:"round",children:e});function yt(e,t,n){return d.jsx("img",{src:e,width:n,height:n,alt:t,title:t,style:{display:"inline-block"}})}function rs(e,t=16){const n=(e||"").toLowerCase();return n.includes("gpt")||n.includes("o4")||n.startsWith("openai")?yt("/static/icons/openai-svgrepo-com.svg","GPT",t):n.includes("claude")?yt("/static/icons/anthropic-icon-logo.svg","Claude",t):n.includes("gemini")?yt("/static/icons/google-gemini-logo.svg","Gemini",t):n.includes("llama")?ht(d.jsxs(mt,{children:[d.jsx("path",{d:"M6 17c3 1 9 1 12 0"}),d.jsx("path",{d:"M8 17V9l2-2 2 2v8"}),d.jsx("path",{d:"M10 7l1-2 1 2"})]}),t,"Llama"):n.includes("mistral")||n.includes("mixtral")?ht(d.jsxs(mt,{children:[d.jsx("path",{d:"M3 9h10c2 0 2-3 0-3"}),d.jsx("path",{d:"M3 15h14c3 0 3-4 0-4"})]}),t,"Mistral"):n.includes("qwen")?ht(d.jsxs(mt,{children:[d.jsx("path",{d:"M6 12a6 6 0 1 1 6 6"}),d.jsx("path",{d:"M12 18l3-3"})]}),t,"Qwen"):n.includes("deepseek")?ht(d.jsxs(mt,{children:[d.jsx("path",{d:"M4 12l8-8 8 8-8 8z"}),d.jsx("path",{d:"M8 12l4-4 4 4-4 4z"})]}),t,"DeepSeek"):n.includes("phi")?ht(d.jsxs(mt,{children:[d.jsx("circle",{cx:"12",cy:"12",r:"7"}),d.jsx("path",{d:"M12 5v14M8 10h8"})]}),t,"Phi"):ht(d.jsx(mt,{children:d.jsx("circle",{cx:"12",cy:"12",r:"8"})}),t,"Model")}function Zd(e,t=16){const n=(e||"").toLowerCase();return n.includes("openrouter")?yt("/static/icons/openrouter.svg","OpenRouter",t):n.includes("openai")?yt("/static/icons/openai-svgrepo-com.svg","OpenAI",t):n.includes("anthropic")?yt("/static/icons/anthropic-icon-logo.svg","Anthropic",t):n.includes("gemini")||n.includes("google")?yt("/static/icons/google-gemini-logo.svg","Google",t):n.includes("azure")?yt("/static/icons/azure-original-logo.svg","Azure",t):n.includes("ollama")?ht(d.jsxs(mt,{children:[d.jsx("path",{d:"M7 14a3 3 0 0 1 6 0v3H7z"}),d.jsx("path",{d:"M13 14a3 3 0 1 1 3 3"})]}),t,"Ollama"):ht(d.jsx(mt,{children:d.jsx("rect",{x:"5",y:"5",width:"14",height:"14",rx:"3"})}),t,"Provider")}function Jd(e){const t=e.split(/\r?\n/),n=[];let r=0;for(;r<t.length;){const o=t[r].match(/^```\s*([\w+-]*)\s*$/);if(o){const u=o[1]||"";r++;const s=[];for(;r<t.length&&!/^```\s*$/.test(t[r]);)s.push(t[r]),r++;r<t.length&&/^```\s*$/.test(t[r])&&r++,n.push({type:"code",lang:u,code:s.join(`
-`)});continue}const i=[];for(;r<t.length&&!/^```/.test(t[r]);)i.push(t[r]),r++;i.length&&n.push({type:"text",text:i.join(`
-`)})}return n}function qd(e){const t=[];let n=0;const r=()=>`${n}-${Math.random().toString(36).slice(2,7)}`;for(;n<e.length;){const l=e[n];if(/^\s*---+\s*$/.test(l)){t.push(d.jsx("hr",{className:"border-white/10"},r())),n++;continue}const o=l.match(/^(#{1,3})\s+(.*)$/);if(o){const u=o[1].length,s=o[2];u===1?t.push(d.jsx("h2",{className:"mt-4",children:s},r())):u===2?t.push(d.jsx("h3",{className:"mt-3",children:s},r())):t.push(d.jsx("h4",{className:"mt-2",children:s},r())),n++;continue}if(/^\s*[-*]\s+/.test(l)){const u=[];for(;n<e.length&&/^\s*[-*]\s+/.test(e[n]);)u.push(e[n].replace(/^\s*[-*]\s+/,"")),n++;t.push(d.jsx("ul",{className:"list-disc pl-6 space-y-1",children:u.map((s,c)=>d.jsx("li",{children:s},c))},r()));continue}if(/^\s*\d+\.\s+/.test(l)){const u=[];for(;n<e.length&&/^\s*\d+\.\s+/.test(e[n]);)u.push(e[n].replace(/^\s*\d+\.\s+/,"")),n++;t.push(d.jsx("ol",{className:"list-decimal pl-6 space-y-1",children:u.map((s,c)=>d.jsx("li",{children:s},c))},r()));continue}if(l.includes("|")){const u=[],s=n;for(;n<e.length&&e[n].includes("|");)u.push(e[n]),n++;if(u.length>=2&&/\|/.test(u[0])&&/-/.test(u[1])){const c=h=>h.split("|").map(x=>x.trim()).filter((x,S,k)=>!(S===0&&h.trim().startsWith("|"))&&!(S===k.length-1&&h.trim().endsWith("|"))),g=c(u[0]),m=u.slice(2).map(c);t.push(d.jsx("div",{className:"overflow-x-auto",children:d.jsxs("table",{className:"w-full text-sm border-collapse",children:[d.jsx("thead",{children:d.jsx("tr",{children:g.map((h,x)=>d.jsx("th",{className:"text-left font-semibold px-3 py-2 border-b border-white/10",children:h},x))})}),d.jsx("tbody",{children:m.map((h,x)=>d.jsx("tr",{className:"odd:bg-white/5",children:h.map((S,k)=>d.jsx("td",{className:"px-3 py-2 align-top border-b border-white/5",children:S},k))},x))})]})},r()));continue}else n=s}const i=[];for(;n<e.length&&e[n].trim()!=="";)i.push(e[n]),n++;for(t.push(d.jsx("p",{className:"whitespace-pre-wrap leading-relaxed",children:i.join(`
-`)},r()));n<e.length&&e[n].trim()==="";)n++}return t}function bd({content:e,wrapDefault:t}){const n=O.useMemo(()=>e.replace(/\r/g,"").replace(/^\uFEFF/,""),[e]),r=O.useMemo(()=>Jd(n),[n]);return d.jsx("div",{className:"prose prose-invert max-w-none",children:r.map((l,o)=>l.type==="text"?d.jsx("div",{children:qd(l.text.split(`
-`))},o):d.jsx(ep,{lang:l.lang,code:l.code,defaultWrap:!!t},o))})}function ep({lang:e,code:t,defaultWrap:n}){const[r,l]=O.useState(!!n),o=async()=>{try{await navigator.clipboard.writeText(t)}catch{}};return d.jsxs("div",{className:"rounded-lg border border-white/10 overflow-hidden",children:[d.jsxs("div",{className:"flex items-center justify-between px-3 py-1.5 text-xs bg-slate-800/60 border-b border-white/10",children:[d.jsx("div",{className:"uppercase tracking-wide text-slate-300",children:e||"text"}),d.jsxs("div",{className:"flex items-center gap-2",children:[d.jsx("button",{className:"px-2 py-0.5 rounded bg-white/10 hover:bg-white/15",onClick:()=>l(i=>!i),children:r?"No wrap":"Wrap"}),d.jsx("button",{className:"px-2 py-0.5 rounded bg-white/10 hover:bg-white/15",onClick:o,children:"Copy"})]})]}),d.jsx("pre",{className:`text-sm p-3 ${r?"whitespace-pre-wrap break-words":"whitespace-pre overflow-x-auto"}`,children:d.jsx("code",{children:t})})]})}const ls={theme:"dark",density:"comfortable",fontScale:1,defaultReasoning:!1,codeWrapDefault:!1};function bo(){try{const e=localStorage.getItem("appSettings");if(e)return{...ls,...JSON.parse(e)}}catch{}return ls}function yc(e){const t=document.body;t.classList.toggle("theme-light",e.theme==="light"),t.classList.toggle("theme-dark",e.theme==="dark"),t.classList.toggle("density-compact",e.density==="compact"),t.style.setProperty("--font-scale",String(e.fontScale))}function tp({open:e,onClose:t,onSave:n}){const[r,l]=O.useState(bo());return O.useEffect(()=>{e&&l(bo())},[e]),e?d.jsxs("div",{className:"fixed inset-0 z-50 flex items-center justify-center",children:[d.jsx("div",{className:"absolute inset-0 bg-black/60",onClick:t}),d.jsxs("div",{className:"relative w-full max-w-lg glass rounded-lg p-4",children:[d.jsxs("div",{className:"flex items-center justify-between mb-3",children:[d.jsx("h2",{className:"text-lg font-semibold",children:"Settings"}),d.jsx("button",{className:"px-2 py-1 rounded border border-white/10 hover:bg-white/10",onClick:t,children:"Close"})]}),d.jsxs("div",{className:"space-y-4 text-sm",children:[d.jsxs("div",{children:[d.jsx("label",{className:"block mb-1 text-slate-300",children:"Theme"}),d.jsxs("select",{className:"w-full bg-slate-800/60 border border-white/10 rounded px-2 py-1",value:r.theme,onChange:o=>l(i=>({...i,theme:o.target.value})),children:[d.jsx("option",{value:"dark",children:"Dark"}),d.jsx("option",{value:"light",children:"Light"})]})]}),d.jsxs("div",{children:[d.jsx("label",{className:"block mb-1 text-slate-300",children:"Density"}),d.jsxs("select",{className:"w-full bg-slate-800/60 border border-white/10 rounded px-2 py-1",value:r.density,onChange:o=>l(i=>({...i,density:o.target.value})),children:[d.jsx("option",{value:"comfortable",children:"Comfortable"}),d.jsx("option",{value:"compact",children:"Compact"})]})]}),d.jsxs("div",{children:[d.jsx("label",{className:"block mb-1 text-slate-300",children:"Font scale"}),d.jsx("input",{type:"range",min:.9,max:1.2,step:.05,value:r.fontScale,onChange:o=>l(i=>({...i,fontScale:Number(o.target.value)})),className:"w-full"})]}),d.jsxs("div",{className:"flex items-center gap-2",children:[d.jsx("input",{id:"def-reason",type:"checkbox",checked:r.defaultReasoning,onChange:o=>l(i=>({...i,defaultReasoning:o.target.checked}))}),d.jsx("label",{htmlFor:"def-reason",children:"Enable reasoning by default"})]}),d.jsxs("div",{className:"flex items-center gap-2",children:[d.jsx("input",{id:"code-wrap",type:"checkbox",checked:r.codeWrapDefault,onChange:o=>l(i=>({...i,codeWrapDefault:o.target.checked}))}),d.jsx("label",{htmlFor:"code-wrap",children:"Wrap code blocks by default"})]})]}),d.jsxs("div",{className:"mt-4 flex justify-end gap-2",children:[d.jsx("button",{className:"px-3 py-1.5 rounded border border-white/10 hover:bg-white/10",onClick:t,children:"Cancel"}),d.jsx("button",{className:"btn-primary",onClick:()=>{localStorage.setItem("appSettings",JSON.stringify(r)),yc(r),n(r)},children:"Save"})]})]})]}):null}function np(e){const t=new Date,n=new Date(t.getFullYear(),t.getMonth(),t.getDate()).getTime(),r=n-24*60*60*1e3,l=new Date(e.getFullYear(),e.getMonth(),e.getDate()).getTime();return l===n?"Today":l===r?"Yesterday":e.toLocaleDateString()}async function ft(e,t){const n=await fetch(e,t);if(!n.ok)throw new Error(`${n.status}`);return n.json()}function rp(){const[e,t]=O.useState([]),[n,r]=O.useState(""),[l,o]=O.useState(null),[i,u]=O.useState([{role:"system",content:"You are a helpful assistant."}]),[s,c]=O.useState(""),[g,m]=O.useState("openai"),[h,x]=O.useState(""),[S,k]=O.useState([]),[F,f]=O.useState(!1),[a,p]=O.useState(!1),[y,E]=O.useState(""),_=O.useRef(null),[j,P]=O.useState(!1),[H,M]=O.useState(!1),[fe,Dt]=O.useState(bo()),Xe=O.useMemo(()=>e.filter(v=>(v.title||"").toLowerCase().includes(n.toLowerCase())),[e,n]),Zt=O.useMemo(()=>{const v=Xe.filter(re=>re.pinned),z=Xe.filter(re=>!re.pinned),V={Today:[],Yesterday:[],Earlier:[]},q=new Date,de=new Date(q.getFullYear(),q.getMonth(),q.getDate()).getTime(),Ve=de-24*60*60*1e3;for(const re of z){const Ot=re.updated_at?new Date(re.updated_at).getTime():0;Ot>=de?V.Today.push(re):Ot>=Ve?V.Yesterday.push(re):V.Earlier.push(re)}return{pinned:v,byDay:V}},[Xe]);async function vr(v){try{await ft(`/api/conversations/${encodeURIComponent(v)}`,{method:"DELETE"})}catch{}await We(),l===v&&(o(null),u([{role:"system",content:"You are a helpful assistant."}]))}O.useEffect(()=>{(async()=>(await We(),await L()))()},[]),O.useEffect(()=>{const v=_.current;if(!v)return;const z=()=>{P(v.scrollTop+v.clientHeight<v.scrollHeight-200)};return v.addEventListener("scroll",z),z(),()=>v.removeEventListener("scroll",z)},[]),O.useEffect(()=>{yc(fe)},[fe]),O.useEffect(()=>{const v=_.current;!v||j||(v.scrollTop=v.scrollHeight)},[i,y]);async function We(){var z;const v=await ft("/api/conversations");t(v.conversations||[]),!l&&((z=v.conversations)!=null&&z[0])&&await ut(v.conversations[0].id)}async function ut(v){o(v);const z=await ft(`/api/conversations/${encodeURIComponent(v)}`);u(z.messages||[{role:"system",content:"You are a helpful assistant."}])}async function C(){const v=await ft("/api/conversations",{method:"POST",headers:{"Content-Type":"application/json"},body:JSON.stringify({})});o(v.id),await We(),await ut(v.id)}async function T(v){await ft(`/api/conversations/${encodeURIComponent(v.id)}`,{method:"PATCH",headers:{"Content-Type":"application/json"},body:JSON.stringify({pinned:!v.pinned})}),await We()}async function L(){const v=await ft("/api/settings");v.provider&&m(v.provider),await G(v.provider||g),v.model&&x(v.model)}async function W(v){l&&(await ft(`/api/conversations/${encodeURIComponent(l)}`,{method:"PATCH",headers:{"Content-Type":"application/json"},body:JSON.stringify({messages:v})}),u(v),await We())}async function G(v){try{const z=await ft(`/api/models/${encodeURIComponent(v)}`);k(z.models||[])}catch{k([])}}async function st(){const v=s.trim();if(!v||!l)return;c("");const z={role:"user",content:v},V=[...i,z];u(V);const q=window.location.protocol==="https:"?"wss":"ws",de=new WebSocket(`${q}://${window.location.host}/ws/chat`);f(!0);let Ve="";E(""),de.onopen=()=>{de.send(JSON.stringify({messages:V,provider:g,model:h,conversation_id:l,reasoning:a}))},de.onmessage=re=>{const Ot=re.data;if(Ot==="[END]"){f(!1),u(Ml=>[...Ml,{role:"assistant",content:Ve}]),E(""),We();return}Ve+=Ot,E(Ve)},de.onerror=()=>f(!1),de.onclose=()=>f(!1)}function Ge({m:v,idx:z}){const[V,q]=O.useState(!1),[de,Ve]=O.useState(v.content),re=v.role==="user",Ot=async()=>{try{await navigator.clipboard.writeText(v.content)}catch{}},Ml=async()=>{const Ze=i.filter((at,Rl)=>Rl!==z);await W(Ze)},wc=async()=>{const Ze=i.map((at,Rl)=>Rl===z?{...at,content:de}:at);await W(Ze),q(!1)},xc=async()=>{let Ze=null;for(let at=z-1;at>=0;at--)if(i[at].role==="user"){Ze=i[at].content;break}Ze&&(c(Ze),await st())};return d.jsxs("div",{className:`flex gap-3 ${v.role==="user"?"justify-end":""}`,children:[v.role==="assistant"&&d.jsx("div",{className:"w-8 h-8 rounded-full bg-brand flex items-center justify-center",children:rs(h,16)}),d.jsxs("div",{className:`group rounded-2xl px-3 py-2 border relative ${v.role==="user"?"bg-slate-800/60 border-white/10":"bg-slate-900/60 border-white/10"} shadow-[inset_0_1px_0_rgba(255,255,255,0.05)]`,style:{maxWidth:"80%"},children:[d.jsxs("div",{className:"absolute -top-2 right-1 opacity-0 group-hover:opacity-100 transition text-xs flex gap-2",children:[d.jsx("button",{className:"px-2 py-0.5 bg-white/10 rounded",onClick:Ot,children:"Copy"}),v.role==="assistant"&&d.jsx("button",{className:"px-2 py-0.5 bg-white/10 rounded",onClick:xc,children:"Regenerate"}),re&&!V&&d.jsx("button",{className:"px-2 py-0.5 bg-white/10 rounded",onClick:()=>q(!0),children:"Edit"}),d.jsx("button",{className:"px-2 py-0.5 bg-white/10 rounded",onClick:Ml,children:"Delete"}),V&&d.jsxs(d.Fragment,{children:[d.jsx("button",{className:"px-2 py-0.5 bg-brand rounded",onClick:wc,children:"Save"}),d.jsx("button",{className:"px-2 py-0.5 bg-white/10 rounded",onClick:()=>{q(!1),Ve(v.content)},children:"Cancel"})]})]}),V?d.jsx("textarea",{className:"w-full bg-slate-800/60 border border-white/10 rounded p-2 text-sm",rows:Math.min(10,Math.max(3,v.content.split(`
-`).length)),value:de,onChange:Ze=>Ve(Ze.target.value)}):d.jsx("div",{className:"text-slate-100 text-sm",children:v.role==="assistant"?d.jsxs(d.Fragment,{children:[v.reasoning&&d.jsx("div",{className:"mb-2 rounded-lg border border-amber-300/20 bg-amber-900/10 p-2 text-amber-200 text-xs",children:v.reasoning}),d.jsx(bd,{content:v.content,wrapDefault:fe.codeWrapDefault})]}):d.jsx("div",{className:"whitespace-pre-wrap",children:v.content})})]}),v.role==="user"&&d.jsx("div",{className:"w-8 h-8 rounded-full bg-brand flex items-center justify-center",children:"U"})]})}return d.jsxs("div",{className:"h-screen grid grid-cols-[300px_1fr] gap-0",children:[d.jsxs("aside",{className:"glass border-r",children:[d.jsxs("div",{className:"p-3 flex items-center gap-2",children:[d.jsx("button",{className:"btn-primary",onClick:C,children:"New"}),d.jsx("input",{className:"ml-auto bg-slate-800/60 border border-white/10 rounded px-2 py-1 w-full",placeholder:"Search",value:n,onChange:v=>r(v.target.value)})]}),d.jsxs("div",{className:"overflow-y-auto min-h-0 p-2 space-y-2",children:[Zt.pinned.length>0&&d.jsxs("div",{children:[d.jsx("div",{className:"px-2 text-xs uppercase text-slate-400 mb-1",children:"Pinned"}),d.jsx("div",{className:"space-y-1",children:Zt.pinned.map(v=>d.jsx("div",{className:`w-full px-2 py-1 rounded hover:bg-white/5 ${l===v.id?"bg-white/10":""}`,children:d.jsxs("div",{className:"flex items-center justify-between gap-2",children:[d.jsx("button",{className:"flex-1 text-left truncate",onClick:()=>ut(v.id),children:v.title||"Untitled"}),d.jsxs("div",{className:"flex items-center gap-1 text-xs text-slate-400",children:[d.jsx("button",{className:"px-1 hover:text-white",onClick:z=>{z.stopPropagation(),T(v)},children:"Unpin"}),d.jsx("button",{className:"px-1 text-red-300 hover:text-red-200",onClick:z=>{z.stopPropagation(),vr(v.id)},children:"Delete"})]})]})},v.id))})]}),Object.entries(Zt.byDay).map(([v,z])=>z.length?d.jsxs("div",{children:[d.jsx("div",{className:"px-2 text-xs uppercase text-slate-400 mb-1",children:v}),d.jsx("div",{className:"space-y-1",children:z.map(V=>d.jsx("div",{className:`w-full px-2 py-1 rounded hover:bg-white/5 ${l===V.id?"bg-white/10":""}`,children:d.jsxs("div",{className:"flex items-center justify-between gap-2",children:[d.jsx("button",{className:"flex-1 text-left truncate",onClick:()=>ut(V.id),children:V.title||"Untitled"}),d.jsxs("div",{className:"flex items-center gap-1 text-xs text-slate-400",children:[d.jsx("button",{className:"px-1 hover:text-white",onClick:q=>{q.stopPropagation(),T(V)},children:"Pin"}),d.jsx("button",{className:"px-1 text-red-300 hover:text-red-200",onClick:q=>{q.stopPropagation(),vr(V.id)},children:"Delete"})]})]})},V.id))})]},v):null)]})]}),d.jsxs("main",{className:"flex flex-col min-h-0",children:[d.jsxs("header",{className:"glass flex items-center justify-between px-4 py-2 border-b",children:[d.jsx("h1",{className:"font-semibold",children:"ChatUI"}),d.jsxs("div",{className:"flex items-center gap-2",children:[d.jsxs("div",{className:"flex items-center gap-1 text-sm text-slate-300",children:[Zd(g,16),d.jsx("span",{className:"hidden md:inline",children:g})]}),d.jsx("select",{className:"bg-slate-800/60 border border-white/10 rounded px-2 py-1",value:g,onChange:async v=>{const z=v.target.value;m(z),await G(z)},children:["openai","openrouter","anthropic","gemini","azure","ollama","together","fireworks","perplexity","mistral","deepseek","cohere"].map(v=>d.jsx("option",{value:v,children:v},v))}),d.jsxs("select",{className:"bg-slate-800/60 border border-white/10 rounded px-2 py-1",value:h,onChange:v=>x(v.target.value),children:[d.jsx("option",{value:"",children:"Select a model"}),S.map(v=>d.jsx("option",{value:v.id,children:v.name||v.id},v.id))]}),d.jsxs("label",{className:"text-sm flex items-center gap-1",children:[d.jsx("input",{type:"checkbox",checked:a,onChange:v=>p(v.target.checked)})," Reasoning"]}),d.jsx("button",{className:"px-2 py-1 rounded border border-white/10 hover:bg-white/10",onClick:()=>M(!0),children:"Settings"})]})]}),d.jsxs("div",{ref:_,className:"flex-1 overflow-y-auto p-4",children:[i.filter(v=>v.role!=="system").length===0&&d.jsxs("div",{className:"max-w-2xl mx-auto p-4 rounded-lg border border-white/10 bg-slate-900/60",children:[d.jsx("div",{className:"mb-2 text-slate-300",children:"Try one of these"}),d.jsx("div",{className:"flex flex-wrap gap-2",children:["Summarize an article","Write Python","Explain a concept","Create a plan"].map((v,z)=>d.jsx("button",{className:"px-3 py-1 rounded border border-white/10 hover:bg-white/5",onClick:()=>c(v),children:v},z))})]}),d.jsxs("div",{className:"max-w-3xl mx-auto space-y-3",children:[(()=>{const v=[];let z=null;return i.filter(q=>q.role!=="system").forEach((q,de)=>{if(q.created_at){const Ve=new Date(q.created_at),re=np(Ve);re!==z&&(z=re,v.push(d.jsx("div",{className:"sticky top-2 z-10",children:d.jsx("div",{className:"mx-auto w-fit px-3 py-1 text-xs text-slate-300 border border-white/10 rounded-full bg-slate-900/70 backdrop-blur",children:re})},`sep-${de}`)))}v.push(d.jsx(Ge,{m:q,idx:de},de))}),v})(),y&&d.jsxs("div",{className:"flex gap-3",children:[d.jsx("div",{className:"w-8 h-8 rounded-full bg-brand flex items-center justify-center",children:rs(h,16)}),d.jsx("div",{className:"rounded-2xl px-3 py-2 border bg-slate-900/60 border-white/10",style:{maxWidth:"80%"},children:d.jsx("div",{className:"whitespace-pre-wrap text-slate-100 text-sm",children:y})})]}),F&&!y&&d.jsxs("div",{className:"flex items-center gap-2 text-slate-300 text-sm",children:[d.jsx("span",{className:"w-2 h-2 bg-slate-500 rounded-full animate-pulse"}),"Generating…"]})]})]}),j&&d.jsx("button",{className:"fixed right-6 bottom-24 px-3 py-1.5 rounded-full bg-brand text-white shadow hover:bg-brand-dark",onClick:()=>{const v=_.current;v&&(v.scrollTop=v.scrollHeight)},children:"Jump to latest"}),d.jsxs("form",{className:"glass border-t p-3 flex items-center gap-2",onSubmit:v=>{v.preventDefault(),st()},children:[d.jsx("div",{className:"flex-1",children:d.jsx("textarea",{className:"w-full bg-slate-800/60 border border-white/10 rounded-full px-4 py-2 h-11 resize-none",placeholder:"Ask something...",value:s,onChange:v=>c(v.target.value),onKeyDown:v=>{v.key==="Enter"&&!v.shiftKey&&(v.preventDefault(),st())}})}),d.jsx("button",{className:"btn-primary rounded-full h-11 px-5",disabled:!s.trim()||F,type:"submit",children:"Send"})]})]}),d.jsx(tp,{open:H,onClose:()=>M(!1),onSave:v=>{Dt(v),M(!1)}})]})}const lp=document.getElementById("root");gc(lp).render(d.jsx(Fc.StrictMode,{children:d.jsx(rp,{})}));
@@ -1,47 +0,0 @@
-(function(){const t=document.createElement("link").relList;if(t&&t.supports&&t.supports("modulepreload"))return;for(const l of document.querySelectorAll('link[rel="modulepreload"]'))r(l);new MutationObserver(l=>{for(const o of l)if(o.type==="childList")for(const i of o.addedNodes)i.tagName==="LINK"&&i.rel==="modulepreload"&&r(i)}).observe(document,{childList:!0,subtree:!0});function n(l){const o={};return l.integrity&&(o.integrity=l.integrity),l.referrerPolicy&&(o.referrerPolicy=l.referrerPolicy),l.crossOrigin==="use-credentials"?o.credentials="include":l.crossOrigin==="anonymous"?o.credentials="omit":o.credentials="same-origin",o}function r(l){if(l.ep)return;l.ep=!0;const o=n(l);fetch(l.href,o)}})();function Ac(e){return e&&e.__esModule&&Object.prototype.hasOwnProperty.call(e,"default")?e.default:e}var Es={exports:{}},_l={},Cs={exports:{}},I={};/**
- * @license React
- * react.production.min.js
- *
- * Copyright (c) Facebook, Inc. and its affiliates.
- *
- * This source code is licensed under the MIT license found in the
- * LICENSE file in the root directory of this source tree.
- */var wr=Symbol.for("react.element"),$c=Symbol.for("react.portal"),Bc=Symbol.for("react.fragment"),Wc=Symbol.for("react.strict_mode"),Hc=Symbol.for("react.profiler"),Vc=Symbol.for("react.provider"),Qc=Symbol.for("react.context"),Kc=Symbol.for("react.forward_ref"),Yc=Symbol.for("react.suspense"),Gc=Symbol.for("react.memo"),Xc=Symbol.for("react.lazy"),cu=Symbol.iterator;function Zc(e){return e===null||typeof e!="object"?null:(e=cu&&e[cu]||e["@@iterator"],typeof e=="function"?e:null)}var Ns={isMounted:function(){return!1},enqueueForceUpdate:function(){},enqueueReplaceState:function(){},enqueueSetState:function(){}},_s=Object.assign,js={};function zn(e,t,n){this.props=e,this.context=t,this.refs=js,this.updater=n||Ns}zn.prototype.isReactComponent={};zn.prototype.setState=function(e,t){if(typeof e!="object"&&typeof e!="function"&&e!=null)throw Error("setState(...): takes an object of state variables to update or a function which returns an object of state variables.");this.updater.enqueueSetState(this,e,t,"setState")};zn.prototype.forceUpdate=function(e){this.updater.enqueueForceUpdate(this,e,"forceUpdate")};function Ps(){}Ps.prototype=zn.prototype;function ci(e,t,n){this.props=e,this.context=t,this.refs=js,this.updater=n||Ns}var fi=ci.prototype=new Ps;fi.constructor=ci;_s(fi,zn.prototype);fi.isPureReactComponent=!0;var fu=Array.isArray,Ls=Object.prototype.hasOwnProperty,di={current:null},Ts={key:!0,ref:!0,__self:!0,__source:!0};function zs(e,t,n){var r,l={},o=null,i=null;if(t!=null)for(r in t.ref!==void 0&&(i=t.ref),t.key!==void 0&&(o=""+t.key),t)Ls.call(t,r)&&!Ts.hasOwnProperty(r)&&(l[r]=t[r]);var u=arguments.length-2;if(u===1)l.children=n;else if(1<u){for(var s=Array(u),f=0;f<u;f++)s[f]=arguments[f+2];l.children=s}if(e&&e.defaultProps)for(r in u=e.defaultProps,u)l[r]===void 0&&(l[r]=u[r]);return{$$typeof:wr,type:e,key:o,ref:i,props:l,_owner:di.current}}function Jc(e,t){return{$$typeof:wr,type:e.type,key:t,ref:e.ref,props:e.props,_owner:e._owner}}function pi(e){return typeof e=="object"&&e!==null&&e.$$typeof===wr}function qc(e){var t={"=":"=0",":":"=2"};return"$"+e.replace(/[=:]/g,function(n){return t[n]})}var du=/\/+/g;function Vl(e,t){return typeof e=="object"&&e!==null&&e.key!=null?qc(""+e.key):t.toString(36)}function Hr(e,t,n,r,l){var o=typeof e;(o==="undefined"||o==="boolean")&&(e=null);var i=!1;if(e===null)i=!0;else switch(o){case"string":case"number":i=!0;break;case"object":switch(e.$$typeof){case wr:case $c:i=!0}}if(i)return i=e,l=l(i),e=r===""?"."+Vl(i,0):r,fu(l)?(n="",e!=null&&(n=e.replace(du,"$&/")+"/"),Hr(l,t,n,"",function(f){return f})):l!=null&&(pi(l)&&(l=Jc(l,n+(!l.key||i&&i.key===l.key?"":(""+l.key).replace(du,"$&/")+"/")+e)),t.push(l)),1;if(i=0,r=r===""?".":r+":",fu(e))for(var u=0;u<e.length;u++){o=e[u];var s=r+Vl(o,u);i+=Hr(o,t,n,s,l)}else if(s=Zc(e),typeof s=="function")for(e=s.call(e),u=0;!(o=e.next()).done;)o=o.value,s=r+Vl(o,u++),i+=Hr(o,t,n,s,l);else if(o==="object")throw t=String(e),Error("Objects are not valid as a React child (found: "+(t==="[object Object]"?"object with keys {"+Object.keys(e).join(", ")+"}":t)+"). If you meant to render a collection of children, use an array instead.");return i}function _r(e,t,n){if(e==null)return e;var r=[],l=0;return Hr(e,r,"","",function(o){return t.call(n,o,l++)}),r}function bc(e){if(e._status===-1){var t=e._result;t=t(),t.then(function(n){(e._status===0||e._status===-1)&&(e._status=1,e._result=n)},function(n){(e._status===0||e._status===-1)&&(e._status=2,e._result=n)}),e._status===-1&&(e._status=0,e._result=t)}if(e._status===1)return e._result.default;throw e._result}var xe={current:null},Vr={transition:null},ef={ReactCurrentDispatcher:xe,ReactCurrentBatchConfig:Vr,ReactCurrentOwner:di};function Ds(){throw Error("act(...) is not supported in production builds of React.")}I.Children={map:_r,forEach:function(e,t,n){_r(e,function(){t.apply(this,arguments)},n)},count:function(e){var t=0;return _r(e,function(){t++}),t},toArray:function(e){return _r(e,function(t){return t})||[]},only:function(e){if(!pi(e))throw Error("React.Children.only expected to receive a single React element child.");return e}};I.Component=zn;I.Fragment=Bc;I.Profiler=Hc;I.PureComponent=ci;I.StrictMode=Wc;I.Suspense=Yc;I.__SECRET_INTERNALS_DO_NOT_USE_OR_YOU_WILL_BE_FIRED=ef;I.act=Ds;I.cloneElement=function(e,t,n){if(e==null)throw Error("React.cloneElement(...): The argument must be a React element, but you passed "+e+".");var r=_s({},e.props),l=e.key,o=e.ref,i=e._owner;if(t!=null){if(t.ref!==void 0&&(o=t.ref,i=di.current),t.key!==void 0&&(l=""+t.key),e.type&&e.type.defaultProps)var u=e.type.defaultProps;for(s in t)Ls.call(t,s)&&!Ts.hasOwnProperty(s)&&(r[s]=t[s]===void 0&&u!==void 0?u[s]:t[s])}var s=arguments.length-2;if(s===1)r.children=n;else if(1<s){u=Array(s);for(var f=0;f<s;f++)u[f]=arguments[f+2];r.children=u}return{$$typeof:wr,type:e.type,key:l,ref:o,props:r,_owner:i}};I.createContext=function(e){return e={$$typeof:Qc,_currentValue:e,_currentValue2:e,_threadCount:0,Provider:null,Consumer:null,_defaultValue:null,_globalName:null},e.Provider={$$typeof:Vc,_context:e},e.Consumer=e};I.createElement=zs;I.createFactory=function(e){var t=zs.bind(null,e);return t.type=e,t};I.createRef=function(){return{current:null}};I.forwardRef=function(e){return{$$typeof:Kc,render:e}};I.isValidElement=pi;I.lazy=function(e){return{$$typeof:Xc,_payload:{_status:-1,_result:e},_init:bc}};I.memo=function(e,t){return{$$typeof:Gc,type:e,compare:t===void 0?null:t}};I.startTransition=function(e){var t=Vr.transition;Vr.transition={};try{e()}finally{Vr.transition=t}};I.unstable_act=Ds;I.useCallback=function(e,t){return xe.current.useCallback(e,t)};I.useContext=function(e){return xe.current.useContext(e)};I.useDebugValue=function(){};I.useDeferredValue=function(e){return xe.current.useDeferredValue(e)};I.useEffect=function(e,t){return xe.current.useEffect(e,t)};I.useId=function(){return xe.current.useId()};I.useImperativeHandle=function(e,t,n){return xe.current.useImperativeHandle(e,t,n)};I.useInsertionEffect=function(e,t){return xe.current.useInsertionEffect(e,t)};I.useLayoutEffect=function(e,t){return xe.current.useLayoutEffect(e,t)};I.useMemo=function(e,t){return xe.current.useMemo(e,t)};I.useReducer=function(e,t,n){return xe.current.useReducer(e,t,n)};I.useRef=function(e){return xe.current.useRef(e)};I.useState=function(e){return xe.current.useState(e)};I.useSyncExternalStore=function(e,t,n){return xe.current.useSyncExternalStore(e,t,n)};I.useTransition=function(){return xe.current.useTransition()};I.version="18.3.1";Cs.exports=I;var L=Cs.exports;const tf=Ac(L);/**
- * @license React
- * react-jsx-runtime.production.min.js
- *
- * Copyright (c) Facebook, Inc. and its affiliates.
- *
- * This source code is licensed under the MIT license found in the
- * LICENSE file in the root directory of this source tree.
- */var nf=L,rf=Symbol.for("react.element"),lf=Symbol.for("react.fragment"),of=Object.prototype.hasOwnProperty,uf=nf.__SECRET_INTERNALS_DO_NOT_USE_OR_YOU_WILL_BE_FIRED.ReactCurrentOwner,sf={key:!0,ref:!0,__self:!0,__source:!0};function Rs(e,t,n){var r,l={},o=null,i=null;n!==void 0&&(o=""+n),t.key!==void 0&&(o=""+t.key),t.ref!==void 0&&(i=t.ref);for(r in t)of.call(t,r)&&!sf.hasOwnProperty(r)&&(l[r]=t[r]);if(e&&e.defaultProps)for(r in t=e.defaultProps,t)l[r]===void 0&&(l[r]=t[r]);return{$$typeof:rf,type:e,key:o,ref:i,props:l,_owner:uf.current}}_l.Fragment=lf;_l.jsx=Rs;_l.jsxs=Rs;Es.exports=_l;var a=Es.exports,Is={exports:{}},De={},Ms={exports:{}},Os={};/**
- * @license React
- * scheduler.production.min.js
- *
- * Copyright (c) Facebook, Inc. and its affiliates.
- *
- * This source code is licensed under the MIT license found in the
- * LICENSE file in the root directory of this source tree.
- */(function(e){function t(C,T){var D=C.length;C.push(T);e:for(;0<D;){var $=D-1>>>1,B=C[$];if(0<l(B,T))C[$]=T,C[D]=B,D=$;else break e}}function n(C){return C.length===0?null:C[0]}function r(C){if(C.length===0)return null;var T=C[0],D=C.pop();if(D!==T){C[0]=D;e:for(var $=0,B=C.length,$t=B>>>1;$<$t;){var nt=2*($+1)-1,nn=C[nt],We=nt+1,ht=C[We];if(0>l(nn,D))We<B&&0>l(ht,nn)?(C[$]=ht,C[We]=D,$=We):(C[$]=nn,C[nt]=D,$=nt);else if(We<B&&0>l(ht,D))C[$]=ht,C[We]=D,$=We;else break e}}return T}function l(C,T){var D=C.sortIndex-T.sortIndex;return D!==0?D:C.id-T.id}if(typeof performance=="object"&&typeof performance.now=="function"){var o=performance;e.unstable_now=function(){return o.now()}}else{var i=Date,u=i.now();e.unstable_now=function(){return i.now()-u}}var s=[],f=[],h=1,g=null,m=3,x=!1,k=!1,S=!1,O=typeof setTimeout=="function"?setTimeout:null,d=typeof clearTimeout=="function"?clearTimeout:null,c=typeof setImmediate<"u"?setImmediate:null;typeof navigator<"u"&&navigator.scheduling!==void 0&&navigator.scheduling.isInputPending!==void 0&&navigator.scheduling.isInputPending.bind(navigator.scheduling);function p(C){for(var T=n(f);T!==null;){if(T.callback===null)r(f);else if(T.startTime<=C)r(f),T.sortIndex=T.expirationTime,t(s,T);else break;T=n(f)}}function y(C){if(S=!1,p(C),!k)if(n(s)!==null)k=!0,oe(E);else{var T=n(f);T!==null&&tt(y,T.startTime-C)}}function E(C,T){k=!1,S&&(S=!1,d(P),P=-1),x=!0;var D=m;try{for(p(T),g=n(s);g!==null&&(!(g.expirationTime>T)||C&&!Ie());){var $=g.callback;if(typeof $=="function"){g.callback=null,m=g.priorityLevel;var B=$(g.expirationTime<=T);T=e.unstable_now(),typeof B=="function"?g.callback=B:g===n(s)&&r(s),p(T)}else r(s);g=n(s)}if(g!==null)var $t=!0;else{var nt=n(f);nt!==null&&tt(y,nt.startTime-T),$t=!1}return $t}finally{g=null,m=D,x=!1}}var j=!1,N=null,P=-1,K=5,R=-1;function Ie(){return!(e.unstable_now()-R<K)}function pt(){if(N!==null){var C=e.unstable_now();R=C;var T=!0;try{T=N(!0,C)}finally{T?At():(j=!1,N=null)}}else j=!1}var At;if(typeof c=="function")At=function(){c(pt)};else if(typeof MessageChannel<"u"){var In=new MessageChannel,Me=In.port2;In.port1.onmessage=pt,At=function(){Me.postMessage(null)}}else At=function(){O(pt,0)};function oe(C){N=C,j||(j=!0,At())}function tt(C,T){P=O(function(){C(e.unstable_now())},T)}e.unstable_IdlePriority=5,e.unstable_ImmediatePriority=1,e.unstable_LowPriority=4,e.unstable_NormalPriority=3,e.unstable_Profiling=null,e.unstable_UserBlockingPriority=2,e.unstable_cancelCallback=function(C){C.callback=null},e.unstable_continueExecution=function(){k||x||(k=!0,oe(E))},e.unstable_forceFrameRate=function(C){0>C||125<C?console.error("forceFrameRate takes a positive int between 0 and 125, forcing frame rates higher than 125 fps is not supported"):K=0<C?Math.floor(1e3/C):5},e.unstable_getCurrentPriorityLevel=function(){return m},e.unstable_getFirstCallbackNode=function(){return n(s)},e.unstable_next=function(C){switch(m){case 1:case 2:case 3:var T=3;break;default:T=m}var D=m;m=T;try{return C()}finally{m=D}},e.unstable_pauseExecution=function(){},e.unstable_requestPaint=function(){},e.unstable_runWithPriority=function(C,T){switch(C){case 1:case 2:case 3:case 4:case 5:break;default:C=3}var D=m;m=C;try{return T()}finally{m=D}},e.unstable_scheduleCallback=function(C,T,D){var $=e.unstable_now();switch(typeof D=="object"&&D!==null?(D=D.delay,D=typeof D=="number"&&0<D?$+D:$):D=$,C){case 1:var B=-1;break;case 2:B=250;break;case 5:B=1073741823;break;case 4:B=1e4;break;default:B=5e3}return B=D+B,C={id:h++,callback:T,priorityLevel:C,startTime:D,expirationTime:B,sortIndex:-1},D>$?(C.sortIndex=D,t(f,C),n(s)===null&&C===n(f)&&(S?(d(P),P=-1):S=!0,tt(y,D-$))):(C.sortIndex=B,t(s,C),k||x||(k=!0,oe(E))),C},e.unstable_shouldYield=Ie,e.unstable_wrapCallback=function(C){var T=m;return function(){var D=m;m=T;try{return C.apply(this,arguments)}finally{m=D}}}})(Os);Ms.exports=Os;var af=Ms.exports;/**
- * @license React
- * react-dom.production.min.js
- *
- * Copyright (c) Facebook, Inc. and its affiliates.
- *
- * This source code is licensed under the MIT license found in the
- * LICENSE file in the root directory of this source tree.
- */var cf=L,ze=af;function w(e){for(var t="https://reactjs.org/docs/error-decoder.html?invariant="+e,n=1;n<arguments.length;n++)t+="&args[]="+encodeURIComponent(arguments[n]);return"Minified React error #"+e+"; visit "+t+" for the full message or use the non-minified dev environment for full errors and additional helpful warnings."}var Fs=new Set,nr={};function en(e,t){Cn(e,t),Cn(e+"Capture",t)}function Cn(e,t){for(nr[e]=t,e=0;e<t.length;e++)Fs.add(t[e])}var st=!(typeof window>"u"||typeof window.document>"u"||typeof window.document.createElement>"u"),go=Object.prototype.hasOwnProperty,ff=/^[:A-Z_a-z\u00C0-\u00D6\u00D8-\u00F6\u00F8-\u02FF\u0370-\u037D\u037F-\u1FFF\u200C-\u200D\u2070-\u218F\u2C00-\u2FEF\u3001-\uD7FF\uF900-\uFDCF\uFDF0-\uFFFD][:A-Z_a-z\u00C0-\u00D6\u00D8-\u00F6\u00F8-\u02FF\u0370-\u037D\u037F-\u1FFF\u200C-\u200D\u2070-\u218F\u2C00-\u2FEF\u3001-\uD7FF\uF900-\uFDCF\uFDF0-\uFFFD\-.0-9\u00B7\u0300-\u036F\u203F-\u2040]*$/,pu={},hu={};function df(e){return go.call(hu,e)?!0:go.call(pu,e)?!1:ff.test(e)?hu[e]=!0:(pu[e]=!0,!1)}function pf(e,t,n,r){if(n!==null&&n.type===0)return!1;switch(typeof t){case"function":case"symbol":return!0;case"boolean":return r?!1:n!==null?!n.acceptsBooleans:(e=e.toLowerCase().slice(0,5),e!=="data-"&&e!=="aria-");default:return!1}}function hf(e,t,n,r){if(t===null||typeof t>"u"||pf(e,t,n,r))return!0;if(r)return!1;if(n!==null)switch(n.type){case 3:return!t;case 4:return t===!1;case 5:return isNaN(t);case 6:return isNaN(t)||1>t}return!1}function ke(e,t,n,r,l,o,i){this.acceptsBooleans=t===2||t===3||t===4,this.attributeName=r,this.attributeNamespace=l,this.mustUseProperty=n,this.propertyName=e,this.type=t,this.sanitizeURL=o,this.removeEmptyString=i}var fe={};"children dangerouslySetInnerHTML defaultValue defaultChecked innerHTML suppressContentEditableWarning suppressHydrationWarning style".split(" ").forEach(function(e){fe[e]=new ke(e,0,!1,e,null,!1,!1)});[["acceptCharset","accept-charset"],["className","class"],["htmlFor","for"],["httpEquiv","http-equiv"]].forEach(function(e){var t=e[0];fe[t]=new ke(t,1,!1,e[1],null,!1,!1)});["contentEditable","draggable","spellCheck","value"].forEach(function(e){fe[e]=new ke(e,2,!1,e.toLowerCase(),null,!1,!1)});["autoReverse","externalResourcesRequired","focusable","preserveAlpha"].forEach(function(e){fe[e]=new ke(e,2,!1,e,null,!1,!1)});"allowFullScreen async autoFocus autoPlay controls default defer disabled disablePictureInPicture disableRemotePlayback formNoValidate hidden loop noModule noValidate open playsInline readOnly required reversed scoped seamless itemScope".split(" ").forEach(function(e){fe[e]=new ke(e,3,!1,e.toLowerCase(),null,!1,!1)});["checked","multiple","muted","selected"].forEach(function(e){fe[e]=new ke(e,3,!0,e,null,!1,!1)});["capture","download"].forEach(function(e){fe[e]=new ke(e,4,!1,e,null,!1,!1)});["cols","rows","size","span"].forEach(function(e){fe[e]=new ke(e,6,!1,e,null,!1,!1)});["rowSpan","start"].forEach(function(e){fe[e]=new ke(e,5,!1,e.toLowerCase(),null,!1,!1)});var hi=/[\-:]([a-z])/g;function mi(e){return e[1].toUpperCase()}"accent-height alignment-baseline arabic-form baseline-shift cap-height clip-path clip-rule color-interpolation color-interpolation-filters color-profile color-rendering dominant-baseline enable-background fill-opacity fill-rule flood-color flood-opacity font-family font-size font-size-adjust font-stretch font-style font-variant font-weight glyph-name glyph-orientation-horizontal glyph-orientation-vertical horiz-adv-x horiz-origin-x image-rendering letter-spacing lighting-color marker-end marker-mid marker-start overline-position overline-thickness paint-order panose-1 pointer-events rendering-intent shape-rendering stop-color stop-opacity strikethrough-position strikethrough-thickness stroke-dasharray stroke-dashoffset stroke-linecap stroke-linejoin stroke-miterlimit stroke-opacity stroke-width text-anchor text-decoration text-rendering underline-position underline-thickness unicode-bidi unicode-range units-per-em v-alphabetic v-hanging v-ideographic v-mathematical vector-effect vert-adv-y vert-origin-x vert-origin-y word-spacing writing-mode xmlns:xlink x-height".split(" ").forEach(function(e){var t=e.replace(hi,mi);fe[t]=new ke(t,1,!1,e,null,!1,!1)});"xlink:actuate xlink:arcrole xlink:role xlink:show xlink:title xlink:type".split(" ").forEach(function(e){var t=e.replace(hi,mi);fe[t]=new ke(t,1,!1,e,"http://www.w3.org/1999/xlink",!1,!1)});["xml:base","xml:lang","xml:space"].forEach(function(e){var t=e.replace(hi,mi);fe[t]=new ke(t,1,!1,e,"http://www.w3.org/XML/1998/namespace",!1,!1)});["tabIndex","crossOrigin"].forEach(function(e){fe[e]=new ke(e,1,!1,e.toLowerCase(),null,!1,!1)});fe.xlinkHref=new ke("xlinkHref",1,!1,"xlink:href","http://www.w3.org/1999/xlink",!0,!1);["src","href","action","formAction"].forEach(function(e){fe[e]=new ke(e,1,!1,e.toLowerCase(),null,!0,!0)});function vi(e,t,n,r){var l=fe.hasOwnProperty(t)?fe[t]:null;(l!==null?l.type!==0:r||!(2<t.length)||t[0]!=="o"&&t[0]!=="O"||t[1]!=="n"&&t[1]!=="N")&&(hf(t,n,l,r)&&(n=null),r||l===null?df(t)&&(n===null?e.removeAttribute(t):e.setAttribute(t,""+n)):l.mustUseProperty?e[l.propertyName]=n===null?l.type===3?!1:"":n:(t=l.attributeName,r=l.attributeNamespace,n===null?e.removeAttribute(t):(l=l.type,n=l===3||l===4&&n===!0?"":""+n,r?e.setAttributeNS(r,t,n):e.setAttribute(t,n))))}var dt=cf.__SECRET_INTERNALS_DO_NOT_USE_OR_YOU_WILL_BE_FIRED,jr=Symbol.for("react.element"),on=Symbol.for("react.portal"),un=Symbol.for("react.fragment"),gi=Symbol.for("react.strict_mode"),yo=Symbol.for("react.profiler"),Us=Symbol.for("react.provider"),As=Symbol.for("react.context"),yi=Symbol.for("react.forward_ref"),wo=Symbol.for("react.suspense"),xo=Symbol.for("react.suspense_list"),wi=Symbol.for("react.memo"),yt=Symbol.for("react.lazy"),$s=Symbol.for("react.offscreen"),mu=Symbol.iterator;function Mn(e){return e===null||typeof e!="object"?null:(e=mu&&e[mu]||e["@@iterator"],typeof e=="function"?e:null)}var Z=Object.assign,Ql;function Hn(e){if(Ql===void 0)try{throw Error()}catch(n){var t=n.stack.trim().match(/\n( *(at )?)/);Ql=t&&t[1]||""}return`
-`+Ql+e}var Kl=!1;function Yl(e,t){if(!e||Kl)return"";Kl=!0;var n=Error.prepareStackTrace;Error.prepareStackTrace=void 0;try{if(t)if(t=function(){throw Error()},Object.defineProperty(t.prototype,"props",{set:function(){throw Error()}}),typeof Reflect=="object"&&Reflect.construct){try{Reflect.construct(t,[])}catch(f){var r=f}Reflect.construct(e,[],t)}else{try{t.call()}catch(f){r=f}e.call(t.prototype)}else{try{throw Error()}catch(f){r=f}e()}}catch(f){if(f&&r&&typeof f.stack=="string"){for(var l=f.stack.split(`
-`),o=r.stack.split(`
-`),i=l.length-1,u=o.length-1;1<=i&&0<=u&&l[i]!==o[u];)u--;for(;1<=i&&0<=u;i--,u--)if(l[i]!==o[u]){if(i!==1||u!==1)do if(i--,u--,0>u||l[i]!==o[u]){var s=`
-`+l[i].replace(" at new "," at ");return e.displayName&&s.includes("<anonymous>")&&(s=s.replace("<anonymous>",e.displayName)),s}while(1<=i&&0<=u);break}}}finally{Kl=!1,Error.prepareStackTrace=n}return(e=e?e.displayName||e.name:"")?Hn(e):""}function mf(e){switch(e.tag){case 5:return Hn(e.type);case 16:return Hn("Lazy");case 13:return Hn("Suspense");case 19:return Hn("SuspenseList");case 0:case 2:case 15:return e=Yl(e.type,!1),e;case 11:return e=Yl(e.type.render,!1),e;case 1:return e=Yl(e.type,!0),e;default:return""}}function ko(e){if(e==null)return null;if(typeof e=="function")return e.displayName||e.name||null;if(typeof e=="string")return e;switch(e){case un:return"Fragment";case on:return"Portal";case yo:return"Profiler";case gi:return"StrictMode";case wo:return"Suspense";case xo:return"SuspenseList"}if(typeof e=="object")switch(e.$$typeof){case As:return(e.displayName||"Context")+".Consumer";case Us:return(e._context.displayName||"Context")+".Provider";case yi:var t=e.render;return e=e.displayName,e||(e=t.displayName||t.name||"",e=e!==""?"ForwardRef("+e+")":"ForwardRef"),e;case wi:return t=e.displayName||null,t!==null?t:ko(e.type)||"Memo";case yt:t=e._payload,e=e._init;try{return ko(e(t))}catch{}}return null}function vf(e){var t=e.type;switch(e.tag){case 24:return"Cache";case 9:return(t.displayName||"Context")+".Consumer";case 10:return(t._context.displayName||"Context")+".Provider";case 18:return"DehydratedFragment";case 11:return e=t.render,e=e.displayName||e.name||"",t.displayName||(e!==""?"ForwardRef("+e+")":"ForwardRef");case 7:return"Fragment";case 5:return t;case 4:return"Portal";case 3:return"Root";case 6:return"Text";case 16:return ko(t);case 8:return t===gi?"StrictMode":"Mode";case 22:return"Offscreen";case 12:return"Profiler";case 21:return"Scope";case 13:return"Suspense";case 19:return"SuspenseList";case 25:return"TracingMarker";case 1:case 0:case 17:case 2:case 14:case 15:if(typeof t=="function")return t.displayName||t.name||null;if(typeof t=="string")return t}return null}function It(e){switch(typeof e){case"boolean":case"number":case"string":case"undefined":return e;case"object":return e;default:return""}}function Bs(e){var t=e.type;return(e=e.nodeName)&&e.toLowerCase()==="input"&&(t==="checkbox"||t==="radio")}function gf(e){var t=Bs(e)?"checked":"value",n=Object.getOwnPropertyDescriptor(e.constructor.prototype,t),r=""+e[t];if(!e.hasOwnProperty(t)&&typeof n<"u"&&typeof n.get=="function"&&typeof n.set=="function"){var l=n.get,o=n.set;return Object.defineProperty(e,t,{configurable:!0,get:function(){return l.call(this)},set:function(i){r=""+i,o.call(this,i)}}),Object.defineProperty(e,t,{enumerable:n.enumerable}),{getValue:function(){return r},setValue:function(i){r=""+i},stopTracking:function(){e._valueTracker=null,delete e[t]}}}}function Pr(e){e._valueTracker||(e._valueTracker=gf(e))}function Ws(e){if(!e)return!1;var t=e._valueTracker;if(!t)return!0;var n=t.getValue(),r="";return e&&(r=Bs(e)?e.checked?"true":"false":e.value),e=r,e!==n?(t.setValue(e),!0):!1}function tl(e){if(e=e||(typeof document<"u"?document:void 0),typeof e>"u")return null;try{return e.activeElement||e.body}catch{return e.body}}function So(e,t){var n=t.checked;return Z({},t,{defaultChecked:void 0,defaultValue:void 0,value:void 0,checked:n??e._wrapperState.initialChecked})}function vu(e,t){var n=t.defaultValue==null?"":t.defaultValue,r=t.checked!=null?t.checked:t.defaultChecked;n=It(t.value!=null?t.value:n),e._wrapperState={initialChecked:r,initialValue:n,controlled:t.type==="checkbox"||t.type==="radio"?t.checked!=null:t.value!=null}}function Hs(e,t){t=t.checked,t!=null&&vi(e,"checked",t,!1)}function Eo(e,t){Hs(e,t);var n=It(t.value),r=t.type;if(n!=null)r==="number"?(n===0&&e.value===""||e.value!=n)&&(e.value=""+n):e.value!==""+n&&(e.value=""+n);else if(r==="submit"||r==="reset"){e.removeAttribute("value");return}t.hasOwnProperty("value")?Co(e,t.type,n):t.hasOwnProperty("defaultValue")&&Co(e,t.type,It(t.defaultValue)),t.checked==null&&t.defaultChecked!=null&&(e.defaultChecked=!!t.defaultChecked)}function gu(e,t,n){if(t.hasOwnProperty("value")||t.hasOwnProperty("defaultValue")){var r=t.type;if(!(r!=="submit"&&r!=="reset"||t.value!==void 0&&t.value!==null))return;t=""+e._wrapperState.initialValue,n||t===e.value||(e.value=t),e.defaultValue=t}n=e.name,n!==""&&(e.name=""),e.defaultChecked=!!e._wrapperState.initialChecked,n!==""&&(e.name=n)}function Co(e,t,n){(t!=="number"||tl(e.ownerDocument)!==e)&&(n==null?e.defaultValue=""+e._wrapperState.initialValue:e.defaultValue!==""+n&&(e.defaultValue=""+n))}var Vn=Array.isArray;function yn(e,t,n,r){if(e=e.options,t){t={};for(var l=0;l<n.length;l++)t["$"+n[l]]=!0;for(n=0;n<e.length;n++)l=t.hasOwnProperty("$"+e[n].value),e[n].selected!==l&&(e[n].selected=l),l&&r&&(e[n].defaultSelected=!0)}else{for(n=""+It(n),t=null,l=0;l<e.length;l++){if(e[l].value===n){e[l].selected=!0,r&&(e[l].defaultSelected=!0);return}t!==null||e[l].disabled||(t=e[l])}t!==null&&(t.selected=!0)}}function No(e,t){if(t.dangerouslySetInnerHTML!=null)throw Error(w(91));return Z({},t,{value:void 0,defaultValue:void 0,children:""+e._wrapperState.initialValue})}function yu(e,t){var n=t.value;if(n==null){if(n=t.children,t=t.defaultValue,n!=null){if(t!=null)throw Error(w(92));if(Vn(n)){if(1<n.length)throw Error(w(93));n=n[0]}t=n}t==null&&(t=""),n=t}e._wrapperState={initialValue:It(n)}}function Vs(e,t){var n=It(t.value),r=It(t.defaultValue);n!=null&&(n=""+n,n!==e.value&&(e.value=n),t.defaultValue==null&&e.defaultValue!==n&&(e.defaultValue=n)),r!=null&&(e.defaultValue=""+r)}function wu(e){var t=e.textContent;t===e._wrapperState.initialValue&&t!==""&&t!==null&&(e.value=t)}function Qs(e){switch(e){case"svg":return"http://www.w3.org/2000/svg";case"math":return"http://www.w3.org/1998/Math/MathML";default:return"http://www.w3.org/1999/xhtml"}}function _o(e,t){return e==null||e==="http://www.w3.org/1999/xhtml"?Qs(t):e==="http://www.w3.org/2000/svg"&&t==="foreignObject"?"http://www.w3.org/1999/xhtml":e}var Lr,Ks=function(e){return typeof MSApp<"u"&&MSApp.execUnsafeLocalFunction?function(t,n,r,l){MSApp.execUnsafeLocalFunction(function(){return e(t,n,r,l)})}:e}(function(e,t){if(e.namespaceURI!=="http://www.w3.org/2000/svg"||"innerHTML"in e)e.innerHTML=t;else{for(Lr=Lr||document.createElement("div"),Lr.innerHTML="<svg>"+t.valueOf().toString()+"</svg>",t=Lr.firstChild;e.firstChild;)e.removeChild(e.firstChild);for(;t.firstChild;)e.appendChild(t.firstChild)}});function rr(e,t){if(t){var n=e.firstChild;if(n&&n===e.lastChild&&n.nodeType===3){n.nodeValue=t;return}}e.textContent=t}var Yn={animationIterationCount:!0,aspectRatio:!0,borderImageOutset:!0,borderImageSlice:!0,borderImageWidth:!0,boxFlex:!0,boxFlexGroup:!0,boxOrdinalGroup:!0,columnCount:!0,columns:!0,flex:!0,flexGrow:!0,flexPositive:!0,flexShrink:!0,flexNegative:!0,flexOrder:!0,gridArea:!0,gridRow:!0,gridRowEnd:!0,gridRowSpan:!0,gridRowStart:!0,gridColumn:!0,gridColumnEnd:!0,gridColumnSpan:!0,gridColumnStart:!0,fontWeight:!0,lineClamp:!0,lineHeight:!0,opacity:!0,order:!0,orphans:!0,tabSize:!0,widows:!0,zIndex:!0,zoom:!0,fillOpacity:!0,floodOpacity:!0,stopOpacity:!0,strokeDasharray:!0,strokeDashoffset:!0,strokeMiterlimit:!0,strokeOpacity:!0,strokeWidth:!0},yf=["Webkit","ms","Moz","O"];Object.keys(Yn).forEach(function(e){yf.forEach(function(t){t=t+e.charAt(0).toUpperCase()+e.substring(1),Yn[t]=Yn[e]})});function Ys(e,t,n){return t==null||typeof t=="boolean"||t===""?"":n||typeof t!="number"||t===0||Yn.hasOwnProperty(e)&&Yn[e]?(""+t).trim():t+"px"}function Gs(e,t){e=e.style;for(var n in t)if(t.hasOwnProperty(n)){var r=n.indexOf("--")===0,l=Ys(n,t[n],r);n==="float"&&(n="cssFloat"),r?e.setProperty(n,l):e[n]=l}}var wf=Z({menuitem:!0},{area:!0,base:!0,br:!0,col:!0,embed:!0,hr:!0,img:!0,input:!0,keygen:!0,link:!0,meta:!0,param:!0,source:!0,track:!0,wbr:!0});function jo(e,t){if(t){if(wf[e]&&(t.children!=null||t.dangerouslySetInnerHTML!=null))throw Error(w(137,e));if(t.dangerouslySetInnerHTML!=null){if(t.children!=null)throw Error(w(60));if(typeof t.dangerouslySetInnerHTML!="object"||!("__html"in t.dangerouslySetInnerHTML))throw Error(w(61))}if(t.style!=null&&typeof t.style!="object")throw Error(w(62))}}function Po(e,t){if(e.indexOf("-")===-1)return typeof t.is=="string";switch(e){case"annotation-xml":case"color-profile":case"font-face":case"font-face-src":case"font-face-uri":case"font-face-format":case"font-face-name":case"missing-glyph":return!1;default:return!0}}var Lo=null;function xi(e){return e=e.target||e.srcElement||window,e.correspondingUseElement&&(e=e.correspondingUseElement),e.nodeType===3?e.parentNode:e}var To=null,wn=null,xn=null;function xu(e){if(e=Sr(e)){if(typeof To!="function")throw Error(w(280));var t=e.stateNode;t&&(t=zl(t),To(e.stateNode,e.type,t))}}function Xs(e){wn?xn?xn.push(e):xn=[e]:wn=e}function Zs(){if(wn){var e=wn,t=xn;if(xn=wn=null,xu(e),t)for(e=0;e<t.length;e++)xu(t[e])}}function Js(e,t){return e(t)}function qs(){}var Gl=!1;function bs(e,t,n){if(Gl)return e(t,n);Gl=!0;try{return Js(e,t,n)}finally{Gl=!1,(wn!==null||xn!==null)&&(qs(),Zs())}}function lr(e,t){var n=e.stateNode;if(n===null)return null;var r=zl(n);if(r===null)return null;n=r[t];e:switch(t){case"onClick":case"onClickCapture":case"onDoubleClick":case"onDoubleClickCapture":case"onMouseDown":case"onMouseDownCapture":case"onMouseMove":case"onMouseMoveCapture":case"onMouseUp":case"onMouseUpCapture":case"onMouseEnter":(r=!r.disabled)||(e=e.type,r=!(e==="button"||e==="input"||e==="select"||e==="textarea")),e=!r;break e;default:e=!1}if(e)return null;if(n&&typeof n!="function")throw Error(w(231,t,typeof n));return n}var zo=!1;if(st)try{var On={};Object.defineProperty(On,"passive",{get:function(){zo=!0}}),window.addEventListener("test",On,On),window.removeEventListener("test",On,On)}catch{zo=!1}function xf(e,t,n,r,l,o,i,u,s){var f=Array.prototype.slice.call(arguments,3);try{t.apply(n,f)}catch(h){this.onError(h)}}var Gn=!1,nl=null,rl=!1,Do=null,kf={onError:function(e){Gn=!0,nl=e}};function Sf(e,t,n,r,l,o,i,u,s){Gn=!1,nl=null,xf.apply(kf,arguments)}function Ef(e,t,n,r,l,o,i,u,s){if(Sf.apply(this,arguments),Gn){if(Gn){var f=nl;Gn=!1,nl=null}else throw Error(w(198));rl||(rl=!0,Do=f)}}function tn(e){var t=e,n=e;if(e.alternate)for(;t.return;)t=t.return;else{e=t;do t=e,t.flags&4098&&(n=t.return),e=t.return;while(e)}return t.tag===3?n:null}function ea(e){if(e.tag===13){var t=e.memoizedState;if(t===null&&(e=e.alternate,e!==null&&(t=e.memoizedState)),t!==null)return t.dehydrated}return null}function ku(e){if(tn(e)!==e)throw Error(w(188))}function Cf(e){var t=e.alternate;if(!t){if(t=tn(e),t===null)throw Error(w(188));return t!==e?null:e}for(var n=e,r=t;;){var l=n.return;if(l===null)break;var o=l.alternate;if(o===null){if(r=l.return,r!==null){n=r;continue}break}if(l.child===o.child){for(o=l.child;o;){if(o===n)return ku(l),e;if(o===r)return ku(l),t;o=o.sibling}throw Error(w(188))}if(n.return!==r.return)n=l,r=o;else{for(var i=!1,u=l.child;u;){if(u===n){i=!0,n=l,r=o;break}if(u===r){i=!0,r=l,n=o;break}u=u.sibling}if(!i){for(u=o.child;u;){if(u===n){i=!0,n=o,r=l;break}if(u===r){i=!0,r=o,n=l;break}u=u.sibling}if(!i)throw Error(w(189))}}if(n.alternate!==r)throw Error(w(190))}if(n.tag!==3)throw Error(w(188));return n.stateNode.current===n?e:t}function ta(e){return e=Cf(e),e!==null?na(e):null}function na(e){if(e.tag===5||e.tag===6)return e;for(e=e.child;e!==null;){var t=na(e);if(t!==null)return t;e=e.sibling}return null}var ra=ze.unstable_scheduleCallback,Su=ze.unstable_cancelCallback,Nf=ze.unstable_shouldYield,_f=ze.unstable_requestPaint,b=ze.unstable_now,jf=ze.unstable_getCurrentPriorityLevel,ki=ze.unstable_ImmediatePriority,la=ze.unstable_UserBlockingPriority,ll=ze.unstable_NormalPriority,Pf=ze.unstable_LowPriority,oa=ze.unstable_IdlePriority,jl=null,be=null;function Lf(e){if(be&&typeof be.onCommitFiberRoot=="function")try{be.onCommitFiberRoot(jl,e,void 0,(e.current.flags&128)===128)}catch{}}var Ye=Math.clz32?Math.clz32:Df,Tf=Math.log,zf=Math.LN2;function Df(e){return e>>>=0,e===0?32:31-(Tf(e)/zf|0)|0}var Tr=64,zr=4194304;function Qn(e){switch(e&-e){case 1:return 1;case 2:return 2;case 4:return 4;case 8:return 8;case 16:return 16;case 32:return 32;case 64:case 128:case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:return e&4194240;case 4194304:case 8388608:case 16777216:case 33554432:case 67108864:return e&130023424;case 134217728:return 134217728;case 268435456:return 268435456;case 536870912:return 536870912;case 1073741824:return 1073741824;default:return e}}function ol(e,t){var n=e.pendingLanes;if(n===0)return 0;var r=0,l=e.suspendedLanes,o=e.pingedLanes,i=n&268435455;if(i!==0){var u=i&~l;u!==0?r=Qn(u):(o&=i,o!==0&&(r=Qn(o)))}else i=n&~l,i!==0?r=Qn(i):o!==0&&(r=Qn(o));if(r===0)return 0;if(t!==0&&t!==r&&!(t&l)&&(l=r&-r,o=t&-t,l>=o||l===16&&(o&4194240)!==0))return t;if(r&4&&(r|=n&16),t=e.entangledLanes,t!==0)for(e=e.entanglements,t&=r;0<t;)n=31-Ye(t),l=1<<n,r|=e[n],t&=~l;return r}function Rf(e,t){switch(e){case 1:case 2:case 4:return t+250;case 8:case 16:case 32:case 64:case 128:case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:return t+5e3;case 4194304:case 8388608:case 16777216:case 33554432:case 67108864:return-1;case 134217728:case 268435456:case 536870912:case 1073741824:return-1;default:return-1}}function If(e,t){for(var n=e.suspendedLanes,r=e.pingedLanes,l=e.expirationTimes,o=e.pendingLanes;0<o;){var i=31-Ye(o),u=1<<i,s=l[i];s===-1?(!(u&n)||u&r)&&(l[i]=Rf(u,t)):s<=t&&(e.expiredLanes|=u),o&=~u}}function Ro(e){return e=e.pendingLanes&-1073741825,e!==0?e:e&1073741824?1073741824:0}function ia(){var e=Tr;return Tr<<=1,!(Tr&4194240)&&(Tr=64),e}function Xl(e){for(var t=[],n=0;31>n;n++)t.push(e);return t}function xr(e,t,n){e.pendingLanes|=t,t!==536870912&&(e.suspendedLanes=0,e.pingedLanes=0),e=e.eventTimes,t=31-Ye(t),e[t]=n}function Mf(e,t){var n=e.pendingLanes&~t;e.pendingLanes=t,e.suspendedLanes=0,e.pingedLanes=0,e.expiredLanes&=t,e.mutableReadLanes&=t,e.entangledLanes&=t,t=e.entanglements;var r=e.eventTimes;for(e=e.expirationTimes;0<n;){var l=31-Ye(n),o=1<<l;t[l]=0,r[l]=-1,e[l]=-1,n&=~o}}function Si(e,t){var n=e.entangledLanes|=t;for(e=e.entanglements;n;){var r=31-Ye(n),l=1<<r;l&t|e[r]&t&&(e[r]|=t),n&=~l}}var F=0;function ua(e){return e&=-e,1<e?4<e?e&268435455?16:536870912:4:1}var sa,Ei,aa,ca,fa,Io=!1,Dr=[],_t=null,jt=null,Pt=null,or=new Map,ir=new Map,St=[],Of="mousedown mouseup touchcancel touchend touchstart auxclick dblclick pointercancel pointerdown pointerup dragend dragstart drop compositionend compositionstart keydown keypress keyup input textInput copy cut paste click change contextmenu reset submit".split(" ");function Eu(e,t){switch(e){case"focusin":case"focusout":_t=null;break;case"dragenter":case"dragleave":jt=null;break;case"mouseover":case"mouseout":Pt=null;break;case"pointerover":case"pointerout":or.delete(t.pointerId);break;case"gotpointercapture":case"lostpointercapture":ir.delete(t.pointerId)}}function Fn(e,t,n,r,l,o){return e===null||e.nativeEvent!==o?(e={blockedOn:t,domEventName:n,eventSystemFlags:r,nativeEvent:o,targetContainers:[l]},t!==null&&(t=Sr(t),t!==null&&Ei(t)),e):(e.eventSystemFlags|=r,t=e.targetContainers,l!==null&&t.indexOf(l)===-1&&t.push(l),e)}function Ff(e,t,n,r,l){switch(t){case"focusin":return _t=Fn(_t,e,t,n,r,l),!0;case"dragenter":return jt=Fn(jt,e,t,n,r,l),!0;case"mouseover":return Pt=Fn(Pt,e,t,n,r,l),!0;case"pointerover":var o=l.pointerId;return or.set(o,Fn(or.get(o)||null,e,t,n,r,l)),!0;case"gotpointercapture":return o=l.pointerId,ir.set(o,Fn(ir.get(o)||null,e,t,n,r,l)),!0}return!1}function da(e){var t=Vt(e.target);if(t!==null){var n=tn(t);if(n!==null){if(t=n.tag,t===13){if(t=ea(n),t!==null){e.blockedOn=t,fa(e.priority,function(){aa(n)});return}}else if(t===3&&n.stateNode.current.memoizedState.isDehydrated){e.blockedOn=n.tag===3?n.stateNode.containerInfo:null;return}}}e.blockedOn=null}function Qr(e){if(e.blockedOn!==null)return!1;for(var t=e.targetContainers;0<t.length;){var n=Mo(e.domEventName,e.eventSystemFlags,t[0],e.nativeEvent);if(n===null){n=e.nativeEvent;var r=new n.constructor(n.type,n);Lo=r,n.target.dispatchEvent(r),Lo=null}else return t=Sr(n),t!==null&&Ei(t),e.blockedOn=n,!1;t.shift()}return!0}function Cu(e,t,n){Qr(e)&&n.delete(t)}function Uf(){Io=!1,_t!==null&&Qr(_t)&&(_t=null),jt!==null&&Qr(jt)&&(jt=null),Pt!==null&&Qr(Pt)&&(Pt=null),or.forEach(Cu),ir.forEach(Cu)}function Un(e,t){e.blockedOn===t&&(e.blockedOn=null,Io||(Io=!0,ze.unstable_scheduleCallback(ze.unstable_NormalPriority,Uf)))}function ur(e){function t(l){return Un(l,e)}if(0<Dr.length){Un(Dr[0],e);for(var n=1;n<Dr.length;n++){var r=Dr[n];r.blockedOn===e&&(r.blockedOn=null)}}for(_t!==null&&Un(_t,e),jt!==null&&Un(jt,e),Pt!==null&&Un(Pt,e),or.forEach(t),ir.forEach(t),n=0;n<St.length;n++)r=St[n],r.blockedOn===e&&(r.blockedOn=null);for(;0<St.length&&(n=St[0],n.blockedOn===null);)da(n),n.blockedOn===null&&St.shift()}var kn=dt.ReactCurrentBatchConfig,il=!0;function Af(e,t,n,r){var l=F,o=kn.transition;kn.transition=null;try{F=1,Ci(e,t,n,r)}finally{F=l,kn.transition=o}}function $f(e,t,n,r){var l=F,o=kn.transition;kn.transition=null;try{F=4,Ci(e,t,n,r)}finally{F=l,kn.transition=o}}function Ci(e,t,n,r){if(il){var l=Mo(e,t,n,r);if(l===null)oo(e,t,r,ul,n),Eu(e,r);else if(Ff(l,e,t,n,r))r.stopPropagation();else if(Eu(e,r),t&4&&-1<Of.indexOf(e)){for(;l!==null;){var o=Sr(l);if(o!==null&&sa(o),o=Mo(e,t,n,r),o===null&&oo(e,t,r,ul,n),o===l)break;l=o}l!==null&&r.stopPropagation()}else oo(e,t,r,null,n)}}var ul=null;function Mo(e,t,n,r){if(ul=null,e=xi(r),e=Vt(e),e!==null)if(t=tn(e),t===null)e=null;else if(n=t.tag,n===13){if(e=ea(t),e!==null)return e;e=null}else if(n===3){if(t.stateNode.current.memoizedState.isDehydrated)return t.tag===3?t.stateNode.containerInfo:null;e=null}else t!==e&&(e=null);return ul=e,null}function pa(e){switch(e){case"cancel":case"click":case"close":case"contextmenu":case"copy":case"cut":case"auxclick":case"dblclick":case"dragend":case"dragstart":case"drop":case"focusin":case"focusout":case"input":case"invalid":case"keydown":case"keypress":case"keyup":case"mousedown":case"mouseup":case"paste":case"pause":case"play":case"pointercancel":case"pointerdown":case"pointerup":case"ratechange":case"reset":case"resize":case"seeked":case"submit":case"touchcancel":case"touchend":case"touchstart":case"volumechange":case"change":case"selectionchange":case"textInput":case"compositionstart":case"compositionend":case"compositionupdate":case"beforeblur":case"afterblur":case"beforeinput":case"blur":case"fullscreenchange":case"focus":case"hashchange":case"popstate":case"select":case"selectstart":return 1;case"drag":case"dragenter":case"dragexit":case"dragleave":case"dragover":case"mousemove":case"mouseout":case"mouseover":case"pointermove":case"pointerout":case"pointerover":case"scroll":case"toggle":case"touchmove":case"wheel":case"mouseenter":case"mouseleave":case"pointerenter":case"pointerleave":return 4;case"message":switch(jf()){case ki:return 1;case la:return 4;case ll:case Pf:return 16;case oa:return 536870912;default:return 16}default:return 16}}var Ct=null,Ni=null,Kr=null;function ha(){if(Kr)return Kr;var e,t=Ni,n=t.length,r,l="value"in Ct?Ct.value:Ct.textContent,o=l.length;for(e=0;e<n&&t[e]===l[e];e++);var i=n-e;for(r=1;r<=i&&t[n-r]===l[o-r];r++);return Kr=l.slice(e,1<r?1-r:void 0)}function Yr(e){var t=e.keyCode;return"charCode"in e?(e=e.charCode,e===0&&t===13&&(e=13)):e=t,e===10&&(e=13),32<=e||e===13?e:0}function Rr(){return!0}function Nu(){return!1}function Re(e){function t(n,r,l,o,i){this._reactName=n,this._targetInst=l,this.type=r,this.nativeEvent=o,this.target=i,this.currentTarget=null;for(var u in e)e.hasOwnProperty(u)&&(n=e[u],this[u]=n?n(o):o[u]);return this.isDefaultPrevented=(o.defaultPrevented!=null?o.defaultPrevented:o.returnValue===!1)?Rr:Nu,this.isPropagationStopped=Nu,this}return Z(t.prototype,{preventDefault:function(){this.defaultPrevented=!0;var n=this.nativeEvent;n&&(n.preventDefault?n.preventDefault():typeof n.returnValue!="unknown"&&(n.returnValue=!1),this.isDefaultPrevented=Rr)},stopPropagation:function(){var n=this.nativeEvent;n&&(n.stopPropagation?n.stopPropagation():typeof n.cancelBubble!="unknown"&&(n.cancelBubble=!0),this.isPropagationStopped=Rr)},persist:function(){},isPersistent:Rr}),t}var Dn={eventPhase:0,bubbles:0,cancelable:0,timeStamp:function(e){return e.timeStamp||Date.now()},defaultPrevented:0,isTrusted:0},_i=Re(Dn),kr=Z({},Dn,{view:0,detail:0}),Bf=Re(kr),Zl,Jl,An,Pl=Z({},kr,{screenX:0,screenY:0,clientX:0,clientY:0,pageX:0,pageY:0,ctrlKey:0,shiftKey:0,altKey:0,metaKey:0,getModifierState:ji,button:0,buttons:0,relatedTarget:function(e){return e.relatedTarget===void 0?e.fromElement===e.srcElement?e.toElement:e.fromElement:e.relatedTarget},movementX:function(e){return"movementX"in e?e.movementX:(e!==An&&(An&&e.type==="mousemove"?(Zl=e.screenX-An.screenX,Jl=e.screenY-An.screenY):Jl=Zl=0,An=e),Zl)},movementY:function(e){return"movementY"in e?e.movementY:Jl}}),_u=Re(Pl),Wf=Z({},Pl,{dataTransfer:0}),Hf=Re(Wf),Vf=Z({},kr,{relatedTarget:0}),ql=Re(Vf),Qf=Z({},Dn,{animationName:0,elapsedTime:0,pseudoElement:0}),Kf=Re(Qf),Yf=Z({},Dn,{clipboardData:function(e){return"clipboardData"in e?e.clipboardData:window.clipboardData}}),Gf=Re(Yf),Xf=Z({},Dn,{data:0}),ju=Re(Xf),Zf={Esc:"Escape",Spacebar:" ",Left:"ArrowLeft",Up:"ArrowUp",Right:"ArrowRight",Down:"ArrowDown",Del:"Delete",Win:"OS",Menu:"ContextMenu",Apps:"ContextMenu",Scroll:"ScrollLock",MozPrintableKey:"Unidentified"},Jf={8:"Backspace",9:"Tab",12:"Clear",13:"Enter",16:"Shift",17:"Control",18:"Alt",19:"Pause",20:"CapsLock",27:"Escape",32:" ",33:"PageUp",34:"PageDown",35:"End",36:"Home",37:"ArrowLeft",38:"ArrowUp",39:"ArrowRight",40:"ArrowDown",45:"Insert",46:"Delete",112:"F1",113:"F2",114:"F3",115:"F4",116:"F5",117:"F6",118:"F7",119:"F8",120:"F9",121:"F10",122:"F11",123:"F12",144:"NumLock",145:"ScrollLock",224:"Meta"},qf={Alt:"altKey",Control:"ctrlKey",Meta:"metaKey",Shift:"shiftKey"};function bf(e){var t=this.nativeEvent;return t.getModifierState?t.getModifierState(e):(e=qf[e])?!!t[e]:!1}function ji(){return bf}var ed=Z({},kr,{key:function(e){if(e.key){var t=Zf[e.key]||e.key;if(t!=="Unidentified")return t}return e.type==="keypress"?(e=Yr(e),e===13?"Enter":String.fromCharCode(e)):e.type==="keydown"||e.type==="keyup"?Jf[e.keyCode]||"Unidentified":""},code:0,location:0,ctrlKey:0,shiftKey:0,altKey:0,metaKey:0,repeat:0,locale:0,getModifierState:ji,charCode:function(e){return e.type==="keypress"?Yr(e):0},keyCode:function(e){return e.type==="keydown"||e.type==="keyup"?e.keyCode:0},which:function(e){return e.type==="keypress"?Yr(e):e.type==="keydown"||e.type==="keyup"?e.keyCode:0}}),td=Re(ed),nd=Z({},Pl,{pointerId:0,width:0,height:0,pressure:0,tangentialPressure:0,tiltX:0,tiltY:0,twist:0,pointerType:0,isPrimary:0}),Pu=Re(nd),rd=Z({},kr,{touches:0,targetTouches:0,changedTouches:0,altKey:0,metaKey:0,ctrlKey:0,shiftKey:0,getModifierState:ji}),ld=Re(rd),od=Z({},Dn,{propertyName:0,elapsedTime:0,pseudoElement:0}),id=Re(od),ud=Z({},Pl,{deltaX:function(e){return"deltaX"in e?e.deltaX:"wheelDeltaX"in e?-e.wheelDeltaX:0},deltaY:function(e){return"deltaY"in e?e.deltaY:"wheelDeltaY"in e?-e.wheelDeltaY:"wheelDelta"in e?-e.wheelDelta:0},deltaZ:0,deltaMode:0}),sd=Re(ud),ad=[9,13,27,32],Pi=st&&"CompositionEvent"in window,Xn=null;st&&"documentMode"in document&&(Xn=document.documentMode);var cd=st&&"TextEvent"in window&&!Xn,ma=st&&(!Pi||Xn&&8<Xn&&11>=Xn),Lu=" ",Tu=!1;function va(e,t){switch(e){case"keyup":return ad.indexOf(t.keyCode)!==-1;case"keydown":return t.keyCode!==229;case"keypress":case"mousedown":case"focusout":return!0;default:return!1}}function ga(e){return e=e.detail,typeof e=="object"&&"data"in e?e.data:null}var sn=!1;function fd(e,t){switch(e){case"compositionend":return ga(t);case"keypress":return t.which!==32?null:(Tu=!0,Lu);case"textInput":return e=t.data,e===Lu&&Tu?null:e;default:return null}}function dd(e,t){if(sn)return e==="compositionend"||!Pi&&va(e,t)?(e=ha(),Kr=Ni=Ct=null,sn=!1,e):null;switch(e){case"paste":return null;case"keypress":if(!(t.ctrlKey||t.altKey||t.metaKey)||t.ctrlKey&&t.altKey){if(t.char&&1<t.char.length)return t.char;if(t.which)return String.fromCharCode(t.which)}return null;case"compositionend":return ma&&t.locale!=="ko"?null:t.data;default:return null}}var pd={color:!0,date:!0,datetime:!0,"datetime-local":!0,email:!0,month:!0,number:!0,password:!0,range:!0,search:!0,tel:!0,text:!0,time:!0,url:!0,week:!0};function zu(e){var t=e&&e.nodeName&&e.nodeName.toLowerCase();return t==="input"?!!pd[e.type]:t==="textarea"}function ya(e,t,n,r){Xs(r),t=sl(t,"onChange"),0<t.length&&(n=new _i("onChange","change",null,n,r),e.push({event:n,listeners:t}))}var Zn=null,sr=null;function hd(e){La(e,0)}function Ll(e){var t=fn(e);if(Ws(t))return e}function md(e,t){if(e==="change")return t}var wa=!1;if(st){var bl;if(st){var eo="oninput"in document;if(!eo){var Du=document.createElement("div");Du.setAttribute("oninput","return;"),eo=typeof Du.oninput=="function"}bl=eo}else bl=!1;wa=bl&&(!document.documentMode||9<document.documentMode)}function Ru(){Zn&&(Zn.detachEvent("onpropertychange",xa),sr=Zn=null)}function xa(e){if(e.propertyName==="value"&&Ll(sr)){var t=[];ya(t,sr,e,xi(e)),bs(hd,t)}}function vd(e,t,n){e==="focusin"?(Ru(),Zn=t,sr=n,Zn.attachEvent("onpropertychange",xa)):e==="focusout"&&Ru()}function gd(e){if(e==="selectionchange"||e==="keyup"||e==="keydown")return Ll(sr)}function yd(e,t){if(e==="click")return Ll(t)}function wd(e,t){if(e==="input"||e==="change")return Ll(t)}function xd(e,t){return e===t&&(e!==0||1/e===1/t)||e!==e&&t!==t}var Xe=typeof Object.is=="function"?Object.is:xd;function ar(e,t){if(Xe(e,t))return!0;if(typeof e!="object"||e===null||typeof t!="object"||t===null)return!1;var n=Object.keys(e),r=Object.keys(t);if(n.length!==r.length)return!1;for(r=0;r<n.length;r++){var l=n[r];if(!go.call(t,l)||!Xe(e[l],t[l]))return!1}return!0}function Iu(e){for(;e&&e.firstChild;)e=e.firstChild;return e}function Mu(e,t){var n=Iu(e);e=0;for(var r;n;){if(n.nodeType===3){if(r=e+n.textContent.length,e<=t&&r>=t)return{node:n,offset:t-e};e=r}e:{for(;n;){if(n.nextSibling){n=n.nextSibling;break e}n=n.parentNode}n=void 0}n=Iu(n)}}function ka(e,t){return e&&t?e===t?!0:e&&e.nodeType===3?!1:t&&t.nodeType===3?ka(e,t.parentNode):"contains"in e?e.contains(t):e.compareDocumentPosition?!!(e.compareDocumentPosition(t)&16):!1:!1}function Sa(){for(var e=window,t=tl();t instanceof e.HTMLIFrameElement;){try{var n=typeof t.contentWindow.location.href=="string"}catch{n=!1}if(n)e=t.contentWindow;else break;t=tl(e.document)}return t}function Li(e){var t=e&&e.nodeName&&e.nodeName.toLowerCase();return t&&(t==="input"&&(e.type==="text"||e.type==="search"||e.type==="tel"||e.type==="url"||e.type==="password")||t==="textarea"||e.contentEditable==="true")}function kd(e){var t=Sa(),n=e.focusedElem,r=e.selectionRange;if(t!==n&&n&&n.ownerDocument&&ka(n.ownerDocument.documentElement,n)){if(r!==null&&Li(n)){if(t=r.start,e=r.end,e===void 0&&(e=t),"selectionStart"in n)n.selectionStart=t,n.selectionEnd=Math.min(e,n.value.length);else if(e=(t=n.ownerDocument||document)&&t.defaultView||window,e.getSelection){e=e.getSelection();var l=n.textContent.length,o=Math.min(r.start,l);r=r.end===void 0?o:Math.min(r.end,l),!e.extend&&o>r&&(l=r,r=o,o=l),l=Mu(n,o);var i=Mu(n,r);l&&i&&(e.rangeCount!==1||e.anchorNode!==l.node||e.anchorOffset!==l.offset||e.focusNode!==i.node||e.focusOffset!==i.offset)&&(t=t.createRange(),t.setStart(l.node,l.offset),e.removeAllRanges(),o>r?(e.addRange(t),e.extend(i.node,i.offset)):(t.setEnd(i.node,i.offset),e.addRange(t)))}}for(t=[],e=n;e=e.parentNode;)e.nodeType===1&&t.push({element:e,left:e.scrollLeft,top:e.scrollTop});for(typeof n.focus=="function"&&n.focus(),n=0;n<t.length;n++)e=t[n],e.element.scrollLeft=e.left,e.element.scrollTop=e.top}}var Sd=st&&"documentMode"in document&&11>=document.documentMode,an=null,Oo=null,Jn=null,Fo=!1;function Ou(e,t,n){var r=n.window===n?n.document:n.nodeType===9?n:n.ownerDocument;Fo||an==null||an!==tl(r)||(r=an,"selectionStart"in r&&Li(r)?r={start:r.selectionStart,end:r.selectionEnd}:(r=(r.ownerDocument&&r.ownerDocument.defaultView||window).getSelection(),r={anchorNode:r.anchorNode,anchorOffset:r.anchorOffset,focusNode:r.focusNode,focusOffset:r.focusOffset}),Jn&&ar(Jn,r)||(Jn=r,r=sl(Oo,"onSelect"),0<r.length&&(t=new _i("onSelect","select",null,t,n),e.push({event:t,listeners:r}),t.target=an)))}function Ir(e,t){var n={};return n[e.toLowerCase()]=t.toLowerCase(),n["Webkit"+e]="webkit"+t,n["Moz"+e]="moz"+t,n}var cn={animationend:Ir("Animation","AnimationEnd"),animationiteration:Ir("Animation","AnimationIteration"),animationstart:Ir("Animation","AnimationStart"),transitionend:Ir("Transition","TransitionEnd")},to={},Ea={};st&&(Ea=document.createElement("div").style,"AnimationEvent"in window||(delete cn.animationend.animation,delete cn.animationiteration.animation,delete cn.animationstart.animation),"TransitionEvent"in window||delete cn.transitionend.transition);function Tl(e){if(to[e])return to[e];if(!cn[e])return e;var t=cn[e],n;for(n in t)if(t.hasOwnProperty(n)&&n in Ea)return to[e]=t[n];return e}var Ca=Tl("animationend"),Na=Tl("animationiteration"),_a=Tl("animationstart"),ja=Tl("transitionend"),Pa=new Map,Fu="abort auxClick cancel canPlay canPlayThrough click close contextMenu copy cut drag dragEnd dragEnter dragExit dragLeave dragOver dragStart drop durationChange emptied encrypted ended error gotPointerCapture input invalid keyDown keyPress keyUp load loadedData loadedMetadata loadStart lostPointerCapture mouseDown mouseMove mouseOut mouseOver mouseUp paste pause play playing pointerCancel pointerDown pointerMove pointerOut pointerOver pointerUp progress rateChange reset resize seeked seeking stalled submit suspend timeUpdate touchCancel touchEnd touchStart volumeChange scroll toggle touchMove waiting wheel".split(" ");function Ot(e,t){Pa.set(e,t),en(t,[e])}for(var no=0;no<Fu.length;no++){var ro=Fu[no],Ed=ro.toLowerCase(),Cd=ro[0].toUpperCase()+ro.slice(1);Ot(Ed,"on"+Cd)}Ot(Ca,"onAnimationEnd");Ot(Na,"onAnimationIteration");Ot(_a,"onAnimationStart");Ot("dblclick","onDoubleClick");Ot("focusin","onFocus");Ot("focusout","onBlur");Ot(ja,"onTransitionEnd");Cn("onMouseEnter",["mouseout","mouseover"]);Cn("onMouseLeave",["mouseout","mouseover"]);Cn("onPointerEnter",["pointerout","pointerover"]);Cn("onPointerLeave",["pointerout","pointerover"]);en("onChange","change click focusin focusout input keydown keyup selectionchange".split(" "));en("onSelect","focusout contextmenu dragend focusin keydown keyup mousedown mouseup selectionchange".split(" "));en("onBeforeInput",["compositionend","keypress","textInput","paste"]);en("onCompositionEnd","compositionend focusout keydown keypress keyup mousedown".split(" "));en("onCompositionStart","compositionstart focusout keydown keypress keyup mousedown".split(" "));en("onCompositionUpdate","compositionupdate focusout keydown keypress keyup mousedown".split(" "));var Kn="abort canplay canplaythrough durationchange emptied encrypted ended error loadeddata loadedmetadata loadstart pause play playing progress ratechange resize seeked seeking stalled suspend timeupdate volumechange waiting".split(" "),Nd=new Set("cancel close invalid load scroll toggle".split(" ").concat(Kn));function Uu(e,t,n){var r=e.type||"unknown-event";e.currentTarget=n,Ef(r,t,void 0,e),e.currentTarget=null}function La(e,t){t=(t&4)!==0;for(var n=0;n<e.length;n++){var r=e[n],l=r.event;r=r.listeners;e:{var o=void 0;if(t)for(var i=r.length-1;0<=i;i--){var u=r[i],s=u.instance,f=u.currentTarget;if(u=u.listener,s!==o&&l.isPropagationStopped())break e;Uu(l,u,f),o=s}else for(i=0;i<r.length;i++){if(u=r[i],s=u.instance,f=u.currentTarget,u=u.listener,s!==o&&l.isPropagationStopped())break e;Uu(l,u,f),o=s}}}if(rl)throw e=Do,rl=!1,Do=null,e}function W(e,t){var n=t[Wo];n===void 0&&(n=t[Wo]=new Set);var r=e+"__bubble";n.has(r)||(Ta(t,e,2,!1),n.add(r))}function lo(e,t,n){var r=0;t&&(r|=4),Ta(n,e,r,t)}var Mr="_reactListening"+Math.random().toString(36).slice(2);function cr(e){if(!e[Mr]){e[Mr]=!0,Fs.forEach(function(n){n!=="selectionchange"&&(Nd.has(n)||lo(n,!1,e),lo(n,!0,e))});var t=e.nodeType===9?e:e.ownerDocument;t===null||t[Mr]||(t[Mr]=!0,lo("selectionchange",!1,t))}}function Ta(e,t,n,r){switch(pa(t)){case 1:var l=Af;break;case 4:l=$f;break;default:l=Ci}n=l.bind(null,t,n,e),l=void 0,!zo||t!=="touchstart"&&t!=="touchmove"&&t!=="wheel"||(l=!0),r?l!==void 0?e.addEventListener(t,n,{capture:!0,passive:l}):e.addEventListener(t,n,!0):l!==void 0?e.addEventListener(t,n,{passive:l}):e.addEventListener(t,n,!1)}function oo(e,t,n,r,l){var o=r;if(!(t&1)&&!(t&2)&&r!==null)e:for(;;){if(r===null)return;var i=r.tag;if(i===3||i===4){var u=r.stateNode.containerInfo;if(u===l||u.nodeType===8&&u.parentNode===l)break;if(i===4)for(i=r.return;i!==null;){var s=i.tag;if((s===3||s===4)&&(s=i.stateNode.containerInfo,s===l||s.nodeType===8&&s.parentNode===l))return;i=i.return}for(;u!==null;){if(i=Vt(u),i===null)return;if(s=i.tag,s===5||s===6){r=o=i;continue e}u=u.parentNode}}r=r.return}bs(function(){var f=o,h=xi(n),g=[];e:{var m=Pa.get(e);if(m!==void 0){var x=_i,k=e;switch(e){case"keypress":if(Yr(n)===0)break e;case"keydown":case"keyup":x=td;break;case"focusin":k="focus",x=ql;break;case"focusout":k="blur",x=ql;break;case"beforeblur":case"afterblur":x=ql;break;case"click":if(n.button===2)break e;case"auxclick":case"dblclick":case"mousedown":case"mousemove":case"mouseup":case"mouseout":case"mouseover":case"contextmenu":x=_u;break;case"drag":case"dragend":case"dragenter":case"dragexit":case"dragleave":case"dragover":case"dragstart":case"drop":x=Hf;break;case"touchcancel":case"touchend":case"touchmove":case"touchstart":x=ld;break;case Ca:case Na:case _a:x=Kf;break;case ja:x=id;break;case"scroll":x=Bf;break;case"wheel":x=sd;break;case"copy":case"cut":case"paste":x=Gf;break;case"gotpointercapture":case"lostpointercapture":case"pointercancel":case"pointerdown":case"pointermove":case"pointerout":case"pointerover":case"pointerup":x=Pu}var S=(t&4)!==0,O=!S&&e==="scroll",d=S?m!==null?m+"Capture":null:m;S=[];for(var c=f,p;c!==null;){p=c;var y=p.stateNode;if(p.tag===5&&y!==null&&(p=y,d!==null&&(y=lr(c,d),y!=null&&S.push(fr(c,y,p)))),O)break;c=c.return}0<S.length&&(m=new x(m,k,null,n,h),g.push({event:m,listeners:S}))}}if(!(t&7)){e:{if(m=e==="mouseover"||e==="pointerover",x=e==="mouseout"||e==="pointerout",m&&n!==Lo&&(k=n.relatedTarget||n.fromElement)&&(Vt(k)||k[at]))break e;if((x||m)&&(m=h.window===h?h:(m=h.ownerDocument)?m.defaultView||m.parentWindow:window,x?(k=n.relatedTarget||n.toElement,x=f,k=k?Vt(k):null,k!==null&&(O=tn(k),k!==O||k.tag!==5&&k.tag!==6)&&(k=null)):(x=null,k=f),x!==k)){if(S=_u,y="onMouseLeave",d="onMouseEnter",c="mouse",(e==="pointerout"||e==="pointerover")&&(S=Pu,y="onPointerLeave",d="onPointerEnter",c="pointer"),O=x==null?m:fn(x),p=k==null?m:fn(k),m=new S(y,c+"leave",x,n,h),m.target=O,m.relatedTarget=p,y=null,Vt(h)===f&&(S=new S(d,c+"enter",k,n,h),S.target=p,S.relatedTarget=O,y=S),O=y,x&&k)t:{for(S=x,d=k,c=0,p=S;p;p=ln(p))c++;for(p=0,y=d;y;y=ln(y))p++;for(;0<c-p;)S=ln(S),c--;for(;0<p-c;)d=ln(d),p--;for(;c--;){if(S===d||d!==null&&S===d.alternate)break t;S=ln(S),d=ln(d)}S=null}else S=null;x!==null&&Au(g,m,x,S,!1),k!==null&&O!==null&&Au(g,O,k,S,!0)}}e:{if(m=f?fn(f):window,x=m.nodeName&&m.nodeName.toLowerCase(),x==="select"||x==="input"&&m.type==="file")var E=md;else if(zu(m))if(wa)E=wd;else{E=gd;var j=vd}else(x=m.nodeName)&&x.toLowerCase()==="input"&&(m.type==="checkbox"||m.type==="radio")&&(E=yd);if(E&&(E=E(e,f))){ya(g,E,n,h);break e}j&&j(e,m,f),e==="focusout"&&(j=m._wrapperState)&&j.controlled&&m.type==="number"&&Co(m,"number",m.value)}switch(j=f?fn(f):window,e){case"focusin":(zu(j)||j.contentEditable==="true")&&(an=j,Oo=f,Jn=null);break;case"focusout":Jn=Oo=an=null;break;case"mousedown":Fo=!0;break;case"contextmenu":case"mouseup":case"dragend":Fo=!1,Ou(g,n,h);break;case"selectionchange":if(Sd)break;case"keydown":case"keyup":Ou(g,n,h)}var N;if(Pi)e:{switch(e){case"compositionstart":var P="onCompositionStart";break e;case"compositionend":P="onCompositionEnd";break e;case"compositionupdate":P="onCompositionUpdate";break e}P=void 0}else sn?va(e,n)&&(P="onCompositionEnd"):e==="keydown"&&n.keyCode===229&&(P="onCompositionStart");P&&(ma&&n.locale!=="ko"&&(sn||P!=="onCompositionStart"?P==="onCompositionEnd"&&sn&&(N=ha()):(Ct=h,Ni="value"in Ct?Ct.value:Ct.textContent,sn=!0)),j=sl(f,P),0<j.length&&(P=new ju(P,e,null,n,h),g.push({event:P,listeners:j}),N?P.data=N:(N=ga(n),N!==null&&(P.data=N)))),(N=cd?fd(e,n):dd(e,n))&&(f=sl(f,"onBeforeInput"),0<f.length&&(h=new ju("onBeforeInput","beforeinput",null,n,h),g.push({event:h,listeners:f}),h.data=N))}La(g,t)})}function fr(e,t,n){return{instance:e,listener:t,currentTarget:n}}function sl(e,t){for(var n=t+"Capture",r=[];e!==null;){var l=e,o=l.stateNode;l.tag===5&&o!==null&&(l=o,o=lr(e,n),o!=null&&r.unshift(fr(e,o,l)),o=lr(e,t),o!=null&&r.push(fr(e,o,l))),e=e.return}return r}function ln(e){if(e===null)return null;do e=e.return;while(e&&e.tag!==5);return e||null}function Au(e,t,n,r,l){for(var o=t._reactName,i=[];n!==null&&n!==r;){var u=n,s=u.alternate,f=u.stateNode;if(s!==null&&s===r)break;u.tag===5&&f!==null&&(u=f,l?(s=lr(n,o),s!=null&&i.unshift(fr(n,s,u))):l||(s=lr(n,o),s!=null&&i.push(fr(n,s,u)))),n=n.return}i.length!==0&&e.push({event:t,listeners:i})}var _d=/\r\n?/g,jd=/\u0000|\uFFFD/g;function $u(e){return(typeof e=="string"?e:""+e).replace(_d,`
-`).replace(jd,"")}function Or(e,t,n){if(t=$u(t),$u(e)!==t&&n)throw Error(w(425))}function al(){}var Uo=null,Ao=null;function $o(e,t){return e==="textarea"||e==="noscript"||typeof t.children=="string"||typeof t.children=="number"||typeof t.dangerouslySetInnerHTML=="object"&&t.dangerouslySetInnerHTML!==null&&t.dangerouslySetInnerHTML.__html!=null}var Bo=typeof setTimeout=="function"?setTimeout:void 0,Pd=typeof clearTimeout=="function"?clearTimeout:void 0,Bu=typeof Promise=="function"?Promise:void 0,Ld=typeof queueMicrotask=="function"?queueMicrotask:typeof Bu<"u"?function(e){return Bu.resolve(null).then(e).catch(Td)}:Bo;function Td(e){setTimeout(function(){throw e})}function io(e,t){var n=t,r=0;do{var l=n.nextSibling;if(e.removeChild(n),l&&l.nodeType===8)if(n=l.data,n==="/$"){if(r===0){e.removeChild(l),ur(t);return}r--}else n!=="$"&&n!=="$?"&&n!=="$!"||r++;n=l}while(n);ur(t)}function Lt(e){for(;e!=null;e=e.nextSibling){var t=e.nodeType;if(t===1||t===3)break;if(t===8){if(t=e.data,t==="$"||t==="$!"||t==="$?")break;if(t==="/$")return null}}return e}function Wu(e){e=e.previousSibling;for(var t=0;e;){if(e.nodeType===8){var n=e.data;if(n==="$"||n==="$!"||n==="$?"){if(t===0)return e;t--}else n==="/$"&&t++}e=e.previousSibling}return null}var Rn=Math.random().toString(36).slice(2),qe="__reactFiber$"+Rn,dr="__reactProps$"+Rn,at="__reactContainer$"+Rn,Wo="__reactEvents$"+Rn,zd="__reactListeners$"+Rn,Dd="__reactHandles$"+Rn;function Vt(e){var t=e[qe];if(t)return t;for(var n=e.parentNode;n;){if(t=n[at]||n[qe]){if(n=t.alternate,t.child!==null||n!==null&&n.child!==null)for(e=Wu(e);e!==null;){if(n=e[qe])return n;e=Wu(e)}return t}e=n,n=e.parentNode}return null}function Sr(e){return e=e[qe]||e[at],!e||e.tag!==5&&e.tag!==6&&e.tag!==13&&e.tag!==3?null:e}function fn(e){if(e.tag===5||e.tag===6)return e.stateNode;throw Error(w(33))}function zl(e){return e[dr]||null}var Ho=[],dn=-1;function Ft(e){return{current:e}}function H(e){0>dn||(e.current=Ho[dn],Ho[dn]=null,dn--)}function A(e,t){dn++,Ho[dn]=e.current,e.current=t}var Mt={},ge=Ft(Mt),Ce=Ft(!1),Xt=Mt;function Nn(e,t){var n=e.type.contextTypes;if(!n)return Mt;var r=e.stateNode;if(r&&r.__reactInternalMemoizedUnmaskedChildContext===t)return r.__reactInternalMemoizedMaskedChildContext;var l={},o;for(o in n)l[o]=t[o];return r&&(e=e.stateNode,e.__reactInternalMemoizedUnmaskedChildContext=t,e.__reactInternalMemoizedMaskedChildContext=l),l}function Ne(e){return e=e.childContextTypes,e!=null}function cl(){H(Ce),H(ge)}function Hu(e,t,n){if(ge.current!==Mt)throw Error(w(168));A(ge,t),A(Ce,n)}function za(e,t,n){var r=e.stateNode;if(t=t.childContextTypes,typeof r.getChildContext!="function")return n;r=r.getChildContext();for(var l in r)if(!(l in t))throw Error(w(108,vf(e)||"Unknown",l));return Z({},n,r)}function fl(e){return e=(e=e.stateNode)&&e.__reactInternalMemoizedMergedChildContext||Mt,Xt=ge.current,A(ge,e),A(Ce,Ce.current),!0}function Vu(e,t,n){var r=e.stateNode;if(!r)throw Error(w(169));n?(e=za(e,t,Xt),r.__reactInternalMemoizedMergedChildContext=e,H(Ce),H(ge),A(ge,e)):H(Ce),A(Ce,n)}var lt=null,Dl=!1,uo=!1;function Da(e){lt===null?lt=[e]:lt.push(e)}function Rd(e){Dl=!0,Da(e)}function Ut(){if(!uo&&lt!==null){uo=!0;var e=0,t=F;try{var n=lt;for(F=1;e<n.length;e++){var r=n[e];do r=r(!0);while(r!==null)}lt=null,Dl=!1}catch(l){throw lt!==null&&(lt=lt.slice(e+1)),ra(ki,Ut),l}finally{F=t,uo=!1}}return null}var pn=[],hn=0,dl=null,pl=0,Oe=[],Fe=0,Zt=null,ot=1,it="";function Wt(e,t){pn[hn++]=pl,pn[hn++]=dl,dl=e,pl=t}function Ra(e,t,n){Oe[Fe++]=ot,Oe[Fe++]=it,Oe[Fe++]=Zt,Zt=e;var r=ot;e=it;var l=32-Ye(r)-1;r&=~(1<<l),n+=1;var o=32-Ye(t)+l;if(30<o){var i=l-l%5;o=(r&(1<<i)-1).toString(32),r>>=i,l-=i,ot=1<<32-Ye(t)+l|n<<l|r,it=o+e}else ot=1<<o|n<<l|r,it=e}function Ti(e){e.return!==null&&(Wt(e,1),Ra(e,1,0))}function zi(e){for(;e===dl;)dl=pn[--hn],pn[hn]=null,pl=pn[--hn],pn[hn]=null;for(;e===Zt;)Zt=Oe[--Fe],Oe[Fe]=null,it=Oe[--Fe],Oe[Fe]=null,ot=Oe[--Fe],Oe[Fe]=null}var Te=null,Le=null,Q=!1,Ke=null;function Ia(e,t){var n=Ue(5,null,null,0);n.elementType="DELETED",n.stateNode=t,n.return=e,t=e.deletions,t===null?(e.deletions=[n],e.flags|=16):t.push(n)}function Qu(e,t){switch(e.tag){case 5:var n=e.type;return t=t.nodeType!==1||n.toLowerCase()!==t.nodeName.toLowerCase()?null:t,t!==null?(e.stateNode=t,Te=e,Le=Lt(t.firstChild),!0):!1;case 6:return t=e.pendingProps===""||t.nodeType!==3?null:t,t!==null?(e.stateNode=t,Te=e,Le=null,!0):!1;case 13:return t=t.nodeType!==8?null:t,t!==null?(n=Zt!==null?{id:ot,overflow:it}:null,e.memoizedState={dehydrated:t,treeContext:n,retryLane:1073741824},n=Ue(18,null,null,0),n.stateNode=t,n.return=e,e.child=n,Te=e,Le=null,!0):!1;default:return!1}}function Vo(e){return(e.mode&1)!==0&&(e.flags&128)===0}function Qo(e){if(Q){var t=Le;if(t){var n=t;if(!Qu(e,t)){if(Vo(e))throw Error(w(418));t=Lt(n.nextSibling);var r=Te;t&&Qu(e,t)?Ia(r,n):(e.flags=e.flags&-4097|2,Q=!1,Te=e)}}else{if(Vo(e))throw Error(w(418));e.flags=e.flags&-4097|2,Q=!1,Te=e}}}function Ku(e){for(e=e.return;e!==null&&e.tag!==5&&e.tag!==3&&e.tag!==13;)e=e.return;Te=e}function Fr(e){if(e!==Te)return!1;if(!Q)return Ku(e),Q=!0,!1;var t;if((t=e.tag!==3)&&!(t=e.tag!==5)&&(t=e.type,t=t!=="head"&&t!=="body"&&!$o(e.type,e.memoizedProps)),t&&(t=Le)){if(Vo(e))throw Ma(),Error(w(418));for(;t;)Ia(e,t),t=Lt(t.nextSibling)}if(Ku(e),e.tag===13){if(e=e.memoizedState,e=e!==null?e.dehydrated:null,!e)throw Error(w(317));e:{for(e=e.nextSibling,t=0;e;){if(e.nodeType===8){var n=e.data;if(n==="/$"){if(t===0){Le=Lt(e.nextSibling);break e}t--}else n!=="$"&&n!=="$!"&&n!=="$?"||t++}e=e.nextSibling}Le=null}}else Le=Te?Lt(e.stateNode.nextSibling):null;return!0}function Ma(){for(var e=Le;e;)e=Lt(e.nextSibling)}function _n(){Le=Te=null,Q=!1}function Di(e){Ke===null?Ke=[e]:Ke.push(e)}var Id=dt.ReactCurrentBatchConfig;function $n(e,t,n){if(e=n.ref,e!==null&&typeof e!="function"&&typeof e!="object"){if(n._owner){if(n=n._owner,n){if(n.tag!==1)throw Error(w(309));var r=n.stateNode}if(!r)throw Error(w(147,e));var l=r,o=""+e;return t!==null&&t.ref!==null&&typeof t.ref=="function"&&t.ref._stringRef===o?t.ref:(t=function(i){var u=l.refs;i===null?delete u[o]:u[o]=i},t._stringRef=o,t)}if(typeof e!="string")throw Error(w(284));if(!n._owner)throw Error(w(290,e))}return e}function Ur(e,t){throw e=Object.prototype.toString.call(t),Error(w(31,e==="[object Object]"?"object with keys {"+Object.keys(t).join(", ")+"}":e))}function Yu(e){var t=e._init;return t(e._payload)}function Oa(e){function t(d,c){if(e){var p=d.deletions;p===null?(d.deletions=[c],d.flags|=16):p.push(c)}}function n(d,c){if(!e)return null;for(;c!==null;)t(d,c),c=c.sibling;return null}function r(d,c){for(d=new Map;c!==null;)c.key!==null?d.set(c.key,c):d.set(c.index,c),c=c.sibling;return d}function l(d,c){return d=Rt(d,c),d.index=0,d.sibling=null,d}function o(d,c,p){return d.index=p,e?(p=d.alternate,p!==null?(p=p.index,p<c?(d.flags|=2,c):p):(d.flags|=2,c)):(d.flags|=1048576,c)}function i(d){return e&&d.alternate===null&&(d.flags|=2),d}function u(d,c,p,y){return c===null||c.tag!==6?(c=mo(p,d.mode,y),c.return=d,c):(c=l(c,p),c.return=d,c)}function s(d,c,p,y){var E=p.type;return E===un?h(d,c,p.props.children,y,p.key):c!==null&&(c.elementType===E||typeof E=="object"&&E!==null&&E.$$typeof===yt&&Yu(E)===c.type)?(y=l(c,p.props),y.ref=$n(d,c,p),y.return=d,y):(y=el(p.type,p.key,p.props,null,d.mode,y),y.ref=$n(d,c,p),y.return=d,y)}function f(d,c,p,y){return c===null||c.tag!==4||c.stateNode.containerInfo!==p.containerInfo||c.stateNode.implementation!==p.implementation?(c=vo(p,d.mode,y),c.return=d,c):(c=l(c,p.children||[]),c.return=d,c)}function h(d,c,p,y,E){return c===null||c.tag!==7?(c=Gt(p,d.mode,y,E),c.return=d,c):(c=l(c,p),c.return=d,c)}function g(d,c,p){if(typeof c=="string"&&c!==""||typeof c=="number")return c=mo(""+c,d.mode,p),c.return=d,c;if(typeof c=="object"&&c!==null){switch(c.$$typeof){case jr:return p=el(c.type,c.key,c.props,null,d.mode,p),p.ref=$n(d,null,c),p.return=d,p;case on:return c=vo(c,d.mode,p),c.return=d,c;case yt:var y=c._init;return g(d,y(c._payload),p)}if(Vn(c)||Mn(c))return c=Gt(c,d.mode,p,null),c.return=d,c;Ur(d,c)}return null}function m(d,c,p,y){var E=c!==null?c.key:null;if(typeof p=="string"&&p!==""||typeof p=="number")return E!==null?null:u(d,c,""+p,y);if(typeof p=="object"&&p!==null){switch(p.$$typeof){case jr:return p.key===E?s(d,c,p,y):null;case on:return p.key===E?f(d,c,p,y):null;case yt:return E=p._init,m(d,c,E(p._payload),y)}if(Vn(p)||Mn(p))return E!==null?null:h(d,c,p,y,null);Ur(d,p)}return null}function x(d,c,p,y,E){if(typeof y=="string"&&y!==""||typeof y=="number")return d=d.get(p)||null,u(c,d,""+y,E);if(typeof y=="object"&&y!==null){switch(y.$$typeof){case jr:return d=d.get(y.key===null?p:y.key)||null,s(c,d,y,E);case on:return d=d.get(y.key===null?p:y.key)||null,f(c,d,y,E);case yt:var j=y._init;return x(d,c,p,j(y._payload),E)}if(Vn(y)||Mn(y))return d=d.get(p)||null,h(c,d,y,E,null);Ur(c,y)}return null}function k(d,c,p,y){for(var E=null,j=null,N=c,P=c=0,K=null;N!==null&&P<p.length;P++){N.index>P?(K=N,N=null):K=N.sibling;var R=m(d,N,p[P],y);if(R===null){N===null&&(N=K);break}e&&N&&R.alternate===null&&t(d,N),c=o(R,c,P),j===null?E=R:j.sibling=R,j=R,N=K}if(P===p.length)return n(d,N),Q&&Wt(d,P),E;if(N===null){for(;P<p.length;P++)N=g(d,p[P],y),N!==null&&(c=o(N,c,P),j===null?E=N:j.sibling=N,j=N);return Q&&Wt(d,P),E}for(N=r(d,N);P<p.length;P++)K=x(N,d,P,p[P],y),K!==null&&(e&&K.alternate!==null&&N.delete(K.key===null?P:K.key),c=o(K,c,P),j===null?E=K:j.sibling=K,j=K);return e&&N.forEach(function(Ie){return t(d,Ie)}),Q&&Wt(d,P),E}function S(d,c,p,y){var E=Mn(p);if(typeof E!="function")throw Error(w(150));if(p=E.call(p),p==null)throw Error(w(151));for(var j=E=null,N=c,P=c=0,K=null,R=p.next();N!==null&&!R.done;P++,R=p.next()){N.index>P?(K=N,N=null):K=N.sibling;var Ie=m(d,N,R.value,y);if(Ie===null){N===null&&(N=K);break}e&&N&&Ie.alternate===null&&t(d,N),c=o(Ie,c,P),j===null?E=Ie:j.sibling=Ie,j=Ie,N=K}if(R.done)return n(d,N),Q&&Wt(d,P),E;if(N===null){for(;!R.done;P++,R=p.next())R=g(d,R.value,y),R!==null&&(c=o(R,c,P),j===null?E=R:j.sibling=R,j=R);return Q&&Wt(d,P),E}for(N=r(d,N);!R.done;P++,R=p.next())R=x(N,d,P,R.value,y),R!==null&&(e&&R.alternate!==null&&N.delete(R.key===null?P:R.key),c=o(R,c,P),j===null?E=R:j.sibling=R,j=R);return e&&N.forEach(function(pt){return t(d,pt)}),Q&&Wt(d,P),E}function O(d,c,p,y){if(typeof p=="object"&&p!==null&&p.type===un&&p.key===null&&(p=p.props.children),typeof p=="object"&&p!==null){switch(p.$$typeof){case jr:e:{for(var E=p.key,j=c;j!==null;){if(j.key===E){if(E=p.type,E===un){if(j.tag===7){n(d,j.sibling),c=l(j,p.props.children),c.return=d,d=c;break e}}else if(j.elementType===E||typeof E=="object"&&E!==null&&E.$$typeof===yt&&Yu(E)===j.type){n(d,j.sibling),c=l(j,p.props),c.ref=$n(d,j,p),c.return=d,d=c;break e}n(d,j);break}else t(d,j);j=j.sibling}p.type===un?(c=Gt(p.props.children,d.mode,y,p.key),c.return=d,d=c):(y=el(p.type,p.key,p.props,null,d.mode,y),y.ref=$n(d,c,p),y.return=d,d=y)}return i(d);case on:e:{for(j=p.key;c!==null;){if(c.key===j)if(c.tag===4&&c.stateNode.containerInfo===p.containerInfo&&c.stateNode.implementation===p.implementation){n(d,c.sibling),c=l(c,p.children||[]),c.return=d,d=c;break e}else{n(d,c);break}else t(d,c);c=c.sibling}c=vo(p,d.mode,y),c.return=d,d=c}return i(d);case yt:return j=p._init,O(d,c,j(p._payload),y)}if(Vn(p))return k(d,c,p,y);if(Mn(p))return S(d,c,p,y);Ur(d,p)}return typeof p=="string"&&p!==""||typeof p=="number"?(p=""+p,c!==null&&c.tag===6?(n(d,c.sibling),c=l(c,p),c.return=d,d=c):(n(d,c),c=mo(p,d.mode,y),c.return=d,d=c),i(d)):n(d,c)}return O}var jn=Oa(!0),Fa=Oa(!1),hl=Ft(null),ml=null,mn=null,Ri=null;function Ii(){Ri=mn=ml=null}function Mi(e){var t=hl.current;H(hl),e._currentValue=t}function Ko(e,t,n){for(;e!==null;){var r=e.alternate;if((e.childLanes&t)!==t?(e.childLanes|=t,r!==null&&(r.childLanes|=t)):r!==null&&(r.childLanes&t)!==t&&(r.childLanes|=t),e===n)break;e=e.return}}function Sn(e,t){ml=e,Ri=mn=null,e=e.dependencies,e!==null&&e.firstContext!==null&&(e.lanes&t&&(Ee=!0),e.firstContext=null)}function $e(e){var t=e._currentValue;if(Ri!==e)if(e={context:e,memoizedValue:t,next:null},mn===null){if(ml===null)throw Error(w(308));mn=e,ml.dependencies={lanes:0,firstContext:e}}else mn=mn.next=e;return t}var Qt=null;function Oi(e){Qt===null?Qt=[e]:Qt.push(e)}function Ua(e,t,n,r){var l=t.interleaved;return l===null?(n.next=n,Oi(t)):(n.next=l.next,l.next=n),t.interleaved=n,ct(e,r)}function ct(e,t){e.lanes|=t;var n=e.alternate;for(n!==null&&(n.lanes|=t),n=e,e=e.return;e!==null;)e.childLanes|=t,n=e.alternate,n!==null&&(n.childLanes|=t),n=e,e=e.return;return n.tag===3?n.stateNode:null}var wt=!1;function Fi(e){e.updateQueue={baseState:e.memoizedState,firstBaseUpdate:null,lastBaseUpdate:null,shared:{pending:null,interleaved:null,lanes:0},effects:null}}function Aa(e,t){e=e.updateQueue,t.updateQueue===e&&(t.updateQueue={baseState:e.baseState,firstBaseUpdate:e.firstBaseUpdate,lastBaseUpdate:e.lastBaseUpdate,shared:e.shared,effects:e.effects})}function ut(e,t){return{eventTime:e,lane:t,tag:0,payload:null,callback:null,next:null}}function Tt(e,t,n){var r=e.updateQueue;if(r===null)return null;if(r=r.shared,M&2){var l=r.pending;return l===null?t.next=t:(t.next=l.next,l.next=t),r.pending=t,ct(e,n)}return l=r.interleaved,l===null?(t.next=t,Oi(r)):(t.next=l.next,l.next=t),r.interleaved=t,ct(e,n)}function Gr(e,t,n){if(t=t.updateQueue,t!==null&&(t=t.shared,(n&4194240)!==0)){var r=t.lanes;r&=e.pendingLanes,n|=r,t.lanes=n,Si(e,n)}}function Gu(e,t){var n=e.updateQueue,r=e.alternate;if(r!==null&&(r=r.updateQueue,n===r)){var l=null,o=null;if(n=n.firstBaseUpdate,n!==null){do{var i={eventTime:n.eventTime,lane:n.lane,tag:n.tag,payload:n.payload,callback:n.callback,next:null};o===null?l=o=i:o=o.next=i,n=n.next}while(n!==null);o===null?l=o=t:o=o.next=t}else l=o=t;n={baseState:r.baseState,firstBaseUpdate:l,lastBaseUpdate:o,shared:r.shared,effects:r.effects},e.updateQueue=n;return}e=n.lastBaseUpdate,e===null?n.firstBaseUpdate=t:e.next=t,n.lastBaseUpdate=t}function vl(e,t,n,r){var l=e.updateQueue;wt=!1;var o=l.firstBaseUpdate,i=l.lastBaseUpdate,u=l.shared.pending;if(u!==null){l.shared.pending=null;var s=u,f=s.next;s.next=null,i===null?o=f:i.next=f,i=s;var h=e.alternate;h!==null&&(h=h.updateQueue,u=h.lastBaseUpdate,u!==i&&(u===null?h.firstBaseUpdate=f:u.next=f,h.lastBaseUpdate=s))}if(o!==null){var g=l.baseState;i=0,h=f=s=null,u=o;do{var m=u.lane,x=u.eventTime;if((r&m)===m){h!==null&&(h=h.next={eventTime:x,lane:0,tag:u.tag,payload:u.payload,callback:u.callback,next:null});e:{var k=e,S=u;switch(m=t,x=n,S.tag){case 1:if(k=S.payload,typeof k=="function"){g=k.call(x,g,m);break e}g=k;break e;case 3:k.flags=k.flags&-65537|128;case 0:if(k=S.payload,m=typeof k=="function"?k.call(x,g,m):k,m==null)break e;g=Z({},g,m);break e;case 2:wt=!0}}u.callback!==null&&u.lane!==0&&(e.flags|=64,m=l.effects,m===null?l.effects=[u]:m.push(u))}else x={eventTime:x,lane:m,tag:u.tag,payload:u.payload,callback:u.callback,next:null},h===null?(f=h=x,s=g):h=h.next=x,i|=m;if(u=u.next,u===null){if(u=l.shared.pending,u===null)break;m=u,u=m.next,m.next=null,l.lastBaseUpdate=m,l.shared.pending=null}}while(!0);if(h===null&&(s=g),l.baseState=s,l.firstBaseUpdate=f,l.lastBaseUpdate=h,t=l.shared.interleaved,t!==null){l=t;do i|=l.lane,l=l.next;while(l!==t)}else o===null&&(l.shared.lanes=0);qt|=i,e.lanes=i,e.memoizedState=g}}function Xu(e,t,n){if(e=t.effects,t.effects=null,e!==null)for(t=0;t<e.length;t++){var r=e[t],l=r.callback;if(l!==null){if(r.callback=null,r=n,typeof l!="function")throw Error(w(191,l));l.call(r)}}}var Er={},et=Ft(Er),pr=Ft(Er),hr=Ft(Er);function Kt(e){if(e===Er)throw Error(w(174));return e}function Ui(e,t){switch(A(hr,t),A(pr,e),A(et,Er),e=t.nodeType,e){case 9:case 11:t=(t=t.documentElement)?t.namespaceURI:_o(null,"");break;default:e=e===8?t.parentNode:t,t=e.namespaceURI||null,e=e.tagName,t=_o(t,e)}H(et),A(et,t)}function Pn(){H(et),H(pr),H(hr)}function $a(e){Kt(hr.current);var t=Kt(et.current),n=_o(t,e.type);t!==n&&(A(pr,e),A(et,n))}function Ai(e){pr.current===e&&(H(et),H(pr))}var G=Ft(0);function gl(e){for(var t=e;t!==null;){if(t.tag===13){var n=t.memoizedState;if(n!==null&&(n=n.dehydrated,n===null||n.data==="$?"||n.data==="$!"))return t}else if(t.tag===19&&t.memoizedProps.revealOrder!==void 0){if(t.flags&128)return t}else if(t.child!==null){t.child.return=t,t=t.child;continue}if(t===e)break;for(;t.sibling===null;){if(t.return===null||t.return===e)return null;t=t.return}t.sibling.return=t.return,t=t.sibling}return null}var so=[];function $i(){for(var e=0;e<so.length;e++)so[e]._workInProgressVersionPrimary=null;so.length=0}var Xr=dt.ReactCurrentDispatcher,ao=dt.ReactCurrentBatchConfig,Jt=0,X=null,re=null,ie=null,yl=!1,qn=!1,mr=0,Md=0;function pe(){throw Error(w(321))}function Bi(e,t){if(t===null)return!1;for(var n=0;n<t.length&&n<e.length;n++)if(!Xe(e[n],t[n]))return!1;return!0}function Wi(e,t,n,r,l,o){if(Jt=o,X=t,t.memoizedState=null,t.updateQueue=null,t.lanes=0,Xr.current=e===null||e.memoizedState===null?Ad:$d,e=n(r,l),qn){o=0;do{if(qn=!1,mr=0,25<=o)throw Error(w(301));o+=1,ie=re=null,t.updateQueue=null,Xr.current=Bd,e=n(r,l)}while(qn)}if(Xr.current=wl,t=re!==null&&re.next!==null,Jt=0,ie=re=X=null,yl=!1,t)throw Error(w(300));return e}function Hi(){var e=mr!==0;return mr=0,e}function Je(){var e={memoizedState:null,baseState:null,baseQueue:null,queue:null,next:null};return ie===null?X.memoizedState=ie=e:ie=ie.next=e,ie}function Be(){if(re===null){var e=X.alternate;e=e!==null?e.memoizedState:null}else e=re.next;var t=ie===null?X.memoizedState:ie.next;if(t!==null)ie=t,re=e;else{if(e===null)throw Error(w(310));re=e,e={memoizedState:re.memoizedState,baseState:re.baseState,baseQueue:re.baseQueue,queue:re.queue,next:null},ie===null?X.memoizedState=ie=e:ie=ie.next=e}return ie}function vr(e,t){return typeof t=="function"?t(e):t}function co(e){var t=Be(),n=t.queue;if(n===null)throw Error(w(311));n.lastRenderedReducer=e;var r=re,l=r.baseQueue,o=n.pending;if(o!==null){if(l!==null){var i=l.next;l.next=o.next,o.next=i}r.baseQueue=l=o,n.pending=null}if(l!==null){o=l.next,r=r.baseState;var u=i=null,s=null,f=o;do{var h=f.lane;if((Jt&h)===h)s!==null&&(s=s.next={lane:0,action:f.action,hasEagerState:f.hasEagerState,eagerState:f.eagerState,next:null}),r=f.hasEagerState?f.eagerState:e(r,f.action);else{var g={lane:h,action:f.action,hasEagerState:f.hasEagerState,eagerState:f.eagerState,next:null};s===null?(u=s=g,i=r):s=s.next=g,X.lanes|=h,qt|=h}f=f.next}while(f!==null&&f!==o);s===null?i=r:s.next=u,Xe(r,t.memoizedState)||(Ee=!0),t.memoizedState=r,t.baseState=i,t.baseQueue=s,n.lastRenderedState=r}if(e=n.interleaved,e!==null){l=e;do o=l.lane,X.lanes|=o,qt|=o,l=l.next;while(l!==e)}else l===null&&(n.lanes=0);return[t.memoizedState,n.dispatch]}function fo(e){var t=Be(),n=t.queue;if(n===null)throw Error(w(311));n.lastRenderedReducer=e;var r=n.dispatch,l=n.pending,o=t.memoizedState;if(l!==null){n.pending=null;var i=l=l.next;do o=e(o,i.action),i=i.next;while(i!==l);Xe(o,t.memoizedState)||(Ee=!0),t.memoizedState=o,t.baseQueue===null&&(t.baseState=o),n.lastRenderedState=o}return[o,r]}function Ba(){}function Wa(e,t){var n=X,r=Be(),l=t(),o=!Xe(r.memoizedState,l);if(o&&(r.memoizedState=l,Ee=!0),r=r.queue,Vi(Qa.bind(null,n,r,e),[e]),r.getSnapshot!==t||o||ie!==null&&ie.memoizedState.tag&1){if(n.flags|=2048,gr(9,Va.bind(null,n,r,l,t),void 0,null),ue===null)throw Error(w(349));Jt&30||Ha(n,t,l)}return l}function Ha(e,t,n){e.flags|=16384,e={getSnapshot:t,value:n},t=X.updateQueue,t===null?(t={lastEffect:null,stores:null},X.updateQueue=t,t.stores=[e]):(n=t.stores,n===null?t.stores=[e]:n.push(e))}function Va(e,t,n,r){t.value=n,t.getSnapshot=r,Ka(t)&&Ya(e)}function Qa(e,t,n){return n(function(){Ka(t)&&Ya(e)})}function Ka(e){var t=e.getSnapshot;e=e.value;try{var n=t();return!Xe(e,n)}catch{return!0}}function Ya(e){var t=ct(e,1);t!==null&&Ge(t,e,1,-1)}function Zu(e){var t=Je();return typeof e=="function"&&(e=e()),t.memoizedState=t.baseState=e,e={pending:null,interleaved:null,lanes:0,dispatch:null,lastRenderedReducer:vr,lastRenderedState:e},t.queue=e,e=e.dispatch=Ud.bind(null,X,e),[t.memoizedState,e]}function gr(e,t,n,r){return e={tag:e,create:t,destroy:n,deps:r,next:null},t=X.updateQueue,t===null?(t={lastEffect:null,stores:null},X.updateQueue=t,t.lastEffect=e.next=e):(n=t.lastEffect,n===null?t.lastEffect=e.next=e:(r=n.next,n.next=e,e.next=r,t.lastEffect=e)),e}function Ga(){return Be().memoizedState}function Zr(e,t,n,r){var l=Je();X.flags|=e,l.memoizedState=gr(1|t,n,void 0,r===void 0?null:r)}function Rl(e,t,n,r){var l=Be();r=r===void 0?null:r;var o=void 0;if(re!==null){var i=re.memoizedState;if(o=i.destroy,r!==null&&Bi(r,i.deps)){l.memoizedState=gr(t,n,o,r);return}}X.flags|=e,l.memoizedState=gr(1|t,n,o,r)}function Ju(e,t){return Zr(8390656,8,e,t)}function Vi(e,t){return Rl(2048,8,e,t)}function Xa(e,t){return Rl(4,2,e,t)}function Za(e,t){return Rl(4,4,e,t)}function Ja(e,t){if(typeof t=="function")return e=e(),t(e),function(){t(null)};if(t!=null)return e=e(),t.current=e,function(){t.current=null}}function qa(e,t,n){return n=n!=null?n.concat([e]):null,Rl(4,4,Ja.bind(null,t,e),n)}function Qi(){}function ba(e,t){var n=Be();t=t===void 0?null:t;var r=n.memoizedState;return r!==null&&t!==null&&Bi(t,r[1])?r[0]:(n.memoizedState=[e,t],e)}function ec(e,t){var n=Be();t=t===void 0?null:t;var r=n.memoizedState;return r!==null&&t!==null&&Bi(t,r[1])?r[0]:(e=e(),n.memoizedState=[e,t],e)}function tc(e,t,n){return Jt&21?(Xe(n,t)||(n=ia(),X.lanes|=n,qt|=n,e.baseState=!0),t):(e.baseState&&(e.baseState=!1,Ee=!0),e.memoizedState=n)}function Od(e,t){var n=F;F=n!==0&&4>n?n:4,e(!0);var r=ao.transition;ao.transition={};try{e(!1),t()}finally{F=n,ao.transition=r}}function nc(){return Be().memoizedState}function Fd(e,t,n){var r=Dt(e);if(n={lane:r,action:n,hasEagerState:!1,eagerState:null,next:null},rc(e))lc(t,n);else if(n=Ua(e,t,n,r),n!==null){var l=we();Ge(n,e,r,l),oc(n,t,r)}}function Ud(e,t,n){var r=Dt(e),l={lane:r,action:n,hasEagerState:!1,eagerState:null,next:null};if(rc(e))lc(t,l);else{var o=e.alternate;if(e.lanes===0&&(o===null||o.lanes===0)&&(o=t.lastRenderedReducer,o!==null))try{var i=t.lastRenderedState,u=o(i,n);if(l.hasEagerState=!0,l.eagerState=u,Xe(u,i)){var s=t.interleaved;s===null?(l.next=l,Oi(t)):(l.next=s.next,s.next=l),t.interleaved=l;return}}catch{}finally{}n=Ua(e,t,l,r),n!==null&&(l=we(),Ge(n,e,r,l),oc(n,t,r))}}function rc(e){var t=e.alternate;return e===X||t!==null&&t===X}function lc(e,t){qn=yl=!0;var n=e.pending;n===null?t.next=t:(t.next=n.next,n.next=t),e.pending=t}function oc(e,t,n){if(n&4194240){var r=t.lanes;r&=e.pendingLanes,n|=r,t.lanes=n,Si(e,n)}}var wl={readContext:$e,useCallback:pe,useContext:pe,useEffect:pe,useImperativeHandle:pe,useInsertionEffect:pe,useLayoutEffect:pe,useMemo:pe,useReducer:pe,useRef:pe,useState:pe,useDebugValue:pe,useDeferredValue:pe,useTransition:pe,useMutableSource:pe,useSyncExternalStore:pe,useId:pe,unstable_isNewReconciler:!1},Ad={readContext:$e,useCallback:function(e,t){return Je().memoizedState=[e,t===void 0?null:t],e},useContext:$e,useEffect:Ju,useImperativeHandle:function(e,t,n){return n=n!=null?n.concat([e]):null,Zr(4194308,4,Ja.bind(null,t,e),n)},useLayoutEffect:function(e,t){return Zr(4194308,4,e,t)},useInsertionEffect:function(e,t){return Zr(4,2,e,t)},useMemo:function(e,t){var n=Je();return t=t===void 0?null:t,e=e(),n.memoizedState=[e,t],e},useReducer:function(e,t,n){var r=Je();return t=n!==void 0?n(t):t,r.memoizedState=r.baseState=t,e={pending:null,interleaved:null,lanes:0,dispatch:null,lastRenderedReducer:e,lastRenderedState:t},r.queue=e,e=e.dispatch=Fd.bind(null,X,e),[r.memoizedState,e]},useRef:function(e){var t=Je();return e={current:e},t.memoizedState=e},useState:Zu,useDebugValue:Qi,useDeferredValue:function(e){return Je().memoizedState=e},useTransition:function(){var e=Zu(!1),t=e[0];return e=Od.bind(null,e[1]),Je().memoizedState=e,[t,e]},useMutableSource:function(){},useSyncExternalStore:function(e,t,n){var r=X,l=Je();if(Q){if(n===void 0)throw Error(w(407));n=n()}else{if(n=t(),ue===null)throw Error(w(349));Jt&30||Ha(r,t,n)}l.memoizedState=n;var o={value:n,getSnapshot:t};return l.queue=o,Ju(Qa.bind(null,r,o,e),[e]),r.flags|=2048,gr(9,Va.bind(null,r,o,n,t),void 0,null),n},useId:function(){var e=Je(),t=ue.identifierPrefix;if(Q){var n=it,r=ot;n=(r&~(1<<32-Ye(r)-1)).toString(32)+n,t=":"+t+"R"+n,n=mr++,0<n&&(t+="H"+n.toString(32)),t+=":"}else n=Md++,t=":"+t+"r"+n.toString(32)+":";return e.memoizedState=t},unstable_isNewReconciler:!1},$d={readContext:$e,useCallback:ba,useContext:$e,useEffect:Vi,useImperativeHandle:qa,useInsertionEffect:Xa,useLayoutEffect:Za,useMemo:ec,useReducer:co,useRef:Ga,useState:function(){return co(vr)},useDebugValue:Qi,useDeferredValue:function(e){var t=Be();return tc(t,re.memoizedState,e)},useTransition:function(){var e=co(vr)[0],t=Be().memoizedState;return[e,t]},useMutableSource:Ba,useSyncExternalStore:Wa,useId:nc,unstable_isNewReconciler:!1},Bd={readContext:$e,useCallback:ba,useContext:$e,useEffect:Vi,useImperativeHandle:qa,useInsertionEffect:Xa,useLayoutEffect:Za,useMemo:ec,useReducer:fo,useRef:Ga,useState:function(){return fo(vr)},useDebugValue:Qi,useDeferredValue:function(e){var t=Be();return re===null?t.memoizedState=e:tc(t,re.memoizedState,e)},useTransition:function(){var e=fo(vr)[0],t=Be().memoizedState;return[e,t]},useMutableSource:Ba,useSyncExternalStore:Wa,useId:nc,unstable_isNewReconciler:!1};function Ve(e,t){if(e&&e.defaultProps){t=Z({},t),e=e.defaultProps;for(var n in e)t[n]===void 0&&(t[n]=e[n]);return t}return t}function Yo(e,t,n,r){t=e.memoizedState,n=n(r,t),n=n==null?t:Z({},t,n),e.memoizedState=n,e.lanes===0&&(e.updateQueue.baseState=n)}var Il={isMounted:function(e){return(e=e._reactInternals)?tn(e)===e:!1},enqueueSetState:function(e,t,n){e=e._reactInternals;var r=we(),l=Dt(e),o=ut(r,l);o.payload=t,n!=null&&(o.callback=n),t=Tt(e,o,l),t!==null&&(Ge(t,e,l,r),Gr(t,e,l))},enqueueReplaceState:function(e,t,n){e=e._reactInternals;var r=we(),l=Dt(e),o=ut(r,l);o.tag=1,o.payload=t,n!=null&&(o.callback=n),t=Tt(e,o,l),t!==null&&(Ge(t,e,l,r),Gr(t,e,l))},enqueueForceUpdate:function(e,t){e=e._reactInternals;var n=we(),r=Dt(e),l=ut(n,r);l.tag=2,t!=null&&(l.callback=t),t=Tt(e,l,r),t!==null&&(Ge(t,e,r,n),Gr(t,e,r))}};function qu(e,t,n,r,l,o,i){return e=e.stateNode,typeof e.shouldComponentUpdate=="function"?e.shouldComponentUpdate(r,o,i):t.prototype&&t.prototype.isPureReactComponent?!ar(n,r)||!ar(l,o):!0}function ic(e,t,n){var r=!1,l=Mt,o=t.contextType;return typeof o=="object"&&o!==null?o=$e(o):(l=Ne(t)?Xt:ge.current,r=t.contextTypes,o=(r=r!=null)?Nn(e,l):Mt),t=new t(n,o),e.memoizedState=t.state!==null&&t.state!==void 0?t.state:null,t.updater=Il,e.stateNode=t,t._reactInternals=e,r&&(e=e.stateNode,e.__reactInternalMemoizedUnmaskedChildContext=l,e.__reactInternalMemoizedMaskedChildContext=o),t}function bu(e,t,n,r){e=t.state,typeof t.componentWillReceiveProps=="function"&&t.componentWillReceiveProps(n,r),typeof t.UNSAFE_componentWillReceiveProps=="function"&&t.UNSAFE_componentWillReceiveProps(n,r),t.state!==e&&Il.enqueueReplaceState(t,t.state,null)}function Go(e,t,n,r){var l=e.stateNode;l.props=n,l.state=e.memoizedState,l.refs={},Fi(e);var o=t.contextType;typeof o=="object"&&o!==null?l.context=$e(o):(o=Ne(t)?Xt:ge.current,l.context=Nn(e,o)),l.state=e.memoizedState,o=t.getDerivedStateFromProps,typeof o=="function"&&(Yo(e,t,o,n),l.state=e.memoizedState),typeof t.getDerivedStateFromProps=="function"||typeof l.getSnapshotBeforeUpdate=="function"||typeof l.UNSAFE_componentWillMount!="function"&&typeof l.componentWillMount!="function"||(t=l.state,typeof l.componentWillMount=="function"&&l.componentWillMount(),typeof l.UNSAFE_componentWillMount=="function"&&l.UNSAFE_componentWillMount(),t!==l.state&&Il.enqueueReplaceState(l,l.state,null),vl(e,n,l,r),l.state=e.memoizedState),typeof l.componentDidMount=="function"&&(e.flags|=4194308)}function Ln(e,t){try{var n="",r=t;do n+=mf(r),r=r.return;while(r);var l=n}catch(o){l=`
-Error generating stack: `+o.message+`
-`+o.stack}return{value:e,source:t,stack:l,digest:null}}function po(e,t,n){return{value:e,source:null,stack:n??null,digest:t??null}}function Xo(e,t){try{console.error(t.value)}catch(n){setTimeout(function(){throw n})}}var Wd=typeof WeakMap=="function"?WeakMap:Map;function uc(e,t,n){n=ut(-1,n),n.tag=3,n.payload={element:null};var r=t.value;return n.callback=function(){kl||(kl=!0,oi=r),Xo(e,t)},n}function sc(e,t,n){n=ut(-1,n),n.tag=3;var r=e.type.getDerivedStateFromError;if(typeof r=="function"){var l=t.value;n.payload=function(){return r(l)},n.callback=function(){Xo(e,t)}}var o=e.stateNode;return o!==null&&typeof o.componentDidCatch=="function"&&(n.callback=function(){Xo(e,t),typeof r!="function"&&(zt===null?zt=new Set([this]):zt.add(this));var i=t.stack;this.componentDidCatch(t.value,{componentStack:i!==null?i:""})}),n}function es(e,t,n){var r=e.pingCache;if(r===null){r=e.pingCache=new Wd;var l=new Set;r.set(t,l)}else l=r.get(t),l===void 0&&(l=new Set,r.set(t,l));l.has(n)||(l.add(n),e=np.bind(null,e,t,n),t.then(e,e))}function ts(e){do{var t;if((t=e.tag===13)&&(t=e.memoizedState,t=t!==null?t.dehydrated!==null:!0),t)return e;e=e.return}while(e!==null);return null}function ns(e,t,n,r,l){return e.mode&1?(e.flags|=65536,e.lanes=l,e):(e===t?e.flags|=65536:(e.flags|=128,n.flags|=131072,n.flags&=-52805,n.tag===1&&(n.alternate===null?n.tag=17:(t=ut(-1,1),t.tag=2,Tt(n,t,1))),n.lanes|=1),e)}var Hd=dt.ReactCurrentOwner,Ee=!1;function ye(e,t,n,r){t.child=e===null?Fa(t,null,n,r):jn(t,e.child,n,r)}function rs(e,t,n,r,l){n=n.render;var o=t.ref;return Sn(t,l),r=Wi(e,t,n,r,o,l),n=Hi(),e!==null&&!Ee?(t.updateQueue=e.updateQueue,t.flags&=-2053,e.lanes&=~l,ft(e,t,l)):(Q&&n&&Ti(t),t.flags|=1,ye(e,t,r,l),t.child)}function ls(e,t,n,r,l){if(e===null){var o=n.type;return typeof o=="function"&&!bi(o)&&o.defaultProps===void 0&&n.compare===null&&n.defaultProps===void 0?(t.tag=15,t.type=o,ac(e,t,o,r,l)):(e=el(n.type,null,r,t,t.mode,l),e.ref=t.ref,e.return=t,t.child=e)}if(o=e.child,!(e.lanes&l)){var i=o.memoizedProps;if(n=n.compare,n=n!==null?n:ar,n(i,r)&&e.ref===t.ref)return ft(e,t,l)}return t.flags|=1,e=Rt(o,r),e.ref=t.ref,e.return=t,t.child=e}function ac(e,t,n,r,l){if(e!==null){var o=e.memoizedProps;if(ar(o,r)&&e.ref===t.ref)if(Ee=!1,t.pendingProps=r=o,(e.lanes&l)!==0)e.flags&131072&&(Ee=!0);else return t.lanes=e.lanes,ft(e,t,l)}return Zo(e,t,n,r,l)}function cc(e,t,n){var r=t.pendingProps,l=r.children,o=e!==null?e.memoizedState:null;if(r.mode==="hidden")if(!(t.mode&1))t.memoizedState={baseLanes:0,cachePool:null,transitions:null},A(gn,Pe),Pe|=n;else{if(!(n&1073741824))return e=o!==null?o.baseLanes|n:n,t.lanes=t.childLanes=1073741824,t.memoizedState={baseLanes:e,cachePool:null,transitions:null},t.updateQueue=null,A(gn,Pe),Pe|=e,null;t.memoizedState={baseLanes:0,cachePool:null,transitions:null},r=o!==null?o.baseLanes:n,A(gn,Pe),Pe|=r}else o!==null?(r=o.baseLanes|n,t.memoizedState=null):r=n,A(gn,Pe),Pe|=r;return ye(e,t,l,n),t.child}function fc(e,t){var n=t.ref;(e===null&&n!==null||e!==null&&e.ref!==n)&&(t.flags|=512,t.flags|=2097152)}function Zo(e,t,n,r,l){var o=Ne(n)?Xt:ge.current;return o=Nn(t,o),Sn(t,l),n=Wi(e,t,n,r,o,l),r=Hi(),e!==null&&!Ee?(t.updateQueue=e.updateQueue,t.flags&=-2053,e.lanes&=~l,ft(e,t,l)):(Q&&r&&Ti(t),t.flags|=1,ye(e,t,n,l),t.child)}function os(e,t,n,r,l){if(Ne(n)){var o=!0;fl(t)}else o=!1;if(Sn(t,l),t.stateNode===null)Jr(e,t),ic(t,n,r),Go(t,n,r,l),r=!0;else if(e===null){var i=t.stateNode,u=t.memoizedProps;i.props=u;var s=i.context,f=n.contextType;typeof f=="object"&&f!==null?f=$e(f):(f=Ne(n)?Xt:ge.current,f=Nn(t,f));var h=n.getDerivedStateFromProps,g=typeof h=="function"||typeof i.getSnapshotBeforeUpdate=="function";g||typeof i.UNSAFE_componentWillReceiveProps!="function"&&typeof i.componentWillReceiveProps!="function"||(u!==r||s!==f)&&bu(t,i,r,f),wt=!1;var m=t.memoizedState;i.state=m,vl(t,r,i,l),s=t.memoizedState,u!==r||m!==s||Ce.current||wt?(typeof h=="function"&&(Yo(t,n,h,r),s=t.memoizedState),(u=wt||qu(t,n,u,r,m,s,f))?(g||typeof i.UNSAFE_componentWillMount!="function"&&typeof i.componentWillMount!="function"||(typeof i.componentWillMount=="function"&&i.componentWillMount(),typeof i.UNSAFE_componentWillMount=="function"&&i.UNSAFE_componentWillMount()),typeof i.componentDidMount=="function"&&(t.flags|=4194308)):(typeof i.componentDidMount=="function"&&(t.flags|=4194308),t.memoizedProps=r,t.memoizedState=s),i.props=r,i.state=s,i.context=f,r=u):(typeof i.componentDidMount=="function"&&(t.flags|=4194308),r=!1)}else{i=t.stateNode,Aa(e,t),u=t.memoizedProps,f=t.type===t.elementType?u:Ve(t.type,u),i.props=f,g=t.pendingProps,m=i.context,s=n.contextType,typeof s=="object"&&s!==null?s=$e(s):(s=Ne(n)?Xt:ge.current,s=Nn(t,s));var x=n.getDerivedStateFromProps;(h=typeof x=="function"||typeof i.getSnapshotBeforeUpdate=="function")||typeof i.UNSAFE_componentWillReceiveProps!="function"&&typeof i.componentWillReceiveProps!="function"||(u!==g||m!==s)&&bu(t,i,r,s),wt=!1,m=t.memoizedState,i.state=m,vl(t,r,i,l);var k=t.memoizedState;u!==g||m!==k||Ce.current||wt?(typeof x=="function"&&(Yo(t,n,x,r),k=t.memoizedState),(f=wt||qu(t,n,f,r,m,k,s)||!1)?(h||typeof i.UNSAFE_componentWillUpdate!="function"&&typeof i.componentWillUpdate!="function"||(typeof i.componentWillUpdate=="function"&&i.componentWillUpdate(r,k,s),typeof i.UNSAFE_componentWillUpdate=="function"&&i.UNSAFE_componentWillUpdate(r,k,s)),typeof i.componentDidUpdate=="function"&&(t.flags|=4),typeof i.getSnapshotBeforeUpdate=="function"&&(t.flags|=1024)):(typeof i.componentDidUpdate!="function"||u===e.memoizedProps&&m===e.memoizedState||(t.flags|=4),typeof i.getSnapshotBeforeUpdate!="function"||u===e.memoizedProps&&m===e.memoizedState||(t.flags|=1024),t.memoizedProps=r,t.memoizedState=k),i.props=r,i.state=k,i.context=s,r=f):(typeof i.componentDidUpdate!="function"||u===e.memoizedProps&&m===e.memoizedState||(t.flags|=4),typeof i.getSnapshotBeforeUpdate!="function"||u===e.memoizedProps&&m===e.memoizedState||(t.flags|=1024),r=!1)}return Jo(e,t,n,r,o,l)}function Jo(e,t,n,r,l,o){fc(e,t);var i=(t.flags&128)!==0;if(!r&&!i)return l&&Vu(t,n,!1),ft(e,t,o);r=t.stateNode,Hd.current=t;var u=i&&typeof n.getDerivedStateFromError!="function"?null:r.render();return t.flags|=1,e!==null&&i?(t.child=jn(t,e.child,null,o),t.child=jn(t,null,u,o)):ye(e,t,u,o),t.memoizedState=r.state,l&&Vu(t,n,!0),t.child}function dc(e){var t=e.stateNode;t.pendingContext?Hu(e,t.pendingContext,t.pendingContext!==t.context):t.context&&Hu(e,t.context,!1),Ui(e,t.containerInfo)}function is(e,t,n,r,l){return _n(),Di(l),t.flags|=256,ye(e,t,n,r),t.child}var qo={dehydrated:null,treeContext:null,retryLane:0};function bo(e){return{baseLanes:e,cachePool:null,transitions:null}}function pc(e,t,n){var r=t.pendingProps,l=G.current,o=!1,i=(t.flags&128)!==0,u;if((u=i)||(u=e!==null&&e.memoizedState===null?!1:(l&2)!==0),u?(o=!0,t.flags&=-129):(e===null||e.memoizedState!==null)&&(l|=1),A(G,l&1),e===null)return Qo(t),e=t.memoizedState,e!==null&&(e=e.dehydrated,e!==null)?(t.mode&1?e.data==="$!"?t.lanes=8:t.lanes=1073741824:t.lanes=1,null):(i=r.children,e=r.fallback,o?(r=t.mode,o=t.child,i={mode:"hidden",children:i},!(r&1)&&o!==null?(o.childLanes=0,o.pendingProps=i):o=Fl(i,r,0,null),e=Gt(e,r,n,null),o.return=t,e.return=t,o.sibling=e,t.child=o,t.child.memoizedState=bo(n),t.memoizedState=qo,e):Ki(t,i));if(l=e.memoizedState,l!==null&&(u=l.dehydrated,u!==null))return Vd(e,t,i,r,u,l,n);if(o){o=r.fallback,i=t.mode,l=e.child,u=l.sibling;var s={mode:"hidden",children:r.children};return!(i&1)&&t.child!==l?(r=t.child,r.childLanes=0,r.pendingProps=s,t.deletions=null):(r=Rt(l,s),r.subtreeFlags=l.subtreeFlags&14680064),u!==null?o=Rt(u,o):(o=Gt(o,i,n,null),o.flags|=2),o.return=t,r.return=t,r.sibling=o,t.child=r,r=o,o=t.child,i=e.child.memoizedState,i=i===null?bo(n):{baseLanes:i.baseLanes|n,cachePool:null,transitions:i.transitions},o.memoizedState=i,o.childLanes=e.childLanes&~n,t.memoizedState=qo,r}return o=e.child,e=o.sibling,r=Rt(o,{mode:"visible",children:r.children}),!(t.mode&1)&&(r.lanes=n),r.return=t,r.sibling=null,e!==null&&(n=t.deletions,n===null?(t.deletions=[e],t.flags|=16):n.push(e)),t.child=r,t.memoizedState=null,r}function Ki(e,t){return t=Fl({mode:"visible",children:t},e.mode,0,null),t.return=e,e.child=t}function Ar(e,t,n,r){return r!==null&&Di(r),jn(t,e.child,null,n),e=Ki(t,t.pendingProps.children),e.flags|=2,t.memoizedState=null,e}function Vd(e,t,n,r,l,o,i){if(n)return t.flags&256?(t.flags&=-257,r=po(Error(w(422))),Ar(e,t,i,r)):t.memoizedState!==null?(t.child=e.child,t.flags|=128,null):(o=r.fallback,l=t.mode,r=Fl({mode:"visible",children:r.children},l,0,null),o=Gt(o,l,i,null),o.flags|=2,r.return=t,o.return=t,r.sibling=o,t.child=r,t.mode&1&&jn(t,e.child,null,i),t.child.memoizedState=bo(i),t.memoizedState=qo,o);if(!(t.mode&1))return Ar(e,t,i,null);if(l.data==="$!"){if(r=l.nextSibling&&l.nextSibling.dataset,r)var u=r.dgst;return r=u,o=Error(w(419)),r=po(o,r,void 0),Ar(e,t,i,r)}if(u=(i&e.childLanes)!==0,Ee||u){if(r=ue,r!==null){switch(i&-i){case 4:l=2;break;case 16:l=8;break;case 64:case 128:case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:case 4194304:case 8388608:case 16777216:case 33554432:case 67108864:l=32;break;case 536870912:l=268435456;break;default:l=0}l=l&(r.suspendedLanes|i)?0:l,l!==0&&l!==o.retryLane&&(o.retryLane=l,ct(e,l),Ge(r,e,l,-1))}return qi(),r=po(Error(w(421))),Ar(e,t,i,r)}return l.data==="$?"?(t.flags|=128,t.child=e.child,t=rp.bind(null,e),l._reactRetry=t,null):(e=o.treeContext,Le=Lt(l.nextSibling),Te=t,Q=!0,Ke=null,e!==null&&(Oe[Fe++]=ot,Oe[Fe++]=it,Oe[Fe++]=Zt,ot=e.id,it=e.overflow,Zt=t),t=Ki(t,r.children),t.flags|=4096,t)}function us(e,t,n){e.lanes|=t;var r=e.alternate;r!==null&&(r.lanes|=t),Ko(e.return,t,n)}function ho(e,t,n,r,l){var o=e.memoizedState;o===null?e.memoizedState={isBackwards:t,rendering:null,renderingStartTime:0,last:r,tail:n,tailMode:l}:(o.isBackwards=t,o.rendering=null,o.renderingStartTime=0,o.last=r,o.tail=n,o.tailMode=l)}function hc(e,t,n){var r=t.pendingProps,l=r.revealOrder,o=r.tail;if(ye(e,t,r.children,n),r=G.current,r&2)r=r&1|2,t.flags|=128;else{if(e!==null&&e.flags&128)e:for(e=t.child;e!==null;){if(e.tag===13)e.memoizedState!==null&&us(e,n,t);else if(e.tag===19)us(e,n,t);else if(e.child!==null){e.child.return=e,e=e.child;continue}if(e===t)break e;for(;e.sibling===null;){if(e.return===null||e.return===t)break e;e=e.return}e.sibling.return=e.return,e=e.sibling}r&=1}if(A(G,r),!(t.mode&1))t.memoizedState=null;else switch(l){case"forwards":for(n=t.child,l=null;n!==null;)e=n.alternate,e!==null&&gl(e)===null&&(l=n),n=n.sibling;n=l,n===null?(l=t.child,t.child=null):(l=n.sibling,n.sibling=null),ho(t,!1,l,n,o);break;case"backwards":for(n=null,l=t.child,t.child=null;l!==null;){if(e=l.alternate,e!==null&&gl(e)===null){t.child=l;break}e=l.sibling,l.sibling=n,n=l,l=e}ho(t,!0,n,null,o);break;case"together":ho(t,!1,null,null,void 0);break;default:t.memoizedState=null}return t.child}function Jr(e,t){!(t.mode&1)&&e!==null&&(e.alternate=null,t.alternate=null,t.flags|=2)}function ft(e,t,n){if(e!==null&&(t.dependencies=e.dependencies),qt|=t.lanes,!(n&t.childLanes))return null;if(e!==null&&t.child!==e.child)throw Error(w(153));if(t.child!==null){for(e=t.child,n=Rt(e,e.pendingProps),t.child=n,n.return=t;e.sibling!==null;)e=e.sibling,n=n.sibling=Rt(e,e.pendingProps),n.return=t;n.sibling=null}return t.child}function Qd(e,t,n){switch(t.tag){case 3:dc(t),_n();break;case 5:$a(t);break;case 1:Ne(t.type)&&fl(t);break;case 4:Ui(t,t.stateNode.containerInfo);break;case 10:var r=t.type._context,l=t.memoizedProps.value;A(hl,r._currentValue),r._currentValue=l;break;case 13:if(r=t.memoizedState,r!==null)return r.dehydrated!==null?(A(G,G.current&1),t.flags|=128,null):n&t.child.childLanes?pc(e,t,n):(A(G,G.current&1),e=ft(e,t,n),e!==null?e.sibling:null);A(G,G.current&1);break;case 19:if(r=(n&t.childLanes)!==0,e.flags&128){if(r)return hc(e,t,n);t.flags|=128}if(l=t.memoizedState,l!==null&&(l.rendering=null,l.tail=null,l.lastEffect=null),A(G,G.current),r)break;return null;case 22:case 23:return t.lanes=0,cc(e,t,n)}return ft(e,t,n)}var mc,ei,vc,gc;mc=function(e,t){for(var n=t.child;n!==null;){if(n.tag===5||n.tag===6)e.appendChild(n.stateNode);else if(n.tag!==4&&n.child!==null){n.child.return=n,n=n.child;continue}if(n===t)break;for(;n.sibling===null;){if(n.return===null||n.return===t)return;n=n.return}n.sibling.return=n.return,n=n.sibling}};ei=function(){};vc=function(e,t,n,r){var l=e.memoizedProps;if(l!==r){e=t.stateNode,Kt(et.current);var o=null;switch(n){case"input":l=So(e,l),r=So(e,r),o=[];break;case"select":l=Z({},l,{value:void 0}),r=Z({},r,{value:void 0}),o=[];break;case"textarea":l=No(e,l),r=No(e,r),o=[];break;default:typeof l.onClick!="function"&&typeof r.onClick=="function"&&(e.onclick=al)}jo(n,r);var i;n=null;for(f in l)if(!r.hasOwnProperty(f)&&l.hasOwnProperty(f)&&l[f]!=null)if(f==="style"){var u=l[f];for(i in u)u.hasOwnProperty(i)&&(n||(n={}),n[i]="")}else f!=="dangerouslySetInnerHTML"&&f!=="children"&&f!=="suppressContentEditableWarning"&&f!=="suppressHydrationWarning"&&f!=="autoFocus"&&(nr.hasOwnProperty(f)?o||(o=[]):(o=o||[]).push(f,null));for(f in r){var s=r[f];if(u=l!=null?l[f]:void 0,r.hasOwnProperty(f)&&s!==u&&(s!=null||u!=null))if(f==="style")if(u){for(i in u)!u.hasOwnProperty(i)||s&&s.hasOwnProperty(i)||(n||(n={}),n[i]="");for(i in s)s.hasOwnProperty(i)&&u[i]!==s[i]&&(n||(n={}),n[i]=s[i])}else n||(o||(o=[]),o.push(f,n)),n=s;else f==="dangerouslySetInnerHTML"?(s=s?s.__html:void 0,u=u?u.__html:void 0,s!=null&&u!==s&&(o=o||[]).push(f,s)):f==="children"?typeof s!="string"&&typeof s!="number"||(o=o||[]).push(f,""+s):f!=="suppressContentEditableWarning"&&f!=="suppressHydrationWarning"&&(nr.hasOwnProperty(f)?(s!=null&&f==="onScroll"&&W("scroll",e),o||u===s||(o=[])):(o=o||[]).push(f,s))}n&&(o=o||[]).push("style",n);var f=o;(t.updateQueue=f)&&(t.flags|=4)}};gc=function(e,t,n,r){n!==r&&(t.flags|=4)};function Bn(e,t){if(!Q)switch(e.tailMode){case"hidden":t=e.tail;for(var n=null;t!==null;)t.alternate!==null&&(n=t),t=t.sibling;n===null?e.tail=null:n.sibling=null;break;case"collapsed":n=e.tail;for(var r=null;n!==null;)n.alternate!==null&&(r=n),n=n.sibling;r===null?t||e.tail===null?e.tail=null:e.tail.sibling=null:r.sibling=null}}function he(e){var t=e.alternate!==null&&e.alternate.child===e.child,n=0,r=0;if(t)for(var l=e.child;l!==null;)n|=l.lanes|l.childLanes,r|=l.subtreeFlags&14680064,r|=l.flags&14680064,l.return=e,l=l.sibling;else for(l=e.child;l!==null;)n|=l.lanes|l.childLanes,r|=l.subtreeFlags,r|=l.flags,l.return=e,l=l.sibling;return e.subtreeFlags|=r,e.childLanes=n,t}function Kd(e,t,n){var r=t.pendingProps;switch(zi(t),t.tag){case 2:case 16:case 15:case 0:case 11:case 7:case 8:case 12:case 9:case 14:return he(t),null;case 1:return Ne(t.type)&&cl(),he(t),null;case 3:return r=t.stateNode,Pn(),H(Ce),H(ge),$i(),r.pendingContext&&(r.context=r.pendingContext,r.pendingContext=null),(e===null||e.child===null)&&(Fr(t)?t.flags|=4:e===null||e.memoizedState.isDehydrated&&!(t.flags&256)||(t.flags|=1024,Ke!==null&&(si(Ke),Ke=null))),ei(e,t),he(t),null;case 5:Ai(t);var l=Kt(hr.current);if(n=t.type,e!==null&&t.stateNode!=null)vc(e,t,n,r,l),e.ref!==t.ref&&(t.flags|=512,t.flags|=2097152);else{if(!r){if(t.stateNode===null)throw Error(w(166));return he(t),null}if(e=Kt(et.current),Fr(t)){r=t.stateNode,n=t.type;var o=t.memoizedProps;switch(r[qe]=t,r[dr]=o,e=(t.mode&1)!==0,n){case"dialog":W("cancel",r),W("close",r);break;case"iframe":case"object":case"embed":W("load",r);break;case"video":case"audio":for(l=0;l<Kn.length;l++)W(Kn[l],r);break;case"source":W("error",r);break;case"img":case"image":case"link":W("error",r),W("load",r);break;case"details":W("toggle",r);break;case"input":vu(r,o),W("invalid",r);break;case"select":r._wrapperState={wasMultiple:!!o.multiple},W("invalid",r);break;case"textarea":yu(r,o),W("invalid",r)}jo(n,o),l=null;for(var i in o)if(o.hasOwnProperty(i)){var u=o[i];i==="children"?typeof u=="string"?r.textContent!==u&&(o.suppressHydrationWarning!==!0&&Or(r.textContent,u,e),l=["children",u]):typeof u=="number"&&r.textContent!==""+u&&(o.suppressHydrationWarning!==!0&&Or(r.textContent,u,e),l=["children",""+u]):nr.hasOwnProperty(i)&&u!=null&&i==="onScroll"&&W("scroll",r)}switch(n){case"input":Pr(r),gu(r,o,!0);break;case"textarea":Pr(r),wu(r);break;case"select":case"option":break;default:typeof o.onClick=="function"&&(r.onclick=al)}r=l,t.updateQueue=r,r!==null&&(t.flags|=4)}else{i=l.nodeType===9?l:l.ownerDocument,e==="http://www.w3.org/1999/xhtml"&&(e=Qs(n)),e==="http://www.w3.org/1999/xhtml"?n==="script"?(e=i.createElement("div"),e.innerHTML="<script><\/script>",e=e.removeChild(e.firstChild)):typeof r.is=="string"?e=i.createElement(n,{is:r.is}):(e=i.createElement(n),n==="select"&&(i=e,r.multiple?i.multiple=!0:r.size&&(i.size=r.size))):e=i.createElementNS(e,n),e[qe]=t,e[dr]=r,mc(e,t,!1,!1),t.stateNode=e;e:{switch(i=Po(n,r),n){case"dialog":W("cancel",e),W("close",e),l=r;break;case"iframe":case"object":case"embed":W("load",e),l=r;break;case"video":case"audio":for(l=0;l<Kn.length;l++)W(Kn[l],e);l=r;break;case"source":W("error",e),l=r;break;case"img":case"image":case"link":W("error",e),W("load",e),l=r;break;case"details":W("toggle",e),l=r;break;case"input":vu(e,r),l=So(e,r),W("invalid",e);break;case"option":l=r;break;case"select":e._wrapperState={wasMultiple:!!r.multiple},l=Z({},r,{value:void 0}),W("invalid",e);break;case"textarea":yu(e,r),l=No(e,r),W("invalid",e);break;default:l=r}jo(n,l),u=l;for(o in u)if(u.hasOwnProperty(o)){var s=u[o];o==="style"?Gs(e,s):o==="dangerouslySetInnerHTML"?(s=s?s.__html:void 0,s!=null&&Ks(e,s)):o==="children"?typeof s=="string"?(n!=="textarea"||s!=="")&&rr(e,s):typeof s=="number"&&rr(e,""+s):o!=="suppressContentEditableWarning"&&o!=="suppressHydrationWarning"&&o!=="autoFocus"&&(nr.hasOwnProperty(o)?s!=null&&o==="onScroll"&&W("scroll",e):s!=null&&vi(e,o,s,i))}switch(n){case"input":Pr(e),gu(e,r,!1);break;case"textarea":Pr(e),wu(e);break;case"option":r.value!=null&&e.setAttribute("value",""+It(r.value));break;case"select":e.multiple=!!r.multiple,o=r.value,o!=null?yn(e,!!r.multiple,o,!1):r.defaultValue!=null&&yn(e,!!r.multiple,r.defaultValue,!0);break;default:typeof l.onClick=="function"&&(e.onclick=al)}switch(n){case"button":case"input":case"select":case"textarea":r=!!r.autoFocus;break e;case"img":r=!0;break e;default:r=!1}}r&&(t.flags|=4)}t.ref!==null&&(t.flags|=512,t.flags|=2097152)}return he(t),null;case 6:if(e&&t.stateNode!=null)gc(e,t,e.memoizedProps,r);else{if(typeof r!="string"&&t.stateNode===null)throw Error(w(166));if(n=Kt(hr.current),Kt(et.current),Fr(t)){if(r=t.stateNode,n=t.memoizedProps,r[qe]=t,(o=r.nodeValue!==n)&&(e=Te,e!==null))switch(e.tag){case 3:Or(r.nodeValue,n,(e.mode&1)!==0);break;case 5:e.memoizedProps.suppressHydrationWarning!==!0&&Or(r.nodeValue,n,(e.mode&1)!==0)}o&&(t.flags|=4)}else r=(n.nodeType===9?n:n.ownerDocument).createTextNode(r),r[qe]=t,t.stateNode=r}return he(t),null;case 13:if(H(G),r=t.memoizedState,e===null||e.memoizedState!==null&&e.memoizedState.dehydrated!==null){if(Q&&Le!==null&&t.mode&1&&!(t.flags&128))Ma(),_n(),t.flags|=98560,o=!1;else if(o=Fr(t),r!==null&&r.dehydrated!==null){if(e===null){if(!o)throw Error(w(318));if(o=t.memoizedState,o=o!==null?o.dehydrated:null,!o)throw Error(w(317));o[qe]=t}else _n(),!(t.flags&128)&&(t.memoizedState=null),t.flags|=4;he(t),o=!1}else Ke!==null&&(si(Ke),Ke=null),o=!0;if(!o)return t.flags&65536?t:null}return t.flags&128?(t.lanes=n,t):(r=r!==null,r!==(e!==null&&e.memoizedState!==null)&&r&&(t.child.flags|=8192,t.mode&1&&(e===null||G.current&1?le===0&&(le=3):qi())),t.updateQueue!==null&&(t.flags|=4),he(t),null);case 4:return Pn(),ei(e,t),e===null&&cr(t.stateNode.containerInfo),he(t),null;case 10:return Mi(t.type._context),he(t),null;case 17:return Ne(t.type)&&cl(),he(t),null;case 19:if(H(G),o=t.memoizedState,o===null)return he(t),null;if(r=(t.flags&128)!==0,i=o.rendering,i===null)if(r)Bn(o,!1);else{if(le!==0||e!==null&&e.flags&128)for(e=t.child;e!==null;){if(i=gl(e),i!==null){for(t.flags|=128,Bn(o,!1),r=i.updateQueue,r!==null&&(t.updateQueue=r,t.flags|=4),t.subtreeFlags=0,r=n,n=t.child;n!==null;)o=n,e=r,o.flags&=14680066,i=o.alternate,i===null?(o.childLanes=0,o.lanes=e,o.child=null,o.subtreeFlags=0,o.memoizedProps=null,o.memoizedState=null,o.updateQueue=null,o.dependencies=null,o.stateNode=null):(o.childLanes=i.childLanes,o.lanes=i.lanes,o.child=i.child,o.subtreeFlags=0,o.deletions=null,o.memoizedProps=i.memoizedProps,o.memoizedState=i.memoizedState,o.updateQueue=i.updateQueue,o.type=i.type,e=i.dependencies,o.dependencies=e===null?null:{lanes:e.lanes,firstContext:e.firstContext}),n=n.sibling;return A(G,G.current&1|2),t.child}e=e.sibling}o.tail!==null&&b()>Tn&&(t.flags|=128,r=!0,Bn(o,!1),t.lanes=4194304)}else{if(!r)if(e=gl(i),e!==null){if(t.flags|=128,r=!0,n=e.updateQueue,n!==null&&(t.updateQueue=n,t.flags|=4),Bn(o,!0),o.tail===null&&o.tailMode==="hidden"&&!i.alternate&&!Q)return he(t),null}else 2*b()-o.renderingStartTime>Tn&&n!==1073741824&&(t.flags|=128,r=!0,Bn(o,!1),t.lanes=4194304);o.isBackwards?(i.sibling=t.child,t.child=i):(n=o.last,n!==null?n.sibling=i:t.child=i,o.last=i)}return o.tail!==null?(t=o.tail,o.rendering=t,o.tail=t.sibling,o.renderingStartTime=b(),t.sibling=null,n=G.current,A(G,r?n&1|2:n&1),t):(he(t),null);case 22:case 23:return Ji(),r=t.memoizedState!==null,e!==null&&e.memoizedState!==null!==r&&(t.flags|=8192),r&&t.mode&1?Pe&1073741824&&(he(t),t.subtreeFlags&6&&(t.flags|=8192)):he(t),null;case 24:return null;case 25:return null}throw Error(w(156,t.tag))}function Yd(e,t){switch(zi(t),t.tag){case 1:return Ne(t.type)&&cl(),e=t.flags,e&65536?(t.flags=e&-65537|128,t):null;case 3:return Pn(),H(Ce),H(ge),$i(),e=t.flags,e&65536&&!(e&128)?(t.flags=e&-65537|128,t):null;case 5:return Ai(t),null;case 13:if(H(G),e=t.memoizedState,e!==null&&e.dehydrated!==null){if(t.alternate===null)throw Error(w(340));_n()}return e=t.flags,e&65536?(t.flags=e&-65537|128,t):null;case 19:return H(G),null;case 4:return Pn(),null;case 10:return Mi(t.type._context),null;case 22:case 23:return Ji(),null;case 24:return null;default:return null}}var $r=!1,ve=!1,Gd=typeof WeakSet=="function"?WeakSet:Set,_=null;function vn(e,t){var n=e.ref;if(n!==null)if(typeof n=="function")try{n(null)}catch(r){q(e,t,r)}else n.current=null}function ti(e,t,n){try{n()}catch(r){q(e,t,r)}}var ss=!1;function Xd(e,t){if(Uo=il,e=Sa(),Li(e)){if("selectionStart"in e)var n={start:e.selectionStart,end:e.selectionEnd};else e:{n=(n=e.ownerDocument)&&n.defaultView||window;var r=n.getSelection&&n.getSelection();if(r&&r.rangeCount!==0){n=r.anchorNode;var l=r.anchorOffset,o=r.focusNode;r=r.focusOffset;try{n.nodeType,o.nodeType}catch{n=null;break e}var i=0,u=-1,s=-1,f=0,h=0,g=e,m=null;t:for(;;){for(var x;g!==n||l!==0&&g.nodeType!==3||(u=i+l),g!==o||r!==0&&g.nodeType!==3||(s=i+r),g.nodeType===3&&(i+=g.nodeValue.length),(x=g.firstChild)!==null;)m=g,g=x;for(;;){if(g===e)break t;if(m===n&&++f===l&&(u=i),m===o&&++h===r&&(s=i),(x=g.nextSibling)!==null)break;g=m,m=g.parentNode}g=x}n=u===-1||s===-1?null:{start:u,end:s}}else n=null}n=n||{start:0,end:0}}else n=null;for(Ao={focusedElem:e,selectionRange:n},il=!1,_=t;_!==null;)if(t=_,e=t.child,(t.subtreeFlags&1028)!==0&&e!==null)e.return=t,_=e;else for(;_!==null;){t=_;try{var k=t.alternate;if(t.flags&1024)switch(t.tag){case 0:case 11:case 15:break;case 1:if(k!==null){var S=k.memoizedProps,O=k.memoizedState,d=t.stateNode,c=d.getSnapshotBeforeUpdate(t.elementType===t.type?S:Ve(t.type,S),O);d.__reactInternalSnapshotBeforeUpdate=c}break;case 3:var p=t.stateNode.containerInfo;p.nodeType===1?p.textContent="":p.nodeType===9&&p.documentElement&&p.removeChild(p.documentElement);break;case 5:case 6:case 4:case 17:break;default:throw Error(w(163))}}catch(y){q(t,t.return,y)}if(e=t.sibling,e!==null){e.return=t.return,_=e;break}_=t.return}return k=ss,ss=!1,k}function bn(e,t,n){var r=t.updateQueue;if(r=r!==null?r.lastEffect:null,r!==null){var l=r=r.next;do{if((l.tag&e)===e){var o=l.destroy;l.destroy=void 0,o!==void 0&&ti(t,n,o)}l=l.next}while(l!==r)}}function Ml(e,t){if(t=t.updateQueue,t=t!==null?t.lastEffect:null,t!==null){var n=t=t.next;do{if((n.tag&e)===e){var r=n.create;n.destroy=r()}n=n.next}while(n!==t)}}function ni(e){var t=e.ref;if(t!==null){var n=e.stateNode;switch(e.tag){case 5:e=n;break;default:e=n}typeof t=="function"?t(e):t.current=e}}function yc(e){var t=e.alternate;t!==null&&(e.alternate=null,yc(t)),e.child=null,e.deletions=null,e.sibling=null,e.tag===5&&(t=e.stateNode,t!==null&&(delete t[qe],delete t[dr],delete t[Wo],delete t[zd],delete t[Dd])),e.stateNode=null,e.return=null,e.dependencies=null,e.memoizedProps=null,e.memoizedState=null,e.pendingProps=null,e.stateNode=null,e.updateQueue=null}function wc(e){return e.tag===5||e.tag===3||e.tag===4}function as(e){e:for(;;){for(;e.sibling===null;){if(e.return===null||wc(e.return))return null;e=e.return}for(e.sibling.return=e.return,e=e.sibling;e.tag!==5&&e.tag!==6&&e.tag!==18;){if(e.flags&2||e.child===null||e.tag===4)continue e;e.child.return=e,e=e.child}if(!(e.flags&2))return e.stateNode}}function ri(e,t,n){var r=e.tag;if(r===5||r===6)e=e.stateNode,t?n.nodeType===8?n.parentNode.insertBefore(e,t):n.insertBefore(e,t):(n.nodeType===8?(t=n.parentNode,t.insertBefore(e,n)):(t=n,t.appendChild(e)),n=n._reactRootContainer,n!=null||t.onclick!==null||(t.onclick=al));else if(r!==4&&(e=e.child,e!==null))for(ri(e,t,n),e=e.sibling;e!==null;)ri(e,t,n),e=e.sibling}function li(e,t,n){var r=e.tag;if(r===5||r===6)e=e.stateNode,t?n.insertBefore(e,t):n.appendChild(e);else if(r!==4&&(e=e.child,e!==null))for(li(e,t,n),e=e.sibling;e!==null;)li(e,t,n),e=e.sibling}var ae=null,Qe=!1;function vt(e,t,n){for(n=n.child;n!==null;)xc(e,t,n),n=n.sibling}function xc(e,t,n){if(be&&typeof be.onCommitFiberUnmount=="function")try{be.onCommitFiberUnmount(jl,n)}catch{}switch(n.tag){case 5:ve||vn(n,t);case 6:var r=ae,l=Qe;ae=null,vt(e,t,n),ae=r,Qe=l,ae!==null&&(Qe?(e=ae,n=n.stateNode,e.nodeType===8?e.parentNode.removeChild(n):e.removeChild(n)):ae.removeChild(n.stateNode));break;case 18:ae!==null&&(Qe?(e=ae,n=n.stateNode,e.nodeType===8?io(e.parentNode,n):e.nodeType===1&&io(e,n),ur(e)):io(ae,n.stateNode));break;case 4:r=ae,l=Qe,ae=n.stateNode.containerInfo,Qe=!0,vt(e,t,n),ae=r,Qe=l;break;case 0:case 11:case 14:case 15:if(!ve&&(r=n.updateQueue,r!==null&&(r=r.lastEffect,r!==null))){l=r=r.next;do{var o=l,i=o.destroy;o=o.tag,i!==void 0&&(o&2||o&4)&&ti(n,t,i),l=l.next}while(l!==r)}vt(e,t,n);break;case 1:if(!ve&&(vn(n,t),r=n.stateNode,typeof r.componentWillUnmount=="function"))try{r.props=n.memoizedProps,r.state=n.memoizedState,r.componentWillUnmount()}catch(u){q(n,t,u)}vt(e,t,n);break;case 21:vt(e,t,n);break;case 22:n.mode&1?(ve=(r=ve)||n.memoizedState!==null,vt(e,t,n),ve=r):vt(e,t,n);break;default:vt(e,t,n)}}function cs(e){var t=e.updateQueue;if(t!==null){e.updateQueue=null;var n=e.stateNode;n===null&&(n=e.stateNode=new Gd),t.forEach(function(r){var l=lp.bind(null,e,r);n.has(r)||(n.add(r),r.then(l,l))})}}function He(e,t){var n=t.deletions;if(n!==null)for(var r=0;r<n.length;r++){var l=n[r];try{var o=e,i=t,u=i;e:for(;u!==null;){switch(u.tag){case 5:ae=u.stateNode,Qe=!1;break e;case 3:ae=u.stateNode.containerInfo,Qe=!0;break e;case 4:ae=u.stateNode.containerInfo,Qe=!0;break e}u=u.return}if(ae===null)throw Error(w(160));xc(o,i,l),ae=null,Qe=!1;var s=l.alternate;s!==null&&(s.return=null),l.return=null}catch(f){q(l,t,f)}}if(t.subtreeFlags&12854)for(t=t.child;t!==null;)kc(t,e),t=t.sibling}function kc(e,t){var n=e.alternate,r=e.flags;switch(e.tag){case 0:case 11:case 14:case 15:if(He(t,e),Ze(e),r&4){try{bn(3,e,e.return),Ml(3,e)}catch(S){q(e,e.return,S)}try{bn(5,e,e.return)}catch(S){q(e,e.return,S)}}break;case 1:He(t,e),Ze(e),r&512&&n!==null&&vn(n,n.return);break;case 5:if(He(t,e),Ze(e),r&512&&n!==null&&vn(n,n.return),e.flags&32){var l=e.stateNode;try{rr(l,"")}catch(S){q(e,e.return,S)}}if(r&4&&(l=e.stateNode,l!=null)){var o=e.memoizedProps,i=n!==null?n.memoizedProps:o,u=e.type,s=e.updateQueue;if(e.updateQueue=null,s!==null)try{u==="input"&&o.type==="radio"&&o.name!=null&&Hs(l,o),Po(u,i);var f=Po(u,o);for(i=0;i<s.length;i+=2){var h=s[i],g=s[i+1];h==="style"?Gs(l,g):h==="dangerouslySetInnerHTML"?Ks(l,g):h==="children"?rr(l,g):vi(l,h,g,f)}switch(u){case"input":Eo(l,o);break;case"textarea":Vs(l,o);break;case"select":var m=l._wrapperState.wasMultiple;l._wrapperState.wasMultiple=!!o.multiple;var x=o.value;x!=null?yn(l,!!o.multiple,x,!1):m!==!!o.multiple&&(o.defaultValue!=null?yn(l,!!o.multiple,o.defaultValue,!0):yn(l,!!o.multiple,o.multiple?[]:"",!1))}l[dr]=o}catch(S){q(e,e.return,S)}}break;case 6:if(He(t,e),Ze(e),r&4){if(e.stateNode===null)throw Error(w(162));l=e.stateNode,o=e.memoizedProps;try{l.nodeValue=o}catch(S){q(e,e.return,S)}}break;case 3:if(He(t,e),Ze(e),r&4&&n!==null&&n.memoizedState.isDehydrated)try{ur(t.containerInfo)}catch(S){q(e,e.return,S)}break;case 4:He(t,e),Ze(e);break;case 13:He(t,e),Ze(e),l=e.child,l.flags&8192&&(o=l.memoizedState!==null,l.stateNode.isHidden=o,!o||l.alternate!==null&&l.alternate.memoizedState!==null||(Xi=b())),r&4&&cs(e);break;case 22:if(h=n!==null&&n.memoizedState!==null,e.mode&1?(ve=(f=ve)||h,He(t,e),ve=f):He(t,e),Ze(e),r&8192){if(f=e.memoizedState!==null,(e.stateNode.isHidden=f)&&!h&&e.mode&1)for(_=e,h=e.child;h!==null;){for(g=_=h;_!==null;){switch(m=_,x=m.child,m.tag){case 0:case 11:case 14:case 15:bn(4,m,m.return);break;case 1:vn(m,m.return);var k=m.stateNode;if(typeof k.componentWillUnmount=="function"){r=m,n=m.return;try{t=r,k.props=t.memoizedProps,k.state=t.memoizedState,k.componentWillUnmount()}catch(S){q(r,n,S)}}break;case 5:vn(m,m.return);break;case 22:if(m.memoizedState!==null){ds(g);continue}}x!==null?(x.return=m,_=x):ds(g)}h=h.sibling}e:for(h=null,g=e;;){if(g.tag===5){if(h===null){h=g;try{l=g.stateNode,f?(o=l.style,typeof o.setProperty=="function"?o.setProperty("display","none","important"):o.display="none"):(u=g.stateNode,s=g.memoizedProps.style,i=s!=null&&s.hasOwnProperty("display")?s.display:null,u.style.display=Ys("display",i))}catch(S){q(e,e.return,S)}}}else if(g.tag===6){if(h===null)try{g.stateNode.nodeValue=f?"":g.memoizedProps}catch(S){q(e,e.return,S)}}else if((g.tag!==22&&g.tag!==23||g.memoizedState===null||g===e)&&g.child!==null){g.child.return=g,g=g.child;continue}if(g===e)break e;for(;g.sibling===null;){if(g.return===null||g.return===e)break e;h===g&&(h=null),g=g.return}h===g&&(h=null),g.sibling.return=g.return,g=g.sibling}}break;case 19:He(t,e),Ze(e),r&4&&cs(e);break;case 21:break;default:He(t,e),Ze(e)}}function Ze(e){var t=e.flags;if(t&2){try{e:{for(var n=e.return;n!==null;){if(wc(n)){var r=n;break e}n=n.return}throw Error(w(160))}switch(r.tag){case 5:var l=r.stateNode;r.flags&32&&(rr(l,""),r.flags&=-33);var o=as(e);li(e,o,l);break;case 3:case 4:var i=r.stateNode.containerInfo,u=as(e);ri(e,u,i);break;default:throw Error(w(161))}}catch(s){q(e,e.return,s)}e.flags&=-3}t&4096&&(e.flags&=-4097)}function Zd(e,t,n){_=e,Sc(e)}function Sc(e,t,n){for(var r=(e.mode&1)!==0;_!==null;){var l=_,o=l.child;if(l.tag===22&&r){var i=l.memoizedState!==null||$r;if(!i){var u=l.alternate,s=u!==null&&u.memoizedState!==null||ve;u=$r;var f=ve;if($r=i,(ve=s)&&!f)for(_=l;_!==null;)i=_,s=i.child,i.tag===22&&i.memoizedState!==null?ps(l):s!==null?(s.return=i,_=s):ps(l);for(;o!==null;)_=o,Sc(o),o=o.sibling;_=l,$r=u,ve=f}fs(e)}else l.subtreeFlags&8772&&o!==null?(o.return=l,_=o):fs(e)}}function fs(e){for(;_!==null;){var t=_;if(t.flags&8772){var n=t.alternate;try{if(t.flags&8772)switch(t.tag){case 0:case 11:case 15:ve||Ml(5,t);break;case 1:var r=t.stateNode;if(t.flags&4&&!ve)if(n===null)r.componentDidMount();else{var l=t.elementType===t.type?n.memoizedProps:Ve(t.type,n.memoizedProps);r.componentDidUpdate(l,n.memoizedState,r.__reactInternalSnapshotBeforeUpdate)}var o=t.updateQueue;o!==null&&Xu(t,o,r);break;case 3:var i=t.updateQueue;if(i!==null){if(n=null,t.child!==null)switch(t.child.tag){case 5:n=t.child.stateNode;break;case 1:n=t.child.stateNode}Xu(t,i,n)}break;case 5:var u=t.stateNode;if(n===null&&t.flags&4){n=u;var s=t.memoizedProps;switch(t.type){case"button":case"input":case"select":case"textarea":s.autoFocus&&n.focus();break;case"img":s.src&&(n.src=s.src)}}break;case 6:break;case 4:break;case 12:break;case 13:if(t.memoizedState===null){var f=t.alternate;if(f!==null){var h=f.memoizedState;if(h!==null){var g=h.dehydrated;g!==null&&ur(g)}}}break;case 19:case 17:case 21:case 22:case 23:case 25:break;default:throw Error(w(163))}ve||t.flags&512&&ni(t)}catch(m){q(t,t.return,m)}}if(t===e){_=null;break}if(n=t.sibling,n!==null){n.return=t.return,_=n;break}_=t.return}}function ds(e){for(;_!==null;){var t=_;if(t===e){_=null;break}var n=t.sibling;if(n!==null){n.return=t.return,_=n;break}_=t.return}}function ps(e){for(;_!==null;){var t=_;try{switch(t.tag){case 0:case 11:case 15:var n=t.return;try{Ml(4,t)}catch(s){q(t,n,s)}break;case 1:var r=t.stateNode;if(typeof r.componentDidMount=="function"){var l=t.return;try{r.componentDidMount()}catch(s){q(t,l,s)}}var o=t.return;try{ni(t)}catch(s){q(t,o,s)}break;case 5:var i=t.return;try{ni(t)}catch(s){q(t,i,s)}}}catch(s){q(t,t.return,s)}if(t===e){_=null;break}var u=t.sibling;if(u!==null){u.return=t.return,_=u;break}_=t.return}}var Jd=Math.ceil,xl=dt.ReactCurrentDispatcher,Yi=dt.ReactCurrentOwner,Ae=dt.ReactCurrentBatchConfig,M=0,ue=null,te=null,ce=0,Pe=0,gn=Ft(0),le=0,yr=null,qt=0,Ol=0,Gi=0,er=null,Se=null,Xi=0,Tn=1/0,rt=null,kl=!1,oi=null,zt=null,Br=!1,Nt=null,Sl=0,tr=0,ii=null,qr=-1,br=0;function we(){return M&6?b():qr!==-1?qr:qr=b()}function Dt(e){return e.mode&1?M&2&&ce!==0?ce&-ce:Id.transition!==null?(br===0&&(br=ia()),br):(e=F,e!==0||(e=window.event,e=e===void 0?16:pa(e.type)),e):1}function Ge(e,t,n,r){if(50<tr)throw tr=0,ii=null,Error(w(185));xr(e,n,r),(!(M&2)||e!==ue)&&(e===ue&&(!(M&2)&&(Ol|=n),le===4&&Et(e,ce)),_e(e,r),n===1&&M===0&&!(t.mode&1)&&(Tn=b()+500,Dl&&Ut()))}function _e(e,t){var n=e.callbackNode;If(e,t);var r=ol(e,e===ue?ce:0);if(r===0)n!==null&&Su(n),e.callbackNode=null,e.callbackPriority=0;else if(t=r&-r,e.callbackPriority!==t){if(n!=null&&Su(n),t===1)e.tag===0?Rd(hs.bind(null,e)):Da(hs.bind(null,e)),Ld(function(){!(M&6)&&Ut()}),n=null;else{switch(ua(r)){case 1:n=ki;break;case 4:n=la;break;case 16:n=ll;break;case 536870912:n=oa;break;default:n=ll}n=Tc(n,Ec.bind(null,e))}e.callbackPriority=t,e.callbackNode=n}}function Ec(e,t){if(qr=-1,br=0,M&6)throw Error(w(327));var n=e.callbackNode;if(En()&&e.callbackNode!==n)return null;var r=ol(e,e===ue?ce:0);if(r===0)return null;if(r&30||r&e.expiredLanes||t)t=El(e,r);else{t=r;var l=M;M|=2;var o=Nc();(ue!==e||ce!==t)&&(rt=null,Tn=b()+500,Yt(e,t));do try{ep();break}catch(u){Cc(e,u)}while(!0);Ii(),xl.current=o,M=l,te!==null?t=0:(ue=null,ce=0,t=le)}if(t!==0){if(t===2&&(l=Ro(e),l!==0&&(r=l,t=ui(e,l))),t===1)throw n=yr,Yt(e,0),Et(e,r),_e(e,b()),n;if(t===6)Et(e,r);else{if(l=e.current.alternate,!(r&30)&&!qd(l)&&(t=El(e,r),t===2&&(o=Ro(e),o!==0&&(r=o,t=ui(e,o))),t===1))throw n=yr,Yt(e,0),Et(e,r),_e(e,b()),n;switch(e.finishedWork=l,e.finishedLanes=r,t){case 0:case 1:throw Error(w(345));case 2:Ht(e,Se,rt);break;case 3:if(Et(e,r),(r&130023424)===r&&(t=Xi+500-b(),10<t)){if(ol(e,0)!==0)break;if(l=e.suspendedLanes,(l&r)!==r){we(),e.pingedLanes|=e.suspendedLanes&l;break}e.timeoutHandle=Bo(Ht.bind(null,e,Se,rt),t);break}Ht(e,Se,rt);break;case 4:if(Et(e,r),(r&4194240)===r)break;for(t=e.eventTimes,l=-1;0<r;){var i=31-Ye(r);o=1<<i,i=t[i],i>l&&(l=i),r&=~o}if(r=l,r=b()-r,r=(120>r?120:480>r?480:1080>r?1080:1920>r?1920:3e3>r?3e3:4320>r?4320:1960*Jd(r/1960))-r,10<r){e.timeoutHandle=Bo(Ht.bind(null,e,Se,rt),r);break}Ht(e,Se,rt);break;case 5:Ht(e,Se,rt);break;default:throw Error(w(329))}}}return _e(e,b()),e.callbackNode===n?Ec.bind(null,e):null}function ui(e,t){var n=er;return e.current.memoizedState.isDehydrated&&(Yt(e,t).flags|=256),e=El(e,t),e!==2&&(t=Se,Se=n,t!==null&&si(t)),e}function si(e){Se===null?Se=e:Se.push.apply(Se,e)}function qd(e){for(var t=e;;){if(t.flags&16384){var n=t.updateQueue;if(n!==null&&(n=n.stores,n!==null))for(var r=0;r<n.length;r++){var l=n[r],o=l.getSnapshot;l=l.value;try{if(!Xe(o(),l))return!1}catch{return!1}}}if(n=t.child,t.subtreeFlags&16384&&n!==null)n.return=t,t=n;else{if(t===e)break;for(;t.sibling===null;){if(t.return===null||t.return===e)return!0;t=t.return}t.sibling.return=t.return,t=t.sibling}}return!0}function Et(e,t){for(t&=~Gi,t&=~Ol,e.suspendedLanes|=t,e.pingedLanes&=~t,e=e.expirationTimes;0<t;){var n=31-Ye(t),r=1<<n;e[n]=-1,t&=~r}}function hs(e){if(M&6)throw Error(w(327));En();var t=ol(e,0);if(!(t&1))return _e(e,b()),null;var n=El(e,t);if(e.tag!==0&&n===2){var r=Ro(e);r!==0&&(t=r,n=ui(e,r))}if(n===1)throw n=yr,Yt(e,0),Et(e,t),_e(e,b()),n;if(n===6)throw Error(w(345));return e.finishedWork=e.current.alternate,e.finishedLanes=t,Ht(e,Se,rt),_e(e,b()),null}function Zi(e,t){var n=M;M|=1;try{return e(t)}finally{M=n,M===0&&(Tn=b()+500,Dl&&Ut())}}function bt(e){Nt!==null&&Nt.tag===0&&!(M&6)&&En();var t=M;M|=1;var n=Ae.transition,r=F;try{if(Ae.transition=null,F=1,e)return e()}finally{F=r,Ae.transition=n,M=t,!(M&6)&&Ut()}}function Ji(){Pe=gn.current,H(gn)}function Yt(e,t){e.finishedWork=null,e.finishedLanes=0;var n=e.timeoutHandle;if(n!==-1&&(e.timeoutHandle=-1,Pd(n)),te!==null)for(n=te.return;n!==null;){var r=n;switch(zi(r),r.tag){case 1:r=r.type.childContextTypes,r!=null&&cl();break;case 3:Pn(),H(Ce),H(ge),$i();break;case 5:Ai(r);break;case 4:Pn();break;case 13:H(G);break;case 19:H(G);break;case 10:Mi(r.type._context);break;case 22:case 23:Ji()}n=n.return}if(ue=e,te=e=Rt(e.current,null),ce=Pe=t,le=0,yr=null,Gi=Ol=qt=0,Se=er=null,Qt!==null){for(t=0;t<Qt.length;t++)if(n=Qt[t],r=n.interleaved,r!==null){n.interleaved=null;var l=r.next,o=n.pending;if(o!==null){var i=o.next;o.next=l,r.next=i}n.pending=r}Qt=null}return e}function Cc(e,t){do{var n=te;try{if(Ii(),Xr.current=wl,yl){for(var r=X.memoizedState;r!==null;){var l=r.queue;l!==null&&(l.pending=null),r=r.next}yl=!1}if(Jt=0,ie=re=X=null,qn=!1,mr=0,Yi.current=null,n===null||n.return===null){le=1,yr=t,te=null;break}e:{var o=e,i=n.return,u=n,s=t;if(t=ce,u.flags|=32768,s!==null&&typeof s=="object"&&typeof s.then=="function"){var f=s,h=u,g=h.tag;if(!(h.mode&1)&&(g===0||g===11||g===15)){var m=h.alternate;m?(h.updateQueue=m.updateQueue,h.memoizedState=m.memoizedState,h.lanes=m.lanes):(h.updateQueue=null,h.memoizedState=null)}var x=ts(i);if(x!==null){x.flags&=-257,ns(x,i,u,o,t),x.mode&1&&es(o,f,t),t=x,s=f;var k=t.updateQueue;if(k===null){var S=new Set;S.add(s),t.updateQueue=S}else k.add(s);break e}else{if(!(t&1)){es(o,f,t),qi();break e}s=Error(w(426))}}else if(Q&&u.mode&1){var O=ts(i);if(O!==null){!(O.flags&65536)&&(O.flags|=256),ns(O,i,u,o,t),Di(Ln(s,u));break e}}o=s=Ln(s,u),le!==4&&(le=2),er===null?er=[o]:er.push(o),o=i;do{switch(o.tag){case 3:o.flags|=65536,t&=-t,o.lanes|=t;var d=uc(o,s,t);Gu(o,d);break e;case 1:u=s;var c=o.type,p=o.stateNode;if(!(o.flags&128)&&(typeof c.getDerivedStateFromError=="function"||p!==null&&typeof p.componentDidCatch=="function"&&(zt===null||!zt.has(p)))){o.flags|=65536,t&=-t,o.lanes|=t;var y=sc(o,u,t);Gu(o,y);break e}}o=o.return}while(o!==null)}jc(n)}catch(E){t=E,te===n&&n!==null&&(te=n=n.return);continue}break}while(!0)}function Nc(){var e=xl.current;return xl.current=wl,e===null?wl:e}function qi(){(le===0||le===3||le===2)&&(le=4),ue===null||!(qt&268435455)&&!(Ol&268435455)||Et(ue,ce)}function El(e,t){var n=M;M|=2;var r=Nc();(ue!==e||ce!==t)&&(rt=null,Yt(e,t));do try{bd();break}catch(l){Cc(e,l)}while(!0);if(Ii(),M=n,xl.current=r,te!==null)throw Error(w(261));return ue=null,ce=0,le}function bd(){for(;te!==null;)_c(te)}function ep(){for(;te!==null&&!Nf();)_c(te)}function _c(e){var t=Lc(e.alternate,e,Pe);e.memoizedProps=e.pendingProps,t===null?jc(e):te=t,Yi.current=null}function jc(e){var t=e;do{var n=t.alternate;if(e=t.return,t.flags&32768){if(n=Yd(n,t),n!==null){n.flags&=32767,te=n;return}if(e!==null)e.flags|=32768,e.subtreeFlags=0,e.deletions=null;else{le=6,te=null;return}}else if(n=Kd(n,t,Pe),n!==null){te=n;return}if(t=t.sibling,t!==null){te=t;return}te=t=e}while(t!==null);le===0&&(le=5)}function Ht(e,t,n){var r=F,l=Ae.transition;try{Ae.transition=null,F=1,tp(e,t,n,r)}finally{Ae.transition=l,F=r}return null}function tp(e,t,n,r){do En();while(Nt!==null);if(M&6)throw Error(w(327));n=e.finishedWork;var l=e.finishedLanes;if(n===null)return null;if(e.finishedWork=null,e.finishedLanes=0,n===e.current)throw Error(w(177));e.callbackNode=null,e.callbackPriority=0;var o=n.lanes|n.childLanes;if(Mf(e,o),e===ue&&(te=ue=null,ce=0),!(n.subtreeFlags&2064)&&!(n.flags&2064)||Br||(Br=!0,Tc(ll,function(){return En(),null})),o=(n.flags&15990)!==0,n.subtreeFlags&15990||o){o=Ae.transition,Ae.transition=null;var i=F;F=1;var u=M;M|=4,Yi.current=null,Xd(e,n),kc(n,e),kd(Ao),il=!!Uo,Ao=Uo=null,e.current=n,Zd(n),_f(),M=u,F=i,Ae.transition=o}else e.current=n;if(Br&&(Br=!1,Nt=e,Sl=l),o=e.pendingLanes,o===0&&(zt=null),Lf(n.stateNode),_e(e,b()),t!==null)for(r=e.onRecoverableError,n=0;n<t.length;n++)l=t[n],r(l.value,{componentStack:l.stack,digest:l.digest});if(kl)throw kl=!1,e=oi,oi=null,e;return Sl&1&&e.tag!==0&&En(),o=e.pendingLanes,o&1?e===ii?tr++:(tr=0,ii=e):tr=0,Ut(),null}function En(){if(Nt!==null){var e=ua(Sl),t=Ae.transition,n=F;try{if(Ae.transition=null,F=16>e?16:e,Nt===null)var r=!1;else{if(e=Nt,Nt=null,Sl=0,M&6)throw Error(w(331));var l=M;for(M|=4,_=e.current;_!==null;){var o=_,i=o.child;if(_.flags&16){var u=o.deletions;if(u!==null){for(var s=0;s<u.length;s++){var f=u[s];for(_=f;_!==null;){var h=_;switch(h.tag){case 0:case 11:case 15:bn(8,h,o)}var g=h.child;if(g!==null)g.return=h,_=g;else for(;_!==null;){h=_;var m=h.sibling,x=h.return;if(yc(h),h===f){_=null;break}if(m!==null){m.return=x,_=m;break}_=x}}}var k=o.alternate;if(k!==null){var S=k.child;if(S!==null){k.child=null;do{var O=S.sibling;S.sibling=null,S=O}while(S!==null)}}_=o}}if(o.subtreeFlags&2064&&i!==null)i.return=o,_=i;else e:for(;_!==null;){if(o=_,o.flags&2048)switch(o.tag){case 0:case 11:case 15:bn(9,o,o.return)}var d=o.sibling;if(d!==null){d.return=o.return,_=d;break e}_=o.return}}var c=e.current;for(_=c;_!==null;){i=_;var p=i.child;if(i.subtreeFlags&2064&&p!==null)p.return=i,_=p;else e:for(i=c;_!==null;){if(u=_,u.flags&2048)try{switch(u.tag){case 0:case 11:case 15:Ml(9,u)}}catch(E){q(u,u.return,E)}if(u===i){_=null;break e}var y=u.sibling;if(y!==null){y.return=u.return,_=y;break e}_=u.return}}if(M=l,Ut(),be&&typeof be.onPostCommitFiberRoot=="function")try{be.onPostCommitFiberRoot(jl,e)}catch{}r=!0}return r}finally{F=n,Ae.transition=t}}return!1}function ms(e,t,n){t=Ln(n,t),t=uc(e,t,1),e=Tt(e,t,1),t=we(),e!==null&&(xr(e,1,t),_e(e,t))}function q(e,t,n){if(e.tag===3)ms(e,e,n);else for(;t!==null;){if(t.tag===3){ms(t,e,n);break}else if(t.tag===1){var r=t.stateNode;if(typeof t.type.getDerivedStateFromError=="function"||typeof r.componentDidCatch=="function"&&(zt===null||!zt.has(r))){e=Ln(n,e),e=sc(t,e,1),t=Tt(t,e,1),e=we(),t!==null&&(xr(t,1,e),_e(t,e));break}}t=t.return}}function np(e,t,n){var r=e.pingCache;r!==null&&r.delete(t),t=we(),e.pingedLanes|=e.suspendedLanes&n,ue===e&&(ce&n)===n&&(le===4||le===3&&(ce&130023424)===ce&&500>b()-Xi?Yt(e,0):Gi|=n),_e(e,t)}function Pc(e,t){t===0&&(e.mode&1?(t=zr,zr<<=1,!(zr&130023424)&&(zr=4194304)):t=1);var n=we();e=ct(e,t),e!==null&&(xr(e,t,n),_e(e,n))}function rp(e){var t=e.memoizedState,n=0;t!==null&&(n=t.retryLane),Pc(e,n)}function lp(e,t){var n=0;switch(e.tag){case 13:var r=e.stateNode,l=e.memoizedState;l!==null&&(n=l.retryLane);break;case 19:r=e.stateNode;break;default:throw Error(w(314))}r!==null&&r.delete(t),Pc(e,n)}var Lc;Lc=function(e,t,n){if(e!==null)if(e.memoizedProps!==t.pendingProps||Ce.current)Ee=!0;else{if(!(e.lanes&n)&&!(t.flags&128))return Ee=!1,Qd(e,t,n);Ee=!!(e.flags&131072)}else Ee=!1,Q&&t.flags&1048576&&Ra(t,pl,t.index);switch(t.lanes=0,t.tag){case 2:var r=t.type;Jr(e,t),e=t.pendingProps;var l=Nn(t,ge.current);Sn(t,n),l=Wi(null,t,r,e,l,n);var o=Hi();return t.flags|=1,typeof l=="object"&&l!==null&&typeof l.render=="function"&&l.$$typeof===void 0?(t.tag=1,t.memoizedState=null,t.updateQueue=null,Ne(r)?(o=!0,fl(t)):o=!1,t.memoizedState=l.state!==null&&l.state!==void 0?l.state:null,Fi(t),l.updater=Il,t.stateNode=l,l._reactInternals=t,Go(t,r,e,n),t=Jo(null,t,r,!0,o,n)):(t.tag=0,Q&&o&&Ti(t),ye(null,t,l,n),t=t.child),t;case 16:r=t.elementType;e:{switch(Jr(e,t),e=t.pendingProps,l=r._init,r=l(r._payload),t.type=r,l=t.tag=ip(r),e=Ve(r,e),l){case 0:t=Zo(null,t,r,e,n);break e;case 1:t=os(null,t,r,e,n);break e;case 11:t=rs(null,t,r,e,n);break e;case 14:t=ls(null,t,r,Ve(r.type,e),n);break e}throw Error(w(306,r,""))}return t;case 0:return r=t.type,l=t.pendingProps,l=t.elementType===r?l:Ve(r,l),Zo(e,t,r,l,n);case 1:return r=t.type,l=t.pendingProps,l=t.elementType===r?l:Ve(r,l),os(e,t,r,l,n);case 3:e:{if(dc(t),e===null)throw Error(w(387));r=t.pendingProps,o=t.memoizedState,l=o.element,Aa(e,t),vl(t,r,null,n);var i=t.memoizedState;if(r=i.element,o.isDehydrated)if(o={element:r,isDehydrated:!1,cache:i.cache,pendingSuspenseBoundaries:i.pendingSuspenseBoundaries,transitions:i.transitions},t.updateQueue.baseState=o,t.memoizedState=o,t.flags&256){l=Ln(Error(w(423)),t),t=is(e,t,r,n,l);break e}else if(r!==l){l=Ln(Error(w(424)),t),t=is(e,t,r,n,l);break e}else for(Le=Lt(t.stateNode.containerInfo.firstChild),Te=t,Q=!0,Ke=null,n=Fa(t,null,r,n),t.child=n;n;)n.flags=n.flags&-3|4096,n=n.sibling;else{if(_n(),r===l){t=ft(e,t,n);break e}ye(e,t,r,n)}t=t.child}return t;case 5:return $a(t),e===null&&Qo(t),r=t.type,l=t.pendingProps,o=e!==null?e.memoizedProps:null,i=l.children,$o(r,l)?i=null:o!==null&&$o(r,o)&&(t.flags|=32),fc(e,t),ye(e,t,i,n),t.child;case 6:return e===null&&Qo(t),null;case 13:return pc(e,t,n);case 4:return Ui(t,t.stateNode.containerInfo),r=t.pendingProps,e===null?t.child=jn(t,null,r,n):ye(e,t,r,n),t.child;case 11:return r=t.type,l=t.pendingProps,l=t.elementType===r?l:Ve(r,l),rs(e,t,r,l,n);case 7:return ye(e,t,t.pendingProps,n),t.child;case 8:return ye(e,t,t.pendingProps.children,n),t.child;case 12:return ye(e,t,t.pendingProps.children,n),t.child;case 10:e:{if(r=t.type._context,l=t.pendingProps,o=t.memoizedProps,i=l.value,A(hl,r._currentValue),r._currentValue=i,o!==null)if(Xe(o.value,i)){if(o.children===l.children&&!Ce.current){t=ft(e,t,n);break e}}else for(o=t.child,o!==null&&(o.return=t);o!==null;){var u=o.dependencies;if(u!==null){i=o.child;for(var s=u.firstContext;s!==null;){if(s.context===r){if(o.tag===1){s=ut(-1,n&-n),s.tag=2;var f=o.updateQueue;if(f!==null){f=f.shared;var h=f.pending;h===null?s.next=s:(s.next=h.next,h.next=s),f.pending=s}}o.lanes|=n,s=o.alternate,s!==null&&(s.lanes|=n),Ko(o.return,n,t),u.lanes|=n;break}s=s.next}}else if(o.tag===10)i=o.type===t.type?null:o.child;else if(o.tag===18){if(i=o.return,i===null)throw Error(w(341));i.lanes|=n,u=i.alternate,u!==null&&(u.lanes|=n),Ko(i,n,t),i=o.sibling}else i=o.child;if(i!==null)i.return=o;else for(i=o;i!==null;){if(i===t){i=null;break}if(o=i.sibling,o!==null){o.return=i.return,i=o;break}i=i.return}o=i}ye(e,t,l.children,n),t=t.child}return t;case 9:return l=t.type,r=t.pendingProps.children,Sn(t,n),l=$e(l),r=r(l),t.flags|=1,ye(e,t,r,n),t.child;case 14:return r=t.type,l=Ve(r,t.pendingProps),l=Ve(r.type,l),ls(e,t,r,l,n);case 15:return ac(e,t,t.type,t.pendingProps,n);case 17:return r=t.type,l=t.pendingProps,l=t.elementType===r?l:Ve(r,l),Jr(e,t),t.tag=1,Ne(r)?(e=!0,fl(t)):e=!1,Sn(t,n),ic(t,r,l),Go(t,r,l,n),Jo(null,t,r,!0,e,n);case 19:return hc(e,t,n);case 22:return cc(e,t,n)}throw Error(w(156,t.tag))};function Tc(e,t){return ra(e,t)}function op(e,t,n,r){this.tag=e,this.key=n,this.sibling=this.child=this.return=this.stateNode=this.type=this.elementType=null,this.index=0,this.ref=null,this.pendingProps=t,this.dependencies=this.memoizedState=this.updateQueue=this.memoizedProps=null,this.mode=r,this.subtreeFlags=this.flags=0,this.deletions=null,this.childLanes=this.lanes=0,this.alternate=null}function Ue(e,t,n,r){return new op(e,t,n,r)}function bi(e){return e=e.prototype,!(!e||!e.isReactComponent)}function ip(e){if(typeof e=="function")return bi(e)?1:0;if(e!=null){if(e=e.$$typeof,e===yi)return 11;if(e===wi)return 14}return 2}function Rt(e,t){var n=e.alternate;return n===null?(n=Ue(e.tag,t,e.key,e.mode),n.elementType=e.elementType,n.type=e.type,n.stateNode=e.stateNode,n.alternate=e,e.alternate=n):(n.pendingProps=t,n.type=e.type,n.flags=0,n.subtreeFlags=0,n.deletions=null),n.flags=e.flags&14680064,n.childLanes=e.childLanes,n.lanes=e.lanes,n.child=e.child,n.memoizedProps=e.memoizedProps,n.memoizedState=e.memoizedState,n.updateQueue=e.updateQueue,t=e.dependencies,n.dependencies=t===null?null:{lanes:t.lanes,firstContext:t.firstContext},n.sibling=e.sibling,n.index=e.index,n.ref=e.ref,n}function el(e,t,n,r,l,o){var i=2;if(r=e,typeof e=="function")bi(e)&&(i=1);else if(typeof e=="string")i=5;else e:switch(e){case un:return Gt(n.children,l,o,t);case gi:i=8,l|=8;break;case yo:return e=Ue(12,n,t,l|2),e.elementType=yo,e.lanes=o,e;case wo:return e=Ue(13,n,t,l),e.elementType=wo,e.lanes=o,e;case xo:return e=Ue(19,n,t,l),e.elementType=xo,e.lanes=o,e;case $s:return Fl(n,l,o,t);default:if(typeof e=="object"&&e!==null)switch(e.$$typeof){case Us:i=10;break e;case As:i=9;break e;case yi:i=11;break e;case wi:i=14;break e;case yt:i=16,r=null;break e}throw Error(w(130,e==null?e:typeof e,""))}return t=Ue(i,n,t,l),t.elementType=e,t.type=r,t.lanes=o,t}function Gt(e,t,n,r){return e=Ue(7,e,r,t),e.lanes=n,e}function Fl(e,t,n,r){return e=Ue(22,e,r,t),e.elementType=$s,e.lanes=n,e.stateNode={isHidden:!1},e}function mo(e,t,n){return e=Ue(6,e,null,t),e.lanes=n,e}function vo(e,t,n){return t=Ue(4,e.children!==null?e.children:[],e.key,t),t.lanes=n,t.stateNode={containerInfo:e.containerInfo,pendingChildren:null,implementation:e.implementation},t}function up(e,t,n,r,l){this.tag=t,this.containerInfo=e,this.finishedWork=this.pingCache=this.current=this.pendingChildren=null,this.timeoutHandle=-1,this.callbackNode=this.pendingContext=this.context=null,this.callbackPriority=0,this.eventTimes=Xl(0),this.expirationTimes=Xl(-1),this.entangledLanes=this.finishedLanes=this.mutableReadLanes=this.expiredLanes=this.pingedLanes=this.suspendedLanes=this.pendingLanes=0,this.entanglements=Xl(0),this.identifierPrefix=r,this.onRecoverableError=l,this.mutableSourceEagerHydrationData=null}function eu(e,t,n,r,l,o,i,u,s){return e=new up(e,t,n,u,s),t===1?(t=1,o===!0&&(t|=8)):t=0,o=Ue(3,null,null,t),e.current=o,o.stateNode=e,o.memoizedState={element:r,isDehydrated:n,cache:null,transitions:null,pendingSuspenseBoundaries:null},Fi(o),e}function sp(e,t,n){var r=3<arguments.length&&arguments[3]!==void 0?arguments[3]:null;return{$$typeof:on,key:r==null?null:""+r,children:e,containerInfo:t,implementation:n}}function zc(e){if(!e)return Mt;e=e._reactInternals;e:{if(tn(e)!==e||e.tag!==1)throw Error(w(170));var t=e;do{switch(t.tag){case 3:t=t.stateNode.context;break e;case 1:if(Ne(t.type)){t=t.stateNode.__reactInternalMemoizedMergedChildContext;break e}}t=t.return}while(t!==null);throw Error(w(171))}if(e.tag===1){var n=e.type;if(Ne(n))return za(e,n,t)}return t}function Dc(e,t,n,r,l,o,i,u,s){return e=eu(n,r,!0,e,l,o,i,u,s),e.context=zc(null),n=e.current,r=we(),l=Dt(n),o=ut(r,l),o.callback=t??null,Tt(n,o,l),e.current.lanes=l,xr(e,l,r),_e(e,r),e}function Ul(e,t,n,r){var l=t.current,o=we(),i=Dt(l);return n=zc(n),t.context===null?t.context=n:t.pendingContext=n,t=ut(o,i),t.payload={element:e},r=r===void 0?null:r,r!==null&&(t.callback=r),e=Tt(l,t,i),e!==null&&(Ge(e,l,i,o),Gr(e,l,i)),i}function Cl(e){if(e=e.current,!e.child)return null;switch(e.child.tag){case 5:return e.child.stateNode;default:return e.child.stateNode}}function vs(e,t){if(e=e.memoizedState,e!==null&&e.dehydrated!==null){var n=e.retryLane;e.retryLane=n!==0&&n<t?n:t}}function tu(e,t){vs(e,t),(e=e.alternate)&&vs(e,t)}function ap(){return null}var Rc=typeof reportError=="function"?reportError:function(e){console.error(e)};function nu(e){this._internalRoot=e}Al.prototype.render=nu.prototype.render=function(e){var t=this._internalRoot;if(t===null)throw Error(w(409));Ul(e,t,null,null)};Al.prototype.unmount=nu.prototype.unmount=function(){var e=this._internalRoot;if(e!==null){this._internalRoot=null;var t=e.containerInfo;bt(function(){Ul(null,e,null,null)}),t[at]=null}};function Al(e){this._internalRoot=e}Al.prototype.unstable_scheduleHydration=function(e){if(e){var t=ca();e={blockedOn:null,target:e,priority:t};for(var n=0;n<St.length&&t!==0&&t<St[n].priority;n++);St.splice(n,0,e),n===0&&da(e)}};function ru(e){return!(!e||e.nodeType!==1&&e.nodeType!==9&&e.nodeType!==11)}function $l(e){return!(!e||e.nodeType!==1&&e.nodeType!==9&&e.nodeType!==11&&(e.nodeType!==8||e.nodeValue!==" react-mount-point-unstable "))}function gs(){}function cp(e,t,n,r,l){if(l){if(typeof r=="function"){var o=r;r=function(){var f=Cl(i);o.call(f)}}var i=Dc(t,r,e,0,null,!1,!1,"",gs);return e._reactRootContainer=i,e[at]=i.current,cr(e.nodeType===8?e.parentNode:e),bt(),i}for(;l=e.lastChild;)e.removeChild(l);if(typeof r=="function"){var u=r;r=function(){var f=Cl(s);u.call(f)}}var s=eu(e,0,!1,null,null,!1,!1,"",gs);return e._reactRootContainer=s,e[at]=s.current,cr(e.nodeType===8?e.parentNode:e),bt(function(){Ul(t,s,n,r)}),s}function Bl(e,t,n,r,l){var o=n._reactRootContainer;if(o){var i=o;if(typeof l=="function"){var u=l;l=function(){var s=Cl(i);u.call(s)}}Ul(t,i,e,l)}else i=cp(n,t,e,l,r);return Cl(i)}sa=function(e){switch(e.tag){case 3:var t=e.stateNode;if(t.current.memoizedState.isDehydrated){var n=Qn(t.pendingLanes);n!==0&&(Si(t,n|1),_e(t,b()),!(M&6)&&(Tn=b()+500,Ut()))}break;case 13:bt(function(){var r=ct(e,1);if(r!==null){var l=we();Ge(r,e,1,l)}}),tu(e,1)}};Ei=function(e){if(e.tag===13){var t=ct(e,134217728);if(t!==null){var n=we();Ge(t,e,134217728,n)}tu(e,134217728)}};aa=function(e){if(e.tag===13){var t=Dt(e),n=ct(e,t);if(n!==null){var r=we();Ge(n,e,t,r)}tu(e,t)}};ca=function(){return F};fa=function(e,t){var n=F;try{return F=e,t()}finally{F=n}};To=function(e,t,n){switch(t){case"input":if(Eo(e,n),t=n.name,n.type==="radio"&&t!=null){for(n=e;n.parentNode;)n=n.parentNode;for(n=n.querySelectorAll("input[name="+JSON.stringify(""+t)+'][type="radio"]'),t=0;t<n.length;t++){var r=n[t];if(r!==e&&r.form===e.form){var l=zl(r);if(!l)throw Error(w(90));Ws(r),Eo(r,l)}}}break;case"textarea":Vs(e,n);break;case"select":t=n.value,t!=null&&yn(e,!!n.multiple,t,!1)}};Js=Zi;qs=bt;var fp={usingClientEntryPoint:!1,Events:[Sr,fn,zl,Xs,Zs,Zi]},Wn={findFiberByHostInstance:Vt,bundleType:0,version:"18.3.1",rendererPackageName:"react-dom"},dp={bundleType:Wn.bundleType,version:Wn.version,rendererPackageName:Wn.rendererPackageName,rendererConfig:Wn.rendererConfig,overrideHookState:null,overrideHookStateDeletePath:null,overrideHookStateRenamePath:null,overrideProps:null,overridePropsDeletePath:null,overridePropsRenamePath:null,setErrorHandler:null,setSuspenseHandler:null,scheduleUpdate:null,currentDispatcherRef:dt.ReactCurrentDispatcher,findHostInstanceByFiber:function(e){return e=ta(e),e===null?null:e.stateNode},findFiberByHostInstance:Wn.findFiberByHostInstance||ap,findHostInstancesForRefresh:null,scheduleRefresh:null,scheduleRoot:null,setRefreshHandler:null,getCurrentFiber:null,reconcilerVersion:"18.3.1-next-f1338f8080-20240426"};if(typeof __REACT_DEVTOOLS_GLOBAL_HOOK__<"u"){var Wr=__REACT_DEVTOOLS_GLOBAL_HOOK__;if(!Wr.isDisabled&&Wr.supportsFiber)try{jl=Wr.inject(dp),be=Wr}catch{}}De.__SECRET_INTERNALS_DO_NOT_USE_OR_YOU_WILL_BE_FIRED=fp;De.createPortal=function(e,t){var n=2<arguments.length&&arguments[2]!==void 0?arguments[2]:null;if(!ru(t))throw Error(w(200));return sp(e,t,null,n)};De.createRoot=function(e,t){if(!ru(e))throw Error(w(299));var n=!1,r="",l=Rc;return t!=null&&(t.unstable_strictMode===!0&&(n=!0),t.identifierPrefix!==void 0&&(r=t.identifierPrefix),t.onRecoverableError!==void 0&&(l=t.onRecoverableError)),t=eu(e,1,!1,null,null,n,!1,r,l),e[at]=t.current,cr(e.nodeType===8?e.parentNode:e),new nu(t)};De.findDOMNode=function(e){if(e==null)return null;if(e.nodeType===1)return e;var t=e._reactInternals;if(t===void 0)throw typeof e.render=="function"?Error(w(188)):(e=Object.keys(e).join(","),Error(w(268,e)));return e=ta(t),e=e===null?null:e.stateNode,e};De.flushSync=function(e){return bt(e)};De.hydrate=function(e,t,n){if(!$l(t))throw Error(w(200));return Bl(null,e,t,!0,n)};De.hydrateRoot=function(e,t,n){if(!ru(e))throw Error(w(405));var r=n!=null&&n.hydratedSources||null,l=!1,o="",i=Rc;if(n!=null&&(n.unstable_strictMode===!0&&(l=!0),n.identifierPrefix!==void 0&&(o=n.identifierPrefix),n.onRecoverableError!==void 0&&(i=n.onRecoverableError)),t=Dc(t,null,e,1,n??null,l,!1,o,i),e[at]=t.current,cr(e),r)for(e=0;e<r.length;e++)n=r[e],l=n._getVersion,l=l(n._source),t.mutableSourceEagerHydrationData==null?t.mutableSourceEagerHydrationData=[n,l]:t.mutableSourceEagerHydrationData.push(n,l);return new Al(t)};De.render=function(e,t,n){if(!$l(t))throw Error(w(200));return Bl(null,e,t,!1,n)};De.unmountComponentAtNode=function(e){if(!$l(e))throw Error(w(40));return e._reactRootContainer?(bt(function(){Bl(null,null,e,!1,function(){e._reactRootContainer=null,e[at]=null})}),!0):!1};De.unstable_batchedUpdates=Zi;De.unstable_renderSubtreeIntoContainer=function(e,t,n,r){if(!$l(n))throw Error(w(200));if(e==null||e._reactInternals===void 0)throw Error(w(38));return Bl(e,t,n,!1,r)};De.version="18.3.1-next-f1338f8080-20240426";function Ic(){if(!(typeof __REACT_DEVTOOLS_GLOBAL_HOOK__>"u"||typeof __REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE!="function"))try{__REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE(Ic)}catch(e){console.error(e)}}Ic(),Is.exports=De;var pp=Is.exports,Mc,ys=pp;Mc=ys.createRoot,ys.hydrateRoot;function xt(e,t,n){return a.jsxs("svg",{width:t,height:t,viewBox:"0 0 24 24","aria-label":n,role:"img",children:[a.jsx("title",{children:n}),e]})}const kt=({children:e})=>a.jsx("g",{fill:"none",stroke:"currentColor",strokeWidth:1.6,strokeLinecap:"round",strokeLinejoin:"round",children:e});function me(e,t,n){return a.jsx("img",{src:e,width:n,height:n,alt:t,title:t,style:{display:"inline-block"}})}function ws(e,t=16){const n=(e||"").toLowerCase();return n.includes("gpt")||n.includes("o4")||n.startsWith("openai")?me("/assets/Icons/openai.svg","GPT",t):n.includes("claude")?me("/assets/Icons/claude-color.svg","Claude",t):n.includes("gemini")?me("/assets/Icons/gemini-color.svg","Gemini",t):n.includes("llama")?xt(a.jsxs(kt,{children:[a.jsx("path",{d:"M6 17c3 1 9 1 12 0"}),a.jsx("path",{d:"M8 17V9l2-2 2 2v8"}),a.jsx("path",{d:"M10 7l1-2 1 2"})]}),t,"Llama"):n.includes("mistral")||n.includes("mixtral")?xt(a.jsxs(kt,{children:[a.jsx("path",{d:"M3 9h10c2 0 2-3 0-3"}),a.jsx("path",{d:"M3 15h14c3 0 3-4 0-4"})]}),t,"Mistral"):n.includes("qwen")?xt(a.jsxs(kt,{children:[a.jsx("path",{d:"M6 12a6 6 0 1 1 6 6"}),a.jsx("path",{d:"M12 18l3-3"})]}),t,"Qwen"):n.includes("deepseek")?xt(a.jsxs(kt,{children:[a.jsx("path",{d:"M4 12l8-8 8 8-8 8z"}),a.jsx("path",{d:"M8 12l4-4 4 4-4 4z"})]}),t,"DeepSeek"):n.includes("phi")?xt(a.jsxs(kt,{children:[a.jsx("circle",{cx:"12",cy:"12",r:"7"}),a.jsx("path",{d:"M12 5v14M8 10h8"})]}),t,"Phi"):xt(a.jsx(kt,{children:a.jsx("circle",{cx:"12",cy:"12",r:"8"})}),t,"Model")}function hp(e,t=16){const n=(e||"").toLowerCase();return n.includes("openrouter")?me("/assets/Icons/openrouter.svg","OpenRouter",t):n.includes("openai")?me("/assets/Icons/openai.svg","OpenAI",t):n.includes("anthropic")?me("/assets/Icons/anthropic.svg","Anthropic",t):n.includes("gemini")||n.includes("google")?me("/assets/Icons/gemini-color.svg","Google",t):n.includes("azure")?me("/assets/Icons/azure-color.svg","Azure",t):n.includes("ollama")?xt(a.jsxs(kt,{children:[a.jsx("path",{d:"M7 14a3 3 0 0 1 6 0v3H7z"}),a.jsx("path",{d:"M13 14a3 3 0 1 1 3 3"})]}),t,"Ollama"):n.includes("together")?me("/assets/Icons/together-color.svg","Together",t):n.includes("fireworks")?me("/assets/Icons/fireworks-color.svg","Fireworks",t):n.includes("perplexity")?me("/assets/Icons/perplexity-color.svg","Perplexity",t):n.includes("mistral")?me("/assets/Icons/mistral-color.svg","Mistral",t):n.includes("deepseek")?me("/assets/Icons/deepseek-color.svg","DeepSeek",t):n.includes("cohere")?me("/assets/Icons/cohere-color.svg","Cohere",t):n.includes("litellm")?me("/assets/Icons/openai.svg","LiteLLM",t):n.includes("vllm")?me("/assets/Icons/vllm-color.svg","vLLM",t):xt(a.jsx(kt,{children:a.jsx("rect",{x:"5",y:"5",width:"14",height:"14",rx:"3"})}),t,"Provider")}function mp(e){const t=e.split(/\r?\n/),n=[];let r=0;for(;r<t.length;){const o=t[r].match(/^```\s*([\w+-]*)\s*$/);if(o){const u=o[1]||"";r++;const s=[];for(;r<t.length&&!/^```\s*$/.test(t[r]);)s.push(t[r]),r++;r<t.length&&/^```\s*$/.test(t[r])&&r++,n.push({type:"code",lang:u,code:s.join(`
-`)});continue}const i=[];for(;r<t.length&&!/^```/.test(t[r]);)i.push(t[r]),r++;i.length&&n.push({type:"text",text:i.join(`
-`)})}return n}function vp(e){const t=[];let n=0;const r=()=>`${n}-${Math.random().toString(36).slice(2,7)}`;for(;n<e.length;){const l=e[n];if(/^\s*---+\s*$/.test(l)){t.push(a.jsx("hr",{className:"border-white/10"},r())),n++;continue}const o=l.match(/^(#{1,3})\s+(.*)$/);if(o){const u=o[1].length,s=o[2];u===1?t.push(a.jsx("h2",{className:"mt-4",children:s},r())):u===2?t.push(a.jsx("h3",{className:"mt-3",children:s},r())):t.push(a.jsx("h4",{className:"mt-2",children:s},r())),n++;continue}if(/^\s*[-*]\s+/.test(l)){const u=[];for(;n<e.length&&/^\s*[-*]\s+/.test(e[n]);)u.push(e[n].replace(/^\s*[-*]\s+/,"")),n++;t.push(a.jsx("ul",{className:"list-disc pl-6 space-y-1",children:u.map((s,f)=>a.jsx("li",{children:s},f))},r()));continue}if(/^\s*\d+\.\s+/.test(l)){const u=[];for(;n<e.length&&/^\s*\d+\.\s+/.test(e[n]);)u.push(e[n].replace(/^\s*\d+\.\s+/,"")),n++;t.push(a.jsx("ol",{className:"list-decimal pl-6 space-y-1",children:u.map((s,f)=>a.jsx("li",{children:s},f))},r()));continue}if(l.includes("|")){const u=[],s=n;for(;n<e.length&&e[n].includes("|");)u.push(e[n]),n++;if(u.length>=2&&/\|/.test(u[0])&&/-/.test(u[1])){const f=m=>m.split("|").map(x=>x.trim()).filter((x,k,S)=>!(k===0&&m.trim().startsWith("|"))&&!(k===S.length-1&&m.trim().endsWith("|"))),h=f(u[0]),g=u.slice(2).map(f);t.push(a.jsx("div",{className:"overflow-x-auto",children:a.jsxs("table",{className:"w-full text-sm border-collapse",children:[a.jsx("thead",{children:a.jsx("tr",{children:h.map((m,x)=>a.jsx("th",{className:"text-left font-semibold px-3 py-2 border-b border-white/10",children:m},x))})}),a.jsx("tbody",{children:g.map((m,x)=>a.jsx("tr",{className:"odd:bg-white/5",children:m.map((k,S)=>a.jsx("td",{className:"px-3 py-2 align-top border-b border-white/5",children:k},S))},x))})]})},r()));continue}else n=s}const i=[];for(;n<e.length&&e[n].trim()!=="";)i.push(e[n]),n++;for(t.push(a.jsx("p",{className:"whitespace-pre-wrap leading-relaxed",children:i.join(`
-`)},r()));n<e.length&&e[n].trim()==="";)n++}return t}function xs({content:e,wrapDefault:t}){const n=L.useMemo(()=>e.replace(/\r/g,"").replace(/^\uFEFF/,""),[e]),r=L.useMemo(()=>mp(n),[n]);return a.jsx("div",{className:"prose prose-invert max-w-none",children:r.map((l,o)=>l.type==="text"?a.jsx("div",{children:vp(l.text.split(`
-`))},o):a.jsx(gp,{lang:l.lang,code:l.code,defaultWrap:!!t},o))})}function gp({lang:e,code:t,defaultWrap:n}){const[r,l]=L.useState(!!n),o=async()=>{try{await navigator.clipboard.writeText(t)}catch{}};return a.jsxs("div",{className:"rounded-lg border border-white/10 overflow-hidden",children:[a.jsxs("div",{className:"flex items-center justify-between px-3 py-1.5 text-xs bg-slate-800/60 border-b border-white/10",children:[a.jsx("div",{className:"uppercase tracking-wide text-slate-300",children:e||"text"}),a.jsxs("div",{className:"flex items-center gap-2",children:[a.jsx("button",{className:"px-2 py-0.5 rounded bg-white/10 hover:bg-white/15",onClick:()=>l(i=>!i),children:r?"No wrap":"Wrap"}),a.jsx("button",{className:"px-2 py-0.5 rounded bg-white/10 hover:bg-white/15",onClick:o,children:"Copy"})]})]}),a.jsx("pre",{className:`text-sm p-3 ${r?"whitespace-pre-wrap break-words":"whitespace-pre overflow-x-auto"}`,children:a.jsx("code",{children:t})})]})}const ks={theme:"blackwhite",density:"comfortable",fontScale:1,defaultReasoning:!1,codeWrapDefault:!1};function Nl(){try{const e=localStorage.getItem("appSettings");if(e)return{...ks,...JSON.parse(e)}}catch{}return ks}function ai(e){const t=document.body;Array.from(t.classList).filter(l=>l.startsWith("theme-")).forEach(l=>t.classList.remove(l));const n=`theme-${e.theme}`;t.classList.add(n);const r=["dark","blackwhite","midnight","highcontrast","ruby","ocean","magma","seagreen","openai","gemini","anthropic","perplexity"];t.classList.toggle("theme-light",e.theme==="light"),t.classList.toggle("theme-dark",r.includes(e.theme)),t.classList.toggle("density-compact",e.density==="compact"),t.style.setProperty("--font-scale",String(e.fontScale))}function yp({open:e,onClose:t,onSave:n}){const[r,l]=L.useState(Nl()),[o,i]=L.useState({}),[u,s]=L.useState(!1);async function f(h,g){const m=(()=>{try{return localStorage.getItem("client_id")||""}catch{return""}})(),x=new Headers((g==null?void 0:g.headers)||{});!x.has("X-Client-ID")&&m&&x.set("X-Client-ID",m);const k=await fetch(h,{...g,headers:x});if(!k.ok)throw new Error(String(k.status));return k.json()}return L.useEffect(()=>{e&&(l(Nl()),(async()=>{s(!0);try{const h=await f("/api/settings");i(h||{})}catch{i({})}finally{s(!1)}})())},[e]),e?a.jsxs("div",{className:"fixed inset-0 z-50 flex items-center justify-center",children:[a.jsx("div",{className:"absolute inset-0 bg-black/60",onClick:t}),a.jsxs("div",{className:"relative w-full max-w-lg glass rounded-lg p-4",children:[a.jsxs("div",{className:"flex items-center justify-between mb-3",children:[a.jsx("h2",{className:"text-lg font-semibold",children:"Settings"}),a.jsx("button",{className:"px-2 py-1 rounded border border-white/10 hover:bg-white/10",onClick:t,children:"Close"})]}),a.jsxs("div",{className:"space-y-4 text-sm",children:[a.jsxs("div",{children:[a.jsx("label",{className:"block mb-1 text-slate-300",children:"Theme"}),a.jsxs("select",{className:"w-full bg-slate-800/60 border border-white/10 rounded px-2 py-1",value:r.theme,onChange:h=>l(g=>({...g,theme:h.target.value})),children:[a.jsxs("optgroup",{label:"Base",children:[a.jsx("option",{value:"blackwhite",children:"Black & White"}),a.jsx("option",{value:"dark",children:"Dark"}),a.jsx("option",{value:"light",children:"Light"}),a.jsx("option",{value:"midnight",children:"Midnight"}),a.jsx("option",{value:"highcontrast",children:"High Contrast"}),a.jsx("option",{value:"ruby",children:"Ruby"}),a.jsx("option",{value:"ocean",children:"Ocean"}),a.jsx("option",{value:"magma",children:"Magma"}),a.jsx("option",{value:"seagreen",children:"Sea Green"})]}),a.jsxs("optgroup",{label:"AI Model Themed",children:[a.jsx("option",{value:"openai",children:"OpenAI"}),a.jsx("option",{value:"gemini",children:"Gemini"}),a.jsx("option",{value:"anthropic",children:"Anthropic"}),a.jsx("option",{value:"perplexity",children:"Perplexity"})]})]})]}),a.jsxs("div",{children:[a.jsx("label",{className:"block mb-1 text-slate-300",children:"Density"}),a.jsxs("select",{className:"w-full bg-slate-800/60 border border-white/10 rounded px-2 py-1",value:r.density,onChange:h=>l(g=>({...g,density:h.target.value})),children:[a.jsx("option",{value:"comfortable",children:"Comfortable"}),a.jsx("option",{value:"compact",children:"Compact"})]})]}),a.jsxs("div",{children:[a.jsx("label",{className:"block mb-1 text-slate-300",children:"Font scale"}),a.jsx("input",{type:"range",min:.9,max:1.2,step:.05,value:r.fontScale,onChange:h=>l(g=>({...g,fontScale:Number(h.target.value)})),className:"w-full"})]}),a.jsxs("div",{className:"flex items-center gap-2",children:[a.jsx("input",{id:"def-reason",type:"checkbox",checked:r.defaultReasoning,onChange:h=>l(g=>({...g,defaultReasoning:h.target.checked}))}),a.jsx("label",{htmlFor:"def-reason",children:"Enable reasoning by default"})]}),a.jsxs("div",{className:"flex items-center gap-2",children:[a.jsx("input",{id:"code-wrap",type:"checkbox",checked:r.codeWrapDefault,onChange:h=>l(g=>({...g,codeWrapDefault:h.target.checked}))}),a.jsx("label",{htmlFor:"code-wrap",children:"Wrap code blocks by default"})]}),a.jsx("hr",{className:"border-white/10"}),a.jsxs("div",{children:[a.jsx("div",{className:"mb-2 text-slate-300",children:"Backend defaults"}),a.jsx("label",{className:"block mb-1",children:"Default provider"}),a.jsx("select",{className:"w-full bg-slate-800/60 border border-white/10 rounded px-2 py-1",value:o.provider||"",onChange:h=>i(g=>({...g,provider:h.target.value})),children:["","openai","openrouter","anthropic","gemini","azure","ollama","together","fireworks","perplexity","mistral","deepseek","cohere","litellm","vllm"].map(h=>a.jsx("option",{value:h,children:h||"—"},h))})]}),a.jsxs("div",{children:[a.jsx("label",{className:"block mb-1",children:"Default model"}),a.jsx("input",{className:"w-full bg-slate-800/60 border border-white/10 rounded px-2 py-1",placeholder:"e.g. gpt-4o-mini",value:o.model||"",onChange:h=>i(g=>({...g,model:h.target.value}))})]}),a.jsx("div",{className:"grid grid-cols-1 md:grid-cols-2 gap-3",children:["OPENAI_API_KEY","OPENROUTER_API_KEY","ANTHROPIC_API_KEY","GEMINI_API_KEY","GOOGLE_API_KEY","AZURE_OPENAI_API_KEY","AZURE_OPENAI_ENDPOINT","TOGETHER_API_KEY","FIREWORKS_API_KEY","PERPLEXITY_API_KEY","MISTRAL_API_KEY","DEEPSEEK_API_KEY","COHERE_API_KEY","LITELLM_API_KEY","VLLM_API_KEY","LITELLM_BASE_URL","VLLM_BASE_URL"].map(h=>a.jsxs("div",{children:[a.jsx("label",{className:"block mb-1 text-slate-300",children:h}),a.jsx("input",{className:"w-full bg-slate-800/60 border border-white/10 rounded px-2 py-1",type:h.endsWith("_BASE_URL")?"text":"password",placeholder:o[h]===!0?"Set (leave blank to keep)":"Enter value or leave blank",value:typeof o[h]=="string"?o[h]:"",onChange:g=>i(m=>({...m,[h]:g.target.value}))})]},h))})]}),a.jsxs("div",{className:"mt-4 flex justify-end gap-2",children:[a.jsx("button",{className:"px-3 py-1.5 rounded border border-white/10 hover:bg-white/10",onClick:t,children:"Cancel"}),a.jsx("button",{disabled:u,className:"btn-primary",onClick:async()=>{localStorage.setItem("appSettings",JSON.stringify(r)),ai(r),n(r);const h={};Object.entries(o).forEach(([g,m])=>{(typeof m=="string"||["provider","model"].includes(g))&&(h[g]=m)});try{await f("/api/settings",{method:"POST",headers:{"Content-Type":"application/json"},body:JSON.stringify(h)})}catch{}t()},children:"Save"})]})]})]}):null}function Ss(e,t){const n=(e||"").toLowerCase(),r=(t||"").toLowerCase(),l={openai:{accent:"#00A67E",accentDark:"#008F6C"},openrouter:{accent:"#7c3aed",accentDark:"#6d28d9"},anthropic:{accent:"#C15F3C",accentDark:"#9E4B30"},gemini:{accent:"#4B79F7",accentDark:"#3A64D6"},azure:{accent:"#2563eb",accentDark:"#1d4ed8"},ollama:{accent:"#10b981",accentDark:"#059669"},together:{accent:"#ec4899",accentDark:"#db2777"},fireworks:{accent:"#f97316",accentDark:"#ea580c"},perplexity:{accent:"#00B3FF",accentDark:"#008FCC"},mistral:{accent:"#eab308",accentDark:"#ca8a04"},deepseek:{accent:"#06b6d4",accentDark:"#0891b2"},cohere:{accent:"#f59e0b",accentDark:"#d97706"}},o=[{test:s=>s.includes("gpt-4o")||s.includes("gpt-5"),accent:"#00A67E",accentDark:"#008F6C"},{test:s=>s.includes("sonnet")||s.includes("opus")||s.includes("claude"),accent:"#C15F3C",accentDark:"#9E4B30"},{test:s=>s.includes("mixtral")||s.includes("mistral"),accent:"#eab308",accentDark:"#ca8a04"},{test:s=>s.includes("llama")||s.includes("llama-3"),accent:"#4B79F7",accentDark:"#3A64D6"}];let i=l[n]||{accent:"#3b82f6",accentDark:"#2563eb"};for(const s of o)if(r&&s.test(r)){i={accent:s.accent,accentDark:s.accentDark};break}const u=document.body;u.style.setProperty("--accent",i.accent),u.style.setProperty("--accent-dark",i.accentDark),u.setAttribute("data-model-theme",`${n}:${r}`)}function wp(e){const t=new Date,n=new Date(t.getFullYear(),t.getMonth(),t.getDate()).getTime(),r=n-24*60*60*1e3,l=new Date(e.getFullYear(),e.getMonth(),e.getDate()).getTime();return l===n?"Today":l===r?"Yesterday":e.toLocaleDateString()}async function gt(e,t){const n=await fetch(e,t);if(!n.ok)throw new Error(`${n.status}`);return n.json()}function xp(){const[e,t]=L.useState([]),[n,r]=L.useState(""),[l,o]=L.useState(null),[i,u]=L.useState([{role:"system",content:"You are a helpful assistant."}]),[s,f]=L.useState(""),[h,g]=L.useState("openai"),[m,x]=L.useState(""),[k,S]=L.useState([]),[O,d]=L.useState(!1),[c,p]=L.useState(!1),[y,E]=L.useState(""),[j,N]=L.useState(""),P=L.useRef(null),[K,R]=L.useState(void 0),[Ie,pt]=L.useState(0),[At,In]=L.useState(0),Me=L.useRef(""),oe=L.useRef(null),tt=L.useRef(null),[C,T]=L.useState(!1),[D,$]=L.useState(!1),[B,$t]=L.useState(Nl());L.useEffect(()=>{ai(B)},[B]),L.useEffect(()=>{const v=tt.current;if(!v)return;(v.scrollTop+v.clientHeight>v.scrollHeight-200||O)&&(v.scrollTop=v.scrollHeight)},[i,y,j,O]),L.useEffect(()=>()=>{var v;oe.current&&(window.clearInterval(oe.current),oe.current=null);try{(v=P.current)==null||v.close()}catch{}P.current=null},[]);function nt(){oe.current||(oe.current=window.setInterval(()=>{const v=Me.current;if(!v)return;const z=Math.min(v.length,4),U=v.slice(0,z);Me.current=v.slice(z),E(Y=>Y+U)},16))}function nn(v){v&&(Me.current+=v,nt())}L.useEffect(()=>{["openai","gemini","anthropic","perplexity"].includes(B.theme)||Ss(h,m)},[h,m,B.theme]);const We=L.useMemo(()=>e.filter(v=>(v.title||"").toLowerCase().includes(n.toLowerCase())),[e,n]),ht=L.useMemo(()=>{const v=We.filter(J=>J.pinned),z=We.filter(J=>!J.pinned),U={Today:[],Yesterday:[],Earlier:[]},Y=new Date,de=new Date(Y.getFullYear(),Y.getMonth(),Y.getDate()).getTime(),ne=de-24*60*60*1e3;for(const J of z){const mt=J.updated_at?new Date(J.updated_at).getTime():0;mt>=de?U.Today.push(J):mt>=ne?U.Yesterday.push(J):U.Earlier.push(J)}return{pinned:v,byDay:U}},[We]);async function lu(v){try{await gt(`/api/conversations/${encodeURIComponent(v)}`,{method:"DELETE"})}catch{}await rn(),l===v&&(o(null),u([{role:"system",content:"You are a helpful assistant."}]))}L.useEffect(()=>{(async()=>(await rn(),await Oc()))()},[]),L.useEffect(()=>{const v=tt.current;if(!v)return;const z=()=>{T(v.scrollTop+v.clientHeight<v.scrollHeight-200)};return v.addEventListener("scroll",z),z(),()=>v.removeEventListener("scroll",z)},[]),L.useEffect(()=>{const v=Nl();$t(v),ai(v),p(!!v.defaultReasoning)},[]),L.useEffect(()=>{Ss(h,m)},[h,m]),L.useEffect(()=>{const v=tt.current;!v||C||(v.scrollTop=v.scrollHeight)},[i,y]);async function rn(){var z;const v=await gt("/api/conversations");t(v.conversations||[]),!l&&((z=v.conversations)!=null&&z[0])&&await Cr(v.conversations[0].id)}async function Cr(v){o(v);const z=await gt(`/api/conversations/${encodeURIComponent(v)}`);u(z.messages||[{role:"system",content:"You are a helpful assistant."}])}async function ou(){const v=await gt("/api/conversations",{method:"POST",headers:{"Content-Type":"application/json"},body:JSON.stringify({})});o(v.id),await rn(),await Cr(v.id)}async function iu(v){await gt(`/api/conversations/${encodeURIComponent(v.id)}`,{method:"PATCH",headers:{"Content-Type":"application/json"},body:JSON.stringify({pinned:!v.pinned})}),await rn()}async function Oc(){const v=await gt("/api/settings");v.provider&&g(v.provider),await su(v.provider||h),v.model&&x(v.model)}async function uu(v){l&&(await gt(`/api/conversations/${encodeURIComponent(l)}`,{method:"PATCH",headers:{"Content-Type":"application/json"},body:JSON.stringify({messages:v})}),u(v),await rn())}async function su(v){try{const z=await gt(`/api/models/${encodeURIComponent(v)}`);S(z.models||[])}catch{S([])}}async function Wl(){const v=s.trim();if(!v)return;l||await ou(),f("");const z={role:"user",content:v},U=[...i,z];u(U);const Y=window.location.protocol==="https:"?"wss":"ws",de=new WebSocket(`${Y}://${window.location.host}/ws/chat`);P.current=de,d(!0);let ne="",J="unknown";E(""),N(""),R(Date.now()),pt(0),In(0),Me.current="",oe.current&&(window.clearInterval(oe.current),oe.current=null),de.onopen=()=>{const mt=l;de.send(JSON.stringify({messages:U,provider:h,model:m,conversation_id:mt,reasoning:c}))},de.onmessage=mt=>{var Nr;const Bt=mt.data;if(Bt==="[END]"){d(!1);try{(Nr=P.current)==null||Nr.close()}catch{}if(P.current=null,Me.current){const se=Me.current;Me.current="",E(V=>V+se)}oe.current&&(window.clearInterval(oe.current),oe.current=null),u(se=>[...se,{role:"assistant",content:J==="answer"?y:ne,reasoning:j||void 0}]),E(""),N(""),rn();return}if(ne+=Bt,pt(se=>{const V=se+(typeof Bt=="string"?Bt.length:0),ee=K||Date.now(),je=Math.max(.001,(Date.now()-ee)/1e3);return In(Math.round(V/4/je)),V}),J==="unknown"){const se=ne.indexOf("Reasoning:"),V=ne.indexOf("Answer:");if(se!==-1&&V!==-1&&V>se){const ee=ne.slice(se+10,V).trim(),je=ne.slice(V+7);N(ee),J="answer",nn(je);return}if(se!==-1&&V===-1){const ee=ne.slice(se+10);N(ee.trim());return}}if(J==="reason"){const se=ne.indexOf("Answer:"),V=ne.indexOf("Reasoning:");if(se>=0){const je=ne.slice(V+10).slice(0,se-(V+10)),Hl=ne.slice(se+7);N(je),E(Hl),J="answer"}else{const ee=ne.slice(V+10),je=ee.indexOf(`
-
-`);if(je>=0){const Hl=ee.slice(0,je),Uc=ee.slice(je+2);N(Hl),E(Uc),J="answer"}else N(ee)}return}nn(Bt)},de.onerror=()=>{d(!1),P.current=null},de.onclose=()=>{d(!1),P.current=null}}function au(){var z;try{(z=P.current)==null||z.close()}catch{}if(P.current=null,oe.current&&(window.clearInterval(oe.current),oe.current=null),Me.current){const U=Me.current;Me.current="",E(Y=>Y+U)}d(!1);const v=y.trim();v&&u(U=>[...U,{role:"assistant",content:v,reasoning:j||void 0}]),E(""),N("")}function Fc({m:v,idx:z}){const[U,Y]=L.useState(!1),[de,ne]=L.useState(v.content),J=v.role==="user",mt=async()=>{try{await navigator.clipboard.writeText(v.content)}catch{}},Bt=async()=>{const V=i.filter((ee,je)=>je!==z);await uu(V)},Nr=async()=>{const V=i.map((ee,je)=>je===z?{...ee,content:de}:ee);await uu(V),Y(!1)},se=async()=>{let V=null;for(let ee=z-1;ee>=0;ee--)if(i[ee].role==="user"){V=i[ee].content;break}V&&(f(V),await Wl())};return a.jsxs("div",{className:`flex gap-3 ${v.role==="user"?"justify-end":""}`,children:[v.role==="assistant"&&a.jsx("div",{className:"w-8 h-8 rounded-full bg-brand flex items-center justify-center",children:ws(m,16)}),a.jsxs("div",{className:`group rounded-2xl px-3 py-2 border relative ${v.role==="user"?"bg-slate-800/60 border-white/10":"bg-slate-900/60 border-white/10"} shadow-[inset_0_1px_0_rgba(255,255,255,0.05)]`,style:{maxWidth:"80%"},children:[a.jsxs("div",{className:"absolute -top-2 right-1 opacity-0 group-hover:opacity-100 transition text-xs flex gap-2",children:[a.jsx("button",{className:"px-2 py-0.5 bg-white/10 rounded",onClick:mt,children:"Copy"}),v.role==="assistant"&&a.jsx("button",{className:"px-2 py-0.5 bg-white/10 rounded",onClick:se,children:"Regenerate"}),J&&!U&&a.jsx("button",{className:"px-2 py-0.5 bg-white/10 rounded",onClick:()=>Y(!0),children:"Edit"}),a.jsx("button",{className:"px-2 py-0.5 bg-white/10 rounded",onClick:Bt,children:"Delete"}),U&&a.jsxs(a.Fragment,{children:[a.jsx("button",{className:"px-2 py-0.5 bg-brand rounded",onClick:Nr,children:"Save"}),a.jsx("button",{className:"px-2 py-0.5 bg-white/10 rounded",onClick:()=>{Y(!1),ne(v.content)},children:"Cancel"})]})]}),U?a.jsx("textarea",{className:"w-full bg-slate-800/60 border border-white/10 rounded p-2 text-sm",rows:Math.min(10,Math.max(3,v.content.split(`
-`).length)),value:de,onChange:V=>ne(V.target.value)}):a.jsx("div",{className:"text-slate-100 text-sm",children:v.role==="assistant"?a.jsxs(a.Fragment,{children:[v.reasoning&&a.jsx("div",{className:"mb-2 rounded-lg border border-amber-300/20 bg-amber-900/10 p-2 text-amber-200 text-xs",children:v.reasoning}),a.jsx(xs,{content:v.content,wrapDefault:B.codeWrapDefault})]}):a.jsx("div",{className:"whitespace-pre-wrap",children:v.content})})]}),v.role==="user"&&a.jsx("div",{className:"w-8 h-8 rounded-full bg-accent flex items-center justify-center",children:"U"})]})}return a.jsxs("div",{className:"h-screen grid grid-cols-[300px_1fr] gap-0",children:[a.jsxs("aside",{className:"glass border-r",children:[a.jsxs("div",{className:"p-3 flex items-center gap-2",children:[a.jsx("button",{className:"btn-primary",onClick:ou,children:"New"}),a.jsx("input",{className:"ml-auto bg-slate-800/60 border border-white/10 rounded px-2 py-1 w-full",placeholder:"Search",value:n,onChange:v=>r(v.target.value)})]}),a.jsxs("div",{className:"overflow-y-auto min-h-0 p-2 space-y-2",children:[ht.pinned.length>0&&a.jsxs("div",{children:[a.jsx("div",{className:"px-2 text-xs uppercase text-slate-400 mb-1",children:"Pinned"}),a.jsx("div",{className:"space-y-1",children:ht.pinned.map(v=>a.jsx("div",{className:`w-full px-2 py-1 rounded hover:bg-white/5 ${l===v.id?"bg-white/10":""}`,children:a.jsxs("div",{className:"flex items-center justify-between gap-2",children:[a.jsx("button",{className:"flex-1 text-left truncate",onClick:()=>Cr(v.id),children:v.title||"Untitled"}),a.jsxs("div",{className:"flex items-center gap-1 text-xs text-slate-400",children:[a.jsx("button",{className:"px-1 hover:text-white",onClick:z=>{z.stopPropagation(),iu(v)},children:"Unpin"}),a.jsx("button",{className:"px-1 text-red-300 hover:text-red-200",onClick:z=>{z.stopPropagation(),lu(v.id)},children:"Delete"})]})]})},v.id))})]}),Object.entries(ht.byDay).map(([v,z])=>z.length?a.jsxs("div",{children:[a.jsx("div",{className:"px-2 text-xs uppercase text-slate-400 mb-1",children:v}),a.jsx("div",{className:"space-y-1",children:z.map(U=>a.jsx("div",{className:`w-full px-2 py-1 rounded hover:bg-white/5 ${l===U.id?"bg-white/10":""}`,children:a.jsxs("div",{className:"flex items-center justify-between gap-2",children:[a.jsx("button",{className:"flex-1 text-left truncate",onClick:()=>Cr(U.id),children:U.title||"Untitled"}),a.jsxs("div",{className:"flex items-center gap-1 text-xs text-slate-400",children:[a.jsx("button",{className:"px-1 hover:text-white",onClick:Y=>{Y.stopPropagation(),iu(U)},children:"Pin"}),a.jsx("button",{className:"px-1 text-red-300 hover:text-red-200",onClick:Y=>{Y.stopPropagation(),lu(U.id)},children:"Delete"})]})]})},U.id))})]},v):null)]})]}),a.jsxs("main",{className:"flex flex-col min-h-0",children:[a.jsxs("header",{className:"glass flex items-center justify-between px-4 py-2 border-b",children:[a.jsxs("div",{className:"flex items-center gap-2",children:[a.jsx("img",{src:"/assets/Logo/fern-Ico.png",alt:"Fern",className:"h-6 w-6 object-contain",onError:v=>{v.currentTarget.onerror=null,v.currentTarget.src="/assets/Logo/fern.svg"}}),a.jsx("h1",{className:"font-semibold",children:"Fern"})]}),a.jsxs("div",{className:"flex items-center gap-2",children:[a.jsxs("div",{className:"flex items-center gap-1 text-sm text-slate-300",children:[hp(h,16),a.jsx("span",{className:"hidden md:inline",children:h})]}),a.jsx("select",{className:"bg-slate-800/60 border border-white/10 rounded px-2 py-1",value:h,onChange:async v=>{const z=v.target.value;g(z),await su(z)},children:["openai","openrouter","anthropic","gemini","azure","ollama","together","fireworks","perplexity","mistral","deepseek","cohere","litellm","vllm"].map(v=>a.jsx("option",{value:v,children:v},v))}),a.jsxs("select",{className:"bg-slate-800/60 border border-white/10 rounded px-2 py-1",value:m,onChange:v=>x(v.target.value),children:[a.jsx("option",{value:"",children:"Select a model"}),k.map(v=>a.jsx("option",{value:v.id,children:v.name||v.id},v.id))]}),a.jsxs("label",{className:"text-sm flex items-center gap-1",children:[a.jsx("input",{type:"checkbox",checked:c,onChange:v=>p(v.target.checked)})," Reasoning"]}),a.jsx("button",{className:"px-2 py-1 rounded border border-white/10 hover:bg-white/10",onClick:()=>$(!0),children:"Settings"})]})]}),a.jsxs("div",{ref:tt,className:"flex-1 overflow-y-auto p-4",children:[a.jsxs("div",{className:"max-w-3xl mx-auto mb-6 flex items-center justify-center",children:[a.jsx("img",{src:"/assets/Logo/fern.svg",alt:"Fern",className:"h-20 md:h-28 lg:h-32 opacity-95 drop-shadow",onError:v=>{var U;const z=v.currentTarget;z.style.display="none",(U=z.nextSibling)==null||U.classList.remove("hidden")}}),a.jsx("div",{className:"hidden text-3xl md:text-4xl font-extrabold tracking-wide",children:"Fern"})]}),i.filter(v=>v.role!=="system").length===0&&a.jsxs("div",{className:"max-w-2xl mx-auto p-4 rounded-lg border border-white/10 bg-slate-900/60",children:[a.jsx("div",{className:"mb-2 text-slate-300",children:"Try one of these"}),a.jsx("div",{className:"flex flex-wrap gap-2",children:["Summarize an article","Write Python","Explain a concept","Create a plan"].map((v,z)=>a.jsx("button",{className:"px-3 py-1 rounded border border-white/10 hover:bg-white/5",onClick:()=>f(v),children:v},z))})]}),a.jsxs("div",{className:"max-w-3xl mx-auto space-y-3",children:[(()=>{const v=[];let z=null;return i.filter(Y=>Y.role!=="system").forEach((Y,de)=>{if(Y.created_at){const ne=new Date(Y.created_at),J=wp(ne);J!==z&&(z=J,v.push(a.jsx("div",{className:"sticky top-2 z-10",children:a.jsx("div",{className:"mx-auto w-fit px-3 py-1 text-xs text-slate-300 border border-white/10 rounded-full bg-slate-900/70 backdrop-blur",children:J})},`sep-${de}`)))}v.push(a.jsx(Fc,{m:Y,idx:de},de))}),v})(),(y||j)&&a.jsxs("div",{className:"flex gap-3",children:[a.jsx("div",{className:"w-8 h-8 rounded-full bg-accent flex items-center justify-center",children:ws(m,16)}),a.jsxs("div",{className:"rounded-2xl px-3 py-2 border bg-slate-900/60 border-white/10 space-y-2",style:{maxWidth:"80%"},children:[j&&a.jsx("div",{className:"rounded-lg border border-amber-300/20 bg-amber-900/10 p-2 text-amber-200 text-xs whitespace-pre-wrap",children:j}),y&&a.jsxs("div",{className:"text-slate-100 text-sm space-y-2",children:[a.jsx(xs,{content:y,wrapDefault:B.codeWrapDefault}),a.jsxs("div",{className:"flex items-center gap-2 text-xs text-slate-400",children:[a.jsx("span",{className:"inline-block w-2 h-4 align-baseline bg-slate-300/80 animate-pulse"}),a.jsxs("span",{children:[At," tok/s"]})]})]})]})]}),O&&!y&&a.jsxs("div",{className:"flex items-center gap-2 text-slate-300 text-sm",children:[a.jsx("span",{className:"w-2 h-2 bg-slate-500 rounded-full animate-pulse"}),"Generating…"]})]})]}),C&&a.jsx("button",{className:"fixed right-6 bottom-24 px-3 py-1.5 rounded-full bg-accent text-white shadow hover:bg-accent-dark",onClick:()=>{const v=tt.current;v&&(v.scrollTop=v.scrollHeight)},children:"Jump to latest"}),a.jsxs("form",{className:"glass border-t p-3 flex items-center gap-2",onSubmit:v=>{v.preventDefault(),O?au():Wl()},children:[a.jsx("div",{className:"flex-1",children:a.jsx("textarea",{className:"w-full bg-slate-800/60 border border-white/10 rounded-full px-4 py-2 h-11 resize-none",placeholder:"Ask something...",value:s,onChange:v=>f(v.target.value),onKeyDown:v=>{v.key==="Enter"&&!v.shiftKey&&(v.preventDefault(),Wl())}})}),O?a.jsx("button",{type:"button",onClick:au,className:"rounded-full h-11 px-5 bg-red-600 hover:bg-red-500 text-white",children:"Stop"}):a.jsx("button",{className:"btn-primary rounded-full h-11 px-5",disabled:!s.trim(),type:"submit",children:"Send"})]})]}),a.jsx(yp,{open:D,onClose:()=>$(!1),onSave:v=>{$t(v),$(!1)}})]})}(()=>{try{let e=localStorage.getItem("client_id");e||(typeof crypto<"u"&&"randomUUID"in crypto?e=crypto.randomUUID():e=String(Math.random()).slice(2)+"-"+Date.now(),localStorage.setItem("client_id",e))}catch{}try{const e=localStorage.getItem("appSettings");let t="dark",n="comfortable",r=1;if(e){const o=JSON.parse(e);o&&(o.theme==="dark"||o.theme==="light")&&(t=o.theme),o&&(o.density==="comfortable"||o.density==="compact")&&(n=o.density),o&&typeof o.fontScale=="number"&&(r=o.fontScale)}else window.matchMedia&&window.matchMedia("(prefers-color-scheme: light)").matches&&(t="light");const l=document.body;l.classList.toggle("theme-light",t==="light"),l.classList.toggle("theme-dark",t==="dark"),l.classList.toggle("density-compact",n==="compact"),l.style.setProperty("--font-scale",String(r))}catch{}})();const kp=document.getElementById("root");Mc(kp).render(a.jsx(tf.StrictMode,{children:a.jsx(xp,{})}));
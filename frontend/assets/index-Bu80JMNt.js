@@ -1,49 +0,0 @@
-(function(){const t=document.createElement("link").relList;if(t&&t.supports&&t.supports("modulepreload"))return;for(const l of document.querySelectorAll('link[rel="modulepreload"]'))r(l);new MutationObserver(l=>{for(const o of l)if(o.type==="childList")for(const i of o.addedNodes)i.tagName==="LINK"&&i.rel==="modulepreload"&&r(i)}).observe(document,{childList:!0,subtree:!0});function n(l){const o={};return l.integrity&&(o.integrity=l.integrity),l.referrerPolicy&&(o.referrerPolicy=l.referrerPolicy),l.crossOrigin==="use-credentials"?o.credentials="include":l.crossOrigin==="anonymous"?o.credentials="omit":o.credentials="same-origin",o}function r(l){if(l.ep)return;l.ep=!0;const o=n(l);fetch(l.href,o)}})();function Nc(e){return e&&e.__esModule&&Object.prototype.hasOwnProperty.call(e,"default")?e.default:e}var ds={exports:{}},El={},ps={exports:{}},R={};/**
- * @license React
- * react.production.min.js
- *
- * Copyright (c) Facebook, Inc. and its affiliates.
- *
- * This source code is licensed under the MIT license found in the
- * LICENSE file in the root directory of this source tree.
- */var gr=Symbol.for("react.element"),jc=Symbol.for("react.portal"),_c=Symbol.for("react.fragment"),Pc=Symbol.for("react.strict_mode"),Tc=Symbol.for("react.profiler"),Lc=Symbol.for("react.provider"),zc=Symbol.for("react.context"),Dc=Symbol.for("react.forward_ref"),Rc=Symbol.for("react.suspense"),Oc=Symbol.for("react.memo"),Ic=Symbol.for("react.lazy"),eu=Symbol.iterator;function Mc(e){return e===null||typeof e!="object"?null:(e=eu&&e[eu]||e["@@iterator"],typeof e=="function"?e:null)}var hs={isMounted:function(){return!1},enqueueForceUpdate:function(){},enqueueReplaceState:function(){},enqueueSetState:function(){}},ms=Object.assign,vs={};function Pn(e,t,n){this.props=e,this.context=t,this.refs=vs,this.updater=n||hs}Pn.prototype.isReactComponent={};Pn.prototype.setState=function(e,t){if(typeof e!="object"&&typeof e!="function"&&e!=null)throw Error("setState(...): takes an object of state variables to update or a function which returns an object of state variables.");this.updater.enqueueSetState(this,e,t,"setState")};Pn.prototype.forceUpdate=function(e){this.updater.enqueueForceUpdate(this,e,"forceUpdate")};function gs(){}gs.prototype=Pn.prototype;function ii(e,t,n){this.props=e,this.context=t,this.refs=vs,this.updater=n||hs}var ui=ii.prototype=new gs;ui.constructor=ii;ms(ui,Pn.prototype);ui.isPureReactComponent=!0;var tu=Array.isArray,ys=Object.prototype.hasOwnProperty,si={current:null},ws={key:!0,ref:!0,__self:!0,__source:!0};function xs(e,t,n){var r,l={},o=null,i=null;if(t!=null)for(r in t.ref!==void 0&&(i=t.ref),t.key!==void 0&&(o=""+t.key),t)ys.call(t,r)&&!ws.hasOwnProperty(r)&&(l[r]=t[r]);var u=arguments.length-2;if(u===1)l.children=n;else if(1<u){for(var s=Array(u),f=0;f<u;f++)s[f]=arguments[f+2];l.children=s}if(e&&e.defaultProps)for(r in u=e.defaultProps,u)l[r]===void 0&&(l[r]=u[r]);return{$$typeof:gr,type:e,key:o,ref:i,props:l,_owner:si.current}}function Fc(e,t){return{$$typeof:gr,type:e.type,key:t,ref:e.ref,props:e.props,_owner:e._owner}}function ai(e){return typeof e=="object"&&e!==null&&e.$$typeof===gr}function Uc(e){var t={"=":"=0",":":"=2"};return"$"+e.replace(/[=:]/g,function(n){return t[n]})}var nu=/\/+/g;function Al(e,t){return typeof e=="object"&&e!==null&&e.key!=null?Uc(""+e.key):t.toString(36)}function Ar(e,t,n,r,l){var o=typeof e;(o==="undefined"||o==="boolean")&&(e=null);var i=!1;if(e===null)i=!0;else switch(o){case"string":case"number":i=!0;break;case"object":switch(e.$$typeof){case gr:case jc:i=!0}}if(i)return i=e,l=l(i),e=r===""?"."+Al(i,0):r,tu(l)?(n="",e!=null&&(n=e.replace(nu,"$&/")+"/"),Ar(l,t,n,"",function(f){return f})):l!=null&&(ai(l)&&(l=Fc(l,n+(!l.key||i&&i.key===l.key?"":(""+l.key).replace(nu,"$&/")+"/")+e)),t.push(l)),1;if(i=0,r=r===""?".":r+":",tu(e))for(var u=0;u<e.length;u++){o=e[u];var s=r+Al(o,u);i+=Ar(o,t,n,s,l)}else if(s=Mc(e),typeof s=="function")for(e=s.call(e),u=0;!(o=e.next()).done;)o=o.value,s=r+Al(o,u++),i+=Ar(o,t,n,s,l);else if(o==="object")throw t=String(e),Error("Objects are not valid as a React child (found: "+(t==="[object Object]"?"object with keys {"+Object.keys(e).join(", ")+"}":t)+"). If you meant to render a collection of children, use an array instead.");return i}function Er(e,t,n){if(e==null)return e;var r=[],l=0;return Ar(e,r,"","",function(o){return t.call(n,o,l++)}),r}function $c(e){if(e._status===-1){var t=e._result;t=t(),t.then(function(n){(e._status===0||e._status===-1)&&(e._status=1,e._result=n)},function(n){(e._status===0||e._status===-1)&&(e._status=2,e._result=n)}),e._status===-1&&(e._status=0,e._result=t)}if(e._status===1)return e._result.default;throw e._result}var ge={current:null},Br={transition:null},Ac={ReactCurrentDispatcher:ge,ReactCurrentBatchConfig:Br,ReactCurrentOwner:si};function ks(){throw Error("act(...) is not supported in production builds of React.")}R.Children={map:Er,forEach:function(e,t,n){Er(e,function(){t.apply(this,arguments)},n)},count:function(e){var t=0;return Er(e,function(){t++}),t},toArray:function(e){return Er(e,function(t){return t})||[]},only:function(e){if(!ai(e))throw Error("React.Children.only expected to receive a single React element child.");return e}};R.Component=Pn;R.Fragment=_c;R.Profiler=Tc;R.PureComponent=ii;R.StrictMode=Pc;R.Suspense=Rc;R.__SECRET_INTERNALS_DO_NOT_USE_OR_YOU_WILL_BE_FIRED=Ac;R.act=ks;R.cloneElement=function(e,t,n){if(e==null)throw Error("React.cloneElement(...): The argument must be a React element, but you passed "+e+".");var r=ms({},e.props),l=e.key,o=e.ref,i=e._owner;if(t!=null){if(t.ref!==void 0&&(o=t.ref,i=si.current),t.key!==void 0&&(l=""+t.key),e.type&&e.type.defaultProps)var u=e.type.defaultProps;for(s in t)ys.call(t,s)&&!ws.hasOwnProperty(s)&&(r[s]=t[s]===void 0&&u!==void 0?u[s]:t[s])}var s=arguments.length-2;if(s===1)r.children=n;else if(1<s){u=Array(s);for(var f=0;f<s;f++)u[f]=arguments[f+2];r.children=u}return{$$typeof:gr,type:e.type,key:l,ref:o,props:r,_owner:i}};R.createContext=function(e){return e={$$typeof:zc,_currentValue:e,_currentValue2:e,_threadCount:0,Provider:null,Consumer:null,_defaultValue:null,_globalName:null},e.Provider={$$typeof:Lc,_context:e},e.Consumer=e};R.createElement=xs;R.createFactory=function(e){var t=xs.bind(null,e);return t.type=e,t};R.createRef=function(){return{current:null}};R.forwardRef=function(e){return{$$typeof:Dc,render:e}};R.isValidElement=ai;R.lazy=function(e){return{$$typeof:Ic,_payload:{_status:-1,_result:e},_init:$c}};R.memo=function(e,t){return{$$typeof:Oc,type:e,compare:t===void 0?null:t}};R.startTransition=function(e){var t=Br.transition;Br.transition={};try{e()}finally{Br.transition=t}};R.unstable_act=ks;R.useCallback=function(e,t){return ge.current.useCallback(e,t)};R.useContext=function(e){return ge.current.useContext(e)};R.useDebugValue=function(){};R.useDeferredValue=function(e){return ge.current.useDeferredValue(e)};R.useEffect=function(e,t){return ge.current.useEffect(e,t)};R.useId=function(){return ge.current.useId()};R.useImperativeHandle=function(e,t,n){return ge.current.useImperativeHandle(e,t,n)};R.useInsertionEffect=function(e,t){return ge.current.useInsertionEffect(e,t)};R.useLayoutEffect=function(e,t){return ge.current.useLayoutEffect(e,t)};R.useMemo=function(e,t){return ge.current.useMemo(e,t)};R.useReducer=function(e,t,n){return ge.current.useReducer(e,t,n)};R.useRef=function(e){return ge.current.useRef(e)};R.useState=function(e){return ge.current.useState(e)};R.useSyncExternalStore=function(e,t,n){return ge.current.useSyncExternalStore(e,t,n)};R.useTransition=function(){return ge.current.useTransition()};R.version="18.3.1";ps.exports=R;var D=ps.exports;const Bc=Nc(D);/**
- * @license React
- * react-jsx-runtime.production.min.js
- *
- * Copyright (c) Facebook, Inc. and its affiliates.
- *
- * This source code is licensed under the MIT license found in the
- * LICENSE file in the root directory of this source tree.
- */var Wc=D,Vc=Symbol.for("react.element"),Hc=Symbol.for("react.fragment"),Qc=Object.prototype.hasOwnProperty,Kc=Wc.__SECRET_INTERNALS_DO_NOT_USE_OR_YOU_WILL_BE_FIRED.ReactCurrentOwner,Yc={key:!0,ref:!0,__self:!0,__source:!0};function Ss(e,t,n){var r,l={},o=null,i=null;n!==void 0&&(o=""+n),t.key!==void 0&&(o=""+t.key),t.ref!==void 0&&(i=t.ref);for(r in t)Qc.call(t,r)&&!Yc.hasOwnProperty(r)&&(l[r]=t[r]);if(e&&e.defaultProps)for(r in t=e.defaultProps,t)l[r]===void 0&&(l[r]=t[r]);return{$$typeof:Vc,type:e,key:o,ref:i,props:l,_owner:Kc.current}}El.Fragment=Hc;El.jsx=Ss;El.jsxs=Ss;ds.exports=El;var c=ds.exports,Es={exports:{}},ze={},Cs={exports:{}},Ns={};/**
- * @license React
- * scheduler.production.min.js
- *
- * Copyright (c) Facebook, Inc. and its affiliates.
- *
- * This source code is licensed under the MIT license found in the
- * LICENSE file in the root directory of this source tree.
- */(function(e){function t(C,T){var L=C.length;C.push(T);e:for(;0<L;){var W=L-1>>>1,J=C[W];if(0<l(J,T))C[W]=T,C[L]=J,L=W;else break e}}function n(C){return C.length===0?null:C[0]}function r(C){if(C.length===0)return null;var T=C[0],L=C.pop();if(L!==T){C[0]=L;e:for(var W=0,J=C.length,Ut=J>>>1;W<Ut;){var Ge=2*(W+1)-1,$t=C[Ge],nt=Ge+1,g=C[nt];if(0>l($t,L))nt<J&&0>l(g,$t)?(C[W]=g,C[nt]=L,W=nt):(C[W]=$t,C[Ge]=L,W=Ge);else if(nt<J&&0>l(g,L))C[W]=g,C[nt]=L,W=nt;else break e}}return T}function l(C,T){var L=C.sortIndex-T.sortIndex;return L!==0?L:C.id-T.id}if(typeof performance=="object"&&typeof performance.now=="function"){var o=performance;e.unstable_now=function(){return o.now()}}else{var i=Date,u=i.now();e.unstable_now=function(){return i.now()-u}}var s=[],f=[],h=1,v=null,m=3,x=!1,k=!1,S=!1,F=typeof setTimeout=="function"?setTimeout:null,d=typeof clearTimeout=="function"?clearTimeout:null,a=typeof setImmediate<"u"?setImmediate:null;typeof navigator<"u"&&navigator.scheduling!==void 0&&navigator.scheduling.isInputPending!==void 0&&navigator.scheduling.isInputPending.bind(navigator.scheduling);function p(C){for(var T=n(f);T!==null;){if(T.callback===null)r(f);else if(T.startTime<=C)r(f),T.sortIndex=T.expirationTime,t(s,T);else break;T=n(f)}}function y(C){if(S=!1,p(C),!k)if(n(s)!==null)k=!0,Ft(E);else{var T=n(f);T!==null&&en(y,T.startTime-C)}}function E(C,T){k=!1,S&&(S=!1,d(P),P=-1),x=!0;var L=m;try{for(p(T),v=n(s);v!==null&&(!(v.expirationTime>T)||C&&!Ne());){var W=v.callback;if(typeof W=="function"){v.callback=null,m=v.priorityLevel;var J=W(v.expirationTime<=T);T=e.unstable_now(),typeof J=="function"?v.callback=J:v===n(s)&&r(s),p(T)}else r(s);v=n(s)}if(v!==null)var Ut=!0;else{var Ge=n(f);Ge!==null&&en(y,Ge.startTime-T),Ut=!1}return Ut}finally{v=null,m=L,x=!1}}var _=!1,N=null,P=-1,B=5,z=-1;function Ne(){return!(e.unstable_now()-z<B)}function tt(){if(N!==null){var C=e.unstable_now();z=C;var T=!0;try{T=N(!0,C)}finally{T?$e():(_=!1,N=null)}}else _=!1}var $e;if(typeof a=="function")$e=function(){a(tt)};else if(typeof MessageChannel<"u"){var zn=new MessageChannel,Dn=zn.port2;zn.port1.onmessage=tt,$e=function(){Dn.postMessage(null)}}else $e=function(){F(tt,0)};function Ft(C){N=C,_||(_=!0,$e())}function en(C,T){P=F(function(){C(e.unstable_now())},T)}e.unstable_IdlePriority=5,e.unstable_ImmediatePriority=1,e.unstable_LowPriority=4,e.unstable_NormalPriority=3,e.unstable_Profiling=null,e.unstable_UserBlockingPriority=2,e.unstable_cancelCallback=function(C){C.callback=null},e.unstable_continueExecution=function(){k||x||(k=!0,Ft(E))},e.unstable_forceFrameRate=function(C){0>C||125<C?console.error("forceFrameRate takes a positive int between 0 and 125, forcing frame rates higher than 125 fps is not supported"):B=0<C?Math.floor(1e3/C):5},e.unstable_getCurrentPriorityLevel=function(){return m},e.unstable_getFirstCallbackNode=function(){return n(s)},e.unstable_next=function(C){switch(m){case 1:case 2:case 3:var T=3;break;default:T=m}var L=m;m=T;try{return C()}finally{m=L}},e.unstable_pauseExecution=function(){},e.unstable_requestPaint=function(){},e.unstable_runWithPriority=function(C,T){switch(C){case 1:case 2:case 3:case 4:case 5:break;default:C=3}var L=m;m=C;try{return T()}finally{m=L}},e.unstable_scheduleCallback=function(C,T,L){var W=e.unstable_now();switch(typeof L=="object"&&L!==null?(L=L.delay,L=typeof L=="number"&&0<L?W+L:W):L=W,C){case 1:var J=-1;break;case 2:J=250;break;case 5:J=1073741823;break;case 4:J=1e4;break;default:J=5e3}return J=L+J,C={id:h++,callback:T,priorityLevel:C,startTime:L,expirationTime:J,sortIndex:-1},L>W?(C.sortIndex=L,t(f,C),n(s)===null&&C===n(f)&&(S?(d(P),P=-1):S=!0,en(y,L-W))):(C.sortIndex=J,t(s,C),k||x||(k=!0,Ft(E))),C},e.unstable_shouldYield=Ne,e.unstable_wrapCallback=function(C){var T=m;return function(){var L=m;m=T;try{return C.apply(this,arguments)}finally{m=L}}}})(Ns);Cs.exports=Ns;var Gc=Cs.exports;/**
- * @license React
- * react-dom.production.min.js
- *
- * Copyright (c) Facebook, Inc. and its affiliates.
- *
- * This source code is licensed under the MIT license found in the
- * LICENSE file in the root directory of this source tree.
- */var Xc=D,Le=Gc;function w(e){for(var t="https://reactjs.org/docs/error-decoder.html?invariant="+e,n=1;n<arguments.length;n++)t+="&args[]="+encodeURIComponent(arguments[n]);return"Minified React error #"+e+"; visit "+t+" for the full message or use the non-minified dev environment for full errors and additional helpful warnings."}var js=new Set,er={};function qt(e,t){kn(e,t),kn(e+"Capture",t)}function kn(e,t){for(er[e]=t,e=0;e<t.length;e++)js.add(t[e])}var st=!(typeof window>"u"||typeof window.document>"u"||typeof window.document.createElement>"u"),po=Object.prototype.hasOwnProperty,Zc=/^[:A-Z_a-z\u00C0-\u00D6\u00D8-\u00F6\u00F8-\u02FF\u0370-\u037D\u037F-\u1FFF\u200C-\u200D\u2070-\u218F\u2C00-\u2FEF\u3001-\uD7FF\uF900-\uFDCF\uFDF0-\uFFFD][:A-Z_a-z\u00C0-\u00D6\u00D8-\u00F6\u00F8-\u02FF\u0370-\u037D\u037F-\u1FFF\u200C-\u200D\u2070-\u218F\u2C00-\u2FEF\u3001-\uD7FF\uF900-\uFDCF\uFDF0-\uFFFD\-.0-9\u00B7\u0300-\u036F\u203F-\u2040]*$/,ru={},lu={};function Jc(e){return po.call(lu,e)?!0:po.call(ru,e)?!1:Zc.test(e)?lu[e]=!0:(ru[e]=!0,!1)}function qc(e,t,n,r){if(n!==null&&n.type===0)return!1;switch(typeof t){case"function":case"symbol":return!0;case"boolean":return r?!1:n!==null?!n.acceptsBooleans:(e=e.toLowerCase().slice(0,5),e!=="data-"&&e!=="aria-");default:return!1}}function bc(e,t,n,r){if(t===null||typeof t>"u"||qc(e,t,n,r))return!0;if(r)return!1;if(n!==null)switch(n.type){case 3:return!t;case 4:return t===!1;case 5:return isNaN(t);case 6:return isNaN(t)||1>t}return!1}function ye(e,t,n,r,l,o,i){this.acceptsBooleans=t===2||t===3||t===4,this.attributeName=r,this.attributeNamespace=l,this.mustUseProperty=n,this.propertyName=e,this.type=t,this.sanitizeURL=o,this.removeEmptyString=i}var ae={};"children dangerouslySetInnerHTML defaultValue defaultChecked innerHTML suppressContentEditableWarning suppressHydrationWarning style".split(" ").forEach(function(e){ae[e]=new ye(e,0,!1,e,null,!1,!1)});[["acceptCharset","accept-charset"],["className","class"],["htmlFor","for"],["httpEquiv","http-equiv"]].forEach(function(e){var t=e[0];ae[t]=new ye(t,1,!1,e[1],null,!1,!1)});["contentEditable","draggable","spellCheck","value"].forEach(function(e){ae[e]=new ye(e,2,!1,e.toLowerCase(),null,!1,!1)});["autoReverse","externalResourcesRequired","focusable","preserveAlpha"].forEach(function(e){ae[e]=new ye(e,2,!1,e,null,!1,!1)});"allowFullScreen async autoFocus autoPlay controls default defer disabled disablePictureInPicture disableRemotePlayback formNoValidate hidden loop noModule noValidate open playsInline readOnly required reversed scoped seamless itemScope".split(" ").forEach(function(e){ae[e]=new ye(e,3,!1,e.toLowerCase(),null,!1,!1)});["checked","multiple","muted","selected"].forEach(function(e){ae[e]=new ye(e,3,!0,e,null,!1,!1)});["capture","download"].forEach(function(e){ae[e]=new ye(e,4,!1,e,null,!1,!1)});["cols","rows","size","span"].forEach(function(e){ae[e]=new ye(e,6,!1,e,null,!1,!1)});["rowSpan","start"].forEach(function(e){ae[e]=new ye(e,5,!1,e.toLowerCase(),null,!1,!1)});var ci=/[\-:]([a-z])/g;function fi(e){return e[1].toUpperCase()}"accent-height alignment-baseline arabic-form baseline-shift cap-height clip-path clip-rule color-interpolation color-interpolation-filters color-profile color-rendering dominant-baseline enable-background fill-opacity fill-rule flood-color flood-opacity font-family font-size font-size-adjust font-stretch font-style font-variant font-weight glyph-name glyph-orientation-horizontal glyph-orientation-vertical horiz-adv-x horiz-origin-x image-rendering letter-spacing lighting-color marker-end marker-mid marker-start overline-position overline-thickness paint-order panose-1 pointer-events rendering-intent shape-rendering stop-color stop-opacity strikethrough-position strikethrough-thickness stroke-dasharray stroke-dashoffset stroke-linecap stroke-linejoin stroke-miterlimit stroke-opacity stroke-width text-anchor text-decoration text-rendering underline-position underline-thickness unicode-bidi unicode-range units-per-em v-alphabetic v-hanging v-ideographic v-mathematical vector-effect vert-adv-y vert-origin-x vert-origin-y word-spacing writing-mode xmlns:xlink x-height".split(" ").forEach(function(e){var t=e.replace(ci,fi);ae[t]=new ye(t,1,!1,e,null,!1,!1)});"xlink:actuate xlink:arcrole xlink:role xlink:show xlink:title xlink:type".split(" ").forEach(function(e){var t=e.replace(ci,fi);ae[t]=new ye(t,1,!1,e,"http://www.w3.org/1999/xlink",!1,!1)});["xml:base","xml:lang","xml:space"].forEach(function(e){var t=e.replace(ci,fi);ae[t]=new ye(t,1,!1,e,"http://www.w3.org/XML/1998/namespace",!1,!1)});["tabIndex","crossOrigin"].forEach(function(e){ae[e]=new ye(e,1,!1,e.toLowerCase(),null,!1,!1)});ae.xlinkHref=new ye("xlinkHref",1,!1,"xlink:href","http://www.w3.org/1999/xlink",!0,!1);["src","href","action","formAction"].forEach(function(e){ae[e]=new ye(e,1,!1,e.toLowerCase(),null,!0,!0)});function di(e,t,n,r){var l=ae.hasOwnProperty(t)?ae[t]:null;(l!==null?l.type!==0:r||!(2<t.length)||t[0]!=="o"&&t[0]!=="O"||t[1]!=="n"&&t[1]!=="N")&&(bc(t,n,l,r)&&(n=null),r||l===null?Jc(t)&&(n===null?e.removeAttribute(t):e.setAttribute(t,""+n)):l.mustUseProperty?e[l.propertyName]=n===null?l.type===3?!1:"":n:(t=l.attributeName,r=l.attributeNamespace,n===null?e.removeAttribute(t):(l=l.type,n=l===3||l===4&&n===!0?"":""+n,r?e.setAttributeNS(r,t,n):e.setAttribute(t,n))))}var dt=Xc.__SECRET_INTERNALS_DO_NOT_USE_OR_YOU_WILL_BE_FIRED,Cr=Symbol.for("react.element"),nn=Symbol.for("react.portal"),rn=Symbol.for("react.fragment"),pi=Symbol.for("react.strict_mode"),ho=Symbol.for("react.profiler"),_s=Symbol.for("react.provider"),Ps=Symbol.for("react.context"),hi=Symbol.for("react.forward_ref"),mo=Symbol.for("react.suspense"),vo=Symbol.for("react.suspense_list"),mi=Symbol.for("react.memo"),vt=Symbol.for("react.lazy"),Ts=Symbol.for("react.offscreen"),ou=Symbol.iterator;function Rn(e){return e===null||typeof e!="object"?null:(e=ou&&e[ou]||e["@@iterator"],typeof e=="function"?e:null)}var Y=Object.assign,Bl;function Bn(e){if(Bl===void 0)try{throw Error()}catch(n){var t=n.stack.trim().match(/\n( *(at )?)/);Bl=t&&t[1]||""}return`
-`+Bl+e}var Wl=!1;function Vl(e,t){if(!e||Wl)return"";Wl=!0;var n=Error.prepareStackTrace;Error.prepareStackTrace=void 0;try{if(t)if(t=function(){throw Error()},Object.defineProperty(t.prototype,"props",{set:function(){throw Error()}}),typeof Reflect=="object"&&Reflect.construct){try{Reflect.construct(t,[])}catch(f){var r=f}Reflect.construct(e,[],t)}else{try{t.call()}catch(f){r=f}e.call(t.prototype)}else{try{throw Error()}catch(f){r=f}e()}}catch(f){if(f&&r&&typeof f.stack=="string"){for(var l=f.stack.split(`
-`),o=r.stack.split(`
-`),i=l.length-1,u=o.length-1;1<=i&&0<=u&&l[i]!==o[u];)u--;for(;1<=i&&0<=u;i--,u--)if(l[i]!==o[u]){if(i!==1||u!==1)do if(i--,u--,0>u||l[i]!==o[u]){var s=`
-`+l[i].replace(" at new "," at ");return e.displayName&&s.includes("<anonymous>")&&(s=s.replace("<anonymous>",e.displayName)),s}while(1<=i&&0<=u);break}}}finally{Wl=!1,Error.prepareStackTrace=n}return(e=e?e.displayName||e.name:"")?Bn(e):""}function ef(e){switch(e.tag){case 5:return Bn(e.type);case 16:return Bn("Lazy");case 13:return Bn("Suspense");case 19:return Bn("SuspenseList");case 0:case 2:case 15:return e=Vl(e.type,!1),e;case 11:return e=Vl(e.type.render,!1),e;case 1:return e=Vl(e.type,!0),e;default:return""}}function go(e){if(e==null)return null;if(typeof e=="function")return e.displayName||e.name||null;if(typeof e=="string")return e;switch(e){case rn:return"Fragment";case nn:return"Portal";case ho:return"Profiler";case pi:return"StrictMode";case mo:return"Suspense";case vo:return"SuspenseList"}if(typeof e=="object")switch(e.$$typeof){case Ps:return(e.displayName||"Context")+".Consumer";case _s:return(e._context.displayName||"Context")+".Provider";case hi:var t=e.render;return e=e.displayName,e||(e=t.displayName||t.name||"",e=e!==""?"ForwardRef("+e+")":"ForwardRef"),e;case mi:return t=e.displayName||null,t!==null?t:go(e.type)||"Memo";case vt:t=e._payload,e=e._init;try{return go(e(t))}catch{}}return null}function tf(e){var t=e.type;switch(e.tag){case 24:return"Cache";case 9:return(t.displayName||"Context")+".Consumer";case 10:return(t._context.displayName||"Context")+".Provider";case 18:return"DehydratedFragment";case 11:return e=t.render,e=e.displayName||e.name||"",t.displayName||(e!==""?"ForwardRef("+e+")":"ForwardRef");case 7:return"Fragment";case 5:return t;case 4:return"Portal";case 3:return"Root";case 6:return"Text";case 16:return go(t);case 8:return t===pi?"StrictMode":"Mode";case 22:return"Offscreen";case 12:return"Profiler";case 21:return"Scope";case 13:return"Suspense";case 19:return"SuspenseList";case 25:return"TracingMarker";case 1:case 0:case 17:case 2:case 14:case 15:if(typeof t=="function")return t.displayName||t.name||null;if(typeof t=="string")return t}return null}function Dt(e){switch(typeof e){case"boolean":case"number":case"string":case"undefined":return e;case"object":return e;default:return""}}function Ls(e){var t=e.type;return(e=e.nodeName)&&e.toLowerCase()==="input"&&(t==="checkbox"||t==="radio")}function nf(e){var t=Ls(e)?"checked":"value",n=Object.getOwnPropertyDescriptor(e.constructor.prototype,t),r=""+e[t];if(!e.hasOwnProperty(t)&&typeof n<"u"&&typeof n.get=="function"&&typeof n.set=="function"){var l=n.get,o=n.set;return Object.defineProperty(e,t,{configurable:!0,get:function(){return l.call(this)},set:function(i){r=""+i,o.call(this,i)}}),Object.defineProperty(e,t,{enumerable:n.enumerable}),{getValue:function(){return r},setValue:function(i){r=""+i},stopTracking:function(){e._valueTracker=null,delete e[t]}}}}function Nr(e){e._valueTracker||(e._valueTracker=nf(e))}function zs(e){if(!e)return!1;var t=e._valueTracker;if(!t)return!0;var n=t.getValue(),r="";return e&&(r=Ls(e)?e.checked?"true":"false":e.value),e=r,e!==n?(t.setValue(e),!0):!1}function qr(e){if(e=e||(typeof document<"u"?document:void 0),typeof e>"u")return null;try{return e.activeElement||e.body}catch{return e.body}}function yo(e,t){var n=t.checked;return Y({},t,{defaultChecked:void 0,defaultValue:void 0,value:void 0,checked:n??e._wrapperState.initialChecked})}function iu(e,t){var n=t.defaultValue==null?"":t.defaultValue,r=t.checked!=null?t.checked:t.defaultChecked;n=Dt(t.value!=null?t.value:n),e._wrapperState={initialChecked:r,initialValue:n,controlled:t.type==="checkbox"||t.type==="radio"?t.checked!=null:t.value!=null}}function Ds(e,t){t=t.checked,t!=null&&di(e,"checked",t,!1)}function wo(e,t){Ds(e,t);var n=Dt(t.value),r=t.type;if(n!=null)r==="number"?(n===0&&e.value===""||e.value!=n)&&(e.value=""+n):e.value!==""+n&&(e.value=""+n);else if(r==="submit"||r==="reset"){e.removeAttribute("value");return}t.hasOwnProperty("value")?xo(e,t.type,n):t.hasOwnProperty("defaultValue")&&xo(e,t.type,Dt(t.defaultValue)),t.checked==null&&t.defaultChecked!=null&&(e.defaultChecked=!!t.defaultChecked)}function uu(e,t,n){if(t.hasOwnProperty("value")||t.hasOwnProperty("defaultValue")){var r=t.type;if(!(r!=="submit"&&r!=="reset"||t.value!==void 0&&t.value!==null))return;t=""+e._wrapperState.initialValue,n||t===e.value||(e.value=t),e.defaultValue=t}n=e.name,n!==""&&(e.name=""),e.defaultChecked=!!e._wrapperState.initialChecked,n!==""&&(e.name=n)}function xo(e,t,n){(t!=="number"||qr(e.ownerDocument)!==e)&&(n==null?e.defaultValue=""+e._wrapperState.initialValue:e.defaultValue!==""+n&&(e.defaultValue=""+n))}var Wn=Array.isArray;function mn(e,t,n,r){if(e=e.options,t){t={};for(var l=0;l<n.length;l++)t["$"+n[l]]=!0;for(n=0;n<e.length;n++)l=t.hasOwnProperty("$"+e[n].value),e[n].selected!==l&&(e[n].selected=l),l&&r&&(e[n].defaultSelected=!0)}else{for(n=""+Dt(n),t=null,l=0;l<e.length;l++){if(e[l].value===n){e[l].selected=!0,r&&(e[l].defaultSelected=!0);return}t!==null||e[l].disabled||(t=e[l])}t!==null&&(t.selected=!0)}}function ko(e,t){if(t.dangerouslySetInnerHTML!=null)throw Error(w(91));return Y({},t,{value:void 0,defaultValue:void 0,children:""+e._wrapperState.initialValue})}function su(e,t){var n=t.value;if(n==null){if(n=t.children,t=t.defaultValue,n!=null){if(t!=null)throw Error(w(92));if(Wn(n)){if(1<n.length)throw Error(w(93));n=n[0]}t=n}t==null&&(t=""),n=t}e._wrapperState={initialValue:Dt(n)}}function Rs(e,t){var n=Dt(t.value),r=Dt(t.defaultValue);n!=null&&(n=""+n,n!==e.value&&(e.value=n),t.defaultValue==null&&e.defaultValue!==n&&(e.defaultValue=n)),r!=null&&(e.defaultValue=""+r)}function au(e){var t=e.textContent;t===e._wrapperState.initialValue&&t!==""&&t!==null&&(e.value=t)}function Os(e){switch(e){case"svg":return"http://www.w3.org/2000/svg";case"math":return"http://www.w3.org/1998/Math/MathML";default:return"http://www.w3.org/1999/xhtml"}}function So(e,t){return e==null||e==="http://www.w3.org/1999/xhtml"?Os(t):e==="http://www.w3.org/2000/svg"&&t==="foreignObject"?"http://www.w3.org/1999/xhtml":e}var jr,Is=function(e){return typeof MSApp<"u"&&MSApp.execUnsafeLocalFunction?function(t,n,r,l){MSApp.execUnsafeLocalFunction(function(){return e(t,n,r,l)})}:e}(function(e,t){if(e.namespaceURI!=="http://www.w3.org/2000/svg"||"innerHTML"in e)e.innerHTML=t;else{for(jr=jr||document.createElement("div"),jr.innerHTML="<svg>"+t.valueOf().toString()+"</svg>",t=jr.firstChild;e.firstChild;)e.removeChild(e.firstChild);for(;t.firstChild;)e.appendChild(t.firstChild)}});function tr(e,t){if(t){var n=e.firstChild;if(n&&n===e.lastChild&&n.nodeType===3){n.nodeValue=t;return}}e.textContent=t}var Qn={animationIterationCount:!0,aspectRatio:!0,borderImageOutset:!0,borderImageSlice:!0,borderImageWidth:!0,boxFlex:!0,boxFlexGroup:!0,boxOrdinalGroup:!0,columnCount:!0,columns:!0,flex:!0,flexGrow:!0,flexPositive:!0,flexShrink:!0,flexNegative:!0,flexOrder:!0,gridArea:!0,gridRow:!0,gridRowEnd:!0,gridRowSpan:!0,gridRowStart:!0,gridColumn:!0,gridColumnEnd:!0,gridColumnSpan:!0,gridColumnStart:!0,fontWeight:!0,lineClamp:!0,lineHeight:!0,opacity:!0,order:!0,orphans:!0,tabSize:!0,widows:!0,zIndex:!0,zoom:!0,fillOpacity:!0,floodOpacity:!0,stopOpacity:!0,strokeDasharray:!0,strokeDashoffset:!0,strokeMiterlimit:!0,strokeOpacity:!0,strokeWidth:!0},rf=["Webkit","ms","Moz","O"];Object.keys(Qn).forEach(function(e){rf.forEach(function(t){t=t+e.charAt(0).toUpperCase()+e.substring(1),Qn[t]=Qn[e]})});function Ms(e,t,n){return t==null||typeof t=="boolean"||t===""?"":n||typeof t!="number"||t===0||Qn.hasOwnProperty(e)&&Qn[e]?(""+t).trim():t+"px"}function Fs(e,t){e=e.style;for(var n in t)if(t.hasOwnProperty(n)){var r=n.indexOf("--")===0,l=Ms(n,t[n],r);n==="float"&&(n="cssFloat"),r?e.setProperty(n,l):e[n]=l}}var lf=Y({menuitem:!0},{area:!0,base:!0,br:!0,col:!0,embed:!0,hr:!0,img:!0,input:!0,keygen:!0,link:!0,meta:!0,param:!0,source:!0,track:!0,wbr:!0});function Eo(e,t){if(t){if(lf[e]&&(t.children!=null||t.dangerouslySetInnerHTML!=null))throw Error(w(137,e));if(t.dangerouslySetInnerHTML!=null){if(t.children!=null)throw Error(w(60));if(typeof t.dangerouslySetInnerHTML!="object"||!("__html"in t.dangerouslySetInnerHTML))throw Error(w(61))}if(t.style!=null&&typeof t.style!="object")throw Error(w(62))}}function Co(e,t){if(e.indexOf("-")===-1)return typeof t.is=="string";switch(e){case"annotation-xml":case"color-profile":case"font-face":case"font-face-src":case"font-face-uri":case"font-face-format":case"font-face-name":case"missing-glyph":return!1;default:return!0}}var No=null;function vi(e){return e=e.target||e.srcElement||window,e.correspondingUseElement&&(e=e.correspondingUseElement),e.nodeType===3?e.parentNode:e}var jo=null,vn=null,gn=null;function cu(e){if(e=xr(e)){if(typeof jo!="function")throw Error(w(280));var t=e.stateNode;t&&(t=Pl(t),jo(e.stateNode,e.type,t))}}function Us(e){vn?gn?gn.push(e):gn=[e]:vn=e}function $s(){if(vn){var e=vn,t=gn;if(gn=vn=null,cu(e),t)for(e=0;e<t.length;e++)cu(t[e])}}function As(e,t){return e(t)}function Bs(){}var Hl=!1;function Ws(e,t,n){if(Hl)return e(t,n);Hl=!0;try{return As(e,t,n)}finally{Hl=!1,(vn!==null||gn!==null)&&(Bs(),$s())}}function nr(e,t){var n=e.stateNode;if(n===null)return null;var r=Pl(n);if(r===null)return null;n=r[t];e:switch(t){case"onClick":case"onClickCapture":case"onDoubleClick":case"onDoubleClickCapture":case"onMouseDown":case"onMouseDownCapture":case"onMouseMove":case"onMouseMoveCapture":case"onMouseUp":case"onMouseUpCapture":case"onMouseEnter":(r=!r.disabled)||(e=e.type,r=!(e==="button"||e==="input"||e==="select"||e==="textarea")),e=!r;break e;default:e=!1}if(e)return null;if(n&&typeof n!="function")throw Error(w(231,t,typeof n));return n}var _o=!1;if(st)try{var On={};Object.defineProperty(On,"passive",{get:function(){_o=!0}}),window.addEventListener("test",On,On),window.removeEventListener("test",On,On)}catch{_o=!1}function of(e,t,n,r,l,o,i,u,s){var f=Array.prototype.slice.call(arguments,3);try{t.apply(n,f)}catch(h){this.onError(h)}}var Kn=!1,br=null,el=!1,Po=null,uf={onError:function(e){Kn=!0,br=e}};function sf(e,t,n,r,l,o,i,u,s){Kn=!1,br=null,of.apply(uf,arguments)}function af(e,t,n,r,l,o,i,u,s){if(sf.apply(this,arguments),Kn){if(Kn){var f=br;Kn=!1,br=null}else throw Error(w(198));el||(el=!0,Po=f)}}function bt(e){var t=e,n=e;if(e.alternate)for(;t.return;)t=t.return;else{e=t;do t=e,t.flags&4098&&(n=t.return),e=t.return;while(e)}return t.tag===3?n:null}function Vs(e){if(e.tag===13){var t=e.memoizedState;if(t===null&&(e=e.alternate,e!==null&&(t=e.memoizedState)),t!==null)return t.dehydrated}return null}function fu(e){if(bt(e)!==e)throw Error(w(188))}function cf(e){var t=e.alternate;if(!t){if(t=bt(e),t===null)throw Error(w(188));return t!==e?null:e}for(var n=e,r=t;;){var l=n.return;if(l===null)break;var o=l.alternate;if(o===null){if(r=l.return,r!==null){n=r;continue}break}if(l.child===o.child){for(o=l.child;o;){if(o===n)return fu(l),e;if(o===r)return fu(l),t;o=o.sibling}throw Error(w(188))}if(n.return!==r.return)n=l,r=o;else{for(var i=!1,u=l.child;u;){if(u===n){i=!0,n=l,r=o;break}if(u===r){i=!0,r=l,n=o;break}u=u.sibling}if(!i){for(u=o.child;u;){if(u===n){i=!0,n=o,r=l;break}if(u===r){i=!0,r=o,n=l;break}u=u.sibling}if(!i)throw Error(w(189))}}if(n.alternate!==r)throw Error(w(190))}if(n.tag!==3)throw Error(w(188));return n.stateNode.current===n?e:t}function Hs(e){return e=cf(e),e!==null?Qs(e):null}function Qs(e){if(e.tag===5||e.tag===6)return e;for(e=e.child;e!==null;){var t=Qs(e);if(t!==null)return t;e=e.sibling}return null}var Ks=Le.unstable_scheduleCallback,du=Le.unstable_cancelCallback,ff=Le.unstable_shouldYield,df=Le.unstable_requestPaint,Z=Le.unstable_now,pf=Le.unstable_getCurrentPriorityLevel,gi=Le.unstable_ImmediatePriority,Ys=Le.unstable_UserBlockingPriority,tl=Le.unstable_NormalPriority,hf=Le.unstable_LowPriority,Gs=Le.unstable_IdlePriority,Cl=null,be=null;function mf(e){if(be&&typeof be.onCommitFiberRoot=="function")try{be.onCommitFiberRoot(Cl,e,void 0,(e.current.flags&128)===128)}catch{}}var Qe=Math.clz32?Math.clz32:yf,vf=Math.log,gf=Math.LN2;function yf(e){return e>>>=0,e===0?32:31-(vf(e)/gf|0)|0}var _r=64,Pr=4194304;function Vn(e){switch(e&-e){case 1:return 1;case 2:return 2;case 4:return 4;case 8:return 8;case 16:return 16;case 32:return 32;case 64:case 128:case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:return e&4194240;case 4194304:case 8388608:case 16777216:case 33554432:case 67108864:return e&130023424;case 134217728:return 134217728;case 268435456:return 268435456;case 536870912:return 536870912;case 1073741824:return 1073741824;default:return e}}function nl(e,t){var n=e.pendingLanes;if(n===0)return 0;var r=0,l=e.suspendedLanes,o=e.pingedLanes,i=n&268435455;if(i!==0){var u=i&~l;u!==0?r=Vn(u):(o&=i,o!==0&&(r=Vn(o)))}else i=n&~l,i!==0?r=Vn(i):o!==0&&(r=Vn(o));if(r===0)return 0;if(t!==0&&t!==r&&!(t&l)&&(l=r&-r,o=t&-t,l>=o||l===16&&(o&4194240)!==0))return t;if(r&4&&(r|=n&16),t=e.entangledLanes,t!==0)for(e=e.entanglements,t&=r;0<t;)n=31-Qe(t),l=1<<n,r|=e[n],t&=~l;return r}function wf(e,t){switch(e){case 1:case 2:case 4:return t+250;case 8:case 16:case 32:case 64:case 128:case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:return t+5e3;case 4194304:case 8388608:case 16777216:case 33554432:case 67108864:return-1;case 134217728:case 268435456:case 536870912:case 1073741824:return-1;default:return-1}}function xf(e,t){for(var n=e.suspendedLanes,r=e.pingedLanes,l=e.expirationTimes,o=e.pendingLanes;0<o;){var i=31-Qe(o),u=1<<i,s=l[i];s===-1?(!(u&n)||u&r)&&(l[i]=wf(u,t)):s<=t&&(e.expiredLanes|=u),o&=~u}}function To(e){return e=e.pendingLanes&-1073741825,e!==0?e:e&1073741824?1073741824:0}function Xs(){var e=_r;return _r<<=1,!(_r&4194240)&&(_r=64),e}function Ql(e){for(var t=[],n=0;31>n;n++)t.push(e);return t}function yr(e,t,n){e.pendingLanes|=t,t!==536870912&&(e.suspendedLanes=0,e.pingedLanes=0),e=e.eventTimes,t=31-Qe(t),e[t]=n}function kf(e,t){var n=e.pendingLanes&~t;e.pendingLanes=t,e.suspendedLanes=0,e.pingedLanes=0,e.expiredLanes&=t,e.mutableReadLanes&=t,e.entangledLanes&=t,t=e.entanglements;var r=e.eventTimes;for(e=e.expirationTimes;0<n;){var l=31-Qe(n),o=1<<l;t[l]=0,r[l]=-1,e[l]=-1,n&=~o}}function yi(e,t){var n=e.entangledLanes|=t;for(e=e.entanglements;n;){var r=31-Qe(n),l=1<<r;l&t|e[r]&t&&(e[r]|=t),n&=~l}}var M=0;function Zs(e){return e&=-e,1<e?4<e?e&268435455?16:536870912:4:1}var Js,wi,qs,bs,ea,Lo=!1,Tr=[],Ct=null,Nt=null,jt=null,rr=new Map,lr=new Map,xt=[],Sf="mousedown mouseup touchcancel touchend touchstart auxclick dblclick pointercancel pointerdown pointerup dragend dragstart drop compositionend compositionstart keydown keypress keyup input textInput copy cut paste click change contextmenu reset submit".split(" ");function pu(e,t){switch(e){case"focusin":case"focusout":Ct=null;break;case"dragenter":case"dragleave":Nt=null;break;case"mouseover":case"mouseout":jt=null;break;case"pointerover":case"pointerout":rr.delete(t.pointerId);break;case"gotpointercapture":case"lostpointercapture":lr.delete(t.pointerId)}}function In(e,t,n,r,l,o){return e===null||e.nativeEvent!==o?(e={blockedOn:t,domEventName:n,eventSystemFlags:r,nativeEvent:o,targetContainers:[l]},t!==null&&(t=xr(t),t!==null&&wi(t)),e):(e.eventSystemFlags|=r,t=e.targetContainers,l!==null&&t.indexOf(l)===-1&&t.push(l),e)}function Ef(e,t,n,r,l){switch(t){case"focusin":return Ct=In(Ct,e,t,n,r,l),!0;case"dragenter":return Nt=In(Nt,e,t,n,r,l),!0;case"mouseover":return jt=In(jt,e,t,n,r,l),!0;case"pointerover":var o=l.pointerId;return rr.set(o,In(rr.get(o)||null,e,t,n,r,l)),!0;case"gotpointercapture":return o=l.pointerId,lr.set(o,In(lr.get(o)||null,e,t,n,r,l)),!0}return!1}function ta(e){var t=Wt(e.target);if(t!==null){var n=bt(t);if(n!==null){if(t=n.tag,t===13){if(t=Vs(n),t!==null){e.blockedOn=t,ea(e.priority,function(){qs(n)});return}}else if(t===3&&n.stateNode.current.memoizedState.isDehydrated){e.blockedOn=n.tag===3?n.stateNode.containerInfo:null;return}}}e.blockedOn=null}function Wr(e){if(e.blockedOn!==null)return!1;for(var t=e.targetContainers;0<t.length;){var n=zo(e.domEventName,e.eventSystemFlags,t[0],e.nativeEvent);if(n===null){n=e.nativeEvent;var r=new n.constructor(n.type,n);No=r,n.target.dispatchEvent(r),No=null}else return t=xr(n),t!==null&&wi(t),e.blockedOn=n,!1;t.shift()}return!0}function hu(e,t,n){Wr(e)&&n.delete(t)}function Cf(){Lo=!1,Ct!==null&&Wr(Ct)&&(Ct=null),Nt!==null&&Wr(Nt)&&(Nt=null),jt!==null&&Wr(jt)&&(jt=null),rr.forEach(hu),lr.forEach(hu)}function Mn(e,t){e.blockedOn===t&&(e.blockedOn=null,Lo||(Lo=!0,Le.unstable_scheduleCallback(Le.unstable_NormalPriority,Cf)))}function or(e){function t(l){return Mn(l,e)}if(0<Tr.length){Mn(Tr[0],e);for(var n=1;n<Tr.length;n++){var r=Tr[n];r.blockedOn===e&&(r.blockedOn=null)}}for(Ct!==null&&Mn(Ct,e),Nt!==null&&Mn(Nt,e),jt!==null&&Mn(jt,e),rr.forEach(t),lr.forEach(t),n=0;n<xt.length;n++)r=xt[n],r.blockedOn===e&&(r.blockedOn=null);for(;0<xt.length&&(n=xt[0],n.blockedOn===null);)ta(n),n.blockedOn===null&&xt.shift()}var yn=dt.ReactCurrentBatchConfig,rl=!0;function Nf(e,t,n,r){var l=M,o=yn.transition;yn.transition=null;try{M=1,xi(e,t,n,r)}finally{M=l,yn.transition=o}}function jf(e,t,n,r){var l=M,o=yn.transition;yn.transition=null;try{M=4,xi(e,t,n,r)}finally{M=l,yn.transition=o}}function xi(e,t,n,r){if(rl){var l=zo(e,t,n,r);if(l===null)to(e,t,r,ll,n),pu(e,r);else if(Ef(l,e,t,n,r))r.stopPropagation();else if(pu(e,r),t&4&&-1<Sf.indexOf(e)){for(;l!==null;){var o=xr(l);if(o!==null&&Js(o),o=zo(e,t,n,r),o===null&&to(e,t,r,ll,n),o===l)break;l=o}l!==null&&r.stopPropagation()}else to(e,t,r,null,n)}}var ll=null;function zo(e,t,n,r){if(ll=null,e=vi(r),e=Wt(e),e!==null)if(t=bt(e),t===null)e=null;else if(n=t.tag,n===13){if(e=Vs(t),e!==null)return e;e=null}else if(n===3){if(t.stateNode.current.memoizedState.isDehydrated)return t.tag===3?t.stateNode.containerInfo:null;e=null}else t!==e&&(e=null);return ll=e,null}function na(e){switch(e){case"cancel":case"click":case"close":case"contextmenu":case"copy":case"cut":case"auxclick":case"dblclick":case"dragend":case"dragstart":case"drop":case"focusin":case"focusout":case"input":case"invalid":case"keydown":case"keypress":case"keyup":case"mousedown":case"mouseup":case"paste":case"pause":case"play":case"pointercancel":case"pointerdown":case"pointerup":case"ratechange":case"reset":case"resize":case"seeked":case"submit":case"touchcancel":case"touchend":case"touchstart":case"volumechange":case"change":case"selectionchange":case"textInput":case"compositionstart":case"compositionend":case"compositionupdate":case"beforeblur":case"afterblur":case"beforeinput":case"blur":case"fullscreenchange":case"focus":case"hashchange":case"popstate":case"select":case"selectstart":return 1;case"drag":case"dragenter":case"dragexit":case"dragleave":case"dragover":case"mousemove":case"mouseout":case"mouseover":case"pointermove":case"pointerout":case"pointerover":case"scroll":case"toggle":case"touchmove":case"wheel":case"mouseenter":case"mouseleave":case"pointerenter":case"pointerleave":return 4;case"message":switch(pf()){case gi:return 1;case Ys:return 4;case tl:case hf:return 16;case Gs:return 536870912;default:return 16}default:return 16}}var St=null,ki=null,Vr=null;function ra(){if(Vr)return Vr;var e,t=ki,n=t.length,r,l="value"in St?St.value:St.textContent,o=l.length;for(e=0;e<n&&t[e]===l[e];e++);var i=n-e;for(r=1;r<=i&&t[n-r]===l[o-r];r++);return Vr=l.slice(e,1<r?1-r:void 0)}function Hr(e){var t=e.keyCode;return"charCode"in e?(e=e.charCode,e===0&&t===13&&(e=13)):e=t,e===10&&(e=13),32<=e||e===13?e:0}function Lr(){return!0}function mu(){return!1}function De(e){function t(n,r,l,o,i){this._reactName=n,this._targetInst=l,this.type=r,this.nativeEvent=o,this.target=i,this.currentTarget=null;for(var u in e)e.hasOwnProperty(u)&&(n=e[u],this[u]=n?n(o):o[u]);return this.isDefaultPrevented=(o.defaultPrevented!=null?o.defaultPrevented:o.returnValue===!1)?Lr:mu,this.isPropagationStopped=mu,this}return Y(t.prototype,{preventDefault:function(){this.defaultPrevented=!0;var n=this.nativeEvent;n&&(n.preventDefault?n.preventDefault():typeof n.returnValue!="unknown"&&(n.returnValue=!1),this.isDefaultPrevented=Lr)},stopPropagation:function(){var n=this.nativeEvent;n&&(n.stopPropagation?n.stopPropagation():typeof n.cancelBubble!="unknown"&&(n.cancelBubble=!0),this.isPropagationStopped=Lr)},persist:function(){},isPersistent:Lr}),t}var Tn={eventPhase:0,bubbles:0,cancelable:0,timeStamp:function(e){return e.timeStamp||Date.now()},defaultPrevented:0,isTrusted:0},Si=De(Tn),wr=Y({},Tn,{view:0,detail:0}),_f=De(wr),Kl,Yl,Fn,Nl=Y({},wr,{screenX:0,screenY:0,clientX:0,clientY:0,pageX:0,pageY:0,ctrlKey:0,shiftKey:0,altKey:0,metaKey:0,getModifierState:Ei,button:0,buttons:0,relatedTarget:function(e){return e.relatedTarget===void 0?e.fromElement===e.srcElement?e.toElement:e.fromElement:e.relatedTarget},movementX:function(e){return"movementX"in e?e.movementX:(e!==Fn&&(Fn&&e.type==="mousemove"?(Kl=e.screenX-Fn.screenX,Yl=e.screenY-Fn.screenY):Yl=Kl=0,Fn=e),Kl)},movementY:function(e){return"movementY"in e?e.movementY:Yl}}),vu=De(Nl),Pf=Y({},Nl,{dataTransfer:0}),Tf=De(Pf),Lf=Y({},wr,{relatedTarget:0}),Gl=De(Lf),zf=Y({},Tn,{animationName:0,elapsedTime:0,pseudoElement:0}),Df=De(zf),Rf=Y({},Tn,{clipboardData:function(e){return"clipboardData"in e?e.clipboardData:window.clipboardData}}),Of=De(Rf),If=Y({},Tn,{data:0}),gu=De(If),Mf={Esc:"Escape",Spacebar:" ",Left:"ArrowLeft",Up:"ArrowUp",Right:"ArrowRight",Down:"ArrowDown",Del:"Delete",Win:"OS",Menu:"ContextMenu",Apps:"ContextMenu",Scroll:"ScrollLock",MozPrintableKey:"Unidentified"},Ff={8:"Backspace",9:"Tab",12:"Clear",13:"Enter",16:"Shift",17:"Control",18:"Alt",19:"Pause",20:"CapsLock",27:"Escape",32:" ",33:"PageUp",34:"PageDown",35:"End",36:"Home",37:"ArrowLeft",38:"ArrowUp",39:"ArrowRight",40:"ArrowDown",45:"Insert",46:"Delete",112:"F1",113:"F2",114:"F3",115:"F4",116:"F5",117:"F6",118:"F7",119:"F8",120:"F9",121:"F10",122:"F11",123:"F12",144:"NumLock",145:"ScrollLock",224:"Meta"},Uf={Alt:"altKey",Control:"ctrlKey",Meta:"metaKey",Shift:"shiftKey"};function $f(e){var t=this.nativeEvent;return t.getModifierState?t.getModifierState(e):(e=Uf[e])?!!t[e]:!1}function Ei(){return $f}var Af=Y({},wr,{key:function(e){if(e.key){var t=Mf[e.key]||e.key;if(t!=="Unidentified")return t}return e.type==="keypress"?(e=Hr(e),e===13?"Enter":String.fromCharCode(e)):e.type==="keydown"||e.type==="keyup"?Ff[e.keyCode]||"Unidentified":""},code:0,location:0,ctrlKey:0,shiftKey:0,altKey:0,metaKey:0,repeat:0,locale:0,getModifierState:Ei,charCode:function(e){return e.type==="keypress"?Hr(e):0},keyCode:function(e){return e.type==="keydown"||e.type==="keyup"?e.keyCode:0},which:function(e){return e.type==="keypress"?Hr(e):e.type==="keydown"||e.type==="keyup"?e.keyCode:0}}),Bf=De(Af),Wf=Y({},Nl,{pointerId:0,width:0,height:0,pressure:0,tangentialPressure:0,tiltX:0,tiltY:0,twist:0,pointerType:0,isPrimary:0}),yu=De(Wf),Vf=Y({},wr,{touches:0,targetTouches:0,changedTouches:0,altKey:0,metaKey:0,ctrlKey:0,shiftKey:0,getModifierState:Ei}),Hf=De(Vf),Qf=Y({},Tn,{propertyName:0,elapsedTime:0,pseudoElement:0}),Kf=De(Qf),Yf=Y({},Nl,{deltaX:function(e){return"deltaX"in e?e.deltaX:"wheelDeltaX"in e?-e.wheelDeltaX:0},deltaY:function(e){return"deltaY"in e?e.deltaY:"wheelDeltaY"in e?-e.wheelDeltaY:"wheelDelta"in e?-e.wheelDelta:0},deltaZ:0,deltaMode:0}),Gf=De(Yf),Xf=[9,13,27,32],Ci=st&&"CompositionEvent"in window,Yn=null;st&&"documentMode"in document&&(Yn=document.documentMode);var Zf=st&&"TextEvent"in window&&!Yn,la=st&&(!Ci||Yn&&8<Yn&&11>=Yn),wu=" ",xu=!1;function oa(e,t){switch(e){case"keyup":return Xf.indexOf(t.keyCode)!==-1;case"keydown":return t.keyCode!==229;case"keypress":case"mousedown":case"focusout":return!0;default:return!1}}function ia(e){return e=e.detail,typeof e=="object"&&"data"in e?e.data:null}var ln=!1;function Jf(e,t){switch(e){case"compositionend":return ia(t);case"keypress":return t.which!==32?null:(xu=!0,wu);case"textInput":return e=t.data,e===wu&&xu?null:e;default:return null}}function qf(e,t){if(ln)return e==="compositionend"||!Ci&&oa(e,t)?(e=ra(),Vr=ki=St=null,ln=!1,e):null;switch(e){case"paste":return null;case"keypress":if(!(t.ctrlKey||t.altKey||t.metaKey)||t.ctrlKey&&t.altKey){if(t.char&&1<t.char.length)return t.char;if(t.which)return String.fromCharCode(t.which)}return null;case"compositionend":return la&&t.locale!=="ko"?null:t.data;default:return null}}var bf={color:!0,date:!0,datetime:!0,"datetime-local":!0,email:!0,month:!0,number:!0,password:!0,range:!0,search:!0,tel:!0,text:!0,time:!0,url:!0,week:!0};function ku(e){var t=e&&e.nodeName&&e.nodeName.toLowerCase();return t==="input"?!!bf[e.type]:t==="textarea"}function ua(e,t,n,r){Us(r),t=ol(t,"onChange"),0<t.length&&(n=new Si("onChange","change",null,n,r),e.push({event:n,listeners:t}))}var Gn=null,ir=null;function ed(e){ya(e,0)}function jl(e){var t=sn(e);if(zs(t))return e}function td(e,t){if(e==="change")return t}var sa=!1;if(st){var Xl;if(st){var Zl="oninput"in document;if(!Zl){var Su=document.createElement("div");Su.setAttribute("oninput","return;"),Zl=typeof Su.oninput=="function"}Xl=Zl}else Xl=!1;sa=Xl&&(!document.documentMode||9<document.documentMode)}function Eu(){Gn&&(Gn.detachEvent("onpropertychange",aa),ir=Gn=null)}function aa(e){if(e.propertyName==="value"&&jl(ir)){var t=[];ua(t,ir,e,vi(e)),Ws(ed,t)}}function nd(e,t,n){e==="focusin"?(Eu(),Gn=t,ir=n,Gn.attachEvent("onpropertychange",aa)):e==="focusout"&&Eu()}function rd(e){if(e==="selectionchange"||e==="keyup"||e==="keydown")return jl(ir)}function ld(e,t){if(e==="click")return jl(t)}function od(e,t){if(e==="input"||e==="change")return jl(t)}function id(e,t){return e===t&&(e!==0||1/e===1/t)||e!==e&&t!==t}var Ye=typeof Object.is=="function"?Object.is:id;function ur(e,t){if(Ye(e,t))return!0;if(typeof e!="object"||e===null||typeof t!="object"||t===null)return!1;var n=Object.keys(e),r=Object.keys(t);if(n.length!==r.length)return!1;for(r=0;r<n.length;r++){var l=n[r];if(!po.call(t,l)||!Ye(e[l],t[l]))return!1}return!0}function Cu(e){for(;e&&e.firstChild;)e=e.firstChild;return e}function Nu(e,t){var n=Cu(e);e=0;for(var r;n;){if(n.nodeType===3){if(r=e+n.textContent.length,e<=t&&r>=t)return{node:n,offset:t-e};e=r}e:{for(;n;){if(n.nextSibling){n=n.nextSibling;break e}n=n.parentNode}n=void 0}n=Cu(n)}}function ca(e,t){return e&&t?e===t?!0:e&&e.nodeType===3?!1:t&&t.nodeType===3?ca(e,t.parentNode):"contains"in e?e.contains(t):e.compareDocumentPosition?!!(e.compareDocumentPosition(t)&16):!1:!1}function fa(){for(var e=window,t=qr();t instanceof e.HTMLIFrameElement;){try{var n=typeof t.contentWindow.location.href=="string"}catch{n=!1}if(n)e=t.contentWindow;else break;t=qr(e.document)}return t}function Ni(e){var t=e&&e.nodeName&&e.nodeName.toLowerCase();return t&&(t==="input"&&(e.type==="text"||e.type==="search"||e.type==="tel"||e.type==="url"||e.type==="password")||t==="textarea"||e.contentEditable==="true")}function ud(e){var t=fa(),n=e.focusedElem,r=e.selectionRange;if(t!==n&&n&&n.ownerDocument&&ca(n.ownerDocument.documentElement,n)){if(r!==null&&Ni(n)){if(t=r.start,e=r.end,e===void 0&&(e=t),"selectionStart"in n)n.selectionStart=t,n.selectionEnd=Math.min(e,n.value.length);else if(e=(t=n.ownerDocument||document)&&t.defaultView||window,e.getSelection){e=e.getSelection();var l=n.textContent.length,o=Math.min(r.start,l);r=r.end===void 0?o:Math.min(r.end,l),!e.extend&&o>r&&(l=r,r=o,o=l),l=Nu(n,o);var i=Nu(n,r);l&&i&&(e.rangeCount!==1||e.anchorNode!==l.node||e.anchorOffset!==l.offset||e.focusNode!==i.node||e.focusOffset!==i.offset)&&(t=t.createRange(),t.setStart(l.node,l.offset),e.removeAllRanges(),o>r?(e.addRange(t),e.extend(i.node,i.offset)):(t.setEnd(i.node,i.offset),e.addRange(t)))}}for(t=[],e=n;e=e.parentNode;)e.nodeType===1&&t.push({element:e,left:e.scrollLeft,top:e.scrollTop});for(typeof n.focus=="function"&&n.focus(),n=0;n<t.length;n++)e=t[n],e.element.scrollLeft=e.left,e.element.scrollTop=e.top}}var sd=st&&"documentMode"in document&&11>=document.documentMode,on=null,Do=null,Xn=null,Ro=!1;function ju(e,t,n){var r=n.window===n?n.document:n.nodeType===9?n:n.ownerDocument;Ro||on==null||on!==qr(r)||(r=on,"selectionStart"in r&&Ni(r)?r={start:r.selectionStart,end:r.selectionEnd}:(r=(r.ownerDocument&&r.ownerDocument.defaultView||window).getSelection(),r={anchorNode:r.anchorNode,anchorOffset:r.anchorOffset,focusNode:r.focusNode,focusOffset:r.focusOffset}),Xn&&ur(Xn,r)||(Xn=r,r=ol(Do,"onSelect"),0<r.length&&(t=new Si("onSelect","select",null,t,n),e.push({event:t,listeners:r}),t.target=on)))}function zr(e,t){var n={};return n[e.toLowerCase()]=t.toLowerCase(),n["Webkit"+e]="webkit"+t,n["Moz"+e]="moz"+t,n}var un={animationend:zr("Animation","AnimationEnd"),animationiteration:zr("Animation","AnimationIteration"),animationstart:zr("Animation","AnimationStart"),transitionend:zr("Transition","TransitionEnd")},Jl={},da={};st&&(da=document.createElement("div").style,"AnimationEvent"in window||(delete un.animationend.animation,delete un.animationiteration.animation,delete un.animationstart.animation),"TransitionEvent"in window||delete un.transitionend.transition);function _l(e){if(Jl[e])return Jl[e];if(!un[e])return e;var t=un[e],n;for(n in t)if(t.hasOwnProperty(n)&&n in da)return Jl[e]=t[n];return e}var pa=_l("animationend"),ha=_l("animationiteration"),ma=_l("animationstart"),va=_l("transitionend"),ga=new Map,_u="abort auxClick cancel canPlay canPlayThrough click close contextMenu copy cut drag dragEnd dragEnter dragExit dragLeave dragOver dragStart drop durationChange emptied encrypted ended error gotPointerCapture input invalid keyDown keyPress keyUp load loadedData loadedMetadata loadStart lostPointerCapture mouseDown mouseMove mouseOut mouseOver mouseUp paste pause play playing pointerCancel pointerDown pointerMove pointerOut pointerOver pointerUp progress rateChange reset resize seeked seeking stalled submit suspend timeUpdate touchCancel touchEnd touchStart volumeChange scroll toggle touchMove waiting wheel".split(" ");function Ot(e,t){ga.set(e,t),qt(t,[e])}for(var ql=0;ql<_u.length;ql++){var bl=_u[ql],ad=bl.toLowerCase(),cd=bl[0].toUpperCase()+bl.slice(1);Ot(ad,"on"+cd)}Ot(pa,"onAnimationEnd");Ot(ha,"onAnimationIteration");Ot(ma,"onAnimationStart");Ot("dblclick","onDoubleClick");Ot("focusin","onFocus");Ot("focusout","onBlur");Ot(va,"onTransitionEnd");kn("onMouseEnter",["mouseout","mouseover"]);kn("onMouseLeave",["mouseout","mouseover"]);kn("onPointerEnter",["pointerout","pointerover"]);kn("onPointerLeave",["pointerout","pointerover"]);qt("onChange","change click focusin focusout input keydown keyup selectionchange".split(" "));qt("onSelect","focusout contextmenu dragend focusin keydown keyup mousedown mouseup selectionchange".split(" "));qt("onBeforeInput",["compositionend","keypress","textInput","paste"]);qt("onCompositionEnd","compositionend focusout keydown keypress keyup mousedown".split(" "));qt("onCompositionStart","compositionstart focusout keydown keypress keyup mousedown".split(" "));qt("onCompositionUpdate","compositionupdate focusout keydown keypress keyup mousedown".split(" "));var Hn="abort canplay canplaythrough durationchange emptied encrypted ended error loadeddata loadedmetadata loadstart pause play playing progress ratechange resize seeked seeking stalled suspend timeupdate volumechange waiting".split(" "),fd=new Set("cancel close invalid load scroll toggle".split(" ").concat(Hn));function Pu(e,t,n){var r=e.type||"unknown-event";e.currentTarget=n,af(r,t,void 0,e),e.currentTarget=null}function ya(e,t){t=(t&4)!==0;for(var n=0;n<e.length;n++){var r=e[n],l=r.event;r=r.listeners;e:{var o=void 0;if(t)for(var i=r.length-1;0<=i;i--){var u=r[i],s=u.instance,f=u.currentTarget;if(u=u.listener,s!==o&&l.isPropagationStopped())break e;Pu(l,u,f),o=s}else for(i=0;i<r.length;i++){if(u=r[i],s=u.instance,f=u.currentTarget,u=u.listener,s!==o&&l.isPropagationStopped())break e;Pu(l,u,f),o=s}}}if(el)throw e=Po,el=!1,Po=null,e}function $(e,t){var n=t[Uo];n===void 0&&(n=t[Uo]=new Set);var r=e+"__bubble";n.has(r)||(wa(t,e,2,!1),n.add(r))}function eo(e,t,n){var r=0;t&&(r|=4),wa(n,e,r,t)}var Dr="_reactListening"+Math.random().toString(36).slice(2);function sr(e){if(!e[Dr]){e[Dr]=!0,js.forEach(function(n){n!=="selectionchange"&&(fd.has(n)||eo(n,!1,e),eo(n,!0,e))});var t=e.nodeType===9?e:e.ownerDocument;t===null||t[Dr]||(t[Dr]=!0,eo("selectionchange",!1,t))}}function wa(e,t,n,r){switch(na(t)){case 1:var l=Nf;break;case 4:l=jf;break;default:l=xi}n=l.bind(null,t,n,e),l=void 0,!_o||t!=="touchstart"&&t!=="touchmove"&&t!=="wheel"||(l=!0),r?l!==void 0?e.addEventListener(t,n,{capture:!0,passive:l}):e.addEventListener(t,n,!0):l!==void 0?e.addEventListener(t,n,{passive:l}):e.addEventListener(t,n,!1)}function to(e,t,n,r,l){var o=r;if(!(t&1)&&!(t&2)&&r!==null)e:for(;;){if(r===null)return;var i=r.tag;if(i===3||i===4){var u=r.stateNode.containerInfo;if(u===l||u.nodeType===8&&u.parentNode===l)break;if(i===4)for(i=r.return;i!==null;){var s=i.tag;if((s===3||s===4)&&(s=i.stateNode.containerInfo,s===l||s.nodeType===8&&s.parentNode===l))return;i=i.return}for(;u!==null;){if(i=Wt(u),i===null)return;if(s=i.tag,s===5||s===6){r=o=i;continue e}u=u.parentNode}}r=r.return}Ws(function(){var f=o,h=vi(n),v=[];e:{var m=ga.get(e);if(m!==void 0){var x=Si,k=e;switch(e){case"keypress":if(Hr(n)===0)break e;case"keydown":case"keyup":x=Bf;break;case"focusin":k="focus",x=Gl;break;case"focusout":k="blur",x=Gl;break;case"beforeblur":case"afterblur":x=Gl;break;case"click":if(n.button===2)break e;case"auxclick":case"dblclick":case"mousedown":case"mousemove":case"mouseup":case"mouseout":case"mouseover":case"contextmenu":x=vu;break;case"drag":case"dragend":case"dragenter":case"dragexit":case"dragleave":case"dragover":case"dragstart":case"drop":x=Tf;break;case"touchcancel":case"touchend":case"touchmove":case"touchstart":x=Hf;break;case pa:case ha:case ma:x=Df;break;case va:x=Kf;break;case"scroll":x=_f;break;case"wheel":x=Gf;break;case"copy":case"cut":case"paste":x=Of;break;case"gotpointercapture":case"lostpointercapture":case"pointercancel":case"pointerdown":case"pointermove":case"pointerout":case"pointerover":case"pointerup":x=yu}var S=(t&4)!==0,F=!S&&e==="scroll",d=S?m!==null?m+"Capture":null:m;S=[];for(var a=f,p;a!==null;){p=a;var y=p.stateNode;if(p.tag===5&&y!==null&&(p=y,d!==null&&(y=nr(a,d),y!=null&&S.push(ar(a,y,p)))),F)break;a=a.return}0<S.length&&(m=new x(m,k,null,n,h),v.push({event:m,listeners:S}))}}if(!(t&7)){e:{if(m=e==="mouseover"||e==="pointerover",x=e==="mouseout"||e==="pointerout",m&&n!==No&&(k=n.relatedTarget||n.fromElement)&&(Wt(k)||k[at]))break e;if((x||m)&&(m=h.window===h?h:(m=h.ownerDocument)?m.defaultView||m.parentWindow:window,x?(k=n.relatedTarget||n.toElement,x=f,k=k?Wt(k):null,k!==null&&(F=bt(k),k!==F||k.tag!==5&&k.tag!==6)&&(k=null)):(x=null,k=f),x!==k)){if(S=vu,y="onMouseLeave",d="onMouseEnter",a="mouse",(e==="pointerout"||e==="pointerover")&&(S=yu,y="onPointerLeave",d="onPointerEnter",a="pointer"),F=x==null?m:sn(x),p=k==null?m:sn(k),m=new S(y,a+"leave",x,n,h),m.target=F,m.relatedTarget=p,y=null,Wt(h)===f&&(S=new S(d,a+"enter",k,n,h),S.target=p,S.relatedTarget=F,y=S),F=y,x&&k)t:{for(S=x,d=k,a=0,p=S;p;p=tn(p))a++;for(p=0,y=d;y;y=tn(y))p++;for(;0<a-p;)S=tn(S),a--;for(;0<p-a;)d=tn(d),p--;for(;a--;){if(S===d||d!==null&&S===d.alternate)break t;S=tn(S),d=tn(d)}S=null}else S=null;x!==null&&Tu(v,m,x,S,!1),k!==null&&F!==null&&Tu(v,F,k,S,!0)}}e:{if(m=f?sn(f):window,x=m.nodeName&&m.nodeName.toLowerCase(),x==="select"||x==="input"&&m.type==="file")var E=td;else if(ku(m))if(sa)E=od;else{E=rd;var _=nd}else(x=m.nodeName)&&x.toLowerCase()==="input"&&(m.type==="checkbox"||m.type==="radio")&&(E=ld);if(E&&(E=E(e,f))){ua(v,E,n,h);break e}_&&_(e,m,f),e==="focusout"&&(_=m._wrapperState)&&_.controlled&&m.type==="number"&&xo(m,"number",m.value)}switch(_=f?sn(f):window,e){case"focusin":(ku(_)||_.contentEditable==="true")&&(on=_,Do=f,Xn=null);break;case"focusout":Xn=Do=on=null;break;case"mousedown":Ro=!0;break;case"contextmenu":case"mouseup":case"dragend":Ro=!1,ju(v,n,h);break;case"selectionchange":if(sd)break;case"keydown":case"keyup":ju(v,n,h)}var N;if(Ci)e:{switch(e){case"compositionstart":var P="onCompositionStart";break e;case"compositionend":P="onCompositionEnd";break e;case"compositionupdate":P="onCompositionUpdate";break e}P=void 0}else ln?oa(e,n)&&(P="onCompositionEnd"):e==="keydown"&&n.keyCode===229&&(P="onCompositionStart");P&&(la&&n.locale!=="ko"&&(ln||P!=="onCompositionStart"?P==="onCompositionEnd"&&ln&&(N=ra()):(St=h,ki="value"in St?St.value:St.textContent,ln=!0)),_=ol(f,P),0<_.length&&(P=new gu(P,e,null,n,h),v.push({event:P,listeners:_}),N?P.data=N:(N=ia(n),N!==null&&(P.data=N)))),(N=Zf?Jf(e,n):qf(e,n))&&(f=ol(f,"onBeforeInput"),0<f.length&&(h=new gu("onBeforeInput","beforeinput",null,n,h),v.push({event:h,listeners:f}),h.data=N))}ya(v,t)})}function ar(e,t,n){return{instance:e,listener:t,currentTarget:n}}function ol(e,t){for(var n=t+"Capture",r=[];e!==null;){var l=e,o=l.stateNode;l.tag===5&&o!==null&&(l=o,o=nr(e,n),o!=null&&r.unshift(ar(e,o,l)),o=nr(e,t),o!=null&&r.push(ar(e,o,l))),e=e.return}return r}function tn(e){if(e===null)return null;do e=e.return;while(e&&e.tag!==5);return e||null}function Tu(e,t,n,r,l){for(var o=t._reactName,i=[];n!==null&&n!==r;){var u=n,s=u.alternate,f=u.stateNode;if(s!==null&&s===r)break;u.tag===5&&f!==null&&(u=f,l?(s=nr(n,o),s!=null&&i.unshift(ar(n,s,u))):l||(s=nr(n,o),s!=null&&i.push(ar(n,s,u)))),n=n.return}i.length!==0&&e.push({event:t,listeners:i})}var dd=/\r\n?/g,pd=/\u0000|\uFFFD/g;function Lu(e){return(typeof e=="string"?e:""+e).replace(dd,`
-`).replace(pd,"")}function Rr(e,t,n){if(t=Lu(t),Lu(e)!==t&&n)throw Error(w(425))}function il(){}var Oo=null,Io=null;function Mo(e,t){return e==="textarea"||e==="noscript"||typeof t.children=="string"||typeof t.children=="number"||typeof t.dangerouslySetInnerHTML=="object"&&t.dangerouslySetInnerHTML!==null&&t.dangerouslySetInnerHTML.__html!=null}var Fo=typeof setTimeout=="function"?setTimeout:void 0,hd=typeof clearTimeout=="function"?clearTimeout:void 0,zu=typeof Promise=="function"?Promise:void 0,md=typeof queueMicrotask=="function"?queueMicrotask:typeof zu<"u"?function(e){return zu.resolve(null).then(e).catch(vd)}:Fo;function vd(e){setTimeout(function(){throw e})}function no(e,t){var n=t,r=0;do{var l=n.nextSibling;if(e.removeChild(n),l&&l.nodeType===8)if(n=l.data,n==="/$"){if(r===0){e.removeChild(l),or(t);return}r--}else n!=="$"&&n!=="$?"&&n!=="$!"||r++;n=l}while(n);or(t)}function _t(e){for(;e!=null;e=e.nextSibling){var t=e.nodeType;if(t===1||t===3)break;if(t===8){if(t=e.data,t==="$"||t==="$!"||t==="$?")break;if(t==="/$")return null}}return e}function Du(e){e=e.previousSibling;for(var t=0;e;){if(e.nodeType===8){var n=e.data;if(n==="$"||n==="$!"||n==="$?"){if(t===0)return e;t--}else n==="/$"&&t++}e=e.previousSibling}return null}var Ln=Math.random().toString(36).slice(2),qe="__reactFiber$"+Ln,cr="__reactProps$"+Ln,at="__reactContainer$"+Ln,Uo="__reactEvents$"+Ln,gd="__reactListeners$"+Ln,yd="__reactHandles$"+Ln;function Wt(e){var t=e[qe];if(t)return t;for(var n=e.parentNode;n;){if(t=n[at]||n[qe]){if(n=t.alternate,t.child!==null||n!==null&&n.child!==null)for(e=Du(e);e!==null;){if(n=e[qe])return n;e=Du(e)}return t}e=n,n=e.parentNode}return null}function xr(e){return e=e[qe]||e[at],!e||e.tag!==5&&e.tag!==6&&e.tag!==13&&e.tag!==3?null:e}function sn(e){if(e.tag===5||e.tag===6)return e.stateNode;throw Error(w(33))}function Pl(e){return e[cr]||null}var $o=[],an=-1;function It(e){return{current:e}}function A(e){0>an||(e.current=$o[an],$o[an]=null,an--)}function U(e,t){an++,$o[an]=e.current,e.current=t}var Rt={},pe=It(Rt),Se=It(!1),Yt=Rt;function Sn(e,t){var n=e.type.contextTypes;if(!n)return Rt;var r=e.stateNode;if(r&&r.__reactInternalMemoizedUnmaskedChildContext===t)return r.__reactInternalMemoizedMaskedChildContext;var l={},o;for(o in n)l[o]=t[o];return r&&(e=e.stateNode,e.__reactInternalMemoizedUnmaskedChildContext=t,e.__reactInternalMemoizedMaskedChildContext=l),l}function Ee(e){return e=e.childContextTypes,e!=null}function ul(){A(Se),A(pe)}function Ru(e,t,n){if(pe.current!==Rt)throw Error(w(168));U(pe,t),U(Se,n)}function xa(e,t,n){var r=e.stateNode;if(t=t.childContextTypes,typeof r.getChildContext!="function")return n;r=r.getChildContext();for(var l in r)if(!(l in t))throw Error(w(108,tf(e)||"Unknown",l));return Y({},n,r)}function sl(e){return e=(e=e.stateNode)&&e.__reactInternalMemoizedMergedChildContext||Rt,Yt=pe.current,U(pe,e),U(Se,Se.current),!0}function Ou(e,t,n){var r=e.stateNode;if(!r)throw Error(w(169));n?(e=xa(e,t,Yt),r.__reactInternalMemoizedMergedChildContext=e,A(Se),A(pe),U(pe,e)):A(Se),U(Se,n)}var lt=null,Tl=!1,ro=!1;function ka(e){lt===null?lt=[e]:lt.push(e)}function wd(e){Tl=!0,ka(e)}function Mt(){if(!ro&&lt!==null){ro=!0;var e=0,t=M;try{var n=lt;for(M=1;e<n.length;e++){var r=n[e];do r=r(!0);while(r!==null)}lt=null,Tl=!1}catch(l){throw lt!==null&&(lt=lt.slice(e+1)),Ks(gi,Mt),l}finally{M=t,ro=!1}}return null}var cn=[],fn=0,al=null,cl=0,Re=[],Oe=0,Gt=null,ot=1,it="";function At(e,t){cn[fn++]=cl,cn[fn++]=al,al=e,cl=t}function Sa(e,t,n){Re[Oe++]=ot,Re[Oe++]=it,Re[Oe++]=Gt,Gt=e;var r=ot;e=it;var l=32-Qe(r)-1;r&=~(1<<l),n+=1;var o=32-Qe(t)+l;if(30<o){var i=l-l%5;o=(r&(1<<i)-1).toString(32),r>>=i,l-=i,ot=1<<32-Qe(t)+l|n<<l|r,it=o+e}else ot=1<<o|n<<l|r,it=e}function ji(e){e.return!==null&&(At(e,1),Sa(e,1,0))}function _i(e){for(;e===al;)al=cn[--fn],cn[fn]=null,cl=cn[--fn],cn[fn]=null;for(;e===Gt;)Gt=Re[--Oe],Re[Oe]=null,it=Re[--Oe],Re[Oe]=null,ot=Re[--Oe],Re[Oe]=null}var Te=null,Pe=null,H=!1,He=null;function Ea(e,t){var n=Ie(5,null,null,0);n.elementType="DELETED",n.stateNode=t,n.return=e,t=e.deletions,t===null?(e.deletions=[n],e.flags|=16):t.push(n)}function Iu(e,t){switch(e.tag){case 5:var n=e.type;return t=t.nodeType!==1||n.toLowerCase()!==t.nodeName.toLowerCase()?null:t,t!==null?(e.stateNode=t,Te=e,Pe=_t(t.firstChild),!0):!1;case 6:return t=e.pendingProps===""||t.nodeType!==3?null:t,t!==null?(e.stateNode=t,Te=e,Pe=null,!0):!1;case 13:return t=t.nodeType!==8?null:t,t!==null?(n=Gt!==null?{id:ot,overflow:it}:null,e.memoizedState={dehydrated:t,treeContext:n,retryLane:1073741824},n=Ie(18,null,null,0),n.stateNode=t,n.return=e,e.child=n,Te=e,Pe=null,!0):!1;default:return!1}}function Ao(e){return(e.mode&1)!==0&&(e.flags&128)===0}function Bo(e){if(H){var t=Pe;if(t){var n=t;if(!Iu(e,t)){if(Ao(e))throw Error(w(418));t=_t(n.nextSibling);var r=Te;t&&Iu(e,t)?Ea(r,n):(e.flags=e.flags&-4097|2,H=!1,Te=e)}}else{if(Ao(e))throw Error(w(418));e.flags=e.flags&-4097|2,H=!1,Te=e}}}function Mu(e){for(e=e.return;e!==null&&e.tag!==5&&e.tag!==3&&e.tag!==13;)e=e.return;Te=e}function Or(e){if(e!==Te)return!1;if(!H)return Mu(e),H=!0,!1;var t;if((t=e.tag!==3)&&!(t=e.tag!==5)&&(t=e.type,t=t!=="head"&&t!=="body"&&!Mo(e.type,e.memoizedProps)),t&&(t=Pe)){if(Ao(e))throw Ca(),Error(w(418));for(;t;)Ea(e,t),t=_t(t.nextSibling)}if(Mu(e),e.tag===13){if(e=e.memoizedState,e=e!==null?e.dehydrated:null,!e)throw Error(w(317));e:{for(e=e.nextSibling,t=0;e;){if(e.nodeType===8){var n=e.data;if(n==="/$"){if(t===0){Pe=_t(e.nextSibling);break e}t--}else n!=="$"&&n!=="$!"&&n!=="$?"||t++}e=e.nextSibling}Pe=null}}else Pe=Te?_t(e.stateNode.nextSibling):null;return!0}function Ca(){for(var e=Pe;e;)e=_t(e.nextSibling)}function En(){Pe=Te=null,H=!1}function Pi(e){He===null?He=[e]:He.push(e)}var xd=dt.ReactCurrentBatchConfig;function Un(e,t,n){if(e=n.ref,e!==null&&typeof e!="function"&&typeof e!="object"){if(n._owner){if(n=n._owner,n){if(n.tag!==1)throw Error(w(309));var r=n.stateNode}if(!r)throw Error(w(147,e));var l=r,o=""+e;return t!==null&&t.ref!==null&&typeof t.ref=="function"&&t.ref._stringRef===o?t.ref:(t=function(i){var u=l.refs;i===null?delete u[o]:u[o]=i},t._stringRef=o,t)}if(typeof e!="string")throw Error(w(284));if(!n._owner)throw Error(w(290,e))}return e}function Ir(e,t){throw e=Object.prototype.toString.call(t),Error(w(31,e==="[object Object]"?"object with keys {"+Object.keys(t).join(", ")+"}":e))}function Fu(e){var t=e._init;return t(e._payload)}function Na(e){function t(d,a){if(e){var p=d.deletions;p===null?(d.deletions=[a],d.flags|=16):p.push(a)}}function n(d,a){if(!e)return null;for(;a!==null;)t(d,a),a=a.sibling;return null}function r(d,a){for(d=new Map;a!==null;)a.key!==null?d.set(a.key,a):d.set(a.index,a),a=a.sibling;return d}function l(d,a){return d=zt(d,a),d.index=0,d.sibling=null,d}function o(d,a,p){return d.index=p,e?(p=d.alternate,p!==null?(p=p.index,p<a?(d.flags|=2,a):p):(d.flags|=2,a)):(d.flags|=1048576,a)}function i(d){return e&&d.alternate===null&&(d.flags|=2),d}function u(d,a,p,y){return a===null||a.tag!==6?(a=co(p,d.mode,y),a.return=d,a):(a=l(a,p),a.return=d,a)}function s(d,a,p,y){var E=p.type;return E===rn?h(d,a,p.props.children,y,p.key):a!==null&&(a.elementType===E||typeof E=="object"&&E!==null&&E.$$typeof===vt&&Fu(E)===a.type)?(y=l(a,p.props),y.ref=Un(d,a,p),y.return=d,y):(y=Jr(p.type,p.key,p.props,null,d.mode,y),y.ref=Un(d,a,p),y.return=d,y)}function f(d,a,p,y){return a===null||a.tag!==4||a.stateNode.containerInfo!==p.containerInfo||a.stateNode.implementation!==p.implementation?(a=fo(p,d.mode,y),a.return=d,a):(a=l(a,p.children||[]),a.return=d,a)}function h(d,a,p,y,E){return a===null||a.tag!==7?(a=Kt(p,d.mode,y,E),a.return=d,a):(a=l(a,p),a.return=d,a)}function v(d,a,p){if(typeof a=="string"&&a!==""||typeof a=="number")return a=co(""+a,d.mode,p),a.return=d,a;if(typeof a=="object"&&a!==null){switch(a.$$typeof){case Cr:return p=Jr(a.type,a.key,a.props,null,d.mode,p),p.ref=Un(d,null,a),p.return=d,p;case nn:return a=fo(a,d.mode,p),a.return=d,a;case vt:var y=a._init;return v(d,y(a._payload),p)}if(Wn(a)||Rn(a))return a=Kt(a,d.mode,p,null),a.return=d,a;Ir(d,a)}return null}function m(d,a,p,y){var E=a!==null?a.key:null;if(typeof p=="string"&&p!==""||typeof p=="number")return E!==null?null:u(d,a,""+p,y);if(typeof p=="object"&&p!==null){switch(p.$$typeof){case Cr:return p.key===E?s(d,a,p,y):null;case nn:return p.key===E?f(d,a,p,y):null;case vt:return E=p._init,m(d,a,E(p._payload),y)}if(Wn(p)||Rn(p))return E!==null?null:h(d,a,p,y,null);Ir(d,p)}return null}function x(d,a,p,y,E){if(typeof y=="string"&&y!==""||typeof y=="number")return d=d.get(p)||null,u(a,d,""+y,E);if(typeof y=="object"&&y!==null){switch(y.$$typeof){case Cr:return d=d.get(y.key===null?p:y.key)||null,s(a,d,y,E);case nn:return d=d.get(y.key===null?p:y.key)||null,f(a,d,y,E);case vt:var _=y._init;return x(d,a,p,_(y._payload),E)}if(Wn(y)||Rn(y))return d=d.get(p)||null,h(a,d,y,E,null);Ir(a,y)}return null}function k(d,a,p,y){for(var E=null,_=null,N=a,P=a=0,B=null;N!==null&&P<p.length;P++){N.index>P?(B=N,N=null):B=N.sibling;var z=m(d,N,p[P],y);if(z===null){N===null&&(N=B);break}e&&N&&z.alternate===null&&t(d,N),a=o(z,a,P),_===null?E=z:_.sibling=z,_=z,N=B}if(P===p.length)return n(d,N),H&&At(d,P),E;if(N===null){for(;P<p.length;P++)N=v(d,p[P],y),N!==null&&(a=o(N,a,P),_===null?E=N:_.sibling=N,_=N);return H&&At(d,P),E}for(N=r(d,N);P<p.length;P++)B=x(N,d,P,p[P],y),B!==null&&(e&&B.alternate!==null&&N.delete(B.key===null?P:B.key),a=o(B,a,P),_===null?E=B:_.sibling=B,_=B);return e&&N.forEach(function(Ne){return t(d,Ne)}),H&&At(d,P),E}function S(d,a,p,y){var E=Rn(p);if(typeof E!="function")throw Error(w(150));if(p=E.call(p),p==null)throw Error(w(151));for(var _=E=null,N=a,P=a=0,B=null,z=p.next();N!==null&&!z.done;P++,z=p.next()){N.index>P?(B=N,N=null):B=N.sibling;var Ne=m(d,N,z.value,y);if(Ne===null){N===null&&(N=B);break}e&&N&&Ne.alternate===null&&t(d,N),a=o(Ne,a,P),_===null?E=Ne:_.sibling=Ne,_=Ne,N=B}if(z.done)return n(d,N),H&&At(d,P),E;if(N===null){for(;!z.done;P++,z=p.next())z=v(d,z.value,y),z!==null&&(a=o(z,a,P),_===null?E=z:_.sibling=z,_=z);return H&&At(d,P),E}for(N=r(d,N);!z.done;P++,z=p.next())z=x(N,d,P,z.value,y),z!==null&&(e&&z.alternate!==null&&N.delete(z.key===null?P:z.key),a=o(z,a,P),_===null?E=z:_.sibling=z,_=z);return e&&N.forEach(function(tt){return t(d,tt)}),H&&At(d,P),E}function F(d,a,p,y){if(typeof p=="object"&&p!==null&&p.type===rn&&p.key===null&&(p=p.props.children),typeof p=="object"&&p!==null){switch(p.$$typeof){case Cr:e:{for(var E=p.key,_=a;_!==null;){if(_.key===E){if(E=p.type,E===rn){if(_.tag===7){n(d,_.sibling),a=l(_,p.props.children),a.return=d,d=a;break e}}else if(_.elementType===E||typeof E=="object"&&E!==null&&E.$$typeof===vt&&Fu(E)===_.type){n(d,_.sibling),a=l(_,p.props),a.ref=Un(d,_,p),a.return=d,d=a;break e}n(d,_);break}else t(d,_);_=_.sibling}p.type===rn?(a=Kt(p.props.children,d.mode,y,p.key),a.return=d,d=a):(y=Jr(p.type,p.key,p.props,null,d.mode,y),y.ref=Un(d,a,p),y.return=d,d=y)}return i(d);case nn:e:{for(_=p.key;a!==null;){if(a.key===_)if(a.tag===4&&a.stateNode.containerInfo===p.containerInfo&&a.stateNode.implementation===p.implementation){n(d,a.sibling),a=l(a,p.children||[]),a.return=d,d=a;break e}else{n(d,a);break}else t(d,a);a=a.sibling}a=fo(p,d.mode,y),a.return=d,d=a}return i(d);case vt:return _=p._init,F(d,a,_(p._payload),y)}if(Wn(p))return k(d,a,p,y);if(Rn(p))return S(d,a,p,y);Ir(d,p)}return typeof p=="string"&&p!==""||typeof p=="number"?(p=""+p,a!==null&&a.tag===6?(n(d,a.sibling),a=l(a,p),a.return=d,d=a):(n(d,a),a=co(p,d.mode,y),a.return=d,d=a),i(d)):n(d,a)}return F}var Cn=Na(!0),ja=Na(!1),fl=It(null),dl=null,dn=null,Ti=null;function Li(){Ti=dn=dl=null}function zi(e){var t=fl.current;A(fl),e._currentValue=t}function Wo(e,t,n){for(;e!==null;){var r=e.alternate;if((e.childLanes&t)!==t?(e.childLanes|=t,r!==null&&(r.childLanes|=t)):r!==null&&(r.childLanes&t)!==t&&(r.childLanes|=t),e===n)break;e=e.return}}function wn(e,t){dl=e,Ti=dn=null,e=e.dependencies,e!==null&&e.firstContext!==null&&(e.lanes&t&&(ke=!0),e.firstContext=null)}function Fe(e){var t=e._currentValue;if(Ti!==e)if(e={context:e,memoizedValue:t,next:null},dn===null){if(dl===null)throw Error(w(308));dn=e,dl.dependencies={lanes:0,firstContext:e}}else dn=dn.next=e;return t}var Vt=null;function Di(e){Vt===null?Vt=[e]:Vt.push(e)}function _a(e,t,n,r){var l=t.interleaved;return l===null?(n.next=n,Di(t)):(n.next=l.next,l.next=n),t.interleaved=n,ct(e,r)}function ct(e,t){e.lanes|=t;var n=e.alternate;for(n!==null&&(n.lanes|=t),n=e,e=e.return;e!==null;)e.childLanes|=t,n=e.alternate,n!==null&&(n.childLanes|=t),n=e,e=e.return;return n.tag===3?n.stateNode:null}var gt=!1;function Ri(e){e.updateQueue={baseState:e.memoizedState,firstBaseUpdate:null,lastBaseUpdate:null,shared:{pending:null,interleaved:null,lanes:0},effects:null}}function Pa(e,t){e=e.updateQueue,t.updateQueue===e&&(t.updateQueue={baseState:e.baseState,firstBaseUpdate:e.firstBaseUpdate,lastBaseUpdate:e.lastBaseUpdate,shared:e.shared,effects:e.effects})}function ut(e,t){return{eventTime:e,lane:t,tag:0,payload:null,callback:null,next:null}}function Pt(e,t,n){var r=e.updateQueue;if(r===null)return null;if(r=r.shared,I&2){var l=r.pending;return l===null?t.next=t:(t.next=l.next,l.next=t),r.pending=t,ct(e,n)}return l=r.interleaved,l===null?(t.next=t,Di(r)):(t.next=l.next,l.next=t),r.interleaved=t,ct(e,n)}function Qr(e,t,n){if(t=t.updateQueue,t!==null&&(t=t.shared,(n&4194240)!==0)){var r=t.lanes;r&=e.pendingLanes,n|=r,t.lanes=n,yi(e,n)}}function Uu(e,t){var n=e.updateQueue,r=e.alternate;if(r!==null&&(r=r.updateQueue,n===r)){var l=null,o=null;if(n=n.firstBaseUpdate,n!==null){do{var i={eventTime:n.eventTime,lane:n.lane,tag:n.tag,payload:n.payload,callback:n.callback,next:null};o===null?l=o=i:o=o.next=i,n=n.next}while(n!==null);o===null?l=o=t:o=o.next=t}else l=o=t;n={baseState:r.baseState,firstBaseUpdate:l,lastBaseUpdate:o,shared:r.shared,effects:r.effects},e.updateQueue=n;return}e=n.lastBaseUpdate,e===null?n.firstBaseUpdate=t:e.next=t,n.lastBaseUpdate=t}function pl(e,t,n,r){var l=e.updateQueue;gt=!1;var o=l.firstBaseUpdate,i=l.lastBaseUpdate,u=l.shared.pending;if(u!==null){l.shared.pending=null;var s=u,f=s.next;s.next=null,i===null?o=f:i.next=f,i=s;var h=e.alternate;h!==null&&(h=h.updateQueue,u=h.lastBaseUpdate,u!==i&&(u===null?h.firstBaseUpdate=f:u.next=f,h.lastBaseUpdate=s))}if(o!==null){var v=l.baseState;i=0,h=f=s=null,u=o;do{var m=u.lane,x=u.eventTime;if((r&m)===m){h!==null&&(h=h.next={eventTime:x,lane:0,tag:u.tag,payload:u.payload,callback:u.callback,next:null});e:{var k=e,S=u;switch(m=t,x=n,S.tag){case 1:if(k=S.payload,typeof k=="function"){v=k.call(x,v,m);break e}v=k;break e;case 3:k.flags=k.flags&-65537|128;case 0:if(k=S.payload,m=typeof k=="function"?k.call(x,v,m):k,m==null)break e;v=Y({},v,m);break e;case 2:gt=!0}}u.callback!==null&&u.lane!==0&&(e.flags|=64,m=l.effects,m===null?l.effects=[u]:m.push(u))}else x={eventTime:x,lane:m,tag:u.tag,payload:u.payload,callback:u.callback,next:null},h===null?(f=h=x,s=v):h=h.next=x,i|=m;if(u=u.next,u===null){if(u=l.shared.pending,u===null)break;m=u,u=m.next,m.next=null,l.lastBaseUpdate=m,l.shared.pending=null}}while(!0);if(h===null&&(s=v),l.baseState=s,l.firstBaseUpdate=f,l.lastBaseUpdate=h,t=l.shared.interleaved,t!==null){l=t;do i|=l.lane,l=l.next;while(l!==t)}else o===null&&(l.shared.lanes=0);Zt|=i,e.lanes=i,e.memoizedState=v}}function $u(e,t,n){if(e=t.effects,t.effects=null,e!==null)for(t=0;t<e.length;t++){var r=e[t],l=r.callback;if(l!==null){if(r.callback=null,r=n,typeof l!="function")throw Error(w(191,l));l.call(r)}}}var kr={},et=It(kr),fr=It(kr),dr=It(kr);function Ht(e){if(e===kr)throw Error(w(174));return e}function Oi(e,t){switch(U(dr,t),U(fr,e),U(et,kr),e=t.nodeType,e){case 9:case 11:t=(t=t.documentElement)?t.namespaceURI:So(null,"");break;default:e=e===8?t.parentNode:t,t=e.namespaceURI||null,e=e.tagName,t=So(t,e)}A(et),U(et,t)}function Nn(){A(et),A(fr),A(dr)}function Ta(e){Ht(dr.current);var t=Ht(et.current),n=So(t,e.type);t!==n&&(U(fr,e),U(et,n))}function Ii(e){fr.current===e&&(A(et),A(fr))}var Q=It(0);function hl(e){for(var t=e;t!==null;){if(t.tag===13){var n=t.memoizedState;if(n!==null&&(n=n.dehydrated,n===null||n.data==="$?"||n.data==="$!"))return t}else if(t.tag===19&&t.memoizedProps.revealOrder!==void 0){if(t.flags&128)return t}else if(t.child!==null){t.child.return=t,t=t.child;continue}if(t===e)break;for(;t.sibling===null;){if(t.return===null||t.return===e)return null;t=t.return}t.sibling.return=t.return,t=t.sibling}return null}var lo=[];function Mi(){for(var e=0;e<lo.length;e++)lo[e]._workInProgressVersionPrimary=null;lo.length=0}var Kr=dt.ReactCurrentDispatcher,oo=dt.ReactCurrentBatchConfig,Xt=0,K=null,ne=null,le=null,ml=!1,Zn=!1,pr=0,kd=0;function ce(){throw Error(w(321))}function Fi(e,t){if(t===null)return!1;for(var n=0;n<t.length&&n<e.length;n++)if(!Ye(e[n],t[n]))return!1;return!0}function Ui(e,t,n,r,l,o){if(Xt=o,K=t,t.memoizedState=null,t.updateQueue=null,t.lanes=0,Kr.current=e===null||e.memoizedState===null?Nd:jd,e=n(r,l),Zn){o=0;do{if(Zn=!1,pr=0,25<=o)throw Error(w(301));o+=1,le=ne=null,t.updateQueue=null,Kr.current=_d,e=n(r,l)}while(Zn)}if(Kr.current=vl,t=ne!==null&&ne.next!==null,Xt=0,le=ne=K=null,ml=!1,t)throw Error(w(300));return e}function $i(){var e=pr!==0;return pr=0,e}function Je(){var e={memoizedState:null,baseState:null,baseQueue:null,queue:null,next:null};return le===null?K.memoizedState=le=e:le=le.next=e,le}function Ue(){if(ne===null){var e=K.alternate;e=e!==null?e.memoizedState:null}else e=ne.next;var t=le===null?K.memoizedState:le.next;if(t!==null)le=t,ne=e;else{if(e===null)throw Error(w(310));ne=e,e={memoizedState:ne.memoizedState,baseState:ne.baseState,baseQueue:ne.baseQueue,queue:ne.queue,next:null},le===null?K.memoizedState=le=e:le=le.next=e}return le}function hr(e,t){return typeof t=="function"?t(e):t}function io(e){var t=Ue(),n=t.queue;if(n===null)throw Error(w(311));n.lastRenderedReducer=e;var r=ne,l=r.baseQueue,o=n.pending;if(o!==null){if(l!==null){var i=l.next;l.next=o.next,o.next=i}r.baseQueue=l=o,n.pending=null}if(l!==null){o=l.next,r=r.baseState;var u=i=null,s=null,f=o;do{var h=f.lane;if((Xt&h)===h)s!==null&&(s=s.next={lane:0,action:f.action,hasEagerState:f.hasEagerState,eagerState:f.eagerState,next:null}),r=f.hasEagerState?f.eagerState:e(r,f.action);else{var v={lane:h,action:f.action,hasEagerState:f.hasEagerState,eagerState:f.eagerState,next:null};s===null?(u=s=v,i=r):s=s.next=v,K.lanes|=h,Zt|=h}f=f.next}while(f!==null&&f!==o);s===null?i=r:s.next=u,Ye(r,t.memoizedState)||(ke=!0),t.memoizedState=r,t.baseState=i,t.baseQueue=s,n.lastRenderedState=r}if(e=n.interleaved,e!==null){l=e;do o=l.lane,K.lanes|=o,Zt|=o,l=l.next;while(l!==e)}else l===null&&(n.lanes=0);return[t.memoizedState,n.dispatch]}function uo(e){var t=Ue(),n=t.queue;if(n===null)throw Error(w(311));n.lastRenderedReducer=e;var r=n.dispatch,l=n.pending,o=t.memoizedState;if(l!==null){n.pending=null;var i=l=l.next;do o=e(o,i.action),i=i.next;while(i!==l);Ye(o,t.memoizedState)||(ke=!0),t.memoizedState=o,t.baseQueue===null&&(t.baseState=o),n.lastRenderedState=o}return[o,r]}function La(){}function za(e,t){var n=K,r=Ue(),l=t(),o=!Ye(r.memoizedState,l);if(o&&(r.memoizedState=l,ke=!0),r=r.queue,Ai(Oa.bind(null,n,r,e),[e]),r.getSnapshot!==t||o||le!==null&&le.memoizedState.tag&1){if(n.flags|=2048,mr(9,Ra.bind(null,n,r,l,t),void 0,null),oe===null)throw Error(w(349));Xt&30||Da(n,t,l)}return l}function Da(e,t,n){e.flags|=16384,e={getSnapshot:t,value:n},t=K.updateQueue,t===null?(t={lastEffect:null,stores:null},K.updateQueue=t,t.stores=[e]):(n=t.stores,n===null?t.stores=[e]:n.push(e))}function Ra(e,t,n,r){t.value=n,t.getSnapshot=r,Ia(t)&&Ma(e)}function Oa(e,t,n){return n(function(){Ia(t)&&Ma(e)})}function Ia(e){var t=e.getSnapshot;e=e.value;try{var n=t();return!Ye(e,n)}catch{return!0}}function Ma(e){var t=ct(e,1);t!==null&&Ke(t,e,1,-1)}function Au(e){var t=Je();return typeof e=="function"&&(e=e()),t.memoizedState=t.baseState=e,e={pending:null,interleaved:null,lanes:0,dispatch:null,lastRenderedReducer:hr,lastRenderedState:e},t.queue=e,e=e.dispatch=Cd.bind(null,K,e),[t.memoizedState,e]}function mr(e,t,n,r){return e={tag:e,create:t,destroy:n,deps:r,next:null},t=K.updateQueue,t===null?(t={lastEffect:null,stores:null},K.updateQueue=t,t.lastEffect=e.next=e):(n=t.lastEffect,n===null?t.lastEffect=e.next=e:(r=n.next,n.next=e,e.next=r,t.lastEffect=e)),e}function Fa(){return Ue().memoizedState}function Yr(e,t,n,r){var l=Je();K.flags|=e,l.memoizedState=mr(1|t,n,void 0,r===void 0?null:r)}function Ll(e,t,n,r){var l=Ue();r=r===void 0?null:r;var o=void 0;if(ne!==null){var i=ne.memoizedState;if(o=i.destroy,r!==null&&Fi(r,i.deps)){l.memoizedState=mr(t,n,o,r);return}}K.flags|=e,l.memoizedState=mr(1|t,n,o,r)}function Bu(e,t){return Yr(8390656,8,e,t)}function Ai(e,t){return Ll(2048,8,e,t)}function Ua(e,t){return Ll(4,2,e,t)}function $a(e,t){return Ll(4,4,e,t)}function Aa(e,t){if(typeof t=="function")return e=e(),t(e),function(){t(null)};if(t!=null)return e=e(),t.current=e,function(){t.current=null}}function Ba(e,t,n){return n=n!=null?n.concat([e]):null,Ll(4,4,Aa.bind(null,t,e),n)}function Bi(){}function Wa(e,t){var n=Ue();t=t===void 0?null:t;var r=n.memoizedState;return r!==null&&t!==null&&Fi(t,r[1])?r[0]:(n.memoizedState=[e,t],e)}function Va(e,t){var n=Ue();t=t===void 0?null:t;var r=n.memoizedState;return r!==null&&t!==null&&Fi(t,r[1])?r[0]:(e=e(),n.memoizedState=[e,t],e)}function Ha(e,t,n){return Xt&21?(Ye(n,t)||(n=Xs(),K.lanes|=n,Zt|=n,e.baseState=!0),t):(e.baseState&&(e.baseState=!1,ke=!0),e.memoizedState=n)}function Sd(e,t){var n=M;M=n!==0&&4>n?n:4,e(!0);var r=oo.transition;oo.transition={};try{e(!1),t()}finally{M=n,oo.transition=r}}function Qa(){return Ue().memoizedState}function Ed(e,t,n){var r=Lt(e);if(n={lane:r,action:n,hasEagerState:!1,eagerState:null,next:null},Ka(e))Ya(t,n);else if(n=_a(e,t,n,r),n!==null){var l=ve();Ke(n,e,r,l),Ga(n,t,r)}}function Cd(e,t,n){var r=Lt(e),l={lane:r,action:n,hasEagerState:!1,eagerState:null,next:null};if(Ka(e))Ya(t,l);else{var o=e.alternate;if(e.lanes===0&&(o===null||o.lanes===0)&&(o=t.lastRenderedReducer,o!==null))try{var i=t.lastRenderedState,u=o(i,n);if(l.hasEagerState=!0,l.eagerState=u,Ye(u,i)){var s=t.interleaved;s===null?(l.next=l,Di(t)):(l.next=s.next,s.next=l),t.interleaved=l;return}}catch{}finally{}n=_a(e,t,l,r),n!==null&&(l=ve(),Ke(n,e,r,l),Ga(n,t,r))}}function Ka(e){var t=e.alternate;return e===K||t!==null&&t===K}function Ya(e,t){Zn=ml=!0;var n=e.pending;n===null?t.next=t:(t.next=n.next,n.next=t),e.pending=t}function Ga(e,t,n){if(n&4194240){var r=t.lanes;r&=e.pendingLanes,n|=r,t.lanes=n,yi(e,n)}}var vl={readContext:Fe,useCallback:ce,useContext:ce,useEffect:ce,useImperativeHandle:ce,useInsertionEffect:ce,useLayoutEffect:ce,useMemo:ce,useReducer:ce,useRef:ce,useState:ce,useDebugValue:ce,useDeferredValue:ce,useTransition:ce,useMutableSource:ce,useSyncExternalStore:ce,useId:ce,unstable_isNewReconciler:!1},Nd={readContext:Fe,useCallback:function(e,t){return Je().memoizedState=[e,t===void 0?null:t],e},useContext:Fe,useEffect:Bu,useImperativeHandle:function(e,t,n){return n=n!=null?n.concat([e]):null,Yr(4194308,4,Aa.bind(null,t,e),n)},useLayoutEffect:function(e,t){return Yr(4194308,4,e,t)},useInsertionEffect:function(e,t){return Yr(4,2,e,t)},useMemo:function(e,t){var n=Je();return t=t===void 0?null:t,e=e(),n.memoizedState=[e,t],e},useReducer:function(e,t,n){var r=Je();return t=n!==void 0?n(t):t,r.memoizedState=r.baseState=t,e={pending:null,interleaved:null,lanes:0,dispatch:null,lastRenderedReducer:e,lastRenderedState:t},r.queue=e,e=e.dispatch=Ed.bind(null,K,e),[r.memoizedState,e]},useRef:function(e){var t=Je();return e={current:e},t.memoizedState=e},useState:Au,useDebugValue:Bi,useDeferredValue:function(e){return Je().memoizedState=e},useTransition:function(){var e=Au(!1),t=e[0];return e=Sd.bind(null,e[1]),Je().memoizedState=e,[t,e]},useMutableSource:function(){},useSyncExternalStore:function(e,t,n){var r=K,l=Je();if(H){if(n===void 0)throw Error(w(407));n=n()}else{if(n=t(),oe===null)throw Error(w(349));Xt&30||Da(r,t,n)}l.memoizedState=n;var o={value:n,getSnapshot:t};return l.queue=o,Bu(Oa.bind(null,r,o,e),[e]),r.flags|=2048,mr(9,Ra.bind(null,r,o,n,t),void 0,null),n},useId:function(){var e=Je(),t=oe.identifierPrefix;if(H){var n=it,r=ot;n=(r&~(1<<32-Qe(r)-1)).toString(32)+n,t=":"+t+"R"+n,n=pr++,0<n&&(t+="H"+n.toString(32)),t+=":"}else n=kd++,t=":"+t+"r"+n.toString(32)+":";return e.memoizedState=t},unstable_isNewReconciler:!1},jd={readContext:Fe,useCallback:Wa,useContext:Fe,useEffect:Ai,useImperativeHandle:Ba,useInsertionEffect:Ua,useLayoutEffect:$a,useMemo:Va,useReducer:io,useRef:Fa,useState:function(){return io(hr)},useDebugValue:Bi,useDeferredValue:function(e){var t=Ue();return Ha(t,ne.memoizedState,e)},useTransition:function(){var e=io(hr)[0],t=Ue().memoizedState;return[e,t]},useMutableSource:La,useSyncExternalStore:za,useId:Qa,unstable_isNewReconciler:!1},_d={readContext:Fe,useCallback:Wa,useContext:Fe,useEffect:Ai,useImperativeHandle:Ba,useInsertionEffect:Ua,useLayoutEffect:$a,useMemo:Va,useReducer:uo,useRef:Fa,useState:function(){return uo(hr)},useDebugValue:Bi,useDeferredValue:function(e){var t=Ue();return ne===null?t.memoizedState=e:Ha(t,ne.memoizedState,e)},useTransition:function(){var e=uo(hr)[0],t=Ue().memoizedState;return[e,t]},useMutableSource:La,useSyncExternalStore:za,useId:Qa,unstable_isNewReconciler:!1};function We(e,t){if(e&&e.defaultProps){t=Y({},t),e=e.defaultProps;for(var n in e)t[n]===void 0&&(t[n]=e[n]);return t}return t}function Vo(e,t,n,r){t=e.memoizedState,n=n(r,t),n=n==null?t:Y({},t,n),e.memoizedState=n,e.lanes===0&&(e.updateQueue.baseState=n)}var zl={isMounted:function(e){return(e=e._reactInternals)?bt(e)===e:!1},enqueueSetState:function(e,t,n){e=e._reactInternals;var r=ve(),l=Lt(e),o=ut(r,l);o.payload=t,n!=null&&(o.callback=n),t=Pt(e,o,l),t!==null&&(Ke(t,e,l,r),Qr(t,e,l))},enqueueReplaceState:function(e,t,n){e=e._reactInternals;var r=ve(),l=Lt(e),o=ut(r,l);o.tag=1,o.payload=t,n!=null&&(o.callback=n),t=Pt(e,o,l),t!==null&&(Ke(t,e,l,r),Qr(t,e,l))},enqueueForceUpdate:function(e,t){e=e._reactInternals;var n=ve(),r=Lt(e),l=ut(n,r);l.tag=2,t!=null&&(l.callback=t),t=Pt(e,l,r),t!==null&&(Ke(t,e,r,n),Qr(t,e,r))}};function Wu(e,t,n,r,l,o,i){return e=e.stateNode,typeof e.shouldComponentUpdate=="function"?e.shouldComponentUpdate(r,o,i):t.prototype&&t.prototype.isPureReactComponent?!ur(n,r)||!ur(l,o):!0}function Xa(e,t,n){var r=!1,l=Rt,o=t.contextType;return typeof o=="object"&&o!==null?o=Fe(o):(l=Ee(t)?Yt:pe.current,r=t.contextTypes,o=(r=r!=null)?Sn(e,l):Rt),t=new t(n,o),e.memoizedState=t.state!==null&&t.state!==void 0?t.state:null,t.updater=zl,e.stateNode=t,t._reactInternals=e,r&&(e=e.stateNode,e.__reactInternalMemoizedUnmaskedChildContext=l,e.__reactInternalMemoizedMaskedChildContext=o),t}function Vu(e,t,n,r){e=t.state,typeof t.componentWillReceiveProps=="function"&&t.componentWillReceiveProps(n,r),typeof t.UNSAFE_componentWillReceiveProps=="function"&&t.UNSAFE_componentWillReceiveProps(n,r),t.state!==e&&zl.enqueueReplaceState(t,t.state,null)}function Ho(e,t,n,r){var l=e.stateNode;l.props=n,l.state=e.memoizedState,l.refs={},Ri(e);var o=t.contextType;typeof o=="object"&&o!==null?l.context=Fe(o):(o=Ee(t)?Yt:pe.current,l.context=Sn(e,o)),l.state=e.memoizedState,o=t.getDerivedStateFromProps,typeof o=="function"&&(Vo(e,t,o,n),l.state=e.memoizedState),typeof t.getDerivedStateFromProps=="function"||typeof l.getSnapshotBeforeUpdate=="function"||typeof l.UNSAFE_componentWillMount!="function"&&typeof l.componentWillMount!="function"||(t=l.state,typeof l.componentWillMount=="function"&&l.componentWillMount(),typeof l.UNSAFE_componentWillMount=="function"&&l.UNSAFE_componentWillMount(),t!==l.state&&zl.enqueueReplaceState(l,l.state,null),pl(e,n,l,r),l.state=e.memoizedState),typeof l.componentDidMount=="function"&&(e.flags|=4194308)}function jn(e,t){try{var n="",r=t;do n+=ef(r),r=r.return;while(r);var l=n}catch(o){l=`
-Error generating stack: `+o.message+`
-`+o.stack}return{value:e,source:t,stack:l,digest:null}}function so(e,t,n){return{value:e,source:null,stack:n??null,digest:t??null}}function Qo(e,t){try{console.error(t.value)}catch(n){setTimeout(function(){throw n})}}var Pd=typeof WeakMap=="function"?WeakMap:Map;function Za(e,t,n){n=ut(-1,n),n.tag=3,n.payload={element:null};var r=t.value;return n.callback=function(){yl||(yl=!0,ti=r),Qo(e,t)},n}function Ja(e,t,n){n=ut(-1,n),n.tag=3;var r=e.type.getDerivedStateFromError;if(typeof r=="function"){var l=t.value;n.payload=function(){return r(l)},n.callback=function(){Qo(e,t)}}var o=e.stateNode;return o!==null&&typeof o.componentDidCatch=="function"&&(n.callback=function(){Qo(e,t),typeof r!="function"&&(Tt===null?Tt=new Set([this]):Tt.add(this));var i=t.stack;this.componentDidCatch(t.value,{componentStack:i!==null?i:""})}),n}function Hu(e,t,n){var r=e.pingCache;if(r===null){r=e.pingCache=new Pd;var l=new Set;r.set(t,l)}else l=r.get(t),l===void 0&&(l=new Set,r.set(t,l));l.has(n)||(l.add(n),e=Wd.bind(null,e,t,n),t.then(e,e))}function Qu(e){do{var t;if((t=e.tag===13)&&(t=e.memoizedState,t=t!==null?t.dehydrated!==null:!0),t)return e;e=e.return}while(e!==null);return null}function Ku(e,t,n,r,l){return e.mode&1?(e.flags|=65536,e.lanes=l,e):(e===t?e.flags|=65536:(e.flags|=128,n.flags|=131072,n.flags&=-52805,n.tag===1&&(n.alternate===null?n.tag=17:(t=ut(-1,1),t.tag=2,Pt(n,t,1))),n.lanes|=1),e)}var Td=dt.ReactCurrentOwner,ke=!1;function me(e,t,n,r){t.child=e===null?ja(t,null,n,r):Cn(t,e.child,n,r)}function Yu(e,t,n,r,l){n=n.render;var o=t.ref;return wn(t,l),r=Ui(e,t,n,r,o,l),n=$i(),e!==null&&!ke?(t.updateQueue=e.updateQueue,t.flags&=-2053,e.lanes&=~l,ft(e,t,l)):(H&&n&&ji(t),t.flags|=1,me(e,t,r,l),t.child)}function Gu(e,t,n,r,l){if(e===null){var o=n.type;return typeof o=="function"&&!Xi(o)&&o.defaultProps===void 0&&n.compare===null&&n.defaultProps===void 0?(t.tag=15,t.type=o,qa(e,t,o,r,l)):(e=Jr(n.type,null,r,t,t.mode,l),e.ref=t.ref,e.return=t,t.child=e)}if(o=e.child,!(e.lanes&l)){var i=o.memoizedProps;if(n=n.compare,n=n!==null?n:ur,n(i,r)&&e.ref===t.ref)return ft(e,t,l)}return t.flags|=1,e=zt(o,r),e.ref=t.ref,e.return=t,t.child=e}function qa(e,t,n,r,l){if(e!==null){var o=e.memoizedProps;if(ur(o,r)&&e.ref===t.ref)if(ke=!1,t.pendingProps=r=o,(e.lanes&l)!==0)e.flags&131072&&(ke=!0);else return t.lanes=e.lanes,ft(e,t,l)}return Ko(e,t,n,r,l)}function ba(e,t,n){var r=t.pendingProps,l=r.children,o=e!==null?e.memoizedState:null;if(r.mode==="hidden")if(!(t.mode&1))t.memoizedState={baseLanes:0,cachePool:null,transitions:null},U(hn,_e),_e|=n;else{if(!(n&1073741824))return e=o!==null?o.baseLanes|n:n,t.lanes=t.childLanes=1073741824,t.memoizedState={baseLanes:e,cachePool:null,transitions:null},t.updateQueue=null,U(hn,_e),_e|=e,null;t.memoizedState={baseLanes:0,cachePool:null,transitions:null},r=o!==null?o.baseLanes:n,U(hn,_e),_e|=r}else o!==null?(r=o.baseLanes|n,t.memoizedState=null):r=n,U(hn,_e),_e|=r;return me(e,t,l,n),t.child}function ec(e,t){var n=t.ref;(e===null&&n!==null||e!==null&&e.ref!==n)&&(t.flags|=512,t.flags|=2097152)}function Ko(e,t,n,r,l){var o=Ee(n)?Yt:pe.current;return o=Sn(t,o),wn(t,l),n=Ui(e,t,n,r,o,l),r=$i(),e!==null&&!ke?(t.updateQueue=e.updateQueue,t.flags&=-2053,e.lanes&=~l,ft(e,t,l)):(H&&r&&ji(t),t.flags|=1,me(e,t,n,l),t.child)}function Xu(e,t,n,r,l){if(Ee(n)){var o=!0;sl(t)}else o=!1;if(wn(t,l),t.stateNode===null)Gr(e,t),Xa(t,n,r),Ho(t,n,r,l),r=!0;else if(e===null){var i=t.stateNode,u=t.memoizedProps;i.props=u;var s=i.context,f=n.contextType;typeof f=="object"&&f!==null?f=Fe(f):(f=Ee(n)?Yt:pe.current,f=Sn(t,f));var h=n.getDerivedStateFromProps,v=typeof h=="function"||typeof i.getSnapshotBeforeUpdate=="function";v||typeof i.UNSAFE_componentWillReceiveProps!="function"&&typeof i.componentWillReceiveProps!="function"||(u!==r||s!==f)&&Vu(t,i,r,f),gt=!1;var m=t.memoizedState;i.state=m,pl(t,r,i,l),s=t.memoizedState,u!==r||m!==s||Se.current||gt?(typeof h=="function"&&(Vo(t,n,h,r),s=t.memoizedState),(u=gt||Wu(t,n,u,r,m,s,f))?(v||typeof i.UNSAFE_componentWillMount!="function"&&typeof i.componentWillMount!="function"||(typeof i.componentWillMount=="function"&&i.componentWillMount(),typeof i.UNSAFE_componentWillMount=="function"&&i.UNSAFE_componentWillMount()),typeof i.componentDidMount=="function"&&(t.flags|=4194308)):(typeof i.componentDidMount=="function"&&(t.flags|=4194308),t.memoizedProps=r,t.memoizedState=s),i.props=r,i.state=s,i.context=f,r=u):(typeof i.componentDidMount=="function"&&(t.flags|=4194308),r=!1)}else{i=t.stateNode,Pa(e,t),u=t.memoizedProps,f=t.type===t.elementType?u:We(t.type,u),i.props=f,v=t.pendingProps,m=i.context,s=n.contextType,typeof s=="object"&&s!==null?s=Fe(s):(s=Ee(n)?Yt:pe.current,s=Sn(t,s));var x=n.getDerivedStateFromProps;(h=typeof x=="function"||typeof i.getSnapshotBeforeUpdate=="function")||typeof i.UNSAFE_componentWillReceiveProps!="function"&&typeof i.componentWillReceiveProps!="function"||(u!==v||m!==s)&&Vu(t,i,r,s),gt=!1,m=t.memoizedState,i.state=m,pl(t,r,i,l);var k=t.memoizedState;u!==v||m!==k||Se.current||gt?(typeof x=="function"&&(Vo(t,n,x,r),k=t.memoizedState),(f=gt||Wu(t,n,f,r,m,k,s)||!1)?(h||typeof i.UNSAFE_componentWillUpdate!="function"&&typeof i.componentWillUpdate!="function"||(typeof i.componentWillUpdate=="function"&&i.componentWillUpdate(r,k,s),typeof i.UNSAFE_componentWillUpdate=="function"&&i.UNSAFE_componentWillUpdate(r,k,s)),typeof i.componentDidUpdate=="function"&&(t.flags|=4),typeof i.getSnapshotBeforeUpdate=="function"&&(t.flags|=1024)):(typeof i.componentDidUpdate!="function"||u===e.memoizedProps&&m===e.memoizedState||(t.flags|=4),typeof i.getSnapshotBeforeUpdate!="function"||u===e.memoizedProps&&m===e.memoizedState||(t.flags|=1024),t.memoizedProps=r,t.memoizedState=k),i.props=r,i.state=k,i.context=s,r=f):(typeof i.componentDidUpdate!="function"||u===e.memoizedProps&&m===e.memoizedState||(t.flags|=4),typeof i.getSnapshotBeforeUpdate!="function"||u===e.memoizedProps&&m===e.memoizedState||(t.flags|=1024),r=!1)}return Yo(e,t,n,r,o,l)}function Yo(e,t,n,r,l,o){ec(e,t);var i=(t.flags&128)!==0;if(!r&&!i)return l&&Ou(t,n,!1),ft(e,t,o);r=t.stateNode,Td.current=t;var u=i&&typeof n.getDerivedStateFromError!="function"?null:r.render();return t.flags|=1,e!==null&&i?(t.child=Cn(t,e.child,null,o),t.child=Cn(t,null,u,o)):me(e,t,u,o),t.memoizedState=r.state,l&&Ou(t,n,!0),t.child}function tc(e){var t=e.stateNode;t.pendingContext?Ru(e,t.pendingContext,t.pendingContext!==t.context):t.context&&Ru(e,t.context,!1),Oi(e,t.containerInfo)}function Zu(e,t,n,r,l){return En(),Pi(l),t.flags|=256,me(e,t,n,r),t.child}var Go={dehydrated:null,treeContext:null,retryLane:0};function Xo(e){return{baseLanes:e,cachePool:null,transitions:null}}function nc(e,t,n){var r=t.pendingProps,l=Q.current,o=!1,i=(t.flags&128)!==0,u;if((u=i)||(u=e!==null&&e.memoizedState===null?!1:(l&2)!==0),u?(o=!0,t.flags&=-129):(e===null||e.memoizedState!==null)&&(l|=1),U(Q,l&1),e===null)return Bo(t),e=t.memoizedState,e!==null&&(e=e.dehydrated,e!==null)?(t.mode&1?e.data==="$!"?t.lanes=8:t.lanes=1073741824:t.lanes=1,null):(i=r.children,e=r.fallback,o?(r=t.mode,o=t.child,i={mode:"hidden",children:i},!(r&1)&&o!==null?(o.childLanes=0,o.pendingProps=i):o=Ol(i,r,0,null),e=Kt(e,r,n,null),o.return=t,e.return=t,o.sibling=e,t.child=o,t.child.memoizedState=Xo(n),t.memoizedState=Go,e):Wi(t,i));if(l=e.memoizedState,l!==null&&(u=l.dehydrated,u!==null))return Ld(e,t,i,r,u,l,n);if(o){o=r.fallback,i=t.mode,l=e.child,u=l.sibling;var s={mode:"hidden",children:r.children};return!(i&1)&&t.child!==l?(r=t.child,r.childLanes=0,r.pendingProps=s,t.deletions=null):(r=zt(l,s),r.subtreeFlags=l.subtreeFlags&14680064),u!==null?o=zt(u,o):(o=Kt(o,i,n,null),o.flags|=2),o.return=t,r.return=t,r.sibling=o,t.child=r,r=o,o=t.child,i=e.child.memoizedState,i=i===null?Xo(n):{baseLanes:i.baseLanes|n,cachePool:null,transitions:i.transitions},o.memoizedState=i,o.childLanes=e.childLanes&~n,t.memoizedState=Go,r}return o=e.child,e=o.sibling,r=zt(o,{mode:"visible",children:r.children}),!(t.mode&1)&&(r.lanes=n),r.return=t,r.sibling=null,e!==null&&(n=t.deletions,n===null?(t.deletions=[e],t.flags|=16):n.push(e)),t.child=r,t.memoizedState=null,r}function Wi(e,t){return t=Ol({mode:"visible",children:t},e.mode,0,null),t.return=e,e.child=t}function Mr(e,t,n,r){return r!==null&&Pi(r),Cn(t,e.child,null,n),e=Wi(t,t.pendingProps.children),e.flags|=2,t.memoizedState=null,e}function Ld(e,t,n,r,l,o,i){if(n)return t.flags&256?(t.flags&=-257,r=so(Error(w(422))),Mr(e,t,i,r)):t.memoizedState!==null?(t.child=e.child,t.flags|=128,null):(o=r.fallback,l=t.mode,r=Ol({mode:"visible",children:r.children},l,0,null),o=Kt(o,l,i,null),o.flags|=2,r.return=t,o.return=t,r.sibling=o,t.child=r,t.mode&1&&Cn(t,e.child,null,i),t.child.memoizedState=Xo(i),t.memoizedState=Go,o);if(!(t.mode&1))return Mr(e,t,i,null);if(l.data==="$!"){if(r=l.nextSibling&&l.nextSibling.dataset,r)var u=r.dgst;return r=u,o=Error(w(419)),r=so(o,r,void 0),Mr(e,t,i,r)}if(u=(i&e.childLanes)!==0,ke||u){if(r=oe,r!==null){switch(i&-i){case 4:l=2;break;case 16:l=8;break;case 64:case 128:case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:case 4194304:case 8388608:case 16777216:case 33554432:case 67108864:l=32;break;case 536870912:l=268435456;break;default:l=0}l=l&(r.suspendedLanes|i)?0:l,l!==0&&l!==o.retryLane&&(o.retryLane=l,ct(e,l),Ke(r,e,l,-1))}return Gi(),r=so(Error(w(421))),Mr(e,t,i,r)}return l.data==="$?"?(t.flags|=128,t.child=e.child,t=Vd.bind(null,e),l._reactRetry=t,null):(e=o.treeContext,Pe=_t(l.nextSibling),Te=t,H=!0,He=null,e!==null&&(Re[Oe++]=ot,Re[Oe++]=it,Re[Oe++]=Gt,ot=e.id,it=e.overflow,Gt=t),t=Wi(t,r.children),t.flags|=4096,t)}function Ju(e,t,n){e.lanes|=t;var r=e.alternate;r!==null&&(r.lanes|=t),Wo(e.return,t,n)}function ao(e,t,n,r,l){var o=e.memoizedState;o===null?e.memoizedState={isBackwards:t,rendering:null,renderingStartTime:0,last:r,tail:n,tailMode:l}:(o.isBackwards=t,o.rendering=null,o.renderingStartTime=0,o.last=r,o.tail=n,o.tailMode=l)}function rc(e,t,n){var r=t.pendingProps,l=r.revealOrder,o=r.tail;if(me(e,t,r.children,n),r=Q.current,r&2)r=r&1|2,t.flags|=128;else{if(e!==null&&e.flags&128)e:for(e=t.child;e!==null;){if(e.tag===13)e.memoizedState!==null&&Ju(e,n,t);else if(e.tag===19)Ju(e,n,t);else if(e.child!==null){e.child.return=e,e=e.child;continue}if(e===t)break e;for(;e.sibling===null;){if(e.return===null||e.return===t)break e;e=e.return}e.sibling.return=e.return,e=e.sibling}r&=1}if(U(Q,r),!(t.mode&1))t.memoizedState=null;else switch(l){case"forwards":for(n=t.child,l=null;n!==null;)e=n.alternate,e!==null&&hl(e)===null&&(l=n),n=n.sibling;n=l,n===null?(l=t.child,t.child=null):(l=n.sibling,n.sibling=null),ao(t,!1,l,n,o);break;case"backwards":for(n=null,l=t.child,t.child=null;l!==null;){if(e=l.alternate,e!==null&&hl(e)===null){t.child=l;break}e=l.sibling,l.sibling=n,n=l,l=e}ao(t,!0,n,null,o);break;case"together":ao(t,!1,null,null,void 0);break;default:t.memoizedState=null}return t.child}function Gr(e,t){!(t.mode&1)&&e!==null&&(e.alternate=null,t.alternate=null,t.flags|=2)}function ft(e,t,n){if(e!==null&&(t.dependencies=e.dependencies),Zt|=t.lanes,!(n&t.childLanes))return null;if(e!==null&&t.child!==e.child)throw Error(w(153));if(t.child!==null){for(e=t.child,n=zt(e,e.pendingProps),t.child=n,n.return=t;e.sibling!==null;)e=e.sibling,n=n.sibling=zt(e,e.pendingProps),n.return=t;n.sibling=null}return t.child}function zd(e,t,n){switch(t.tag){case 3:tc(t),En();break;case 5:Ta(t);break;case 1:Ee(t.type)&&sl(t);break;case 4:Oi(t,t.stateNode.containerInfo);break;case 10:var r=t.type._context,l=t.memoizedProps.value;U(fl,r._currentValue),r._currentValue=l;break;case 13:if(r=t.memoizedState,r!==null)return r.dehydrated!==null?(U(Q,Q.current&1),t.flags|=128,null):n&t.child.childLanes?nc(e,t,n):(U(Q,Q.current&1),e=ft(e,t,n),e!==null?e.sibling:null);U(Q,Q.current&1);break;case 19:if(r=(n&t.childLanes)!==0,e.flags&128){if(r)return rc(e,t,n);t.flags|=128}if(l=t.memoizedState,l!==null&&(l.rendering=null,l.tail=null,l.lastEffect=null),U(Q,Q.current),r)break;return null;case 22:case 23:return t.lanes=0,ba(e,t,n)}return ft(e,t,n)}var lc,Zo,oc,ic;lc=function(e,t){for(var n=t.child;n!==null;){if(n.tag===5||n.tag===6)e.appendChild(n.stateNode);else if(n.tag!==4&&n.child!==null){n.child.return=n,n=n.child;continue}if(n===t)break;for(;n.sibling===null;){if(n.return===null||n.return===t)return;n=n.return}n.sibling.return=n.return,n=n.sibling}};Zo=function(){};oc=function(e,t,n,r){var l=e.memoizedProps;if(l!==r){e=t.stateNode,Ht(et.current);var o=null;switch(n){case"input":l=yo(e,l),r=yo(e,r),o=[];break;case"select":l=Y({},l,{value:void 0}),r=Y({},r,{value:void 0}),o=[];break;case"textarea":l=ko(e,l),r=ko(e,r),o=[];break;default:typeof l.onClick!="function"&&typeof r.onClick=="function"&&(e.onclick=il)}Eo(n,r);var i;n=null;for(f in l)if(!r.hasOwnProperty(f)&&l.hasOwnProperty(f)&&l[f]!=null)if(f==="style"){var u=l[f];for(i in u)u.hasOwnProperty(i)&&(n||(n={}),n[i]="")}else f!=="dangerouslySetInnerHTML"&&f!=="children"&&f!=="suppressContentEditableWarning"&&f!=="suppressHydrationWarning"&&f!=="autoFocus"&&(er.hasOwnProperty(f)?o||(o=[]):(o=o||[]).push(f,null));for(f in r){var s=r[f];if(u=l!=null?l[f]:void 0,r.hasOwnProperty(f)&&s!==u&&(s!=null||u!=null))if(f==="style")if(u){for(i in u)!u.hasOwnProperty(i)||s&&s.hasOwnProperty(i)||(n||(n={}),n[i]="");for(i in s)s.hasOwnProperty(i)&&u[i]!==s[i]&&(n||(n={}),n[i]=s[i])}else n||(o||(o=[]),o.push(f,n)),n=s;else f==="dangerouslySetInnerHTML"?(s=s?s.__html:void 0,u=u?u.__html:void 0,s!=null&&u!==s&&(o=o||[]).push(f,s)):f==="children"?typeof s!="string"&&typeof s!="number"||(o=o||[]).push(f,""+s):f!=="suppressContentEditableWarning"&&f!=="suppressHydrationWarning"&&(er.hasOwnProperty(f)?(s!=null&&f==="onScroll"&&$("scroll",e),o||u===s||(o=[])):(o=o||[]).push(f,s))}n&&(o=o||[]).push("style",n);var f=o;(t.updateQueue=f)&&(t.flags|=4)}};ic=function(e,t,n,r){n!==r&&(t.flags|=4)};function $n(e,t){if(!H)switch(e.tailMode){case"hidden":t=e.tail;for(var n=null;t!==null;)t.alternate!==null&&(n=t),t=t.sibling;n===null?e.tail=null:n.sibling=null;break;case"collapsed":n=e.tail;for(var r=null;n!==null;)n.alternate!==null&&(r=n),n=n.sibling;r===null?t||e.tail===null?e.tail=null:e.tail.sibling=null:r.sibling=null}}function fe(e){var t=e.alternate!==null&&e.alternate.child===e.child,n=0,r=0;if(t)for(var l=e.child;l!==null;)n|=l.lanes|l.childLanes,r|=l.subtreeFlags&14680064,r|=l.flags&14680064,l.return=e,l=l.sibling;else for(l=e.child;l!==null;)n|=l.lanes|l.childLanes,r|=l.subtreeFlags,r|=l.flags,l.return=e,l=l.sibling;return e.subtreeFlags|=r,e.childLanes=n,t}function Dd(e,t,n){var r=t.pendingProps;switch(_i(t),t.tag){case 2:case 16:case 15:case 0:case 11:case 7:case 8:case 12:case 9:case 14:return fe(t),null;case 1:return Ee(t.type)&&ul(),fe(t),null;case 3:return r=t.stateNode,Nn(),A(Se),A(pe),Mi(),r.pendingContext&&(r.context=r.pendingContext,r.pendingContext=null),(e===null||e.child===null)&&(Or(t)?t.flags|=4:e===null||e.memoizedState.isDehydrated&&!(t.flags&256)||(t.flags|=1024,He!==null&&(li(He),He=null))),Zo(e,t),fe(t),null;case 5:Ii(t);var l=Ht(dr.current);if(n=t.type,e!==null&&t.stateNode!=null)oc(e,t,n,r,l),e.ref!==t.ref&&(t.flags|=512,t.flags|=2097152);else{if(!r){if(t.stateNode===null)throw Error(w(166));return fe(t),null}if(e=Ht(et.current),Or(t)){r=t.stateNode,n=t.type;var o=t.memoizedProps;switch(r[qe]=t,r[cr]=o,e=(t.mode&1)!==0,n){case"dialog":$("cancel",r),$("close",r);break;case"iframe":case"object":case"embed":$("load",r);break;case"video":case"audio":for(l=0;l<Hn.length;l++)$(Hn[l],r);break;case"source":$("error",r);break;case"img":case"image":case"link":$("error",r),$("load",r);break;case"details":$("toggle",r);break;case"input":iu(r,o),$("invalid",r);break;case"select":r._wrapperState={wasMultiple:!!o.multiple},$("invalid",r);break;case"textarea":su(r,o),$("invalid",r)}Eo(n,o),l=null;for(var i in o)if(o.hasOwnProperty(i)){var u=o[i];i==="children"?typeof u=="string"?r.textContent!==u&&(o.suppressHydrationWarning!==!0&&Rr(r.textContent,u,e),l=["children",u]):typeof u=="number"&&r.textContent!==""+u&&(o.suppressHydrationWarning!==!0&&Rr(r.textContent,u,e),l=["children",""+u]):er.hasOwnProperty(i)&&u!=null&&i==="onScroll"&&$("scroll",r)}switch(n){case"input":Nr(r),uu(r,o,!0);break;case"textarea":Nr(r),au(r);break;case"select":case"option":break;default:typeof o.onClick=="function"&&(r.onclick=il)}r=l,t.updateQueue=r,r!==null&&(t.flags|=4)}else{i=l.nodeType===9?l:l.ownerDocument,e==="http://www.w3.org/1999/xhtml"&&(e=Os(n)),e==="http://www.w3.org/1999/xhtml"?n==="script"?(e=i.createElement("div"),e.innerHTML="<script><\/script>",e=e.removeChild(e.firstChild)):typeof r.is=="string"?e=i.createElement(n,{is:r.is}):(e=i.createElement(n),n==="select"&&(i=e,r.multiple?i.multiple=!0:r.size&&(i.size=r.size))):e=i.createElementNS(e,n),e[qe]=t,e[cr]=r,lc(e,t,!1,!1),t.stateNode=e;e:{switch(i=Co(n,r),n){case"dialog":$("cancel",e),$("close",e),l=r;break;case"iframe":case"object":case"embed":$("load",e),l=r;break;case"video":case"audio":for(l=0;l<Hn.length;l++)$(Hn[l],e);l=r;break;case"source":$("error",e),l=r;break;case"img":case"image":case"link":$("error",e),$("load",e),l=r;break;case"details":$("toggle",e),l=r;break;case"input":iu(e,r),l=yo(e,r),$("invalid",e);break;case"option":l=r;break;case"select":e._wrapperState={wasMultiple:!!r.multiple},l=Y({},r,{value:void 0}),$("invalid",e);break;case"textarea":su(e,r),l=ko(e,r),$("invalid",e);break;default:l=r}Eo(n,l),u=l;for(o in u)if(u.hasOwnProperty(o)){var s=u[o];o==="style"?Fs(e,s):o==="dangerouslySetInnerHTML"?(s=s?s.__html:void 0,s!=null&&Is(e,s)):o==="children"?typeof s=="string"?(n!=="textarea"||s!=="")&&tr(e,s):typeof s=="number"&&tr(e,""+s):o!=="suppressContentEditableWarning"&&o!=="suppressHydrationWarning"&&o!=="autoFocus"&&(er.hasOwnProperty(o)?s!=null&&o==="onScroll"&&$("scroll",e):s!=null&&di(e,o,s,i))}switch(n){case"input":Nr(e),uu(e,r,!1);break;case"textarea":Nr(e),au(e);break;case"option":r.value!=null&&e.setAttribute("value",""+Dt(r.value));break;case"select":e.multiple=!!r.multiple,o=r.value,o!=null?mn(e,!!r.multiple,o,!1):r.defaultValue!=null&&mn(e,!!r.multiple,r.defaultValue,!0);break;default:typeof l.onClick=="function"&&(e.onclick=il)}switch(n){case"button":case"input":case"select":case"textarea":r=!!r.autoFocus;break e;case"img":r=!0;break e;default:r=!1}}r&&(t.flags|=4)}t.ref!==null&&(t.flags|=512,t.flags|=2097152)}return fe(t),null;case 6:if(e&&t.stateNode!=null)ic(e,t,e.memoizedProps,r);else{if(typeof r!="string"&&t.stateNode===null)throw Error(w(166));if(n=Ht(dr.current),Ht(et.current),Or(t)){if(r=t.stateNode,n=t.memoizedProps,r[qe]=t,(o=r.nodeValue!==n)&&(e=Te,e!==null))switch(e.tag){case 3:Rr(r.nodeValue,n,(e.mode&1)!==0);break;case 5:e.memoizedProps.suppressHydrationWarning!==!0&&Rr(r.nodeValue,n,(e.mode&1)!==0)}o&&(t.flags|=4)}else r=(n.nodeType===9?n:n.ownerDocument).createTextNode(r),r[qe]=t,t.stateNode=r}return fe(t),null;case 13:if(A(Q),r=t.memoizedState,e===null||e.memoizedState!==null&&e.memoizedState.dehydrated!==null){if(H&&Pe!==null&&t.mode&1&&!(t.flags&128))Ca(),En(),t.flags|=98560,o=!1;else if(o=Or(t),r!==null&&r.dehydrated!==null){if(e===null){if(!o)throw Error(w(318));if(o=t.memoizedState,o=o!==null?o.dehydrated:null,!o)throw Error(w(317));o[qe]=t}else En(),!(t.flags&128)&&(t.memoizedState=null),t.flags|=4;fe(t),o=!1}else He!==null&&(li(He),He=null),o=!0;if(!o)return t.flags&65536?t:null}return t.flags&128?(t.lanes=n,t):(r=r!==null,r!==(e!==null&&e.memoizedState!==null)&&r&&(t.child.flags|=8192,t.mode&1&&(e===null||Q.current&1?re===0&&(re=3):Gi())),t.updateQueue!==null&&(t.flags|=4),fe(t),null);case 4:return Nn(),Zo(e,t),e===null&&sr(t.stateNode.containerInfo),fe(t),null;case 10:return zi(t.type._context),fe(t),null;case 17:return Ee(t.type)&&ul(),fe(t),null;case 19:if(A(Q),o=t.memoizedState,o===null)return fe(t),null;if(r=(t.flags&128)!==0,i=o.rendering,i===null)if(r)$n(o,!1);else{if(re!==0||e!==null&&e.flags&128)for(e=t.child;e!==null;){if(i=hl(e),i!==null){for(t.flags|=128,$n(o,!1),r=i.updateQueue,r!==null&&(t.updateQueue=r,t.flags|=4),t.subtreeFlags=0,r=n,n=t.child;n!==null;)o=n,e=r,o.flags&=14680066,i=o.alternate,i===null?(o.childLanes=0,o.lanes=e,o.child=null,o.subtreeFlags=0,o.memoizedProps=null,o.memoizedState=null,o.updateQueue=null,o.dependencies=null,o.stateNode=null):(o.childLanes=i.childLanes,o.lanes=i.lanes,o.child=i.child,o.subtreeFlags=0,o.deletions=null,o.memoizedProps=i.memoizedProps,o.memoizedState=i.memoizedState,o.updateQueue=i.updateQueue,o.type=i.type,e=i.dependencies,o.dependencies=e===null?null:{lanes:e.lanes,firstContext:e.firstContext}),n=n.sibling;return U(Q,Q.current&1|2),t.child}e=e.sibling}o.tail!==null&&Z()>_n&&(t.flags|=128,r=!0,$n(o,!1),t.lanes=4194304)}else{if(!r)if(e=hl(i),e!==null){if(t.flags|=128,r=!0,n=e.updateQueue,n!==null&&(t.updateQueue=n,t.flags|=4),$n(o,!0),o.tail===null&&o.tailMode==="hidden"&&!i.alternate&&!H)return fe(t),null}else 2*Z()-o.renderingStartTime>_n&&n!==1073741824&&(t.flags|=128,r=!0,$n(o,!1),t.lanes=4194304);o.isBackwards?(i.sibling=t.child,t.child=i):(n=o.last,n!==null?n.sibling=i:t.child=i,o.last=i)}return o.tail!==null?(t=o.tail,o.rendering=t,o.tail=t.sibling,o.renderingStartTime=Z(),t.sibling=null,n=Q.current,U(Q,r?n&1|2:n&1),t):(fe(t),null);case 22:case 23:return Yi(),r=t.memoizedState!==null,e!==null&&e.memoizedState!==null!==r&&(t.flags|=8192),r&&t.mode&1?_e&1073741824&&(fe(t),t.subtreeFlags&6&&(t.flags|=8192)):fe(t),null;case 24:return null;case 25:return null}throw Error(w(156,t.tag))}function Rd(e,t){switch(_i(t),t.tag){case 1:return Ee(t.type)&&ul(),e=t.flags,e&65536?(t.flags=e&-65537|128,t):null;case 3:return Nn(),A(Se),A(pe),Mi(),e=t.flags,e&65536&&!(e&128)?(t.flags=e&-65537|128,t):null;case 5:return Ii(t),null;case 13:if(A(Q),e=t.memoizedState,e!==null&&e.dehydrated!==null){if(t.alternate===null)throw Error(w(340));En()}return e=t.flags,e&65536?(t.flags=e&-65537|128,t):null;case 19:return A(Q),null;case 4:return Nn(),null;case 10:return zi(t.type._context),null;case 22:case 23:return Yi(),null;case 24:return null;default:return null}}var Fr=!1,de=!1,Od=typeof WeakSet=="function"?WeakSet:Set,j=null;function pn(e,t){var n=e.ref;if(n!==null)if(typeof n=="function")try{n(null)}catch(r){X(e,t,r)}else n.current=null}function Jo(e,t,n){try{n()}catch(r){X(e,t,r)}}var qu=!1;function Id(e,t){if(Oo=rl,e=fa(),Ni(e)){if("selectionStart"in e)var n={start:e.selectionStart,end:e.selectionEnd};else e:{n=(n=e.ownerDocument)&&n.defaultView||window;var r=n.getSelection&&n.getSelection();if(r&&r.rangeCount!==0){n=r.anchorNode;var l=r.anchorOffset,o=r.focusNode;r=r.focusOffset;try{n.nodeType,o.nodeType}catch{n=null;break e}var i=0,u=-1,s=-1,f=0,h=0,v=e,m=null;t:for(;;){for(var x;v!==n||l!==0&&v.nodeType!==3||(u=i+l),v!==o||r!==0&&v.nodeType!==3||(s=i+r),v.nodeType===3&&(i+=v.nodeValue.length),(x=v.firstChild)!==null;)m=v,v=x;for(;;){if(v===e)break t;if(m===n&&++f===l&&(u=i),m===o&&++h===r&&(s=i),(x=v.nextSibling)!==null)break;v=m,m=v.parentNode}v=x}n=u===-1||s===-1?null:{start:u,end:s}}else n=null}n=n||{start:0,end:0}}else n=null;for(Io={focusedElem:e,selectionRange:n},rl=!1,j=t;j!==null;)if(t=j,e=t.child,(t.subtreeFlags&1028)!==0&&e!==null)e.return=t,j=e;else for(;j!==null;){t=j;try{var k=t.alternate;if(t.flags&1024)switch(t.tag){case 0:case 11:case 15:break;case 1:if(k!==null){var S=k.memoizedProps,F=k.memoizedState,d=t.stateNode,a=d.getSnapshotBeforeUpdate(t.elementType===t.type?S:We(t.type,S),F);d.__reactInternalSnapshotBeforeUpdate=a}break;case 3:var p=t.stateNode.containerInfo;p.nodeType===1?p.textContent="":p.nodeType===9&&p.documentElement&&p.removeChild(p.documentElement);break;case 5:case 6:case 4:case 17:break;default:throw Error(w(163))}}catch(y){X(t,t.return,y)}if(e=t.sibling,e!==null){e.return=t.return,j=e;break}j=t.return}return k=qu,qu=!1,k}function Jn(e,t,n){var r=t.updateQueue;if(r=r!==null?r.lastEffect:null,r!==null){var l=r=r.next;do{if((l.tag&e)===e){var o=l.destroy;l.destroy=void 0,o!==void 0&&Jo(t,n,o)}l=l.next}while(l!==r)}}function Dl(e,t){if(t=t.updateQueue,t=t!==null?t.lastEffect:null,t!==null){var n=t=t.next;do{if((n.tag&e)===e){var r=n.create;n.destroy=r()}n=n.next}while(n!==t)}}function qo(e){var t=e.ref;if(t!==null){var n=e.stateNode;switch(e.tag){case 5:e=n;break;default:e=n}typeof t=="function"?t(e):t.current=e}}function uc(e){var t=e.alternate;t!==null&&(e.alternate=null,uc(t)),e.child=null,e.deletions=null,e.sibling=null,e.tag===5&&(t=e.stateNode,t!==null&&(delete t[qe],delete t[cr],delete t[Uo],delete t[gd],delete t[yd])),e.stateNode=null,e.return=null,e.dependencies=null,e.memoizedProps=null,e.memoizedState=null,e.pendingProps=null,e.stateNode=null,e.updateQueue=null}function sc(e){return e.tag===5||e.tag===3||e.tag===4}function bu(e){e:for(;;){for(;e.sibling===null;){if(e.return===null||sc(e.return))return null;e=e.return}for(e.sibling.return=e.return,e=e.sibling;e.tag!==5&&e.tag!==6&&e.tag!==18;){if(e.flags&2||e.child===null||e.tag===4)continue e;e.child.return=e,e=e.child}if(!(e.flags&2))return e.stateNode}}function bo(e,t,n){var r=e.tag;if(r===5||r===6)e=e.stateNode,t?n.nodeType===8?n.parentNode.insertBefore(e,t):n.insertBefore(e,t):(n.nodeType===8?(t=n.parentNode,t.insertBefore(e,n)):(t=n,t.appendChild(e)),n=n._reactRootContainer,n!=null||t.onclick!==null||(t.onclick=il));else if(r!==4&&(e=e.child,e!==null))for(bo(e,t,n),e=e.sibling;e!==null;)bo(e,t,n),e=e.sibling}function ei(e,t,n){var r=e.tag;if(r===5||r===6)e=e.stateNode,t?n.insertBefore(e,t):n.appendChild(e);else if(r!==4&&(e=e.child,e!==null))for(ei(e,t,n),e=e.sibling;e!==null;)ei(e,t,n),e=e.sibling}var ue=null,Ve=!1;function ht(e,t,n){for(n=n.child;n!==null;)ac(e,t,n),n=n.sibling}function ac(e,t,n){if(be&&typeof be.onCommitFiberUnmount=="function")try{be.onCommitFiberUnmount(Cl,n)}catch{}switch(n.tag){case 5:de||pn(n,t);case 6:var r=ue,l=Ve;ue=null,ht(e,t,n),ue=r,Ve=l,ue!==null&&(Ve?(e=ue,n=n.stateNode,e.nodeType===8?e.parentNode.removeChild(n):e.removeChild(n)):ue.removeChild(n.stateNode));break;case 18:ue!==null&&(Ve?(e=ue,n=n.stateNode,e.nodeType===8?no(e.parentNode,n):e.nodeType===1&&no(e,n),or(e)):no(ue,n.stateNode));break;case 4:r=ue,l=Ve,ue=n.stateNode.containerInfo,Ve=!0,ht(e,t,n),ue=r,Ve=l;break;case 0:case 11:case 14:case 15:if(!de&&(r=n.updateQueue,r!==null&&(r=r.lastEffect,r!==null))){l=r=r.next;do{var o=l,i=o.destroy;o=o.tag,i!==void 0&&(o&2||o&4)&&Jo(n,t,i),l=l.next}while(l!==r)}ht(e,t,n);break;case 1:if(!de&&(pn(n,t),r=n.stateNode,typeof r.componentWillUnmount=="function"))try{r.props=n.memoizedProps,r.state=n.memoizedState,r.componentWillUnmount()}catch(u){X(n,t,u)}ht(e,t,n);break;case 21:ht(e,t,n);break;case 22:n.mode&1?(de=(r=de)||n.memoizedState!==null,ht(e,t,n),de=r):ht(e,t,n);break;default:ht(e,t,n)}}function es(e){var t=e.updateQueue;if(t!==null){e.updateQueue=null;var n=e.stateNode;n===null&&(n=e.stateNode=new Od),t.forEach(function(r){var l=Hd.bind(null,e,r);n.has(r)||(n.add(r),r.then(l,l))})}}function Be(e,t){var n=t.deletions;if(n!==null)for(var r=0;r<n.length;r++){var l=n[r];try{var o=e,i=t,u=i;e:for(;u!==null;){switch(u.tag){case 5:ue=u.stateNode,Ve=!1;break e;case 3:ue=u.stateNode.containerInfo,Ve=!0;break e;case 4:ue=u.stateNode.containerInfo,Ve=!0;break e}u=u.return}if(ue===null)throw Error(w(160));ac(o,i,l),ue=null,Ve=!1;var s=l.alternate;s!==null&&(s.return=null),l.return=null}catch(f){X(l,t,f)}}if(t.subtreeFlags&12854)for(t=t.child;t!==null;)cc(t,e),t=t.sibling}function cc(e,t){var n=e.alternate,r=e.flags;switch(e.tag){case 0:case 11:case 14:case 15:if(Be(t,e),Ze(e),r&4){try{Jn(3,e,e.return),Dl(3,e)}catch(S){X(e,e.return,S)}try{Jn(5,e,e.return)}catch(S){X(e,e.return,S)}}break;case 1:Be(t,e),Ze(e),r&512&&n!==null&&pn(n,n.return);break;case 5:if(Be(t,e),Ze(e),r&512&&n!==null&&pn(n,n.return),e.flags&32){var l=e.stateNode;try{tr(l,"")}catch(S){X(e,e.return,S)}}if(r&4&&(l=e.stateNode,l!=null)){var o=e.memoizedProps,i=n!==null?n.memoizedProps:o,u=e.type,s=e.updateQueue;if(e.updateQueue=null,s!==null)try{u==="input"&&o.type==="radio"&&o.name!=null&&Ds(l,o),Co(u,i);var f=Co(u,o);for(i=0;i<s.length;i+=2){var h=s[i],v=s[i+1];h==="style"?Fs(l,v):h==="dangerouslySetInnerHTML"?Is(l,v):h==="children"?tr(l,v):di(l,h,v,f)}switch(u){case"input":wo(l,o);break;case"textarea":Rs(l,o);break;case"select":var m=l._wrapperState.wasMultiple;l._wrapperState.wasMultiple=!!o.multiple;var x=o.value;x!=null?mn(l,!!o.multiple,x,!1):m!==!!o.multiple&&(o.defaultValue!=null?mn(l,!!o.multiple,o.defaultValue,!0):mn(l,!!o.multiple,o.multiple?[]:"",!1))}l[cr]=o}catch(S){X(e,e.return,S)}}break;case 6:if(Be(t,e),Ze(e),r&4){if(e.stateNode===null)throw Error(w(162));l=e.stateNode,o=e.memoizedProps;try{l.nodeValue=o}catch(S){X(e,e.return,S)}}break;case 3:if(Be(t,e),Ze(e),r&4&&n!==null&&n.memoizedState.isDehydrated)try{or(t.containerInfo)}catch(S){X(e,e.return,S)}break;case 4:Be(t,e),Ze(e);break;case 13:Be(t,e),Ze(e),l=e.child,l.flags&8192&&(o=l.memoizedState!==null,l.stateNode.isHidden=o,!o||l.alternate!==null&&l.alternate.memoizedState!==null||(Qi=Z())),r&4&&es(e);break;case 22:if(h=n!==null&&n.memoizedState!==null,e.mode&1?(de=(f=de)||h,Be(t,e),de=f):Be(t,e),Ze(e),r&8192){if(f=e.memoizedState!==null,(e.stateNode.isHidden=f)&&!h&&e.mode&1)for(j=e,h=e.child;h!==null;){for(v=j=h;j!==null;){switch(m=j,x=m.child,m.tag){case 0:case 11:case 14:case 15:Jn(4,m,m.return);break;case 1:pn(m,m.return);var k=m.stateNode;if(typeof k.componentWillUnmount=="function"){r=m,n=m.return;try{t=r,k.props=t.memoizedProps,k.state=t.memoizedState,k.componentWillUnmount()}catch(S){X(r,n,S)}}break;case 5:pn(m,m.return);break;case 22:if(m.memoizedState!==null){ns(v);continue}}x!==null?(x.return=m,j=x):ns(v)}h=h.sibling}e:for(h=null,v=e;;){if(v.tag===5){if(h===null){h=v;try{l=v.stateNode,f?(o=l.style,typeof o.setProperty=="function"?o.setProperty("display","none","important"):o.display="none"):(u=v.stateNode,s=v.memoizedProps.style,i=s!=null&&s.hasOwnProperty("display")?s.display:null,u.style.display=Ms("display",i))}catch(S){X(e,e.return,S)}}}else if(v.tag===6){if(h===null)try{v.stateNode.nodeValue=f?"":v.memoizedProps}catch(S){X(e,e.return,S)}}else if((v.tag!==22&&v.tag!==23||v.memoizedState===null||v===e)&&v.child!==null){v.child.return=v,v=v.child;continue}if(v===e)break e;for(;v.sibling===null;){if(v.return===null||v.return===e)break e;h===v&&(h=null),v=v.return}h===v&&(h=null),v.sibling.return=v.return,v=v.sibling}}break;case 19:Be(t,e),Ze(e),r&4&&es(e);break;case 21:break;default:Be(t,e),Ze(e)}}function Ze(e){var t=e.flags;if(t&2){try{e:{for(var n=e.return;n!==null;){if(sc(n)){var r=n;break e}n=n.return}throw Error(w(160))}switch(r.tag){case 5:var l=r.stateNode;r.flags&32&&(tr(l,""),r.flags&=-33);var o=bu(e);ei(e,o,l);break;case 3:case 4:var i=r.stateNode.containerInfo,u=bu(e);bo(e,u,i);break;default:throw Error(w(161))}}catch(s){X(e,e.return,s)}e.flags&=-3}t&4096&&(e.flags&=-4097)}function Md(e,t,n){j=e,fc(e)}function fc(e,t,n){for(var r=(e.mode&1)!==0;j!==null;){var l=j,o=l.child;if(l.tag===22&&r){var i=l.memoizedState!==null||Fr;if(!i){var u=l.alternate,s=u!==null&&u.memoizedState!==null||de;u=Fr;var f=de;if(Fr=i,(de=s)&&!f)for(j=l;j!==null;)i=j,s=i.child,i.tag===22&&i.memoizedState!==null?rs(l):s!==null?(s.return=i,j=s):rs(l);for(;o!==null;)j=o,fc(o),o=o.sibling;j=l,Fr=u,de=f}ts(e)}else l.subtreeFlags&8772&&o!==null?(o.return=l,j=o):ts(e)}}function ts(e){for(;j!==null;){var t=j;if(t.flags&8772){var n=t.alternate;try{if(t.flags&8772)switch(t.tag){case 0:case 11:case 15:de||Dl(5,t);break;case 1:var r=t.stateNode;if(t.flags&4&&!de)if(n===null)r.componentDidMount();else{var l=t.elementType===t.type?n.memoizedProps:We(t.type,n.memoizedProps);r.componentDidUpdate(l,n.memoizedState,r.__reactInternalSnapshotBeforeUpdate)}var o=t.updateQueue;o!==null&&$u(t,o,r);break;case 3:var i=t.updateQueue;if(i!==null){if(n=null,t.child!==null)switch(t.child.tag){case 5:n=t.child.stateNode;break;case 1:n=t.child.stateNode}$u(t,i,n)}break;case 5:var u=t.stateNode;if(n===null&&t.flags&4){n=u;var s=t.memoizedProps;switch(t.type){case"button":case"input":case"select":case"textarea":s.autoFocus&&n.focus();break;case"img":s.src&&(n.src=s.src)}}break;case 6:break;case 4:break;case 12:break;case 13:if(t.memoizedState===null){var f=t.alternate;if(f!==null){var h=f.memoizedState;if(h!==null){var v=h.dehydrated;v!==null&&or(v)}}}break;case 19:case 17:case 21:case 22:case 23:case 25:break;default:throw Error(w(163))}de||t.flags&512&&qo(t)}catch(m){X(t,t.return,m)}}if(t===e){j=null;break}if(n=t.sibling,n!==null){n.return=t.return,j=n;break}j=t.return}}function ns(e){for(;j!==null;){var t=j;if(t===e){j=null;break}var n=t.sibling;if(n!==null){n.return=t.return,j=n;break}j=t.return}}function rs(e){for(;j!==null;){var t=j;try{switch(t.tag){case 0:case 11:case 15:var n=t.return;try{Dl(4,t)}catch(s){X(t,n,s)}break;case 1:var r=t.stateNode;if(typeof r.componentDidMount=="function"){var l=t.return;try{r.componentDidMount()}catch(s){X(t,l,s)}}var o=t.return;try{qo(t)}catch(s){X(t,o,s)}break;case 5:var i=t.return;try{qo(t)}catch(s){X(t,i,s)}}}catch(s){X(t,t.return,s)}if(t===e){j=null;break}var u=t.sibling;if(u!==null){u.return=t.return,j=u;break}j=t.return}}var Fd=Math.ceil,gl=dt.ReactCurrentDispatcher,Vi=dt.ReactCurrentOwner,Me=dt.ReactCurrentBatchConfig,I=0,oe=null,b=null,se=0,_e=0,hn=It(0),re=0,vr=null,Zt=0,Rl=0,Hi=0,qn=null,xe=null,Qi=0,_n=1/0,rt=null,yl=!1,ti=null,Tt=null,Ur=!1,Et=null,wl=0,bn=0,ni=null,Xr=-1,Zr=0;function ve(){return I&6?Z():Xr!==-1?Xr:Xr=Z()}function Lt(e){return e.mode&1?I&2&&se!==0?se&-se:xd.transition!==null?(Zr===0&&(Zr=Xs()),Zr):(e=M,e!==0||(e=window.event,e=e===void 0?16:na(e.type)),e):1}function Ke(e,t,n,r){if(50<bn)throw bn=0,ni=null,Error(w(185));yr(e,n,r),(!(I&2)||e!==oe)&&(e===oe&&(!(I&2)&&(Rl|=n),re===4&&kt(e,se)),Ce(e,r),n===1&&I===0&&!(t.mode&1)&&(_n=Z()+500,Tl&&Mt()))}function Ce(e,t){var n=e.callbackNode;xf(e,t);var r=nl(e,e===oe?se:0);if(r===0)n!==null&&du(n),e.callbackNode=null,e.callbackPriority=0;else if(t=r&-r,e.callbackPriority!==t){if(n!=null&&du(n),t===1)e.tag===0?wd(ls.bind(null,e)):ka(ls.bind(null,e)),md(function(){!(I&6)&&Mt()}),n=null;else{switch(Zs(r)){case 1:n=gi;break;case 4:n=Ys;break;case 16:n=tl;break;case 536870912:n=Gs;break;default:n=tl}n=wc(n,dc.bind(null,e))}e.callbackPriority=t,e.callbackNode=n}}function dc(e,t){if(Xr=-1,Zr=0,I&6)throw Error(w(327));var n=e.callbackNode;if(xn()&&e.callbackNode!==n)return null;var r=nl(e,e===oe?se:0);if(r===0)return null;if(r&30||r&e.expiredLanes||t)t=xl(e,r);else{t=r;var l=I;I|=2;var o=hc();(oe!==e||se!==t)&&(rt=null,_n=Z()+500,Qt(e,t));do try{Ad();break}catch(u){pc(e,u)}while(!0);Li(),gl.current=o,I=l,b!==null?t=0:(oe=null,se=0,t=re)}if(t!==0){if(t===2&&(l=To(e),l!==0&&(r=l,t=ri(e,l))),t===1)throw n=vr,Qt(e,0),kt(e,r),Ce(e,Z()),n;if(t===6)kt(e,r);else{if(l=e.current.alternate,!(r&30)&&!Ud(l)&&(t=xl(e,r),t===2&&(o=To(e),o!==0&&(r=o,t=ri(e,o))),t===1))throw n=vr,Qt(e,0),kt(e,r),Ce(e,Z()),n;switch(e.finishedWork=l,e.finishedLanes=r,t){case 0:case 1:throw Error(w(345));case 2:Bt(e,xe,rt);break;case 3:if(kt(e,r),(r&130023424)===r&&(t=Qi+500-Z(),10<t)){if(nl(e,0)!==0)break;if(l=e.suspendedLanes,(l&r)!==r){ve(),e.pingedLanes|=e.suspendedLanes&l;break}e.timeoutHandle=Fo(Bt.bind(null,e,xe,rt),t);break}Bt(e,xe,rt);break;case 4:if(kt(e,r),(r&4194240)===r)break;for(t=e.eventTimes,l=-1;0<r;){var i=31-Qe(r);o=1<<i,i=t[i],i>l&&(l=i),r&=~o}if(r=l,r=Z()-r,r=(120>r?120:480>r?480:1080>r?1080:1920>r?1920:3e3>r?3e3:4320>r?4320:1960*Fd(r/1960))-r,10<r){e.timeoutHandle=Fo(Bt.bind(null,e,xe,rt),r);break}Bt(e,xe,rt);break;case 5:Bt(e,xe,rt);break;default:throw Error(w(329))}}}return Ce(e,Z()),e.callbackNode===n?dc.bind(null,e):null}function ri(e,t){var n=qn;return e.current.memoizedState.isDehydrated&&(Qt(e,t).flags|=256),e=xl(e,t),e!==2&&(t=xe,xe=n,t!==null&&li(t)),e}function li(e){xe===null?xe=e:xe.push.apply(xe,e)}function Ud(e){for(var t=e;;){if(t.flags&16384){var n=t.updateQueue;if(n!==null&&(n=n.stores,n!==null))for(var r=0;r<n.length;r++){var l=n[r],o=l.getSnapshot;l=l.value;try{if(!Ye(o(),l))return!1}catch{return!1}}}if(n=t.child,t.subtreeFlags&16384&&n!==null)n.return=t,t=n;else{if(t===e)break;for(;t.sibling===null;){if(t.return===null||t.return===e)return!0;t=t.return}t.sibling.return=t.return,t=t.sibling}}return!0}function kt(e,t){for(t&=~Hi,t&=~Rl,e.suspendedLanes|=t,e.pingedLanes&=~t,e=e.expirationTimes;0<t;){var n=31-Qe(t),r=1<<n;e[n]=-1,t&=~r}}function ls(e){if(I&6)throw Error(w(327));xn();var t=nl(e,0);if(!(t&1))return Ce(e,Z()),null;var n=xl(e,t);if(e.tag!==0&&n===2){var r=To(e);r!==0&&(t=r,n=ri(e,r))}if(n===1)throw n=vr,Qt(e,0),kt(e,t),Ce(e,Z()),n;if(n===6)throw Error(w(345));return e.finishedWork=e.current.alternate,e.finishedLanes=t,Bt(e,xe,rt),Ce(e,Z()),null}function Ki(e,t){var n=I;I|=1;try{return e(t)}finally{I=n,I===0&&(_n=Z()+500,Tl&&Mt())}}function Jt(e){Et!==null&&Et.tag===0&&!(I&6)&&xn();var t=I;I|=1;var n=Me.transition,r=M;try{if(Me.transition=null,M=1,e)return e()}finally{M=r,Me.transition=n,I=t,!(I&6)&&Mt()}}function Yi(){_e=hn.current,A(hn)}function Qt(e,t){e.finishedWork=null,e.finishedLanes=0;var n=e.timeoutHandle;if(n!==-1&&(e.timeoutHandle=-1,hd(n)),b!==null)for(n=b.return;n!==null;){var r=n;switch(_i(r),r.tag){case 1:r=r.type.childContextTypes,r!=null&&ul();break;case 3:Nn(),A(Se),A(pe),Mi();break;case 5:Ii(r);break;case 4:Nn();break;case 13:A(Q);break;case 19:A(Q);break;case 10:zi(r.type._context);break;case 22:case 23:Yi()}n=n.return}if(oe=e,b=e=zt(e.current,null),se=_e=t,re=0,vr=null,Hi=Rl=Zt=0,xe=qn=null,Vt!==null){for(t=0;t<Vt.length;t++)if(n=Vt[t],r=n.interleaved,r!==null){n.interleaved=null;var l=r.next,o=n.pending;if(o!==null){var i=o.next;o.next=l,r.next=i}n.pending=r}Vt=null}return e}function pc(e,t){do{var n=b;try{if(Li(),Kr.current=vl,ml){for(var r=K.memoizedState;r!==null;){var l=r.queue;l!==null&&(l.pending=null),r=r.next}ml=!1}if(Xt=0,le=ne=K=null,Zn=!1,pr=0,Vi.current=null,n===null||n.return===null){re=1,vr=t,b=null;break}e:{var o=e,i=n.return,u=n,s=t;if(t=se,u.flags|=32768,s!==null&&typeof s=="object"&&typeof s.then=="function"){var f=s,h=u,v=h.tag;if(!(h.mode&1)&&(v===0||v===11||v===15)){var m=h.alternate;m?(h.updateQueue=m.updateQueue,h.memoizedState=m.memoizedState,h.lanes=m.lanes):(h.updateQueue=null,h.memoizedState=null)}var x=Qu(i);if(x!==null){x.flags&=-257,Ku(x,i,u,o,t),x.mode&1&&Hu(o,f,t),t=x,s=f;var k=t.updateQueue;if(k===null){var S=new Set;S.add(s),t.updateQueue=S}else k.add(s);break e}else{if(!(t&1)){Hu(o,f,t),Gi();break e}s=Error(w(426))}}else if(H&&u.mode&1){var F=Qu(i);if(F!==null){!(F.flags&65536)&&(F.flags|=256),Ku(F,i,u,o,t),Pi(jn(s,u));break e}}o=s=jn(s,u),re!==4&&(re=2),qn===null?qn=[o]:qn.push(o),o=i;do{switch(o.tag){case 3:o.flags|=65536,t&=-t,o.lanes|=t;var d=Za(o,s,t);Uu(o,d);break e;case 1:u=s;var a=o.type,p=o.stateNode;if(!(o.flags&128)&&(typeof a.getDerivedStateFromError=="function"||p!==null&&typeof p.componentDidCatch=="function"&&(Tt===null||!Tt.has(p)))){o.flags|=65536,t&=-t,o.lanes|=t;var y=Ja(o,u,t);Uu(o,y);break e}}o=o.return}while(o!==null)}vc(n)}catch(E){t=E,b===n&&n!==null&&(b=n=n.return);continue}break}while(!0)}function hc(){var e=gl.current;return gl.current=vl,e===null?vl:e}function Gi(){(re===0||re===3||re===2)&&(re=4),oe===null||!(Zt&268435455)&&!(Rl&268435455)||kt(oe,se)}function xl(e,t){var n=I;I|=2;var r=hc();(oe!==e||se!==t)&&(rt=null,Qt(e,t));do try{$d();break}catch(l){pc(e,l)}while(!0);if(Li(),I=n,gl.current=r,b!==null)throw Error(w(261));return oe=null,se=0,re}function $d(){for(;b!==null;)mc(b)}function Ad(){for(;b!==null&&!ff();)mc(b)}function mc(e){var t=yc(e.alternate,e,_e);e.memoizedProps=e.pendingProps,t===null?vc(e):b=t,Vi.current=null}function vc(e){var t=e;do{var n=t.alternate;if(e=t.return,t.flags&32768){if(n=Rd(n,t),n!==null){n.flags&=32767,b=n;return}if(e!==null)e.flags|=32768,e.subtreeFlags=0,e.deletions=null;else{re=6,b=null;return}}else if(n=Dd(n,t,_e),n!==null){b=n;return}if(t=t.sibling,t!==null){b=t;return}b=t=e}while(t!==null);re===0&&(re=5)}function Bt(e,t,n){var r=M,l=Me.transition;try{Me.transition=null,M=1,Bd(e,t,n,r)}finally{Me.transition=l,M=r}return null}function Bd(e,t,n,r){do xn();while(Et!==null);if(I&6)throw Error(w(327));n=e.finishedWork;var l=e.finishedLanes;if(n===null)return null;if(e.finishedWork=null,e.finishedLanes=0,n===e.current)throw Error(w(177));e.callbackNode=null,e.callbackPriority=0;var o=n.lanes|n.childLanes;if(kf(e,o),e===oe&&(b=oe=null,se=0),!(n.subtreeFlags&2064)&&!(n.flags&2064)||Ur||(Ur=!0,wc(tl,function(){return xn(),null})),o=(n.flags&15990)!==0,n.subtreeFlags&15990||o){o=Me.transition,Me.transition=null;var i=M;M=1;var u=I;I|=4,Vi.current=null,Id(e,n),cc(n,e),ud(Io),rl=!!Oo,Io=Oo=null,e.current=n,Md(n),df(),I=u,M=i,Me.transition=o}else e.current=n;if(Ur&&(Ur=!1,Et=e,wl=l),o=e.pendingLanes,o===0&&(Tt=null),mf(n.stateNode),Ce(e,Z()),t!==null)for(r=e.onRecoverableError,n=0;n<t.length;n++)l=t[n],r(l.value,{componentStack:l.stack,digest:l.digest});if(yl)throw yl=!1,e=ti,ti=null,e;return wl&1&&e.tag!==0&&xn(),o=e.pendingLanes,o&1?e===ni?bn++:(bn=0,ni=e):bn=0,Mt(),null}function xn(){if(Et!==null){var e=Zs(wl),t=Me.transition,n=M;try{if(Me.transition=null,M=16>e?16:e,Et===null)var r=!1;else{if(e=Et,Et=null,wl=0,I&6)throw Error(w(331));var l=I;for(I|=4,j=e.current;j!==null;){var o=j,i=o.child;if(j.flags&16){var u=o.deletions;if(u!==null){for(var s=0;s<u.length;s++){var f=u[s];for(j=f;j!==null;){var h=j;switch(h.tag){case 0:case 11:case 15:Jn(8,h,o)}var v=h.child;if(v!==null)v.return=h,j=v;else for(;j!==null;){h=j;var m=h.sibling,x=h.return;if(uc(h),h===f){j=null;break}if(m!==null){m.return=x,j=m;break}j=x}}}var k=o.alternate;if(k!==null){var S=k.child;if(S!==null){k.child=null;do{var F=S.sibling;S.sibling=null,S=F}while(S!==null)}}j=o}}if(o.subtreeFlags&2064&&i!==null)i.return=o,j=i;else e:for(;j!==null;){if(o=j,o.flags&2048)switch(o.tag){case 0:case 11:case 15:Jn(9,o,o.return)}var d=o.sibling;if(d!==null){d.return=o.return,j=d;break e}j=o.return}}var a=e.current;for(j=a;j!==null;){i=j;var p=i.child;if(i.subtreeFlags&2064&&p!==null)p.return=i,j=p;else e:for(i=a;j!==null;){if(u=j,u.flags&2048)try{switch(u.tag){case 0:case 11:case 15:Dl(9,u)}}catch(E){X(u,u.return,E)}if(u===i){j=null;break e}var y=u.sibling;if(y!==null){y.return=u.return,j=y;break e}j=u.return}}if(I=l,Mt(),be&&typeof be.onPostCommitFiberRoot=="function")try{be.onPostCommitFiberRoot(Cl,e)}catch{}r=!0}return r}finally{M=n,Me.transition=t}}return!1}function os(e,t,n){t=jn(n,t),t=Za(e,t,1),e=Pt(e,t,1),t=ve(),e!==null&&(yr(e,1,t),Ce(e,t))}function X(e,t,n){if(e.tag===3)os(e,e,n);else for(;t!==null;){if(t.tag===3){os(t,e,n);break}else if(t.tag===1){var r=t.stateNode;if(typeof t.type.getDerivedStateFromError=="function"||typeof r.componentDidCatch=="function"&&(Tt===null||!Tt.has(r))){e=jn(n,e),e=Ja(t,e,1),t=Pt(t,e,1),e=ve(),t!==null&&(yr(t,1,e),Ce(t,e));break}}t=t.return}}function Wd(e,t,n){var r=e.pingCache;r!==null&&r.delete(t),t=ve(),e.pingedLanes|=e.suspendedLanes&n,oe===e&&(se&n)===n&&(re===4||re===3&&(se&130023424)===se&&500>Z()-Qi?Qt(e,0):Hi|=n),Ce(e,t)}function gc(e,t){t===0&&(e.mode&1?(t=Pr,Pr<<=1,!(Pr&130023424)&&(Pr=4194304)):t=1);var n=ve();e=ct(e,t),e!==null&&(yr(e,t,n),Ce(e,n))}function Vd(e){var t=e.memoizedState,n=0;t!==null&&(n=t.retryLane),gc(e,n)}function Hd(e,t){var n=0;switch(e.tag){case 13:var r=e.stateNode,l=e.memoizedState;l!==null&&(n=l.retryLane);break;case 19:r=e.stateNode;break;default:throw Error(w(314))}r!==null&&r.delete(t),gc(e,n)}var yc;yc=function(e,t,n){if(e!==null)if(e.memoizedProps!==t.pendingProps||Se.current)ke=!0;else{if(!(e.lanes&n)&&!(t.flags&128))return ke=!1,zd(e,t,n);ke=!!(e.flags&131072)}else ke=!1,H&&t.flags&1048576&&Sa(t,cl,t.index);switch(t.lanes=0,t.tag){case 2:var r=t.type;Gr(e,t),e=t.pendingProps;var l=Sn(t,pe.current);wn(t,n),l=Ui(null,t,r,e,l,n);var o=$i();return t.flags|=1,typeof l=="object"&&l!==null&&typeof l.render=="function"&&l.$$typeof===void 0?(t.tag=1,t.memoizedState=null,t.updateQueue=null,Ee(r)?(o=!0,sl(t)):o=!1,t.memoizedState=l.state!==null&&l.state!==void 0?l.state:null,Ri(t),l.updater=zl,t.stateNode=l,l._reactInternals=t,Ho(t,r,e,n),t=Yo(null,t,r,!0,o,n)):(t.tag=0,H&&o&&ji(t),me(null,t,l,n),t=t.child),t;case 16:r=t.elementType;e:{switch(Gr(e,t),e=t.pendingProps,l=r._init,r=l(r._payload),t.type=r,l=t.tag=Kd(r),e=We(r,e),l){case 0:t=Ko(null,t,r,e,n);break e;case 1:t=Xu(null,t,r,e,n);break e;case 11:t=Yu(null,t,r,e,n);break e;case 14:t=Gu(null,t,r,We(r.type,e),n);break e}throw Error(w(306,r,""))}return t;case 0:return r=t.type,l=t.pendingProps,l=t.elementType===r?l:We(r,l),Ko(e,t,r,l,n);case 1:return r=t.type,l=t.pendingProps,l=t.elementType===r?l:We(r,l),Xu(e,t,r,l,n);case 3:e:{if(tc(t),e===null)throw Error(w(387));r=t.pendingProps,o=t.memoizedState,l=o.element,Pa(e,t),pl(t,r,null,n);var i=t.memoizedState;if(r=i.element,o.isDehydrated)if(o={element:r,isDehydrated:!1,cache:i.cache,pendingSuspenseBoundaries:i.pendingSuspenseBoundaries,transitions:i.transitions},t.updateQueue.baseState=o,t.memoizedState=o,t.flags&256){l=jn(Error(w(423)),t),t=Zu(e,t,r,n,l);break e}else if(r!==l){l=jn(Error(w(424)),t),t=Zu(e,t,r,n,l);break e}else for(Pe=_t(t.stateNode.containerInfo.firstChild),Te=t,H=!0,He=null,n=ja(t,null,r,n),t.child=n;n;)n.flags=n.flags&-3|4096,n=n.sibling;else{if(En(),r===l){t=ft(e,t,n);break e}me(e,t,r,n)}t=t.child}return t;case 5:return Ta(t),e===null&&Bo(t),r=t.type,l=t.pendingProps,o=e!==null?e.memoizedProps:null,i=l.children,Mo(r,l)?i=null:o!==null&&Mo(r,o)&&(t.flags|=32),ec(e,t),me(e,t,i,n),t.child;case 6:return e===null&&Bo(t),null;case 13:return nc(e,t,n);case 4:return Oi(t,t.stateNode.containerInfo),r=t.pendingProps,e===null?t.child=Cn(t,null,r,n):me(e,t,r,n),t.child;case 11:return r=t.type,l=t.pendingProps,l=t.elementType===r?l:We(r,l),Yu(e,t,r,l,n);case 7:return me(e,t,t.pendingProps,n),t.child;case 8:return me(e,t,t.pendingProps.children,n),t.child;case 12:return me(e,t,t.pendingProps.children,n),t.child;case 10:e:{if(r=t.type._context,l=t.pendingProps,o=t.memoizedProps,i=l.value,U(fl,r._currentValue),r._currentValue=i,o!==null)if(Ye(o.value,i)){if(o.children===l.children&&!Se.current){t=ft(e,t,n);break e}}else for(o=t.child,o!==null&&(o.return=t);o!==null;){var u=o.dependencies;if(u!==null){i=o.child;for(var s=u.firstContext;s!==null;){if(s.context===r){if(o.tag===1){s=ut(-1,n&-n),s.tag=2;var f=o.updateQueue;if(f!==null){f=f.shared;var h=f.pending;h===null?s.next=s:(s.next=h.next,h.next=s),f.pending=s}}o.lanes|=n,s=o.alternate,s!==null&&(s.lanes|=n),Wo(o.return,n,t),u.lanes|=n;break}s=s.next}}else if(o.tag===10)i=o.type===t.type?null:o.child;else if(o.tag===18){if(i=o.return,i===null)throw Error(w(341));i.lanes|=n,u=i.alternate,u!==null&&(u.lanes|=n),Wo(i,n,t),i=o.sibling}else i=o.child;if(i!==null)i.return=o;else for(i=o;i!==null;){if(i===t){i=null;break}if(o=i.sibling,o!==null){o.return=i.return,i=o;break}i=i.return}o=i}me(e,t,l.children,n),t=t.child}return t;case 9:return l=t.type,r=t.pendingProps.children,wn(t,n),l=Fe(l),r=r(l),t.flags|=1,me(e,t,r,n),t.child;case 14:return r=t.type,l=We(r,t.pendingProps),l=We(r.type,l),Gu(e,t,r,l,n);case 15:return qa(e,t,t.type,t.pendingProps,n);case 17:return r=t.type,l=t.pendingProps,l=t.elementType===r?l:We(r,l),Gr(e,t),t.tag=1,Ee(r)?(e=!0,sl(t)):e=!1,wn(t,n),Xa(t,r,l),Ho(t,r,l,n),Yo(null,t,r,!0,e,n);case 19:return rc(e,t,n);case 22:return ba(e,t,n)}throw Error(w(156,t.tag))};function wc(e,t){return Ks(e,t)}function Qd(e,t,n,r){this.tag=e,this.key=n,this.sibling=this.child=this.return=this.stateNode=this.type=this.elementType=null,this.index=0,this.ref=null,this.pendingProps=t,this.dependencies=this.memoizedState=this.updateQueue=this.memoizedProps=null,this.mode=r,this.subtreeFlags=this.flags=0,this.deletions=null,this.childLanes=this.lanes=0,this.alternate=null}function Ie(e,t,n,r){return new Qd(e,t,n,r)}function Xi(e){return e=e.prototype,!(!e||!e.isReactComponent)}function Kd(e){if(typeof e=="function")return Xi(e)?1:0;if(e!=null){if(e=e.$$typeof,e===hi)return 11;if(e===mi)return 14}return 2}function zt(e,t){var n=e.alternate;return n===null?(n=Ie(e.tag,t,e.key,e.mode),n.elementType=e.elementType,n.type=e.type,n.stateNode=e.stateNode,n.alternate=e,e.alternate=n):(n.pendingProps=t,n.type=e.type,n.flags=0,n.subtreeFlags=0,n.deletions=null),n.flags=e.flags&14680064,n.childLanes=e.childLanes,n.lanes=e.lanes,n.child=e.child,n.memoizedProps=e.memoizedProps,n.memoizedState=e.memoizedState,n.updateQueue=e.updateQueue,t=e.dependencies,n.dependencies=t===null?null:{lanes:t.lanes,firstContext:t.firstContext},n.sibling=e.sibling,n.index=e.index,n.ref=e.ref,n}function Jr(e,t,n,r,l,o){var i=2;if(r=e,typeof e=="function")Xi(e)&&(i=1);else if(typeof e=="string")i=5;else e:switch(e){case rn:return Kt(n.children,l,o,t);case pi:i=8,l|=8;break;case ho:return e=Ie(12,n,t,l|2),e.elementType=ho,e.lanes=o,e;case mo:return e=Ie(13,n,t,l),e.elementType=mo,e.lanes=o,e;case vo:return e=Ie(19,n,t,l),e.elementType=vo,e.lanes=o,e;case Ts:return Ol(n,l,o,t);default:if(typeof e=="object"&&e!==null)switch(e.$$typeof){case _s:i=10;break e;case Ps:i=9;break e;case hi:i=11;break e;case mi:i=14;break e;case vt:i=16,r=null;break e}throw Error(w(130,e==null?e:typeof e,""))}return t=Ie(i,n,t,l),t.elementType=e,t.type=r,t.lanes=o,t}function Kt(e,t,n,r){return e=Ie(7,e,r,t),e.lanes=n,e}function Ol(e,t,n,r){return e=Ie(22,e,r,t),e.elementType=Ts,e.lanes=n,e.stateNode={isHidden:!1},e}function co(e,t,n){return e=Ie(6,e,null,t),e.lanes=n,e}function fo(e,t,n){return t=Ie(4,e.children!==null?e.children:[],e.key,t),t.lanes=n,t.stateNode={containerInfo:e.containerInfo,pendingChildren:null,implementation:e.implementation},t}function Yd(e,t,n,r,l){this.tag=t,this.containerInfo=e,this.finishedWork=this.pingCache=this.current=this.pendingChildren=null,this.timeoutHandle=-1,this.callbackNode=this.pendingContext=this.context=null,this.callbackPriority=0,this.eventTimes=Ql(0),this.expirationTimes=Ql(-1),this.entangledLanes=this.finishedLanes=this.mutableReadLanes=this.expiredLanes=this.pingedLanes=this.suspendedLanes=this.pendingLanes=0,this.entanglements=Ql(0),this.identifierPrefix=r,this.onRecoverableError=l,this.mutableSourceEagerHydrationData=null}function Zi(e,t,n,r,l,o,i,u,s){return e=new Yd(e,t,n,u,s),t===1?(t=1,o===!0&&(t|=8)):t=0,o=Ie(3,null,null,t),e.current=o,o.stateNode=e,o.memoizedState={element:r,isDehydrated:n,cache:null,transitions:null,pendingSuspenseBoundaries:null},Ri(o),e}function Gd(e,t,n){var r=3<arguments.length&&arguments[3]!==void 0?arguments[3]:null;return{$$typeof:nn,key:r==null?null:""+r,children:e,containerInfo:t,implementation:n}}function xc(e){if(!e)return Rt;e=e._reactInternals;e:{if(bt(e)!==e||e.tag!==1)throw Error(w(170));var t=e;do{switch(t.tag){case 3:t=t.stateNode.context;break e;case 1:if(Ee(t.type)){t=t.stateNode.__reactInternalMemoizedMergedChildContext;break e}}t=t.return}while(t!==null);throw Error(w(171))}if(e.tag===1){var n=e.type;if(Ee(n))return xa(e,n,t)}return t}function kc(e,t,n,r,l,o,i,u,s){return e=Zi(n,r,!0,e,l,o,i,u,s),e.context=xc(null),n=e.current,r=ve(),l=Lt(n),o=ut(r,l),o.callback=t??null,Pt(n,o,l),e.current.lanes=l,yr(e,l,r),Ce(e,r),e}function Il(e,t,n,r){var l=t.current,o=ve(),i=Lt(l);return n=xc(n),t.context===null?t.context=n:t.pendingContext=n,t=ut(o,i),t.payload={element:e},r=r===void 0?null:r,r!==null&&(t.callback=r),e=Pt(l,t,i),e!==null&&(Ke(e,l,i,o),Qr(e,l,i)),i}function kl(e){if(e=e.current,!e.child)return null;switch(e.child.tag){case 5:return e.child.stateNode;default:return e.child.stateNode}}function is(e,t){if(e=e.memoizedState,e!==null&&e.dehydrated!==null){var n=e.retryLane;e.retryLane=n!==0&&n<t?n:t}}function Ji(e,t){is(e,t),(e=e.alternate)&&is(e,t)}function Xd(){return null}var Sc=typeof reportError=="function"?reportError:function(e){console.error(e)};function qi(e){this._internalRoot=e}Ml.prototype.render=qi.prototype.render=function(e){var t=this._internalRoot;if(t===null)throw Error(w(409));Il(e,t,null,null)};Ml.prototype.unmount=qi.prototype.unmount=function(){var e=this._internalRoot;if(e!==null){this._internalRoot=null;var t=e.containerInfo;Jt(function(){Il(null,e,null,null)}),t[at]=null}};function Ml(e){this._internalRoot=e}Ml.prototype.unstable_scheduleHydration=function(e){if(e){var t=bs();e={blockedOn:null,target:e,priority:t};for(var n=0;n<xt.length&&t!==0&&t<xt[n].priority;n++);xt.splice(n,0,e),n===0&&ta(e)}};function bi(e){return!(!e||e.nodeType!==1&&e.nodeType!==9&&e.nodeType!==11)}function Fl(e){return!(!e||e.nodeType!==1&&e.nodeType!==9&&e.nodeType!==11&&(e.nodeType!==8||e.nodeValue!==" react-mount-point-unstable "))}function us(){}function Zd(e,t,n,r,l){if(l){if(typeof r=="function"){var o=r;r=function(){var f=kl(i);o.call(f)}}var i=kc(t,r,e,0,null,!1,!1,"",us);return e._reactRootContainer=i,e[at]=i.current,sr(e.nodeType===8?e.parentNode:e),Jt(),i}for(;l=e.lastChild;)e.removeChild(l);if(typeof r=="function"){var u=r;r=function(){var f=kl(s);u.call(f)}}var s=Zi(e,0,!1,null,null,!1,!1,"",us);return e._reactRootContainer=s,e[at]=s.current,sr(e.nodeType===8?e.parentNode:e),Jt(function(){Il(t,s,n,r)}),s}function Ul(e,t,n,r,l){var o=n._reactRootContainer;if(o){var i=o;if(typeof l=="function"){var u=l;l=function(){var s=kl(i);u.call(s)}}Il(t,i,e,l)}else i=Zd(n,t,e,l,r);return kl(i)}Js=function(e){switch(e.tag){case 3:var t=e.stateNode;if(t.current.memoizedState.isDehydrated){var n=Vn(t.pendingLanes);n!==0&&(yi(t,n|1),Ce(t,Z()),!(I&6)&&(_n=Z()+500,Mt()))}break;case 13:Jt(function(){var r=ct(e,1);if(r!==null){var l=ve();Ke(r,e,1,l)}}),Ji(e,1)}};wi=function(e){if(e.tag===13){var t=ct(e,134217728);if(t!==null){var n=ve();Ke(t,e,134217728,n)}Ji(e,134217728)}};qs=function(e){if(e.tag===13){var t=Lt(e),n=ct(e,t);if(n!==null){var r=ve();Ke(n,e,t,r)}Ji(e,t)}};bs=function(){return M};ea=function(e,t){var n=M;try{return M=e,t()}finally{M=n}};jo=function(e,t,n){switch(t){case"input":if(wo(e,n),t=n.name,n.type==="radio"&&t!=null){for(n=e;n.parentNode;)n=n.parentNode;for(n=n.querySelectorAll("input[name="+JSON.stringify(""+t)+'][type="radio"]'),t=0;t<n.length;t++){var r=n[t];if(r!==e&&r.form===e.form){var l=Pl(r);if(!l)throw Error(w(90));zs(r),wo(r,l)}}}break;case"textarea":Rs(e,n);break;case"select":t=n.value,t!=null&&mn(e,!!n.multiple,t,!1)}};As=Ki;Bs=Jt;var Jd={usingClientEntryPoint:!1,Events:[xr,sn,Pl,Us,$s,Ki]},An={findFiberByHostInstance:Wt,bundleType:0,version:"18.3.1",rendererPackageName:"react-dom"},qd={bundleType:An.bundleType,version:An.version,rendererPackageName:An.rendererPackageName,rendererConfig:An.rendererConfig,overrideHookState:null,overrideHookStateDeletePath:null,overrideHookStateRenamePath:null,overrideProps:null,overridePropsDeletePath:null,overridePropsRenamePath:null,setErrorHandler:null,setSuspenseHandler:null,scheduleUpdate:null,currentDispatcherRef:dt.ReactCurrentDispatcher,findHostInstanceByFiber:function(e){return e=Hs(e),e===null?null:e.stateNode},findFiberByHostInstance:An.findFiberByHostInstance||Xd,findHostInstancesForRefresh:null,scheduleRefresh:null,scheduleRoot:null,setRefreshHandler:null,getCurrentFiber:null,reconcilerVersion:"18.3.1-next-f1338f8080-20240426"};if(typeof __REACT_DEVTOOLS_GLOBAL_HOOK__<"u"){var $r=__REACT_DEVTOOLS_GLOBAL_HOOK__;if(!$r.isDisabled&&$r.supportsFiber)try{Cl=$r.inject(qd),be=$r}catch{}}ze.__SECRET_INTERNALS_DO_NOT_USE_OR_YOU_WILL_BE_FIRED=Jd;ze.createPortal=function(e,t){var n=2<arguments.length&&arguments[2]!==void 0?arguments[2]:null;if(!bi(t))throw Error(w(200));return Gd(e,t,null,n)};ze.createRoot=function(e,t){if(!bi(e))throw Error(w(299));var n=!1,r="",l=Sc;return t!=null&&(t.unstable_strictMode===!0&&(n=!0),t.identifierPrefix!==void 0&&(r=t.identifierPrefix),t.onRecoverableError!==void 0&&(l=t.onRecoverableError)),t=Zi(e,1,!1,null,null,n,!1,r,l),e[at]=t.current,sr(e.nodeType===8?e.parentNode:e),new qi(t)};ze.findDOMNode=function(e){if(e==null)return null;if(e.nodeType===1)return e;var t=e._reactInternals;if(t===void 0)throw typeof e.render=="function"?Error(w(188)):(e=Object.keys(e).join(","),Error(w(268,e)));return e=Hs(t),e=e===null?null:e.stateNode,e};ze.flushSync=function(e){return Jt(e)};ze.hydrate=function(e,t,n){if(!Fl(t))throw Error(w(200));return Ul(null,e,t,!0,n)};ze.hydrateRoot=function(e,t,n){if(!bi(e))throw Error(w(405));var r=n!=null&&n.hydratedSources||null,l=!1,o="",i=Sc;if(n!=null&&(n.unstable_strictMode===!0&&(l=!0),n.identifierPrefix!==void 0&&(o=n.identifierPrefix),n.onRecoverableError!==void 0&&(i=n.onRecoverableError)),t=kc(t,null,e,1,n??null,l,!1,o,i),e[at]=t.current,sr(e),r)for(e=0;e<r.length;e++)n=r[e],l=n._getVersion,l=l(n._source),t.mutableSourceEagerHydrationData==null?t.mutableSourceEagerHydrationData=[n,l]:t.mutableSourceEagerHydrationData.push(n,l);return new Ml(t)};ze.render=function(e,t,n){if(!Fl(t))throw Error(w(200));return Ul(null,e,t,!1,n)};ze.unmountComponentAtNode=function(e){if(!Fl(e))throw Error(w(40));return e._reactRootContainer?(Jt(function(){Ul(null,null,e,!1,function(){e._reactRootContainer=null,e[at]=null})}),!0):!1};ze.unstable_batchedUpdates=Ki;ze.unstable_renderSubtreeIntoContainer=function(e,t,n,r){if(!Fl(n))throw Error(w(200));if(e==null||e._reactInternals===void 0)throw Error(w(38));return Ul(e,t,n,!1,r)};ze.version="18.3.1-next-f1338f8080-20240426";function Ec(){if(!(typeof __REACT_DEVTOOLS_GLOBAL_HOOK__>"u"||typeof __REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE!="function"))try{__REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE(Ec)}catch(e){console.error(e)}}Ec(),Es.exports=ze;var bd=Es.exports,Cc,ss=bd;Cc=ss.createRoot,ss.hydrateRoot;function yt(e,t,n){return c.jsxs("svg",{width:t,height:t,viewBox:"0 0 24 24","aria-label":n,role:"img",children:[c.jsx("title",{children:n}),e]})}const wt=({children:e})=>c.jsx("g",{fill:"none",stroke:"currentColor",strokeWidth:1.6,strokeLinecap:"round",strokeLinejoin:"round",children:e});function we(e,t,n){return c.jsx("img",{src:e,width:n,height:n,alt:t,title:t,style:{display:"inline-block"}})}function as(e,t=16){const n=(e||"").toLowerCase();return n.includes("gpt")||n.includes("o4")||n.startsWith("openai")?we("/assets/Icons/openai.svg","GPT",t):n.includes("claude")?we("/assets/Icons/claude.svg","Claude",t):n.includes("gemini")?we("/assets/Icons/gemini.svg","Gemini",t):n.includes("llama")?yt(c.jsxs(wt,{children:[c.jsx("path",{d:"M6 17c3 1 9 1 12 0"}),c.jsx("path",{d:"M8 17V9l2-2 2 2v8"}),c.jsx("path",{d:"M10 7l1-2 1 2"})]}),t,"Llama"):n.includes("mistral")||n.includes("mixtral")?yt(c.jsxs(wt,{children:[c.jsx("path",{d:"M3 9h10c2 0 2-3 0-3"}),c.jsx("path",{d:"M3 15h14c3 0 3-4 0-4"})]}),t,"Mistral"):n.includes("qwen")?yt(c.jsxs(wt,{children:[c.jsx("path",{d:"M6 12a6 6 0 1 1 6 6"}),c.jsx("path",{d:"M12 18l3-3"})]}),t,"Qwen"):n.includes("deepseek")?yt(c.jsxs(wt,{children:[c.jsx("path",{d:"M4 12l8-8 8 8-8 8z"}),c.jsx("path",{d:"M8 12l4-4 4 4-4 4z"})]}),t,"DeepSeek"):n.includes("phi")?yt(c.jsxs(wt,{children:[c.jsx("circle",{cx:"12",cy:"12",r:"7"}),c.jsx("path",{d:"M12 5v14M8 10h8"})]}),t,"Phi"):yt(c.jsx(wt,{children:c.jsx("circle",{cx:"12",cy:"12",r:"8"})}),t,"Model")}function ep(e,t=16){const n=(e||"").toLowerCase();return n.includes("openrouter")?we("/assets/Icons/openrouter.svg","OpenRouter",t):n.includes("openai")?we("/assets/Icons/openai.svg","OpenAI",t):n.includes("anthropic")?we("/assets/Icons/anthropic.svg","Anthropic",t):n.includes("gemini")||n.includes("google")?we("/assets/Icons/gemini.svg","Google",t):n.includes("azure")?we("/assets/Icons/azure.svg","Azure",t):n.includes("ollama")?yt(c.jsxs(wt,{children:[c.jsx("path",{d:"M7 14a3 3 0 0 1 6 0v3H7z"}),c.jsx("path",{d:"M13 14a3 3 0 1 1 3 3"})]}),t,"Ollama"):n.includes("together")?we("/assets/Icons/together.svg","Together",t):n.includes("fireworks")?we("/assets/Icons/fireworks.svg","Fireworks",t):n.includes("perplexity")?we("/assets/Icons/perplexity.svg","Perplexity",t):n.includes("mistral")?we("/assets/Icons/mistral.svg","Mistral",t):n.includes("deepseek")?we("/assets/Icons/deepseek.svg","DeepSeek",t):n.includes("cohere")?we("/assets/Icons/cohere.svg","Cohere",t):yt(c.jsx(wt,{children:c.jsx("rect",{x:"5",y:"5",width:"14",height:"14",rx:"3"})}),t,"Provider")}function tp(e){const t=e.split(/\r?\n/),n=[];let r=0;for(;r<t.length;){const o=t[r].match(/^```\s*([\w+-]*)\s*$/);if(o){const u=o[1]||"";r++;const s=[];for(;r<t.length&&!/^```\s*$/.test(t[r]);)s.push(t[r]),r++;r<t.length&&/^```\s*$/.test(t[r])&&r++,n.push({type:"code",lang:u,code:s.join(`
-`)});continue}const i=[];for(;r<t.length&&!/^```/.test(t[r]);)i.push(t[r]),r++;i.length&&n.push({type:"text",text:i.join(`
-`)})}return n}function np(e){const t=[];let n=0;const r=()=>`${n}-${Math.random().toString(36).slice(2,7)}`;for(;n<e.length;){const l=e[n];if(/^\s*---+\s*$/.test(l)){t.push(c.jsx("hr",{className:"border-white/10"},r())),n++;continue}const o=l.match(/^(#{1,3})\s+(.*)$/);if(o){const u=o[1].length,s=o[2];u===1?t.push(c.jsx("h2",{className:"mt-4",children:s},r())):u===2?t.push(c.jsx("h3",{className:"mt-3",children:s},r())):t.push(c.jsx("h4",{className:"mt-2",children:s},r())),n++;continue}if(/^\s*[-*]\s+/.test(l)){const u=[];for(;n<e.length&&/^\s*[-*]\s+/.test(e[n]);)u.push(e[n].replace(/^\s*[-*]\s+/,"")),n++;t.push(c.jsx("ul",{className:"list-disc pl-6 space-y-1",children:u.map((s,f)=>c.jsx("li",{children:s},f))},r()));continue}if(/^\s*\d+\.\s+/.test(l)){const u=[];for(;n<e.length&&/^\s*\d+\.\s+/.test(e[n]);)u.push(e[n].replace(/^\s*\d+\.\s+/,"")),n++;t.push(c.jsx("ol",{className:"list-decimal pl-6 space-y-1",children:u.map((s,f)=>c.jsx("li",{children:s},f))},r()));continue}if(l.includes("|")){const u=[],s=n;for(;n<e.length&&e[n].includes("|");)u.push(e[n]),n++;if(u.length>=2&&/\|/.test(u[0])&&/-/.test(u[1])){const f=m=>m.split("|").map(x=>x.trim()).filter((x,k,S)=>!(k===0&&m.trim().startsWith("|"))&&!(k===S.length-1&&m.trim().endsWith("|"))),h=f(u[0]),v=u.slice(2).map(f);t.push(c.jsx("div",{className:"overflow-x-auto",children:c.jsxs("table",{className:"w-full text-sm border-collapse",children:[c.jsx("thead",{children:c.jsx("tr",{children:h.map((m,x)=>c.jsx("th",{className:"text-left font-semibold px-3 py-2 border-b border-white/10",children:m},x))})}),c.jsx("tbody",{children:v.map((m,x)=>c.jsx("tr",{className:"odd:bg-white/5",children:m.map((k,S)=>c.jsx("td",{className:"px-3 py-2 align-top border-b border-white/5",children:k},S))},x))})]})},r()));continue}else n=s}const i=[];for(;n<e.length&&e[n].trim()!=="";)i.push(e[n]),n++;for(t.push(c.jsx("p",{className:"whitespace-pre-wrap leading-relaxed",children:i.join(`
-`)},r()));n<e.length&&e[n].trim()==="";)n++}return t}function rp({content:e,wrapDefault:t}){const n=D.useMemo(()=>e.replace(/\r/g,"").replace(/^\uFEFF/,""),[e]),r=D.useMemo(()=>tp(n),[n]);return c.jsx("div",{className:"prose prose-invert max-w-none",children:r.map((l,o)=>l.type==="text"?c.jsx("div",{children:np(l.text.split(`
-`))},o):c.jsx(lp,{lang:l.lang,code:l.code,defaultWrap:!!t},o))})}function lp({lang:e,code:t,defaultWrap:n}){const[r,l]=D.useState(!!n),o=async()=>{try{await navigator.clipboard.writeText(t)}catch{}};return c.jsxs("div",{className:"rounded-lg border border-white/10 overflow-hidden",children:[c.jsxs("div",{className:"flex items-center justify-between px-3 py-1.5 text-xs bg-slate-800/60 border-b border-white/10",children:[c.jsx("div",{className:"uppercase tracking-wide text-slate-300",children:e||"text"}),c.jsxs("div",{className:"flex items-center gap-2",children:[c.jsx("button",{className:"px-2 py-0.5 rounded bg-white/10 hover:bg-white/15",onClick:()=>l(i=>!i),children:r?"No wrap":"Wrap"}),c.jsx("button",{className:"px-2 py-0.5 rounded bg-white/10 hover:bg-white/15",onClick:o,children:"Copy"})]})]}),c.jsx("pre",{className:`text-sm p-3 ${r?"whitespace-pre-wrap break-words":"whitespace-pre overflow-x-auto"}`,children:c.jsx("code",{children:t})})]})}const cs={theme:"blackwhite",density:"comfortable",fontScale:1,defaultReasoning:!1,codeWrapDefault:!1};function Sl(){try{const e=localStorage.getItem("appSettings");if(e)return{...cs,...JSON.parse(e)}}catch{}return cs}function oi(e){const t=document.body;Array.from(t.classList).filter(l=>l.startsWith("theme-")).forEach(l=>t.classList.remove(l));const n=`theme-${e.theme}`;t.classList.add(n);const r=["dark","blackwhite","midnight","highcontrast","ruby","ocean","magma","seagreen","openai","gemini","anthropic","perplexity"];t.classList.toggle("theme-light",e.theme==="light"),t.classList.toggle("theme-dark",r.includes(e.theme)),t.classList.toggle("density-compact",e.density==="compact"),t.style.setProperty("--font-scale",String(e.fontScale))}function op({open:e,onClose:t,onSave:n}){const[r,l]=D.useState(Sl()),[o,i]=D.useState({}),[u,s]=D.useState(!1);async function f(h,v){const m=await fetch(h,v);if(!m.ok)throw new Error(String(m.status));return m.json()}return D.useEffect(()=>{e&&(l(Sl()),(async()=>{s(!0);try{const h=await f("/api/settings");i(h||{})}catch{i({})}finally{s(!1)}})())},[e]),e?c.jsxs("div",{className:"fixed inset-0 z-50 flex items-center justify-center",children:[c.jsx("div",{className:"absolute inset-0 bg-black/60",onClick:t}),c.jsxs("div",{className:"relative w-full max-w-lg glass rounded-lg p-4",children:[c.jsxs("div",{className:"flex items-center justify-between mb-3",children:[c.jsx("h2",{className:"text-lg font-semibold",children:"Settings"}),c.jsx("button",{className:"px-2 py-1 rounded border border-white/10 hover:bg-white/10",onClick:t,children:"Close"})]}),c.jsxs("div",{className:"space-y-4 text-sm",children:[c.jsxs("div",{children:[c.jsx("label",{className:"block mb-1 text-slate-300",children:"Theme"}),c.jsxs("select",{className:"w-full bg-slate-800/60 border border-white/10 rounded px-2 py-1",value:r.theme,onChange:h=>l(v=>({...v,theme:h.target.value})),children:[c.jsxs("optgroup",{label:"Base",children:[c.jsx("option",{value:"blackwhite",children:"Black & White"}),c.jsx("option",{value:"dark",children:"Dark"}),c.jsx("option",{value:"light",children:"Light"}),c.jsx("option",{value:"midnight",children:"Midnight"}),c.jsx("option",{value:"highcontrast",children:"High Contrast"}),c.jsx("option",{value:"ruby",children:"Ruby"}),c.jsx("option",{value:"ocean",children:"Ocean"}),c.jsx("option",{value:"magma",children:"Magma"}),c.jsx("option",{value:"seagreen",children:"Sea Green"})]}),c.jsxs("optgroup",{label:"AI Model Themed",children:[c.jsx("option",{value:"openai",children:"OpenAI"}),c.jsx("option",{value:"gemini",children:"Gemini"}),c.jsx("option",{value:"anthropic",children:"Anthropic"}),c.jsx("option",{value:"perplexity",children:"Perplexity"})]})]})]}),c.jsxs("div",{children:[c.jsx("label",{className:"block mb-1 text-slate-300",children:"Density"}),c.jsxs("select",{className:"w-full bg-slate-800/60 border border-white/10 rounded px-2 py-1",value:r.density,onChange:h=>l(v=>({...v,density:h.target.value})),children:[c.jsx("option",{value:"comfortable",children:"Comfortable"}),c.jsx("option",{value:"compact",children:"Compact"})]})]}),c.jsxs("div",{children:[c.jsx("label",{className:"block mb-1 text-slate-300",children:"Font scale"}),c.jsx("input",{type:"range",min:.9,max:1.2,step:.05,value:r.fontScale,onChange:h=>l(v=>({...v,fontScale:Number(h.target.value)})),className:"w-full"})]}),c.jsxs("div",{className:"flex items-center gap-2",children:[c.jsx("input",{id:"def-reason",type:"checkbox",checked:r.defaultReasoning,onChange:h=>l(v=>({...v,defaultReasoning:h.target.checked}))}),c.jsx("label",{htmlFor:"def-reason",children:"Enable reasoning by default"})]}),c.jsxs("div",{className:"flex items-center gap-2",children:[c.jsx("input",{id:"code-wrap",type:"checkbox",checked:r.codeWrapDefault,onChange:h=>l(v=>({...v,codeWrapDefault:h.target.checked}))}),c.jsx("label",{htmlFor:"code-wrap",children:"Wrap code blocks by default"})]}),c.jsx("hr",{className:"border-white/10"}),c.jsxs("div",{children:[c.jsx("div",{className:"mb-2 text-slate-300",children:"Backend defaults"}),c.jsx("label",{className:"block mb-1",children:"Default provider"}),c.jsx("select",{className:"w-full bg-slate-800/60 border border-white/10 rounded px-2 py-1",value:o.provider||"",onChange:h=>i(v=>({...v,provider:h.target.value})),children:["","openai","openrouter","anthropic","gemini","azure","ollama","together","fireworks","perplexity","mistral","deepseek","cohere"].map(h=>c.jsx("option",{value:h,children:h||"—"},h))})]}),c.jsxs("div",{children:[c.jsx("label",{className:"block mb-1",children:"Default model"}),c.jsx("input",{className:"w-full bg-slate-800/60 border border-white/10 rounded px-2 py-1",placeholder:"e.g. gpt-4o-mini",value:o.model||"",onChange:h=>i(v=>({...v,model:h.target.value}))})]}),c.jsx("div",{className:"grid grid-cols-1 md:grid-cols-2 gap-3",children:["OPENAI_API_KEY","OPENROUTER_API_KEY","ANTHROPIC_API_KEY","GEMINI_API_KEY","GOOGLE_API_KEY","AZURE_OPENAI_API_KEY","AZURE_OPENAI_ENDPOINT","TOGETHER_API_KEY","FIREWORKS_API_KEY","PERPLEXITY_API_KEY","MISTRAL_API_KEY","DEEPSEEK_API_KEY","COHERE_API_KEY"].map(h=>c.jsxs("div",{children:[c.jsx("label",{className:"block mb-1 text-slate-300",children:h}),c.jsx("input",{className:"w-full bg-slate-800/60 border border-white/10 rounded px-2 py-1",type:"password",placeholder:o[h]===!0?"Set (leave blank to keep)":"Enter value or leave blank",value:typeof o[h]=="string"?o[h]:"",onChange:v=>i(m=>({...m,[h]:v.target.value}))})]},h))})]}),c.jsxs("div",{className:"mt-4 flex justify-end gap-2",children:[c.jsx("button",{className:"px-3 py-1.5 rounded border border-white/10 hover:bg-white/10",onClick:t,children:"Cancel"}),c.jsx("button",{disabled:u,className:"btn-primary",onClick:async()=>{localStorage.setItem("appSettings",JSON.stringify(r)),oi(r),n(r);const h={};Object.entries(o).forEach(([v,m])=>{(typeof m=="string"||["provider","model"].includes(v))&&(h[v]=m)});try{await f("/api/settings",{method:"POST",headers:{"Content-Type":"application/json"},body:JSON.stringify(h)})}catch{}t()},children:"Save"})]})]})]}):null}function fs(e,t){const n=(e||"").toLowerCase(),r=(t||"").toLowerCase(),l={openai:{accent:"#00A67E",accentDark:"#008F6C"},openrouter:{accent:"#7c3aed",accentDark:"#6d28d9"},anthropic:{accent:"#C15F3C",accentDark:"#9E4B30"},gemini:{accent:"#4B79F7",accentDark:"#3A64D6"},azure:{accent:"#2563eb",accentDark:"#1d4ed8"},ollama:{accent:"#10b981",accentDark:"#059669"},together:{accent:"#ec4899",accentDark:"#db2777"},fireworks:{accent:"#f97316",accentDark:"#ea580c"},perplexity:{accent:"#00B3FF",accentDark:"#008FCC"},mistral:{accent:"#eab308",accentDark:"#ca8a04"},deepseek:{accent:"#06b6d4",accentDark:"#0891b2"},cohere:{accent:"#f59e0b",accentDark:"#d97706"}},o=[{test:s=>s.includes("gpt-4o")||s.includes("gpt-5"),accent:"#00A67E",accentDark:"#008F6C"},{test:s=>s.includes("sonnet")||s.includes("opus")||s.includes("claude"),accent:"#C15F3C",accentDark:"#9E4B30"},{test:s=>s.includes("mixtral")||s.includes("mistral"),accent:"#eab308",accentDark:"#ca8a04"},{test:s=>s.includes("llama")||s.includes("llama-3"),accent:"#4B79F7",accentDark:"#3A64D6"}];let i=l[n]||{accent:"#3b82f6",accentDark:"#2563eb"};for(const s of o)if(r&&s.test(r)){i={accent:s.accent,accentDark:s.accentDark};break}const u=document.body;u.style.setProperty("--accent",i.accent),u.style.setProperty("--accent-dark",i.accentDark),u.setAttribute("data-model-theme",`${n}:${r}`)}function ip(e){const t=new Date,n=new Date(t.getFullYear(),t.getMonth(),t.getDate()).getTime(),r=n-24*60*60*1e3,l=new Date(e.getFullYear(),e.getMonth(),e.getDate()).getTime();return l===n?"Today":l===r?"Yesterday":e.toLocaleDateString()}async function mt(e,t){const n=await fetch(e,t);if(!n.ok)throw new Error(`${n.status}`);return n.json()}function up(){const[e,t]=D.useState([]),[n,r]=D.useState(""),[l,o]=D.useState(null),[i,u]=D.useState([{role:"system",content:"You are a helpful assistant."}]),[s,f]=D.useState(""),[h,v]=D.useState("openai"),[m,x]=D.useState(""),[k,S]=D.useState([]),[F,d]=D.useState(!1),[a,p]=D.useState(!1),[y,E]=D.useState(""),[_,N]=D.useState(""),P=D.useRef(null),[B,z]=D.useState(!1),[Ne,tt]=D.useState(!1),[$e,zn]=D.useState(Sl());D.useEffect(()=>{oi($e)},[$e]),D.useEffect(()=>{["openai","gemini","anthropic","perplexity"].includes($e.theme)||fs(h,m)},[h,m,$e.theme]);const Dn=D.useMemo(()=>e.filter(g=>(g.title||"").toLowerCase().includes(n.toLowerCase())),[e,n]),Ft=D.useMemo(()=>{const g=Dn.filter(V=>V.pinned),O=Dn.filter(V=>!V.pinned),G={Today:[],Yesterday:[],Earlier:[]},ee=new Date,he=new Date(ee.getFullYear(),ee.getMonth(),ee.getDate()).getTime(),ie=he-24*60*60*1e3;for(const V of O){const pt=V.updated_at?new Date(V.updated_at).getTime():0;pt>=he?G.Today.push(V):pt>=ie?G.Yesterday.push(V):G.Earlier.push(V)}return{pinned:g,byDay:G}},[Dn]);async function en(g){try{await mt(`/api/conversations/${encodeURIComponent(g)}`,{method:"DELETE"})}catch{}await C(),l===g&&(o(null),u([{role:"system",content:"You are a helpful assistant."}]))}D.useEffect(()=>{(async()=>(await C(),await J()))()},[]),D.useEffect(()=>{const g=P.current;if(!g)return;const O=()=>{z(g.scrollTop+g.clientHeight<g.scrollHeight-200)};return g.addEventListener("scroll",O),O(),()=>g.removeEventListener("scroll",O)},[]),D.useEffect(()=>{const g=Sl();zn(g),oi(g),p(!!g.defaultReasoning)},[]),D.useEffect(()=>{fs(h,m)},[h,m]),D.useEffect(()=>{const g=P.current;!g||B||(g.scrollTop=g.scrollHeight)},[i,y]);async function C(){var O;const g=await mt("/api/conversations");t(g.conversations||[]),!l&&((O=g.conversations)!=null&&O[0])&&await T(g.conversations[0].id)}async function T(g){o(g);const O=await mt(`/api/conversations/${encodeURIComponent(g)}`);u(O.messages||[{role:"system",content:"You are a helpful assistant."}])}async function L(){const g=await mt("/api/conversations",{method:"POST",headers:{"Content-Type":"application/json"},body:JSON.stringify({})});o(g.id),await C(),await T(g.id)}async function W(g){await mt(`/api/conversations/${encodeURIComponent(g.id)}`,{method:"PATCH",headers:{"Content-Type":"application/json"},body:JSON.stringify({pinned:!g.pinned})}),await C()}async function J(){const g=await mt("/api/settings");g.provider&&v(g.provider),await Ge(g.provider||h),g.model&&x(g.model)}async function Ut(g){l&&(await mt(`/api/conversations/${encodeURIComponent(l)}`,{method:"PATCH",headers:{"Content-Type":"application/json"},body:JSON.stringify({messages:g})}),u(g),await C())}async function Ge(g){try{const O=await mt(`/api/models/${encodeURIComponent(g)}`);S(O.models||[])}catch{S([])}}async function $t(){const g=s.trim();if(!g)return;l||await L(),f("");const O={role:"user",content:g},G=[...i,O];u(G);const ee=window.location.protocol==="https:"?"wss":"ws",he=new WebSocket(`${ee}://${window.location.host}/ws/chat`);d(!0);let ie="",V="unknown";E(""),N(""),he.onopen=()=>{const pt=l;he.send(JSON.stringify({messages:G,provider:h,model:m,conversation_id:pt,reasoning:a}))},he.onmessage=pt=>{const Sr=pt.data;if(Sr==="[END]"){d(!1),u(Xe=>[...Xe,{role:"assistant",content:V==="answer"?y:ie,reasoning:_||void 0}]),E(""),N(""),C();return}if(ie+=Sr,V==="unknown"){const Xe=ie.indexOf("Reasoning:");if(Xe>=0){V="reason";const je=ie.slice(Xe+10),te=je.indexOf("Answer:");if(te>=0){const q=je.slice(0,te),Ae=je.slice(te+7);N(q),E(Ae),V="answer"}else{const q=je.indexOf(`
-
-`);if(q>=0){const Ae=je.slice(0,q),$l=je.slice(q+2);N(Ae),E($l),V="answer"}else N(je)}return}}if(V==="reason"){const Xe=ie.indexOf("Answer:"),je=ie.indexOf("Reasoning:");if(Xe>=0){const q=ie.slice(je+10).slice(0,Xe-(je+10)),Ae=ie.slice(Xe+7);N(q),E(Ae),V="answer"}else{const te=ie.slice(je+10),q=te.indexOf(`
-
-`);if(q>=0){const Ae=te.slice(0,q),$l=te.slice(q+2);N(Ae),E($l),V="answer"}else N(te)}return}E(ie)},he.onerror=()=>d(!1),he.onclose=()=>d(!1)}function nt({m:g,idx:O}){const[G,ee]=D.useState(!1),[he,ie]=D.useState(g.content),V=g.role==="user",pt=async()=>{try{await navigator.clipboard.writeText(g.content)}catch{}},Sr=async()=>{const te=i.filter((q,Ae)=>Ae!==O);await Ut(te)},Xe=async()=>{const te=i.map((q,Ae)=>Ae===O?{...q,content:he}:q);await Ut(te),ee(!1)},je=async()=>{let te=null;for(let q=O-1;q>=0;q--)if(i[q].role==="user"){te=i[q].content;break}te&&(f(te),await $t())};return c.jsxs("div",{className:`flex gap-3 ${g.role==="user"?"justify-end":""}`,children:[g.role==="assistant"&&c.jsx("div",{className:"w-8 h-8 rounded-full bg-brand flex items-center justify-center",children:as(m,16)}),c.jsxs("div",{className:`group rounded-2xl px-3 py-2 border relative ${g.role==="user"?"bg-slate-800/60 border-white/10":"bg-slate-900/60 border-white/10"} shadow-[inset_0_1px_0_rgba(255,255,255,0.05)]`,style:{maxWidth:"80%"},children:[c.jsxs("div",{className:"absolute -top-2 right-1 opacity-0 group-hover:opacity-100 transition text-xs flex gap-2",children:[c.jsx("button",{className:"px-2 py-0.5 bg-white/10 rounded",onClick:pt,children:"Copy"}),g.role==="assistant"&&c.jsx("button",{className:"px-2 py-0.5 bg-white/10 rounded",onClick:je,children:"Regenerate"}),V&&!G&&c.jsx("button",{className:"px-2 py-0.5 bg-white/10 rounded",onClick:()=>ee(!0),children:"Edit"}),c.jsx("button",{className:"px-2 py-0.5 bg-white/10 rounded",onClick:Sr,children:"Delete"}),G&&c.jsxs(c.Fragment,{children:[c.jsx("button",{className:"px-2 py-0.5 bg-brand rounded",onClick:Xe,children:"Save"}),c.jsx("button",{className:"px-2 py-0.5 bg-white/10 rounded",onClick:()=>{ee(!1),ie(g.content)},children:"Cancel"})]})]}),G?c.jsx("textarea",{className:"w-full bg-slate-800/60 border border-white/10 rounded p-2 text-sm",rows:Math.min(10,Math.max(3,g.content.split(`
-`).length)),value:he,onChange:te=>ie(te.target.value)}):c.jsx("div",{className:"text-slate-100 text-sm",children:g.role==="assistant"?c.jsxs(c.Fragment,{children:[g.reasoning&&c.jsx("div",{className:"mb-2 rounded-lg border border-amber-300/20 bg-amber-900/10 p-2 text-amber-200 text-xs",children:g.reasoning}),c.jsx(rp,{content:g.content,wrapDefault:$e.codeWrapDefault})]}):c.jsx("div",{className:"whitespace-pre-wrap",children:g.content})})]}),g.role==="user"&&c.jsx("div",{className:"w-8 h-8 rounded-full bg-accent flex items-center justify-center",children:"U"})]})}return c.jsxs("div",{className:"h-screen grid grid-cols-[300px_1fr] gap-0",children:[c.jsxs("aside",{className:"glass border-r",children:[c.jsxs("div",{className:"p-3 flex items-center gap-2",children:[c.jsx("button",{className:"btn-primary",onClick:L,children:"New"}),c.jsx("input",{className:"ml-auto bg-slate-800/60 border border-white/10 rounded px-2 py-1 w-full",placeholder:"Search",value:n,onChange:g=>r(g.target.value)})]}),c.jsxs("div",{className:"overflow-y-auto min-h-0 p-2 space-y-2",children:[Ft.pinned.length>0&&c.jsxs("div",{children:[c.jsx("div",{className:"px-2 text-xs uppercase text-slate-400 mb-1",children:"Pinned"}),c.jsx("div",{className:"space-y-1",children:Ft.pinned.map(g=>c.jsx("div",{className:`w-full px-2 py-1 rounded hover:bg-white/5 ${l===g.id?"bg-white/10":""}`,children:c.jsxs("div",{className:"flex items-center justify-between gap-2",children:[c.jsx("button",{className:"flex-1 text-left truncate",onClick:()=>T(g.id),children:g.title||"Untitled"}),c.jsxs("div",{className:"flex items-center gap-1 text-xs text-slate-400",children:[c.jsx("button",{className:"px-1 hover:text-white",onClick:O=>{O.stopPropagation(),W(g)},children:"Unpin"}),c.jsx("button",{className:"px-1 text-red-300 hover:text-red-200",onClick:O=>{O.stopPropagation(),en(g.id)},children:"Delete"})]})]})},g.id))})]}),Object.entries(Ft.byDay).map(([g,O])=>O.length?c.jsxs("div",{children:[c.jsx("div",{className:"px-2 text-xs uppercase text-slate-400 mb-1",children:g}),c.jsx("div",{className:"space-y-1",children:O.map(G=>c.jsx("div",{className:`w-full px-2 py-1 rounded hover:bg-white/5 ${l===G.id?"bg-white/10":""}`,children:c.jsxs("div",{className:"flex items-center justify-between gap-2",children:[c.jsx("button",{className:"flex-1 text-left truncate",onClick:()=>T(G.id),children:G.title||"Untitled"}),c.jsxs("div",{className:"flex items-center gap-1 text-xs text-slate-400",children:[c.jsx("button",{className:"px-1 hover:text-white",onClick:ee=>{ee.stopPropagation(),W(G)},children:"Pin"}),c.jsx("button",{className:"px-1 text-red-300 hover:text-red-200",onClick:ee=>{ee.stopPropagation(),en(G.id)},children:"Delete"})]})]})},G.id))})]},g):null)]})]}),c.jsxs("main",{className:"flex flex-col min-h-0",children:[c.jsxs("header",{className:"glass flex items-center justify-between px-4 py-2 border-b",children:[c.jsxs("div",{className:"flex items-center gap-2",children:[c.jsx("img",{src:"/assets/Logo/fern-Ico.png",alt:"Fern",className:"h-6 w-6 object-contain",onError:g=>{g.currentTarget.onerror=null,g.currentTarget.src="/assets/Logo/fern.svg"}}),c.jsx("h1",{className:"font-semibold",children:"Fern"})]}),c.jsxs("div",{className:"flex items-center gap-2",children:[c.jsxs("div",{className:"flex items-center gap-1 text-sm text-slate-300",children:[ep(h,16),c.jsx("span",{className:"hidden md:inline",children:h})]}),c.jsx("select",{className:"bg-slate-800/60 border border-white/10 rounded px-2 py-1",value:h,onChange:async g=>{const O=g.target.value;v(O),await Ge(O)},children:["openai","openrouter","anthropic","gemini","azure","ollama","together","fireworks","perplexity","mistral","deepseek","cohere"].map(g=>c.jsx("option",{value:g,children:g},g))}),c.jsxs("select",{className:"bg-slate-800/60 border border-white/10 rounded px-2 py-1",value:m,onChange:g=>x(g.target.value),children:[c.jsx("option",{value:"",children:"Select a model"}),k.map(g=>c.jsx("option",{value:g.id,children:g.name||g.id},g.id))]}),c.jsxs("label",{className:"text-sm flex items-center gap-1",children:[c.jsx("input",{type:"checkbox",checked:a,onChange:g=>p(g.target.checked)})," Reasoning"]}),c.jsx("button",{className:"px-2 py-1 rounded border border-white/10 hover:bg-white/10",onClick:()=>tt(!0),children:"Settings"})]})]}),c.jsxs("div",{ref:P,className:"flex-1 overflow-y-auto p-4",children:[c.jsxs("div",{className:"max-w-3xl mx-auto mb-6 flex items-center justify-center",children:[c.jsx("img",{src:"/assets/Logo/fern.svg",alt:"Fern",className:"h-20 md:h-28 lg:h-32 opacity-95 drop-shadow",onError:g=>{var G;const O=g.currentTarget;O.style.display="none",(G=O.nextSibling)==null||G.classList.remove("hidden")}}),c.jsx("div",{className:"hidden text-3xl md:text-4xl font-extrabold tracking-wide",children:"Fern"})]}),i.filter(g=>g.role!=="system").length===0&&c.jsxs("div",{className:"max-w-2xl mx-auto p-4 rounded-lg border border-white/10 bg-slate-900/60",children:[c.jsx("div",{className:"mb-2 text-slate-300",children:"Try one of these"}),c.jsx("div",{className:"flex flex-wrap gap-2",children:["Summarize an article","Write Python","Explain a concept","Create a plan"].map((g,O)=>c.jsx("button",{className:"px-3 py-1 rounded border border-white/10 hover:bg-white/5",onClick:()=>f(g),children:g},O))})]}),c.jsxs("div",{className:"max-w-3xl mx-auto space-y-3",children:[(()=>{const g=[];let O=null;return i.filter(ee=>ee.role!=="system").forEach((ee,he)=>{if(ee.created_at){const ie=new Date(ee.created_at),V=ip(ie);V!==O&&(O=V,g.push(c.jsx("div",{className:"sticky top-2 z-10",children:c.jsx("div",{className:"mx-auto w-fit px-3 py-1 text-xs text-slate-300 border border-white/10 rounded-full bg-slate-900/70 backdrop-blur",children:V})},`sep-${he}`)))}g.push(c.jsx(nt,{m:ee,idx:he},he))}),g})(),(y||_)&&c.jsxs("div",{className:"flex gap-3",children:[c.jsx("div",{className:"w-8 h-8 rounded-full bg-accent flex items-center justify-center",children:as(m,16)}),c.jsxs("div",{className:"rounded-2xl px-3 py-2 border bg-slate-900/60 border-white/10 space-y-2",style:{maxWidth:"80%"},children:[_&&c.jsx("div",{className:"rounded-lg border border-amber-300/20 bg-amber-900/10 p-2 text-amber-200 text-xs whitespace-pre-wrap",children:_}),y&&c.jsx("div",{className:"whitespace-pre-wrap text-slate-100 text-sm",children:y})]})]}),F&&!y&&c.jsxs("div",{className:"flex items-center gap-2 text-slate-300 text-sm",children:[c.jsx("span",{className:"w-2 h-2 bg-slate-500 rounded-full animate-pulse"}),"Generating…"]})]})]}),B&&c.jsx("button",{className:"fixed right-6 bottom-24 px-3 py-1.5 rounded-full bg-accent text-white shadow hover:bg-accent-dark",onClick:()=>{const g=P.current;g&&(g.scrollTop=g.scrollHeight)},children:"Jump to latest"}),c.jsxs("form",{className:"glass border-t p-3 flex items-center gap-2",onSubmit:g=>{g.preventDefault(),$t()},children:[c.jsx("div",{className:"flex-1",children:c.jsx("textarea",{className:"w-full bg-slate-800/60 border border-white/10 rounded-full px-4 py-2 h-11 resize-none",placeholder:"Ask something...",value:s,onChange:g=>f(g.target.value),onKeyDown:g=>{g.key==="Enter"&&!g.shiftKey&&(g.preventDefault(),$t())}})}),c.jsx("button",{className:"btn-primary rounded-full h-11 px-5",disabled:!s.trim()||F,type:"submit",children:"Send"})]})]}),c.jsx(op,{open:Ne,onClose:()=>tt(!1),onSave:g=>{zn(g),tt(!1)}})]})}(()=>{try{const e=localStorage.getItem("appSettings");let t="dark",n="comfortable",r=1;if(e){const o=JSON.parse(e);o&&(o.theme==="dark"||o.theme==="light")&&(t=o.theme),o&&(o.density==="comfortable"||o.density==="compact")&&(n=o.density),o&&typeof o.fontScale=="number"&&(r=o.fontScale)}else window.matchMedia&&window.matchMedia("(prefers-color-scheme: light)").matches&&(t="light");const l=document.body;l.classList.toggle("theme-light",t==="light"),l.classList.toggle("theme-dark",t==="dark"),l.classList.toggle("density-compact",n==="compact"),l.style.setProperty("--font-scale",String(r))}catch{}})();const sp=document.getElementById("root");Cc(sp).render(c.jsx(Bc.StrictMode,{children:c.jsx(up,{})}));
@@ -1,43 +0,0 @@
-(function(){const t=document.createElement("link").relList;if(t&&t.supports&&t.supports("modulepreload"))return;for(const l of document.querySelectorAll('link[rel="modulepreload"]'))r(l);new MutationObserver(l=>{for(const o of l)if(o.type==="childList")for(const i of o.addedNodes)i.tagName==="LINK"&&i.rel==="modulepreload"&&r(i)}).observe(document,{childList:!0,subtree:!0});function n(l){const o={};return l.integrity&&(o.integrity=l.integrity),l.referrerPolicy&&(o.referrerPolicy=l.referrerPolicy),l.crossOrigin==="use-credentials"?o.credentials="include":l.crossOrigin==="anonymous"?o.credentials="omit":o.credentials="same-origin",o}function r(l){if(l.ep)return;l.ep=!0;const o=n(l);fetch(l.href,o)}})();function vc(e){return e&&e.__esModule&&Object.prototype.hasOwnProperty.call(e,"default")?e.default:e}var qu={exports:{}},cl={},bu={exports:{}},M={};/**
- * @license React
- * react.production.min.js
- *
- * Copyright (c) Facebook, Inc. and its affiliates.
- *
- * This source code is licensed under the MIT license found in the
- * LICENSE file in the root directory of this source tree.
- */var ir=Symbol.for("react.element"),yc=Symbol.for("react.portal"),gc=Symbol.for("react.fragment"),wc=Symbol.for("react.strict_mode"),xc=Symbol.for("react.profiler"),Sc=Symbol.for("react.provider"),kc=Symbol.for("react.context"),Cc=Symbol.for("react.forward_ref"),Ec=Symbol.for("react.suspense"),Nc=Symbol.for("react.memo"),_c=Symbol.for("react.lazy"),Hi=Symbol.iterator;function Pc(e){return e===null||typeof e!="object"?null:(e=Hi&&e[Hi]||e["@@iterator"],typeof e=="function"?e:null)}var es={isMounted:function(){return!1},enqueueForceUpdate:function(){},enqueueReplaceState:function(){},enqueueSetState:function(){}},ts=Object.assign,ns={};function gn(e,t,n){this.props=e,this.context=t,this.refs=ns,this.updater=n||es}gn.prototype.isReactComponent={};gn.prototype.setState=function(e,t){if(typeof e!="object"&&typeof e!="function"&&e!=null)throw Error("setState(...): takes an object of state variables to update or a function which returns an object of state variables.");this.updater.enqueueSetState(this,e,t,"setState")};gn.prototype.forceUpdate=function(e){this.updater.enqueueForceUpdate(this,e,"forceUpdate")};function rs(){}rs.prototype=gn.prototype;function Xo(e,t,n){this.props=e,this.context=t,this.refs=ns,this.updater=n||es}var Zo=Xo.prototype=new rs;Zo.constructor=Xo;ts(Zo,gn.prototype);Zo.isPureReactComponent=!0;var Wi=Array.isArray,ls=Object.prototype.hasOwnProperty,Jo={current:null},os={key:!0,ref:!0,__self:!0,__source:!0};function is(e,t,n){var r,l={},o=null,i=null;if(t!=null)for(r in t.ref!==void 0&&(i=t.ref),t.key!==void 0&&(o=""+t.key),t)ls.call(t,r)&&!os.hasOwnProperty(r)&&(l[r]=t[r]);var u=arguments.length-2;if(u===1)l.children=n;else if(1<u){for(var s=Array(u),c=0;c<u;c++)s[c]=arguments[c+2];l.children=s}if(e&&e.defaultProps)for(r in u=e.defaultProps,u)l[r]===void 0&&(l[r]=u[r]);return{$$typeof:ir,type:e,key:o,ref:i,props:l,_owner:Jo.current}}function jc(e,t){return{$$typeof:ir,type:e.type,key:t,ref:e.ref,props:e.props,_owner:e._owner}}function qo(e){return typeof e=="object"&&e!==null&&e.$$typeof===ir}function zc(e){var t={"=":"=0",":":"=2"};return"$"+e.replace(/[=:]/g,function(n){return t[n]})}var Qi=/\/+/g;function zl(e,t){return typeof e=="object"&&e!==null&&e.key!=null?zc(""+e.key):t.toString(36)}function jr(e,t,n,r,l){var o=typeof e;(o==="undefined"||o==="boolean")&&(e=null);var i=!1;if(e===null)i=!0;else switch(o){case"string":case"number":i=!0;break;case"object":switch(e.$$typeof){case ir:case yc:i=!0}}if(i)return i=e,l=l(i),e=r===""?"."+zl(i,0):r,Wi(l)?(n="",e!=null&&(n=e.replace(Qi,"$&/")+"/"),jr(l,t,n,"",function(c){return c})):l!=null&&(qo(l)&&(l=jc(l,n+(!l.key||i&&i.key===l.key?"":(""+l.key).replace(Qi,"$&/")+"/")+e)),t.push(l)),1;if(i=0,r=r===""?".":r+":",Wi(e))for(var u=0;u<e.length;u++){o=e[u];var s=r+zl(o,u);i+=jr(o,t,n,s,l)}else if(s=Pc(e),typeof s=="function")for(e=s.call(e),u=0;!(o=e.next()).done;)o=o.value,s=r+zl(o,u++),i+=jr(o,t,n,s,l);else if(o==="object")throw t=String(e),Error("Objects are not valid as a React child (found: "+(t==="[object Object]"?"object with keys {"+Object.keys(e).join(", ")+"}":t)+"). If you meant to render a collection of children, use an array instead.");return i}function fr(e,t,n){if(e==null)return e;var r=[],l=0;return jr(e,r,"","",function(o){return t.call(n,o,l++)}),r}function Tc(e){if(e._status===-1){var t=e._result;t=t(),t.then(function(n){(e._status===0||e._status===-1)&&(e._status=1,e._result=n)},function(n){(e._status===0||e._status===-1)&&(e._status=2,e._result=n)}),e._status===-1&&(e._status=0,e._result=t)}if(e._status===1)return e._result.default;throw e._result}var de={current:null},zr={transition:null},Lc={ReactCurrentDispatcher:de,ReactCurrentBatchConfig:zr,ReactCurrentOwner:Jo};function us(){throw Error("act(...) is not supported in production builds of React.")}M.Children={map:fr,forEach:function(e,t,n){fr(e,function(){t.apply(this,arguments)},n)},count:function(e){var t=0;return fr(e,function(){t++}),t},toArray:function(e){return fr(e,function(t){return t})||[]},only:function(e){if(!qo(e))throw Error("React.Children.only expected to receive a single React element child.");return e}};M.Component=gn;M.Fragment=gc;M.Profiler=xc;M.PureComponent=Xo;M.StrictMode=wc;M.Suspense=Ec;M.__SECRET_INTERNALS_DO_NOT_USE_OR_YOU_WILL_BE_FIRED=Lc;M.act=us;M.cloneElement=function(e,t,n){if(e==null)throw Error("React.cloneElement(...): The argument must be a React element, but you passed "+e+".");var r=ts({},e.props),l=e.key,o=e.ref,i=e._owner;if(t!=null){if(t.ref!==void 0&&(o=t.ref,i=Jo.current),t.key!==void 0&&(l=""+t.key),e.type&&e.type.defaultProps)var u=e.type.defaultProps;for(s in t)ls.call(t,s)&&!os.hasOwnProperty(s)&&(r[s]=t[s]===void 0&&u!==void 0?u[s]:t[s])}var s=arguments.length-2;if(s===1)r.children=n;else if(1<s){u=Array(s);for(var c=0;c<s;c++)u[c]=arguments[c+2];r.children=u}return{$$typeof:ir,type:e.type,key:l,ref:o,props:r,_owner:i}};M.createContext=function(e){return e={$$typeof:kc,_currentValue:e,_currentValue2:e,_threadCount:0,Provider:null,Consumer:null,_defaultValue:null,_globalName:null},e.Provider={$$typeof:Sc,_context:e},e.Consumer=e};M.createElement=is;M.createFactory=function(e){var t=is.bind(null,e);return t.type=e,t};M.createRef=function(){return{current:null}};M.forwardRef=function(e){return{$$typeof:Cc,render:e}};M.isValidElement=qo;M.lazy=function(e){return{$$typeof:_c,_payload:{_status:-1,_result:e},_init:Tc}};M.memo=function(e,t){return{$$typeof:Nc,type:e,compare:t===void 0?null:t}};M.startTransition=function(e){var t=zr.transition;zr.transition={};try{e()}finally{zr.transition=t}};M.unstable_act=us;M.useCallback=function(e,t){return de.current.useCallback(e,t)};M.useContext=function(e){return de.current.useContext(e)};M.useDebugValue=function(){};M.useDeferredValue=function(e){return de.current.useDeferredValue(e)};M.useEffect=function(e,t){return de.current.useEffect(e,t)};M.useId=function(){return de.current.useId()};M.useImperativeHandle=function(e,t,n){return de.current.useImperativeHandle(e,t,n)};M.useInsertionEffect=function(e,t){return de.current.useInsertionEffect(e,t)};M.useLayoutEffect=function(e,t){return de.current.useLayoutEffect(e,t)};M.useMemo=function(e,t){return de.current.useMemo(e,t)};M.useReducer=function(e,t,n){return de.current.useReducer(e,t,n)};M.useRef=function(e){return de.current.useRef(e)};M.useState=function(e){return de.current.useState(e)};M.useSyncExternalStore=function(e,t,n){return de.current.useSyncExternalStore(e,t,n)};M.useTransition=function(){return de.current.useTransition()};M.version="18.3.1";bu.exports=M;var B=bu.exports;const Mc=vc(B);/**
- * @license React
- * react-jsx-runtime.production.min.js
- *
- * Copyright (c) Facebook, Inc. and its affiliates.
- *
- * This source code is licensed under the MIT license found in the
- * LICENSE file in the root directory of this source tree.
- */var Rc=B,Oc=Symbol.for("react.element"),Dc=Symbol.for("react.fragment"),Ic=Object.prototype.hasOwnProperty,Fc=Rc.__SECRET_INTERNALS_DO_NOT_USE_OR_YOU_WILL_BE_FIRED.ReactCurrentOwner,Uc={key:!0,ref:!0,__self:!0,__source:!0};function ss(e,t,n){var r,l={},o=null,i=null;n!==void 0&&(o=""+n),t.key!==void 0&&(o=""+t.key),t.ref!==void 0&&(i=t.ref);for(r in t)Ic.call(t,r)&&!Uc.hasOwnProperty(r)&&(l[r]=t[r]);if(e&&e.defaultProps)for(r in t=e.defaultProps,t)l[r]===void 0&&(l[r]=t[r]);return{$$typeof:Oc,type:e,key:o,ref:i,props:l,_owner:Fc.current}}cl.Fragment=Dc;cl.jsx=ss;cl.jsxs=ss;qu.exports=cl;var m=qu.exports,as={exports:{}},Ee={},cs={exports:{}},fs={};/**
- * @license React
- * scheduler.production.min.js
- *
- * Copyright (c) Facebook, Inc. and its affiliates.
- *
- * This source code is licensed under the MIT license found in the
- * LICENSE file in the root directory of this source tree.
- */(function(e){function t(E,T){var p=E.length;E.push(T);e:for(;0<p;){var j=p-1>>>1,R=E[j];if(0<l(R,T))E[j]=T,E[p]=R,p=j;else break e}}function n(E){return E.length===0?null:E[0]}function r(E){if(E.length===0)return null;var T=E[0],p=E.pop();if(p!==T){E[0]=p;e:for(var j=0,R=E.length,Z=R>>>1;j<Z;){var W=2*(j+1)-1,he=E[W],$=W+1,_e=E[$];if(0>l(he,p))$<R&&0>l(_e,he)?(E[j]=_e,E[$]=p,j=$):(E[j]=he,E[W]=p,j=W);else if($<R&&0>l(_e,p))E[j]=_e,E[$]=p,j=$;else break e}}return T}function l(E,T){var p=E.sortIndex-T.sortIndex;return p!==0?p:E.id-T.id}if(typeof performance=="object"&&typeof performance.now=="function"){var o=performance;e.unstable_now=function(){return o.now()}}else{var i=Date,u=i.now();e.unstable_now=function(){return i.now()-u}}var s=[],c=[],y=1,v=null,h=3,x=!1,S=!1,k=!1,I=typeof setTimeout=="function"?setTimeout:null,f=typeof clearTimeout=="function"?clearTimeout:null,a=typeof setImmediate<"u"?setImmediate:null;typeof navigator<"u"&&navigator.scheduling!==void 0&&navigator.scheduling.isInputPending!==void 0&&navigator.scheduling.isInputPending.bind(navigator.scheduling);function d(E){for(var T=n(c);T!==null;){if(T.callback===null)r(c);else if(T.startTime<=E)r(c),T.sortIndex=T.expirationTime,t(s,T);else break;T=n(c)}}function g(E){if(k=!1,d(E),!S)if(n(s)!==null)S=!0,Ht(C);else{var T=n(c);T!==null&&Wt(g,T.startTime-E)}}function C(E,T){S=!1,k&&(k=!1,f(z),z=-1),x=!0;var p=h;try{for(d(T),v=n(s);v!==null&&(!(v.expirationTime>T)||E&&!ne());){var j=v.callback;if(typeof j=="function"){v.callback=null,h=v.priorityLevel;var R=j(v.expirationTime<=T);T=e.unstable_now(),typeof R=="function"?v.callback=R:v===n(s)&&r(s),d(T)}else r(s);v=n(s)}if(v!==null)var Z=!0;else{var W=n(c);W!==null&&Wt(g,W.startTime-T),Z=!1}return Z}finally{v=null,h=p,x=!1}}var _=!1,P=null,z=-1,U=5,L=-1;function ne(){return!(e.unstable_now()-L<U)}function Ae(){if(P!==null){var E=e.unstable_now();L=E;var T=!0;try{T=P(!0,E)}finally{T?Pt():(_=!1,P=null)}}else _=!1}var Pt;if(typeof a=="function")Pt=function(){a(Ae)};else if(typeof MessageChannel<"u"){var Sn=new MessageChannel,_l=Sn.port2;Sn.port1.onmessage=Ae,Pt=function(){_l.postMessage(null)}}else Pt=function(){I(Ae,0)};function Ht(E){P=E,_||(_=!0,Pt())}function Wt(E,T){z=I(function(){E(e.unstable_now())},T)}e.unstable_IdlePriority=5,e.unstable_ImmediatePriority=1,e.unstable_LowPriority=4,e.unstable_NormalPriority=3,e.unstable_Profiling=null,e.unstable_UserBlockingPriority=2,e.unstable_cancelCallback=function(E){E.callback=null},e.unstable_continueExecution=function(){S||x||(S=!0,Ht(C))},e.unstable_forceFrameRate=function(E){0>E||125<E?console.error("forceFrameRate takes a positive int between 0 and 125, forcing frame rates higher than 125 fps is not supported"):U=0<E?Math.floor(1e3/E):5},e.unstable_getCurrentPriorityLevel=function(){return h},e.unstable_getFirstCallbackNode=function(){return n(s)},e.unstable_next=function(E){switch(h){case 1:case 2:case 3:var T=3;break;default:T=h}var p=h;h=T;try{return E()}finally{h=p}},e.unstable_pauseExecution=function(){},e.unstable_requestPaint=function(){},e.unstable_runWithPriority=function(E,T){switch(E){case 1:case 2:case 3:case 4:case 5:break;default:E=3}var p=h;h=E;try{return T()}finally{h=p}},e.unstable_scheduleCallback=function(E,T,p){var j=e.unstable_now();switch(typeof p=="object"&&p!==null?(p=p.delay,p=typeof p=="number"&&0<p?j+p:j):p=j,E){case 1:var R=-1;break;case 2:R=250;break;case 5:R=1073741823;break;case 4:R=1e4;break;default:R=5e3}return R=p+R,E={id:y++,callback:T,priorityLevel:E,startTime:p,expirationTime:R,sortIndex:-1},p>j?(E.sortIndex=p,t(c,E),n(s)===null&&E===n(c)&&(k?(f(z),z=-1):k=!0,Wt(g,p-j))):(E.sortIndex=R,t(s,E),S||x||(S=!0,Ht(C))),E},e.unstable_shouldYield=ne,e.unstable_wrapCallback=function(E){var T=h;return function(){var p=h;h=T;try{return E.apply(this,arguments)}finally{h=p}}}})(fs);cs.exports=fs;var $c=cs.exports;/**
- * @license React
- * react-dom.production.min.js
- *
- * Copyright (c) Facebook, Inc. and its affiliates.
- *
- * This source code is licensed under the MIT license found in the
- * LICENSE file in the root directory of this source tree.
- */var Ac=B,Ce=$c;function w(e){for(var t="https://reactjs.org/docs/error-decoder.html?invariant="+e,n=1;n<arguments.length;n++)t+="&args[]="+encodeURIComponent(arguments[n]);return"Minified React error #"+e+"; visit "+t+" for the full message or use the non-minified dev environment for full errors and additional helpful warnings."}var ds=new Set,Hn={};function Vt(e,t){fn(e,t),fn(e+"Capture",t)}function fn(e,t){for(Hn[e]=t,e=0;e<t.length;e++)ds.add(t[e])}var qe=!(typeof window>"u"||typeof window.document>"u"||typeof window.document.createElement>"u"),no=Object.prototype.hasOwnProperty,Vc=/^[:A-Z_a-z\u00C0-\u00D6\u00D8-\u00F6\u00F8-\u02FF\u0370-\u037D\u037F-\u1FFF\u200C-\u200D\u2070-\u218F\u2C00-\u2FEF\u3001-\uD7FF\uF900-\uFDCF\uFDF0-\uFFFD][:A-Z_a-z\u00C0-\u00D6\u00D8-\u00F6\u00F8-\u02FF\u0370-\u037D\u037F-\u1FFF\u200C-\u200D\u2070-\u218F\u2C00-\u2FEF\u3001-\uD7FF\uF900-\uFDCF\uFDF0-\uFFFD\-.0-9\u00B7\u0300-\u036F\u203F-\u2040]*$/,Ki={},Yi={};function Bc(e){return no.call(Yi,e)?!0:no.call(Ki,e)?!1:Vc.test(e)?Yi[e]=!0:(Ki[e]=!0,!1)}function Hc(e,t,n,r){if(n!==null&&n.type===0)return!1;switch(typeof t){case"function":case"symbol":return!0;case"boolean":return r?!1:n!==null?!n.acceptsBooleans:(e=e.toLowerCase().slice(0,5),e!=="data-"&&e!=="aria-");default:return!1}}function Wc(e,t,n,r){if(t===null||typeof t>"u"||Hc(e,t,n,r))return!0;if(r)return!1;if(n!==null)switch(n.type){case 3:return!t;case 4:return t===!1;case 5:return isNaN(t);case 6:return isNaN(t)||1>t}return!1}function pe(e,t,n,r,l,o,i){this.acceptsBooleans=t===2||t===3||t===4,this.attributeName=r,this.attributeNamespace=l,this.mustUseProperty=n,this.propertyName=e,this.type=t,this.sanitizeURL=o,this.removeEmptyString=i}var oe={};"children dangerouslySetInnerHTML defaultValue defaultChecked innerHTML suppressContentEditableWarning suppressHydrationWarning style".split(" ").forEach(function(e){oe[e]=new pe(e,0,!1,e,null,!1,!1)});[["acceptCharset","accept-charset"],["className","class"],["htmlFor","for"],["httpEquiv","http-equiv"]].forEach(function(e){var t=e[0];oe[t]=new pe(t,1,!1,e[1],null,!1,!1)});["contentEditable","draggable","spellCheck","value"].forEach(function(e){oe[e]=new pe(e,2,!1,e.toLowerCase(),null,!1,!1)});["autoReverse","externalResourcesRequired","focusable","preserveAlpha"].forEach(function(e){oe[e]=new pe(e,2,!1,e,null,!1,!1)});"allowFullScreen async autoFocus autoPlay controls default defer disabled disablePictureInPicture disableRemotePlayback formNoValidate hidden loop noModule noValidate open playsInline readOnly required reversed scoped seamless itemScope".split(" ").forEach(function(e){oe[e]=new pe(e,3,!1,e.toLowerCase(),null,!1,!1)});["checked","multiple","muted","selected"].forEach(function(e){oe[e]=new pe(e,3,!0,e,null,!1,!1)});["capture","download"].forEach(function(e){oe[e]=new pe(e,4,!1,e,null,!1,!1)});["cols","rows","size","span"].forEach(function(e){oe[e]=new pe(e,6,!1,e,null,!1,!1)});["rowSpan","start"].forEach(function(e){oe[e]=new pe(e,5,!1,e.toLowerCase(),null,!1,!1)});var bo=/[\-:]([a-z])/g;function ei(e){return e[1].toUpperCase()}"accent-height alignment-baseline arabic-form baseline-shift cap-height clip-path clip-rule color-interpolation color-interpolation-filters color-profile color-rendering dominant-baseline enable-background fill-opacity fill-rule flood-color flood-opacity font-family font-size font-size-adjust font-stretch font-style font-variant font-weight glyph-name glyph-orientation-horizontal glyph-orientation-vertical horiz-adv-x horiz-origin-x image-rendering letter-spacing lighting-color marker-end marker-mid marker-start overline-position overline-thickness paint-order panose-1 pointer-events rendering-intent shape-rendering stop-color stop-opacity strikethrough-position strikethrough-thickness stroke-dasharray stroke-dashoffset stroke-linecap stroke-linejoin stroke-miterlimit stroke-opacity stroke-width text-anchor text-decoration text-rendering underline-position underline-thickness unicode-bidi unicode-range units-per-em v-alphabetic v-hanging v-ideographic v-mathematical vector-effect vert-adv-y vert-origin-x vert-origin-y word-spacing writing-mode xmlns:xlink x-height".split(" ").forEach(function(e){var t=e.replace(bo,ei);oe[t]=new pe(t,1,!1,e,null,!1,!1)});"xlink:actuate xlink:arcrole xlink:role xlink:show xlink:title xlink:type".split(" ").forEach(function(e){var t=e.replace(bo,ei);oe[t]=new pe(t,1,!1,e,"http://www.w3.org/1999/xlink",!1,!1)});["xml:base","xml:lang","xml:space"].forEach(function(e){var t=e.replace(bo,ei);oe[t]=new pe(t,1,!1,e,"http://www.w3.org/XML/1998/namespace",!1,!1)});["tabIndex","crossOrigin"].forEach(function(e){oe[e]=new pe(e,1,!1,e.toLowerCase(),null,!1,!1)});oe.xlinkHref=new pe("xlinkHref",1,!1,"xlink:href","http://www.w3.org/1999/xlink",!0,!1);["src","href","action","formAction"].forEach(function(e){oe[e]=new pe(e,1,!1,e.toLowerCase(),null,!0,!0)});function ti(e,t,n,r){var l=oe.hasOwnProperty(t)?oe[t]:null;(l!==null?l.type!==0:r||!(2<t.length)||t[0]!=="o"&&t[0]!=="O"||t[1]!=="n"&&t[1]!=="N")&&(Wc(t,n,l,r)&&(n=null),r||l===null?Bc(t)&&(n===null?e.removeAttribute(t):e.setAttribute(t,""+n)):l.mustUseProperty?e[l.propertyName]=n===null?l.type===3?!1:"":n:(t=l.attributeName,r=l.attributeNamespace,n===null?e.removeAttribute(t):(l=l.type,n=l===3||l===4&&n===!0?"":""+n,r?e.setAttributeNS(r,t,n):e.setAttribute(t,n))))}var nt=Ac.__SECRET_INTERNALS_DO_NOT_USE_OR_YOU_WILL_BE_FIRED,dr=Symbol.for("react.element"),Kt=Symbol.for("react.portal"),Yt=Symbol.for("react.fragment"),ni=Symbol.for("react.strict_mode"),ro=Symbol.for("react.profiler"),ps=Symbol.for("react.provider"),hs=Symbol.for("react.context"),ri=Symbol.for("react.forward_ref"),lo=Symbol.for("react.suspense"),oo=Symbol.for("react.suspense_list"),li=Symbol.for("react.memo"),ot=Symbol.for("react.lazy"),ms=Symbol.for("react.offscreen"),Gi=Symbol.iterator;function kn(e){return e===null||typeof e!="object"?null:(e=Gi&&e[Gi]||e["@@iterator"],typeof e=="function"?e:null)}var Y=Object.assign,Tl;function Tn(e){if(Tl===void 0)try{throw Error()}catch(n){var t=n.stack.trim().match(/\n( *(at )?)/);Tl=t&&t[1]||""}return`
-`+Tl+e}var Ll=!1;function Ml(e,t){if(!e||Ll)return"";Ll=!0;var n=Error.prepareStackTrace;Error.prepareStackTrace=void 0;try{if(t)if(t=function(){throw Error()},Object.defineProperty(t.prototype,"props",{set:function(){throw Error()}}),typeof Reflect=="object"&&Reflect.construct){try{Reflect.construct(t,[])}catch(c){var r=c}Reflect.construct(e,[],t)}else{try{t.call()}catch(c){r=c}e.call(t.prototype)}else{try{throw Error()}catch(c){r=c}e()}}catch(c){if(c&&r&&typeof c.stack=="string"){for(var l=c.stack.split(`
-`),o=r.stack.split(`
-`),i=l.length-1,u=o.length-1;1<=i&&0<=u&&l[i]!==o[u];)u--;for(;1<=i&&0<=u;i--,u--)if(l[i]!==o[u]){if(i!==1||u!==1)do if(i--,u--,0>u||l[i]!==o[u]){var s=`
-`+l[i].replace(" at new "," at ");return e.displayName&&s.includes("<anonymous>")&&(s=s.replace("<anonymous>",e.displayName)),s}while(1<=i&&0<=u);break}}}finally{Ll=!1,Error.prepareStackTrace=n}return(e=e?e.displayName||e.name:"")?Tn(e):""}function Qc(e){switch(e.tag){case 5:return Tn(e.type);case 16:return Tn("Lazy");case 13:return Tn("Suspense");case 19:return Tn("SuspenseList");case 0:case 2:case 15:return e=Ml(e.type,!1),e;case 11:return e=Ml(e.type.render,!1),e;case 1:return e=Ml(e.type,!0),e;default:return""}}function io(e){if(e==null)return null;if(typeof e=="function")return e.displayName||e.name||null;if(typeof e=="string")return e;switch(e){case Yt:return"Fragment";case Kt:return"Portal";case ro:return"Profiler";case ni:return"StrictMode";case lo:return"Suspense";case oo:return"SuspenseList"}if(typeof e=="object")switch(e.$$typeof){case hs:return(e.displayName||"Context")+".Consumer";case ps:return(e._context.displayName||"Context")+".Provider";case ri:var t=e.render;return e=e.displayName,e||(e=t.displayName||t.name||"",e=e!==""?"ForwardRef("+e+")":"ForwardRef"),e;case li:return t=e.displayName||null,t!==null?t:io(e.type)||"Memo";case ot:t=e._payload,e=e._init;try{return io(e(t))}catch{}}return null}function Kc(e){var t=e.type;switch(e.tag){case 24:return"Cache";case 9:return(t.displayName||"Context")+".Consumer";case 10:return(t._context.displayName||"Context")+".Provider";case 18:return"DehydratedFragment";case 11:return e=t.render,e=e.displayName||e.name||"",t.displayName||(e!==""?"ForwardRef("+e+")":"ForwardRef");case 7:return"Fragment";case 5:return t;case 4:return"Portal";case 3:return"Root";case 6:return"Text";case 16:return io(t);case 8:return t===ni?"StrictMode":"Mode";case 22:return"Offscreen";case 12:return"Profiler";case 21:return"Scope";case 13:return"Suspense";case 19:return"SuspenseList";case 25:return"TracingMarker";case 1:case 0:case 17:case 2:case 14:case 15:if(typeof t=="function")return t.displayName||t.name||null;if(typeof t=="string")return t}return null}function kt(e){switch(typeof e){case"boolean":case"number":case"string":case"undefined":return e;case"object":return e;default:return""}}function vs(e){var t=e.type;return(e=e.nodeName)&&e.toLowerCase()==="input"&&(t==="checkbox"||t==="radio")}function Yc(e){var t=vs(e)?"checked":"value",n=Object.getOwnPropertyDescriptor(e.constructor.prototype,t),r=""+e[t];if(!e.hasOwnProperty(t)&&typeof n<"u"&&typeof n.get=="function"&&typeof n.set=="function"){var l=n.get,o=n.set;return Object.defineProperty(e,t,{configurable:!0,get:function(){return l.call(this)},set:function(i){r=""+i,o.call(this,i)}}),Object.defineProperty(e,t,{enumerable:n.enumerable}),{getValue:function(){return r},setValue:function(i){r=""+i},stopTracking:function(){e._valueTracker=null,delete e[t]}}}}function pr(e){e._valueTracker||(e._valueTracker=Yc(e))}function ys(e){if(!e)return!1;var t=e._valueTracker;if(!t)return!0;var n=t.getValue(),r="";return e&&(r=vs(e)?e.checked?"true":"false":e.value),e=r,e!==n?(t.setValue(e),!0):!1}function Ar(e){if(e=e||(typeof document<"u"?document:void 0),typeof e>"u")return null;try{return e.activeElement||e.body}catch{return e.body}}function uo(e,t){var n=t.checked;return Y({},t,{defaultChecked:void 0,defaultValue:void 0,value:void 0,checked:n??e._wrapperState.initialChecked})}function Xi(e,t){var n=t.defaultValue==null?"":t.defaultValue,r=t.checked!=null?t.checked:t.defaultChecked;n=kt(t.value!=null?t.value:n),e._wrapperState={initialChecked:r,initialValue:n,controlled:t.type==="checkbox"||t.type==="radio"?t.checked!=null:t.value!=null}}function gs(e,t){t=t.checked,t!=null&&ti(e,"checked",t,!1)}function so(e,t){gs(e,t);var n=kt(t.value),r=t.type;if(n!=null)r==="number"?(n===0&&e.value===""||e.value!=n)&&(e.value=""+n):e.value!==""+n&&(e.value=""+n);else if(r==="submit"||r==="reset"){e.removeAttribute("value");return}t.hasOwnProperty("value")?ao(e,t.type,n):t.hasOwnProperty("defaultValue")&&ao(e,t.type,kt(t.defaultValue)),t.checked==null&&t.defaultChecked!=null&&(e.defaultChecked=!!t.defaultChecked)}function Zi(e,t,n){if(t.hasOwnProperty("value")||t.hasOwnProperty("defaultValue")){var r=t.type;if(!(r!=="submit"&&r!=="reset"||t.value!==void 0&&t.value!==null))return;t=""+e._wrapperState.initialValue,n||t===e.value||(e.value=t),e.defaultValue=t}n=e.name,n!==""&&(e.name=""),e.defaultChecked=!!e._wrapperState.initialChecked,n!==""&&(e.name=n)}function ao(e,t,n){(t!=="number"||Ar(e.ownerDocument)!==e)&&(n==null?e.defaultValue=""+e._wrapperState.initialValue:e.defaultValue!==""+n&&(e.defaultValue=""+n))}var Ln=Array.isArray;function ln(e,t,n,r){if(e=e.options,t){t={};for(var l=0;l<n.length;l++)t["$"+n[l]]=!0;for(n=0;n<e.length;n++)l=t.hasOwnProperty("$"+e[n].value),e[n].selected!==l&&(e[n].selected=l),l&&r&&(e[n].defaultSelected=!0)}else{for(n=""+kt(n),t=null,l=0;l<e.length;l++){if(e[l].value===n){e[l].selected=!0,r&&(e[l].defaultSelected=!0);return}t!==null||e[l].disabled||(t=e[l])}t!==null&&(t.selected=!0)}}function co(e,t){if(t.dangerouslySetInnerHTML!=null)throw Error(w(91));return Y({},t,{value:void 0,defaultValue:void 0,children:""+e._wrapperState.initialValue})}function Ji(e,t){var n=t.value;if(n==null){if(n=t.children,t=t.defaultValue,n!=null){if(t!=null)throw Error(w(92));if(Ln(n)){if(1<n.length)throw Error(w(93));n=n[0]}t=n}t==null&&(t=""),n=t}e._wrapperState={initialValue:kt(n)}}function ws(e,t){var n=kt(t.value),r=kt(t.defaultValue);n!=null&&(n=""+n,n!==e.value&&(e.value=n),t.defaultValue==null&&e.defaultValue!==n&&(e.defaultValue=n)),r!=null&&(e.defaultValue=""+r)}function qi(e){var t=e.textContent;t===e._wrapperState.initialValue&&t!==""&&t!==null&&(e.value=t)}function xs(e){switch(e){case"svg":return"http://www.w3.org/2000/svg";case"math":return"http://www.w3.org/1998/Math/MathML";default:return"http://www.w3.org/1999/xhtml"}}function fo(e,t){return e==null||e==="http://www.w3.org/1999/xhtml"?xs(t):e==="http://www.w3.org/2000/svg"&&t==="foreignObject"?"http://www.w3.org/1999/xhtml":e}var hr,Ss=function(e){return typeof MSApp<"u"&&MSApp.execUnsafeLocalFunction?function(t,n,r,l){MSApp.execUnsafeLocalFunction(function(){return e(t,n,r,l)})}:e}(function(e,t){if(e.namespaceURI!=="http://www.w3.org/2000/svg"||"innerHTML"in e)e.innerHTML=t;else{for(hr=hr||document.createElement("div"),hr.innerHTML="<svg>"+t.valueOf().toString()+"</svg>",t=hr.firstChild;e.firstChild;)e.removeChild(e.firstChild);for(;t.firstChild;)e.appendChild(t.firstChild)}});function Wn(e,t){if(t){var n=e.firstChild;if(n&&n===e.lastChild&&n.nodeType===3){n.nodeValue=t;return}}e.textContent=t}var On={animationIterationCount:!0,aspectRatio:!0,borderImageOutset:!0,borderImageSlice:!0,borderImageWidth:!0,boxFlex:!0,boxFlexGroup:!0,boxOrdinalGroup:!0,columnCount:!0,columns:!0,flex:!0,flexGrow:!0,flexPositive:!0,flexShrink:!0,flexNegative:!0,flexOrder:!0,gridArea:!0,gridRow:!0,gridRowEnd:!0,gridRowSpan:!0,gridRowStart:!0,gridColumn:!0,gridColumnEnd:!0,gridColumnSpan:!0,gridColumnStart:!0,fontWeight:!0,lineClamp:!0,lineHeight:!0,opacity:!0,order:!0,orphans:!0,tabSize:!0,widows:!0,zIndex:!0,zoom:!0,fillOpacity:!0,floodOpacity:!0,stopOpacity:!0,strokeDasharray:!0,strokeDashoffset:!0,strokeMiterlimit:!0,strokeOpacity:!0,strokeWidth:!0},Gc=["Webkit","ms","Moz","O"];Object.keys(On).forEach(function(e){Gc.forEach(function(t){t=t+e.charAt(0).toUpperCase()+e.substring(1),On[t]=On[e]})});function ks(e,t,n){return t==null||typeof t=="boolean"||t===""?"":n||typeof t!="number"||t===0||On.hasOwnProperty(e)&&On[e]?(""+t).trim():t+"px"}function Cs(e,t){e=e.style;for(var n in t)if(t.hasOwnProperty(n)){var r=n.indexOf("--")===0,l=ks(n,t[n],r);n==="float"&&(n="cssFloat"),r?e.setProperty(n,l):e[n]=l}}var Xc=Y({menuitem:!0},{area:!0,base:!0,br:!0,col:!0,embed:!0,hr:!0,img:!0,input:!0,keygen:!0,link:!0,meta:!0,param:!0,source:!0,track:!0,wbr:!0});function po(e,t){if(t){if(Xc[e]&&(t.children!=null||t.dangerouslySetInnerHTML!=null))throw Error(w(137,e));if(t.dangerouslySetInnerHTML!=null){if(t.children!=null)throw Error(w(60));if(typeof t.dangerouslySetInnerHTML!="object"||!("__html"in t.dangerouslySetInnerHTML))throw Error(w(61))}if(t.style!=null&&typeof t.style!="object")throw Error(w(62))}}function ho(e,t){if(e.indexOf("-")===-1)return typeof t.is=="string";switch(e){case"annotation-xml":case"color-profile":case"font-face":case"font-face-src":case"font-face-uri":case"font-face-format":case"font-face-name":case"missing-glyph":return!1;default:return!0}}var mo=null;function oi(e){return e=e.target||e.srcElement||window,e.correspondingUseElement&&(e=e.correspondingUseElement),e.nodeType===3?e.parentNode:e}var vo=null,on=null,un=null;function bi(e){if(e=ar(e)){if(typeof vo!="function")throw Error(w(280));var t=e.stateNode;t&&(t=ml(t),vo(e.stateNode,e.type,t))}}function Es(e){on?un?un.push(e):un=[e]:on=e}function Ns(){if(on){var e=on,t=un;if(un=on=null,bi(e),t)for(e=0;e<t.length;e++)bi(t[e])}}function _s(e,t){return e(t)}function Ps(){}var Rl=!1;function js(e,t,n){if(Rl)return e(t,n);Rl=!0;try{return _s(e,t,n)}finally{Rl=!1,(on!==null||un!==null)&&(Ps(),Ns())}}function Qn(e,t){var n=e.stateNode;if(n===null)return null;var r=ml(n);if(r===null)return null;n=r[t];e:switch(t){case"onClick":case"onClickCapture":case"onDoubleClick":case"onDoubleClickCapture":case"onMouseDown":case"onMouseDownCapture":case"onMouseMove":case"onMouseMoveCapture":case"onMouseUp":case"onMouseUpCapture":case"onMouseEnter":(r=!r.disabled)||(e=e.type,r=!(e==="button"||e==="input"||e==="select"||e==="textarea")),e=!r;break e;default:e=!1}if(e)return null;if(n&&typeof n!="function")throw Error(w(231,t,typeof n));return n}var yo=!1;if(qe)try{var Cn={};Object.defineProperty(Cn,"passive",{get:function(){yo=!0}}),window.addEventListener("test",Cn,Cn),window.removeEventListener("test",Cn,Cn)}catch{yo=!1}function Zc(e,t,n,r,l,o,i,u,s){var c=Array.prototype.slice.call(arguments,3);try{t.apply(n,c)}catch(y){this.onError(y)}}var Dn=!1,Vr=null,Br=!1,go=null,Jc={onError:function(e){Dn=!0,Vr=e}};function qc(e,t,n,r,l,o,i,u,s){Dn=!1,Vr=null,Zc.apply(Jc,arguments)}function bc(e,t,n,r,l,o,i,u,s){if(qc.apply(this,arguments),Dn){if(Dn){var c=Vr;Dn=!1,Vr=null}else throw Error(w(198));Br||(Br=!0,go=c)}}function Bt(e){var t=e,n=e;if(e.alternate)for(;t.return;)t=t.return;else{e=t;do t=e,t.flags&4098&&(n=t.return),e=t.return;while(e)}return t.tag===3?n:null}function zs(e){if(e.tag===13){var t=e.memoizedState;if(t===null&&(e=e.alternate,e!==null&&(t=e.memoizedState)),t!==null)return t.dehydrated}return null}function eu(e){if(Bt(e)!==e)throw Error(w(188))}function ef(e){var t=e.alternate;if(!t){if(t=Bt(e),t===null)throw Error(w(188));return t!==e?null:e}for(var n=e,r=t;;){var l=n.return;if(l===null)break;var o=l.alternate;if(o===null){if(r=l.return,r!==null){n=r;continue}break}if(l.child===o.child){for(o=l.child;o;){if(o===n)return eu(l),e;if(o===r)return eu(l),t;o=o.sibling}throw Error(w(188))}if(n.return!==r.return)n=l,r=o;else{for(var i=!1,u=l.child;u;){if(u===n){i=!0,n=l,r=o;break}if(u===r){i=!0,r=l,n=o;break}u=u.sibling}if(!i){for(u=o.child;u;){if(u===n){i=!0,n=o,r=l;break}if(u===r){i=!0,r=o,n=l;break}u=u.sibling}if(!i)throw Error(w(189))}}if(n.alternate!==r)throw Error(w(190))}if(n.tag!==3)throw Error(w(188));return n.stateNode.current===n?e:t}function Ts(e){return e=ef(e),e!==null?Ls(e):null}function Ls(e){if(e.tag===5||e.tag===6)return e;for(e=e.child;e!==null;){var t=Ls(e);if(t!==null)return t;e=e.sibling}return null}var Ms=Ce.unstable_scheduleCallback,tu=Ce.unstable_cancelCallback,tf=Ce.unstable_shouldYield,nf=Ce.unstable_requestPaint,X=Ce.unstable_now,rf=Ce.unstable_getCurrentPriorityLevel,ii=Ce.unstable_ImmediatePriority,Rs=Ce.unstable_UserBlockingPriority,Hr=Ce.unstable_NormalPriority,lf=Ce.unstable_LowPriority,Os=Ce.unstable_IdlePriority,fl=null,We=null;function of(e){if(We&&typeof We.onCommitFiberRoot=="function")try{We.onCommitFiberRoot(fl,e,void 0,(e.current.flags&128)===128)}catch{}}var Fe=Math.clz32?Math.clz32:af,uf=Math.log,sf=Math.LN2;function af(e){return e>>>=0,e===0?32:31-(uf(e)/sf|0)|0}var mr=64,vr=4194304;function Mn(e){switch(e&-e){case 1:return 1;case 2:return 2;case 4:return 4;case 8:return 8;case 16:return 16;case 32:return 32;case 64:case 128:case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:return e&4194240;case 4194304:case 8388608:case 16777216:case 33554432:case 67108864:return e&130023424;case 134217728:return 134217728;case 268435456:return 268435456;case 536870912:return 536870912;case 1073741824:return 1073741824;default:return e}}function Wr(e,t){var n=e.pendingLanes;if(n===0)return 0;var r=0,l=e.suspendedLanes,o=e.pingedLanes,i=n&268435455;if(i!==0){var u=i&~l;u!==0?r=Mn(u):(o&=i,o!==0&&(r=Mn(o)))}else i=n&~l,i!==0?r=Mn(i):o!==0&&(r=Mn(o));if(r===0)return 0;if(t!==0&&t!==r&&!(t&l)&&(l=r&-r,o=t&-t,l>=o||l===16&&(o&4194240)!==0))return t;if(r&4&&(r|=n&16),t=e.entangledLanes,t!==0)for(e=e.entanglements,t&=r;0<t;)n=31-Fe(t),l=1<<n,r|=e[n],t&=~l;return r}function cf(e,t){switch(e){case 1:case 2:case 4:return t+250;case 8:case 16:case 32:case 64:case 128:case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:return t+5e3;case 4194304:case 8388608:case 16777216:case 33554432:case 67108864:return-1;case 134217728:case 268435456:case 536870912:case 1073741824:return-1;default:return-1}}function ff(e,t){for(var n=e.suspendedLanes,r=e.pingedLanes,l=e.expirationTimes,o=e.pendingLanes;0<o;){var i=31-Fe(o),u=1<<i,s=l[i];s===-1?(!(u&n)||u&r)&&(l[i]=cf(u,t)):s<=t&&(e.expiredLanes|=u),o&=~u}}function wo(e){return e=e.pendingLanes&-1073741825,e!==0?e:e&1073741824?1073741824:0}function Ds(){var e=mr;return mr<<=1,!(mr&4194240)&&(mr=64),e}function Ol(e){for(var t=[],n=0;31>n;n++)t.push(e);return t}function ur(e,t,n){e.pendingLanes|=t,t!==536870912&&(e.suspendedLanes=0,e.pingedLanes=0),e=e.eventTimes,t=31-Fe(t),e[t]=n}function df(e,t){var n=e.pendingLanes&~t;e.pendingLanes=t,e.suspendedLanes=0,e.pingedLanes=0,e.expiredLanes&=t,e.mutableReadLanes&=t,e.entangledLanes&=t,t=e.entanglements;var r=e.eventTimes;for(e=e.expirationTimes;0<n;){var l=31-Fe(n),o=1<<l;t[l]=0,r[l]=-1,e[l]=-1,n&=~o}}function ui(e,t){var n=e.entangledLanes|=t;for(e=e.entanglements;n;){var r=31-Fe(n),l=1<<r;l&t|e[r]&t&&(e[r]|=t),n&=~l}}var D=0;function Is(e){return e&=-e,1<e?4<e?e&268435455?16:536870912:4:1}var Fs,si,Us,$s,As,xo=!1,yr=[],ht=null,mt=null,vt=null,Kn=new Map,Yn=new Map,at=[],pf="mousedown mouseup touchcancel touchend touchstart auxclick dblclick pointercancel pointerdown pointerup dragend dragstart drop compositionend compositionstart keydown keypress keyup input textInput copy cut paste click change contextmenu reset submit".split(" ");function nu(e,t){switch(e){case"focusin":case"focusout":ht=null;break;case"dragenter":case"dragleave":mt=null;break;case"mouseover":case"mouseout":vt=null;break;case"pointerover":case"pointerout":Kn.delete(t.pointerId);break;case"gotpointercapture":case"lostpointercapture":Yn.delete(t.pointerId)}}function En(e,t,n,r,l,o){return e===null||e.nativeEvent!==o?(e={blockedOn:t,domEventName:n,eventSystemFlags:r,nativeEvent:o,targetContainers:[l]},t!==null&&(t=ar(t),t!==null&&si(t)),e):(e.eventSystemFlags|=r,t=e.targetContainers,l!==null&&t.indexOf(l)===-1&&t.push(l),e)}function hf(e,t,n,r,l){switch(t){case"focusin":return ht=En(ht,e,t,n,r,l),!0;case"dragenter":return mt=En(mt,e,t,n,r,l),!0;case"mouseover":return vt=En(vt,e,t,n,r,l),!0;case"pointerover":var o=l.pointerId;return Kn.set(o,En(Kn.get(o)||null,e,t,n,r,l)),!0;case"gotpointercapture":return o=l.pointerId,Yn.set(o,En(Yn.get(o)||null,e,t,n,r,l)),!0}return!1}function Vs(e){var t=Lt(e.target);if(t!==null){var n=Bt(t);if(n!==null){if(t=n.tag,t===13){if(t=zs(n),t!==null){e.blockedOn=t,As(e.priority,function(){Us(n)});return}}else if(t===3&&n.stateNode.current.memoizedState.isDehydrated){e.blockedOn=n.tag===3?n.stateNode.containerInfo:null;return}}}e.blockedOn=null}function Tr(e){if(e.blockedOn!==null)return!1;for(var t=e.targetContainers;0<t.length;){var n=So(e.domEventName,e.eventSystemFlags,t[0],e.nativeEvent);if(n===null){n=e.nativeEvent;var r=new n.constructor(n.type,n);mo=r,n.target.dispatchEvent(r),mo=null}else return t=ar(n),t!==null&&si(t),e.blockedOn=n,!1;t.shift()}return!0}function ru(e,t,n){Tr(e)&&n.delete(t)}function mf(){xo=!1,ht!==null&&Tr(ht)&&(ht=null),mt!==null&&Tr(mt)&&(mt=null),vt!==null&&Tr(vt)&&(vt=null),Kn.forEach(ru),Yn.forEach(ru)}function Nn(e,t){e.blockedOn===t&&(e.blockedOn=null,xo||(xo=!0,Ce.unstable_scheduleCallback(Ce.unstable_NormalPriority,mf)))}function Gn(e){function t(l){return Nn(l,e)}if(0<yr.length){Nn(yr[0],e);for(var n=1;n<yr.length;n++){var r=yr[n];r.blockedOn===e&&(r.blockedOn=null)}}for(ht!==null&&Nn(ht,e),mt!==null&&Nn(mt,e),vt!==null&&Nn(vt,e),Kn.forEach(t),Yn.forEach(t),n=0;n<at.length;n++)r=at[n],r.blockedOn===e&&(r.blockedOn=null);for(;0<at.length&&(n=at[0],n.blockedOn===null);)Vs(n),n.blockedOn===null&&at.shift()}var sn=nt.ReactCurrentBatchConfig,Qr=!0;function vf(e,t,n,r){var l=D,o=sn.transition;sn.transition=null;try{D=1,ai(e,t,n,r)}finally{D=l,sn.transition=o}}function yf(e,t,n,r){var l=D,o=sn.transition;sn.transition=null;try{D=4,ai(e,t,n,r)}finally{D=l,sn.transition=o}}function ai(e,t,n,r){if(Qr){var l=So(e,t,n,r);if(l===null)Wl(e,t,r,Kr,n),nu(e,r);else if(hf(l,e,t,n,r))r.stopPropagation();else if(nu(e,r),t&4&&-1<pf.indexOf(e)){for(;l!==null;){var o=ar(l);if(o!==null&&Fs(o),o=So(e,t,n,r),o===null&&Wl(e,t,r,Kr,n),o===l)break;l=o}l!==null&&r.stopPropagation()}else Wl(e,t,r,null,n)}}var Kr=null;function So(e,t,n,r){if(Kr=null,e=oi(r),e=Lt(e),e!==null)if(t=Bt(e),t===null)e=null;else if(n=t.tag,n===13){if(e=zs(t),e!==null)return e;e=null}else if(n===3){if(t.stateNode.current.memoizedState.isDehydrated)return t.tag===3?t.stateNode.containerInfo:null;e=null}else t!==e&&(e=null);return Kr=e,null}function Bs(e){switch(e){case"cancel":case"click":case"close":case"contextmenu":case"copy":case"cut":case"auxclick":case"dblclick":case"dragend":case"dragstart":case"drop":case"focusin":case"focusout":case"input":case"invalid":case"keydown":case"keypress":case"keyup":case"mousedown":case"mouseup":case"paste":case"pause":case"play":case"pointercancel":case"pointerdown":case"pointerup":case"ratechange":case"reset":case"resize":case"seeked":case"submit":case"touchcancel":case"touchend":case"touchstart":case"volumechange":case"change":case"selectionchange":case"textInput":case"compositionstart":case"compositionend":case"compositionupdate":case"beforeblur":case"afterblur":case"beforeinput":case"blur":case"fullscreenchange":case"focus":case"hashchange":case"popstate":case"select":case"selectstart":return 1;case"drag":case"dragenter":case"dragexit":case"dragleave":case"dragover":case"mousemove":case"mouseout":case"mouseover":case"pointermove":case"pointerout":case"pointerover":case"scroll":case"toggle":case"touchmove":case"wheel":case"mouseenter":case"mouseleave":case"pointerenter":case"pointerleave":return 4;case"message":switch(rf()){case ii:return 1;case Rs:return 4;case Hr:case lf:return 16;case Os:return 536870912;default:return 16}default:return 16}}var dt=null,ci=null,Lr=null;function Hs(){if(Lr)return Lr;var e,t=ci,n=t.length,r,l="value"in dt?dt.value:dt.textContent,o=l.length;for(e=0;e<n&&t[e]===l[e];e++);var i=n-e;for(r=1;r<=i&&t[n-r]===l[o-r];r++);return Lr=l.slice(e,1<r?1-r:void 0)}function Mr(e){var t=e.keyCode;return"charCode"in e?(e=e.charCode,e===0&&t===13&&(e=13)):e=t,e===10&&(e=13),32<=e||e===13?e:0}function gr(){return!0}function lu(){return!1}function Ne(e){function t(n,r,l,o,i){this._reactName=n,this._targetInst=l,this.type=r,this.nativeEvent=o,this.target=i,this.currentTarget=null;for(var u in e)e.hasOwnProperty(u)&&(n=e[u],this[u]=n?n(o):o[u]);return this.isDefaultPrevented=(o.defaultPrevented!=null?o.defaultPrevented:o.returnValue===!1)?gr:lu,this.isPropagationStopped=lu,this}return Y(t.prototype,{preventDefault:function(){this.defaultPrevented=!0;var n=this.nativeEvent;n&&(n.preventDefault?n.preventDefault():typeof n.returnValue!="unknown"&&(n.returnValue=!1),this.isDefaultPrevented=gr)},stopPropagation:function(){var n=this.nativeEvent;n&&(n.stopPropagation?n.stopPropagation():typeof n.cancelBubble!="unknown"&&(n.cancelBubble=!0),this.isPropagationStopped=gr)},persist:function(){},isPersistent:gr}),t}var wn={eventPhase:0,bubbles:0,cancelable:0,timeStamp:function(e){return e.timeStamp||Date.now()},defaultPrevented:0,isTrusted:0},fi=Ne(wn),sr=Y({},wn,{view:0,detail:0}),gf=Ne(sr),Dl,Il,_n,dl=Y({},sr,{screenX:0,screenY:0,clientX:0,clientY:0,pageX:0,pageY:0,ctrlKey:0,shiftKey:0,altKey:0,metaKey:0,getModifierState:di,button:0,buttons:0,relatedTarget:function(e){return e.relatedTarget===void 0?e.fromElement===e.srcElement?e.toElement:e.fromElement:e.relatedTarget},movementX:function(e){return"movementX"in e?e.movementX:(e!==_n&&(_n&&e.type==="mousemove"?(Dl=e.screenX-_n.screenX,Il=e.screenY-_n.screenY):Il=Dl=0,_n=e),Dl)},movementY:function(e){return"movementY"in e?e.movementY:Il}}),ou=Ne(dl),wf=Y({},dl,{dataTransfer:0}),xf=Ne(wf),Sf=Y({},sr,{relatedTarget:0}),Fl=Ne(Sf),kf=Y({},wn,{animationName:0,elapsedTime:0,pseudoElement:0}),Cf=Ne(kf),Ef=Y({},wn,{clipboardData:function(e){return"clipboardData"in e?e.clipboardData:window.clipboardData}}),Nf=Ne(Ef),_f=Y({},wn,{data:0}),iu=Ne(_f),Pf={Esc:"Escape",Spacebar:" ",Left:"ArrowLeft",Up:"ArrowUp",Right:"ArrowRight",Down:"ArrowDown",Del:"Delete",Win:"OS",Menu:"ContextMenu",Apps:"ContextMenu",Scroll:"ScrollLock",MozPrintableKey:"Unidentified"},jf={8:"Backspace",9:"Tab",12:"Clear",13:"Enter",16:"Shift",17:"Control",18:"Alt",19:"Pause",20:"CapsLock",27:"Escape",32:" ",33:"PageUp",34:"PageDown",35:"End",36:"Home",37:"ArrowLeft",38:"ArrowUp",39:"ArrowRight",40:"ArrowDown",45:"Insert",46:"Delete",112:"F1",113:"F2",114:"F3",115:"F4",116:"F5",117:"F6",118:"F7",119:"F8",120:"F9",121:"F10",122:"F11",123:"F12",144:"NumLock",145:"ScrollLock",224:"Meta"},zf={Alt:"altKey",Control:"ctrlKey",Meta:"metaKey",Shift:"shiftKey"};function Tf(e){var t=this.nativeEvent;return t.getModifierState?t.getModifierState(e):(e=zf[e])?!!t[e]:!1}function di(){return Tf}var Lf=Y({},sr,{key:function(e){if(e.key){var t=Pf[e.key]||e.key;if(t!=="Unidentified")return t}return e.type==="keypress"?(e=Mr(e),e===13?"Enter":String.fromCharCode(e)):e.type==="keydown"||e.type==="keyup"?jf[e.keyCode]||"Unidentified":""},code:0,location:0,ctrlKey:0,shiftKey:0,altKey:0,metaKey:0,repeat:0,locale:0,getModifierState:di,charCode:function(e){return e.type==="keypress"?Mr(e):0},keyCode:function(e){return e.type==="keydown"||e.type==="keyup"?e.keyCode:0},which:function(e){return e.type==="keypress"?Mr(e):e.type==="keydown"||e.type==="keyup"?e.keyCode:0}}),Mf=Ne(Lf),Rf=Y({},dl,{pointerId:0,width:0,height:0,pressure:0,tangentialPressure:0,tiltX:0,tiltY:0,twist:0,pointerType:0,isPrimary:0}),uu=Ne(Rf),Of=Y({},sr,{touches:0,targetTouches:0,changedTouches:0,altKey:0,metaKey:0,ctrlKey:0,shiftKey:0,getModifierState:di}),Df=Ne(Of),If=Y({},wn,{propertyName:0,elapsedTime:0,pseudoElement:0}),Ff=Ne(If),Uf=Y({},dl,{deltaX:function(e){return"deltaX"in e?e.deltaX:"wheelDeltaX"in e?-e.wheelDeltaX:0},deltaY:function(e){return"deltaY"in e?e.deltaY:"wheelDeltaY"in e?-e.wheelDeltaY:"wheelDelta"in e?-e.wheelDelta:0},deltaZ:0,deltaMode:0}),$f=Ne(Uf),Af=[9,13,27,32],pi=qe&&"CompositionEvent"in window,In=null;qe&&"documentMode"in document&&(In=document.documentMode);var Vf=qe&&"TextEvent"in window&&!In,Ws=qe&&(!pi||In&&8<In&&11>=In),su=" ",au=!1;function Qs(e,t){switch(e){case"keyup":return Af.indexOf(t.keyCode)!==-1;case"keydown":return t.keyCode!==229;case"keypress":case"mousedown":case"focusout":return!0;default:return!1}}function Ks(e){return e=e.detail,typeof e=="object"&&"data"in e?e.data:null}var Gt=!1;function Bf(e,t){switch(e){case"compositionend":return Ks(t);case"keypress":return t.which!==32?null:(au=!0,su);case"textInput":return e=t.data,e===su&&au?null:e;default:return null}}function Hf(e,t){if(Gt)return e==="compositionend"||!pi&&Qs(e,t)?(e=Hs(),Lr=ci=dt=null,Gt=!1,e):null;switch(e){case"paste":return null;case"keypress":if(!(t.ctrlKey||t.altKey||t.metaKey)||t.ctrlKey&&t.altKey){if(t.char&&1<t.char.length)return t.char;if(t.which)return String.fromCharCode(t.which)}return null;case"compositionend":return Ws&&t.locale!=="ko"?null:t.data;default:return null}}var Wf={color:!0,date:!0,datetime:!0,"datetime-local":!0,email:!0,month:!0,number:!0,password:!0,range:!0,search:!0,tel:!0,text:!0,time:!0,url:!0,week:!0};function cu(e){var t=e&&e.nodeName&&e.nodeName.toLowerCase();return t==="input"?!!Wf[e.type]:t==="textarea"}function Ys(e,t,n,r){Es(r),t=Yr(t,"onChange"),0<t.length&&(n=new fi("onChange","change",null,n,r),e.push({event:n,listeners:t}))}var Fn=null,Xn=null;function Qf(e){la(e,0)}function pl(e){var t=Jt(e);if(ys(t))return e}function Kf(e,t){if(e==="change")return t}var Gs=!1;if(qe){var Ul;if(qe){var $l="oninput"in document;if(!$l){var fu=document.createElement("div");fu.setAttribute("oninput","return;"),$l=typeof fu.oninput=="function"}Ul=$l}else Ul=!1;Gs=Ul&&(!document.documentMode||9<document.documentMode)}function du(){Fn&&(Fn.detachEvent("onpropertychange",Xs),Xn=Fn=null)}function Xs(e){if(e.propertyName==="value"&&pl(Xn)){var t=[];Ys(t,Xn,e,oi(e)),js(Qf,t)}}function Yf(e,t,n){e==="focusin"?(du(),Fn=t,Xn=n,Fn.attachEvent("onpropertychange",Xs)):e==="focusout"&&du()}function Gf(e){if(e==="selectionchange"||e==="keyup"||e==="keydown")return pl(Xn)}function Xf(e,t){if(e==="click")return pl(t)}function Zf(e,t){if(e==="input"||e==="change")return pl(t)}function Jf(e,t){return e===t&&(e!==0||1/e===1/t)||e!==e&&t!==t}var $e=typeof Object.is=="function"?Object.is:Jf;function Zn(e,t){if($e(e,t))return!0;if(typeof e!="object"||e===null||typeof t!="object"||t===null)return!1;var n=Object.keys(e),r=Object.keys(t);if(n.length!==r.length)return!1;for(r=0;r<n.length;r++){var l=n[r];if(!no.call(t,l)||!$e(e[l],t[l]))return!1}return!0}function pu(e){for(;e&&e.firstChild;)e=e.firstChild;return e}function hu(e,t){var n=pu(e);e=0;for(var r;n;){if(n.nodeType===3){if(r=e+n.textContent.length,e<=t&&r>=t)return{node:n,offset:t-e};e=r}e:{for(;n;){if(n.nextSibling){n=n.nextSibling;break e}n=n.parentNode}n=void 0}n=pu(n)}}function Zs(e,t){return e&&t?e===t?!0:e&&e.nodeType===3?!1:t&&t.nodeType===3?Zs(e,t.parentNode):"contains"in e?e.contains(t):e.compareDocumentPosition?!!(e.compareDocumentPosition(t)&16):!1:!1}function Js(){for(var e=window,t=Ar();t instanceof e.HTMLIFrameElement;){try{var n=typeof t.contentWindow.location.href=="string"}catch{n=!1}if(n)e=t.contentWindow;else break;t=Ar(e.document)}return t}function hi(e){var t=e&&e.nodeName&&e.nodeName.toLowerCase();return t&&(t==="input"&&(e.type==="text"||e.type==="search"||e.type==="tel"||e.type==="url"||e.type==="password")||t==="textarea"||e.contentEditable==="true")}function qf(e){var t=Js(),n=e.focusedElem,r=e.selectionRange;if(t!==n&&n&&n.ownerDocument&&Zs(n.ownerDocument.documentElement,n)){if(r!==null&&hi(n)){if(t=r.start,e=r.end,e===void 0&&(e=t),"selectionStart"in n)n.selectionStart=t,n.selectionEnd=Math.min(e,n.value.length);else if(e=(t=n.ownerDocument||document)&&t.defaultView||window,e.getSelection){e=e.getSelection();var l=n.textContent.length,o=Math.min(r.start,l);r=r.end===void 0?o:Math.min(r.end,l),!e.extend&&o>r&&(l=r,r=o,o=l),l=hu(n,o);var i=hu(n,r);l&&i&&(e.rangeCount!==1||e.anchorNode!==l.node||e.anchorOffset!==l.offset||e.focusNode!==i.node||e.focusOffset!==i.offset)&&(t=t.createRange(),t.setStart(l.node,l.offset),e.removeAllRanges(),o>r?(e.addRange(t),e.extend(i.node,i.offset)):(t.setEnd(i.node,i.offset),e.addRange(t)))}}for(t=[],e=n;e=e.parentNode;)e.nodeType===1&&t.push({element:e,left:e.scrollLeft,top:e.scrollTop});for(typeof n.focus=="function"&&n.focus(),n=0;n<t.length;n++)e=t[n],e.element.scrollLeft=e.left,e.element.scrollTop=e.top}}var bf=qe&&"documentMode"in document&&11>=document.documentMode,Xt=null,ko=null,Un=null,Co=!1;function mu(e,t,n){var r=n.window===n?n.document:n.nodeType===9?n:n.ownerDocument;Co||Xt==null||Xt!==Ar(r)||(r=Xt,"selectionStart"in r&&hi(r)?r={start:r.selectionStart,end:r.selectionEnd}:(r=(r.ownerDocument&&r.ownerDocument.defaultView||window).getSelection(),r={anchorNode:r.anchorNode,anchorOffset:r.anchorOffset,focusNode:r.focusNode,focusOffset:r.focusOffset}),Un&&Zn(Un,r)||(Un=r,r=Yr(ko,"onSelect"),0<r.length&&(t=new fi("onSelect","select",null,t,n),e.push({event:t,listeners:r}),t.target=Xt)))}function wr(e,t){var n={};return n[e.toLowerCase()]=t.toLowerCase(),n["Webkit"+e]="webkit"+t,n["Moz"+e]="moz"+t,n}var Zt={animationend:wr("Animation","AnimationEnd"),animationiteration:wr("Animation","AnimationIteration"),animationstart:wr("Animation","AnimationStart"),transitionend:wr("Transition","TransitionEnd")},Al={},qs={};qe&&(qs=document.createElement("div").style,"AnimationEvent"in window||(delete Zt.animationend.animation,delete Zt.animationiteration.animation,delete Zt.animationstart.animation),"TransitionEvent"in window||delete Zt.transitionend.transition);function hl(e){if(Al[e])return Al[e];if(!Zt[e])return e;var t=Zt[e],n;for(n in t)if(t.hasOwnProperty(n)&&n in qs)return Al[e]=t[n];return e}var bs=hl("animationend"),ea=hl("animationiteration"),ta=hl("animationstart"),na=hl("transitionend"),ra=new Map,vu="abort auxClick cancel canPlay canPlayThrough click close contextMenu copy cut drag dragEnd dragEnter dragExit dragLeave dragOver dragStart drop durationChange emptied encrypted ended error gotPointerCapture input invalid keyDown keyPress keyUp load loadedData loadedMetadata loadStart lostPointerCapture mouseDown mouseMove mouseOut mouseOver mouseUp paste pause play playing pointerCancel pointerDown pointerMove pointerOut pointerOver pointerUp progress rateChange reset resize seeked seeking stalled submit suspend timeUpdate touchCancel touchEnd touchStart volumeChange scroll toggle touchMove waiting wheel".split(" ");function Et(e,t){ra.set(e,t),Vt(t,[e])}for(var Vl=0;Vl<vu.length;Vl++){var Bl=vu[Vl],ed=Bl.toLowerCase(),td=Bl[0].toUpperCase()+Bl.slice(1);Et(ed,"on"+td)}Et(bs,"onAnimationEnd");Et(ea,"onAnimationIteration");Et(ta,"onAnimationStart");Et("dblclick","onDoubleClick");Et("focusin","onFocus");Et("focusout","onBlur");Et(na,"onTransitionEnd");fn("onMouseEnter",["mouseout","mouseover"]);fn("onMouseLeave",["mouseout","mouseover"]);fn("onPointerEnter",["pointerout","pointerover"]);fn("onPointerLeave",["pointerout","pointerover"]);Vt("onChange","change click focusin focusout input keydown keyup selectionchange".split(" "));Vt("onSelect","focusout contextmenu dragend focusin keydown keyup mousedown mouseup selectionchange".split(" "));Vt("onBeforeInput",["compositionend","keypress","textInput","paste"]);Vt("onCompositionEnd","compositionend focusout keydown keypress keyup mousedown".split(" "));Vt("onCompositionStart","compositionstart focusout keydown keypress keyup mousedown".split(" "));Vt("onCompositionUpdate","compositionupdate focusout keydown keypress keyup mousedown".split(" "));var Rn="abort canplay canplaythrough durationchange emptied encrypted ended error loadeddata loadedmetadata loadstart pause play playing progress ratechange resize seeked seeking stalled suspend timeupdate volumechange waiting".split(" "),nd=new Set("cancel close invalid load scroll toggle".split(" ").concat(Rn));function yu(e,t,n){var r=e.type||"unknown-event";e.currentTarget=n,bc(r,t,void 0,e),e.currentTarget=null}function la(e,t){t=(t&4)!==0;for(var n=0;n<e.length;n++){var r=e[n],l=r.event;r=r.listeners;e:{var o=void 0;if(t)for(var i=r.length-1;0<=i;i--){var u=r[i],s=u.instance,c=u.currentTarget;if(u=u.listener,s!==o&&l.isPropagationStopped())break e;yu(l,u,c),o=s}else for(i=0;i<r.length;i++){if(u=r[i],s=u.instance,c=u.currentTarget,u=u.listener,s!==o&&l.isPropagationStopped())break e;yu(l,u,c),o=s}}}if(Br)throw e=go,Br=!1,go=null,e}function A(e,t){var n=t[jo];n===void 0&&(n=t[jo]=new Set);var r=e+"__bubble";n.has(r)||(oa(t,e,2,!1),n.add(r))}function Hl(e,t,n){var r=0;t&&(r|=4),oa(n,e,r,t)}var xr="_reactListening"+Math.random().toString(36).slice(2);function Jn(e){if(!e[xr]){e[xr]=!0,ds.forEach(function(n){n!=="selectionchange"&&(nd.has(n)||Hl(n,!1,e),Hl(n,!0,e))});var t=e.nodeType===9?e:e.ownerDocument;t===null||t[xr]||(t[xr]=!0,Hl("selectionchange",!1,t))}}function oa(e,t,n,r){switch(Bs(t)){case 1:var l=vf;break;case 4:l=yf;break;default:l=ai}n=l.bind(null,t,n,e),l=void 0,!yo||t!=="touchstart"&&t!=="touchmove"&&t!=="wheel"||(l=!0),r?l!==void 0?e.addEventListener(t,n,{capture:!0,passive:l}):e.addEventListener(t,n,!0):l!==void 0?e.addEventListener(t,n,{passive:l}):e.addEventListener(t,n,!1)}function Wl(e,t,n,r,l){var o=r;if(!(t&1)&&!(t&2)&&r!==null)e:for(;;){if(r===null)return;var i=r.tag;if(i===3||i===4){var u=r.stateNode.containerInfo;if(u===l||u.nodeType===8&&u.parentNode===l)break;if(i===4)for(i=r.return;i!==null;){var s=i.tag;if((s===3||s===4)&&(s=i.stateNode.containerInfo,s===l||s.nodeType===8&&s.parentNode===l))return;i=i.return}for(;u!==null;){if(i=Lt(u),i===null)return;if(s=i.tag,s===5||s===6){r=o=i;continue e}u=u.parentNode}}r=r.return}js(function(){var c=o,y=oi(n),v=[];e:{var h=ra.get(e);if(h!==void 0){var x=fi,S=e;switch(e){case"keypress":if(Mr(n)===0)break e;case"keydown":case"keyup":x=Mf;break;case"focusin":S="focus",x=Fl;break;case"focusout":S="blur",x=Fl;break;case"beforeblur":case"afterblur":x=Fl;break;case"click":if(n.button===2)break e;case"auxclick":case"dblclick":case"mousedown":case"mousemove":case"mouseup":case"mouseout":case"mouseover":case"contextmenu":x=ou;break;case"drag":case"dragend":case"dragenter":case"dragexit":case"dragleave":case"dragover":case"dragstart":case"drop":x=xf;break;case"touchcancel":case"touchend":case"touchmove":case"touchstart":x=Df;break;case bs:case ea:case ta:x=Cf;break;case na:x=Ff;break;case"scroll":x=gf;break;case"wheel":x=$f;break;case"copy":case"cut":case"paste":x=Nf;break;case"gotpointercapture":case"lostpointercapture":case"pointercancel":case"pointerdown":case"pointermove":case"pointerout":case"pointerover":case"pointerup":x=uu}var k=(t&4)!==0,I=!k&&e==="scroll",f=k?h!==null?h+"Capture":null:h;k=[];for(var a=c,d;a!==null;){d=a;var g=d.stateNode;if(d.tag===5&&g!==null&&(d=g,f!==null&&(g=Qn(a,f),g!=null&&k.push(qn(a,g,d)))),I)break;a=a.return}0<k.length&&(h=new x(h,S,null,n,y),v.push({event:h,listeners:k}))}}if(!(t&7)){e:{if(h=e==="mouseover"||e==="pointerover",x=e==="mouseout"||e==="pointerout",h&&n!==mo&&(S=n.relatedTarget||n.fromElement)&&(Lt(S)||S[be]))break e;if((x||h)&&(h=y.window===y?y:(h=y.ownerDocument)?h.defaultView||h.parentWindow:window,x?(S=n.relatedTarget||n.toElement,x=c,S=S?Lt(S):null,S!==null&&(I=Bt(S),S!==I||S.tag!==5&&S.tag!==6)&&(S=null)):(x=null,S=c),x!==S)){if(k=ou,g="onMouseLeave",f="onMouseEnter",a="mouse",(e==="pointerout"||e==="pointerover")&&(k=uu,g="onPointerLeave",f="onPointerEnter",a="pointer"),I=x==null?h:Jt(x),d=S==null?h:Jt(S),h=new k(g,a+"leave",x,n,y),h.target=I,h.relatedTarget=d,g=null,Lt(y)===c&&(k=new k(f,a+"enter",S,n,y),k.target=d,k.relatedTarget=I,g=k),I=g,x&&S)t:{for(k=x,f=S,a=0,d=k;d;d=Qt(d))a++;for(d=0,g=f;g;g=Qt(g))d++;for(;0<a-d;)k=Qt(k),a--;for(;0<d-a;)f=Qt(f),d--;for(;a--;){if(k===f||f!==null&&k===f.alternate)break t;k=Qt(k),f=Qt(f)}k=null}else k=null;x!==null&&gu(v,h,x,k,!1),S!==null&&I!==null&&gu(v,I,S,k,!0)}}e:{if(h=c?Jt(c):window,x=h.nodeName&&h.nodeName.toLowerCase(),x==="select"||x==="input"&&h.type==="file")var C=Kf;else if(cu(h))if(Gs)C=Zf;else{C=Gf;var _=Yf}else(x=h.nodeName)&&x.toLowerCase()==="input"&&(h.type==="checkbox"||h.type==="radio")&&(C=Xf);if(C&&(C=C(e,c))){Ys(v,C,n,y);break e}_&&_(e,h,c),e==="focusout"&&(_=h._wrapperState)&&_.controlled&&h.type==="number"&&ao(h,"number",h.value)}switch(_=c?Jt(c):window,e){case"focusin":(cu(_)||_.contentEditable==="true")&&(Xt=_,ko=c,Un=null);break;case"focusout":Un=ko=Xt=null;break;case"mousedown":Co=!0;break;case"contextmenu":case"mouseup":case"dragend":Co=!1,mu(v,n,y);break;case"selectionchange":if(bf)break;case"keydown":case"keyup":mu(v,n,y)}var P;if(pi)e:{switch(e){case"compositionstart":var z="onCompositionStart";break e;case"compositionend":z="onCompositionEnd";break e;case"compositionupdate":z="onCompositionUpdate";break e}z=void 0}else Gt?Qs(e,n)&&(z="onCompositionEnd"):e==="keydown"&&n.keyCode===229&&(z="onCompositionStart");z&&(Ws&&n.locale!=="ko"&&(Gt||z!=="onCompositionStart"?z==="onCompositionEnd"&&Gt&&(P=Hs()):(dt=y,ci="value"in dt?dt.value:dt.textContent,Gt=!0)),_=Yr(c,z),0<_.length&&(z=new iu(z,e,null,n,y),v.push({event:z,listeners:_}),P?z.data=P:(P=Ks(n),P!==null&&(z.data=P)))),(P=Vf?Bf(e,n):Hf(e,n))&&(c=Yr(c,"onBeforeInput"),0<c.length&&(y=new iu("onBeforeInput","beforeinput",null,n,y),v.push({event:y,listeners:c}),y.data=P))}la(v,t)})}function qn(e,t,n){return{instance:e,listener:t,currentTarget:n}}function Yr(e,t){for(var n=t+"Capture",r=[];e!==null;){var l=e,o=l.stateNode;l.tag===5&&o!==null&&(l=o,o=Qn(e,n),o!=null&&r.unshift(qn(e,o,l)),o=Qn(e,t),o!=null&&r.push(qn(e,o,l))),e=e.return}return r}function Qt(e){if(e===null)return null;do e=e.return;while(e&&e.tag!==5);return e||null}function gu(e,t,n,r,l){for(var o=t._reactName,i=[];n!==null&&n!==r;){var u=n,s=u.alternate,c=u.stateNode;if(s!==null&&s===r)break;u.tag===5&&c!==null&&(u=c,l?(s=Qn(n,o),s!=null&&i.unshift(qn(n,s,u))):l||(s=Qn(n,o),s!=null&&i.push(qn(n,s,u)))),n=n.return}i.length!==0&&e.push({event:t,listeners:i})}var rd=/\r\n?/g,ld=/\u0000|\uFFFD/g;function wu(e){return(typeof e=="string"?e:""+e).replace(rd,`
-`).replace(ld,"")}function Sr(e,t,n){if(t=wu(t),wu(e)!==t&&n)throw Error(w(425))}function Gr(){}var Eo=null,No=null;function _o(e,t){return e==="textarea"||e==="noscript"||typeof t.children=="string"||typeof t.children=="number"||typeof t.dangerouslySetInnerHTML=="object"&&t.dangerouslySetInnerHTML!==null&&t.dangerouslySetInnerHTML.__html!=null}var Po=typeof setTimeout=="function"?setTimeout:void 0,od=typeof clearTimeout=="function"?clearTimeout:void 0,xu=typeof Promise=="function"?Promise:void 0,id=typeof queueMicrotask=="function"?queueMicrotask:typeof xu<"u"?function(e){return xu.resolve(null).then(e).catch(ud)}:Po;function ud(e){setTimeout(function(){throw e})}function Ql(e,t){var n=t,r=0;do{var l=n.nextSibling;if(e.removeChild(n),l&&l.nodeType===8)if(n=l.data,n==="/$"){if(r===0){e.removeChild(l),Gn(t);return}r--}else n!=="$"&&n!=="$?"&&n!=="$!"||r++;n=l}while(n);Gn(t)}function yt(e){for(;e!=null;e=e.nextSibling){var t=e.nodeType;if(t===1||t===3)break;if(t===8){if(t=e.data,t==="$"||t==="$!"||t==="$?")break;if(t==="/$")return null}}return e}function Su(e){e=e.previousSibling;for(var t=0;e;){if(e.nodeType===8){var n=e.data;if(n==="$"||n==="$!"||n==="$?"){if(t===0)return e;t--}else n==="/$"&&t++}e=e.previousSibling}return null}var xn=Math.random().toString(36).slice(2),He="__reactFiber$"+xn,bn="__reactProps$"+xn,be="__reactContainer$"+xn,jo="__reactEvents$"+xn,sd="__reactListeners$"+xn,ad="__reactHandles$"+xn;function Lt(e){var t=e[He];if(t)return t;for(var n=e.parentNode;n;){if(t=n[be]||n[He]){if(n=t.alternate,t.child!==null||n!==null&&n.child!==null)for(e=Su(e);e!==null;){if(n=e[He])return n;e=Su(e)}return t}e=n,n=e.parentNode}return null}function ar(e){return e=e[He]||e[be],!e||e.tag!==5&&e.tag!==6&&e.tag!==13&&e.tag!==3?null:e}function Jt(e){if(e.tag===5||e.tag===6)return e.stateNode;throw Error(w(33))}function ml(e){return e[bn]||null}var zo=[],qt=-1;function Nt(e){return{current:e}}function V(e){0>qt||(e.current=zo[qt],zo[qt]=null,qt--)}function F(e,t){qt++,zo[qt]=e.current,e.current=t}var Ct={},ae=Nt(Ct),ye=Nt(!1),It=Ct;function dn(e,t){var n=e.type.contextTypes;if(!n)return Ct;var r=e.stateNode;if(r&&r.__reactInternalMemoizedUnmaskedChildContext===t)return r.__reactInternalMemoizedMaskedChildContext;var l={},o;for(o in n)l[o]=t[o];return r&&(e=e.stateNode,e.__reactInternalMemoizedUnmaskedChildContext=t,e.__reactInternalMemoizedMaskedChildContext=l),l}function ge(e){return e=e.childContextTypes,e!=null}function Xr(){V(ye),V(ae)}function ku(e,t,n){if(ae.current!==Ct)throw Error(w(168));F(ae,t),F(ye,n)}function ia(e,t,n){var r=e.stateNode;if(t=t.childContextTypes,typeof r.getChildContext!="function")return n;r=r.getChildContext();for(var l in r)if(!(l in t))throw Error(w(108,Kc(e)||"Unknown",l));return Y({},n,r)}function Zr(e){return e=(e=e.stateNode)&&e.__reactInternalMemoizedMergedChildContext||Ct,It=ae.current,F(ae,e),F(ye,ye.current),!0}function Cu(e,t,n){var r=e.stateNode;if(!r)throw Error(w(169));n?(e=ia(e,t,It),r.__reactInternalMemoizedMergedChildContext=e,V(ye),V(ae),F(ae,e)):V(ye),F(ye,n)}var Ge=null,vl=!1,Kl=!1;function ua(e){Ge===null?Ge=[e]:Ge.push(e)}function cd(e){vl=!0,ua(e)}function _t(){if(!Kl&&Ge!==null){Kl=!0;var e=0,t=D;try{var n=Ge;for(D=1;e<n.length;e++){var r=n[e];do r=r(!0);while(r!==null)}Ge=null,vl=!1}catch(l){throw Ge!==null&&(Ge=Ge.slice(e+1)),Ms(ii,_t),l}finally{D=t,Kl=!1}}return null}var bt=[],en=0,Jr=null,qr=0,Pe=[],je=0,Ft=null,Xe=1,Ze="";function zt(e,t){bt[en++]=qr,bt[en++]=Jr,Jr=e,qr=t}function sa(e,t,n){Pe[je++]=Xe,Pe[je++]=Ze,Pe[je++]=Ft,Ft=e;var r=Xe;e=Ze;var l=32-Fe(r)-1;r&=~(1<<l),n+=1;var o=32-Fe(t)+l;if(30<o){var i=l-l%5;o=(r&(1<<i)-1).toString(32),r>>=i,l-=i,Xe=1<<32-Fe(t)+l|n<<l|r,Ze=o+e}else Xe=1<<o|n<<l|r,Ze=e}function mi(e){e.return!==null&&(zt(e,1),sa(e,1,0))}function vi(e){for(;e===Jr;)Jr=bt[--en],bt[en]=null,qr=bt[--en],bt[en]=null;for(;e===Ft;)Ft=Pe[--je],Pe[je]=null,Ze=Pe[--je],Pe[je]=null,Xe=Pe[--je],Pe[je]=null}var ke=null,Se=null,H=!1,Ie=null;function aa(e,t){var n=ze(5,null,null,0);n.elementType="DELETED",n.stateNode=t,n.return=e,t=e.deletions,t===null?(e.deletions=[n],e.flags|=16):t.push(n)}function Eu(e,t){switch(e.tag){case 5:var n=e.type;return t=t.nodeType!==1||n.toLowerCase()!==t.nodeName.toLowerCase()?null:t,t!==null?(e.stateNode=t,ke=e,Se=yt(t.firstChild),!0):!1;case 6:return t=e.pendingProps===""||t.nodeType!==3?null:t,t!==null?(e.stateNode=t,ke=e,Se=null,!0):!1;case 13:return t=t.nodeType!==8?null:t,t!==null?(n=Ft!==null?{id:Xe,overflow:Ze}:null,e.memoizedState={dehydrated:t,treeContext:n,retryLane:1073741824},n=ze(18,null,null,0),n.stateNode=t,n.return=e,e.child=n,ke=e,Se=null,!0):!1;default:return!1}}function To(e){return(e.mode&1)!==0&&(e.flags&128)===0}function Lo(e){if(H){var t=Se;if(t){var n=t;if(!Eu(e,t)){if(To(e))throw Error(w(418));t=yt(n.nextSibling);var r=ke;t&&Eu(e,t)?aa(r,n):(e.flags=e.flags&-4097|2,H=!1,ke=e)}}else{if(To(e))throw Error(w(418));e.flags=e.flags&-4097|2,H=!1,ke=e}}}function Nu(e){for(e=e.return;e!==null&&e.tag!==5&&e.tag!==3&&e.tag!==13;)e=e.return;ke=e}function kr(e){if(e!==ke)return!1;if(!H)return Nu(e),H=!0,!1;var t;if((t=e.tag!==3)&&!(t=e.tag!==5)&&(t=e.type,t=t!=="head"&&t!=="body"&&!_o(e.type,e.memoizedProps)),t&&(t=Se)){if(To(e))throw ca(),Error(w(418));for(;t;)aa(e,t),t=yt(t.nextSibling)}if(Nu(e),e.tag===13){if(e=e.memoizedState,e=e!==null?e.dehydrated:null,!e)throw Error(w(317));e:{for(e=e.nextSibling,t=0;e;){if(e.nodeType===8){var n=e.data;if(n==="/$"){if(t===0){Se=yt(e.nextSibling);break e}t--}else n!=="$"&&n!=="$!"&&n!=="$?"||t++}e=e.nextSibling}Se=null}}else Se=ke?yt(e.stateNode.nextSibling):null;return!0}function ca(){for(var e=Se;e;)e=yt(e.nextSibling)}function pn(){Se=ke=null,H=!1}function yi(e){Ie===null?Ie=[e]:Ie.push(e)}var fd=nt.ReactCurrentBatchConfig;function Pn(e,t,n){if(e=n.ref,e!==null&&typeof e!="function"&&typeof e!="object"){if(n._owner){if(n=n._owner,n){if(n.tag!==1)throw Error(w(309));var r=n.stateNode}if(!r)throw Error(w(147,e));var l=r,o=""+e;return t!==null&&t.ref!==null&&typeof t.ref=="function"&&t.ref._stringRef===o?t.ref:(t=function(i){var u=l.refs;i===null?delete u[o]:u[o]=i},t._stringRef=o,t)}if(typeof e!="string")throw Error(w(284));if(!n._owner)throw Error(w(290,e))}return e}function Cr(e,t){throw e=Object.prototype.toString.call(t),Error(w(31,e==="[object Object]"?"object with keys {"+Object.keys(t).join(", ")+"}":e))}function _u(e){var t=e._init;return t(e._payload)}function fa(e){function t(f,a){if(e){var d=f.deletions;d===null?(f.deletions=[a],f.flags|=16):d.push(a)}}function n(f,a){if(!e)return null;for(;a!==null;)t(f,a),a=a.sibling;return null}function r(f,a){for(f=new Map;a!==null;)a.key!==null?f.set(a.key,a):f.set(a.index,a),a=a.sibling;return f}function l(f,a){return f=St(f,a),f.index=0,f.sibling=null,f}function o(f,a,d){return f.index=d,e?(d=f.alternate,d!==null?(d=d.index,d<a?(f.flags|=2,a):d):(f.flags|=2,a)):(f.flags|=1048576,a)}function i(f){return e&&f.alternate===null&&(f.flags|=2),f}function u(f,a,d,g){return a===null||a.tag!==6?(a=bl(d,f.mode,g),a.return=f,a):(a=l(a,d),a.return=f,a)}function s(f,a,d,g){var C=d.type;return C===Yt?y(f,a,d.props.children,g,d.key):a!==null&&(a.elementType===C||typeof C=="object"&&C!==null&&C.$$typeof===ot&&_u(C)===a.type)?(g=l(a,d.props),g.ref=Pn(f,a,d),g.return=f,g):(g=$r(d.type,d.key,d.props,null,f.mode,g),g.ref=Pn(f,a,d),g.return=f,g)}function c(f,a,d,g){return a===null||a.tag!==4||a.stateNode.containerInfo!==d.containerInfo||a.stateNode.implementation!==d.implementation?(a=eo(d,f.mode,g),a.return=f,a):(a=l(a,d.children||[]),a.return=f,a)}function y(f,a,d,g,C){return a===null||a.tag!==7?(a=Dt(d,f.mode,g,C),a.return=f,a):(a=l(a,d),a.return=f,a)}function v(f,a,d){if(typeof a=="string"&&a!==""||typeof a=="number")return a=bl(""+a,f.mode,d),a.return=f,a;if(typeof a=="object"&&a!==null){switch(a.$$typeof){case dr:return d=$r(a.type,a.key,a.props,null,f.mode,d),d.ref=Pn(f,null,a),d.return=f,d;case Kt:return a=eo(a,f.mode,d),a.return=f,a;case ot:var g=a._init;return v(f,g(a._payload),d)}if(Ln(a)||kn(a))return a=Dt(a,f.mode,d,null),a.return=f,a;Cr(f,a)}return null}function h(f,a,d,g){var C=a!==null?a.key:null;if(typeof d=="string"&&d!==""||typeof d=="number")return C!==null?null:u(f,a,""+d,g);if(typeof d=="object"&&d!==null){switch(d.$$typeof){case dr:return d.key===C?s(f,a,d,g):null;case Kt:return d.key===C?c(f,a,d,g):null;case ot:return C=d._init,h(f,a,C(d._payload),g)}if(Ln(d)||kn(d))return C!==null?null:y(f,a,d,g,null);Cr(f,d)}return null}function x(f,a,d,g,C){if(typeof g=="string"&&g!==""||typeof g=="number")return f=f.get(d)||null,u(a,f,""+g,C);if(typeof g=="object"&&g!==null){switch(g.$$typeof){case dr:return f=f.get(g.key===null?d:g.key)||null,s(a,f,g,C);case Kt:return f=f.get(g.key===null?d:g.key)||null,c(a,f,g,C);case ot:var _=g._init;return x(f,a,d,_(g._payload),C)}if(Ln(g)||kn(g))return f=f.get(d)||null,y(a,f,g,C,null);Cr(a,g)}return null}function S(f,a,d,g){for(var C=null,_=null,P=a,z=a=0,U=null;P!==null&&z<d.length;z++){P.index>z?(U=P,P=null):U=P.sibling;var L=h(f,P,d[z],g);if(L===null){P===null&&(P=U);break}e&&P&&L.alternate===null&&t(f,P),a=o(L,a,z),_===null?C=L:_.sibling=L,_=L,P=U}if(z===d.length)return n(f,P),H&&zt(f,z),C;if(P===null){for(;z<d.length;z++)P=v(f,d[z],g),P!==null&&(a=o(P,a,z),_===null?C=P:_.sibling=P,_=P);return H&&zt(f,z),C}for(P=r(f,P);z<d.length;z++)U=x(P,f,z,d[z],g),U!==null&&(e&&U.alternate!==null&&P.delete(U.key===null?z:U.key),a=o(U,a,z),_===null?C=U:_.sibling=U,_=U);return e&&P.forEach(function(ne){return t(f,ne)}),H&&zt(f,z),C}function k(f,a,d,g){var C=kn(d);if(typeof C!="function")throw Error(w(150));if(d=C.call(d),d==null)throw Error(w(151));for(var _=C=null,P=a,z=a=0,U=null,L=d.next();P!==null&&!L.done;z++,L=d.next()){P.index>z?(U=P,P=null):U=P.sibling;var ne=h(f,P,L.value,g);if(ne===null){P===null&&(P=U);break}e&&P&&ne.alternate===null&&t(f,P),a=o(ne,a,z),_===null?C=ne:_.sibling=ne,_=ne,P=U}if(L.done)return n(f,P),H&&zt(f,z),C;if(P===null){for(;!L.done;z++,L=d.next())L=v(f,L.value,g),L!==null&&(a=o(L,a,z),_===null?C=L:_.sibling=L,_=L);return H&&zt(f,z),C}for(P=r(f,P);!L.done;z++,L=d.next())L=x(P,f,z,L.value,g),L!==null&&(e&&L.alternate!==null&&P.delete(L.key===null?z:L.key),a=o(L,a,z),_===null?C=L:_.sibling=L,_=L);return e&&P.forEach(function(Ae){return t(f,Ae)}),H&&zt(f,z),C}function I(f,a,d,g){if(typeof d=="object"&&d!==null&&d.type===Yt&&d.key===null&&(d=d.props.children),typeof d=="object"&&d!==null){switch(d.$$typeof){case dr:e:{for(var C=d.key,_=a;_!==null;){if(_.key===C){if(C=d.type,C===Yt){if(_.tag===7){n(f,_.sibling),a=l(_,d.props.children),a.return=f,f=a;break e}}else if(_.elementType===C||typeof C=="object"&&C!==null&&C.$$typeof===ot&&_u(C)===_.type){n(f,_.sibling),a=l(_,d.props),a.ref=Pn(f,_,d),a.return=f,f=a;break e}n(f,_);break}else t(f,_);_=_.sibling}d.type===Yt?(a=Dt(d.props.children,f.mode,g,d.key),a.return=f,f=a):(g=$r(d.type,d.key,d.props,null,f.mode,g),g.ref=Pn(f,a,d),g.return=f,f=g)}return i(f);case Kt:e:{for(_=d.key;a!==null;){if(a.key===_)if(a.tag===4&&a.stateNode.containerInfo===d.containerInfo&&a.stateNode.implementation===d.implementation){n(f,a.sibling),a=l(a,d.children||[]),a.return=f,f=a;break e}else{n(f,a);break}else t(f,a);a=a.sibling}a=eo(d,f.mode,g),a.return=f,f=a}return i(f);case ot:return _=d._init,I(f,a,_(d._payload),g)}if(Ln(d))return S(f,a,d,g);if(kn(d))return k(f,a,d,g);Cr(f,d)}return typeof d=="string"&&d!==""||typeof d=="number"?(d=""+d,a!==null&&a.tag===6?(n(f,a.sibling),a=l(a,d),a.return=f,f=a):(n(f,a),a=bl(d,f.mode,g),a.return=f,f=a),i(f)):n(f,a)}return I}var hn=fa(!0),da=fa(!1),br=Nt(null),el=null,tn=null,gi=null;function wi(){gi=tn=el=null}function xi(e){var t=br.current;V(br),e._currentValue=t}function Mo(e,t,n){for(;e!==null;){var r=e.alternate;if((e.childLanes&t)!==t?(e.childLanes|=t,r!==null&&(r.childLanes|=t)):r!==null&&(r.childLanes&t)!==t&&(r.childLanes|=t),e===n)break;e=e.return}}function an(e,t){el=e,gi=tn=null,e=e.dependencies,e!==null&&e.firstContext!==null&&(e.lanes&t&&(ve=!0),e.firstContext=null)}function Le(e){var t=e._currentValue;if(gi!==e)if(e={context:e,memoizedValue:t,next:null},tn===null){if(el===null)throw Error(w(308));tn=e,el.dependencies={lanes:0,firstContext:e}}else tn=tn.next=e;return t}var Mt=null;function Si(e){Mt===null?Mt=[e]:Mt.push(e)}function pa(e,t,n,r){var l=t.interleaved;return l===null?(n.next=n,Si(t)):(n.next=l.next,l.next=n),t.interleaved=n,et(e,r)}function et(e,t){e.lanes|=t;var n=e.alternate;for(n!==null&&(n.lanes|=t),n=e,e=e.return;e!==null;)e.childLanes|=t,n=e.alternate,n!==null&&(n.childLanes|=t),n=e,e=e.return;return n.tag===3?n.stateNode:null}var it=!1;function ki(e){e.updateQueue={baseState:e.memoizedState,firstBaseUpdate:null,lastBaseUpdate:null,shared:{pending:null,interleaved:null,lanes:0},effects:null}}function ha(e,t){e=e.updateQueue,t.updateQueue===e&&(t.updateQueue={baseState:e.baseState,firstBaseUpdate:e.firstBaseUpdate,lastBaseUpdate:e.lastBaseUpdate,shared:e.shared,effects:e.effects})}function Je(e,t){return{eventTime:e,lane:t,tag:0,payload:null,callback:null,next:null}}function gt(e,t,n){var r=e.updateQueue;if(r===null)return null;if(r=r.shared,O&2){var l=r.pending;return l===null?t.next=t:(t.next=l.next,l.next=t),r.pending=t,et(e,n)}return l=r.interleaved,l===null?(t.next=t,Si(r)):(t.next=l.next,l.next=t),r.interleaved=t,et(e,n)}function Rr(e,t,n){if(t=t.updateQueue,t!==null&&(t=t.shared,(n&4194240)!==0)){var r=t.lanes;r&=e.pendingLanes,n|=r,t.lanes=n,ui(e,n)}}function Pu(e,t){var n=e.updateQueue,r=e.alternate;if(r!==null&&(r=r.updateQueue,n===r)){var l=null,o=null;if(n=n.firstBaseUpdate,n!==null){do{var i={eventTime:n.eventTime,lane:n.lane,tag:n.tag,payload:n.payload,callback:n.callback,next:null};o===null?l=o=i:o=o.next=i,n=n.next}while(n!==null);o===null?l=o=t:o=o.next=t}else l=o=t;n={baseState:r.baseState,firstBaseUpdate:l,lastBaseUpdate:o,shared:r.shared,effects:r.effects},e.updateQueue=n;return}e=n.lastBaseUpdate,e===null?n.firstBaseUpdate=t:e.next=t,n.lastBaseUpdate=t}function tl(e,t,n,r){var l=e.updateQueue;it=!1;var o=l.firstBaseUpdate,i=l.lastBaseUpdate,u=l.shared.pending;if(u!==null){l.shared.pending=null;var s=u,c=s.next;s.next=null,i===null?o=c:i.next=c,i=s;var y=e.alternate;y!==null&&(y=y.updateQueue,u=y.lastBaseUpdate,u!==i&&(u===null?y.firstBaseUpdate=c:u.next=c,y.lastBaseUpdate=s))}if(o!==null){var v=l.baseState;i=0,y=c=s=null,u=o;do{var h=u.lane,x=u.eventTime;if((r&h)===h){y!==null&&(y=y.next={eventTime:x,lane:0,tag:u.tag,payload:u.payload,callback:u.callback,next:null});e:{var S=e,k=u;switch(h=t,x=n,k.tag){case 1:if(S=k.payload,typeof S=="function"){v=S.call(x,v,h);break e}v=S;break e;case 3:S.flags=S.flags&-65537|128;case 0:if(S=k.payload,h=typeof S=="function"?S.call(x,v,h):S,h==null)break e;v=Y({},v,h);break e;case 2:it=!0}}u.callback!==null&&u.lane!==0&&(e.flags|=64,h=l.effects,h===null?l.effects=[u]:h.push(u))}else x={eventTime:x,lane:h,tag:u.tag,payload:u.payload,callback:u.callback,next:null},y===null?(c=y=x,s=v):y=y.next=x,i|=h;if(u=u.next,u===null){if(u=l.shared.pending,u===null)break;h=u,u=h.next,h.next=null,l.lastBaseUpdate=h,l.shared.pending=null}}while(!0);if(y===null&&(s=v),l.baseState=s,l.firstBaseUpdate=c,l.lastBaseUpdate=y,t=l.shared.interleaved,t!==null){l=t;do i|=l.lane,l=l.next;while(l!==t)}else o===null&&(l.shared.lanes=0);$t|=i,e.lanes=i,e.memoizedState=v}}function ju(e,t,n){if(e=t.effects,t.effects=null,e!==null)for(t=0;t<e.length;t++){var r=e[t],l=r.callback;if(l!==null){if(r.callback=null,r=n,typeof l!="function")throw Error(w(191,l));l.call(r)}}}var cr={},Qe=Nt(cr),er=Nt(cr),tr=Nt(cr);function Rt(e){if(e===cr)throw Error(w(174));return e}function Ci(e,t){switch(F(tr,t),F(er,e),F(Qe,cr),e=t.nodeType,e){case 9:case 11:t=(t=t.documentElement)?t.namespaceURI:fo(null,"");break;default:e=e===8?t.parentNode:t,t=e.namespaceURI||null,e=e.tagName,t=fo(t,e)}V(Qe),F(Qe,t)}function mn(){V(Qe),V(er),V(tr)}function ma(e){Rt(tr.current);var t=Rt(Qe.current),n=fo(t,e.type);t!==n&&(F(er,e),F(Qe,n))}function Ei(e){er.current===e&&(V(Qe),V(er))}var Q=Nt(0);function nl(e){for(var t=e;t!==null;){if(t.tag===13){var n=t.memoizedState;if(n!==null&&(n=n.dehydrated,n===null||n.data==="$?"||n.data==="$!"))return t}else if(t.tag===19&&t.memoizedProps.revealOrder!==void 0){if(t.flags&128)return t}else if(t.child!==null){t.child.return=t,t=t.child;continue}if(t===e)break;for(;t.sibling===null;){if(t.return===null||t.return===e)return null;t=t.return}t.sibling.return=t.return,t=t.sibling}return null}var Yl=[];function Ni(){for(var e=0;e<Yl.length;e++)Yl[e]._workInProgressVersionPrimary=null;Yl.length=0}var Or=nt.ReactCurrentDispatcher,Gl=nt.ReactCurrentBatchConfig,Ut=0,K=null,q=null,ee=null,rl=!1,$n=!1,nr=0,dd=0;function ie(){throw Error(w(321))}function _i(e,t){if(t===null)return!1;for(var n=0;n<t.length&&n<e.length;n++)if(!$e(e[n],t[n]))return!1;return!0}function Pi(e,t,n,r,l,o){if(Ut=o,K=t,t.memoizedState=null,t.updateQueue=null,t.lanes=0,Or.current=e===null||e.memoizedState===null?vd:yd,e=n(r,l),$n){o=0;do{if($n=!1,nr=0,25<=o)throw Error(w(301));o+=1,ee=q=null,t.updateQueue=null,Or.current=gd,e=n(r,l)}while($n)}if(Or.current=ll,t=q!==null&&q.next!==null,Ut=0,ee=q=K=null,rl=!1,t)throw Error(w(300));return e}function ji(){var e=nr!==0;return nr=0,e}function Be(){var e={memoizedState:null,baseState:null,baseQueue:null,queue:null,next:null};return ee===null?K.memoizedState=ee=e:ee=ee.next=e,ee}function Me(){if(q===null){var e=K.alternate;e=e!==null?e.memoizedState:null}else e=q.next;var t=ee===null?K.memoizedState:ee.next;if(t!==null)ee=t,q=e;else{if(e===null)throw Error(w(310));q=e,e={memoizedState:q.memoizedState,baseState:q.baseState,baseQueue:q.baseQueue,queue:q.queue,next:null},ee===null?K.memoizedState=ee=e:ee=ee.next=e}return ee}function rr(e,t){return typeof t=="function"?t(e):t}function Xl(e){var t=Me(),n=t.queue;if(n===null)throw Error(w(311));n.lastRenderedReducer=e;var r=q,l=r.baseQueue,o=n.pending;if(o!==null){if(l!==null){var i=l.next;l.next=o.next,o.next=i}r.baseQueue=l=o,n.pending=null}if(l!==null){o=l.next,r=r.baseState;var u=i=null,s=null,c=o;do{var y=c.lane;if((Ut&y)===y)s!==null&&(s=s.next={lane:0,action:c.action,hasEagerState:c.hasEagerState,eagerState:c.eagerState,next:null}),r=c.hasEagerState?c.eagerState:e(r,c.action);else{var v={lane:y,action:c.action,hasEagerState:c.hasEagerState,eagerState:c.eagerState,next:null};s===null?(u=s=v,i=r):s=s.next=v,K.lanes|=y,$t|=y}c=c.next}while(c!==null&&c!==o);s===null?i=r:s.next=u,$e(r,t.memoizedState)||(ve=!0),t.memoizedState=r,t.baseState=i,t.baseQueue=s,n.lastRenderedState=r}if(e=n.interleaved,e!==null){l=e;do o=l.lane,K.lanes|=o,$t|=o,l=l.next;while(l!==e)}else l===null&&(n.lanes=0);return[t.memoizedState,n.dispatch]}function Zl(e){var t=Me(),n=t.queue;if(n===null)throw Error(w(311));n.lastRenderedReducer=e;var r=n.dispatch,l=n.pending,o=t.memoizedState;if(l!==null){n.pending=null;var i=l=l.next;do o=e(o,i.action),i=i.next;while(i!==l);$e(o,t.memoizedState)||(ve=!0),t.memoizedState=o,t.baseQueue===null&&(t.baseState=o),n.lastRenderedState=o}return[o,r]}function va(){}function ya(e,t){var n=K,r=Me(),l=t(),o=!$e(r.memoizedState,l);if(o&&(r.memoizedState=l,ve=!0),r=r.queue,zi(xa.bind(null,n,r,e),[e]),r.getSnapshot!==t||o||ee!==null&&ee.memoizedState.tag&1){if(n.flags|=2048,lr(9,wa.bind(null,n,r,l,t),void 0,null),te===null)throw Error(w(349));Ut&30||ga(n,t,l)}return l}function ga(e,t,n){e.flags|=16384,e={getSnapshot:t,value:n},t=K.updateQueue,t===null?(t={lastEffect:null,stores:null},K.updateQueue=t,t.stores=[e]):(n=t.stores,n===null?t.stores=[e]:n.push(e))}function wa(e,t,n,r){t.value=n,t.getSnapshot=r,Sa(t)&&ka(e)}function xa(e,t,n){return n(function(){Sa(t)&&ka(e)})}function Sa(e){var t=e.getSnapshot;e=e.value;try{var n=t();return!$e(e,n)}catch{return!0}}function ka(e){var t=et(e,1);t!==null&&Ue(t,e,1,-1)}function zu(e){var t=Be();return typeof e=="function"&&(e=e()),t.memoizedState=t.baseState=e,e={pending:null,interleaved:null,lanes:0,dispatch:null,lastRenderedReducer:rr,lastRenderedState:e},t.queue=e,e=e.dispatch=md.bind(null,K,e),[t.memoizedState,e]}function lr(e,t,n,r){return e={tag:e,create:t,destroy:n,deps:r,next:null},t=K.updateQueue,t===null?(t={lastEffect:null,stores:null},K.updateQueue=t,t.lastEffect=e.next=e):(n=t.lastEffect,n===null?t.lastEffect=e.next=e:(r=n.next,n.next=e,e.next=r,t.lastEffect=e)),e}function Ca(){return Me().memoizedState}function Dr(e,t,n,r){var l=Be();K.flags|=e,l.memoizedState=lr(1|t,n,void 0,r===void 0?null:r)}function yl(e,t,n,r){var l=Me();r=r===void 0?null:r;var o=void 0;if(q!==null){var i=q.memoizedState;if(o=i.destroy,r!==null&&_i(r,i.deps)){l.memoizedState=lr(t,n,o,r);return}}K.flags|=e,l.memoizedState=lr(1|t,n,o,r)}function Tu(e,t){return Dr(8390656,8,e,t)}function zi(e,t){return yl(2048,8,e,t)}function Ea(e,t){return yl(4,2,e,t)}function Na(e,t){return yl(4,4,e,t)}function _a(e,t){if(typeof t=="function")return e=e(),t(e),function(){t(null)};if(t!=null)return e=e(),t.current=e,function(){t.current=null}}function Pa(e,t,n){return n=n!=null?n.concat([e]):null,yl(4,4,_a.bind(null,t,e),n)}function Ti(){}function ja(e,t){var n=Me();t=t===void 0?null:t;var r=n.memoizedState;return r!==null&&t!==null&&_i(t,r[1])?r[0]:(n.memoizedState=[e,t],e)}function za(e,t){var n=Me();t=t===void 0?null:t;var r=n.memoizedState;return r!==null&&t!==null&&_i(t,r[1])?r[0]:(e=e(),n.memoizedState=[e,t],e)}function Ta(e,t,n){return Ut&21?($e(n,t)||(n=Ds(),K.lanes|=n,$t|=n,e.baseState=!0),t):(e.baseState&&(e.baseState=!1,ve=!0),e.memoizedState=n)}function pd(e,t){var n=D;D=n!==0&&4>n?n:4,e(!0);var r=Gl.transition;Gl.transition={};try{e(!1),t()}finally{D=n,Gl.transition=r}}function La(){return Me().memoizedState}function hd(e,t,n){var r=xt(e);if(n={lane:r,action:n,hasEagerState:!1,eagerState:null,next:null},Ma(e))Ra(t,n);else if(n=pa(e,t,n,r),n!==null){var l=fe();Ue(n,e,r,l),Oa(n,t,r)}}function md(e,t,n){var r=xt(e),l={lane:r,action:n,hasEagerState:!1,eagerState:null,next:null};if(Ma(e))Ra(t,l);else{var o=e.alternate;if(e.lanes===0&&(o===null||o.lanes===0)&&(o=t.lastRenderedReducer,o!==null))try{var i=t.lastRenderedState,u=o(i,n);if(l.hasEagerState=!0,l.eagerState=u,$e(u,i)){var s=t.interleaved;s===null?(l.next=l,Si(t)):(l.next=s.next,s.next=l),t.interleaved=l;return}}catch{}finally{}n=pa(e,t,l,r),n!==null&&(l=fe(),Ue(n,e,r,l),Oa(n,t,r))}}function Ma(e){var t=e.alternate;return e===K||t!==null&&t===K}function Ra(e,t){$n=rl=!0;var n=e.pending;n===null?t.next=t:(t.next=n.next,n.next=t),e.pending=t}function Oa(e,t,n){if(n&4194240){var r=t.lanes;r&=e.pendingLanes,n|=r,t.lanes=n,ui(e,n)}}var ll={readContext:Le,useCallback:ie,useContext:ie,useEffect:ie,useImperativeHandle:ie,useInsertionEffect:ie,useLayoutEffect:ie,useMemo:ie,useReducer:ie,useRef:ie,useState:ie,useDebugValue:ie,useDeferredValue:ie,useTransition:ie,useMutableSource:ie,useSyncExternalStore:ie,useId:ie,unstable_isNewReconciler:!1},vd={readContext:Le,useCallback:function(e,t){return Be().memoizedState=[e,t===void 0?null:t],e},useContext:Le,useEffect:Tu,useImperativeHandle:function(e,t,n){return n=n!=null?n.concat([e]):null,Dr(4194308,4,_a.bind(null,t,e),n)},useLayoutEffect:function(e,t){return Dr(4194308,4,e,t)},useInsertionEffect:function(e,t){return Dr(4,2,e,t)},useMemo:function(e,t){var n=Be();return t=t===void 0?null:t,e=e(),n.memoizedState=[e,t],e},useReducer:function(e,t,n){var r=Be();return t=n!==void 0?n(t):t,r.memoizedState=r.baseState=t,e={pending:null,interleaved:null,lanes:0,dispatch:null,lastRenderedReducer:e,lastRenderedState:t},r.queue=e,e=e.dispatch=hd.bind(null,K,e),[r.memoizedState,e]},useRef:function(e){var t=Be();return e={current:e},t.memoizedState=e},useState:zu,useDebugValue:Ti,useDeferredValue:function(e){return Be().memoizedState=e},useTransition:function(){var e=zu(!1),t=e[0];return e=pd.bind(null,e[1]),Be().memoizedState=e,[t,e]},useMutableSource:function(){},useSyncExternalStore:function(e,t,n){var r=K,l=Be();if(H){if(n===void 0)throw Error(w(407));n=n()}else{if(n=t(),te===null)throw Error(w(349));Ut&30||ga(r,t,n)}l.memoizedState=n;var o={value:n,getSnapshot:t};return l.queue=o,Tu(xa.bind(null,r,o,e),[e]),r.flags|=2048,lr(9,wa.bind(null,r,o,n,t),void 0,null),n},useId:function(){var e=Be(),t=te.identifierPrefix;if(H){var n=Ze,r=Xe;n=(r&~(1<<32-Fe(r)-1)).toString(32)+n,t=":"+t+"R"+n,n=nr++,0<n&&(t+="H"+n.toString(32)),t+=":"}else n=dd++,t=":"+t+"r"+n.toString(32)+":";return e.memoizedState=t},unstable_isNewReconciler:!1},yd={readContext:Le,useCallback:ja,useContext:Le,useEffect:zi,useImperativeHandle:Pa,useInsertionEffect:Ea,useLayoutEffect:Na,useMemo:za,useReducer:Xl,useRef:Ca,useState:function(){return Xl(rr)},useDebugValue:Ti,useDeferredValue:function(e){var t=Me();return Ta(t,q.memoizedState,e)},useTransition:function(){var e=Xl(rr)[0],t=Me().memoizedState;return[e,t]},useMutableSource:va,useSyncExternalStore:ya,useId:La,unstable_isNewReconciler:!1},gd={readContext:Le,useCallback:ja,useContext:Le,useEffect:zi,useImperativeHandle:Pa,useInsertionEffect:Ea,useLayoutEffect:Na,useMemo:za,useReducer:Zl,useRef:Ca,useState:function(){return Zl(rr)},useDebugValue:Ti,useDeferredValue:function(e){var t=Me();return q===null?t.memoizedState=e:Ta(t,q.memoizedState,e)},useTransition:function(){var e=Zl(rr)[0],t=Me().memoizedState;return[e,t]},useMutableSource:va,useSyncExternalStore:ya,useId:La,unstable_isNewReconciler:!1};function Oe(e,t){if(e&&e.defaultProps){t=Y({},t),e=e.defaultProps;for(var n in e)t[n]===void 0&&(t[n]=e[n]);return t}return t}function Ro(e,t,n,r){t=e.memoizedState,n=n(r,t),n=n==null?t:Y({},t,n),e.memoizedState=n,e.lanes===0&&(e.updateQueue.baseState=n)}var gl={isMounted:function(e){return(e=e._reactInternals)?Bt(e)===e:!1},enqueueSetState:function(e,t,n){e=e._reactInternals;var r=fe(),l=xt(e),o=Je(r,l);o.payload=t,n!=null&&(o.callback=n),t=gt(e,o,l),t!==null&&(Ue(t,e,l,r),Rr(t,e,l))},enqueueReplaceState:function(e,t,n){e=e._reactInternals;var r=fe(),l=xt(e),o=Je(r,l);o.tag=1,o.payload=t,n!=null&&(o.callback=n),t=gt(e,o,l),t!==null&&(Ue(t,e,l,r),Rr(t,e,l))},enqueueForceUpdate:function(e,t){e=e._reactInternals;var n=fe(),r=xt(e),l=Je(n,r);l.tag=2,t!=null&&(l.callback=t),t=gt(e,l,r),t!==null&&(Ue(t,e,r,n),Rr(t,e,r))}};function Lu(e,t,n,r,l,o,i){return e=e.stateNode,typeof e.shouldComponentUpdate=="function"?e.shouldComponentUpdate(r,o,i):t.prototype&&t.prototype.isPureReactComponent?!Zn(n,r)||!Zn(l,o):!0}function Da(e,t,n){var r=!1,l=Ct,o=t.contextType;return typeof o=="object"&&o!==null?o=Le(o):(l=ge(t)?It:ae.current,r=t.contextTypes,o=(r=r!=null)?dn(e,l):Ct),t=new t(n,o),e.memoizedState=t.state!==null&&t.state!==void 0?t.state:null,t.updater=gl,e.stateNode=t,t._reactInternals=e,r&&(e=e.stateNode,e.__reactInternalMemoizedUnmaskedChildContext=l,e.__reactInternalMemoizedMaskedChildContext=o),t}function Mu(e,t,n,r){e=t.state,typeof t.componentWillReceiveProps=="function"&&t.componentWillReceiveProps(n,r),typeof t.UNSAFE_componentWillReceiveProps=="function"&&t.UNSAFE_componentWillReceiveProps(n,r),t.state!==e&&gl.enqueueReplaceState(t,t.state,null)}function Oo(e,t,n,r){var l=e.stateNode;l.props=n,l.state=e.memoizedState,l.refs={},ki(e);var o=t.contextType;typeof o=="object"&&o!==null?l.context=Le(o):(o=ge(t)?It:ae.current,l.context=dn(e,o)),l.state=e.memoizedState,o=t.getDerivedStateFromProps,typeof o=="function"&&(Ro(e,t,o,n),l.state=e.memoizedState),typeof t.getDerivedStateFromProps=="function"||typeof l.getSnapshotBeforeUpdate=="function"||typeof l.UNSAFE_componentWillMount!="function"&&typeof l.componentWillMount!="function"||(t=l.state,typeof l.componentWillMount=="function"&&l.componentWillMount(),typeof l.UNSAFE_componentWillMount=="function"&&l.UNSAFE_componentWillMount(),t!==l.state&&gl.enqueueReplaceState(l,l.state,null),tl(e,n,l,r),l.state=e.memoizedState),typeof l.componentDidMount=="function"&&(e.flags|=4194308)}function vn(e,t){try{var n="",r=t;do n+=Qc(r),r=r.return;while(r);var l=n}catch(o){l=`
-Error generating stack: `+o.message+`
-`+o.stack}return{value:e,source:t,stack:l,digest:null}}function Jl(e,t,n){return{value:e,source:null,stack:n??null,digest:t??null}}function Do(e,t){try{console.error(t.value)}catch(n){setTimeout(function(){throw n})}}var wd=typeof WeakMap=="function"?WeakMap:Map;function Ia(e,t,n){n=Je(-1,n),n.tag=3,n.payload={element:null};var r=t.value;return n.callback=function(){il||(il=!0,Qo=r),Do(e,t)},n}function Fa(e,t,n){n=Je(-1,n),n.tag=3;var r=e.type.getDerivedStateFromError;if(typeof r=="function"){var l=t.value;n.payload=function(){return r(l)},n.callback=function(){Do(e,t)}}var o=e.stateNode;return o!==null&&typeof o.componentDidCatch=="function"&&(n.callback=function(){Do(e,t),typeof r!="function"&&(wt===null?wt=new Set([this]):wt.add(this));var i=t.stack;this.componentDidCatch(t.value,{componentStack:i!==null?i:""})}),n}function Ru(e,t,n){var r=e.pingCache;if(r===null){r=e.pingCache=new wd;var l=new Set;r.set(t,l)}else l=r.get(t),l===void 0&&(l=new Set,r.set(t,l));l.has(n)||(l.add(n),e=Rd.bind(null,e,t,n),t.then(e,e))}function Ou(e){do{var t;if((t=e.tag===13)&&(t=e.memoizedState,t=t!==null?t.dehydrated!==null:!0),t)return e;e=e.return}while(e!==null);return null}function Du(e,t,n,r,l){return e.mode&1?(e.flags|=65536,e.lanes=l,e):(e===t?e.flags|=65536:(e.flags|=128,n.flags|=131072,n.flags&=-52805,n.tag===1&&(n.alternate===null?n.tag=17:(t=Je(-1,1),t.tag=2,gt(n,t,1))),n.lanes|=1),e)}var xd=nt.ReactCurrentOwner,ve=!1;function ce(e,t,n,r){t.child=e===null?da(t,null,n,r):hn(t,e.child,n,r)}function Iu(e,t,n,r,l){n=n.render;var o=t.ref;return an(t,l),r=Pi(e,t,n,r,o,l),n=ji(),e!==null&&!ve?(t.updateQueue=e.updateQueue,t.flags&=-2053,e.lanes&=~l,tt(e,t,l)):(H&&n&&mi(t),t.flags|=1,ce(e,t,r,l),t.child)}function Fu(e,t,n,r,l){if(e===null){var o=n.type;return typeof o=="function"&&!Ui(o)&&o.defaultProps===void 0&&n.compare===null&&n.defaultProps===void 0?(t.tag=15,t.type=o,Ua(e,t,o,r,l)):(e=$r(n.type,null,r,t,t.mode,l),e.ref=t.ref,e.return=t,t.child=e)}if(o=e.child,!(e.lanes&l)){var i=o.memoizedProps;if(n=n.compare,n=n!==null?n:Zn,n(i,r)&&e.ref===t.ref)return tt(e,t,l)}return t.flags|=1,e=St(o,r),e.ref=t.ref,e.return=t,t.child=e}function Ua(e,t,n,r,l){if(e!==null){var o=e.memoizedProps;if(Zn(o,r)&&e.ref===t.ref)if(ve=!1,t.pendingProps=r=o,(e.lanes&l)!==0)e.flags&131072&&(ve=!0);else return t.lanes=e.lanes,tt(e,t,l)}return Io(e,t,n,r,l)}function $a(e,t,n){var r=t.pendingProps,l=r.children,o=e!==null?e.memoizedState:null;if(r.mode==="hidden")if(!(t.mode&1))t.memoizedState={baseLanes:0,cachePool:null,transitions:null},F(rn,xe),xe|=n;else{if(!(n&1073741824))return e=o!==null?o.baseLanes|n:n,t.lanes=t.childLanes=1073741824,t.memoizedState={baseLanes:e,cachePool:null,transitions:null},t.updateQueue=null,F(rn,xe),xe|=e,null;t.memoizedState={baseLanes:0,cachePool:null,transitions:null},r=o!==null?o.baseLanes:n,F(rn,xe),xe|=r}else o!==null?(r=o.baseLanes|n,t.memoizedState=null):r=n,F(rn,xe),xe|=r;return ce(e,t,l,n),t.child}function Aa(e,t){var n=t.ref;(e===null&&n!==null||e!==null&&e.ref!==n)&&(t.flags|=512,t.flags|=2097152)}function Io(e,t,n,r,l){var o=ge(n)?It:ae.current;return o=dn(t,o),an(t,l),n=Pi(e,t,n,r,o,l),r=ji(),e!==null&&!ve?(t.updateQueue=e.updateQueue,t.flags&=-2053,e.lanes&=~l,tt(e,t,l)):(H&&r&&mi(t),t.flags|=1,ce(e,t,n,l),t.child)}function Uu(e,t,n,r,l){if(ge(n)){var o=!0;Zr(t)}else o=!1;if(an(t,l),t.stateNode===null)Ir(e,t),Da(t,n,r),Oo(t,n,r,l),r=!0;else if(e===null){var i=t.stateNode,u=t.memoizedProps;i.props=u;var s=i.context,c=n.contextType;typeof c=="object"&&c!==null?c=Le(c):(c=ge(n)?It:ae.current,c=dn(t,c));var y=n.getDerivedStateFromProps,v=typeof y=="function"||typeof i.getSnapshotBeforeUpdate=="function";v||typeof i.UNSAFE_componentWillReceiveProps!="function"&&typeof i.componentWillReceiveProps!="function"||(u!==r||s!==c)&&Mu(t,i,r,c),it=!1;var h=t.memoizedState;i.state=h,tl(t,r,i,l),s=t.memoizedState,u!==r||h!==s||ye.current||it?(typeof y=="function"&&(Ro(t,n,y,r),s=t.memoizedState),(u=it||Lu(t,n,u,r,h,s,c))?(v||typeof i.UNSAFE_componentWillMount!="function"&&typeof i.componentWillMount!="function"||(typeof i.componentWillMount=="function"&&i.componentWillMount(),typeof i.UNSAFE_componentWillMount=="function"&&i.UNSAFE_componentWillMount()),typeof i.componentDidMount=="function"&&(t.flags|=4194308)):(typeof i.componentDidMount=="function"&&(t.flags|=4194308),t.memoizedProps=r,t.memoizedState=s),i.props=r,i.state=s,i.context=c,r=u):(typeof i.componentDidMount=="function"&&(t.flags|=4194308),r=!1)}else{i=t.stateNode,ha(e,t),u=t.memoizedProps,c=t.type===t.elementType?u:Oe(t.type,u),i.props=c,v=t.pendingProps,h=i.context,s=n.contextType,typeof s=="object"&&s!==null?s=Le(s):(s=ge(n)?It:ae.current,s=dn(t,s));var x=n.getDerivedStateFromProps;(y=typeof x=="function"||typeof i.getSnapshotBeforeUpdate=="function")||typeof i.UNSAFE_componentWillReceiveProps!="function"&&typeof i.componentWillReceiveProps!="function"||(u!==v||h!==s)&&Mu(t,i,r,s),it=!1,h=t.memoizedState,i.state=h,tl(t,r,i,l);var S=t.memoizedState;u!==v||h!==S||ye.current||it?(typeof x=="function"&&(Ro(t,n,x,r),S=t.memoizedState),(c=it||Lu(t,n,c,r,h,S,s)||!1)?(y||typeof i.UNSAFE_componentWillUpdate!="function"&&typeof i.componentWillUpdate!="function"||(typeof i.componentWillUpdate=="function"&&i.componentWillUpdate(r,S,s),typeof i.UNSAFE_componentWillUpdate=="function"&&i.UNSAFE_componentWillUpdate(r,S,s)),typeof i.componentDidUpdate=="function"&&(t.flags|=4),typeof i.getSnapshotBeforeUpdate=="function"&&(t.flags|=1024)):(typeof i.componentDidUpdate!="function"||u===e.memoizedProps&&h===e.memoizedState||(t.flags|=4),typeof i.getSnapshotBeforeUpdate!="function"||u===e.memoizedProps&&h===e.memoizedState||(t.flags|=1024),t.memoizedProps=r,t.memoizedState=S),i.props=r,i.state=S,i.context=s,r=c):(typeof i.componentDidUpdate!="function"||u===e.memoizedProps&&h===e.memoizedState||(t.flags|=4),typeof i.getSnapshotBeforeUpdate!="function"||u===e.memoizedProps&&h===e.memoizedState||(t.flags|=1024),r=!1)}return Fo(e,t,n,r,o,l)}function Fo(e,t,n,r,l,o){Aa(e,t);var i=(t.flags&128)!==0;if(!r&&!i)return l&&Cu(t,n,!1),tt(e,t,o);r=t.stateNode,xd.current=t;var u=i&&typeof n.getDerivedStateFromError!="function"?null:r.render();return t.flags|=1,e!==null&&i?(t.child=hn(t,e.child,null,o),t.child=hn(t,null,u,o)):ce(e,t,u,o),t.memoizedState=r.state,l&&Cu(t,n,!0),t.child}function Va(e){var t=e.stateNode;t.pendingContext?ku(e,t.pendingContext,t.pendingContext!==t.context):t.context&&ku(e,t.context,!1),Ci(e,t.containerInfo)}function $u(e,t,n,r,l){return pn(),yi(l),t.flags|=256,ce(e,t,n,r),t.child}var Uo={dehydrated:null,treeContext:null,retryLane:0};function $o(e){return{baseLanes:e,cachePool:null,transitions:null}}function Ba(e,t,n){var r=t.pendingProps,l=Q.current,o=!1,i=(t.flags&128)!==0,u;if((u=i)||(u=e!==null&&e.memoizedState===null?!1:(l&2)!==0),u?(o=!0,t.flags&=-129):(e===null||e.memoizedState!==null)&&(l|=1),F(Q,l&1),e===null)return Lo(t),e=t.memoizedState,e!==null&&(e=e.dehydrated,e!==null)?(t.mode&1?e.data==="$!"?t.lanes=8:t.lanes=1073741824:t.lanes=1,null):(i=r.children,e=r.fallback,o?(r=t.mode,o=t.child,i={mode:"hidden",children:i},!(r&1)&&o!==null?(o.childLanes=0,o.pendingProps=i):o=Sl(i,r,0,null),e=Dt(e,r,n,null),o.return=t,e.return=t,o.sibling=e,t.child=o,t.child.memoizedState=$o(n),t.memoizedState=Uo,e):Li(t,i));if(l=e.memoizedState,l!==null&&(u=l.dehydrated,u!==null))return Sd(e,t,i,r,u,l,n);if(o){o=r.fallback,i=t.mode,l=e.child,u=l.sibling;var s={mode:"hidden",children:r.children};return!(i&1)&&t.child!==l?(r=t.child,r.childLanes=0,r.pendingProps=s,t.deletions=null):(r=St(l,s),r.subtreeFlags=l.subtreeFlags&14680064),u!==null?o=St(u,o):(o=Dt(o,i,n,null),o.flags|=2),o.return=t,r.return=t,r.sibling=o,t.child=r,r=o,o=t.child,i=e.child.memoizedState,i=i===null?$o(n):{baseLanes:i.baseLanes|n,cachePool:null,transitions:i.transitions},o.memoizedState=i,o.childLanes=e.childLanes&~n,t.memoizedState=Uo,r}return o=e.child,e=o.sibling,r=St(o,{mode:"visible",children:r.children}),!(t.mode&1)&&(r.lanes=n),r.return=t,r.sibling=null,e!==null&&(n=t.deletions,n===null?(t.deletions=[e],t.flags|=16):n.push(e)),t.child=r,t.memoizedState=null,r}function Li(e,t){return t=Sl({mode:"visible",children:t},e.mode,0,null),t.return=e,e.child=t}function Er(e,t,n,r){return r!==null&&yi(r),hn(t,e.child,null,n),e=Li(t,t.pendingProps.children),e.flags|=2,t.memoizedState=null,e}function Sd(e,t,n,r,l,o,i){if(n)return t.flags&256?(t.flags&=-257,r=Jl(Error(w(422))),Er(e,t,i,r)):t.memoizedState!==null?(t.child=e.child,t.flags|=128,null):(o=r.fallback,l=t.mode,r=Sl({mode:"visible",children:r.children},l,0,null),o=Dt(o,l,i,null),o.flags|=2,r.return=t,o.return=t,r.sibling=o,t.child=r,t.mode&1&&hn(t,e.child,null,i),t.child.memoizedState=$o(i),t.memoizedState=Uo,o);if(!(t.mode&1))return Er(e,t,i,null);if(l.data==="$!"){if(r=l.nextSibling&&l.nextSibling.dataset,r)var u=r.dgst;return r=u,o=Error(w(419)),r=Jl(o,r,void 0),Er(e,t,i,r)}if(u=(i&e.childLanes)!==0,ve||u){if(r=te,r!==null){switch(i&-i){case 4:l=2;break;case 16:l=8;break;case 64:case 128:case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:case 4194304:case 8388608:case 16777216:case 33554432:case 67108864:l=32;break;case 536870912:l=268435456;break;default:l=0}l=l&(r.suspendedLanes|i)?0:l,l!==0&&l!==o.retryLane&&(o.retryLane=l,et(e,l),Ue(r,e,l,-1))}return Fi(),r=Jl(Error(w(421))),Er(e,t,i,r)}return l.data==="$?"?(t.flags|=128,t.child=e.child,t=Od.bind(null,e),l._reactRetry=t,null):(e=o.treeContext,Se=yt(l.nextSibling),ke=t,H=!0,Ie=null,e!==null&&(Pe[je++]=Xe,Pe[je++]=Ze,Pe[je++]=Ft,Xe=e.id,Ze=e.overflow,Ft=t),t=Li(t,r.children),t.flags|=4096,t)}function Au(e,t,n){e.lanes|=t;var r=e.alternate;r!==null&&(r.lanes|=t),Mo(e.return,t,n)}function ql(e,t,n,r,l){var o=e.memoizedState;o===null?e.memoizedState={isBackwards:t,rendering:null,renderingStartTime:0,last:r,tail:n,tailMode:l}:(o.isBackwards=t,o.rendering=null,o.renderingStartTime=0,o.last=r,o.tail=n,o.tailMode=l)}function Ha(e,t,n){var r=t.pendingProps,l=r.revealOrder,o=r.tail;if(ce(e,t,r.children,n),r=Q.current,r&2)r=r&1|2,t.flags|=128;else{if(e!==null&&e.flags&128)e:for(e=t.child;e!==null;){if(e.tag===13)e.memoizedState!==null&&Au(e,n,t);else if(e.tag===19)Au(e,n,t);else if(e.child!==null){e.child.return=e,e=e.child;continue}if(e===t)break e;for(;e.sibling===null;){if(e.return===null||e.return===t)break e;e=e.return}e.sibling.return=e.return,e=e.sibling}r&=1}if(F(Q,r),!(t.mode&1))t.memoizedState=null;else switch(l){case"forwards":for(n=t.child,l=null;n!==null;)e=n.alternate,e!==null&&nl(e)===null&&(l=n),n=n.sibling;n=l,n===null?(l=t.child,t.child=null):(l=n.sibling,n.sibling=null),ql(t,!1,l,n,o);break;case"backwards":for(n=null,l=t.child,t.child=null;l!==null;){if(e=l.alternate,e!==null&&nl(e)===null){t.child=l;break}e=l.sibling,l.sibling=n,n=l,l=e}ql(t,!0,n,null,o);break;case"together":ql(t,!1,null,null,void 0);break;default:t.memoizedState=null}return t.child}function Ir(e,t){!(t.mode&1)&&e!==null&&(e.alternate=null,t.alternate=null,t.flags|=2)}function tt(e,t,n){if(e!==null&&(t.dependencies=e.dependencies),$t|=t.lanes,!(n&t.childLanes))return null;if(e!==null&&t.child!==e.child)throw Error(w(153));if(t.child!==null){for(e=t.child,n=St(e,e.pendingProps),t.child=n,n.return=t;e.sibling!==null;)e=e.sibling,n=n.sibling=St(e,e.pendingProps),n.return=t;n.sibling=null}return t.child}function kd(e,t,n){switch(t.tag){case 3:Va(t),pn();break;case 5:ma(t);break;case 1:ge(t.type)&&Zr(t);break;case 4:Ci(t,t.stateNode.containerInfo);break;case 10:var r=t.type._context,l=t.memoizedProps.value;F(br,r._currentValue),r._currentValue=l;break;case 13:if(r=t.memoizedState,r!==null)return r.dehydrated!==null?(F(Q,Q.current&1),t.flags|=128,null):n&t.child.childLanes?Ba(e,t,n):(F(Q,Q.current&1),e=tt(e,t,n),e!==null?e.sibling:null);F(Q,Q.current&1);break;case 19:if(r=(n&t.childLanes)!==0,e.flags&128){if(r)return Ha(e,t,n);t.flags|=128}if(l=t.memoizedState,l!==null&&(l.rendering=null,l.tail=null,l.lastEffect=null),F(Q,Q.current),r)break;return null;case 22:case 23:return t.lanes=0,$a(e,t,n)}return tt(e,t,n)}var Wa,Ao,Qa,Ka;Wa=function(e,t){for(var n=t.child;n!==null;){if(n.tag===5||n.tag===6)e.appendChild(n.stateNode);else if(n.tag!==4&&n.child!==null){n.child.return=n,n=n.child;continue}if(n===t)break;for(;n.sibling===null;){if(n.return===null||n.return===t)return;n=n.return}n.sibling.return=n.return,n=n.sibling}};Ao=function(){};Qa=function(e,t,n,r){var l=e.memoizedProps;if(l!==r){e=t.stateNode,Rt(Qe.current);var o=null;switch(n){case"input":l=uo(e,l),r=uo(e,r),o=[];break;case"select":l=Y({},l,{value:void 0}),r=Y({},r,{value:void 0}),o=[];break;case"textarea":l=co(e,l),r=co(e,r),o=[];break;default:typeof l.onClick!="function"&&typeof r.onClick=="function"&&(e.onclick=Gr)}po(n,r);var i;n=null;for(c in l)if(!r.hasOwnProperty(c)&&l.hasOwnProperty(c)&&l[c]!=null)if(c==="style"){var u=l[c];for(i in u)u.hasOwnProperty(i)&&(n||(n={}),n[i]="")}else c!=="dangerouslySetInnerHTML"&&c!=="children"&&c!=="suppressContentEditableWarning"&&c!=="suppressHydrationWarning"&&c!=="autoFocus"&&(Hn.hasOwnProperty(c)?o||(o=[]):(o=o||[]).push(c,null));for(c in r){var s=r[c];if(u=l!=null?l[c]:void 0,r.hasOwnProperty(c)&&s!==u&&(s!=null||u!=null))if(c==="style")if(u){for(i in u)!u.hasOwnProperty(i)||s&&s.hasOwnProperty(i)||(n||(n={}),n[i]="");for(i in s)s.hasOwnProperty(i)&&u[i]!==s[i]&&(n||(n={}),n[i]=s[i])}else n||(o||(o=[]),o.push(c,n)),n=s;else c==="dangerouslySetInnerHTML"?(s=s?s.__html:void 0,u=u?u.__html:void 0,s!=null&&u!==s&&(o=o||[]).push(c,s)):c==="children"?typeof s!="string"&&typeof s!="number"||(o=o||[]).push(c,""+s):c!=="suppressContentEditableWarning"&&c!=="suppressHydrationWarning"&&(Hn.hasOwnProperty(c)?(s!=null&&c==="onScroll"&&A("scroll",e),o||u===s||(o=[])):(o=o||[]).push(c,s))}n&&(o=o||[]).push("style",n);var c=o;(t.updateQueue=c)&&(t.flags|=4)}};Ka=function(e,t,n,r){n!==r&&(t.flags|=4)};function jn(e,t){if(!H)switch(e.tailMode){case"hidden":t=e.tail;for(var n=null;t!==null;)t.alternate!==null&&(n=t),t=t.sibling;n===null?e.tail=null:n.sibling=null;break;case"collapsed":n=e.tail;for(var r=null;n!==null;)n.alternate!==null&&(r=n),n=n.sibling;r===null?t||e.tail===null?e.tail=null:e.tail.sibling=null:r.sibling=null}}function ue(e){var t=e.alternate!==null&&e.alternate.child===e.child,n=0,r=0;if(t)for(var l=e.child;l!==null;)n|=l.lanes|l.childLanes,r|=l.subtreeFlags&14680064,r|=l.flags&14680064,l.return=e,l=l.sibling;else for(l=e.child;l!==null;)n|=l.lanes|l.childLanes,r|=l.subtreeFlags,r|=l.flags,l.return=e,l=l.sibling;return e.subtreeFlags|=r,e.childLanes=n,t}function Cd(e,t,n){var r=t.pendingProps;switch(vi(t),t.tag){case 2:case 16:case 15:case 0:case 11:case 7:case 8:case 12:case 9:case 14:return ue(t),null;case 1:return ge(t.type)&&Xr(),ue(t),null;case 3:return r=t.stateNode,mn(),V(ye),V(ae),Ni(),r.pendingContext&&(r.context=r.pendingContext,r.pendingContext=null),(e===null||e.child===null)&&(kr(t)?t.flags|=4:e===null||e.memoizedState.isDehydrated&&!(t.flags&256)||(t.flags|=1024,Ie!==null&&(Go(Ie),Ie=null))),Ao(e,t),ue(t),null;case 5:Ei(t);var l=Rt(tr.current);if(n=t.type,e!==null&&t.stateNode!=null)Qa(e,t,n,r,l),e.ref!==t.ref&&(t.flags|=512,t.flags|=2097152);else{if(!r){if(t.stateNode===null)throw Error(w(166));return ue(t),null}if(e=Rt(Qe.current),kr(t)){r=t.stateNode,n=t.type;var o=t.memoizedProps;switch(r[He]=t,r[bn]=o,e=(t.mode&1)!==0,n){case"dialog":A("cancel",r),A("close",r);break;case"iframe":case"object":case"embed":A("load",r);break;case"video":case"audio":for(l=0;l<Rn.length;l++)A(Rn[l],r);break;case"source":A("error",r);break;case"img":case"image":case"link":A("error",r),A("load",r);break;case"details":A("toggle",r);break;case"input":Xi(r,o),A("invalid",r);break;case"select":r._wrapperState={wasMultiple:!!o.multiple},A("invalid",r);break;case"textarea":Ji(r,o),A("invalid",r)}po(n,o),l=null;for(var i in o)if(o.hasOwnProperty(i)){var u=o[i];i==="children"?typeof u=="string"?r.textContent!==u&&(o.suppressHydrationWarning!==!0&&Sr(r.textContent,u,e),l=["children",u]):typeof u=="number"&&r.textContent!==""+u&&(o.suppressHydrationWarning!==!0&&Sr(r.textContent,u,e),l=["children",""+u]):Hn.hasOwnProperty(i)&&u!=null&&i==="onScroll"&&A("scroll",r)}switch(n){case"input":pr(r),Zi(r,o,!0);break;case"textarea":pr(r),qi(r);break;case"select":case"option":break;default:typeof o.onClick=="function"&&(r.onclick=Gr)}r=l,t.updateQueue=r,r!==null&&(t.flags|=4)}else{i=l.nodeType===9?l:l.ownerDocument,e==="http://www.w3.org/1999/xhtml"&&(e=xs(n)),e==="http://www.w3.org/1999/xhtml"?n==="script"?(e=i.createElement("div"),e.innerHTML="<script><\/script>",e=e.removeChild(e.firstChild)):typeof r.is=="string"?e=i.createElement(n,{is:r.is}):(e=i.createElement(n),n==="select"&&(i=e,r.multiple?i.multiple=!0:r.size&&(i.size=r.size))):e=i.createElementNS(e,n),e[He]=t,e[bn]=r,Wa(e,t,!1,!1),t.stateNode=e;e:{switch(i=ho(n,r),n){case"dialog":A("cancel",e),A("close",e),l=r;break;case"iframe":case"object":case"embed":A("load",e),l=r;break;case"video":case"audio":for(l=0;l<Rn.length;l++)A(Rn[l],e);l=r;break;case"source":A("error",e),l=r;break;case"img":case"image":case"link":A("error",e),A("load",e),l=r;break;case"details":A("toggle",e),l=r;break;case"input":Xi(e,r),l=uo(e,r),A("invalid",e);break;case"option":l=r;break;case"select":e._wrapperState={wasMultiple:!!r.multiple},l=Y({},r,{value:void 0}),A("invalid",e);break;case"textarea":Ji(e,r),l=co(e,r),A("invalid",e);break;default:l=r}po(n,l),u=l;for(o in u)if(u.hasOwnProperty(o)){var s=u[o];o==="style"?Cs(e,s):o==="dangerouslySetInnerHTML"?(s=s?s.__html:void 0,s!=null&&Ss(e,s)):o==="children"?typeof s=="string"?(n!=="textarea"||s!=="")&&Wn(e,s):typeof s=="number"&&Wn(e,""+s):o!=="suppressContentEditableWarning"&&o!=="suppressHydrationWarning"&&o!=="autoFocus"&&(Hn.hasOwnProperty(o)?s!=null&&o==="onScroll"&&A("scroll",e):s!=null&&ti(e,o,s,i))}switch(n){case"input":pr(e),Zi(e,r,!1);break;case"textarea":pr(e),qi(e);break;case"option":r.value!=null&&e.setAttribute("value",""+kt(r.value));break;case"select":e.multiple=!!r.multiple,o=r.value,o!=null?ln(e,!!r.multiple,o,!1):r.defaultValue!=null&&ln(e,!!r.multiple,r.defaultValue,!0);break;default:typeof l.onClick=="function"&&(e.onclick=Gr)}switch(n){case"button":case"input":case"select":case"textarea":r=!!r.autoFocus;break e;case"img":r=!0;break e;default:r=!1}}r&&(t.flags|=4)}t.ref!==null&&(t.flags|=512,t.flags|=2097152)}return ue(t),null;case 6:if(e&&t.stateNode!=null)Ka(e,t,e.memoizedProps,r);else{if(typeof r!="string"&&t.stateNode===null)throw Error(w(166));if(n=Rt(tr.current),Rt(Qe.current),kr(t)){if(r=t.stateNode,n=t.memoizedProps,r[He]=t,(o=r.nodeValue!==n)&&(e=ke,e!==null))switch(e.tag){case 3:Sr(r.nodeValue,n,(e.mode&1)!==0);break;case 5:e.memoizedProps.suppressHydrationWarning!==!0&&Sr(r.nodeValue,n,(e.mode&1)!==0)}o&&(t.flags|=4)}else r=(n.nodeType===9?n:n.ownerDocument).createTextNode(r),r[He]=t,t.stateNode=r}return ue(t),null;case 13:if(V(Q),r=t.memoizedState,e===null||e.memoizedState!==null&&e.memoizedState.dehydrated!==null){if(H&&Se!==null&&t.mode&1&&!(t.flags&128))ca(),pn(),t.flags|=98560,o=!1;else if(o=kr(t),r!==null&&r.dehydrated!==null){if(e===null){if(!o)throw Error(w(318));if(o=t.memoizedState,o=o!==null?o.dehydrated:null,!o)throw Error(w(317));o[He]=t}else pn(),!(t.flags&128)&&(t.memoizedState=null),t.flags|=4;ue(t),o=!1}else Ie!==null&&(Go(Ie),Ie=null),o=!0;if(!o)return t.flags&65536?t:null}return t.flags&128?(t.lanes=n,t):(r=r!==null,r!==(e!==null&&e.memoizedState!==null)&&r&&(t.child.flags|=8192,t.mode&1&&(e===null||Q.current&1?b===0&&(b=3):Fi())),t.updateQueue!==null&&(t.flags|=4),ue(t),null);case 4:return mn(),Ao(e,t),e===null&&Jn(t.stateNode.containerInfo),ue(t),null;case 10:return xi(t.type._context),ue(t),null;case 17:return ge(t.type)&&Xr(),ue(t),null;case 19:if(V(Q),o=t.memoizedState,o===null)return ue(t),null;if(r=(t.flags&128)!==0,i=o.rendering,i===null)if(r)jn(o,!1);else{if(b!==0||e!==null&&e.flags&128)for(e=t.child;e!==null;){if(i=nl(e),i!==null){for(t.flags|=128,jn(o,!1),r=i.updateQueue,r!==null&&(t.updateQueue=r,t.flags|=4),t.subtreeFlags=0,r=n,n=t.child;n!==null;)o=n,e=r,o.flags&=14680066,i=o.alternate,i===null?(o.childLanes=0,o.lanes=e,o.child=null,o.subtreeFlags=0,o.memoizedProps=null,o.memoizedState=null,o.updateQueue=null,o.dependencies=null,o.stateNode=null):(o.childLanes=i.childLanes,o.lanes=i.lanes,o.child=i.child,o.subtreeFlags=0,o.deletions=null,o.memoizedProps=i.memoizedProps,o.memoizedState=i.memoizedState,o.updateQueue=i.updateQueue,o.type=i.type,e=i.dependencies,o.dependencies=e===null?null:{lanes:e.lanes,firstContext:e.firstContext}),n=n.sibling;return F(Q,Q.current&1|2),t.child}e=e.sibling}o.tail!==null&&X()>yn&&(t.flags|=128,r=!0,jn(o,!1),t.lanes=4194304)}else{if(!r)if(e=nl(i),e!==null){if(t.flags|=128,r=!0,n=e.updateQueue,n!==null&&(t.updateQueue=n,t.flags|=4),jn(o,!0),o.tail===null&&o.tailMode==="hidden"&&!i.alternate&&!H)return ue(t),null}else 2*X()-o.renderingStartTime>yn&&n!==1073741824&&(t.flags|=128,r=!0,jn(o,!1),t.lanes=4194304);o.isBackwards?(i.sibling=t.child,t.child=i):(n=o.last,n!==null?n.sibling=i:t.child=i,o.last=i)}return o.tail!==null?(t=o.tail,o.rendering=t,o.tail=t.sibling,o.renderingStartTime=X(),t.sibling=null,n=Q.current,F(Q,r?n&1|2:n&1),t):(ue(t),null);case 22:case 23:return Ii(),r=t.memoizedState!==null,e!==null&&e.memoizedState!==null!==r&&(t.flags|=8192),r&&t.mode&1?xe&1073741824&&(ue(t),t.subtreeFlags&6&&(t.flags|=8192)):ue(t),null;case 24:return null;case 25:return null}throw Error(w(156,t.tag))}function Ed(e,t){switch(vi(t),t.tag){case 1:return ge(t.type)&&Xr(),e=t.flags,e&65536?(t.flags=e&-65537|128,t):null;case 3:return mn(),V(ye),V(ae),Ni(),e=t.flags,e&65536&&!(e&128)?(t.flags=e&-65537|128,t):null;case 5:return Ei(t),null;case 13:if(V(Q),e=t.memoizedState,e!==null&&e.dehydrated!==null){if(t.alternate===null)throw Error(w(340));pn()}return e=t.flags,e&65536?(t.flags=e&-65537|128,t):null;case 19:return V(Q),null;case 4:return mn(),null;case 10:return xi(t.type._context),null;case 22:case 23:return Ii(),null;case 24:return null;default:return null}}var Nr=!1,se=!1,Nd=typeof WeakSet=="function"?WeakSet:Set,N=null;function nn(e,t){var n=e.ref;if(n!==null)if(typeof n=="function")try{n(null)}catch(r){G(e,t,r)}else n.current=null}function Vo(e,t,n){try{n()}catch(r){G(e,t,r)}}var Vu=!1;function _d(e,t){if(Eo=Qr,e=Js(),hi(e)){if("selectionStart"in e)var n={start:e.selectionStart,end:e.selectionEnd};else e:{n=(n=e.ownerDocument)&&n.defaultView||window;var r=n.getSelection&&n.getSelection();if(r&&r.rangeCount!==0){n=r.anchorNode;var l=r.anchorOffset,o=r.focusNode;r=r.focusOffset;try{n.nodeType,o.nodeType}catch{n=null;break e}var i=0,u=-1,s=-1,c=0,y=0,v=e,h=null;t:for(;;){for(var x;v!==n||l!==0&&v.nodeType!==3||(u=i+l),v!==o||r!==0&&v.nodeType!==3||(s=i+r),v.nodeType===3&&(i+=v.nodeValue.length),(x=v.firstChild)!==null;)h=v,v=x;for(;;){if(v===e)break t;if(h===n&&++c===l&&(u=i),h===o&&++y===r&&(s=i),(x=v.nextSibling)!==null)break;v=h,h=v.parentNode}v=x}n=u===-1||s===-1?null:{start:u,end:s}}else n=null}n=n||{start:0,end:0}}else n=null;for(No={focusedElem:e,selectionRange:n},Qr=!1,N=t;N!==null;)if(t=N,e=t.child,(t.subtreeFlags&1028)!==0&&e!==null)e.return=t,N=e;else for(;N!==null;){t=N;try{var S=t.alternate;if(t.flags&1024)switch(t.tag){case 0:case 11:case 15:break;case 1:if(S!==null){var k=S.memoizedProps,I=S.memoizedState,f=t.stateNode,a=f.getSnapshotBeforeUpdate(t.elementType===t.type?k:Oe(t.type,k),I);f.__reactInternalSnapshotBeforeUpdate=a}break;case 3:var d=t.stateNode.containerInfo;d.nodeType===1?d.textContent="":d.nodeType===9&&d.documentElement&&d.removeChild(d.documentElement);break;case 5:case 6:case 4:case 17:break;default:throw Error(w(163))}}catch(g){G(t,t.return,g)}if(e=t.sibling,e!==null){e.return=t.return,N=e;break}N=t.return}return S=Vu,Vu=!1,S}function An(e,t,n){var r=t.updateQueue;if(r=r!==null?r.lastEffect:null,r!==null){var l=r=r.next;do{if((l.tag&e)===e){var o=l.destroy;l.destroy=void 0,o!==void 0&&Vo(t,n,o)}l=l.next}while(l!==r)}}function wl(e,t){if(t=t.updateQueue,t=t!==null?t.lastEffect:null,t!==null){var n=t=t.next;do{if((n.tag&e)===e){var r=n.create;n.destroy=r()}n=n.next}while(n!==t)}}function Bo(e){var t=e.ref;if(t!==null){var n=e.stateNode;switch(e.tag){case 5:e=n;break;default:e=n}typeof t=="function"?t(e):t.current=e}}function Ya(e){var t=e.alternate;t!==null&&(e.alternate=null,Ya(t)),e.child=null,e.deletions=null,e.sibling=null,e.tag===5&&(t=e.stateNode,t!==null&&(delete t[He],delete t[bn],delete t[jo],delete t[sd],delete t[ad])),e.stateNode=null,e.return=null,e.dependencies=null,e.memoizedProps=null,e.memoizedState=null,e.pendingProps=null,e.stateNode=null,e.updateQueue=null}function Ga(e){return e.tag===5||e.tag===3||e.tag===4}function Bu(e){e:for(;;){for(;e.sibling===null;){if(e.return===null||Ga(e.return))return null;e=e.return}for(e.sibling.return=e.return,e=e.sibling;e.tag!==5&&e.tag!==6&&e.tag!==18;){if(e.flags&2||e.child===null||e.tag===4)continue e;e.child.return=e,e=e.child}if(!(e.flags&2))return e.stateNode}}function Ho(e,t,n){var r=e.tag;if(r===5||r===6)e=e.stateNode,t?n.nodeType===8?n.parentNode.insertBefore(e,t):n.insertBefore(e,t):(n.nodeType===8?(t=n.parentNode,t.insertBefore(e,n)):(t=n,t.appendChild(e)),n=n._reactRootContainer,n!=null||t.onclick!==null||(t.onclick=Gr));else if(r!==4&&(e=e.child,e!==null))for(Ho(e,t,n),e=e.sibling;e!==null;)Ho(e,t,n),e=e.sibling}function Wo(e,t,n){var r=e.tag;if(r===5||r===6)e=e.stateNode,t?n.insertBefore(e,t):n.appendChild(e);else if(r!==4&&(e=e.child,e!==null))for(Wo(e,t,n),e=e.sibling;e!==null;)Wo(e,t,n),e=e.sibling}var re=null,De=!1;function lt(e,t,n){for(n=n.child;n!==null;)Xa(e,t,n),n=n.sibling}function Xa(e,t,n){if(We&&typeof We.onCommitFiberUnmount=="function")try{We.onCommitFiberUnmount(fl,n)}catch{}switch(n.tag){case 5:se||nn(n,t);case 6:var r=re,l=De;re=null,lt(e,t,n),re=r,De=l,re!==null&&(De?(e=re,n=n.stateNode,e.nodeType===8?e.parentNode.removeChild(n):e.removeChild(n)):re.removeChild(n.stateNode));break;case 18:re!==null&&(De?(e=re,n=n.stateNode,e.nodeType===8?Ql(e.parentNode,n):e.nodeType===1&&Ql(e,n),Gn(e)):Ql(re,n.stateNode));break;case 4:r=re,l=De,re=n.stateNode.containerInfo,De=!0,lt(e,t,n),re=r,De=l;break;case 0:case 11:case 14:case 15:if(!se&&(r=n.updateQueue,r!==null&&(r=r.lastEffect,r!==null))){l=r=r.next;do{var o=l,i=o.destroy;o=o.tag,i!==void 0&&(o&2||o&4)&&Vo(n,t,i),l=l.next}while(l!==r)}lt(e,t,n);break;case 1:if(!se&&(nn(n,t),r=n.stateNode,typeof r.componentWillUnmount=="function"))try{r.props=n.memoizedProps,r.state=n.memoizedState,r.componentWillUnmount()}catch(u){G(n,t,u)}lt(e,t,n);break;case 21:lt(e,t,n);break;case 22:n.mode&1?(se=(r=se)||n.memoizedState!==null,lt(e,t,n),se=r):lt(e,t,n);break;default:lt(e,t,n)}}function Hu(e){var t=e.updateQueue;if(t!==null){e.updateQueue=null;var n=e.stateNode;n===null&&(n=e.stateNode=new Nd),t.forEach(function(r){var l=Dd.bind(null,e,r);n.has(r)||(n.add(r),r.then(l,l))})}}function Re(e,t){var n=t.deletions;if(n!==null)for(var r=0;r<n.length;r++){var l=n[r];try{var o=e,i=t,u=i;e:for(;u!==null;){switch(u.tag){case 5:re=u.stateNode,De=!1;break e;case 3:re=u.stateNode.containerInfo,De=!0;break e;case 4:re=u.stateNode.containerInfo,De=!0;break e}u=u.return}if(re===null)throw Error(w(160));Xa(o,i,l),re=null,De=!1;var s=l.alternate;s!==null&&(s.return=null),l.return=null}catch(c){G(l,t,c)}}if(t.subtreeFlags&12854)for(t=t.child;t!==null;)Za(t,e),t=t.sibling}function Za(e,t){var n=e.alternate,r=e.flags;switch(e.tag){case 0:case 11:case 14:case 15:if(Re(t,e),Ve(e),r&4){try{An(3,e,e.return),wl(3,e)}catch(k){G(e,e.return,k)}try{An(5,e,e.return)}catch(k){G(e,e.return,k)}}break;case 1:Re(t,e),Ve(e),r&512&&n!==null&&nn(n,n.return);break;case 5:if(Re(t,e),Ve(e),r&512&&n!==null&&nn(n,n.return),e.flags&32){var l=e.stateNode;try{Wn(l,"")}catch(k){G(e,e.return,k)}}if(r&4&&(l=e.stateNode,l!=null)){var o=e.memoizedProps,i=n!==null?n.memoizedProps:o,u=e.type,s=e.updateQueue;if(e.updateQueue=null,s!==null)try{u==="input"&&o.type==="radio"&&o.name!=null&&gs(l,o),ho(u,i);var c=ho(u,o);for(i=0;i<s.length;i+=2){var y=s[i],v=s[i+1];y==="style"?Cs(l,v):y==="dangerouslySetInnerHTML"?Ss(l,v):y==="children"?Wn(l,v):ti(l,y,v,c)}switch(u){case"input":so(l,o);break;case"textarea":ws(l,o);break;case"select":var h=l._wrapperState.wasMultiple;l._wrapperState.wasMultiple=!!o.multiple;var x=o.value;x!=null?ln(l,!!o.multiple,x,!1):h!==!!o.multiple&&(o.defaultValue!=null?ln(l,!!o.multiple,o.defaultValue,!0):ln(l,!!o.multiple,o.multiple?[]:"",!1))}l[bn]=o}catch(k){G(e,e.return,k)}}break;case 6:if(Re(t,e),Ve(e),r&4){if(e.stateNode===null)throw Error(w(162));l=e.stateNode,o=e.memoizedProps;try{l.nodeValue=o}catch(k){G(e,e.return,k)}}break;case 3:if(Re(t,e),Ve(e),r&4&&n!==null&&n.memoizedState.isDehydrated)try{Gn(t.containerInfo)}catch(k){G(e,e.return,k)}break;case 4:Re(t,e),Ve(e);break;case 13:Re(t,e),Ve(e),l=e.child,l.flags&8192&&(o=l.memoizedState!==null,l.stateNode.isHidden=o,!o||l.alternate!==null&&l.alternate.memoizedState!==null||(Oi=X())),r&4&&Hu(e);break;case 22:if(y=n!==null&&n.memoizedState!==null,e.mode&1?(se=(c=se)||y,Re(t,e),se=c):Re(t,e),Ve(e),r&8192){if(c=e.memoizedState!==null,(e.stateNode.isHidden=c)&&!y&&e.mode&1)for(N=e,y=e.child;y!==null;){for(v=N=y;N!==null;){switch(h=N,x=h.child,h.tag){case 0:case 11:case 14:case 15:An(4,h,h.return);break;case 1:nn(h,h.return);var S=h.stateNode;if(typeof S.componentWillUnmount=="function"){r=h,n=h.return;try{t=r,S.props=t.memoizedProps,S.state=t.memoizedState,S.componentWillUnmount()}catch(k){G(r,n,k)}}break;case 5:nn(h,h.return);break;case 22:if(h.memoizedState!==null){Qu(v);continue}}x!==null?(x.return=h,N=x):Qu(v)}y=y.sibling}e:for(y=null,v=e;;){if(v.tag===5){if(y===null){y=v;try{l=v.stateNode,c?(o=l.style,typeof o.setProperty=="function"?o.setProperty("display","none","important"):o.display="none"):(u=v.stateNode,s=v.memoizedProps.style,i=s!=null&&s.hasOwnProperty("display")?s.display:null,u.style.display=ks("display",i))}catch(k){G(e,e.return,k)}}}else if(v.tag===6){if(y===null)try{v.stateNode.nodeValue=c?"":v.memoizedProps}catch(k){G(e,e.return,k)}}else if((v.tag!==22&&v.tag!==23||v.memoizedState===null||v===e)&&v.child!==null){v.child.return=v,v=v.child;continue}if(v===e)break e;for(;v.sibling===null;){if(v.return===null||v.return===e)break e;y===v&&(y=null),v=v.return}y===v&&(y=null),v.sibling.return=v.return,v=v.sibling}}break;case 19:Re(t,e),Ve(e),r&4&&Hu(e);break;case 21:break;default:Re(t,e),Ve(e)}}function Ve(e){var t=e.flags;if(t&2){try{e:{for(var n=e.return;n!==null;){if(Ga(n)){var r=n;break e}n=n.return}throw Error(w(160))}switch(r.tag){case 5:var l=r.stateNode;r.flags&32&&(Wn(l,""),r.flags&=-33);var o=Bu(e);Wo(e,o,l);break;case 3:case 4:var i=r.stateNode.containerInfo,u=Bu(e);Ho(e,u,i);break;default:throw Error(w(161))}}catch(s){G(e,e.return,s)}e.flags&=-3}t&4096&&(e.flags&=-4097)}function Pd(e,t,n){N=e,Ja(e)}function Ja(e,t,n){for(var r=(e.mode&1)!==0;N!==null;){var l=N,o=l.child;if(l.tag===22&&r){var i=l.memoizedState!==null||Nr;if(!i){var u=l.alternate,s=u!==null&&u.memoizedState!==null||se;u=Nr;var c=se;if(Nr=i,(se=s)&&!c)for(N=l;N!==null;)i=N,s=i.child,i.tag===22&&i.memoizedState!==null?Ku(l):s!==null?(s.return=i,N=s):Ku(l);for(;o!==null;)N=o,Ja(o),o=o.sibling;N=l,Nr=u,se=c}Wu(e)}else l.subtreeFlags&8772&&o!==null?(o.return=l,N=o):Wu(e)}}function Wu(e){for(;N!==null;){var t=N;if(t.flags&8772){var n=t.alternate;try{if(t.flags&8772)switch(t.tag){case 0:case 11:case 15:se||wl(5,t);break;case 1:var r=t.stateNode;if(t.flags&4&&!se)if(n===null)r.componentDidMount();else{var l=t.elementType===t.type?n.memoizedProps:Oe(t.type,n.memoizedProps);r.componentDidUpdate(l,n.memoizedState,r.__reactInternalSnapshotBeforeUpdate)}var o=t.updateQueue;o!==null&&ju(t,o,r);break;case 3:var i=t.updateQueue;if(i!==null){if(n=null,t.child!==null)switch(t.child.tag){case 5:n=t.child.stateNode;break;case 1:n=t.child.stateNode}ju(t,i,n)}break;case 5:var u=t.stateNode;if(n===null&&t.flags&4){n=u;var s=t.memoizedProps;switch(t.type){case"button":case"input":case"select":case"textarea":s.autoFocus&&n.focus();break;case"img":s.src&&(n.src=s.src)}}break;case 6:break;case 4:break;case 12:break;case 13:if(t.memoizedState===null){var c=t.alternate;if(c!==null){var y=c.memoizedState;if(y!==null){var v=y.dehydrated;v!==null&&Gn(v)}}}break;case 19:case 17:case 21:case 22:case 23:case 25:break;default:throw Error(w(163))}se||t.flags&512&&Bo(t)}catch(h){G(t,t.return,h)}}if(t===e){N=null;break}if(n=t.sibling,n!==null){n.return=t.return,N=n;break}N=t.return}}function Qu(e){for(;N!==null;){var t=N;if(t===e){N=null;break}var n=t.sibling;if(n!==null){n.return=t.return,N=n;break}N=t.return}}function Ku(e){for(;N!==null;){var t=N;try{switch(t.tag){case 0:case 11:case 15:var n=t.return;try{wl(4,t)}catch(s){G(t,n,s)}break;case 1:var r=t.stateNode;if(typeof r.componentDidMount=="function"){var l=t.return;try{r.componentDidMount()}catch(s){G(t,l,s)}}var o=t.return;try{Bo(t)}catch(s){G(t,o,s)}break;case 5:var i=t.return;try{Bo(t)}catch(s){G(t,i,s)}}}catch(s){G(t,t.return,s)}if(t===e){N=null;break}var u=t.sibling;if(u!==null){u.return=t.return,N=u;break}N=t.return}}var jd=Math.ceil,ol=nt.ReactCurrentDispatcher,Mi=nt.ReactCurrentOwner,Te=nt.ReactCurrentBatchConfig,O=0,te=null,J=null,le=0,xe=0,rn=Nt(0),b=0,or=null,$t=0,xl=0,Ri=0,Vn=null,me=null,Oi=0,yn=1/0,Ye=null,il=!1,Qo=null,wt=null,_r=!1,pt=null,ul=0,Bn=0,Ko=null,Fr=-1,Ur=0;function fe(){return O&6?X():Fr!==-1?Fr:Fr=X()}function xt(e){return e.mode&1?O&2&&le!==0?le&-le:fd.transition!==null?(Ur===0&&(Ur=Ds()),Ur):(e=D,e!==0||(e=window.event,e=e===void 0?16:Bs(e.type)),e):1}function Ue(e,t,n,r){if(50<Bn)throw Bn=0,Ko=null,Error(w(185));ur(e,n,r),(!(O&2)||e!==te)&&(e===te&&(!(O&2)&&(xl|=n),b===4&&ct(e,le)),we(e,r),n===1&&O===0&&!(t.mode&1)&&(yn=X()+500,vl&&_t()))}function we(e,t){var n=e.callbackNode;ff(e,t);var r=Wr(e,e===te?le:0);if(r===0)n!==null&&tu(n),e.callbackNode=null,e.callbackPriority=0;else if(t=r&-r,e.callbackPriority!==t){if(n!=null&&tu(n),t===1)e.tag===0?cd(Yu.bind(null,e)):ua(Yu.bind(null,e)),id(function(){!(O&6)&&_t()}),n=null;else{switch(Is(r)){case 1:n=ii;break;case 4:n=Rs;break;case 16:n=Hr;break;case 536870912:n=Os;break;default:n=Hr}n=oc(n,qa.bind(null,e))}e.callbackPriority=t,e.callbackNode=n}}function qa(e,t){if(Fr=-1,Ur=0,O&6)throw Error(w(327));var n=e.callbackNode;if(cn()&&e.callbackNode!==n)return null;var r=Wr(e,e===te?le:0);if(r===0)return null;if(r&30||r&e.expiredLanes||t)t=sl(e,r);else{t=r;var l=O;O|=2;var o=ec();(te!==e||le!==t)&&(Ye=null,yn=X()+500,Ot(e,t));do try{Ld();break}catch(u){ba(e,u)}while(!0);wi(),ol.current=o,O=l,J!==null?t=0:(te=null,le=0,t=b)}if(t!==0){if(t===2&&(l=wo(e),l!==0&&(r=l,t=Yo(e,l))),t===1)throw n=or,Ot(e,0),ct(e,r),we(e,X()),n;if(t===6)ct(e,r);else{if(l=e.current.alternate,!(r&30)&&!zd(l)&&(t=sl(e,r),t===2&&(o=wo(e),o!==0&&(r=o,t=Yo(e,o))),t===1))throw n=or,Ot(e,0),ct(e,r),we(e,X()),n;switch(e.finishedWork=l,e.finishedLanes=r,t){case 0:case 1:throw Error(w(345));case 2:Tt(e,me,Ye);break;case 3:if(ct(e,r),(r&130023424)===r&&(t=Oi+500-X(),10<t)){if(Wr(e,0)!==0)break;if(l=e.suspendedLanes,(l&r)!==r){fe(),e.pingedLanes|=e.suspendedLanes&l;break}e.timeoutHandle=Po(Tt.bind(null,e,me,Ye),t);break}Tt(e,me,Ye);break;case 4:if(ct(e,r),(r&4194240)===r)break;for(t=e.eventTimes,l=-1;0<r;){var i=31-Fe(r);o=1<<i,i=t[i],i>l&&(l=i),r&=~o}if(r=l,r=X()-r,r=(120>r?120:480>r?480:1080>r?1080:1920>r?1920:3e3>r?3e3:4320>r?4320:1960*jd(r/1960))-r,10<r){e.timeoutHandle=Po(Tt.bind(null,e,me,Ye),r);break}Tt(e,me,Ye);break;case 5:Tt(e,me,Ye);break;default:throw Error(w(329))}}}return we(e,X()),e.callbackNode===n?qa.bind(null,e):null}function Yo(e,t){var n=Vn;return e.current.memoizedState.isDehydrated&&(Ot(e,t).flags|=256),e=sl(e,t),e!==2&&(t=me,me=n,t!==null&&Go(t)),e}function Go(e){me===null?me=e:me.push.apply(me,e)}function zd(e){for(var t=e;;){if(t.flags&16384){var n=t.updateQueue;if(n!==null&&(n=n.stores,n!==null))for(var r=0;r<n.length;r++){var l=n[r],o=l.getSnapshot;l=l.value;try{if(!$e(o(),l))return!1}catch{return!1}}}if(n=t.child,t.subtreeFlags&16384&&n!==null)n.return=t,t=n;else{if(t===e)break;for(;t.sibling===null;){if(t.return===null||t.return===e)return!0;t=t.return}t.sibling.return=t.return,t=t.sibling}}return!0}function ct(e,t){for(t&=~Ri,t&=~xl,e.suspendedLanes|=t,e.pingedLanes&=~t,e=e.expirationTimes;0<t;){var n=31-Fe(t),r=1<<n;e[n]=-1,t&=~r}}function Yu(e){if(O&6)throw Error(w(327));cn();var t=Wr(e,0);if(!(t&1))return we(e,X()),null;var n=sl(e,t);if(e.tag!==0&&n===2){var r=wo(e);r!==0&&(t=r,n=Yo(e,r))}if(n===1)throw n=or,Ot(e,0),ct(e,t),we(e,X()),n;if(n===6)throw Error(w(345));return e.finishedWork=e.current.alternate,e.finishedLanes=t,Tt(e,me,Ye),we(e,X()),null}function Di(e,t){var n=O;O|=1;try{return e(t)}finally{O=n,O===0&&(yn=X()+500,vl&&_t())}}function At(e){pt!==null&&pt.tag===0&&!(O&6)&&cn();var t=O;O|=1;var n=Te.transition,r=D;try{if(Te.transition=null,D=1,e)return e()}finally{D=r,Te.transition=n,O=t,!(O&6)&&_t()}}function Ii(){xe=rn.current,V(rn)}function Ot(e,t){e.finishedWork=null,e.finishedLanes=0;var n=e.timeoutHandle;if(n!==-1&&(e.timeoutHandle=-1,od(n)),J!==null)for(n=J.return;n!==null;){var r=n;switch(vi(r),r.tag){case 1:r=r.type.childContextTypes,r!=null&&Xr();break;case 3:mn(),V(ye),V(ae),Ni();break;case 5:Ei(r);break;case 4:mn();break;case 13:V(Q);break;case 19:V(Q);break;case 10:xi(r.type._context);break;case 22:case 23:Ii()}n=n.return}if(te=e,J=e=St(e.current,null),le=xe=t,b=0,or=null,Ri=xl=$t=0,me=Vn=null,Mt!==null){for(t=0;t<Mt.length;t++)if(n=Mt[t],r=n.interleaved,r!==null){n.interleaved=null;var l=r.next,o=n.pending;if(o!==null){var i=o.next;o.next=l,r.next=i}n.pending=r}Mt=null}return e}function ba(e,t){do{var n=J;try{if(wi(),Or.current=ll,rl){for(var r=K.memoizedState;r!==null;){var l=r.queue;l!==null&&(l.pending=null),r=r.next}rl=!1}if(Ut=0,ee=q=K=null,$n=!1,nr=0,Mi.current=null,n===null||n.return===null){b=1,or=t,J=null;break}e:{var o=e,i=n.return,u=n,s=t;if(t=le,u.flags|=32768,s!==null&&typeof s=="object"&&typeof s.then=="function"){var c=s,y=u,v=y.tag;if(!(y.mode&1)&&(v===0||v===11||v===15)){var h=y.alternate;h?(y.updateQueue=h.updateQueue,y.memoizedState=h.memoizedState,y.lanes=h.lanes):(y.updateQueue=null,y.memoizedState=null)}var x=Ou(i);if(x!==null){x.flags&=-257,Du(x,i,u,o,t),x.mode&1&&Ru(o,c,t),t=x,s=c;var S=t.updateQueue;if(S===null){var k=new Set;k.add(s),t.updateQueue=k}else S.add(s);break e}else{if(!(t&1)){Ru(o,c,t),Fi();break e}s=Error(w(426))}}else if(H&&u.mode&1){var I=Ou(i);if(I!==null){!(I.flags&65536)&&(I.flags|=256),Du(I,i,u,o,t),yi(vn(s,u));break e}}o=s=vn(s,u),b!==4&&(b=2),Vn===null?Vn=[o]:Vn.push(o),o=i;do{switch(o.tag){case 3:o.flags|=65536,t&=-t,o.lanes|=t;var f=Ia(o,s,t);Pu(o,f);break e;case 1:u=s;var a=o.type,d=o.stateNode;if(!(o.flags&128)&&(typeof a.getDerivedStateFromError=="function"||d!==null&&typeof d.componentDidCatch=="function"&&(wt===null||!wt.has(d)))){o.flags|=65536,t&=-t,o.lanes|=t;var g=Fa(o,u,t);Pu(o,g);break e}}o=o.return}while(o!==null)}nc(n)}catch(C){t=C,J===n&&n!==null&&(J=n=n.return);continue}break}while(!0)}function ec(){var e=ol.current;return ol.current=ll,e===null?ll:e}function Fi(){(b===0||b===3||b===2)&&(b=4),te===null||!($t&268435455)&&!(xl&268435455)||ct(te,le)}function sl(e,t){var n=O;O|=2;var r=ec();(te!==e||le!==t)&&(Ye=null,Ot(e,t));do try{Td();break}catch(l){ba(e,l)}while(!0);if(wi(),O=n,ol.current=r,J!==null)throw Error(w(261));return te=null,le=0,b}function Td(){for(;J!==null;)tc(J)}function Ld(){for(;J!==null&&!tf();)tc(J)}function tc(e){var t=lc(e.alternate,e,xe);e.memoizedProps=e.pendingProps,t===null?nc(e):J=t,Mi.current=null}function nc(e){var t=e;do{var n=t.alternate;if(e=t.return,t.flags&32768){if(n=Ed(n,t),n!==null){n.flags&=32767,J=n;return}if(e!==null)e.flags|=32768,e.subtreeFlags=0,e.deletions=null;else{b=6,J=null;return}}else if(n=Cd(n,t,xe),n!==null){J=n;return}if(t=t.sibling,t!==null){J=t;return}J=t=e}while(t!==null);b===0&&(b=5)}function Tt(e,t,n){var r=D,l=Te.transition;try{Te.transition=null,D=1,Md(e,t,n,r)}finally{Te.transition=l,D=r}return null}function Md(e,t,n,r){do cn();while(pt!==null);if(O&6)throw Error(w(327));n=e.finishedWork;var l=e.finishedLanes;if(n===null)return null;if(e.finishedWork=null,e.finishedLanes=0,n===e.current)throw Error(w(177));e.callbackNode=null,e.callbackPriority=0;var o=n.lanes|n.childLanes;if(df(e,o),e===te&&(J=te=null,le=0),!(n.subtreeFlags&2064)&&!(n.flags&2064)||_r||(_r=!0,oc(Hr,function(){return cn(),null})),o=(n.flags&15990)!==0,n.subtreeFlags&15990||o){o=Te.transition,Te.transition=null;var i=D;D=1;var u=O;O|=4,Mi.current=null,_d(e,n),Za(n,e),qf(No),Qr=!!Eo,No=Eo=null,e.current=n,Pd(n),nf(),O=u,D=i,Te.transition=o}else e.current=n;if(_r&&(_r=!1,pt=e,ul=l),o=e.pendingLanes,o===0&&(wt=null),of(n.stateNode),we(e,X()),t!==null)for(r=e.onRecoverableError,n=0;n<t.length;n++)l=t[n],r(l.value,{componentStack:l.stack,digest:l.digest});if(il)throw il=!1,e=Qo,Qo=null,e;return ul&1&&e.tag!==0&&cn(),o=e.pendingLanes,o&1?e===Ko?Bn++:(Bn=0,Ko=e):Bn=0,_t(),null}function cn(){if(pt!==null){var e=Is(ul),t=Te.transition,n=D;try{if(Te.transition=null,D=16>e?16:e,pt===null)var r=!1;else{if(e=pt,pt=null,ul=0,O&6)throw Error(w(331));var l=O;for(O|=4,N=e.current;N!==null;){var o=N,i=o.child;if(N.flags&16){var u=o.deletions;if(u!==null){for(var s=0;s<u.length;s++){var c=u[s];for(N=c;N!==null;){var y=N;switch(y.tag){case 0:case 11:case 15:An(8,y,o)}var v=y.child;if(v!==null)v.return=y,N=v;else for(;N!==null;){y=N;var h=y.sibling,x=y.return;if(Ya(y),y===c){N=null;break}if(h!==null){h.return=x,N=h;break}N=x}}}var S=o.alternate;if(S!==null){var k=S.child;if(k!==null){S.child=null;do{var I=k.sibling;k.sibling=null,k=I}while(k!==null)}}N=o}}if(o.subtreeFlags&2064&&i!==null)i.return=o,N=i;else e:for(;N!==null;){if(o=N,o.flags&2048)switch(o.tag){case 0:case 11:case 15:An(9,o,o.return)}var f=o.sibling;if(f!==null){f.return=o.return,N=f;break e}N=o.return}}var a=e.current;for(N=a;N!==null;){i=N;var d=i.child;if(i.subtreeFlags&2064&&d!==null)d.return=i,N=d;else e:for(i=a;N!==null;){if(u=N,u.flags&2048)try{switch(u.tag){case 0:case 11:case 15:wl(9,u)}}catch(C){G(u,u.return,C)}if(u===i){N=null;break e}var g=u.sibling;if(g!==null){g.return=u.return,N=g;break e}N=u.return}}if(O=l,_t(),We&&typeof We.onPostCommitFiberRoot=="function")try{We.onPostCommitFiberRoot(fl,e)}catch{}r=!0}return r}finally{D=n,Te.transition=t}}return!1}function Gu(e,t,n){t=vn(n,t),t=Ia(e,t,1),e=gt(e,t,1),t=fe(),e!==null&&(ur(e,1,t),we(e,t))}function G(e,t,n){if(e.tag===3)Gu(e,e,n);else for(;t!==null;){if(t.tag===3){Gu(t,e,n);break}else if(t.tag===1){var r=t.stateNode;if(typeof t.type.getDerivedStateFromError=="function"||typeof r.componentDidCatch=="function"&&(wt===null||!wt.has(r))){e=vn(n,e),e=Fa(t,e,1),t=gt(t,e,1),e=fe(),t!==null&&(ur(t,1,e),we(t,e));break}}t=t.return}}function Rd(e,t,n){var r=e.pingCache;r!==null&&r.delete(t),t=fe(),e.pingedLanes|=e.suspendedLanes&n,te===e&&(le&n)===n&&(b===4||b===3&&(le&130023424)===le&&500>X()-Oi?Ot(e,0):Ri|=n),we(e,t)}function rc(e,t){t===0&&(e.mode&1?(t=vr,vr<<=1,!(vr&130023424)&&(vr=4194304)):t=1);var n=fe();e=et(e,t),e!==null&&(ur(e,t,n),we(e,n))}function Od(e){var t=e.memoizedState,n=0;t!==null&&(n=t.retryLane),rc(e,n)}function Dd(e,t){var n=0;switch(e.tag){case 13:var r=e.stateNode,l=e.memoizedState;l!==null&&(n=l.retryLane);break;case 19:r=e.stateNode;break;default:throw Error(w(314))}r!==null&&r.delete(t),rc(e,n)}var lc;lc=function(e,t,n){if(e!==null)if(e.memoizedProps!==t.pendingProps||ye.current)ve=!0;else{if(!(e.lanes&n)&&!(t.flags&128))return ve=!1,kd(e,t,n);ve=!!(e.flags&131072)}else ve=!1,H&&t.flags&1048576&&sa(t,qr,t.index);switch(t.lanes=0,t.tag){case 2:var r=t.type;Ir(e,t),e=t.pendingProps;var l=dn(t,ae.current);an(t,n),l=Pi(null,t,r,e,l,n);var o=ji();return t.flags|=1,typeof l=="object"&&l!==null&&typeof l.render=="function"&&l.$$typeof===void 0?(t.tag=1,t.memoizedState=null,t.updateQueue=null,ge(r)?(o=!0,Zr(t)):o=!1,t.memoizedState=l.state!==null&&l.state!==void 0?l.state:null,ki(t),l.updater=gl,t.stateNode=l,l._reactInternals=t,Oo(t,r,e,n),t=Fo(null,t,r,!0,o,n)):(t.tag=0,H&&o&&mi(t),ce(null,t,l,n),t=t.child),t;case 16:r=t.elementType;e:{switch(Ir(e,t),e=t.pendingProps,l=r._init,r=l(r._payload),t.type=r,l=t.tag=Fd(r),e=Oe(r,e),l){case 0:t=Io(null,t,r,e,n);break e;case 1:t=Uu(null,t,r,e,n);break e;case 11:t=Iu(null,t,r,e,n);break e;case 14:t=Fu(null,t,r,Oe(r.type,e),n);break e}throw Error(w(306,r,""))}return t;case 0:return r=t.type,l=t.pendingProps,l=t.elementType===r?l:Oe(r,l),Io(e,t,r,l,n);case 1:return r=t.type,l=t.pendingProps,l=t.elementType===r?l:Oe(r,l),Uu(e,t,r,l,n);case 3:e:{if(Va(t),e===null)throw Error(w(387));r=t.pendingProps,o=t.memoizedState,l=o.element,ha(e,t),tl(t,r,null,n);var i=t.memoizedState;if(r=i.element,o.isDehydrated)if(o={element:r,isDehydrated:!1,cache:i.cache,pendingSuspenseBoundaries:i.pendingSuspenseBoundaries,transitions:i.transitions},t.updateQueue.baseState=o,t.memoizedState=o,t.flags&256){l=vn(Error(w(423)),t),t=$u(e,t,r,n,l);break e}else if(r!==l){l=vn(Error(w(424)),t),t=$u(e,t,r,n,l);break e}else for(Se=yt(t.stateNode.containerInfo.firstChild),ke=t,H=!0,Ie=null,n=da(t,null,r,n),t.child=n;n;)n.flags=n.flags&-3|4096,n=n.sibling;else{if(pn(),r===l){t=tt(e,t,n);break e}ce(e,t,r,n)}t=t.child}return t;case 5:return ma(t),e===null&&Lo(t),r=t.type,l=t.pendingProps,o=e!==null?e.memoizedProps:null,i=l.children,_o(r,l)?i=null:o!==null&&_o(r,o)&&(t.flags|=32),Aa(e,t),ce(e,t,i,n),t.child;case 6:return e===null&&Lo(t),null;case 13:return Ba(e,t,n);case 4:return Ci(t,t.stateNode.containerInfo),r=t.pendingProps,e===null?t.child=hn(t,null,r,n):ce(e,t,r,n),t.child;case 11:return r=t.type,l=t.pendingProps,l=t.elementType===r?l:Oe(r,l),Iu(e,t,r,l,n);case 7:return ce(e,t,t.pendingProps,n),t.child;case 8:return ce(e,t,t.pendingProps.children,n),t.child;case 12:return ce(e,t,t.pendingProps.children,n),t.child;case 10:e:{if(r=t.type._context,l=t.pendingProps,o=t.memoizedProps,i=l.value,F(br,r._currentValue),r._currentValue=i,o!==null)if($e(o.value,i)){if(o.children===l.children&&!ye.current){t=tt(e,t,n);break e}}else for(o=t.child,o!==null&&(o.return=t);o!==null;){var u=o.dependencies;if(u!==null){i=o.child;for(var s=u.firstContext;s!==null;){if(s.context===r){if(o.tag===1){s=Je(-1,n&-n),s.tag=2;var c=o.updateQueue;if(c!==null){c=c.shared;var y=c.pending;y===null?s.next=s:(s.next=y.next,y.next=s),c.pending=s}}o.lanes|=n,s=o.alternate,s!==null&&(s.lanes|=n),Mo(o.return,n,t),u.lanes|=n;break}s=s.next}}else if(o.tag===10)i=o.type===t.type?null:o.child;else if(o.tag===18){if(i=o.return,i===null)throw Error(w(341));i.lanes|=n,u=i.alternate,u!==null&&(u.lanes|=n),Mo(i,n,t),i=o.sibling}else i=o.child;if(i!==null)i.return=o;else for(i=o;i!==null;){if(i===t){i=null;break}if(o=i.sibling,o!==null){o.return=i.return,i=o;break}i=i.return}o=i}ce(e,t,l.children,n),t=t.child}return t;case 9:return l=t.type,r=t.pendingProps.children,an(t,n),l=Le(l),r=r(l),t.flags|=1,ce(e,t,r,n),t.child;case 14:return r=t.type,l=Oe(r,t.pendingProps),l=Oe(r.type,l),Fu(e,t,r,l,n);case 15:return Ua(e,t,t.type,t.pendingProps,n);case 17:return r=t.type,l=t.pendingProps,l=t.elementType===r?l:Oe(r,l),Ir(e,t),t.tag=1,ge(r)?(e=!0,Zr(t)):e=!1,an(t,n),Da(t,r,l),Oo(t,r,l,n),Fo(null,t,r,!0,e,n);case 19:return Ha(e,t,n);case 22:return $a(e,t,n)}throw Error(w(156,t.tag))};function oc(e,t){return Ms(e,t)}function Id(e,t,n,r){this.tag=e,this.key=n,this.sibling=this.child=this.return=this.stateNode=this.type=this.elementType=null,this.index=0,this.ref=null,this.pendingProps=t,this.dependencies=this.memoizedState=this.updateQueue=this.memoizedProps=null,this.mode=r,this.subtreeFlags=this.flags=0,this.deletions=null,this.childLanes=this.lanes=0,this.alternate=null}function ze(e,t,n,r){return new Id(e,t,n,r)}function Ui(e){return e=e.prototype,!(!e||!e.isReactComponent)}function Fd(e){if(typeof e=="function")return Ui(e)?1:0;if(e!=null){if(e=e.$$typeof,e===ri)return 11;if(e===li)return 14}return 2}function St(e,t){var n=e.alternate;return n===null?(n=ze(e.tag,t,e.key,e.mode),n.elementType=e.elementType,n.type=e.type,n.stateNode=e.stateNode,n.alternate=e,e.alternate=n):(n.pendingProps=t,n.type=e.type,n.flags=0,n.subtreeFlags=0,n.deletions=null),n.flags=e.flags&14680064,n.childLanes=e.childLanes,n.lanes=e.lanes,n.child=e.child,n.memoizedProps=e.memoizedProps,n.memoizedState=e.memoizedState,n.updateQueue=e.updateQueue,t=e.dependencies,n.dependencies=t===null?null:{lanes:t.lanes,firstContext:t.firstContext},n.sibling=e.sibling,n.index=e.index,n.ref=e.ref,n}function $r(e,t,n,r,l,o){var i=2;if(r=e,typeof e=="function")Ui(e)&&(i=1);else if(typeof e=="string")i=5;else e:switch(e){case Yt:return Dt(n.children,l,o,t);case ni:i=8,l|=8;break;case ro:return e=ze(12,n,t,l|2),e.elementType=ro,e.lanes=o,e;case lo:return e=ze(13,n,t,l),e.elementType=lo,e.lanes=o,e;case oo:return e=ze(19,n,t,l),e.elementType=oo,e.lanes=o,e;case ms:return Sl(n,l,o,t);default:if(typeof e=="object"&&e!==null)switch(e.$$typeof){case ps:i=10;break e;case hs:i=9;break e;case ri:i=11;break e;case li:i=14;break e;case ot:i=16,r=null;break e}throw Error(w(130,e==null?e:typeof e,""))}return t=ze(i,n,t,l),t.elementType=e,t.type=r,t.lanes=o,t}function Dt(e,t,n,r){return e=ze(7,e,r,t),e.lanes=n,e}function Sl(e,t,n,r){return e=ze(22,e,r,t),e.elementType=ms,e.lanes=n,e.stateNode={isHidden:!1},e}function bl(e,t,n){return e=ze(6,e,null,t),e.lanes=n,e}function eo(e,t,n){return t=ze(4,e.children!==null?e.children:[],e.key,t),t.lanes=n,t.stateNode={containerInfo:e.containerInfo,pendingChildren:null,implementation:e.implementation},t}function Ud(e,t,n,r,l){this.tag=t,this.containerInfo=e,this.finishedWork=this.pingCache=this.current=this.pendingChildren=null,this.timeoutHandle=-1,this.callbackNode=this.pendingContext=this.context=null,this.callbackPriority=0,this.eventTimes=Ol(0),this.expirationTimes=Ol(-1),this.entangledLanes=this.finishedLanes=this.mutableReadLanes=this.expiredLanes=this.pingedLanes=this.suspendedLanes=this.pendingLanes=0,this.entanglements=Ol(0),this.identifierPrefix=r,this.onRecoverableError=l,this.mutableSourceEagerHydrationData=null}function $i(e,t,n,r,l,o,i,u,s){return e=new Ud(e,t,n,u,s),t===1?(t=1,o===!0&&(t|=8)):t=0,o=ze(3,null,null,t),e.current=o,o.stateNode=e,o.memoizedState={element:r,isDehydrated:n,cache:null,transitions:null,pendingSuspenseBoundaries:null},ki(o),e}function $d(e,t,n){var r=3<arguments.length&&arguments[3]!==void 0?arguments[3]:null;return{$$typeof:Kt,key:r==null?null:""+r,children:e,containerInfo:t,implementation:n}}function ic(e){if(!e)return Ct;e=e._reactInternals;e:{if(Bt(e)!==e||e.tag!==1)throw Error(w(170));var t=e;do{switch(t.tag){case 3:t=t.stateNode.context;break e;case 1:if(ge(t.type)){t=t.stateNode.__reactInternalMemoizedMergedChildContext;break e}}t=t.return}while(t!==null);throw Error(w(171))}if(e.tag===1){var n=e.type;if(ge(n))return ia(e,n,t)}return t}function uc(e,t,n,r,l,o,i,u,s){return e=$i(n,r,!0,e,l,o,i,u,s),e.context=ic(null),n=e.current,r=fe(),l=xt(n),o=Je(r,l),o.callback=t??null,gt(n,o,l),e.current.lanes=l,ur(e,l,r),we(e,r),e}function kl(e,t,n,r){var l=t.current,o=fe(),i=xt(l);return n=ic(n),t.context===null?t.context=n:t.pendingContext=n,t=Je(o,i),t.payload={element:e},r=r===void 0?null:r,r!==null&&(t.callback=r),e=gt(l,t,i),e!==null&&(Ue(e,l,i,o),Rr(e,l,i)),i}function al(e){if(e=e.current,!e.child)return null;switch(e.child.tag){case 5:return e.child.stateNode;default:return e.child.stateNode}}function Xu(e,t){if(e=e.memoizedState,e!==null&&e.dehydrated!==null){var n=e.retryLane;e.retryLane=n!==0&&n<t?n:t}}function Ai(e,t){Xu(e,t),(e=e.alternate)&&Xu(e,t)}function Ad(){return null}var sc=typeof reportError=="function"?reportError:function(e){console.error(e)};function Vi(e){this._internalRoot=e}Cl.prototype.render=Vi.prototype.render=function(e){var t=this._internalRoot;if(t===null)throw Error(w(409));kl(e,t,null,null)};Cl.prototype.unmount=Vi.prototype.unmount=function(){var e=this._internalRoot;if(e!==null){this._internalRoot=null;var t=e.containerInfo;At(function(){kl(null,e,null,null)}),t[be]=null}};function Cl(e){this._internalRoot=e}Cl.prototype.unstable_scheduleHydration=function(e){if(e){var t=$s();e={blockedOn:null,target:e,priority:t};for(var n=0;n<at.length&&t!==0&&t<at[n].priority;n++);at.splice(n,0,e),n===0&&Vs(e)}};function Bi(e){return!(!e||e.nodeType!==1&&e.nodeType!==9&&e.nodeType!==11)}function El(e){return!(!e||e.nodeType!==1&&e.nodeType!==9&&e.nodeType!==11&&(e.nodeType!==8||e.nodeValue!==" react-mount-point-unstable "))}function Zu(){}function Vd(e,t,n,r,l){if(l){if(typeof r=="function"){var o=r;r=function(){var c=al(i);o.call(c)}}var i=uc(t,r,e,0,null,!1,!1,"",Zu);return e._reactRootContainer=i,e[be]=i.current,Jn(e.nodeType===8?e.parentNode:e),At(),i}for(;l=e.lastChild;)e.removeChild(l);if(typeof r=="function"){var u=r;r=function(){var c=al(s);u.call(c)}}var s=$i(e,0,!1,null,null,!1,!1,"",Zu);return e._reactRootContainer=s,e[be]=s.current,Jn(e.nodeType===8?e.parentNode:e),At(function(){kl(t,s,n,r)}),s}function Nl(e,t,n,r,l){var o=n._reactRootContainer;if(o){var i=o;if(typeof l=="function"){var u=l;l=function(){var s=al(i);u.call(s)}}kl(t,i,e,l)}else i=Vd(n,t,e,l,r);return al(i)}Fs=function(e){switch(e.tag){case 3:var t=e.stateNode;if(t.current.memoizedState.isDehydrated){var n=Mn(t.pendingLanes);n!==0&&(ui(t,n|1),we(t,X()),!(O&6)&&(yn=X()+500,_t()))}break;case 13:At(function(){var r=et(e,1);if(r!==null){var l=fe();Ue(r,e,1,l)}}),Ai(e,1)}};si=function(e){if(e.tag===13){var t=et(e,134217728);if(t!==null){var n=fe();Ue(t,e,134217728,n)}Ai(e,134217728)}};Us=function(e){if(e.tag===13){var t=xt(e),n=et(e,t);if(n!==null){var r=fe();Ue(n,e,t,r)}Ai(e,t)}};$s=function(){return D};As=function(e,t){var n=D;try{return D=e,t()}finally{D=n}};vo=function(e,t,n){switch(t){case"input":if(so(e,n),t=n.name,n.type==="radio"&&t!=null){for(n=e;n.parentNode;)n=n.parentNode;for(n=n.querySelectorAll("input[name="+JSON.stringify(""+t)+'][type="radio"]'),t=0;t<n.length;t++){var r=n[t];if(r!==e&&r.form===e.form){var l=ml(r);if(!l)throw Error(w(90));ys(r),so(r,l)}}}break;case"textarea":ws(e,n);break;case"select":t=n.value,t!=null&&ln(e,!!n.multiple,t,!1)}};_s=Di;Ps=At;var Bd={usingClientEntryPoint:!1,Events:[ar,Jt,ml,Es,Ns,Di]},zn={findFiberByHostInstance:Lt,bundleType:0,version:"18.3.1",rendererPackageName:"react-dom"},Hd={bundleType:zn.bundleType,version:zn.version,rendererPackageName:zn.rendererPackageName,rendererConfig:zn.rendererConfig,overrideHookState:null,overrideHookStateDeletePath:null,overrideHookStateRenamePath:null,overrideProps:null,overridePropsDeletePath:null,overridePropsRenamePath:null,setErrorHandler:null,setSuspenseHandler:null,scheduleUpdate:null,currentDispatcherRef:nt.ReactCurrentDispatcher,findHostInstanceByFiber:function(e){return e=Ts(e),e===null?null:e.stateNode},findFiberByHostInstance:zn.findFiberByHostInstance||Ad,findHostInstancesForRefresh:null,scheduleRefresh:null,scheduleRoot:null,setRefreshHandler:null,getCurrentFiber:null,reconcilerVersion:"18.3.1-next-f1338f8080-20240426"};if(typeof __REACT_DEVTOOLS_GLOBAL_HOOK__<"u"){var Pr=__REACT_DEVTOOLS_GLOBAL_HOOK__;if(!Pr.isDisabled&&Pr.supportsFiber)try{fl=Pr.inject(Hd),We=Pr}catch{}}Ee.__SECRET_INTERNALS_DO_NOT_USE_OR_YOU_WILL_BE_FIRED=Bd;Ee.createPortal=function(e,t){var n=2<arguments.length&&arguments[2]!==void 0?arguments[2]:null;if(!Bi(t))throw Error(w(200));return $d(e,t,null,n)};Ee.createRoot=function(e,t){if(!Bi(e))throw Error(w(299));var n=!1,r="",l=sc;return t!=null&&(t.unstable_strictMode===!0&&(n=!0),t.identifierPrefix!==void 0&&(r=t.identifierPrefix),t.onRecoverableError!==void 0&&(l=t.onRecoverableError)),t=$i(e,1,!1,null,null,n,!1,r,l),e[be]=t.current,Jn(e.nodeType===8?e.parentNode:e),new Vi(t)};Ee.findDOMNode=function(e){if(e==null)return null;if(e.nodeType===1)return e;var t=e._reactInternals;if(t===void 0)throw typeof e.render=="function"?Error(w(188)):(e=Object.keys(e).join(","),Error(w(268,e)));return e=Ts(t),e=e===null?null:e.stateNode,e};Ee.flushSync=function(e){return At(e)};Ee.hydrate=function(e,t,n){if(!El(t))throw Error(w(200));return Nl(null,e,t,!0,n)};Ee.hydrateRoot=function(e,t,n){if(!Bi(e))throw Error(w(405));var r=n!=null&&n.hydratedSources||null,l=!1,o="",i=sc;if(n!=null&&(n.unstable_strictMode===!0&&(l=!0),n.identifierPrefix!==void 0&&(o=n.identifierPrefix),n.onRecoverableError!==void 0&&(i=n.onRecoverableError)),t=uc(t,null,e,1,n??null,l,!1,o,i),e[be]=t.current,Jn(e),r)for(e=0;e<r.length;e++)n=r[e],l=n._getVersion,l=l(n._source),t.mutableSourceEagerHydrationData==null?t.mutableSourceEagerHydrationData=[n,l]:t.mutableSourceEagerHydrationData.push(n,l);return new Cl(t)};Ee.render=function(e,t,n){if(!El(t))throw Error(w(200));return Nl(null,e,t,!1,n)};Ee.unmountComponentAtNode=function(e){if(!El(e))throw Error(w(40));return e._reactRootContainer?(At(function(){Nl(null,null,e,!1,function(){e._reactRootContainer=null,e[be]=null})}),!0):!1};Ee.unstable_batchedUpdates=Di;Ee.unstable_renderSubtreeIntoContainer=function(e,t,n,r){if(!El(n))throw Error(w(200));if(e==null||e._reactInternals===void 0)throw Error(w(38));return Nl(e,t,n,!1,r)};Ee.version="18.3.1-next-f1338f8080-20240426";function ac(){if(!(typeof __REACT_DEVTOOLS_GLOBAL_HOOK__>"u"||typeof __REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE!="function"))try{__REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE(ac)}catch(e){console.error(e)}}ac(),as.exports=Ee;var Wd=as.exports,cc,Ju=Wd;cc=Ju.createRoot,Ju.hydrateRoot;const fc="data:image/svg+xml,%3c?xml%20version='1.0'%20encoding='utf-8'?%3e%3c!--%20Uploaded%20to:%20SVG%20Repo,%20www.svgrepo.com,%20Generator:%20SVG%20Repo%20Mixer%20Tools%20--%3e%3csvg%20fill='%23000000'%20width='800px'%20height='800px'%20viewBox='0%200%2024%2024'%20role='img'%20xmlns='http://www.w3.org/2000/svg'%3e%3ctitle%3eOpenAI%20icon%3c/title%3e%3cpath%20d='M22.2819%209.8211a5.9847%205.9847%200%200%200-.5157-4.9108%206.0462%206.0462%200%200%200-6.5098-2.9A6.0651%206.0651%200%200%200%204.9807%204.1818a5.9847%205.9847%200%200%200-3.9977%202.9%206.0462%206.0462%200%200%200%20.7427%207.0966%205.98%205.98%200%200%200%20.511%204.9107%206.051%206.051%200%200%200%206.5146%202.9001A5.9847%205.9847%200%200%200%2013.2599%2024a6.0557%206.0557%200%200%200%205.7718-4.2058%205.9894%205.9894%200%200%200%203.9977-2.9001%206.0557%206.0557%200%200%200-.7475-7.0729zm-9.022%2012.6081a4.4755%204.4755%200%200%201-2.8764-1.0408l.1419-.0804%204.7783-2.7582a.7948.7948%200%200%200%20.3927-.6813v-6.7369l2.02%201.1686a.071.071%200%200%201%20.038.052v5.5826a4.504%204.504%200%200%201-4.4945%204.4944zm-9.6607-4.1254a4.4708%204.4708%200%200%201-.5346-3.0137l.142.0852%204.783%202.7582a.7712.7712%200%200%200%20.7806%200l5.8428-3.3685v2.3324a.0804.0804%200%200%201-.0332.0615L9.74%2019.9502a4.4992%204.4992%200%200%201-6.1408-1.6464zM2.3408%207.8956a4.485%204.485%200%200%201%202.3655-1.9728V11.6a.7664.7664%200%200%200%20.3879.6765l5.8144%203.3543-2.0201%201.1685a.0757.0757%200%200%201-.071%200l-4.8303-2.7865A4.504%204.504%200%200%201%202.3408%207.872zm16.5963%203.8558L13.1038%208.364%2015.1192%207.2a.0757.0757%200%200%201%20.071%200l4.8303%202.7913a4.4944%204.4944%200%200%201-.6765%208.1042v-5.6772a.79.79%200%200%200-.407-.667zm2.0107-3.0231l-.142-.0852-4.7735-2.7818a.7759.7759%200%200%200-.7854%200L9.409%209.2297V6.8974a.0662.0662%200%200%201%20.0284-.0615l4.8303-2.7866a4.4992%204.4992%200%200%201%206.6802%204.66zM8.3065%2012.863l-2.02-1.1638a.0804.0804%200%200%201-.038-.0567V6.0742a4.4992%204.4992%200%200%201%207.3757-3.4537l-.142.0805L8.704%205.459a.7948.7948%200%200%200-.3927.6813zm1.0976-2.3654l2.602-1.4998%202.6069%201.4998v2.9994l-2.5974%201.4997-2.6067-1.4997Z'/%3e%3c/svg%3e",dc="data:image/svg+xml,%3csvg%20width='256px'%20height='176px'%20viewBox='0%200%20256%20176'%20version='1.1'%20xmlns='http://www.w3.org/2000/svg'%20preserveAspectRatio='xMidYMid'%3e%3ctitle%3eAnthropic%3c/title%3e%3cg%20fill='%23181818'%3e%3cpath%20d='M147.486878,0%20C147.486878,0%20217.568251,175.780074%20217.568251,175.780074%20C217.568251,175.780074%20256,175.780074%20256,175.780074%20C256,175.780074%20185.918621,0%20185.918621,0%20C185.918621,0%20147.486878,0%20147.486878,0%20C147.486878,0%20147.486878,0%20147.486878,0%20Z'/%3e%3cpath%20d='M66.1828124,106.221191%20C66.1828124,106.221191%2090.1624677,44.4471185%2090.1624677,44.4471185%20C90.1624677,44.4471185%20114.142128,106.221191%20114.142128,106.221191%20C114.142128,106.221191%2066.1828124,106.221191%2066.1828124,106.221191%20C66.1828124,106.221191%2066.1828124,106.221191%2066.1828124,106.221191%20Z%20M70.0705318,0%20C70.0705318,0%200,175.780074%200,175.780074%20C0,175.780074%2039.179211,175.780074%2039.179211,175.780074%20C39.179211,175.780074%2053.5097704,138.86606%2053.5097704,138.86606%20C53.5097704,138.86606%20126.817544,138.86606%20126.817544,138.86606%20C126.817544,138.86606%20141.145724,175.780074%20141.145724,175.780074%20C141.145724,175.780074%20180.324935,175.780074%20180.324935,175.780074%20C180.324935,175.780074%20110.254409,0%20110.254409,0%20C110.254409,0%2070.0705318,0%2070.0705318,0%20C70.0705318,0%2070.0705318,0%2070.0705318,0%20Z'/%3e%3c/g%3e%3c/svg%3e",pc="/static/assets/google-gemini-logo-DNUMbM7x.svg",Qd="data:image/svg+xml,%3csvg%20viewBox='0%200%20128%20128'%20xmlns='http://www.w3.org/2000/svg'%3e%3cdefs%3e%3clinearGradient%20id='azure-original-a'%20x1='60.919'%20y1='9.602'%20x2='18.667'%20y2='134.423'%20gradientUnits='userSpaceOnUse'%3e%3cstop%20stop-color='%23114A8B'/%3e%3cstop%20offset='1'%20stop-color='%230669BC'/%3e%3c/linearGradient%3e%3clinearGradient%20id='azure-original-b'%20x1='74.117'%20y1='67.772'%20x2='64.344'%20y2='71.076'%20gradientUnits='userSpaceOnUse'%3e%3cstop%20stop-opacity='.3'/%3e%3cstop%20offset='.071'%20stop-opacity='.2'/%3e%3cstop%20offset='.321'%20stop-opacity='.1'/%3e%3cstop%20offset='.623'%20stop-opacity='.05'/%3e%3cstop%20offset='1'%20stop-opacity='0'/%3e%3c/linearGradient%3e%3clinearGradient%20id='azure-original-c'%20x1='68.742'%20y1='5.961'%20x2='115.122'%20y2='129.525'%20gradientUnits='userSpaceOnUse'%3e%3cstop%20stop-color='%233CCBF4'/%3e%3cstop%20offset='1'%20stop-color='%232892DF'/%3e%3c/linearGradient%3e%3c/defs%3e%3cpath%20d='M46.09.002h40.685L44.541%20125.137a6.485%206.485%200%2001-6.146%204.413H6.733a6.482%206.482%200%2001-5.262-2.699%206.474%206.474%200%2001-.876-5.848L39.944%204.414A6.488%206.488%200%200146.09%200z'%20fill='url(%23azure-original-a)'%20transform='translate(.587%204.468)%20scale(.91904)'/%3e%3cpath%20d='M97.28%2081.607H37.987a2.743%202.743%200%2000-1.874%204.751l38.1%2035.562a5.991%205.991%200%20004.087%201.61h33.574z'%20fill='%230078d4'/%3e%3cpath%20d='M46.09.002A6.434%206.434%200%200039.93%204.5L.644%20120.897a6.469%206.469%200%20006.106%208.653h32.48a6.942%206.942%200%20005.328-4.531l7.834-23.089%2027.985%2026.101a6.618%206.618%200%20004.165%201.519h36.396l-15.963-45.616-46.533.011L86.922.002z'%20fill='url(%23azure-original-b)'%20transform='translate(.587%204.468)%20scale(.91904)'/%3e%3cpath%20d='M98.055%204.408A6.476%206.476%200%200091.917.002H46.575a6.478%206.478%200%20016.137%204.406l39.35%20116.594a6.476%206.476%200%2001-6.137%208.55h45.344a6.48%206.48%200%20006.136-8.55z'%20fill='url(%23azure-original-c)'%20transform='translate(.587%204.468)%20scale(.91904)'/%3e%3c/svg%3e",Kd="/static/assets/openrouter-Dh806t5d.svg";function ut(e,t,n){return m.jsxs("svg",{width:t,height:t,viewBox:"0 0 24 24","aria-label":n,role:"img",children:[m.jsx("title",{children:n}),e]})}const st=({children:e})=>m.jsx("g",{fill:"none",stroke:"currentColor",strokeWidth:1.6,strokeLinecap:"round",strokeLinejoin:"round",children:e});function ft(e,t,n){return m.jsx("img",{src:e,width:n,height:n,alt:t,title:t,style:{display:"inline-block"}})}function to(e,t=16){const n=(e||"").toLowerCase();return n.includes("gpt")||n.includes("o4")||n.startsWith("openai")?ft(fc,"GPT",t):n.includes("claude")?ft(dc,"Claude",t):n.includes("gemini")?ft(pc,"Gemini",t):n.includes("llama")?ut(m.jsxs(st,{children:[m.jsx("path",{d:"M6 17c3 1 9 1 12 0"}),m.jsx("path",{d:"M8 17V9l2-2 2 2v8"}),m.jsx("path",{d:"M10 7l1-2 1 2"})]}),t,"Llama"):n.includes("mistral")||n.includes("mixtral")?ut(m.jsxs(st,{children:[m.jsx("path",{d:"M3 9h10c2 0 2-3 0-3"}),m.jsx("path",{d:"M3 15h14c3 0 3-4 0-4"})]}),t,"Mistral"):n.includes("qwen")?ut(m.jsxs(st,{children:[m.jsx("path",{d:"M6 12a6 6 0 1 1 6 6"}),m.jsx("path",{d:"M12 18l3-3"})]}),t,"Qwen"):n.includes("deepseek")?ut(m.jsxs(st,{children:[m.jsx("path",{d:"M4 12l8-8 8 8-8 8z"}),m.jsx("path",{d:"M8 12l4-4 4 4-4 4z"})]}),t,"DeepSeek"):n.includes("phi")?ut(m.jsxs(st,{children:[m.jsx("circle",{cx:"12",cy:"12",r:"7"}),m.jsx("path",{d:"M12 5v14M8 10h8"})]}),t,"Phi"):ut(m.jsx(st,{children:m.jsx("circle",{cx:"12",cy:"12",r:"8"})}),t,"Model")}function Yd(e,t=16){const n=(e||"").toLowerCase();return n.includes("openrouter")?ft(Kd,"OpenRouter",t):n.includes("openai")?ft(fc,"OpenAI",t):n.includes("anthropic")?ft(dc,"Anthropic",t):n.includes("gemini")||n.includes("google")?ft(pc,"Google",t):n.includes("azure")?ft(Qd,"Azure",t):n.includes("ollama")?ut(m.jsxs(st,{children:[m.jsx("path",{d:"M7 14a3 3 0 0 1 6 0v3H7z"}),m.jsx("path",{d:"M13 14a3 3 0 1 1 3 3"})]}),t,"Ollama"):ut(m.jsx(st,{children:m.jsx("rect",{x:"5",y:"5",width:"14",height:"14",rx:"3"})}),t,"Provider")}function Gd(e){const t=e.split(/\r?\n/),n=[];let r=0;for(;r<t.length;){const o=t[r].match(/^```\s*([\w+-]*)\s*$/);if(o){const u=o[1]||"";r++;const s=[];for(;r<t.length&&!/^```\s*$/.test(t[r]);)s.push(t[r]),r++;r<t.length&&/^```\s*$/.test(t[r])&&r++,n.push({type:"code",lang:u,code:s.join(`
-`)});continue}const i=[];for(;r<t.length&&!/^```/.test(t[r]);)i.push(t[r]),r++;i.length&&n.push({type:"text",text:i.join(`
-`)})}return n}function Xd({content:e}){const t=Gd(e);return m.jsx("div",{className:"prose prose-invert max-w-none",children:t.map((n,r)=>n.type==="text"?m.jsx("p",{className:"whitespace-pre-wrap leading-relaxed",children:n.text},r):m.jsx(Zd,{lang:n.lang,code:n.code},r))})}function Zd({lang:e,code:t}){const[n,r]=B.useState(!1),l=async()=>{try{await navigator.clipboard.writeText(t)}catch{}};return m.jsxs("div",{className:"rounded-lg border border-white/10 overflow-hidden",children:[m.jsxs("div",{className:"flex items-center justify-between px-3 py-1.5 text-xs bg-slate-800/60 border-b border-white/10",children:[m.jsx("div",{className:"uppercase tracking-wide text-slate-300",children:e||"text"}),m.jsxs("div",{className:"flex items-center gap-2",children:[m.jsx("button",{className:"px-2 py-0.5 rounded bg-white/10 hover:bg-white/15",onClick:()=>r(o=>!o),children:n?"No wrap":"Wrap"}),m.jsx("button",{className:"px-2 py-0.5 rounded bg-white/10 hover:bg-white/15",onClick:l,children:"Copy"})]})]}),m.jsx("pre",{className:`text-sm p-3 ${n?"whitespace-pre-wrap break-words":"whitespace-pre overflow-x-auto"}`,children:m.jsx("code",{children:t})})]})}function Jd(e){const t=new Date,n=new Date(t.getFullYear(),t.getMonth(),t.getDate()).getTime(),r=n-24*60*60*1e3,l=new Date(e.getFullYear(),e.getMonth(),e.getDate()).getTime();return l===n?"Today":l===r?"Yesterday":e.toLocaleDateString()}async function jt(e,t){const n=await fetch(e,t);if(!n.ok)throw new Error(`${n.status}`);return n.json()}function qd(){const[e,t]=B.useState([]),[n,r]=B.useState(""),[l,o]=B.useState(null),[i,u]=B.useState([{role:"system",content:"You are a helpful assistant."}]),[s,c]=B.useState(""),[y,v]=B.useState("openai"),[h,x]=B.useState(""),[S,k]=B.useState([]),[I,f]=B.useState(!1),[a,d]=B.useState(!1),[g,C]=B.useState(""),_=B.useRef(null),[P,z]=B.useState(!1),U=B.useMemo(()=>e.filter(p=>(p.title||"").toLowerCase().includes(n.toLowerCase())),[e,n]),L=B.useMemo(()=>{const p=U.filter($=>$.pinned),j=U.filter($=>!$.pinned),R={Today:[],Yesterday:[],Earlier:[]},Z=new Date,W=new Date(Z.getFullYear(),Z.getMonth(),Z.getDate()).getTime(),he=W-24*60*60*1e3;for(const $ of j){const _e=$.updated_at?new Date($.updated_at).getTime():0;_e>=W?R.Today.push($):_e>=he?R.Yesterday.push($):R.Earlier.push($)}return{pinned:p,byDay:R}},[U]);B.useEffect(()=>{(async()=>(await ne(),await _l()))()},[]),B.useEffect(()=>{const p=_.current;if(!p)return;const j=()=>{z(p.scrollTop+p.clientHeight<p.scrollHeight-200)};return p.addEventListener("scroll",j),j(),()=>p.removeEventListener("scroll",j)},[]),B.useEffect(()=>{const p=_.current;!p||P||(p.scrollTop=p.scrollHeight)},[i,g]);async function ne(){var j;const p=await jt("/api/conversations");t(p.conversations||[]),!l&&((j=p.conversations)!=null&&j[0])&&await Ae(p.conversations[0].id)}async function Ae(p){o(p);const j=await jt(`/api/conversations/${encodeURIComponent(p)}`);u(j.messages||[{role:"system",content:"You are a helpful assistant."}])}async function Pt(){const p=await jt("/api/conversations",{method:"POST",headers:{"Content-Type":"application/json"},body:JSON.stringify({})});o(p.id),await ne(),await Ae(p.id)}async function Sn(p){await jt(`/api/conversations/${encodeURIComponent(p.id)}`,{method:"PATCH",headers:{"Content-Type":"application/json"},body:JSON.stringify({pinned:!p.pinned})}),await ne()}async function _l(){const p=await jt("/api/settings");p.provider&&v(p.provider),await Wt(p.provider||y),p.model&&x(p.model)}async function Ht(p){l&&(await jt(`/api/conversations/${encodeURIComponent(l)}`,{method:"PATCH",headers:{"Content-Type":"application/json"},body:JSON.stringify({messages:p})}),u(p),await ne())}async function Wt(p){const j=await jt(`/api/models?provider=${encodeURIComponent(p)}`);k(j.models||[])}async function E(){const p=s.trim();if(!p||!l)return;c("");const j={role:"user",content:p},R=[...i,j];u(R);const Z=window.location.protocol==="https:"?"wss":"ws",W=new WebSocket(`${Z}://${window.location.host}/ws/chat`);f(!0);let he="";C(""),W.onopen=()=>{W.send(JSON.stringify({messages:R,provider:y,model:h,conversation_id:l,reasoning:a}))},W.onmessage=$=>{const _e=$.data;if(_e==="[END]"){f(!1),u(Pl=>[...Pl,{role:"assistant",content:he}]),C(""),ne();return}he+=_e,C(he)},W.onerror=()=>f(!1),W.onclose=()=>f(!1)}function T({m:p,idx:j}){const[R,Z]=B.useState(!1),[W,he]=B.useState(p.content),$=p.role==="user",_e=async()=>{try{await navigator.clipboard.writeText(p.content)}catch{}},Pl=async()=>{const Ke=i.filter((rt,jl)=>jl!==j);await Ht(Ke)},hc=async()=>{const Ke=i.map((rt,jl)=>jl===j?{...rt,content:W}:rt);await Ht(Ke),Z(!1)},mc=async()=>{let Ke=null;for(let rt=j-1;rt>=0;rt--)if(i[rt].role==="user"){Ke=i[rt].content;break}Ke&&(c(Ke),await E())};return m.jsxs("div",{className:`flex gap-3 ${p.role==="user"?"justify-end":""}`,children:[p.role==="assistant"&&m.jsx("div",{className:"w-8 h-8 rounded-full bg-brand flex items-center justify-center",children:to(h,16)}),m.jsxs("div",{className:`group rounded-2xl px-3 py-2 border relative ${p.role==="user"?"bg-slate-800/60 border-white/10":"bg-slate-900/60 border-white/10"} shadow-[inset_0_1px_0_rgba(255,255,255,0.05)]`,style:{maxWidth:"80%"},children:[m.jsxs("div",{className:"absolute -top-2 right-1 opacity-0 group-hover:opacity-100 transition text-xs flex gap-2",children:[m.jsx("button",{className:"px-2 py-0.5 bg-white/10 rounded",onClick:_e,children:"Copy"}),p.role==="assistant"&&m.jsx("button",{className:"px-2 py-0.5 bg-white/10 rounded",onClick:mc,children:"Regenerate"}),$&&!R&&m.jsx("button",{className:"px-2 py-0.5 bg-white/10 rounded",onClick:()=>Z(!0),children:"Edit"}),m.jsx("button",{className:"px-2 py-0.5 bg-white/10 rounded",onClick:Pl,children:"Delete"}),R&&m.jsxs(m.Fragment,{children:[m.jsx("button",{className:"px-2 py-0.5 bg-brand rounded",onClick:hc,children:"Save"}),m.jsx("button",{className:"px-2 py-0.5 bg-white/10 rounded",onClick:()=>{Z(!1),he(p.content)},children:"Cancel"})]})]}),R?m.jsx("textarea",{className:"w-full bg-slate-800/60 border border-white/10 rounded p-2 text-sm",rows:Math.min(10,Math.max(3,p.content.split(`
-`).length)),value:W,onChange:Ke=>he(Ke.target.value)}):m.jsx("div",{className:"text-slate-100 text-sm",children:p.role==="assistant"?m.jsxs(m.Fragment,{children:[p.reasoning&&m.jsx("div",{className:"mb-2 rounded-lg border border-amber-300/20 bg-amber-900/10 p-2 text-amber-200 text-xs",children:p.reasoning}),m.jsx(Xd,{content:p.content})]}):m.jsx("div",{className:"whitespace-pre-wrap",children:p.content})})]}),p.role==="user"&&m.jsx("div",{className:"w-8 h-8 rounded-full bg-brand flex items-center justify-center",children:"U"})]})}return m.jsxs("div",{className:"h-screen grid grid-cols-[300px_1fr] gap-0",children:[m.jsxs("aside",{className:"glass border-r",children:[m.jsxs("div",{className:"p-3 flex items-center gap-2",children:[m.jsx("button",{className:"btn-primary",onClick:Pt,children:"New"}),m.jsx("input",{className:"ml-auto bg-slate-800/60 border border-white/10 rounded px-2 py-1 w-full",placeholder:"Search",value:n,onChange:p=>r(p.target.value)})]}),m.jsxs("div",{className:"px-3 space-y-3 overflow-y-auto h-[calc(100vh-48px)]",children:[L.pinned.length>0&&m.jsxs("div",{children:[m.jsx("div",{className:"px-2 py-1 text-xs uppercase tracking-wide text-slate-400",children:"Pinned"}),m.jsx("div",{className:"space-y-1",children:L.pinned.map(p=>m.jsxs("div",{className:`flex items-center gap-2 px-2 py-2 rounded hover:bg-white/5 cursor-pointer ${p.id===l?"bg-white/10":""}`,onClick:()=>Ae(p.id),children:[m.jsxs("div",{className:"flex-1 truncate",children:[m.jsx("div",{className:"text-sm font-medium",children:p.title||"Conversation"}),m.jsx("div",{className:"text-xs text-slate-400",children:p.updated_at?new Date(p.updated_at).toLocaleString():""})]}),m.jsx("button",{className:"text-yellow-400",title:p.pinned?"Unpin":"Pin",onClick:j=>{j.stopPropagation(),Sn(p)},children:p.pinned?"★":"☆"})]},p.id))})]}),["Today","Yesterday","Earlier"].map(p=>L.byDay[p].length>0&&m.jsxs("div",{children:[m.jsx("div",{className:"px-2 py-1 text-xs uppercase tracking-wide text-slate-400",children:p}),m.jsx("div",{className:"space-y-1",children:L.byDay[p].map(j=>m.jsxs("div",{className:`flex items-center gap-2 px-2 py-2 rounded hover:bg-white/5 cursor-pointer ${j.id===l?"bg-white/10":""}`,onClick:()=>Ae(j.id),children:[m.jsxs("div",{className:"flex-1 truncate",children:[m.jsx("div",{className:"text-sm font-medium",children:j.title||"Conversation"}),m.jsx("div",{className:"text-xs text-slate-400",children:j.updated_at?new Date(j.updated_at).toLocaleString():""})]}),m.jsx("button",{className:"text-yellow-400",title:j.pinned?"Unpin":"Pin",onClick:R=>{R.stopPropagation(),Sn(j)},children:j.pinned?"★":"☆"})]},j.id))})]},p))]})]}),m.jsxs("main",{className:"flex flex-col min-h-0",children:[m.jsxs("header",{className:"glass flex items-center justify-between px-4 py-2 border-b",children:[m.jsx("h1",{className:"font-semibold",children:"ChatUI"}),m.jsxs("div",{className:"flex items-center gap-2",children:[m.jsxs("div",{className:"flex items-center gap-1 text-sm text-slate-300",children:[Yd(y,16),m.jsx("span",{className:"hidden md:inline",children:y})]}),m.jsxs("select",{className:"bg-slate-800/60 border border-white/10 rounded px-2 py-1",value:y,onChange:p=>{v(p.target.value),Wt(p.target.value)},children:[m.jsx("option",{value:"openai",children:"OpenAI"}),m.jsx("option",{value:"openrouter",children:"OpenRouter"}),m.jsx("option",{value:"azure",children:"Azure OpenAI"}),m.jsx("option",{value:"anthropic",children:"Anthropic"}),m.jsx("option",{value:"gemini",children:"Gemini"}),m.jsx("option",{value:"ollama",children:"Ollama (local)"})]}),m.jsxs("div",{className:"flex items-center gap-1 text-sm text-slate-300",children:[to(h,16),m.jsx("span",{className:"hidden md:inline",children:h||"model"})]}),m.jsxs("select",{className:"bg-slate-800/60 border border-white/10 rounded px-2 py-1",value:h,onChange:p=>x(p.target.value),children:[m.jsx("option",{value:"",children:"Select a model"}),S.map(p=>m.jsx("option",{value:p.id,children:p.name||p.id},p.id))]}),m.jsxs("label",{className:"text-sm flex items-center gap-1",children:[m.jsx("input",{type:"checkbox",checked:a,onChange:p=>d(p.target.checked)})," Reasoning"]})]})]}),m.jsxs("div",{ref:_,className:"flex-1 overflow-y-auto p-4",children:[i.filter(p=>p.role!=="system").length===0&&m.jsxs("div",{className:"max-w-2xl mx-auto p-4 rounded-lg border border-white/10 bg-slate-900/60",children:[m.jsx("div",{className:"mb-2 text-slate-300",children:"Try one of these"}),m.jsx("div",{className:"flex flex-wrap gap-2",children:["Summarize an article","Write Python","Explain a concept","Create a plan"].map((p,j)=>m.jsx("button",{className:"px-3 py-1 rounded border border-white/10 hover:bg-white/5",onClick:()=>c(p),children:p},j))})]}),m.jsxs("div",{className:"max-w-3xl mx-auto space-y-3",children:[(()=>{const p=[];let j=null;return i.filter(Z=>Z.role!=="system").forEach((Z,W)=>{if(Z.created_at){const he=new Date(Z.created_at),$=Jd(he);$!==j&&(j=$,p.push(m.jsx("div",{className:"sticky top-2 z-10",children:m.jsx("div",{className:"mx-auto w-fit px-3 py-1 text-xs text-slate-300 border border-white/10 rounded-full bg-slate-900/70 backdrop-blur",children:$})},`sep-${W}`)))}p.push(m.jsx(T,{m:Z,idx:W},W))}),p})(),g&&m.jsxs("div",{className:"flex gap-3",children:[m.jsx("div",{className:"w-8 h-8 rounded-full bg-brand flex items-center justify-center",children:to(h,16)}),m.jsx("div",{className:"rounded-2xl px-3 py-2 border bg-slate-900/60 border-white/10",style:{maxWidth:"80%"},children:m.jsx("div",{className:"whitespace-pre-wrap text-slate-100 text-sm",children:g})})]}),I&&!g&&m.jsxs("div",{className:"flex items-center gap-2 text-slate-300 text-sm",children:[m.jsx("span",{className:"w-2 h-2 bg-slate-500 rounded-full animate-pulse"}),"Generating…"]})]})]}),P&&m.jsx("button",{className:"fixed right-6 bottom-24 px-3 py-1.5 rounded-full bg-brand text-white shadow hover:bg-brand-dark",onClick:()=>{const p=_.current;p&&(p.scrollTop=p.scrollHeight)},children:"Jump to latest"}),m.jsxs("form",{className:"glass border-t p-3 flex items-center gap-2",onSubmit:p=>{p.preventDefault(),E()},children:[m.jsx("div",{className:"flex-1",children:m.jsx("textarea",{className:"w-full bg-slate-800/60 border border-white/10 rounded-full px-4 py-2 h-11 resize-none",placeholder:"Ask something...",value:s,onChange:p=>c(p.target.value),onKeyDown:p=>{p.key==="Enter"&&!p.shiftKey&&(p.preventDefault(),E())}})}),m.jsx("button",{className:"btn-primary rounded-full h-11 px-5",disabled:!s.trim()||I,type:"submit",children:"Send"})]})]})]})}const bd=document.getElementById("root");cc(bd).render(m.jsx(Mc.StrictMode,{children:m.jsx(qd,{})}));
@@ -1,45 +0,0 @@
-(function(){const t=document.createElement("link").relList;if(t&&t.supports&&t.supports("modulepreload"))return;for(const l of document.querySelectorAll('link[rel="modulepreload"]'))r(l);new MutationObserver(l=>{for(const o of l)if(o.type==="childList")for(const i of o.addedNodes)i.tagName==="LINK"&&i.rel==="modulepreload"&&r(i)}).observe(document,{childList:!0,subtree:!0});function n(l){const o={};return l.integrity&&(o.integrity=l.integrity),l.referrerPolicy&&(o.referrerPolicy=l.referrerPolicy),l.crossOrigin==="use-credentials"?o.credentials="include":l.crossOrigin==="anonymous"?o.credentials="omit":o.credentials="same-origin",o}function r(l){if(l.ep)return;l.ep=!0;const o=n(l);fetch(l.href,o)}})();function Sc(e){return e&&e.__esModule&&Object.prototype.hasOwnProperty.call(e,"default")?e.default:e}var os={exports:{}},vl={},is={exports:{}},I={};/**
- * @license React
- * react.production.min.js
- *
- * Copyright (c) Facebook, Inc. and its affiliates.
- *
- * This source code is licensed under the MIT license found in the
- * LICENSE file in the root directory of this source tree.
- */var fr=Symbol.for("react.element"),kc=Symbol.for("react.portal"),Ec=Symbol.for("react.fragment"),Cc=Symbol.for("react.strict_mode"),Nc=Symbol.for("react.profiler"),_c=Symbol.for("react.provider"),jc=Symbol.for("react.context"),Pc=Symbol.for("react.forward_ref"),Tc=Symbol.for("react.suspense"),Lc=Symbol.for("react.memo"),zc=Symbol.for("react.lazy"),Gi=Symbol.iterator;function Rc(e){return e===null||typeof e!="object"?null:(e=Gi&&e[Gi]||e["@@iterator"],typeof e=="function"?e:null)}var us={isMounted:function(){return!1},enqueueForceUpdate:function(){},enqueueReplaceState:function(){},enqueueSetState:function(){}},ss=Object.assign,as={};function Cn(e,t,n){this.props=e,this.context=t,this.refs=as,this.updater=n||us}Cn.prototype.isReactComponent={};Cn.prototype.setState=function(e,t){if(typeof e!="object"&&typeof e!="function"&&e!=null)throw Error("setState(...): takes an object of state variables to update or a function which returns an object of state variables.");this.updater.enqueueSetState(this,e,t,"setState")};Cn.prototype.forceUpdate=function(e){this.updater.enqueueForceUpdate(this,e,"forceUpdate")};function cs(){}cs.prototype=Cn.prototype;function ei(e,t,n){this.props=e,this.context=t,this.refs=as,this.updater=n||us}var ti=ei.prototype=new cs;ti.constructor=ei;ss(ti,Cn.prototype);ti.isPureReactComponent=!0;var Xi=Array.isArray,fs=Object.prototype.hasOwnProperty,ni={current:null},ds={key:!0,ref:!0,__self:!0,__source:!0};function ps(e,t,n){var r,l={},o=null,i=null;if(t!=null)for(r in t.ref!==void 0&&(i=t.ref),t.key!==void 0&&(o=""+t.key),t)fs.call(t,r)&&!ds.hasOwnProperty(r)&&(l[r]=t[r]);var u=arguments.length-2;if(u===1)l.children=n;else if(1<u){for(var s=Array(u),c=0;c<u;c++)s[c]=arguments[c+2];l.children=s}if(e&&e.defaultProps)for(r in u=e.defaultProps,u)l[r]===void 0&&(l[r]=u[r]);return{$$typeof:fr,type:e,key:o,ref:i,props:l,_owner:ni.current}}function Ic(e,t){return{$$typeof:fr,type:e.type,key:t,ref:e.ref,props:e.props,_owner:e._owner}}function ri(e){return typeof e=="object"&&e!==null&&e.$$typeof===fr}function Oc(e){var t={"=":"=0",":":"=2"};return"$"+e.replace(/[=:]/g,function(n){return t[n]})}var Zi=/\/+/g;function Ol(e,t){return typeof e=="object"&&e!==null&&e.key!=null?Oc(""+e.key):t.toString(36)}function Or(e,t,n,r,l){var o=typeof e;(o==="undefined"||o==="boolean")&&(e=null);var i=!1;if(e===null)i=!0;else switch(o){case"string":case"number":i=!0;break;case"object":switch(e.$$typeof){case fr:case kc:i=!0}}if(i)return i=e,l=l(i),e=r===""?"."+Ol(i,0):r,Xi(l)?(n="",e!=null&&(n=e.replace(Zi,"$&/")+"/"),Or(l,t,n,"",function(c){return c})):l!=null&&(ri(l)&&(l=Ic(l,n+(!l.key||i&&i.key===l.key?"":(""+l.key).replace(Zi,"$&/")+"/")+e)),t.push(l)),1;if(i=0,r=r===""?".":r+":",Xi(e))for(var u=0;u<e.length;u++){o=e[u];var s=r+Ol(o,u);i+=Or(o,t,n,s,l)}else if(s=Rc(e),typeof s=="function")for(e=s.call(e),u=0;!(o=e.next()).done;)o=o.value,s=r+Ol(o,u++),i+=Or(o,t,n,s,l);else if(o==="object")throw t=String(e),Error("Objects are not valid as a React child (found: "+(t==="[object Object]"?"object with keys {"+Object.keys(e).join(", ")+"}":t)+"). If you meant to render a collection of children, use an array instead.");return i}function gr(e,t,n){if(e==null)return e;var r=[],l=0;return Or(e,r,"","",function(o){return t.call(n,o,l++)}),r}function Mc(e){if(e._status===-1){var t=e._result;t=t(),t.then(function(n){(e._status===0||e._status===-1)&&(e._status=1,e._result=n)},function(n){(e._status===0||e._status===-1)&&(e._status=2,e._result=n)}),e._status===-1&&(e._status=0,e._result=t)}if(e._status===1)return e._result.default;throw e._result}var me={current:null},Mr={transition:null},Dc={ReactCurrentDispatcher:me,ReactCurrentBatchConfig:Mr,ReactCurrentOwner:ni};function hs(){throw Error("act(...) is not supported in production builds of React.")}I.Children={map:gr,forEach:function(e,t,n){gr(e,function(){t.apply(this,arguments)},n)},count:function(e){var t=0;return gr(e,function(){t++}),t},toArray:function(e){return gr(e,function(t){return t})||[]},only:function(e){if(!ri(e))throw Error("React.Children.only expected to receive a single React element child.");return e}};I.Component=Cn;I.Fragment=Ec;I.Profiler=Nc;I.PureComponent=ei;I.StrictMode=Cc;I.Suspense=Tc;I.__SECRET_INTERNALS_DO_NOT_USE_OR_YOU_WILL_BE_FIRED=Dc;I.act=hs;I.cloneElement=function(e,t,n){if(e==null)throw Error("React.cloneElement(...): The argument must be a React element, but you passed "+e+".");var r=ss({},e.props),l=e.key,o=e.ref,i=e._owner;if(t!=null){if(t.ref!==void 0&&(o=t.ref,i=ni.current),t.key!==void 0&&(l=""+t.key),e.type&&e.type.defaultProps)var u=e.type.defaultProps;for(s in t)fs.call(t,s)&&!ds.hasOwnProperty(s)&&(r[s]=t[s]===void 0&&u!==void 0?u[s]:t[s])}var s=arguments.length-2;if(s===1)r.children=n;else if(1<s){u=Array(s);for(var c=0;c<s;c++)u[c]=arguments[c+2];r.children=u}return{$$typeof:fr,type:e.type,key:l,ref:o,props:r,_owner:i}};I.createContext=function(e){return e={$$typeof:jc,_currentValue:e,_currentValue2:e,_threadCount:0,Provider:null,Consumer:null,_defaultValue:null,_globalName:null},e.Provider={$$typeof:_c,_context:e},e.Consumer=e};I.createElement=ps;I.createFactory=function(e){var t=ps.bind(null,e);return t.type=e,t};I.createRef=function(){return{current:null}};I.forwardRef=function(e){return{$$typeof:Pc,render:e}};I.isValidElement=ri;I.lazy=function(e){return{$$typeof:zc,_payload:{_status:-1,_result:e},_init:Mc}};I.memo=function(e,t){return{$$typeof:Lc,type:e,compare:t===void 0?null:t}};I.startTransition=function(e){var t=Mr.transition;Mr.transition={};try{e()}finally{Mr.transition=t}};I.unstable_act=hs;I.useCallback=function(e,t){return me.current.useCallback(e,t)};I.useContext=function(e){return me.current.useContext(e)};I.useDebugValue=function(){};I.useDeferredValue=function(e){return me.current.useDeferredValue(e)};I.useEffect=function(e,t){return me.current.useEffect(e,t)};I.useId=function(){return me.current.useId()};I.useImperativeHandle=function(e,t,n){return me.current.useImperativeHandle(e,t,n)};I.useInsertionEffect=function(e,t){return me.current.useInsertionEffect(e,t)};I.useLayoutEffect=function(e,t){return me.current.useLayoutEffect(e,t)};I.useMemo=function(e,t){return me.current.useMemo(e,t)};I.useReducer=function(e,t,n){return me.current.useReducer(e,t,n)};I.useRef=function(e){return me.current.useRef(e)};I.useState=function(e){return me.current.useState(e)};I.useSyncExternalStore=function(e,t,n){return me.current.useSyncExternalStore(e,t,n)};I.useTransition=function(){return me.current.useTransition()};I.version="18.3.1";is.exports=I;var O=is.exports;const Fc=Sc(O);/**
- * @license React
- * react-jsx-runtime.production.min.js
- *
- * Copyright (c) Facebook, Inc. and its affiliates.
- *
- * This source code is licensed under the MIT license found in the
- * LICENSE file in the root directory of this source tree.
- */var Uc=O,$c=Symbol.for("react.element"),Ac=Symbol.for("react.fragment"),Wc=Object.prototype.hasOwnProperty,Vc=Uc.__SECRET_INTERNALS_DO_NOT_USE_OR_YOU_WILL_BE_FIRED.ReactCurrentOwner,Hc={key:!0,ref:!0,__self:!0,__source:!0};function ms(e,t,n){var r,l={},o=null,i=null;n!==void 0&&(o=""+n),t.key!==void 0&&(o=""+t.key),t.ref!==void 0&&(i=t.ref);for(r in t)Wc.call(t,r)&&!Hc.hasOwnProperty(r)&&(l[r]=t[r]);if(e&&e.defaultProps)for(r in t=e.defaultProps,t)l[r]===void 0&&(l[r]=t[r]);return{$$typeof:$c,type:e,key:o,ref:i,props:l,_owner:Vc.current}}vl.Fragment=Ac;vl.jsx=ms;vl.jsxs=ms;os.exports=vl;var f=os.exports,vs={exports:{}},je={},gs={exports:{}},ys={};/**
- * @license React
- * scheduler.production.min.js
- *
- * Copyright (c) Facebook, Inc. and its affiliates.
- *
- * This source code is licensed under the MIT license found in the
- * LICENSE file in the root directory of this source tree.
- */(function(e){function t(C,T){var z=C.length;C.push(T);e:for(;0<z;){var W=z-1>>>1,X=C[W];if(0<l(X,T))C[W]=T,C[z]=X,z=W;else break e}}function n(C){return C.length===0?null:C[0]}function r(C){if(C.length===0)return null;var T=C[0],z=C.pop();if(z!==T){C[0]=z;e:for(var W=0,X=C.length,at=X>>>1;W<at;){var Ze=2*(W+1)-1,g=C[Ze],L=Ze+1,V=C[L];if(0>l(g,z))L<X&&0>l(V,g)?(C[W]=V,C[L]=z,W=L):(C[W]=g,C[Ze]=z,W=Ze);else if(L<X&&0>l(V,z))C[W]=V,C[L]=z,W=L;else break e}}return T}function l(C,T){var z=C.sortIndex-T.sortIndex;return z!==0?z:C.id-T.id}if(typeof performance=="object"&&typeof performance.now=="function"){var o=performance;e.unstable_now=function(){return o.now()}}else{var i=Date,u=i.now();e.unstable_now=function(){return i.now()-u}}var s=[],c=[],h=1,v=null,m=3,x=!1,S=!1,k=!1,F=typeof setTimeout=="function"?setTimeout:null,d=typeof clearTimeout=="function"?clearTimeout:null,a=typeof setImmediate<"u"?setImmediate:null;typeof navigator<"u"&&navigator.scheduling!==void 0&&navigator.scheduling.isInputPending!==void 0&&navigator.scheduling.isInputPending.bind(navigator.scheduling);function p(C){for(var T=n(c);T!==null;){if(T.callback===null)r(c);else if(T.startTime<=C)r(c),T.sortIndex=T.expirationTime,t(s,T);else break;T=n(c)}}function y(C){if(k=!1,p(C),!S)if(n(s)!==null)S=!0,Ve(E);else{var T=n(c);T!==null&&st(y,T.startTime-C)}}function E(C,T){S=!1,k&&(k=!1,d(P),P=-1),x=!0;var z=m;try{for(p(T),v=n(s);v!==null&&(!(v.expirationTime>T)||C&&!fe());){var W=v.callback;if(typeof W=="function"){v.callback=null,m=v.priorityLevel;var X=W(v.expirationTime<=T);T=e.unstable_now(),typeof X=="function"?v.callback=X:v===n(s)&&r(s),p(T)}else r(s);v=n(s)}if(v!==null)var at=!0;else{var Ze=n(c);Ze!==null&&st(y,Ze.startTime-T),at=!1}return at}finally{v=null,m=z,x=!1}}var _=!1,j=null,P=-1,B=5,R=-1;function fe(){return!(e.unstable_now()-R<B)}function Ot(){if(j!==null){var C=e.unstable_now();R=C;var T=!0;try{T=j(!0,C)}finally{T?Xe():(_=!1,j=null)}}else _=!1}var Xe;if(typeof a=="function")Xe=function(){a(Ot)};else if(typeof MessageChannel<"u"){var Zt=new MessageChannel,vr=Zt.port2;Zt.port1.onmessage=Ot,Xe=function(){vr.postMessage(null)}}else Xe=function(){F(Ot,0)};function Ve(C){j=C,_||(_=!0,Xe())}function st(C,T){P=F(function(){C(e.unstable_now())},T)}e.unstable_IdlePriority=5,e.unstable_ImmediatePriority=1,e.unstable_LowPriority=4,e.unstable_NormalPriority=3,e.unstable_Profiling=null,e.unstable_UserBlockingPriority=2,e.unstable_cancelCallback=function(C){C.callback=null},e.unstable_continueExecution=function(){S||x||(S=!0,Ve(E))},e.unstable_forceFrameRate=function(C){0>C||125<C?console.error("forceFrameRate takes a positive int between 0 and 125, forcing frame rates higher than 125 fps is not supported"):B=0<C?Math.floor(1e3/C):5},e.unstable_getCurrentPriorityLevel=function(){return m},e.unstable_getFirstCallbackNode=function(){return n(s)},e.unstable_next=function(C){switch(m){case 1:case 2:case 3:var T=3;break;default:T=m}var z=m;m=T;try{return C()}finally{m=z}},e.unstable_pauseExecution=function(){},e.unstable_requestPaint=function(){},e.unstable_runWithPriority=function(C,T){switch(C){case 1:case 2:case 3:case 4:case 5:break;default:C=3}var z=m;m=C;try{return T()}finally{m=z}},e.unstable_scheduleCallback=function(C,T,z){var W=e.unstable_now();switch(typeof z=="object"&&z!==null?(z=z.delay,z=typeof z=="number"&&0<z?W+z:W):z=W,C){case 1:var X=-1;break;case 2:X=250;break;case 5:X=1073741823;break;case 4:X=1e4;break;default:X=5e3}return X=z+X,C={id:h++,callback:T,priorityLevel:C,startTime:z,expirationTime:X,sortIndex:-1},z>W?(C.sortIndex=z,t(c,C),n(s)===null&&C===n(c)&&(k?(d(P),P=-1):k=!0,st(y,z-W))):(C.sortIndex=X,t(s,C),S||x||(S=!0,Ve(E))),C},e.unstable_shouldYield=fe,e.unstable_wrapCallback=function(C){var T=m;return function(){var z=m;m=T;try{return C.apply(this,arguments)}finally{m=z}}}})(ys);gs.exports=ys;var Bc=gs.exports;/**
- * @license React
- * react-dom.production.min.js
- *
- * Copyright (c) Facebook, Inc. and its affiliates.
- *
- * This source code is licensed under the MIT license found in the
- * LICENSE file in the root directory of this source tree.
- */var Qc=O,_e=Bc;function w(e){for(var t="https://reactjs.org/docs/error-decoder.html?invariant="+e,n=1;n<arguments.length;n++)t+="&args[]="+encodeURIComponent(arguments[n]);return"Minified React error #"+e+"; visit "+t+" for the full message or use the non-minified dev environment for full errors and additional helpful warnings."}var ws=new Set,Gn={};function Gt(e,t){gn(e,t),gn(e+"Capture",t)}function gn(e,t){for(Gn[e]=t,e=0;e<t.length;e++)ws.add(t[e])}var rt=!(typeof window>"u"||typeof window.document>"u"||typeof window.document.createElement>"u"),io=Object.prototype.hasOwnProperty,Kc=/^[:A-Z_a-z\u00C0-\u00D6\u00D8-\u00F6\u00F8-\u02FF\u0370-\u037D\u037F-\u1FFF\u200C-\u200D\u2070-\u218F\u2C00-\u2FEF\u3001-\uD7FF\uF900-\uFDCF\uFDF0-\uFFFD][:A-Z_a-z\u00C0-\u00D6\u00D8-\u00F6\u00F8-\u02FF\u0370-\u037D\u037F-\u1FFF\u200C-\u200D\u2070-\u218F\u2C00-\u2FEF\u3001-\uD7FF\uF900-\uFDCF\uFDF0-\uFFFD\-.0-9\u00B7\u0300-\u036F\u203F-\u2040]*$/,Ji={},qi={};function Yc(e){return io.call(qi,e)?!0:io.call(Ji,e)?!1:Kc.test(e)?qi[e]=!0:(Ji[e]=!0,!1)}function Gc(e,t,n,r){if(n!==null&&n.type===0)return!1;switch(typeof t){case"function":case"symbol":return!0;case"boolean":return r?!1:n!==null?!n.acceptsBooleans:(e=e.toLowerCase().slice(0,5),e!=="data-"&&e!=="aria-");default:return!1}}function Xc(e,t,n,r){if(t===null||typeof t>"u"||Gc(e,t,n,r))return!0;if(r)return!1;if(n!==null)switch(n.type){case 3:return!t;case 4:return t===!1;case 5:return isNaN(t);case 6:return isNaN(t)||1>t}return!1}function ve(e,t,n,r,l,o,i){this.acceptsBooleans=t===2||t===3||t===4,this.attributeName=r,this.attributeNamespace=l,this.mustUseProperty=n,this.propertyName=e,this.type=t,this.sanitizeURL=o,this.removeEmptyString=i}var ie={};"children dangerouslySetInnerHTML defaultValue defaultChecked innerHTML suppressContentEditableWarning suppressHydrationWarning style".split(" ").forEach(function(e){ie[e]=new ve(e,0,!1,e,null,!1,!1)});[["acceptCharset","accept-charset"],["className","class"],["htmlFor","for"],["httpEquiv","http-equiv"]].forEach(function(e){var t=e[0];ie[t]=new ve(t,1,!1,e[1],null,!1,!1)});["contentEditable","draggable","spellCheck","value"].forEach(function(e){ie[e]=new ve(e,2,!1,e.toLowerCase(),null,!1,!1)});["autoReverse","externalResourcesRequired","focusable","preserveAlpha"].forEach(function(e){ie[e]=new ve(e,2,!1,e,null,!1,!1)});"allowFullScreen async autoFocus autoPlay controls default defer disabled disablePictureInPicture disableRemotePlayback formNoValidate hidden loop noModule noValidate open playsInline readOnly required reversed scoped seamless itemScope".split(" ").forEach(function(e){ie[e]=new ve(e,3,!1,e.toLowerCase(),null,!1,!1)});["checked","multiple","muted","selected"].forEach(function(e){ie[e]=new ve(e,3,!0,e,null,!1,!1)});["capture","download"].forEach(function(e){ie[e]=new ve(e,4,!1,e,null,!1,!1)});["cols","rows","size","span"].forEach(function(e){ie[e]=new ve(e,6,!1,e,null,!1,!1)});["rowSpan","start"].forEach(function(e){ie[e]=new ve(e,5,!1,e.toLowerCase(),null,!1,!1)});var li=/[\-:]([a-z])/g;function oi(e){return e[1].toUpperCase()}"accent-height alignment-baseline arabic-form baseline-shift cap-height clip-path clip-rule color-interpolation color-interpolation-filters color-profile color-rendering dominant-baseline enable-background fill-opacity fill-rule flood-color flood-opacity font-family font-size font-size-adjust font-stretch font-style font-variant font-weight glyph-name glyph-orientation-horizontal glyph-orientation-vertical horiz-adv-x horiz-origin-x image-rendering letter-spacing lighting-color marker-end marker-mid marker-start overline-position overline-thickness paint-order panose-1 pointer-events rendering-intent shape-rendering stop-color stop-opacity strikethrough-position strikethrough-thickness stroke-dasharray stroke-dashoffset stroke-linecap stroke-linejoin stroke-miterlimit stroke-opacity stroke-width text-anchor text-decoration text-rendering underline-position underline-thickness unicode-bidi unicode-range units-per-em v-alphabetic v-hanging v-ideographic v-mathematical vector-effect vert-adv-y vert-origin-x vert-origin-y word-spacing writing-mode xmlns:xlink x-height".split(" ").forEach(function(e){var t=e.replace(li,oi);ie[t]=new ve(t,1,!1,e,null,!1,!1)});"xlink:actuate xlink:arcrole xlink:role xlink:show xlink:title xlink:type".split(" ").forEach(function(e){var t=e.replace(li,oi);ie[t]=new ve(t,1,!1,e,"http://www.w3.org/1999/xlink",!1,!1)});["xml:base","xml:lang","xml:space"].forEach(function(e){var t=e.replace(li,oi);ie[t]=new ve(t,1,!1,e,"http://www.w3.org/XML/1998/namespace",!1,!1)});["tabIndex","crossOrigin"].forEach(function(e){ie[e]=new ve(e,1,!1,e.toLowerCase(),null,!1,!1)});ie.xlinkHref=new ve("xlinkHref",1,!1,"xlink:href","http://www.w3.org/1999/xlink",!0,!1);["src","href","action","formAction"].forEach(function(e){ie[e]=new ve(e,1,!1,e.toLowerCase(),null,!0,!0)});function ii(e,t,n,r){var l=ie.hasOwnProperty(t)?ie[t]:null;(l!==null?l.type!==0:r||!(2<t.length)||t[0]!=="o"&&t[0]!=="O"||t[1]!=="n"&&t[1]!=="N")&&(Xc(t,n,l,r)&&(n=null),r||l===null?Yc(t)&&(n===null?e.removeAttribute(t):e.setAttribute(t,""+n)):l.mustUseProperty?e[l.propertyName]=n===null?l.type===3?!1:"":n:(t=l.attributeName,r=l.attributeNamespace,n===null?e.removeAttribute(t):(l=l.type,n=l===3||l===4&&n===!0?"":""+n,r?e.setAttributeNS(r,t,n):e.setAttribute(t,n))))}var ut=Qc.__SECRET_INTERNALS_DO_NOT_USE_OR_YOU_WILL_BE_FIRED,yr=Symbol.for("react.element"),qt=Symbol.for("react.portal"),bt=Symbol.for("react.fragment"),ui=Symbol.for("react.strict_mode"),uo=Symbol.for("react.profiler"),xs=Symbol.for("react.provider"),Ss=Symbol.for("react.context"),si=Symbol.for("react.forward_ref"),so=Symbol.for("react.suspense"),ao=Symbol.for("react.suspense_list"),ai=Symbol.for("react.memo"),pt=Symbol.for("react.lazy"),ks=Symbol.for("react.offscreen"),bi=Symbol.iterator;function jn(e){return e===null||typeof e!="object"?null:(e=bi&&e[bi]||e["@@iterator"],typeof e=="function"?e:null)}var Y=Object.assign,Ml;function Mn(e){if(Ml===void 0)try{throw Error()}catch(n){var t=n.stack.trim().match(/\n( *(at )?)/);Ml=t&&t[1]||""}return`
-`+Ml+e}var Dl=!1;function Fl(e,t){if(!e||Dl)return"";Dl=!0;var n=Error.prepareStackTrace;Error.prepareStackTrace=void 0;try{if(t)if(t=function(){throw Error()},Object.defineProperty(t.prototype,"props",{set:function(){throw Error()}}),typeof Reflect=="object"&&Reflect.construct){try{Reflect.construct(t,[])}catch(c){var r=c}Reflect.construct(e,[],t)}else{try{t.call()}catch(c){r=c}e.call(t.prototype)}else{try{throw Error()}catch(c){r=c}e()}}catch(c){if(c&&r&&typeof c.stack=="string"){for(var l=c.stack.split(`
-`),o=r.stack.split(`
-`),i=l.length-1,u=o.length-1;1<=i&&0<=u&&l[i]!==o[u];)u--;for(;1<=i&&0<=u;i--,u--)if(l[i]!==o[u]){if(i!==1||u!==1)do if(i--,u--,0>u||l[i]!==o[u]){var s=`
-`+l[i].replace(" at new "," at ");return e.displayName&&s.includes("<anonymous>")&&(s=s.replace("<anonymous>",e.displayName)),s}while(1<=i&&0<=u);break}}}finally{Dl=!1,Error.prepareStackTrace=n}return(e=e?e.displayName||e.name:"")?Mn(e):""}function Zc(e){switch(e.tag){case 5:return Mn(e.type);case 16:return Mn("Lazy");case 13:return Mn("Suspense");case 19:return Mn("SuspenseList");case 0:case 2:case 15:return e=Fl(e.type,!1),e;case 11:return e=Fl(e.type.render,!1),e;case 1:return e=Fl(e.type,!0),e;default:return""}}function co(e){if(e==null)return null;if(typeof e=="function")return e.displayName||e.name||null;if(typeof e=="string")return e;switch(e){case bt:return"Fragment";case qt:return"Portal";case uo:return"Profiler";case ui:return"StrictMode";case so:return"Suspense";case ao:return"SuspenseList"}if(typeof e=="object")switch(e.$$typeof){case Ss:return(e.displayName||"Context")+".Consumer";case xs:return(e._context.displayName||"Context")+".Provider";case si:var t=e.render;return e=e.displayName,e||(e=t.displayName||t.name||"",e=e!==""?"ForwardRef("+e+")":"ForwardRef"),e;case ai:return t=e.displayName||null,t!==null?t:co(e.type)||"Memo";case pt:t=e._payload,e=e._init;try{return co(e(t))}catch{}}return null}function Jc(e){var t=e.type;switch(e.tag){case 24:return"Cache";case 9:return(t.displayName||"Context")+".Consumer";case 10:return(t._context.displayName||"Context")+".Provider";case 18:return"DehydratedFragment";case 11:return e=t.render,e=e.displayName||e.name||"",t.displayName||(e!==""?"ForwardRef("+e+")":"ForwardRef");case 7:return"Fragment";case 5:return t;case 4:return"Portal";case 3:return"Root";case 6:return"Text";case 16:return co(t);case 8:return t===ui?"StrictMode":"Mode";case 22:return"Offscreen";case 12:return"Profiler";case 21:return"Scope";case 13:return"Suspense";case 19:return"SuspenseList";case 25:return"TracingMarker";case 1:case 0:case 17:case 2:case 14:case 15:if(typeof t=="function")return t.displayName||t.name||null;if(typeof t=="string")return t}return null}function Tt(e){switch(typeof e){case"boolean":case"number":case"string":case"undefined":return e;case"object":return e;default:return""}}function Es(e){var t=e.type;return(e=e.nodeName)&&e.toLowerCase()==="input"&&(t==="checkbox"||t==="radio")}function qc(e){var t=Es(e)?"checked":"value",n=Object.getOwnPropertyDescriptor(e.constructor.prototype,t),r=""+e[t];if(!e.hasOwnProperty(t)&&typeof n<"u"&&typeof n.get=="function"&&typeof n.set=="function"){var l=n.get,o=n.set;return Object.defineProperty(e,t,{configurable:!0,get:function(){return l.call(this)},set:function(i){r=""+i,o.call(this,i)}}),Object.defineProperty(e,t,{enumerable:n.enumerable}),{getValue:function(){return r},setValue:function(i){r=""+i},stopTracking:function(){e._valueTracker=null,delete e[t]}}}}function wr(e){e._valueTracker||(e._valueTracker=qc(e))}function Cs(e){if(!e)return!1;var t=e._valueTracker;if(!t)return!0;var n=t.getValue(),r="";return e&&(r=Es(e)?e.checked?"true":"false":e.value),e=r,e!==n?(t.setValue(e),!0):!1}function Kr(e){if(e=e||(typeof document<"u"?document:void 0),typeof e>"u")return null;try{return e.activeElement||e.body}catch{return e.body}}function fo(e,t){var n=t.checked;return Y({},t,{defaultChecked:void 0,defaultValue:void 0,value:void 0,checked:n??e._wrapperState.initialChecked})}function eu(e,t){var n=t.defaultValue==null?"":t.defaultValue,r=t.checked!=null?t.checked:t.defaultChecked;n=Tt(t.value!=null?t.value:n),e._wrapperState={initialChecked:r,initialValue:n,controlled:t.type==="checkbox"||t.type==="radio"?t.checked!=null:t.value!=null}}function Ns(e,t){t=t.checked,t!=null&&ii(e,"checked",t,!1)}function po(e,t){Ns(e,t);var n=Tt(t.value),r=t.type;if(n!=null)r==="number"?(n===0&&e.value===""||e.value!=n)&&(e.value=""+n):e.value!==""+n&&(e.value=""+n);else if(r==="submit"||r==="reset"){e.removeAttribute("value");return}t.hasOwnProperty("value")?ho(e,t.type,n):t.hasOwnProperty("defaultValue")&&ho(e,t.type,Tt(t.defaultValue)),t.checked==null&&t.defaultChecked!=null&&(e.defaultChecked=!!t.defaultChecked)}function tu(e,t,n){if(t.hasOwnProperty("value")||t.hasOwnProperty("defaultValue")){var r=t.type;if(!(r!=="submit"&&r!=="reset"||t.value!==void 0&&t.value!==null))return;t=""+e._wrapperState.initialValue,n||t===e.value||(e.value=t),e.defaultValue=t}n=e.name,n!==""&&(e.name=""),e.defaultChecked=!!e._wrapperState.initialChecked,n!==""&&(e.name=n)}function ho(e,t,n){(t!=="number"||Kr(e.ownerDocument)!==e)&&(n==null?e.defaultValue=""+e._wrapperState.initialValue:e.defaultValue!==""+n&&(e.defaultValue=""+n))}var Dn=Array.isArray;function fn(e,t,n,r){if(e=e.options,t){t={};for(var l=0;l<n.length;l++)t["$"+n[l]]=!0;for(n=0;n<e.length;n++)l=t.hasOwnProperty("$"+e[n].value),e[n].selected!==l&&(e[n].selected=l),l&&r&&(e[n].defaultSelected=!0)}else{for(n=""+Tt(n),t=null,l=0;l<e.length;l++){if(e[l].value===n){e[l].selected=!0,r&&(e[l].defaultSelected=!0);return}t!==null||e[l].disabled||(t=e[l])}t!==null&&(t.selected=!0)}}function mo(e,t){if(t.dangerouslySetInnerHTML!=null)throw Error(w(91));return Y({},t,{value:void 0,defaultValue:void 0,children:""+e._wrapperState.initialValue})}function nu(e,t){var n=t.value;if(n==null){if(n=t.children,t=t.defaultValue,n!=null){if(t!=null)throw Error(w(92));if(Dn(n)){if(1<n.length)throw Error(w(93));n=n[0]}t=n}t==null&&(t=""),n=t}e._wrapperState={initialValue:Tt(n)}}function _s(e,t){var n=Tt(t.value),r=Tt(t.defaultValue);n!=null&&(n=""+n,n!==e.value&&(e.value=n),t.defaultValue==null&&e.defaultValue!==n&&(e.defaultValue=n)),r!=null&&(e.defaultValue=""+r)}function ru(e){var t=e.textContent;t===e._wrapperState.initialValue&&t!==""&&t!==null&&(e.value=t)}function js(e){switch(e){case"svg":return"http://www.w3.org/2000/svg";case"math":return"http://www.w3.org/1998/Math/MathML";default:return"http://www.w3.org/1999/xhtml"}}function vo(e,t){return e==null||e==="http://www.w3.org/1999/xhtml"?js(t):e==="http://www.w3.org/2000/svg"&&t==="foreignObject"?"http://www.w3.org/1999/xhtml":e}var xr,Ps=function(e){return typeof MSApp<"u"&&MSApp.execUnsafeLocalFunction?function(t,n,r,l){MSApp.execUnsafeLocalFunction(function(){return e(t,n,r,l)})}:e}(function(e,t){if(e.namespaceURI!=="http://www.w3.org/2000/svg"||"innerHTML"in e)e.innerHTML=t;else{for(xr=xr||document.createElement("div"),xr.innerHTML="<svg>"+t.valueOf().toString()+"</svg>",t=xr.firstChild;e.firstChild;)e.removeChild(e.firstChild);for(;t.firstChild;)e.appendChild(t.firstChild)}});function Xn(e,t){if(t){var n=e.firstChild;if(n&&n===e.lastChild&&n.nodeType===3){n.nodeValue=t;return}}e.textContent=t}var $n={animationIterationCount:!0,aspectRatio:!0,borderImageOutset:!0,borderImageSlice:!0,borderImageWidth:!0,boxFlex:!0,boxFlexGroup:!0,boxOrdinalGroup:!0,columnCount:!0,columns:!0,flex:!0,flexGrow:!0,flexPositive:!0,flexShrink:!0,flexNegative:!0,flexOrder:!0,gridArea:!0,gridRow:!0,gridRowEnd:!0,gridRowSpan:!0,gridRowStart:!0,gridColumn:!0,gridColumnEnd:!0,gridColumnSpan:!0,gridColumnStart:!0,fontWeight:!0,lineClamp:!0,lineHeight:!0,opacity:!0,order:!0,orphans:!0,tabSize:!0,widows:!0,zIndex:!0,zoom:!0,fillOpacity:!0,floodOpacity:!0,stopOpacity:!0,strokeDasharray:!0,strokeDashoffset:!0,strokeMiterlimit:!0,strokeOpacity:!0,strokeWidth:!0},bc=["Webkit","ms","Moz","O"];Object.keys($n).forEach(function(e){bc.forEach(function(t){t=t+e.charAt(0).toUpperCase()+e.substring(1),$n[t]=$n[e]})});function Ts(e,t,n){return t==null||typeof t=="boolean"||t===""?"":n||typeof t!="number"||t===0||$n.hasOwnProperty(e)&&$n[e]?(""+t).trim():t+"px"}function Ls(e,t){e=e.style;for(var n in t)if(t.hasOwnProperty(n)){var r=n.indexOf("--")===0,l=Ts(n,t[n],r);n==="float"&&(n="cssFloat"),r?e.setProperty(n,l):e[n]=l}}var ef=Y({menuitem:!0},{area:!0,base:!0,br:!0,col:!0,embed:!0,hr:!0,img:!0,input:!0,keygen:!0,link:!0,meta:!0,param:!0,source:!0,track:!0,wbr:!0});function go(e,t){if(t){if(ef[e]&&(t.children!=null||t.dangerouslySetInnerHTML!=null))throw Error(w(137,e));if(t.dangerouslySetInnerHTML!=null){if(t.children!=null)throw Error(w(60));if(typeof t.dangerouslySetInnerHTML!="object"||!("__html"in t.dangerouslySetInnerHTML))throw Error(w(61))}if(t.style!=null&&typeof t.style!="object")throw Error(w(62))}}function yo(e,t){if(e.indexOf("-")===-1)return typeof t.is=="string";switch(e){case"annotation-xml":case"color-profile":case"font-face":case"font-face-src":case"font-face-uri":case"font-face-format":case"font-face-name":case"missing-glyph":return!1;default:return!0}}var wo=null;function ci(e){return e=e.target||e.srcElement||window,e.correspondingUseElement&&(e=e.correspondingUseElement),e.nodeType===3?e.parentNode:e}var xo=null,dn=null,pn=null;function lu(e){if(e=hr(e)){if(typeof xo!="function")throw Error(w(280));var t=e.stateNode;t&&(t=Sl(t),xo(e.stateNode,e.type,t))}}function zs(e){dn?pn?pn.push(e):pn=[e]:dn=e}function Rs(){if(dn){var e=dn,t=pn;if(pn=dn=null,lu(e),t)for(e=0;e<t.length;e++)lu(t[e])}}function Is(e,t){return e(t)}function Os(){}var Ul=!1;function Ms(e,t,n){if(Ul)return e(t,n);Ul=!0;try{return Is(e,t,n)}finally{Ul=!1,(dn!==null||pn!==null)&&(Os(),Rs())}}function Zn(e,t){var n=e.stateNode;if(n===null)return null;var r=Sl(n);if(r===null)return null;n=r[t];e:switch(t){case"onClick":case"onClickCapture":case"onDoubleClick":case"onDoubleClickCapture":case"onMouseDown":case"onMouseDownCapture":case"onMouseMove":case"onMouseMoveCapture":case"onMouseUp":case"onMouseUpCapture":case"onMouseEnter":(r=!r.disabled)||(e=e.type,r=!(e==="button"||e==="input"||e==="select"||e==="textarea")),e=!r;break e;default:e=!1}if(e)return null;if(n&&typeof n!="function")throw Error(w(231,t,typeof n));return n}var So=!1;if(rt)try{var Pn={};Object.defineProperty(Pn,"passive",{get:function(){So=!0}}),window.addEventListener("test",Pn,Pn),window.removeEventListener("test",Pn,Pn)}catch{So=!1}function tf(e,t,n,r,l,o,i,u,s){var c=Array.prototype.slice.call(arguments,3);try{t.apply(n,c)}catch(h){this.onError(h)}}var An=!1,Yr=null,Gr=!1,ko=null,nf={onError:function(e){An=!0,Yr=e}};function rf(e,t,n,r,l,o,i,u,s){An=!1,Yr=null,tf.apply(nf,arguments)}function lf(e,t,n,r,l,o,i,u,s){if(rf.apply(this,arguments),An){if(An){var c=Yr;An=!1,Yr=null}else throw Error(w(198));Gr||(Gr=!0,ko=c)}}function Xt(e){var t=e,n=e;if(e.alternate)for(;t.return;)t=t.return;else{e=t;do t=e,t.flags&4098&&(n=t.return),e=t.return;while(e)}return t.tag===3?n:null}function Ds(e){if(e.tag===13){var t=e.memoizedState;if(t===null&&(e=e.alternate,e!==null&&(t=e.memoizedState)),t!==null)return t.dehydrated}return null}function ou(e){if(Xt(e)!==e)throw Error(w(188))}function of(e){var t=e.alternate;if(!t){if(t=Xt(e),t===null)throw Error(w(188));return t!==e?null:e}for(var n=e,r=t;;){var l=n.return;if(l===null)break;var o=l.alternate;if(o===null){if(r=l.return,r!==null){n=r;continue}break}if(l.child===o.child){for(o=l.child;o;){if(o===n)return ou(l),e;if(o===r)return ou(l),t;o=o.sibling}throw Error(w(188))}if(n.return!==r.return)n=l,r=o;else{for(var i=!1,u=l.child;u;){if(u===n){i=!0,n=l,r=o;break}if(u===r){i=!0,r=l,n=o;break}u=u.sibling}if(!i){for(u=o.child;u;){if(u===n){i=!0,n=o,r=l;break}if(u===r){i=!0,r=o,n=l;break}u=u.sibling}if(!i)throw Error(w(189))}}if(n.alternate!==r)throw Error(w(190))}if(n.tag!==3)throw Error(w(188));return n.stateNode.current===n?e:t}function Fs(e){return e=of(e),e!==null?Us(e):null}function Us(e){if(e.tag===5||e.tag===6)return e;for(e=e.child;e!==null;){var t=Us(e);if(t!==null)return t;e=e.sibling}return null}var $s=_e.unstable_scheduleCallback,iu=_e.unstable_cancelCallback,uf=_e.unstable_shouldYield,sf=_e.unstable_requestPaint,Z=_e.unstable_now,af=_e.unstable_getCurrentPriorityLevel,fi=_e.unstable_ImmediatePriority,As=_e.unstable_UserBlockingPriority,Xr=_e.unstable_NormalPriority,cf=_e.unstable_LowPriority,Ws=_e.unstable_IdlePriority,gl=null,Ye=null;function ff(e){if(Ye&&typeof Ye.onCommitFiberRoot=="function")try{Ye.onCommitFiberRoot(gl,e,void 0,(e.current.flags&128)===128)}catch{}}var $e=Math.clz32?Math.clz32:hf,df=Math.log,pf=Math.LN2;function hf(e){return e>>>=0,e===0?32:31-(df(e)/pf|0)|0}var Sr=64,kr=4194304;function Fn(e){switch(e&-e){case 1:return 1;case 2:return 2;case 4:return 4;case 8:return 8;case 16:return 16;case 32:return 32;case 64:case 128:case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:return e&4194240;case 4194304:case 8388608:case 16777216:case 33554432:case 67108864:return e&130023424;case 134217728:return 134217728;case 268435456:return 268435456;case 536870912:return 536870912;case 1073741824:return 1073741824;default:return e}}function Zr(e,t){var n=e.pendingLanes;if(n===0)return 0;var r=0,l=e.suspendedLanes,o=e.pingedLanes,i=n&268435455;if(i!==0){var u=i&~l;u!==0?r=Fn(u):(o&=i,o!==0&&(r=Fn(o)))}else i=n&~l,i!==0?r=Fn(i):o!==0&&(r=Fn(o));if(r===0)return 0;if(t!==0&&t!==r&&!(t&l)&&(l=r&-r,o=t&-t,l>=o||l===16&&(o&4194240)!==0))return t;if(r&4&&(r|=n&16),t=e.entangledLanes,t!==0)for(e=e.entanglements,t&=r;0<t;)n=31-$e(t),l=1<<n,r|=e[n],t&=~l;return r}function mf(e,t){switch(e){case 1:case 2:case 4:return t+250;case 8:case 16:case 32:case 64:case 128:case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:return t+5e3;case 4194304:case 8388608:case 16777216:case 33554432:case 67108864:return-1;case 134217728:case 268435456:case 536870912:case 1073741824:return-1;default:return-1}}function vf(e,t){for(var n=e.suspendedLanes,r=e.pingedLanes,l=e.expirationTimes,o=e.pendingLanes;0<o;){var i=31-$e(o),u=1<<i,s=l[i];s===-1?(!(u&n)||u&r)&&(l[i]=mf(u,t)):s<=t&&(e.expiredLanes|=u),o&=~u}}function Eo(e){return e=e.pendingLanes&-1073741825,e!==0?e:e&1073741824?1073741824:0}function Vs(){var e=Sr;return Sr<<=1,!(Sr&4194240)&&(Sr=64),e}function $l(e){for(var t=[],n=0;31>n;n++)t.push(e);return t}function dr(e,t,n){e.pendingLanes|=t,t!==536870912&&(e.suspendedLanes=0,e.pingedLanes=0),e=e.eventTimes,t=31-$e(t),e[t]=n}function gf(e,t){var n=e.pendingLanes&~t;e.pendingLanes=t,e.suspendedLanes=0,e.pingedLanes=0,e.expiredLanes&=t,e.mutableReadLanes&=t,e.entangledLanes&=t,t=e.entanglements;var r=e.eventTimes;for(e=e.expirationTimes;0<n;){var l=31-$e(n),o=1<<l;t[l]=0,r[l]=-1,e[l]=-1,n&=~o}}function di(e,t){var n=e.entangledLanes|=t;for(e=e.entanglements;n;){var r=31-$e(n),l=1<<r;l&t|e[r]&t&&(e[r]|=t),n&=~l}}var D=0;function Hs(e){return e&=-e,1<e?4<e?e&268435455?16:536870912:4:1}var Bs,pi,Qs,Ks,Ys,Co=!1,Er=[],St=null,kt=null,Et=null,Jn=new Map,qn=new Map,gt=[],yf="mousedown mouseup touchcancel touchend touchstart auxclick dblclick pointercancel pointerdown pointerup dragend dragstart drop compositionend compositionstart keydown keypress keyup input textInput copy cut paste click change contextmenu reset submit".split(" ");function uu(e,t){switch(e){case"focusin":case"focusout":St=null;break;case"dragenter":case"dragleave":kt=null;break;case"mouseover":case"mouseout":Et=null;break;case"pointerover":case"pointerout":Jn.delete(t.pointerId);break;case"gotpointercapture":case"lostpointercapture":qn.delete(t.pointerId)}}function Tn(e,t,n,r,l,o){return e===null||e.nativeEvent!==o?(e={blockedOn:t,domEventName:n,eventSystemFlags:r,nativeEvent:o,targetContainers:[l]},t!==null&&(t=hr(t),t!==null&&pi(t)),e):(e.eventSystemFlags|=r,t=e.targetContainers,l!==null&&t.indexOf(l)===-1&&t.push(l),e)}function wf(e,t,n,r,l){switch(t){case"focusin":return St=Tn(St,e,t,n,r,l),!0;case"dragenter":return kt=Tn(kt,e,t,n,r,l),!0;case"mouseover":return Et=Tn(Et,e,t,n,r,l),!0;case"pointerover":var o=l.pointerId;return Jn.set(o,Tn(Jn.get(o)||null,e,t,n,r,l)),!0;case"gotpointercapture":return o=l.pointerId,qn.set(o,Tn(qn.get(o)||null,e,t,n,r,l)),!0}return!1}function Gs(e){var t=Ut(e.target);if(t!==null){var n=Xt(t);if(n!==null){if(t=n.tag,t===13){if(t=Ds(n),t!==null){e.blockedOn=t,Ys(e.priority,function(){Qs(n)});return}}else if(t===3&&n.stateNode.current.memoizedState.isDehydrated){e.blockedOn=n.tag===3?n.stateNode.containerInfo:null;return}}}e.blockedOn=null}function Dr(e){if(e.blockedOn!==null)return!1;for(var t=e.targetContainers;0<t.length;){var n=No(e.domEventName,e.eventSystemFlags,t[0],e.nativeEvent);if(n===null){n=e.nativeEvent;var r=new n.constructor(n.type,n);wo=r,n.target.dispatchEvent(r),wo=null}else return t=hr(n),t!==null&&pi(t),e.blockedOn=n,!1;t.shift()}return!0}function su(e,t,n){Dr(e)&&n.delete(t)}function xf(){Co=!1,St!==null&&Dr(St)&&(St=null),kt!==null&&Dr(kt)&&(kt=null),Et!==null&&Dr(Et)&&(Et=null),Jn.forEach(su),qn.forEach(su)}function Ln(e,t){e.blockedOn===t&&(e.blockedOn=null,Co||(Co=!0,_e.unstable_scheduleCallback(_e.unstable_NormalPriority,xf)))}function bn(e){function t(l){return Ln(l,e)}if(0<Er.length){Ln(Er[0],e);for(var n=1;n<Er.length;n++){var r=Er[n];r.blockedOn===e&&(r.blockedOn=null)}}for(St!==null&&Ln(St,e),kt!==null&&Ln(kt,e),Et!==null&&Ln(Et,e),Jn.forEach(t),qn.forEach(t),n=0;n<gt.length;n++)r=gt[n],r.blockedOn===e&&(r.blockedOn=null);for(;0<gt.length&&(n=gt[0],n.blockedOn===null);)Gs(n),n.blockedOn===null&&gt.shift()}var hn=ut.ReactCurrentBatchConfig,Jr=!0;function Sf(e,t,n,r){var l=D,o=hn.transition;hn.transition=null;try{D=1,hi(e,t,n,r)}finally{D=l,hn.transition=o}}function kf(e,t,n,r){var l=D,o=hn.transition;hn.transition=null;try{D=4,hi(e,t,n,r)}finally{D=l,hn.transition=o}}function hi(e,t,n,r){if(Jr){var l=No(e,t,n,r);if(l===null)Xl(e,t,r,qr,n),uu(e,r);else if(wf(l,e,t,n,r))r.stopPropagation();else if(uu(e,r),t&4&&-1<yf.indexOf(e)){for(;l!==null;){var o=hr(l);if(o!==null&&Bs(o),o=No(e,t,n,r),o===null&&Xl(e,t,r,qr,n),o===l)break;l=o}l!==null&&r.stopPropagation()}else Xl(e,t,r,null,n)}}var qr=null;function No(e,t,n,r){if(qr=null,e=ci(r),e=Ut(e),e!==null)if(t=Xt(e),t===null)e=null;else if(n=t.tag,n===13){if(e=Ds(t),e!==null)return e;e=null}else if(n===3){if(t.stateNode.current.memoizedState.isDehydrated)return t.tag===3?t.stateNode.containerInfo:null;e=null}else t!==e&&(e=null);return qr=e,null}function Xs(e){switch(e){case"cancel":case"click":case"close":case"contextmenu":case"copy":case"cut":case"auxclick":case"dblclick":case"dragend":case"dragstart":case"drop":case"focusin":case"focusout":case"input":case"invalid":case"keydown":case"keypress":case"keyup":case"mousedown":case"mouseup":case"paste":case"pause":case"play":case"pointercancel":case"pointerdown":case"pointerup":case"ratechange":case"reset":case"resize":case"seeked":case"submit":case"touchcancel":case"touchend":case"touchstart":case"volumechange":case"change":case"selectionchange":case"textInput":case"compositionstart":case"compositionend":case"compositionupdate":case"beforeblur":case"afterblur":case"beforeinput":case"blur":case"fullscreenchange":case"focus":case"hashchange":case"popstate":case"select":case"selectstart":return 1;case"drag":case"dragenter":case"dragexit":case"dragleave":case"dragover":case"mousemove":case"mouseout":case"mouseover":case"pointermove":case"pointerout":case"pointerover":case"scroll":case"toggle":case"touchmove":case"wheel":case"mouseenter":case"mouseleave":case"pointerenter":case"pointerleave":return 4;case"message":switch(af()){case fi:return 1;case As:return 4;case Xr:case cf:return 16;case Ws:return 536870912;default:return 16}default:return 16}}var wt=null,mi=null,Fr=null;function Zs(){if(Fr)return Fr;var e,t=mi,n=t.length,r,l="value"in wt?wt.value:wt.textContent,o=l.length;for(e=0;e<n&&t[e]===l[e];e++);var i=n-e;for(r=1;r<=i&&t[n-r]===l[o-r];r++);return Fr=l.slice(e,1<r?1-r:void 0)}function Ur(e){var t=e.keyCode;return"charCode"in e?(e=e.charCode,e===0&&t===13&&(e=13)):e=t,e===10&&(e=13),32<=e||e===13?e:0}function Cr(){return!0}function au(){return!1}function Pe(e){function t(n,r,l,o,i){this._reactName=n,this._targetInst=l,this.type=r,this.nativeEvent=o,this.target=i,this.currentTarget=null;for(var u in e)e.hasOwnProperty(u)&&(n=e[u],this[u]=n?n(o):o[u]);return this.isDefaultPrevented=(o.defaultPrevented!=null?o.defaultPrevented:o.returnValue===!1)?Cr:au,this.isPropagationStopped=au,this}return Y(t.prototype,{preventDefault:function(){this.defaultPrevented=!0;var n=this.nativeEvent;n&&(n.preventDefault?n.preventDefault():typeof n.returnValue!="unknown"&&(n.returnValue=!1),this.isDefaultPrevented=Cr)},stopPropagation:function(){var n=this.nativeEvent;n&&(n.stopPropagation?n.stopPropagation():typeof n.cancelBubble!="unknown"&&(n.cancelBubble=!0),this.isPropagationStopped=Cr)},persist:function(){},isPersistent:Cr}),t}var Nn={eventPhase:0,bubbles:0,cancelable:0,timeStamp:function(e){return e.timeStamp||Date.now()},defaultPrevented:0,isTrusted:0},vi=Pe(Nn),pr=Y({},Nn,{view:0,detail:0}),Ef=Pe(pr),Al,Wl,zn,yl=Y({},pr,{screenX:0,screenY:0,clientX:0,clientY:0,pageX:0,pageY:0,ctrlKey:0,shiftKey:0,altKey:0,metaKey:0,getModifierState:gi,button:0,buttons:0,relatedTarget:function(e){return e.relatedTarget===void 0?e.fromElement===e.srcElement?e.toElement:e.fromElement:e.relatedTarget},movementX:function(e){return"movementX"in e?e.movementX:(e!==zn&&(zn&&e.type==="mousemove"?(Al=e.screenX-zn.screenX,Wl=e.screenY-zn.screenY):Wl=Al=0,zn=e),Al)},movementY:function(e){return"movementY"in e?e.movementY:Wl}}),cu=Pe(yl),Cf=Y({},yl,{dataTransfer:0}),Nf=Pe(Cf),_f=Y({},pr,{relatedTarget:0}),Vl=Pe(_f),jf=Y({},Nn,{animationName:0,elapsedTime:0,pseudoElement:0}),Pf=Pe(jf),Tf=Y({},Nn,{clipboardData:function(e){return"clipboardData"in e?e.clipboardData:window.clipboardData}}),Lf=Pe(Tf),zf=Y({},Nn,{data:0}),fu=Pe(zf),Rf={Esc:"Escape",Spacebar:" ",Left:"ArrowLeft",Up:"ArrowUp",Right:"ArrowRight",Down:"ArrowDown",Del:"Delete",Win:"OS",Menu:"ContextMenu",Apps:"ContextMenu",Scroll:"ScrollLock",MozPrintableKey:"Unidentified"},If={8:"Backspace",9:"Tab",12:"Clear",13:"Enter",16:"Shift",17:"Control",18:"Alt",19:"Pause",20:"CapsLock",27:"Escape",32:" ",33:"PageUp",34:"PageDown",35:"End",36:"Home",37:"ArrowLeft",38:"ArrowUp",39:"ArrowRight",40:"ArrowDown",45:"Insert",46:"Delete",112:"F1",113:"F2",114:"F3",115:"F4",116:"F5",117:"F6",118:"F7",119:"F8",120:"F9",121:"F10",122:"F11",123:"F12",144:"NumLock",145:"ScrollLock",224:"Meta"},Of={Alt:"altKey",Control:"ctrlKey",Meta:"metaKey",Shift:"shiftKey"};function Mf(e){var t=this.nativeEvent;return t.getModifierState?t.getModifierState(e):(e=Of[e])?!!t[e]:!1}function gi(){return Mf}var Df=Y({},pr,{key:function(e){if(e.key){var t=Rf[e.key]||e.key;if(t!=="Unidentified")return t}return e.type==="keypress"?(e=Ur(e),e===13?"Enter":String.fromCharCode(e)):e.type==="keydown"||e.type==="keyup"?If[e.keyCode]||"Unidentified":""},code:0,location:0,ctrlKey:0,shiftKey:0,altKey:0,metaKey:0,repeat:0,locale:0,getModifierState:gi,charCode:function(e){return e.type==="keypress"?Ur(e):0},keyCode:function(e){return e.type==="keydown"||e.type==="keyup"?e.keyCode:0},which:function(e){return e.type==="keypress"?Ur(e):e.type==="keydown"||e.type==="keyup"?e.keyCode:0}}),Ff=Pe(Df),Uf=Y({},yl,{pointerId:0,width:0,height:0,pressure:0,tangentialPressure:0,tiltX:0,tiltY:0,twist:0,pointerType:0,isPrimary:0}),du=Pe(Uf),$f=Y({},pr,{touches:0,targetTouches:0,changedTouches:0,altKey:0,metaKey:0,ctrlKey:0,shiftKey:0,getModifierState:gi}),Af=Pe($f),Wf=Y({},Nn,{propertyName:0,elapsedTime:0,pseudoElement:0}),Vf=Pe(Wf),Hf=Y({},yl,{deltaX:function(e){return"deltaX"in e?e.deltaX:"wheelDeltaX"in e?-e.wheelDeltaX:0},deltaY:function(e){return"deltaY"in e?e.deltaY:"wheelDeltaY"in e?-e.wheelDeltaY:"wheelDelta"in e?-e.wheelDelta:0},deltaZ:0,deltaMode:0}),Bf=Pe(Hf),Qf=[9,13,27,32],yi=rt&&"CompositionEvent"in window,Wn=null;rt&&"documentMode"in document&&(Wn=document.documentMode);var Kf=rt&&"TextEvent"in window&&!Wn,Js=rt&&(!yi||Wn&&8<Wn&&11>=Wn),pu=" ",hu=!1;function qs(e,t){switch(e){case"keyup":return Qf.indexOf(t.keyCode)!==-1;case"keydown":return t.keyCode!==229;case"keypress":case"mousedown":case"focusout":return!0;default:return!1}}function bs(e){return e=e.detail,typeof e=="object"&&"data"in e?e.data:null}var en=!1;function Yf(e,t){switch(e){case"compositionend":return bs(t);case"keypress":return t.which!==32?null:(hu=!0,pu);case"textInput":return e=t.data,e===pu&&hu?null:e;default:return null}}function Gf(e,t){if(en)return e==="compositionend"||!yi&&qs(e,t)?(e=Zs(),Fr=mi=wt=null,en=!1,e):null;switch(e){case"paste":return null;case"keypress":if(!(t.ctrlKey||t.altKey||t.metaKey)||t.ctrlKey&&t.altKey){if(t.char&&1<t.char.length)return t.char;if(t.which)return String.fromCharCode(t.which)}return null;case"compositionend":return Js&&t.locale!=="ko"?null:t.data;default:return null}}var Xf={color:!0,date:!0,datetime:!0,"datetime-local":!0,email:!0,month:!0,number:!0,password:!0,range:!0,search:!0,tel:!0,text:!0,time:!0,url:!0,week:!0};function mu(e){var t=e&&e.nodeName&&e.nodeName.toLowerCase();return t==="input"?!!Xf[e.type]:t==="textarea"}function ea(e,t,n,r){zs(r),t=br(t,"onChange"),0<t.length&&(n=new vi("onChange","change",null,n,r),e.push({event:n,listeners:t}))}var Vn=null,er=null;function Zf(e){fa(e,0)}function wl(e){var t=rn(e);if(Cs(t))return e}function Jf(e,t){if(e==="change")return t}var ta=!1;if(rt){var Hl;if(rt){var Bl="oninput"in document;if(!Bl){var vu=document.createElement("div");vu.setAttribute("oninput","return;"),Bl=typeof vu.oninput=="function"}Hl=Bl}else Hl=!1;ta=Hl&&(!document.documentMode||9<document.documentMode)}function gu(){Vn&&(Vn.detachEvent("onpropertychange",na),er=Vn=null)}function na(e){if(e.propertyName==="value"&&wl(er)){var t=[];ea(t,er,e,ci(e)),Ms(Zf,t)}}function qf(e,t,n){e==="focusin"?(gu(),Vn=t,er=n,Vn.attachEvent("onpropertychange",na)):e==="focusout"&&gu()}function bf(e){if(e==="selectionchange"||e==="keyup"||e==="keydown")return wl(er)}function ed(e,t){if(e==="click")return wl(t)}function td(e,t){if(e==="input"||e==="change")return wl(t)}function nd(e,t){return e===t&&(e!==0||1/e===1/t)||e!==e&&t!==t}var We=typeof Object.is=="function"?Object.is:nd;function tr(e,t){if(We(e,t))return!0;if(typeof e!="object"||e===null||typeof t!="object"||t===null)return!1;var n=Object.keys(e),r=Object.keys(t);if(n.length!==r.length)return!1;for(r=0;r<n.length;r++){var l=n[r];if(!io.call(t,l)||!We(e[l],t[l]))return!1}return!0}function yu(e){for(;e&&e.firstChild;)e=e.firstChild;return e}function wu(e,t){var n=yu(e);e=0;for(var r;n;){if(n.nodeType===3){if(r=e+n.textContent.length,e<=t&&r>=t)return{node:n,offset:t-e};e=r}e:{for(;n;){if(n.nextSibling){n=n.nextSibling;break e}n=n.parentNode}n=void 0}n=yu(n)}}function ra(e,t){return e&&t?e===t?!0:e&&e.nodeType===3?!1:t&&t.nodeType===3?ra(e,t.parentNode):"contains"in e?e.contains(t):e.compareDocumentPosition?!!(e.compareDocumentPosition(t)&16):!1:!1}function la(){for(var e=window,t=Kr();t instanceof e.HTMLIFrameElement;){try{var n=typeof t.contentWindow.location.href=="string"}catch{n=!1}if(n)e=t.contentWindow;else break;t=Kr(e.document)}return t}function wi(e){var t=e&&e.nodeName&&e.nodeName.toLowerCase();return t&&(t==="input"&&(e.type==="text"||e.type==="search"||e.type==="tel"||e.type==="url"||e.type==="password")||t==="textarea"||e.contentEditable==="true")}function rd(e){var t=la(),n=e.focusedElem,r=e.selectionRange;if(t!==n&&n&&n.ownerDocument&&ra(n.ownerDocument.documentElement,n)){if(r!==null&&wi(n)){if(t=r.start,e=r.end,e===void 0&&(e=t),"selectionStart"in n)n.selectionStart=t,n.selectionEnd=Math.min(e,n.value.length);else if(e=(t=n.ownerDocument||document)&&t.defaultView||window,e.getSelection){e=e.getSelection();var l=n.textContent.length,o=Math.min(r.start,l);r=r.end===void 0?o:Math.min(r.end,l),!e.extend&&o>r&&(l=r,r=o,o=l),l=wu(n,o);var i=wu(n,r);l&&i&&(e.rangeCount!==1||e.anchorNode!==l.node||e.anchorOffset!==l.offset||e.focusNode!==i.node||e.focusOffset!==i.offset)&&(t=t.createRange(),t.setStart(l.node,l.offset),e.removeAllRanges(),o>r?(e.addRange(t),e.extend(i.node,i.offset)):(t.setEnd(i.node,i.offset),e.addRange(t)))}}for(t=[],e=n;e=e.parentNode;)e.nodeType===1&&t.push({element:e,left:e.scrollLeft,top:e.scrollTop});for(typeof n.focus=="function"&&n.focus(),n=0;n<t.length;n++)e=t[n],e.element.scrollLeft=e.left,e.element.scrollTop=e.top}}var ld=rt&&"documentMode"in document&&11>=document.documentMode,tn=null,_o=null,Hn=null,jo=!1;function xu(e,t,n){var r=n.window===n?n.document:n.nodeType===9?n:n.ownerDocument;jo||tn==null||tn!==Kr(r)||(r=tn,"selectionStart"in r&&wi(r)?r={start:r.selectionStart,end:r.selectionEnd}:(r=(r.ownerDocument&&r.ownerDocument.defaultView||window).getSelection(),r={anchorNode:r.anchorNode,anchorOffset:r.anchorOffset,focusNode:r.focusNode,focusOffset:r.focusOffset}),Hn&&tr(Hn,r)||(Hn=r,r=br(_o,"onSelect"),0<r.length&&(t=new vi("onSelect","select",null,t,n),e.push({event:t,listeners:r}),t.target=tn)))}function Nr(e,t){var n={};return n[e.toLowerCase()]=t.toLowerCase(),n["Webkit"+e]="webkit"+t,n["Moz"+e]="moz"+t,n}var nn={animationend:Nr("Animation","AnimationEnd"),animationiteration:Nr("Animation","AnimationIteration"),animationstart:Nr("Animation","AnimationStart"),transitionend:Nr("Transition","TransitionEnd")},Ql={},oa={};rt&&(oa=document.createElement("div").style,"AnimationEvent"in window||(delete nn.animationend.animation,delete nn.animationiteration.animation,delete nn.animationstart.animation),"TransitionEvent"in window||delete nn.transitionend.transition);function xl(e){if(Ql[e])return Ql[e];if(!nn[e])return e;var t=nn[e],n;for(n in t)if(t.hasOwnProperty(n)&&n in oa)return Ql[e]=t[n];return e}var ia=xl("animationend"),ua=xl("animationiteration"),sa=xl("animationstart"),aa=xl("transitionend"),ca=new Map,Su="abort auxClick cancel canPlay canPlayThrough click close contextMenu copy cut drag dragEnd dragEnter dragExit dragLeave dragOver dragStart drop durationChange emptied encrypted ended error gotPointerCapture input invalid keyDown keyPress keyUp load loadedData loadedMetadata loadStart lostPointerCapture mouseDown mouseMove mouseOut mouseOver mouseUp paste pause play playing pointerCancel pointerDown pointerMove pointerOut pointerOver pointerUp progress rateChange reset resize seeked seeking stalled submit suspend timeUpdate touchCancel touchEnd touchStart volumeChange scroll toggle touchMove waiting wheel".split(" ");function zt(e,t){ca.set(e,t),Gt(t,[e])}for(var Kl=0;Kl<Su.length;Kl++){var Yl=Su[Kl],od=Yl.toLowerCase(),id=Yl[0].toUpperCase()+Yl.slice(1);zt(od,"on"+id)}zt(ia,"onAnimationEnd");zt(ua,"onAnimationIteration");zt(sa,"onAnimationStart");zt("dblclick","onDoubleClick");zt("focusin","onFocus");zt("focusout","onBlur");zt(aa,"onTransitionEnd");gn("onMouseEnter",["mouseout","mouseover"]);gn("onMouseLeave",["mouseout","mouseover"]);gn("onPointerEnter",["pointerout","pointerover"]);gn("onPointerLeave",["pointerout","pointerover"]);Gt("onChange","change click focusin focusout input keydown keyup selectionchange".split(" "));Gt("onSelect","focusout contextmenu dragend focusin keydown keyup mousedown mouseup selectionchange".split(" "));Gt("onBeforeInput",["compositionend","keypress","textInput","paste"]);Gt("onCompositionEnd","compositionend focusout keydown keypress keyup mousedown".split(" "));Gt("onCompositionStart","compositionstart focusout keydown keypress keyup mousedown".split(" "));Gt("onCompositionUpdate","compositionupdate focusout keydown keypress keyup mousedown".split(" "));var Un="abort canplay canplaythrough durationchange emptied encrypted ended error loadeddata loadedmetadata loadstart pause play playing progress ratechange resize seeked seeking stalled suspend timeupdate volumechange waiting".split(" "),ud=new Set("cancel close invalid load scroll toggle".split(" ").concat(Un));function ku(e,t,n){var r=e.type||"unknown-event";e.currentTarget=n,lf(r,t,void 0,e),e.currentTarget=null}function fa(e,t){t=(t&4)!==0;for(var n=0;n<e.length;n++){var r=e[n],l=r.event;r=r.listeners;e:{var o=void 0;if(t)for(var i=r.length-1;0<=i;i--){var u=r[i],s=u.instance,c=u.currentTarget;if(u=u.listener,s!==o&&l.isPropagationStopped())break e;ku(l,u,c),o=s}else for(i=0;i<r.length;i++){if(u=r[i],s=u.instance,c=u.currentTarget,u=u.listener,s!==o&&l.isPropagationStopped())break e;ku(l,u,c),o=s}}}if(Gr)throw e=ko,Gr=!1,ko=null,e}function $(e,t){var n=t[Ro];n===void 0&&(n=t[Ro]=new Set);var r=e+"__bubble";n.has(r)||(da(t,e,2,!1),n.add(r))}function Gl(e,t,n){var r=0;t&&(r|=4),da(n,e,r,t)}var _r="_reactListening"+Math.random().toString(36).slice(2);function nr(e){if(!e[_r]){e[_r]=!0,ws.forEach(function(n){n!=="selectionchange"&&(ud.has(n)||Gl(n,!1,e),Gl(n,!0,e))});var t=e.nodeType===9?e:e.ownerDocument;t===null||t[_r]||(t[_r]=!0,Gl("selectionchange",!1,t))}}function da(e,t,n,r){switch(Xs(t)){case 1:var l=Sf;break;case 4:l=kf;break;default:l=hi}n=l.bind(null,t,n,e),l=void 0,!So||t!=="touchstart"&&t!=="touchmove"&&t!=="wheel"||(l=!0),r?l!==void 0?e.addEventListener(t,n,{capture:!0,passive:l}):e.addEventListener(t,n,!0):l!==void 0?e.addEventListener(t,n,{passive:l}):e.addEventListener(t,n,!1)}function Xl(e,t,n,r,l){var o=r;if(!(t&1)&&!(t&2)&&r!==null)e:for(;;){if(r===null)return;var i=r.tag;if(i===3||i===4){var u=r.stateNode.containerInfo;if(u===l||u.nodeType===8&&u.parentNode===l)break;if(i===4)for(i=r.return;i!==null;){var s=i.tag;if((s===3||s===4)&&(s=i.stateNode.containerInfo,s===l||s.nodeType===8&&s.parentNode===l))return;i=i.return}for(;u!==null;){if(i=Ut(u),i===null)return;if(s=i.tag,s===5||s===6){r=o=i;continue e}u=u.parentNode}}r=r.return}Ms(function(){var c=o,h=ci(n),v=[];e:{var m=ca.get(e);if(m!==void 0){var x=vi,S=e;switch(e){case"keypress":if(Ur(n)===0)break e;case"keydown":case"keyup":x=Ff;break;case"focusin":S="focus",x=Vl;break;case"focusout":S="blur",x=Vl;break;case"beforeblur":case"afterblur":x=Vl;break;case"click":if(n.button===2)break e;case"auxclick":case"dblclick":case"mousedown":case"mousemove":case"mouseup":case"mouseout":case"mouseover":case"contextmenu":x=cu;break;case"drag":case"dragend":case"dragenter":case"dragexit":case"dragleave":case"dragover":case"dragstart":case"drop":x=Nf;break;case"touchcancel":case"touchend":case"touchmove":case"touchstart":x=Af;break;case ia:case ua:case sa:x=Pf;break;case aa:x=Vf;break;case"scroll":x=Ef;break;case"wheel":x=Bf;break;case"copy":case"cut":case"paste":x=Lf;break;case"gotpointercapture":case"lostpointercapture":case"pointercancel":case"pointerdown":case"pointermove":case"pointerout":case"pointerover":case"pointerup":x=du}var k=(t&4)!==0,F=!k&&e==="scroll",d=k?m!==null?m+"Capture":null:m;k=[];for(var a=c,p;a!==null;){p=a;var y=p.stateNode;if(p.tag===5&&y!==null&&(p=y,d!==null&&(y=Zn(a,d),y!=null&&k.push(rr(a,y,p)))),F)break;a=a.return}0<k.length&&(m=new x(m,S,null,n,h),v.push({event:m,listeners:k}))}}if(!(t&7)){e:{if(m=e==="mouseover"||e==="pointerover",x=e==="mouseout"||e==="pointerout",m&&n!==wo&&(S=n.relatedTarget||n.fromElement)&&(Ut(S)||S[lt]))break e;if((x||m)&&(m=h.window===h?h:(m=h.ownerDocument)?m.defaultView||m.parentWindow:window,x?(S=n.relatedTarget||n.toElement,x=c,S=S?Ut(S):null,S!==null&&(F=Xt(S),S!==F||S.tag!==5&&S.tag!==6)&&(S=null)):(x=null,S=c),x!==S)){if(k=cu,y="onMouseLeave",d="onMouseEnter",a="mouse",(e==="pointerout"||e==="pointerover")&&(k=du,y="onPointerLeave",d="onPointerEnter",a="pointer"),F=x==null?m:rn(x),p=S==null?m:rn(S),m=new k(y,a+"leave",x,n,h),m.target=F,m.relatedTarget=p,y=null,Ut(h)===c&&(k=new k(d,a+"enter",S,n,h),k.target=p,k.relatedTarget=F,y=k),F=y,x&&S)t:{for(k=x,d=S,a=0,p=k;p;p=Jt(p))a++;for(p=0,y=d;y;y=Jt(y))p++;for(;0<a-p;)k=Jt(k),a--;for(;0<p-a;)d=Jt(d),p--;for(;a--;){if(k===d||d!==null&&k===d.alternate)break t;k=Jt(k),d=Jt(d)}k=null}else k=null;x!==null&&Eu(v,m,x,k,!1),S!==null&&F!==null&&Eu(v,F,S,k,!0)}}e:{if(m=c?rn(c):window,x=m.nodeName&&m.nodeName.toLowerCase(),x==="select"||x==="input"&&m.type==="file")var E=Jf;else if(mu(m))if(ta)E=td;else{E=bf;var _=qf}else(x=m.nodeName)&&x.toLowerCase()==="input"&&(m.type==="checkbox"||m.type==="radio")&&(E=ed);if(E&&(E=E(e,c))){ea(v,E,n,h);break e}_&&_(e,m,c),e==="focusout"&&(_=m._wrapperState)&&_.controlled&&m.type==="number"&&ho(m,"number",m.value)}switch(_=c?rn(c):window,e){case"focusin":(mu(_)||_.contentEditable==="true")&&(tn=_,_o=c,Hn=null);break;case"focusout":Hn=_o=tn=null;break;case"mousedown":jo=!0;break;case"contextmenu":case"mouseup":case"dragend":jo=!1,xu(v,n,h);break;case"selectionchange":if(ld)break;case"keydown":case"keyup":xu(v,n,h)}var j;if(yi)e:{switch(e){case"compositionstart":var P="onCompositionStart";break e;case"compositionend":P="onCompositionEnd";break e;case"compositionupdate":P="onCompositionUpdate";break e}P=void 0}else en?qs(e,n)&&(P="onCompositionEnd"):e==="keydown"&&n.keyCode===229&&(P="onCompositionStart");P&&(Js&&n.locale!=="ko"&&(en||P!=="onCompositionStart"?P==="onCompositionEnd"&&en&&(j=Zs()):(wt=h,mi="value"in wt?wt.value:wt.textContent,en=!0)),_=br(c,P),0<_.length&&(P=new fu(P,e,null,n,h),v.push({event:P,listeners:_}),j?P.data=j:(j=bs(n),j!==null&&(P.data=j)))),(j=Kf?Yf(e,n):Gf(e,n))&&(c=br(c,"onBeforeInput"),0<c.length&&(h=new fu("onBeforeInput","beforeinput",null,n,h),v.push({event:h,listeners:c}),h.data=j))}fa(v,t)})}function rr(e,t,n){return{instance:e,listener:t,currentTarget:n}}function br(e,t){for(var n=t+"Capture",r=[];e!==null;){var l=e,o=l.stateNode;l.tag===5&&o!==null&&(l=o,o=Zn(e,n),o!=null&&r.unshift(rr(e,o,l)),o=Zn(e,t),o!=null&&r.push(rr(e,o,l))),e=e.return}return r}function Jt(e){if(e===null)return null;do e=e.return;while(e&&e.tag!==5);return e||null}function Eu(e,t,n,r,l){for(var o=t._reactName,i=[];n!==null&&n!==r;){var u=n,s=u.alternate,c=u.stateNode;if(s!==null&&s===r)break;u.tag===5&&c!==null&&(u=c,l?(s=Zn(n,o),s!=null&&i.unshift(rr(n,s,u))):l||(s=Zn(n,o),s!=null&&i.push(rr(n,s,u)))),n=n.return}i.length!==0&&e.push({event:t,listeners:i})}var sd=/\r\n?/g,ad=/\u0000|\uFFFD/g;function Cu(e){return(typeof e=="string"?e:""+e).replace(sd,`
-`).replace(ad,"")}function jr(e,t,n){if(t=Cu(t),Cu(e)!==t&&n)throw Error(w(425))}function el(){}var Po=null,To=null;function Lo(e,t){return e==="textarea"||e==="noscript"||typeof t.children=="string"||typeof t.children=="number"||typeof t.dangerouslySetInnerHTML=="object"&&t.dangerouslySetInnerHTML!==null&&t.dangerouslySetInnerHTML.__html!=null}var zo=typeof setTimeout=="function"?setTimeout:void 0,cd=typeof clearTimeout=="function"?clearTimeout:void 0,Nu=typeof Promise=="function"?Promise:void 0,fd=typeof queueMicrotask=="function"?queueMicrotask:typeof Nu<"u"?function(e){return Nu.resolve(null).then(e).catch(dd)}:zo;function dd(e){setTimeout(function(){throw e})}function Zl(e,t){var n=t,r=0;do{var l=n.nextSibling;if(e.removeChild(n),l&&l.nodeType===8)if(n=l.data,n==="/$"){if(r===0){e.removeChild(l),bn(t);return}r--}else n!=="$"&&n!=="$?"&&n!=="$!"||r++;n=l}while(n);bn(t)}function Ct(e){for(;e!=null;e=e.nextSibling){var t=e.nodeType;if(t===1||t===3)break;if(t===8){if(t=e.data,t==="$"||t==="$!"||t==="$?")break;if(t==="/$")return null}}return e}function _u(e){e=e.previousSibling;for(var t=0;e;){if(e.nodeType===8){var n=e.data;if(n==="$"||n==="$!"||n==="$?"){if(t===0)return e;t--}else n==="/$"&&t++}e=e.previousSibling}return null}var _n=Math.random().toString(36).slice(2),Ke="__reactFiber$"+_n,lr="__reactProps$"+_n,lt="__reactContainer$"+_n,Ro="__reactEvents$"+_n,pd="__reactListeners$"+_n,hd="__reactHandles$"+_n;function Ut(e){var t=e[Ke];if(t)return t;for(var n=e.parentNode;n;){if(t=n[lt]||n[Ke]){if(n=t.alternate,t.child!==null||n!==null&&n.child!==null)for(e=_u(e);e!==null;){if(n=e[Ke])return n;e=_u(e)}return t}e=n,n=e.parentNode}return null}function hr(e){return e=e[Ke]||e[lt],!e||e.tag!==5&&e.tag!==6&&e.tag!==13&&e.tag!==3?null:e}function rn(e){if(e.tag===5||e.tag===6)return e.stateNode;throw Error(w(33))}function Sl(e){return e[lr]||null}var Io=[],ln=-1;function Rt(e){return{current:e}}function A(e){0>ln||(e.current=Io[ln],Io[ln]=null,ln--)}function U(e,t){ln++,Io[ln]=e.current,e.current=t}var Lt={},ce=Rt(Lt),xe=Rt(!1),Ht=Lt;function yn(e,t){var n=e.type.contextTypes;if(!n)return Lt;var r=e.stateNode;if(r&&r.__reactInternalMemoizedUnmaskedChildContext===t)return r.__reactInternalMemoizedMaskedChildContext;var l={},o;for(o in n)l[o]=t[o];return r&&(e=e.stateNode,e.__reactInternalMemoizedUnmaskedChildContext=t,e.__reactInternalMemoizedMaskedChildContext=l),l}function Se(e){return e=e.childContextTypes,e!=null}function tl(){A(xe),A(ce)}function ju(e,t,n){if(ce.current!==Lt)throw Error(w(168));U(ce,t),U(xe,n)}function pa(e,t,n){var r=e.stateNode;if(t=t.childContextTypes,typeof r.getChildContext!="function")return n;r=r.getChildContext();for(var l in r)if(!(l in t))throw Error(w(108,Jc(e)||"Unknown",l));return Y({},n,r)}function nl(e){return e=(e=e.stateNode)&&e.__reactInternalMemoizedMergedChildContext||Lt,Ht=ce.current,U(ce,e),U(xe,xe.current),!0}function Pu(e,t,n){var r=e.stateNode;if(!r)throw Error(w(169));n?(e=pa(e,t,Ht),r.__reactInternalMemoizedMergedChildContext=e,A(xe),A(ce),U(ce,e)):A(xe),U(xe,n)}var be=null,kl=!1,Jl=!1;function ha(e){be===null?be=[e]:be.push(e)}function md(e){kl=!0,ha(e)}function It(){if(!Jl&&be!==null){Jl=!0;var e=0,t=D;try{var n=be;for(D=1;e<n.length;e++){var r=n[e];do r=r(!0);while(r!==null)}be=null,kl=!1}catch(l){throw be!==null&&(be=be.slice(e+1)),$s(fi,It),l}finally{D=t,Jl=!1}}return null}var on=[],un=0,rl=null,ll=0,Te=[],Le=0,Bt=null,et=1,tt="";function Dt(e,t){on[un++]=ll,on[un++]=rl,rl=e,ll=t}function ma(e,t,n){Te[Le++]=et,Te[Le++]=tt,Te[Le++]=Bt,Bt=e;var r=et;e=tt;var l=32-$e(r)-1;r&=~(1<<l),n+=1;var o=32-$e(t)+l;if(30<o){var i=l-l%5;o=(r&(1<<i)-1).toString(32),r>>=i,l-=i,et=1<<32-$e(t)+l|n<<l|r,tt=o+e}else et=1<<o|n<<l|r,tt=e}function xi(e){e.return!==null&&(Dt(e,1),ma(e,1,0))}function Si(e){for(;e===rl;)rl=on[--un],on[un]=null,ll=on[--un],on[un]=null;for(;e===Bt;)Bt=Te[--Le],Te[Le]=null,tt=Te[--Le],Te[Le]=null,et=Te[--Le],Te[Le]=null}var Ne=null,Ce=null,H=!1,Ue=null;function va(e,t){var n=ze(5,null,null,0);n.elementType="DELETED",n.stateNode=t,n.return=e,t=e.deletions,t===null?(e.deletions=[n],e.flags|=16):t.push(n)}function Tu(e,t){switch(e.tag){case 5:var n=e.type;return t=t.nodeType!==1||n.toLowerCase()!==t.nodeName.toLowerCase()?null:t,t!==null?(e.stateNode=t,Ne=e,Ce=Ct(t.firstChild),!0):!1;case 6:return t=e.pendingProps===""||t.nodeType!==3?null:t,t!==null?(e.stateNode=t,Ne=e,Ce=null,!0):!1;case 13:return t=t.nodeType!==8?null:t,t!==null?(n=Bt!==null?{id:et,overflow:tt}:null,e.memoizedState={dehydrated:t,treeContext:n,retryLane:1073741824},n=ze(18,null,null,0),n.stateNode=t,n.return=e,e.child=n,Ne=e,Ce=null,!0):!1;default:return!1}}function Oo(e){return(e.mode&1)!==0&&(e.flags&128)===0}function Mo(e){if(H){var t=Ce;if(t){var n=t;if(!Tu(e,t)){if(Oo(e))throw Error(w(418));t=Ct(n.nextSibling);var r=Ne;t&&Tu(e,t)?va(r,n):(e.flags=e.flags&-4097|2,H=!1,Ne=e)}}else{if(Oo(e))throw Error(w(418));e.flags=e.flags&-4097|2,H=!1,Ne=e}}}function Lu(e){for(e=e.return;e!==null&&e.tag!==5&&e.tag!==3&&e.tag!==13;)e=e.return;Ne=e}function Pr(e){if(e!==Ne)return!1;if(!H)return Lu(e),H=!0,!1;var t;if((t=e.tag!==3)&&!(t=e.tag!==5)&&(t=e.type,t=t!=="head"&&t!=="body"&&!Lo(e.type,e.memoizedProps)),t&&(t=Ce)){if(Oo(e))throw ga(),Error(w(418));for(;t;)va(e,t),t=Ct(t.nextSibling)}if(Lu(e),e.tag===13){if(e=e.memoizedState,e=e!==null?e.dehydrated:null,!e)throw Error(w(317));e:{for(e=e.nextSibling,t=0;e;){if(e.nodeType===8){var n=e.data;if(n==="/$"){if(t===0){Ce=Ct(e.nextSibling);break e}t--}else n!=="$"&&n!=="$!"&&n!=="$?"||t++}e=e.nextSibling}Ce=null}}else Ce=Ne?Ct(e.stateNode.nextSibling):null;return!0}function ga(){for(var e=Ce;e;)e=Ct(e.nextSibling)}function wn(){Ce=Ne=null,H=!1}function ki(e){Ue===null?Ue=[e]:Ue.push(e)}var vd=ut.ReactCurrentBatchConfig;function Rn(e,t,n){if(e=n.ref,e!==null&&typeof e!="function"&&typeof e!="object"){if(n._owner){if(n=n._owner,n){if(n.tag!==1)throw Error(w(309));var r=n.stateNode}if(!r)throw Error(w(147,e));var l=r,o=""+e;return t!==null&&t.ref!==null&&typeof t.ref=="function"&&t.ref._stringRef===o?t.ref:(t=function(i){var u=l.refs;i===null?delete u[o]:u[o]=i},t._stringRef=o,t)}if(typeof e!="string")throw Error(w(284));if(!n._owner)throw Error(w(290,e))}return e}function Tr(e,t){throw e=Object.prototype.toString.call(t),Error(w(31,e==="[object Object]"?"object with keys {"+Object.keys(t).join(", ")+"}":e))}function zu(e){var t=e._init;return t(e._payload)}function ya(e){function t(d,a){if(e){var p=d.deletions;p===null?(d.deletions=[a],d.flags|=16):p.push(a)}}function n(d,a){if(!e)return null;for(;a!==null;)t(d,a),a=a.sibling;return null}function r(d,a){for(d=new Map;a!==null;)a.key!==null?d.set(a.key,a):d.set(a.index,a),a=a.sibling;return d}function l(d,a){return d=Pt(d,a),d.index=0,d.sibling=null,d}function o(d,a,p){return d.index=p,e?(p=d.alternate,p!==null?(p=p.index,p<a?(d.flags|=2,a):p):(d.flags|=2,a)):(d.flags|=1048576,a)}function i(d){return e&&d.alternate===null&&(d.flags|=2),d}function u(d,a,p,y){return a===null||a.tag!==6?(a=lo(p,d.mode,y),a.return=d,a):(a=l(a,p),a.return=d,a)}function s(d,a,p,y){var E=p.type;return E===bt?h(d,a,p.props.children,y,p.key):a!==null&&(a.elementType===E||typeof E=="object"&&E!==null&&E.$$typeof===pt&&zu(E)===a.type)?(y=l(a,p.props),y.ref=Rn(d,a,p),y.return=d,y):(y=Qr(p.type,p.key,p.props,null,d.mode,y),y.ref=Rn(d,a,p),y.return=d,y)}function c(d,a,p,y){return a===null||a.tag!==4||a.stateNode.containerInfo!==p.containerInfo||a.stateNode.implementation!==p.implementation?(a=oo(p,d.mode,y),a.return=d,a):(a=l(a,p.children||[]),a.return=d,a)}function h(d,a,p,y,E){return a===null||a.tag!==7?(a=Vt(p,d.mode,y,E),a.return=d,a):(a=l(a,p),a.return=d,a)}function v(d,a,p){if(typeof a=="string"&&a!==""||typeof a=="number")return a=lo(""+a,d.mode,p),a.return=d,a;if(typeof a=="object"&&a!==null){switch(a.$$typeof){case yr:return p=Qr(a.type,a.key,a.props,null,d.mode,p),p.ref=Rn(d,null,a),p.return=d,p;case qt:return a=oo(a,d.mode,p),a.return=d,a;case pt:var y=a._init;return v(d,y(a._payload),p)}if(Dn(a)||jn(a))return a=Vt(a,d.mode,p,null),a.return=d,a;Tr(d,a)}return null}function m(d,a,p,y){var E=a!==null?a.key:null;if(typeof p=="string"&&p!==""||typeof p=="number")return E!==null?null:u(d,a,""+p,y);if(typeof p=="object"&&p!==null){switch(p.$$typeof){case yr:return p.key===E?s(d,a,p,y):null;case qt:return p.key===E?c(d,a,p,y):null;case pt:return E=p._init,m(d,a,E(p._payload),y)}if(Dn(p)||jn(p))return E!==null?null:h(d,a,p,y,null);Tr(d,p)}return null}function x(d,a,p,y,E){if(typeof y=="string"&&y!==""||typeof y=="number")return d=d.get(p)||null,u(a,d,""+y,E);if(typeof y=="object"&&y!==null){switch(y.$$typeof){case yr:return d=d.get(y.key===null?p:y.key)||null,s(a,d,y,E);case qt:return d=d.get(y.key===null?p:y.key)||null,c(a,d,y,E);case pt:var _=y._init;return x(d,a,p,_(y._payload),E)}if(Dn(y)||jn(y))return d=d.get(p)||null,h(a,d,y,E,null);Tr(a,y)}return null}function S(d,a,p,y){for(var E=null,_=null,j=a,P=a=0,B=null;j!==null&&P<p.length;P++){j.index>P?(B=j,j=null):B=j.sibling;var R=m(d,j,p[P],y);if(R===null){j===null&&(j=B);break}e&&j&&R.alternate===null&&t(d,j),a=o(R,a,P),_===null?E=R:_.sibling=R,_=R,j=B}if(P===p.length)return n(d,j),H&&Dt(d,P),E;if(j===null){for(;P<p.length;P++)j=v(d,p[P],y),j!==null&&(a=o(j,a,P),_===null?E=j:_.sibling=j,_=j);return H&&Dt(d,P),E}for(j=r(d,j);P<p.length;P++)B=x(j,d,P,p[P],y),B!==null&&(e&&B.alternate!==null&&j.delete(B.key===null?P:B.key),a=o(B,a,P),_===null?E=B:_.sibling=B,_=B);return e&&j.forEach(function(fe){return t(d,fe)}),H&&Dt(d,P),E}function k(d,a,p,y){var E=jn(p);if(typeof E!="function")throw Error(w(150));if(p=E.call(p),p==null)throw Error(w(151));for(var _=E=null,j=a,P=a=0,B=null,R=p.next();j!==null&&!R.done;P++,R=p.next()){j.index>P?(B=j,j=null):B=j.sibling;var fe=m(d,j,R.value,y);if(fe===null){j===null&&(j=B);break}e&&j&&fe.alternate===null&&t(d,j),a=o(fe,a,P),_===null?E=fe:_.sibling=fe,_=fe,j=B}if(R.done)return n(d,j),H&&Dt(d,P),E;if(j===null){for(;!R.done;P++,R=p.next())R=v(d,R.value,y),R!==null&&(a=o(R,a,P),_===null?E=R:_.sibling=R,_=R);return H&&Dt(d,P),E}for(j=r(d,j);!R.done;P++,R=p.next())R=x(j,d,P,R.value,y),R!==null&&(e&&R.alternate!==null&&j.delete(R.key===null?P:R.key),a=o(R,a,P),_===null?E=R:_.sibling=R,_=R);return e&&j.forEach(function(Ot){return t(d,Ot)}),H&&Dt(d,P),E}function F(d,a,p,y){if(typeof p=="object"&&p!==null&&p.type===bt&&p.key===null&&(p=p.props.children),typeof p=="object"&&p!==null){switch(p.$$typeof){case yr:e:{for(var E=p.key,_=a;_!==null;){if(_.key===E){if(E=p.type,E===bt){if(_.tag===7){n(d,_.sibling),a=l(_,p.props.children),a.return=d,d=a;break e}}else if(_.elementType===E||typeof E=="object"&&E!==null&&E.$$typeof===pt&&zu(E)===_.type){n(d,_.sibling),a=l(_,p.props),a.ref=Rn(d,_,p),a.return=d,d=a;break e}n(d,_);break}else t(d,_);_=_.sibling}p.type===bt?(a=Vt(p.props.children,d.mode,y,p.key),a.return=d,d=a):(y=Qr(p.type,p.key,p.props,null,d.mode,y),y.ref=Rn(d,a,p),y.return=d,d=y)}return i(d);case qt:e:{for(_=p.key;a!==null;){if(a.key===_)if(a.tag===4&&a.stateNode.containerInfo===p.containerInfo&&a.stateNode.implementation===p.implementation){n(d,a.sibling),a=l(a,p.children||[]),a.return=d,d=a;break e}else{n(d,a);break}else t(d,a);a=a.sibling}a=oo(p,d.mode,y),a.return=d,d=a}return i(d);case pt:return _=p._init,F(d,a,_(p._payload),y)}if(Dn(p))return S(d,a,p,y);if(jn(p))return k(d,a,p,y);Tr(d,p)}return typeof p=="string"&&p!==""||typeof p=="number"?(p=""+p,a!==null&&a.tag===6?(n(d,a.sibling),a=l(a,p),a.return=d,d=a):(n(d,a),a=lo(p,d.mode,y),a.return=d,d=a),i(d)):n(d,a)}return F}var xn=ya(!0),wa=ya(!1),ol=Rt(null),il=null,sn=null,Ei=null;function Ci(){Ei=sn=il=null}function Ni(e){var t=ol.current;A(ol),e._currentValue=t}function Do(e,t,n){for(;e!==null;){var r=e.alternate;if((e.childLanes&t)!==t?(e.childLanes|=t,r!==null&&(r.childLanes|=t)):r!==null&&(r.childLanes&t)!==t&&(r.childLanes|=t),e===n)break;e=e.return}}function mn(e,t){il=e,Ei=sn=null,e=e.dependencies,e!==null&&e.firstContext!==null&&(e.lanes&t&&(we=!0),e.firstContext=null)}function Ie(e){var t=e._currentValue;if(Ei!==e)if(e={context:e,memoizedValue:t,next:null},sn===null){if(il===null)throw Error(w(308));sn=e,il.dependencies={lanes:0,firstContext:e}}else sn=sn.next=e;return t}var $t=null;function _i(e){$t===null?$t=[e]:$t.push(e)}function xa(e,t,n,r){var l=t.interleaved;return l===null?(n.next=n,_i(t)):(n.next=l.next,l.next=n),t.interleaved=n,ot(e,r)}function ot(e,t){e.lanes|=t;var n=e.alternate;for(n!==null&&(n.lanes|=t),n=e,e=e.return;e!==null;)e.childLanes|=t,n=e.alternate,n!==null&&(n.childLanes|=t),n=e,e=e.return;return n.tag===3?n.stateNode:null}var ht=!1;function ji(e){e.updateQueue={baseState:e.memoizedState,firstBaseUpdate:null,lastBaseUpdate:null,shared:{pending:null,interleaved:null,lanes:0},effects:null}}function Sa(e,t){e=e.updateQueue,t.updateQueue===e&&(t.updateQueue={baseState:e.baseState,firstBaseUpdate:e.firstBaseUpdate,lastBaseUpdate:e.lastBaseUpdate,shared:e.shared,effects:e.effects})}function nt(e,t){return{eventTime:e,lane:t,tag:0,payload:null,callback:null,next:null}}function Nt(e,t,n){var r=e.updateQueue;if(r===null)return null;if(r=r.shared,M&2){var l=r.pending;return l===null?t.next=t:(t.next=l.next,l.next=t),r.pending=t,ot(e,n)}return l=r.interleaved,l===null?(t.next=t,_i(r)):(t.next=l.next,l.next=t),r.interleaved=t,ot(e,n)}function $r(e,t,n){if(t=t.updateQueue,t!==null&&(t=t.shared,(n&4194240)!==0)){var r=t.lanes;r&=e.pendingLanes,n|=r,t.lanes=n,di(e,n)}}function Ru(e,t){var n=e.updateQueue,r=e.alternate;if(r!==null&&(r=r.updateQueue,n===r)){var l=null,o=null;if(n=n.firstBaseUpdate,n!==null){do{var i={eventTime:n.eventTime,lane:n.lane,tag:n.tag,payload:n.payload,callback:n.callback,next:null};o===null?l=o=i:o=o.next=i,n=n.next}while(n!==null);o===null?l=o=t:o=o.next=t}else l=o=t;n={baseState:r.baseState,firstBaseUpdate:l,lastBaseUpdate:o,shared:r.shared,effects:r.effects},e.updateQueue=n;return}e=n.lastBaseUpdate,e===null?n.firstBaseUpdate=t:e.next=t,n.lastBaseUpdate=t}function ul(e,t,n,r){var l=e.updateQueue;ht=!1;var o=l.firstBaseUpdate,i=l.lastBaseUpdate,u=l.shared.pending;if(u!==null){l.shared.pending=null;var s=u,c=s.next;s.next=null,i===null?o=c:i.next=c,i=s;var h=e.alternate;h!==null&&(h=h.updateQueue,u=h.lastBaseUpdate,u!==i&&(u===null?h.firstBaseUpdate=c:u.next=c,h.lastBaseUpdate=s))}if(o!==null){var v=l.baseState;i=0,h=c=s=null,u=o;do{var m=u.lane,x=u.eventTime;if((r&m)===m){h!==null&&(h=h.next={eventTime:x,lane:0,tag:u.tag,payload:u.payload,callback:u.callback,next:null});e:{var S=e,k=u;switch(m=t,x=n,k.tag){case 1:if(S=k.payload,typeof S=="function"){v=S.call(x,v,m);break e}v=S;break e;case 3:S.flags=S.flags&-65537|128;case 0:if(S=k.payload,m=typeof S=="function"?S.call(x,v,m):S,m==null)break e;v=Y({},v,m);break e;case 2:ht=!0}}u.callback!==null&&u.lane!==0&&(e.flags|=64,m=l.effects,m===null?l.effects=[u]:m.push(u))}else x={eventTime:x,lane:m,tag:u.tag,payload:u.payload,callback:u.callback,next:null},h===null?(c=h=x,s=v):h=h.next=x,i|=m;if(u=u.next,u===null){if(u=l.shared.pending,u===null)break;m=u,u=m.next,m.next=null,l.lastBaseUpdate=m,l.shared.pending=null}}while(!0);if(h===null&&(s=v),l.baseState=s,l.firstBaseUpdate=c,l.lastBaseUpdate=h,t=l.shared.interleaved,t!==null){l=t;do i|=l.lane,l=l.next;while(l!==t)}else o===null&&(l.shared.lanes=0);Kt|=i,e.lanes=i,e.memoizedState=v}}function Iu(e,t,n){if(e=t.effects,t.effects=null,e!==null)for(t=0;t<e.length;t++){var r=e[t],l=r.callback;if(l!==null){if(r.callback=null,r=n,typeof l!="function")throw Error(w(191,l));l.call(r)}}}var mr={},Ge=Rt(mr),or=Rt(mr),ir=Rt(mr);function At(e){if(e===mr)throw Error(w(174));return e}function Pi(e,t){switch(U(ir,t),U(or,e),U(Ge,mr),e=t.nodeType,e){case 9:case 11:t=(t=t.documentElement)?t.namespaceURI:vo(null,"");break;default:e=e===8?t.parentNode:t,t=e.namespaceURI||null,e=e.tagName,t=vo(t,e)}A(Ge),U(Ge,t)}function Sn(){A(Ge),A(or),A(ir)}function ka(e){At(ir.current);var t=At(Ge.current),n=vo(t,e.type);t!==n&&(U(or,e),U(Ge,n))}function Ti(e){or.current===e&&(A(Ge),A(or))}var Q=Rt(0);function sl(e){for(var t=e;t!==null;){if(t.tag===13){var n=t.memoizedState;if(n!==null&&(n=n.dehydrated,n===null||n.data==="$?"||n.data==="$!"))return t}else if(t.tag===19&&t.memoizedProps.revealOrder!==void 0){if(t.flags&128)return t}else if(t.child!==null){t.child.return=t,t=t.child;continue}if(t===e)break;for(;t.sibling===null;){if(t.return===null||t.return===e)return null;t=t.return}t.sibling.return=t.return,t=t.sibling}return null}var ql=[];function Li(){for(var e=0;e<ql.length;e++)ql[e]._workInProgressVersionPrimary=null;ql.length=0}var Ar=ut.ReactCurrentDispatcher,bl=ut.ReactCurrentBatchConfig,Qt=0,K=null,ee=null,ne=null,al=!1,Bn=!1,ur=0,gd=0;function ue(){throw Error(w(321))}function zi(e,t){if(t===null)return!1;for(var n=0;n<t.length&&n<e.length;n++)if(!We(e[n],t[n]))return!1;return!0}function Ri(e,t,n,r,l,o){if(Qt=o,K=t,t.memoizedState=null,t.updateQueue=null,t.lanes=0,Ar.current=e===null||e.memoizedState===null?Sd:kd,e=n(r,l),Bn){o=0;do{if(Bn=!1,ur=0,25<=o)throw Error(w(301));o+=1,ne=ee=null,t.updateQueue=null,Ar.current=Ed,e=n(r,l)}while(Bn)}if(Ar.current=cl,t=ee!==null&&ee.next!==null,Qt=0,ne=ee=K=null,al=!1,t)throw Error(w(300));return e}function Ii(){var e=ur!==0;return ur=0,e}function Qe(){var e={memoizedState:null,baseState:null,baseQueue:null,queue:null,next:null};return ne===null?K.memoizedState=ne=e:ne=ne.next=e,ne}function Oe(){if(ee===null){var e=K.alternate;e=e!==null?e.memoizedState:null}else e=ee.next;var t=ne===null?K.memoizedState:ne.next;if(t!==null)ne=t,ee=e;else{if(e===null)throw Error(w(310));ee=e,e={memoizedState:ee.memoizedState,baseState:ee.baseState,baseQueue:ee.baseQueue,queue:ee.queue,next:null},ne===null?K.memoizedState=ne=e:ne=ne.next=e}return ne}function sr(e,t){return typeof t=="function"?t(e):t}function eo(e){var t=Oe(),n=t.queue;if(n===null)throw Error(w(311));n.lastRenderedReducer=e;var r=ee,l=r.baseQueue,o=n.pending;if(o!==null){if(l!==null){var i=l.next;l.next=o.next,o.next=i}r.baseQueue=l=o,n.pending=null}if(l!==null){o=l.next,r=r.baseState;var u=i=null,s=null,c=o;do{var h=c.lane;if((Qt&h)===h)s!==null&&(s=s.next={lane:0,action:c.action,hasEagerState:c.hasEagerState,eagerState:c.eagerState,next:null}),r=c.hasEagerState?c.eagerState:e(r,c.action);else{var v={lane:h,action:c.action,hasEagerState:c.hasEagerState,eagerState:c.eagerState,next:null};s===null?(u=s=v,i=r):s=s.next=v,K.lanes|=h,Kt|=h}c=c.next}while(c!==null&&c!==o);s===null?i=r:s.next=u,We(r,t.memoizedState)||(we=!0),t.memoizedState=r,t.baseState=i,t.baseQueue=s,n.lastRenderedState=r}if(e=n.interleaved,e!==null){l=e;do o=l.lane,K.lanes|=o,Kt|=o,l=l.next;while(l!==e)}else l===null&&(n.lanes=0);return[t.memoizedState,n.dispatch]}function to(e){var t=Oe(),n=t.queue;if(n===null)throw Error(w(311));n.lastRenderedReducer=e;var r=n.dispatch,l=n.pending,o=t.memoizedState;if(l!==null){n.pending=null;var i=l=l.next;do o=e(o,i.action),i=i.next;while(i!==l);We(o,t.memoizedState)||(we=!0),t.memoizedState=o,t.baseQueue===null&&(t.baseState=o),n.lastRenderedState=o}return[o,r]}function Ea(){}function Ca(e,t){var n=K,r=Oe(),l=t(),o=!We(r.memoizedState,l);if(o&&(r.memoizedState=l,we=!0),r=r.queue,Oi(ja.bind(null,n,r,e),[e]),r.getSnapshot!==t||o||ne!==null&&ne.memoizedState.tag&1){if(n.flags|=2048,ar(9,_a.bind(null,n,r,l,t),void 0,null),re===null)throw Error(w(349));Qt&30||Na(n,t,l)}return l}function Na(e,t,n){e.flags|=16384,e={getSnapshot:t,value:n},t=K.updateQueue,t===null?(t={lastEffect:null,stores:null},K.updateQueue=t,t.stores=[e]):(n=t.stores,n===null?t.stores=[e]:n.push(e))}function _a(e,t,n,r){t.value=n,t.getSnapshot=r,Pa(t)&&Ta(e)}function ja(e,t,n){return n(function(){Pa(t)&&Ta(e)})}function Pa(e){var t=e.getSnapshot;e=e.value;try{var n=t();return!We(e,n)}catch{return!0}}function Ta(e){var t=ot(e,1);t!==null&&Ae(t,e,1,-1)}function Ou(e){var t=Qe();return typeof e=="function"&&(e=e()),t.memoizedState=t.baseState=e,e={pending:null,interleaved:null,lanes:0,dispatch:null,lastRenderedReducer:sr,lastRenderedState:e},t.queue=e,e=e.dispatch=xd.bind(null,K,e),[t.memoizedState,e]}function ar(e,t,n,r){return e={tag:e,create:t,destroy:n,deps:r,next:null},t=K.updateQueue,t===null?(t={lastEffect:null,stores:null},K.updateQueue=t,t.lastEffect=e.next=e):(n=t.lastEffect,n===null?t.lastEffect=e.next=e:(r=n.next,n.next=e,e.next=r,t.lastEffect=e)),e}function La(){return Oe().memoizedState}function Wr(e,t,n,r){var l=Qe();K.flags|=e,l.memoizedState=ar(1|t,n,void 0,r===void 0?null:r)}function El(e,t,n,r){var l=Oe();r=r===void 0?null:r;var o=void 0;if(ee!==null){var i=ee.memoizedState;if(o=i.destroy,r!==null&&zi(r,i.deps)){l.memoizedState=ar(t,n,o,r);return}}K.flags|=e,l.memoizedState=ar(1|t,n,o,r)}function Mu(e,t){return Wr(8390656,8,e,t)}function Oi(e,t){return El(2048,8,e,t)}function za(e,t){return El(4,2,e,t)}function Ra(e,t){return El(4,4,e,t)}function Ia(e,t){if(typeof t=="function")return e=e(),t(e),function(){t(null)};if(t!=null)return e=e(),t.current=e,function(){t.current=null}}function Oa(e,t,n){return n=n!=null?n.concat([e]):null,El(4,4,Ia.bind(null,t,e),n)}function Mi(){}function Ma(e,t){var n=Oe();t=t===void 0?null:t;var r=n.memoizedState;return r!==null&&t!==null&&zi(t,r[1])?r[0]:(n.memoizedState=[e,t],e)}function Da(e,t){var n=Oe();t=t===void 0?null:t;var r=n.memoizedState;return r!==null&&t!==null&&zi(t,r[1])?r[0]:(e=e(),n.memoizedState=[e,t],e)}function Fa(e,t,n){return Qt&21?(We(n,t)||(n=Vs(),K.lanes|=n,Kt|=n,e.baseState=!0),t):(e.baseState&&(e.baseState=!1,we=!0),e.memoizedState=n)}function yd(e,t){var n=D;D=n!==0&&4>n?n:4,e(!0);var r=bl.transition;bl.transition={};try{e(!1),t()}finally{D=n,bl.transition=r}}function Ua(){return Oe().memoizedState}function wd(e,t,n){var r=jt(e);if(n={lane:r,action:n,hasEagerState:!1,eagerState:null,next:null},$a(e))Aa(t,n);else if(n=xa(e,t,n,r),n!==null){var l=he();Ae(n,e,r,l),Wa(n,t,r)}}function xd(e,t,n){var r=jt(e),l={lane:r,action:n,hasEagerState:!1,eagerState:null,next:null};if($a(e))Aa(t,l);else{var o=e.alternate;if(e.lanes===0&&(o===null||o.lanes===0)&&(o=t.lastRenderedReducer,o!==null))try{var i=t.lastRenderedState,u=o(i,n);if(l.hasEagerState=!0,l.eagerState=u,We(u,i)){var s=t.interleaved;s===null?(l.next=l,_i(t)):(l.next=s.next,s.next=l),t.interleaved=l;return}}catch{}finally{}n=xa(e,t,l,r),n!==null&&(l=he(),Ae(n,e,r,l),Wa(n,t,r))}}function $a(e){var t=e.alternate;return e===K||t!==null&&t===K}function Aa(e,t){Bn=al=!0;var n=e.pending;n===null?t.next=t:(t.next=n.next,n.next=t),e.pending=t}function Wa(e,t,n){if(n&4194240){var r=t.lanes;r&=e.pendingLanes,n|=r,t.lanes=n,di(e,n)}}var cl={readContext:Ie,useCallback:ue,useContext:ue,useEffect:ue,useImperativeHandle:ue,useInsertionEffect:ue,useLayoutEffect:ue,useMemo:ue,useReducer:ue,useRef:ue,useState:ue,useDebugValue:ue,useDeferredValue:ue,useTransition:ue,useMutableSource:ue,useSyncExternalStore:ue,useId:ue,unstable_isNewReconciler:!1},Sd={readContext:Ie,useCallback:function(e,t){return Qe().memoizedState=[e,t===void 0?null:t],e},useContext:Ie,useEffect:Mu,useImperativeHandle:function(e,t,n){return n=n!=null?n.concat([e]):null,Wr(4194308,4,Ia.bind(null,t,e),n)},useLayoutEffect:function(e,t){return Wr(4194308,4,e,t)},useInsertionEffect:function(e,t){return Wr(4,2,e,t)},useMemo:function(e,t){var n=Qe();return t=t===void 0?null:t,e=e(),n.memoizedState=[e,t],e},useReducer:function(e,t,n){var r=Qe();return t=n!==void 0?n(t):t,r.memoizedState=r.baseState=t,e={pending:null,interleaved:null,lanes:0,dispatch:null,lastRenderedReducer:e,lastRenderedState:t},r.queue=e,e=e.dispatch=wd.bind(null,K,e),[r.memoizedState,e]},useRef:function(e){var t=Qe();return e={current:e},t.memoizedState=e},useState:Ou,useDebugValue:Mi,useDeferredValue:function(e){return Qe().memoizedState=e},useTransition:function(){var e=Ou(!1),t=e[0];return e=yd.bind(null,e[1]),Qe().memoizedState=e,[t,e]},useMutableSource:function(){},useSyncExternalStore:function(e,t,n){var r=K,l=Qe();if(H){if(n===void 0)throw Error(w(407));n=n()}else{if(n=t(),re===null)throw Error(w(349));Qt&30||Na(r,t,n)}l.memoizedState=n;var o={value:n,getSnapshot:t};return l.queue=o,Mu(ja.bind(null,r,o,e),[e]),r.flags|=2048,ar(9,_a.bind(null,r,o,n,t),void 0,null),n},useId:function(){var e=Qe(),t=re.identifierPrefix;if(H){var n=tt,r=et;n=(r&~(1<<32-$e(r)-1)).toString(32)+n,t=":"+t+"R"+n,n=ur++,0<n&&(t+="H"+n.toString(32)),t+=":"}else n=gd++,t=":"+t+"r"+n.toString(32)+":";return e.memoizedState=t},unstable_isNewReconciler:!1},kd={readContext:Ie,useCallback:Ma,useContext:Ie,useEffect:Oi,useImperativeHandle:Oa,useInsertionEffect:za,useLayoutEffect:Ra,useMemo:Da,useReducer:eo,useRef:La,useState:function(){return eo(sr)},useDebugValue:Mi,useDeferredValue:function(e){var t=Oe();return Fa(t,ee.memoizedState,e)},useTransition:function(){var e=eo(sr)[0],t=Oe().memoizedState;return[e,t]},useMutableSource:Ea,useSyncExternalStore:Ca,useId:Ua,unstable_isNewReconciler:!1},Ed={readContext:Ie,useCallback:Ma,useContext:Ie,useEffect:Oi,useImperativeHandle:Oa,useInsertionEffect:za,useLayoutEffect:Ra,useMemo:Da,useReducer:to,useRef:La,useState:function(){return to(sr)},useDebugValue:Mi,useDeferredValue:function(e){var t=Oe();return ee===null?t.memoizedState=e:Fa(t,ee.memoizedState,e)},useTransition:function(){var e=to(sr)[0],t=Oe().memoizedState;return[e,t]},useMutableSource:Ea,useSyncExternalStore:Ca,useId:Ua,unstable_isNewReconciler:!1};function De(e,t){if(e&&e.defaultProps){t=Y({},t),e=e.defaultProps;for(var n in e)t[n]===void 0&&(t[n]=e[n]);return t}return t}function Fo(e,t,n,r){t=e.memoizedState,n=n(r,t),n=n==null?t:Y({},t,n),e.memoizedState=n,e.lanes===0&&(e.updateQueue.baseState=n)}var Cl={isMounted:function(e){return(e=e._reactInternals)?Xt(e)===e:!1},enqueueSetState:function(e,t,n){e=e._reactInternals;var r=he(),l=jt(e),o=nt(r,l);o.payload=t,n!=null&&(o.callback=n),t=Nt(e,o,l),t!==null&&(Ae(t,e,l,r),$r(t,e,l))},enqueueReplaceState:function(e,t,n){e=e._reactInternals;var r=he(),l=jt(e),o=nt(r,l);o.tag=1,o.payload=t,n!=null&&(o.callback=n),t=Nt(e,o,l),t!==null&&(Ae(t,e,l,r),$r(t,e,l))},enqueueForceUpdate:function(e,t){e=e._reactInternals;var n=he(),r=jt(e),l=nt(n,r);l.tag=2,t!=null&&(l.callback=t),t=Nt(e,l,r),t!==null&&(Ae(t,e,r,n),$r(t,e,r))}};function Du(e,t,n,r,l,o,i){return e=e.stateNode,typeof e.shouldComponentUpdate=="function"?e.shouldComponentUpdate(r,o,i):t.prototype&&t.prototype.isPureReactComponent?!tr(n,r)||!tr(l,o):!0}function Va(e,t,n){var r=!1,l=Lt,o=t.contextType;return typeof o=="object"&&o!==null?o=Ie(o):(l=Se(t)?Ht:ce.current,r=t.contextTypes,o=(r=r!=null)?yn(e,l):Lt),t=new t(n,o),e.memoizedState=t.state!==null&&t.state!==void 0?t.state:null,t.updater=Cl,e.stateNode=t,t._reactInternals=e,r&&(e=e.stateNode,e.__reactInternalMemoizedUnmaskedChildContext=l,e.__reactInternalMemoizedMaskedChildContext=o),t}function Fu(e,t,n,r){e=t.state,typeof t.componentWillReceiveProps=="function"&&t.componentWillReceiveProps(n,r),typeof t.UNSAFE_componentWillReceiveProps=="function"&&t.UNSAFE_componentWillReceiveProps(n,r),t.state!==e&&Cl.enqueueReplaceState(t,t.state,null)}function Uo(e,t,n,r){var l=e.stateNode;l.props=n,l.state=e.memoizedState,l.refs={},ji(e);var o=t.contextType;typeof o=="object"&&o!==null?l.context=Ie(o):(o=Se(t)?Ht:ce.current,l.context=yn(e,o)),l.state=e.memoizedState,o=t.getDerivedStateFromProps,typeof o=="function"&&(Fo(e,t,o,n),l.state=e.memoizedState),typeof t.getDerivedStateFromProps=="function"||typeof l.getSnapshotBeforeUpdate=="function"||typeof l.UNSAFE_componentWillMount!="function"&&typeof l.componentWillMount!="function"||(t=l.state,typeof l.componentWillMount=="function"&&l.componentWillMount(),typeof l.UNSAFE_componentWillMount=="function"&&l.UNSAFE_componentWillMount(),t!==l.state&&Cl.enqueueReplaceState(l,l.state,null),ul(e,n,l,r),l.state=e.memoizedState),typeof l.componentDidMount=="function"&&(e.flags|=4194308)}function kn(e,t){try{var n="",r=t;do n+=Zc(r),r=r.return;while(r);var l=n}catch(o){l=`
-Error generating stack: `+o.message+`
-`+o.stack}return{value:e,source:t,stack:l,digest:null}}function no(e,t,n){return{value:e,source:null,stack:n??null,digest:t??null}}function $o(e,t){try{console.error(t.value)}catch(n){setTimeout(function(){throw n})}}var Cd=typeof WeakMap=="function"?WeakMap:Map;function Ha(e,t,n){n=nt(-1,n),n.tag=3,n.payload={element:null};var r=t.value;return n.callback=function(){dl||(dl=!0,Xo=r),$o(e,t)},n}function Ba(e,t,n){n=nt(-1,n),n.tag=3;var r=e.type.getDerivedStateFromError;if(typeof r=="function"){var l=t.value;n.payload=function(){return r(l)},n.callback=function(){$o(e,t)}}var o=e.stateNode;return o!==null&&typeof o.componentDidCatch=="function"&&(n.callback=function(){$o(e,t),typeof r!="function"&&(_t===null?_t=new Set([this]):_t.add(this));var i=t.stack;this.componentDidCatch(t.value,{componentStack:i!==null?i:""})}),n}function Uu(e,t,n){var r=e.pingCache;if(r===null){r=e.pingCache=new Cd;var l=new Set;r.set(t,l)}else l=r.get(t),l===void 0&&(l=new Set,r.set(t,l));l.has(n)||(l.add(n),e=Ud.bind(null,e,t,n),t.then(e,e))}function $u(e){do{var t;if((t=e.tag===13)&&(t=e.memoizedState,t=t!==null?t.dehydrated!==null:!0),t)return e;e=e.return}while(e!==null);return null}function Au(e,t,n,r,l){return e.mode&1?(e.flags|=65536,e.lanes=l,e):(e===t?e.flags|=65536:(e.flags|=128,n.flags|=131072,n.flags&=-52805,n.tag===1&&(n.alternate===null?n.tag=17:(t=nt(-1,1),t.tag=2,Nt(n,t,1))),n.lanes|=1),e)}var Nd=ut.ReactCurrentOwner,we=!1;function pe(e,t,n,r){t.child=e===null?wa(t,null,n,r):xn(t,e.child,n,r)}function Wu(e,t,n,r,l){n=n.render;var o=t.ref;return mn(t,l),r=Ri(e,t,n,r,o,l),n=Ii(),e!==null&&!we?(t.updateQueue=e.updateQueue,t.flags&=-2053,e.lanes&=~l,it(e,t,l)):(H&&n&&xi(t),t.flags|=1,pe(e,t,r,l),t.child)}function Vu(e,t,n,r,l){if(e===null){var o=n.type;return typeof o=="function"&&!Hi(o)&&o.defaultProps===void 0&&n.compare===null&&n.defaultProps===void 0?(t.tag=15,t.type=o,Qa(e,t,o,r,l)):(e=Qr(n.type,null,r,t,t.mode,l),e.ref=t.ref,e.return=t,t.child=e)}if(o=e.child,!(e.lanes&l)){var i=o.memoizedProps;if(n=n.compare,n=n!==null?n:tr,n(i,r)&&e.ref===t.ref)return it(e,t,l)}return t.flags|=1,e=Pt(o,r),e.ref=t.ref,e.return=t,t.child=e}function Qa(e,t,n,r,l){if(e!==null){var o=e.memoizedProps;if(tr(o,r)&&e.ref===t.ref)if(we=!1,t.pendingProps=r=o,(e.lanes&l)!==0)e.flags&131072&&(we=!0);else return t.lanes=e.lanes,it(e,t,l)}return Ao(e,t,n,r,l)}function Ka(e,t,n){var r=t.pendingProps,l=r.children,o=e!==null?e.memoizedState:null;if(r.mode==="hidden")if(!(t.mode&1))t.memoizedState={baseLanes:0,cachePool:null,transitions:null},U(cn,Ee),Ee|=n;else{if(!(n&1073741824))return e=o!==null?o.baseLanes|n:n,t.lanes=t.childLanes=1073741824,t.memoizedState={baseLanes:e,cachePool:null,transitions:null},t.updateQueue=null,U(cn,Ee),Ee|=e,null;t.memoizedState={baseLanes:0,cachePool:null,transitions:null},r=o!==null?o.baseLanes:n,U(cn,Ee),Ee|=r}else o!==null?(r=o.baseLanes|n,t.memoizedState=null):r=n,U(cn,Ee),Ee|=r;return pe(e,t,l,n),t.child}function Ya(e,t){var n=t.ref;(e===null&&n!==null||e!==null&&e.ref!==n)&&(t.flags|=512,t.flags|=2097152)}function Ao(e,t,n,r,l){var o=Se(n)?Ht:ce.current;return o=yn(t,o),mn(t,l),n=Ri(e,t,n,r,o,l),r=Ii(),e!==null&&!we?(t.updateQueue=e.updateQueue,t.flags&=-2053,e.lanes&=~l,it(e,t,l)):(H&&r&&xi(t),t.flags|=1,pe(e,t,n,l),t.child)}function Hu(e,t,n,r,l){if(Se(n)){var o=!0;nl(t)}else o=!1;if(mn(t,l),t.stateNode===null)Vr(e,t),Va(t,n,r),Uo(t,n,r,l),r=!0;else if(e===null){var i=t.stateNode,u=t.memoizedProps;i.props=u;var s=i.context,c=n.contextType;typeof c=="object"&&c!==null?c=Ie(c):(c=Se(n)?Ht:ce.current,c=yn(t,c));var h=n.getDerivedStateFromProps,v=typeof h=="function"||typeof i.getSnapshotBeforeUpdate=="function";v||typeof i.UNSAFE_componentWillReceiveProps!="function"&&typeof i.componentWillReceiveProps!="function"||(u!==r||s!==c)&&Fu(t,i,r,c),ht=!1;var m=t.memoizedState;i.state=m,ul(t,r,i,l),s=t.memoizedState,u!==r||m!==s||xe.current||ht?(typeof h=="function"&&(Fo(t,n,h,r),s=t.memoizedState),(u=ht||Du(t,n,u,r,m,s,c))?(v||typeof i.UNSAFE_componentWillMount!="function"&&typeof i.componentWillMount!="function"||(typeof i.componentWillMount=="function"&&i.componentWillMount(),typeof i.UNSAFE_componentWillMount=="function"&&i.UNSAFE_componentWillMount()),typeof i.componentDidMount=="function"&&(t.flags|=4194308)):(typeof i.componentDidMount=="function"&&(t.flags|=4194308),t.memoizedProps=r,t.memoizedState=s),i.props=r,i.state=s,i.context=c,r=u):(typeof i.componentDidMount=="function"&&(t.flags|=4194308),r=!1)}else{i=t.stateNode,Sa(e,t),u=t.memoizedProps,c=t.type===t.elementType?u:De(t.type,u),i.props=c,v=t.pendingProps,m=i.context,s=n.contextType,typeof s=="object"&&s!==null?s=Ie(s):(s=Se(n)?Ht:ce.current,s=yn(t,s));var x=n.getDerivedStateFromProps;(h=typeof x=="function"||typeof i.getSnapshotBeforeUpdate=="function")||typeof i.UNSAFE_componentWillReceiveProps!="function"&&typeof i.componentWillReceiveProps!="function"||(u!==v||m!==s)&&Fu(t,i,r,s),ht=!1,m=t.memoizedState,i.state=m,ul(t,r,i,l);var S=t.memoizedState;u!==v||m!==S||xe.current||ht?(typeof x=="function"&&(Fo(t,n,x,r),S=t.memoizedState),(c=ht||Du(t,n,c,r,m,S,s)||!1)?(h||typeof i.UNSAFE_componentWillUpdate!="function"&&typeof i.componentWillUpdate!="function"||(typeof i.componentWillUpdate=="function"&&i.componentWillUpdate(r,S,s),typeof i.UNSAFE_componentWillUpdate=="function"&&i.UNSAFE_componentWillUpdate(r,S,s)),typeof i.componentDidUpdate=="function"&&(t.flags|=4),typeof i.getSnapshotBeforeUpdate=="function"&&(t.flags|=1024)):(typeof i.componentDidUpdate!="function"||u===e.memoizedProps&&m===e.memoizedState||(t.flags|=4),typeof i.getSnapshotBeforeUpdate!="function"||u===e.memoizedProps&&m===e.memoizedState||(t.flags|=1024),t.memoizedProps=r,t.memoizedState=S),i.props=r,i.state=S,i.context=s,r=c):(typeof i.componentDidUpdate!="function"||u===e.memoizedProps&&m===e.memoizedState||(t.flags|=4),typeof i.getSnapshotBeforeUpdate!="function"||u===e.memoizedProps&&m===e.memoizedState||(t.flags|=1024),r=!1)}return Wo(e,t,n,r,o,l)}function Wo(e,t,n,r,l,o){Ya(e,t);var i=(t.flags&128)!==0;if(!r&&!i)return l&&Pu(t,n,!1),it(e,t,o);r=t.stateNode,Nd.current=t;var u=i&&typeof n.getDerivedStateFromError!="function"?null:r.render();return t.flags|=1,e!==null&&i?(t.child=xn(t,e.child,null,o),t.child=xn(t,null,u,o)):pe(e,t,u,o),t.memoizedState=r.state,l&&Pu(t,n,!0),t.child}function Ga(e){var t=e.stateNode;t.pendingContext?ju(e,t.pendingContext,t.pendingContext!==t.context):t.context&&ju(e,t.context,!1),Pi(e,t.containerInfo)}function Bu(e,t,n,r,l){return wn(),ki(l),t.flags|=256,pe(e,t,n,r),t.child}var Vo={dehydrated:null,treeContext:null,retryLane:0};function Ho(e){return{baseLanes:e,cachePool:null,transitions:null}}function Xa(e,t,n){var r=t.pendingProps,l=Q.current,o=!1,i=(t.flags&128)!==0,u;if((u=i)||(u=e!==null&&e.memoizedState===null?!1:(l&2)!==0),u?(o=!0,t.flags&=-129):(e===null||e.memoizedState!==null)&&(l|=1),U(Q,l&1),e===null)return Mo(t),e=t.memoizedState,e!==null&&(e=e.dehydrated,e!==null)?(t.mode&1?e.data==="$!"?t.lanes=8:t.lanes=1073741824:t.lanes=1,null):(i=r.children,e=r.fallback,o?(r=t.mode,o=t.child,i={mode:"hidden",children:i},!(r&1)&&o!==null?(o.childLanes=0,o.pendingProps=i):o=jl(i,r,0,null),e=Vt(e,r,n,null),o.return=t,e.return=t,o.sibling=e,t.child=o,t.child.memoizedState=Ho(n),t.memoizedState=Vo,e):Di(t,i));if(l=e.memoizedState,l!==null&&(u=l.dehydrated,u!==null))return _d(e,t,i,r,u,l,n);if(o){o=r.fallback,i=t.mode,l=e.child,u=l.sibling;var s={mode:"hidden",children:r.children};return!(i&1)&&t.child!==l?(r=t.child,r.childLanes=0,r.pendingProps=s,t.deletions=null):(r=Pt(l,s),r.subtreeFlags=l.subtreeFlags&14680064),u!==null?o=Pt(u,o):(o=Vt(o,i,n,null),o.flags|=2),o.return=t,r.return=t,r.sibling=o,t.child=r,r=o,o=t.child,i=e.child.memoizedState,i=i===null?Ho(n):{baseLanes:i.baseLanes|n,cachePool:null,transitions:i.transitions},o.memoizedState=i,o.childLanes=e.childLanes&~n,t.memoizedState=Vo,r}return o=e.child,e=o.sibling,r=Pt(o,{mode:"visible",children:r.children}),!(t.mode&1)&&(r.lanes=n),r.return=t,r.sibling=null,e!==null&&(n=t.deletions,n===null?(t.deletions=[e],t.flags|=16):n.push(e)),t.child=r,t.memoizedState=null,r}function Di(e,t){return t=jl({mode:"visible",children:t},e.mode,0,null),t.return=e,e.child=t}function Lr(e,t,n,r){return r!==null&&ki(r),xn(t,e.child,null,n),e=Di(t,t.pendingProps.children),e.flags|=2,t.memoizedState=null,e}function _d(e,t,n,r,l,o,i){if(n)return t.flags&256?(t.flags&=-257,r=no(Error(w(422))),Lr(e,t,i,r)):t.memoizedState!==null?(t.child=e.child,t.flags|=128,null):(o=r.fallback,l=t.mode,r=jl({mode:"visible",children:r.children},l,0,null),o=Vt(o,l,i,null),o.flags|=2,r.return=t,o.return=t,r.sibling=o,t.child=r,t.mode&1&&xn(t,e.child,null,i),t.child.memoizedState=Ho(i),t.memoizedState=Vo,o);if(!(t.mode&1))return Lr(e,t,i,null);if(l.data==="$!"){if(r=l.nextSibling&&l.nextSibling.dataset,r)var u=r.dgst;return r=u,o=Error(w(419)),r=no(o,r,void 0),Lr(e,t,i,r)}if(u=(i&e.childLanes)!==0,we||u){if(r=re,r!==null){switch(i&-i){case 4:l=2;break;case 16:l=8;break;case 64:case 128:case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:case 4194304:case 8388608:case 16777216:case 33554432:case 67108864:l=32;break;case 536870912:l=268435456;break;default:l=0}l=l&(r.suspendedLanes|i)?0:l,l!==0&&l!==o.retryLane&&(o.retryLane=l,ot(e,l),Ae(r,e,l,-1))}return Vi(),r=no(Error(w(421))),Lr(e,t,i,r)}return l.data==="$?"?(t.flags|=128,t.child=e.child,t=$d.bind(null,e),l._reactRetry=t,null):(e=o.treeContext,Ce=Ct(l.nextSibling),Ne=t,H=!0,Ue=null,e!==null&&(Te[Le++]=et,Te[Le++]=tt,Te[Le++]=Bt,et=e.id,tt=e.overflow,Bt=t),t=Di(t,r.children),t.flags|=4096,t)}function Qu(e,t,n){e.lanes|=t;var r=e.alternate;r!==null&&(r.lanes|=t),Do(e.return,t,n)}function ro(e,t,n,r,l){var o=e.memoizedState;o===null?e.memoizedState={isBackwards:t,rendering:null,renderingStartTime:0,last:r,tail:n,tailMode:l}:(o.isBackwards=t,o.rendering=null,o.renderingStartTime=0,o.last=r,o.tail=n,o.tailMode=l)}function Za(e,t,n){var r=t.pendingProps,l=r.revealOrder,o=r.tail;if(pe(e,t,r.children,n),r=Q.current,r&2)r=r&1|2,t.flags|=128;else{if(e!==null&&e.flags&128)e:for(e=t.child;e!==null;){if(e.tag===13)e.memoizedState!==null&&Qu(e,n,t);else if(e.tag===19)Qu(e,n,t);else if(e.child!==null){e.child.return=e,e=e.child;continue}if(e===t)break e;for(;e.sibling===null;){if(e.return===null||e.return===t)break e;e=e.return}e.sibling.return=e.return,e=e.sibling}r&=1}if(U(Q,r),!(t.mode&1))t.memoizedState=null;else switch(l){case"forwards":for(n=t.child,l=null;n!==null;)e=n.alternate,e!==null&&sl(e)===null&&(l=n),n=n.sibling;n=l,n===null?(l=t.child,t.child=null):(l=n.sibling,n.sibling=null),ro(t,!1,l,n,o);break;case"backwards":for(n=null,l=t.child,t.child=null;l!==null;){if(e=l.alternate,e!==null&&sl(e)===null){t.child=l;break}e=l.sibling,l.sibling=n,n=l,l=e}ro(t,!0,n,null,o);break;case"together":ro(t,!1,null,null,void 0);break;default:t.memoizedState=null}return t.child}function Vr(e,t){!(t.mode&1)&&e!==null&&(e.alternate=null,t.alternate=null,t.flags|=2)}function it(e,t,n){if(e!==null&&(t.dependencies=e.dependencies),Kt|=t.lanes,!(n&t.childLanes))return null;if(e!==null&&t.child!==e.child)throw Error(w(153));if(t.child!==null){for(e=t.child,n=Pt(e,e.pendingProps),t.child=n,n.return=t;e.sibling!==null;)e=e.sibling,n=n.sibling=Pt(e,e.pendingProps),n.return=t;n.sibling=null}return t.child}function jd(e,t,n){switch(t.tag){case 3:Ga(t),wn();break;case 5:ka(t);break;case 1:Se(t.type)&&nl(t);break;case 4:Pi(t,t.stateNode.containerInfo);break;case 10:var r=t.type._context,l=t.memoizedProps.value;U(ol,r._currentValue),r._currentValue=l;break;case 13:if(r=t.memoizedState,r!==null)return r.dehydrated!==null?(U(Q,Q.current&1),t.flags|=128,null):n&t.child.childLanes?Xa(e,t,n):(U(Q,Q.current&1),e=it(e,t,n),e!==null?e.sibling:null);U(Q,Q.current&1);break;case 19:if(r=(n&t.childLanes)!==0,e.flags&128){if(r)return Za(e,t,n);t.flags|=128}if(l=t.memoizedState,l!==null&&(l.rendering=null,l.tail=null,l.lastEffect=null),U(Q,Q.current),r)break;return null;case 22:case 23:return t.lanes=0,Ka(e,t,n)}return it(e,t,n)}var Ja,Bo,qa,ba;Ja=function(e,t){for(var n=t.child;n!==null;){if(n.tag===5||n.tag===6)e.appendChild(n.stateNode);else if(n.tag!==4&&n.child!==null){n.child.return=n,n=n.child;continue}if(n===t)break;for(;n.sibling===null;){if(n.return===null||n.return===t)return;n=n.return}n.sibling.return=n.return,n=n.sibling}};Bo=function(){};qa=function(e,t,n,r){var l=e.memoizedProps;if(l!==r){e=t.stateNode,At(Ge.current);var o=null;switch(n){case"input":l=fo(e,l),r=fo(e,r),o=[];break;case"select":l=Y({},l,{value:void 0}),r=Y({},r,{value:void 0}),o=[];break;case"textarea":l=mo(e,l),r=mo(e,r),o=[];break;default:typeof l.onClick!="function"&&typeof r.onClick=="function"&&(e.onclick=el)}go(n,r);var i;n=null;for(c in l)if(!r.hasOwnProperty(c)&&l.hasOwnProperty(c)&&l[c]!=null)if(c==="style"){var u=l[c];for(i in u)u.hasOwnProperty(i)&&(n||(n={}),n[i]="")}else c!=="dangerouslySetInnerHTML"&&c!=="children"&&c!=="suppressContentEditableWarning"&&c!=="suppressHydrationWarning"&&c!=="autoFocus"&&(Gn.hasOwnProperty(c)?o||(o=[]):(o=o||[]).push(c,null));for(c in r){var s=r[c];if(u=l!=null?l[c]:void 0,r.hasOwnProperty(c)&&s!==u&&(s!=null||u!=null))if(c==="style")if(u){for(i in u)!u.hasOwnProperty(i)||s&&s.hasOwnProperty(i)||(n||(n={}),n[i]="");for(i in s)s.hasOwnProperty(i)&&u[i]!==s[i]&&(n||(n={}),n[i]=s[i])}else n||(o||(o=[]),o.push(c,n)),n=s;else c==="dangerouslySetInnerHTML"?(s=s?s.__html:void 0,u=u?u.__html:void 0,s!=null&&u!==s&&(o=o||[]).push(c,s)):c==="children"?typeof s!="string"&&typeof s!="number"||(o=o||[]).push(c,""+s):c!=="suppressContentEditableWarning"&&c!=="suppressHydrationWarning"&&(Gn.hasOwnProperty(c)?(s!=null&&c==="onScroll"&&$("scroll",e),o||u===s||(o=[])):(o=o||[]).push(c,s))}n&&(o=o||[]).push("style",n);var c=o;(t.updateQueue=c)&&(t.flags|=4)}};ba=function(e,t,n,r){n!==r&&(t.flags|=4)};function In(e,t){if(!H)switch(e.tailMode){case"hidden":t=e.tail;for(var n=null;t!==null;)t.alternate!==null&&(n=t),t=t.sibling;n===null?e.tail=null:n.sibling=null;break;case"collapsed":n=e.tail;for(var r=null;n!==null;)n.alternate!==null&&(r=n),n=n.sibling;r===null?t||e.tail===null?e.tail=null:e.tail.sibling=null:r.sibling=null}}function se(e){var t=e.alternate!==null&&e.alternate.child===e.child,n=0,r=0;if(t)for(var l=e.child;l!==null;)n|=l.lanes|l.childLanes,r|=l.subtreeFlags&14680064,r|=l.flags&14680064,l.return=e,l=l.sibling;else for(l=e.child;l!==null;)n|=l.lanes|l.childLanes,r|=l.subtreeFlags,r|=l.flags,l.return=e,l=l.sibling;return e.subtreeFlags|=r,e.childLanes=n,t}function Pd(e,t,n){var r=t.pendingProps;switch(Si(t),t.tag){case 2:case 16:case 15:case 0:case 11:case 7:case 8:case 12:case 9:case 14:return se(t),null;case 1:return Se(t.type)&&tl(),se(t),null;case 3:return r=t.stateNode,Sn(),A(xe),A(ce),Li(),r.pendingContext&&(r.context=r.pendingContext,r.pendingContext=null),(e===null||e.child===null)&&(Pr(t)?t.flags|=4:e===null||e.memoizedState.isDehydrated&&!(t.flags&256)||(t.flags|=1024,Ue!==null&&(qo(Ue),Ue=null))),Bo(e,t),se(t),null;case 5:Ti(t);var l=At(ir.current);if(n=t.type,e!==null&&t.stateNode!=null)qa(e,t,n,r,l),e.ref!==t.ref&&(t.flags|=512,t.flags|=2097152);else{if(!r){if(t.stateNode===null)throw Error(w(166));return se(t),null}if(e=At(Ge.current),Pr(t)){r=t.stateNode,n=t.type;var o=t.memoizedProps;switch(r[Ke]=t,r[lr]=o,e=(t.mode&1)!==0,n){case"dialog":$("cancel",r),$("close",r);break;case"iframe":case"object":case"embed":$("load",r);break;case"video":case"audio":for(l=0;l<Un.length;l++)$(Un[l],r);break;case"source":$("error",r);break;case"img":case"image":case"link":$("error",r),$("load",r);break;case"details":$("toggle",r);break;case"input":eu(r,o),$("invalid",r);break;case"select":r._wrapperState={wasMultiple:!!o.multiple},$("invalid",r);break;case"textarea":nu(r,o),$("invalid",r)}go(n,o),l=null;for(var i in o)if(o.hasOwnProperty(i)){var u=o[i];i==="children"?typeof u=="string"?r.textContent!==u&&(o.suppressHydrationWarning!==!0&&jr(r.textContent,u,e),l=["children",u]):typeof u=="number"&&r.textContent!==""+u&&(o.suppressHydrationWarning!==!0&&jr(r.textContent,u,e),l=["children",""+u]):Gn.hasOwnProperty(i)&&u!=null&&i==="onScroll"&&$("scroll",r)}switch(n){case"input":wr(r),tu(r,o,!0);break;case"textarea":wr(r),ru(r);break;case"select":case"option":break;default:typeof o.onClick=="function"&&(r.onclick=el)}r=l,t.updateQueue=r,r!==null&&(t.flags|=4)}else{i=l.nodeType===9?l:l.ownerDocument,e==="http://www.w3.org/1999/xhtml"&&(e=js(n)),e==="http://www.w3.org/1999/xhtml"?n==="script"?(e=i.createElement("div"),e.innerHTML="<script><\/script>",e=e.removeChild(e.firstChild)):typeof r.is=="string"?e=i.createElement(n,{is:r.is}):(e=i.createElement(n),n==="select"&&(i=e,r.multiple?i.multiple=!0:r.size&&(i.size=r.size))):e=i.createElementNS(e,n),e[Ke]=t,e[lr]=r,Ja(e,t,!1,!1),t.stateNode=e;e:{switch(i=yo(n,r),n){case"dialog":$("cancel",e),$("close",e),l=r;break;case"iframe":case"object":case"embed":$("load",e),l=r;break;case"video":case"audio":for(l=0;l<Un.length;l++)$(Un[l],e);l=r;break;case"source":$("error",e),l=r;break;case"img":case"image":case"link":$("error",e),$("load",e),l=r;break;case"details":$("toggle",e),l=r;break;case"input":eu(e,r),l=fo(e,r),$("invalid",e);break;case"option":l=r;break;case"select":e._wrapperState={wasMultiple:!!r.multiple},l=Y({},r,{value:void 0}),$("invalid",e);break;case"textarea":nu(e,r),l=mo(e,r),$("invalid",e);break;default:l=r}go(n,l),u=l;for(o in u)if(u.hasOwnProperty(o)){var s=u[o];o==="style"?Ls(e,s):o==="dangerouslySetInnerHTML"?(s=s?s.__html:void 0,s!=null&&Ps(e,s)):o==="children"?typeof s=="string"?(n!=="textarea"||s!=="")&&Xn(e,s):typeof s=="number"&&Xn(e,""+s):o!=="suppressContentEditableWarning"&&o!=="suppressHydrationWarning"&&o!=="autoFocus"&&(Gn.hasOwnProperty(o)?s!=null&&o==="onScroll"&&$("scroll",e):s!=null&&ii(e,o,s,i))}switch(n){case"input":wr(e),tu(e,r,!1);break;case"textarea":wr(e),ru(e);break;case"option":r.value!=null&&e.setAttribute("value",""+Tt(r.value));break;case"select":e.multiple=!!r.multiple,o=r.value,o!=null?fn(e,!!r.multiple,o,!1):r.defaultValue!=null&&fn(e,!!r.multiple,r.defaultValue,!0);break;default:typeof l.onClick=="function"&&(e.onclick=el)}switch(n){case"button":case"input":case"select":case"textarea":r=!!r.autoFocus;break e;case"img":r=!0;break e;default:r=!1}}r&&(t.flags|=4)}t.ref!==null&&(t.flags|=512,t.flags|=2097152)}return se(t),null;case 6:if(e&&t.stateNode!=null)ba(e,t,e.memoizedProps,r);else{if(typeof r!="string"&&t.stateNode===null)throw Error(w(166));if(n=At(ir.current),At(Ge.current),Pr(t)){if(r=t.stateNode,n=t.memoizedProps,r[Ke]=t,(o=r.nodeValue!==n)&&(e=Ne,e!==null))switch(e.tag){case 3:jr(r.nodeValue,n,(e.mode&1)!==0);break;case 5:e.memoizedProps.suppressHydrationWarning!==!0&&jr(r.nodeValue,n,(e.mode&1)!==0)}o&&(t.flags|=4)}else r=(n.nodeType===9?n:n.ownerDocument).createTextNode(r),r[Ke]=t,t.stateNode=r}return se(t),null;case 13:if(A(Q),r=t.memoizedState,e===null||e.memoizedState!==null&&e.memoizedState.dehydrated!==null){if(H&&Ce!==null&&t.mode&1&&!(t.flags&128))ga(),wn(),t.flags|=98560,o=!1;else if(o=Pr(t),r!==null&&r.dehydrated!==null){if(e===null){if(!o)throw Error(w(318));if(o=t.memoizedState,o=o!==null?o.dehydrated:null,!o)throw Error(w(317));o[Ke]=t}else wn(),!(t.flags&128)&&(t.memoizedState=null),t.flags|=4;se(t),o=!1}else Ue!==null&&(qo(Ue),Ue=null),o=!0;if(!o)return t.flags&65536?t:null}return t.flags&128?(t.lanes=n,t):(r=r!==null,r!==(e!==null&&e.memoizedState!==null)&&r&&(t.child.flags|=8192,t.mode&1&&(e===null||Q.current&1?te===0&&(te=3):Vi())),t.updateQueue!==null&&(t.flags|=4),se(t),null);case 4:return Sn(),Bo(e,t),e===null&&nr(t.stateNode.containerInfo),se(t),null;case 10:return Ni(t.type._context),se(t),null;case 17:return Se(t.type)&&tl(),se(t),null;case 19:if(A(Q),o=t.memoizedState,o===null)return se(t),null;if(r=(t.flags&128)!==0,i=o.rendering,i===null)if(r)In(o,!1);else{if(te!==0||e!==null&&e.flags&128)for(e=t.child;e!==null;){if(i=sl(e),i!==null){for(t.flags|=128,In(o,!1),r=i.updateQueue,r!==null&&(t.updateQueue=r,t.flags|=4),t.subtreeFlags=0,r=n,n=t.child;n!==null;)o=n,e=r,o.flags&=14680066,i=o.alternate,i===null?(o.childLanes=0,o.lanes=e,o.child=null,o.subtreeFlags=0,o.memoizedProps=null,o.memoizedState=null,o.updateQueue=null,o.dependencies=null,o.stateNode=null):(o.childLanes=i.childLanes,o.lanes=i.lanes,o.child=i.child,o.subtreeFlags=0,o.deletions=null,o.memoizedProps=i.memoizedProps,o.memoizedState=i.memoizedState,o.updateQueue=i.updateQueue,o.type=i.type,e=i.dependencies,o.dependencies=e===null?null:{lanes:e.lanes,firstContext:e.firstContext}),n=n.sibling;return U(Q,Q.current&1|2),t.child}e=e.sibling}o.tail!==null&&Z()>En&&(t.flags|=128,r=!0,In(o,!1),t.lanes=4194304)}else{if(!r)if(e=sl(i),e!==null){if(t.flags|=128,r=!0,n=e.updateQueue,n!==null&&(t.updateQueue=n,t.flags|=4),In(o,!0),o.tail===null&&o.tailMode==="hidden"&&!i.alternate&&!H)return se(t),null}else 2*Z()-o.renderingStartTime>En&&n!==1073741824&&(t.flags|=128,r=!0,In(o,!1),t.lanes=4194304);o.isBackwards?(i.sibling=t.child,t.child=i):(n=o.last,n!==null?n.sibling=i:t.child=i,o.last=i)}return o.tail!==null?(t=o.tail,o.rendering=t,o.tail=t.sibling,o.renderingStartTime=Z(),t.sibling=null,n=Q.current,U(Q,r?n&1|2:n&1),t):(se(t),null);case 22:case 23:return Wi(),r=t.memoizedState!==null,e!==null&&e.memoizedState!==null!==r&&(t.flags|=8192),r&&t.mode&1?Ee&1073741824&&(se(t),t.subtreeFlags&6&&(t.flags|=8192)):se(t),null;case 24:return null;case 25:return null}throw Error(w(156,t.tag))}function Td(e,t){switch(Si(t),t.tag){case 1:return Se(t.type)&&tl(),e=t.flags,e&65536?(t.flags=e&-65537|128,t):null;case 3:return Sn(),A(xe),A(ce),Li(),e=t.flags,e&65536&&!(e&128)?(t.flags=e&-65537|128,t):null;case 5:return Ti(t),null;case 13:if(A(Q),e=t.memoizedState,e!==null&&e.dehydrated!==null){if(t.alternate===null)throw Error(w(340));wn()}return e=t.flags,e&65536?(t.flags=e&-65537|128,t):null;case 19:return A(Q),null;case 4:return Sn(),null;case 10:return Ni(t.type._context),null;case 22:case 23:return Wi(),null;case 24:return null;default:return null}}var zr=!1,ae=!1,Ld=typeof WeakSet=="function"?WeakSet:Set,N=null;function an(e,t){var n=e.ref;if(n!==null)if(typeof n=="function")try{n(null)}catch(r){G(e,t,r)}else n.current=null}function Qo(e,t,n){try{n()}catch(r){G(e,t,r)}}var Ku=!1;function zd(e,t){if(Po=Jr,e=la(),wi(e)){if("selectionStart"in e)var n={start:e.selectionStart,end:e.selectionEnd};else e:{n=(n=e.ownerDocument)&&n.defaultView||window;var r=n.getSelection&&n.getSelection();if(r&&r.rangeCount!==0){n=r.anchorNode;var l=r.anchorOffset,o=r.focusNode;r=r.focusOffset;try{n.nodeType,o.nodeType}catch{n=null;break e}var i=0,u=-1,s=-1,c=0,h=0,v=e,m=null;t:for(;;){for(var x;v!==n||l!==0&&v.nodeType!==3||(u=i+l),v!==o||r!==0&&v.nodeType!==3||(s=i+r),v.nodeType===3&&(i+=v.nodeValue.length),(x=v.firstChild)!==null;)m=v,v=x;for(;;){if(v===e)break t;if(m===n&&++c===l&&(u=i),m===o&&++h===r&&(s=i),(x=v.nextSibling)!==null)break;v=m,m=v.parentNode}v=x}n=u===-1||s===-1?null:{start:u,end:s}}else n=null}n=n||{start:0,end:0}}else n=null;for(To={focusedElem:e,selectionRange:n},Jr=!1,N=t;N!==null;)if(t=N,e=t.child,(t.subtreeFlags&1028)!==0&&e!==null)e.return=t,N=e;else for(;N!==null;){t=N;try{var S=t.alternate;if(t.flags&1024)switch(t.tag){case 0:case 11:case 15:break;case 1:if(S!==null){var k=S.memoizedProps,F=S.memoizedState,d=t.stateNode,a=d.getSnapshotBeforeUpdate(t.elementType===t.type?k:De(t.type,k),F);d.__reactInternalSnapshotBeforeUpdate=a}break;case 3:var p=t.stateNode.containerInfo;p.nodeType===1?p.textContent="":p.nodeType===9&&p.documentElement&&p.removeChild(p.documentElement);break;case 5:case 6:case 4:case 17:break;default:throw Error(w(163))}}catch(y){G(t,t.return,y)}if(e=t.sibling,e!==null){e.return=t.return,N=e;break}N=t.return}return S=Ku,Ku=!1,S}function Qn(e,t,n){var r=t.updateQueue;if(r=r!==null?r.lastEffect:null,r!==null){var l=r=r.next;do{if((l.tag&e)===e){var o=l.destroy;l.destroy=void 0,o!==void 0&&Qo(t,n,o)}l=l.next}while(l!==r)}}function Nl(e,t){if(t=t.updateQueue,t=t!==null?t.lastEffect:null,t!==null){var n=t=t.next;do{if((n.tag&e)===e){var r=n.create;n.destroy=r()}n=n.next}while(n!==t)}}function Ko(e){var t=e.ref;if(t!==null){var n=e.stateNode;switch(e.tag){case 5:e=n;break;default:e=n}typeof t=="function"?t(e):t.current=e}}function ec(e){var t=e.alternate;t!==null&&(e.alternate=null,ec(t)),e.child=null,e.deletions=null,e.sibling=null,e.tag===5&&(t=e.stateNode,t!==null&&(delete t[Ke],delete t[lr],delete t[Ro],delete t[pd],delete t[hd])),e.stateNode=null,e.return=null,e.dependencies=null,e.memoizedProps=null,e.memoizedState=null,e.pendingProps=null,e.stateNode=null,e.updateQueue=null}function tc(e){return e.tag===5||e.tag===3||e.tag===4}function Yu(e){e:for(;;){for(;e.sibling===null;){if(e.return===null||tc(e.return))return null;e=e.return}for(e.sibling.return=e.return,e=e.sibling;e.tag!==5&&e.tag!==6&&e.tag!==18;){if(e.flags&2||e.child===null||e.tag===4)continue e;e.child.return=e,e=e.child}if(!(e.flags&2))return e.stateNode}}function Yo(e,t,n){var r=e.tag;if(r===5||r===6)e=e.stateNode,t?n.nodeType===8?n.parentNode.insertBefore(e,t):n.insertBefore(e,t):(n.nodeType===8?(t=n.parentNode,t.insertBefore(e,n)):(t=n,t.appendChild(e)),n=n._reactRootContainer,n!=null||t.onclick!==null||(t.onclick=el));else if(r!==4&&(e=e.child,e!==null))for(Yo(e,t,n),e=e.sibling;e!==null;)Yo(e,t,n),e=e.sibling}function Go(e,t,n){var r=e.tag;if(r===5||r===6)e=e.stateNode,t?n.insertBefore(e,t):n.appendChild(e);else if(r!==4&&(e=e.child,e!==null))for(Go(e,t,n),e=e.sibling;e!==null;)Go(e,t,n),e=e.sibling}var le=null,Fe=!1;function ft(e,t,n){for(n=n.child;n!==null;)nc(e,t,n),n=n.sibling}function nc(e,t,n){if(Ye&&typeof Ye.onCommitFiberUnmount=="function")try{Ye.onCommitFiberUnmount(gl,n)}catch{}switch(n.tag){case 5:ae||an(n,t);case 6:var r=le,l=Fe;le=null,ft(e,t,n),le=r,Fe=l,le!==null&&(Fe?(e=le,n=n.stateNode,e.nodeType===8?e.parentNode.removeChild(n):e.removeChild(n)):le.removeChild(n.stateNode));break;case 18:le!==null&&(Fe?(e=le,n=n.stateNode,e.nodeType===8?Zl(e.parentNode,n):e.nodeType===1&&Zl(e,n),bn(e)):Zl(le,n.stateNode));break;case 4:r=le,l=Fe,le=n.stateNode.containerInfo,Fe=!0,ft(e,t,n),le=r,Fe=l;break;case 0:case 11:case 14:case 15:if(!ae&&(r=n.updateQueue,r!==null&&(r=r.lastEffect,r!==null))){l=r=r.next;do{var o=l,i=o.destroy;o=o.tag,i!==void 0&&(o&2||o&4)&&Qo(n,t,i),l=l.next}while(l!==r)}ft(e,t,n);break;case 1:if(!ae&&(an(n,t),r=n.stateNode,typeof r.componentWillUnmount=="function"))try{r.props=n.memoizedProps,r.state=n.memoizedState,r.componentWillUnmount()}catch(u){G(n,t,u)}ft(e,t,n);break;case 21:ft(e,t,n);break;case 22:n.mode&1?(ae=(r=ae)||n.memoizedState!==null,ft(e,t,n),ae=r):ft(e,t,n);break;default:ft(e,t,n)}}function Gu(e){var t=e.updateQueue;if(t!==null){e.updateQueue=null;var n=e.stateNode;n===null&&(n=e.stateNode=new Ld),t.forEach(function(r){var l=Ad.bind(null,e,r);n.has(r)||(n.add(r),r.then(l,l))})}}function Me(e,t){var n=t.deletions;if(n!==null)for(var r=0;r<n.length;r++){var l=n[r];try{var o=e,i=t,u=i;e:for(;u!==null;){switch(u.tag){case 5:le=u.stateNode,Fe=!1;break e;case 3:le=u.stateNode.containerInfo,Fe=!0;break e;case 4:le=u.stateNode.containerInfo,Fe=!0;break e}u=u.return}if(le===null)throw Error(w(160));nc(o,i,l),le=null,Fe=!1;var s=l.alternate;s!==null&&(s.return=null),l.return=null}catch(c){G(l,t,c)}}if(t.subtreeFlags&12854)for(t=t.child;t!==null;)rc(t,e),t=t.sibling}function rc(e,t){var n=e.alternate,r=e.flags;switch(e.tag){case 0:case 11:case 14:case 15:if(Me(t,e),Be(e),r&4){try{Qn(3,e,e.return),Nl(3,e)}catch(k){G(e,e.return,k)}try{Qn(5,e,e.return)}catch(k){G(e,e.return,k)}}break;case 1:Me(t,e),Be(e),r&512&&n!==null&&an(n,n.return);break;case 5:if(Me(t,e),Be(e),r&512&&n!==null&&an(n,n.return),e.flags&32){var l=e.stateNode;try{Xn(l,"")}catch(k){G(e,e.return,k)}}if(r&4&&(l=e.stateNode,l!=null)){var o=e.memoizedProps,i=n!==null?n.memoizedProps:o,u=e.type,s=e.updateQueue;if(e.updateQueue=null,s!==null)try{u==="input"&&o.type==="radio"&&o.name!=null&&Ns(l,o),yo(u,i);var c=yo(u,o);for(i=0;i<s.length;i+=2){var h=s[i],v=s[i+1];h==="style"?Ls(l,v):h==="dangerouslySetInnerHTML"?Ps(l,v):h==="children"?Xn(l,v):ii(l,h,v,c)}switch(u){case"input":po(l,o);break;case"textarea":_s(l,o);break;case"select":var m=l._wrapperState.wasMultiple;l._wrapperState.wasMultiple=!!o.multiple;var x=o.value;x!=null?fn(l,!!o.multiple,x,!1):m!==!!o.multiple&&(o.defaultValue!=null?fn(l,!!o.multiple,o.defaultValue,!0):fn(l,!!o.multiple,o.multiple?[]:"",!1))}l[lr]=o}catch(k){G(e,e.return,k)}}break;case 6:if(Me(t,e),Be(e),r&4){if(e.stateNode===null)throw Error(w(162));l=e.stateNode,o=e.memoizedProps;try{l.nodeValue=o}catch(k){G(e,e.return,k)}}break;case 3:if(Me(t,e),Be(e),r&4&&n!==null&&n.memoizedState.isDehydrated)try{bn(t.containerInfo)}catch(k){G(e,e.return,k)}break;case 4:Me(t,e),Be(e);break;case 13:Me(t,e),Be(e),l=e.child,l.flags&8192&&(o=l.memoizedState!==null,l.stateNode.isHidden=o,!o||l.alternate!==null&&l.alternate.memoizedState!==null||($i=Z())),r&4&&Gu(e);break;case 22:if(h=n!==null&&n.memoizedState!==null,e.mode&1?(ae=(c=ae)||h,Me(t,e),ae=c):Me(t,e),Be(e),r&8192){if(c=e.memoizedState!==null,(e.stateNode.isHidden=c)&&!h&&e.mode&1)for(N=e,h=e.child;h!==null;){for(v=N=h;N!==null;){switch(m=N,x=m.child,m.tag){case 0:case 11:case 14:case 15:Qn(4,m,m.return);break;case 1:an(m,m.return);var S=m.stateNode;if(typeof S.componentWillUnmount=="function"){r=m,n=m.return;try{t=r,S.props=t.memoizedProps,S.state=t.memoizedState,S.componentWillUnmount()}catch(k){G(r,n,k)}}break;case 5:an(m,m.return);break;case 22:if(m.memoizedState!==null){Zu(v);continue}}x!==null?(x.return=m,N=x):Zu(v)}h=h.sibling}e:for(h=null,v=e;;){if(v.tag===5){if(h===null){h=v;try{l=v.stateNode,c?(o=l.style,typeof o.setProperty=="function"?o.setProperty("display","none","important"):o.display="none"):(u=v.stateNode,s=v.memoizedProps.style,i=s!=null&&s.hasOwnProperty("display")?s.display:null,u.style.display=Ts("display",i))}catch(k){G(e,e.return,k)}}}else if(v.tag===6){if(h===null)try{v.stateNode.nodeValue=c?"":v.memoizedProps}catch(k){G(e,e.return,k)}}else if((v.tag!==22&&v.tag!==23||v.memoizedState===null||v===e)&&v.child!==null){v.child.return=v,v=v.child;continue}if(v===e)break e;for(;v.sibling===null;){if(v.return===null||v.return===e)break e;h===v&&(h=null),v=v.return}h===v&&(h=null),v.sibling.return=v.return,v=v.sibling}}break;case 19:Me(t,e),Be(e),r&4&&Gu(e);break;case 21:break;default:Me(t,e),Be(e)}}function Be(e){var t=e.flags;if(t&2){try{e:{for(var n=e.return;n!==null;){if(tc(n)){var r=n;break e}n=n.return}throw Error(w(160))}switch(r.tag){case 5:var l=r.stateNode;r.flags&32&&(Xn(l,""),r.flags&=-33);var o=Yu(e);Go(e,o,l);break;case 3:case 4:var i=r.stateNode.containerInfo,u=Yu(e);Yo(e,u,i);break;default:throw Error(w(161))}}catch(s){G(e,e.return,s)}e.flags&=-3}t&4096&&(e.flags&=-4097)}function Rd(e,t,n){N=e,lc(e)}function lc(e,t,n){for(var r=(e.mode&1)!==0;N!==null;){var l=N,o=l.child;if(l.tag===22&&r){var i=l.memoizedState!==null||zr;if(!i){var u=l.alternate,s=u!==null&&u.memoizedState!==null||ae;u=zr;var c=ae;if(zr=i,(ae=s)&&!c)for(N=l;N!==null;)i=N,s=i.child,i.tag===22&&i.memoizedState!==null?Ju(l):s!==null?(s.return=i,N=s):Ju(l);for(;o!==null;)N=o,lc(o),o=o.sibling;N=l,zr=u,ae=c}Xu(e)}else l.subtreeFlags&8772&&o!==null?(o.return=l,N=o):Xu(e)}}function Xu(e){for(;N!==null;){var t=N;if(t.flags&8772){var n=t.alternate;try{if(t.flags&8772)switch(t.tag){case 0:case 11:case 15:ae||Nl(5,t);break;case 1:var r=t.stateNode;if(t.flags&4&&!ae)if(n===null)r.componentDidMount();else{var l=t.elementType===t.type?n.memoizedProps:De(t.type,n.memoizedProps);r.componentDidUpdate(l,n.memoizedState,r.__reactInternalSnapshotBeforeUpdate)}var o=t.updateQueue;o!==null&&Iu(t,o,r);break;case 3:var i=t.updateQueue;if(i!==null){if(n=null,t.child!==null)switch(t.child.tag){case 5:n=t.child.stateNode;break;case 1:n=t.child.stateNode}Iu(t,i,n)}break;case 5:var u=t.stateNode;if(n===null&&t.flags&4){n=u;var s=t.memoizedProps;switch(t.type){case"button":case"input":case"select":case"textarea":s.autoFocus&&n.focus();break;case"img":s.src&&(n.src=s.src)}}break;case 6:break;case 4:break;case 12:break;case 13:if(t.memoizedState===null){var c=t.alternate;if(c!==null){var h=c.memoizedState;if(h!==null){var v=h.dehydrated;v!==null&&bn(v)}}}break;case 19:case 17:case 21:case 22:case 23:case 25:break;default:throw Error(w(163))}ae||t.flags&512&&Ko(t)}catch(m){G(t,t.return,m)}}if(t===e){N=null;break}if(n=t.sibling,n!==null){n.return=t.return,N=n;break}N=t.return}}function Zu(e){for(;N!==null;){var t=N;if(t===e){N=null;break}var n=t.sibling;if(n!==null){n.return=t.return,N=n;break}N=t.return}}function Ju(e){for(;N!==null;){var t=N;try{switch(t.tag){case 0:case 11:case 15:var n=t.return;try{Nl(4,t)}catch(s){G(t,n,s)}break;case 1:var r=t.stateNode;if(typeof r.componentDidMount=="function"){var l=t.return;try{r.componentDidMount()}catch(s){G(t,l,s)}}var o=t.return;try{Ko(t)}catch(s){G(t,o,s)}break;case 5:var i=t.return;try{Ko(t)}catch(s){G(t,i,s)}}}catch(s){G(t,t.return,s)}if(t===e){N=null;break}var u=t.sibling;if(u!==null){u.return=t.return,N=u;break}N=t.return}}var Id=Math.ceil,fl=ut.ReactCurrentDispatcher,Fi=ut.ReactCurrentOwner,Re=ut.ReactCurrentBatchConfig,M=0,re=null,J=null,oe=0,Ee=0,cn=Rt(0),te=0,cr=null,Kt=0,_l=0,Ui=0,Kn=null,ye=null,$i=0,En=1/0,qe=null,dl=!1,Xo=null,_t=null,Rr=!1,xt=null,pl=0,Yn=0,Zo=null,Hr=-1,Br=0;function he(){return M&6?Z():Hr!==-1?Hr:Hr=Z()}function jt(e){return e.mode&1?M&2&&oe!==0?oe&-oe:vd.transition!==null?(Br===0&&(Br=Vs()),Br):(e=D,e!==0||(e=window.event,e=e===void 0?16:Xs(e.type)),e):1}function Ae(e,t,n,r){if(50<Yn)throw Yn=0,Zo=null,Error(w(185));dr(e,n,r),(!(M&2)||e!==re)&&(e===re&&(!(M&2)&&(_l|=n),te===4&&yt(e,oe)),ke(e,r),n===1&&M===0&&!(t.mode&1)&&(En=Z()+500,kl&&It()))}function ke(e,t){var n=e.callbackNode;vf(e,t);var r=Zr(e,e===re?oe:0);if(r===0)n!==null&&iu(n),e.callbackNode=null,e.callbackPriority=0;else if(t=r&-r,e.callbackPriority!==t){if(n!=null&&iu(n),t===1)e.tag===0?md(qu.bind(null,e)):ha(qu.bind(null,e)),fd(function(){!(M&6)&&It()}),n=null;else{switch(Hs(r)){case 1:n=fi;break;case 4:n=As;break;case 16:n=Xr;break;case 536870912:n=Ws;break;default:n=Xr}n=dc(n,oc.bind(null,e))}e.callbackPriority=t,e.callbackNode=n}}function oc(e,t){if(Hr=-1,Br=0,M&6)throw Error(w(327));var n=e.callbackNode;if(vn()&&e.callbackNode!==n)return null;var r=Zr(e,e===re?oe:0);if(r===0)return null;if(r&30||r&e.expiredLanes||t)t=hl(e,r);else{t=r;var l=M;M|=2;var o=uc();(re!==e||oe!==t)&&(qe=null,En=Z()+500,Wt(e,t));do try{Dd();break}catch(u){ic(e,u)}while(!0);Ci(),fl.current=o,M=l,J!==null?t=0:(re=null,oe=0,t=te)}if(t!==0){if(t===2&&(l=Eo(e),l!==0&&(r=l,t=Jo(e,l))),t===1)throw n=cr,Wt(e,0),yt(e,r),ke(e,Z()),n;if(t===6)yt(e,r);else{if(l=e.current.alternate,!(r&30)&&!Od(l)&&(t=hl(e,r),t===2&&(o=Eo(e),o!==0&&(r=o,t=Jo(e,o))),t===1))throw n=cr,Wt(e,0),yt(e,r),ke(e,Z()),n;switch(e.finishedWork=l,e.finishedLanes=r,t){case 0:case 1:throw Error(w(345));case 2:Ft(e,ye,qe);break;case 3:if(yt(e,r),(r&130023424)===r&&(t=$i+500-Z(),10<t)){if(Zr(e,0)!==0)break;if(l=e.suspendedLanes,(l&r)!==r){he(),e.pingedLanes|=e.suspendedLanes&l;break}e.timeoutHandle=zo(Ft.bind(null,e,ye,qe),t);break}Ft(e,ye,qe);break;case 4:if(yt(e,r),(r&4194240)===r)break;for(t=e.eventTimes,l=-1;0<r;){var i=31-$e(r);o=1<<i,i=t[i],i>l&&(l=i),r&=~o}if(r=l,r=Z()-r,r=(120>r?120:480>r?480:1080>r?1080:1920>r?1920:3e3>r?3e3:4320>r?4320:1960*Id(r/1960))-r,10<r){e.timeoutHandle=zo(Ft.bind(null,e,ye,qe),r);break}Ft(e,ye,qe);break;case 5:Ft(e,ye,qe);break;default:throw Error(w(329))}}}return ke(e,Z()),e.callbackNode===n?oc.bind(null,e):null}function Jo(e,t){var n=Kn;return e.current.memoizedState.isDehydrated&&(Wt(e,t).flags|=256),e=hl(e,t),e!==2&&(t=ye,ye=n,t!==null&&qo(t)),e}function qo(e){ye===null?ye=e:ye.push.apply(ye,e)}function Od(e){for(var t=e;;){if(t.flags&16384){var n=t.updateQueue;if(n!==null&&(n=n.stores,n!==null))for(var r=0;r<n.length;r++){var l=n[r],o=l.getSnapshot;l=l.value;try{if(!We(o(),l))return!1}catch{return!1}}}if(n=t.child,t.subtreeFlags&16384&&n!==null)n.return=t,t=n;else{if(t===e)break;for(;t.sibling===null;){if(t.return===null||t.return===e)return!0;t=t.return}t.sibling.return=t.return,t=t.sibling}}return!0}function yt(e,t){for(t&=~Ui,t&=~_l,e.suspendedLanes|=t,e.pingedLanes&=~t,e=e.expirationTimes;0<t;){var n=31-$e(t),r=1<<n;e[n]=-1,t&=~r}}function qu(e){if(M&6)throw Error(w(327));vn();var t=Zr(e,0);if(!(t&1))return ke(e,Z()),null;var n=hl(e,t);if(e.tag!==0&&n===2){var r=Eo(e);r!==0&&(t=r,n=Jo(e,r))}if(n===1)throw n=cr,Wt(e,0),yt(e,t),ke(e,Z()),n;if(n===6)throw Error(w(345));return e.finishedWork=e.current.alternate,e.finishedLanes=t,Ft(e,ye,qe),ke(e,Z()),null}function Ai(e,t){var n=M;M|=1;try{return e(t)}finally{M=n,M===0&&(En=Z()+500,kl&&It())}}function Yt(e){xt!==null&&xt.tag===0&&!(M&6)&&vn();var t=M;M|=1;var n=Re.transition,r=D;try{if(Re.transition=null,D=1,e)return e()}finally{D=r,Re.transition=n,M=t,!(M&6)&&It()}}function Wi(){Ee=cn.current,A(cn)}function Wt(e,t){e.finishedWork=null,e.finishedLanes=0;var n=e.timeoutHandle;if(n!==-1&&(e.timeoutHandle=-1,cd(n)),J!==null)for(n=J.return;n!==null;){var r=n;switch(Si(r),r.tag){case 1:r=r.type.childContextTypes,r!=null&&tl();break;case 3:Sn(),A(xe),A(ce),Li();break;case 5:Ti(r);break;case 4:Sn();break;case 13:A(Q);break;case 19:A(Q);break;case 10:Ni(r.type._context);break;case 22:case 23:Wi()}n=n.return}if(re=e,J=e=Pt(e.current,null),oe=Ee=t,te=0,cr=null,Ui=_l=Kt=0,ye=Kn=null,$t!==null){for(t=0;t<$t.length;t++)if(n=$t[t],r=n.interleaved,r!==null){n.interleaved=null;var l=r.next,o=n.pending;if(o!==null){var i=o.next;o.next=l,r.next=i}n.pending=r}$t=null}return e}function ic(e,t){do{var n=J;try{if(Ci(),Ar.current=cl,al){for(var r=K.memoizedState;r!==null;){var l=r.queue;l!==null&&(l.pending=null),r=r.next}al=!1}if(Qt=0,ne=ee=K=null,Bn=!1,ur=0,Fi.current=null,n===null||n.return===null){te=1,cr=t,J=null;break}e:{var o=e,i=n.return,u=n,s=t;if(t=oe,u.flags|=32768,s!==null&&typeof s=="object"&&typeof s.then=="function"){var c=s,h=u,v=h.tag;if(!(h.mode&1)&&(v===0||v===11||v===15)){var m=h.alternate;m?(h.updateQueue=m.updateQueue,h.memoizedState=m.memoizedState,h.lanes=m.lanes):(h.updateQueue=null,h.memoizedState=null)}var x=$u(i);if(x!==null){x.flags&=-257,Au(x,i,u,o,t),x.mode&1&&Uu(o,c,t),t=x,s=c;var S=t.updateQueue;if(S===null){var k=new Set;k.add(s),t.updateQueue=k}else S.add(s);break e}else{if(!(t&1)){Uu(o,c,t),Vi();break e}s=Error(w(426))}}else if(H&&u.mode&1){var F=$u(i);if(F!==null){!(F.flags&65536)&&(F.flags|=256),Au(F,i,u,o,t),ki(kn(s,u));break e}}o=s=kn(s,u),te!==4&&(te=2),Kn===null?Kn=[o]:Kn.push(o),o=i;do{switch(o.tag){case 3:o.flags|=65536,t&=-t,o.lanes|=t;var d=Ha(o,s,t);Ru(o,d);break e;case 1:u=s;var a=o.type,p=o.stateNode;if(!(o.flags&128)&&(typeof a.getDerivedStateFromError=="function"||p!==null&&typeof p.componentDidCatch=="function"&&(_t===null||!_t.has(p)))){o.flags|=65536,t&=-t,o.lanes|=t;var y=Ba(o,u,t);Ru(o,y);break e}}o=o.return}while(o!==null)}ac(n)}catch(E){t=E,J===n&&n!==null&&(J=n=n.return);continue}break}while(!0)}function uc(){var e=fl.current;return fl.current=cl,e===null?cl:e}function Vi(){(te===0||te===3||te===2)&&(te=4),re===null||!(Kt&268435455)&&!(_l&268435455)||yt(re,oe)}function hl(e,t){var n=M;M|=2;var r=uc();(re!==e||oe!==t)&&(qe=null,Wt(e,t));do try{Md();break}catch(l){ic(e,l)}while(!0);if(Ci(),M=n,fl.current=r,J!==null)throw Error(w(261));return re=null,oe=0,te}function Md(){for(;J!==null;)sc(J)}function Dd(){for(;J!==null&&!uf();)sc(J)}function sc(e){var t=fc(e.alternate,e,Ee);e.memoizedProps=e.pendingProps,t===null?ac(e):J=t,Fi.current=null}function ac(e){var t=e;do{var n=t.alternate;if(e=t.return,t.flags&32768){if(n=Td(n,t),n!==null){n.flags&=32767,J=n;return}if(e!==null)e.flags|=32768,e.subtreeFlags=0,e.deletions=null;else{te=6,J=null;return}}else if(n=Pd(n,t,Ee),n!==null){J=n;return}if(t=t.sibling,t!==null){J=t;return}J=t=e}while(t!==null);te===0&&(te=5)}function Ft(e,t,n){var r=D,l=Re.transition;try{Re.transition=null,D=1,Fd(e,t,n,r)}finally{Re.transition=l,D=r}return null}function Fd(e,t,n,r){do vn();while(xt!==null);if(M&6)throw Error(w(327));n=e.finishedWork;var l=e.finishedLanes;if(n===null)return null;if(e.finishedWork=null,e.finishedLanes=0,n===e.current)throw Error(w(177));e.callbackNode=null,e.callbackPriority=0;var o=n.lanes|n.childLanes;if(gf(e,o),e===re&&(J=re=null,oe=0),!(n.subtreeFlags&2064)&&!(n.flags&2064)||Rr||(Rr=!0,dc(Xr,function(){return vn(),null})),o=(n.flags&15990)!==0,n.subtreeFlags&15990||o){o=Re.transition,Re.transition=null;var i=D;D=1;var u=M;M|=4,Fi.current=null,zd(e,n),rc(n,e),rd(To),Jr=!!Po,To=Po=null,e.current=n,Rd(n),sf(),M=u,D=i,Re.transition=o}else e.current=n;if(Rr&&(Rr=!1,xt=e,pl=l),o=e.pendingLanes,o===0&&(_t=null),ff(n.stateNode),ke(e,Z()),t!==null)for(r=e.onRecoverableError,n=0;n<t.length;n++)l=t[n],r(l.value,{componentStack:l.stack,digest:l.digest});if(dl)throw dl=!1,e=Xo,Xo=null,e;return pl&1&&e.tag!==0&&vn(),o=e.pendingLanes,o&1?e===Zo?Yn++:(Yn=0,Zo=e):Yn=0,It(),null}function vn(){if(xt!==null){var e=Hs(pl),t=Re.transition,n=D;try{if(Re.transition=null,D=16>e?16:e,xt===null)var r=!1;else{if(e=xt,xt=null,pl=0,M&6)throw Error(w(331));var l=M;for(M|=4,N=e.current;N!==null;){var o=N,i=o.child;if(N.flags&16){var u=o.deletions;if(u!==null){for(var s=0;s<u.length;s++){var c=u[s];for(N=c;N!==null;){var h=N;switch(h.tag){case 0:case 11:case 15:Qn(8,h,o)}var v=h.child;if(v!==null)v.return=h,N=v;else for(;N!==null;){h=N;var m=h.sibling,x=h.return;if(ec(h),h===c){N=null;break}if(m!==null){m.return=x,N=m;break}N=x}}}var S=o.alternate;if(S!==null){var k=S.child;if(k!==null){S.child=null;do{var F=k.sibling;k.sibling=null,k=F}while(k!==null)}}N=o}}if(o.subtreeFlags&2064&&i!==null)i.return=o,N=i;else e:for(;N!==null;){if(o=N,o.flags&2048)switch(o.tag){case 0:case 11:case 15:Qn(9,o,o.return)}var d=o.sibling;if(d!==null){d.return=o.return,N=d;break e}N=o.return}}var a=e.current;for(N=a;N!==null;){i=N;var p=i.child;if(i.subtreeFlags&2064&&p!==null)p.return=i,N=p;else e:for(i=a;N!==null;){if(u=N,u.flags&2048)try{switch(u.tag){case 0:case 11:case 15:Nl(9,u)}}catch(E){G(u,u.return,E)}if(u===i){N=null;break e}var y=u.sibling;if(y!==null){y.return=u.return,N=y;break e}N=u.return}}if(M=l,It(),Ye&&typeof Ye.onPostCommitFiberRoot=="function")try{Ye.onPostCommitFiberRoot(gl,e)}catch{}r=!0}return r}finally{D=n,Re.transition=t}}return!1}function bu(e,t,n){t=kn(n,t),t=Ha(e,t,1),e=Nt(e,t,1),t=he(),e!==null&&(dr(e,1,t),ke(e,t))}function G(e,t,n){if(e.tag===3)bu(e,e,n);else for(;t!==null;){if(t.tag===3){bu(t,e,n);break}else if(t.tag===1){var r=t.stateNode;if(typeof t.type.getDerivedStateFromError=="function"||typeof r.componentDidCatch=="function"&&(_t===null||!_t.has(r))){e=kn(n,e),e=Ba(t,e,1),t=Nt(t,e,1),e=he(),t!==null&&(dr(t,1,e),ke(t,e));break}}t=t.return}}function Ud(e,t,n){var r=e.pingCache;r!==null&&r.delete(t),t=he(),e.pingedLanes|=e.suspendedLanes&n,re===e&&(oe&n)===n&&(te===4||te===3&&(oe&130023424)===oe&&500>Z()-$i?Wt(e,0):Ui|=n),ke(e,t)}function cc(e,t){t===0&&(e.mode&1?(t=kr,kr<<=1,!(kr&130023424)&&(kr=4194304)):t=1);var n=he();e=ot(e,t),e!==null&&(dr(e,t,n),ke(e,n))}function $d(e){var t=e.memoizedState,n=0;t!==null&&(n=t.retryLane),cc(e,n)}function Ad(e,t){var n=0;switch(e.tag){case 13:var r=e.stateNode,l=e.memoizedState;l!==null&&(n=l.retryLane);break;case 19:r=e.stateNode;break;default:throw Error(w(314))}r!==null&&r.delete(t),cc(e,n)}var fc;fc=function(e,t,n){if(e!==null)if(e.memoizedProps!==t.pendingProps||xe.current)we=!0;else{if(!(e.lanes&n)&&!(t.flags&128))return we=!1,jd(e,t,n);we=!!(e.flags&131072)}else we=!1,H&&t.flags&1048576&&ma(t,ll,t.index);switch(t.lanes=0,t.tag){case 2:var r=t.type;Vr(e,t),e=t.pendingProps;var l=yn(t,ce.current);mn(t,n),l=Ri(null,t,r,e,l,n);var o=Ii();return t.flags|=1,typeof l=="object"&&l!==null&&typeof l.render=="function"&&l.$$typeof===void 0?(t.tag=1,t.memoizedState=null,t.updateQueue=null,Se(r)?(o=!0,nl(t)):o=!1,t.memoizedState=l.state!==null&&l.state!==void 0?l.state:null,ji(t),l.updater=Cl,t.stateNode=l,l._reactInternals=t,Uo(t,r,e,n),t=Wo(null,t,r,!0,o,n)):(t.tag=0,H&&o&&xi(t),pe(null,t,l,n),t=t.child),t;case 16:r=t.elementType;e:{switch(Vr(e,t),e=t.pendingProps,l=r._init,r=l(r._payload),t.type=r,l=t.tag=Vd(r),e=De(r,e),l){case 0:t=Ao(null,t,r,e,n);break e;case 1:t=Hu(null,t,r,e,n);break e;case 11:t=Wu(null,t,r,e,n);break e;case 14:t=Vu(null,t,r,De(r.type,e),n);break e}throw Error(w(306,r,""))}return t;case 0:return r=t.type,l=t.pendingProps,l=t.elementType===r?l:De(r,l),Ao(e,t,r,l,n);case 1:return r=t.type,l=t.pendingProps,l=t.elementType===r?l:De(r,l),Hu(e,t,r,l,n);case 3:e:{if(Ga(t),e===null)throw Error(w(387));r=t.pendingProps,o=t.memoizedState,l=o.element,Sa(e,t),ul(t,r,null,n);var i=t.memoizedState;if(r=i.element,o.isDehydrated)if(o={element:r,isDehydrated:!1,cache:i.cache,pendingSuspenseBoundaries:i.pendingSuspenseBoundaries,transitions:i.transitions},t.updateQueue.baseState=o,t.memoizedState=o,t.flags&256){l=kn(Error(w(423)),t),t=Bu(e,t,r,n,l);break e}else if(r!==l){l=kn(Error(w(424)),t),t=Bu(e,t,r,n,l);break e}else for(Ce=Ct(t.stateNode.containerInfo.firstChild),Ne=t,H=!0,Ue=null,n=wa(t,null,r,n),t.child=n;n;)n.flags=n.flags&-3|4096,n=n.sibling;else{if(wn(),r===l){t=it(e,t,n);break e}pe(e,t,r,n)}t=t.child}return t;case 5:return ka(t),e===null&&Mo(t),r=t.type,l=t.pendingProps,o=e!==null?e.memoizedProps:null,i=l.children,Lo(r,l)?i=null:o!==null&&Lo(r,o)&&(t.flags|=32),Ya(e,t),pe(e,t,i,n),t.child;case 6:return e===null&&Mo(t),null;case 13:return Xa(e,t,n);case 4:return Pi(t,t.stateNode.containerInfo),r=t.pendingProps,e===null?t.child=xn(t,null,r,n):pe(e,t,r,n),t.child;case 11:return r=t.type,l=t.pendingProps,l=t.elementType===r?l:De(r,l),Wu(e,t,r,l,n);case 7:return pe(e,t,t.pendingProps,n),t.child;case 8:return pe(e,t,t.pendingProps.children,n),t.child;case 12:return pe(e,t,t.pendingProps.children,n),t.child;case 10:e:{if(r=t.type._context,l=t.pendingProps,o=t.memoizedProps,i=l.value,U(ol,r._currentValue),r._currentValue=i,o!==null)if(We(o.value,i)){if(o.children===l.children&&!xe.current){t=it(e,t,n);break e}}else for(o=t.child,o!==null&&(o.return=t);o!==null;){var u=o.dependencies;if(u!==null){i=o.child;for(var s=u.firstContext;s!==null;){if(s.context===r){if(o.tag===1){s=nt(-1,n&-n),s.tag=2;var c=o.updateQueue;if(c!==null){c=c.shared;var h=c.pending;h===null?s.next=s:(s.next=h.next,h.next=s),c.pending=s}}o.lanes|=n,s=o.alternate,s!==null&&(s.lanes|=n),Do(o.return,n,t),u.lanes|=n;break}s=s.next}}else if(o.tag===10)i=o.type===t.type?null:o.child;else if(o.tag===18){if(i=o.return,i===null)throw Error(w(341));i.lanes|=n,u=i.alternate,u!==null&&(u.lanes|=n),Do(i,n,t),i=o.sibling}else i=o.child;if(i!==null)i.return=o;else for(i=o;i!==null;){if(i===t){i=null;break}if(o=i.sibling,o!==null){o.return=i.return,i=o;break}i=i.return}o=i}pe(e,t,l.children,n),t=t.child}return t;case 9:return l=t.type,r=t.pendingProps.children,mn(t,n),l=Ie(l),r=r(l),t.flags|=1,pe(e,t,r,n),t.child;case 14:return r=t.type,l=De(r,t.pendingProps),l=De(r.type,l),Vu(e,t,r,l,n);case 15:return Qa(e,t,t.type,t.pendingProps,n);case 17:return r=t.type,l=t.pendingProps,l=t.elementType===r?l:De(r,l),Vr(e,t),t.tag=1,Se(r)?(e=!0,nl(t)):e=!1,mn(t,n),Va(t,r,l),Uo(t,r,l,n),Wo(null,t,r,!0,e,n);case 19:return Za(e,t,n);case 22:return Ka(e,t,n)}throw Error(w(156,t.tag))};function dc(e,t){return $s(e,t)}function Wd(e,t,n,r){this.tag=e,this.key=n,this.sibling=this.child=this.return=this.stateNode=this.type=this.elementType=null,this.index=0,this.ref=null,this.pendingProps=t,this.dependencies=this.memoizedState=this.updateQueue=this.memoizedProps=null,this.mode=r,this.subtreeFlags=this.flags=0,this.deletions=null,this.childLanes=this.lanes=0,this.alternate=null}function ze(e,t,n,r){return new Wd(e,t,n,r)}function Hi(e){return e=e.prototype,!(!e||!e.isReactComponent)}function Vd(e){if(typeof e=="function")return Hi(e)?1:0;if(e!=null){if(e=e.$$typeof,e===si)return 11;if(e===ai)return 14}return 2}function Pt(e,t){var n=e.alternate;return n===null?(n=ze(e.tag,t,e.key,e.mode),n.elementType=e.elementType,n.type=e.type,n.stateNode=e.stateNode,n.alternate=e,e.alternate=n):(n.pendingProps=t,n.type=e.type,n.flags=0,n.subtreeFlags=0,n.deletions=null),n.flags=e.flags&14680064,n.childLanes=e.childLanes,n.lanes=e.lanes,n.child=e.child,n.memoizedProps=e.memoizedProps,n.memoizedState=e.memoizedState,n.updateQueue=e.updateQueue,t=e.dependencies,n.dependencies=t===null?null:{lanes:t.lanes,firstContext:t.firstContext},n.sibling=e.sibling,n.index=e.index,n.ref=e.ref,n}function Qr(e,t,n,r,l,o){var i=2;if(r=e,typeof e=="function")Hi(e)&&(i=1);else if(typeof e=="string")i=5;else e:switch(e){case bt:return Vt(n.children,l,o,t);case ui:i=8,l|=8;break;case uo:return e=ze(12,n,t,l|2),e.elementType=uo,e.lanes=o,e;case so:return e=ze(13,n,t,l),e.elementType=so,e.lanes=o,e;case ao:return e=ze(19,n,t,l),e.elementType=ao,e.lanes=o,e;case ks:return jl(n,l,o,t);default:if(typeof e=="object"&&e!==null)switch(e.$$typeof){case xs:i=10;break e;case Ss:i=9;break e;case si:i=11;break e;case ai:i=14;break e;case pt:i=16,r=null;break e}throw Error(w(130,e==null?e:typeof e,""))}return t=ze(i,n,t,l),t.elementType=e,t.type=r,t.lanes=o,t}function Vt(e,t,n,r){return e=ze(7,e,r,t),e.lanes=n,e}function jl(e,t,n,r){return e=ze(22,e,r,t),e.elementType=ks,e.lanes=n,e.stateNode={isHidden:!1},e}function lo(e,t,n){return e=ze(6,e,null,t),e.lanes=n,e}function oo(e,t,n){return t=ze(4,e.children!==null?e.children:[],e.key,t),t.lanes=n,t.stateNode={containerInfo:e.containerInfo,pendingChildren:null,implementation:e.implementation},t}function Hd(e,t,n,r,l){this.tag=t,this.containerInfo=e,this.finishedWork=this.pingCache=this.current=this.pendingChildren=null,this.timeoutHandle=-1,this.callbackNode=this.pendingContext=this.context=null,this.callbackPriority=0,this.eventTimes=$l(0),this.expirationTimes=$l(-1),this.entangledLanes=this.finishedLanes=this.mutableReadLanes=this.expiredLanes=this.pingedLanes=this.suspendedLanes=this.pendingLanes=0,this.entanglements=$l(0),this.identifierPrefix=r,this.onRecoverableError=l,this.mutableSourceEagerHydrationData=null}function Bi(e,t,n,r,l,o,i,u,s){return e=new Hd(e,t,n,u,s),t===1?(t=1,o===!0&&(t|=8)):t=0,o=ze(3,null,null,t),e.current=o,o.stateNode=e,o.memoizedState={element:r,isDehydrated:n,cache:null,transitions:null,pendingSuspenseBoundaries:null},ji(o),e}function Bd(e,t,n){var r=3<arguments.length&&arguments[3]!==void 0?arguments[3]:null;return{$$typeof:qt,key:r==null?null:""+r,children:e,containerInfo:t,implementation:n}}function pc(e){if(!e)return Lt;e=e._reactInternals;e:{if(Xt(e)!==e||e.tag!==1)throw Error(w(170));var t=e;do{switch(t.tag){case 3:t=t.stateNode.context;break e;case 1:if(Se(t.type)){t=t.stateNode.__reactInternalMemoizedMergedChildContext;break e}}t=t.return}while(t!==null);throw Error(w(171))}if(e.tag===1){var n=e.type;if(Se(n))return pa(e,n,t)}return t}function hc(e,t,n,r,l,o,i,u,s){return e=Bi(n,r,!0,e,l,o,i,u,s),e.context=pc(null),n=e.current,r=he(),l=jt(n),o=nt(r,l),o.callback=t??null,Nt(n,o,l),e.current.lanes=l,dr(e,l,r),ke(e,r),e}function Pl(e,t,n,r){var l=t.current,o=he(),i=jt(l);return n=pc(n),t.context===null?t.context=n:t.pendingContext=n,t=nt(o,i),t.payload={element:e},r=r===void 0?null:r,r!==null&&(t.callback=r),e=Nt(l,t,i),e!==null&&(Ae(e,l,i,o),$r(e,l,i)),i}function ml(e){if(e=e.current,!e.child)return null;switch(e.child.tag){case 5:return e.child.stateNode;default:return e.child.stateNode}}function es(e,t){if(e=e.memoizedState,e!==null&&e.dehydrated!==null){var n=e.retryLane;e.retryLane=n!==0&&n<t?n:t}}function Qi(e,t){es(e,t),(e=e.alternate)&&es(e,t)}function Qd(){return null}var mc=typeof reportError=="function"?reportError:function(e){console.error(e)};function Ki(e){this._internalRoot=e}Tl.prototype.render=Ki.prototype.render=function(e){var t=this._internalRoot;if(t===null)throw Error(w(409));Pl(e,t,null,null)};Tl.prototype.unmount=Ki.prototype.unmount=function(){var e=this._internalRoot;if(e!==null){this._internalRoot=null;var t=e.containerInfo;Yt(function(){Pl(null,e,null,null)}),t[lt]=null}};function Tl(e){this._internalRoot=e}Tl.prototype.unstable_scheduleHydration=function(e){if(e){var t=Ks();e={blockedOn:null,target:e,priority:t};for(var n=0;n<gt.length&&t!==0&&t<gt[n].priority;n++);gt.splice(n,0,e),n===0&&Gs(e)}};function Yi(e){return!(!e||e.nodeType!==1&&e.nodeType!==9&&e.nodeType!==11)}function Ll(e){return!(!e||e.nodeType!==1&&e.nodeType!==9&&e.nodeType!==11&&(e.nodeType!==8||e.nodeValue!==" react-mount-point-unstable "))}function ts(){}function Kd(e,t,n,r,l){if(l){if(typeof r=="function"){var o=r;r=function(){var c=ml(i);o.call(c)}}var i=hc(t,r,e,0,null,!1,!1,"",ts);return e._reactRootContainer=i,e[lt]=i.current,nr(e.nodeType===8?e.parentNode:e),Yt(),i}for(;l=e.lastChild;)e.removeChild(l);if(typeof r=="function"){var u=r;r=function(){var c=ml(s);u.call(c)}}var s=Bi(e,0,!1,null,null,!1,!1,"",ts);return e._reactRootContainer=s,e[lt]=s.current,nr(e.nodeType===8?e.parentNode:e),Yt(function(){Pl(t,s,n,r)}),s}function zl(e,t,n,r,l){var o=n._reactRootContainer;if(o){var i=o;if(typeof l=="function"){var u=l;l=function(){var s=ml(i);u.call(s)}}Pl(t,i,e,l)}else i=Kd(n,t,e,l,r);return ml(i)}Bs=function(e){switch(e.tag){case 3:var t=e.stateNode;if(t.current.memoizedState.isDehydrated){var n=Fn(t.pendingLanes);n!==0&&(di(t,n|1),ke(t,Z()),!(M&6)&&(En=Z()+500,It()))}break;case 13:Yt(function(){var r=ot(e,1);if(r!==null){var l=he();Ae(r,e,1,l)}}),Qi(e,1)}};pi=function(e){if(e.tag===13){var t=ot(e,134217728);if(t!==null){var n=he();Ae(t,e,134217728,n)}Qi(e,134217728)}};Qs=function(e){if(e.tag===13){var t=jt(e),n=ot(e,t);if(n!==null){var r=he();Ae(n,e,t,r)}Qi(e,t)}};Ks=function(){return D};Ys=function(e,t){var n=D;try{return D=e,t()}finally{D=n}};xo=function(e,t,n){switch(t){case"input":if(po(e,n),t=n.name,n.type==="radio"&&t!=null){for(n=e;n.parentNode;)n=n.parentNode;for(n=n.querySelectorAll("input[name="+JSON.stringify(""+t)+'][type="radio"]'),t=0;t<n.length;t++){var r=n[t];if(r!==e&&r.form===e.form){var l=Sl(r);if(!l)throw Error(w(90));Cs(r),po(r,l)}}}break;case"textarea":_s(e,n);break;case"select":t=n.value,t!=null&&fn(e,!!n.multiple,t,!1)}};Is=Ai;Os=Yt;var Yd={usingClientEntryPoint:!1,Events:[hr,rn,Sl,zs,Rs,Ai]},On={findFiberByHostInstance:Ut,bundleType:0,version:"18.3.1",rendererPackageName:"react-dom"},Gd={bundleType:On.bundleType,version:On.version,rendererPackageName:On.rendererPackageName,rendererConfig:On.rendererConfig,overrideHookState:null,overrideHookStateDeletePath:null,overrideHookStateRenamePath:null,overrideProps:null,overridePropsDeletePath:null,overridePropsRenamePath:null,setErrorHandler:null,setSuspenseHandler:null,scheduleUpdate:null,currentDispatcherRef:ut.ReactCurrentDispatcher,findHostInstanceByFiber:function(e){return e=Fs(e),e===null?null:e.stateNode},findFiberByHostInstance:On.findFiberByHostInstance||Qd,findHostInstancesForRefresh:null,scheduleRefresh:null,scheduleRoot:null,setRefreshHandler:null,getCurrentFiber:null,reconcilerVersion:"18.3.1-next-f1338f8080-20240426"};if(typeof __REACT_DEVTOOLS_GLOBAL_HOOK__<"u"){var Ir=__REACT_DEVTOOLS_GLOBAL_HOOK__;if(!Ir.isDisabled&&Ir.supportsFiber)try{gl=Ir.inject(Gd),Ye=Ir}catch{}}je.__SECRET_INTERNALS_DO_NOT_USE_OR_YOU_WILL_BE_FIRED=Yd;je.createPortal=function(e,t){var n=2<arguments.length&&arguments[2]!==void 0?arguments[2]:null;if(!Yi(t))throw Error(w(200));return Bd(e,t,null,n)};je.createRoot=function(e,t){if(!Yi(e))throw Error(w(299));var n=!1,r="",l=mc;return t!=null&&(t.unstable_strictMode===!0&&(n=!0),t.identifierPrefix!==void 0&&(r=t.identifierPrefix),t.onRecoverableError!==void 0&&(l=t.onRecoverableError)),t=Bi(e,1,!1,null,null,n,!1,r,l),e[lt]=t.current,nr(e.nodeType===8?e.parentNode:e),new Ki(t)};je.findDOMNode=function(e){if(e==null)return null;if(e.nodeType===1)return e;var t=e._reactInternals;if(t===void 0)throw typeof e.render=="function"?Error(w(188)):(e=Object.keys(e).join(","),Error(w(268,e)));return e=Fs(t),e=e===null?null:e.stateNode,e};je.flushSync=function(e){return Yt(e)};je.hydrate=function(e,t,n){if(!Ll(t))throw Error(w(200));return zl(null,e,t,!0,n)};je.hydrateRoot=function(e,t,n){if(!Yi(e))throw Error(w(405));var r=n!=null&&n.hydratedSources||null,l=!1,o="",i=mc;if(n!=null&&(n.unstable_strictMode===!0&&(l=!0),n.identifierPrefix!==void 0&&(o=n.identifierPrefix),n.onRecoverableError!==void 0&&(i=n.onRecoverableError)),t=hc(t,null,e,1,n??null,l,!1,o,i),e[lt]=t.current,nr(e),r)for(e=0;e<r.length;e++)n=r[e],l=n._getVersion,l=l(n._source),t.mutableSourceEagerHydrationData==null?t.mutableSourceEagerHydrationData=[n,l]:t.mutableSourceEagerHydrationData.push(n,l);return new Tl(t)};je.render=function(e,t,n){if(!Ll(t))throw Error(w(200));return zl(null,e,t,!1,n)};je.unmountComponentAtNode=function(e){if(!Ll(e))throw Error(w(40));return e._reactRootContainer?(Yt(function(){zl(null,null,e,!1,function(){e._reactRootContainer=null,e[lt]=null})}),!0):!1};je.unstable_batchedUpdates=Ai;je.unstable_renderSubtreeIntoContainer=function(e,t,n,r){if(!Ll(n))throw Error(w(200));if(e==null||e._reactInternals===void 0)throw Error(w(38));return zl(e,t,n,!1,r)};je.version="18.3.1-next-f1338f8080-20240426";function vc(){if(!(typeof __REACT_DEVTOOLS_GLOBAL_HOOK__>"u"||typeof __REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE!="function"))try{__REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE(vc)}catch(e){console.error(e)}}vc(),vs.exports=je;var Xd=vs.exports,gc,ns=Xd;gc=ns.createRoot,ns.hydrateRoot;function mt(e,t,n){return f.jsxs("svg",{width:t,height:t,viewBox:"0 0 24 24","aria-label":n,role:"img",children:[f.jsx("title",{children:n}),e]})}const vt=({children:e})=>f.jsx("g",{fill:"none",stroke:"currentColor",strokeWidth:1.6,strokeLinecap:"round",strokeLinejoin:"round",children:e});function ge(e,t,n){return f.jsx("img",{src:e,width:n,height:n,alt:t,title:t,style:{display:"inline-block"}})}function rs(e,t=16){const n=(e||"").toLowerCase();return n.includes("gpt")||n.includes("o4")||n.startsWith("openai")?ge("/assets/Icons/openai.svg","GPT",t):n.includes("claude")?ge("/assets/Icons/claude.svg","Claude",t):n.includes("gemini")?ge("/assets/Icons/gemini.svg","Gemini",t):n.includes("llama")?mt(f.jsxs(vt,{children:[f.jsx("path",{d:"M6 17c3 1 9 1 12 0"}),f.jsx("path",{d:"M8 17V9l2-2 2 2v8"}),f.jsx("path",{d:"M10 7l1-2 1 2"})]}),t,"Llama"):n.includes("mistral")||n.includes("mixtral")?mt(f.jsxs(vt,{children:[f.jsx("path",{d:"M3 9h10c2 0 2-3 0-3"}),f.jsx("path",{d:"M3 15h14c3 0 3-4 0-4"})]}),t,"Mistral"):n.includes("qwen")?mt(f.jsxs(vt,{children:[f.jsx("path",{d:"M6 12a6 6 0 1 1 6 6"}),f.jsx("path",{d:"M12 18l3-3"})]}),t,"Qwen"):n.includes("deepseek")?mt(f.jsxs(vt,{children:[f.jsx("path",{d:"M4 12l8-8 8 8-8 8z"}),f.jsx("path",{d:"M8 12l4-4 4 4-4 4z"})]}),t,"DeepSeek"):n.includes("phi")?mt(f.jsxs(vt,{children:[f.jsx("circle",{cx:"12",cy:"12",r:"7"}),f.jsx("path",{d:"M12 5v14M8 10h8"})]}),t,"Phi"):mt(f.jsx(vt,{children:f.jsx("circle",{cx:"12",cy:"12",r:"8"})}),t,"Model")}function Zd(e,t=16){const n=(e||"").toLowerCase();return n.includes("openrouter")?ge("/assets/Icons/openrouter.svg","OpenRouter",t):n.includes("openai")?ge("/assets/Icons/openai.svg","OpenAI",t):n.includes("anthropic")?ge("/assets/Icons/anthropic.svg","Anthropic",t):n.includes("gemini")||n.includes("google")?ge("/assets/Icons/gemini.svg","Google",t):n.includes("azure")?ge("/assets/Icons/azure.svg","Azure",t):n.includes("ollama")?mt(f.jsxs(vt,{children:[f.jsx("path",{d:"M7 14a3 3 0 0 1 6 0v3H7z"}),f.jsx("path",{d:"M13 14a3 3 0 1 1 3 3"})]}),t,"Ollama"):n.includes("together")?ge("/assets/Icons/together.svg","Together",t):n.includes("fireworks")?ge("/assets/Icons/fireworks.svg","Fireworks",t):n.includes("perplexity")?ge("/assets/Icons/perplexity.svg","Perplexity",t):n.includes("mistral")?ge("/assets/Icons/mistral.svg","Mistral",t):n.includes("deepseek")?ge("/assets/Icons/deepseek.svg","DeepSeek",t):n.includes("cohere")?ge("/assets/Icons/cohere.svg","Cohere",t):mt(f.jsx(vt,{children:f.jsx("rect",{x:"5",y:"5",width:"14",height:"14",rx:"3"})}),t,"Provider")}function Jd(e){const t=e.split(/\r?\n/),n=[];let r=0;for(;r<t.length;){const o=t[r].match(/^```\s*([\w+-]*)\s*$/);if(o){const u=o[1]||"";r++;const s=[];for(;r<t.length&&!/^```\s*$/.test(t[r]);)s.push(t[r]),r++;r<t.length&&/^```\s*$/.test(t[r])&&r++,n.push({type:"code",lang:u,code:s.join(`
-`)});continue}const i=[];for(;r<t.length&&!/^```/.test(t[r]);)i.push(t[r]),r++;i.length&&n.push({type:"text",text:i.join(`
-`)})}return n}function qd(e){const t=[];let n=0;const r=()=>`${n}-${Math.random().toString(36).slice(2,7)}`;for(;n<e.length;){const l=e[n];if(/^\s*---+\s*$/.test(l)){t.push(f.jsx("hr",{className:"border-white/10"},r())),n++;continue}const o=l.match(/^(#{1,3})\s+(.*)$/);if(o){const u=o[1].length,s=o[2];u===1?t.push(f.jsx("h2",{className:"mt-4",children:s},r())):u===2?t.push(f.jsx("h3",{className:"mt-3",children:s},r())):t.push(f.jsx("h4",{className:"mt-2",children:s},r())),n++;continue}if(/^\s*[-*]\s+/.test(l)){const u=[];for(;n<e.length&&/^\s*[-*]\s+/.test(e[n]);)u.push(e[n].replace(/^\s*[-*]\s+/,"")),n++;t.push(f.jsx("ul",{className:"list-disc pl-6 space-y-1",children:u.map((s,c)=>f.jsx("li",{children:s},c))},r()));continue}if(/^\s*\d+\.\s+/.test(l)){const u=[];for(;n<e.length&&/^\s*\d+\.\s+/.test(e[n]);)u.push(e[n].replace(/^\s*\d+\.\s+/,"")),n++;t.push(f.jsx("ol",{className:"list-decimal pl-6 space-y-1",children:u.map((s,c)=>f.jsx("li",{children:s},c))},r()));continue}if(l.includes("|")){const u=[],s=n;for(;n<e.length&&e[n].includes("|");)u.push(e[n]),n++;if(u.length>=2&&/\|/.test(u[0])&&/-/.test(u[1])){const c=m=>m.split("|").map(x=>x.trim()).filter((x,S,k)=>!(S===0&&m.trim().startsWith("|"))&&!(S===k.length-1&&m.trim().endsWith("|"))),h=c(u[0]),v=u.slice(2).map(c);t.push(f.jsx("div",{className:"overflow-x-auto",children:f.jsxs("table",{className:"w-full text-sm border-collapse",children:[f.jsx("thead",{children:f.jsx("tr",{children:h.map((m,x)=>f.jsx("th",{className:"text-left font-semibold px-3 py-2 border-b border-white/10",children:m},x))})}),f.jsx("tbody",{children:v.map((m,x)=>f.jsx("tr",{className:"odd:bg-white/5",children:m.map((S,k)=>f.jsx("td",{className:"px-3 py-2 align-top border-b border-white/5",children:S},k))},x))})]})},r()));continue}else n=s}const i=[];for(;n<e.length&&e[n].trim()!=="";)i.push(e[n]),n++;for(t.push(f.jsx("p",{className:"whitespace-pre-wrap leading-relaxed",children:i.join(`
-`)},r()));n<e.length&&e[n].trim()==="";)n++}return t}function bd({content:e,wrapDefault:t}){const n=O.useMemo(()=>e.replace(/\r/g,"").replace(/^\uFEFF/,""),[e]),r=O.useMemo(()=>Jd(n),[n]);return f.jsx("div",{className:"prose prose-invert max-w-none",children:r.map((l,o)=>l.type==="text"?f.jsx("div",{children:qd(l.text.split(`
-`))},o):f.jsx(ep,{lang:l.lang,code:l.code,defaultWrap:!!t},o))})}function ep({lang:e,code:t,defaultWrap:n}){const[r,l]=O.useState(!!n),o=async()=>{try{await navigator.clipboard.writeText(t)}catch{}};return f.jsxs("div",{className:"rounded-lg border border-white/10 overflow-hidden",children:[f.jsxs("div",{className:"flex items-center justify-between px-3 py-1.5 text-xs bg-slate-800/60 border-b border-white/10",children:[f.jsx("div",{className:"uppercase tracking-wide text-slate-300",children:e||"text"}),f.jsxs("div",{className:"flex items-center gap-2",children:[f.jsx("button",{className:"px-2 py-0.5 rounded bg-white/10 hover:bg-white/15",onClick:()=>l(i=>!i),children:r?"No wrap":"Wrap"}),f.jsx("button",{className:"px-2 py-0.5 rounded bg-white/10 hover:bg-white/15",onClick:o,children:"Copy"})]})]}),f.jsx("pre",{className:`text-sm p-3 ${r?"whitespace-pre-wrap break-words":"whitespace-pre overflow-x-auto"}`,children:f.jsx("code",{children:t})})]})}const ls={theme:"dark",density:"comfortable",fontScale:1,defaultReasoning:!1,codeWrapDefault:!1};function bo(){try{const e=localStorage.getItem("appSettings");if(e)return{...ls,...JSON.parse(e)}}catch{}return ls}function yc(e){const t=document.body;t.classList.toggle("theme-light",e.theme==="light"),t.classList.toggle("theme-dark",e.theme==="dark"),t.classList.toggle("density-compact",e.density==="compact"),t.style.setProperty("--font-scale",String(e.fontScale))}function tp({open:e,onClose:t,onSave:n}){const[r,l]=O.useState(bo()),[o,i]=O.useState({}),[u,s]=O.useState(!1);async function c(h,v){const m=await fetch(h,v);if(!m.ok)throw new Error(String(m.status));return m.json()}return O.useEffect(()=>{e&&(l(bo()),(async()=>{s(!0);try{const h=await c("/api/settings");i(h||{})}catch{i({})}finally{s(!1)}})())},[e]),e?f.jsxs("div",{className:"fixed inset-0 z-50 flex items-center justify-center",children:[f.jsx("div",{className:"absolute inset-0 bg-black/60",onClick:t}),f.jsxs("div",{className:"relative w-full max-w-lg glass rounded-lg p-4",children:[f.jsxs("div",{className:"flex items-center justify-between mb-3",children:[f.jsx("h2",{className:"text-lg font-semibold",children:"Settings"}),f.jsx("button",{className:"px-2 py-1 rounded border border-white/10 hover:bg-white/10",onClick:t,children:"Close"})]}),f.jsxs("div",{className:"space-y-4 text-sm",children:[f.jsxs("div",{children:[f.jsx("label",{className:"block mb-1 text-slate-300",children:"Theme"}),f.jsxs("select",{className:"w-full bg-slate-800/60 border border-white/10 rounded px-2 py-1",value:r.theme,onChange:h=>l(v=>({...v,theme:h.target.value})),children:[f.jsx("option",{value:"dark",children:"Dark"}),f.jsx("option",{value:"light",children:"Light"})]})]}),f.jsxs("div",{children:[f.jsx("label",{className:"block mb-1 text-slate-300",children:"Density"}),f.jsxs("select",{className:"w-full bg-slate-800/60 border border-white/10 rounded px-2 py-1",value:r.density,onChange:h=>l(v=>({...v,density:h.target.value})),children:[f.jsx("option",{value:"comfortable",children:"Comfortable"}),f.jsx("option",{value:"compact",children:"Compact"})]})]}),f.jsxs("div",{children:[f.jsx("label",{className:"block mb-1 text-slate-300",children:"Font scale"}),f.jsx("input",{type:"range",min:.9,max:1.2,step:.05,value:r.fontScale,onChange:h=>l(v=>({...v,fontScale:Number(h.target.value)})),className:"w-full"})]}),f.jsxs("div",{className:"flex items-center gap-2",children:[f.jsx("input",{id:"def-reason",type:"checkbox",checked:r.defaultReasoning,onChange:h=>l(v=>({...v,defaultReasoning:h.target.checked}))}),f.jsx("label",{htmlFor:"def-reason",children:"Enable reasoning by default"})]}),f.jsxs("div",{className:"flex items-center gap-2",children:[f.jsx("input",{id:"code-wrap",type:"checkbox",checked:r.codeWrapDefault,onChange:h=>l(v=>({...v,codeWrapDefault:h.target.checked}))}),f.jsx("label",{htmlFor:"code-wrap",children:"Wrap code blocks by default"})]}),f.jsx("hr",{className:"border-white/10"}),f.jsxs("div",{children:[f.jsx("div",{className:"mb-2 text-slate-300",children:"Backend defaults"}),f.jsx("label",{className:"block mb-1",children:"Default provider"}),f.jsx("select",{className:"w-full bg-slate-800/60 border border-white/10 rounded px-2 py-1",value:o.provider||"",onChange:h=>i(v=>({...v,provider:h.target.value})),children:["","openai","openrouter","anthropic","gemini","azure","ollama","together","fireworks","perplexity","mistral","deepseek","cohere"].map(h=>f.jsx("option",{value:h,children:h||"—"},h))})]}),f.jsxs("div",{children:[f.jsx("label",{className:"block mb-1",children:"Default model"}),f.jsx("input",{className:"w-full bg-slate-800/60 border border-white/10 rounded px-2 py-1",placeholder:"e.g. gpt-4o-mini",value:o.model||"",onChange:h=>i(v=>({...v,model:h.target.value}))})]}),f.jsx("div",{className:"grid grid-cols-1 md:grid-cols-2 gap-3",children:["OPENAI_API_KEY","OPENROUTER_API_KEY","ANTHROPIC_API_KEY","GEMINI_API_KEY","GOOGLE_API_KEY","AZURE_OPENAI_API_KEY","AZURE_OPENAI_ENDPOINT","TOGETHER_API_KEY","FIREWORKS_API_KEY","PERPLEXITY_API_KEY","MISTRAL_API_KEY","DEEPSEEK_API_KEY","COHERE_API_KEY"].map(h=>f.jsxs("div",{children:[f.jsx("label",{className:"block mb-1 text-slate-300",children:h}),f.jsx("input",{className:"w-full bg-slate-800/60 border border-white/10 rounded px-2 py-1",type:"password",placeholder:o[h]===!0?"Set (leave blank to keep)":"Enter value or leave blank",value:typeof o[h]=="string"?o[h]:"",onChange:v=>i(m=>({...m,[h]:v.target.value}))})]},h))})]}),f.jsxs("div",{className:"mt-4 flex justify-end gap-2",children:[f.jsx("button",{className:"px-3 py-1.5 rounded border border-white/10 hover:bg-white/10",onClick:t,children:"Cancel"}),f.jsx("button",{disabled:u,className:"btn-primary",onClick:async()=>{localStorage.setItem("appSettings",JSON.stringify(r)),yc(r),n(r);const h={};Object.entries(o).forEach(([v,m])=>{(typeof m=="string"||["provider","model"].includes(v))&&(h[v]=m)});try{await c("/api/settings",{method:"POST",headers:{"Content-Type":"application/json"},body:JSON.stringify(h)})}catch{}t()},children:"Save"})]})]})]}):null}function np(e){const t=new Date,n=new Date(t.getFullYear(),t.getMonth(),t.getDate()).getTime(),r=n-24*60*60*1e3,l=new Date(e.getFullYear(),e.getMonth(),e.getDate()).getTime();return l===n?"Today":l===r?"Yesterday":e.toLocaleDateString()}async function dt(e,t){const n=await fetch(e,t);if(!n.ok)throw new Error(`${n.status}`);return n.json()}function rp(){const[e,t]=O.useState([]),[n,r]=O.useState(""),[l,o]=O.useState(null),[i,u]=O.useState([{role:"system",content:"You are a helpful assistant."}]),[s,c]=O.useState(""),[h,v]=O.useState("openai"),[m,x]=O.useState(""),[S,k]=O.useState([]),[F,d]=O.useState(!1),[a,p]=O.useState(!1),[y,E]=O.useState(""),_=O.useRef(null),[j,P]=O.useState(!1),[B,R]=O.useState(!1),[fe,Ot]=O.useState(bo()),Xe=O.useMemo(()=>e.filter(g=>(g.title||"").toLowerCase().includes(n.toLowerCase())),[e,n]),Zt=O.useMemo(()=>{const g=Xe.filter(b=>b.pinned),L=Xe.filter(b=>!b.pinned),V={Today:[],Yesterday:[],Earlier:[]},q=new Date,de=new Date(q.getFullYear(),q.getMonth(),q.getDate()).getTime(),He=de-24*60*60*1e3;for(const b of L){const Mt=b.updated_at?new Date(b.updated_at).getTime():0;Mt>=de?V.Today.push(b):Mt>=He?V.Yesterday.push(b):V.Earlier.push(b)}return{pinned:g,byDay:V}},[Xe]);async function vr(g){try{await dt(`/api/conversations/${encodeURIComponent(g)}`,{method:"DELETE"})}catch{}await Ve(),l===g&&(o(null),u([{role:"system",content:"You are a helpful assistant."}]))}O.useEffect(()=>{(async()=>(await Ve(),await z()))()},[]),O.useEffect(()=>{const g=_.current;if(!g)return;const L=()=>{P(g.scrollTop+g.clientHeight<g.scrollHeight-200)};return g.addEventListener("scroll",L),L(),()=>g.removeEventListener("scroll",L)},[]),O.useEffect(()=>{yc(fe)},[fe]),O.useEffect(()=>{const g=_.current;!g||j||(g.scrollTop=g.scrollHeight)},[i,y]);async function Ve(){var L;const g=await dt("/api/conversations");t(g.conversations||[]),!l&&((L=g.conversations)!=null&&L[0])&&await st(g.conversations[0].id)}async function st(g){o(g);const L=await dt(`/api/conversations/${encodeURIComponent(g)}`);u(L.messages||[{role:"system",content:"You are a helpful assistant."}])}async function C(){const g=await dt("/api/conversations",{method:"POST",headers:{"Content-Type":"application/json"},body:JSON.stringify({})});o(g.id),await Ve(),await st(g.id)}async function T(g){await dt(`/api/conversations/${encodeURIComponent(g.id)}`,{method:"PATCH",headers:{"Content-Type":"application/json"},body:JSON.stringify({pinned:!g.pinned})}),await Ve()}async function z(){const g=await dt("/api/settings");g.provider&&v(g.provider),await X(g.provider||h),g.model&&x(g.model)}async function W(g){l&&(await dt(`/api/conversations/${encodeURIComponent(l)}`,{method:"PATCH",headers:{"Content-Type":"application/json"},body:JSON.stringify({messages:g})}),u(g),await Ve())}async function X(g){try{const L=await dt(`/api/models/${encodeURIComponent(g)}`);k(L.models||[])}catch{k([])}}async function at(){const g=s.trim();if(!g)return;l||await C(),c("");const L={role:"user",content:g},V=[...i,L];u(V);const q=window.location.protocol==="https:"?"wss":"ws",de=new WebSocket(`${q}://${window.location.host}/ws/chat`);d(!0);let He="";E(""),de.onopen=()=>{const b=l;de.send(JSON.stringify({messages:V,provider:h,model:m,conversation_id:b,reasoning:a}))},de.onmessage=b=>{const Mt=b.data;if(Mt==="[END]"){d(!1),u(Rl=>[...Rl,{role:"assistant",content:He}]),E(""),Ve();return}He+=Mt,E(He)},de.onerror=()=>d(!1),de.onclose=()=>d(!1)}function Ze({m:g,idx:L}){const[V,q]=O.useState(!1),[de,He]=O.useState(g.content),b=g.role==="user",Mt=async()=>{try{await navigator.clipboard.writeText(g.content)}catch{}},Rl=async()=>{const Je=i.filter((ct,Il)=>Il!==L);await W(Je)},wc=async()=>{const Je=i.map((ct,Il)=>Il===L?{...ct,content:de}:ct);await W(Je),q(!1)},xc=async()=>{let Je=null;for(let ct=L-1;ct>=0;ct--)if(i[ct].role==="user"){Je=i[ct].content;break}Je&&(c(Je),await at())};return f.jsxs("div",{className:`flex gap-3 ${g.role==="user"?"justify-end":""}`,children:[g.role==="assistant"&&f.jsx("div",{className:"w-8 h-8 rounded-full bg-brand flex items-center justify-center",children:rs(m,16)}),f.jsxs("div",{className:`group rounded-2xl px-3 py-2 border relative ${g.role==="user"?"bg-slate-800/60 border-white/10":"bg-slate-900/60 border-white/10"} shadow-[inset_0_1px_0_rgba(255,255,255,0.05)]`,style:{maxWidth:"80%"},children:[f.jsxs("div",{className:"absolute -top-2 right-1 opacity-0 group-hover:opacity-100 transition text-xs flex gap-2",children:[f.jsx("button",{className:"px-2 py-0.5 bg-white/10 rounded",onClick:Mt,children:"Copy"}),g.role==="assistant"&&f.jsx("button",{className:"px-2 py-0.5 bg-white/10 rounded",onClick:xc,children:"Regenerate"}),b&&!V&&f.jsx("button",{className:"px-2 py-0.5 bg-white/10 rounded",onClick:()=>q(!0),children:"Edit"}),f.jsx("button",{className:"px-2 py-0.5 bg-white/10 rounded",onClick:Rl,children:"Delete"}),V&&f.jsxs(f.Fragment,{children:[f.jsx("button",{className:"px-2 py-0.5 bg-brand rounded",onClick:wc,children:"Save"}),f.jsx("button",{className:"px-2 py-0.5 bg-white/10 rounded",onClick:()=>{q(!1),He(g.content)},children:"Cancel"})]})]}),V?f.jsx("textarea",{className:"w-full bg-slate-800/60 border border-white/10 rounded p-2 text-sm",rows:Math.min(10,Math.max(3,g.content.split(`
-`).length)),value:de,onChange:Je=>He(Je.target.value)}):f.jsx("div",{className:"text-slate-100 text-sm",children:g.role==="assistant"?f.jsxs(f.Fragment,{children:[g.reasoning&&f.jsx("div",{className:"mb-2 rounded-lg border border-amber-300/20 bg-amber-900/10 p-2 text-amber-200 text-xs",children:g.reasoning}),f.jsx(bd,{content:g.content,wrapDefault:fe.codeWrapDefault})]}):f.jsx("div",{className:"whitespace-pre-wrap",children:g.content})})]}),g.role==="user"&&f.jsx("div",{className:"w-8 h-8 rounded-full bg-brand flex items-center justify-center",children:"U"})]})}return f.jsxs("div",{className:"h-screen grid grid-cols-[300px_1fr] gap-0",children:[f.jsxs("aside",{className:"glass border-r",children:[f.jsxs("div",{className:"p-3 flex items-center gap-2",children:[f.jsx("button",{className:"btn-primary",onClick:C,children:"New"}),f.jsx("input",{className:"ml-auto bg-slate-800/60 border border-white/10 rounded px-2 py-1 w-full",placeholder:"Search",value:n,onChange:g=>r(g.target.value)})]}),f.jsxs("div",{className:"overflow-y-auto min-h-0 p-2 space-y-2",children:[Zt.pinned.length>0&&f.jsxs("div",{children:[f.jsx("div",{className:"px-2 text-xs uppercase text-slate-400 mb-1",children:"Pinned"}),f.jsx("div",{className:"space-y-1",children:Zt.pinned.map(g=>f.jsx("div",{className:`w-full px-2 py-1 rounded hover:bg-white/5 ${l===g.id?"bg-white/10":""}`,children:f.jsxs("div",{className:"flex items-center justify-between gap-2",children:[f.jsx("button",{className:"flex-1 text-left truncate",onClick:()=>st(g.id),children:g.title||"Untitled"}),f.jsxs("div",{className:"flex items-center gap-1 text-xs text-slate-400",children:[f.jsx("button",{className:"px-1 hover:text-white",onClick:L=>{L.stopPropagation(),T(g)},children:"Unpin"}),f.jsx("button",{className:"px-1 text-red-300 hover:text-red-200",onClick:L=>{L.stopPropagation(),vr(g.id)},children:"Delete"})]})]})},g.id))})]}),Object.entries(Zt.byDay).map(([g,L])=>L.length?f.jsxs("div",{children:[f.jsx("div",{className:"px-2 text-xs uppercase text-slate-400 mb-1",children:g}),f.jsx("div",{className:"space-y-1",children:L.map(V=>f.jsx("div",{className:`w-full px-2 py-1 rounded hover:bg-white/5 ${l===V.id?"bg-white/10":""}`,children:f.jsxs("div",{className:"flex items-center justify-between gap-2",children:[f.jsx("button",{className:"flex-1 text-left truncate",onClick:()=>st(V.id),children:V.title||"Untitled"}),f.jsxs("div",{className:"flex items-center gap-1 text-xs text-slate-400",children:[f.jsx("button",{className:"px-1 hover:text-white",onClick:q=>{q.stopPropagation(),T(V)},children:"Pin"}),f.jsx("button",{className:"px-1 text-red-300 hover:text-red-200",onClick:q=>{q.stopPropagation(),vr(V.id)},children:"Delete"})]})]})},V.id))})]},g):null)]})]}),f.jsxs("main",{className:"flex flex-col min-h-0",children:[f.jsxs("header",{className:"glass flex items-center justify-between px-4 py-2 border-b",children:[f.jsx("h1",{className:"font-semibold",children:"ChatUI"}),f.jsxs("div",{className:"flex items-center gap-2",children:[f.jsxs("div",{className:"flex items-center gap-1 text-sm text-slate-300",children:[Zd(h,16),f.jsx("span",{className:"hidden md:inline",children:h})]}),f.jsx("select",{className:"bg-slate-800/60 border border-white/10 rounded px-2 py-1",value:h,onChange:async g=>{const L=g.target.value;v(L),await X(L)},children:["openai","openrouter","anthropic","gemini","azure","ollama","together","fireworks","perplexity","mistral","deepseek","cohere"].map(g=>f.jsx("option",{value:g,children:g},g))}),f.jsxs("select",{className:"bg-slate-800/60 border border-white/10 rounded px-2 py-1",value:m,onChange:g=>x(g.target.value),children:[f.jsx("option",{value:"",children:"Select a model"}),S.map(g=>f.jsx("option",{value:g.id,children:g.name||g.id},g.id))]}),f.jsxs("label",{className:"text-sm flex items-center gap-1",children:[f.jsx("input",{type:"checkbox",checked:a,onChange:g=>p(g.target.checked)})," Reasoning"]}),f.jsx("button",{className:"px-2 py-1 rounded border border-white/10 hover:bg-white/10",onClick:()=>R(!0),children:"Settings"})]})]}),f.jsxs("div",{ref:_,className:"flex-1 overflow-y-auto p-4",children:[i.filter(g=>g.role!=="system").length===0&&f.jsxs("div",{className:"max-w-2xl mx-auto p-4 rounded-lg border border-white/10 bg-slate-900/60",children:[f.jsx("div",{className:"mb-2 text-slate-300",children:"Try one of these"}),f.jsx("div",{className:"flex flex-wrap gap-2",children:["Summarize an article","Write Python","Explain a concept","Create a plan"].map((g,L)=>f.jsx("button",{className:"px-3 py-1 rounded border border-white/10 hover:bg-white/5",onClick:()=>c(g),children:g},L))})]}),f.jsxs("div",{className:"max-w-3xl mx-auto space-y-3",children:[(()=>{const g=[];let L=null;return i.filter(q=>q.role!=="system").forEach((q,de)=>{if(q.created_at){const He=new Date(q.created_at),b=np(He);b!==L&&(L=b,g.push(f.jsx("div",{className:"sticky top-2 z-10",children:f.jsx("div",{className:"mx-auto w-fit px-3 py-1 text-xs text-slate-300 border border-white/10 rounded-full bg-slate-900/70 backdrop-blur",children:b})},`sep-${de}`)))}g.push(f.jsx(Ze,{m:q,idx:de},de))}),g})(),y&&f.jsxs("div",{className:"flex gap-3",children:[f.jsx("div",{className:"w-8 h-8 rounded-full bg-brand flex items-center justify-center",children:rs(m,16)}),f.jsx("div",{className:"rounded-2xl px-3 py-2 border bg-slate-900/60 border-white/10",style:{maxWidth:"80%"},children:f.jsx("div",{className:"whitespace-pre-wrap text-slate-100 text-sm",children:y})})]}),F&&!y&&f.jsxs("div",{className:"flex items-center gap-2 text-slate-300 text-sm",children:[f.jsx("span",{className:"w-2 h-2 bg-slate-500 rounded-full animate-pulse"}),"Generating…"]})]})]}),j&&f.jsx("button",{className:"fixed right-6 bottom-24 px-3 py-1.5 rounded-full bg-brand text-white shadow hover:bg-brand-dark",onClick:()=>{const g=_.current;g&&(g.scrollTop=g.scrollHeight)},children:"Jump to latest"}),f.jsxs("form",{className:"glass border-t p-3 flex items-center gap-2",onSubmit:g=>{g.preventDefault(),at()},children:[f.jsx("div",{className:"flex-1",children:f.jsx("textarea",{className:"w-full bg-slate-800/60 border border-white/10 rounded-full px-4 py-2 h-11 resize-none",placeholder:"Ask something...",value:s,onChange:g=>c(g.target.value),onKeyDown:g=>{g.key==="Enter"&&!g.shiftKey&&(g.preventDefault(),at())}})}),f.jsx("button",{className:"btn-primary rounded-full h-11 px-5",disabled:!s.trim()||F,type:"submit",children:"Send"})]})]}),f.jsx(tp,{open:B,onClose:()=>R(!1),onSave:g=>{Ot(g),R(!1)}})]})}const lp=document.getElementById("root");gc(lp).render(f.jsx(Fc.StrictMode,{children:f.jsx(rp,{})}));
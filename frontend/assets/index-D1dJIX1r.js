@@ -1,47 +0,0 @@
-(function(){const t=document.createElement("link").relList;if(t&&t.supports&&t.supports("modulepreload"))return;for(const l of document.querySelectorAll('link[rel="modulepreload"]'))r(l);new MutationObserver(l=>{for(const i of l)if(i.type==="childList")for(const o of i.addedNodes)o.tagName==="LINK"&&o.rel==="modulepreload"&&r(o)}).observe(document,{childList:!0,subtree:!0});function n(l){const i={};return l.integrity&&(i.integrity=l.integrity),l.referrerPolicy&&(i.referrerPolicy=l.referrerPolicy),l.crossOrigin==="use-credentials"?i.credentials="include":l.crossOrigin==="anonymous"?i.credentials="omit":i.credentials="same-origin",i}function r(l){if(l.ep)return;l.ep=!0;const i=n(l);fetch(l.href,i)}})();function Bc(e){return e&&e.__esModule&&Object.prototype.hasOwnProperty.call(e,"default")?e.default:e}var Cu={exports:{}},jl={},ju={exports:{}},R={};/**
- * @license React
- * react.production.min.js
- *
- * Copyright (c) Facebook, Inc. and its affiliates.
- *
- * This source code is licensed under the MIT license found in the
- * LICENSE file in the root directory of this source tree.
- */var wr=Symbol.for("react.element"),Wc=Symbol.for("react.portal"),Vc=Symbol.for("react.fragment"),Hc=Symbol.for("react.strict_mode"),Qc=Symbol.for("react.profiler"),Kc=Symbol.for("react.provider"),Yc=Symbol.for("react.context"),Gc=Symbol.for("react.forward_ref"),Xc=Symbol.for("react.suspense"),Zc=Symbol.for("react.memo"),Jc=Symbol.for("react.lazy"),ds=Symbol.iterator;function qc(e){return e===null||typeof e!="object"?null:(e=ds&&e[ds]||e["@@iterator"],typeof e=="function"?e:null)}var _u={isMounted:function(){return!1},enqueueForceUpdate:function(){},enqueueReplaceState:function(){},enqueueSetState:function(){}},Pu=Object.assign,Lu={};function In(e,t,n){this.props=e,this.context=t,this.refs=Lu,this.updater=n||_u}In.prototype.isReactComponent={};In.prototype.setState=function(e,t){if(typeof e!="object"&&typeof e!="function"&&e!=null)throw Error("setState(...): takes an object of state variables to update or a function which returns an object of state variables.");this.updater.enqueueSetState(this,e,t,"setState")};In.prototype.forceUpdate=function(e){this.updater.enqueueForceUpdate(this,e,"forceUpdate")};function Tu(){}Tu.prototype=In.prototype;function fo(e,t,n){this.props=e,this.context=t,this.refs=Lu,this.updater=n||_u}var po=fo.prototype=new Tu;po.constructor=fo;Pu(po,In.prototype);po.isPureReactComponent=!0;var ps=Array.isArray,Iu=Object.prototype.hasOwnProperty,ho={current:null},zu={key:!0,ref:!0,__self:!0,__source:!0};function Du(e,t,n){var r,l={},i=null,o=null;if(t!=null)for(r in t.ref!==void 0&&(o=t.ref),t.key!==void 0&&(i=""+t.key),t)Iu.call(t,r)&&!zu.hasOwnProperty(r)&&(l[r]=t[r]);var s=arguments.length-2;if(s===1)l.children=n;else if(1<s){for(var u=Array(s),f=0;f<s;f++)u[f]=arguments[f+2];l.children=u}if(e&&e.defaultProps)for(r in s=e.defaultProps,s)l[r]===void 0&&(l[r]=s[r]);return{$$typeof:wr,type:e,key:i,ref:o,props:l,_owner:ho.current}}function bc(e,t){return{$$typeof:wr,type:e.type,key:t,ref:e.ref,props:e.props,_owner:e._owner}}function mo(e){return typeof e=="object"&&e!==null&&e.$$typeof===wr}function ef(e){var t={"=":"=0",":":"=2"};return"$"+e.replace(/[=:]/g,function(n){return t[n]})}var hs=/\/+/g;function Kl(e,t){return typeof e=="object"&&e!==null&&e.key!=null?ef(""+e.key):t.toString(36)}function Vr(e,t,n,r,l){var i=typeof e;(i==="undefined"||i==="boolean")&&(e=null);var o=!1;if(e===null)o=!0;else switch(i){case"string":case"number":o=!0;break;case"object":switch(e.$$typeof){case wr:case Wc:o=!0}}if(o)return o=e,l=l(o),e=r===""?"."+Kl(o,0):r,ps(l)?(n="",e!=null&&(n=e.replace(hs,"$&/")+"/"),Vr(l,t,n,"",function(f){return f})):l!=null&&(mo(l)&&(l=bc(l,n+(!l.key||o&&o.key===l.key?"":(""+l.key).replace(hs,"$&/")+"/")+e)),t.push(l)),1;if(o=0,r=r===""?".":r+":",ps(e))for(var s=0;s<e.length;s++){i=e[s];var u=r+Kl(i,s);o+=Vr(i,t,n,u,l)}else if(u=qc(e),typeof u=="function")for(e=u.call(e),s=0;!(i=e.next()).done;)i=i.value,u=r+Kl(i,s++),o+=Vr(i,t,n,u,l);else if(i==="object")throw t=String(e),Error("Objects are not valid as a React child (found: "+(t==="[object Object]"?"object with keys {"+Object.keys(e).join(", ")+"}":t)+"). If you meant to render a collection of children, use an array instead.");return o}function jr(e,t,n){if(e==null)return e;var r=[],l=0;return Vr(e,r,"","",function(i){return t.call(n,i,l++)}),r}function tf(e){if(e._status===-1){var t=e._result;t=t(),t.then(function(n){(e._status===0||e._status===-1)&&(e._status=1,e._result=n)},function(n){(e._status===0||e._status===-1)&&(e._status=2,e._result=n)}),e._status===-1&&(e._status=0,e._result=t)}if(e._status===1)return e._result.default;throw e._result}var ke={current:null},Hr={transition:null},nf={ReactCurrentDispatcher:ke,ReactCurrentBatchConfig:Hr,ReactCurrentOwner:ho};function Ru(){throw Error("act(...) is not supported in production builds of React.")}R.Children={map:jr,forEach:function(e,t,n){jr(e,function(){t.apply(this,arguments)},n)},count:function(e){var t=0;return jr(e,function(){t++}),t},toArray:function(e){return jr(e,function(t){return t})||[]},only:function(e){if(!mo(e))throw Error("React.Children.only expected to receive a single React element child.");return e}};R.Component=In;R.Fragment=Vc;R.Profiler=Qc;R.PureComponent=fo;R.StrictMode=Hc;R.Suspense=Xc;R.__SECRET_INTERNALS_DO_NOT_USE_OR_YOU_WILL_BE_FIRED=nf;R.act=Ru;R.cloneElement=function(e,t,n){if(e==null)throw Error("React.cloneElement(...): The argument must be a React element, but you passed "+e+".");var r=Pu({},e.props),l=e.key,i=e.ref,o=e._owner;if(t!=null){if(t.ref!==void 0&&(i=t.ref,o=ho.current),t.key!==void 0&&(l=""+t.key),e.type&&e.type.defaultProps)var s=e.type.defaultProps;for(u in t)Iu.call(t,u)&&!zu.hasOwnProperty(u)&&(r[u]=t[u]===void 0&&s!==void 0?s[u]:t[u])}var u=arguments.length-2;if(u===1)r.children=n;else if(1<u){s=Array(u);for(var f=0;f<u;f++)s[f]=arguments[f+2];r.children=s}return{$$typeof:wr,type:e.type,key:l,ref:i,props:r,_owner:o}};R.createContext=function(e){return e={$$typeof:Yc,_currentValue:e,_currentValue2:e,_threadCount:0,Provider:null,Consumer:null,_defaultValue:null,_globalName:null},e.Provider={$$typeof:Kc,_context:e},e.Consumer=e};R.createElement=Du;R.createFactory=function(e){var t=Du.bind(null,e);return t.type=e,t};R.createRef=function(){return{current:null}};R.forwardRef=function(e){return{$$typeof:Gc,render:e}};R.isValidElement=mo;R.lazy=function(e){return{$$typeof:Jc,_payload:{_status:-1,_result:e},_init:tf}};R.memo=function(e,t){return{$$typeof:Zc,type:e,compare:t===void 0?null:t}};R.startTransition=function(e){var t=Hr.transition;Hr.transition={};try{e()}finally{Hr.transition=t}};R.unstable_act=Ru;R.useCallback=function(e,t){return ke.current.useCallback(e,t)};R.useContext=function(e){return ke.current.useContext(e)};R.useDebugValue=function(){};R.useDeferredValue=function(e){return ke.current.useDeferredValue(e)};R.useEffect=function(e,t){return ke.current.useEffect(e,t)};R.useId=function(){return ke.current.useId()};R.useImperativeHandle=function(e,t,n){return ke.current.useImperativeHandle(e,t,n)};R.useInsertionEffect=function(e,t){return ke.current.useInsertionEffect(e,t)};R.useLayoutEffect=function(e,t){return ke.current.useLayoutEffect(e,t)};R.useMemo=function(e,t){return ke.current.useMemo(e,t)};R.useReducer=function(e,t,n){return ke.current.useReducer(e,t,n)};R.useRef=function(e){return ke.current.useRef(e)};R.useState=function(e){return ke.current.useState(e)};R.useSyncExternalStore=function(e,t,n){return ke.current.useSyncExternalStore(e,t,n)};R.useTransition=function(){return ke.current.useTransition()};R.version="18.3.1";ju.exports=R;var L=ju.exports;const rf=Bc(L);/**
- * @license React
- * react-jsx-runtime.production.min.js
- *
- * Copyright (c) Facebook, Inc. and its affiliates.
- *
- * This source code is licensed under the MIT license found in the
- * LICENSE file in the root directory of this source tree.
- */var lf=L,of=Symbol.for("react.element"),sf=Symbol.for("react.fragment"),uf=Object.prototype.hasOwnProperty,af=lf.__SECRET_INTERNALS_DO_NOT_USE_OR_YOU_WILL_BE_FIRED.ReactCurrentOwner,cf={key:!0,ref:!0,__self:!0,__source:!0};function Mu(e,t,n){var r,l={},i=null,o=null;n!==void 0&&(i=""+n),t.key!==void 0&&(i=""+t.key),t.ref!==void 0&&(o=t.ref);for(r in t)uf.call(t,r)&&!cf.hasOwnProperty(r)&&(l[r]=t[r]);if(e&&e.defaultProps)for(r in t=e.defaultProps,t)l[r]===void 0&&(l[r]=t[r]);return{$$typeof:of,type:e,key:i,ref:o,props:l,_owner:af.current}}jl.Fragment=sf;jl.jsx=Mu;jl.jsxs=Mu;Cu.exports=jl;var a=Cu.exports,Ou={exports:{}},De={},Fu={exports:{}},Uu={};/**
- * @license React
- * scheduler.production.min.js
- *
- * Copyright (c) Facebook, Inc. and its affiliates.
- *
- * This source code is licensed under the MIT license found in the
- * LICENSE file in the root directory of this source tree.
- */(function(e){function t(N,T){var z=N.length;N.push(T);e:for(;0<z;){var $=z-1>>>1,B=N[$];if(0<l(B,T))N[$]=T,N[z]=B,z=$;else break e}}function n(N){return N.length===0?null:N[0]}function r(N){if(N.length===0)return null;var T=N[0],z=N.pop();if(z!==T){N[0]=z;e:for(var $=0,B=N.length,$t=B>>>1;$<$t;){var oe=2*($+1)-1,vt=N[oe],lt=oe+1,Bt=N[lt];if(0>l(vt,z))lt<B&&0>l(Bt,vt)?(N[$]=Bt,N[lt]=z,$=lt):(N[$]=vt,N[oe]=z,$=oe);else if(lt<B&&0>l(Bt,z))N[$]=Bt,N[lt]=z,$=lt;else break e}}return T}function l(N,T){var z=N.sortIndex-T.sortIndex;return z!==0?z:N.id-T.id}if(typeof performance=="object"&&typeof performance.now=="function"){var i=performance;e.unstable_now=function(){return i.now()}}else{var o=Date,s=o.now();e.unstable_now=function(){return o.now()-s}}var u=[],f=[],h=1,g=null,m=3,x=!1,k=!1,S=!1,O=typeof setTimeout=="function"?setTimeout:null,d=typeof clearTimeout=="function"?clearTimeout:null,c=typeof setImmediate<"u"?setImmediate:null;typeof navigator<"u"&&navigator.scheduling!==void 0&&navigator.scheduling.isInputPending!==void 0&&navigator.scheduling.isInputPending.bind(navigator.scheduling);function p(N){for(var T=n(f);T!==null;){if(T.callback===null)r(f);else if(T.startTime<=N)r(f),T.sortIndex=T.expirationTime,t(u,T);else break;T=n(f)}}function y(N){if(S=!1,p(N),!k)if(n(u)!==null)k=!0,ie(E);else{var T=n(f);T!==null&&rt(y,T.startTime-N)}}function E(N,T){k=!1,S&&(S=!1,d(P),P=-1),x=!0;var z=m;try{for(p(T),g=n(u);g!==null&&(!(g.expirationTime>T)||N&&!Me());){var $=g.callback;if(typeof $=="function"){g.callback=null,m=g.priorityLevel;var B=$(g.expirationTime<=T);T=e.unstable_now(),typeof B=="function"?g.callback=B:g===n(u)&&r(u),p(T)}else r(u);g=n(u)}if(g!==null)var $t=!0;else{var oe=n(f);oe!==null&&rt(y,oe.startTime-T),$t=!1}return $t}finally{g=null,m=z,x=!1}}var _=!1,C=null,P=-1,K=5,D=-1;function Me(){return!(e.unstable_now()-D<K)}function mt(){if(C!==null){var N=e.unstable_now();D=N;var T=!0;try{T=C(!0,N)}finally{T?At():(_=!1,C=null)}}else _=!1}var At;if(typeof c=="function")At=function(){c(mt)};else if(typeof MessageChannel<"u"){var Rn=new MessageChannel,Oe=Rn.port2;Rn.port1.onmessage=mt,At=function(){Oe.postMessage(null)}}else At=function(){O(mt,0)};function ie(N){C=N,_||(_=!0,At())}function rt(N,T){P=O(function(){N(e.unstable_now())},T)}e.unstable_IdlePriority=5,e.unstable_ImmediatePriority=1,e.unstable_LowPriority=4,e.unstable_NormalPriority=3,e.unstable_Profiling=null,e.unstable_UserBlockingPriority=2,e.unstable_cancelCallback=function(N){N.callback=null},e.unstable_continueExecution=function(){k||x||(k=!0,ie(E))},e.unstable_forceFrameRate=function(N){0>N||125<N?console.error("forceFrameRate takes a positive int between 0 and 125, forcing frame rates higher than 125 fps is not supported"):K=0<N?Math.floor(1e3/N):5},e.unstable_getCurrentPriorityLevel=function(){return m},e.unstable_getFirstCallbackNode=function(){return n(u)},e.unstable_next=function(N){switch(m){case 1:case 2:case 3:var T=3;break;default:T=m}var z=m;m=T;try{return N()}finally{m=z}},e.unstable_pauseExecution=function(){},e.unstable_requestPaint=function(){},e.unstable_runWithPriority=function(N,T){switch(N){case 1:case 2:case 3:case 4:case 5:break;default:N=3}var z=m;m=N;try{return T()}finally{m=z}},e.unstable_scheduleCallback=function(N,T,z){var $=e.unstable_now();switch(typeof z=="object"&&z!==null?(z=z.delay,z=typeof z=="number"&&0<z?$+z:$):z=$,N){case 1:var B=-1;break;case 2:B=250;break;case 5:B=1073741823;break;case 4:B=1e4;break;default:B=5e3}return B=z+B,N={id:h++,callback:T,priorityLevel:N,startTime:z,expirationTime:B,sortIndex:-1},z>$?(N.sortIndex=z,t(f,N),n(u)===null&&N===n(f)&&(S?(d(P),P=-1):S=!0,rt(y,z-$))):(N.sortIndex=B,t(u,N),k||x||(k=!0,ie(E))),N},e.unstable_shouldYield=Me,e.unstable_wrapCallback=function(N){var T=m;return function(){var z=m;m=T;try{return N.apply(this,arguments)}finally{m=z}}}})(Uu);Fu.exports=Uu;var ff=Fu.exports;/**
- * @license React
- * react-dom.production.min.js
- *
- * Copyright (c) Facebook, Inc. and its affiliates.
- *
- * This source code is licensed under the MIT license found in the
- * LICENSE file in the root directory of this source tree.
- */var df=L,ze=ff;function w(e){for(var t="https://reactjs.org/docs/error-decoder.html?invariant="+e,n=1;n<arguments.length;n++)t+="&args[]="+encodeURIComponent(arguments[n]);return"Minified React error #"+e+"; visit "+t+" for the full message or use the non-minified dev environment for full errors and additional helpful warnings."}var Au=new Set,nr={};function tn(e,t){Nn(e,t),Nn(e+"Capture",t)}function Nn(e,t){for(nr[e]=t,e=0;e<t.length;e++)Au.add(t[e])}var ct=!(typeof window>"u"||typeof window.document>"u"||typeof window.document.createElement>"u"),yi=Object.prototype.hasOwnProperty,pf=/^[:A-Z_a-z\u00C0-\u00D6\u00D8-\u00F6\u00F8-\u02FF\u0370-\u037D\u037F-\u1FFF\u200C-\u200D\u2070-\u218F\u2C00-\u2FEF\u3001-\uD7FF\uF900-\uFDCF\uFDF0-\uFFFD][:A-Z_a-z\u00C0-\u00D6\u00D8-\u00F6\u00F8-\u02FF\u0370-\u037D\u037F-\u1FFF\u200C-\u200D\u2070-\u218F\u2C00-\u2FEF\u3001-\uD7FF\uF900-\uFDCF\uFDF0-\uFFFD\-.0-9\u00B7\u0300-\u036F\u203F-\u2040]*$/,ms={},vs={};function hf(e){return yi.call(vs,e)?!0:yi.call(ms,e)?!1:pf.test(e)?vs[e]=!0:(ms[e]=!0,!1)}function mf(e,t,n,r){if(n!==null&&n.type===0)return!1;switch(typeof t){case"function":case"symbol":return!0;case"boolean":return r?!1:n!==null?!n.acceptsBooleans:(e=e.toLowerCase().slice(0,5),e!=="data-"&&e!=="aria-");default:return!1}}function vf(e,t,n,r){if(t===null||typeof t>"u"||mf(e,t,n,r))return!0;if(r)return!1;if(n!==null)switch(n.type){case 3:return!t;case 4:return t===!1;case 5:return isNaN(t);case 6:return isNaN(t)||1>t}return!1}function Se(e,t,n,r,l,i,o){this.acceptsBooleans=t===2||t===3||t===4,this.attributeName=r,this.attributeNamespace=l,this.mustUseProperty=n,this.propertyName=e,this.type=t,this.sanitizeURL=i,this.removeEmptyString=o}var de={};"children dangerouslySetInnerHTML defaultValue defaultChecked innerHTML suppressContentEditableWarning suppressHydrationWarning style".split(" ").forEach(function(e){de[e]=new Se(e,0,!1,e,null,!1,!1)});[["acceptCharset","accept-charset"],["className","class"],["htmlFor","for"],["httpEquiv","http-equiv"]].forEach(function(e){var t=e[0];de[t]=new Se(t,1,!1,e[1],null,!1,!1)});["contentEditable","draggable","spellCheck","value"].forEach(function(e){de[e]=new Se(e,2,!1,e.toLowerCase(),null,!1,!1)});["autoReverse","externalResourcesRequired","focusable","preserveAlpha"].forEach(function(e){de[e]=new Se(e,2,!1,e,null,!1,!1)});"allowFullScreen async autoFocus autoPlay controls default defer disabled disablePictureInPicture disableRemotePlayback formNoValidate hidden loop noModule noValidate open playsInline readOnly required reversed scoped seamless itemScope".split(" ").forEach(function(e){de[e]=new Se(e,3,!1,e.toLowerCase(),null,!1,!1)});["checked","multiple","muted","selected"].forEach(function(e){de[e]=new Se(e,3,!0,e,null,!1,!1)});["capture","download"].forEach(function(e){de[e]=new Se(e,4,!1,e,null,!1,!1)});["cols","rows","size","span"].forEach(function(e){de[e]=new Se(e,6,!1,e,null,!1,!1)});["rowSpan","start"].forEach(function(e){de[e]=new Se(e,5,!1,e.toLowerCase(),null,!1,!1)});var vo=/[\-:]([a-z])/g;function go(e){return e[1].toUpperCase()}"accent-height alignment-baseline arabic-form baseline-shift cap-height clip-path clip-rule color-interpolation color-interpolation-filters color-profile color-rendering dominant-baseline enable-background fill-opacity fill-rule flood-color flood-opacity font-family font-size font-size-adjust font-stretch font-style font-variant font-weight glyph-name glyph-orientation-horizontal glyph-orientation-vertical horiz-adv-x horiz-origin-x image-rendering letter-spacing lighting-color marker-end marker-mid marker-start overline-position overline-thickness paint-order panose-1 pointer-events rendering-intent shape-rendering stop-color stop-opacity strikethrough-position strikethrough-thickness stroke-dasharray stroke-dashoffset stroke-linecap stroke-linejoin stroke-miterlimit stroke-opacity stroke-width text-anchor text-decoration text-rendering underline-position underline-thickness unicode-bidi unicode-range units-per-em v-alphabetic v-hanging v-ideographic v-mathematical vector-effect vert-adv-y vert-origin-x vert-origin-y word-spacing writing-mode xmlns:xlink x-height".split(" ").forEach(function(e){var t=e.replace(vo,go);de[t]=new Se(t,1,!1,e,null,!1,!1)});"xlink:actuate xlink:arcrole xlink:role xlink:show xlink:title xlink:type".split(" ").forEach(function(e){var t=e.replace(vo,go);de[t]=new Se(t,1,!1,e,"http://www.w3.org/1999/xlink",!1,!1)});["xml:base","xml:lang","xml:space"].forEach(function(e){var t=e.replace(vo,go);de[t]=new Se(t,1,!1,e,"http://www.w3.org/XML/1998/namespace",!1,!1)});["tabIndex","crossOrigin"].forEach(function(e){de[e]=new Se(e,1,!1,e.toLowerCase(),null,!1,!1)});de.xlinkHref=new Se("xlinkHref",1,!1,"xlink:href","http://www.w3.org/1999/xlink",!0,!1);["src","href","action","formAction"].forEach(function(e){de[e]=new Se(e,1,!1,e.toLowerCase(),null,!0,!0)});function yo(e,t,n,r){var l=de.hasOwnProperty(t)?de[t]:null;(l!==null?l.type!==0:r||!(2<t.length)||t[0]!=="o"&&t[0]!=="O"||t[1]!=="n"&&t[1]!=="N")&&(vf(t,n,l,r)&&(n=null),r||l===null?hf(t)&&(n===null?e.removeAttribute(t):e.setAttribute(t,""+n)):l.mustUseProperty?e[l.propertyName]=n===null?l.type===3?!1:"":n:(t=l.attributeName,r=l.attributeNamespace,n===null?e.removeAttribute(t):(l=l.type,n=l===3||l===4&&n===!0?"":""+n,r?e.setAttributeNS(r,t,n):e.setAttribute(t,n))))}var ht=df.__SECRET_INTERNALS_DO_NOT_USE_OR_YOU_WILL_BE_FIRED,_r=Symbol.for("react.element"),on=Symbol.for("react.portal"),sn=Symbol.for("react.fragment"),wo=Symbol.for("react.strict_mode"),wi=Symbol.for("react.profiler"),$u=Symbol.for("react.provider"),Bu=Symbol.for("react.context"),xo=Symbol.for("react.forward_ref"),xi=Symbol.for("react.suspense"),ki=Symbol.for("react.suspense_list"),ko=Symbol.for("react.memo"),xt=Symbol.for("react.lazy"),Wu=Symbol.for("react.offscreen"),gs=Symbol.iterator;function Mn(e){return e===null||typeof e!="object"?null:(e=gs&&e[gs]||e["@@iterator"],typeof e=="function"?e:null)}var Z=Object.assign,Yl;function Vn(e){if(Yl===void 0)try{throw Error()}catch(n){var t=n.stack.trim().match(/\n( *(at )?)/);Yl=t&&t[1]||""}return`
-`+Yl+e}var Gl=!1;function Xl(e,t){if(!e||Gl)return"";Gl=!0;var n=Error.prepareStackTrace;Error.prepareStackTrace=void 0;try{if(t)if(t=function(){throw Error()},Object.defineProperty(t.prototype,"props",{set:function(){throw Error()}}),typeof Reflect=="object"&&Reflect.construct){try{Reflect.construct(t,[])}catch(f){var r=f}Reflect.construct(e,[],t)}else{try{t.call()}catch(f){r=f}e.call(t.prototype)}else{try{throw Error()}catch(f){r=f}e()}}catch(f){if(f&&r&&typeof f.stack=="string"){for(var l=f.stack.split(`
-`),i=r.stack.split(`
-`),o=l.length-1,s=i.length-1;1<=o&&0<=s&&l[o]!==i[s];)s--;for(;1<=o&&0<=s;o--,s--)if(l[o]!==i[s]){if(o!==1||s!==1)do if(o--,s--,0>s||l[o]!==i[s]){var u=`
-`+l[o].replace(" at new "," at ");return e.displayName&&u.includes("<anonymous>")&&(u=u.replace("<anonymous>",e.displayName)),u}while(1<=o&&0<=s);break}}}finally{Gl=!1,Error.prepareStackTrace=n}return(e=e?e.displayName||e.name:"")?Vn(e):""}function gf(e){switch(e.tag){case 5:return Vn(e.type);case 16:return Vn("Lazy");case 13:return Vn("Suspense");case 19:return Vn("SuspenseList");case 0:case 2:case 15:return e=Xl(e.type,!1),e;case 11:return e=Xl(e.type.render,!1),e;case 1:return e=Xl(e.type,!0),e;default:return""}}function Si(e){if(e==null)return null;if(typeof e=="function")return e.displayName||e.name||null;if(typeof e=="string")return e;switch(e){case sn:return"Fragment";case on:return"Portal";case wi:return"Profiler";case wo:return"StrictMode";case xi:return"Suspense";case ki:return"SuspenseList"}if(typeof e=="object")switch(e.$$typeof){case Bu:return(e.displayName||"Context")+".Consumer";case $u:return(e._context.displayName||"Context")+".Provider";case xo:var t=e.render;return e=e.displayName,e||(e=t.displayName||t.name||"",e=e!==""?"ForwardRef("+e+")":"ForwardRef"),e;case ko:return t=e.displayName||null,t!==null?t:Si(e.type)||"Memo";case xt:t=e._payload,e=e._init;try{return Si(e(t))}catch{}}return null}function yf(e){var t=e.type;switch(e.tag){case 24:return"Cache";case 9:return(t.displayName||"Context")+".Consumer";case 10:return(t._context.displayName||"Context")+".Provider";case 18:return"DehydratedFragment";case 11:return e=t.render,e=e.displayName||e.name||"",t.displayName||(e!==""?"ForwardRef("+e+")":"ForwardRef");case 7:return"Fragment";case 5:return t;case 4:return"Portal";case 3:return"Root";case 6:return"Text";case 16:return Si(t);case 8:return t===wo?"StrictMode":"Mode";case 22:return"Offscreen";case 12:return"Profiler";case 21:return"Scope";case 13:return"Suspense";case 19:return"SuspenseList";case 25:return"TracingMarker";case 1:case 0:case 17:case 2:case 14:case 15:if(typeof t=="function")return t.displayName||t.name||null;if(typeof t=="string")return t}return null}function Rt(e){switch(typeof e){case"boolean":case"number":case"string":case"undefined":return e;case"object":return e;default:return""}}function Vu(e){var t=e.type;return(e=e.nodeName)&&e.toLowerCase()==="input"&&(t==="checkbox"||t==="radio")}function wf(e){var t=Vu(e)?"checked":"value",n=Object.getOwnPropertyDescriptor(e.constructor.prototype,t),r=""+e[t];if(!e.hasOwnProperty(t)&&typeof n<"u"&&typeof n.get=="function"&&typeof n.set=="function"){var l=n.get,i=n.set;return Object.defineProperty(e,t,{configurable:!0,get:function(){return l.call(this)},set:function(o){r=""+o,i.call(this,o)}}),Object.defineProperty(e,t,{enumerable:n.enumerable}),{getValue:function(){return r},setValue:function(o){r=""+o},stopTracking:function(){e._valueTracker=null,delete e[t]}}}}function Pr(e){e._valueTracker||(e._valueTracker=wf(e))}function Hu(e){if(!e)return!1;var t=e._valueTracker;if(!t)return!0;var n=t.getValue(),r="";return e&&(r=Vu(e)?e.checked?"true":"false":e.value),e=r,e!==n?(t.setValue(e),!0):!1}function tl(e){if(e=e||(typeof document<"u"?document:void 0),typeof e>"u")return null;try{return e.activeElement||e.body}catch{return e.body}}function Ei(e,t){var n=t.checked;return Z({},t,{defaultChecked:void 0,defaultValue:void 0,value:void 0,checked:n??e._wrapperState.initialChecked})}function ys(e,t){var n=t.defaultValue==null?"":t.defaultValue,r=t.checked!=null?t.checked:t.defaultChecked;n=Rt(t.value!=null?t.value:n),e._wrapperState={initialChecked:r,initialValue:n,controlled:t.type==="checkbox"||t.type==="radio"?t.checked!=null:t.value!=null}}function Qu(e,t){t=t.checked,t!=null&&yo(e,"checked",t,!1)}function Ni(e,t){Qu(e,t);var n=Rt(t.value),r=t.type;if(n!=null)r==="number"?(n===0&&e.value===""||e.value!=n)&&(e.value=""+n):e.value!==""+n&&(e.value=""+n);else if(r==="submit"||r==="reset"){e.removeAttribute("value");return}t.hasOwnProperty("value")?Ci(e,t.type,n):t.hasOwnProperty("defaultValue")&&Ci(e,t.type,Rt(t.defaultValue)),t.checked==null&&t.defaultChecked!=null&&(e.defaultChecked=!!t.defaultChecked)}function ws(e,t,n){if(t.hasOwnProperty("value")||t.hasOwnProperty("defaultValue")){var r=t.type;if(!(r!=="submit"&&r!=="reset"||t.value!==void 0&&t.value!==null))return;t=""+e._wrapperState.initialValue,n||t===e.value||(e.value=t),e.defaultValue=t}n=e.name,n!==""&&(e.name=""),e.defaultChecked=!!e._wrapperState.initialChecked,n!==""&&(e.name=n)}function Ci(e,t,n){(t!=="number"||tl(e.ownerDocument)!==e)&&(n==null?e.defaultValue=""+e._wrapperState.initialValue:e.defaultValue!==""+n&&(e.defaultValue=""+n))}var Hn=Array.isArray;function yn(e,t,n,r){if(e=e.options,t){t={};for(var l=0;l<n.length;l++)t["$"+n[l]]=!0;for(n=0;n<e.length;n++)l=t.hasOwnProperty("$"+e[n].value),e[n].selected!==l&&(e[n].selected=l),l&&r&&(e[n].defaultSelected=!0)}else{for(n=""+Rt(n),t=null,l=0;l<e.length;l++){if(e[l].value===n){e[l].selected=!0,r&&(e[l].defaultSelected=!0);return}t!==null||e[l].disabled||(t=e[l])}t!==null&&(t.selected=!0)}}function ji(e,t){if(t.dangerouslySetInnerHTML!=null)throw Error(w(91));return Z({},t,{value:void 0,defaultValue:void 0,children:""+e._wrapperState.initialValue})}function xs(e,t){var n=t.value;if(n==null){if(n=t.children,t=t.defaultValue,n!=null){if(t!=null)throw Error(w(92));if(Hn(n)){if(1<n.length)throw Error(w(93));n=n[0]}t=n}t==null&&(t=""),n=t}e._wrapperState={initialValue:Rt(n)}}function Ku(e,t){var n=Rt(t.value),r=Rt(t.defaultValue);n!=null&&(n=""+n,n!==e.value&&(e.value=n),t.defaultValue==null&&e.defaultValue!==n&&(e.defaultValue=n)),r!=null&&(e.defaultValue=""+r)}function ks(e){var t=e.textContent;t===e._wrapperState.initialValue&&t!==""&&t!==null&&(e.value=t)}function Yu(e){switch(e){case"svg":return"http://www.w3.org/2000/svg";case"math":return"http://www.w3.org/1998/Math/MathML";default:return"http://www.w3.org/1999/xhtml"}}function _i(e,t){return e==null||e==="http://www.w3.org/1999/xhtml"?Yu(t):e==="http://www.w3.org/2000/svg"&&t==="foreignObject"?"http://www.w3.org/1999/xhtml":e}var Lr,Gu=function(e){return typeof MSApp<"u"&&MSApp.execUnsafeLocalFunction?function(t,n,r,l){MSApp.execUnsafeLocalFunction(function(){return e(t,n,r,l)})}:e}(function(e,t){if(e.namespaceURI!=="http://www.w3.org/2000/svg"||"innerHTML"in e)e.innerHTML=t;else{for(Lr=Lr||document.createElement("div"),Lr.innerHTML="<svg>"+t.valueOf().toString()+"</svg>",t=Lr.firstChild;e.firstChild;)e.removeChild(e.firstChild);for(;t.firstChild;)e.appendChild(t.firstChild)}});function rr(e,t){if(t){var n=e.firstChild;if(n&&n===e.lastChild&&n.nodeType===3){n.nodeValue=t;return}}e.textContent=t}var Yn={animationIterationCount:!0,aspectRatio:!0,borderImageOutset:!0,borderImageSlice:!0,borderImageWidth:!0,boxFlex:!0,boxFlexGroup:!0,boxOrdinalGroup:!0,columnCount:!0,columns:!0,flex:!0,flexGrow:!0,flexPositive:!0,flexShrink:!0,flexNegative:!0,flexOrder:!0,gridArea:!0,gridRow:!0,gridRowEnd:!0,gridRowSpan:!0,gridRowStart:!0,gridColumn:!0,gridColumnEnd:!0,gridColumnSpan:!0,gridColumnStart:!0,fontWeight:!0,lineClamp:!0,lineHeight:!0,opacity:!0,order:!0,orphans:!0,tabSize:!0,widows:!0,zIndex:!0,zoom:!0,fillOpacity:!0,floodOpacity:!0,stopOpacity:!0,strokeDasharray:!0,strokeDashoffset:!0,strokeMiterlimit:!0,strokeOpacity:!0,strokeWidth:!0},xf=["Webkit","ms","Moz","O"];Object.keys(Yn).forEach(function(e){xf.forEach(function(t){t=t+e.charAt(0).toUpperCase()+e.substring(1),Yn[t]=Yn[e]})});function Xu(e,t,n){return t==null||typeof t=="boolean"||t===""?"":n||typeof t!="number"||t===0||Yn.hasOwnProperty(e)&&Yn[e]?(""+t).trim():t+"px"}function Zu(e,t){e=e.style;for(var n in t)if(t.hasOwnProperty(n)){var r=n.indexOf("--")===0,l=Xu(n,t[n],r);n==="float"&&(n="cssFloat"),r?e.setProperty(n,l):e[n]=l}}var kf=Z({menuitem:!0},{area:!0,base:!0,br:!0,col:!0,embed:!0,hr:!0,img:!0,input:!0,keygen:!0,link:!0,meta:!0,param:!0,source:!0,track:!0,wbr:!0});function Pi(e,t){if(t){if(kf[e]&&(t.children!=null||t.dangerouslySetInnerHTML!=null))throw Error(w(137,e));if(t.dangerouslySetInnerHTML!=null){if(t.children!=null)throw Error(w(60));if(typeof t.dangerouslySetInnerHTML!="object"||!("__html"in t.dangerouslySetInnerHTML))throw Error(w(61))}if(t.style!=null&&typeof t.style!="object")throw Error(w(62))}}function Li(e,t){if(e.indexOf("-")===-1)return typeof t.is=="string";switch(e){case"annotation-xml":case"color-profile":case"font-face":case"font-face-src":case"font-face-uri":case"font-face-format":case"font-face-name":case"missing-glyph":return!1;default:return!0}}var Ti=null;function So(e){return e=e.target||e.srcElement||window,e.correspondingUseElement&&(e=e.correspondingUseElement),e.nodeType===3?e.parentNode:e}var Ii=null,wn=null,xn=null;function Ss(e){if(e=Sr(e)){if(typeof Ii!="function")throw Error(w(280));var t=e.stateNode;t&&(t=Il(t),Ii(e.stateNode,e.type,t))}}function Ju(e){wn?xn?xn.push(e):xn=[e]:wn=e}function qu(){if(wn){var e=wn,t=xn;if(xn=wn=null,Ss(e),t)for(e=0;e<t.length;e++)Ss(t[e])}}function bu(e,t){return e(t)}function ea(){}var Zl=!1;function ta(e,t,n){if(Zl)return e(t,n);Zl=!0;try{return bu(e,t,n)}finally{Zl=!1,(wn!==null||xn!==null)&&(ea(),qu())}}function lr(e,t){var n=e.stateNode;if(n===null)return null;var r=Il(n);if(r===null)return null;n=r[t];e:switch(t){case"onClick":case"onClickCapture":case"onDoubleClick":case"onDoubleClickCapture":case"onMouseDown":case"onMouseDownCapture":case"onMouseMove":case"onMouseMoveCapture":case"onMouseUp":case"onMouseUpCapture":case"onMouseEnter":(r=!r.disabled)||(e=e.type,r=!(e==="button"||e==="input"||e==="select"||e==="textarea")),e=!r;break e;default:e=!1}if(e)return null;if(n&&typeof n!="function")throw Error(w(231,t,typeof n));return n}var zi=!1;if(ct)try{var On={};Object.defineProperty(On,"passive",{get:function(){zi=!0}}),window.addEventListener("test",On,On),window.removeEventListener("test",On,On)}catch{zi=!1}function Sf(e,t,n,r,l,i,o,s,u){var f=Array.prototype.slice.call(arguments,3);try{t.apply(n,f)}catch(h){this.onError(h)}}var Gn=!1,nl=null,rl=!1,Di=null,Ef={onError:function(e){Gn=!0,nl=e}};function Nf(e,t,n,r,l,i,o,s,u){Gn=!1,nl=null,Sf.apply(Ef,arguments)}function Cf(e,t,n,r,l,i,o,s,u){if(Nf.apply(this,arguments),Gn){if(Gn){var f=nl;Gn=!1,nl=null}else throw Error(w(198));rl||(rl=!0,Di=f)}}function nn(e){var t=e,n=e;if(e.alternate)for(;t.return;)t=t.return;else{e=t;do t=e,t.flags&4098&&(n=t.return),e=t.return;while(e)}return t.tag===3?n:null}function na(e){if(e.tag===13){var t=e.memoizedState;if(t===null&&(e=e.alternate,e!==null&&(t=e.memoizedState)),t!==null)return t.dehydrated}return null}function Es(e){if(nn(e)!==e)throw Error(w(188))}function jf(e){var t=e.alternate;if(!t){if(t=nn(e),t===null)throw Error(w(188));return t!==e?null:e}for(var n=e,r=t;;){var l=n.return;if(l===null)break;var i=l.alternate;if(i===null){if(r=l.return,r!==null){n=r;continue}break}if(l.child===i.child){for(i=l.child;i;){if(i===n)return Es(l),e;if(i===r)return Es(l),t;i=i.sibling}throw Error(w(188))}if(n.return!==r.return)n=l,r=i;else{for(var o=!1,s=l.child;s;){if(s===n){o=!0,n=l,r=i;break}if(s===r){o=!0,r=l,n=i;break}s=s.sibling}if(!o){for(s=i.child;s;){if(s===n){o=!0,n=i,r=l;break}if(s===r){o=!0,r=i,n=l;break}s=s.sibling}if(!o)throw Error(w(189))}}if(n.alternate!==r)throw Error(w(190))}if(n.tag!==3)throw Error(w(188));return n.stateNode.current===n?e:t}function ra(e){return e=jf(e),e!==null?la(e):null}function la(e){if(e.tag===5||e.tag===6)return e;for(e=e.child;e!==null;){var t=la(e);if(t!==null)return t;e=e.sibling}return null}var ia=ze.unstable_scheduleCallback,Ns=ze.unstable_cancelCallback,_f=ze.unstable_shouldYield,Pf=ze.unstable_requestPaint,b=ze.unstable_now,Lf=ze.unstable_getCurrentPriorityLevel,Eo=ze.unstable_ImmediatePriority,oa=ze.unstable_UserBlockingPriority,ll=ze.unstable_NormalPriority,Tf=ze.unstable_LowPriority,sa=ze.unstable_IdlePriority,_l=null,tt=null;function If(e){if(tt&&typeof tt.onCommitFiberRoot=="function")try{tt.onCommitFiberRoot(_l,e,void 0,(e.current.flags&128)===128)}catch{}}var Xe=Math.clz32?Math.clz32:Rf,zf=Math.log,Df=Math.LN2;function Rf(e){return e>>>=0,e===0?32:31-(zf(e)/Df|0)|0}var Tr=64,Ir=4194304;function Qn(e){switch(e&-e){case 1:return 1;case 2:return 2;case 4:return 4;case 8:return 8;case 16:return 16;case 32:return 32;case 64:case 128:case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:return e&4194240;case 4194304:case 8388608:case 16777216:case 33554432:case 67108864:return e&130023424;case 134217728:return 134217728;case 268435456:return 268435456;case 536870912:return 536870912;case 1073741824:return 1073741824;default:return e}}function il(e,t){var n=e.pendingLanes;if(n===0)return 0;var r=0,l=e.suspendedLanes,i=e.pingedLanes,o=n&268435455;if(o!==0){var s=o&~l;s!==0?r=Qn(s):(i&=o,i!==0&&(r=Qn(i)))}else o=n&~l,o!==0?r=Qn(o):i!==0&&(r=Qn(i));if(r===0)return 0;if(t!==0&&t!==r&&!(t&l)&&(l=r&-r,i=t&-t,l>=i||l===16&&(i&4194240)!==0))return t;if(r&4&&(r|=n&16),t=e.entangledLanes,t!==0)for(e=e.entanglements,t&=r;0<t;)n=31-Xe(t),l=1<<n,r|=e[n],t&=~l;return r}function Mf(e,t){switch(e){case 1:case 2:case 4:return t+250;case 8:case 16:case 32:case 64:case 128:case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:return t+5e3;case 4194304:case 8388608:case 16777216:case 33554432:case 67108864:return-1;case 134217728:case 268435456:case 536870912:case 1073741824:return-1;default:return-1}}function Of(e,t){for(var n=e.suspendedLanes,r=e.pingedLanes,l=e.expirationTimes,i=e.pendingLanes;0<i;){var o=31-Xe(i),s=1<<o,u=l[o];u===-1?(!(s&n)||s&r)&&(l[o]=Mf(s,t)):u<=t&&(e.expiredLanes|=s),i&=~s}}function Ri(e){return e=e.pendingLanes&-1073741825,e!==0?e:e&1073741824?1073741824:0}function ua(){var e=Tr;return Tr<<=1,!(Tr&4194240)&&(Tr=64),e}function Jl(e){for(var t=[],n=0;31>n;n++)t.push(e);return t}function xr(e,t,n){e.pendingLanes|=t,t!==536870912&&(e.suspendedLanes=0,e.pingedLanes=0),e=e.eventTimes,t=31-Xe(t),e[t]=n}function Ff(e,t){var n=e.pendingLanes&~t;e.pendingLanes=t,e.suspendedLanes=0,e.pingedLanes=0,e.expiredLanes&=t,e.mutableReadLanes&=t,e.entangledLanes&=t,t=e.entanglements;var r=e.eventTimes;for(e=e.expirationTimes;0<n;){var l=31-Xe(n),i=1<<l;t[l]=0,r[l]=-1,e[l]=-1,n&=~i}}function No(e,t){var n=e.entangledLanes|=t;for(e=e.entanglements;n;){var r=31-Xe(n),l=1<<r;l&t|e[r]&t&&(e[r]|=t),n&=~l}}var F=0;function aa(e){return e&=-e,1<e?4<e?e&268435455?16:536870912:4:1}var ca,Co,fa,da,pa,Mi=!1,zr=[],jt=null,_t=null,Pt=null,ir=new Map,or=new Map,St=[],Uf="mousedown mouseup touchcancel touchend touchstart auxclick dblclick pointercancel pointerdown pointerup dragend dragstart drop compositionend compositionstart keydown keypress keyup input textInput copy cut paste click change contextmenu reset submit".split(" ");function Cs(e,t){switch(e){case"focusin":case"focusout":jt=null;break;case"dragenter":case"dragleave":_t=null;break;case"mouseover":case"mouseout":Pt=null;break;case"pointerover":case"pointerout":ir.delete(t.pointerId);break;case"gotpointercapture":case"lostpointercapture":or.delete(t.pointerId)}}function Fn(e,t,n,r,l,i){return e===null||e.nativeEvent!==i?(e={blockedOn:t,domEventName:n,eventSystemFlags:r,nativeEvent:i,targetContainers:[l]},t!==null&&(t=Sr(t),t!==null&&Co(t)),e):(e.eventSystemFlags|=r,t=e.targetContainers,l!==null&&t.indexOf(l)===-1&&t.push(l),e)}function Af(e,t,n,r,l){switch(t){case"focusin":return jt=Fn(jt,e,t,n,r,l),!0;case"dragenter":return _t=Fn(_t,e,t,n,r,l),!0;case"mouseover":return Pt=Fn(Pt,e,t,n,r,l),!0;case"pointerover":var i=l.pointerId;return ir.set(i,Fn(ir.get(i)||null,e,t,n,r,l)),!0;case"gotpointercapture":return i=l.pointerId,or.set(i,Fn(or.get(i)||null,e,t,n,r,l)),!0}return!1}function ha(e){var t=Qt(e.target);if(t!==null){var n=nn(t);if(n!==null){if(t=n.tag,t===13){if(t=na(n),t!==null){e.blockedOn=t,pa(e.priority,function(){fa(n)});return}}else if(t===3&&n.stateNode.current.memoizedState.isDehydrated){e.blockedOn=n.tag===3?n.stateNode.containerInfo:null;return}}}e.blockedOn=null}function Qr(e){if(e.blockedOn!==null)return!1;for(var t=e.targetContainers;0<t.length;){var n=Oi(e.domEventName,e.eventSystemFlags,t[0],e.nativeEvent);if(n===null){n=e.nativeEvent;var r=new n.constructor(n.type,n);Ti=r,n.target.dispatchEvent(r),Ti=null}else return t=Sr(n),t!==null&&Co(t),e.blockedOn=n,!1;t.shift()}return!0}function js(e,t,n){Qr(e)&&n.delete(t)}function $f(){Mi=!1,jt!==null&&Qr(jt)&&(jt=null),_t!==null&&Qr(_t)&&(_t=null),Pt!==null&&Qr(Pt)&&(Pt=null),ir.forEach(js),or.forEach(js)}function Un(e,t){e.blockedOn===t&&(e.blockedOn=null,Mi||(Mi=!0,ze.unstable_scheduleCallback(ze.unstable_NormalPriority,$f)))}function sr(e){function t(l){return Un(l,e)}if(0<zr.length){Un(zr[0],e);for(var n=1;n<zr.length;n++){var r=zr[n];r.blockedOn===e&&(r.blockedOn=null)}}for(jt!==null&&Un(jt,e),_t!==null&&Un(_t,e),Pt!==null&&Un(Pt,e),ir.forEach(t),or.forEach(t),n=0;n<St.length;n++)r=St[n],r.blockedOn===e&&(r.blockedOn=null);for(;0<St.length&&(n=St[0],n.blockedOn===null);)ha(n),n.blockedOn===null&&St.shift()}var kn=ht.ReactCurrentBatchConfig,ol=!0;function Bf(e,t,n,r){var l=F,i=kn.transition;kn.transition=null;try{F=1,jo(e,t,n,r)}finally{F=l,kn.transition=i}}function Wf(e,t,n,r){var l=F,i=kn.transition;kn.transition=null;try{F=4,jo(e,t,n,r)}finally{F=l,kn.transition=i}}function jo(e,t,n,r){if(ol){var l=Oi(e,t,n,r);if(l===null)si(e,t,r,sl,n),Cs(e,r);else if(Af(l,e,t,n,r))r.stopPropagation();else if(Cs(e,r),t&4&&-1<Uf.indexOf(e)){for(;l!==null;){var i=Sr(l);if(i!==null&&ca(i),i=Oi(e,t,n,r),i===null&&si(e,t,r,sl,n),i===l)break;l=i}l!==null&&r.stopPropagation()}else si(e,t,r,null,n)}}var sl=null;function Oi(e,t,n,r){if(sl=null,e=So(r),e=Qt(e),e!==null)if(t=nn(e),t===null)e=null;else if(n=t.tag,n===13){if(e=na(t),e!==null)return e;e=null}else if(n===3){if(t.stateNode.current.memoizedState.isDehydrated)return t.tag===3?t.stateNode.containerInfo:null;e=null}else t!==e&&(e=null);return sl=e,null}function ma(e){switch(e){case"cancel":case"click":case"close":case"contextmenu":case"copy":case"cut":case"auxclick":case"dblclick":case"dragend":case"dragstart":case"drop":case"focusin":case"focusout":case"input":case"invalid":case"keydown":case"keypress":case"keyup":case"mousedown":case"mouseup":case"paste":case"pause":case"play":case"pointercancel":case"pointerdown":case"pointerup":case"ratechange":case"reset":case"resize":case"seeked":case"submit":case"touchcancel":case"touchend":case"touchstart":case"volumechange":case"change":case"selectionchange":case"textInput":case"compositionstart":case"compositionend":case"compositionupdate":case"beforeblur":case"afterblur":case"beforeinput":case"blur":case"fullscreenchange":case"focus":case"hashchange":case"popstate":case"select":case"selectstart":return 1;case"drag":case"dragenter":case"dragexit":case"dragleave":case"dragover":case"mousemove":case"mouseout":case"mouseover":case"pointermove":case"pointerout":case"pointerover":case"scroll":case"toggle":case"touchmove":case"wheel":case"mouseenter":case"mouseleave":case"pointerenter":case"pointerleave":return 4;case"message":switch(Lf()){case Eo:return 1;case oa:return 4;case ll:case Tf:return 16;case sa:return 536870912;default:return 16}default:return 16}}var Nt=null,_o=null,Kr=null;function va(){if(Kr)return Kr;var e,t=_o,n=t.length,r,l="value"in Nt?Nt.value:Nt.textContent,i=l.length;for(e=0;e<n&&t[e]===l[e];e++);var o=n-e;for(r=1;r<=o&&t[n-r]===l[i-r];r++);return Kr=l.slice(e,1<r?1-r:void 0)}function Yr(e){var t=e.keyCode;return"charCode"in e?(e=e.charCode,e===0&&t===13&&(e=13)):e=t,e===10&&(e=13),32<=e||e===13?e:0}function Dr(){return!0}function _s(){return!1}function Re(e){function t(n,r,l,i,o){this._reactName=n,this._targetInst=l,this.type=r,this.nativeEvent=i,this.target=o,this.currentTarget=null;for(var s in e)e.hasOwnProperty(s)&&(n=e[s],this[s]=n?n(i):i[s]);return this.isDefaultPrevented=(i.defaultPrevented!=null?i.defaultPrevented:i.returnValue===!1)?Dr:_s,this.isPropagationStopped=_s,this}return Z(t.prototype,{preventDefault:function(){this.defaultPrevented=!0;var n=this.nativeEvent;n&&(n.preventDefault?n.preventDefault():typeof n.returnValue!="unknown"&&(n.returnValue=!1),this.isDefaultPrevented=Dr)},stopPropagation:function(){var n=this.nativeEvent;n&&(n.stopPropagation?n.stopPropagation():typeof n.cancelBubble!="unknown"&&(n.cancelBubble=!0),this.isPropagationStopped=Dr)},persist:function(){},isPersistent:Dr}),t}var zn={eventPhase:0,bubbles:0,cancelable:0,timeStamp:function(e){return e.timeStamp||Date.now()},defaultPrevented:0,isTrusted:0},Po=Re(zn),kr=Z({},zn,{view:0,detail:0}),Vf=Re(kr),ql,bl,An,Pl=Z({},kr,{screenX:0,screenY:0,clientX:0,clientY:0,pageX:0,pageY:0,ctrlKey:0,shiftKey:0,altKey:0,metaKey:0,getModifierState:Lo,button:0,buttons:0,relatedTarget:function(e){return e.relatedTarget===void 0?e.fromElement===e.srcElement?e.toElement:e.fromElement:e.relatedTarget},movementX:function(e){return"movementX"in e?e.movementX:(e!==An&&(An&&e.type==="mousemove"?(ql=e.screenX-An.screenX,bl=e.screenY-An.screenY):bl=ql=0,An=e),ql)},movementY:function(e){return"movementY"in e?e.movementY:bl}}),Ps=Re(Pl),Hf=Z({},Pl,{dataTransfer:0}),Qf=Re(Hf),Kf=Z({},kr,{relatedTarget:0}),ei=Re(Kf),Yf=Z({},zn,{animationName:0,elapsedTime:0,pseudoElement:0}),Gf=Re(Yf),Xf=Z({},zn,{clipboardData:function(e){return"clipboardData"in e?e.clipboardData:window.clipboardData}}),Zf=Re(Xf),Jf=Z({},zn,{data:0}),Ls=Re(Jf),qf={Esc:"Escape",Spacebar:" ",Left:"ArrowLeft",Up:"ArrowUp",Right:"ArrowRight",Down:"ArrowDown",Del:"Delete",Win:"OS",Menu:"ContextMenu",Apps:"ContextMenu",Scroll:"ScrollLock",MozPrintableKey:"Unidentified"},bf={8:"Backspace",9:"Tab",12:"Clear",13:"Enter",16:"Shift",17:"Control",18:"Alt",19:"Pause",20:"CapsLock",27:"Escape",32:" ",33:"PageUp",34:"PageDown",35:"End",36:"Home",37:"ArrowLeft",38:"ArrowUp",39:"ArrowRight",40:"ArrowDown",45:"Insert",46:"Delete",112:"F1",113:"F2",114:"F3",115:"F4",116:"F5",117:"F6",118:"F7",119:"F8",120:"F9",121:"F10",122:"F11",123:"F12",144:"NumLock",145:"ScrollLock",224:"Meta"},ed={Alt:"altKey",Control:"ctrlKey",Meta:"metaKey",Shift:"shiftKey"};function td(e){var t=this.nativeEvent;return t.getModifierState?t.getModifierState(e):(e=ed[e])?!!t[e]:!1}function Lo(){return td}var nd=Z({},kr,{key:function(e){if(e.key){var t=qf[e.key]||e.key;if(t!=="Unidentified")return t}return e.type==="keypress"?(e=Yr(e),e===13?"Enter":String.fromCharCode(e)):e.type==="keydown"||e.type==="keyup"?bf[e.keyCode]||"Unidentified":""},code:0,location:0,ctrlKey:0,shiftKey:0,altKey:0,metaKey:0,repeat:0,locale:0,getModifierState:Lo,charCode:function(e){return e.type==="keypress"?Yr(e):0},keyCode:function(e){return e.type==="keydown"||e.type==="keyup"?e.keyCode:0},which:function(e){return e.type==="keypress"?Yr(e):e.type==="keydown"||e.type==="keyup"?e.keyCode:0}}),rd=Re(nd),ld=Z({},Pl,{pointerId:0,width:0,height:0,pressure:0,tangentialPressure:0,tiltX:0,tiltY:0,twist:0,pointerType:0,isPrimary:0}),Ts=Re(ld),id=Z({},kr,{touches:0,targetTouches:0,changedTouches:0,altKey:0,metaKey:0,ctrlKey:0,shiftKey:0,getModifierState:Lo}),od=Re(id),sd=Z({},zn,{propertyName:0,elapsedTime:0,pseudoElement:0}),ud=Re(sd),ad=Z({},Pl,{deltaX:function(e){return"deltaX"in e?e.deltaX:"wheelDeltaX"in e?-e.wheelDeltaX:0},deltaY:function(e){return"deltaY"in e?e.deltaY:"wheelDeltaY"in e?-e.wheelDeltaY:"wheelDelta"in e?-e.wheelDelta:0},deltaZ:0,deltaMode:0}),cd=Re(ad),fd=[9,13,27,32],To=ct&&"CompositionEvent"in window,Xn=null;ct&&"documentMode"in document&&(Xn=document.documentMode);var dd=ct&&"TextEvent"in window&&!Xn,ga=ct&&(!To||Xn&&8<Xn&&11>=Xn),Is=" ",zs=!1;function ya(e,t){switch(e){case"keyup":return fd.indexOf(t.keyCode)!==-1;case"keydown":return t.keyCode!==229;case"keypress":case"mousedown":case"focusout":return!0;default:return!1}}function wa(e){return e=e.detail,typeof e=="object"&&"data"in e?e.data:null}var un=!1;function pd(e,t){switch(e){case"compositionend":return wa(t);case"keypress":return t.which!==32?null:(zs=!0,Is);case"textInput":return e=t.data,e===Is&&zs?null:e;default:return null}}function hd(e,t){if(un)return e==="compositionend"||!To&&ya(e,t)?(e=va(),Kr=_o=Nt=null,un=!1,e):null;switch(e){case"paste":return null;case"keypress":if(!(t.ctrlKey||t.altKey||t.metaKey)||t.ctrlKey&&t.altKey){if(t.char&&1<t.char.length)return t.char;if(t.which)return String.fromCharCode(t.which)}return null;case"compositionend":return ga&&t.locale!=="ko"?null:t.data;default:return null}}var md={color:!0,date:!0,datetime:!0,"datetime-local":!0,email:!0,month:!0,number:!0,password:!0,range:!0,search:!0,tel:!0,text:!0,time:!0,url:!0,week:!0};function Ds(e){var t=e&&e.nodeName&&e.nodeName.toLowerCase();return t==="input"?!!md[e.type]:t==="textarea"}function xa(e,t,n,r){Ju(r),t=ul(t,"onChange"),0<t.length&&(n=new Po("onChange","change",null,n,r),e.push({event:n,listeners:t}))}var Zn=null,ur=null;function vd(e){Ia(e,0)}function Ll(e){var t=fn(e);if(Hu(t))return e}function gd(e,t){if(e==="change")return t}var ka=!1;if(ct){var ti;if(ct){var ni="oninput"in document;if(!ni){var Rs=document.createElement("div");Rs.setAttribute("oninput","return;"),ni=typeof Rs.oninput=="function"}ti=ni}else ti=!1;ka=ti&&(!document.documentMode||9<document.documentMode)}function Ms(){Zn&&(Zn.detachEvent("onpropertychange",Sa),ur=Zn=null)}function Sa(e){if(e.propertyName==="value"&&Ll(ur)){var t=[];xa(t,ur,e,So(e)),ta(vd,t)}}function yd(e,t,n){e==="focusin"?(Ms(),Zn=t,ur=n,Zn.attachEvent("onpropertychange",Sa)):e==="focusout"&&Ms()}function wd(e){if(e==="selectionchange"||e==="keyup"||e==="keydown")return Ll(ur)}function xd(e,t){if(e==="click")return Ll(t)}function kd(e,t){if(e==="input"||e==="change")return Ll(t)}function Sd(e,t){return e===t&&(e!==0||1/e===1/t)||e!==e&&t!==t}var Je=typeof Object.is=="function"?Object.is:Sd;function ar(e,t){if(Je(e,t))return!0;if(typeof e!="object"||e===null||typeof t!="object"||t===null)return!1;var n=Object.keys(e),r=Object.keys(t);if(n.length!==r.length)return!1;for(r=0;r<n.length;r++){var l=n[r];if(!yi.call(t,l)||!Je(e[l],t[l]))return!1}return!0}function Os(e){for(;e&&e.firstChild;)e=e.firstChild;return e}function Fs(e,t){var n=Os(e);e=0;for(var r;n;){if(n.nodeType===3){if(r=e+n.textContent.length,e<=t&&r>=t)return{node:n,offset:t-e};e=r}e:{for(;n;){if(n.nextSibling){n=n.nextSibling;break e}n=n.parentNode}n=void 0}n=Os(n)}}function Ea(e,t){return e&&t?e===t?!0:e&&e.nodeType===3?!1:t&&t.nodeType===3?Ea(e,t.parentNode):"contains"in e?e.contains(t):e.compareDocumentPosition?!!(e.compareDocumentPosition(t)&16):!1:!1}function Na(){for(var e=window,t=tl();t instanceof e.HTMLIFrameElement;){try{var n=typeof t.contentWindow.location.href=="string"}catch{n=!1}if(n)e=t.contentWindow;else break;t=tl(e.document)}return t}function Io(e){var t=e&&e.nodeName&&e.nodeName.toLowerCase();return t&&(t==="input"&&(e.type==="text"||e.type==="search"||e.type==="tel"||e.type==="url"||e.type==="password")||t==="textarea"||e.contentEditable==="true")}function Ed(e){var t=Na(),n=e.focusedElem,r=e.selectionRange;if(t!==n&&n&&n.ownerDocument&&Ea(n.ownerDocument.documentElement,n)){if(r!==null&&Io(n)){if(t=r.start,e=r.end,e===void 0&&(e=t),"selectionStart"in n)n.selectionStart=t,n.selectionEnd=Math.min(e,n.value.length);else if(e=(t=n.ownerDocument||document)&&t.defaultView||window,e.getSelection){e=e.getSelection();var l=n.textContent.length,i=Math.min(r.start,l);r=r.end===void 0?i:Math.min(r.end,l),!e.extend&&i>r&&(l=r,r=i,i=l),l=Fs(n,i);var o=Fs(n,r);l&&o&&(e.rangeCount!==1||e.anchorNode!==l.node||e.anchorOffset!==l.offset||e.focusNode!==o.node||e.focusOffset!==o.offset)&&(t=t.createRange(),t.setStart(l.node,l.offset),e.removeAllRanges(),i>r?(e.addRange(t),e.extend(o.node,o.offset)):(t.setEnd(o.node,o.offset),e.addRange(t)))}}for(t=[],e=n;e=e.parentNode;)e.nodeType===1&&t.push({element:e,left:e.scrollLeft,top:e.scrollTop});for(typeof n.focus=="function"&&n.focus(),n=0;n<t.length;n++)e=t[n],e.element.scrollLeft=e.left,e.element.scrollTop=e.top}}var Nd=ct&&"documentMode"in document&&11>=document.documentMode,an=null,Fi=null,Jn=null,Ui=!1;function Us(e,t,n){var r=n.window===n?n.document:n.nodeType===9?n:n.ownerDocument;Ui||an==null||an!==tl(r)||(r=an,"selectionStart"in r&&Io(r)?r={start:r.selectionStart,end:r.selectionEnd}:(r=(r.ownerDocument&&r.ownerDocument.defaultView||window).getSelection(),r={anchorNode:r.anchorNode,anchorOffset:r.anchorOffset,focusNode:r.focusNode,focusOffset:r.focusOffset}),Jn&&ar(Jn,r)||(Jn=r,r=ul(Fi,"onSelect"),0<r.length&&(t=new Po("onSelect","select",null,t,n),e.push({event:t,listeners:r}),t.target=an)))}function Rr(e,t){var n={};return n[e.toLowerCase()]=t.toLowerCase(),n["Webkit"+e]="webkit"+t,n["Moz"+e]="moz"+t,n}var cn={animationend:Rr("Animation","AnimationEnd"),animationiteration:Rr("Animation","AnimationIteration"),animationstart:Rr("Animation","AnimationStart"),transitionend:Rr("Transition","TransitionEnd")},ri={},Ca={};ct&&(Ca=document.createElement("div").style,"AnimationEvent"in window||(delete cn.animationend.animation,delete cn.animationiteration.animation,delete cn.animationstart.animation),"TransitionEvent"in window||delete cn.transitionend.transition);function Tl(e){if(ri[e])return ri[e];if(!cn[e])return e;var t=cn[e],n;for(n in t)if(t.hasOwnProperty(n)&&n in Ca)return ri[e]=t[n];return e}var ja=Tl("animationend"),_a=Tl("animationiteration"),Pa=Tl("animationstart"),La=Tl("transitionend"),Ta=new Map,As="abort auxClick cancel canPlay canPlayThrough click close contextMenu copy cut drag dragEnd dragEnter dragExit dragLeave dragOver dragStart drop durationChange emptied encrypted ended error gotPointerCapture input invalid keyDown keyPress keyUp load loadedData loadedMetadata loadStart lostPointerCapture mouseDown mouseMove mouseOut mouseOver mouseUp paste pause play playing pointerCancel pointerDown pointerMove pointerOut pointerOver pointerUp progress rateChange reset resize seeked seeking stalled submit suspend timeUpdate touchCancel touchEnd touchStart volumeChange scroll toggle touchMove waiting wheel".split(" ");function Ot(e,t){Ta.set(e,t),tn(t,[e])}for(var li=0;li<As.length;li++){var ii=As[li],Cd=ii.toLowerCase(),jd=ii[0].toUpperCase()+ii.slice(1);Ot(Cd,"on"+jd)}Ot(ja,"onAnimationEnd");Ot(_a,"onAnimationIteration");Ot(Pa,"onAnimationStart");Ot("dblclick","onDoubleClick");Ot("focusin","onFocus");Ot("focusout","onBlur");Ot(La,"onTransitionEnd");Nn("onMouseEnter",["mouseout","mouseover"]);Nn("onMouseLeave",["mouseout","mouseover"]);Nn("onPointerEnter",["pointerout","pointerover"]);Nn("onPointerLeave",["pointerout","pointerover"]);tn("onChange","change click focusin focusout input keydown keyup selectionchange".split(" "));tn("onSelect","focusout contextmenu dragend focusin keydown keyup mousedown mouseup selectionchange".split(" "));tn("onBeforeInput",["compositionend","keypress","textInput","paste"]);tn("onCompositionEnd","compositionend focusout keydown keypress keyup mousedown".split(" "));tn("onCompositionStart","compositionstart focusout keydown keypress keyup mousedown".split(" "));tn("onCompositionUpdate","compositionupdate focusout keydown keypress keyup mousedown".split(" "));var Kn="abort canplay canplaythrough durationchange emptied encrypted ended error loadeddata loadedmetadata loadstart pause play playing progress ratechange resize seeked seeking stalled suspend timeupdate volumechange waiting".split(" "),_d=new Set("cancel close invalid load scroll toggle".split(" ").concat(Kn));function $s(e,t,n){var r=e.type||"unknown-event";e.currentTarget=n,Cf(r,t,void 0,e),e.currentTarget=null}function Ia(e,t){t=(t&4)!==0;for(var n=0;n<e.length;n++){var r=e[n],l=r.event;r=r.listeners;e:{var i=void 0;if(t)for(var o=r.length-1;0<=o;o--){var s=r[o],u=s.instance,f=s.currentTarget;if(s=s.listener,u!==i&&l.isPropagationStopped())break e;$s(l,s,f),i=u}else for(o=0;o<r.length;o++){if(s=r[o],u=s.instance,f=s.currentTarget,s=s.listener,u!==i&&l.isPropagationStopped())break e;$s(l,s,f),i=u}}}if(rl)throw e=Di,rl=!1,Di=null,e}function W(e,t){var n=t[Vi];n===void 0&&(n=t[Vi]=new Set);var r=e+"__bubble";n.has(r)||(za(t,e,2,!1),n.add(r))}function oi(e,t,n){var r=0;t&&(r|=4),za(n,e,r,t)}var Mr="_reactListening"+Math.random().toString(36).slice(2);function cr(e){if(!e[Mr]){e[Mr]=!0,Au.forEach(function(n){n!=="selectionchange"&&(_d.has(n)||oi(n,!1,e),oi(n,!0,e))});var t=e.nodeType===9?e:e.ownerDocument;t===null||t[Mr]||(t[Mr]=!0,oi("selectionchange",!1,t))}}function za(e,t,n,r){switch(ma(t)){case 1:var l=Bf;break;case 4:l=Wf;break;default:l=jo}n=l.bind(null,t,n,e),l=void 0,!zi||t!=="touchstart"&&t!=="touchmove"&&t!=="wheel"||(l=!0),r?l!==void 0?e.addEventListener(t,n,{capture:!0,passive:l}):e.addEventListener(t,n,!0):l!==void 0?e.addEventListener(t,n,{passive:l}):e.addEventListener(t,n,!1)}function si(e,t,n,r,l){var i=r;if(!(t&1)&&!(t&2)&&r!==null)e:for(;;){if(r===null)return;var o=r.tag;if(o===3||o===4){var s=r.stateNode.containerInfo;if(s===l||s.nodeType===8&&s.parentNode===l)break;if(o===4)for(o=r.return;o!==null;){var u=o.tag;if((u===3||u===4)&&(u=o.stateNode.containerInfo,u===l||u.nodeType===8&&u.parentNode===l))return;o=o.return}for(;s!==null;){if(o=Qt(s),o===null)return;if(u=o.tag,u===5||u===6){r=i=o;continue e}s=s.parentNode}}r=r.return}ta(function(){var f=i,h=So(n),g=[];e:{var m=Ta.get(e);if(m!==void 0){var x=Po,k=e;switch(e){case"keypress":if(Yr(n)===0)break e;case"keydown":case"keyup":x=rd;break;case"focusin":k="focus",x=ei;break;case"focusout":k="blur",x=ei;break;case"beforeblur":case"afterblur":x=ei;break;case"click":if(n.button===2)break e;case"auxclick":case"dblclick":case"mousedown":case"mousemove":case"mouseup":case"mouseout":case"mouseover":case"contextmenu":x=Ps;break;case"drag":case"dragend":case"dragenter":case"dragexit":case"dragleave":case"dragover":case"dragstart":case"drop":x=Qf;break;case"touchcancel":case"touchend":case"touchmove":case"touchstart":x=od;break;case ja:case _a:case Pa:x=Gf;break;case La:x=ud;break;case"scroll":x=Vf;break;case"wheel":x=cd;break;case"copy":case"cut":case"paste":x=Zf;break;case"gotpointercapture":case"lostpointercapture":case"pointercancel":case"pointerdown":case"pointermove":case"pointerout":case"pointerover":case"pointerup":x=Ts}var S=(t&4)!==0,O=!S&&e==="scroll",d=S?m!==null?m+"Capture":null:m;S=[];for(var c=f,p;c!==null;){p=c;var y=p.stateNode;if(p.tag===5&&y!==null&&(p=y,d!==null&&(y=lr(c,d),y!=null&&S.push(fr(c,y,p)))),O)break;c=c.return}0<S.length&&(m=new x(m,k,null,n,h),g.push({event:m,listeners:S}))}}if(!(t&7)){e:{if(m=e==="mouseover"||e==="pointerover",x=e==="mouseout"||e==="pointerout",m&&n!==Ti&&(k=n.relatedTarget||n.fromElement)&&(Qt(k)||k[ft]))break e;if((x||m)&&(m=h.window===h?h:(m=h.ownerDocument)?m.defaultView||m.parentWindow:window,x?(k=n.relatedTarget||n.toElement,x=f,k=k?Qt(k):null,k!==null&&(O=nn(k),k!==O||k.tag!==5&&k.tag!==6)&&(k=null)):(x=null,k=f),x!==k)){if(S=Ps,y="onMouseLeave",d="onMouseEnter",c="mouse",(e==="pointerout"||e==="pointerover")&&(S=Ts,y="onPointerLeave",d="onPointerEnter",c="pointer"),O=x==null?m:fn(x),p=k==null?m:fn(k),m=new S(y,c+"leave",x,n,h),m.target=O,m.relatedTarget=p,y=null,Qt(h)===f&&(S=new S(d,c+"enter",k,n,h),S.target=p,S.relatedTarget=O,y=S),O=y,x&&k)t:{for(S=x,d=k,c=0,p=S;p;p=ln(p))c++;for(p=0,y=d;y;y=ln(y))p++;for(;0<c-p;)S=ln(S),c--;for(;0<p-c;)d=ln(d),p--;for(;c--;){if(S===d||d!==null&&S===d.alternate)break t;S=ln(S),d=ln(d)}S=null}else S=null;x!==null&&Bs(g,m,x,S,!1),k!==null&&O!==null&&Bs(g,O,k,S,!0)}}e:{if(m=f?fn(f):window,x=m.nodeName&&m.nodeName.toLowerCase(),x==="select"||x==="input"&&m.type==="file")var E=gd;else if(Ds(m))if(ka)E=kd;else{E=wd;var _=yd}else(x=m.nodeName)&&x.toLowerCase()==="input"&&(m.type==="checkbox"||m.type==="radio")&&(E=xd);if(E&&(E=E(e,f))){xa(g,E,n,h);break e}_&&_(e,m,f),e==="focusout"&&(_=m._wrapperState)&&_.controlled&&m.type==="number"&&Ci(m,"number",m.value)}switch(_=f?fn(f):window,e){case"focusin":(Ds(_)||_.contentEditable==="true")&&(an=_,Fi=f,Jn=null);break;case"focusout":Jn=Fi=an=null;break;case"mousedown":Ui=!0;break;case"contextmenu":case"mouseup":case"dragend":Ui=!1,Us(g,n,h);break;case"selectionchange":if(Nd)break;case"keydown":case"keyup":Us(g,n,h)}var C;if(To)e:{switch(e){case"compositionstart":var P="onCompositionStart";break e;case"compositionend":P="onCompositionEnd";break e;case"compositionupdate":P="onCompositionUpdate";break e}P=void 0}else un?ya(e,n)&&(P="onCompositionEnd"):e==="keydown"&&n.keyCode===229&&(P="onCompositionStart");P&&(ga&&n.locale!=="ko"&&(un||P!=="onCompositionStart"?P==="onCompositionEnd"&&un&&(C=va()):(Nt=h,_o="value"in Nt?Nt.value:Nt.textContent,un=!0)),_=ul(f,P),0<_.length&&(P=new Ls(P,e,null,n,h),g.push({event:P,listeners:_}),C?P.data=C:(C=wa(n),C!==null&&(P.data=C)))),(C=dd?pd(e,n):hd(e,n))&&(f=ul(f,"onBeforeInput"),0<f.length&&(h=new Ls("onBeforeInput","beforeinput",null,n,h),g.push({event:h,listeners:f}),h.data=C))}Ia(g,t)})}function fr(e,t,n){return{instance:e,listener:t,currentTarget:n}}function ul(e,t){for(var n=t+"Capture",r=[];e!==null;){var l=e,i=l.stateNode;l.tag===5&&i!==null&&(l=i,i=lr(e,n),i!=null&&r.unshift(fr(e,i,l)),i=lr(e,t),i!=null&&r.push(fr(e,i,l))),e=e.return}return r}function ln(e){if(e===null)return null;do e=e.return;while(e&&e.tag!==5);return e||null}function Bs(e,t,n,r,l){for(var i=t._reactName,o=[];n!==null&&n!==r;){var s=n,u=s.alternate,f=s.stateNode;if(u!==null&&u===r)break;s.tag===5&&f!==null&&(s=f,l?(u=lr(n,i),u!=null&&o.unshift(fr(n,u,s))):l||(u=lr(n,i),u!=null&&o.push(fr(n,u,s)))),n=n.return}o.length!==0&&e.push({event:t,listeners:o})}var Pd=/\r\n?/g,Ld=/\u0000|\uFFFD/g;function Ws(e){return(typeof e=="string"?e:""+e).replace(Pd,`
-`).replace(Ld,"")}function Or(e,t,n){if(t=Ws(t),Ws(e)!==t&&n)throw Error(w(425))}function al(){}var Ai=null,$i=null;function Bi(e,t){return e==="textarea"||e==="noscript"||typeof t.children=="string"||typeof t.children=="number"||typeof t.dangerouslySetInnerHTML=="object"&&t.dangerouslySetInnerHTML!==null&&t.dangerouslySetInnerHTML.__html!=null}var Wi=typeof setTimeout=="function"?setTimeout:void 0,Td=typeof clearTimeout=="function"?clearTimeout:void 0,Vs=typeof Promise=="function"?Promise:void 0,Id=typeof queueMicrotask=="function"?queueMicrotask:typeof Vs<"u"?function(e){return Vs.resolve(null).then(e).catch(zd)}:Wi;function zd(e){setTimeout(function(){throw e})}function ui(e,t){var n=t,r=0;do{var l=n.nextSibling;if(e.removeChild(n),l&&l.nodeType===8)if(n=l.data,n==="/$"){if(r===0){e.removeChild(l),sr(t);return}r--}else n!=="$"&&n!=="$?"&&n!=="$!"||r++;n=l}while(n);sr(t)}function Lt(e){for(;e!=null;e=e.nextSibling){var t=e.nodeType;if(t===1||t===3)break;if(t===8){if(t=e.data,t==="$"||t==="$!"||t==="$?")break;if(t==="/$")return null}}return e}function Hs(e){e=e.previousSibling;for(var t=0;e;){if(e.nodeType===8){var n=e.data;if(n==="$"||n==="$!"||n==="$?"){if(t===0)return e;t--}else n==="/$"&&t++}e=e.previousSibling}return null}var Dn=Math.random().toString(36).slice(2),et="__reactFiber$"+Dn,dr="__reactProps$"+Dn,ft="__reactContainer$"+Dn,Vi="__reactEvents$"+Dn,Dd="__reactListeners$"+Dn,Rd="__reactHandles$"+Dn;function Qt(e){var t=e[et];if(t)return t;for(var n=e.parentNode;n;){if(t=n[ft]||n[et]){if(n=t.alternate,t.child!==null||n!==null&&n.child!==null)for(e=Hs(e);e!==null;){if(n=e[et])return n;e=Hs(e)}return t}e=n,n=e.parentNode}return null}function Sr(e){return e=e[et]||e[ft],!e||e.tag!==5&&e.tag!==6&&e.tag!==13&&e.tag!==3?null:e}function fn(e){if(e.tag===5||e.tag===6)return e.stateNode;throw Error(w(33))}function Il(e){return e[dr]||null}var Hi=[],dn=-1;function Ft(e){return{current:e}}function V(e){0>dn||(e.current=Hi[dn],Hi[dn]=null,dn--)}function A(e,t){dn++,Hi[dn]=e.current,e.current=t}var Mt={},ye=Ft(Mt),Ce=Ft(!1),Zt=Mt;function Cn(e,t){var n=e.type.contextTypes;if(!n)return Mt;var r=e.stateNode;if(r&&r.__reactInternalMemoizedUnmaskedChildContext===t)return r.__reactInternalMemoizedMaskedChildContext;var l={},i;for(i in n)l[i]=t[i];return r&&(e=e.stateNode,e.__reactInternalMemoizedUnmaskedChildContext=t,e.__reactInternalMemoizedMaskedChildContext=l),l}function je(e){return e=e.childContextTypes,e!=null}function cl(){V(Ce),V(ye)}function Qs(e,t,n){if(ye.current!==Mt)throw Error(w(168));A(ye,t),A(Ce,n)}function Da(e,t,n){var r=e.stateNode;if(t=t.childContextTypes,typeof r.getChildContext!="function")return n;r=r.getChildContext();for(var l in r)if(!(l in t))throw Error(w(108,yf(e)||"Unknown",l));return Z({},n,r)}function fl(e){return e=(e=e.stateNode)&&e.__reactInternalMemoizedMergedChildContext||Mt,Zt=ye.current,A(ye,e),A(Ce,Ce.current),!0}function Ks(e,t,n){var r=e.stateNode;if(!r)throw Error(w(169));n?(e=Da(e,t,Zt),r.__reactInternalMemoizedMergedChildContext=e,V(Ce),V(ye),A(ye,e)):V(Ce),A(Ce,n)}var ot=null,zl=!1,ai=!1;function Ra(e){ot===null?ot=[e]:ot.push(e)}function Md(e){zl=!0,Ra(e)}function Ut(){if(!ai&&ot!==null){ai=!0;var e=0,t=F;try{var n=ot;for(F=1;e<n.length;e++){var r=n[e];do r=r(!0);while(r!==null)}ot=null,zl=!1}catch(l){throw ot!==null&&(ot=ot.slice(e+1)),ia(Eo,Ut),l}finally{F=t,ai=!1}}return null}var pn=[],hn=0,dl=null,pl=0,Fe=[],Ue=0,Jt=null,st=1,ut="";function Vt(e,t){pn[hn++]=pl,pn[hn++]=dl,dl=e,pl=t}function Ma(e,t,n){Fe[Ue++]=st,Fe[Ue++]=ut,Fe[Ue++]=Jt,Jt=e;var r=st;e=ut;var l=32-Xe(r)-1;r&=~(1<<l),n+=1;var i=32-Xe(t)+l;if(30<i){var o=l-l%5;i=(r&(1<<o)-1).toString(32),r>>=o,l-=o,st=1<<32-Xe(t)+l|n<<l|r,ut=i+e}else st=1<<i|n<<l|r,ut=e}function zo(e){e.return!==null&&(Vt(e,1),Ma(e,1,0))}function Do(e){for(;e===dl;)dl=pn[--hn],pn[hn]=null,pl=pn[--hn],pn[hn]=null;for(;e===Jt;)Jt=Fe[--Ue],Fe[Ue]=null,ut=Fe[--Ue],Fe[Ue]=null,st=Fe[--Ue],Fe[Ue]=null}var Ie=null,Te=null,Q=!1,Ge=null;function Oa(e,t){var n=Be(5,null,null,0);n.elementType="DELETED",n.stateNode=t,n.return=e,t=e.deletions,t===null?(e.deletions=[n],e.flags|=16):t.push(n)}function Ys(e,t){switch(e.tag){case 5:var n=e.type;return t=t.nodeType!==1||n.toLowerCase()!==t.nodeName.toLowerCase()?null:t,t!==null?(e.stateNode=t,Ie=e,Te=Lt(t.firstChild),!0):!1;case 6:return t=e.pendingProps===""||t.nodeType!==3?null:t,t!==null?(e.stateNode=t,Ie=e,Te=null,!0):!1;case 13:return t=t.nodeType!==8?null:t,t!==null?(n=Jt!==null?{id:st,overflow:ut}:null,e.memoizedState={dehydrated:t,treeContext:n,retryLane:1073741824},n=Be(18,null,null,0),n.stateNode=t,n.return=e,e.child=n,Ie=e,Te=null,!0):!1;default:return!1}}function Qi(e){return(e.mode&1)!==0&&(e.flags&128)===0}function Ki(e){if(Q){var t=Te;if(t){var n=t;if(!Ys(e,t)){if(Qi(e))throw Error(w(418));t=Lt(n.nextSibling);var r=Ie;t&&Ys(e,t)?Oa(r,n):(e.flags=e.flags&-4097|2,Q=!1,Ie=e)}}else{if(Qi(e))throw Error(w(418));e.flags=e.flags&-4097|2,Q=!1,Ie=e}}}function Gs(e){for(e=e.return;e!==null&&e.tag!==5&&e.tag!==3&&e.tag!==13;)e=e.return;Ie=e}function Fr(e){if(e!==Ie)return!1;if(!Q)return Gs(e),Q=!0,!1;var t;if((t=e.tag!==3)&&!(t=e.tag!==5)&&(t=e.type,t=t!=="head"&&t!=="body"&&!Bi(e.type,e.memoizedProps)),t&&(t=Te)){if(Qi(e))throw Fa(),Error(w(418));for(;t;)Oa(e,t),t=Lt(t.nextSibling)}if(Gs(e),e.tag===13){if(e=e.memoizedState,e=e!==null?e.dehydrated:null,!e)throw Error(w(317));e:{for(e=e.nextSibling,t=0;e;){if(e.nodeType===8){var n=e.data;if(n==="/$"){if(t===0){Te=Lt(e.nextSibling);break e}t--}else n!=="$"&&n!=="$!"&&n!=="$?"||t++}e=e.nextSibling}Te=null}}else Te=Ie?Lt(e.stateNode.nextSibling):null;return!0}function Fa(){for(var e=Te;e;)e=Lt(e.nextSibling)}function jn(){Te=Ie=null,Q=!1}function Ro(e){Ge===null?Ge=[e]:Ge.push(e)}var Od=ht.ReactCurrentBatchConfig;function $n(e,t,n){if(e=n.ref,e!==null&&typeof e!="function"&&typeof e!="object"){if(n._owner){if(n=n._owner,n){if(n.tag!==1)throw Error(w(309));var r=n.stateNode}if(!r)throw Error(w(147,e));var l=r,i=""+e;return t!==null&&t.ref!==null&&typeof t.ref=="function"&&t.ref._stringRef===i?t.ref:(t=function(o){var s=l.refs;o===null?delete s[i]:s[i]=o},t._stringRef=i,t)}if(typeof e!="string")throw Error(w(284));if(!n._owner)throw Error(w(290,e))}return e}function Ur(e,t){throw e=Object.prototype.toString.call(t),Error(w(31,e==="[object Object]"?"object with keys {"+Object.keys(t).join(", ")+"}":e))}function Xs(e){var t=e._init;return t(e._payload)}function Ua(e){function t(d,c){if(e){var p=d.deletions;p===null?(d.deletions=[c],d.flags|=16):p.push(c)}}function n(d,c){if(!e)return null;for(;c!==null;)t(d,c),c=c.sibling;return null}function r(d,c){for(d=new Map;c!==null;)c.key!==null?d.set(c.key,c):d.set(c.index,c),c=c.sibling;return d}function l(d,c){return d=Dt(d,c),d.index=0,d.sibling=null,d}function i(d,c,p){return d.index=p,e?(p=d.alternate,p!==null?(p=p.index,p<c?(d.flags|=2,c):p):(d.flags|=2,c)):(d.flags|=1048576,c)}function o(d){return e&&d.alternate===null&&(d.flags|=2),d}function s(d,c,p,y){return c===null||c.tag!==6?(c=vi(p,d.mode,y),c.return=d,c):(c=l(c,p),c.return=d,c)}function u(d,c,p,y){var E=p.type;return E===sn?h(d,c,p.props.children,y,p.key):c!==null&&(c.elementType===E||typeof E=="object"&&E!==null&&E.$$typeof===xt&&Xs(E)===c.type)?(y=l(c,p.props),y.ref=$n(d,c,p),y.return=d,y):(y=el(p.type,p.key,p.props,null,d.mode,y),y.ref=$n(d,c,p),y.return=d,y)}function f(d,c,p,y){return c===null||c.tag!==4||c.stateNode.containerInfo!==p.containerInfo||c.stateNode.implementation!==p.implementation?(c=gi(p,d.mode,y),c.return=d,c):(c=l(c,p.children||[]),c.return=d,c)}function h(d,c,p,y,E){return c===null||c.tag!==7?(c=Xt(p,d.mode,y,E),c.return=d,c):(c=l(c,p),c.return=d,c)}function g(d,c,p){if(typeof c=="string"&&c!==""||typeof c=="number")return c=vi(""+c,d.mode,p),c.return=d,c;if(typeof c=="object"&&c!==null){switch(c.$$typeof){case _r:return p=el(c.type,c.key,c.props,null,d.mode,p),p.ref=$n(d,null,c),p.return=d,p;case on:return c=gi(c,d.mode,p),c.return=d,c;case xt:var y=c._init;return g(d,y(c._payload),p)}if(Hn(c)||Mn(c))return c=Xt(c,d.mode,p,null),c.return=d,c;Ur(d,c)}return null}function m(d,c,p,y){var E=c!==null?c.key:null;if(typeof p=="string"&&p!==""||typeof p=="number")return E!==null?null:s(d,c,""+p,y);if(typeof p=="object"&&p!==null){switch(p.$$typeof){case _r:return p.key===E?u(d,c,p,y):null;case on:return p.key===E?f(d,c,p,y):null;case xt:return E=p._init,m(d,c,E(p._payload),y)}if(Hn(p)||Mn(p))return E!==null?null:h(d,c,p,y,null);Ur(d,p)}return null}function x(d,c,p,y,E){if(typeof y=="string"&&y!==""||typeof y=="number")return d=d.get(p)||null,s(c,d,""+y,E);if(typeof y=="object"&&y!==null){switch(y.$$typeof){case _r:return d=d.get(y.key===null?p:y.key)||null,u(c,d,y,E);case on:return d=d.get(y.key===null?p:y.key)||null,f(c,d,y,E);case xt:var _=y._init;return x(d,c,p,_(y._payload),E)}if(Hn(y)||Mn(y))return d=d.get(p)||null,h(c,d,y,E,null);Ur(c,y)}return null}function k(d,c,p,y){for(var E=null,_=null,C=c,P=c=0,K=null;C!==null&&P<p.length;P++){C.index>P?(K=C,C=null):K=C.sibling;var D=m(d,C,p[P],y);if(D===null){C===null&&(C=K);break}e&&C&&D.alternate===null&&t(d,C),c=i(D,c,P),_===null?E=D:_.sibling=D,_=D,C=K}if(P===p.length)return n(d,C),Q&&Vt(d,P),E;if(C===null){for(;P<p.length;P++)C=g(d,p[P],y),C!==null&&(c=i(C,c,P),_===null?E=C:_.sibling=C,_=C);return Q&&Vt(d,P),E}for(C=r(d,C);P<p.length;P++)K=x(C,d,P,p[P],y),K!==null&&(e&&K.alternate!==null&&C.delete(K.key===null?P:K.key),c=i(K,c,P),_===null?E=K:_.sibling=K,_=K);return e&&C.forEach(function(Me){return t(d,Me)}),Q&&Vt(d,P),E}function S(d,c,p,y){var E=Mn(p);if(typeof E!="function")throw Error(w(150));if(p=E.call(p),p==null)throw Error(w(151));for(var _=E=null,C=c,P=c=0,K=null,D=p.next();C!==null&&!D.done;P++,D=p.next()){C.index>P?(K=C,C=null):K=C.sibling;var Me=m(d,C,D.value,y);if(Me===null){C===null&&(C=K);break}e&&C&&Me.alternate===null&&t(d,C),c=i(Me,c,P),_===null?E=Me:_.sibling=Me,_=Me,C=K}if(D.done)return n(d,C),Q&&Vt(d,P),E;if(C===null){for(;!D.done;P++,D=p.next())D=g(d,D.value,y),D!==null&&(c=i(D,c,P),_===null?E=D:_.sibling=D,_=D);return Q&&Vt(d,P),E}for(C=r(d,C);!D.done;P++,D=p.next())D=x(C,d,P,D.value,y),D!==null&&(e&&D.alternate!==null&&C.delete(D.key===null?P:D.key),c=i(D,c,P),_===null?E=D:_.sibling=D,_=D);return e&&C.forEach(function(mt){return t(d,mt)}),Q&&Vt(d,P),E}function O(d,c,p,y){if(typeof p=="object"&&p!==null&&p.type===sn&&p.key===null&&(p=p.props.children),typeof p=="object"&&p!==null){switch(p.$$typeof){case _r:e:{for(var E=p.key,_=c;_!==null;){if(_.key===E){if(E=p.type,E===sn){if(_.tag===7){n(d,_.sibling),c=l(_,p.props.children),c.return=d,d=c;break e}}else if(_.elementType===E||typeof E=="object"&&E!==null&&E.$$typeof===xt&&Xs(E)===_.type){n(d,_.sibling),c=l(_,p.props),c.ref=$n(d,_,p),c.return=d,d=c;break e}n(d,_);break}else t(d,_);_=_.sibling}p.type===sn?(c=Xt(p.props.children,d.mode,y,p.key),c.return=d,d=c):(y=el(p.type,p.key,p.props,null,d.mode,y),y.ref=$n(d,c,p),y.return=d,d=y)}return o(d);case on:e:{for(_=p.key;c!==null;){if(c.key===_)if(c.tag===4&&c.stateNode.containerInfo===p.containerInfo&&c.stateNode.implementation===p.implementation){n(d,c.sibling),c=l(c,p.children||[]),c.return=d,d=c;break e}else{n(d,c);break}else t(d,c);c=c.sibling}c=gi(p,d.mode,y),c.return=d,d=c}return o(d);case xt:return _=p._init,O(d,c,_(p._payload),y)}if(Hn(p))return k(d,c,p,y);if(Mn(p))return S(d,c,p,y);Ur(d,p)}return typeof p=="string"&&p!==""||typeof p=="number"?(p=""+p,c!==null&&c.tag===6?(n(d,c.sibling),c=l(c,p),c.return=d,d=c):(n(d,c),c=vi(p,d.mode,y),c.return=d,d=c),o(d)):n(d,c)}return O}var _n=Ua(!0),Aa=Ua(!1),hl=Ft(null),ml=null,mn=null,Mo=null;function Oo(){Mo=mn=ml=null}function Fo(e){var t=hl.current;V(hl),e._currentValue=t}function Yi(e,t,n){for(;e!==null;){var r=e.alternate;if((e.childLanes&t)!==t?(e.childLanes|=t,r!==null&&(r.childLanes|=t)):r!==null&&(r.childLanes&t)!==t&&(r.childLanes|=t),e===n)break;e=e.return}}function Sn(e,t){ml=e,Mo=mn=null,e=e.dependencies,e!==null&&e.firstContext!==null&&(e.lanes&t&&(Ne=!0),e.firstContext=null)}function Ve(e){var t=e._currentValue;if(Mo!==e)if(e={context:e,memoizedValue:t,next:null},mn===null){if(ml===null)throw Error(w(308));mn=e,ml.dependencies={lanes:0,firstContext:e}}else mn=mn.next=e;return t}var Kt=null;function Uo(e){Kt===null?Kt=[e]:Kt.push(e)}function $a(e,t,n,r){var l=t.interleaved;return l===null?(n.next=n,Uo(t)):(n.next=l.next,l.next=n),t.interleaved=n,dt(e,r)}function dt(e,t){e.lanes|=t;var n=e.alternate;for(n!==null&&(n.lanes|=t),n=e,e=e.return;e!==null;)e.childLanes|=t,n=e.alternate,n!==null&&(n.childLanes|=t),n=e,e=e.return;return n.tag===3?n.stateNode:null}var kt=!1;function Ao(e){e.updateQueue={baseState:e.memoizedState,firstBaseUpdate:null,lastBaseUpdate:null,shared:{pending:null,interleaved:null,lanes:0},effects:null}}function Ba(e,t){e=e.updateQueue,t.updateQueue===e&&(t.updateQueue={baseState:e.baseState,firstBaseUpdate:e.firstBaseUpdate,lastBaseUpdate:e.lastBaseUpdate,shared:e.shared,effects:e.effects})}function at(e,t){return{eventTime:e,lane:t,tag:0,payload:null,callback:null,next:null}}function Tt(e,t,n){var r=e.updateQueue;if(r===null)return null;if(r=r.shared,M&2){var l=r.pending;return l===null?t.next=t:(t.next=l.next,l.next=t),r.pending=t,dt(e,n)}return l=r.interleaved,l===null?(t.next=t,Uo(r)):(t.next=l.next,l.next=t),r.interleaved=t,dt(e,n)}function Gr(e,t,n){if(t=t.updateQueue,t!==null&&(t=t.shared,(n&4194240)!==0)){var r=t.lanes;r&=e.pendingLanes,n|=r,t.lanes=n,No(e,n)}}function Zs(e,t){var n=e.updateQueue,r=e.alternate;if(r!==null&&(r=r.updateQueue,n===r)){var l=null,i=null;if(n=n.firstBaseUpdate,n!==null){do{var o={eventTime:n.eventTime,lane:n.lane,tag:n.tag,payload:n.payload,callback:n.callback,next:null};i===null?l=i=o:i=i.next=o,n=n.next}while(n!==null);i===null?l=i=t:i=i.next=t}else l=i=t;n={baseState:r.baseState,firstBaseUpdate:l,lastBaseUpdate:i,shared:r.shared,effects:r.effects},e.updateQueue=n;return}e=n.lastBaseUpdate,e===null?n.firstBaseUpdate=t:e.next=t,n.lastBaseUpdate=t}function vl(e,t,n,r){var l=e.updateQueue;kt=!1;var i=l.firstBaseUpdate,o=l.lastBaseUpdate,s=l.shared.pending;if(s!==null){l.shared.pending=null;var u=s,f=u.next;u.next=null,o===null?i=f:o.next=f,o=u;var h=e.alternate;h!==null&&(h=h.updateQueue,s=h.lastBaseUpdate,s!==o&&(s===null?h.firstBaseUpdate=f:s.next=f,h.lastBaseUpdate=u))}if(i!==null){var g=l.baseState;o=0,h=f=u=null,s=i;do{var m=s.lane,x=s.eventTime;if((r&m)===m){h!==null&&(h=h.next={eventTime:x,lane:0,tag:s.tag,payload:s.payload,callback:s.callback,next:null});e:{var k=e,S=s;switch(m=t,x=n,S.tag){case 1:if(k=S.payload,typeof k=="function"){g=k.call(x,g,m);break e}g=k;break e;case 3:k.flags=k.flags&-65537|128;case 0:if(k=S.payload,m=typeof k=="function"?k.call(x,g,m):k,m==null)break e;g=Z({},g,m);break e;case 2:kt=!0}}s.callback!==null&&s.lane!==0&&(e.flags|=64,m=l.effects,m===null?l.effects=[s]:m.push(s))}else x={eventTime:x,lane:m,tag:s.tag,payload:s.payload,callback:s.callback,next:null},h===null?(f=h=x,u=g):h=h.next=x,o|=m;if(s=s.next,s===null){if(s=l.shared.pending,s===null)break;m=s,s=m.next,m.next=null,l.lastBaseUpdate=m,l.shared.pending=null}}while(!0);if(h===null&&(u=g),l.baseState=u,l.firstBaseUpdate=f,l.lastBaseUpdate=h,t=l.shared.interleaved,t!==null){l=t;do o|=l.lane,l=l.next;while(l!==t)}else i===null&&(l.shared.lanes=0);bt|=o,e.lanes=o,e.memoizedState=g}}function Js(e,t,n){if(e=t.effects,t.effects=null,e!==null)for(t=0;t<e.length;t++){var r=e[t],l=r.callback;if(l!==null){if(r.callback=null,r=n,typeof l!="function")throw Error(w(191,l));l.call(r)}}}var Er={},nt=Ft(Er),pr=Ft(Er),hr=Ft(Er);function Yt(e){if(e===Er)throw Error(w(174));return e}function $o(e,t){switch(A(hr,t),A(pr,e),A(nt,Er),e=t.nodeType,e){case 9:case 11:t=(t=t.documentElement)?t.namespaceURI:_i(null,"");break;default:e=e===8?t.parentNode:t,t=e.namespaceURI||null,e=e.tagName,t=_i(t,e)}V(nt),A(nt,t)}function Pn(){V(nt),V(pr),V(hr)}function Wa(e){Yt(hr.current);var t=Yt(nt.current),n=_i(t,e.type);t!==n&&(A(pr,e),A(nt,n))}function Bo(e){pr.current===e&&(V(nt),V(pr))}var G=Ft(0);function gl(e){for(var t=e;t!==null;){if(t.tag===13){var n=t.memoizedState;if(n!==null&&(n=n.dehydrated,n===null||n.data==="$?"||n.data==="$!"))return t}else if(t.tag===19&&t.memoizedProps.revealOrder!==void 0){if(t.flags&128)return t}else if(t.child!==null){t.child.return=t,t=t.child;continue}if(t===e)break;for(;t.sibling===null;){if(t.return===null||t.return===e)return null;t=t.return}t.sibling.return=t.return,t=t.sibling}return null}var ci=[];function Wo(){for(var e=0;e<ci.length;e++)ci[e]._workInProgressVersionPrimary=null;ci.length=0}var Xr=ht.ReactCurrentDispatcher,fi=ht.ReactCurrentBatchConfig,qt=0,X=null,re=null,se=null,yl=!1,qn=!1,mr=0,Fd=0;function he(){throw Error(w(321))}function Vo(e,t){if(t===null)return!1;for(var n=0;n<t.length&&n<e.length;n++)if(!Je(e[n],t[n]))return!1;return!0}function Ho(e,t,n,r,l,i){if(qt=i,X=t,t.memoizedState=null,t.updateQueue=null,t.lanes=0,Xr.current=e===null||e.memoizedState===null?Bd:Wd,e=n(r,l),qn){i=0;do{if(qn=!1,mr=0,25<=i)throw Error(w(301));i+=1,se=re=null,t.updateQueue=null,Xr.current=Vd,e=n(r,l)}while(qn)}if(Xr.current=wl,t=re!==null&&re.next!==null,qt=0,se=re=X=null,yl=!1,t)throw Error(w(300));return e}function Qo(){var e=mr!==0;return mr=0,e}function be(){var e={memoizedState:null,baseState:null,baseQueue:null,queue:null,next:null};return se===null?X.memoizedState=se=e:se=se.next=e,se}function He(){if(re===null){var e=X.alternate;e=e!==null?e.memoizedState:null}else e=re.next;var t=se===null?X.memoizedState:se.next;if(t!==null)se=t,re=e;else{if(e===null)throw Error(w(310));re=e,e={memoizedState:re.memoizedState,baseState:re.baseState,baseQueue:re.baseQueue,queue:re.queue,next:null},se===null?X.memoizedState=se=e:se=se.next=e}return se}function vr(e,t){return typeof t=="function"?t(e):t}function di(e){var t=He(),n=t.queue;if(n===null)throw Error(w(311));n.lastRenderedReducer=e;var r=re,l=r.baseQueue,i=n.pending;if(i!==null){if(l!==null){var o=l.next;l.next=i.next,i.next=o}r.baseQueue=l=i,n.pending=null}if(l!==null){i=l.next,r=r.baseState;var s=o=null,u=null,f=i;do{var h=f.lane;if((qt&h)===h)u!==null&&(u=u.next={lane:0,action:f.action,hasEagerState:f.hasEagerState,eagerState:f.eagerState,next:null}),r=f.hasEagerState?f.eagerState:e(r,f.action);else{var g={lane:h,action:f.action,hasEagerState:f.hasEagerState,eagerState:f.eagerState,next:null};u===null?(s=u=g,o=r):u=u.next=g,X.lanes|=h,bt|=h}f=f.next}while(f!==null&&f!==i);u===null?o=r:u.next=s,Je(r,t.memoizedState)||(Ne=!0),t.memoizedState=r,t.baseState=o,t.baseQueue=u,n.lastRenderedState=r}if(e=n.interleaved,e!==null){l=e;do i=l.lane,X.lanes|=i,bt|=i,l=l.next;while(l!==e)}else l===null&&(n.lanes=0);return[t.memoizedState,n.dispatch]}function pi(e){var t=He(),n=t.queue;if(n===null)throw Error(w(311));n.lastRenderedReducer=e;var r=n.dispatch,l=n.pending,i=t.memoizedState;if(l!==null){n.pending=null;var o=l=l.next;do i=e(i,o.action),o=o.next;while(o!==l);Je(i,t.memoizedState)||(Ne=!0),t.memoizedState=i,t.baseQueue===null&&(t.baseState=i),n.lastRenderedState=i}return[i,r]}function Va(){}function Ha(e,t){var n=X,r=He(),l=t(),i=!Je(r.memoizedState,l);if(i&&(r.memoizedState=l,Ne=!0),r=r.queue,Ko(Ya.bind(null,n,r,e),[e]),r.getSnapshot!==t||i||se!==null&&se.memoizedState.tag&1){if(n.flags|=2048,gr(9,Ka.bind(null,n,r,l,t),void 0,null),ue===null)throw Error(w(349));qt&30||Qa(n,t,l)}return l}function Qa(e,t,n){e.flags|=16384,e={getSnapshot:t,value:n},t=X.updateQueue,t===null?(t={lastEffect:null,stores:null},X.updateQueue=t,t.stores=[e]):(n=t.stores,n===null?t.stores=[e]:n.push(e))}function Ka(e,t,n,r){t.value=n,t.getSnapshot=r,Ga(t)&&Xa(e)}function Ya(e,t,n){return n(function(){Ga(t)&&Xa(e)})}function Ga(e){var t=e.getSnapshot;e=e.value;try{var n=t();return!Je(e,n)}catch{return!0}}function Xa(e){var t=dt(e,1);t!==null&&Ze(t,e,1,-1)}function qs(e){var t=be();return typeof e=="function"&&(e=e()),t.memoizedState=t.baseState=e,e={pending:null,interleaved:null,lanes:0,dispatch:null,lastRenderedReducer:vr,lastRenderedState:e},t.queue=e,e=e.dispatch=$d.bind(null,X,e),[t.memoizedState,e]}function gr(e,t,n,r){return e={tag:e,create:t,destroy:n,deps:r,next:null},t=X.updateQueue,t===null?(t={lastEffect:null,stores:null},X.updateQueue=t,t.lastEffect=e.next=e):(n=t.lastEffect,n===null?t.lastEffect=e.next=e:(r=n.next,n.next=e,e.next=r,t.lastEffect=e)),e}function Za(){return He().memoizedState}function Zr(e,t,n,r){var l=be();X.flags|=e,l.memoizedState=gr(1|t,n,void 0,r===void 0?null:r)}function Dl(e,t,n,r){var l=He();r=r===void 0?null:r;var i=void 0;if(re!==null){var o=re.memoizedState;if(i=o.destroy,r!==null&&Vo(r,o.deps)){l.memoizedState=gr(t,n,i,r);return}}X.flags|=e,l.memoizedState=gr(1|t,n,i,r)}function bs(e,t){return Zr(8390656,8,e,t)}function Ko(e,t){return Dl(2048,8,e,t)}function Ja(e,t){return Dl(4,2,e,t)}function qa(e,t){return Dl(4,4,e,t)}function ba(e,t){if(typeof t=="function")return e=e(),t(e),function(){t(null)};if(t!=null)return e=e(),t.current=e,function(){t.current=null}}function ec(e,t,n){return n=n!=null?n.concat([e]):null,Dl(4,4,ba.bind(null,t,e),n)}function Yo(){}function tc(e,t){var n=He();t=t===void 0?null:t;var r=n.memoizedState;return r!==null&&t!==null&&Vo(t,r[1])?r[0]:(n.memoizedState=[e,t],e)}function nc(e,t){var n=He();t=t===void 0?null:t;var r=n.memoizedState;return r!==null&&t!==null&&Vo(t,r[1])?r[0]:(e=e(),n.memoizedState=[e,t],e)}function rc(e,t,n){return qt&21?(Je(n,t)||(n=ua(),X.lanes|=n,bt|=n,e.baseState=!0),t):(e.baseState&&(e.baseState=!1,Ne=!0),e.memoizedState=n)}function Ud(e,t){var n=F;F=n!==0&&4>n?n:4,e(!0);var r=fi.transition;fi.transition={};try{e(!1),t()}finally{F=n,fi.transition=r}}function lc(){return He().memoizedState}function Ad(e,t,n){var r=zt(e);if(n={lane:r,action:n,hasEagerState:!1,eagerState:null,next:null},ic(e))oc(t,n);else if(n=$a(e,t,n,r),n!==null){var l=xe();Ze(n,e,r,l),sc(n,t,r)}}function $d(e,t,n){var r=zt(e),l={lane:r,action:n,hasEagerState:!1,eagerState:null,next:null};if(ic(e))oc(t,l);else{var i=e.alternate;if(e.lanes===0&&(i===null||i.lanes===0)&&(i=t.lastRenderedReducer,i!==null))try{var o=t.lastRenderedState,s=i(o,n);if(l.hasEagerState=!0,l.eagerState=s,Je(s,o)){var u=t.interleaved;u===null?(l.next=l,Uo(t)):(l.next=u.next,u.next=l),t.interleaved=l;return}}catch{}finally{}n=$a(e,t,l,r),n!==null&&(l=xe(),Ze(n,e,r,l),sc(n,t,r))}}function ic(e){var t=e.alternate;return e===X||t!==null&&t===X}function oc(e,t){qn=yl=!0;var n=e.pending;n===null?t.next=t:(t.next=n.next,n.next=t),e.pending=t}function sc(e,t,n){if(n&4194240){var r=t.lanes;r&=e.pendingLanes,n|=r,t.lanes=n,No(e,n)}}var wl={readContext:Ve,useCallback:he,useContext:he,useEffect:he,useImperativeHandle:he,useInsertionEffect:he,useLayoutEffect:he,useMemo:he,useReducer:he,useRef:he,useState:he,useDebugValue:he,useDeferredValue:he,useTransition:he,useMutableSource:he,useSyncExternalStore:he,useId:he,unstable_isNewReconciler:!1},Bd={readContext:Ve,useCallback:function(e,t){return be().memoizedState=[e,t===void 0?null:t],e},useContext:Ve,useEffect:bs,useImperativeHandle:function(e,t,n){return n=n!=null?n.concat([e]):null,Zr(4194308,4,ba.bind(null,t,e),n)},useLayoutEffect:function(e,t){return Zr(4194308,4,e,t)},useInsertionEffect:function(e,t){return Zr(4,2,e,t)},useMemo:function(e,t){var n=be();return t=t===void 0?null:t,e=e(),n.memoizedState=[e,t],e},useReducer:function(e,t,n){var r=be();return t=n!==void 0?n(t):t,r.memoizedState=r.baseState=t,e={pending:null,interleaved:null,lanes:0,dispatch:null,lastRenderedReducer:e,lastRenderedState:t},r.queue=e,e=e.dispatch=Ad.bind(null,X,e),[r.memoizedState,e]},useRef:function(e){var t=be();return e={current:e},t.memoizedState=e},useState:qs,useDebugValue:Yo,useDeferredValue:function(e){return be().memoizedState=e},useTransition:function(){var e=qs(!1),t=e[0];return e=Ud.bind(null,e[1]),be().memoizedState=e,[t,e]},useMutableSource:function(){},useSyncExternalStore:function(e,t,n){var r=X,l=be();if(Q){if(n===void 0)throw Error(w(407));n=n()}else{if(n=t(),ue===null)throw Error(w(349));qt&30||Qa(r,t,n)}l.memoizedState=n;var i={value:n,getSnapshot:t};return l.queue=i,bs(Ya.bind(null,r,i,e),[e]),r.flags|=2048,gr(9,Ka.bind(null,r,i,n,t),void 0,null),n},useId:function(){var e=be(),t=ue.identifierPrefix;if(Q){var n=ut,r=st;n=(r&~(1<<32-Xe(r)-1)).toString(32)+n,t=":"+t+"R"+n,n=mr++,0<n&&(t+="H"+n.toString(32)),t+=":"}else n=Fd++,t=":"+t+"r"+n.toString(32)+":";return e.memoizedState=t},unstable_isNewReconciler:!1},Wd={readContext:Ve,useCallback:tc,useContext:Ve,useEffect:Ko,useImperativeHandle:ec,useInsertionEffect:Ja,useLayoutEffect:qa,useMemo:nc,useReducer:di,useRef:Za,useState:function(){return di(vr)},useDebugValue:Yo,useDeferredValue:function(e){var t=He();return rc(t,re.memoizedState,e)},useTransition:function(){var e=di(vr)[0],t=He().memoizedState;return[e,t]},useMutableSource:Va,useSyncExternalStore:Ha,useId:lc,unstable_isNewReconciler:!1},Vd={readContext:Ve,useCallback:tc,useContext:Ve,useEffect:Ko,useImperativeHandle:ec,useInsertionEffect:Ja,useLayoutEffect:qa,useMemo:nc,useReducer:pi,useRef:Za,useState:function(){return pi(vr)},useDebugValue:Yo,useDeferredValue:function(e){var t=He();return re===null?t.memoizedState=e:rc(t,re.memoizedState,e)},useTransition:function(){var e=pi(vr)[0],t=He().memoizedState;return[e,t]},useMutableSource:Va,useSyncExternalStore:Ha,useId:lc,unstable_isNewReconciler:!1};function Ke(e,t){if(e&&e.defaultProps){t=Z({},t),e=e.defaultProps;for(var n in e)t[n]===void 0&&(t[n]=e[n]);return t}return t}function Gi(e,t,n,r){t=e.memoizedState,n=n(r,t),n=n==null?t:Z({},t,n),e.memoizedState=n,e.lanes===0&&(e.updateQueue.baseState=n)}var Rl={isMounted:function(e){return(e=e._reactInternals)?nn(e)===e:!1},enqueueSetState:function(e,t,n){e=e._reactInternals;var r=xe(),l=zt(e),i=at(r,l);i.payload=t,n!=null&&(i.callback=n),t=Tt(e,i,l),t!==null&&(Ze(t,e,l,r),Gr(t,e,l))},enqueueReplaceState:function(e,t,n){e=e._reactInternals;var r=xe(),l=zt(e),i=at(r,l);i.tag=1,i.payload=t,n!=null&&(i.callback=n),t=Tt(e,i,l),t!==null&&(Ze(t,e,l,r),Gr(t,e,l))},enqueueForceUpdate:function(e,t){e=e._reactInternals;var n=xe(),r=zt(e),l=at(n,r);l.tag=2,t!=null&&(l.callback=t),t=Tt(e,l,r),t!==null&&(Ze(t,e,r,n),Gr(t,e,r))}};function eu(e,t,n,r,l,i,o){return e=e.stateNode,typeof e.shouldComponentUpdate=="function"?e.shouldComponentUpdate(r,i,o):t.prototype&&t.prototype.isPureReactComponent?!ar(n,r)||!ar(l,i):!0}function uc(e,t,n){var r=!1,l=Mt,i=t.contextType;return typeof i=="object"&&i!==null?i=Ve(i):(l=je(t)?Zt:ye.current,r=t.contextTypes,i=(r=r!=null)?Cn(e,l):Mt),t=new t(n,i),e.memoizedState=t.state!==null&&t.state!==void 0?t.state:null,t.updater=Rl,e.stateNode=t,t._reactInternals=e,r&&(e=e.stateNode,e.__reactInternalMemoizedUnmaskedChildContext=l,e.__reactInternalMemoizedMaskedChildContext=i),t}function tu(e,t,n,r){e=t.state,typeof t.componentWillReceiveProps=="function"&&t.componentWillReceiveProps(n,r),typeof t.UNSAFE_componentWillReceiveProps=="function"&&t.UNSAFE_componentWillReceiveProps(n,r),t.state!==e&&Rl.enqueueReplaceState(t,t.state,null)}function Xi(e,t,n,r){var l=e.stateNode;l.props=n,l.state=e.memoizedState,l.refs={},Ao(e);var i=t.contextType;typeof i=="object"&&i!==null?l.context=Ve(i):(i=je(t)?Zt:ye.current,l.context=Cn(e,i)),l.state=e.memoizedState,i=t.getDerivedStateFromProps,typeof i=="function"&&(Gi(e,t,i,n),l.state=e.memoizedState),typeof t.getDerivedStateFromProps=="function"||typeof l.getSnapshotBeforeUpdate=="function"||typeof l.UNSAFE_componentWillMount!="function"&&typeof l.componentWillMount!="function"||(t=l.state,typeof l.componentWillMount=="function"&&l.componentWillMount(),typeof l.UNSAFE_componentWillMount=="function"&&l.UNSAFE_componentWillMount(),t!==l.state&&Rl.enqueueReplaceState(l,l.state,null),vl(e,n,l,r),l.state=e.memoizedState),typeof l.componentDidMount=="function"&&(e.flags|=4194308)}function Ln(e,t){try{var n="",r=t;do n+=gf(r),r=r.return;while(r);var l=n}catch(i){l=`
-Error generating stack: `+i.message+`
-`+i.stack}return{value:e,source:t,stack:l,digest:null}}function hi(e,t,n){return{value:e,source:null,stack:n??null,digest:t??null}}function Zi(e,t){try{console.error(t.value)}catch(n){setTimeout(function(){throw n})}}var Hd=typeof WeakMap=="function"?WeakMap:Map;function ac(e,t,n){n=at(-1,n),n.tag=3,n.payload={element:null};var r=t.value;return n.callback=function(){kl||(kl=!0,oo=r),Zi(e,t)},n}function cc(e,t,n){n=at(-1,n),n.tag=3;var r=e.type.getDerivedStateFromError;if(typeof r=="function"){var l=t.value;n.payload=function(){return r(l)},n.callback=function(){Zi(e,t)}}var i=e.stateNode;return i!==null&&typeof i.componentDidCatch=="function"&&(n.callback=function(){Zi(e,t),typeof r!="function"&&(It===null?It=new Set([this]):It.add(this));var o=t.stack;this.componentDidCatch(t.value,{componentStack:o!==null?o:""})}),n}function nu(e,t,n){var r=e.pingCache;if(r===null){r=e.pingCache=new Hd;var l=new Set;r.set(t,l)}else l=r.get(t),l===void 0&&(l=new Set,r.set(t,l));l.has(n)||(l.add(n),e=lp.bind(null,e,t,n),t.then(e,e))}function ru(e){do{var t;if((t=e.tag===13)&&(t=e.memoizedState,t=t!==null?t.dehydrated!==null:!0),t)return e;e=e.return}while(e!==null);return null}function lu(e,t,n,r,l){return e.mode&1?(e.flags|=65536,e.lanes=l,e):(e===t?e.flags|=65536:(e.flags|=128,n.flags|=131072,n.flags&=-52805,n.tag===1&&(n.alternate===null?n.tag=17:(t=at(-1,1),t.tag=2,Tt(n,t,1))),n.lanes|=1),e)}var Qd=ht.ReactCurrentOwner,Ne=!1;function we(e,t,n,r){t.child=e===null?Aa(t,null,n,r):_n(t,e.child,n,r)}function iu(e,t,n,r,l){n=n.render;var i=t.ref;return Sn(t,l),r=Ho(e,t,n,r,i,l),n=Qo(),e!==null&&!Ne?(t.updateQueue=e.updateQueue,t.flags&=-2053,e.lanes&=~l,pt(e,t,l)):(Q&&n&&zo(t),t.flags|=1,we(e,t,r,l),t.child)}function ou(e,t,n,r,l){if(e===null){var i=n.type;return typeof i=="function"&&!ts(i)&&i.defaultProps===void 0&&n.compare===null&&n.defaultProps===void 0?(t.tag=15,t.type=i,fc(e,t,i,r,l)):(e=el(n.type,null,r,t,t.mode,l),e.ref=t.ref,e.return=t,t.child=e)}if(i=e.child,!(e.lanes&l)){var o=i.memoizedProps;if(n=n.compare,n=n!==null?n:ar,n(o,r)&&e.ref===t.ref)return pt(e,t,l)}return t.flags|=1,e=Dt(i,r),e.ref=t.ref,e.return=t,t.child=e}function fc(e,t,n,r,l){if(e!==null){var i=e.memoizedProps;if(ar(i,r)&&e.ref===t.ref)if(Ne=!1,t.pendingProps=r=i,(e.lanes&l)!==0)e.flags&131072&&(Ne=!0);else return t.lanes=e.lanes,pt(e,t,l)}return Ji(e,t,n,r,l)}function dc(e,t,n){var r=t.pendingProps,l=r.children,i=e!==null?e.memoizedState:null;if(r.mode==="hidden")if(!(t.mode&1))t.memoizedState={baseLanes:0,cachePool:null,transitions:null},A(gn,Le),Le|=n;else{if(!(n&1073741824))return e=i!==null?i.baseLanes|n:n,t.lanes=t.childLanes=1073741824,t.memoizedState={baseLanes:e,cachePool:null,transitions:null},t.updateQueue=null,A(gn,Le),Le|=e,null;t.memoizedState={baseLanes:0,cachePool:null,transitions:null},r=i!==null?i.baseLanes:n,A(gn,Le),Le|=r}else i!==null?(r=i.baseLanes|n,t.memoizedState=null):r=n,A(gn,Le),Le|=r;return we(e,t,l,n),t.child}function pc(e,t){var n=t.ref;(e===null&&n!==null||e!==null&&e.ref!==n)&&(t.flags|=512,t.flags|=2097152)}function Ji(e,t,n,r,l){var i=je(n)?Zt:ye.current;return i=Cn(t,i),Sn(t,l),n=Ho(e,t,n,r,i,l),r=Qo(),e!==null&&!Ne?(t.updateQueue=e.updateQueue,t.flags&=-2053,e.lanes&=~l,pt(e,t,l)):(Q&&r&&zo(t),t.flags|=1,we(e,t,n,l),t.child)}function su(e,t,n,r,l){if(je(n)){var i=!0;fl(t)}else i=!1;if(Sn(t,l),t.stateNode===null)Jr(e,t),uc(t,n,r),Xi(t,n,r,l),r=!0;else if(e===null){var o=t.stateNode,s=t.memoizedProps;o.props=s;var u=o.context,f=n.contextType;typeof f=="object"&&f!==null?f=Ve(f):(f=je(n)?Zt:ye.current,f=Cn(t,f));var h=n.getDerivedStateFromProps,g=typeof h=="function"||typeof o.getSnapshotBeforeUpdate=="function";g||typeof o.UNSAFE_componentWillReceiveProps!="function"&&typeof o.componentWillReceiveProps!="function"||(s!==r||u!==f)&&tu(t,o,r,f),kt=!1;var m=t.memoizedState;o.state=m,vl(t,r,o,l),u=t.memoizedState,s!==r||m!==u||Ce.current||kt?(typeof h=="function"&&(Gi(t,n,h,r),u=t.memoizedState),(s=kt||eu(t,n,s,r,m,u,f))?(g||typeof o.UNSAFE_componentWillMount!="function"&&typeof o.componentWillMount!="function"||(typeof o.componentWillMount=="function"&&o.componentWillMount(),typeof o.UNSAFE_componentWillMount=="function"&&o.UNSAFE_componentWillMount()),typeof o.componentDidMount=="function"&&(t.flags|=4194308)):(typeof o.componentDidMount=="function"&&(t.flags|=4194308),t.memoizedProps=r,t.memoizedState=u),o.props=r,o.state=u,o.context=f,r=s):(typeof o.componentDidMount=="function"&&(t.flags|=4194308),r=!1)}else{o=t.stateNode,Ba(e,t),s=t.memoizedProps,f=t.type===t.elementType?s:Ke(t.type,s),o.props=f,g=t.pendingProps,m=o.context,u=n.contextType,typeof u=="object"&&u!==null?u=Ve(u):(u=je(n)?Zt:ye.current,u=Cn(t,u));var x=n.getDerivedStateFromProps;(h=typeof x=="function"||typeof o.getSnapshotBeforeUpdate=="function")||typeof o.UNSAFE_componentWillReceiveProps!="function"&&typeof o.componentWillReceiveProps!="function"||(s!==g||m!==u)&&tu(t,o,r,u),kt=!1,m=t.memoizedState,o.state=m,vl(t,r,o,l);var k=t.memoizedState;s!==g||m!==k||Ce.current||kt?(typeof x=="function"&&(Gi(t,n,x,r),k=t.memoizedState),(f=kt||eu(t,n,f,r,m,k,u)||!1)?(h||typeof o.UNSAFE_componentWillUpdate!="function"&&typeof o.componentWillUpdate!="function"||(typeof o.componentWillUpdate=="function"&&o.componentWillUpdate(r,k,u),typeof o.UNSAFE_componentWillUpdate=="function"&&o.UNSAFE_componentWillUpdate(r,k,u)),typeof o.componentDidUpdate=="function"&&(t.flags|=4),typeof o.getSnapshotBeforeUpdate=="function"&&(t.flags|=1024)):(typeof o.componentDidUpdate!="function"||s===e.memoizedProps&&m===e.memoizedState||(t.flags|=4),typeof o.getSnapshotBeforeUpdate!="function"||s===e.memoizedProps&&m===e.memoizedState||(t.flags|=1024),t.memoizedProps=r,t.memoizedState=k),o.props=r,o.state=k,o.context=u,r=f):(typeof o.componentDidUpdate!="function"||s===e.memoizedProps&&m===e.memoizedState||(t.flags|=4),typeof o.getSnapshotBeforeUpdate!="function"||s===e.memoizedProps&&m===e.memoizedState||(t.flags|=1024),r=!1)}return qi(e,t,n,r,i,l)}function qi(e,t,n,r,l,i){pc(e,t);var o=(t.flags&128)!==0;if(!r&&!o)return l&&Ks(t,n,!1),pt(e,t,i);r=t.stateNode,Qd.current=t;var s=o&&typeof n.getDerivedStateFromError!="function"?null:r.render();return t.flags|=1,e!==null&&o?(t.child=_n(t,e.child,null,i),t.child=_n(t,null,s,i)):we(e,t,s,i),t.memoizedState=r.state,l&&Ks(t,n,!0),t.child}function hc(e){var t=e.stateNode;t.pendingContext?Qs(e,t.pendingContext,t.pendingContext!==t.context):t.context&&Qs(e,t.context,!1),$o(e,t.containerInfo)}function uu(e,t,n,r,l){return jn(),Ro(l),t.flags|=256,we(e,t,n,r),t.child}var bi={dehydrated:null,treeContext:null,retryLane:0};function eo(e){return{baseLanes:e,cachePool:null,transitions:null}}function mc(e,t,n){var r=t.pendingProps,l=G.current,i=!1,o=(t.flags&128)!==0,s;if((s=o)||(s=e!==null&&e.memoizedState===null?!1:(l&2)!==0),s?(i=!0,t.flags&=-129):(e===null||e.memoizedState!==null)&&(l|=1),A(G,l&1),e===null)return Ki(t),e=t.memoizedState,e!==null&&(e=e.dehydrated,e!==null)?(t.mode&1?e.data==="$!"?t.lanes=8:t.lanes=1073741824:t.lanes=1,null):(o=r.children,e=r.fallback,i?(r=t.mode,i=t.child,o={mode:"hidden",children:o},!(r&1)&&i!==null?(i.childLanes=0,i.pendingProps=o):i=Fl(o,r,0,null),e=Xt(e,r,n,null),i.return=t,e.return=t,i.sibling=e,t.child=i,t.child.memoizedState=eo(n),t.memoizedState=bi,e):Go(t,o));if(l=e.memoizedState,l!==null&&(s=l.dehydrated,s!==null))return Kd(e,t,o,r,s,l,n);if(i){i=r.fallback,o=t.mode,l=e.child,s=l.sibling;var u={mode:"hidden",children:r.children};return!(o&1)&&t.child!==l?(r=t.child,r.childLanes=0,r.pendingProps=u,t.deletions=null):(r=Dt(l,u),r.subtreeFlags=l.subtreeFlags&14680064),s!==null?i=Dt(s,i):(i=Xt(i,o,n,null),i.flags|=2),i.return=t,r.return=t,r.sibling=i,t.child=r,r=i,i=t.child,o=e.child.memoizedState,o=o===null?eo(n):{baseLanes:o.baseLanes|n,cachePool:null,transitions:o.transitions},i.memoizedState=o,i.childLanes=e.childLanes&~n,t.memoizedState=bi,r}return i=e.child,e=i.sibling,r=Dt(i,{mode:"visible",children:r.children}),!(t.mode&1)&&(r.lanes=n),r.return=t,r.sibling=null,e!==null&&(n=t.deletions,n===null?(t.deletions=[e],t.flags|=16):n.push(e)),t.child=r,t.memoizedState=null,r}function Go(e,t){return t=Fl({mode:"visible",children:t},e.mode,0,null),t.return=e,e.child=t}function Ar(e,t,n,r){return r!==null&&Ro(r),_n(t,e.child,null,n),e=Go(t,t.pendingProps.children),e.flags|=2,t.memoizedState=null,e}function Kd(e,t,n,r,l,i,o){if(n)return t.flags&256?(t.flags&=-257,r=hi(Error(w(422))),Ar(e,t,o,r)):t.memoizedState!==null?(t.child=e.child,t.flags|=128,null):(i=r.fallback,l=t.mode,r=Fl({mode:"visible",children:r.children},l,0,null),i=Xt(i,l,o,null),i.flags|=2,r.return=t,i.return=t,r.sibling=i,t.child=r,t.mode&1&&_n(t,e.child,null,o),t.child.memoizedState=eo(o),t.memoizedState=bi,i);if(!(t.mode&1))return Ar(e,t,o,null);if(l.data==="$!"){if(r=l.nextSibling&&l.nextSibling.dataset,r)var s=r.dgst;return r=s,i=Error(w(419)),r=hi(i,r,void 0),Ar(e,t,o,r)}if(s=(o&e.childLanes)!==0,Ne||s){if(r=ue,r!==null){switch(o&-o){case 4:l=2;break;case 16:l=8;break;case 64:case 128:case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:case 4194304:case 8388608:case 16777216:case 33554432:case 67108864:l=32;break;case 536870912:l=268435456;break;default:l=0}l=l&(r.suspendedLanes|o)?0:l,l!==0&&l!==i.retryLane&&(i.retryLane=l,dt(e,l),Ze(r,e,l,-1))}return es(),r=hi(Error(w(421))),Ar(e,t,o,r)}return l.data==="$?"?(t.flags|=128,t.child=e.child,t=ip.bind(null,e),l._reactRetry=t,null):(e=i.treeContext,Te=Lt(l.nextSibling),Ie=t,Q=!0,Ge=null,e!==null&&(Fe[Ue++]=st,Fe[Ue++]=ut,Fe[Ue++]=Jt,st=e.id,ut=e.overflow,Jt=t),t=Go(t,r.children),t.flags|=4096,t)}function au(e,t,n){e.lanes|=t;var r=e.alternate;r!==null&&(r.lanes|=t),Yi(e.return,t,n)}function mi(e,t,n,r,l){var i=e.memoizedState;i===null?e.memoizedState={isBackwards:t,rendering:null,renderingStartTime:0,last:r,tail:n,tailMode:l}:(i.isBackwards=t,i.rendering=null,i.renderingStartTime=0,i.last=r,i.tail=n,i.tailMode=l)}function vc(e,t,n){var r=t.pendingProps,l=r.revealOrder,i=r.tail;if(we(e,t,r.children,n),r=G.current,r&2)r=r&1|2,t.flags|=128;else{if(e!==null&&e.flags&128)e:for(e=t.child;e!==null;){if(e.tag===13)e.memoizedState!==null&&au(e,n,t);else if(e.tag===19)au(e,n,t);else if(e.child!==null){e.child.return=e,e=e.child;continue}if(e===t)break e;for(;e.sibling===null;){if(e.return===null||e.return===t)break e;e=e.return}e.sibling.return=e.return,e=e.sibling}r&=1}if(A(G,r),!(t.mode&1))t.memoizedState=null;else switch(l){case"forwards":for(n=t.child,l=null;n!==null;)e=n.alternate,e!==null&&gl(e)===null&&(l=n),n=n.sibling;n=l,n===null?(l=t.child,t.child=null):(l=n.sibling,n.sibling=null),mi(t,!1,l,n,i);break;case"backwards":for(n=null,l=t.child,t.child=null;l!==null;){if(e=l.alternate,e!==null&&gl(e)===null){t.child=l;break}e=l.sibling,l.sibling=n,n=l,l=e}mi(t,!0,n,null,i);break;case"together":mi(t,!1,null,null,void 0);break;default:t.memoizedState=null}return t.child}function Jr(e,t){!(t.mode&1)&&e!==null&&(e.alternate=null,t.alternate=null,t.flags|=2)}function pt(e,t,n){if(e!==null&&(t.dependencies=e.dependencies),bt|=t.lanes,!(n&t.childLanes))return null;if(e!==null&&t.child!==e.child)throw Error(w(153));if(t.child!==null){for(e=t.child,n=Dt(e,e.pendingProps),t.child=n,n.return=t;e.sibling!==null;)e=e.sibling,n=n.sibling=Dt(e,e.pendingProps),n.return=t;n.sibling=null}return t.child}function Yd(e,t,n){switch(t.tag){case 3:hc(t),jn();break;case 5:Wa(t);break;case 1:je(t.type)&&fl(t);break;case 4:$o(t,t.stateNode.containerInfo);break;case 10:var r=t.type._context,l=t.memoizedProps.value;A(hl,r._currentValue),r._currentValue=l;break;case 13:if(r=t.memoizedState,r!==null)return r.dehydrated!==null?(A(G,G.current&1),t.flags|=128,null):n&t.child.childLanes?mc(e,t,n):(A(G,G.current&1),e=pt(e,t,n),e!==null?e.sibling:null);A(G,G.current&1);break;case 19:if(r=(n&t.childLanes)!==0,e.flags&128){if(r)return vc(e,t,n);t.flags|=128}if(l=t.memoizedState,l!==null&&(l.rendering=null,l.tail=null,l.lastEffect=null),A(G,G.current),r)break;return null;case 22:case 23:return t.lanes=0,dc(e,t,n)}return pt(e,t,n)}var gc,to,yc,wc;gc=function(e,t){for(var n=t.child;n!==null;){if(n.tag===5||n.tag===6)e.appendChild(n.stateNode);else if(n.tag!==4&&n.child!==null){n.child.return=n,n=n.child;continue}if(n===t)break;for(;n.sibling===null;){if(n.return===null||n.return===t)return;n=n.return}n.sibling.return=n.return,n=n.sibling}};to=function(){};yc=function(e,t,n,r){var l=e.memoizedProps;if(l!==r){e=t.stateNode,Yt(nt.current);var i=null;switch(n){case"input":l=Ei(e,l),r=Ei(e,r),i=[];break;case"select":l=Z({},l,{value:void 0}),r=Z({},r,{value:void 0}),i=[];break;case"textarea":l=ji(e,l),r=ji(e,r),i=[];break;default:typeof l.onClick!="function"&&typeof r.onClick=="function"&&(e.onclick=al)}Pi(n,r);var o;n=null;for(f in l)if(!r.hasOwnProperty(f)&&l.hasOwnProperty(f)&&l[f]!=null)if(f==="style"){var s=l[f];for(o in s)s.hasOwnProperty(o)&&(n||(n={}),n[o]="")}else f!=="dangerouslySetInnerHTML"&&f!=="children"&&f!=="suppressContentEditableWarning"&&f!=="suppressHydrationWarning"&&f!=="autoFocus"&&(nr.hasOwnProperty(f)?i||(i=[]):(i=i||[]).push(f,null));for(f in r){var u=r[f];if(s=l!=null?l[f]:void 0,r.hasOwnProperty(f)&&u!==s&&(u!=null||s!=null))if(f==="style")if(s){for(o in s)!s.hasOwnProperty(o)||u&&u.hasOwnProperty(o)||(n||(n={}),n[o]="");for(o in u)u.hasOwnProperty(o)&&s[o]!==u[o]&&(n||(n={}),n[o]=u[o])}else n||(i||(i=[]),i.push(f,n)),n=u;else f==="dangerouslySetInnerHTML"?(u=u?u.__html:void 0,s=s?s.__html:void 0,u!=null&&s!==u&&(i=i||[]).push(f,u)):f==="children"?typeof u!="string"&&typeof u!="number"||(i=i||[]).push(f,""+u):f!=="suppressContentEditableWarning"&&f!=="suppressHydrationWarning"&&(nr.hasOwnProperty(f)?(u!=null&&f==="onScroll"&&W("scroll",e),i||s===u||(i=[])):(i=i||[]).push(f,u))}n&&(i=i||[]).push("style",n);var f=i;(t.updateQueue=f)&&(t.flags|=4)}};wc=function(e,t,n,r){n!==r&&(t.flags|=4)};function Bn(e,t){if(!Q)switch(e.tailMode){case"hidden":t=e.tail;for(var n=null;t!==null;)t.alternate!==null&&(n=t),t=t.sibling;n===null?e.tail=null:n.sibling=null;break;case"collapsed":n=e.tail;for(var r=null;n!==null;)n.alternate!==null&&(r=n),n=n.sibling;r===null?t||e.tail===null?e.tail=null:e.tail.sibling=null:r.sibling=null}}function me(e){var t=e.alternate!==null&&e.alternate.child===e.child,n=0,r=0;if(t)for(var l=e.child;l!==null;)n|=l.lanes|l.childLanes,r|=l.subtreeFlags&14680064,r|=l.flags&14680064,l.return=e,l=l.sibling;else for(l=e.child;l!==null;)n|=l.lanes|l.childLanes,r|=l.subtreeFlags,r|=l.flags,l.return=e,l=l.sibling;return e.subtreeFlags|=r,e.childLanes=n,t}function Gd(e,t,n){var r=t.pendingProps;switch(Do(t),t.tag){case 2:case 16:case 15:case 0:case 11:case 7:case 8:case 12:case 9:case 14:return me(t),null;case 1:return je(t.type)&&cl(),me(t),null;case 3:return r=t.stateNode,Pn(),V(Ce),V(ye),Wo(),r.pendingContext&&(r.context=r.pendingContext,r.pendingContext=null),(e===null||e.child===null)&&(Fr(t)?t.flags|=4:e===null||e.memoizedState.isDehydrated&&!(t.flags&256)||(t.flags|=1024,Ge!==null&&(ao(Ge),Ge=null))),to(e,t),me(t),null;case 5:Bo(t);var l=Yt(hr.current);if(n=t.type,e!==null&&t.stateNode!=null)yc(e,t,n,r,l),e.ref!==t.ref&&(t.flags|=512,t.flags|=2097152);else{if(!r){if(t.stateNode===null)throw Error(w(166));return me(t),null}if(e=Yt(nt.current),Fr(t)){r=t.stateNode,n=t.type;var i=t.memoizedProps;switch(r[et]=t,r[dr]=i,e=(t.mode&1)!==0,n){case"dialog":W("cancel",r),W("close",r);break;case"iframe":case"object":case"embed":W("load",r);break;case"video":case"audio":for(l=0;l<Kn.length;l++)W(Kn[l],r);break;case"source":W("error",r);break;case"img":case"image":case"link":W("error",r),W("load",r);break;case"details":W("toggle",r);break;case"input":ys(r,i),W("invalid",r);break;case"select":r._wrapperState={wasMultiple:!!i.multiple},W("invalid",r);break;case"textarea":xs(r,i),W("invalid",r)}Pi(n,i),l=null;for(var o in i)if(i.hasOwnProperty(o)){var s=i[o];o==="children"?typeof s=="string"?r.textContent!==s&&(i.suppressHydrationWarning!==!0&&Or(r.textContent,s,e),l=["children",s]):typeof s=="number"&&r.textContent!==""+s&&(i.suppressHydrationWarning!==!0&&Or(r.textContent,s,e),l=["children",""+s]):nr.hasOwnProperty(o)&&s!=null&&o==="onScroll"&&W("scroll",r)}switch(n){case"input":Pr(r),ws(r,i,!0);break;case"textarea":Pr(r),ks(r);break;case"select":case"option":break;default:typeof i.onClick=="function"&&(r.onclick=al)}r=l,t.updateQueue=r,r!==null&&(t.flags|=4)}else{o=l.nodeType===9?l:l.ownerDocument,e==="http://www.w3.org/1999/xhtml"&&(e=Yu(n)),e==="http://www.w3.org/1999/xhtml"?n==="script"?(e=o.createElement("div"),e.innerHTML="<script><\/script>",e=e.removeChild(e.firstChild)):typeof r.is=="string"?e=o.createElement(n,{is:r.is}):(e=o.createElement(n),n==="select"&&(o=e,r.multiple?o.multiple=!0:r.size&&(o.size=r.size))):e=o.createElementNS(e,n),e[et]=t,e[dr]=r,gc(e,t,!1,!1),t.stateNode=e;e:{switch(o=Li(n,r),n){case"dialog":W("cancel",e),W("close",e),l=r;break;case"iframe":case"object":case"embed":W("load",e),l=r;break;case"video":case"audio":for(l=0;l<Kn.length;l++)W(Kn[l],e);l=r;break;case"source":W("error",e),l=r;break;case"img":case"image":case"link":W("error",e),W("load",e),l=r;break;case"details":W("toggle",e),l=r;break;case"input":ys(e,r),l=Ei(e,r),W("invalid",e);break;case"option":l=r;break;case"select":e._wrapperState={wasMultiple:!!r.multiple},l=Z({},r,{value:void 0}),W("invalid",e);break;case"textarea":xs(e,r),l=ji(e,r),W("invalid",e);break;default:l=r}Pi(n,l),s=l;for(i in s)if(s.hasOwnProperty(i)){var u=s[i];i==="style"?Zu(e,u):i==="dangerouslySetInnerHTML"?(u=u?u.__html:void 0,u!=null&&Gu(e,u)):i==="children"?typeof u=="string"?(n!=="textarea"||u!=="")&&rr(e,u):typeof u=="number"&&rr(e,""+u):i!=="suppressContentEditableWarning"&&i!=="suppressHydrationWarning"&&i!=="autoFocus"&&(nr.hasOwnProperty(i)?u!=null&&i==="onScroll"&&W("scroll",e):u!=null&&yo(e,i,u,o))}switch(n){case"input":Pr(e),ws(e,r,!1);break;case"textarea":Pr(e),ks(e);break;case"option":r.value!=null&&e.setAttribute("value",""+Rt(r.value));break;case"select":e.multiple=!!r.multiple,i=r.value,i!=null?yn(e,!!r.multiple,i,!1):r.defaultValue!=null&&yn(e,!!r.multiple,r.defaultValue,!0);break;default:typeof l.onClick=="function"&&(e.onclick=al)}switch(n){case"button":case"input":case"select":case"textarea":r=!!r.autoFocus;break e;case"img":r=!0;break e;default:r=!1}}r&&(t.flags|=4)}t.ref!==null&&(t.flags|=512,t.flags|=2097152)}return me(t),null;case 6:if(e&&t.stateNode!=null)wc(e,t,e.memoizedProps,r);else{if(typeof r!="string"&&t.stateNode===null)throw Error(w(166));if(n=Yt(hr.current),Yt(nt.current),Fr(t)){if(r=t.stateNode,n=t.memoizedProps,r[et]=t,(i=r.nodeValue!==n)&&(e=Ie,e!==null))switch(e.tag){case 3:Or(r.nodeValue,n,(e.mode&1)!==0);break;case 5:e.memoizedProps.suppressHydrationWarning!==!0&&Or(r.nodeValue,n,(e.mode&1)!==0)}i&&(t.flags|=4)}else r=(n.nodeType===9?n:n.ownerDocument).createTextNode(r),r[et]=t,t.stateNode=r}return me(t),null;case 13:if(V(G),r=t.memoizedState,e===null||e.memoizedState!==null&&e.memoizedState.dehydrated!==null){if(Q&&Te!==null&&t.mode&1&&!(t.flags&128))Fa(),jn(),t.flags|=98560,i=!1;else if(i=Fr(t),r!==null&&r.dehydrated!==null){if(e===null){if(!i)throw Error(w(318));if(i=t.memoizedState,i=i!==null?i.dehydrated:null,!i)throw Error(w(317));i[et]=t}else jn(),!(t.flags&128)&&(t.memoizedState=null),t.flags|=4;me(t),i=!1}else Ge!==null&&(ao(Ge),Ge=null),i=!0;if(!i)return t.flags&65536?t:null}return t.flags&128?(t.lanes=n,t):(r=r!==null,r!==(e!==null&&e.memoizedState!==null)&&r&&(t.child.flags|=8192,t.mode&1&&(e===null||G.current&1?le===0&&(le=3):es())),t.updateQueue!==null&&(t.flags|=4),me(t),null);case 4:return Pn(),to(e,t),e===null&&cr(t.stateNode.containerInfo),me(t),null;case 10:return Fo(t.type._context),me(t),null;case 17:return je(t.type)&&cl(),me(t),null;case 19:if(V(G),i=t.memoizedState,i===null)return me(t),null;if(r=(t.flags&128)!==0,o=i.rendering,o===null)if(r)Bn(i,!1);else{if(le!==0||e!==null&&e.flags&128)for(e=t.child;e!==null;){if(o=gl(e),o!==null){for(t.flags|=128,Bn(i,!1),r=o.updateQueue,r!==null&&(t.updateQueue=r,t.flags|=4),t.subtreeFlags=0,r=n,n=t.child;n!==null;)i=n,e=r,i.flags&=14680066,o=i.alternate,o===null?(i.childLanes=0,i.lanes=e,i.child=null,i.subtreeFlags=0,i.memoizedProps=null,i.memoizedState=null,i.updateQueue=null,i.dependencies=null,i.stateNode=null):(i.childLanes=o.childLanes,i.lanes=o.lanes,i.child=o.child,i.subtreeFlags=0,i.deletions=null,i.memoizedProps=o.memoizedProps,i.memoizedState=o.memoizedState,i.updateQueue=o.updateQueue,i.type=o.type,e=o.dependencies,i.dependencies=e===null?null:{lanes:e.lanes,firstContext:e.firstContext}),n=n.sibling;return A(G,G.current&1|2),t.child}e=e.sibling}i.tail!==null&&b()>Tn&&(t.flags|=128,r=!0,Bn(i,!1),t.lanes=4194304)}else{if(!r)if(e=gl(o),e!==null){if(t.flags|=128,r=!0,n=e.updateQueue,n!==null&&(t.updateQueue=n,t.flags|=4),Bn(i,!0),i.tail===null&&i.tailMode==="hidden"&&!o.alternate&&!Q)return me(t),null}else 2*b()-i.renderingStartTime>Tn&&n!==1073741824&&(t.flags|=128,r=!0,Bn(i,!1),t.lanes=4194304);i.isBackwards?(o.sibling=t.child,t.child=o):(n=i.last,n!==null?n.sibling=o:t.child=o,i.last=o)}return i.tail!==null?(t=i.tail,i.rendering=t,i.tail=t.sibling,i.renderingStartTime=b(),t.sibling=null,n=G.current,A(G,r?n&1|2:n&1),t):(me(t),null);case 22:case 23:return bo(),r=t.memoizedState!==null,e!==null&&e.memoizedState!==null!==r&&(t.flags|=8192),r&&t.mode&1?Le&1073741824&&(me(t),t.subtreeFlags&6&&(t.flags|=8192)):me(t),null;case 24:return null;case 25:return null}throw Error(w(156,t.tag))}function Xd(e,t){switch(Do(t),t.tag){case 1:return je(t.type)&&cl(),e=t.flags,e&65536?(t.flags=e&-65537|128,t):null;case 3:return Pn(),V(Ce),V(ye),Wo(),e=t.flags,e&65536&&!(e&128)?(t.flags=e&-65537|128,t):null;case 5:return Bo(t),null;case 13:if(V(G),e=t.memoizedState,e!==null&&e.dehydrated!==null){if(t.alternate===null)throw Error(w(340));jn()}return e=t.flags,e&65536?(t.flags=e&-65537|128,t):null;case 19:return V(G),null;case 4:return Pn(),null;case 10:return Fo(t.type._context),null;case 22:case 23:return bo(),null;case 24:return null;default:return null}}var $r=!1,ge=!1,Zd=typeof WeakSet=="function"?WeakSet:Set,j=null;function vn(e,t){var n=e.ref;if(n!==null)if(typeof n=="function")try{n(null)}catch(r){q(e,t,r)}else n.current=null}function no(e,t,n){try{n()}catch(r){q(e,t,r)}}var cu=!1;function Jd(e,t){if(Ai=ol,e=Na(),Io(e)){if("selectionStart"in e)var n={start:e.selectionStart,end:e.selectionEnd};else e:{n=(n=e.ownerDocument)&&n.defaultView||window;var r=n.getSelection&&n.getSelection();if(r&&r.rangeCount!==0){n=r.anchorNode;var l=r.anchorOffset,i=r.focusNode;r=r.focusOffset;try{n.nodeType,i.nodeType}catch{n=null;break e}var o=0,s=-1,u=-1,f=0,h=0,g=e,m=null;t:for(;;){for(var x;g!==n||l!==0&&g.nodeType!==3||(s=o+l),g!==i||r!==0&&g.nodeType!==3||(u=o+r),g.nodeType===3&&(o+=g.nodeValue.length),(x=g.firstChild)!==null;)m=g,g=x;for(;;){if(g===e)break t;if(m===n&&++f===l&&(s=o),m===i&&++h===r&&(u=o),(x=g.nextSibling)!==null)break;g=m,m=g.parentNode}g=x}n=s===-1||u===-1?null:{start:s,end:u}}else n=null}n=n||{start:0,end:0}}else n=null;for($i={focusedElem:e,selectionRange:n},ol=!1,j=t;j!==null;)if(t=j,e=t.child,(t.subtreeFlags&1028)!==0&&e!==null)e.return=t,j=e;else for(;j!==null;){t=j;try{var k=t.alternate;if(t.flags&1024)switch(t.tag){case 0:case 11:case 15:break;case 1:if(k!==null){var S=k.memoizedProps,O=k.memoizedState,d=t.stateNode,c=d.getSnapshotBeforeUpdate(t.elementType===t.type?S:Ke(t.type,S),O);d.__reactInternalSnapshotBeforeUpdate=c}break;case 3:var p=t.stateNode.containerInfo;p.nodeType===1?p.textContent="":p.nodeType===9&&p.documentElement&&p.removeChild(p.documentElement);break;case 5:case 6:case 4:case 17:break;default:throw Error(w(163))}}catch(y){q(t,t.return,y)}if(e=t.sibling,e!==null){e.return=t.return,j=e;break}j=t.return}return k=cu,cu=!1,k}function bn(e,t,n){var r=t.updateQueue;if(r=r!==null?r.lastEffect:null,r!==null){var l=r=r.next;do{if((l.tag&e)===e){var i=l.destroy;l.destroy=void 0,i!==void 0&&no(t,n,i)}l=l.next}while(l!==r)}}function Ml(e,t){if(t=t.updateQueue,t=t!==null?t.lastEffect:null,t!==null){var n=t=t.next;do{if((n.tag&e)===e){var r=n.create;n.destroy=r()}n=n.next}while(n!==t)}}function ro(e){var t=e.ref;if(t!==null){var n=e.stateNode;switch(e.tag){case 5:e=n;break;default:e=n}typeof t=="function"?t(e):t.current=e}}function xc(e){var t=e.alternate;t!==null&&(e.alternate=null,xc(t)),e.child=null,e.deletions=null,e.sibling=null,e.tag===5&&(t=e.stateNode,t!==null&&(delete t[et],delete t[dr],delete t[Vi],delete t[Dd],delete t[Rd])),e.stateNode=null,e.return=null,e.dependencies=null,e.memoizedProps=null,e.memoizedState=null,e.pendingProps=null,e.stateNode=null,e.updateQueue=null}function kc(e){return e.tag===5||e.tag===3||e.tag===4}function fu(e){e:for(;;){for(;e.sibling===null;){if(e.return===null||kc(e.return))return null;e=e.return}for(e.sibling.return=e.return,e=e.sibling;e.tag!==5&&e.tag!==6&&e.tag!==18;){if(e.flags&2||e.child===null||e.tag===4)continue e;e.child.return=e,e=e.child}if(!(e.flags&2))return e.stateNode}}function lo(e,t,n){var r=e.tag;if(r===5||r===6)e=e.stateNode,t?n.nodeType===8?n.parentNode.insertBefore(e,t):n.insertBefore(e,t):(n.nodeType===8?(t=n.parentNode,t.insertBefore(e,n)):(t=n,t.appendChild(e)),n=n._reactRootContainer,n!=null||t.onclick!==null||(t.onclick=al));else if(r!==4&&(e=e.child,e!==null))for(lo(e,t,n),e=e.sibling;e!==null;)lo(e,t,n),e=e.sibling}function io(e,t,n){var r=e.tag;if(r===5||r===6)e=e.stateNode,t?n.insertBefore(e,t):n.appendChild(e);else if(r!==4&&(e=e.child,e!==null))for(io(e,t,n),e=e.sibling;e!==null;)io(e,t,n),e=e.sibling}var ce=null,Ye=!1;function yt(e,t,n){for(n=n.child;n!==null;)Sc(e,t,n),n=n.sibling}function Sc(e,t,n){if(tt&&typeof tt.onCommitFiberUnmount=="function")try{tt.onCommitFiberUnmount(_l,n)}catch{}switch(n.tag){case 5:ge||vn(n,t);case 6:var r=ce,l=Ye;ce=null,yt(e,t,n),ce=r,Ye=l,ce!==null&&(Ye?(e=ce,n=n.stateNode,e.nodeType===8?e.parentNode.removeChild(n):e.removeChild(n)):ce.removeChild(n.stateNode));break;case 18:ce!==null&&(Ye?(e=ce,n=n.stateNode,e.nodeType===8?ui(e.parentNode,n):e.nodeType===1&&ui(e,n),sr(e)):ui(ce,n.stateNode));break;case 4:r=ce,l=Ye,ce=n.stateNode.containerInfo,Ye=!0,yt(e,t,n),ce=r,Ye=l;break;case 0:case 11:case 14:case 15:if(!ge&&(r=n.updateQueue,r!==null&&(r=r.lastEffect,r!==null))){l=r=r.next;do{var i=l,o=i.destroy;i=i.tag,o!==void 0&&(i&2||i&4)&&no(n,t,o),l=l.next}while(l!==r)}yt(e,t,n);break;case 1:if(!ge&&(vn(n,t),r=n.stateNode,typeof r.componentWillUnmount=="function"))try{r.props=n.memoizedProps,r.state=n.memoizedState,r.componentWillUnmount()}catch(s){q(n,t,s)}yt(e,t,n);break;case 21:yt(e,t,n);break;case 22:n.mode&1?(ge=(r=ge)||n.memoizedState!==null,yt(e,t,n),ge=r):yt(e,t,n);break;default:yt(e,t,n)}}function du(e){var t=e.updateQueue;if(t!==null){e.updateQueue=null;var n=e.stateNode;n===null&&(n=e.stateNode=new Zd),t.forEach(function(r){var l=op.bind(null,e,r);n.has(r)||(n.add(r),r.then(l,l))})}}function Qe(e,t){var n=t.deletions;if(n!==null)for(var r=0;r<n.length;r++){var l=n[r];try{var i=e,o=t,s=o;e:for(;s!==null;){switch(s.tag){case 5:ce=s.stateNode,Ye=!1;break e;case 3:ce=s.stateNode.containerInfo,Ye=!0;break e;case 4:ce=s.stateNode.containerInfo,Ye=!0;break e}s=s.return}if(ce===null)throw Error(w(160));Sc(i,o,l),ce=null,Ye=!1;var u=l.alternate;u!==null&&(u.return=null),l.return=null}catch(f){q(l,t,f)}}if(t.subtreeFlags&12854)for(t=t.child;t!==null;)Ec(t,e),t=t.sibling}function Ec(e,t){var n=e.alternate,r=e.flags;switch(e.tag){case 0:case 11:case 14:case 15:if(Qe(t,e),qe(e),r&4){try{bn(3,e,e.return),Ml(3,e)}catch(S){q(e,e.return,S)}try{bn(5,e,e.return)}catch(S){q(e,e.return,S)}}break;case 1:Qe(t,e),qe(e),r&512&&n!==null&&vn(n,n.return);break;case 5:if(Qe(t,e),qe(e),r&512&&n!==null&&vn(n,n.return),e.flags&32){var l=e.stateNode;try{rr(l,"")}catch(S){q(e,e.return,S)}}if(r&4&&(l=e.stateNode,l!=null)){var i=e.memoizedProps,o=n!==null?n.memoizedProps:i,s=e.type,u=e.updateQueue;if(e.updateQueue=null,u!==null)try{s==="input"&&i.type==="radio"&&i.name!=null&&Qu(l,i),Li(s,o);var f=Li(s,i);for(o=0;o<u.length;o+=2){var h=u[o],g=u[o+1];h==="style"?Zu(l,g):h==="dangerouslySetInnerHTML"?Gu(l,g):h==="children"?rr(l,g):yo(l,h,g,f)}switch(s){case"input":Ni(l,i);break;case"textarea":Ku(l,i);break;case"select":var m=l._wrapperState.wasMultiple;l._wrapperState.wasMultiple=!!i.multiple;var x=i.value;x!=null?yn(l,!!i.multiple,x,!1):m!==!!i.multiple&&(i.defaultValue!=null?yn(l,!!i.multiple,i.defaultValue,!0):yn(l,!!i.multiple,i.multiple?[]:"",!1))}l[dr]=i}catch(S){q(e,e.return,S)}}break;case 6:if(Qe(t,e),qe(e),r&4){if(e.stateNode===null)throw Error(w(162));l=e.stateNode,i=e.memoizedProps;try{l.nodeValue=i}catch(S){q(e,e.return,S)}}break;case 3:if(Qe(t,e),qe(e),r&4&&n!==null&&n.memoizedState.isDehydrated)try{sr(t.containerInfo)}catch(S){q(e,e.return,S)}break;case 4:Qe(t,e),qe(e);break;case 13:Qe(t,e),qe(e),l=e.child,l.flags&8192&&(i=l.memoizedState!==null,l.stateNode.isHidden=i,!i||l.alternate!==null&&l.alternate.memoizedState!==null||(Jo=b())),r&4&&du(e);break;case 22:if(h=n!==null&&n.memoizedState!==null,e.mode&1?(ge=(f=ge)||h,Qe(t,e),ge=f):Qe(t,e),qe(e),r&8192){if(f=e.memoizedState!==null,(e.stateNode.isHidden=f)&&!h&&e.mode&1)for(j=e,h=e.child;h!==null;){for(g=j=h;j!==null;){switch(m=j,x=m.child,m.tag){case 0:case 11:case 14:case 15:bn(4,m,m.return);break;case 1:vn(m,m.return);var k=m.stateNode;if(typeof k.componentWillUnmount=="function"){r=m,n=m.return;try{t=r,k.props=t.memoizedProps,k.state=t.memoizedState,k.componentWillUnmount()}catch(S){q(r,n,S)}}break;case 5:vn(m,m.return);break;case 22:if(m.memoizedState!==null){hu(g);continue}}x!==null?(x.return=m,j=x):hu(g)}h=h.sibling}e:for(h=null,g=e;;){if(g.tag===5){if(h===null){h=g;try{l=g.stateNode,f?(i=l.style,typeof i.setProperty=="function"?i.setProperty("display","none","important"):i.display="none"):(s=g.stateNode,u=g.memoizedProps.style,o=u!=null&&u.hasOwnProperty("display")?u.display:null,s.style.display=Xu("display",o))}catch(S){q(e,e.return,S)}}}else if(g.tag===6){if(h===null)try{g.stateNode.nodeValue=f?"":g.memoizedProps}catch(S){q(e,e.return,S)}}else if((g.tag!==22&&g.tag!==23||g.memoizedState===null||g===e)&&g.child!==null){g.child.return=g,g=g.child;continue}if(g===e)break e;for(;g.sibling===null;){if(g.return===null||g.return===e)break e;h===g&&(h=null),g=g.return}h===g&&(h=null),g.sibling.return=g.return,g=g.sibling}}break;case 19:Qe(t,e),qe(e),r&4&&du(e);break;case 21:break;default:Qe(t,e),qe(e)}}function qe(e){var t=e.flags;if(t&2){try{e:{for(var n=e.return;n!==null;){if(kc(n)){var r=n;break e}n=n.return}throw Error(w(160))}switch(r.tag){case 5:var l=r.stateNode;r.flags&32&&(rr(l,""),r.flags&=-33);var i=fu(e);io(e,i,l);break;case 3:case 4:var o=r.stateNode.containerInfo,s=fu(e);lo(e,s,o);break;default:throw Error(w(161))}}catch(u){q(e,e.return,u)}e.flags&=-3}t&4096&&(e.flags&=-4097)}function qd(e,t,n){j=e,Nc(e)}function Nc(e,t,n){for(var r=(e.mode&1)!==0;j!==null;){var l=j,i=l.child;if(l.tag===22&&r){var o=l.memoizedState!==null||$r;if(!o){var s=l.alternate,u=s!==null&&s.memoizedState!==null||ge;s=$r;var f=ge;if($r=o,(ge=u)&&!f)for(j=l;j!==null;)o=j,u=o.child,o.tag===22&&o.memoizedState!==null?mu(l):u!==null?(u.return=o,j=u):mu(l);for(;i!==null;)j=i,Nc(i),i=i.sibling;j=l,$r=s,ge=f}pu(e)}else l.subtreeFlags&8772&&i!==null?(i.return=l,j=i):pu(e)}}function pu(e){for(;j!==null;){var t=j;if(t.flags&8772){var n=t.alternate;try{if(t.flags&8772)switch(t.tag){case 0:case 11:case 15:ge||Ml(5,t);break;case 1:var r=t.stateNode;if(t.flags&4&&!ge)if(n===null)r.componentDidMount();else{var l=t.elementType===t.type?n.memoizedProps:Ke(t.type,n.memoizedProps);r.componentDidUpdate(l,n.memoizedState,r.__reactInternalSnapshotBeforeUpdate)}var i=t.updateQueue;i!==null&&Js(t,i,r);break;case 3:var o=t.updateQueue;if(o!==null){if(n=null,t.child!==null)switch(t.child.tag){case 5:n=t.child.stateNode;break;case 1:n=t.child.stateNode}Js(t,o,n)}break;case 5:var s=t.stateNode;if(n===null&&t.flags&4){n=s;var u=t.memoizedProps;switch(t.type){case"button":case"input":case"select":case"textarea":u.autoFocus&&n.focus();break;case"img":u.src&&(n.src=u.src)}}break;case 6:break;case 4:break;case 12:break;case 13:if(t.memoizedState===null){var f=t.alternate;if(f!==null){var h=f.memoizedState;if(h!==null){var g=h.dehydrated;g!==null&&sr(g)}}}break;case 19:case 17:case 21:case 22:case 23:case 25:break;default:throw Error(w(163))}ge||t.flags&512&&ro(t)}catch(m){q(t,t.return,m)}}if(t===e){j=null;break}if(n=t.sibling,n!==null){n.return=t.return,j=n;break}j=t.return}}function hu(e){for(;j!==null;){var t=j;if(t===e){j=null;break}var n=t.sibling;if(n!==null){n.return=t.return,j=n;break}j=t.return}}function mu(e){for(;j!==null;){var t=j;try{switch(t.tag){case 0:case 11:case 15:var n=t.return;try{Ml(4,t)}catch(u){q(t,n,u)}break;case 1:var r=t.stateNode;if(typeof r.componentDidMount=="function"){var l=t.return;try{r.componentDidMount()}catch(u){q(t,l,u)}}var i=t.return;try{ro(t)}catch(u){q(t,i,u)}break;case 5:var o=t.return;try{ro(t)}catch(u){q(t,o,u)}}}catch(u){q(t,t.return,u)}if(t===e){j=null;break}var s=t.sibling;if(s!==null){s.return=t.return,j=s;break}j=t.return}}var bd=Math.ceil,xl=ht.ReactCurrentDispatcher,Xo=ht.ReactCurrentOwner,We=ht.ReactCurrentBatchConfig,M=0,ue=null,te=null,fe=0,Le=0,gn=Ft(0),le=0,yr=null,bt=0,Ol=0,Zo=0,er=null,Ee=null,Jo=0,Tn=1/0,it=null,kl=!1,oo=null,It=null,Br=!1,Ct=null,Sl=0,tr=0,so=null,qr=-1,br=0;function xe(){return M&6?b():qr!==-1?qr:qr=b()}function zt(e){return e.mode&1?M&2&&fe!==0?fe&-fe:Od.transition!==null?(br===0&&(br=ua()),br):(e=F,e!==0||(e=window.event,e=e===void 0?16:ma(e.type)),e):1}function Ze(e,t,n,r){if(50<tr)throw tr=0,so=null,Error(w(185));xr(e,n,r),(!(M&2)||e!==ue)&&(e===ue&&(!(M&2)&&(Ol|=n),le===4&&Et(e,fe)),_e(e,r),n===1&&M===0&&!(t.mode&1)&&(Tn=b()+500,zl&&Ut()))}function _e(e,t){var n=e.callbackNode;Of(e,t);var r=il(e,e===ue?fe:0);if(r===0)n!==null&&Ns(n),e.callbackNode=null,e.callbackPriority=0;else if(t=r&-r,e.callbackPriority!==t){if(n!=null&&Ns(n),t===1)e.tag===0?Md(vu.bind(null,e)):Ra(vu.bind(null,e)),Id(function(){!(M&6)&&Ut()}),n=null;else{switch(aa(r)){case 1:n=Eo;break;case 4:n=oa;break;case 16:n=ll;break;case 536870912:n=sa;break;default:n=ll}n=zc(n,Cc.bind(null,e))}e.callbackPriority=t,e.callbackNode=n}}function Cc(e,t){if(qr=-1,br=0,M&6)throw Error(w(327));var n=e.callbackNode;if(En()&&e.callbackNode!==n)return null;var r=il(e,e===ue?fe:0);if(r===0)return null;if(r&30||r&e.expiredLanes||t)t=El(e,r);else{t=r;var l=M;M|=2;var i=_c();(ue!==e||fe!==t)&&(it=null,Tn=b()+500,Gt(e,t));do try{np();break}catch(s){jc(e,s)}while(!0);Oo(),xl.current=i,M=l,te!==null?t=0:(ue=null,fe=0,t=le)}if(t!==0){if(t===2&&(l=Ri(e),l!==0&&(r=l,t=uo(e,l))),t===1)throw n=yr,Gt(e,0),Et(e,r),_e(e,b()),n;if(t===6)Et(e,r);else{if(l=e.current.alternate,!(r&30)&&!ep(l)&&(t=El(e,r),t===2&&(i=Ri(e),i!==0&&(r=i,t=uo(e,i))),t===1))throw n=yr,Gt(e,0),Et(e,r),_e(e,b()),n;switch(e.finishedWork=l,e.finishedLanes=r,t){case 0:case 1:throw Error(w(345));case 2:Ht(e,Ee,it);break;case 3:if(Et(e,r),(r&130023424)===r&&(t=Jo+500-b(),10<t)){if(il(e,0)!==0)break;if(l=e.suspendedLanes,(l&r)!==r){xe(),e.pingedLanes|=e.suspendedLanes&l;break}e.timeoutHandle=Wi(Ht.bind(null,e,Ee,it),t);break}Ht(e,Ee,it);break;case 4:if(Et(e,r),(r&4194240)===r)break;for(t=e.eventTimes,l=-1;0<r;){var o=31-Xe(r);i=1<<o,o=t[o],o>l&&(l=o),r&=~i}if(r=l,r=b()-r,r=(120>r?120:480>r?480:1080>r?1080:1920>r?1920:3e3>r?3e3:4320>r?4320:1960*bd(r/1960))-r,10<r){e.timeoutHandle=Wi(Ht.bind(null,e,Ee,it),r);break}Ht(e,Ee,it);break;case 5:Ht(e,Ee,it);break;default:throw Error(w(329))}}}return _e(e,b()),e.callbackNode===n?Cc.bind(null,e):null}function uo(e,t){var n=er;return e.current.memoizedState.isDehydrated&&(Gt(e,t).flags|=256),e=El(e,t),e!==2&&(t=Ee,Ee=n,t!==null&&ao(t)),e}function ao(e){Ee===null?Ee=e:Ee.push.apply(Ee,e)}function ep(e){for(var t=e;;){if(t.flags&16384){var n=t.updateQueue;if(n!==null&&(n=n.stores,n!==null))for(var r=0;r<n.length;r++){var l=n[r],i=l.getSnapshot;l=l.value;try{if(!Je(i(),l))return!1}catch{return!1}}}if(n=t.child,t.subtreeFlags&16384&&n!==null)n.return=t,t=n;else{if(t===e)break;for(;t.sibling===null;){if(t.return===null||t.return===e)return!0;t=t.return}t.sibling.return=t.return,t=t.sibling}}return!0}function Et(e,t){for(t&=~Zo,t&=~Ol,e.suspendedLanes|=t,e.pingedLanes&=~t,e=e.expirationTimes;0<t;){var n=31-Xe(t),r=1<<n;e[n]=-1,t&=~r}}function vu(e){if(M&6)throw Error(w(327));En();var t=il(e,0);if(!(t&1))return _e(e,b()),null;var n=El(e,t);if(e.tag!==0&&n===2){var r=Ri(e);r!==0&&(t=r,n=uo(e,r))}if(n===1)throw n=yr,Gt(e,0),Et(e,t),_e(e,b()),n;if(n===6)throw Error(w(345));return e.finishedWork=e.current.alternate,e.finishedLanes=t,Ht(e,Ee,it),_e(e,b()),null}function qo(e,t){var n=M;M|=1;try{return e(t)}finally{M=n,M===0&&(Tn=b()+500,zl&&Ut())}}function en(e){Ct!==null&&Ct.tag===0&&!(M&6)&&En();var t=M;M|=1;var n=We.transition,r=F;try{if(We.transition=null,F=1,e)return e()}finally{F=r,We.transition=n,M=t,!(M&6)&&Ut()}}function bo(){Le=gn.current,V(gn)}function Gt(e,t){e.finishedWork=null,e.finishedLanes=0;var n=e.timeoutHandle;if(n!==-1&&(e.timeoutHandle=-1,Td(n)),te!==null)for(n=te.return;n!==null;){var r=n;switch(Do(r),r.tag){case 1:r=r.type.childContextTypes,r!=null&&cl();break;case 3:Pn(),V(Ce),V(ye),Wo();break;case 5:Bo(r);break;case 4:Pn();break;case 13:V(G);break;case 19:V(G);break;case 10:Fo(r.type._context);break;case 22:case 23:bo()}n=n.return}if(ue=e,te=e=Dt(e.current,null),fe=Le=t,le=0,yr=null,Zo=Ol=bt=0,Ee=er=null,Kt!==null){for(t=0;t<Kt.length;t++)if(n=Kt[t],r=n.interleaved,r!==null){n.interleaved=null;var l=r.next,i=n.pending;if(i!==null){var o=i.next;i.next=l,r.next=o}n.pending=r}Kt=null}return e}function jc(e,t){do{var n=te;try{if(Oo(),Xr.current=wl,yl){for(var r=X.memoizedState;r!==null;){var l=r.queue;l!==null&&(l.pending=null),r=r.next}yl=!1}if(qt=0,se=re=X=null,qn=!1,mr=0,Xo.current=null,n===null||n.return===null){le=1,yr=t,te=null;break}e:{var i=e,o=n.return,s=n,u=t;if(t=fe,s.flags|=32768,u!==null&&typeof u=="object"&&typeof u.then=="function"){var f=u,h=s,g=h.tag;if(!(h.mode&1)&&(g===0||g===11||g===15)){var m=h.alternate;m?(h.updateQueue=m.updateQueue,h.memoizedState=m.memoizedState,h.lanes=m.lanes):(h.updateQueue=null,h.memoizedState=null)}var x=ru(o);if(x!==null){x.flags&=-257,lu(x,o,s,i,t),x.mode&1&&nu(i,f,t),t=x,u=f;var k=t.updateQueue;if(k===null){var S=new Set;S.add(u),t.updateQueue=S}else k.add(u);break e}else{if(!(t&1)){nu(i,f,t),es();break e}u=Error(w(426))}}else if(Q&&s.mode&1){var O=ru(o);if(O!==null){!(O.flags&65536)&&(O.flags|=256),lu(O,o,s,i,t),Ro(Ln(u,s));break e}}i=u=Ln(u,s),le!==4&&(le=2),er===null?er=[i]:er.push(i),i=o;do{switch(i.tag){case 3:i.flags|=65536,t&=-t,i.lanes|=t;var d=ac(i,u,t);Zs(i,d);break e;case 1:s=u;var c=i.type,p=i.stateNode;if(!(i.flags&128)&&(typeof c.getDerivedStateFromError=="function"||p!==null&&typeof p.componentDidCatch=="function"&&(It===null||!It.has(p)))){i.flags|=65536,t&=-t,i.lanes|=t;var y=cc(i,s,t);Zs(i,y);break e}}i=i.return}while(i!==null)}Lc(n)}catch(E){t=E,te===n&&n!==null&&(te=n=n.return);continue}break}while(!0)}function _c(){var e=xl.current;return xl.current=wl,e===null?wl:e}function es(){(le===0||le===3||le===2)&&(le=4),ue===null||!(bt&268435455)&&!(Ol&268435455)||Et(ue,fe)}function El(e,t){var n=M;M|=2;var r=_c();(ue!==e||fe!==t)&&(it=null,Gt(e,t));do try{tp();break}catch(l){jc(e,l)}while(!0);if(Oo(),M=n,xl.current=r,te!==null)throw Error(w(261));return ue=null,fe=0,le}function tp(){for(;te!==null;)Pc(te)}function np(){for(;te!==null&&!_f();)Pc(te)}function Pc(e){var t=Ic(e.alternate,e,Le);e.memoizedProps=e.pendingProps,t===null?Lc(e):te=t,Xo.current=null}function Lc(e){var t=e;do{var n=t.alternate;if(e=t.return,t.flags&32768){if(n=Xd(n,t),n!==null){n.flags&=32767,te=n;return}if(e!==null)e.flags|=32768,e.subtreeFlags=0,e.deletions=null;else{le=6,te=null;return}}else if(n=Gd(n,t,Le),n!==null){te=n;return}if(t=t.sibling,t!==null){te=t;return}te=t=e}while(t!==null);le===0&&(le=5)}function Ht(e,t,n){var r=F,l=We.transition;try{We.transition=null,F=1,rp(e,t,n,r)}finally{We.transition=l,F=r}return null}function rp(e,t,n,r){do En();while(Ct!==null);if(M&6)throw Error(w(327));n=e.finishedWork;var l=e.finishedLanes;if(n===null)return null;if(e.finishedWork=null,e.finishedLanes=0,n===e.current)throw Error(w(177));e.callbackNode=null,e.callbackPriority=0;var i=n.lanes|n.childLanes;if(Ff(e,i),e===ue&&(te=ue=null,fe=0),!(n.subtreeFlags&2064)&&!(n.flags&2064)||Br||(Br=!0,zc(ll,function(){return En(),null})),i=(n.flags&15990)!==0,n.subtreeFlags&15990||i){i=We.transition,We.transition=null;var o=F;F=1;var s=M;M|=4,Xo.current=null,Jd(e,n),Ec(n,e),Ed($i),ol=!!Ai,$i=Ai=null,e.current=n,qd(n),Pf(),M=s,F=o,We.transition=i}else e.current=n;if(Br&&(Br=!1,Ct=e,Sl=l),i=e.pendingLanes,i===0&&(It=null),If(n.stateNode),_e(e,b()),t!==null)for(r=e.onRecoverableError,n=0;n<t.length;n++)l=t[n],r(l.value,{componentStack:l.stack,digest:l.digest});if(kl)throw kl=!1,e=oo,oo=null,e;return Sl&1&&e.tag!==0&&En(),i=e.pendingLanes,i&1?e===so?tr++:(tr=0,so=e):tr=0,Ut(),null}function En(){if(Ct!==null){var e=aa(Sl),t=We.transition,n=F;try{if(We.transition=null,F=16>e?16:e,Ct===null)var r=!1;else{if(e=Ct,Ct=null,Sl=0,M&6)throw Error(w(331));var l=M;for(M|=4,j=e.current;j!==null;){var i=j,o=i.child;if(j.flags&16){var s=i.deletions;if(s!==null){for(var u=0;u<s.length;u++){var f=s[u];for(j=f;j!==null;){var h=j;switch(h.tag){case 0:case 11:case 15:bn(8,h,i)}var g=h.child;if(g!==null)g.return=h,j=g;else for(;j!==null;){h=j;var m=h.sibling,x=h.return;if(xc(h),h===f){j=null;break}if(m!==null){m.return=x,j=m;break}j=x}}}var k=i.alternate;if(k!==null){var S=k.child;if(S!==null){k.child=null;do{var O=S.sibling;S.sibling=null,S=O}while(S!==null)}}j=i}}if(i.subtreeFlags&2064&&o!==null)o.return=i,j=o;else e:for(;j!==null;){if(i=j,i.flags&2048)switch(i.tag){case 0:case 11:case 15:bn(9,i,i.return)}var d=i.sibling;if(d!==null){d.return=i.return,j=d;break e}j=i.return}}var c=e.current;for(j=c;j!==null;){o=j;var p=o.child;if(o.subtreeFlags&2064&&p!==null)p.return=o,j=p;else e:for(o=c;j!==null;){if(s=j,s.flags&2048)try{switch(s.tag){case 0:case 11:case 15:Ml(9,s)}}catch(E){q(s,s.return,E)}if(s===o){j=null;break e}var y=s.sibling;if(y!==null){y.return=s.return,j=y;break e}j=s.return}}if(M=l,Ut(),tt&&typeof tt.onPostCommitFiberRoot=="function")try{tt.onPostCommitFiberRoot(_l,e)}catch{}r=!0}return r}finally{F=n,We.transition=t}}return!1}function gu(e,t,n){t=Ln(n,t),t=ac(e,t,1),e=Tt(e,t,1),t=xe(),e!==null&&(xr(e,1,t),_e(e,t))}function q(e,t,n){if(e.tag===3)gu(e,e,n);else for(;t!==null;){if(t.tag===3){gu(t,e,n);break}else if(t.tag===1){var r=t.stateNode;if(typeof t.type.getDerivedStateFromError=="function"||typeof r.componentDidCatch=="function"&&(It===null||!It.has(r))){e=Ln(n,e),e=cc(t,e,1),t=Tt(t,e,1),e=xe(),t!==null&&(xr(t,1,e),_e(t,e));break}}t=t.return}}function lp(e,t,n){var r=e.pingCache;r!==null&&r.delete(t),t=xe(),e.pingedLanes|=e.suspendedLanes&n,ue===e&&(fe&n)===n&&(le===4||le===3&&(fe&130023424)===fe&&500>b()-Jo?Gt(e,0):Zo|=n),_e(e,t)}function Tc(e,t){t===0&&(e.mode&1?(t=Ir,Ir<<=1,!(Ir&130023424)&&(Ir=4194304)):t=1);var n=xe();e=dt(e,t),e!==null&&(xr(e,t,n),_e(e,n))}function ip(e){var t=e.memoizedState,n=0;t!==null&&(n=t.retryLane),Tc(e,n)}function op(e,t){var n=0;switch(e.tag){case 13:var r=e.stateNode,l=e.memoizedState;l!==null&&(n=l.retryLane);break;case 19:r=e.stateNode;break;default:throw Error(w(314))}r!==null&&r.delete(t),Tc(e,n)}var Ic;Ic=function(e,t,n){if(e!==null)if(e.memoizedProps!==t.pendingProps||Ce.current)Ne=!0;else{if(!(e.lanes&n)&&!(t.flags&128))return Ne=!1,Yd(e,t,n);Ne=!!(e.flags&131072)}else Ne=!1,Q&&t.flags&1048576&&Ma(t,pl,t.index);switch(t.lanes=0,t.tag){case 2:var r=t.type;Jr(e,t),e=t.pendingProps;var l=Cn(t,ye.current);Sn(t,n),l=Ho(null,t,r,e,l,n);var i=Qo();return t.flags|=1,typeof l=="object"&&l!==null&&typeof l.render=="function"&&l.$$typeof===void 0?(t.tag=1,t.memoizedState=null,t.updateQueue=null,je(r)?(i=!0,fl(t)):i=!1,t.memoizedState=l.state!==null&&l.state!==void 0?l.state:null,Ao(t),l.updater=Rl,t.stateNode=l,l._reactInternals=t,Xi(t,r,e,n),t=qi(null,t,r,!0,i,n)):(t.tag=0,Q&&i&&zo(t),we(null,t,l,n),t=t.child),t;case 16:r=t.elementType;e:{switch(Jr(e,t),e=t.pendingProps,l=r._init,r=l(r._payload),t.type=r,l=t.tag=up(r),e=Ke(r,e),l){case 0:t=Ji(null,t,r,e,n);break e;case 1:t=su(null,t,r,e,n);break e;case 11:t=iu(null,t,r,e,n);break e;case 14:t=ou(null,t,r,Ke(r.type,e),n);break e}throw Error(w(306,r,""))}return t;case 0:return r=t.type,l=t.pendingProps,l=t.elementType===r?l:Ke(r,l),Ji(e,t,r,l,n);case 1:return r=t.type,l=t.pendingProps,l=t.elementType===r?l:Ke(r,l),su(e,t,r,l,n);case 3:e:{if(hc(t),e===null)throw Error(w(387));r=t.pendingProps,i=t.memoizedState,l=i.element,Ba(e,t),vl(t,r,null,n);var o=t.memoizedState;if(r=o.element,i.isDehydrated)if(i={element:r,isDehydrated:!1,cache:o.cache,pendingSuspenseBoundaries:o.pendingSuspenseBoundaries,transitions:o.transitions},t.updateQueue.baseState=i,t.memoizedState=i,t.flags&256){l=Ln(Error(w(423)),t),t=uu(e,t,r,n,l);break e}else if(r!==l){l=Ln(Error(w(424)),t),t=uu(e,t,r,n,l);break e}else for(Te=Lt(t.stateNode.containerInfo.firstChild),Ie=t,Q=!0,Ge=null,n=Aa(t,null,r,n),t.child=n;n;)n.flags=n.flags&-3|4096,n=n.sibling;else{if(jn(),r===l){t=pt(e,t,n);break e}we(e,t,r,n)}t=t.child}return t;case 5:return Wa(t),e===null&&Ki(t),r=t.type,l=t.pendingProps,i=e!==null?e.memoizedProps:null,o=l.children,Bi(r,l)?o=null:i!==null&&Bi(r,i)&&(t.flags|=32),pc(e,t),we(e,t,o,n),t.child;case 6:return e===null&&Ki(t),null;case 13:return mc(e,t,n);case 4:return $o(t,t.stateNode.containerInfo),r=t.pendingProps,e===null?t.child=_n(t,null,r,n):we(e,t,r,n),t.child;case 11:return r=t.type,l=t.pendingProps,l=t.elementType===r?l:Ke(r,l),iu(e,t,r,l,n);case 7:return we(e,t,t.pendingProps,n),t.child;case 8:return we(e,t,t.pendingProps.children,n),t.child;case 12:return we(e,t,t.pendingProps.children,n),t.child;case 10:e:{if(r=t.type._context,l=t.pendingProps,i=t.memoizedProps,o=l.value,A(hl,r._currentValue),r._currentValue=o,i!==null)if(Je(i.value,o)){if(i.children===l.children&&!Ce.current){t=pt(e,t,n);break e}}else for(i=t.child,i!==null&&(i.return=t);i!==null;){var s=i.dependencies;if(s!==null){o=i.child;for(var u=s.firstContext;u!==null;){if(u.context===r){if(i.tag===1){u=at(-1,n&-n),u.tag=2;var f=i.updateQueue;if(f!==null){f=f.shared;var h=f.pending;h===null?u.next=u:(u.next=h.next,h.next=u),f.pending=u}}i.lanes|=n,u=i.alternate,u!==null&&(u.lanes|=n),Yi(i.return,n,t),s.lanes|=n;break}u=u.next}}else if(i.tag===10)o=i.type===t.type?null:i.child;else if(i.tag===18){if(o=i.return,o===null)throw Error(w(341));o.lanes|=n,s=o.alternate,s!==null&&(s.lanes|=n),Yi(o,n,t),o=i.sibling}else o=i.child;if(o!==null)o.return=i;else for(o=i;o!==null;){if(o===t){o=null;break}if(i=o.sibling,i!==null){i.return=o.return,o=i;break}o=o.return}i=o}we(e,t,l.children,n),t=t.child}return t;case 9:return l=t.type,r=t.pendingProps.children,Sn(t,n),l=Ve(l),r=r(l),t.flags|=1,we(e,t,r,n),t.child;case 14:return r=t.type,l=Ke(r,t.pendingProps),l=Ke(r.type,l),ou(e,t,r,l,n);case 15:return fc(e,t,t.type,t.pendingProps,n);case 17:return r=t.type,l=t.pendingProps,l=t.elementType===r?l:Ke(r,l),Jr(e,t),t.tag=1,je(r)?(e=!0,fl(t)):e=!1,Sn(t,n),uc(t,r,l),Xi(t,r,l,n),qi(null,t,r,!0,e,n);case 19:return vc(e,t,n);case 22:return dc(e,t,n)}throw Error(w(156,t.tag))};function zc(e,t){return ia(e,t)}function sp(e,t,n,r){this.tag=e,this.key=n,this.sibling=this.child=this.return=this.stateNode=this.type=this.elementType=null,this.index=0,this.ref=null,this.pendingProps=t,this.dependencies=this.memoizedState=this.updateQueue=this.memoizedProps=null,this.mode=r,this.subtreeFlags=this.flags=0,this.deletions=null,this.childLanes=this.lanes=0,this.alternate=null}function Be(e,t,n,r){return new sp(e,t,n,r)}function ts(e){return e=e.prototype,!(!e||!e.isReactComponent)}function up(e){if(typeof e=="function")return ts(e)?1:0;if(e!=null){if(e=e.$$typeof,e===xo)return 11;if(e===ko)return 14}return 2}function Dt(e,t){var n=e.alternate;return n===null?(n=Be(e.tag,t,e.key,e.mode),n.elementType=e.elementType,n.type=e.type,n.stateNode=e.stateNode,n.alternate=e,e.alternate=n):(n.pendingProps=t,n.type=e.type,n.flags=0,n.subtreeFlags=0,n.deletions=null),n.flags=e.flags&14680064,n.childLanes=e.childLanes,n.lanes=e.lanes,n.child=e.child,n.memoizedProps=e.memoizedProps,n.memoizedState=e.memoizedState,n.updateQueue=e.updateQueue,t=e.dependencies,n.dependencies=t===null?null:{lanes:t.lanes,firstContext:t.firstContext},n.sibling=e.sibling,n.index=e.index,n.ref=e.ref,n}function el(e,t,n,r,l,i){var o=2;if(r=e,typeof e=="function")ts(e)&&(o=1);else if(typeof e=="string")o=5;else e:switch(e){case sn:return Xt(n.children,l,i,t);case wo:o=8,l|=8;break;case wi:return e=Be(12,n,t,l|2),e.elementType=wi,e.lanes=i,e;case xi:return e=Be(13,n,t,l),e.elementType=xi,e.lanes=i,e;case ki:return e=Be(19,n,t,l),e.elementType=ki,e.lanes=i,e;case Wu:return Fl(n,l,i,t);default:if(typeof e=="object"&&e!==null)switch(e.$$typeof){case $u:o=10;break e;case Bu:o=9;break e;case xo:o=11;break e;case ko:o=14;break e;case xt:o=16,r=null;break e}throw Error(w(130,e==null?e:typeof e,""))}return t=Be(o,n,t,l),t.elementType=e,t.type=r,t.lanes=i,t}function Xt(e,t,n,r){return e=Be(7,e,r,t),e.lanes=n,e}function Fl(e,t,n,r){return e=Be(22,e,r,t),e.elementType=Wu,e.lanes=n,e.stateNode={isHidden:!1},e}function vi(e,t,n){return e=Be(6,e,null,t),e.lanes=n,e}function gi(e,t,n){return t=Be(4,e.children!==null?e.children:[],e.key,t),t.lanes=n,t.stateNode={containerInfo:e.containerInfo,pendingChildren:null,implementation:e.implementation},t}function ap(e,t,n,r,l){this.tag=t,this.containerInfo=e,this.finishedWork=this.pingCache=this.current=this.pendingChildren=null,this.timeoutHandle=-1,this.callbackNode=this.pendingContext=this.context=null,this.callbackPriority=0,this.eventTimes=Jl(0),this.expirationTimes=Jl(-1),this.entangledLanes=this.finishedLanes=this.mutableReadLanes=this.expiredLanes=this.pingedLanes=this.suspendedLanes=this.pendingLanes=0,this.entanglements=Jl(0),this.identifierPrefix=r,this.onRecoverableError=l,this.mutableSourceEagerHydrationData=null}function ns(e,t,n,r,l,i,o,s,u){return e=new ap(e,t,n,s,u),t===1?(t=1,i===!0&&(t|=8)):t=0,i=Be(3,null,null,t),e.current=i,i.stateNode=e,i.memoizedState={element:r,isDehydrated:n,cache:null,transitions:null,pendingSuspenseBoundaries:null},Ao(i),e}function cp(e,t,n){var r=3<arguments.length&&arguments[3]!==void 0?arguments[3]:null;return{$$typeof:on,key:r==null?null:""+r,children:e,containerInfo:t,implementation:n}}function Dc(e){if(!e)return Mt;e=e._reactInternals;e:{if(nn(e)!==e||e.tag!==1)throw Error(w(170));var t=e;do{switch(t.tag){case 3:t=t.stateNode.context;break e;case 1:if(je(t.type)){t=t.stateNode.__reactInternalMemoizedMergedChildContext;break e}}t=t.return}while(t!==null);throw Error(w(171))}if(e.tag===1){var n=e.type;if(je(n))return Da(e,n,t)}return t}function Rc(e,t,n,r,l,i,o,s,u){return e=ns(n,r,!0,e,l,i,o,s,u),e.context=Dc(null),n=e.current,r=xe(),l=zt(n),i=at(r,l),i.callback=t??null,Tt(n,i,l),e.current.lanes=l,xr(e,l,r),_e(e,r),e}function Ul(e,t,n,r){var l=t.current,i=xe(),o=zt(l);return n=Dc(n),t.context===null?t.context=n:t.pendingContext=n,t=at(i,o),t.payload={element:e},r=r===void 0?null:r,r!==null&&(t.callback=r),e=Tt(l,t,o),e!==null&&(Ze(e,l,o,i),Gr(e,l,o)),o}function Nl(e){if(e=e.current,!e.child)return null;switch(e.child.tag){case 5:return e.child.stateNode;default:return e.child.stateNode}}function yu(e,t){if(e=e.memoizedState,e!==null&&e.dehydrated!==null){var n=e.retryLane;e.retryLane=n!==0&&n<t?n:t}}function rs(e,t){yu(e,t),(e=e.alternate)&&yu(e,t)}function fp(){return null}var Mc=typeof reportError=="function"?reportError:function(e){console.error(e)};function ls(e){this._internalRoot=e}Al.prototype.render=ls.prototype.render=function(e){var t=this._internalRoot;if(t===null)throw Error(w(409));Ul(e,t,null,null)};Al.prototype.unmount=ls.prototype.unmount=function(){var e=this._internalRoot;if(e!==null){this._internalRoot=null;var t=e.containerInfo;en(function(){Ul(null,e,null,null)}),t[ft]=null}};function Al(e){this._internalRoot=e}Al.prototype.unstable_scheduleHydration=function(e){if(e){var t=da();e={blockedOn:null,target:e,priority:t};for(var n=0;n<St.length&&t!==0&&t<St[n].priority;n++);St.splice(n,0,e),n===0&&ha(e)}};function is(e){return!(!e||e.nodeType!==1&&e.nodeType!==9&&e.nodeType!==11)}function $l(e){return!(!e||e.nodeType!==1&&e.nodeType!==9&&e.nodeType!==11&&(e.nodeType!==8||e.nodeValue!==" react-mount-point-unstable "))}function wu(){}function dp(e,t,n,r,l){if(l){if(typeof r=="function"){var i=r;r=function(){var f=Nl(o);i.call(f)}}var o=Rc(t,r,e,0,null,!1,!1,"",wu);return e._reactRootContainer=o,e[ft]=o.current,cr(e.nodeType===8?e.parentNode:e),en(),o}for(;l=e.lastChild;)e.removeChild(l);if(typeof r=="function"){var s=r;r=function(){var f=Nl(u);s.call(f)}}var u=ns(e,0,!1,null,null,!1,!1,"",wu);return e._reactRootContainer=u,e[ft]=u.current,cr(e.nodeType===8?e.parentNode:e),en(function(){Ul(t,u,n,r)}),u}function Bl(e,t,n,r,l){var i=n._reactRootContainer;if(i){var o=i;if(typeof l=="function"){var s=l;l=function(){var u=Nl(o);s.call(u)}}Ul(t,o,e,l)}else o=dp(n,t,e,l,r);return Nl(o)}ca=function(e){switch(e.tag){case 3:var t=e.stateNode;if(t.current.memoizedState.isDehydrated){var n=Qn(t.pendingLanes);n!==0&&(No(t,n|1),_e(t,b()),!(M&6)&&(Tn=b()+500,Ut()))}break;case 13:en(function(){var r=dt(e,1);if(r!==null){var l=xe();Ze(r,e,1,l)}}),rs(e,1)}};Co=function(e){if(e.tag===13){var t=dt(e,134217728);if(t!==null){var n=xe();Ze(t,e,134217728,n)}rs(e,134217728)}};fa=function(e){if(e.tag===13){var t=zt(e),n=dt(e,t);if(n!==null){var r=xe();Ze(n,e,t,r)}rs(e,t)}};da=function(){return F};pa=function(e,t){var n=F;try{return F=e,t()}finally{F=n}};Ii=function(e,t,n){switch(t){case"input":if(Ni(e,n),t=n.name,n.type==="radio"&&t!=null){for(n=e;n.parentNode;)n=n.parentNode;for(n=n.querySelectorAll("input[name="+JSON.stringify(""+t)+'][type="radio"]'),t=0;t<n.length;t++){var r=n[t];if(r!==e&&r.form===e.form){var l=Il(r);if(!l)throw Error(w(90));Hu(r),Ni(r,l)}}}break;case"textarea":Ku(e,n);break;case"select":t=n.value,t!=null&&yn(e,!!n.multiple,t,!1)}};bu=qo;ea=en;var pp={usingClientEntryPoint:!1,Events:[Sr,fn,Il,Ju,qu,qo]},Wn={findFiberByHostInstance:Qt,bundleType:0,version:"18.3.1",rendererPackageName:"react-dom"},hp={bundleType:Wn.bundleType,version:Wn.version,rendererPackageName:Wn.rendererPackageName,rendererConfig:Wn.rendererConfig,overrideHookState:null,overrideHookStateDeletePath:null,overrideHookStateRenamePath:null,overrideProps:null,overridePropsDeletePath:null,overridePropsRenamePath:null,setErrorHandler:null,setSuspenseHandler:null,scheduleUpdate:null,currentDispatcherRef:ht.ReactCurrentDispatcher,findHostInstanceByFiber:function(e){return e=ra(e),e===null?null:e.stateNode},findFiberByHostInstance:Wn.findFiberByHostInstance||fp,findHostInstancesForRefresh:null,scheduleRefresh:null,scheduleRoot:null,setRefreshHandler:null,getCurrentFiber:null,reconcilerVersion:"18.3.1-next-f1338f8080-20240426"};if(typeof __REACT_DEVTOOLS_GLOBAL_HOOK__<"u"){var Wr=__REACT_DEVTOOLS_GLOBAL_HOOK__;if(!Wr.isDisabled&&Wr.supportsFiber)try{_l=Wr.inject(hp),tt=Wr}catch{}}De.__SECRET_INTERNALS_DO_NOT_USE_OR_YOU_WILL_BE_FIRED=pp;De.createPortal=function(e,t){var n=2<arguments.length&&arguments[2]!==void 0?arguments[2]:null;if(!is(t))throw Error(w(200));return cp(e,t,null,n)};De.createRoot=function(e,t){if(!is(e))throw Error(w(299));var n=!1,r="",l=Mc;return t!=null&&(t.unstable_strictMode===!0&&(n=!0),t.identifierPrefix!==void 0&&(r=t.identifierPrefix),t.onRecoverableError!==void 0&&(l=t.onRecoverableError)),t=ns(e,1,!1,null,null,n,!1,r,l),e[ft]=t.current,cr(e.nodeType===8?e.parentNode:e),new ls(t)};De.findDOMNode=function(e){if(e==null)return null;if(e.nodeType===1)return e;var t=e._reactInternals;if(t===void 0)throw typeof e.render=="function"?Error(w(188)):(e=Object.keys(e).join(","),Error(w(268,e)));return e=ra(t),e=e===null?null:e.stateNode,e};De.flushSync=function(e){return en(e)};De.hydrate=function(e,t,n){if(!$l(t))throw Error(w(200));return Bl(null,e,t,!0,n)};De.hydrateRoot=function(e,t,n){if(!is(e))throw Error(w(405));var r=n!=null&&n.hydratedSources||null,l=!1,i="",o=Mc;if(n!=null&&(n.unstable_strictMode===!0&&(l=!0),n.identifierPrefix!==void 0&&(i=n.identifierPrefix),n.onRecoverableError!==void 0&&(o=n.onRecoverableError)),t=Rc(t,null,e,1,n??null,l,!1,i,o),e[ft]=t.current,cr(e),r)for(e=0;e<r.length;e++)n=r[e],l=n._getVersion,l=l(n._source),t.mutableSourceEagerHydrationData==null?t.mutableSourceEagerHydrationData=[n,l]:t.mutableSourceEagerHydrationData.push(n,l);return new Al(t)};De.render=function(e,t,n){if(!$l(t))throw Error(w(200));return Bl(null,e,t,!1,n)};De.unmountComponentAtNode=function(e){if(!$l(e))throw Error(w(40));return e._reactRootContainer?(en(function(){Bl(null,null,e,!1,function(){e._reactRootContainer=null,e[ft]=null})}),!0):!1};De.unstable_batchedUpdates=qo;De.unstable_renderSubtreeIntoContainer=function(e,t,n,r){if(!$l(n))throw Error(w(200));if(e==null||e._reactInternals===void 0)throw Error(w(38));return Bl(e,t,n,!1,r)};De.version="18.3.1-next-f1338f8080-20240426";function Oc(){if(!(typeof __REACT_DEVTOOLS_GLOBAL_HOOK__>"u"||typeof __REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE!="function"))try{__REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE(Oc)}catch(e){console.error(e)}}Oc(),Ou.exports=De;var mp=Ou.exports,Fc,xu=mp;Fc=xu.createRoot,xu.hydrateRoot;function Ae(e,t,n){return a.jsxs("svg",{width:t,height:t,viewBox:"0 0 24 24","aria-label":n,role:"img",children:[a.jsx("title",{children:n}),e]})}const $e=({children:e})=>a.jsx("g",{fill:"none",stroke:"currentColor",strokeWidth:1.6,strokeLinecap:"round",strokeLinejoin:"round",children:e});function ve(e,t,n){return a.jsx("img",{src:e,width:n,height:n,alt:t,title:t,style:{display:"inline-block"}})}function ku(e,t=16){const n=(e||"").toLowerCase();return n.includes("gpt")||n.includes("o4")||n.startsWith("openai")?ve("/assets/Icons/openai.svg","GPT",t):n.includes("claude")?ve("/assets/Icons/claude-color.svg","Claude",t):n.includes("gemini")?ve("/assets/Icons/gemini-color.svg","Gemini",t):n.includes("llama")?Ae(a.jsxs($e,{children:[a.jsx("path",{d:"M6 17c3 1 9 1 12 0"}),a.jsx("path",{d:"M8 17V9l2-2 2 2v8"}),a.jsx("path",{d:"M10 7l1-2 1 2"})]}),t,"Llama"):n.includes("mistral")||n.includes("mixtral")?Ae(a.jsxs($e,{children:[a.jsx("path",{d:"M3 9h10c2 0 2-3 0-3"}),a.jsx("path",{d:"M3 15h14c3 0 3-4 0-4"})]}),t,"Mistral"):n.includes("qwen")?Ae(a.jsxs($e,{children:[a.jsx("path",{d:"M6 12a6 6 0 1 1 6 6"}),a.jsx("path",{d:"M12 18l3-3"})]}),t,"Qwen"):n.includes("deepseek")?Ae(a.jsxs($e,{children:[a.jsx("path",{d:"M4 12l8-8 8 8-8 8z"}),a.jsx("path",{d:"M8 12l4-4 4 4-4 4z"})]}),t,"DeepSeek"):n.includes("phi")?Ae(a.jsxs($e,{children:[a.jsx("circle",{cx:"12",cy:"12",r:"7"}),a.jsx("path",{d:"M12 5v14M8 10h8"})]}),t,"Phi"):Ae(a.jsx($e,{children:a.jsx("circle",{cx:"12",cy:"12",r:"8"})}),t,"Model")}function vp(e,t=16){const n=(e||"").toLowerCase();return n.includes("openrouter")?ve("/assets/Icons/openrouter.svg","OpenRouter",t):n.includes("openai")?ve("/assets/Icons/openai.svg","OpenAI",t):n.includes("anthropic")?ve("/assets/Icons/anthropic.svg","Anthropic",t):n.includes("gemini")||n.includes("google")?ve("/assets/Icons/gemini-color.svg","Google",t):n.includes("azure")?ve("/assets/Icons/azure-color.svg","Azure",t):n.includes("ollama")?Ae(a.jsxs($e,{children:[a.jsx("path",{d:"M7 14a3 3 0 0 1 6 0v3H7z"}),a.jsx("path",{d:"M13 14a3 3 0 1 1 3 3"})]}),t,"Ollama"):n.includes("together")?ve("/assets/Icons/together-color.svg","Together",t):n.includes("fireworks")?ve("/assets/Icons/fireworks-color.svg","Fireworks",t):n.includes("perplexity")?ve("/assets/Icons/perplexity-color.svg","Perplexity",t):n.includes("mistral")?ve("/assets/Icons/mistral-color.svg","Mistral",t):n.includes("deepseek")?ve("/assets/Icons/deepseek-color.svg","DeepSeek",t):n.includes("cohere")?ve("/assets/Icons/cohere-color.svg","Cohere",t):n.includes("litellm")?ve("/assets/Icons/openai.svg","LiteLLM",t):n.includes("vllm")?ve("/assets/Icons/vllm-color.svg","vLLM",t):Ae(a.jsx($e,{children:a.jsx("rect",{x:"5",y:"5",width:"14",height:"14",rx:"3"})}),t,"Provider")}function gp(e=18){return Ae(a.jsxs($e,{children:[a.jsx("path",{d:"M4 5h10"}),a.jsx("path",{d:"M4 9h6"}),a.jsx("path",{d:"M4 13h8"}),a.jsx("path",{d:"M6 19l-2 1 .5-2.5L15 7l2 2L6 19z"})]}),e,"New chat")}function yp(e=18){return Ae(a.jsxs($e,{children:[a.jsx("circle",{cx:"11",cy:"11",r:"6"}),a.jsx("path",{d:"M16 16l4 4"})]}),e,"Search chats")}function wp(e=18){return Ae(a.jsxs($e,{children:[a.jsx("path",{d:"M4 19h16"}),a.jsx("path",{d:"M6 17V5h4v12"}),a.jsx("path",{d:"M14 17V5h4v12"})]}),e,"Library")}function xp(e=18){return Ae(a.jsxs($e,{children:[a.jsx("rect",{x:"4",y:"5",width:"16",height:"14",rx:"2"}),a.jsx("path",{d:"M6 15l4-4 3 3 3-3 2 2"}),a.jsx("circle",{cx:"10",cy:"9",r:"1.5"})]}),e,"New Images")}function kp(e){const t=e.split(/\r?\n/),n=[];let r=0;for(;r<t.length;){const i=t[r].match(/^```\s*([\w+-]*)\s*$/);if(i){const s=i[1]||"";r++;const u=[];for(;r<t.length&&!/^```\s*$/.test(t[r]);)u.push(t[r]),r++;r<t.length&&/^```\s*$/.test(t[r])&&r++,n.push({type:"code",lang:s,code:u.join(`
-`)});continue}const o=[];for(;r<t.length&&!/^```/.test(t[r]);)o.push(t[r]),r++;o.length&&n.push({type:"text",text:o.join(`
-`)})}return n}function Sp(e){const t=[];let n=0;const r=()=>`${n}-${Math.random().toString(36).slice(2,7)}`;for(;n<e.length;){const l=e[n];if(/^\s*---+\s*$/.test(l)){t.push(a.jsx("hr",{className:"border-white/10"},r())),n++;continue}const i=l.match(/^(#{1,3})\s+(.*)$/);if(i){const s=i[1].length,u=i[2];s===1?t.push(a.jsx("h2",{className:"mt-4",children:u},r())):s===2?t.push(a.jsx("h3",{className:"mt-3",children:u},r())):t.push(a.jsx("h4",{className:"mt-2",children:u},r())),n++;continue}if(/^\s*[-*]\s+/.test(l)){const s=[];for(;n<e.length&&/^\s*[-*]\s+/.test(e[n]);)s.push(e[n].replace(/^\s*[-*]\s+/,"")),n++;t.push(a.jsx("ul",{className:"list-disc pl-6 space-y-1",children:s.map((u,f)=>a.jsx("li",{children:u},f))},r()));continue}if(/^\s*\d+\.\s+/.test(l)){const s=[];for(;n<e.length&&/^\s*\d+\.\s+/.test(e[n]);)s.push(e[n].replace(/^\s*\d+\.\s+/,"")),n++;t.push(a.jsx("ol",{className:"list-decimal pl-6 space-y-1",children:s.map((u,f)=>a.jsx("li",{children:u},f))},r()));continue}if(l.includes("|")){const s=[],u=n;for(;n<e.length&&e[n].includes("|");)s.push(e[n]),n++;if(s.length>=2&&/\|/.test(s[0])&&/-/.test(s[1])){const f=m=>m.split("|").map(x=>x.trim()).filter((x,k,S)=>!(k===0&&m.trim().startsWith("|"))&&!(k===S.length-1&&m.trim().endsWith("|"))),h=f(s[0]),g=s.slice(2).map(f);t.push(a.jsx("div",{className:"overflow-x-auto",children:a.jsxs("table",{className:"w-full text-sm border-collapse",children:[a.jsx("thead",{children:a.jsx("tr",{children:h.map((m,x)=>a.jsx("th",{className:"text-left font-semibold px-3 py-2 border-b border-white/10",children:m},x))})}),a.jsx("tbody",{children:g.map((m,x)=>a.jsx("tr",{className:"odd:bg-white/5",children:m.map((k,S)=>a.jsx("td",{className:"px-3 py-2 align-top border-b border-white/5",children:k},S))},x))})]})},r()));continue}else n=u}const o=[];for(;n<e.length&&e[n].trim()!=="";)o.push(e[n]),n++;for(t.push(a.jsx("p",{className:"whitespace-pre-wrap leading-relaxed",children:o.join(`
-`)},r()));n<e.length&&e[n].trim()==="";)n++}return t}function Su({content:e,wrapDefault:t}){const n=L.useMemo(()=>e.replace(/\r/g,"").replace(/^\uFEFF/,""),[e]),r=L.useMemo(()=>kp(n),[n]);return a.jsx("div",{className:"prose prose-invert max-w-none",children:r.map((l,i)=>l.type==="text"?a.jsx("div",{children:Sp(l.text.split(`
-`))},i):a.jsx(Ep,{lang:l.lang,code:l.code,defaultWrap:!!t},i))})}function Ep({lang:e,code:t,defaultWrap:n}){const[r,l]=L.useState(!!n),i=async()=>{try{await navigator.clipboard.writeText(t)}catch{}};return a.jsxs("div",{className:"rounded-lg border border-white/10 overflow-hidden",children:[a.jsxs("div",{className:"flex items-center justify-between px-3 py-1.5 text-xs bg-slate-800/60 border-b border-white/10",children:[a.jsx("div",{className:"uppercase tracking-wide text-slate-300",children:e||"text"}),a.jsxs("div",{className:"flex items-center gap-2",children:[a.jsx("button",{className:"px-2 py-0.5 rounded bg-white/10 hover:bg-white/15",onClick:()=>l(o=>!o),children:r?"No wrap":"Wrap"}),a.jsx("button",{className:"px-2 py-0.5 rounded bg-white/10 hover:bg-white/15",onClick:i,children:"Copy"})]})]}),a.jsx("pre",{className:`text-sm p-3 ${r?"whitespace-pre-wrap break-words":"whitespace-pre overflow-x-auto"}`,children:a.jsx("code",{children:t})})]})}const Eu={theme:"blackwhite",density:"comfortable",fontScale:1,defaultReasoning:!1,codeWrapDefault:!1};function Cl(){try{const e=localStorage.getItem("appSettings");if(e)return{...Eu,...JSON.parse(e)}}catch{}return Eu}function co(e){const t=document.body;Array.from(t.classList).filter(l=>l.startsWith("theme-")).forEach(l=>t.classList.remove(l));const n=`theme-${e.theme}`;t.classList.add(n);const r=["dark","blackwhite","midnight","highcontrast","ruby","ocean","magma","seagreen","ferndark","openai","gemini","anthropic","perplexity"];t.classList.toggle("theme-light",e.theme==="light"),t.classList.toggle("theme-dark",r.includes(e.theme)),t.classList.toggle("density-compact",e.density==="compact"),t.style.setProperty("--font-scale",String(e.fontScale))}function Np({open:e,onClose:t,onSave:n}){const[r,l]=L.useState(Cl()),[i,o]=L.useState({}),[s,u]=L.useState(!1);async function f(h,g){const m=(()=>{try{return localStorage.getItem("client_id")||""}catch{return""}})(),x=new Headers((g==null?void 0:g.headers)||{});!x.has("X-Client-ID")&&m&&x.set("X-Client-ID",m);const k=await fetch(h,{...g,headers:x});if(!k.ok)throw new Error(String(k.status));return k.json()}return L.useEffect(()=>{e&&(l(Cl()),(async()=>{u(!0);try{const h=await f("/api/settings");o(h||{})}catch{o({})}finally{u(!1)}})())},[e]),e?a.jsxs("div",{className:"fixed inset-0 z-50 flex items-center justify-center",children:[a.jsx("div",{className:"absolute inset-0 bg-black/60",onClick:t}),a.jsxs("div",{className:"relative w-full max-w-lg glass rounded-lg p-4",children:[a.jsxs("div",{className:"flex items-center justify-between mb-3",children:[a.jsx("h2",{className:"text-lg font-semibold",children:"Settings"}),a.jsx("button",{className:"px-2 py-1 rounded border border-white/10 hover:bg-white/10",onClick:t,children:"Close"})]}),a.jsxs("div",{className:"space-y-4 text-sm",children:[a.jsxs("div",{children:[a.jsx("label",{className:"block mb-1 text-slate-300",children:"Theme"}),a.jsxs("select",{className:"w-full bg-slate-800/60 border border-white/10 rounded px-2 py-1",value:r.theme,onChange:h=>l(g=>({...g,theme:h.target.value})),children:[a.jsxs("optgroup",{label:"Base",children:[a.jsx("option",{value:"blackwhite",children:"Black & White"}),a.jsx("option",{value:"dark",children:"Dark"}),a.jsx("option",{value:"light",children:"Light"}),a.jsx("option",{value:"ferndark",children:"Fern Dark (Green + Black)"}),a.jsx("option",{value:"fernlight",children:"Fern Light (Green + White)"}),a.jsx("option",{value:"midnight",children:"Midnight"}),a.jsx("option",{value:"highcontrast",children:"High Contrast"}),a.jsx("option",{value:"ruby",children:"Ruby"}),a.jsx("option",{value:"ocean",children:"Ocean"}),a.jsx("option",{value:"magma",children:"Magma"}),a.jsx("option",{value:"seagreen",children:"Sea Green"})]}),a.jsxs("optgroup",{label:"AI Model Themed",children:[a.jsx("option",{value:"openai",children:"OpenAI"}),a.jsx("option",{value:"gemini",children:"Gemini"}),a.jsx("option",{value:"anthropic",children:"Anthropic"}),a.jsx("option",{value:"perplexity",children:"Perplexity"})]})]})]}),a.jsxs("div",{children:[a.jsx("label",{className:"block mb-1 text-slate-300",children:"Density"}),a.jsxs("select",{className:"w-full bg-slate-800/60 border border-white/10 rounded px-2 py-1",value:r.density,onChange:h=>l(g=>({...g,density:h.target.value})),children:[a.jsx("option",{value:"comfortable",children:"Comfortable"}),a.jsx("option",{value:"compact",children:"Compact"})]})]}),a.jsxs("div",{children:[a.jsx("label",{className:"block mb-1 text-slate-300",children:"Font scale"}),a.jsx("input",{type:"range",min:.9,max:1.2,step:.05,value:r.fontScale,onChange:h=>l(g=>({...g,fontScale:Number(h.target.value)})),className:"w-full"})]}),a.jsxs("div",{className:"flex items-center gap-2",children:[a.jsx("input",{id:"def-reason",type:"checkbox",checked:r.defaultReasoning,onChange:h=>l(g=>({...g,defaultReasoning:h.target.checked}))}),a.jsx("label",{htmlFor:"def-reason",children:"Enable reasoning by default"})]}),a.jsxs("div",{className:"flex items-center gap-2",children:[a.jsx("input",{id:"code-wrap",type:"checkbox",checked:r.codeWrapDefault,onChange:h=>l(g=>({...g,codeWrapDefault:h.target.checked}))}),a.jsx("label",{htmlFor:"code-wrap",children:"Wrap code blocks by default"})]}),a.jsx("hr",{className:"border-white/10"}),a.jsxs("div",{children:[a.jsx("div",{className:"mb-2 text-slate-300",children:"Backend defaults"}),a.jsx("label",{className:"block mb-1",children:"Default provider"}),a.jsx("select",{className:"w-full bg-slate-800/60 border border-white/10 rounded px-2 py-1",value:i.provider||"",onChange:h=>o(g=>({...g,provider:h.target.value})),children:["","openai","openrouter","anthropic","gemini","azure","ollama","together","fireworks","perplexity","mistral","deepseek","cohere","litellm","vllm"].map(h=>a.jsx("option",{value:h,children:h||"—"},h))})]}),a.jsxs("div",{children:[a.jsx("label",{className:"block mb-1",children:"Default model"}),a.jsx("input",{className:"w-full bg-slate-800/60 border border-white/10 rounded px-2 py-1",placeholder:"e.g. gpt-4o-mini",value:i.model||"",onChange:h=>o(g=>({...g,model:h.target.value}))})]}),a.jsx("div",{className:"grid grid-cols-1 md:grid-cols-2 gap-3",children:["OPENAI_API_KEY","OPENROUTER_API_KEY","ANTHROPIC_API_KEY","GEMINI_API_KEY","GOOGLE_API_KEY","AZURE_OPENAI_API_KEY","AZURE_OPENAI_ENDPOINT","TOGETHER_API_KEY","FIREWORKS_API_KEY","PERPLEXITY_API_KEY","MISTRAL_API_KEY","DEEPSEEK_API_KEY","COHERE_API_KEY","LITELLM_API_KEY","VLLM_API_KEY","LITELLM_BASE_URL","VLLM_BASE_URL"].map(h=>a.jsxs("div",{children:[a.jsx("label",{className:"block mb-1 text-slate-300",children:h}),a.jsx("input",{className:"w-full bg-slate-800/60 border border-white/10 rounded px-2 py-1",type:h.endsWith("_BASE_URL")?"text":"password",placeholder:i[h]===!0?"Set (leave blank to keep)":"Enter value or leave blank",value:typeof i[h]=="string"?i[h]:"",onChange:g=>o(m=>({...m,[h]:g.target.value}))})]},h))})]}),a.jsxs("div",{className:"mt-4 flex justify-end gap-2",children:[a.jsx("button",{className:"px-3 py-1.5 rounded border border-white/10 hover:bg-white/10",onClick:t,children:"Cancel"}),a.jsx("button",{disabled:s,className:"btn-primary",onClick:async()=>{localStorage.setItem("appSettings",JSON.stringify(r)),co(r),n(r);const h={};Object.entries(i).forEach(([g,m])=>{(typeof m=="string"||["provider","model"].includes(g))&&(h[g]=m)});try{await f("/api/settings",{method:"POST",headers:{"Content-Type":"application/json"},body:JSON.stringify(h)})}catch{}t()},children:"Save"})]})]})]}):null}function Nu(e,t){const n=(e||"").toLowerCase(),r=(t||"").toLowerCase(),l={openai:{accent:"#00A67E",accentDark:"#008F6C"},openrouter:{accent:"#7c3aed",accentDark:"#6d28d9"},anthropic:{accent:"#C15F3C",accentDark:"#9E4B30"},gemini:{accent:"#4B79F7",accentDark:"#3A64D6"},azure:{accent:"#2563eb",accentDark:"#1d4ed8"},ollama:{accent:"#10b981",accentDark:"#059669"},together:{accent:"#ec4899",accentDark:"#db2777"},fireworks:{accent:"#f97316",accentDark:"#ea580c"},perplexity:{accent:"#00B3FF",accentDark:"#008FCC"},mistral:{accent:"#eab308",accentDark:"#ca8a04"},deepseek:{accent:"#06b6d4",accentDark:"#0891b2"},cohere:{accent:"#f59e0b",accentDark:"#d97706"}},i=[{test:u=>u.includes("gpt-4o")||u.includes("gpt-5"),accent:"#00A67E",accentDark:"#008F6C"},{test:u=>u.includes("sonnet")||u.includes("opus")||u.includes("claude"),accent:"#C15F3C",accentDark:"#9E4B30"},{test:u=>u.includes("mixtral")||u.includes("mistral"),accent:"#eab308",accentDark:"#ca8a04"},{test:u=>u.includes("llama")||u.includes("llama-3"),accent:"#4B79F7",accentDark:"#3A64D6"}];let o=l[n]||{accent:"#3b82f6",accentDark:"#2563eb"};for(const u of i)if(r&&u.test(r)){o={accent:u.accent,accentDark:u.accentDark};break}const s=document.body;s.style.setProperty("--accent",o.accent),s.style.setProperty("--accent-dark",o.accentDark),s.setAttribute("data-model-theme",`${n}:${r}`)}function Cp(e){const t=new Date,n=new Date(t.getFullYear(),t.getMonth(),t.getDate()).getTime(),r=n-24*60*60*1e3,l=new Date(e.getFullYear(),e.getMonth(),e.getDate()).getTime();return l===n?"Today":l===r?"Yesterday":e.toLocaleDateString()}async function wt(e,t){const n=await fetch(e,t);if(!n.ok)throw new Error(`${n.status}`);return n.json()}function jp(){const[e,t]=L.useState([]),[n,r]=L.useState(""),[l,i]=L.useState(null),[o,s]=L.useState([{role:"system",content:"You are a helpful assistant."}]),[u,f]=L.useState(""),[h,g]=L.useState("openai"),[m,x]=L.useState(""),[k,S]=L.useState([]),[O,d]=L.useState(!1),[c,p]=L.useState(!1),[y,E]=L.useState(""),[_,C]=L.useState(""),P=L.useRef(null),[K,D]=L.useState(void 0),[Me,mt]=L.useState(0),[At,Rn]=L.useState(0),Oe=L.useRef(""),ie=L.useRef(null),rt=L.useRef(null),[N,T]=L.useState(!1),[z,$]=L.useState(!1),[B,$t]=L.useState(Cl()),[oe,vt]=L.useState("chat");L.useEffect(()=>{co(B)},[B]),L.useEffect(()=>{const v=rt.current;if(!v)return;(v.scrollTop+v.clientHeight>v.scrollHeight-200||O)&&(v.scrollTop=v.scrollHeight)},[o,y,_,O]),L.useEffect(()=>()=>{var v;ie.current&&(window.clearInterval(ie.current),ie.current=null);try{(v=P.current)==null||v.close()}catch{}P.current=null},[]);function lt(){ie.current||(ie.current=window.setInterval(()=>{const v=Oe.current;if(!v)return;const I=Math.min(v.length,4),U=v.slice(0,I);Oe.current=v.slice(I),E(Y=>Y+U)},16))}function Bt(v){v&&(Oe.current+=v,lt())}L.useEffect(()=>{["openai","gemini","anthropic","perplexity"].includes(B.theme)||Nu(h,m)},[h,m,B.theme]);const Wl=L.useMemo(()=>e.filter(v=>(v.title||"").toLowerCase().includes(n.toLowerCase())),[e,n]),Vl=L.useMemo(()=>{const v=Wl.filter(J=>J.pinned),I=Wl.filter(J=>!J.pinned),U={Today:[],Yesterday:[],Earlier:[]},Y=new Date,pe=new Date(Y.getFullYear(),Y.getMonth(),Y.getDate()).getTime(),ne=pe-24*60*60*1e3;for(const J of I){const gt=J.updated_at?new Date(J.updated_at).getTime():0;gt>=pe?U.Today.push(J):gt>=ne?U.Yesterday.push(J):U.Earlier.push(J)}return{pinned:v,byDay:U}},[Wl]);async function os(v){try{await wt(`/api/conversations/${encodeURIComponent(v)}`,{method:"DELETE"})}catch{}await rn(),l===v&&(i(null),s([{role:"system",content:"You are a helpful assistant."}]))}L.useEffect(()=>{(async()=>(await rn(),await Uc()))()},[]),L.useEffect(()=>{const v=rt.current;if(!v)return;const I=()=>{T(v.scrollTop+v.clientHeight<v.scrollHeight-200)};return v.addEventListener("scroll",I),I(),()=>v.removeEventListener("scroll",I)},[]),L.useEffect(()=>{const v=Cl();$t(v),co(v),p(!!v.defaultReasoning)},[]),L.useEffect(()=>{Nu(h,m)},[h,m]),L.useEffect(()=>{const v=rt.current;!v||N||(v.scrollTop=v.scrollHeight)},[o,y]);async function rn(){var I;const v=await wt("/api/conversations");t(v.conversations||[]),!l&&((I=v.conversations)!=null&&I[0])&&await Nr(v.conversations[0].id)}async function Nr(v){i(v);const I=await wt(`/api/conversations/${encodeURIComponent(v)}`);s(I.messages||[{role:"system",content:"You are a helpful assistant."}])}async function ss(){const v=await wt("/api/conversations",{method:"POST",headers:{"Content-Type":"application/json"},body:JSON.stringify({})});i(v.id),await rn(),await Nr(v.id)}async function us(v){await wt(`/api/conversations/${encodeURIComponent(v.id)}`,{method:"PATCH",headers:{"Content-Type":"application/json"},body:JSON.stringify({pinned:!v.pinned})}),await rn()}async function Uc(){const v=await wt("/api/settings");v.provider&&g(v.provider),await cs(v.provider||h),v.model&&x(v.model)}async function as(v){l&&(await wt(`/api/conversations/${encodeURIComponent(l)}`,{method:"PATCH",headers:{"Content-Type":"application/json"},body:JSON.stringify({messages:v})}),s(v),await rn())}async function cs(v){try{const I=await wt(`/api/models/${encodeURIComponent(v)}`);S(I.models||[])}catch{S([])}}async function Hl(){const v=u.trim();if(!v)return;l||await ss(),f("");const I={role:"user",content:v},U=[...o,I];s(U);const Y=window.location.protocol==="https:"?"wss":"ws",pe=new WebSocket(`${Y}://${window.location.host}/ws/chat`);P.current=pe,d(!0);let ne="",J="unknown";E(""),C(""),D(Date.now()),mt(0),Rn(0),Oe.current="",ie.current&&(window.clearInterval(ie.current),ie.current=null),pe.onopen=()=>{const gt=l;pe.send(JSON.stringify({messages:U,provider:h,model:m,conversation_id:gt,reasoning:c}))},pe.onmessage=gt=>{var Cr;const Wt=gt.data;if(Wt==="[END]"){d(!1);try{(Cr=P.current)==null||Cr.close()}catch{}if(P.current=null,Oe.current){const ae=Oe.current;Oe.current="",E(H=>H+ae)}ie.current&&(window.clearInterval(ie.current),ie.current=null),s(ae=>[...ae,{role:"assistant",content:J==="answer"?y:ne,reasoning:_||void 0}]),E(""),C(""),rn();return}if(ne+=Wt,mt(ae=>{const H=ae+(typeof Wt=="string"?Wt.length:0),ee=K||Date.now(),Pe=Math.max(.001,(Date.now()-ee)/1e3);return Rn(Math.round(H/4/Pe)),H}),J==="unknown"){const ae=ne.indexOf("Reasoning:"),H=ne.indexOf("Answer:");if(ae!==-1&&H!==-1&&H>ae){const ee=ne.slice(ae+10,H).trim(),Pe=ne.slice(H+7);C(ee),J="answer",Bt(Pe);return}if(ae!==-1&&H===-1){const ee=ne.slice(ae+10);C(ee.trim());return}}if(J==="reason"){const ae=ne.indexOf("Answer:"),H=ne.indexOf("Reasoning:");if(ae>=0){const Pe=ne.slice(H+10).slice(0,ae-(H+10)),Ql=ne.slice(ae+7);C(Pe),E(Ql),J="answer"}else{const ee=ne.slice(H+10),Pe=ee.indexOf(`
-
-`);if(Pe>=0){const Ql=ee.slice(0,Pe),$c=ee.slice(Pe+2);C(Ql),E($c),J="answer"}else C(ee)}return}Bt(Wt)},pe.onerror=()=>{d(!1),P.current=null},pe.onclose=()=>{d(!1),P.current=null}}function fs(){var I;try{(I=P.current)==null||I.close()}catch{}if(P.current=null,ie.current&&(window.clearInterval(ie.current),ie.current=null),Oe.current){const U=Oe.current;Oe.current="",E(Y=>Y+U)}d(!1);const v=y.trim();v&&s(U=>[...U,{role:"assistant",content:v,reasoning:_||void 0}]),E(""),C("")}function Ac({m:v,idx:I}){const[U,Y]=L.useState(!1),[pe,ne]=L.useState(v.content),J=v.role==="user",gt=async()=>{try{await navigator.clipboard.writeText(v.content)}catch{}},Wt=async()=>{const H=o.filter((ee,Pe)=>Pe!==I);await as(H)},Cr=async()=>{const H=o.map((ee,Pe)=>Pe===I?{...ee,content:pe}:ee);await as(H),Y(!1)},ae=async()=>{let H=null;for(let ee=I-1;ee>=0;ee--)if(o[ee].role==="user"){H=o[ee].content;break}H&&(f(H),await Hl())};return a.jsxs("div",{className:`flex gap-3 ${v.role==="user"?"justify-end":""}`,children:[v.role==="assistant"&&a.jsx("div",{className:"w-8 h-8 rounded-full bg-brand flex items-center justify-center",children:ku(m,16)}),a.jsxs("div",{className:`group rounded-2xl px-3 py-2 border relative ${v.role==="user"?"bg-slate-800/60 border-white/10":"bg-slate-900/60 border-white/10"} shadow-[inset_0_1px_0_rgba(255,255,255,0.05)]`,style:{maxWidth:"80%"},children:[a.jsxs("div",{className:"absolute -top-2 right-1 opacity-0 group-hover:opacity-100 transition text-xs flex gap-2",children:[a.jsx("button",{className:"px-2 py-0.5 bg-white/10 rounded",onClick:gt,children:"Copy"}),v.role==="assistant"&&a.jsx("button",{className:"px-2 py-0.5 bg-white/10 rounded",onClick:ae,children:"Regenerate"}),J&&!U&&a.jsx("button",{className:"px-2 py-0.5 bg-white/10 rounded",onClick:()=>Y(!0),children:"Edit"}),a.jsx("button",{className:"px-2 py-0.5 bg-white/10 rounded",onClick:Wt,children:"Delete"}),U&&a.jsxs(a.Fragment,{children:[a.jsx("button",{className:"px-2 py-0.5 bg-brand rounded",onClick:Cr,children:"Save"}),a.jsx("button",{className:"px-2 py-0.5 bg-white/10 rounded",onClick:()=>{Y(!1),ne(v.content)},children:"Cancel"})]})]}),U?a.jsx("textarea",{className:"w-full bg-slate-800/60 border border-white/10 rounded p-2 text-sm",rows:Math.min(10,Math.max(3,v.content.split(`
-`).length)),value:pe,onChange:H=>ne(H.target.value)}):a.jsx("div",{className:"text-slate-100 text-sm",children:v.role==="assistant"?a.jsxs(a.Fragment,{children:[v.reasoning&&a.jsx("div",{className:"mb-2 rounded-lg border border-amber-300/20 bg-amber-900/10 p-2 text-amber-200 text-xs",children:v.reasoning}),a.jsx(Su,{content:v.content,wrapDefault:B.codeWrapDefault})]}):a.jsx("div",{className:"whitespace-pre-wrap",children:v.content})})]}),v.role==="user"&&a.jsx("div",{className:"w-8 h-8 rounded-full bg-accent flex items-center justify-center",children:"U"})]})}return a.jsxs("div",{className:"h-screen grid grid-cols-[260px_1fr] gap-0",children:[a.jsxs("aside",{className:"glass border-r flex flex-col",children:[a.jsxs("nav",{className:"p-2 space-y-1",children:[a.jsxs("button",{className:`w-full flex items-center gap-2 px-3 py-2 rounded hover:bg-white/5 ${oe==="chat"?"bg-white/10":""}`,onClick:()=>vt("chat"),title:"New chat",children:[a.jsx("span",{className:"inline-flex w-5 h-5 items-center justify-center",children:gp(18)}),a.jsx("span",{children:"New chat"})]}),a.jsxs("button",{className:`w-full flex items-center gap-2 px-3 py-2 rounded hover:bg-white/5 ${oe==="search"?"bg-white/10":""}`,onClick:()=>vt("search"),title:"Search chats",children:[a.jsx("span",{className:"inline-flex w-5 h-5 items-center justify-center",children:yp(18)}),a.jsx("span",{children:"Search chats"})]}),a.jsxs("button",{className:`w-full flex items-center gap-2 px-3 py-2 rounded hover:bg-white/5 ${oe==="library"?"bg-white/10":""}`,onClick:()=>vt("library"),title:"Library",children:[a.jsx("span",{className:"inline-flex w-5 h-5 items-center justify-center",children:wp(18)}),a.jsx("span",{children:"Library"})]}),a.jsxs("button",{className:`w-full flex items-center gap-2 px-3 py-2 rounded hover:bg-white/5 ${oe==="images"?"bg-white/10":""}`,onClick:()=>vt("images"),title:"New Images",children:[a.jsx("span",{className:"inline-flex w-5 h-5 items-center justify-center",children:xp(18)}),a.jsx("span",{children:"New Images"})]})]}),a.jsxs("div",{className:"overflow-y-auto min-h-0 p-2 space-y-2 flex-1",children:[oe==="chat"&&a.jsxs(a.Fragment,{children:[a.jsxs("div",{className:"p-2 flex items-center gap-2",children:[a.jsx("button",{className:"btn-primary",onClick:ss,children:"New chat"}),a.jsx("input",{className:"ml-auto bg-slate-800/60 border border-white/10 rounded px-2 py-1 w-full",placeholder:"Search",value:n,onChange:v=>r(v.target.value)})]}),Vl.pinned.length>0&&a.jsxs("div",{children:[a.jsx("div",{className:"px-2 text-xs uppercase text-slate-400 mb-1",children:"Pinned"}),a.jsx("div",{className:"space-y-1",children:Vl.pinned.map(v=>a.jsx("div",{className:`w-full px-2 py-1 rounded hover:bg-white/5 ${l===v.id?"bg-white/10":""}`,children:a.jsxs("div",{className:"flex items-center justify-between gap-2",children:[a.jsx("button",{className:"flex-1 text-left truncate",onClick:()=>Nr(v.id),children:v.title||"Untitled"}),a.jsxs("div",{className:"flex items-center gap-1 text-xs text-slate-400",children:[a.jsx("button",{className:"px-1 hover:text-white",onClick:I=>{I.stopPropagation(),us(v)},children:"Unpin"}),a.jsx("button",{className:"px-1 text-red-300 hover:text-red-200",onClick:I=>{I.stopPropagation(),os(v.id)},children:"Delete"})]})]})},v.id))})]}),Object.entries(Vl.byDay).map(([v,I])=>I.length?a.jsxs("div",{children:[a.jsx("div",{className:"px-2 text-xs uppercase text-slate-400 mb-1",children:v}),a.jsx("div",{className:"space-y-1",children:I.map(U=>a.jsx("div",{className:`w-full px-2 py-1 rounded hover:bg-white/5 ${l===U.id?"bg-white/10":""}`,children:a.jsxs("div",{className:"flex items-center justify-between gap-2",children:[a.jsx("button",{className:"flex-1 text-left truncate",onClick:()=>Nr(U.id),children:U.title||"Untitled"}),a.jsxs("div",{className:"flex items-center gap-1 text-xs text-slate-400",children:[a.jsx("button",{className:"px-1 hover:text-white",onClick:Y=>{Y.stopPropagation(),us(U)},children:"Pin"}),a.jsx("button",{className:"px-1 text-red-300 hover:text-red-200",onClick:Y=>{Y.stopPropagation(),os(U.id)},children:"Delete"})]})]})},U.id))})]},v):null)]}),oe==="search"&&a.jsxs("div",{className:"p-3 text-sm text-slate-300",children:[a.jsx("div",{className:"mb-2",children:"Search chats"}),a.jsx("input",{className:"w-full bg-slate-800/60 border border-white/10 rounded px-2 py-1",placeholder:"Type to search conversations..."})]}),oe==="library"&&a.jsx("div",{className:"p-3 text-sm text-slate-300",children:"Library (coming soon)"}),oe==="images"&&a.jsx("div",{className:"p-3 text-sm text-slate-300",children:"Generate images with your selected provider/model."})]})]}),a.jsxs("main",{className:"flex flex-col min-h-0",children:[a.jsxs("header",{className:"glass flex items-center justify-between px-4 py-2 border-b",children:[a.jsxs("div",{className:"flex items-center gap-2",children:[a.jsx("img",{src:"/assets/Logo/fern-Ico.png",alt:"Fern",className:"h-6 w-6 object-contain",onError:v=>{v.currentTarget.onerror=null,v.currentTarget.src="/assets/Logo/fern.svg"}}),a.jsx("h1",{className:"font-semibold",children:"Fern"})]}),a.jsxs("div",{className:"flex items-center gap-2",children:[a.jsxs("div",{className:"flex items-center gap-1 text-sm text-slate-300",children:[vp(h,16),a.jsx("span",{className:"hidden md:inline",children:h})]}),a.jsx("select",{className:"bg-slate-800/60 border border-white/10 rounded px-2 py-1",value:h,onChange:async v=>{const I=v.target.value;g(I),await cs(I)},children:["openai","openrouter","anthropic","gemini","azure","ollama","together","fireworks","perplexity","mistral","deepseek","cohere","litellm","vllm"].map(v=>a.jsx("option",{value:v,children:v},v))}),a.jsxs("select",{className:"bg-slate-800/60 border border-white/10 rounded px-2 py-1",value:m,onChange:v=>x(v.target.value),children:[a.jsx("option",{value:"",children:"Select a model"}),k.map(v=>a.jsx("option",{value:v.id,children:v.name||v.id},v.id))]}),a.jsxs("label",{className:"text-sm flex items-center gap-1",children:[a.jsx("input",{type:"checkbox",checked:c,onChange:v=>p(v.target.checked)})," Reasoning"]}),a.jsx("button",{className:"px-2 py-1 rounded border border-white/10 hover:bg-white/10",onClick:()=>$(!0),children:"Settings"})]})]}),oe==="chat"&&a.jsxs("div",{ref:rt,className:"flex-1 overflow-y-auto p-4",children:[a.jsxs("div",{className:"max-w-3xl mx-auto mb-6 flex items-center justify-center",children:[a.jsx("img",{src:"/assets/Logo/fern.svg",alt:"Fern",className:"h-20 md:h-28 lg:h-32 opacity-95 drop-shadow",onError:v=>{var U;const I=v.currentTarget;I.style.display="none",(U=I.nextSibling)==null||U.classList.remove("hidden")}}),a.jsx("div",{className:"hidden text-3xl md:text-4xl font-extrabold tracking-wide",children:"Fern"})]}),o.filter(v=>v.role!=="system").length===0&&a.jsxs("div",{className:"max-w-2xl mx-auto p-4 rounded-lg border border-white/10 bg-slate-900/60",children:[a.jsx("div",{className:"mb-2 text-slate-300",children:"Try one of these"}),a.jsx("div",{className:"flex flex-wrap gap-2",children:["Summarize an article","Write Python","Explain a concept","Create a plan"].map((v,I)=>a.jsx("button",{className:"px-3 py-1 rounded border border-white/10 hover:bg-white/5",onClick:()=>f(v),children:v},I))})]}),a.jsxs("div",{className:"max-w-3xl mx-auto space-y-3",children:[(()=>{const v=[];let I=null;return o.filter(Y=>Y.role!=="system").forEach((Y,pe)=>{if(Y.created_at){const ne=new Date(Y.created_at),J=Cp(ne);J!==I&&(I=J,v.push(a.jsx("div",{className:"sticky top-2 z-10",children:a.jsx("div",{className:"mx-auto w-fit px-3 py-1 text-xs text-slate-300 border border-white/10 rounded-full bg-slate-900/70 backdrop-blur",children:J})},`sep-${pe}`)))}v.push(a.jsx(Ac,{m:Y,idx:pe},pe))}),v})(),(y||_)&&a.jsxs("div",{className:"flex gap-3",children:[a.jsx("div",{className:"w-8 h-8 rounded-full bg-accent flex items-center justify-center",children:ku(m,16)}),a.jsxs("div",{className:"rounded-2xl px-3 py-2 border bg-slate-900/60 border-white/10 space-y-2",style:{maxWidth:"80%"},children:[_&&a.jsx("div",{className:"rounded-lg border border-amber-300/20 bg-amber-900/10 p-2 text-amber-200 text-xs whitespace-pre-wrap",children:_}),y&&a.jsxs("div",{className:"text-slate-100 text-sm space-y-2",children:[a.jsx(Su,{content:y,wrapDefault:B.codeWrapDefault}),a.jsxs("div",{className:"flex items-center gap-2 text-xs text-slate-400",children:[a.jsx("span",{className:"inline-block w-2 h-4 align-baseline bg-slate-300/80 animate-pulse"}),a.jsxs("span",{children:[At," tok/s"]})]})]})]})]}),O&&!y&&a.jsxs("div",{className:"flex items-center gap-2 text-slate-300 text-sm",children:[a.jsx("span",{className:"w-2 h-2 bg-slate-500 rounded-full animate-pulse"}),"Generating…"]})]})]}),N&&a.jsx("button",{className:"fixed right-6 bottom-24 px-3 py-1.5 rounded-full bg-accent text-white shadow hover:bg-accent-dark",onClick:()=>{const v=rt.current;v&&(v.scrollTop=v.scrollHeight)},children:"Jump to latest"}),oe==="chat"&&a.jsxs("form",{className:"glass border-t p-3 flex items-center gap-2",onSubmit:v=>{v.preventDefault(),O?fs():Hl()},children:[a.jsx("div",{className:"flex-1",children:a.jsx("textarea",{className:"w-full bg-slate-800/60 border border-white/10 rounded-full px-4 py-2 h-11 resize-none",placeholder:"Ask something...",value:u,onChange:v=>f(v.target.value),onKeyDown:v=>{v.key==="Enter"&&!v.shiftKey&&(v.preventDefault(),Hl())}})}),O?a.jsx("button",{type:"button",onClick:fs,className:"rounded-full h-11 px-5 bg-red-600 hover:bg-red-500 text-white",children:"Stop"}):a.jsx("button",{className:"btn-primary rounded-full h-11 px-5",disabled:!u.trim(),type:"submit",children:"Send"})]})]}),a.jsx(Np,{open:z,onClose:()=>$(!1),onSave:v=>{$t(v),$(!1)}})]})}(()=>{try{let e=localStorage.getItem("client_id");e||(typeof crypto<"u"&&"randomUUID"in crypto?e=crypto.randomUUID():e=String(Math.random()).slice(2)+"-"+Date.now(),localStorage.setItem("client_id",e))}catch{}try{const e=localStorage.getItem("appSettings");let t="dark",n="comfortable",r=1;if(e){const o=JSON.parse(e);o&&typeof o.theme=="string"&&(t=o.theme),o&&(o.density==="comfortable"||o.density==="compact")&&(n=o.density),o&&typeof o.fontScale=="number"&&(r=o.fontScale)}else window.matchMedia&&window.matchMedia("(prefers-color-scheme: light)").matches&&(t="light");const l=document.body;Array.from(l.classList).filter(o=>o.startsWith("theme-")).forEach(o=>l.classList.remove(o)),l.classList.add(`theme-${t}`);const i=["dark","blackwhite","midnight","highcontrast","ruby","ocean","magma","seagreen","ferndark","openai","gemini","anthropic","perplexity"];l.classList.toggle("theme-light",t==="light"),l.classList.toggle("theme-dark",i.includes(t)),l.classList.toggle("density-compact",n==="compact"),l.style.setProperty("--font-scale",String(r))}catch{}})();const _p=document.getElementById("root");Fc(_p).render(a.jsx(rf.StrictMode,{children:a.jsx(jp,{})}));
@@ -1,43 +0,0 @@
-(function(){const t=document.createElement("link").relList;if(t&&t.supports&&t.supports("modulepreload"))return;for(const l of document.querySelectorAll('link[rel="modulepreload"]'))r(l);new MutationObserver(l=>{for(const o of l)if(o.type==="childList")for(const i of o.addedNodes)i.tagName==="LINK"&&i.rel==="modulepreload"&&r(i)}).observe(document,{childList:!0,subtree:!0});function n(l){const o={};return l.integrity&&(o.integrity=l.integrity),l.referrerPolicy&&(o.referrerPolicy=l.referrerPolicy),l.crossOrigin==="use-credentials"?o.credentials="include":l.crossOrigin==="anonymous"?o.credentials="omit":o.credentials="same-origin",o}function r(l){if(l.ep)return;l.ep=!0;const o=n(l);fetch(l.href,o)}})();function dc(e){return e&&e.__esModule&&Object.prototype.hasOwnProperty.call(e,"default")?e.default:e}var Ju={exports:{}},al={},qu={exports:{}},M={};/**
- * @license React
- * react.production.min.js
- *
- * Copyright (c) Facebook, Inc. and its affiliates.
- *
- * This source code is licensed under the MIT license found in the
- * LICENSE file in the root directory of this source tree.
- */var or=Symbol.for("react.element"),pc=Symbol.for("react.portal"),hc=Symbol.for("react.fragment"),mc=Symbol.for("react.strict_mode"),vc=Symbol.for("react.profiler"),yc=Symbol.for("react.provider"),gc=Symbol.for("react.context"),wc=Symbol.for("react.forward_ref"),xc=Symbol.for("react.suspense"),Sc=Symbol.for("react.memo"),kc=Symbol.for("react.lazy"),Bi=Symbol.iterator;function Ec(e){return e===null||typeof e!="object"?null:(e=Bi&&e[Bi]||e["@@iterator"],typeof e=="function"?e:null)}var bu={isMounted:function(){return!1},enqueueForceUpdate:function(){},enqueueReplaceState:function(){},enqueueSetState:function(){}},es=Object.assign,ts={};function yn(e,t,n){this.props=e,this.context=t,this.refs=ts,this.updater=n||bu}yn.prototype.isReactComponent={};yn.prototype.setState=function(e,t){if(typeof e!="object"&&typeof e!="function"&&e!=null)throw Error("setState(...): takes an object of state variables to update or a function which returns an object of state variables.");this.updater.enqueueSetState(this,e,t,"setState")};yn.prototype.forceUpdate=function(e){this.updater.enqueueForceUpdate(this,e,"forceUpdate")};function ns(){}ns.prototype=yn.prototype;function Go(e,t,n){this.props=e,this.context=t,this.refs=ts,this.updater=n||bu}var Xo=Go.prototype=new ns;Xo.constructor=Go;es(Xo,yn.prototype);Xo.isPureReactComponent=!0;var Hi=Array.isArray,rs=Object.prototype.hasOwnProperty,Zo={current:null},ls={key:!0,ref:!0,__self:!0,__source:!0};function os(e,t,n){var r,l={},o=null,i=null;if(t!=null)for(r in t.ref!==void 0&&(i=t.ref),t.key!==void 0&&(o=""+t.key),t)rs.call(t,r)&&!ls.hasOwnProperty(r)&&(l[r]=t[r]);var u=arguments.length-2;if(u===1)l.children=n;else if(1<u){for(var s=Array(u),c=0;c<u;c++)s[c]=arguments[c+2];l.children=s}if(e&&e.defaultProps)for(r in u=e.defaultProps,u)l[r]===void 0&&(l[r]=u[r]);return{$$typeof:or,type:e,key:o,ref:i,props:l,_owner:Zo.current}}function Cc(e,t){return{$$typeof:or,type:e.type,key:t,ref:e.ref,props:e.props,_owner:e._owner}}function Jo(e){return typeof e=="object"&&e!==null&&e.$$typeof===or}function Nc(e){var t={"=":"=0",":":"=2"};return"$"+e.replace(/[=:]/g,function(n){return t[n]})}var Wi=/\/+/g;function Pl(e,t){return typeof e=="object"&&e!==null&&e.key!=null?Nc(""+e.key):t.toString(36)}function jr(e,t,n,r,l){var o=typeof e;(o==="undefined"||o==="boolean")&&(e=null);var i=!1;if(e===null)i=!0;else switch(o){case"string":case"number":i=!0;break;case"object":switch(e.$$typeof){case or:case pc:i=!0}}if(i)return i=e,l=l(i),e=r===""?"."+Pl(i,0):r,Hi(l)?(n="",e!=null&&(n=e.replace(Wi,"$&/")+"/"),jr(l,t,n,"",function(c){return c})):l!=null&&(Jo(l)&&(l=Cc(l,n+(!l.key||i&&i.key===l.key?"":(""+l.key).replace(Wi,"$&/")+"/")+e)),t.push(l)),1;if(i=0,r=r===""?".":r+":",Hi(e))for(var u=0;u<e.length;u++){o=e[u];var s=r+Pl(o,u);i+=jr(o,t,n,s,l)}else if(s=Ec(e),typeof s=="function")for(e=s.call(e),u=0;!(o=e.next()).done;)o=o.value,s=r+Pl(o,u++),i+=jr(o,t,n,s,l);else if(o==="object")throw t=String(e),Error("Objects are not valid as a React child (found: "+(t==="[object Object]"?"object with keys {"+Object.keys(e).join(", ")+"}":t)+"). If you meant to render a collection of children, use an array instead.");return i}function cr(e,t,n){if(e==null)return e;var r=[],l=0;return jr(e,r,"","",function(o){return t.call(n,o,l++)}),r}function _c(e){if(e._status===-1){var t=e._result;t=t(),t.then(function(n){(e._status===0||e._status===-1)&&(e._status=1,e._result=n)},function(n){(e._status===0||e._status===-1)&&(e._status=2,e._result=n)}),e._status===-1&&(e._status=0,e._result=t)}if(e._status===1)return e._result.default;throw e._result}var he={current:null},Pr={transition:null},jc={ReactCurrentDispatcher:he,ReactCurrentBatchConfig:Pr,ReactCurrentOwner:Zo};function is(){throw Error("act(...) is not supported in production builds of React.")}M.Children={map:cr,forEach:function(e,t,n){cr(e,function(){t.apply(this,arguments)},n)},count:function(e){var t=0;return cr(e,function(){t++}),t},toArray:function(e){return cr(e,function(t){return t})||[]},only:function(e){if(!Jo(e))throw Error("React.Children.only expected to receive a single React element child.");return e}};M.Component=yn;M.Fragment=hc;M.Profiler=vc;M.PureComponent=Go;M.StrictMode=mc;M.Suspense=xc;M.__SECRET_INTERNALS_DO_NOT_USE_OR_YOU_WILL_BE_FIRED=jc;M.act=is;M.cloneElement=function(e,t,n){if(e==null)throw Error("React.cloneElement(...): The argument must be a React element, but you passed "+e+".");var r=es({},e.props),l=e.key,o=e.ref,i=e._owner;if(t!=null){if(t.ref!==void 0&&(o=t.ref,i=Zo.current),t.key!==void 0&&(l=""+t.key),e.type&&e.type.defaultProps)var u=e.type.defaultProps;for(s in t)rs.call(t,s)&&!ls.hasOwnProperty(s)&&(r[s]=t[s]===void 0&&u!==void 0?u[s]:t[s])}var s=arguments.length-2;if(s===1)r.children=n;else if(1<s){u=Array(s);for(var c=0;c<s;c++)u[c]=arguments[c+2];r.children=u}return{$$typeof:or,type:e.type,key:l,ref:o,props:r,_owner:i}};M.createContext=function(e){return e={$$typeof:gc,_currentValue:e,_currentValue2:e,_threadCount:0,Provider:null,Consumer:null,_defaultValue:null,_globalName:null},e.Provider={$$typeof:yc,_context:e},e.Consumer=e};M.createElement=os;M.createFactory=function(e){var t=os.bind(null,e);return t.type=e,t};M.createRef=function(){return{current:null}};M.forwardRef=function(e){return{$$typeof:wc,render:e}};M.isValidElement=Jo;M.lazy=function(e){return{$$typeof:kc,_payload:{_status:-1,_result:e},_init:_c}};M.memo=function(e,t){return{$$typeof:Sc,type:e,compare:t===void 0?null:t}};M.startTransition=function(e){var t=Pr.transition;Pr.transition={};try{e()}finally{Pr.transition=t}};M.unstable_act=is;M.useCallback=function(e,t){return he.current.useCallback(e,t)};M.useContext=function(e){return he.current.useContext(e)};M.useDebugValue=function(){};M.useDeferredValue=function(e){return he.current.useDeferredValue(e)};M.useEffect=function(e,t){return he.current.useEffect(e,t)};M.useId=function(){return he.current.useId()};M.useImperativeHandle=function(e,t,n){return he.current.useImperativeHandle(e,t,n)};M.useInsertionEffect=function(e,t){return he.current.useInsertionEffect(e,t)};M.useLayoutEffect=function(e,t){return he.current.useLayoutEffect(e,t)};M.useMemo=function(e,t){return he.current.useMemo(e,t)};M.useReducer=function(e,t,n){return he.current.useReducer(e,t,n)};M.useRef=function(e){return he.current.useRef(e)};M.useState=function(e){return he.current.useState(e)};M.useSyncExternalStore=function(e,t,n){return he.current.useSyncExternalStore(e,t,n)};M.useTransition=function(){return he.current.useTransition()};M.version="18.3.1";qu.exports=M;var B=qu.exports;const Pc=dc(B);/**
- * @license React
- * react-jsx-runtime.production.min.js
- *
- * Copyright (c) Facebook, Inc. and its affiliates.
- *
- * This source code is licensed under the MIT license found in the
- * LICENSE file in the root directory of this source tree.
- */var zc=B,Tc=Symbol.for("react.element"),Lc=Symbol.for("react.fragment"),Mc=Object.prototype.hasOwnProperty,Rc=zc.__SECRET_INTERNALS_DO_NOT_USE_OR_YOU_WILL_BE_FIRED.ReactCurrentOwner,Oc={key:!0,ref:!0,__self:!0,__source:!0};function us(e,t,n){var r,l={},o=null,i=null;n!==void 0&&(o=""+n),t.key!==void 0&&(o=""+t.key),t.ref!==void 0&&(i=t.ref);for(r in t)Mc.call(t,r)&&!Oc.hasOwnProperty(r)&&(l[r]=t[r]);if(e&&e.defaultProps)for(r in t=e.defaultProps,t)l[r]===void 0&&(l[r]=t[r]);return{$$typeof:Tc,type:e,key:o,ref:i,props:l,_owner:Rc.current}}al.Fragment=Lc;al.jsx=us;al.jsxs=us;Ju.exports=al;var p=Ju.exports,ss={exports:{}},_e={},as={exports:{}},cs={};/**
- * @license React
- * scheduler.production.min.js
- *
- * Copyright (c) Facebook, Inc. and its affiliates.
- *
- * This source code is licensed under the MIT license found in the
- * LICENSE file in the root directory of this source tree.
- */(function(e){function t(C,T){var h=C.length;C.push(T);e:for(;0<h;){var P=h-1>>>1,R=C[P];if(0<l(R,T))C[P]=T,C[h]=R,h=P;else break e}}function n(C){return C.length===0?null:C[0]}function r(C){if(C.length===0)return null;var T=C[0],h=C.pop();if(h!==T){C[0]=h;e:for(var P=0,R=C.length,Z=R>>>1;P<Z;){var W=2*(P+1)-1,ve=C[W],$=W+1,Pe=C[$];if(0>l(ve,h))$<R&&0>l(Pe,ve)?(C[P]=Pe,C[$]=h,P=$):(C[P]=ve,C[W]=h,P=W);else if($<R&&0>l(Pe,h))C[P]=Pe,C[$]=h,P=$;else break e}}return T}function l(C,T){var h=C.sortIndex-T.sortIndex;return h!==0?h:C.id-T.id}if(typeof performance=="object"&&typeof performance.now=="function"){var o=performance;e.unstable_now=function(){return o.now()}}else{var i=Date,u=i.now();e.unstable_now=function(){return i.now()-u}}var s=[],c=[],y=1,v=null,m=3,x=!1,S=!1,k=!1,I=typeof setTimeout=="function"?setTimeout:null,f=typeof clearTimeout=="function"?clearTimeout:null,a=typeof setImmediate<"u"?setImmediate:null;typeof navigator<"u"&&navigator.scheduling!==void 0&&navigator.scheduling.isInputPending!==void 0&&navigator.scheduling.isInputPending.bind(navigator.scheduling);function d(C){for(var T=n(c);T!==null;){if(T.callback===null)r(c);else if(T.startTime<=C)r(c),T.sortIndex=T.expirationTime,t(s,T);else break;T=n(c)}}function g(C){if(k=!1,d(C),!S)if(n(s)!==null)S=!0,Bt(E);else{var T=n(c);T!==null&&Ht(g,T.startTime-C)}}function E(C,T){S=!1,k&&(k=!1,f(z),z=-1),x=!0;var h=m;try{for(d(T),v=n(s);v!==null&&(!(v.expirationTime>T)||C&&!ne());){var P=v.callback;if(typeof P=="function"){v.callback=null,m=v.priorityLevel;var R=P(v.expirationTime<=T);T=e.unstable_now(),typeof R=="function"?v.callback=R:v===n(s)&&r(s),d(T)}else r(s);v=n(s)}if(v!==null)var Z=!0;else{var W=n(c);W!==null&&Ht(g,W.startTime-T),Z=!1}return Z}finally{v=null,m=h,x=!1}}var _=!1,j=null,z=-1,U=5,L=-1;function ne(){return!(e.unstable_now()-L<U)}function Be(){if(j!==null){var C=e.unstable_now();L=C;var T=!0;try{T=j(!0,C)}finally{T?_t():(_=!1,j=null)}}else _=!1}var _t;if(typeof a=="function")_t=function(){a(Be)};else if(typeof MessageChannel<"u"){var xn=new MessageChannel,Nl=xn.port2;xn.port1.onmessage=Be,_t=function(){Nl.postMessage(null)}}else _t=function(){I(Be,0)};function Bt(C){j=C,_||(_=!0,_t())}function Ht(C,T){z=I(function(){C(e.unstable_now())},T)}e.unstable_IdlePriority=5,e.unstable_ImmediatePriority=1,e.unstable_LowPriority=4,e.unstable_NormalPriority=3,e.unstable_Profiling=null,e.unstable_UserBlockingPriority=2,e.unstable_cancelCallback=function(C){C.callback=null},e.unstable_continueExecution=function(){S||x||(S=!0,Bt(E))},e.unstable_forceFrameRate=function(C){0>C||125<C?console.error("forceFrameRate takes a positive int between 0 and 125, forcing frame rates higher than 125 fps is not supported"):U=0<C?Math.floor(1e3/C):5},e.unstable_getCurrentPriorityLevel=function(){return m},e.unstable_getFirstCallbackNode=function(){return n(s)},e.unstable_next=function(C){switch(m){case 1:case 2:case 3:var T=3;break;default:T=m}var h=m;m=T;try{return C()}finally{m=h}},e.unstable_pauseExecution=function(){},e.unstable_requestPaint=function(){},e.unstable_runWithPriority=function(C,T){switch(C){case 1:case 2:case 3:case 4:case 5:break;default:C=3}var h=m;m=C;try{return T()}finally{m=h}},e.unstable_scheduleCallback=function(C,T,h){var P=e.unstable_now();switch(typeof h=="object"&&h!==null?(h=h.delay,h=typeof h=="number"&&0<h?P+h:P):h=P,C){case 1:var R=-1;break;case 2:R=250;break;case 5:R=1073741823;break;case 4:R=1e4;break;default:R=5e3}return R=h+R,C={id:y++,callback:T,priorityLevel:C,startTime:h,expirationTime:R,sortIndex:-1},h>P?(C.sortIndex=h,t(c,C),n(s)===null&&C===n(c)&&(k?(f(z),z=-1):k=!0,Ht(g,h-P))):(C.sortIndex=R,t(s,C),S||x||(S=!0,Bt(E))),C},e.unstable_shouldYield=ne,e.unstable_wrapCallback=function(C){var T=m;return function(){var h=m;m=T;try{return C.apply(this,arguments)}finally{m=h}}}})(cs);as.exports=cs;var Dc=as.exports;/**
- * @license React
- * react-dom.production.min.js
- *
- * Copyright (c) Facebook, Inc. and its affiliates.
- *
- * This source code is licensed under the MIT license found in the
- * LICENSE file in the root directory of this source tree.
- */var Ic=B,Ne=Dc;function w(e){for(var t="https://reactjs.org/docs/error-decoder.html?invariant="+e,n=1;n<arguments.length;n++)t+="&args[]="+encodeURIComponent(arguments[n]);return"Minified React error #"+e+"; visit "+t+" for the full message or use the non-minified dev environment for full errors and additional helpful warnings."}var fs=new Set,Bn={};function At(e,t){cn(e,t),cn(e+"Capture",t)}function cn(e,t){for(Bn[e]=t,e=0;e<t.length;e++)fs.add(t[e])}var et=!(typeof window>"u"||typeof window.document>"u"||typeof window.document.createElement>"u"),to=Object.prototype.hasOwnProperty,Fc=/^[:A-Z_a-z\u00C0-\u00D6\u00D8-\u00F6\u00F8-\u02FF\u0370-\u037D\u037F-\u1FFF\u200C-\u200D\u2070-\u218F\u2C00-\u2FEF\u3001-\uD7FF\uF900-\uFDCF\uFDF0-\uFFFD][:A-Z_a-z\u00C0-\u00D6\u00D8-\u00F6\u00F8-\u02FF\u0370-\u037D\u037F-\u1FFF\u200C-\u200D\u2070-\u218F\u2C00-\u2FEF\u3001-\uD7FF\uF900-\uFDCF\uFDF0-\uFFFD\-.0-9\u00B7\u0300-\u036F\u203F-\u2040]*$/,Qi={},Ki={};function Uc(e){return to.call(Ki,e)?!0:to.call(Qi,e)?!1:Fc.test(e)?Ki[e]=!0:(Qi[e]=!0,!1)}function $c(e,t,n,r){if(n!==null&&n.type===0)return!1;switch(typeof t){case"function":case"symbol":return!0;case"boolean":return r?!1:n!==null?!n.acceptsBooleans:(e=e.toLowerCase().slice(0,5),e!=="data-"&&e!=="aria-");default:return!1}}function Ac(e,t,n,r){if(t===null||typeof t>"u"||$c(e,t,n,r))return!0;if(r)return!1;if(n!==null)switch(n.type){case 3:return!t;case 4:return t===!1;case 5:return isNaN(t);case 6:return isNaN(t)||1>t}return!1}function me(e,t,n,r,l,o,i){this.acceptsBooleans=t===2||t===3||t===4,this.attributeName=r,this.attributeNamespace=l,this.mustUseProperty=n,this.propertyName=e,this.type=t,this.sanitizeURL=o,this.removeEmptyString=i}var oe={};"children dangerouslySetInnerHTML defaultValue defaultChecked innerHTML suppressContentEditableWarning suppressHydrationWarning style".split(" ").forEach(function(e){oe[e]=new me(e,0,!1,e,null,!1,!1)});[["acceptCharset","accept-charset"],["className","class"],["htmlFor","for"],["httpEquiv","http-equiv"]].forEach(function(e){var t=e[0];oe[t]=new me(t,1,!1,e[1],null,!1,!1)});["contentEditable","draggable","spellCheck","value"].forEach(function(e){oe[e]=new me(e,2,!1,e.toLowerCase(),null,!1,!1)});["autoReverse","externalResourcesRequired","focusable","preserveAlpha"].forEach(function(e){oe[e]=new me(e,2,!1,e,null,!1,!1)});"allowFullScreen async autoFocus autoPlay controls default defer disabled disablePictureInPicture disableRemotePlayback formNoValidate hidden loop noModule noValidate open playsInline readOnly required reversed scoped seamless itemScope".split(" ").forEach(function(e){oe[e]=new me(e,3,!1,e.toLowerCase(),null,!1,!1)});["checked","multiple","muted","selected"].forEach(function(e){oe[e]=new me(e,3,!0,e,null,!1,!1)});["capture","download"].forEach(function(e){oe[e]=new me(e,4,!1,e,null,!1,!1)});["cols","rows","size","span"].forEach(function(e){oe[e]=new me(e,6,!1,e,null,!1,!1)});["rowSpan","start"].forEach(function(e){oe[e]=new me(e,5,!1,e.toLowerCase(),null,!1,!1)});var qo=/[\-:]([a-z])/g;function bo(e){return e[1].toUpperCase()}"accent-height alignment-baseline arabic-form baseline-shift cap-height clip-path clip-rule color-interpolation color-interpolation-filters color-profile color-rendering dominant-baseline enable-background fill-opacity fill-rule flood-color flood-opacity font-family font-size font-size-adjust font-stretch font-style font-variant font-weight glyph-name glyph-orientation-horizontal glyph-orientation-vertical horiz-adv-x horiz-origin-x image-rendering letter-spacing lighting-color marker-end marker-mid marker-start overline-position overline-thickness paint-order panose-1 pointer-events rendering-intent shape-rendering stop-color stop-opacity strikethrough-position strikethrough-thickness stroke-dasharray stroke-dashoffset stroke-linecap stroke-linejoin stroke-miterlimit stroke-opacity stroke-width text-anchor text-decoration text-rendering underline-position underline-thickness unicode-bidi unicode-range units-per-em v-alphabetic v-hanging v-ideographic v-mathematical vector-effect vert-adv-y vert-origin-x vert-origin-y word-spacing writing-mode xmlns:xlink x-height".split(" ").forEach(function(e){var t=e.replace(qo,bo);oe[t]=new me(t,1,!1,e,null,!1,!1)});"xlink:actuate xlink:arcrole xlink:role xlink:show xlink:title xlink:type".split(" ").forEach(function(e){var t=e.replace(qo,bo);oe[t]=new me(t,1,!1,e,"http://www.w3.org/1999/xlink",!1,!1)});["xml:base","xml:lang","xml:space"].forEach(function(e){var t=e.replace(qo,bo);oe[t]=new me(t,1,!1,e,"http://www.w3.org/XML/1998/namespace",!1,!1)});["tabIndex","crossOrigin"].forEach(function(e){oe[e]=new me(e,1,!1,e.toLowerCase(),null,!1,!1)});oe.xlinkHref=new me("xlinkHref",1,!1,"xlink:href","http://www.w3.org/1999/xlink",!0,!1);["src","href","action","formAction"].forEach(function(e){oe[e]=new me(e,1,!1,e.toLowerCase(),null,!0,!0)});function ei(e,t,n,r){var l=oe.hasOwnProperty(t)?oe[t]:null;(l!==null?l.type!==0:r||!(2<t.length)||t[0]!=="o"&&t[0]!=="O"||t[1]!=="n"&&t[1]!=="N")&&(Ac(t,n,l,r)&&(n=null),r||l===null?Uc(t)&&(n===null?e.removeAttribute(t):e.setAttribute(t,""+n)):l.mustUseProperty?e[l.propertyName]=n===null?l.type===3?!1:"":n:(t=l.attributeName,r=l.attributeNamespace,n===null?e.removeAttribute(t):(l=l.type,n=l===3||l===4&&n===!0?"":""+n,r?e.setAttributeNS(r,t,n):e.setAttribute(t,n))))}var lt=Ic.__SECRET_INTERNALS_DO_NOT_USE_OR_YOU_WILL_BE_FIRED,fr=Symbol.for("react.element"),Qt=Symbol.for("react.portal"),Kt=Symbol.for("react.fragment"),ti=Symbol.for("react.strict_mode"),no=Symbol.for("react.profiler"),ds=Symbol.for("react.provider"),ps=Symbol.for("react.context"),ni=Symbol.for("react.forward_ref"),ro=Symbol.for("react.suspense"),lo=Symbol.for("react.suspense_list"),ri=Symbol.for("react.memo"),ut=Symbol.for("react.lazy"),hs=Symbol.for("react.offscreen"),Yi=Symbol.iterator;function Sn(e){return e===null||typeof e!="object"?null:(e=Yi&&e[Yi]||e["@@iterator"],typeof e=="function"?e:null)}var Y=Object.assign,zl;function zn(e){if(zl===void 0)try{throw Error()}catch(n){var t=n.stack.trim().match(/\n( *(at )?)/);zl=t&&t[1]||""}return`
-`+zl+e}var Tl=!1;function Ll(e,t){if(!e||Tl)return"";Tl=!0;var n=Error.prepareStackTrace;Error.prepareStackTrace=void 0;try{if(t)if(t=function(){throw Error()},Object.defineProperty(t.prototype,"props",{set:function(){throw Error()}}),typeof Reflect=="object"&&Reflect.construct){try{Reflect.construct(t,[])}catch(c){var r=c}Reflect.construct(e,[],t)}else{try{t.call()}catch(c){r=c}e.call(t.prototype)}else{try{throw Error()}catch(c){r=c}e()}}catch(c){if(c&&r&&typeof c.stack=="string"){for(var l=c.stack.split(`
-`),o=r.stack.split(`
-`),i=l.length-1,u=o.length-1;1<=i&&0<=u&&l[i]!==o[u];)u--;for(;1<=i&&0<=u;i--,u--)if(l[i]!==o[u]){if(i!==1||u!==1)do if(i--,u--,0>u||l[i]!==o[u]){var s=`
-`+l[i].replace(" at new "," at ");return e.displayName&&s.includes("<anonymous>")&&(s=s.replace("<anonymous>",e.displayName)),s}while(1<=i&&0<=u);break}}}finally{Tl=!1,Error.prepareStackTrace=n}return(e=e?e.displayName||e.name:"")?zn(e):""}function Vc(e){switch(e.tag){case 5:return zn(e.type);case 16:return zn("Lazy");case 13:return zn("Suspense");case 19:return zn("SuspenseList");case 0:case 2:case 15:return e=Ll(e.type,!1),e;case 11:return e=Ll(e.type.render,!1),e;case 1:return e=Ll(e.type,!0),e;default:return""}}function oo(e){if(e==null)return null;if(typeof e=="function")return e.displayName||e.name||null;if(typeof e=="string")return e;switch(e){case Kt:return"Fragment";case Qt:return"Portal";case no:return"Profiler";case ti:return"StrictMode";case ro:return"Suspense";case lo:return"SuspenseList"}if(typeof e=="object")switch(e.$$typeof){case ps:return(e.displayName||"Context")+".Consumer";case ds:return(e._context.displayName||"Context")+".Provider";case ni:var t=e.render;return e=e.displayName,e||(e=t.displayName||t.name||"",e=e!==""?"ForwardRef("+e+")":"ForwardRef"),e;case ri:return t=e.displayName||null,t!==null?t:oo(e.type)||"Memo";case ut:t=e._payload,e=e._init;try{return oo(e(t))}catch{}}return null}function Bc(e){var t=e.type;switch(e.tag){case 24:return"Cache";case 9:return(t.displayName||"Context")+".Consumer";case 10:return(t._context.displayName||"Context")+".Provider";case 18:return"DehydratedFragment";case 11:return e=t.render,e=e.displayName||e.name||"",t.displayName||(e!==""?"ForwardRef("+e+")":"ForwardRef");case 7:return"Fragment";case 5:return t;case 4:return"Portal";case 3:return"Root";case 6:return"Text";case 16:return oo(t);case 8:return t===ti?"StrictMode":"Mode";case 22:return"Offscreen";case 12:return"Profiler";case 21:return"Scope";case 13:return"Suspense";case 19:return"SuspenseList";case 25:return"TracingMarker";case 1:case 0:case 17:case 2:case 14:case 15:if(typeof t=="function")return t.displayName||t.name||null;if(typeof t=="string")return t}return null}function St(e){switch(typeof e){case"boolean":case"number":case"string":case"undefined":return e;case"object":return e;default:return""}}function ms(e){var t=e.type;return(e=e.nodeName)&&e.toLowerCase()==="input"&&(t==="checkbox"||t==="radio")}function Hc(e){var t=ms(e)?"checked":"value",n=Object.getOwnPropertyDescriptor(e.constructor.prototype,t),r=""+e[t];if(!e.hasOwnProperty(t)&&typeof n<"u"&&typeof n.get=="function"&&typeof n.set=="function"){var l=n.get,o=n.set;return Object.defineProperty(e,t,{configurable:!0,get:function(){return l.call(this)},set:function(i){r=""+i,o.call(this,i)}}),Object.defineProperty(e,t,{enumerable:n.enumerable}),{getValue:function(){return r},setValue:function(i){r=""+i},stopTracking:function(){e._valueTracker=null,delete e[t]}}}}function dr(e){e._valueTracker||(e._valueTracker=Hc(e))}function vs(e){if(!e)return!1;var t=e._valueTracker;if(!t)return!0;var n=t.getValue(),r="";return e&&(r=ms(e)?e.checked?"true":"false":e.value),e=r,e!==n?(t.setValue(e),!0):!1}function $r(e){if(e=e||(typeof document<"u"?document:void 0),typeof e>"u")return null;try{return e.activeElement||e.body}catch{return e.body}}function io(e,t){var n=t.checked;return Y({},t,{defaultChecked:void 0,defaultValue:void 0,value:void 0,checked:n??e._wrapperState.initialChecked})}function Gi(e,t){var n=t.defaultValue==null?"":t.defaultValue,r=t.checked!=null?t.checked:t.defaultChecked;n=St(t.value!=null?t.value:n),e._wrapperState={initialChecked:r,initialValue:n,controlled:t.type==="checkbox"||t.type==="radio"?t.checked!=null:t.value!=null}}function ys(e,t){t=t.checked,t!=null&&ei(e,"checked",t,!1)}function uo(e,t){ys(e,t);var n=St(t.value),r=t.type;if(n!=null)r==="number"?(n===0&&e.value===""||e.value!=n)&&(e.value=""+n):e.value!==""+n&&(e.value=""+n);else if(r==="submit"||r==="reset"){e.removeAttribute("value");return}t.hasOwnProperty("value")?so(e,t.type,n):t.hasOwnProperty("defaultValue")&&so(e,t.type,St(t.defaultValue)),t.checked==null&&t.defaultChecked!=null&&(e.defaultChecked=!!t.defaultChecked)}function Xi(e,t,n){if(t.hasOwnProperty("value")||t.hasOwnProperty("defaultValue")){var r=t.type;if(!(r!=="submit"&&r!=="reset"||t.value!==void 0&&t.value!==null))return;t=""+e._wrapperState.initialValue,n||t===e.value||(e.value=t),e.defaultValue=t}n=e.name,n!==""&&(e.name=""),e.defaultChecked=!!e._wrapperState.initialChecked,n!==""&&(e.name=n)}function so(e,t,n){(t!=="number"||$r(e.ownerDocument)!==e)&&(n==null?e.defaultValue=""+e._wrapperState.initialValue:e.defaultValue!==""+n&&(e.defaultValue=""+n))}var Tn=Array.isArray;function rn(e,t,n,r){if(e=e.options,t){t={};for(var l=0;l<n.length;l++)t["$"+n[l]]=!0;for(n=0;n<e.length;n++)l=t.hasOwnProperty("$"+e[n].value),e[n].selected!==l&&(e[n].selected=l),l&&r&&(e[n].defaultSelected=!0)}else{for(n=""+St(n),t=null,l=0;l<e.length;l++){if(e[l].value===n){e[l].selected=!0,r&&(e[l].defaultSelected=!0);return}t!==null||e[l].disabled||(t=e[l])}t!==null&&(t.selected=!0)}}function ao(e,t){if(t.dangerouslySetInnerHTML!=null)throw Error(w(91));return Y({},t,{value:void 0,defaultValue:void 0,children:""+e._wrapperState.initialValue})}function Zi(e,t){var n=t.value;if(n==null){if(n=t.children,t=t.defaultValue,n!=null){if(t!=null)throw Error(w(92));if(Tn(n)){if(1<n.length)throw Error(w(93));n=n[0]}t=n}t==null&&(t=""),n=t}e._wrapperState={initialValue:St(n)}}function gs(e,t){var n=St(t.value),r=St(t.defaultValue);n!=null&&(n=""+n,n!==e.value&&(e.value=n),t.defaultValue==null&&e.defaultValue!==n&&(e.defaultValue=n)),r!=null&&(e.defaultValue=""+r)}function Ji(e){var t=e.textContent;t===e._wrapperState.initialValue&&t!==""&&t!==null&&(e.value=t)}function ws(e){switch(e){case"svg":return"http://www.w3.org/2000/svg";case"math":return"http://www.w3.org/1998/Math/MathML";default:return"http://www.w3.org/1999/xhtml"}}function co(e,t){return e==null||e==="http://www.w3.org/1999/xhtml"?ws(t):e==="http://www.w3.org/2000/svg"&&t==="foreignObject"?"http://www.w3.org/1999/xhtml":e}var pr,xs=function(e){return typeof MSApp<"u"&&MSApp.execUnsafeLocalFunction?function(t,n,r,l){MSApp.execUnsafeLocalFunction(function(){return e(t,n,r,l)})}:e}(function(e,t){if(e.namespaceURI!=="http://www.w3.org/2000/svg"||"innerHTML"in e)e.innerHTML=t;else{for(pr=pr||document.createElement("div"),pr.innerHTML="<svg>"+t.valueOf().toString()+"</svg>",t=pr.firstChild;e.firstChild;)e.removeChild(e.firstChild);for(;t.firstChild;)e.appendChild(t.firstChild)}});function Hn(e,t){if(t){var n=e.firstChild;if(n&&n===e.lastChild&&n.nodeType===3){n.nodeValue=t;return}}e.textContent=t}var Rn={animationIterationCount:!0,aspectRatio:!0,borderImageOutset:!0,borderImageSlice:!0,borderImageWidth:!0,boxFlex:!0,boxFlexGroup:!0,boxOrdinalGroup:!0,columnCount:!0,columns:!0,flex:!0,flexGrow:!0,flexPositive:!0,flexShrink:!0,flexNegative:!0,flexOrder:!0,gridArea:!0,gridRow:!0,gridRowEnd:!0,gridRowSpan:!0,gridRowStart:!0,gridColumn:!0,gridColumnEnd:!0,gridColumnSpan:!0,gridColumnStart:!0,fontWeight:!0,lineClamp:!0,lineHeight:!0,opacity:!0,order:!0,orphans:!0,tabSize:!0,widows:!0,zIndex:!0,zoom:!0,fillOpacity:!0,floodOpacity:!0,stopOpacity:!0,strokeDasharray:!0,strokeDashoffset:!0,strokeMiterlimit:!0,strokeOpacity:!0,strokeWidth:!0},Wc=["Webkit","ms","Moz","O"];Object.keys(Rn).forEach(function(e){Wc.forEach(function(t){t=t+e.charAt(0).toUpperCase()+e.substring(1),Rn[t]=Rn[e]})});function Ss(e,t,n){return t==null||typeof t=="boolean"||t===""?"":n||typeof t!="number"||t===0||Rn.hasOwnProperty(e)&&Rn[e]?(""+t).trim():t+"px"}function ks(e,t){e=e.style;for(var n in t)if(t.hasOwnProperty(n)){var r=n.indexOf("--")===0,l=Ss(n,t[n],r);n==="float"&&(n="cssFloat"),r?e.setProperty(n,l):e[n]=l}}var Qc=Y({menuitem:!0},{area:!0,base:!0,br:!0,col:!0,embed:!0,hr:!0,img:!0,input:!0,keygen:!0,link:!0,meta:!0,param:!0,source:!0,track:!0,wbr:!0});function fo(e,t){if(t){if(Qc[e]&&(t.children!=null||t.dangerouslySetInnerHTML!=null))throw Error(w(137,e));if(t.dangerouslySetInnerHTML!=null){if(t.children!=null)throw Error(w(60));if(typeof t.dangerouslySetInnerHTML!="object"||!("__html"in t.dangerouslySetInnerHTML))throw Error(w(61))}if(t.style!=null&&typeof t.style!="object")throw Error(w(62))}}function po(e,t){if(e.indexOf("-")===-1)return typeof t.is=="string";switch(e){case"annotation-xml":case"color-profile":case"font-face":case"font-face-src":case"font-face-uri":case"font-face-format":case"font-face-name":case"missing-glyph":return!1;default:return!0}}var ho=null;function li(e){return e=e.target||e.srcElement||window,e.correspondingUseElement&&(e=e.correspondingUseElement),e.nodeType===3?e.parentNode:e}var mo=null,ln=null,on=null;function qi(e){if(e=sr(e)){if(typeof mo!="function")throw Error(w(280));var t=e.stateNode;t&&(t=hl(t),mo(e.stateNode,e.type,t))}}function Es(e){ln?on?on.push(e):on=[e]:ln=e}function Cs(){if(ln){var e=ln,t=on;if(on=ln=null,qi(e),t)for(e=0;e<t.length;e++)qi(t[e])}}function Ns(e,t){return e(t)}function _s(){}var Ml=!1;function js(e,t,n){if(Ml)return e(t,n);Ml=!0;try{return Ns(e,t,n)}finally{Ml=!1,(ln!==null||on!==null)&&(_s(),Cs())}}function Wn(e,t){var n=e.stateNode;if(n===null)return null;var r=hl(n);if(r===null)return null;n=r[t];e:switch(t){case"onClick":case"onClickCapture":case"onDoubleClick":case"onDoubleClickCapture":case"onMouseDown":case"onMouseDownCapture":case"onMouseMove":case"onMouseMoveCapture":case"onMouseUp":case"onMouseUpCapture":case"onMouseEnter":(r=!r.disabled)||(e=e.type,r=!(e==="button"||e==="input"||e==="select"||e==="textarea")),e=!r;break e;default:e=!1}if(e)return null;if(n&&typeof n!="function")throw Error(w(231,t,typeof n));return n}var vo=!1;if(et)try{var kn={};Object.defineProperty(kn,"passive",{get:function(){vo=!0}}),window.addEventListener("test",kn,kn),window.removeEventListener("test",kn,kn)}catch{vo=!1}function Kc(e,t,n,r,l,o,i,u,s){var c=Array.prototype.slice.call(arguments,3);try{t.apply(n,c)}catch(y){this.onError(y)}}var On=!1,Ar=null,Vr=!1,yo=null,Yc={onError:function(e){On=!0,Ar=e}};function Gc(e,t,n,r,l,o,i,u,s){On=!1,Ar=null,Kc.apply(Yc,arguments)}function Xc(e,t,n,r,l,o,i,u,s){if(Gc.apply(this,arguments),On){if(On){var c=Ar;On=!1,Ar=null}else throw Error(w(198));Vr||(Vr=!0,yo=c)}}function Vt(e){var t=e,n=e;if(e.alternate)for(;t.return;)t=t.return;else{e=t;do t=e,t.flags&4098&&(n=t.return),e=t.return;while(e)}return t.tag===3?n:null}function Ps(e){if(e.tag===13){var t=e.memoizedState;if(t===null&&(e=e.alternate,e!==null&&(t=e.memoizedState)),t!==null)return t.dehydrated}return null}function bi(e){if(Vt(e)!==e)throw Error(w(188))}function Zc(e){var t=e.alternate;if(!t){if(t=Vt(e),t===null)throw Error(w(188));return t!==e?null:e}for(var n=e,r=t;;){var l=n.return;if(l===null)break;var o=l.alternate;if(o===null){if(r=l.return,r!==null){n=r;continue}break}if(l.child===o.child){for(o=l.child;o;){if(o===n)return bi(l),e;if(o===r)return bi(l),t;o=o.sibling}throw Error(w(188))}if(n.return!==r.return)n=l,r=o;else{for(var i=!1,u=l.child;u;){if(u===n){i=!0,n=l,r=o;break}if(u===r){i=!0,r=l,n=o;break}u=u.sibling}if(!i){for(u=o.child;u;){if(u===n){i=!0,n=o,r=l;break}if(u===r){i=!0,r=o,n=l;break}u=u.sibling}if(!i)throw Error(w(189))}}if(n.alternate!==r)throw Error(w(190))}if(n.tag!==3)throw Error(w(188));return n.stateNode.current===n?e:t}function zs(e){return e=Zc(e),e!==null?Ts(e):null}function Ts(e){if(e.tag===5||e.tag===6)return e;for(e=e.child;e!==null;){var t=Ts(e);if(t!==null)return t;e=e.sibling}return null}var Ls=Ne.unstable_scheduleCallback,eu=Ne.unstable_cancelCallback,Jc=Ne.unstable_shouldYield,qc=Ne.unstable_requestPaint,X=Ne.unstable_now,bc=Ne.unstable_getCurrentPriorityLevel,oi=Ne.unstable_ImmediatePriority,Ms=Ne.unstable_UserBlockingPriority,Br=Ne.unstable_NormalPriority,ef=Ne.unstable_LowPriority,Rs=Ne.unstable_IdlePriority,cl=null,Ke=null;function tf(e){if(Ke&&typeof Ke.onCommitFiberRoot=="function")try{Ke.onCommitFiberRoot(cl,e,void 0,(e.current.flags&128)===128)}catch{}}var $e=Math.clz32?Math.clz32:lf,nf=Math.log,rf=Math.LN2;function lf(e){return e>>>=0,e===0?32:31-(nf(e)/rf|0)|0}var hr=64,mr=4194304;function Ln(e){switch(e&-e){case 1:return 1;case 2:return 2;case 4:return 4;case 8:return 8;case 16:return 16;case 32:return 32;case 64:case 128:case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:return e&4194240;case 4194304:case 8388608:case 16777216:case 33554432:case 67108864:return e&130023424;case 134217728:return 134217728;case 268435456:return 268435456;case 536870912:return 536870912;case 1073741824:return 1073741824;default:return e}}function Hr(e,t){var n=e.pendingLanes;if(n===0)return 0;var r=0,l=e.suspendedLanes,o=e.pingedLanes,i=n&268435455;if(i!==0){var u=i&~l;u!==0?r=Ln(u):(o&=i,o!==0&&(r=Ln(o)))}else i=n&~l,i!==0?r=Ln(i):o!==0&&(r=Ln(o));if(r===0)return 0;if(t!==0&&t!==r&&!(t&l)&&(l=r&-r,o=t&-t,l>=o||l===16&&(o&4194240)!==0))return t;if(r&4&&(r|=n&16),t=e.entangledLanes,t!==0)for(e=e.entanglements,t&=r;0<t;)n=31-$e(t),l=1<<n,r|=e[n],t&=~l;return r}function of(e,t){switch(e){case 1:case 2:case 4:return t+250;case 8:case 16:case 32:case 64:case 128:case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:return t+5e3;case 4194304:case 8388608:case 16777216:case 33554432:case 67108864:return-1;case 134217728:case 268435456:case 536870912:case 1073741824:return-1;default:return-1}}function uf(e,t){for(var n=e.suspendedLanes,r=e.pingedLanes,l=e.expirationTimes,o=e.pendingLanes;0<o;){var i=31-$e(o),u=1<<i,s=l[i];s===-1?(!(u&n)||u&r)&&(l[i]=of(u,t)):s<=t&&(e.expiredLanes|=u),o&=~u}}function go(e){return e=e.pendingLanes&-1073741825,e!==0?e:e&1073741824?1073741824:0}function Os(){var e=hr;return hr<<=1,!(hr&4194240)&&(hr=64),e}function Rl(e){for(var t=[],n=0;31>n;n++)t.push(e);return t}function ir(e,t,n){e.pendingLanes|=t,t!==536870912&&(e.suspendedLanes=0,e.pingedLanes=0),e=e.eventTimes,t=31-$e(t),e[t]=n}function sf(e,t){var n=e.pendingLanes&~t;e.pendingLanes=t,e.suspendedLanes=0,e.pingedLanes=0,e.expiredLanes&=t,e.mutableReadLanes&=t,e.entangledLanes&=t,t=e.entanglements;var r=e.eventTimes;for(e=e.expirationTimes;0<n;){var l=31-$e(n),o=1<<l;t[l]=0,r[l]=-1,e[l]=-1,n&=~o}}function ii(e,t){var n=e.entangledLanes|=t;for(e=e.entanglements;n;){var r=31-$e(n),l=1<<r;l&t|e[r]&t&&(e[r]|=t),n&=~l}}var D=0;function Ds(e){return e&=-e,1<e?4<e?e&268435455?16:536870912:4:1}var Is,ui,Fs,Us,$s,wo=!1,vr=[],pt=null,ht=null,mt=null,Qn=new Map,Kn=new Map,at=[],af="mousedown mouseup touchcancel touchend touchstart auxclick dblclick pointercancel pointerdown pointerup dragend dragstart drop compositionend compositionstart keydown keypress keyup input textInput copy cut paste click change contextmenu reset submit".split(" ");function tu(e,t){switch(e){case"focusin":case"focusout":pt=null;break;case"dragenter":case"dragleave":ht=null;break;case"mouseover":case"mouseout":mt=null;break;case"pointerover":case"pointerout":Qn.delete(t.pointerId);break;case"gotpointercapture":case"lostpointercapture":Kn.delete(t.pointerId)}}function En(e,t,n,r,l,o){return e===null||e.nativeEvent!==o?(e={blockedOn:t,domEventName:n,eventSystemFlags:r,nativeEvent:o,targetContainers:[l]},t!==null&&(t=sr(t),t!==null&&ui(t)),e):(e.eventSystemFlags|=r,t=e.targetContainers,l!==null&&t.indexOf(l)===-1&&t.push(l),e)}function cf(e,t,n,r,l){switch(t){case"focusin":return pt=En(pt,e,t,n,r,l),!0;case"dragenter":return ht=En(ht,e,t,n,r,l),!0;case"mouseover":return mt=En(mt,e,t,n,r,l),!0;case"pointerover":var o=l.pointerId;return Qn.set(o,En(Qn.get(o)||null,e,t,n,r,l)),!0;case"gotpointercapture":return o=l.pointerId,Kn.set(o,En(Kn.get(o)||null,e,t,n,r,l)),!0}return!1}function As(e){var t=Tt(e.target);if(t!==null){var n=Vt(t);if(n!==null){if(t=n.tag,t===13){if(t=Ps(n),t!==null){e.blockedOn=t,$s(e.priority,function(){Fs(n)});return}}else if(t===3&&n.stateNode.current.memoizedState.isDehydrated){e.blockedOn=n.tag===3?n.stateNode.containerInfo:null;return}}}e.blockedOn=null}function zr(e){if(e.blockedOn!==null)return!1;for(var t=e.targetContainers;0<t.length;){var n=xo(e.domEventName,e.eventSystemFlags,t[0],e.nativeEvent);if(n===null){n=e.nativeEvent;var r=new n.constructor(n.type,n);ho=r,n.target.dispatchEvent(r),ho=null}else return t=sr(n),t!==null&&ui(t),e.blockedOn=n,!1;t.shift()}return!0}function nu(e,t,n){zr(e)&&n.delete(t)}function ff(){wo=!1,pt!==null&&zr(pt)&&(pt=null),ht!==null&&zr(ht)&&(ht=null),mt!==null&&zr(mt)&&(mt=null),Qn.forEach(nu),Kn.forEach(nu)}function Cn(e,t){e.blockedOn===t&&(e.blockedOn=null,wo||(wo=!0,Ne.unstable_scheduleCallback(Ne.unstable_NormalPriority,ff)))}function Yn(e){function t(l){return Cn(l,e)}if(0<vr.length){Cn(vr[0],e);for(var n=1;n<vr.length;n++){var r=vr[n];r.blockedOn===e&&(r.blockedOn=null)}}for(pt!==null&&Cn(pt,e),ht!==null&&Cn(ht,e),mt!==null&&Cn(mt,e),Qn.forEach(t),Kn.forEach(t),n=0;n<at.length;n++)r=at[n],r.blockedOn===e&&(r.blockedOn=null);for(;0<at.length&&(n=at[0],n.blockedOn===null);)As(n),n.blockedOn===null&&at.shift()}var un=lt.ReactCurrentBatchConfig,Wr=!0;function df(e,t,n,r){var l=D,o=un.transition;un.transition=null;try{D=1,si(e,t,n,r)}finally{D=l,un.transition=o}}function pf(e,t,n,r){var l=D,o=un.transition;un.transition=null;try{D=4,si(e,t,n,r)}finally{D=l,un.transition=o}}function si(e,t,n,r){if(Wr){var l=xo(e,t,n,r);if(l===null)Hl(e,t,r,Qr,n),tu(e,r);else if(cf(l,e,t,n,r))r.stopPropagation();else if(tu(e,r),t&4&&-1<af.indexOf(e)){for(;l!==null;){var o=sr(l);if(o!==null&&Is(o),o=xo(e,t,n,r),o===null&&Hl(e,t,r,Qr,n),o===l)break;l=o}l!==null&&r.stopPropagation()}else Hl(e,t,r,null,n)}}var Qr=null;function xo(e,t,n,r){if(Qr=null,e=li(r),e=Tt(e),e!==null)if(t=Vt(e),t===null)e=null;else if(n=t.tag,n===13){if(e=Ps(t),e!==null)return e;e=null}else if(n===3){if(t.stateNode.current.memoizedState.isDehydrated)return t.tag===3?t.stateNode.containerInfo:null;e=null}else t!==e&&(e=null);return Qr=e,null}function Vs(e){switch(e){case"cancel":case"click":case"close":case"contextmenu":case"copy":case"cut":case"auxclick":case"dblclick":case"dragend":case"dragstart":case"drop":case"focusin":case"focusout":case"input":case"invalid":case"keydown":case"keypress":case"keyup":case"mousedown":case"mouseup":case"paste":case"pause":case"play":case"pointercancel":case"pointerdown":case"pointerup":case"ratechange":case"reset":case"resize":case"seeked":case"submit":case"touchcancel":case"touchend":case"touchstart":case"volumechange":case"change":case"selectionchange":case"textInput":case"compositionstart":case"compositionend":case"compositionupdate":case"beforeblur":case"afterblur":case"beforeinput":case"blur":case"fullscreenchange":case"focus":case"hashchange":case"popstate":case"select":case"selectstart":return 1;case"drag":case"dragenter":case"dragexit":case"dragleave":case"dragover":case"mousemove":case"mouseout":case"mouseover":case"pointermove":case"pointerout":case"pointerover":case"scroll":case"toggle":case"touchmove":case"wheel":case"mouseenter":case"mouseleave":case"pointerenter":case"pointerleave":return 4;case"message":switch(bc()){case oi:return 1;case Ms:return 4;case Br:case ef:return 16;case Rs:return 536870912;default:return 16}default:return 16}}var ft=null,ai=null,Tr=null;function Bs(){if(Tr)return Tr;var e,t=ai,n=t.length,r,l="value"in ft?ft.value:ft.textContent,o=l.length;for(e=0;e<n&&t[e]===l[e];e++);var i=n-e;for(r=1;r<=i&&t[n-r]===l[o-r];r++);return Tr=l.slice(e,1<r?1-r:void 0)}function Lr(e){var t=e.keyCode;return"charCode"in e?(e=e.charCode,e===0&&t===13&&(e=13)):e=t,e===10&&(e=13),32<=e||e===13?e:0}function yr(){return!0}function ru(){return!1}function je(e){function t(n,r,l,o,i){this._reactName=n,this._targetInst=l,this.type=r,this.nativeEvent=o,this.target=i,this.currentTarget=null;for(var u in e)e.hasOwnProperty(u)&&(n=e[u],this[u]=n?n(o):o[u]);return this.isDefaultPrevented=(o.defaultPrevented!=null?o.defaultPrevented:o.returnValue===!1)?yr:ru,this.isPropagationStopped=ru,this}return Y(t.prototype,{preventDefault:function(){this.defaultPrevented=!0;var n=this.nativeEvent;n&&(n.preventDefault?n.preventDefault():typeof n.returnValue!="unknown"&&(n.returnValue=!1),this.isDefaultPrevented=yr)},stopPropagation:function(){var n=this.nativeEvent;n&&(n.stopPropagation?n.stopPropagation():typeof n.cancelBubble!="unknown"&&(n.cancelBubble=!0),this.isPropagationStopped=yr)},persist:function(){},isPersistent:yr}),t}var gn={eventPhase:0,bubbles:0,cancelable:0,timeStamp:function(e){return e.timeStamp||Date.now()},defaultPrevented:0,isTrusted:0},ci=je(gn),ur=Y({},gn,{view:0,detail:0}),hf=je(ur),Ol,Dl,Nn,fl=Y({},ur,{screenX:0,screenY:0,clientX:0,clientY:0,pageX:0,pageY:0,ctrlKey:0,shiftKey:0,altKey:0,metaKey:0,getModifierState:fi,button:0,buttons:0,relatedTarget:function(e){return e.relatedTarget===void 0?e.fromElement===e.srcElement?e.toElement:e.fromElement:e.relatedTarget},movementX:function(e){return"movementX"in e?e.movementX:(e!==Nn&&(Nn&&e.type==="mousemove"?(Ol=e.screenX-Nn.screenX,Dl=e.screenY-Nn.screenY):Dl=Ol=0,Nn=e),Ol)},movementY:function(e){return"movementY"in e?e.movementY:Dl}}),lu=je(fl),mf=Y({},fl,{dataTransfer:0}),vf=je(mf),yf=Y({},ur,{relatedTarget:0}),Il=je(yf),gf=Y({},gn,{animationName:0,elapsedTime:0,pseudoElement:0}),wf=je(gf),xf=Y({},gn,{clipboardData:function(e){return"clipboardData"in e?e.clipboardData:window.clipboardData}}),Sf=je(xf),kf=Y({},gn,{data:0}),ou=je(kf),Ef={Esc:"Escape",Spacebar:" ",Left:"ArrowLeft",Up:"ArrowUp",Right:"ArrowRight",Down:"ArrowDown",Del:"Delete",Win:"OS",Menu:"ContextMenu",Apps:"ContextMenu",Scroll:"ScrollLock",MozPrintableKey:"Unidentified"},Cf={8:"Backspace",9:"Tab",12:"Clear",13:"Enter",16:"Shift",17:"Control",18:"Alt",19:"Pause",20:"CapsLock",27:"Escape",32:" ",33:"PageUp",34:"PageDown",35:"End",36:"Home",37:"ArrowLeft",38:"ArrowUp",39:"ArrowRight",40:"ArrowDown",45:"Insert",46:"Delete",112:"F1",113:"F2",114:"F3",115:"F4",116:"F5",117:"F6",118:"F7",119:"F8",120:"F9",121:"F10",122:"F11",123:"F12",144:"NumLock",145:"ScrollLock",224:"Meta"},Nf={Alt:"altKey",Control:"ctrlKey",Meta:"metaKey",Shift:"shiftKey"};function _f(e){var t=this.nativeEvent;return t.getModifierState?t.getModifierState(e):(e=Nf[e])?!!t[e]:!1}function fi(){return _f}var jf=Y({},ur,{key:function(e){if(e.key){var t=Ef[e.key]||e.key;if(t!=="Unidentified")return t}return e.type==="keypress"?(e=Lr(e),e===13?"Enter":String.fromCharCode(e)):e.type==="keydown"||e.type==="keyup"?Cf[e.keyCode]||"Unidentified":""},code:0,location:0,ctrlKey:0,shiftKey:0,altKey:0,metaKey:0,repeat:0,locale:0,getModifierState:fi,charCode:function(e){return e.type==="keypress"?Lr(e):0},keyCode:function(e){return e.type==="keydown"||e.type==="keyup"?e.keyCode:0},which:function(e){return e.type==="keypress"?Lr(e):e.type==="keydown"||e.type==="keyup"?e.keyCode:0}}),Pf=je(jf),zf=Y({},fl,{pointerId:0,width:0,height:0,pressure:0,tangentialPressure:0,tiltX:0,tiltY:0,twist:0,pointerType:0,isPrimary:0}),iu=je(zf),Tf=Y({},ur,{touches:0,targetTouches:0,changedTouches:0,altKey:0,metaKey:0,ctrlKey:0,shiftKey:0,getModifierState:fi}),Lf=je(Tf),Mf=Y({},gn,{propertyName:0,elapsedTime:0,pseudoElement:0}),Rf=je(Mf),Of=Y({},fl,{deltaX:function(e){return"deltaX"in e?e.deltaX:"wheelDeltaX"in e?-e.wheelDeltaX:0},deltaY:function(e){return"deltaY"in e?e.deltaY:"wheelDeltaY"in e?-e.wheelDeltaY:"wheelDelta"in e?-e.wheelDelta:0},deltaZ:0,deltaMode:0}),Df=je(Of),If=[9,13,27,32],di=et&&"CompositionEvent"in window,Dn=null;et&&"documentMode"in document&&(Dn=document.documentMode);var Ff=et&&"TextEvent"in window&&!Dn,Hs=et&&(!di||Dn&&8<Dn&&11>=Dn),uu=" ",su=!1;function Ws(e,t){switch(e){case"keyup":return If.indexOf(t.keyCode)!==-1;case"keydown":return t.keyCode!==229;case"keypress":case"mousedown":case"focusout":return!0;default:return!1}}function Qs(e){return e=e.detail,typeof e=="object"&&"data"in e?e.data:null}var Yt=!1;function Uf(e,t){switch(e){case"compositionend":return Qs(t);case"keypress":return t.which!==32?null:(su=!0,uu);case"textInput":return e=t.data,e===uu&&su?null:e;default:return null}}function $f(e,t){if(Yt)return e==="compositionend"||!di&&Ws(e,t)?(e=Bs(),Tr=ai=ft=null,Yt=!1,e):null;switch(e){case"paste":return null;case"keypress":if(!(t.ctrlKey||t.altKey||t.metaKey)||t.ctrlKey&&t.altKey){if(t.char&&1<t.char.length)return t.char;if(t.which)return String.fromCharCode(t.which)}return null;case"compositionend":return Hs&&t.locale!=="ko"?null:t.data;default:return null}}var Af={color:!0,date:!0,datetime:!0,"datetime-local":!0,email:!0,month:!0,number:!0,password:!0,range:!0,search:!0,tel:!0,text:!0,time:!0,url:!0,week:!0};function au(e){var t=e&&e.nodeName&&e.nodeName.toLowerCase();return t==="input"?!!Af[e.type]:t==="textarea"}function Ks(e,t,n,r){Es(r),t=Kr(t,"onChange"),0<t.length&&(n=new ci("onChange","change",null,n,r),e.push({event:n,listeners:t}))}var In=null,Gn=null;function Vf(e){ra(e,0)}function dl(e){var t=Zt(e);if(vs(t))return e}function Bf(e,t){if(e==="change")return t}var Ys=!1;if(et){var Fl;if(et){var Ul="oninput"in document;if(!Ul){var cu=document.createElement("div");cu.setAttribute("oninput","return;"),Ul=typeof cu.oninput=="function"}Fl=Ul}else Fl=!1;Ys=Fl&&(!document.documentMode||9<document.documentMode)}function fu(){In&&(In.detachEvent("onpropertychange",Gs),Gn=In=null)}function Gs(e){if(e.propertyName==="value"&&dl(Gn)){var t=[];Ks(t,Gn,e,li(e)),js(Vf,t)}}function Hf(e,t,n){e==="focusin"?(fu(),In=t,Gn=n,In.attachEvent("onpropertychange",Gs)):e==="focusout"&&fu()}function Wf(e){if(e==="selectionchange"||e==="keyup"||e==="keydown")return dl(Gn)}function Qf(e,t){if(e==="click")return dl(t)}function Kf(e,t){if(e==="input"||e==="change")return dl(t)}function Yf(e,t){return e===t&&(e!==0||1/e===1/t)||e!==e&&t!==t}var Ve=typeof Object.is=="function"?Object.is:Yf;function Xn(e,t){if(Ve(e,t))return!0;if(typeof e!="object"||e===null||typeof t!="object"||t===null)return!1;var n=Object.keys(e),r=Object.keys(t);if(n.length!==r.length)return!1;for(r=0;r<n.length;r++){var l=n[r];if(!to.call(t,l)||!Ve(e[l],t[l]))return!1}return!0}function du(e){for(;e&&e.firstChild;)e=e.firstChild;return e}function pu(e,t){var n=du(e);e=0;for(var r;n;){if(n.nodeType===3){if(r=e+n.textContent.length,e<=t&&r>=t)return{node:n,offset:t-e};e=r}e:{for(;n;){if(n.nextSibling){n=n.nextSibling;break e}n=n.parentNode}n=void 0}n=du(n)}}function Xs(e,t){return e&&t?e===t?!0:e&&e.nodeType===3?!1:t&&t.nodeType===3?Xs(e,t.parentNode):"contains"in e?e.contains(t):e.compareDocumentPosition?!!(e.compareDocumentPosition(t)&16):!1:!1}function Zs(){for(var e=window,t=$r();t instanceof e.HTMLIFrameElement;){try{var n=typeof t.contentWindow.location.href=="string"}catch{n=!1}if(n)e=t.contentWindow;else break;t=$r(e.document)}return t}function pi(e){var t=e&&e.nodeName&&e.nodeName.toLowerCase();return t&&(t==="input"&&(e.type==="text"||e.type==="search"||e.type==="tel"||e.type==="url"||e.type==="password")||t==="textarea"||e.contentEditable==="true")}function Gf(e){var t=Zs(),n=e.focusedElem,r=e.selectionRange;if(t!==n&&n&&n.ownerDocument&&Xs(n.ownerDocument.documentElement,n)){if(r!==null&&pi(n)){if(t=r.start,e=r.end,e===void 0&&(e=t),"selectionStart"in n)n.selectionStart=t,n.selectionEnd=Math.min(e,n.value.length);else if(e=(t=n.ownerDocument||document)&&t.defaultView||window,e.getSelection){e=e.getSelection();var l=n.textContent.length,o=Math.min(r.start,l);r=r.end===void 0?o:Math.min(r.end,l),!e.extend&&o>r&&(l=r,r=o,o=l),l=pu(n,o);var i=pu(n,r);l&&i&&(e.rangeCount!==1||e.anchorNode!==l.node||e.anchorOffset!==l.offset||e.focusNode!==i.node||e.focusOffset!==i.offset)&&(t=t.createRange(),t.setStart(l.node,l.offset),e.removeAllRanges(),o>r?(e.addRange(t),e.extend(i.node,i.offset)):(t.setEnd(i.node,i.offset),e.addRange(t)))}}for(t=[],e=n;e=e.parentNode;)e.nodeType===1&&t.push({element:e,left:e.scrollLeft,top:e.scrollTop});for(typeof n.focus=="function"&&n.focus(),n=0;n<t.length;n++)e=t[n],e.element.scrollLeft=e.left,e.element.scrollTop=e.top}}var Xf=et&&"documentMode"in document&&11>=document.documentMode,Gt=null,So=null,Fn=null,ko=!1;function hu(e,t,n){var r=n.window===n?n.document:n.nodeType===9?n:n.ownerDocument;ko||Gt==null||Gt!==$r(r)||(r=Gt,"selectionStart"in r&&pi(r)?r={start:r.selectionStart,end:r.selectionEnd}:(r=(r.ownerDocument&&r.ownerDocument.defaultView||window).getSelection(),r={anchorNode:r.anchorNode,anchorOffset:r.anchorOffset,focusNode:r.focusNode,focusOffset:r.focusOffset}),Fn&&Xn(Fn,r)||(Fn=r,r=Kr(So,"onSelect"),0<r.length&&(t=new ci("onSelect","select",null,t,n),e.push({event:t,listeners:r}),t.target=Gt)))}function gr(e,t){var n={};return n[e.toLowerCase()]=t.toLowerCase(),n["Webkit"+e]="webkit"+t,n["Moz"+e]="moz"+t,n}var Xt={animationend:gr("Animation","AnimationEnd"),animationiteration:gr("Animation","AnimationIteration"),animationstart:gr("Animation","AnimationStart"),transitionend:gr("Transition","TransitionEnd")},$l={},Js={};et&&(Js=document.createElement("div").style,"AnimationEvent"in window||(delete Xt.animationend.animation,delete Xt.animationiteration.animation,delete Xt.animationstart.animation),"TransitionEvent"in window||delete Xt.transitionend.transition);function pl(e){if($l[e])return $l[e];if(!Xt[e])return e;var t=Xt[e],n;for(n in t)if(t.hasOwnProperty(n)&&n in Js)return $l[e]=t[n];return e}var qs=pl("animationend"),bs=pl("animationiteration"),ea=pl("animationstart"),ta=pl("transitionend"),na=new Map,mu="abort auxClick cancel canPlay canPlayThrough click close contextMenu copy cut drag dragEnd dragEnter dragExit dragLeave dragOver dragStart drop durationChange emptied encrypted ended error gotPointerCapture input invalid keyDown keyPress keyUp load loadedData loadedMetadata loadStart lostPointerCapture mouseDown mouseMove mouseOut mouseOver mouseUp paste pause play playing pointerCancel pointerDown pointerMove pointerOut pointerOver pointerUp progress rateChange reset resize seeked seeking stalled submit suspend timeUpdate touchCancel touchEnd touchStart volumeChange scroll toggle touchMove waiting wheel".split(" ");function Et(e,t){na.set(e,t),At(t,[e])}for(var Al=0;Al<mu.length;Al++){var Vl=mu[Al],Zf=Vl.toLowerCase(),Jf=Vl[0].toUpperCase()+Vl.slice(1);Et(Zf,"on"+Jf)}Et(qs,"onAnimationEnd");Et(bs,"onAnimationIteration");Et(ea,"onAnimationStart");Et("dblclick","onDoubleClick");Et("focusin","onFocus");Et("focusout","onBlur");Et(ta,"onTransitionEnd");cn("onMouseEnter",["mouseout","mouseover"]);cn("onMouseLeave",["mouseout","mouseover"]);cn("onPointerEnter",["pointerout","pointerover"]);cn("onPointerLeave",["pointerout","pointerover"]);At("onChange","change click focusin focusout input keydown keyup selectionchange".split(" "));At("onSelect","focusout contextmenu dragend focusin keydown keyup mousedown mouseup selectionchange".split(" "));At("onBeforeInput",["compositionend","keypress","textInput","paste"]);At("onCompositionEnd","compositionend focusout keydown keypress keyup mousedown".split(" "));At("onCompositionStart","compositionstart focusout keydown keypress keyup mousedown".split(" "));At("onCompositionUpdate","compositionupdate focusout keydown keypress keyup mousedown".split(" "));var Mn="abort canplay canplaythrough durationchange emptied encrypted ended error loadeddata loadedmetadata loadstart pause play playing progress ratechange resize seeked seeking stalled suspend timeupdate volumechange waiting".split(" "),qf=new Set("cancel close invalid load scroll toggle".split(" ").concat(Mn));function vu(e,t,n){var r=e.type||"unknown-event";e.currentTarget=n,Xc(r,t,void 0,e),e.currentTarget=null}function ra(e,t){t=(t&4)!==0;for(var n=0;n<e.length;n++){var r=e[n],l=r.event;r=r.listeners;e:{var o=void 0;if(t)for(var i=r.length-1;0<=i;i--){var u=r[i],s=u.instance,c=u.currentTarget;if(u=u.listener,s!==o&&l.isPropagationStopped())break e;vu(l,u,c),o=s}else for(i=0;i<r.length;i++){if(u=r[i],s=u.instance,c=u.currentTarget,u=u.listener,s!==o&&l.isPropagationStopped())break e;vu(l,u,c),o=s}}}if(Vr)throw e=yo,Vr=!1,yo=null,e}function A(e,t){var n=t[jo];n===void 0&&(n=t[jo]=new Set);var r=e+"__bubble";n.has(r)||(la(t,e,2,!1),n.add(r))}function Bl(e,t,n){var r=0;t&&(r|=4),la(n,e,r,t)}var wr="_reactListening"+Math.random().toString(36).slice(2);function Zn(e){if(!e[wr]){e[wr]=!0,fs.forEach(function(n){n!=="selectionchange"&&(qf.has(n)||Bl(n,!1,e),Bl(n,!0,e))});var t=e.nodeType===9?e:e.ownerDocument;t===null||t[wr]||(t[wr]=!0,Bl("selectionchange",!1,t))}}function la(e,t,n,r){switch(Vs(t)){case 1:var l=df;break;case 4:l=pf;break;default:l=si}n=l.bind(null,t,n,e),l=void 0,!vo||t!=="touchstart"&&t!=="touchmove"&&t!=="wheel"||(l=!0),r?l!==void 0?e.addEventListener(t,n,{capture:!0,passive:l}):e.addEventListener(t,n,!0):l!==void 0?e.addEventListener(t,n,{passive:l}):e.addEventListener(t,n,!1)}function Hl(e,t,n,r,l){var o=r;if(!(t&1)&&!(t&2)&&r!==null)e:for(;;){if(r===null)return;var i=r.tag;if(i===3||i===4){var u=r.stateNode.containerInfo;if(u===l||u.nodeType===8&&u.parentNode===l)break;if(i===4)for(i=r.return;i!==null;){var s=i.tag;if((s===3||s===4)&&(s=i.stateNode.containerInfo,s===l||s.nodeType===8&&s.parentNode===l))return;i=i.return}for(;u!==null;){if(i=Tt(u),i===null)return;if(s=i.tag,s===5||s===6){r=o=i;continue e}u=u.parentNode}}r=r.return}js(function(){var c=o,y=li(n),v=[];e:{var m=na.get(e);if(m!==void 0){var x=ci,S=e;switch(e){case"keypress":if(Lr(n)===0)break e;case"keydown":case"keyup":x=Pf;break;case"focusin":S="focus",x=Il;break;case"focusout":S="blur",x=Il;break;case"beforeblur":case"afterblur":x=Il;break;case"click":if(n.button===2)break e;case"auxclick":case"dblclick":case"mousedown":case"mousemove":case"mouseup":case"mouseout":case"mouseover":case"contextmenu":x=lu;break;case"drag":case"dragend":case"dragenter":case"dragexit":case"dragleave":case"dragover":case"dragstart":case"drop":x=vf;break;case"touchcancel":case"touchend":case"touchmove":case"touchstart":x=Lf;break;case qs:case bs:case ea:x=wf;break;case ta:x=Rf;break;case"scroll":x=hf;break;case"wheel":x=Df;break;case"copy":case"cut":case"paste":x=Sf;break;case"gotpointercapture":case"lostpointercapture":case"pointercancel":case"pointerdown":case"pointermove":case"pointerout":case"pointerover":case"pointerup":x=iu}var k=(t&4)!==0,I=!k&&e==="scroll",f=k?m!==null?m+"Capture":null:m;k=[];for(var a=c,d;a!==null;){d=a;var g=d.stateNode;if(d.tag===5&&g!==null&&(d=g,f!==null&&(g=Wn(a,f),g!=null&&k.push(Jn(a,g,d)))),I)break;a=a.return}0<k.length&&(m=new x(m,S,null,n,y),v.push({event:m,listeners:k}))}}if(!(t&7)){e:{if(m=e==="mouseover"||e==="pointerover",x=e==="mouseout"||e==="pointerout",m&&n!==ho&&(S=n.relatedTarget||n.fromElement)&&(Tt(S)||S[tt]))break e;if((x||m)&&(m=y.window===y?y:(m=y.ownerDocument)?m.defaultView||m.parentWindow:window,x?(S=n.relatedTarget||n.toElement,x=c,S=S?Tt(S):null,S!==null&&(I=Vt(S),S!==I||S.tag!==5&&S.tag!==6)&&(S=null)):(x=null,S=c),x!==S)){if(k=lu,g="onMouseLeave",f="onMouseEnter",a="mouse",(e==="pointerout"||e==="pointerover")&&(k=iu,g="onPointerLeave",f="onPointerEnter",a="pointer"),I=x==null?m:Zt(x),d=S==null?m:Zt(S),m=new k(g,a+"leave",x,n,y),m.target=I,m.relatedTarget=d,g=null,Tt(y)===c&&(k=new k(f,a+"enter",S,n,y),k.target=d,k.relatedTarget=I,g=k),I=g,x&&S)t:{for(k=x,f=S,a=0,d=k;d;d=Wt(d))a++;for(d=0,g=f;g;g=Wt(g))d++;for(;0<a-d;)k=Wt(k),a--;for(;0<d-a;)f=Wt(f),d--;for(;a--;){if(k===f||f!==null&&k===f.alternate)break t;k=Wt(k),f=Wt(f)}k=null}else k=null;x!==null&&yu(v,m,x,k,!1),S!==null&&I!==null&&yu(v,I,S,k,!0)}}e:{if(m=c?Zt(c):window,x=m.nodeName&&m.nodeName.toLowerCase(),x==="select"||x==="input"&&m.type==="file")var E=Bf;else if(au(m))if(Ys)E=Kf;else{E=Wf;var _=Hf}else(x=m.nodeName)&&x.toLowerCase()==="input"&&(m.type==="checkbox"||m.type==="radio")&&(E=Qf);if(E&&(E=E(e,c))){Ks(v,E,n,y);break e}_&&_(e,m,c),e==="focusout"&&(_=m._wrapperState)&&_.controlled&&m.type==="number"&&so(m,"number",m.value)}switch(_=c?Zt(c):window,e){case"focusin":(au(_)||_.contentEditable==="true")&&(Gt=_,So=c,Fn=null);break;case"focusout":Fn=So=Gt=null;break;case"mousedown":ko=!0;break;case"contextmenu":case"mouseup":case"dragend":ko=!1,hu(v,n,y);break;case"selectionchange":if(Xf)break;case"keydown":case"keyup":hu(v,n,y)}var j;if(di)e:{switch(e){case"compositionstart":var z="onCompositionStart";break e;case"compositionend":z="onCompositionEnd";break e;case"compositionupdate":z="onCompositionUpdate";break e}z=void 0}else Yt?Ws(e,n)&&(z="onCompositionEnd"):e==="keydown"&&n.keyCode===229&&(z="onCompositionStart");z&&(Hs&&n.locale!=="ko"&&(Yt||z!=="onCompositionStart"?z==="onCompositionEnd"&&Yt&&(j=Bs()):(ft=y,ai="value"in ft?ft.value:ft.textContent,Yt=!0)),_=Kr(c,z),0<_.length&&(z=new ou(z,e,null,n,y),v.push({event:z,listeners:_}),j?z.data=j:(j=Qs(n),j!==null&&(z.data=j)))),(j=Ff?Uf(e,n):$f(e,n))&&(c=Kr(c,"onBeforeInput"),0<c.length&&(y=new ou("onBeforeInput","beforeinput",null,n,y),v.push({event:y,listeners:c}),y.data=j))}ra(v,t)})}function Jn(e,t,n){return{instance:e,listener:t,currentTarget:n}}function Kr(e,t){for(var n=t+"Capture",r=[];e!==null;){var l=e,o=l.stateNode;l.tag===5&&o!==null&&(l=o,o=Wn(e,n),o!=null&&r.unshift(Jn(e,o,l)),o=Wn(e,t),o!=null&&r.push(Jn(e,o,l))),e=e.return}return r}function Wt(e){if(e===null)return null;do e=e.return;while(e&&e.tag!==5);return e||null}function yu(e,t,n,r,l){for(var o=t._reactName,i=[];n!==null&&n!==r;){var u=n,s=u.alternate,c=u.stateNode;if(s!==null&&s===r)break;u.tag===5&&c!==null&&(u=c,l?(s=Wn(n,o),s!=null&&i.unshift(Jn(n,s,u))):l||(s=Wn(n,o),s!=null&&i.push(Jn(n,s,u)))),n=n.return}i.length!==0&&e.push({event:t,listeners:i})}var bf=/\r\n?/g,ed=/\u0000|\uFFFD/g;function gu(e){return(typeof e=="string"?e:""+e).replace(bf,`
-`).replace(ed,"")}function xr(e,t,n){if(t=gu(t),gu(e)!==t&&n)throw Error(w(425))}function Yr(){}var Eo=null,Co=null;function No(e,t){return e==="textarea"||e==="noscript"||typeof t.children=="string"||typeof t.children=="number"||typeof t.dangerouslySetInnerHTML=="object"&&t.dangerouslySetInnerHTML!==null&&t.dangerouslySetInnerHTML.__html!=null}var _o=typeof setTimeout=="function"?setTimeout:void 0,td=typeof clearTimeout=="function"?clearTimeout:void 0,wu=typeof Promise=="function"?Promise:void 0,nd=typeof queueMicrotask=="function"?queueMicrotask:typeof wu<"u"?function(e){return wu.resolve(null).then(e).catch(rd)}:_o;function rd(e){setTimeout(function(){throw e})}function Wl(e,t){var n=t,r=0;do{var l=n.nextSibling;if(e.removeChild(n),l&&l.nodeType===8)if(n=l.data,n==="/$"){if(r===0){e.removeChild(l),Yn(t);return}r--}else n!=="$"&&n!=="$?"&&n!=="$!"||r++;n=l}while(n);Yn(t)}function vt(e){for(;e!=null;e=e.nextSibling){var t=e.nodeType;if(t===1||t===3)break;if(t===8){if(t=e.data,t==="$"||t==="$!"||t==="$?")break;if(t==="/$")return null}}return e}function xu(e){e=e.previousSibling;for(var t=0;e;){if(e.nodeType===8){var n=e.data;if(n==="$"||n==="$!"||n==="$?"){if(t===0)return e;t--}else n==="/$"&&t++}e=e.previousSibling}return null}var wn=Math.random().toString(36).slice(2),Qe="__reactFiber$"+wn,qn="__reactProps$"+wn,tt="__reactContainer$"+wn,jo="__reactEvents$"+wn,ld="__reactListeners$"+wn,od="__reactHandles$"+wn;function Tt(e){var t=e[Qe];if(t)return t;for(var n=e.parentNode;n;){if(t=n[tt]||n[Qe]){if(n=t.alternate,t.child!==null||n!==null&&n.child!==null)for(e=xu(e);e!==null;){if(n=e[Qe])return n;e=xu(e)}return t}e=n,n=e.parentNode}return null}function sr(e){return e=e[Qe]||e[tt],!e||e.tag!==5&&e.tag!==6&&e.tag!==13&&e.tag!==3?null:e}function Zt(e){if(e.tag===5||e.tag===6)return e.stateNode;throw Error(w(33))}function hl(e){return e[qn]||null}var Po=[],Jt=-1;function Ct(e){return{current:e}}function V(e){0>Jt||(e.current=Po[Jt],Po[Jt]=null,Jt--)}function F(e,t){Jt++,Po[Jt]=e.current,e.current=t}var kt={},fe=Ct(kt),we=Ct(!1),Dt=kt;function fn(e,t){var n=e.type.contextTypes;if(!n)return kt;var r=e.stateNode;if(r&&r.__reactInternalMemoizedUnmaskedChildContext===t)return r.__reactInternalMemoizedMaskedChildContext;var l={},o;for(o in n)l[o]=t[o];return r&&(e=e.stateNode,e.__reactInternalMemoizedUnmaskedChildContext=t,e.__reactInternalMemoizedMaskedChildContext=l),l}function xe(e){return e=e.childContextTypes,e!=null}function Gr(){V(we),V(fe)}function Su(e,t,n){if(fe.current!==kt)throw Error(w(168));F(fe,t),F(we,n)}function oa(e,t,n){var r=e.stateNode;if(t=t.childContextTypes,typeof r.getChildContext!="function")return n;r=r.getChildContext();for(var l in r)if(!(l in t))throw Error(w(108,Bc(e)||"Unknown",l));return Y({},n,r)}function Xr(e){return e=(e=e.stateNode)&&e.__reactInternalMemoizedMergedChildContext||kt,Dt=fe.current,F(fe,e),F(we,we.current),!0}function ku(e,t,n){var r=e.stateNode;if(!r)throw Error(w(169));n?(e=oa(e,t,Dt),r.__reactInternalMemoizedMergedChildContext=e,V(we),V(fe),F(fe,e)):V(we),F(we,n)}var Ze=null,ml=!1,Ql=!1;function ia(e){Ze===null?Ze=[e]:Ze.push(e)}function id(e){ml=!0,ia(e)}function Nt(){if(!Ql&&Ze!==null){Ql=!0;var e=0,t=D;try{var n=Ze;for(D=1;e<n.length;e++){var r=n[e];do r=r(!0);while(r!==null)}Ze=null,ml=!1}catch(l){throw Ze!==null&&(Ze=Ze.slice(e+1)),Ls(oi,Nt),l}finally{D=t,Ql=!1}}return null}var qt=[],bt=0,Zr=null,Jr=0,ze=[],Te=0,It=null,Je=1,qe="";function Pt(e,t){qt[bt++]=Jr,qt[bt++]=Zr,Zr=e,Jr=t}function ua(e,t,n){ze[Te++]=Je,ze[Te++]=qe,ze[Te++]=It,It=e;var r=Je;e=qe;var l=32-$e(r)-1;r&=~(1<<l),n+=1;var o=32-$e(t)+l;if(30<o){var i=l-l%5;o=(r&(1<<i)-1).toString(32),r>>=i,l-=i,Je=1<<32-$e(t)+l|n<<l|r,qe=o+e}else Je=1<<o|n<<l|r,qe=e}function hi(e){e.return!==null&&(Pt(e,1),ua(e,1,0))}function mi(e){for(;e===Zr;)Zr=qt[--bt],qt[bt]=null,Jr=qt[--bt],qt[bt]=null;for(;e===It;)It=ze[--Te],ze[Te]=null,qe=ze[--Te],ze[Te]=null,Je=ze[--Te],ze[Te]=null}var Ce=null,Ee=null,H=!1,Ue=null;function sa(e,t){var n=Le(5,null,null,0);n.elementType="DELETED",n.stateNode=t,n.return=e,t=e.deletions,t===null?(e.deletions=[n],e.flags|=16):t.push(n)}function Eu(e,t){switch(e.tag){case 5:var n=e.type;return t=t.nodeType!==1||n.toLowerCase()!==t.nodeName.toLowerCase()?null:t,t!==null?(e.stateNode=t,Ce=e,Ee=vt(t.firstChild),!0):!1;case 6:return t=e.pendingProps===""||t.nodeType!==3?null:t,t!==null?(e.stateNode=t,Ce=e,Ee=null,!0):!1;case 13:return t=t.nodeType!==8?null:t,t!==null?(n=It!==null?{id:Je,overflow:qe}:null,e.memoizedState={dehydrated:t,treeContext:n,retryLane:1073741824},n=Le(18,null,null,0),n.stateNode=t,n.return=e,e.child=n,Ce=e,Ee=null,!0):!1;default:return!1}}function zo(e){return(e.mode&1)!==0&&(e.flags&128)===0}function To(e){if(H){var t=Ee;if(t){var n=t;if(!Eu(e,t)){if(zo(e))throw Error(w(418));t=vt(n.nextSibling);var r=Ce;t&&Eu(e,t)?sa(r,n):(e.flags=e.flags&-4097|2,H=!1,Ce=e)}}else{if(zo(e))throw Error(w(418));e.flags=e.flags&-4097|2,H=!1,Ce=e}}}function Cu(e){for(e=e.return;e!==null&&e.tag!==5&&e.tag!==3&&e.tag!==13;)e=e.return;Ce=e}function Sr(e){if(e!==Ce)return!1;if(!H)return Cu(e),H=!0,!1;var t;if((t=e.tag!==3)&&!(t=e.tag!==5)&&(t=e.type,t=t!=="head"&&t!=="body"&&!No(e.type,e.memoizedProps)),t&&(t=Ee)){if(zo(e))throw aa(),Error(w(418));for(;t;)sa(e,t),t=vt(t.nextSibling)}if(Cu(e),e.tag===13){if(e=e.memoizedState,e=e!==null?e.dehydrated:null,!e)throw Error(w(317));e:{for(e=e.nextSibling,t=0;e;){if(e.nodeType===8){var n=e.data;if(n==="/$"){if(t===0){Ee=vt(e.nextSibling);break e}t--}else n!=="$"&&n!=="$!"&&n!=="$?"||t++}e=e.nextSibling}Ee=null}}else Ee=Ce?vt(e.stateNode.nextSibling):null;return!0}function aa(){for(var e=Ee;e;)e=vt(e.nextSibling)}function dn(){Ee=Ce=null,H=!1}function vi(e){Ue===null?Ue=[e]:Ue.push(e)}var ud=lt.ReactCurrentBatchConfig;function _n(e,t,n){if(e=n.ref,e!==null&&typeof e!="function"&&typeof e!="object"){if(n._owner){if(n=n._owner,n){if(n.tag!==1)throw Error(w(309));var r=n.stateNode}if(!r)throw Error(w(147,e));var l=r,o=""+e;return t!==null&&t.ref!==null&&typeof t.ref=="function"&&t.ref._stringRef===o?t.ref:(t=function(i){var u=l.refs;i===null?delete u[o]:u[o]=i},t._stringRef=o,t)}if(typeof e!="string")throw Error(w(284));if(!n._owner)throw Error(w(290,e))}return e}function kr(e,t){throw e=Object.prototype.toString.call(t),Error(w(31,e==="[object Object]"?"object with keys {"+Object.keys(t).join(", ")+"}":e))}function Nu(e){var t=e._init;return t(e._payload)}function ca(e){function t(f,a){if(e){var d=f.deletions;d===null?(f.deletions=[a],f.flags|=16):d.push(a)}}function n(f,a){if(!e)return null;for(;a!==null;)t(f,a),a=a.sibling;return null}function r(f,a){for(f=new Map;a!==null;)a.key!==null?f.set(a.key,a):f.set(a.index,a),a=a.sibling;return f}function l(f,a){return f=xt(f,a),f.index=0,f.sibling=null,f}function o(f,a,d){return f.index=d,e?(d=f.alternate,d!==null?(d=d.index,d<a?(f.flags|=2,a):d):(f.flags|=2,a)):(f.flags|=1048576,a)}function i(f){return e&&f.alternate===null&&(f.flags|=2),f}function u(f,a,d,g){return a===null||a.tag!==6?(a=ql(d,f.mode,g),a.return=f,a):(a=l(a,d),a.return=f,a)}function s(f,a,d,g){var E=d.type;return E===Kt?y(f,a,d.props.children,g,d.key):a!==null&&(a.elementType===E||typeof E=="object"&&E!==null&&E.$$typeof===ut&&Nu(E)===a.type)?(g=l(a,d.props),g.ref=_n(f,a,d),g.return=f,g):(g=Ur(d.type,d.key,d.props,null,f.mode,g),g.ref=_n(f,a,d),g.return=f,g)}function c(f,a,d,g){return a===null||a.tag!==4||a.stateNode.containerInfo!==d.containerInfo||a.stateNode.implementation!==d.implementation?(a=bl(d,f.mode,g),a.return=f,a):(a=l(a,d.children||[]),a.return=f,a)}function y(f,a,d,g,E){return a===null||a.tag!==7?(a=Ot(d,f.mode,g,E),a.return=f,a):(a=l(a,d),a.return=f,a)}function v(f,a,d){if(typeof a=="string"&&a!==""||typeof a=="number")return a=ql(""+a,f.mode,d),a.return=f,a;if(typeof a=="object"&&a!==null){switch(a.$$typeof){case fr:return d=Ur(a.type,a.key,a.props,null,f.mode,d),d.ref=_n(f,null,a),d.return=f,d;case Qt:return a=bl(a,f.mode,d),a.return=f,a;case ut:var g=a._init;return v(f,g(a._payload),d)}if(Tn(a)||Sn(a))return a=Ot(a,f.mode,d,null),a.return=f,a;kr(f,a)}return null}function m(f,a,d,g){var E=a!==null?a.key:null;if(typeof d=="string"&&d!==""||typeof d=="number")return E!==null?null:u(f,a,""+d,g);if(typeof d=="object"&&d!==null){switch(d.$$typeof){case fr:return d.key===E?s(f,a,d,g):null;case Qt:return d.key===E?c(f,a,d,g):null;case ut:return E=d._init,m(f,a,E(d._payload),g)}if(Tn(d)||Sn(d))return E!==null?null:y(f,a,d,g,null);kr(f,d)}return null}function x(f,a,d,g,E){if(typeof g=="string"&&g!==""||typeof g=="number")return f=f.get(d)||null,u(a,f,""+g,E);if(typeof g=="object"&&g!==null){switch(g.$$typeof){case fr:return f=f.get(g.key===null?d:g.key)||null,s(a,f,g,E);case Qt:return f=f.get(g.key===null?d:g.key)||null,c(a,f,g,E);case ut:var _=g._init;return x(f,a,d,_(g._payload),E)}if(Tn(g)||Sn(g))return f=f.get(d)||null,y(a,f,g,E,null);kr(a,g)}return null}function S(f,a,d,g){for(var E=null,_=null,j=a,z=a=0,U=null;j!==null&&z<d.length;z++){j.index>z?(U=j,j=null):U=j.sibling;var L=m(f,j,d[z],g);if(L===null){j===null&&(j=U);break}e&&j&&L.alternate===null&&t(f,j),a=o(L,a,z),_===null?E=L:_.sibling=L,_=L,j=U}if(z===d.length)return n(f,j),H&&Pt(f,z),E;if(j===null){for(;z<d.length;z++)j=v(f,d[z],g),j!==null&&(a=o(j,a,z),_===null?E=j:_.sibling=j,_=j);return H&&Pt(f,z),E}for(j=r(f,j);z<d.length;z++)U=x(j,f,z,d[z],g),U!==null&&(e&&U.alternate!==null&&j.delete(U.key===null?z:U.key),a=o(U,a,z),_===null?E=U:_.sibling=U,_=U);return e&&j.forEach(function(ne){return t(f,ne)}),H&&Pt(f,z),E}function k(f,a,d,g){var E=Sn(d);if(typeof E!="function")throw Error(w(150));if(d=E.call(d),d==null)throw Error(w(151));for(var _=E=null,j=a,z=a=0,U=null,L=d.next();j!==null&&!L.done;z++,L=d.next()){j.index>z?(U=j,j=null):U=j.sibling;var ne=m(f,j,L.value,g);if(ne===null){j===null&&(j=U);break}e&&j&&ne.alternate===null&&t(f,j),a=o(ne,a,z),_===null?E=ne:_.sibling=ne,_=ne,j=U}if(L.done)return n(f,j),H&&Pt(f,z),E;if(j===null){for(;!L.done;z++,L=d.next())L=v(f,L.value,g),L!==null&&(a=o(L,a,z),_===null?E=L:_.sibling=L,_=L);return H&&Pt(f,z),E}for(j=r(f,j);!L.done;z++,L=d.next())L=x(j,f,z,L.value,g),L!==null&&(e&&L.alternate!==null&&j.delete(L.key===null?z:L.key),a=o(L,a,z),_===null?E=L:_.sibling=L,_=L);return e&&j.forEach(function(Be){return t(f,Be)}),H&&Pt(f,z),E}function I(f,a,d,g){if(typeof d=="object"&&d!==null&&d.type===Kt&&d.key===null&&(d=d.props.children),typeof d=="object"&&d!==null){switch(d.$$typeof){case fr:e:{for(var E=d.key,_=a;_!==null;){if(_.key===E){if(E=d.type,E===Kt){if(_.tag===7){n(f,_.sibling),a=l(_,d.props.children),a.return=f,f=a;break e}}else if(_.elementType===E||typeof E=="object"&&E!==null&&E.$$typeof===ut&&Nu(E)===_.type){n(f,_.sibling),a=l(_,d.props),a.ref=_n(f,_,d),a.return=f,f=a;break e}n(f,_);break}else t(f,_);_=_.sibling}d.type===Kt?(a=Ot(d.props.children,f.mode,g,d.key),a.return=f,f=a):(g=Ur(d.type,d.key,d.props,null,f.mode,g),g.ref=_n(f,a,d),g.return=f,f=g)}return i(f);case Qt:e:{for(_=d.key;a!==null;){if(a.key===_)if(a.tag===4&&a.stateNode.containerInfo===d.containerInfo&&a.stateNode.implementation===d.implementation){n(f,a.sibling),a=l(a,d.children||[]),a.return=f,f=a;break e}else{n(f,a);break}else t(f,a);a=a.sibling}a=bl(d,f.mode,g),a.return=f,f=a}return i(f);case ut:return _=d._init,I(f,a,_(d._payload),g)}if(Tn(d))return S(f,a,d,g);if(Sn(d))return k(f,a,d,g);kr(f,d)}return typeof d=="string"&&d!==""||typeof d=="number"?(d=""+d,a!==null&&a.tag===6?(n(f,a.sibling),a=l(a,d),a.return=f,f=a):(n(f,a),a=ql(d,f.mode,g),a.return=f,f=a),i(f)):n(f,a)}return I}var pn=ca(!0),fa=ca(!1),qr=Ct(null),br=null,en=null,yi=null;function gi(){yi=en=br=null}function wi(e){var t=qr.current;V(qr),e._currentValue=t}function Lo(e,t,n){for(;e!==null;){var r=e.alternate;if((e.childLanes&t)!==t?(e.childLanes|=t,r!==null&&(r.childLanes|=t)):r!==null&&(r.childLanes&t)!==t&&(r.childLanes|=t),e===n)break;e=e.return}}function sn(e,t){br=e,yi=en=null,e=e.dependencies,e!==null&&e.firstContext!==null&&(e.lanes&t&&(ge=!0),e.firstContext=null)}function Re(e){var t=e._currentValue;if(yi!==e)if(e={context:e,memoizedValue:t,next:null},en===null){if(br===null)throw Error(w(308));en=e,br.dependencies={lanes:0,firstContext:e}}else en=en.next=e;return t}var Lt=null;function xi(e){Lt===null?Lt=[e]:Lt.push(e)}function da(e,t,n,r){var l=t.interleaved;return l===null?(n.next=n,xi(t)):(n.next=l.next,l.next=n),t.interleaved=n,nt(e,r)}function nt(e,t){e.lanes|=t;var n=e.alternate;for(n!==null&&(n.lanes|=t),n=e,e=e.return;e!==null;)e.childLanes|=t,n=e.alternate,n!==null&&(n.childLanes|=t),n=e,e=e.return;return n.tag===3?n.stateNode:null}var st=!1;function Si(e){e.updateQueue={baseState:e.memoizedState,firstBaseUpdate:null,lastBaseUpdate:null,shared:{pending:null,interleaved:null,lanes:0},effects:null}}function pa(e,t){e=e.updateQueue,t.updateQueue===e&&(t.updateQueue={baseState:e.baseState,firstBaseUpdate:e.firstBaseUpdate,lastBaseUpdate:e.lastBaseUpdate,shared:e.shared,effects:e.effects})}function be(e,t){return{eventTime:e,lane:t,tag:0,payload:null,callback:null,next:null}}function yt(e,t,n){var r=e.updateQueue;if(r===null)return null;if(r=r.shared,O&2){var l=r.pending;return l===null?t.next=t:(t.next=l.next,l.next=t),r.pending=t,nt(e,n)}return l=r.interleaved,l===null?(t.next=t,xi(r)):(t.next=l.next,l.next=t),r.interleaved=t,nt(e,n)}function Mr(e,t,n){if(t=t.updateQueue,t!==null&&(t=t.shared,(n&4194240)!==0)){var r=t.lanes;r&=e.pendingLanes,n|=r,t.lanes=n,ii(e,n)}}function _u(e,t){var n=e.updateQueue,r=e.alternate;if(r!==null&&(r=r.updateQueue,n===r)){var l=null,o=null;if(n=n.firstBaseUpdate,n!==null){do{var i={eventTime:n.eventTime,lane:n.lane,tag:n.tag,payload:n.payload,callback:n.callback,next:null};o===null?l=o=i:o=o.next=i,n=n.next}while(n!==null);o===null?l=o=t:o=o.next=t}else l=o=t;n={baseState:r.baseState,firstBaseUpdate:l,lastBaseUpdate:o,shared:r.shared,effects:r.effects},e.updateQueue=n;return}e=n.lastBaseUpdate,e===null?n.firstBaseUpdate=t:e.next=t,n.lastBaseUpdate=t}function el(e,t,n,r){var l=e.updateQueue;st=!1;var o=l.firstBaseUpdate,i=l.lastBaseUpdate,u=l.shared.pending;if(u!==null){l.shared.pending=null;var s=u,c=s.next;s.next=null,i===null?o=c:i.next=c,i=s;var y=e.alternate;y!==null&&(y=y.updateQueue,u=y.lastBaseUpdate,u!==i&&(u===null?y.firstBaseUpdate=c:u.next=c,y.lastBaseUpdate=s))}if(o!==null){var v=l.baseState;i=0,y=c=s=null,u=o;do{var m=u.lane,x=u.eventTime;if((r&m)===m){y!==null&&(y=y.next={eventTime:x,lane:0,tag:u.tag,payload:u.payload,callback:u.callback,next:null});e:{var S=e,k=u;switch(m=t,x=n,k.tag){case 1:if(S=k.payload,typeof S=="function"){v=S.call(x,v,m);break e}v=S;break e;case 3:S.flags=S.flags&-65537|128;case 0:if(S=k.payload,m=typeof S=="function"?S.call(x,v,m):S,m==null)break e;v=Y({},v,m);break e;case 2:st=!0}}u.callback!==null&&u.lane!==0&&(e.flags|=64,m=l.effects,m===null?l.effects=[u]:m.push(u))}else x={eventTime:x,lane:m,tag:u.tag,payload:u.payload,callback:u.callback,next:null},y===null?(c=y=x,s=v):y=y.next=x,i|=m;if(u=u.next,u===null){if(u=l.shared.pending,u===null)break;m=u,u=m.next,m.next=null,l.lastBaseUpdate=m,l.shared.pending=null}}while(!0);if(y===null&&(s=v),l.baseState=s,l.firstBaseUpdate=c,l.lastBaseUpdate=y,t=l.shared.interleaved,t!==null){l=t;do i|=l.lane,l=l.next;while(l!==t)}else o===null&&(l.shared.lanes=0);Ut|=i,e.lanes=i,e.memoizedState=v}}function ju(e,t,n){if(e=t.effects,t.effects=null,e!==null)for(t=0;t<e.length;t++){var r=e[t],l=r.callback;if(l!==null){if(r.callback=null,r=n,typeof l!="function")throw Error(w(191,l));l.call(r)}}}var ar={},Ye=Ct(ar),bn=Ct(ar),er=Ct(ar);function Mt(e){if(e===ar)throw Error(w(174));return e}function ki(e,t){switch(F(er,t),F(bn,e),F(Ye,ar),e=t.nodeType,e){case 9:case 11:t=(t=t.documentElement)?t.namespaceURI:co(null,"");break;default:e=e===8?t.parentNode:t,t=e.namespaceURI||null,e=e.tagName,t=co(t,e)}V(Ye),F(Ye,t)}function hn(){V(Ye),V(bn),V(er)}function ha(e){Mt(er.current);var t=Mt(Ye.current),n=co(t,e.type);t!==n&&(F(bn,e),F(Ye,n))}function Ei(e){bn.current===e&&(V(Ye),V(bn))}var Q=Ct(0);function tl(e){for(var t=e;t!==null;){if(t.tag===13){var n=t.memoizedState;if(n!==null&&(n=n.dehydrated,n===null||n.data==="$?"||n.data==="$!"))return t}else if(t.tag===19&&t.memoizedProps.revealOrder!==void 0){if(t.flags&128)return t}else if(t.child!==null){t.child.return=t,t=t.child;continue}if(t===e)break;for(;t.sibling===null;){if(t.return===null||t.return===e)return null;t=t.return}t.sibling.return=t.return,t=t.sibling}return null}var Kl=[];function Ci(){for(var e=0;e<Kl.length;e++)Kl[e]._workInProgressVersionPrimary=null;Kl.length=0}var Rr=lt.ReactCurrentDispatcher,Yl=lt.ReactCurrentBatchConfig,Ft=0,K=null,q=null,ee=null,nl=!1,Un=!1,tr=0,sd=0;function ie(){throw Error(w(321))}function Ni(e,t){if(t===null)return!1;for(var n=0;n<t.length&&n<e.length;n++)if(!Ve(e[n],t[n]))return!1;return!0}function _i(e,t,n,r,l,o){if(Ft=o,K=t,t.memoizedState=null,t.updateQueue=null,t.lanes=0,Rr.current=e===null||e.memoizedState===null?dd:pd,e=n(r,l),Un){o=0;do{if(Un=!1,tr=0,25<=o)throw Error(w(301));o+=1,ee=q=null,t.updateQueue=null,Rr.current=hd,e=n(r,l)}while(Un)}if(Rr.current=rl,t=q!==null&&q.next!==null,Ft=0,ee=q=K=null,nl=!1,t)throw Error(w(300));return e}function ji(){var e=tr!==0;return tr=0,e}function We(){var e={memoizedState:null,baseState:null,baseQueue:null,queue:null,next:null};return ee===null?K.memoizedState=ee=e:ee=ee.next=e,ee}function Oe(){if(q===null){var e=K.alternate;e=e!==null?e.memoizedState:null}else e=q.next;var t=ee===null?K.memoizedState:ee.next;if(t!==null)ee=t,q=e;else{if(e===null)throw Error(w(310));q=e,e={memoizedState:q.memoizedState,baseState:q.baseState,baseQueue:q.baseQueue,queue:q.queue,next:null},ee===null?K.memoizedState=ee=e:ee=ee.next=e}return ee}function nr(e,t){return typeof t=="function"?t(e):t}function Gl(e){var t=Oe(),n=t.queue;if(n===null)throw Error(w(311));n.lastRenderedReducer=e;var r=q,l=r.baseQueue,o=n.pending;if(o!==null){if(l!==null){var i=l.next;l.next=o.next,o.next=i}r.baseQueue=l=o,n.pending=null}if(l!==null){o=l.next,r=r.baseState;var u=i=null,s=null,c=o;do{var y=c.lane;if((Ft&y)===y)s!==null&&(s=s.next={lane:0,action:c.action,hasEagerState:c.hasEagerState,eagerState:c.eagerState,next:null}),r=c.hasEagerState?c.eagerState:e(r,c.action);else{var v={lane:y,action:c.action,hasEagerState:c.hasEagerState,eagerState:c.eagerState,next:null};s===null?(u=s=v,i=r):s=s.next=v,K.lanes|=y,Ut|=y}c=c.next}while(c!==null&&c!==o);s===null?i=r:s.next=u,Ve(r,t.memoizedState)||(ge=!0),t.memoizedState=r,t.baseState=i,t.baseQueue=s,n.lastRenderedState=r}if(e=n.interleaved,e!==null){l=e;do o=l.lane,K.lanes|=o,Ut|=o,l=l.next;while(l!==e)}else l===null&&(n.lanes=0);return[t.memoizedState,n.dispatch]}function Xl(e){var t=Oe(),n=t.queue;if(n===null)throw Error(w(311));n.lastRenderedReducer=e;var r=n.dispatch,l=n.pending,o=t.memoizedState;if(l!==null){n.pending=null;var i=l=l.next;do o=e(o,i.action),i=i.next;while(i!==l);Ve(o,t.memoizedState)||(ge=!0),t.memoizedState=o,t.baseQueue===null&&(t.baseState=o),n.lastRenderedState=o}return[o,r]}function ma(){}function va(e,t){var n=K,r=Oe(),l=t(),o=!Ve(r.memoizedState,l);if(o&&(r.memoizedState=l,ge=!0),r=r.queue,Pi(wa.bind(null,n,r,e),[e]),r.getSnapshot!==t||o||ee!==null&&ee.memoizedState.tag&1){if(n.flags|=2048,rr(9,ga.bind(null,n,r,l,t),void 0,null),te===null)throw Error(w(349));Ft&30||ya(n,t,l)}return l}function ya(e,t,n){e.flags|=16384,e={getSnapshot:t,value:n},t=K.updateQueue,t===null?(t={lastEffect:null,stores:null},K.updateQueue=t,t.stores=[e]):(n=t.stores,n===null?t.stores=[e]:n.push(e))}function ga(e,t,n,r){t.value=n,t.getSnapshot=r,xa(t)&&Sa(e)}function wa(e,t,n){return n(function(){xa(t)&&Sa(e)})}function xa(e){var t=e.getSnapshot;e=e.value;try{var n=t();return!Ve(e,n)}catch{return!0}}function Sa(e){var t=nt(e,1);t!==null&&Ae(t,e,1,-1)}function Pu(e){var t=We();return typeof e=="function"&&(e=e()),t.memoizedState=t.baseState=e,e={pending:null,interleaved:null,lanes:0,dispatch:null,lastRenderedReducer:nr,lastRenderedState:e},t.queue=e,e=e.dispatch=fd.bind(null,K,e),[t.memoizedState,e]}function rr(e,t,n,r){return e={tag:e,create:t,destroy:n,deps:r,next:null},t=K.updateQueue,t===null?(t={lastEffect:null,stores:null},K.updateQueue=t,t.lastEffect=e.next=e):(n=t.lastEffect,n===null?t.lastEffect=e.next=e:(r=n.next,n.next=e,e.next=r,t.lastEffect=e)),e}function ka(){return Oe().memoizedState}function Or(e,t,n,r){var l=We();K.flags|=e,l.memoizedState=rr(1|t,n,void 0,r===void 0?null:r)}function vl(e,t,n,r){var l=Oe();r=r===void 0?null:r;var o=void 0;if(q!==null){var i=q.memoizedState;if(o=i.destroy,r!==null&&Ni(r,i.deps)){l.memoizedState=rr(t,n,o,r);return}}K.flags|=e,l.memoizedState=rr(1|t,n,o,r)}function zu(e,t){return Or(8390656,8,e,t)}function Pi(e,t){return vl(2048,8,e,t)}function Ea(e,t){return vl(4,2,e,t)}function Ca(e,t){return vl(4,4,e,t)}function Na(e,t){if(typeof t=="function")return e=e(),t(e),function(){t(null)};if(t!=null)return e=e(),t.current=e,function(){t.current=null}}function _a(e,t,n){return n=n!=null?n.concat([e]):null,vl(4,4,Na.bind(null,t,e),n)}function zi(){}function ja(e,t){var n=Oe();t=t===void 0?null:t;var r=n.memoizedState;return r!==null&&t!==null&&Ni(t,r[1])?r[0]:(n.memoizedState=[e,t],e)}function Pa(e,t){var n=Oe();t=t===void 0?null:t;var r=n.memoizedState;return r!==null&&t!==null&&Ni(t,r[1])?r[0]:(e=e(),n.memoizedState=[e,t],e)}function za(e,t,n){return Ft&21?(Ve(n,t)||(n=Os(),K.lanes|=n,Ut|=n,e.baseState=!0),t):(e.baseState&&(e.baseState=!1,ge=!0),e.memoizedState=n)}function ad(e,t){var n=D;D=n!==0&&4>n?n:4,e(!0);var r=Yl.transition;Yl.transition={};try{e(!1),t()}finally{D=n,Yl.transition=r}}function Ta(){return Oe().memoizedState}function cd(e,t,n){var r=wt(e);if(n={lane:r,action:n,hasEagerState:!1,eagerState:null,next:null},La(e))Ma(t,n);else if(n=da(e,t,n,r),n!==null){var l=pe();Ae(n,e,r,l),Ra(n,t,r)}}function fd(e,t,n){var r=wt(e),l={lane:r,action:n,hasEagerState:!1,eagerState:null,next:null};if(La(e))Ma(t,l);else{var o=e.alternate;if(e.lanes===0&&(o===null||o.lanes===0)&&(o=t.lastRenderedReducer,o!==null))try{var i=t.lastRenderedState,u=o(i,n);if(l.hasEagerState=!0,l.eagerState=u,Ve(u,i)){var s=t.interleaved;s===null?(l.next=l,xi(t)):(l.next=s.next,s.next=l),t.interleaved=l;return}}catch{}finally{}n=da(e,t,l,r),n!==null&&(l=pe(),Ae(n,e,r,l),Ra(n,t,r))}}function La(e){var t=e.alternate;return e===K||t!==null&&t===K}function Ma(e,t){Un=nl=!0;var n=e.pending;n===null?t.next=t:(t.next=n.next,n.next=t),e.pending=t}function Ra(e,t,n){if(n&4194240){var r=t.lanes;r&=e.pendingLanes,n|=r,t.lanes=n,ii(e,n)}}var rl={readContext:Re,useCallback:ie,useContext:ie,useEffect:ie,useImperativeHandle:ie,useInsertionEffect:ie,useLayoutEffect:ie,useMemo:ie,useReducer:ie,useRef:ie,useState:ie,useDebugValue:ie,useDeferredValue:ie,useTransition:ie,useMutableSource:ie,useSyncExternalStore:ie,useId:ie,unstable_isNewReconciler:!1},dd={readContext:Re,useCallback:function(e,t){return We().memoizedState=[e,t===void 0?null:t],e},useContext:Re,useEffect:zu,useImperativeHandle:function(e,t,n){return n=n!=null?n.concat([e]):null,Or(4194308,4,Na.bind(null,t,e),n)},useLayoutEffect:function(e,t){return Or(4194308,4,e,t)},useInsertionEffect:function(e,t){return Or(4,2,e,t)},useMemo:function(e,t){var n=We();return t=t===void 0?null:t,e=e(),n.memoizedState=[e,t],e},useReducer:function(e,t,n){var r=We();return t=n!==void 0?n(t):t,r.memoizedState=r.baseState=t,e={pending:null,interleaved:null,lanes:0,dispatch:null,lastRenderedReducer:e,lastRenderedState:t},r.queue=e,e=e.dispatch=cd.bind(null,K,e),[r.memoizedState,e]},useRef:function(e){var t=We();return e={current:e},t.memoizedState=e},useState:Pu,useDebugValue:zi,useDeferredValue:function(e){return We().memoizedState=e},useTransition:function(){var e=Pu(!1),t=e[0];return e=ad.bind(null,e[1]),We().memoizedState=e,[t,e]},useMutableSource:function(){},useSyncExternalStore:function(e,t,n){var r=K,l=We();if(H){if(n===void 0)throw Error(w(407));n=n()}else{if(n=t(),te===null)throw Error(w(349));Ft&30||ya(r,t,n)}l.memoizedState=n;var o={value:n,getSnapshot:t};return l.queue=o,zu(wa.bind(null,r,o,e),[e]),r.flags|=2048,rr(9,ga.bind(null,r,o,n,t),void 0,null),n},useId:function(){var e=We(),t=te.identifierPrefix;if(H){var n=qe,r=Je;n=(r&~(1<<32-$e(r)-1)).toString(32)+n,t=":"+t+"R"+n,n=tr++,0<n&&(t+="H"+n.toString(32)),t+=":"}else n=sd++,t=":"+t+"r"+n.toString(32)+":";return e.memoizedState=t},unstable_isNewReconciler:!1},pd={readContext:Re,useCallback:ja,useContext:Re,useEffect:Pi,useImperativeHandle:_a,useInsertionEffect:Ea,useLayoutEffect:Ca,useMemo:Pa,useReducer:Gl,useRef:ka,useState:function(){return Gl(nr)},useDebugValue:zi,useDeferredValue:function(e){var t=Oe();return za(t,q.memoizedState,e)},useTransition:function(){var e=Gl(nr)[0],t=Oe().memoizedState;return[e,t]},useMutableSource:ma,useSyncExternalStore:va,useId:Ta,unstable_isNewReconciler:!1},hd={readContext:Re,useCallback:ja,useContext:Re,useEffect:Pi,useImperativeHandle:_a,useInsertionEffect:Ea,useLayoutEffect:Ca,useMemo:Pa,useReducer:Xl,useRef:ka,useState:function(){return Xl(nr)},useDebugValue:zi,useDeferredValue:function(e){var t=Oe();return q===null?t.memoizedState=e:za(t,q.memoizedState,e)},useTransition:function(){var e=Xl(nr)[0],t=Oe().memoizedState;return[e,t]},useMutableSource:ma,useSyncExternalStore:va,useId:Ta,unstable_isNewReconciler:!1};function Ie(e,t){if(e&&e.defaultProps){t=Y({},t),e=e.defaultProps;for(var n in e)t[n]===void 0&&(t[n]=e[n]);return t}return t}function Mo(e,t,n,r){t=e.memoizedState,n=n(r,t),n=n==null?t:Y({},t,n),e.memoizedState=n,e.lanes===0&&(e.updateQueue.baseState=n)}var yl={isMounted:function(e){return(e=e._reactInternals)?Vt(e)===e:!1},enqueueSetState:function(e,t,n){e=e._reactInternals;var r=pe(),l=wt(e),o=be(r,l);o.payload=t,n!=null&&(o.callback=n),t=yt(e,o,l),t!==null&&(Ae(t,e,l,r),Mr(t,e,l))},enqueueReplaceState:function(e,t,n){e=e._reactInternals;var r=pe(),l=wt(e),o=be(r,l);o.tag=1,o.payload=t,n!=null&&(o.callback=n),t=yt(e,o,l),t!==null&&(Ae(t,e,l,r),Mr(t,e,l))},enqueueForceUpdate:function(e,t){e=e._reactInternals;var n=pe(),r=wt(e),l=be(n,r);l.tag=2,t!=null&&(l.callback=t),t=yt(e,l,r),t!==null&&(Ae(t,e,r,n),Mr(t,e,r))}};function Tu(e,t,n,r,l,o,i){return e=e.stateNode,typeof e.shouldComponentUpdate=="function"?e.shouldComponentUpdate(r,o,i):t.prototype&&t.prototype.isPureReactComponent?!Xn(n,r)||!Xn(l,o):!0}function Oa(e,t,n){var r=!1,l=kt,o=t.contextType;return typeof o=="object"&&o!==null?o=Re(o):(l=xe(t)?Dt:fe.current,r=t.contextTypes,o=(r=r!=null)?fn(e,l):kt),t=new t(n,o),e.memoizedState=t.state!==null&&t.state!==void 0?t.state:null,t.updater=yl,e.stateNode=t,t._reactInternals=e,r&&(e=e.stateNode,e.__reactInternalMemoizedUnmaskedChildContext=l,e.__reactInternalMemoizedMaskedChildContext=o),t}function Lu(e,t,n,r){e=t.state,typeof t.componentWillReceiveProps=="function"&&t.componentWillReceiveProps(n,r),typeof t.UNSAFE_componentWillReceiveProps=="function"&&t.UNSAFE_componentWillReceiveProps(n,r),t.state!==e&&yl.enqueueReplaceState(t,t.state,null)}function Ro(e,t,n,r){var l=e.stateNode;l.props=n,l.state=e.memoizedState,l.refs={},Si(e);var o=t.contextType;typeof o=="object"&&o!==null?l.context=Re(o):(o=xe(t)?Dt:fe.current,l.context=fn(e,o)),l.state=e.memoizedState,o=t.getDerivedStateFromProps,typeof o=="function"&&(Mo(e,t,o,n),l.state=e.memoizedState),typeof t.getDerivedStateFromProps=="function"||typeof l.getSnapshotBeforeUpdate=="function"||typeof l.UNSAFE_componentWillMount!="function"&&typeof l.componentWillMount!="function"||(t=l.state,typeof l.componentWillMount=="function"&&l.componentWillMount(),typeof l.UNSAFE_componentWillMount=="function"&&l.UNSAFE_componentWillMount(),t!==l.state&&yl.enqueueReplaceState(l,l.state,null),el(e,n,l,r),l.state=e.memoizedState),typeof l.componentDidMount=="function"&&(e.flags|=4194308)}function mn(e,t){try{var n="",r=t;do n+=Vc(r),r=r.return;while(r);var l=n}catch(o){l=`
-Error generating stack: `+o.message+`
-`+o.stack}return{value:e,source:t,stack:l,digest:null}}function Zl(e,t,n){return{value:e,source:null,stack:n??null,digest:t??null}}function Oo(e,t){try{console.error(t.value)}catch(n){setTimeout(function(){throw n})}}var md=typeof WeakMap=="function"?WeakMap:Map;function Da(e,t,n){n=be(-1,n),n.tag=3,n.payload={element:null};var r=t.value;return n.callback=function(){ol||(ol=!0,Wo=r),Oo(e,t)},n}function Ia(e,t,n){n=be(-1,n),n.tag=3;var r=e.type.getDerivedStateFromError;if(typeof r=="function"){var l=t.value;n.payload=function(){return r(l)},n.callback=function(){Oo(e,t)}}var o=e.stateNode;return o!==null&&typeof o.componentDidCatch=="function"&&(n.callback=function(){Oo(e,t),typeof r!="function"&&(gt===null?gt=new Set([this]):gt.add(this));var i=t.stack;this.componentDidCatch(t.value,{componentStack:i!==null?i:""})}),n}function Mu(e,t,n){var r=e.pingCache;if(r===null){r=e.pingCache=new md;var l=new Set;r.set(t,l)}else l=r.get(t),l===void 0&&(l=new Set,r.set(t,l));l.has(n)||(l.add(n),e=zd.bind(null,e,t,n),t.then(e,e))}function Ru(e){do{var t;if((t=e.tag===13)&&(t=e.memoizedState,t=t!==null?t.dehydrated!==null:!0),t)return e;e=e.return}while(e!==null);return null}function Ou(e,t,n,r,l){return e.mode&1?(e.flags|=65536,e.lanes=l,e):(e===t?e.flags|=65536:(e.flags|=128,n.flags|=131072,n.flags&=-52805,n.tag===1&&(n.alternate===null?n.tag=17:(t=be(-1,1),t.tag=2,yt(n,t,1))),n.lanes|=1),e)}var vd=lt.ReactCurrentOwner,ge=!1;function de(e,t,n,r){t.child=e===null?fa(t,null,n,r):pn(t,e.child,n,r)}function Du(e,t,n,r,l){n=n.render;var o=t.ref;return sn(t,l),r=_i(e,t,n,r,o,l),n=ji(),e!==null&&!ge?(t.updateQueue=e.updateQueue,t.flags&=-2053,e.lanes&=~l,rt(e,t,l)):(H&&n&&hi(t),t.flags|=1,de(e,t,r,l),t.child)}function Iu(e,t,n,r,l){if(e===null){var o=n.type;return typeof o=="function"&&!Fi(o)&&o.defaultProps===void 0&&n.compare===null&&n.defaultProps===void 0?(t.tag=15,t.type=o,Fa(e,t,o,r,l)):(e=Ur(n.type,null,r,t,t.mode,l),e.ref=t.ref,e.return=t,t.child=e)}if(o=e.child,!(e.lanes&l)){var i=o.memoizedProps;if(n=n.compare,n=n!==null?n:Xn,n(i,r)&&e.ref===t.ref)return rt(e,t,l)}return t.flags|=1,e=xt(o,r),e.ref=t.ref,e.return=t,t.child=e}function Fa(e,t,n,r,l){if(e!==null){var o=e.memoizedProps;if(Xn(o,r)&&e.ref===t.ref)if(ge=!1,t.pendingProps=r=o,(e.lanes&l)!==0)e.flags&131072&&(ge=!0);else return t.lanes=e.lanes,rt(e,t,l)}return Do(e,t,n,r,l)}function Ua(e,t,n){var r=t.pendingProps,l=r.children,o=e!==null?e.memoizedState:null;if(r.mode==="hidden")if(!(t.mode&1))t.memoizedState={baseLanes:0,cachePool:null,transitions:null},F(nn,ke),ke|=n;else{if(!(n&1073741824))return e=o!==null?o.baseLanes|n:n,t.lanes=t.childLanes=1073741824,t.memoizedState={baseLanes:e,cachePool:null,transitions:null},t.updateQueue=null,F(nn,ke),ke|=e,null;t.memoizedState={baseLanes:0,cachePool:null,transitions:null},r=o!==null?o.baseLanes:n,F(nn,ke),ke|=r}else o!==null?(r=o.baseLanes|n,t.memoizedState=null):r=n,F(nn,ke),ke|=r;return de(e,t,l,n),t.child}function $a(e,t){var n=t.ref;(e===null&&n!==null||e!==null&&e.ref!==n)&&(t.flags|=512,t.flags|=2097152)}function Do(e,t,n,r,l){var o=xe(n)?Dt:fe.current;return o=fn(t,o),sn(t,l),n=_i(e,t,n,r,o,l),r=ji(),e!==null&&!ge?(t.updateQueue=e.updateQueue,t.flags&=-2053,e.lanes&=~l,rt(e,t,l)):(H&&r&&hi(t),t.flags|=1,de(e,t,n,l),t.child)}function Fu(e,t,n,r,l){if(xe(n)){var o=!0;Xr(t)}else o=!1;if(sn(t,l),t.stateNode===null)Dr(e,t),Oa(t,n,r),Ro(t,n,r,l),r=!0;else if(e===null){var i=t.stateNode,u=t.memoizedProps;i.props=u;var s=i.context,c=n.contextType;typeof c=="object"&&c!==null?c=Re(c):(c=xe(n)?Dt:fe.current,c=fn(t,c));var y=n.getDerivedStateFromProps,v=typeof y=="function"||typeof i.getSnapshotBeforeUpdate=="function";v||typeof i.UNSAFE_componentWillReceiveProps!="function"&&typeof i.componentWillReceiveProps!="function"||(u!==r||s!==c)&&Lu(t,i,r,c),st=!1;var m=t.memoizedState;i.state=m,el(t,r,i,l),s=t.memoizedState,u!==r||m!==s||we.current||st?(typeof y=="function"&&(Mo(t,n,y,r),s=t.memoizedState),(u=st||Tu(t,n,u,r,m,s,c))?(v||typeof i.UNSAFE_componentWillMount!="function"&&typeof i.componentWillMount!="function"||(typeof i.componentWillMount=="function"&&i.componentWillMount(),typeof i.UNSAFE_componentWillMount=="function"&&i.UNSAFE_componentWillMount()),typeof i.componentDidMount=="function"&&(t.flags|=4194308)):(typeof i.componentDidMount=="function"&&(t.flags|=4194308),t.memoizedProps=r,t.memoizedState=s),i.props=r,i.state=s,i.context=c,r=u):(typeof i.componentDidMount=="function"&&(t.flags|=4194308),r=!1)}else{i=t.stateNode,pa(e,t),u=t.memoizedProps,c=t.type===t.elementType?u:Ie(t.type,u),i.props=c,v=t.pendingProps,m=i.context,s=n.contextType,typeof s=="object"&&s!==null?s=Re(s):(s=xe(n)?Dt:fe.current,s=fn(t,s));var x=n.getDerivedStateFromProps;(y=typeof x=="function"||typeof i.getSnapshotBeforeUpdate=="function")||typeof i.UNSAFE_componentWillReceiveProps!="function"&&typeof i.componentWillReceiveProps!="function"||(u!==v||m!==s)&&Lu(t,i,r,s),st=!1,m=t.memoizedState,i.state=m,el(t,r,i,l);var S=t.memoizedState;u!==v||m!==S||we.current||st?(typeof x=="function"&&(Mo(t,n,x,r),S=t.memoizedState),(c=st||Tu(t,n,c,r,m,S,s)||!1)?(y||typeof i.UNSAFE_componentWillUpdate!="function"&&typeof i.componentWillUpdate!="function"||(typeof i.componentWillUpdate=="function"&&i.componentWillUpdate(r,S,s),typeof i.UNSAFE_componentWillUpdate=="function"&&i.UNSAFE_componentWillUpdate(r,S,s)),typeof i.componentDidUpdate=="function"&&(t.flags|=4),typeof i.getSnapshotBeforeUpdate=="function"&&(t.flags|=1024)):(typeof i.componentDidUpdate!="function"||u===e.memoizedProps&&m===e.memoizedState||(t.flags|=4),typeof i.getSnapshotBeforeUpdate!="function"||u===e.memoizedProps&&m===e.memoizedState||(t.flags|=1024),t.memoizedProps=r,t.memoizedState=S),i.props=r,i.state=S,i.context=s,r=c):(typeof i.componentDidUpdate!="function"||u===e.memoizedProps&&m===e.memoizedState||(t.flags|=4),typeof i.getSnapshotBeforeUpdate!="function"||u===e.memoizedProps&&m===e.memoizedState||(t.flags|=1024),r=!1)}return Io(e,t,n,r,o,l)}function Io(e,t,n,r,l,o){$a(e,t);var i=(t.flags&128)!==0;if(!r&&!i)return l&&ku(t,n,!1),rt(e,t,o);r=t.stateNode,vd.current=t;var u=i&&typeof n.getDerivedStateFromError!="function"?null:r.render();return t.flags|=1,e!==null&&i?(t.child=pn(t,e.child,null,o),t.child=pn(t,null,u,o)):de(e,t,u,o),t.memoizedState=r.state,l&&ku(t,n,!0),t.child}function Aa(e){var t=e.stateNode;t.pendingContext?Su(e,t.pendingContext,t.pendingContext!==t.context):t.context&&Su(e,t.context,!1),ki(e,t.containerInfo)}function Uu(e,t,n,r,l){return dn(),vi(l),t.flags|=256,de(e,t,n,r),t.child}var Fo={dehydrated:null,treeContext:null,retryLane:0};function Uo(e){return{baseLanes:e,cachePool:null,transitions:null}}function Va(e,t,n){var r=t.pendingProps,l=Q.current,o=!1,i=(t.flags&128)!==0,u;if((u=i)||(u=e!==null&&e.memoizedState===null?!1:(l&2)!==0),u?(o=!0,t.flags&=-129):(e===null||e.memoizedState!==null)&&(l|=1),F(Q,l&1),e===null)return To(t),e=t.memoizedState,e!==null&&(e=e.dehydrated,e!==null)?(t.mode&1?e.data==="$!"?t.lanes=8:t.lanes=1073741824:t.lanes=1,null):(i=r.children,e=r.fallback,o?(r=t.mode,o=t.child,i={mode:"hidden",children:i},!(r&1)&&o!==null?(o.childLanes=0,o.pendingProps=i):o=xl(i,r,0,null),e=Ot(e,r,n,null),o.return=t,e.return=t,o.sibling=e,t.child=o,t.child.memoizedState=Uo(n),t.memoizedState=Fo,e):Ti(t,i));if(l=e.memoizedState,l!==null&&(u=l.dehydrated,u!==null))return yd(e,t,i,r,u,l,n);if(o){o=r.fallback,i=t.mode,l=e.child,u=l.sibling;var s={mode:"hidden",children:r.children};return!(i&1)&&t.child!==l?(r=t.child,r.childLanes=0,r.pendingProps=s,t.deletions=null):(r=xt(l,s),r.subtreeFlags=l.subtreeFlags&14680064),u!==null?o=xt(u,o):(o=Ot(o,i,n,null),o.flags|=2),o.return=t,r.return=t,r.sibling=o,t.child=r,r=o,o=t.child,i=e.child.memoizedState,i=i===null?Uo(n):{baseLanes:i.baseLanes|n,cachePool:null,transitions:i.transitions},o.memoizedState=i,o.childLanes=e.childLanes&~n,t.memoizedState=Fo,r}return o=e.child,e=o.sibling,r=xt(o,{mode:"visible",children:r.children}),!(t.mode&1)&&(r.lanes=n),r.return=t,r.sibling=null,e!==null&&(n=t.deletions,n===null?(t.deletions=[e],t.flags|=16):n.push(e)),t.child=r,t.memoizedState=null,r}function Ti(e,t){return t=xl({mode:"visible",children:t},e.mode,0,null),t.return=e,e.child=t}function Er(e,t,n,r){return r!==null&&vi(r),pn(t,e.child,null,n),e=Ti(t,t.pendingProps.children),e.flags|=2,t.memoizedState=null,e}function yd(e,t,n,r,l,o,i){if(n)return t.flags&256?(t.flags&=-257,r=Zl(Error(w(422))),Er(e,t,i,r)):t.memoizedState!==null?(t.child=e.child,t.flags|=128,null):(o=r.fallback,l=t.mode,r=xl({mode:"visible",children:r.children},l,0,null),o=Ot(o,l,i,null),o.flags|=2,r.return=t,o.return=t,r.sibling=o,t.child=r,t.mode&1&&pn(t,e.child,null,i),t.child.memoizedState=Uo(i),t.memoizedState=Fo,o);if(!(t.mode&1))return Er(e,t,i,null);if(l.data==="$!"){if(r=l.nextSibling&&l.nextSibling.dataset,r)var u=r.dgst;return r=u,o=Error(w(419)),r=Zl(o,r,void 0),Er(e,t,i,r)}if(u=(i&e.childLanes)!==0,ge||u){if(r=te,r!==null){switch(i&-i){case 4:l=2;break;case 16:l=8;break;case 64:case 128:case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:case 4194304:case 8388608:case 16777216:case 33554432:case 67108864:l=32;break;case 536870912:l=268435456;break;default:l=0}l=l&(r.suspendedLanes|i)?0:l,l!==0&&l!==o.retryLane&&(o.retryLane=l,nt(e,l),Ae(r,e,l,-1))}return Ii(),r=Zl(Error(w(421))),Er(e,t,i,r)}return l.data==="$?"?(t.flags|=128,t.child=e.child,t=Td.bind(null,e),l._reactRetry=t,null):(e=o.treeContext,Ee=vt(l.nextSibling),Ce=t,H=!0,Ue=null,e!==null&&(ze[Te++]=Je,ze[Te++]=qe,ze[Te++]=It,Je=e.id,qe=e.overflow,It=t),t=Ti(t,r.children),t.flags|=4096,t)}function $u(e,t,n){e.lanes|=t;var r=e.alternate;r!==null&&(r.lanes|=t),Lo(e.return,t,n)}function Jl(e,t,n,r,l){var o=e.memoizedState;o===null?e.memoizedState={isBackwards:t,rendering:null,renderingStartTime:0,last:r,tail:n,tailMode:l}:(o.isBackwards=t,o.rendering=null,o.renderingStartTime=0,o.last=r,o.tail=n,o.tailMode=l)}function Ba(e,t,n){var r=t.pendingProps,l=r.revealOrder,o=r.tail;if(de(e,t,r.children,n),r=Q.current,r&2)r=r&1|2,t.flags|=128;else{if(e!==null&&e.flags&128)e:for(e=t.child;e!==null;){if(e.tag===13)e.memoizedState!==null&&$u(e,n,t);else if(e.tag===19)$u(e,n,t);else if(e.child!==null){e.child.return=e,e=e.child;continue}if(e===t)break e;for(;e.sibling===null;){if(e.return===null||e.return===t)break e;e=e.return}e.sibling.return=e.return,e=e.sibling}r&=1}if(F(Q,r),!(t.mode&1))t.memoizedState=null;else switch(l){case"forwards":for(n=t.child,l=null;n!==null;)e=n.alternate,e!==null&&tl(e)===null&&(l=n),n=n.sibling;n=l,n===null?(l=t.child,t.child=null):(l=n.sibling,n.sibling=null),Jl(t,!1,l,n,o);break;case"backwards":for(n=null,l=t.child,t.child=null;l!==null;){if(e=l.alternate,e!==null&&tl(e)===null){t.child=l;break}e=l.sibling,l.sibling=n,n=l,l=e}Jl(t,!0,n,null,o);break;case"together":Jl(t,!1,null,null,void 0);break;default:t.memoizedState=null}return t.child}function Dr(e,t){!(t.mode&1)&&e!==null&&(e.alternate=null,t.alternate=null,t.flags|=2)}function rt(e,t,n){if(e!==null&&(t.dependencies=e.dependencies),Ut|=t.lanes,!(n&t.childLanes))return null;if(e!==null&&t.child!==e.child)throw Error(w(153));if(t.child!==null){for(e=t.child,n=xt(e,e.pendingProps),t.child=n,n.return=t;e.sibling!==null;)e=e.sibling,n=n.sibling=xt(e,e.pendingProps),n.return=t;n.sibling=null}return t.child}function gd(e,t,n){switch(t.tag){case 3:Aa(t),dn();break;case 5:ha(t);break;case 1:xe(t.type)&&Xr(t);break;case 4:ki(t,t.stateNode.containerInfo);break;case 10:var r=t.type._context,l=t.memoizedProps.value;F(qr,r._currentValue),r._currentValue=l;break;case 13:if(r=t.memoizedState,r!==null)return r.dehydrated!==null?(F(Q,Q.current&1),t.flags|=128,null):n&t.child.childLanes?Va(e,t,n):(F(Q,Q.current&1),e=rt(e,t,n),e!==null?e.sibling:null);F(Q,Q.current&1);break;case 19:if(r=(n&t.childLanes)!==0,e.flags&128){if(r)return Ba(e,t,n);t.flags|=128}if(l=t.memoizedState,l!==null&&(l.rendering=null,l.tail=null,l.lastEffect=null),F(Q,Q.current),r)break;return null;case 22:case 23:return t.lanes=0,Ua(e,t,n)}return rt(e,t,n)}var Ha,$o,Wa,Qa;Ha=function(e,t){for(var n=t.child;n!==null;){if(n.tag===5||n.tag===6)e.appendChild(n.stateNode);else if(n.tag!==4&&n.child!==null){n.child.return=n,n=n.child;continue}if(n===t)break;for(;n.sibling===null;){if(n.return===null||n.return===t)return;n=n.return}n.sibling.return=n.return,n=n.sibling}};$o=function(){};Wa=function(e,t,n,r){var l=e.memoizedProps;if(l!==r){e=t.stateNode,Mt(Ye.current);var o=null;switch(n){case"input":l=io(e,l),r=io(e,r),o=[];break;case"select":l=Y({},l,{value:void 0}),r=Y({},r,{value:void 0}),o=[];break;case"textarea":l=ao(e,l),r=ao(e,r),o=[];break;default:typeof l.onClick!="function"&&typeof r.onClick=="function"&&(e.onclick=Yr)}fo(n,r);var i;n=null;for(c in l)if(!r.hasOwnProperty(c)&&l.hasOwnProperty(c)&&l[c]!=null)if(c==="style"){var u=l[c];for(i in u)u.hasOwnProperty(i)&&(n||(n={}),n[i]="")}else c!=="dangerouslySetInnerHTML"&&c!=="children"&&c!=="suppressContentEditableWarning"&&c!=="suppressHydrationWarning"&&c!=="autoFocus"&&(Bn.hasOwnProperty(c)?o||(o=[]):(o=o||[]).push(c,null));for(c in r){var s=r[c];if(u=l!=null?l[c]:void 0,r.hasOwnProperty(c)&&s!==u&&(s!=null||u!=null))if(c==="style")if(u){for(i in u)!u.hasOwnProperty(i)||s&&s.hasOwnProperty(i)||(n||(n={}),n[i]="");for(i in s)s.hasOwnProperty(i)&&u[i]!==s[i]&&(n||(n={}),n[i]=s[i])}else n||(o||(o=[]),o.push(c,n)),n=s;else c==="dangerouslySetInnerHTML"?(s=s?s.__html:void 0,u=u?u.__html:void 0,s!=null&&u!==s&&(o=o||[]).push(c,s)):c==="children"?typeof s!="string"&&typeof s!="number"||(o=o||[]).push(c,""+s):c!=="suppressContentEditableWarning"&&c!=="suppressHydrationWarning"&&(Bn.hasOwnProperty(c)?(s!=null&&c==="onScroll"&&A("scroll",e),o||u===s||(o=[])):(o=o||[]).push(c,s))}n&&(o=o||[]).push("style",n);var c=o;(t.updateQueue=c)&&(t.flags|=4)}};Qa=function(e,t,n,r){n!==r&&(t.flags|=4)};function jn(e,t){if(!H)switch(e.tailMode){case"hidden":t=e.tail;for(var n=null;t!==null;)t.alternate!==null&&(n=t),t=t.sibling;n===null?e.tail=null:n.sibling=null;break;case"collapsed":n=e.tail;for(var r=null;n!==null;)n.alternate!==null&&(r=n),n=n.sibling;r===null?t||e.tail===null?e.tail=null:e.tail.sibling=null:r.sibling=null}}function ue(e){var t=e.alternate!==null&&e.alternate.child===e.child,n=0,r=0;if(t)for(var l=e.child;l!==null;)n|=l.lanes|l.childLanes,r|=l.subtreeFlags&14680064,r|=l.flags&14680064,l.return=e,l=l.sibling;else for(l=e.child;l!==null;)n|=l.lanes|l.childLanes,r|=l.subtreeFlags,r|=l.flags,l.return=e,l=l.sibling;return e.subtreeFlags|=r,e.childLanes=n,t}function wd(e,t,n){var r=t.pendingProps;switch(mi(t),t.tag){case 2:case 16:case 15:case 0:case 11:case 7:case 8:case 12:case 9:case 14:return ue(t),null;case 1:return xe(t.type)&&Gr(),ue(t),null;case 3:return r=t.stateNode,hn(),V(we),V(fe),Ci(),r.pendingContext&&(r.context=r.pendingContext,r.pendingContext=null),(e===null||e.child===null)&&(Sr(t)?t.flags|=4:e===null||e.memoizedState.isDehydrated&&!(t.flags&256)||(t.flags|=1024,Ue!==null&&(Yo(Ue),Ue=null))),$o(e,t),ue(t),null;case 5:Ei(t);var l=Mt(er.current);if(n=t.type,e!==null&&t.stateNode!=null)Wa(e,t,n,r,l),e.ref!==t.ref&&(t.flags|=512,t.flags|=2097152);else{if(!r){if(t.stateNode===null)throw Error(w(166));return ue(t),null}if(e=Mt(Ye.current),Sr(t)){r=t.stateNode,n=t.type;var o=t.memoizedProps;switch(r[Qe]=t,r[qn]=o,e=(t.mode&1)!==0,n){case"dialog":A("cancel",r),A("close",r);break;case"iframe":case"object":case"embed":A("load",r);break;case"video":case"audio":for(l=0;l<Mn.length;l++)A(Mn[l],r);break;case"source":A("error",r);break;case"img":case"image":case"link":A("error",r),A("load",r);break;case"details":A("toggle",r);break;case"input":Gi(r,o),A("invalid",r);break;case"select":r._wrapperState={wasMultiple:!!o.multiple},A("invalid",r);break;case"textarea":Zi(r,o),A("invalid",r)}fo(n,o),l=null;for(var i in o)if(o.hasOwnProperty(i)){var u=o[i];i==="children"?typeof u=="string"?r.textContent!==u&&(o.suppressHydrationWarning!==!0&&xr(r.textContent,u,e),l=["children",u]):typeof u=="number"&&r.textContent!==""+u&&(o.suppressHydrationWarning!==!0&&xr(r.textContent,u,e),l=["children",""+u]):Bn.hasOwnProperty(i)&&u!=null&&i==="onScroll"&&A("scroll",r)}switch(n){case"input":dr(r),Xi(r,o,!0);break;case"textarea":dr(r),Ji(r);break;case"select":case"option":break;default:typeof o.onClick=="function"&&(r.onclick=Yr)}r=l,t.updateQueue=r,r!==null&&(t.flags|=4)}else{i=l.nodeType===9?l:l.ownerDocument,e==="http://www.w3.org/1999/xhtml"&&(e=ws(n)),e==="http://www.w3.org/1999/xhtml"?n==="script"?(e=i.createElement("div"),e.innerHTML="<script><\/script>",e=e.removeChild(e.firstChild)):typeof r.is=="string"?e=i.createElement(n,{is:r.is}):(e=i.createElement(n),n==="select"&&(i=e,r.multiple?i.multiple=!0:r.size&&(i.size=r.size))):e=i.createElementNS(e,n),e[Qe]=t,e[qn]=r,Ha(e,t,!1,!1),t.stateNode=e;e:{switch(i=po(n,r),n){case"dialog":A("cancel",e),A("close",e),l=r;break;case"iframe":case"object":case"embed":A("load",e),l=r;break;case"video":case"audio":for(l=0;l<Mn.length;l++)A(Mn[l],e);l=r;break;case"source":A("error",e),l=r;break;case"img":case"image":case"link":A("error",e),A("load",e),l=r;break;case"details":A("toggle",e),l=r;break;case"input":Gi(e,r),l=io(e,r),A("invalid",e);break;case"option":l=r;break;case"select":e._wrapperState={wasMultiple:!!r.multiple},l=Y({},r,{value:void 0}),A("invalid",e);break;case"textarea":Zi(e,r),l=ao(e,r),A("invalid",e);break;default:l=r}fo(n,l),u=l;for(o in u)if(u.hasOwnProperty(o)){var s=u[o];o==="style"?ks(e,s):o==="dangerouslySetInnerHTML"?(s=s?s.__html:void 0,s!=null&&xs(e,s)):o==="children"?typeof s=="string"?(n!=="textarea"||s!=="")&&Hn(e,s):typeof s=="number"&&Hn(e,""+s):o!=="suppressContentEditableWarning"&&o!=="suppressHydrationWarning"&&o!=="autoFocus"&&(Bn.hasOwnProperty(o)?s!=null&&o==="onScroll"&&A("scroll",e):s!=null&&ei(e,o,s,i))}switch(n){case"input":dr(e),Xi(e,r,!1);break;case"textarea":dr(e),Ji(e);break;case"option":r.value!=null&&e.setAttribute("value",""+St(r.value));break;case"select":e.multiple=!!r.multiple,o=r.value,o!=null?rn(e,!!r.multiple,o,!1):r.defaultValue!=null&&rn(e,!!r.multiple,r.defaultValue,!0);break;default:typeof l.onClick=="function"&&(e.onclick=Yr)}switch(n){case"button":case"input":case"select":case"textarea":r=!!r.autoFocus;break e;case"img":r=!0;break e;default:r=!1}}r&&(t.flags|=4)}t.ref!==null&&(t.flags|=512,t.flags|=2097152)}return ue(t),null;case 6:if(e&&t.stateNode!=null)Qa(e,t,e.memoizedProps,r);else{if(typeof r!="string"&&t.stateNode===null)throw Error(w(166));if(n=Mt(er.current),Mt(Ye.current),Sr(t)){if(r=t.stateNode,n=t.memoizedProps,r[Qe]=t,(o=r.nodeValue!==n)&&(e=Ce,e!==null))switch(e.tag){case 3:xr(r.nodeValue,n,(e.mode&1)!==0);break;case 5:e.memoizedProps.suppressHydrationWarning!==!0&&xr(r.nodeValue,n,(e.mode&1)!==0)}o&&(t.flags|=4)}else r=(n.nodeType===9?n:n.ownerDocument).createTextNode(r),r[Qe]=t,t.stateNode=r}return ue(t),null;case 13:if(V(Q),r=t.memoizedState,e===null||e.memoizedState!==null&&e.memoizedState.dehydrated!==null){if(H&&Ee!==null&&t.mode&1&&!(t.flags&128))aa(),dn(),t.flags|=98560,o=!1;else if(o=Sr(t),r!==null&&r.dehydrated!==null){if(e===null){if(!o)throw Error(w(318));if(o=t.memoizedState,o=o!==null?o.dehydrated:null,!o)throw Error(w(317));o[Qe]=t}else dn(),!(t.flags&128)&&(t.memoizedState=null),t.flags|=4;ue(t),o=!1}else Ue!==null&&(Yo(Ue),Ue=null),o=!0;if(!o)return t.flags&65536?t:null}return t.flags&128?(t.lanes=n,t):(r=r!==null,r!==(e!==null&&e.memoizedState!==null)&&r&&(t.child.flags|=8192,t.mode&1&&(e===null||Q.current&1?b===0&&(b=3):Ii())),t.updateQueue!==null&&(t.flags|=4),ue(t),null);case 4:return hn(),$o(e,t),e===null&&Zn(t.stateNode.containerInfo),ue(t),null;case 10:return wi(t.type._context),ue(t),null;case 17:return xe(t.type)&&Gr(),ue(t),null;case 19:if(V(Q),o=t.memoizedState,o===null)return ue(t),null;if(r=(t.flags&128)!==0,i=o.rendering,i===null)if(r)jn(o,!1);else{if(b!==0||e!==null&&e.flags&128)for(e=t.child;e!==null;){if(i=tl(e),i!==null){for(t.flags|=128,jn(o,!1),r=i.updateQueue,r!==null&&(t.updateQueue=r,t.flags|=4),t.subtreeFlags=0,r=n,n=t.child;n!==null;)o=n,e=r,o.flags&=14680066,i=o.alternate,i===null?(o.childLanes=0,o.lanes=e,o.child=null,o.subtreeFlags=0,o.memoizedProps=null,o.memoizedState=null,o.updateQueue=null,o.dependencies=null,o.stateNode=null):(o.childLanes=i.childLanes,o.lanes=i.lanes,o.child=i.child,o.subtreeFlags=0,o.deletions=null,o.memoizedProps=i.memoizedProps,o.memoizedState=i.memoizedState,o.updateQueue=i.updateQueue,o.type=i.type,e=i.dependencies,o.dependencies=e===null?null:{lanes:e.lanes,firstContext:e.firstContext}),n=n.sibling;return F(Q,Q.current&1|2),t.child}e=e.sibling}o.tail!==null&&X()>vn&&(t.flags|=128,r=!0,jn(o,!1),t.lanes=4194304)}else{if(!r)if(e=tl(i),e!==null){if(t.flags|=128,r=!0,n=e.updateQueue,n!==null&&(t.updateQueue=n,t.flags|=4),jn(o,!0),o.tail===null&&o.tailMode==="hidden"&&!i.alternate&&!H)return ue(t),null}else 2*X()-o.renderingStartTime>vn&&n!==1073741824&&(t.flags|=128,r=!0,jn(o,!1),t.lanes=4194304);o.isBackwards?(i.sibling=t.child,t.child=i):(n=o.last,n!==null?n.sibling=i:t.child=i,o.last=i)}return o.tail!==null?(t=o.tail,o.rendering=t,o.tail=t.sibling,o.renderingStartTime=X(),t.sibling=null,n=Q.current,F(Q,r?n&1|2:n&1),t):(ue(t),null);case 22:case 23:return Di(),r=t.memoizedState!==null,e!==null&&e.memoizedState!==null!==r&&(t.flags|=8192),r&&t.mode&1?ke&1073741824&&(ue(t),t.subtreeFlags&6&&(t.flags|=8192)):ue(t),null;case 24:return null;case 25:return null}throw Error(w(156,t.tag))}function xd(e,t){switch(mi(t),t.tag){case 1:return xe(t.type)&&Gr(),e=t.flags,e&65536?(t.flags=e&-65537|128,t):null;case 3:return hn(),V(we),V(fe),Ci(),e=t.flags,e&65536&&!(e&128)?(t.flags=e&-65537|128,t):null;case 5:return Ei(t),null;case 13:if(V(Q),e=t.memoizedState,e!==null&&e.dehydrated!==null){if(t.alternate===null)throw Error(w(340));dn()}return e=t.flags,e&65536?(t.flags=e&-65537|128,t):null;case 19:return V(Q),null;case 4:return hn(),null;case 10:return wi(t.type._context),null;case 22:case 23:return Di(),null;case 24:return null;default:return null}}var Cr=!1,ce=!1,Sd=typeof WeakSet=="function"?WeakSet:Set,N=null;function tn(e,t){var n=e.ref;if(n!==null)if(typeof n=="function")try{n(null)}catch(r){G(e,t,r)}else n.current=null}function Ao(e,t,n){try{n()}catch(r){G(e,t,r)}}var Au=!1;function kd(e,t){if(Eo=Wr,e=Zs(),pi(e)){if("selectionStart"in e)var n={start:e.selectionStart,end:e.selectionEnd};else e:{n=(n=e.ownerDocument)&&n.defaultView||window;var r=n.getSelection&&n.getSelection();if(r&&r.rangeCount!==0){n=r.anchorNode;var l=r.anchorOffset,o=r.focusNode;r=r.focusOffset;try{n.nodeType,o.nodeType}catch{n=null;break e}var i=0,u=-1,s=-1,c=0,y=0,v=e,m=null;t:for(;;){for(var x;v!==n||l!==0&&v.nodeType!==3||(u=i+l),v!==o||r!==0&&v.nodeType!==3||(s=i+r),v.nodeType===3&&(i+=v.nodeValue.length),(x=v.firstChild)!==null;)m=v,v=x;for(;;){if(v===e)break t;if(m===n&&++c===l&&(u=i),m===o&&++y===r&&(s=i),(x=v.nextSibling)!==null)break;v=m,m=v.parentNode}v=x}n=u===-1||s===-1?null:{start:u,end:s}}else n=null}n=n||{start:0,end:0}}else n=null;for(Co={focusedElem:e,selectionRange:n},Wr=!1,N=t;N!==null;)if(t=N,e=t.child,(t.subtreeFlags&1028)!==0&&e!==null)e.return=t,N=e;else for(;N!==null;){t=N;try{var S=t.alternate;if(t.flags&1024)switch(t.tag){case 0:case 11:case 15:break;case 1:if(S!==null){var k=S.memoizedProps,I=S.memoizedState,f=t.stateNode,a=f.getSnapshotBeforeUpdate(t.elementType===t.type?k:Ie(t.type,k),I);f.__reactInternalSnapshotBeforeUpdate=a}break;case 3:var d=t.stateNode.containerInfo;d.nodeType===1?d.textContent="":d.nodeType===9&&d.documentElement&&d.removeChild(d.documentElement);break;case 5:case 6:case 4:case 17:break;default:throw Error(w(163))}}catch(g){G(t,t.return,g)}if(e=t.sibling,e!==null){e.return=t.return,N=e;break}N=t.return}return S=Au,Au=!1,S}function $n(e,t,n){var r=t.updateQueue;if(r=r!==null?r.lastEffect:null,r!==null){var l=r=r.next;do{if((l.tag&e)===e){var o=l.destroy;l.destroy=void 0,o!==void 0&&Ao(t,n,o)}l=l.next}while(l!==r)}}function gl(e,t){if(t=t.updateQueue,t=t!==null?t.lastEffect:null,t!==null){var n=t=t.next;do{if((n.tag&e)===e){var r=n.create;n.destroy=r()}n=n.next}while(n!==t)}}function Vo(e){var t=e.ref;if(t!==null){var n=e.stateNode;switch(e.tag){case 5:e=n;break;default:e=n}typeof t=="function"?t(e):t.current=e}}function Ka(e){var t=e.alternate;t!==null&&(e.alternate=null,Ka(t)),e.child=null,e.deletions=null,e.sibling=null,e.tag===5&&(t=e.stateNode,t!==null&&(delete t[Qe],delete t[qn],delete t[jo],delete t[ld],delete t[od])),e.stateNode=null,e.return=null,e.dependencies=null,e.memoizedProps=null,e.memoizedState=null,e.pendingProps=null,e.stateNode=null,e.updateQueue=null}function Ya(e){return e.tag===5||e.tag===3||e.tag===4}function Vu(e){e:for(;;){for(;e.sibling===null;){if(e.return===null||Ya(e.return))return null;e=e.return}for(e.sibling.return=e.return,e=e.sibling;e.tag!==5&&e.tag!==6&&e.tag!==18;){if(e.flags&2||e.child===null||e.tag===4)continue e;e.child.return=e,e=e.child}if(!(e.flags&2))return e.stateNode}}function Bo(e,t,n){var r=e.tag;if(r===5||r===6)e=e.stateNode,t?n.nodeType===8?n.parentNode.insertBefore(e,t):n.insertBefore(e,t):(n.nodeType===8?(t=n.parentNode,t.insertBefore(e,n)):(t=n,t.appendChild(e)),n=n._reactRootContainer,n!=null||t.onclick!==null||(t.onclick=Yr));else if(r!==4&&(e=e.child,e!==null))for(Bo(e,t,n),e=e.sibling;e!==null;)Bo(e,t,n),e=e.sibling}function Ho(e,t,n){var r=e.tag;if(r===5||r===6)e=e.stateNode,t?n.insertBefore(e,t):n.appendChild(e);else if(r!==4&&(e=e.child,e!==null))for(Ho(e,t,n),e=e.sibling;e!==null;)Ho(e,t,n),e=e.sibling}var re=null,Fe=!1;function it(e,t,n){for(n=n.child;n!==null;)Ga(e,t,n),n=n.sibling}function Ga(e,t,n){if(Ke&&typeof Ke.onCommitFiberUnmount=="function")try{Ke.onCommitFiberUnmount(cl,n)}catch{}switch(n.tag){case 5:ce||tn(n,t);case 6:var r=re,l=Fe;re=null,it(e,t,n),re=r,Fe=l,re!==null&&(Fe?(e=re,n=n.stateNode,e.nodeType===8?e.parentNode.removeChild(n):e.removeChild(n)):re.removeChild(n.stateNode));break;case 18:re!==null&&(Fe?(e=re,n=n.stateNode,e.nodeType===8?Wl(e.parentNode,n):e.nodeType===1&&Wl(e,n),Yn(e)):Wl(re,n.stateNode));break;case 4:r=re,l=Fe,re=n.stateNode.containerInfo,Fe=!0,it(e,t,n),re=r,Fe=l;break;case 0:case 11:case 14:case 15:if(!ce&&(r=n.updateQueue,r!==null&&(r=r.lastEffect,r!==null))){l=r=r.next;do{var o=l,i=o.destroy;o=o.tag,i!==void 0&&(o&2||o&4)&&Ao(n,t,i),l=l.next}while(l!==r)}it(e,t,n);break;case 1:if(!ce&&(tn(n,t),r=n.stateNode,typeof r.componentWillUnmount=="function"))try{r.props=n.memoizedProps,r.state=n.memoizedState,r.componentWillUnmount()}catch(u){G(n,t,u)}it(e,t,n);break;case 21:it(e,t,n);break;case 22:n.mode&1?(ce=(r=ce)||n.memoizedState!==null,it(e,t,n),ce=r):it(e,t,n);break;default:it(e,t,n)}}function Bu(e){var t=e.updateQueue;if(t!==null){e.updateQueue=null;var n=e.stateNode;n===null&&(n=e.stateNode=new Sd),t.forEach(function(r){var l=Ld.bind(null,e,r);n.has(r)||(n.add(r),r.then(l,l))})}}function De(e,t){var n=t.deletions;if(n!==null)for(var r=0;r<n.length;r++){var l=n[r];try{var o=e,i=t,u=i;e:for(;u!==null;){switch(u.tag){case 5:re=u.stateNode,Fe=!1;break e;case 3:re=u.stateNode.containerInfo,Fe=!0;break e;case 4:re=u.stateNode.containerInfo,Fe=!0;break e}u=u.return}if(re===null)throw Error(w(160));Ga(o,i,l),re=null,Fe=!1;var s=l.alternate;s!==null&&(s.return=null),l.return=null}catch(c){G(l,t,c)}}if(t.subtreeFlags&12854)for(t=t.child;t!==null;)Xa(t,e),t=t.sibling}function Xa(e,t){var n=e.alternate,r=e.flags;switch(e.tag){case 0:case 11:case 14:case 15:if(De(t,e),He(e),r&4){try{$n(3,e,e.return),gl(3,e)}catch(k){G(e,e.return,k)}try{$n(5,e,e.return)}catch(k){G(e,e.return,k)}}break;case 1:De(t,e),He(e),r&512&&n!==null&&tn(n,n.return);break;case 5:if(De(t,e),He(e),r&512&&n!==null&&tn(n,n.return),e.flags&32){var l=e.stateNode;try{Hn(l,"")}catch(k){G(e,e.return,k)}}if(r&4&&(l=e.stateNode,l!=null)){var o=e.memoizedProps,i=n!==null?n.memoizedProps:o,u=e.type,s=e.updateQueue;if(e.updateQueue=null,s!==null)try{u==="input"&&o.type==="radio"&&o.name!=null&&ys(l,o),po(u,i);var c=po(u,o);for(i=0;i<s.length;i+=2){var y=s[i],v=s[i+1];y==="style"?ks(l,v):y==="dangerouslySetInnerHTML"?xs(l,v):y==="children"?Hn(l,v):ei(l,y,v,c)}switch(u){case"input":uo(l,o);break;case"textarea":gs(l,o);break;case"select":var m=l._wrapperState.wasMultiple;l._wrapperState.wasMultiple=!!o.multiple;var x=o.value;x!=null?rn(l,!!o.multiple,x,!1):m!==!!o.multiple&&(o.defaultValue!=null?rn(l,!!o.multiple,o.defaultValue,!0):rn(l,!!o.multiple,o.multiple?[]:"",!1))}l[qn]=o}catch(k){G(e,e.return,k)}}break;case 6:if(De(t,e),He(e),r&4){if(e.stateNode===null)throw Error(w(162));l=e.stateNode,o=e.memoizedProps;try{l.nodeValue=o}catch(k){G(e,e.return,k)}}break;case 3:if(De(t,e),He(e),r&4&&n!==null&&n.memoizedState.isDehydrated)try{Yn(t.containerInfo)}catch(k){G(e,e.return,k)}break;case 4:De(t,e),He(e);break;case 13:De(t,e),He(e),l=e.child,l.flags&8192&&(o=l.memoizedState!==null,l.stateNode.isHidden=o,!o||l.alternate!==null&&l.alternate.memoizedState!==null||(Ri=X())),r&4&&Bu(e);break;case 22:if(y=n!==null&&n.memoizedState!==null,e.mode&1?(ce=(c=ce)||y,De(t,e),ce=c):De(t,e),He(e),r&8192){if(c=e.memoizedState!==null,(e.stateNode.isHidden=c)&&!y&&e.mode&1)for(N=e,y=e.child;y!==null;){for(v=N=y;N!==null;){switch(m=N,x=m.child,m.tag){case 0:case 11:case 14:case 15:$n(4,m,m.return);break;case 1:tn(m,m.return);var S=m.stateNode;if(typeof S.componentWillUnmount=="function"){r=m,n=m.return;try{t=r,S.props=t.memoizedProps,S.state=t.memoizedState,S.componentWillUnmount()}catch(k){G(r,n,k)}}break;case 5:tn(m,m.return);break;case 22:if(m.memoizedState!==null){Wu(v);continue}}x!==null?(x.return=m,N=x):Wu(v)}y=y.sibling}e:for(y=null,v=e;;){if(v.tag===5){if(y===null){y=v;try{l=v.stateNode,c?(o=l.style,typeof o.setProperty=="function"?o.setProperty("display","none","important"):o.display="none"):(u=v.stateNode,s=v.memoizedProps.style,i=s!=null&&s.hasOwnProperty("display")?s.display:null,u.style.display=Ss("display",i))}catch(k){G(e,e.return,k)}}}else if(v.tag===6){if(y===null)try{v.stateNode.nodeValue=c?"":v.memoizedProps}catch(k){G(e,e.return,k)}}else if((v.tag!==22&&v.tag!==23||v.memoizedState===null||v===e)&&v.child!==null){v.child.return=v,v=v.child;continue}if(v===e)break e;for(;v.sibling===null;){if(v.return===null||v.return===e)break e;y===v&&(y=null),v=v.return}y===v&&(y=null),v.sibling.return=v.return,v=v.sibling}}break;case 19:De(t,e),He(e),r&4&&Bu(e);break;case 21:break;default:De(t,e),He(e)}}function He(e){var t=e.flags;if(t&2){try{e:{for(var n=e.return;n!==null;){if(Ya(n)){var r=n;break e}n=n.return}throw Error(w(160))}switch(r.tag){case 5:var l=r.stateNode;r.flags&32&&(Hn(l,""),r.flags&=-33);var o=Vu(e);Ho(e,o,l);break;case 3:case 4:var i=r.stateNode.containerInfo,u=Vu(e);Bo(e,u,i);break;default:throw Error(w(161))}}catch(s){G(e,e.return,s)}e.flags&=-3}t&4096&&(e.flags&=-4097)}function Ed(e,t,n){N=e,Za(e)}function Za(e,t,n){for(var r=(e.mode&1)!==0;N!==null;){var l=N,o=l.child;if(l.tag===22&&r){var i=l.memoizedState!==null||Cr;if(!i){var u=l.alternate,s=u!==null&&u.memoizedState!==null||ce;u=Cr;var c=ce;if(Cr=i,(ce=s)&&!c)for(N=l;N!==null;)i=N,s=i.child,i.tag===22&&i.memoizedState!==null?Qu(l):s!==null?(s.return=i,N=s):Qu(l);for(;o!==null;)N=o,Za(o),o=o.sibling;N=l,Cr=u,ce=c}Hu(e)}else l.subtreeFlags&8772&&o!==null?(o.return=l,N=o):Hu(e)}}function Hu(e){for(;N!==null;){var t=N;if(t.flags&8772){var n=t.alternate;try{if(t.flags&8772)switch(t.tag){case 0:case 11:case 15:ce||gl(5,t);break;case 1:var r=t.stateNode;if(t.flags&4&&!ce)if(n===null)r.componentDidMount();else{var l=t.elementType===t.type?n.memoizedProps:Ie(t.type,n.memoizedProps);r.componentDidUpdate(l,n.memoizedState,r.__reactInternalSnapshotBeforeUpdate)}var o=t.updateQueue;o!==null&&ju(t,o,r);break;case 3:var i=t.updateQueue;if(i!==null){if(n=null,t.child!==null)switch(t.child.tag){case 5:n=t.child.stateNode;break;case 1:n=t.child.stateNode}ju(t,i,n)}break;case 5:var u=t.stateNode;if(n===null&&t.flags&4){n=u;var s=t.memoizedProps;switch(t.type){case"button":case"input":case"select":case"textarea":s.autoFocus&&n.focus();break;case"img":s.src&&(n.src=s.src)}}break;case 6:break;case 4:break;case 12:break;case 13:if(t.memoizedState===null){var c=t.alternate;if(c!==null){var y=c.memoizedState;if(y!==null){var v=y.dehydrated;v!==null&&Yn(v)}}}break;case 19:case 17:case 21:case 22:case 23:case 25:break;default:throw Error(w(163))}ce||t.flags&512&&Vo(t)}catch(m){G(t,t.return,m)}}if(t===e){N=null;break}if(n=t.sibling,n!==null){n.return=t.return,N=n;break}N=t.return}}function Wu(e){for(;N!==null;){var t=N;if(t===e){N=null;break}var n=t.sibling;if(n!==null){n.return=t.return,N=n;break}N=t.return}}function Qu(e){for(;N!==null;){var t=N;try{switch(t.tag){case 0:case 11:case 15:var n=t.return;try{gl(4,t)}catch(s){G(t,n,s)}break;case 1:var r=t.stateNode;if(typeof r.componentDidMount=="function"){var l=t.return;try{r.componentDidMount()}catch(s){G(t,l,s)}}var o=t.return;try{Vo(t)}catch(s){G(t,o,s)}break;case 5:var i=t.return;try{Vo(t)}catch(s){G(t,i,s)}}}catch(s){G(t,t.return,s)}if(t===e){N=null;break}var u=t.sibling;if(u!==null){u.return=t.return,N=u;break}N=t.return}}var Cd=Math.ceil,ll=lt.ReactCurrentDispatcher,Li=lt.ReactCurrentOwner,Me=lt.ReactCurrentBatchConfig,O=0,te=null,J=null,le=0,ke=0,nn=Ct(0),b=0,lr=null,Ut=0,wl=0,Mi=0,An=null,ye=null,Ri=0,vn=1/0,Xe=null,ol=!1,Wo=null,gt=null,Nr=!1,dt=null,il=0,Vn=0,Qo=null,Ir=-1,Fr=0;function pe(){return O&6?X():Ir!==-1?Ir:Ir=X()}function wt(e){return e.mode&1?O&2&&le!==0?le&-le:ud.transition!==null?(Fr===0&&(Fr=Os()),Fr):(e=D,e!==0||(e=window.event,e=e===void 0?16:Vs(e.type)),e):1}function Ae(e,t,n,r){if(50<Vn)throw Vn=0,Qo=null,Error(w(185));ir(e,n,r),(!(O&2)||e!==te)&&(e===te&&(!(O&2)&&(wl|=n),b===4&&ct(e,le)),Se(e,r),n===1&&O===0&&!(t.mode&1)&&(vn=X()+500,ml&&Nt()))}function Se(e,t){var n=e.callbackNode;uf(e,t);var r=Hr(e,e===te?le:0);if(r===0)n!==null&&eu(n),e.callbackNode=null,e.callbackPriority=0;else if(t=r&-r,e.callbackPriority!==t){if(n!=null&&eu(n),t===1)e.tag===0?id(Ku.bind(null,e)):ia(Ku.bind(null,e)),nd(function(){!(O&6)&&Nt()}),n=null;else{switch(Ds(r)){case 1:n=oi;break;case 4:n=Ms;break;case 16:n=Br;break;case 536870912:n=Rs;break;default:n=Br}n=lc(n,Ja.bind(null,e))}e.callbackPriority=t,e.callbackNode=n}}function Ja(e,t){if(Ir=-1,Fr=0,O&6)throw Error(w(327));var n=e.callbackNode;if(an()&&e.callbackNode!==n)return null;var r=Hr(e,e===te?le:0);if(r===0)return null;if(r&30||r&e.expiredLanes||t)t=ul(e,r);else{t=r;var l=O;O|=2;var o=ba();(te!==e||le!==t)&&(Xe=null,vn=X()+500,Rt(e,t));do try{jd();break}catch(u){qa(e,u)}while(!0);gi(),ll.current=o,O=l,J!==null?t=0:(te=null,le=0,t=b)}if(t!==0){if(t===2&&(l=go(e),l!==0&&(r=l,t=Ko(e,l))),t===1)throw n=lr,Rt(e,0),ct(e,r),Se(e,X()),n;if(t===6)ct(e,r);else{if(l=e.current.alternate,!(r&30)&&!Nd(l)&&(t=ul(e,r),t===2&&(o=go(e),o!==0&&(r=o,t=Ko(e,o))),t===1))throw n=lr,Rt(e,0),ct(e,r),Se(e,X()),n;switch(e.finishedWork=l,e.finishedLanes=r,t){case 0:case 1:throw Error(w(345));case 2:zt(e,ye,Xe);break;case 3:if(ct(e,r),(r&130023424)===r&&(t=Ri+500-X(),10<t)){if(Hr(e,0)!==0)break;if(l=e.suspendedLanes,(l&r)!==r){pe(),e.pingedLanes|=e.suspendedLanes&l;break}e.timeoutHandle=_o(zt.bind(null,e,ye,Xe),t);break}zt(e,ye,Xe);break;case 4:if(ct(e,r),(r&4194240)===r)break;for(t=e.eventTimes,l=-1;0<r;){var i=31-$e(r);o=1<<i,i=t[i],i>l&&(l=i),r&=~o}if(r=l,r=X()-r,r=(120>r?120:480>r?480:1080>r?1080:1920>r?1920:3e3>r?3e3:4320>r?4320:1960*Cd(r/1960))-r,10<r){e.timeoutHandle=_o(zt.bind(null,e,ye,Xe),r);break}zt(e,ye,Xe);break;case 5:zt(e,ye,Xe);break;default:throw Error(w(329))}}}return Se(e,X()),e.callbackNode===n?Ja.bind(null,e):null}function Ko(e,t){var n=An;return e.current.memoizedState.isDehydrated&&(Rt(e,t).flags|=256),e=ul(e,t),e!==2&&(t=ye,ye=n,t!==null&&Yo(t)),e}function Yo(e){ye===null?ye=e:ye.push.apply(ye,e)}function Nd(e){for(var t=e;;){if(t.flags&16384){var n=t.updateQueue;if(n!==null&&(n=n.stores,n!==null))for(var r=0;r<n.length;r++){var l=n[r],o=l.getSnapshot;l=l.value;try{if(!Ve(o(),l))return!1}catch{return!1}}}if(n=t.child,t.subtreeFlags&16384&&n!==null)n.return=t,t=n;else{if(t===e)break;for(;t.sibling===null;){if(t.return===null||t.return===e)return!0;t=t.return}t.sibling.return=t.return,t=t.sibling}}return!0}function ct(e,t){for(t&=~Mi,t&=~wl,e.suspendedLanes|=t,e.pingedLanes&=~t,e=e.expirationTimes;0<t;){var n=31-$e(t),r=1<<n;e[n]=-1,t&=~r}}function Ku(e){if(O&6)throw Error(w(327));an();var t=Hr(e,0);if(!(t&1))return Se(e,X()),null;var n=ul(e,t);if(e.tag!==0&&n===2){var r=go(e);r!==0&&(t=r,n=Ko(e,r))}if(n===1)throw n=lr,Rt(e,0),ct(e,t),Se(e,X()),n;if(n===6)throw Error(w(345));return e.finishedWork=e.current.alternate,e.finishedLanes=t,zt(e,ye,Xe),Se(e,X()),null}function Oi(e,t){var n=O;O|=1;try{return e(t)}finally{O=n,O===0&&(vn=X()+500,ml&&Nt())}}function $t(e){dt!==null&&dt.tag===0&&!(O&6)&&an();var t=O;O|=1;var n=Me.transition,r=D;try{if(Me.transition=null,D=1,e)return e()}finally{D=r,Me.transition=n,O=t,!(O&6)&&Nt()}}function Di(){ke=nn.current,V(nn)}function Rt(e,t){e.finishedWork=null,e.finishedLanes=0;var n=e.timeoutHandle;if(n!==-1&&(e.timeoutHandle=-1,td(n)),J!==null)for(n=J.return;n!==null;){var r=n;switch(mi(r),r.tag){case 1:r=r.type.childContextTypes,r!=null&&Gr();break;case 3:hn(),V(we),V(fe),Ci();break;case 5:Ei(r);break;case 4:hn();break;case 13:V(Q);break;case 19:V(Q);break;case 10:wi(r.type._context);break;case 22:case 23:Di()}n=n.return}if(te=e,J=e=xt(e.current,null),le=ke=t,b=0,lr=null,Mi=wl=Ut=0,ye=An=null,Lt!==null){for(t=0;t<Lt.length;t++)if(n=Lt[t],r=n.interleaved,r!==null){n.interleaved=null;var l=r.next,o=n.pending;if(o!==null){var i=o.next;o.next=l,r.next=i}n.pending=r}Lt=null}return e}function qa(e,t){do{var n=J;try{if(gi(),Rr.current=rl,nl){for(var r=K.memoizedState;r!==null;){var l=r.queue;l!==null&&(l.pending=null),r=r.next}nl=!1}if(Ft=0,ee=q=K=null,Un=!1,tr=0,Li.current=null,n===null||n.return===null){b=1,lr=t,J=null;break}e:{var o=e,i=n.return,u=n,s=t;if(t=le,u.flags|=32768,s!==null&&typeof s=="object"&&typeof s.then=="function"){var c=s,y=u,v=y.tag;if(!(y.mode&1)&&(v===0||v===11||v===15)){var m=y.alternate;m?(y.updateQueue=m.updateQueue,y.memoizedState=m.memoizedState,y.lanes=m.lanes):(y.updateQueue=null,y.memoizedState=null)}var x=Ru(i);if(x!==null){x.flags&=-257,Ou(x,i,u,o,t),x.mode&1&&Mu(o,c,t),t=x,s=c;var S=t.updateQueue;if(S===null){var k=new Set;k.add(s),t.updateQueue=k}else S.add(s);break e}else{if(!(t&1)){Mu(o,c,t),Ii();break e}s=Error(w(426))}}else if(H&&u.mode&1){var I=Ru(i);if(I!==null){!(I.flags&65536)&&(I.flags|=256),Ou(I,i,u,o,t),vi(mn(s,u));break e}}o=s=mn(s,u),b!==4&&(b=2),An===null?An=[o]:An.push(o),o=i;do{switch(o.tag){case 3:o.flags|=65536,t&=-t,o.lanes|=t;var f=Da(o,s,t);_u(o,f);break e;case 1:u=s;var a=o.type,d=o.stateNode;if(!(o.flags&128)&&(typeof a.getDerivedStateFromError=="function"||d!==null&&typeof d.componentDidCatch=="function"&&(gt===null||!gt.has(d)))){o.flags|=65536,t&=-t,o.lanes|=t;var g=Ia(o,u,t);_u(o,g);break e}}o=o.return}while(o!==null)}tc(n)}catch(E){t=E,J===n&&n!==null&&(J=n=n.return);continue}break}while(!0)}function ba(){var e=ll.current;return ll.current=rl,e===null?rl:e}function Ii(){(b===0||b===3||b===2)&&(b=4),te===null||!(Ut&268435455)&&!(wl&268435455)||ct(te,le)}function ul(e,t){var n=O;O|=2;var r=ba();(te!==e||le!==t)&&(Xe=null,Rt(e,t));do try{_d();break}catch(l){qa(e,l)}while(!0);if(gi(),O=n,ll.current=r,J!==null)throw Error(w(261));return te=null,le=0,b}function _d(){for(;J!==null;)ec(J)}function jd(){for(;J!==null&&!Jc();)ec(J)}function ec(e){var t=rc(e.alternate,e,ke);e.memoizedProps=e.pendingProps,t===null?tc(e):J=t,Li.current=null}function tc(e){var t=e;do{var n=t.alternate;if(e=t.return,t.flags&32768){if(n=xd(n,t),n!==null){n.flags&=32767,J=n;return}if(e!==null)e.flags|=32768,e.subtreeFlags=0,e.deletions=null;else{b=6,J=null;return}}else if(n=wd(n,t,ke),n!==null){J=n;return}if(t=t.sibling,t!==null){J=t;return}J=t=e}while(t!==null);b===0&&(b=5)}function zt(e,t,n){var r=D,l=Me.transition;try{Me.transition=null,D=1,Pd(e,t,n,r)}finally{Me.transition=l,D=r}return null}function Pd(e,t,n,r){do an();while(dt!==null);if(O&6)throw Error(w(327));n=e.finishedWork;var l=e.finishedLanes;if(n===null)return null;if(e.finishedWork=null,e.finishedLanes=0,n===e.current)throw Error(w(177));e.callbackNode=null,e.callbackPriority=0;var o=n.lanes|n.childLanes;if(sf(e,o),e===te&&(J=te=null,le=0),!(n.subtreeFlags&2064)&&!(n.flags&2064)||Nr||(Nr=!0,lc(Br,function(){return an(),null})),o=(n.flags&15990)!==0,n.subtreeFlags&15990||o){o=Me.transition,Me.transition=null;var i=D;D=1;var u=O;O|=4,Li.current=null,kd(e,n),Xa(n,e),Gf(Co),Wr=!!Eo,Co=Eo=null,e.current=n,Ed(n),qc(),O=u,D=i,Me.transition=o}else e.current=n;if(Nr&&(Nr=!1,dt=e,il=l),o=e.pendingLanes,o===0&&(gt=null),tf(n.stateNode),Se(e,X()),t!==null)for(r=e.onRecoverableError,n=0;n<t.length;n++)l=t[n],r(l.value,{componentStack:l.stack,digest:l.digest});if(ol)throw ol=!1,e=Wo,Wo=null,e;return il&1&&e.tag!==0&&an(),o=e.pendingLanes,o&1?e===Qo?Vn++:(Vn=0,Qo=e):Vn=0,Nt(),null}function an(){if(dt!==null){var e=Ds(il),t=Me.transition,n=D;try{if(Me.transition=null,D=16>e?16:e,dt===null)var r=!1;else{if(e=dt,dt=null,il=0,O&6)throw Error(w(331));var l=O;for(O|=4,N=e.current;N!==null;){var o=N,i=o.child;if(N.flags&16){var u=o.deletions;if(u!==null){for(var s=0;s<u.length;s++){var c=u[s];for(N=c;N!==null;){var y=N;switch(y.tag){case 0:case 11:case 15:$n(8,y,o)}var v=y.child;if(v!==null)v.return=y,N=v;else for(;N!==null;){y=N;var m=y.sibling,x=y.return;if(Ka(y),y===c){N=null;break}if(m!==null){m.return=x,N=m;break}N=x}}}var S=o.alternate;if(S!==null){var k=S.child;if(k!==null){S.child=null;do{var I=k.sibling;k.sibling=null,k=I}while(k!==null)}}N=o}}if(o.subtreeFlags&2064&&i!==null)i.return=o,N=i;else e:for(;N!==null;){if(o=N,o.flags&2048)switch(o.tag){case 0:case 11:case 15:$n(9,o,o.return)}var f=o.sibling;if(f!==null){f.return=o.return,N=f;break e}N=o.return}}var a=e.current;for(N=a;N!==null;){i=N;var d=i.child;if(i.subtreeFlags&2064&&d!==null)d.return=i,N=d;else e:for(i=a;N!==null;){if(u=N,u.flags&2048)try{switch(u.tag){case 0:case 11:case 15:gl(9,u)}}catch(E){G(u,u.return,E)}if(u===i){N=null;break e}var g=u.sibling;if(g!==null){g.return=u.return,N=g;break e}N=u.return}}if(O=l,Nt(),Ke&&typeof Ke.onPostCommitFiberRoot=="function")try{Ke.onPostCommitFiberRoot(cl,e)}catch{}r=!0}return r}finally{D=n,Me.transition=t}}return!1}function Yu(e,t,n){t=mn(n,t),t=Da(e,t,1),e=yt(e,t,1),t=pe(),e!==null&&(ir(e,1,t),Se(e,t))}function G(e,t,n){if(e.tag===3)Yu(e,e,n);else for(;t!==null;){if(t.tag===3){Yu(t,e,n);break}else if(t.tag===1){var r=t.stateNode;if(typeof t.type.getDerivedStateFromError=="function"||typeof r.componentDidCatch=="function"&&(gt===null||!gt.has(r))){e=mn(n,e),e=Ia(t,e,1),t=yt(t,e,1),e=pe(),t!==null&&(ir(t,1,e),Se(t,e));break}}t=t.return}}function zd(e,t,n){var r=e.pingCache;r!==null&&r.delete(t),t=pe(),e.pingedLanes|=e.suspendedLanes&n,te===e&&(le&n)===n&&(b===4||b===3&&(le&130023424)===le&&500>X()-Ri?Rt(e,0):Mi|=n),Se(e,t)}function nc(e,t){t===0&&(e.mode&1?(t=mr,mr<<=1,!(mr&130023424)&&(mr=4194304)):t=1);var n=pe();e=nt(e,t),e!==null&&(ir(e,t,n),Se(e,n))}function Td(e){var t=e.memoizedState,n=0;t!==null&&(n=t.retryLane),nc(e,n)}function Ld(e,t){var n=0;switch(e.tag){case 13:var r=e.stateNode,l=e.memoizedState;l!==null&&(n=l.retryLane);break;case 19:r=e.stateNode;break;default:throw Error(w(314))}r!==null&&r.delete(t),nc(e,n)}var rc;rc=function(e,t,n){if(e!==null)if(e.memoizedProps!==t.pendingProps||we.current)ge=!0;else{if(!(e.lanes&n)&&!(t.flags&128))return ge=!1,gd(e,t,n);ge=!!(e.flags&131072)}else ge=!1,H&&t.flags&1048576&&ua(t,Jr,t.index);switch(t.lanes=0,t.tag){case 2:var r=t.type;Dr(e,t),e=t.pendingProps;var l=fn(t,fe.current);sn(t,n),l=_i(null,t,r,e,l,n);var o=ji();return t.flags|=1,typeof l=="object"&&l!==null&&typeof l.render=="function"&&l.$$typeof===void 0?(t.tag=1,t.memoizedState=null,t.updateQueue=null,xe(r)?(o=!0,Xr(t)):o=!1,t.memoizedState=l.state!==null&&l.state!==void 0?l.state:null,Si(t),l.updater=yl,t.stateNode=l,l._reactInternals=t,Ro(t,r,e,n),t=Io(null,t,r,!0,o,n)):(t.tag=0,H&&o&&hi(t),de(null,t,l,n),t=t.child),t;case 16:r=t.elementType;e:{switch(Dr(e,t),e=t.pendingProps,l=r._init,r=l(r._payload),t.type=r,l=t.tag=Rd(r),e=Ie(r,e),l){case 0:t=Do(null,t,r,e,n);break e;case 1:t=Fu(null,t,r,e,n);break e;case 11:t=Du(null,t,r,e,n);break e;case 14:t=Iu(null,t,r,Ie(r.type,e),n);break e}throw Error(w(306,r,""))}return t;case 0:return r=t.type,l=t.pendingProps,l=t.elementType===r?l:Ie(r,l),Do(e,t,r,l,n);case 1:return r=t.type,l=t.pendingProps,l=t.elementType===r?l:Ie(r,l),Fu(e,t,r,l,n);case 3:e:{if(Aa(t),e===null)throw Error(w(387));r=t.pendingProps,o=t.memoizedState,l=o.element,pa(e,t),el(t,r,null,n);var i=t.memoizedState;if(r=i.element,o.isDehydrated)if(o={element:r,isDehydrated:!1,cache:i.cache,pendingSuspenseBoundaries:i.pendingSuspenseBoundaries,transitions:i.transitions},t.updateQueue.baseState=o,t.memoizedState=o,t.flags&256){l=mn(Error(w(423)),t),t=Uu(e,t,r,n,l);break e}else if(r!==l){l=mn(Error(w(424)),t),t=Uu(e,t,r,n,l);break e}else for(Ee=vt(t.stateNode.containerInfo.firstChild),Ce=t,H=!0,Ue=null,n=fa(t,null,r,n),t.child=n;n;)n.flags=n.flags&-3|4096,n=n.sibling;else{if(dn(),r===l){t=rt(e,t,n);break e}de(e,t,r,n)}t=t.child}return t;case 5:return ha(t),e===null&&To(t),r=t.type,l=t.pendingProps,o=e!==null?e.memoizedProps:null,i=l.children,No(r,l)?i=null:o!==null&&No(r,o)&&(t.flags|=32),$a(e,t),de(e,t,i,n),t.child;case 6:return e===null&&To(t),null;case 13:return Va(e,t,n);case 4:return ki(t,t.stateNode.containerInfo),r=t.pendingProps,e===null?t.child=pn(t,null,r,n):de(e,t,r,n),t.child;case 11:return r=t.type,l=t.pendingProps,l=t.elementType===r?l:Ie(r,l),Du(e,t,r,l,n);case 7:return de(e,t,t.pendingProps,n),t.child;case 8:return de(e,t,t.pendingProps.children,n),t.child;case 12:return de(e,t,t.pendingProps.children,n),t.child;case 10:e:{if(r=t.type._context,l=t.pendingProps,o=t.memoizedProps,i=l.value,F(qr,r._currentValue),r._currentValue=i,o!==null)if(Ve(o.value,i)){if(o.children===l.children&&!we.current){t=rt(e,t,n);break e}}else for(o=t.child,o!==null&&(o.return=t);o!==null;){var u=o.dependencies;if(u!==null){i=o.child;for(var s=u.firstContext;s!==null;){if(s.context===r){if(o.tag===1){s=be(-1,n&-n),s.tag=2;var c=o.updateQueue;if(c!==null){c=c.shared;var y=c.pending;y===null?s.next=s:(s.next=y.next,y.next=s),c.pending=s}}o.lanes|=n,s=o.alternate,s!==null&&(s.lanes|=n),Lo(o.return,n,t),u.lanes|=n;break}s=s.next}}else if(o.tag===10)i=o.type===t.type?null:o.child;else if(o.tag===18){if(i=o.return,i===null)throw Error(w(341));i.lanes|=n,u=i.alternate,u!==null&&(u.lanes|=n),Lo(i,n,t),i=o.sibling}else i=o.child;if(i!==null)i.return=o;else for(i=o;i!==null;){if(i===t){i=null;break}if(o=i.sibling,o!==null){o.return=i.return,i=o;break}i=i.return}o=i}de(e,t,l.children,n),t=t.child}return t;case 9:return l=t.type,r=t.pendingProps.children,sn(t,n),l=Re(l),r=r(l),t.flags|=1,de(e,t,r,n),t.child;case 14:return r=t.type,l=Ie(r,t.pendingProps),l=Ie(r.type,l),Iu(e,t,r,l,n);case 15:return Fa(e,t,t.type,t.pendingProps,n);case 17:return r=t.type,l=t.pendingProps,l=t.elementType===r?l:Ie(r,l),Dr(e,t),t.tag=1,xe(r)?(e=!0,Xr(t)):e=!1,sn(t,n),Oa(t,r,l),Ro(t,r,l,n),Io(null,t,r,!0,e,n);case 19:return Ba(e,t,n);case 22:return Ua(e,t,n)}throw Error(w(156,t.tag))};function lc(e,t){return Ls(e,t)}function Md(e,t,n,r){this.tag=e,this.key=n,this.sibling=this.child=this.return=this.stateNode=this.type=this.elementType=null,this.index=0,this.ref=null,this.pendingProps=t,this.dependencies=this.memoizedState=this.updateQueue=this.memoizedProps=null,this.mode=r,this.subtreeFlags=this.flags=0,this.deletions=null,this.childLanes=this.lanes=0,this.alternate=null}function Le(e,t,n,r){return new Md(e,t,n,r)}function Fi(e){return e=e.prototype,!(!e||!e.isReactComponent)}function Rd(e){if(typeof e=="function")return Fi(e)?1:0;if(e!=null){if(e=e.$$typeof,e===ni)return 11;if(e===ri)return 14}return 2}function xt(e,t){var n=e.alternate;return n===null?(n=Le(e.tag,t,e.key,e.mode),n.elementType=e.elementType,n.type=e.type,n.stateNode=e.stateNode,n.alternate=e,e.alternate=n):(n.pendingProps=t,n.type=e.type,n.flags=0,n.subtreeFlags=0,n.deletions=null),n.flags=e.flags&14680064,n.childLanes=e.childLanes,n.lanes=e.lanes,n.child=e.child,n.memoizedProps=e.memoizedProps,n.memoizedState=e.memoizedState,n.updateQueue=e.updateQueue,t=e.dependencies,n.dependencies=t===null?null:{lanes:t.lanes,firstContext:t.firstContext},n.sibling=e.sibling,n.index=e.index,n.ref=e.ref,n}function Ur(e,t,n,r,l,o){var i=2;if(r=e,typeof e=="function")Fi(e)&&(i=1);else if(typeof e=="string")i=5;else e:switch(e){case Kt:return Ot(n.children,l,o,t);case ti:i=8,l|=8;break;case no:return e=Le(12,n,t,l|2),e.elementType=no,e.lanes=o,e;case ro:return e=Le(13,n,t,l),e.elementType=ro,e.lanes=o,e;case lo:return e=Le(19,n,t,l),e.elementType=lo,e.lanes=o,e;case hs:return xl(n,l,o,t);default:if(typeof e=="object"&&e!==null)switch(e.$$typeof){case ds:i=10;break e;case ps:i=9;break e;case ni:i=11;break e;case ri:i=14;break e;case ut:i=16,r=null;break e}throw Error(w(130,e==null?e:typeof e,""))}return t=Le(i,n,t,l),t.elementType=e,t.type=r,t.lanes=o,t}function Ot(e,t,n,r){return e=Le(7,e,r,t),e.lanes=n,e}function xl(e,t,n,r){return e=Le(22,e,r,t),e.elementType=hs,e.lanes=n,e.stateNode={isHidden:!1},e}function ql(e,t,n){return e=Le(6,e,null,t),e.lanes=n,e}function bl(e,t,n){return t=Le(4,e.children!==null?e.children:[],e.key,t),t.lanes=n,t.stateNode={containerInfo:e.containerInfo,pendingChildren:null,implementation:e.implementation},t}function Od(e,t,n,r,l){this.tag=t,this.containerInfo=e,this.finishedWork=this.pingCache=this.current=this.pendingChildren=null,this.timeoutHandle=-1,this.callbackNode=this.pendingContext=this.context=null,this.callbackPriority=0,this.eventTimes=Rl(0),this.expirationTimes=Rl(-1),this.entangledLanes=this.finishedLanes=this.mutableReadLanes=this.expiredLanes=this.pingedLanes=this.suspendedLanes=this.pendingLanes=0,this.entanglements=Rl(0),this.identifierPrefix=r,this.onRecoverableError=l,this.mutableSourceEagerHydrationData=null}function Ui(e,t,n,r,l,o,i,u,s){return e=new Od(e,t,n,u,s),t===1?(t=1,o===!0&&(t|=8)):t=0,o=Le(3,null,null,t),e.current=o,o.stateNode=e,o.memoizedState={element:r,isDehydrated:n,cache:null,transitions:null,pendingSuspenseBoundaries:null},Si(o),e}function Dd(e,t,n){var r=3<arguments.length&&arguments[3]!==void 0?arguments[3]:null;return{$$typeof:Qt,key:r==null?null:""+r,children:e,containerInfo:t,implementation:n}}function oc(e){if(!e)return kt;e=e._reactInternals;e:{if(Vt(e)!==e||e.tag!==1)throw Error(w(170));var t=e;do{switch(t.tag){case 3:t=t.stateNode.context;break e;case 1:if(xe(t.type)){t=t.stateNode.__reactInternalMemoizedMergedChildContext;break e}}t=t.return}while(t!==null);throw Error(w(171))}if(e.tag===1){var n=e.type;if(xe(n))return oa(e,n,t)}return t}function ic(e,t,n,r,l,o,i,u,s){return e=Ui(n,r,!0,e,l,o,i,u,s),e.context=oc(null),n=e.current,r=pe(),l=wt(n),o=be(r,l),o.callback=t??null,yt(n,o,l),e.current.lanes=l,ir(e,l,r),Se(e,r),e}function Sl(e,t,n,r){var l=t.current,o=pe(),i=wt(l);return n=oc(n),t.context===null?t.context=n:t.pendingContext=n,t=be(o,i),t.payload={element:e},r=r===void 0?null:r,r!==null&&(t.callback=r),e=yt(l,t,i),e!==null&&(Ae(e,l,i,o),Mr(e,l,i)),i}function sl(e){if(e=e.current,!e.child)return null;switch(e.child.tag){case 5:return e.child.stateNode;default:return e.child.stateNode}}function Gu(e,t){if(e=e.memoizedState,e!==null&&e.dehydrated!==null){var n=e.retryLane;e.retryLane=n!==0&&n<t?n:t}}function $i(e,t){Gu(e,t),(e=e.alternate)&&Gu(e,t)}function Id(){return null}var uc=typeof reportError=="function"?reportError:function(e){console.error(e)};function Ai(e){this._internalRoot=e}kl.prototype.render=Ai.prototype.render=function(e){var t=this._internalRoot;if(t===null)throw Error(w(409));Sl(e,t,null,null)};kl.prototype.unmount=Ai.prototype.unmount=function(){var e=this._internalRoot;if(e!==null){this._internalRoot=null;var t=e.containerInfo;$t(function(){Sl(null,e,null,null)}),t[tt]=null}};function kl(e){this._internalRoot=e}kl.prototype.unstable_scheduleHydration=function(e){if(e){var t=Us();e={blockedOn:null,target:e,priority:t};for(var n=0;n<at.length&&t!==0&&t<at[n].priority;n++);at.splice(n,0,e),n===0&&As(e)}};function Vi(e){return!(!e||e.nodeType!==1&&e.nodeType!==9&&e.nodeType!==11)}function El(e){return!(!e||e.nodeType!==1&&e.nodeType!==9&&e.nodeType!==11&&(e.nodeType!==8||e.nodeValue!==" react-mount-point-unstable "))}function Xu(){}function Fd(e,t,n,r,l){if(l){if(typeof r=="function"){var o=r;r=function(){var c=sl(i);o.call(c)}}var i=ic(t,r,e,0,null,!1,!1,"",Xu);return e._reactRootContainer=i,e[tt]=i.current,Zn(e.nodeType===8?e.parentNode:e),$t(),i}for(;l=e.lastChild;)e.removeChild(l);if(typeof r=="function"){var u=r;r=function(){var c=sl(s);u.call(c)}}var s=Ui(e,0,!1,null,null,!1,!1,"",Xu);return e._reactRootContainer=s,e[tt]=s.current,Zn(e.nodeType===8?e.parentNode:e),$t(function(){Sl(t,s,n,r)}),s}function Cl(e,t,n,r,l){var o=n._reactRootContainer;if(o){var i=o;if(typeof l=="function"){var u=l;l=function(){var s=sl(i);u.call(s)}}Sl(t,i,e,l)}else i=Fd(n,t,e,l,r);return sl(i)}Is=function(e){switch(e.tag){case 3:var t=e.stateNode;if(t.current.memoizedState.isDehydrated){var n=Ln(t.pendingLanes);n!==0&&(ii(t,n|1),Se(t,X()),!(O&6)&&(vn=X()+500,Nt()))}break;case 13:$t(function(){var r=nt(e,1);if(r!==null){var l=pe();Ae(r,e,1,l)}}),$i(e,1)}};ui=function(e){if(e.tag===13){var t=nt(e,134217728);if(t!==null){var n=pe();Ae(t,e,134217728,n)}$i(e,134217728)}};Fs=function(e){if(e.tag===13){var t=wt(e),n=nt(e,t);if(n!==null){var r=pe();Ae(n,e,t,r)}$i(e,t)}};Us=function(){return D};$s=function(e,t){var n=D;try{return D=e,t()}finally{D=n}};mo=function(e,t,n){switch(t){case"input":if(uo(e,n),t=n.name,n.type==="radio"&&t!=null){for(n=e;n.parentNode;)n=n.parentNode;for(n=n.querySelectorAll("input[name="+JSON.stringify(""+t)+'][type="radio"]'),t=0;t<n.length;t++){var r=n[t];if(r!==e&&r.form===e.form){var l=hl(r);if(!l)throw Error(w(90));vs(r),uo(r,l)}}}break;case"textarea":gs(e,n);break;case"select":t=n.value,t!=null&&rn(e,!!n.multiple,t,!1)}};Ns=Oi;_s=$t;var Ud={usingClientEntryPoint:!1,Events:[sr,Zt,hl,Es,Cs,Oi]},Pn={findFiberByHostInstance:Tt,bundleType:0,version:"18.3.1",rendererPackageName:"react-dom"},$d={bundleType:Pn.bundleType,version:Pn.version,rendererPackageName:Pn.rendererPackageName,rendererConfig:Pn.rendererConfig,overrideHookState:null,overrideHookStateDeletePath:null,overrideHookStateRenamePath:null,overrideProps:null,overridePropsDeletePath:null,overridePropsRenamePath:null,setErrorHandler:null,setSuspenseHandler:null,scheduleUpdate:null,currentDispatcherRef:lt.ReactCurrentDispatcher,findHostInstanceByFiber:function(e){return e=zs(e),e===null?null:e.stateNode},findFiberByHostInstance:Pn.findFiberByHostInstance||Id,findHostInstancesForRefresh:null,scheduleRefresh:null,scheduleRoot:null,setRefreshHandler:null,getCurrentFiber:null,reconcilerVersion:"18.3.1-next-f1338f8080-20240426"};if(typeof __REACT_DEVTOOLS_GLOBAL_HOOK__<"u"){var _r=__REACT_DEVTOOLS_GLOBAL_HOOK__;if(!_r.isDisabled&&_r.supportsFiber)try{cl=_r.inject($d),Ke=_r}catch{}}_e.__SECRET_INTERNALS_DO_NOT_USE_OR_YOU_WILL_BE_FIRED=Ud;_e.createPortal=function(e,t){var n=2<arguments.length&&arguments[2]!==void 0?arguments[2]:null;if(!Vi(t))throw Error(w(200));return Dd(e,t,null,n)};_e.createRoot=function(e,t){if(!Vi(e))throw Error(w(299));var n=!1,r="",l=uc;return t!=null&&(t.unstable_strictMode===!0&&(n=!0),t.identifierPrefix!==void 0&&(r=t.identifierPrefix),t.onRecoverableError!==void 0&&(l=t.onRecoverableError)),t=Ui(e,1,!1,null,null,n,!1,r,l),e[tt]=t.current,Zn(e.nodeType===8?e.parentNode:e),new Ai(t)};_e.findDOMNode=function(e){if(e==null)return null;if(e.nodeType===1)return e;var t=e._reactInternals;if(t===void 0)throw typeof e.render=="function"?Error(w(188)):(e=Object.keys(e).join(","),Error(w(268,e)));return e=zs(t),e=e===null?null:e.stateNode,e};_e.flushSync=function(e){return $t(e)};_e.hydrate=function(e,t,n){if(!El(t))throw Error(w(200));return Cl(null,e,t,!0,n)};_e.hydrateRoot=function(e,t,n){if(!Vi(e))throw Error(w(405));var r=n!=null&&n.hydratedSources||null,l=!1,o="",i=uc;if(n!=null&&(n.unstable_strictMode===!0&&(l=!0),n.identifierPrefix!==void 0&&(o=n.identifierPrefix),n.onRecoverableError!==void 0&&(i=n.onRecoverableError)),t=ic(t,null,e,1,n??null,l,!1,o,i),e[tt]=t.current,Zn(e),r)for(e=0;e<r.length;e++)n=r[e],l=n._getVersion,l=l(n._source),t.mutableSourceEagerHydrationData==null?t.mutableSourceEagerHydrationData=[n,l]:t.mutableSourceEagerHydrationData.push(n,l);return new kl(t)};_e.render=function(e,t,n){if(!El(t))throw Error(w(200));return Cl(null,e,t,!1,n)};_e.unmountComponentAtNode=function(e){if(!El(e))throw Error(w(40));return e._reactRootContainer?($t(function(){Cl(null,null,e,!1,function(){e._reactRootContainer=null,e[tt]=null})}),!0):!1};_e.unstable_batchedUpdates=Oi;_e.unstable_renderSubtreeIntoContainer=function(e,t,n,r){if(!El(n))throw Error(w(200));if(e==null||e._reactInternals===void 0)throw Error(w(38));return Cl(e,t,n,!1,r)};_e.version="18.3.1-next-f1338f8080-20240426";function sc(){if(!(typeof __REACT_DEVTOOLS_GLOBAL_HOOK__>"u"||typeof __REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE!="function"))try{__REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE(sc)}catch(e){console.error(e)}}sc(),ss.exports=_e;var Ad=ss.exports,ac,Zu=Ad;ac=Zu.createRoot,Zu.hydrateRoot;function se(e,t,n){return p.jsxs("svg",{width:t,height:t,viewBox:"0 0 24 24","aria-label":n,role:"img",children:[p.jsx("title",{children:n}),e]})}const ae=({children:e})=>p.jsx("g",{fill:"none",stroke:"currentColor",strokeWidth:1.6,strokeLinecap:"round",strokeLinejoin:"round",children:e});function eo(e,t=16){const n=(e||"").toLowerCase();return n.includes("gpt")||n.includes("o4")||n.startsWith("openai")?se(p.jsxs(ae,{children:[p.jsx("path",{d:"M12 3.5 19 7v7l-7 3.5L5 14V7z"}),p.jsx("path",{d:"M12 3.5V17.5"}),p.jsx("path",{d:"M5 7l7 3.5L19 7"})]}),t,"GPT"):n.includes("claude")?se(p.jsxs(ae,{children:[p.jsx("path",{d:"M4 18L12 4l8 14"}),p.jsx("path",{d:"M7.5 12h9"})]}),t,"Claude"):n.includes("gemini")?se(p.jsxs(ae,{children:[p.jsx("circle",{cx:"8",cy:"12",r:"3.5"}),p.jsx("circle",{cx:"16",cy:"12",r:"3.5"}),p.jsx("path",{d:"M4 12h16"})]}),t,"Gemini"):n.includes("llama")?se(p.jsxs(ae,{children:[p.jsx("path",{d:"M6 17c3 1 9 1 12 0"}),p.jsx("path",{d:"M8 17V9l2-2 2 2v8"}),p.jsx("path",{d:"M10 7l1-2 1 2"})]}),t,"Llama"):n.includes("mistral")||n.includes("mixtral")?se(p.jsxs(ae,{children:[p.jsx("path",{d:"M3 9h10c2 0 2-3 0-3"}),p.jsx("path",{d:"M3 15h14c3 0 3-4 0-4"})]}),t,"Mistral"):n.includes("qwen")?se(p.jsxs(ae,{children:[p.jsx("path",{d:"M6 12a6 6 0 1 1 6 6"}),p.jsx("path",{d:"M12 18l3-3"})]}),t,"Qwen"):n.includes("deepseek")?se(p.jsxs(ae,{children:[p.jsx("path",{d:"M4 12l8-8 8 8-8 8z"}),p.jsx("path",{d:"M8 12l4-4 4 4-4 4z"})]}),t,"DeepSeek"):n.includes("phi")?se(p.jsxs(ae,{children:[p.jsx("circle",{cx:"12",cy:"12",r:"7"}),p.jsx("path",{d:"M12 5v14M8 10h8"})]}),t,"Phi"):se(p.jsx(ae,{children:p.jsx("circle",{cx:"12",cy:"12",r:"8"})}),t,"Model")}function Vd(e,t=16){const n=(e||"").toLowerCase();return n.includes("openrouter")?se(p.jsxs(ae,{children:[p.jsx("path",{d:"M5 17h14"}),p.jsx("path",{d:"M6 17V7l8 5-8 5z"}),p.jsx("path",{d:"M6 7h7"})]}),t,"OpenRouter"):n.includes("openai")?se(p.jsxs(ae,{children:[p.jsx("path",{d:"M12 6a4 4 0 1 1-4 4"}),p.jsx("path",{d:"M12 18a4 4 0 1 1 4-4"}),p.jsx("path",{d:"M6 12a4 4 0 1 1 4-4"})]}),t,"OpenAI"):n.includes("anthropic")?se(p.jsxs(ae,{children:[p.jsx("path",{d:"M4 18L12 4l8 14"}),p.jsx("path",{d:"M7.5 12h9"})]}),t,"Anthropic"):n.includes("gemini")||n.includes("google")?se(p.jsxs(ae,{children:[p.jsx("circle",{cx:"12",cy:"12",r:"7.5"}),p.jsx("path",{d:"M12 12h5"})]}),t,"Google"):n.includes("azure")?se(p.jsx(ae,{children:p.jsx("path",{d:"M5 17l7-12 7 12H5z"})}),t,"Azure"):n.includes("ollama")?se(p.jsxs(ae,{children:[p.jsx("path",{d:"M7 14a3 3 0 0 1 6 0v3H7z"}),p.jsx("path",{d:"M13 14a3 3 0 1 1 3 3"})]}),t,"Ollama"):se(p.jsx(ae,{children:p.jsx("rect",{x:"5",y:"5",width:"14",height:"14",rx:"3"})}),t,"Provider")}function Bd(e){const t=e.split(/\r?\n/),n=[];let r=0;for(;r<t.length;){const o=t[r].match(/^```\s*([\w+-]*)\s*$/);if(o){const u=o[1]||"";r++;const s=[];for(;r<t.length&&!/^```\s*$/.test(t[r]);)s.push(t[r]),r++;r<t.length&&/^```\s*$/.test(t[r])&&r++,n.push({type:"code",lang:u,code:s.join(`
-`)});continue}const i=[];for(;r<t.length&&!/^```/.test(t[r]);)i.push(t[r]),r++;i.length&&n.push({type:"text",text:i.join(`
-`)})}return n}function Hd({content:e}){const t=Bd(e);return p.jsx("div",{className:"prose prose-invert max-w-none",children:t.map((n,r)=>n.type==="text"?p.jsx("p",{className:"whitespace-pre-wrap leading-relaxed",children:n.text},r):p.jsx(Wd,{lang:n.lang,code:n.code},r))})}function Wd({lang:e,code:t}){const[n,r]=B.useState(!1),l=async()=>{try{await navigator.clipboard.writeText(t)}catch{}};return p.jsxs("div",{className:"rounded-lg border border-white/10 overflow-hidden",children:[p.jsxs("div",{className:"flex items-center justify-between px-3 py-1.5 text-xs bg-slate-800/60 border-b border-white/10",children:[p.jsx("div",{className:"uppercase tracking-wide text-slate-300",children:e||"text"}),p.jsxs("div",{className:"flex items-center gap-2",children:[p.jsx("button",{className:"px-2 py-0.5 rounded bg-white/10 hover:bg-white/15",onClick:()=>r(o=>!o),children:n?"No wrap":"Wrap"}),p.jsx("button",{className:"px-2 py-0.5 rounded bg-white/10 hover:bg-white/15",onClick:l,children:"Copy"})]})]}),p.jsx("pre",{className:`text-sm p-3 ${n?"whitespace-pre-wrap break-words":"whitespace-pre overflow-x-auto"}`,children:p.jsx("code",{children:t})})]})}function Qd(e){const t=new Date,n=new Date(t.getFullYear(),t.getMonth(),t.getDate()).getTime(),r=n-24*60*60*1e3,l=new Date(e.getFullYear(),e.getMonth(),e.getDate()).getTime();return l===n?"Today":l===r?"Yesterday":e.toLocaleDateString()}async function jt(e,t){const n=await fetch(e,t);if(!n.ok)throw new Error(`${n.status}`);return n.json()}function Kd(){const[e,t]=B.useState([]),[n,r]=B.useState(""),[l,o]=B.useState(null),[i,u]=B.useState([{role:"system",content:"You are a helpful assistant."}]),[s,c]=B.useState(""),[y,v]=B.useState("openai"),[m,x]=B.useState(""),[S,k]=B.useState([]),[I,f]=B.useState(!1),[a,d]=B.useState(!1),[g,E]=B.useState(""),_=B.useRef(null),[j,z]=B.useState(!1),U=B.useMemo(()=>e.filter(h=>(h.title||"").toLowerCase().includes(n.toLowerCase())),[e,n]),L=B.useMemo(()=>{const h=U.filter($=>$.pinned),P=U.filter($=>!$.pinned),R={Today:[],Yesterday:[],Earlier:[]},Z=new Date,W=new Date(Z.getFullYear(),Z.getMonth(),Z.getDate()).getTime(),ve=W-24*60*60*1e3;for(const $ of P){const Pe=$.updated_at?new Date($.updated_at).getTime():0;Pe>=W?R.Today.push($):Pe>=ve?R.Yesterday.push($):R.Earlier.push($)}return{pinned:h,byDay:R}},[U]);B.useEffect(()=>{(async()=>(await ne(),await Nl()))()},[]),B.useEffect(()=>{const h=_.current;if(!h)return;const P=()=>{z(h.scrollTop+h.clientHeight<h.scrollHeight-200)};return h.addEventListener("scroll",P),P(),()=>h.removeEventListener("scroll",P)},[]),B.useEffect(()=>{const h=_.current;!h||j||(h.scrollTop=h.scrollHeight)},[i,g]);async function ne(){var P;const h=await jt("/api/conversations");t(h.conversations||[]),!l&&((P=h.conversations)!=null&&P[0])&&await Be(h.conversations[0].id)}async function Be(h){o(h);const P=await jt(`/api/conversations/${encodeURIComponent(h)}`);u(P.messages||[{role:"system",content:"You are a helpful assistant."}])}async function _t(){const h=await jt("/api/conversations",{method:"POST",headers:{"Content-Type":"application/json"},body:JSON.stringify({})});o(h.id),await ne(),await Be(h.id)}async function xn(h){await jt(`/api/conversations/${encodeURIComponent(h.id)}`,{method:"PATCH",headers:{"Content-Type":"application/json"},body:JSON.stringify({pinned:!h.pinned})}),await ne()}async function Nl(){const h=await jt("/api/settings");h.provider&&v(h.provider),await Ht(h.provider||y),h.model&&x(h.model)}async function Bt(h){l&&(await jt(`/api/conversations/${encodeURIComponent(l)}`,{method:"PATCH",headers:{"Content-Type":"application/json"},body:JSON.stringify({messages:h})}),u(h),await ne())}async function Ht(h){const P=await jt(`/api/models?provider=${encodeURIComponent(h)}`);k(P.models||[])}async function C(){const h=s.trim();if(!h||!l)return;c("");const P={role:"user",content:h},R=[...i,P];u(R);const Z=window.location.protocol==="https:"?"wss":"ws",W=new WebSocket(`${Z}://${window.location.host}/ws/chat`);f(!0);let ve="";E(""),W.onopen=()=>{W.send(JSON.stringify({messages:R,provider:y,model:m,conversation_id:l,reasoning:a}))},W.onmessage=$=>{const Pe=$.data;if(Pe==="[END]"){f(!1),u(_l=>[..._l,{role:"assistant",content:ve}]),E(""),ne();return}ve+=Pe,E(ve)},W.onerror=()=>f(!1),W.onclose=()=>f(!1)}function T({m:h,idx:P}){const[R,Z]=B.useState(!1),[W,ve]=B.useState(h.content),$=h.role==="user",Pe=async()=>{try{await navigator.clipboard.writeText(h.content)}catch{}},_l=async()=>{const Ge=i.filter((ot,jl)=>jl!==P);await Bt(Ge)},cc=async()=>{const Ge=i.map((ot,jl)=>jl===P?{...ot,content:W}:ot);await Bt(Ge),Z(!1)},fc=async()=>{let Ge=null;for(let ot=P-1;ot>=0;ot--)if(i[ot].role==="user"){Ge=i[ot].content;break}Ge&&(c(Ge),await C())};return p.jsxs("div",{className:`flex gap-3 ${h.role==="user"?"justify-end":""}`,children:[h.role==="assistant"&&p.jsx("div",{className:"w-8 h-8 rounded-full bg-brand flex items-center justify-center",children:eo(m,16)}),p.jsxs("div",{className:`group rounded-2xl px-3 py-2 border relative ${h.role==="user"?"bg-slate-800/60 border-white/10":"bg-slate-900/60 border-white/10"} shadow-[inset_0_1px_0_rgba(255,255,255,0.05)]`,style:{maxWidth:"80%"},children:[p.jsxs("div",{className:"absolute -top-2 right-1 opacity-0 group-hover:opacity-100 transition text-xs flex gap-2",children:[p.jsx("button",{className:"px-2 py-0.5 bg-white/10 rounded",onClick:Pe,children:"Copy"}),h.role==="assistant"&&p.jsx("button",{className:"px-2 py-0.5 bg-white/10 rounded",onClick:fc,children:"Regenerate"}),$&&!R&&p.jsx("button",{className:"px-2 py-0.5 bg-white/10 rounded",onClick:()=>Z(!0),children:"Edit"}),p.jsx("button",{className:"px-2 py-0.5 bg-white/10 rounded",onClick:_l,children:"Delete"}),R&&p.jsxs(p.Fragment,{children:[p.jsx("button",{className:"px-2 py-0.5 bg-brand rounded",onClick:cc,children:"Save"}),p.jsx("button",{className:"px-2 py-0.5 bg-white/10 rounded",onClick:()=>{Z(!1),ve(h.content)},children:"Cancel"})]})]}),R?p.jsx("textarea",{className:"w-full bg-slate-800/60 border border-white/10 rounded p-2 text-sm",rows:Math.min(10,Math.max(3,h.content.split(`
-`).length)),value:W,onChange:Ge=>ve(Ge.target.value)}):p.jsx("div",{className:"text-slate-100 text-sm",children:h.role==="assistant"?p.jsxs(p.Fragment,{children:[h.reasoning&&p.jsx("div",{className:"mb-2 rounded-lg border border-amber-300/20 bg-amber-900/10 p-2 text-amber-200 text-xs",children:h.reasoning}),p.jsx(Hd,{content:h.content})]}):p.jsx("div",{className:"whitespace-pre-wrap",children:h.content})})]}),h.role==="user"&&p.jsx("div",{className:"w-8 h-8 rounded-full bg-brand flex items-center justify-center",children:"U"})]})}return p.jsxs("div",{className:"h-screen grid grid-cols-[300px_1fr] gap-0",children:[p.jsxs("aside",{className:"glass border-r",children:[p.jsxs("div",{className:"p-3 flex items-center gap-2",children:[p.jsx("button",{className:"btn-primary",onClick:_t,children:"New"}),p.jsx("input",{className:"ml-auto bg-slate-800/60 border border-white/10 rounded px-2 py-1 w-full",placeholder:"Search",value:n,onChange:h=>r(h.target.value)})]}),p.jsxs("div",{className:"px-3 space-y-3 overflow-y-auto h-[calc(100vh-48px)]",children:[L.pinned.length>0&&p.jsxs("div",{children:[p.jsx("div",{className:"px-2 py-1 text-xs uppercase tracking-wide text-slate-400",children:"Pinned"}),p.jsx("div",{className:"space-y-1",children:L.pinned.map(h=>p.jsxs("div",{className:`flex items-center gap-2 px-2 py-2 rounded hover:bg-white/5 cursor-pointer ${h.id===l?"bg-white/10":""}`,onClick:()=>Be(h.id),children:[p.jsxs("div",{className:"flex-1 truncate",children:[p.jsx("div",{className:"text-sm font-medium",children:h.title||"Conversation"}),p.jsx("div",{className:"text-xs text-slate-400",children:h.updated_at?new Date(h.updated_at).toLocaleString():""})]}),p.jsx("button",{className:"text-yellow-400",title:h.pinned?"Unpin":"Pin",onClick:P=>{P.stopPropagation(),xn(h)},children:h.pinned?"★":"☆"})]},h.id))})]}),["Today","Yesterday","Earlier"].map(h=>L.byDay[h].length>0&&p.jsxs("div",{children:[p.jsx("div",{className:"px-2 py-1 text-xs uppercase tracking-wide text-slate-400",children:h}),p.jsx("div",{className:"space-y-1",children:L.byDay[h].map(P=>p.jsxs("div",{className:`flex items-center gap-2 px-2 py-2 rounded hover:bg-white/5 cursor-pointer ${P.id===l?"bg-white/10":""}`,onClick:()=>Be(P.id),children:[p.jsxs("div",{className:"flex-1 truncate",children:[p.jsx("div",{className:"text-sm font-medium",children:P.title||"Conversation"}),p.jsx("div",{className:"text-xs text-slate-400",children:P.updated_at?new Date(P.updated_at).toLocaleString():""})]}),p.jsx("button",{className:"text-yellow-400",title:P.pinned?"Unpin":"Pin",onClick:R=>{R.stopPropagation(),xn(P)},children:P.pinned?"★":"☆"})]},P.id))})]},h))]})]}),p.jsxs("main",{className:"flex flex-col min-h-0",children:[p.jsxs("header",{className:"glass flex items-center justify-between px-4 py-2 border-b",children:[p.jsx("h1",{className:"font-semibold",children:"ChatUI"}),p.jsxs("div",{className:"flex items-center gap-2",children:[p.jsxs("div",{className:"flex items-center gap-1 text-sm text-slate-300",children:[Vd(y,16),p.jsx("span",{className:"hidden md:inline",children:y})]}),p.jsxs("select",{className:"bg-slate-800/60 border border-white/10 rounded px-2 py-1",value:y,onChange:h=>{v(h.target.value),Ht(h.target.value)},children:[p.jsx("option",{value:"openai",children:"OpenAI"}),p.jsx("option",{value:"openrouter",children:"OpenRouter"}),p.jsx("option",{value:"azure",children:"Azure OpenAI"}),p.jsx("option",{value:"anthropic",children:"Anthropic"}),p.jsx("option",{value:"gemini",children:"Gemini"}),p.jsx("option",{value:"ollama",children:"Ollama (local)"})]}),p.jsxs("div",{className:"flex items-center gap-1 text-sm text-slate-300",children:[eo(m,16),p.jsx("span",{className:"hidden md:inline",children:m||"model"})]}),p.jsxs("select",{className:"bg-slate-800/60 border border-white/10 rounded px-2 py-1",value:m,onChange:h=>x(h.target.value),children:[p.jsx("option",{value:"",children:"Select a model"}),S.map(h=>p.jsx("option",{value:h.id,children:h.name||h.id},h.id))]}),p.jsxs("label",{className:"text-sm flex items-center gap-1",children:[p.jsx("input",{type:"checkbox",checked:a,onChange:h=>d(h.target.checked)})," Reasoning"]})]})]}),p.jsxs("div",{ref:_,className:"flex-1 overflow-y-auto p-4",children:[i.filter(h=>h.role!=="system").length===0&&p.jsxs("div",{className:"max-w-2xl mx-auto p-4 rounded-lg border border-white/10 bg-slate-900/60",children:[p.jsx("div",{className:"mb-2 text-slate-300",children:"Try one of these"}),p.jsx("div",{className:"flex flex-wrap gap-2",children:["Summarize an article","Write Python","Explain a concept","Create a plan"].map((h,P)=>p.jsx("button",{className:"px-3 py-1 rounded border border-white/10 hover:bg-white/5",onClick:()=>c(h),children:h},P))})]}),p.jsxs("div",{className:"max-w-3xl mx-auto space-y-3",children:[(()=>{const h=[];let P=null;return i.filter(Z=>Z.role!=="system").forEach((Z,W)=>{if(Z.created_at){const ve=new Date(Z.created_at),$=Qd(ve);$!==P&&(P=$,h.push(p.jsx("div",{className:"sticky top-2 z-10",children:p.jsx("div",{className:"mx-auto w-fit px-3 py-1 text-xs text-slate-300 border border-white/10 rounded-full bg-slate-900/70 backdrop-blur",children:$})},`sep-${W}`)))}h.push(p.jsx(T,{m:Z,idx:W},W))}),h})(),g&&p.jsxs("div",{className:"flex gap-3",children:[p.jsx("div",{className:"w-8 h-8 rounded-full bg-brand flex items-center justify-center",children:eo(m,16)}),p.jsx("div",{className:"rounded-2xl px-3 py-2 border bg-slate-900/60 border-white/10",style:{maxWidth:"80%"},children:p.jsx("div",{className:"whitespace-pre-wrap text-slate-100 text-sm",children:g})})]}),I&&!g&&p.jsxs("div",{className:"flex items-center gap-2 text-slate-300 text-sm",children:[p.jsx("span",{className:"w-2 h-2 bg-slate-500 rounded-full animate-pulse"}),"Generating…"]})]})]}),j&&p.jsx("button",{className:"fixed right-6 bottom-24 px-3 py-1.5 rounded-full bg-brand text-white shadow hover:bg-brand-dark",onClick:()=>{const h=_.current;h&&(h.scrollTop=h.scrollHeight)},children:"Jump to latest"}),p.jsxs("form",{className:"glass border-t p-3 flex items-center gap-2",onSubmit:h=>{h.preventDefault(),C()},children:[p.jsx("div",{className:"flex-1",children:p.jsx("textarea",{className:"w-full bg-slate-800/60 border border-white/10 rounded-full px-4 py-2 h-11 resize-none",placeholder:"Ask something...",value:s,onChange:h=>c(h.target.value),onKeyDown:h=>{h.key==="Enter"&&!h.shiftKey&&(h.preventDefault(),C())}})}),p.jsx("button",{className:"btn-primary rounded-full h-11 px-5",disabled:!s.trim()||I,type:"submit",children:"Send"})]})]})]})}const Yd=document.getElementById("root");ac(Yd).render(p.jsx(Pc.StrictMode,{children:p.jsx(Kd,{})}));
@@ -1,45 +0,0 @@
-(function(){const t=document.createElement("link").relList;if(t&&t.supports&&t.supports("modulepreload"))return;for(const l of document.querySelectorAll('link[rel="modulepreload"]'))r(l);new MutationObserver(l=>{for(const i of l)if(i.type==="childList")for(const o of i.addedNodes)o.tagName==="LINK"&&o.rel==="modulepreload"&&r(o)}).observe(document,{childList:!0,subtree:!0});function n(l){const i={};return l.integrity&&(i.integrity=l.integrity),l.referrerPolicy&&(i.referrerPolicy=l.referrerPolicy),l.crossOrigin==="use-credentials"?i.credentials="include":l.crossOrigin==="anonymous"?i.credentials="omit":i.credentials="same-origin",i}function r(l){if(l.ep)return;l.ep=!0;const i=n(l);fetch(l.href,i)}})();function Ec(e){return e&&e.__esModule&&Object.prototype.hasOwnProperty.call(e,"default")?e.default:e}var is={exports:{}},vl={},os={exports:{}},R={};/**
- * @license React
- * react.production.min.js
- *
- * Copyright (c) Facebook, Inc. and its affiliates.
- *
- * This source code is licensed under the MIT license found in the
- * LICENSE file in the root directory of this source tree.
- */var fr=Symbol.for("react.element"),Nc=Symbol.for("react.portal"),_c=Symbol.for("react.fragment"),jc=Symbol.for("react.strict_mode"),Pc=Symbol.for("react.profiler"),zc=Symbol.for("react.provider"),Lc=Symbol.for("react.context"),Tc=Symbol.for("react.forward_ref"),Mc=Symbol.for("react.suspense"),Rc=Symbol.for("react.memo"),Dc=Symbol.for("react.lazy"),Go=Symbol.iterator;function Oc(e){return e===null||typeof e!="object"?null:(e=Go&&e[Go]||e["@@iterator"],typeof e=="function"?e:null)}var us={isMounted:function(){return!1},enqueueForceUpdate:function(){},enqueueReplaceState:function(){},enqueueSetState:function(){}},ss=Object.assign,as={};function En(e,t,n){this.props=e,this.context=t,this.refs=as,this.updater=n||us}En.prototype.isReactComponent={};En.prototype.setState=function(e,t){if(typeof e!="object"&&typeof e!="function"&&e!=null)throw Error("setState(...): takes an object of state variables to update or a function which returns an object of state variables.");this.updater.enqueueSetState(this,e,t,"setState")};En.prototype.forceUpdate=function(e){this.updater.enqueueForceUpdate(this,e,"forceUpdate")};function cs(){}cs.prototype=En.prototype;function bi(e,t,n){this.props=e,this.context=t,this.refs=as,this.updater=n||us}var eo=bi.prototype=new cs;eo.constructor=bi;ss(eo,En.prototype);eo.isPureReactComponent=!0;var Xo=Array.isArray,fs=Object.prototype.hasOwnProperty,to={current:null},ds={key:!0,ref:!0,__self:!0,__source:!0};function ps(e,t,n){var r,l={},i=null,o=null;if(t!=null)for(r in t.ref!==void 0&&(o=t.ref),t.key!==void 0&&(i=""+t.key),t)fs.call(t,r)&&!ds.hasOwnProperty(r)&&(l[r]=t[r]);var u=arguments.length-2;if(u===1)l.children=n;else if(1<u){for(var s=Array(u),c=0;c<u;c++)s[c]=arguments[c+2];l.children=s}if(e&&e.defaultProps)for(r in u=e.defaultProps,u)l[r]===void 0&&(l[r]=u[r]);return{$$typeof:fr,type:e,key:i,ref:o,props:l,_owner:to.current}}function Ic(e,t){return{$$typeof:fr,type:e.type,key:t,ref:e.ref,props:e.props,_owner:e._owner}}function no(e){return typeof e=="object"&&e!==null&&e.$$typeof===fr}function Fc(e){var t={"=":"=0",":":"=2"};return"$"+e.replace(/[=:]/g,function(n){return t[n]})}var Zo=/\/+/g;function Dl(e,t){return typeof e=="object"&&e!==null&&e.key!=null?Fc(""+e.key):t.toString(36)}function Dr(e,t,n,r,l){var i=typeof e;(i==="undefined"||i==="boolean")&&(e=null);var o=!1;if(e===null)o=!0;else switch(i){case"string":case"number":o=!0;break;case"object":switch(e.$$typeof){case fr:case Nc:o=!0}}if(o)return o=e,l=l(o),e=r===""?"."+Dl(o,0):r,Xo(l)?(n="",e!=null&&(n=e.replace(Zo,"$&/")+"/"),Dr(l,t,n,"",function(c){return c})):l!=null&&(no(l)&&(l=Ic(l,n+(!l.key||o&&o.key===l.key?"":(""+l.key).replace(Zo,"$&/")+"/")+e)),t.push(l)),1;if(o=0,r=r===""?".":r+":",Xo(e))for(var u=0;u<e.length;u++){i=e[u];var s=r+Dl(i,u);o+=Dr(i,t,n,s,l)}else if(s=Oc(e),typeof s=="function")for(e=s.call(e),u=0;!(i=e.next()).done;)i=i.value,s=r+Dl(i,u++),o+=Dr(i,t,n,s,l);else if(i==="object")throw t=String(e),Error("Objects are not valid as a React child (found: "+(t==="[object Object]"?"object with keys {"+Object.keys(e).join(", ")+"}":t)+"). If you meant to render a collection of children, use an array instead.");return o}function gr(e,t,n){if(e==null)return e;var r=[],l=0;return Dr(e,r,"","",function(i){return t.call(n,i,l++)}),r}function Uc(e){if(e._status===-1){var t=e._result;t=t(),t.then(function(n){(e._status===0||e._status===-1)&&(e._status=1,e._result=n)},function(n){(e._status===0||e._status===-1)&&(e._status=2,e._result=n)}),e._status===-1&&(e._status=0,e._result=t)}if(e._status===1)return e._result.default;throw e._result}var me={current:null},Or={transition:null},$c={ReactCurrentDispatcher:me,ReactCurrentBatchConfig:Or,ReactCurrentOwner:to};function hs(){throw Error("act(...) is not supported in production builds of React.")}R.Children={map:gr,forEach:function(e,t,n){gr(e,function(){t.apply(this,arguments)},n)},count:function(e){var t=0;return gr(e,function(){t++}),t},toArray:function(e){return gr(e,function(t){return t})||[]},only:function(e){if(!no(e))throw Error("React.Children.only expected to receive a single React element child.");return e}};R.Component=En;R.Fragment=_c;R.Profiler=Pc;R.PureComponent=bi;R.StrictMode=jc;R.Suspense=Mc;R.__SECRET_INTERNALS_DO_NOT_USE_OR_YOU_WILL_BE_FIRED=$c;R.act=hs;R.cloneElement=function(e,t,n){if(e==null)throw Error("React.cloneElement(...): The argument must be a React element, but you passed "+e+".");var r=ss({},e.props),l=e.key,i=e.ref,o=e._owner;if(t!=null){if(t.ref!==void 0&&(i=t.ref,o=to.current),t.key!==void 0&&(l=""+t.key),e.type&&e.type.defaultProps)var u=e.type.defaultProps;for(s in t)fs.call(t,s)&&!ds.hasOwnProperty(s)&&(r[s]=t[s]===void 0&&u!==void 0?u[s]:t[s])}var s=arguments.length-2;if(s===1)r.children=n;else if(1<s){u=Array(s);for(var c=0;c<s;c++)u[c]=arguments[c+2];r.children=u}return{$$typeof:fr,type:e.type,key:l,ref:i,props:r,_owner:o}};R.createContext=function(e){return e={$$typeof:Lc,_currentValue:e,_currentValue2:e,_threadCount:0,Provider:null,Consumer:null,_defaultValue:null,_globalName:null},e.Provider={$$typeof:zc,_context:e},e.Consumer=e};R.createElement=ps;R.createFactory=function(e){var t=ps.bind(null,e);return t.type=e,t};R.createRef=function(){return{current:null}};R.forwardRef=function(e){return{$$typeof:Tc,render:e}};R.isValidElement=no;R.lazy=function(e){return{$$typeof:Dc,_payload:{_status:-1,_result:e},_init:Uc}};R.memo=function(e,t){return{$$typeof:Rc,type:e,compare:t===void 0?null:t}};R.startTransition=function(e){var t=Or.transition;Or.transition={};try{e()}finally{Or.transition=t}};R.unstable_act=hs;R.useCallback=function(e,t){return me.current.useCallback(e,t)};R.useContext=function(e){return me.current.useContext(e)};R.useDebugValue=function(){};R.useDeferredValue=function(e){return me.current.useDeferredValue(e)};R.useEffect=function(e,t){return me.current.useEffect(e,t)};R.useId=function(){return me.current.useId()};R.useImperativeHandle=function(e,t,n){return me.current.useImperativeHandle(e,t,n)};R.useInsertionEffect=function(e,t){return me.current.useInsertionEffect(e,t)};R.useLayoutEffect=function(e,t){return me.current.useLayoutEffect(e,t)};R.useMemo=function(e,t){return me.current.useMemo(e,t)};R.useReducer=function(e,t,n){return me.current.useReducer(e,t,n)};R.useRef=function(e){return me.current.useRef(e)};R.useState=function(e){return me.current.useState(e)};R.useSyncExternalStore=function(e,t,n){return me.current.useSyncExternalStore(e,t,n)};R.useTransition=function(){return me.current.useTransition()};R.version="18.3.1";os.exports=R;var O=os.exports;const Ac=Ec(O);/**
- * @license React
- * react-jsx-runtime.production.min.js
- *
- * Copyright (c) Facebook, Inc. and its affiliates.
- *
- * This source code is licensed under the MIT license found in the
- * LICENSE file in the root directory of this source tree.
- */var Bc=O,Vc=Symbol.for("react.element"),Wc=Symbol.for("react.fragment"),Hc=Object.prototype.hasOwnProperty,Qc=Bc.__SECRET_INTERNALS_DO_NOT_USE_OR_YOU_WILL_BE_FIRED.ReactCurrentOwner,Kc={key:!0,ref:!0,__self:!0,__source:!0};function ms(e,t,n){var r,l={},i=null,o=null;n!==void 0&&(i=""+n),t.key!==void 0&&(i=""+t.key),t.ref!==void 0&&(o=t.ref);for(r in t)Hc.call(t,r)&&!Kc.hasOwnProperty(r)&&(l[r]=t[r]);if(e&&e.defaultProps)for(r in t=e.defaultProps,t)l[r]===void 0&&(l[r]=t[r]);return{$$typeof:Vc,type:e,key:i,ref:o,props:l,_owner:Qc.current}}vl.Fragment=Wc;vl.jsx=ms;vl.jsxs=ms;is.exports=vl;var d=is.exports,vs={exports:{}},_e={},gs={exports:{}},ys={};/**
- * @license React
- * scheduler.production.min.js
- *
- * Copyright (c) Facebook, Inc. and its affiliates.
- *
- * This source code is licensed under the MIT license found in the
- * LICENSE file in the root directory of this source tree.
- */(function(e){function t(E,z){var T=E.length;E.push(z);e:for(;0<T;){var B=T-1>>>1,X=E[B];if(0<l(X,z))E[B]=z,E[T]=X,T=B;else break e}}function n(E){return E.length===0?null:E[0]}function r(E){if(E.length===0)return null;var z=E[0],T=E.pop();if(T!==z){E[0]=T;e:for(var B=0,X=E.length,at=X>>>1;B<at;){var Xe=2*(B+1)-1,v=E[Xe],L=Xe+1,V=E[L];if(0>l(v,T))L<X&&0>l(V,v)?(E[B]=V,E[L]=T,B=L):(E[B]=v,E[Xe]=T,B=Xe);else if(L<X&&0>l(V,T))E[B]=V,E[L]=T,B=L;else break e}}return z}function l(E,z){var T=E.sortIndex-z.sortIndex;return T!==0?T:E.id-z.id}if(typeof performance=="object"&&typeof performance.now=="function"){var i=performance;e.unstable_now=function(){return i.now()}}else{var o=Date,u=o.now();e.unstable_now=function(){return o.now()-u}}var s=[],c=[],g=1,m=null,h=3,x=!1,S=!1,k=!1,F=typeof setTimeout=="function"?setTimeout:null,f=typeof clearTimeout=="function"?clearTimeout:null,a=typeof setImmediate<"u"?setImmediate:null;typeof navigator<"u"&&navigator.scheduling!==void 0&&navigator.scheduling.isInputPending!==void 0&&navigator.scheduling.isInputPending.bind(navigator.scheduling);function p(E){for(var z=n(c);z!==null;){if(z.callback===null)r(c);else if(z.startTime<=E)r(c),z.sortIndex=z.expirationTime,t(s,z);else break;z=n(c)}}function y(E){if(k=!1,p(E),!S)if(n(s)!==null)S=!0,Be(C);else{var z=n(c);z!==null&&st(y,z.startTime-E)}}function C(E,z){S=!1,k&&(k=!1,f(P),P=-1),x=!0;var T=h;try{for(p(z),m=n(s);m!==null&&(!(m.expirationTime>z)||E&&!fe());){var B=m.callback;if(typeof B=="function"){m.callback=null,h=m.priorityLevel;var X=B(m.expirationTime<=z);z=e.unstable_now(),typeof X=="function"?m.callback=X:m===n(s)&&r(s),p(z)}else r(s);m=n(s)}if(m!==null)var at=!0;else{var Xe=n(c);Xe!==null&&st(y,Xe.startTime-z),at=!1}return at}finally{m=null,h=T,x=!1}}var _=!1,j=null,P=-1,H=5,M=-1;function fe(){return!(e.unstable_now()-M<H)}function Dt(){if(j!==null){var E=e.unstable_now();M=E;var z=!0;try{z=j(!0,E)}finally{z?Ge():(_=!1,j=null)}}else _=!1}var Ge;if(typeof a=="function")Ge=function(){a(Dt)};else if(typeof MessageChannel<"u"){var Zt=new MessageChannel,vr=Zt.port2;Zt.port1.onmessage=Dt,Ge=function(){vr.postMessage(null)}}else Ge=function(){F(Dt,0)};function Be(E){j=E,_||(_=!0,Ge())}function st(E,z){P=F(function(){E(e.unstable_now())},z)}e.unstable_IdlePriority=5,e.unstable_ImmediatePriority=1,e.unstable_LowPriority=4,e.unstable_NormalPriority=3,e.unstable_Profiling=null,e.unstable_UserBlockingPriority=2,e.unstable_cancelCallback=function(E){E.callback=null},e.unstable_continueExecution=function(){S||x||(S=!0,Be(C))},e.unstable_forceFrameRate=function(E){0>E||125<E?console.error("forceFrameRate takes a positive int between 0 and 125, forcing frame rates higher than 125 fps is not supported"):H=0<E?Math.floor(1e3/E):5},e.unstable_getCurrentPriorityLevel=function(){return h},e.unstable_getFirstCallbackNode=function(){return n(s)},e.unstable_next=function(E){switch(h){case 1:case 2:case 3:var z=3;break;default:z=h}var T=h;h=z;try{return E()}finally{h=T}},e.unstable_pauseExecution=function(){},e.unstable_requestPaint=function(){},e.unstable_runWithPriority=function(E,z){switch(E){case 1:case 2:case 3:case 4:case 5:break;default:E=3}var T=h;h=E;try{return z()}finally{h=T}},e.unstable_scheduleCallback=function(E,z,T){var B=e.unstable_now();switch(typeof T=="object"&&T!==null?(T=T.delay,T=typeof T=="number"&&0<T?B+T:B):T=B,E){case 1:var X=-1;break;case 2:X=250;break;case 5:X=1073741823;break;case 4:X=1e4;break;default:X=5e3}return X=T+X,E={id:g++,callback:z,priorityLevel:E,startTime:T,expirationTime:X,sortIndex:-1},T>B?(E.sortIndex=T,t(c,E),n(s)===null&&E===n(c)&&(k?(f(P),P=-1):k=!0,st(y,T-B))):(E.sortIndex=X,t(s,E),S||x||(S=!0,Be(C))),E},e.unstable_shouldYield=fe,e.unstable_wrapCallback=function(E){var z=h;return function(){var T=h;h=z;try{return E.apply(this,arguments)}finally{h=T}}}})(ys);gs.exports=ys;var Yc=gs.exports;/**
- * @license React
- * react-dom.production.min.js
- *
- * Copyright (c) Facebook, Inc. and its affiliates.
- *
- * This source code is licensed under the MIT license found in the
- * LICENSE file in the root directory of this source tree.
- */var Gc=O,Ne=Yc;function w(e){for(var t="https://reactjs.org/docs/error-decoder.html?invariant="+e,n=1;n<arguments.length;n++)t+="&args[]="+encodeURIComponent(arguments[n]);return"Minified React error #"+e+"; visit "+t+" for the full message or use the non-minified dev environment for full errors and additional helpful warnings."}var ws=new Set,Gn={};function Gt(e,t){gn(e,t),gn(e+"Capture",t)}function gn(e,t){for(Gn[e]=t,e=0;e<t.length;e++)ws.add(t[e])}var rt=!(typeof window>"u"||typeof window.document>"u"||typeof window.document.createElement>"u"),oi=Object.prototype.hasOwnProperty,Xc=/^[:A-Z_a-z\u00C0-\u00D6\u00D8-\u00F6\u00F8-\u02FF\u0370-\u037D\u037F-\u1FFF\u200C-\u200D\u2070-\u218F\u2C00-\u2FEF\u3001-\uD7FF\uF900-\uFDCF\uFDF0-\uFFFD][:A-Z_a-z\u00C0-\u00D6\u00D8-\u00F6\u00F8-\u02FF\u0370-\u037D\u037F-\u1FFF\u200C-\u200D\u2070-\u218F\u2C00-\u2FEF\u3001-\uD7FF\uF900-\uFDCF\uFDF0-\uFFFD\-.0-9\u00B7\u0300-\u036F\u203F-\u2040]*$/,Jo={},qo={};function Zc(e){return oi.call(qo,e)?!0:oi.call(Jo,e)?!1:Xc.test(e)?qo[e]=!0:(Jo[e]=!0,!1)}function Jc(e,t,n,r){if(n!==null&&n.type===0)return!1;switch(typeof t){case"function":case"symbol":return!0;case"boolean":return r?!1:n!==null?!n.acceptsBooleans:(e=e.toLowerCase().slice(0,5),e!=="data-"&&e!=="aria-");default:return!1}}function qc(e,t,n,r){if(t===null||typeof t>"u"||Jc(e,t,n,r))return!0;if(r)return!1;if(n!==null)switch(n.type){case 3:return!t;case 4:return t===!1;case 5:return isNaN(t);case 6:return isNaN(t)||1>t}return!1}function ve(e,t,n,r,l,i,o){this.acceptsBooleans=t===2||t===3||t===4,this.attributeName=r,this.attributeNamespace=l,this.mustUseProperty=n,this.propertyName=e,this.type=t,this.sanitizeURL=i,this.removeEmptyString=o}var oe={};"children dangerouslySetInnerHTML defaultValue defaultChecked innerHTML suppressContentEditableWarning suppressHydrationWarning style".split(" ").forEach(function(e){oe[e]=new ve(e,0,!1,e,null,!1,!1)});[["acceptCharset","accept-charset"],["className","class"],["htmlFor","for"],["httpEquiv","http-equiv"]].forEach(function(e){var t=e[0];oe[t]=new ve(t,1,!1,e[1],null,!1,!1)});["contentEditable","draggable","spellCheck","value"].forEach(function(e){oe[e]=new ve(e,2,!1,e.toLowerCase(),null,!1,!1)});["autoReverse","externalResourcesRequired","focusable","preserveAlpha"].forEach(function(e){oe[e]=new ve(e,2,!1,e,null,!1,!1)});"allowFullScreen async autoFocus autoPlay controls default defer disabled disablePictureInPicture disableRemotePlayback formNoValidate hidden loop noModule noValidate open playsInline readOnly required reversed scoped seamless itemScope".split(" ").forEach(function(e){oe[e]=new ve(e,3,!1,e.toLowerCase(),null,!1,!1)});["checked","multiple","muted","selected"].forEach(function(e){oe[e]=new ve(e,3,!0,e,null,!1,!1)});["capture","download"].forEach(function(e){oe[e]=new ve(e,4,!1,e,null,!1,!1)});["cols","rows","size","span"].forEach(function(e){oe[e]=new ve(e,6,!1,e,null,!1,!1)});["rowSpan","start"].forEach(function(e){oe[e]=new ve(e,5,!1,e.toLowerCase(),null,!1,!1)});var ro=/[\-:]([a-z])/g;function lo(e){return e[1].toUpperCase()}"accent-height alignment-baseline arabic-form baseline-shift cap-height clip-path clip-rule color-interpolation color-interpolation-filters color-profile color-rendering dominant-baseline enable-background fill-opacity fill-rule flood-color flood-opacity font-family font-size font-size-adjust font-stretch font-style font-variant font-weight glyph-name glyph-orientation-horizontal glyph-orientation-vertical horiz-adv-x horiz-origin-x image-rendering letter-spacing lighting-color marker-end marker-mid marker-start overline-position overline-thickness paint-order panose-1 pointer-events rendering-intent shape-rendering stop-color stop-opacity strikethrough-position strikethrough-thickness stroke-dasharray stroke-dashoffset stroke-linecap stroke-linejoin stroke-miterlimit stroke-opacity stroke-width text-anchor text-decoration text-rendering underline-position underline-thickness unicode-bidi unicode-range units-per-em v-alphabetic v-hanging v-ideographic v-mathematical vector-effect vert-adv-y vert-origin-x vert-origin-y word-spacing writing-mode xmlns:xlink x-height".split(" ").forEach(function(e){var t=e.replace(ro,lo);oe[t]=new ve(t,1,!1,e,null,!1,!1)});"xlink:actuate xlink:arcrole xlink:role xlink:show xlink:title xlink:type".split(" ").forEach(function(e){var t=e.replace(ro,lo);oe[t]=new ve(t,1,!1,e,"http://www.w3.org/1999/xlink",!1,!1)});["xml:base","xml:lang","xml:space"].forEach(function(e){var t=e.replace(ro,lo);oe[t]=new ve(t,1,!1,e,"http://www.w3.org/XML/1998/namespace",!1,!1)});["tabIndex","crossOrigin"].forEach(function(e){oe[e]=new ve(e,1,!1,e.toLowerCase(),null,!1,!1)});oe.xlinkHref=new ve("xlinkHref",1,!1,"xlink:href","http://www.w3.org/1999/xlink",!0,!1);["src","href","action","formAction"].forEach(function(e){oe[e]=new ve(e,1,!1,e.toLowerCase(),null,!0,!0)});function io(e,t,n,r){var l=oe.hasOwnProperty(t)?oe[t]:null;(l!==null?l.type!==0:r||!(2<t.length)||t[0]!=="o"&&t[0]!=="O"||t[1]!=="n"&&t[1]!=="N")&&(qc(t,n,l,r)&&(n=null),r||l===null?Zc(t)&&(n===null?e.removeAttribute(t):e.setAttribute(t,""+n)):l.mustUseProperty?e[l.propertyName]=n===null?l.type===3?!1:"":n:(t=l.attributeName,r=l.attributeNamespace,n===null?e.removeAttribute(t):(l=l.type,n=l===3||l===4&&n===!0?"":""+n,r?e.setAttributeNS(r,t,n):e.setAttribute(t,n))))}var ut=Gc.__SECRET_INTERNALS_DO_NOT_USE_OR_YOU_WILL_BE_FIRED,yr=Symbol.for("react.element"),qt=Symbol.for("react.portal"),bt=Symbol.for("react.fragment"),oo=Symbol.for("react.strict_mode"),ui=Symbol.for("react.profiler"),xs=Symbol.for("react.provider"),Ss=Symbol.for("react.context"),uo=Symbol.for("react.forward_ref"),si=Symbol.for("react.suspense"),ai=Symbol.for("react.suspense_list"),so=Symbol.for("react.memo"),pt=Symbol.for("react.lazy"),ks=Symbol.for("react.offscreen"),bo=Symbol.iterator;function jn(e){return e===null||typeof e!="object"?null:(e=bo&&e[bo]||e["@@iterator"],typeof e=="function"?e:null)}var Y=Object.assign,Ol;function On(e){if(Ol===void 0)try{throw Error()}catch(n){var t=n.stack.trim().match(/\n( *(at )?)/);Ol=t&&t[1]||""}return`
-`+Ol+e}var Il=!1;function Fl(e,t){if(!e||Il)return"";Il=!0;var n=Error.prepareStackTrace;Error.prepareStackTrace=void 0;try{if(t)if(t=function(){throw Error()},Object.defineProperty(t.prototype,"props",{set:function(){throw Error()}}),typeof Reflect=="object"&&Reflect.construct){try{Reflect.construct(t,[])}catch(c){var r=c}Reflect.construct(e,[],t)}else{try{t.call()}catch(c){r=c}e.call(t.prototype)}else{try{throw Error()}catch(c){r=c}e()}}catch(c){if(c&&r&&typeof c.stack=="string"){for(var l=c.stack.split(`
-`),i=r.stack.split(`
-`),o=l.length-1,u=i.length-1;1<=o&&0<=u&&l[o]!==i[u];)u--;for(;1<=o&&0<=u;o--,u--)if(l[o]!==i[u]){if(o!==1||u!==1)do if(o--,u--,0>u||l[o]!==i[u]){var s=`
-`+l[o].replace(" at new "," at ");return e.displayName&&s.includes("<anonymous>")&&(s=s.replace("<anonymous>",e.displayName)),s}while(1<=o&&0<=u);break}}}finally{Il=!1,Error.prepareStackTrace=n}return(e=e?e.displayName||e.name:"")?On(e):""}function bc(e){switch(e.tag){case 5:return On(e.type);case 16:return On("Lazy");case 13:return On("Suspense");case 19:return On("SuspenseList");case 0:case 2:case 15:return e=Fl(e.type,!1),e;case 11:return e=Fl(e.type.render,!1),e;case 1:return e=Fl(e.type,!0),e;default:return""}}function ci(e){if(e==null)return null;if(typeof e=="function")return e.displayName||e.name||null;if(typeof e=="string")return e;switch(e){case bt:return"Fragment";case qt:return"Portal";case ui:return"Profiler";case oo:return"StrictMode";case si:return"Suspense";case ai:return"SuspenseList"}if(typeof e=="object")switch(e.$$typeof){case Ss:return(e.displayName||"Context")+".Consumer";case xs:return(e._context.displayName||"Context")+".Provider";case uo:var t=e.render;return e=e.displayName,e||(e=t.displayName||t.name||"",e=e!==""?"ForwardRef("+e+")":"ForwardRef"),e;case so:return t=e.displayName||null,t!==null?t:ci(e.type)||"Memo";case pt:t=e._payload,e=e._init;try{return ci(e(t))}catch{}}return null}function ef(e){var t=e.type;switch(e.tag){case 24:return"Cache";case 9:return(t.displayName||"Context")+".Consumer";case 10:return(t._context.displayName||"Context")+".Provider";case 18:return"DehydratedFragment";case 11:return e=t.render,e=e.displayName||e.name||"",t.displayName||(e!==""?"ForwardRef("+e+")":"ForwardRef");case 7:return"Fragment";case 5:return t;case 4:return"Portal";case 3:return"Root";case 6:return"Text";case 16:return ci(t);case 8:return t===oo?"StrictMode":"Mode";case 22:return"Offscreen";case 12:return"Profiler";case 21:return"Scope";case 13:return"Suspense";case 19:return"SuspenseList";case 25:return"TracingMarker";case 1:case 0:case 17:case 2:case 14:case 15:if(typeof t=="function")return t.displayName||t.name||null;if(typeof t=="string")return t}return null}function zt(e){switch(typeof e){case"boolean":case"number":case"string":case"undefined":return e;case"object":return e;default:return""}}function Cs(e){var t=e.type;return(e=e.nodeName)&&e.toLowerCase()==="input"&&(t==="checkbox"||t==="radio")}function tf(e){var t=Cs(e)?"checked":"value",n=Object.getOwnPropertyDescriptor(e.constructor.prototype,t),r=""+e[t];if(!e.hasOwnProperty(t)&&typeof n<"u"&&typeof n.get=="function"&&typeof n.set=="function"){var l=n.get,i=n.set;return Object.defineProperty(e,t,{configurable:!0,get:function(){return l.call(this)},set:function(o){r=""+o,i.call(this,o)}}),Object.defineProperty(e,t,{enumerable:n.enumerable}),{getValue:function(){return r},setValue:function(o){r=""+o},stopTracking:function(){e._valueTracker=null,delete e[t]}}}}function wr(e){e._valueTracker||(e._valueTracker=tf(e))}function Es(e){if(!e)return!1;var t=e._valueTracker;if(!t)return!0;var n=t.getValue(),r="";return e&&(r=Cs(e)?e.checked?"true":"false":e.value),e=r,e!==n?(t.setValue(e),!0):!1}function Kr(e){if(e=e||(typeof document<"u"?document:void 0),typeof e>"u")return null;try{return e.activeElement||e.body}catch{return e.body}}function fi(e,t){var n=t.checked;return Y({},t,{defaultChecked:void 0,defaultValue:void 0,value:void 0,checked:n??e._wrapperState.initialChecked})}function eu(e,t){var n=t.defaultValue==null?"":t.defaultValue,r=t.checked!=null?t.checked:t.defaultChecked;n=zt(t.value!=null?t.value:n),e._wrapperState={initialChecked:r,initialValue:n,controlled:t.type==="checkbox"||t.type==="radio"?t.checked!=null:t.value!=null}}function Ns(e,t){t=t.checked,t!=null&&io(e,"checked",t,!1)}function di(e,t){Ns(e,t);var n=zt(t.value),r=t.type;if(n!=null)r==="number"?(n===0&&e.value===""||e.value!=n)&&(e.value=""+n):e.value!==""+n&&(e.value=""+n);else if(r==="submit"||r==="reset"){e.removeAttribute("value");return}t.hasOwnProperty("value")?pi(e,t.type,n):t.hasOwnProperty("defaultValue")&&pi(e,t.type,zt(t.defaultValue)),t.checked==null&&t.defaultChecked!=null&&(e.defaultChecked=!!t.defaultChecked)}function tu(e,t,n){if(t.hasOwnProperty("value")||t.hasOwnProperty("defaultValue")){var r=t.type;if(!(r!=="submit"&&r!=="reset"||t.value!==void 0&&t.value!==null))return;t=""+e._wrapperState.initialValue,n||t===e.value||(e.value=t),e.defaultValue=t}n=e.name,n!==""&&(e.name=""),e.defaultChecked=!!e._wrapperState.initialChecked,n!==""&&(e.name=n)}function pi(e,t,n){(t!=="number"||Kr(e.ownerDocument)!==e)&&(n==null?e.defaultValue=""+e._wrapperState.initialValue:e.defaultValue!==""+n&&(e.defaultValue=""+n))}var In=Array.isArray;function fn(e,t,n,r){if(e=e.options,t){t={};for(var l=0;l<n.length;l++)t["$"+n[l]]=!0;for(n=0;n<e.length;n++)l=t.hasOwnProperty("$"+e[n].value),e[n].selected!==l&&(e[n].selected=l),l&&r&&(e[n].defaultSelected=!0)}else{for(n=""+zt(n),t=null,l=0;l<e.length;l++){if(e[l].value===n){e[l].selected=!0,r&&(e[l].defaultSelected=!0);return}t!==null||e[l].disabled||(t=e[l])}t!==null&&(t.selected=!0)}}function hi(e,t){if(t.dangerouslySetInnerHTML!=null)throw Error(w(91));return Y({},t,{value:void 0,defaultValue:void 0,children:""+e._wrapperState.initialValue})}function nu(e,t){var n=t.value;if(n==null){if(n=t.children,t=t.defaultValue,n!=null){if(t!=null)throw Error(w(92));if(In(n)){if(1<n.length)throw Error(w(93));n=n[0]}t=n}t==null&&(t=""),n=t}e._wrapperState={initialValue:zt(n)}}function _s(e,t){var n=zt(t.value),r=zt(t.defaultValue);n!=null&&(n=""+n,n!==e.value&&(e.value=n),t.defaultValue==null&&e.defaultValue!==n&&(e.defaultValue=n)),r!=null&&(e.defaultValue=""+r)}function ru(e){var t=e.textContent;t===e._wrapperState.initialValue&&t!==""&&t!==null&&(e.value=t)}function js(e){switch(e){case"svg":return"http://www.w3.org/2000/svg";case"math":return"http://www.w3.org/1998/Math/MathML";default:return"http://www.w3.org/1999/xhtml"}}function mi(e,t){return e==null||e==="http://www.w3.org/1999/xhtml"?js(t):e==="http://www.w3.org/2000/svg"&&t==="foreignObject"?"http://www.w3.org/1999/xhtml":e}var xr,Ps=function(e){return typeof MSApp<"u"&&MSApp.execUnsafeLocalFunction?function(t,n,r,l){MSApp.execUnsafeLocalFunction(function(){return e(t,n,r,l)})}:e}(function(e,t){if(e.namespaceURI!=="http://www.w3.org/2000/svg"||"innerHTML"in e)e.innerHTML=t;else{for(xr=xr||document.createElement("div"),xr.innerHTML="<svg>"+t.valueOf().toString()+"</svg>",t=xr.firstChild;e.firstChild;)e.removeChild(e.firstChild);for(;t.firstChild;)e.appendChild(t.firstChild)}});function Xn(e,t){if(t){var n=e.firstChild;if(n&&n===e.lastChild&&n.nodeType===3){n.nodeValue=t;return}}e.textContent=t}var $n={animationIterationCount:!0,aspectRatio:!0,borderImageOutset:!0,borderImageSlice:!0,borderImageWidth:!0,boxFlex:!0,boxFlexGroup:!0,boxOrdinalGroup:!0,columnCount:!0,columns:!0,flex:!0,flexGrow:!0,flexPositive:!0,flexShrink:!0,flexNegative:!0,flexOrder:!0,gridArea:!0,gridRow:!0,gridRowEnd:!0,gridRowSpan:!0,gridRowStart:!0,gridColumn:!0,gridColumnEnd:!0,gridColumnSpan:!0,gridColumnStart:!0,fontWeight:!0,lineClamp:!0,lineHeight:!0,opacity:!0,order:!0,orphans:!0,tabSize:!0,widows:!0,zIndex:!0,zoom:!0,fillOpacity:!0,floodOpacity:!0,stopOpacity:!0,strokeDasharray:!0,strokeDashoffset:!0,strokeMiterlimit:!0,strokeOpacity:!0,strokeWidth:!0},nf=["Webkit","ms","Moz","O"];Object.keys($n).forEach(function(e){nf.forEach(function(t){t=t+e.charAt(0).toUpperCase()+e.substring(1),$n[t]=$n[e]})});function zs(e,t,n){return t==null||typeof t=="boolean"||t===""?"":n||typeof t!="number"||t===0||$n.hasOwnProperty(e)&&$n[e]?(""+t).trim():t+"px"}function Ls(e,t){e=e.style;for(var n in t)if(t.hasOwnProperty(n)){var r=n.indexOf("--")===0,l=zs(n,t[n],r);n==="float"&&(n="cssFloat"),r?e.setProperty(n,l):e[n]=l}}var rf=Y({menuitem:!0},{area:!0,base:!0,br:!0,col:!0,embed:!0,hr:!0,img:!0,input:!0,keygen:!0,link:!0,meta:!0,param:!0,source:!0,track:!0,wbr:!0});function vi(e,t){if(t){if(rf[e]&&(t.children!=null||t.dangerouslySetInnerHTML!=null))throw Error(w(137,e));if(t.dangerouslySetInnerHTML!=null){if(t.children!=null)throw Error(w(60));if(typeof t.dangerouslySetInnerHTML!="object"||!("__html"in t.dangerouslySetInnerHTML))throw Error(w(61))}if(t.style!=null&&typeof t.style!="object")throw Error(w(62))}}function gi(e,t){if(e.indexOf("-")===-1)return typeof t.is=="string";switch(e){case"annotation-xml":case"color-profile":case"font-face":case"font-face-src":case"font-face-uri":case"font-face-format":case"font-face-name":case"missing-glyph":return!1;default:return!0}}var yi=null;function ao(e){return e=e.target||e.srcElement||window,e.correspondingUseElement&&(e=e.correspondingUseElement),e.nodeType===3?e.parentNode:e}var wi=null,dn=null,pn=null;function lu(e){if(e=hr(e)){if(typeof wi!="function")throw Error(w(280));var t=e.stateNode;t&&(t=Sl(t),wi(e.stateNode,e.type,t))}}function Ts(e){dn?pn?pn.push(e):pn=[e]:dn=e}function Ms(){if(dn){var e=dn,t=pn;if(pn=dn=null,lu(e),t)for(e=0;e<t.length;e++)lu(t[e])}}function Rs(e,t){return e(t)}function Ds(){}var Ul=!1;function Os(e,t,n){if(Ul)return e(t,n);Ul=!0;try{return Rs(e,t,n)}finally{Ul=!1,(dn!==null||pn!==null)&&(Ds(),Ms())}}function Zn(e,t){var n=e.stateNode;if(n===null)return null;var r=Sl(n);if(r===null)return null;n=r[t];e:switch(t){case"onClick":case"onClickCapture":case"onDoubleClick":case"onDoubleClickCapture":case"onMouseDown":case"onMouseDownCapture":case"onMouseMove":case"onMouseMoveCapture":case"onMouseUp":case"onMouseUpCapture":case"onMouseEnter":(r=!r.disabled)||(e=e.type,r=!(e==="button"||e==="input"||e==="select"||e==="textarea")),e=!r;break e;default:e=!1}if(e)return null;if(n&&typeof n!="function")throw Error(w(231,t,typeof n));return n}var xi=!1;if(rt)try{var Pn={};Object.defineProperty(Pn,"passive",{get:function(){xi=!0}}),window.addEventListener("test",Pn,Pn),window.removeEventListener("test",Pn,Pn)}catch{xi=!1}function lf(e,t,n,r,l,i,o,u,s){var c=Array.prototype.slice.call(arguments,3);try{t.apply(n,c)}catch(g){this.onError(g)}}var An=!1,Yr=null,Gr=!1,Si=null,of={onError:function(e){An=!0,Yr=e}};function uf(e,t,n,r,l,i,o,u,s){An=!1,Yr=null,lf.apply(of,arguments)}function sf(e,t,n,r,l,i,o,u,s){if(uf.apply(this,arguments),An){if(An){var c=Yr;An=!1,Yr=null}else throw Error(w(198));Gr||(Gr=!0,Si=c)}}function Xt(e){var t=e,n=e;if(e.alternate)for(;t.return;)t=t.return;else{e=t;do t=e,t.flags&4098&&(n=t.return),e=t.return;while(e)}return t.tag===3?n:null}function Is(e){if(e.tag===13){var t=e.memoizedState;if(t===null&&(e=e.alternate,e!==null&&(t=e.memoizedState)),t!==null)return t.dehydrated}return null}function iu(e){if(Xt(e)!==e)throw Error(w(188))}function af(e){var t=e.alternate;if(!t){if(t=Xt(e),t===null)throw Error(w(188));return t!==e?null:e}for(var n=e,r=t;;){var l=n.return;if(l===null)break;var i=l.alternate;if(i===null){if(r=l.return,r!==null){n=r;continue}break}if(l.child===i.child){for(i=l.child;i;){if(i===n)return iu(l),e;if(i===r)return iu(l),t;i=i.sibling}throw Error(w(188))}if(n.return!==r.return)n=l,r=i;else{for(var o=!1,u=l.child;u;){if(u===n){o=!0,n=l,r=i;break}if(u===r){o=!0,r=l,n=i;break}u=u.sibling}if(!o){for(u=i.child;u;){if(u===n){o=!0,n=i,r=l;break}if(u===r){o=!0,r=i,n=l;break}u=u.sibling}if(!o)throw Error(w(189))}}if(n.alternate!==r)throw Error(w(190))}if(n.tag!==3)throw Error(w(188));return n.stateNode.current===n?e:t}function Fs(e){return e=af(e),e!==null?Us(e):null}function Us(e){if(e.tag===5||e.tag===6)return e;for(e=e.child;e!==null;){var t=Us(e);if(t!==null)return t;e=e.sibling}return null}var $s=Ne.unstable_scheduleCallback,ou=Ne.unstable_cancelCallback,cf=Ne.unstable_shouldYield,ff=Ne.unstable_requestPaint,Z=Ne.unstable_now,df=Ne.unstable_getCurrentPriorityLevel,co=Ne.unstable_ImmediatePriority,As=Ne.unstable_UserBlockingPriority,Xr=Ne.unstable_NormalPriority,pf=Ne.unstable_LowPriority,Bs=Ne.unstable_IdlePriority,gl=null,Ke=null;function hf(e){if(Ke&&typeof Ke.onCommitFiberRoot=="function")try{Ke.onCommitFiberRoot(gl,e,void 0,(e.current.flags&128)===128)}catch{}}var Ue=Math.clz32?Math.clz32:gf,mf=Math.log,vf=Math.LN2;function gf(e){return e>>>=0,e===0?32:31-(mf(e)/vf|0)|0}var Sr=64,kr=4194304;function Fn(e){switch(e&-e){case 1:return 1;case 2:return 2;case 4:return 4;case 8:return 8;case 16:return 16;case 32:return 32;case 64:case 128:case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:return e&4194240;case 4194304:case 8388608:case 16777216:case 33554432:case 67108864:return e&130023424;case 134217728:return 134217728;case 268435456:return 268435456;case 536870912:return 536870912;case 1073741824:return 1073741824;default:return e}}function Zr(e,t){var n=e.pendingLanes;if(n===0)return 0;var r=0,l=e.suspendedLanes,i=e.pingedLanes,o=n&268435455;if(o!==0){var u=o&~l;u!==0?r=Fn(u):(i&=o,i!==0&&(r=Fn(i)))}else o=n&~l,o!==0?r=Fn(o):i!==0&&(r=Fn(i));if(r===0)return 0;if(t!==0&&t!==r&&!(t&l)&&(l=r&-r,i=t&-t,l>=i||l===16&&(i&4194240)!==0))return t;if(r&4&&(r|=n&16),t=e.entangledLanes,t!==0)for(e=e.entanglements,t&=r;0<t;)n=31-Ue(t),l=1<<n,r|=e[n],t&=~l;return r}function yf(e,t){switch(e){case 1:case 2:case 4:return t+250;case 8:case 16:case 32:case 64:case 128:case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:return t+5e3;case 4194304:case 8388608:case 16777216:case 33554432:case 67108864:return-1;case 134217728:case 268435456:case 536870912:case 1073741824:return-1;default:return-1}}function wf(e,t){for(var n=e.suspendedLanes,r=e.pingedLanes,l=e.expirationTimes,i=e.pendingLanes;0<i;){var o=31-Ue(i),u=1<<o,s=l[o];s===-1?(!(u&n)||u&r)&&(l[o]=yf(u,t)):s<=t&&(e.expiredLanes|=u),i&=~u}}function ki(e){return e=e.pendingLanes&-1073741825,e!==0?e:e&1073741824?1073741824:0}function Vs(){var e=Sr;return Sr<<=1,!(Sr&4194240)&&(Sr=64),e}function $l(e){for(var t=[],n=0;31>n;n++)t.push(e);return t}function dr(e,t,n){e.pendingLanes|=t,t!==536870912&&(e.suspendedLanes=0,e.pingedLanes=0),e=e.eventTimes,t=31-Ue(t),e[t]=n}function xf(e,t){var n=e.pendingLanes&~t;e.pendingLanes=t,e.suspendedLanes=0,e.pingedLanes=0,e.expiredLanes&=t,e.mutableReadLanes&=t,e.entangledLanes&=t,t=e.entanglements;var r=e.eventTimes;for(e=e.expirationTimes;0<n;){var l=31-Ue(n),i=1<<l;t[l]=0,r[l]=-1,e[l]=-1,n&=~i}}function fo(e,t){var n=e.entangledLanes|=t;for(e=e.entanglements;n;){var r=31-Ue(n),l=1<<r;l&t|e[r]&t&&(e[r]|=t),n&=~l}}var I=0;function Ws(e){return e&=-e,1<e?4<e?e&268435455?16:536870912:4:1}var Hs,po,Qs,Ks,Ys,Ci=!1,Cr=[],St=null,kt=null,Ct=null,Jn=new Map,qn=new Map,gt=[],Sf="mousedown mouseup touchcancel touchend touchstart auxclick dblclick pointercancel pointerdown pointerup dragend dragstart drop compositionend compositionstart keydown keypress keyup input textInput copy cut paste click change contextmenu reset submit".split(" ");function uu(e,t){switch(e){case"focusin":case"focusout":St=null;break;case"dragenter":case"dragleave":kt=null;break;case"mouseover":case"mouseout":Ct=null;break;case"pointerover":case"pointerout":Jn.delete(t.pointerId);break;case"gotpointercapture":case"lostpointercapture":qn.delete(t.pointerId)}}function zn(e,t,n,r,l,i){return e===null||e.nativeEvent!==i?(e={blockedOn:t,domEventName:n,eventSystemFlags:r,nativeEvent:i,targetContainers:[l]},t!==null&&(t=hr(t),t!==null&&po(t)),e):(e.eventSystemFlags|=r,t=e.targetContainers,l!==null&&t.indexOf(l)===-1&&t.push(l),e)}function kf(e,t,n,r,l){switch(t){case"focusin":return St=zn(St,e,t,n,r,l),!0;case"dragenter":return kt=zn(kt,e,t,n,r,l),!0;case"mouseover":return Ct=zn(Ct,e,t,n,r,l),!0;case"pointerover":var i=l.pointerId;return Jn.set(i,zn(Jn.get(i)||null,e,t,n,r,l)),!0;case"gotpointercapture":return i=l.pointerId,qn.set(i,zn(qn.get(i)||null,e,t,n,r,l)),!0}return!1}function Gs(e){var t=Ut(e.target);if(t!==null){var n=Xt(t);if(n!==null){if(t=n.tag,t===13){if(t=Is(n),t!==null){e.blockedOn=t,Ys(e.priority,function(){Qs(n)});return}}else if(t===3&&n.stateNode.current.memoizedState.isDehydrated){e.blockedOn=n.tag===3?n.stateNode.containerInfo:null;return}}}e.blockedOn=null}function Ir(e){if(e.blockedOn!==null)return!1;for(var t=e.targetContainers;0<t.length;){var n=Ei(e.domEventName,e.eventSystemFlags,t[0],e.nativeEvent);if(n===null){n=e.nativeEvent;var r=new n.constructor(n.type,n);yi=r,n.target.dispatchEvent(r),yi=null}else return t=hr(n),t!==null&&po(t),e.blockedOn=n,!1;t.shift()}return!0}function su(e,t,n){Ir(e)&&n.delete(t)}function Cf(){Ci=!1,St!==null&&Ir(St)&&(St=null),kt!==null&&Ir(kt)&&(kt=null),Ct!==null&&Ir(Ct)&&(Ct=null),Jn.forEach(su),qn.forEach(su)}function Ln(e,t){e.blockedOn===t&&(e.blockedOn=null,Ci||(Ci=!0,Ne.unstable_scheduleCallback(Ne.unstable_NormalPriority,Cf)))}function bn(e){function t(l){return Ln(l,e)}if(0<Cr.length){Ln(Cr[0],e);for(var n=1;n<Cr.length;n++){var r=Cr[n];r.blockedOn===e&&(r.blockedOn=null)}}for(St!==null&&Ln(St,e),kt!==null&&Ln(kt,e),Ct!==null&&Ln(Ct,e),Jn.forEach(t),qn.forEach(t),n=0;n<gt.length;n++)r=gt[n],r.blockedOn===e&&(r.blockedOn=null);for(;0<gt.length&&(n=gt[0],n.blockedOn===null);)Gs(n),n.blockedOn===null&&gt.shift()}var hn=ut.ReactCurrentBatchConfig,Jr=!0;function Ef(e,t,n,r){var l=I,i=hn.transition;hn.transition=null;try{I=1,ho(e,t,n,r)}finally{I=l,hn.transition=i}}function Nf(e,t,n,r){var l=I,i=hn.transition;hn.transition=null;try{I=4,ho(e,t,n,r)}finally{I=l,hn.transition=i}}function ho(e,t,n,r){if(Jr){var l=Ei(e,t,n,r);if(l===null)Xl(e,t,r,qr,n),uu(e,r);else if(kf(l,e,t,n,r))r.stopPropagation();else if(uu(e,r),t&4&&-1<Sf.indexOf(e)){for(;l!==null;){var i=hr(l);if(i!==null&&Hs(i),i=Ei(e,t,n,r),i===null&&Xl(e,t,r,qr,n),i===l)break;l=i}l!==null&&r.stopPropagation()}else Xl(e,t,r,null,n)}}var qr=null;function Ei(e,t,n,r){if(qr=null,e=ao(r),e=Ut(e),e!==null)if(t=Xt(e),t===null)e=null;else if(n=t.tag,n===13){if(e=Is(t),e!==null)return e;e=null}else if(n===3){if(t.stateNode.current.memoizedState.isDehydrated)return t.tag===3?t.stateNode.containerInfo:null;e=null}else t!==e&&(e=null);return qr=e,null}function Xs(e){switch(e){case"cancel":case"click":case"close":case"contextmenu":case"copy":case"cut":case"auxclick":case"dblclick":case"dragend":case"dragstart":case"drop":case"focusin":case"focusout":case"input":case"invalid":case"keydown":case"keypress":case"keyup":case"mousedown":case"mouseup":case"paste":case"pause":case"play":case"pointercancel":case"pointerdown":case"pointerup":case"ratechange":case"reset":case"resize":case"seeked":case"submit":case"touchcancel":case"touchend":case"touchstart":case"volumechange":case"change":case"selectionchange":case"textInput":case"compositionstart":case"compositionend":case"compositionupdate":case"beforeblur":case"afterblur":case"beforeinput":case"blur":case"fullscreenchange":case"focus":case"hashchange":case"popstate":case"select":case"selectstart":return 1;case"drag":case"dragenter":case"dragexit":case"dragleave":case"dragover":case"mousemove":case"mouseout":case"mouseover":case"pointermove":case"pointerout":case"pointerover":case"scroll":case"toggle":case"touchmove":case"wheel":case"mouseenter":case"mouseleave":case"pointerenter":case"pointerleave":return 4;case"message":switch(df()){case co:return 1;case As:return 4;case Xr:case pf:return 16;case Bs:return 536870912;default:return 16}default:return 16}}var wt=null,mo=null,Fr=null;function Zs(){if(Fr)return Fr;var e,t=mo,n=t.length,r,l="value"in wt?wt.value:wt.textContent,i=l.length;for(e=0;e<n&&t[e]===l[e];e++);var o=n-e;for(r=1;r<=o&&t[n-r]===l[i-r];r++);return Fr=l.slice(e,1<r?1-r:void 0)}function Ur(e){var t=e.keyCode;return"charCode"in e?(e=e.charCode,e===0&&t===13&&(e=13)):e=t,e===10&&(e=13),32<=e||e===13?e:0}function Er(){return!0}function au(){return!1}function je(e){function t(n,r,l,i,o){this._reactName=n,this._targetInst=l,this.type=r,this.nativeEvent=i,this.target=o,this.currentTarget=null;for(var u in e)e.hasOwnProperty(u)&&(n=e[u],this[u]=n?n(i):i[u]);return this.isDefaultPrevented=(i.defaultPrevented!=null?i.defaultPrevented:i.returnValue===!1)?Er:au,this.isPropagationStopped=au,this}return Y(t.prototype,{preventDefault:function(){this.defaultPrevented=!0;var n=this.nativeEvent;n&&(n.preventDefault?n.preventDefault():typeof n.returnValue!="unknown"&&(n.returnValue=!1),this.isDefaultPrevented=Er)},stopPropagation:function(){var n=this.nativeEvent;n&&(n.stopPropagation?n.stopPropagation():typeof n.cancelBubble!="unknown"&&(n.cancelBubble=!0),this.isPropagationStopped=Er)},persist:function(){},isPersistent:Er}),t}var Nn={eventPhase:0,bubbles:0,cancelable:0,timeStamp:function(e){return e.timeStamp||Date.now()},defaultPrevented:0,isTrusted:0},vo=je(Nn),pr=Y({},Nn,{view:0,detail:0}),_f=je(pr),Al,Bl,Tn,yl=Y({},pr,{screenX:0,screenY:0,clientX:0,clientY:0,pageX:0,pageY:0,ctrlKey:0,shiftKey:0,altKey:0,metaKey:0,getModifierState:go,button:0,buttons:0,relatedTarget:function(e){return e.relatedTarget===void 0?e.fromElement===e.srcElement?e.toElement:e.fromElement:e.relatedTarget},movementX:function(e){return"movementX"in e?e.movementX:(e!==Tn&&(Tn&&e.type==="mousemove"?(Al=e.screenX-Tn.screenX,Bl=e.screenY-Tn.screenY):Bl=Al=0,Tn=e),Al)},movementY:function(e){return"movementY"in e?e.movementY:Bl}}),cu=je(yl),jf=Y({},yl,{dataTransfer:0}),Pf=je(jf),zf=Y({},pr,{relatedTarget:0}),Vl=je(zf),Lf=Y({},Nn,{animationName:0,elapsedTime:0,pseudoElement:0}),Tf=je(Lf),Mf=Y({},Nn,{clipboardData:function(e){return"clipboardData"in e?e.clipboardData:window.clipboardData}}),Rf=je(Mf),Df=Y({},Nn,{data:0}),fu=je(Df),Of={Esc:"Escape",Spacebar:" ",Left:"ArrowLeft",Up:"ArrowUp",Right:"ArrowRight",Down:"ArrowDown",Del:"Delete",Win:"OS",Menu:"ContextMenu",Apps:"ContextMenu",Scroll:"ScrollLock",MozPrintableKey:"Unidentified"},If={8:"Backspace",9:"Tab",12:"Clear",13:"Enter",16:"Shift",17:"Control",18:"Alt",19:"Pause",20:"CapsLock",27:"Escape",32:" ",33:"PageUp",34:"PageDown",35:"End",36:"Home",37:"ArrowLeft",38:"ArrowUp",39:"ArrowRight",40:"ArrowDown",45:"Insert",46:"Delete",112:"F1",113:"F2",114:"F3",115:"F4",116:"F5",117:"F6",118:"F7",119:"F8",120:"F9",121:"F10",122:"F11",123:"F12",144:"NumLock",145:"ScrollLock",224:"Meta"},Ff={Alt:"altKey",Control:"ctrlKey",Meta:"metaKey",Shift:"shiftKey"};function Uf(e){var t=this.nativeEvent;return t.getModifierState?t.getModifierState(e):(e=Ff[e])?!!t[e]:!1}function go(){return Uf}var $f=Y({},pr,{key:function(e){if(e.key){var t=Of[e.key]||e.key;if(t!=="Unidentified")return t}return e.type==="keypress"?(e=Ur(e),e===13?"Enter":String.fromCharCode(e)):e.type==="keydown"||e.type==="keyup"?If[e.keyCode]||"Unidentified":""},code:0,location:0,ctrlKey:0,shiftKey:0,altKey:0,metaKey:0,repeat:0,locale:0,getModifierState:go,charCode:function(e){return e.type==="keypress"?Ur(e):0},keyCode:function(e){return e.type==="keydown"||e.type==="keyup"?e.keyCode:0},which:function(e){return e.type==="keypress"?Ur(e):e.type==="keydown"||e.type==="keyup"?e.keyCode:0}}),Af=je($f),Bf=Y({},yl,{pointerId:0,width:0,height:0,pressure:0,tangentialPressure:0,tiltX:0,tiltY:0,twist:0,pointerType:0,isPrimary:0}),du=je(Bf),Vf=Y({},pr,{touches:0,targetTouches:0,changedTouches:0,altKey:0,metaKey:0,ctrlKey:0,shiftKey:0,getModifierState:go}),Wf=je(Vf),Hf=Y({},Nn,{propertyName:0,elapsedTime:0,pseudoElement:0}),Qf=je(Hf),Kf=Y({},yl,{deltaX:function(e){return"deltaX"in e?e.deltaX:"wheelDeltaX"in e?-e.wheelDeltaX:0},deltaY:function(e){return"deltaY"in e?e.deltaY:"wheelDeltaY"in e?-e.wheelDeltaY:"wheelDelta"in e?-e.wheelDelta:0},deltaZ:0,deltaMode:0}),Yf=je(Kf),Gf=[9,13,27,32],yo=rt&&"CompositionEvent"in window,Bn=null;rt&&"documentMode"in document&&(Bn=document.documentMode);var Xf=rt&&"TextEvent"in window&&!Bn,Js=rt&&(!yo||Bn&&8<Bn&&11>=Bn),pu=" ",hu=!1;function qs(e,t){switch(e){case"keyup":return Gf.indexOf(t.keyCode)!==-1;case"keydown":return t.keyCode!==229;case"keypress":case"mousedown":case"focusout":return!0;default:return!1}}function bs(e){return e=e.detail,typeof e=="object"&&"data"in e?e.data:null}var en=!1;function Zf(e,t){switch(e){case"compositionend":return bs(t);case"keypress":return t.which!==32?null:(hu=!0,pu);case"textInput":return e=t.data,e===pu&&hu?null:e;default:return null}}function Jf(e,t){if(en)return e==="compositionend"||!yo&&qs(e,t)?(e=Zs(),Fr=mo=wt=null,en=!1,e):null;switch(e){case"paste":return null;case"keypress":if(!(t.ctrlKey||t.altKey||t.metaKey)||t.ctrlKey&&t.altKey){if(t.char&&1<t.char.length)return t.char;if(t.which)return String.fromCharCode(t.which)}return null;case"compositionend":return Js&&t.locale!=="ko"?null:t.data;default:return null}}var qf={color:!0,date:!0,datetime:!0,"datetime-local":!0,email:!0,month:!0,number:!0,password:!0,range:!0,search:!0,tel:!0,text:!0,time:!0,url:!0,week:!0};function mu(e){var t=e&&e.nodeName&&e.nodeName.toLowerCase();return t==="input"?!!qf[e.type]:t==="textarea"}function ea(e,t,n,r){Ts(r),t=br(t,"onChange"),0<t.length&&(n=new vo("onChange","change",null,n,r),e.push({event:n,listeners:t}))}var Vn=null,er=null;function bf(e){fa(e,0)}function wl(e){var t=rn(e);if(Es(t))return e}function ed(e,t){if(e==="change")return t}var ta=!1;if(rt){var Wl;if(rt){var Hl="oninput"in document;if(!Hl){var vu=document.createElement("div");vu.setAttribute("oninput","return;"),Hl=typeof vu.oninput=="function"}Wl=Hl}else Wl=!1;ta=Wl&&(!document.documentMode||9<document.documentMode)}function gu(){Vn&&(Vn.detachEvent("onpropertychange",na),er=Vn=null)}function na(e){if(e.propertyName==="value"&&wl(er)){var t=[];ea(t,er,e,ao(e)),Os(bf,t)}}function td(e,t,n){e==="focusin"?(gu(),Vn=t,er=n,Vn.attachEvent("onpropertychange",na)):e==="focusout"&&gu()}function nd(e){if(e==="selectionchange"||e==="keyup"||e==="keydown")return wl(er)}function rd(e,t){if(e==="click")return wl(t)}function ld(e,t){if(e==="input"||e==="change")return wl(t)}function id(e,t){return e===t&&(e!==0||1/e===1/t)||e!==e&&t!==t}var Ae=typeof Object.is=="function"?Object.is:id;function tr(e,t){if(Ae(e,t))return!0;if(typeof e!="object"||e===null||typeof t!="object"||t===null)return!1;var n=Object.keys(e),r=Object.keys(t);if(n.length!==r.length)return!1;for(r=0;r<n.length;r++){var l=n[r];if(!oi.call(t,l)||!Ae(e[l],t[l]))return!1}return!0}function yu(e){for(;e&&e.firstChild;)e=e.firstChild;return e}function wu(e,t){var n=yu(e);e=0;for(var r;n;){if(n.nodeType===3){if(r=e+n.textContent.length,e<=t&&r>=t)return{node:n,offset:t-e};e=r}e:{for(;n;){if(n.nextSibling){n=n.nextSibling;break e}n=n.parentNode}n=void 0}n=yu(n)}}function ra(e,t){return e&&t?e===t?!0:e&&e.nodeType===3?!1:t&&t.nodeType===3?ra(e,t.parentNode):"contains"in e?e.contains(t):e.compareDocumentPosition?!!(e.compareDocumentPosition(t)&16):!1:!1}function la(){for(var e=window,t=Kr();t instanceof e.HTMLIFrameElement;){try{var n=typeof t.contentWindow.location.href=="string"}catch{n=!1}if(n)e=t.contentWindow;else break;t=Kr(e.document)}return t}function wo(e){var t=e&&e.nodeName&&e.nodeName.toLowerCase();return t&&(t==="input"&&(e.type==="text"||e.type==="search"||e.type==="tel"||e.type==="url"||e.type==="password")||t==="textarea"||e.contentEditable==="true")}function od(e){var t=la(),n=e.focusedElem,r=e.selectionRange;if(t!==n&&n&&n.ownerDocument&&ra(n.ownerDocument.documentElement,n)){if(r!==null&&wo(n)){if(t=r.start,e=r.end,e===void 0&&(e=t),"selectionStart"in n)n.selectionStart=t,n.selectionEnd=Math.min(e,n.value.length);else if(e=(t=n.ownerDocument||document)&&t.defaultView||window,e.getSelection){e=e.getSelection();var l=n.textContent.length,i=Math.min(r.start,l);r=r.end===void 0?i:Math.min(r.end,l),!e.extend&&i>r&&(l=r,r=i,i=l),l=wu(n,i);var o=wu(n,r);l&&o&&(e.rangeCount!==1||e.anchorNode!==l.node||e.anchorOffset!==l.offset||e.focusNode!==o.node||e.focusOffset!==o.offset)&&(t=t.createRange(),t.setStart(l.node,l.offset),e.removeAllRanges(),i>r?(e.addRange(t),e.extend(o.node,o.offset)):(t.setEnd(o.node,o.offset),e.addRange(t)))}}for(t=[],e=n;e=e.parentNode;)e.nodeType===1&&t.push({element:e,left:e.scrollLeft,top:e.scrollTop});for(typeof n.focus=="function"&&n.focus(),n=0;n<t.length;n++)e=t[n],e.element.scrollLeft=e.left,e.element.scrollTop=e.top}}var ud=rt&&"documentMode"in document&&11>=document.documentMode,tn=null,Ni=null,Wn=null,_i=!1;function xu(e,t,n){var r=n.window===n?n.document:n.nodeType===9?n:n.ownerDocument;_i||tn==null||tn!==Kr(r)||(r=tn,"selectionStart"in r&&wo(r)?r={start:r.selectionStart,end:r.selectionEnd}:(r=(r.ownerDocument&&r.ownerDocument.defaultView||window).getSelection(),r={anchorNode:r.anchorNode,anchorOffset:r.anchorOffset,focusNode:r.focusNode,focusOffset:r.focusOffset}),Wn&&tr(Wn,r)||(Wn=r,r=br(Ni,"onSelect"),0<r.length&&(t=new vo("onSelect","select",null,t,n),e.push({event:t,listeners:r}),t.target=tn)))}function Nr(e,t){var n={};return n[e.toLowerCase()]=t.toLowerCase(),n["Webkit"+e]="webkit"+t,n["Moz"+e]="moz"+t,n}var nn={animationend:Nr("Animation","AnimationEnd"),animationiteration:Nr("Animation","AnimationIteration"),animationstart:Nr("Animation","AnimationStart"),transitionend:Nr("Transition","TransitionEnd")},Ql={},ia={};rt&&(ia=document.createElement("div").style,"AnimationEvent"in window||(delete nn.animationend.animation,delete nn.animationiteration.animation,delete nn.animationstart.animation),"TransitionEvent"in window||delete nn.transitionend.transition);function xl(e){if(Ql[e])return Ql[e];if(!nn[e])return e;var t=nn[e],n;for(n in t)if(t.hasOwnProperty(n)&&n in ia)return Ql[e]=t[n];return e}var oa=xl("animationend"),ua=xl("animationiteration"),sa=xl("animationstart"),aa=xl("transitionend"),ca=new Map,Su="abort auxClick cancel canPlay canPlayThrough click close contextMenu copy cut drag dragEnd dragEnter dragExit dragLeave dragOver dragStart drop durationChange emptied encrypted ended error gotPointerCapture input invalid keyDown keyPress keyUp load loadedData loadedMetadata loadStart lostPointerCapture mouseDown mouseMove mouseOut mouseOver mouseUp paste pause play playing pointerCancel pointerDown pointerMove pointerOut pointerOver pointerUp progress rateChange reset resize seeked seeking stalled submit suspend timeUpdate touchCancel touchEnd touchStart volumeChange scroll toggle touchMove waiting wheel".split(" ");function Tt(e,t){ca.set(e,t),Gt(t,[e])}for(var Kl=0;Kl<Su.length;Kl++){var Yl=Su[Kl],sd=Yl.toLowerCase(),ad=Yl[0].toUpperCase()+Yl.slice(1);Tt(sd,"on"+ad)}Tt(oa,"onAnimationEnd");Tt(ua,"onAnimationIteration");Tt(sa,"onAnimationStart");Tt("dblclick","onDoubleClick");Tt("focusin","onFocus");Tt("focusout","onBlur");Tt(aa,"onTransitionEnd");gn("onMouseEnter",["mouseout","mouseover"]);gn("onMouseLeave",["mouseout","mouseover"]);gn("onPointerEnter",["pointerout","pointerover"]);gn("onPointerLeave",["pointerout","pointerover"]);Gt("onChange","change click focusin focusout input keydown keyup selectionchange".split(" "));Gt("onSelect","focusout contextmenu dragend focusin keydown keyup mousedown mouseup selectionchange".split(" "));Gt("onBeforeInput",["compositionend","keypress","textInput","paste"]);Gt("onCompositionEnd","compositionend focusout keydown keypress keyup mousedown".split(" "));Gt("onCompositionStart","compositionstart focusout keydown keypress keyup mousedown".split(" "));Gt("onCompositionUpdate","compositionupdate focusout keydown keypress keyup mousedown".split(" "));var Un="abort canplay canplaythrough durationchange emptied encrypted ended error loadeddata loadedmetadata loadstart pause play playing progress ratechange resize seeked seeking stalled suspend timeupdate volumechange waiting".split(" "),cd=new Set("cancel close invalid load scroll toggle".split(" ").concat(Un));function ku(e,t,n){var r=e.type||"unknown-event";e.currentTarget=n,sf(r,t,void 0,e),e.currentTarget=null}function fa(e,t){t=(t&4)!==0;for(var n=0;n<e.length;n++){var r=e[n],l=r.event;r=r.listeners;e:{var i=void 0;if(t)for(var o=r.length-1;0<=o;o--){var u=r[o],s=u.instance,c=u.currentTarget;if(u=u.listener,s!==i&&l.isPropagationStopped())break e;ku(l,u,c),i=s}else for(o=0;o<r.length;o++){if(u=r[o],s=u.instance,c=u.currentTarget,u=u.listener,s!==i&&l.isPropagationStopped())break e;ku(l,u,c),i=s}}}if(Gr)throw e=Si,Gr=!1,Si=null,e}function $(e,t){var n=t[Ti];n===void 0&&(n=t[Ti]=new Set);var r=e+"__bubble";n.has(r)||(da(t,e,2,!1),n.add(r))}function Gl(e,t,n){var r=0;t&&(r|=4),da(n,e,r,t)}var _r="_reactListening"+Math.random().toString(36).slice(2);function nr(e){if(!e[_r]){e[_r]=!0,ws.forEach(function(n){n!=="selectionchange"&&(cd.has(n)||Gl(n,!1,e),Gl(n,!0,e))});var t=e.nodeType===9?e:e.ownerDocument;t===null||t[_r]||(t[_r]=!0,Gl("selectionchange",!1,t))}}function da(e,t,n,r){switch(Xs(t)){case 1:var l=Ef;break;case 4:l=Nf;break;default:l=ho}n=l.bind(null,t,n,e),l=void 0,!xi||t!=="touchstart"&&t!=="touchmove"&&t!=="wheel"||(l=!0),r?l!==void 0?e.addEventListener(t,n,{capture:!0,passive:l}):e.addEventListener(t,n,!0):l!==void 0?e.addEventListener(t,n,{passive:l}):e.addEventListener(t,n,!1)}function Xl(e,t,n,r,l){var i=r;if(!(t&1)&&!(t&2)&&r!==null)e:for(;;){if(r===null)return;var o=r.tag;if(o===3||o===4){var u=r.stateNode.containerInfo;if(u===l||u.nodeType===8&&u.parentNode===l)break;if(o===4)for(o=r.return;o!==null;){var s=o.tag;if((s===3||s===4)&&(s=o.stateNode.containerInfo,s===l||s.nodeType===8&&s.parentNode===l))return;o=o.return}for(;u!==null;){if(o=Ut(u),o===null)return;if(s=o.tag,s===5||s===6){r=i=o;continue e}u=u.parentNode}}r=r.return}Os(function(){var c=i,g=ao(n),m=[];e:{var h=ca.get(e);if(h!==void 0){var x=vo,S=e;switch(e){case"keypress":if(Ur(n)===0)break e;case"keydown":case"keyup":x=Af;break;case"focusin":S="focus",x=Vl;break;case"focusout":S="blur",x=Vl;break;case"beforeblur":case"afterblur":x=Vl;break;case"click":if(n.button===2)break e;case"auxclick":case"dblclick":case"mousedown":case"mousemove":case"mouseup":case"mouseout":case"mouseover":case"contextmenu":x=cu;break;case"drag":case"dragend":case"dragenter":case"dragexit":case"dragleave":case"dragover":case"dragstart":case"drop":x=Pf;break;case"touchcancel":case"touchend":case"touchmove":case"touchstart":x=Wf;break;case oa:case ua:case sa:x=Tf;break;case aa:x=Qf;break;case"scroll":x=_f;break;case"wheel":x=Yf;break;case"copy":case"cut":case"paste":x=Rf;break;case"gotpointercapture":case"lostpointercapture":case"pointercancel":case"pointerdown":case"pointermove":case"pointerout":case"pointerover":case"pointerup":x=du}var k=(t&4)!==0,F=!k&&e==="scroll",f=k?h!==null?h+"Capture":null:h;k=[];for(var a=c,p;a!==null;){p=a;var y=p.stateNode;if(p.tag===5&&y!==null&&(p=y,f!==null&&(y=Zn(a,f),y!=null&&k.push(rr(a,y,p)))),F)break;a=a.return}0<k.length&&(h=new x(h,S,null,n,g),m.push({event:h,listeners:k}))}}if(!(t&7)){e:{if(h=e==="mouseover"||e==="pointerover",x=e==="mouseout"||e==="pointerout",h&&n!==yi&&(S=n.relatedTarget||n.fromElement)&&(Ut(S)||S[lt]))break e;if((x||h)&&(h=g.window===g?g:(h=g.ownerDocument)?h.defaultView||h.parentWindow:window,x?(S=n.relatedTarget||n.toElement,x=c,S=S?Ut(S):null,S!==null&&(F=Xt(S),S!==F||S.tag!==5&&S.tag!==6)&&(S=null)):(x=null,S=c),x!==S)){if(k=cu,y="onMouseLeave",f="onMouseEnter",a="mouse",(e==="pointerout"||e==="pointerover")&&(k=du,y="onPointerLeave",f="onPointerEnter",a="pointer"),F=x==null?h:rn(x),p=S==null?h:rn(S),h=new k(y,a+"leave",x,n,g),h.target=F,h.relatedTarget=p,y=null,Ut(g)===c&&(k=new k(f,a+"enter",S,n,g),k.target=p,k.relatedTarget=F,y=k),F=y,x&&S)t:{for(k=x,f=S,a=0,p=k;p;p=Jt(p))a++;for(p=0,y=f;y;y=Jt(y))p++;for(;0<a-p;)k=Jt(k),a--;for(;0<p-a;)f=Jt(f),p--;for(;a--;){if(k===f||f!==null&&k===f.alternate)break t;k=Jt(k),f=Jt(f)}k=null}else k=null;x!==null&&Cu(m,h,x,k,!1),S!==null&&F!==null&&Cu(m,F,S,k,!0)}}e:{if(h=c?rn(c):window,x=h.nodeName&&h.nodeName.toLowerCase(),x==="select"||x==="input"&&h.type==="file")var C=ed;else if(mu(h))if(ta)C=ld;else{C=nd;var _=td}else(x=h.nodeName)&&x.toLowerCase()==="input"&&(h.type==="checkbox"||h.type==="radio")&&(C=rd);if(C&&(C=C(e,c))){ea(m,C,n,g);break e}_&&_(e,h,c),e==="focusout"&&(_=h._wrapperState)&&_.controlled&&h.type==="number"&&pi(h,"number",h.value)}switch(_=c?rn(c):window,e){case"focusin":(mu(_)||_.contentEditable==="true")&&(tn=_,Ni=c,Wn=null);break;case"focusout":Wn=Ni=tn=null;break;case"mousedown":_i=!0;break;case"contextmenu":case"mouseup":case"dragend":_i=!1,xu(m,n,g);break;case"selectionchange":if(ud)break;case"keydown":case"keyup":xu(m,n,g)}var j;if(yo)e:{switch(e){case"compositionstart":var P="onCompositionStart";break e;case"compositionend":P="onCompositionEnd";break e;case"compositionupdate":P="onCompositionUpdate";break e}P=void 0}else en?qs(e,n)&&(P="onCompositionEnd"):e==="keydown"&&n.keyCode===229&&(P="onCompositionStart");P&&(Js&&n.locale!=="ko"&&(en||P!=="onCompositionStart"?P==="onCompositionEnd"&&en&&(j=Zs()):(wt=g,mo="value"in wt?wt.value:wt.textContent,en=!0)),_=br(c,P),0<_.length&&(P=new fu(P,e,null,n,g),m.push({event:P,listeners:_}),j?P.data=j:(j=bs(n),j!==null&&(P.data=j)))),(j=Xf?Zf(e,n):Jf(e,n))&&(c=br(c,"onBeforeInput"),0<c.length&&(g=new fu("onBeforeInput","beforeinput",null,n,g),m.push({event:g,listeners:c}),g.data=j))}fa(m,t)})}function rr(e,t,n){return{instance:e,listener:t,currentTarget:n}}function br(e,t){for(var n=t+"Capture",r=[];e!==null;){var l=e,i=l.stateNode;l.tag===5&&i!==null&&(l=i,i=Zn(e,n),i!=null&&r.unshift(rr(e,i,l)),i=Zn(e,t),i!=null&&r.push(rr(e,i,l))),e=e.return}return r}function Jt(e){if(e===null)return null;do e=e.return;while(e&&e.tag!==5);return e||null}function Cu(e,t,n,r,l){for(var i=t._reactName,o=[];n!==null&&n!==r;){var u=n,s=u.alternate,c=u.stateNode;if(s!==null&&s===r)break;u.tag===5&&c!==null&&(u=c,l?(s=Zn(n,i),s!=null&&o.unshift(rr(n,s,u))):l||(s=Zn(n,i),s!=null&&o.push(rr(n,s,u)))),n=n.return}o.length!==0&&e.push({event:t,listeners:o})}var fd=/\r\n?/g,dd=/\u0000|\uFFFD/g;function Eu(e){return(typeof e=="string"?e:""+e).replace(fd,`
-`).replace(dd,"")}function jr(e,t,n){if(t=Eu(t),Eu(e)!==t&&n)throw Error(w(425))}function el(){}var ji=null,Pi=null;function zi(e,t){return e==="textarea"||e==="noscript"||typeof t.children=="string"||typeof t.children=="number"||typeof t.dangerouslySetInnerHTML=="object"&&t.dangerouslySetInnerHTML!==null&&t.dangerouslySetInnerHTML.__html!=null}var Li=typeof setTimeout=="function"?setTimeout:void 0,pd=typeof clearTimeout=="function"?clearTimeout:void 0,Nu=typeof Promise=="function"?Promise:void 0,hd=typeof queueMicrotask=="function"?queueMicrotask:typeof Nu<"u"?function(e){return Nu.resolve(null).then(e).catch(md)}:Li;function md(e){setTimeout(function(){throw e})}function Zl(e,t){var n=t,r=0;do{var l=n.nextSibling;if(e.removeChild(n),l&&l.nodeType===8)if(n=l.data,n==="/$"){if(r===0){e.removeChild(l),bn(t);return}r--}else n!=="$"&&n!=="$?"&&n!=="$!"||r++;n=l}while(n);bn(t)}function Et(e){for(;e!=null;e=e.nextSibling){var t=e.nodeType;if(t===1||t===3)break;if(t===8){if(t=e.data,t==="$"||t==="$!"||t==="$?")break;if(t==="/$")return null}}return e}function _u(e){e=e.previousSibling;for(var t=0;e;){if(e.nodeType===8){var n=e.data;if(n==="$"||n==="$!"||n==="$?"){if(t===0)return e;t--}else n==="/$"&&t++}e=e.previousSibling}return null}var _n=Math.random().toString(36).slice(2),Qe="__reactFiber$"+_n,lr="__reactProps$"+_n,lt="__reactContainer$"+_n,Ti="__reactEvents$"+_n,vd="__reactListeners$"+_n,gd="__reactHandles$"+_n;function Ut(e){var t=e[Qe];if(t)return t;for(var n=e.parentNode;n;){if(t=n[lt]||n[Qe]){if(n=t.alternate,t.child!==null||n!==null&&n.child!==null)for(e=_u(e);e!==null;){if(n=e[Qe])return n;e=_u(e)}return t}e=n,n=e.parentNode}return null}function hr(e){return e=e[Qe]||e[lt],!e||e.tag!==5&&e.tag!==6&&e.tag!==13&&e.tag!==3?null:e}function rn(e){if(e.tag===5||e.tag===6)return e.stateNode;throw Error(w(33))}function Sl(e){return e[lr]||null}var Mi=[],ln=-1;function Mt(e){return{current:e}}function A(e){0>ln||(e.current=Mi[ln],Mi[ln]=null,ln--)}function U(e,t){ln++,Mi[ln]=e.current,e.current=t}var Lt={},ce=Mt(Lt),we=Mt(!1),Wt=Lt;function yn(e,t){var n=e.type.contextTypes;if(!n)return Lt;var r=e.stateNode;if(r&&r.__reactInternalMemoizedUnmaskedChildContext===t)return r.__reactInternalMemoizedMaskedChildContext;var l={},i;for(i in n)l[i]=t[i];return r&&(e=e.stateNode,e.__reactInternalMemoizedUnmaskedChildContext=t,e.__reactInternalMemoizedMaskedChildContext=l),l}function xe(e){return e=e.childContextTypes,e!=null}function tl(){A(we),A(ce)}function ju(e,t,n){if(ce.current!==Lt)throw Error(w(168));U(ce,t),U(we,n)}function pa(e,t,n){var r=e.stateNode;if(t=t.childContextTypes,typeof r.getChildContext!="function")return n;r=r.getChildContext();for(var l in r)if(!(l in t))throw Error(w(108,ef(e)||"Unknown",l));return Y({},n,r)}function nl(e){return e=(e=e.stateNode)&&e.__reactInternalMemoizedMergedChildContext||Lt,Wt=ce.current,U(ce,e),U(we,we.current),!0}function Pu(e,t,n){var r=e.stateNode;if(!r)throw Error(w(169));n?(e=pa(e,t,Wt),r.__reactInternalMemoizedMergedChildContext=e,A(we),A(ce),U(ce,e)):A(we),U(we,n)}var qe=null,kl=!1,Jl=!1;function ha(e){qe===null?qe=[e]:qe.push(e)}function yd(e){kl=!0,ha(e)}function Rt(){if(!Jl&&qe!==null){Jl=!0;var e=0,t=I;try{var n=qe;for(I=1;e<n.length;e++){var r=n[e];do r=r(!0);while(r!==null)}qe=null,kl=!1}catch(l){throw qe!==null&&(qe=qe.slice(e+1)),$s(co,Rt),l}finally{I=t,Jl=!1}}return null}var on=[],un=0,rl=null,ll=0,Pe=[],ze=0,Ht=null,et=1,tt="";function It(e,t){on[un++]=ll,on[un++]=rl,rl=e,ll=t}function ma(e,t,n){Pe[ze++]=et,Pe[ze++]=tt,Pe[ze++]=Ht,Ht=e;var r=et;e=tt;var l=32-Ue(r)-1;r&=~(1<<l),n+=1;var i=32-Ue(t)+l;if(30<i){var o=l-l%5;i=(r&(1<<o)-1).toString(32),r>>=o,l-=o,et=1<<32-Ue(t)+l|n<<l|r,tt=i+e}else et=1<<i|n<<l|r,tt=e}function xo(e){e.return!==null&&(It(e,1),ma(e,1,0))}function So(e){for(;e===rl;)rl=on[--un],on[un]=null,ll=on[--un],on[un]=null;for(;e===Ht;)Ht=Pe[--ze],Pe[ze]=null,tt=Pe[--ze],Pe[ze]=null,et=Pe[--ze],Pe[ze]=null}var Ee=null,Ce=null,W=!1,Fe=null;function va(e,t){var n=Le(5,null,null,0);n.elementType="DELETED",n.stateNode=t,n.return=e,t=e.deletions,t===null?(e.deletions=[n],e.flags|=16):t.push(n)}function zu(e,t){switch(e.tag){case 5:var n=e.type;return t=t.nodeType!==1||n.toLowerCase()!==t.nodeName.toLowerCase()?null:t,t!==null?(e.stateNode=t,Ee=e,Ce=Et(t.firstChild),!0):!1;case 6:return t=e.pendingProps===""||t.nodeType!==3?null:t,t!==null?(e.stateNode=t,Ee=e,Ce=null,!0):!1;case 13:return t=t.nodeType!==8?null:t,t!==null?(n=Ht!==null?{id:et,overflow:tt}:null,e.memoizedState={dehydrated:t,treeContext:n,retryLane:1073741824},n=Le(18,null,null,0),n.stateNode=t,n.return=e,e.child=n,Ee=e,Ce=null,!0):!1;default:return!1}}function Ri(e){return(e.mode&1)!==0&&(e.flags&128)===0}function Di(e){if(W){var t=Ce;if(t){var n=t;if(!zu(e,t)){if(Ri(e))throw Error(w(418));t=Et(n.nextSibling);var r=Ee;t&&zu(e,t)?va(r,n):(e.flags=e.flags&-4097|2,W=!1,Ee=e)}}else{if(Ri(e))throw Error(w(418));e.flags=e.flags&-4097|2,W=!1,Ee=e}}}function Lu(e){for(e=e.return;e!==null&&e.tag!==5&&e.tag!==3&&e.tag!==13;)e=e.return;Ee=e}function Pr(e){if(e!==Ee)return!1;if(!W)return Lu(e),W=!0,!1;var t;if((t=e.tag!==3)&&!(t=e.tag!==5)&&(t=e.type,t=t!=="head"&&t!=="body"&&!zi(e.type,e.memoizedProps)),t&&(t=Ce)){if(Ri(e))throw ga(),Error(w(418));for(;t;)va(e,t),t=Et(t.nextSibling)}if(Lu(e),e.tag===13){if(e=e.memoizedState,e=e!==null?e.dehydrated:null,!e)throw Error(w(317));e:{for(e=e.nextSibling,t=0;e;){if(e.nodeType===8){var n=e.data;if(n==="/$"){if(t===0){Ce=Et(e.nextSibling);break e}t--}else n!=="$"&&n!=="$!"&&n!=="$?"||t++}e=e.nextSibling}Ce=null}}else Ce=Ee?Et(e.stateNode.nextSibling):null;return!0}function ga(){for(var e=Ce;e;)e=Et(e.nextSibling)}function wn(){Ce=Ee=null,W=!1}function ko(e){Fe===null?Fe=[e]:Fe.push(e)}var wd=ut.ReactCurrentBatchConfig;function Mn(e,t,n){if(e=n.ref,e!==null&&typeof e!="function"&&typeof e!="object"){if(n._owner){if(n=n._owner,n){if(n.tag!==1)throw Error(w(309));var r=n.stateNode}if(!r)throw Error(w(147,e));var l=r,i=""+e;return t!==null&&t.ref!==null&&typeof t.ref=="function"&&t.ref._stringRef===i?t.ref:(t=function(o){var u=l.refs;o===null?delete u[i]:u[i]=o},t._stringRef=i,t)}if(typeof e!="string")throw Error(w(284));if(!n._owner)throw Error(w(290,e))}return e}function zr(e,t){throw e=Object.prototype.toString.call(t),Error(w(31,e==="[object Object]"?"object with keys {"+Object.keys(t).join(", ")+"}":e))}function Tu(e){var t=e._init;return t(e._payload)}function ya(e){function t(f,a){if(e){var p=f.deletions;p===null?(f.deletions=[a],f.flags|=16):p.push(a)}}function n(f,a){if(!e)return null;for(;a!==null;)t(f,a),a=a.sibling;return null}function r(f,a){for(f=new Map;a!==null;)a.key!==null?f.set(a.key,a):f.set(a.index,a),a=a.sibling;return f}function l(f,a){return f=Pt(f,a),f.index=0,f.sibling=null,f}function i(f,a,p){return f.index=p,e?(p=f.alternate,p!==null?(p=p.index,p<a?(f.flags|=2,a):p):(f.flags|=2,a)):(f.flags|=1048576,a)}function o(f){return e&&f.alternate===null&&(f.flags|=2),f}function u(f,a,p,y){return a===null||a.tag!==6?(a=li(p,f.mode,y),a.return=f,a):(a=l(a,p),a.return=f,a)}function s(f,a,p,y){var C=p.type;return C===bt?g(f,a,p.props.children,y,p.key):a!==null&&(a.elementType===C||typeof C=="object"&&C!==null&&C.$$typeof===pt&&Tu(C)===a.type)?(y=l(a,p.props),y.ref=Mn(f,a,p),y.return=f,y):(y=Qr(p.type,p.key,p.props,null,f.mode,y),y.ref=Mn(f,a,p),y.return=f,y)}function c(f,a,p,y){return a===null||a.tag!==4||a.stateNode.containerInfo!==p.containerInfo||a.stateNode.implementation!==p.implementation?(a=ii(p,f.mode,y),a.return=f,a):(a=l(a,p.children||[]),a.return=f,a)}function g(f,a,p,y,C){return a===null||a.tag!==7?(a=Vt(p,f.mode,y,C),a.return=f,a):(a=l(a,p),a.return=f,a)}function m(f,a,p){if(typeof a=="string"&&a!==""||typeof a=="number")return a=li(""+a,f.mode,p),a.return=f,a;if(typeof a=="object"&&a!==null){switch(a.$$typeof){case yr:return p=Qr(a.type,a.key,a.props,null,f.mode,p),p.ref=Mn(f,null,a),p.return=f,p;case qt:return a=ii(a,f.mode,p),a.return=f,a;case pt:var y=a._init;return m(f,y(a._payload),p)}if(In(a)||jn(a))return a=Vt(a,f.mode,p,null),a.return=f,a;zr(f,a)}return null}function h(f,a,p,y){var C=a!==null?a.key:null;if(typeof p=="string"&&p!==""||typeof p=="number")return C!==null?null:u(f,a,""+p,y);if(typeof p=="object"&&p!==null){switch(p.$$typeof){case yr:return p.key===C?s(f,a,p,y):null;case qt:return p.key===C?c(f,a,p,y):null;case pt:return C=p._init,h(f,a,C(p._payload),y)}if(In(p)||jn(p))return C!==null?null:g(f,a,p,y,null);zr(f,p)}return null}function x(f,a,p,y,C){if(typeof y=="string"&&y!==""||typeof y=="number")return f=f.get(p)||null,u(a,f,""+y,C);if(typeof y=="object"&&y!==null){switch(y.$$typeof){case yr:return f=f.get(y.key===null?p:y.key)||null,s(a,f,y,C);case qt:return f=f.get(y.key===null?p:y.key)||null,c(a,f,y,C);case pt:var _=y._init;return x(f,a,p,_(y._payload),C)}if(In(y)||jn(y))return f=f.get(p)||null,g(a,f,y,C,null);zr(a,y)}return null}function S(f,a,p,y){for(var C=null,_=null,j=a,P=a=0,H=null;j!==null&&P<p.length;P++){j.index>P?(H=j,j=null):H=j.sibling;var M=h(f,j,p[P],y);if(M===null){j===null&&(j=H);break}e&&j&&M.alternate===null&&t(f,j),a=i(M,a,P),_===null?C=M:_.sibling=M,_=M,j=H}if(P===p.length)return n(f,j),W&&It(f,P),C;if(j===null){for(;P<p.length;P++)j=m(f,p[P],y),j!==null&&(a=i(j,a,P),_===null?C=j:_.sibling=j,_=j);return W&&It(f,P),C}for(j=r(f,j);P<p.length;P++)H=x(j,f,P,p[P],y),H!==null&&(e&&H.alternate!==null&&j.delete(H.key===null?P:H.key),a=i(H,a,P),_===null?C=H:_.sibling=H,_=H);return e&&j.forEach(function(fe){return t(f,fe)}),W&&It(f,P),C}function k(f,a,p,y){var C=jn(p);if(typeof C!="function")throw Error(w(150));if(p=C.call(p),p==null)throw Error(w(151));for(var _=C=null,j=a,P=a=0,H=null,M=p.next();j!==null&&!M.done;P++,M=p.next()){j.index>P?(H=j,j=null):H=j.sibling;var fe=h(f,j,M.value,y);if(fe===null){j===null&&(j=H);break}e&&j&&fe.alternate===null&&t(f,j),a=i(fe,a,P),_===null?C=fe:_.sibling=fe,_=fe,j=H}if(M.done)return n(f,j),W&&It(f,P),C;if(j===null){for(;!M.done;P++,M=p.next())M=m(f,M.value,y),M!==null&&(a=i(M,a,P),_===null?C=M:_.sibling=M,_=M);return W&&It(f,P),C}for(j=r(f,j);!M.done;P++,M=p.next())M=x(j,f,P,M.value,y),M!==null&&(e&&M.alternate!==null&&j.delete(M.key===null?P:M.key),a=i(M,a,P),_===null?C=M:_.sibling=M,_=M);return e&&j.forEach(function(Dt){return t(f,Dt)}),W&&It(f,P),C}function F(f,a,p,y){if(typeof p=="object"&&p!==null&&p.type===bt&&p.key===null&&(p=p.props.children),typeof p=="object"&&p!==null){switch(p.$$typeof){case yr:e:{for(var C=p.key,_=a;_!==null;){if(_.key===C){if(C=p.type,C===bt){if(_.tag===7){n(f,_.sibling),a=l(_,p.props.children),a.return=f,f=a;break e}}else if(_.elementType===C||typeof C=="object"&&C!==null&&C.$$typeof===pt&&Tu(C)===_.type){n(f,_.sibling),a=l(_,p.props),a.ref=Mn(f,_,p),a.return=f,f=a;break e}n(f,_);break}else t(f,_);_=_.sibling}p.type===bt?(a=Vt(p.props.children,f.mode,y,p.key),a.return=f,f=a):(y=Qr(p.type,p.key,p.props,null,f.mode,y),y.ref=Mn(f,a,p),y.return=f,f=y)}return o(f);case qt:e:{for(_=p.key;a!==null;){if(a.key===_)if(a.tag===4&&a.stateNode.containerInfo===p.containerInfo&&a.stateNode.implementation===p.implementation){n(f,a.sibling),a=l(a,p.children||[]),a.return=f,f=a;break e}else{n(f,a);break}else t(f,a);a=a.sibling}a=ii(p,f.mode,y),a.return=f,f=a}return o(f);case pt:return _=p._init,F(f,a,_(p._payload),y)}if(In(p))return S(f,a,p,y);if(jn(p))return k(f,a,p,y);zr(f,p)}return typeof p=="string"&&p!==""||typeof p=="number"?(p=""+p,a!==null&&a.tag===6?(n(f,a.sibling),a=l(a,p),a.return=f,f=a):(n(f,a),a=li(p,f.mode,y),a.return=f,f=a),o(f)):n(f,a)}return F}var xn=ya(!0),wa=ya(!1),il=Mt(null),ol=null,sn=null,Co=null;function Eo(){Co=sn=ol=null}function No(e){var t=il.current;A(il),e._currentValue=t}function Oi(e,t,n){for(;e!==null;){var r=e.alternate;if((e.childLanes&t)!==t?(e.childLanes|=t,r!==null&&(r.childLanes|=t)):r!==null&&(r.childLanes&t)!==t&&(r.childLanes|=t),e===n)break;e=e.return}}function mn(e,t){ol=e,Co=sn=null,e=e.dependencies,e!==null&&e.firstContext!==null&&(e.lanes&t&&(ye=!0),e.firstContext=null)}function Me(e){var t=e._currentValue;if(Co!==e)if(e={context:e,memoizedValue:t,next:null},sn===null){if(ol===null)throw Error(w(308));sn=e,ol.dependencies={lanes:0,firstContext:e}}else sn=sn.next=e;return t}var $t=null;function _o(e){$t===null?$t=[e]:$t.push(e)}function xa(e,t,n,r){var l=t.interleaved;return l===null?(n.next=n,_o(t)):(n.next=l.next,l.next=n),t.interleaved=n,it(e,r)}function it(e,t){e.lanes|=t;var n=e.alternate;for(n!==null&&(n.lanes|=t),n=e,e=e.return;e!==null;)e.childLanes|=t,n=e.alternate,n!==null&&(n.childLanes|=t),n=e,e=e.return;return n.tag===3?n.stateNode:null}var ht=!1;function jo(e){e.updateQueue={baseState:e.memoizedState,firstBaseUpdate:null,lastBaseUpdate:null,shared:{pending:null,interleaved:null,lanes:0},effects:null}}function Sa(e,t){e=e.updateQueue,t.updateQueue===e&&(t.updateQueue={baseState:e.baseState,firstBaseUpdate:e.firstBaseUpdate,lastBaseUpdate:e.lastBaseUpdate,shared:e.shared,effects:e.effects})}function nt(e,t){return{eventTime:e,lane:t,tag:0,payload:null,callback:null,next:null}}function Nt(e,t,n){var r=e.updateQueue;if(r===null)return null;if(r=r.shared,D&2){var l=r.pending;return l===null?t.next=t:(t.next=l.next,l.next=t),r.pending=t,it(e,n)}return l=r.interleaved,l===null?(t.next=t,_o(r)):(t.next=l.next,l.next=t),r.interleaved=t,it(e,n)}function $r(e,t,n){if(t=t.updateQueue,t!==null&&(t=t.shared,(n&4194240)!==0)){var r=t.lanes;r&=e.pendingLanes,n|=r,t.lanes=n,fo(e,n)}}function Mu(e,t){var n=e.updateQueue,r=e.alternate;if(r!==null&&(r=r.updateQueue,n===r)){var l=null,i=null;if(n=n.firstBaseUpdate,n!==null){do{var o={eventTime:n.eventTime,lane:n.lane,tag:n.tag,payload:n.payload,callback:n.callback,next:null};i===null?l=i=o:i=i.next=o,n=n.next}while(n!==null);i===null?l=i=t:i=i.next=t}else l=i=t;n={baseState:r.baseState,firstBaseUpdate:l,lastBaseUpdate:i,shared:r.shared,effects:r.effects},e.updateQueue=n;return}e=n.lastBaseUpdate,e===null?n.firstBaseUpdate=t:e.next=t,n.lastBaseUpdate=t}function ul(e,t,n,r){var l=e.updateQueue;ht=!1;var i=l.firstBaseUpdate,o=l.lastBaseUpdate,u=l.shared.pending;if(u!==null){l.shared.pending=null;var s=u,c=s.next;s.next=null,o===null?i=c:o.next=c,o=s;var g=e.alternate;g!==null&&(g=g.updateQueue,u=g.lastBaseUpdate,u!==o&&(u===null?g.firstBaseUpdate=c:u.next=c,g.lastBaseUpdate=s))}if(i!==null){var m=l.baseState;o=0,g=c=s=null,u=i;do{var h=u.lane,x=u.eventTime;if((r&h)===h){g!==null&&(g=g.next={eventTime:x,lane:0,tag:u.tag,payload:u.payload,callback:u.callback,next:null});e:{var S=e,k=u;switch(h=t,x=n,k.tag){case 1:if(S=k.payload,typeof S=="function"){m=S.call(x,m,h);break e}m=S;break e;case 3:S.flags=S.flags&-65537|128;case 0:if(S=k.payload,h=typeof S=="function"?S.call(x,m,h):S,h==null)break e;m=Y({},m,h);break e;case 2:ht=!0}}u.callback!==null&&u.lane!==0&&(e.flags|=64,h=l.effects,h===null?l.effects=[u]:h.push(u))}else x={eventTime:x,lane:h,tag:u.tag,payload:u.payload,callback:u.callback,next:null},g===null?(c=g=x,s=m):g=g.next=x,o|=h;if(u=u.next,u===null){if(u=l.shared.pending,u===null)break;h=u,u=h.next,h.next=null,l.lastBaseUpdate=h,l.shared.pending=null}}while(!0);if(g===null&&(s=m),l.baseState=s,l.firstBaseUpdate=c,l.lastBaseUpdate=g,t=l.shared.interleaved,t!==null){l=t;do o|=l.lane,l=l.next;while(l!==t)}else i===null&&(l.shared.lanes=0);Kt|=o,e.lanes=o,e.memoizedState=m}}function Ru(e,t,n){if(e=t.effects,t.effects=null,e!==null)for(t=0;t<e.length;t++){var r=e[t],l=r.callback;if(l!==null){if(r.callback=null,r=n,typeof l!="function")throw Error(w(191,l));l.call(r)}}}var mr={},Ye=Mt(mr),ir=Mt(mr),or=Mt(mr);function At(e){if(e===mr)throw Error(w(174));return e}function Po(e,t){switch(U(or,t),U(ir,e),U(Ye,mr),e=t.nodeType,e){case 9:case 11:t=(t=t.documentElement)?t.namespaceURI:mi(null,"");break;default:e=e===8?t.parentNode:t,t=e.namespaceURI||null,e=e.tagName,t=mi(t,e)}A(Ye),U(Ye,t)}function Sn(){A(Ye),A(ir),A(or)}function ka(e){At(or.current);var t=At(Ye.current),n=mi(t,e.type);t!==n&&(U(ir,e),U(Ye,n))}function zo(e){ir.current===e&&(A(Ye),A(ir))}var Q=Mt(0);function sl(e){for(var t=e;t!==null;){if(t.tag===13){var n=t.memoizedState;if(n!==null&&(n=n.dehydrated,n===null||n.data==="$?"||n.data==="$!"))return t}else if(t.tag===19&&t.memoizedProps.revealOrder!==void 0){if(t.flags&128)return t}else if(t.child!==null){t.child.return=t,t=t.child;continue}if(t===e)break;for(;t.sibling===null;){if(t.return===null||t.return===e)return null;t=t.return}t.sibling.return=t.return,t=t.sibling}return null}var ql=[];function Lo(){for(var e=0;e<ql.length;e++)ql[e]._workInProgressVersionPrimary=null;ql.length=0}var Ar=ut.ReactCurrentDispatcher,bl=ut.ReactCurrentBatchConfig,Qt=0,K=null,b=null,te=null,al=!1,Hn=!1,ur=0,xd=0;function ue(){throw Error(w(321))}function To(e,t){if(t===null)return!1;for(var n=0;n<t.length&&n<e.length;n++)if(!Ae(e[n],t[n]))return!1;return!0}function Mo(e,t,n,r,l,i){if(Qt=i,K=t,t.memoizedState=null,t.updateQueue=null,t.lanes=0,Ar.current=e===null||e.memoizedState===null?Ed:Nd,e=n(r,l),Hn){i=0;do{if(Hn=!1,ur=0,25<=i)throw Error(w(301));i+=1,te=b=null,t.updateQueue=null,Ar.current=_d,e=n(r,l)}while(Hn)}if(Ar.current=cl,t=b!==null&&b.next!==null,Qt=0,te=b=K=null,al=!1,t)throw Error(w(300));return e}function Ro(){var e=ur!==0;return ur=0,e}function He(){var e={memoizedState:null,baseState:null,baseQueue:null,queue:null,next:null};return te===null?K.memoizedState=te=e:te=te.next=e,te}function Re(){if(b===null){var e=K.alternate;e=e!==null?e.memoizedState:null}else e=b.next;var t=te===null?K.memoizedState:te.next;if(t!==null)te=t,b=e;else{if(e===null)throw Error(w(310));b=e,e={memoizedState:b.memoizedState,baseState:b.baseState,baseQueue:b.baseQueue,queue:b.queue,next:null},te===null?K.memoizedState=te=e:te=te.next=e}return te}function sr(e,t){return typeof t=="function"?t(e):t}function ei(e){var t=Re(),n=t.queue;if(n===null)throw Error(w(311));n.lastRenderedReducer=e;var r=b,l=r.baseQueue,i=n.pending;if(i!==null){if(l!==null){var o=l.next;l.next=i.next,i.next=o}r.baseQueue=l=i,n.pending=null}if(l!==null){i=l.next,r=r.baseState;var u=o=null,s=null,c=i;do{var g=c.lane;if((Qt&g)===g)s!==null&&(s=s.next={lane:0,action:c.action,hasEagerState:c.hasEagerState,eagerState:c.eagerState,next:null}),r=c.hasEagerState?c.eagerState:e(r,c.action);else{var m={lane:g,action:c.action,hasEagerState:c.hasEagerState,eagerState:c.eagerState,next:null};s===null?(u=s=m,o=r):s=s.next=m,K.lanes|=g,Kt|=g}c=c.next}while(c!==null&&c!==i);s===null?o=r:s.next=u,Ae(r,t.memoizedState)||(ye=!0),t.memoizedState=r,t.baseState=o,t.baseQueue=s,n.lastRenderedState=r}if(e=n.interleaved,e!==null){l=e;do i=l.lane,K.lanes|=i,Kt|=i,l=l.next;while(l!==e)}else l===null&&(n.lanes=0);return[t.memoizedState,n.dispatch]}function ti(e){var t=Re(),n=t.queue;if(n===null)throw Error(w(311));n.lastRenderedReducer=e;var r=n.dispatch,l=n.pending,i=t.memoizedState;if(l!==null){n.pending=null;var o=l=l.next;do i=e(i,o.action),o=o.next;while(o!==l);Ae(i,t.memoizedState)||(ye=!0),t.memoizedState=i,t.baseQueue===null&&(t.baseState=i),n.lastRenderedState=i}return[i,r]}function Ca(){}function Ea(e,t){var n=K,r=Re(),l=t(),i=!Ae(r.memoizedState,l);if(i&&(r.memoizedState=l,ye=!0),r=r.queue,Do(ja.bind(null,n,r,e),[e]),r.getSnapshot!==t||i||te!==null&&te.memoizedState.tag&1){if(n.flags|=2048,ar(9,_a.bind(null,n,r,l,t),void 0,null),ne===null)throw Error(w(349));Qt&30||Na(n,t,l)}return l}function Na(e,t,n){e.flags|=16384,e={getSnapshot:t,value:n},t=K.updateQueue,t===null?(t={lastEffect:null,stores:null},K.updateQueue=t,t.stores=[e]):(n=t.stores,n===null?t.stores=[e]:n.push(e))}function _a(e,t,n,r){t.value=n,t.getSnapshot=r,Pa(t)&&za(e)}function ja(e,t,n){return n(function(){Pa(t)&&za(e)})}function Pa(e){var t=e.getSnapshot;e=e.value;try{var n=t();return!Ae(e,n)}catch{return!0}}function za(e){var t=it(e,1);t!==null&&$e(t,e,1,-1)}function Du(e){var t=He();return typeof e=="function"&&(e=e()),t.memoizedState=t.baseState=e,e={pending:null,interleaved:null,lanes:0,dispatch:null,lastRenderedReducer:sr,lastRenderedState:e},t.queue=e,e=e.dispatch=Cd.bind(null,K,e),[t.memoizedState,e]}function ar(e,t,n,r){return e={tag:e,create:t,destroy:n,deps:r,next:null},t=K.updateQueue,t===null?(t={lastEffect:null,stores:null},K.updateQueue=t,t.lastEffect=e.next=e):(n=t.lastEffect,n===null?t.lastEffect=e.next=e:(r=n.next,n.next=e,e.next=r,t.lastEffect=e)),e}function La(){return Re().memoizedState}function Br(e,t,n,r){var l=He();K.flags|=e,l.memoizedState=ar(1|t,n,void 0,r===void 0?null:r)}function Cl(e,t,n,r){var l=Re();r=r===void 0?null:r;var i=void 0;if(b!==null){var o=b.memoizedState;if(i=o.destroy,r!==null&&To(r,o.deps)){l.memoizedState=ar(t,n,i,r);return}}K.flags|=e,l.memoizedState=ar(1|t,n,i,r)}function Ou(e,t){return Br(8390656,8,e,t)}function Do(e,t){return Cl(2048,8,e,t)}function Ta(e,t){return Cl(4,2,e,t)}function Ma(e,t){return Cl(4,4,e,t)}function Ra(e,t){if(typeof t=="function")return e=e(),t(e),function(){t(null)};if(t!=null)return e=e(),t.current=e,function(){t.current=null}}function Da(e,t,n){return n=n!=null?n.concat([e]):null,Cl(4,4,Ra.bind(null,t,e),n)}function Oo(){}function Oa(e,t){var n=Re();t=t===void 0?null:t;var r=n.memoizedState;return r!==null&&t!==null&&To(t,r[1])?r[0]:(n.memoizedState=[e,t],e)}function Ia(e,t){var n=Re();t=t===void 0?null:t;var r=n.memoizedState;return r!==null&&t!==null&&To(t,r[1])?r[0]:(e=e(),n.memoizedState=[e,t],e)}function Fa(e,t,n){return Qt&21?(Ae(n,t)||(n=Vs(),K.lanes|=n,Kt|=n,e.baseState=!0),t):(e.baseState&&(e.baseState=!1,ye=!0),e.memoizedState=n)}function Sd(e,t){var n=I;I=n!==0&&4>n?n:4,e(!0);var r=bl.transition;bl.transition={};try{e(!1),t()}finally{I=n,bl.transition=r}}function Ua(){return Re().memoizedState}function kd(e,t,n){var r=jt(e);if(n={lane:r,action:n,hasEagerState:!1,eagerState:null,next:null},$a(e))Aa(t,n);else if(n=xa(e,t,n,r),n!==null){var l=he();$e(n,e,r,l),Ba(n,t,r)}}function Cd(e,t,n){var r=jt(e),l={lane:r,action:n,hasEagerState:!1,eagerState:null,next:null};if($a(e))Aa(t,l);else{var i=e.alternate;if(e.lanes===0&&(i===null||i.lanes===0)&&(i=t.lastRenderedReducer,i!==null))try{var o=t.lastRenderedState,u=i(o,n);if(l.hasEagerState=!0,l.eagerState=u,Ae(u,o)){var s=t.interleaved;s===null?(l.next=l,_o(t)):(l.next=s.next,s.next=l),t.interleaved=l;return}}catch{}finally{}n=xa(e,t,l,r),n!==null&&(l=he(),$e(n,e,r,l),Ba(n,t,r))}}function $a(e){var t=e.alternate;return e===K||t!==null&&t===K}function Aa(e,t){Hn=al=!0;var n=e.pending;n===null?t.next=t:(t.next=n.next,n.next=t),e.pending=t}function Ba(e,t,n){if(n&4194240){var r=t.lanes;r&=e.pendingLanes,n|=r,t.lanes=n,fo(e,n)}}var cl={readContext:Me,useCallback:ue,useContext:ue,useEffect:ue,useImperativeHandle:ue,useInsertionEffect:ue,useLayoutEffect:ue,useMemo:ue,useReducer:ue,useRef:ue,useState:ue,useDebugValue:ue,useDeferredValue:ue,useTransition:ue,useMutableSource:ue,useSyncExternalStore:ue,useId:ue,unstable_isNewReconciler:!1},Ed={readContext:Me,useCallback:function(e,t){return He().memoizedState=[e,t===void 0?null:t],e},useContext:Me,useEffect:Ou,useImperativeHandle:function(e,t,n){return n=n!=null?n.concat([e]):null,Br(4194308,4,Ra.bind(null,t,e),n)},useLayoutEffect:function(e,t){return Br(4194308,4,e,t)},useInsertionEffect:function(e,t){return Br(4,2,e,t)},useMemo:function(e,t){var n=He();return t=t===void 0?null:t,e=e(),n.memoizedState=[e,t],e},useReducer:function(e,t,n){var r=He();return t=n!==void 0?n(t):t,r.memoizedState=r.baseState=t,e={pending:null,interleaved:null,lanes:0,dispatch:null,lastRenderedReducer:e,lastRenderedState:t},r.queue=e,e=e.dispatch=kd.bind(null,K,e),[r.memoizedState,e]},useRef:function(e){var t=He();return e={current:e},t.memoizedState=e},useState:Du,useDebugValue:Oo,useDeferredValue:function(e){return He().memoizedState=e},useTransition:function(){var e=Du(!1),t=e[0];return e=Sd.bind(null,e[1]),He().memoizedState=e,[t,e]},useMutableSource:function(){},useSyncExternalStore:function(e,t,n){var r=K,l=He();if(W){if(n===void 0)throw Error(w(407));n=n()}else{if(n=t(),ne===null)throw Error(w(349));Qt&30||Na(r,t,n)}l.memoizedState=n;var i={value:n,getSnapshot:t};return l.queue=i,Ou(ja.bind(null,r,i,e),[e]),r.flags|=2048,ar(9,_a.bind(null,r,i,n,t),void 0,null),n},useId:function(){var e=He(),t=ne.identifierPrefix;if(W){var n=tt,r=et;n=(r&~(1<<32-Ue(r)-1)).toString(32)+n,t=":"+t+"R"+n,n=ur++,0<n&&(t+="H"+n.toString(32)),t+=":"}else n=xd++,t=":"+t+"r"+n.toString(32)+":";return e.memoizedState=t},unstable_isNewReconciler:!1},Nd={readContext:Me,useCallback:Oa,useContext:Me,useEffect:Do,useImperativeHandle:Da,useInsertionEffect:Ta,useLayoutEffect:Ma,useMemo:Ia,useReducer:ei,useRef:La,useState:function(){return ei(sr)},useDebugValue:Oo,useDeferredValue:function(e){var t=Re();return Fa(t,b.memoizedState,e)},useTransition:function(){var e=ei(sr)[0],t=Re().memoizedState;return[e,t]},useMutableSource:Ca,useSyncExternalStore:Ea,useId:Ua,unstable_isNewReconciler:!1},_d={readContext:Me,useCallback:Oa,useContext:Me,useEffect:Do,useImperativeHandle:Da,useInsertionEffect:Ta,useLayoutEffect:Ma,useMemo:Ia,useReducer:ti,useRef:La,useState:function(){return ti(sr)},useDebugValue:Oo,useDeferredValue:function(e){var t=Re();return b===null?t.memoizedState=e:Fa(t,b.memoizedState,e)},useTransition:function(){var e=ti(sr)[0],t=Re().memoizedState;return[e,t]},useMutableSource:Ca,useSyncExternalStore:Ea,useId:Ua,unstable_isNewReconciler:!1};function Oe(e,t){if(e&&e.defaultProps){t=Y({},t),e=e.defaultProps;for(var n in e)t[n]===void 0&&(t[n]=e[n]);return t}return t}function Ii(e,t,n,r){t=e.memoizedState,n=n(r,t),n=n==null?t:Y({},t,n),e.memoizedState=n,e.lanes===0&&(e.updateQueue.baseState=n)}var El={isMounted:function(e){return(e=e._reactInternals)?Xt(e)===e:!1},enqueueSetState:function(e,t,n){e=e._reactInternals;var r=he(),l=jt(e),i=nt(r,l);i.payload=t,n!=null&&(i.callback=n),t=Nt(e,i,l),t!==null&&($e(t,e,l,r),$r(t,e,l))},enqueueReplaceState:function(e,t,n){e=e._reactInternals;var r=he(),l=jt(e),i=nt(r,l);i.tag=1,i.payload=t,n!=null&&(i.callback=n),t=Nt(e,i,l),t!==null&&($e(t,e,l,r),$r(t,e,l))},enqueueForceUpdate:function(e,t){e=e._reactInternals;var n=he(),r=jt(e),l=nt(n,r);l.tag=2,t!=null&&(l.callback=t),t=Nt(e,l,r),t!==null&&($e(t,e,r,n),$r(t,e,r))}};function Iu(e,t,n,r,l,i,o){return e=e.stateNode,typeof e.shouldComponentUpdate=="function"?e.shouldComponentUpdate(r,i,o):t.prototype&&t.prototype.isPureReactComponent?!tr(n,r)||!tr(l,i):!0}function Va(e,t,n){var r=!1,l=Lt,i=t.contextType;return typeof i=="object"&&i!==null?i=Me(i):(l=xe(t)?Wt:ce.current,r=t.contextTypes,i=(r=r!=null)?yn(e,l):Lt),t=new t(n,i),e.memoizedState=t.state!==null&&t.state!==void 0?t.state:null,t.updater=El,e.stateNode=t,t._reactInternals=e,r&&(e=e.stateNode,e.__reactInternalMemoizedUnmaskedChildContext=l,e.__reactInternalMemoizedMaskedChildContext=i),t}function Fu(e,t,n,r){e=t.state,typeof t.componentWillReceiveProps=="function"&&t.componentWillReceiveProps(n,r),typeof t.UNSAFE_componentWillReceiveProps=="function"&&t.UNSAFE_componentWillReceiveProps(n,r),t.state!==e&&El.enqueueReplaceState(t,t.state,null)}function Fi(e,t,n,r){var l=e.stateNode;l.props=n,l.state=e.memoizedState,l.refs={},jo(e);var i=t.contextType;typeof i=="object"&&i!==null?l.context=Me(i):(i=xe(t)?Wt:ce.current,l.context=yn(e,i)),l.state=e.memoizedState,i=t.getDerivedStateFromProps,typeof i=="function"&&(Ii(e,t,i,n),l.state=e.memoizedState),typeof t.getDerivedStateFromProps=="function"||typeof l.getSnapshotBeforeUpdate=="function"||typeof l.UNSAFE_componentWillMount!="function"&&typeof l.componentWillMount!="function"||(t=l.state,typeof l.componentWillMount=="function"&&l.componentWillMount(),typeof l.UNSAFE_componentWillMount=="function"&&l.UNSAFE_componentWillMount(),t!==l.state&&El.enqueueReplaceState(l,l.state,null),ul(e,n,l,r),l.state=e.memoizedState),typeof l.componentDidMount=="function"&&(e.flags|=4194308)}function kn(e,t){try{var n="",r=t;do n+=bc(r),r=r.return;while(r);var l=n}catch(i){l=`
-Error generating stack: `+i.message+`
-`+i.stack}return{value:e,source:t,stack:l,digest:null}}function ni(e,t,n){return{value:e,source:null,stack:n??null,digest:t??null}}function Ui(e,t){try{console.error(t.value)}catch(n){setTimeout(function(){throw n})}}var jd=typeof WeakMap=="function"?WeakMap:Map;function Wa(e,t,n){n=nt(-1,n),n.tag=3,n.payload={element:null};var r=t.value;return n.callback=function(){dl||(dl=!0,Gi=r),Ui(e,t)},n}function Ha(e,t,n){n=nt(-1,n),n.tag=3;var r=e.type.getDerivedStateFromError;if(typeof r=="function"){var l=t.value;n.payload=function(){return r(l)},n.callback=function(){Ui(e,t)}}var i=e.stateNode;return i!==null&&typeof i.componentDidCatch=="function"&&(n.callback=function(){Ui(e,t),typeof r!="function"&&(_t===null?_t=new Set([this]):_t.add(this));var o=t.stack;this.componentDidCatch(t.value,{componentStack:o!==null?o:""})}),n}function Uu(e,t,n){var r=e.pingCache;if(r===null){r=e.pingCache=new jd;var l=new Set;r.set(t,l)}else l=r.get(t),l===void 0&&(l=new Set,r.set(t,l));l.has(n)||(l.add(n),e=Bd.bind(null,e,t,n),t.then(e,e))}function $u(e){do{var t;if((t=e.tag===13)&&(t=e.memoizedState,t=t!==null?t.dehydrated!==null:!0),t)return e;e=e.return}while(e!==null);return null}function Au(e,t,n,r,l){return e.mode&1?(e.flags|=65536,e.lanes=l,e):(e===t?e.flags|=65536:(e.flags|=128,n.flags|=131072,n.flags&=-52805,n.tag===1&&(n.alternate===null?n.tag=17:(t=nt(-1,1),t.tag=2,Nt(n,t,1))),n.lanes|=1),e)}var Pd=ut.ReactCurrentOwner,ye=!1;function pe(e,t,n,r){t.child=e===null?wa(t,null,n,r):xn(t,e.child,n,r)}function Bu(e,t,n,r,l){n=n.render;var i=t.ref;return mn(t,l),r=Mo(e,t,n,r,i,l),n=Ro(),e!==null&&!ye?(t.updateQueue=e.updateQueue,t.flags&=-2053,e.lanes&=~l,ot(e,t,l)):(W&&n&&xo(t),t.flags|=1,pe(e,t,r,l),t.child)}function Vu(e,t,n,r,l){if(e===null){var i=n.type;return typeof i=="function"&&!Wo(i)&&i.defaultProps===void 0&&n.compare===null&&n.defaultProps===void 0?(t.tag=15,t.type=i,Qa(e,t,i,r,l)):(e=Qr(n.type,null,r,t,t.mode,l),e.ref=t.ref,e.return=t,t.child=e)}if(i=e.child,!(e.lanes&l)){var o=i.memoizedProps;if(n=n.compare,n=n!==null?n:tr,n(o,r)&&e.ref===t.ref)return ot(e,t,l)}return t.flags|=1,e=Pt(i,r),e.ref=t.ref,e.return=t,t.child=e}function Qa(e,t,n,r,l){if(e!==null){var i=e.memoizedProps;if(tr(i,r)&&e.ref===t.ref)if(ye=!1,t.pendingProps=r=i,(e.lanes&l)!==0)e.flags&131072&&(ye=!0);else return t.lanes=e.lanes,ot(e,t,l)}return $i(e,t,n,r,l)}function Ka(e,t,n){var r=t.pendingProps,l=r.children,i=e!==null?e.memoizedState:null;if(r.mode==="hidden")if(!(t.mode&1))t.memoizedState={baseLanes:0,cachePool:null,transitions:null},U(cn,ke),ke|=n;else{if(!(n&1073741824))return e=i!==null?i.baseLanes|n:n,t.lanes=t.childLanes=1073741824,t.memoizedState={baseLanes:e,cachePool:null,transitions:null},t.updateQueue=null,U(cn,ke),ke|=e,null;t.memoizedState={baseLanes:0,cachePool:null,transitions:null},r=i!==null?i.baseLanes:n,U(cn,ke),ke|=r}else i!==null?(r=i.baseLanes|n,t.memoizedState=null):r=n,U(cn,ke),ke|=r;return pe(e,t,l,n),t.child}function Ya(e,t){var n=t.ref;(e===null&&n!==null||e!==null&&e.ref!==n)&&(t.flags|=512,t.flags|=2097152)}function $i(e,t,n,r,l){var i=xe(n)?Wt:ce.current;return i=yn(t,i),mn(t,l),n=Mo(e,t,n,r,i,l),r=Ro(),e!==null&&!ye?(t.updateQueue=e.updateQueue,t.flags&=-2053,e.lanes&=~l,ot(e,t,l)):(W&&r&&xo(t),t.flags|=1,pe(e,t,n,l),t.child)}function Wu(e,t,n,r,l){if(xe(n)){var i=!0;nl(t)}else i=!1;if(mn(t,l),t.stateNode===null)Vr(e,t),Va(t,n,r),Fi(t,n,r,l),r=!0;else if(e===null){var o=t.stateNode,u=t.memoizedProps;o.props=u;var s=o.context,c=n.contextType;typeof c=="object"&&c!==null?c=Me(c):(c=xe(n)?Wt:ce.current,c=yn(t,c));var g=n.getDerivedStateFromProps,m=typeof g=="function"||typeof o.getSnapshotBeforeUpdate=="function";m||typeof o.UNSAFE_componentWillReceiveProps!="function"&&typeof o.componentWillReceiveProps!="function"||(u!==r||s!==c)&&Fu(t,o,r,c),ht=!1;var h=t.memoizedState;o.state=h,ul(t,r,o,l),s=t.memoizedState,u!==r||h!==s||we.current||ht?(typeof g=="function"&&(Ii(t,n,g,r),s=t.memoizedState),(u=ht||Iu(t,n,u,r,h,s,c))?(m||typeof o.UNSAFE_componentWillMount!="function"&&typeof o.componentWillMount!="function"||(typeof o.componentWillMount=="function"&&o.componentWillMount(),typeof o.UNSAFE_componentWillMount=="function"&&o.UNSAFE_componentWillMount()),typeof o.componentDidMount=="function"&&(t.flags|=4194308)):(typeof o.componentDidMount=="function"&&(t.flags|=4194308),t.memoizedProps=r,t.memoizedState=s),o.props=r,o.state=s,o.context=c,r=u):(typeof o.componentDidMount=="function"&&(t.flags|=4194308),r=!1)}else{o=t.stateNode,Sa(e,t),u=t.memoizedProps,c=t.type===t.elementType?u:Oe(t.type,u),o.props=c,m=t.pendingProps,h=o.context,s=n.contextType,typeof s=="object"&&s!==null?s=Me(s):(s=xe(n)?Wt:ce.current,s=yn(t,s));var x=n.getDerivedStateFromProps;(g=typeof x=="function"||typeof o.getSnapshotBeforeUpdate=="function")||typeof o.UNSAFE_componentWillReceiveProps!="function"&&typeof o.componentWillReceiveProps!="function"||(u!==m||h!==s)&&Fu(t,o,r,s),ht=!1,h=t.memoizedState,o.state=h,ul(t,r,o,l);var S=t.memoizedState;u!==m||h!==S||we.current||ht?(typeof x=="function"&&(Ii(t,n,x,r),S=t.memoizedState),(c=ht||Iu(t,n,c,r,h,S,s)||!1)?(g||typeof o.UNSAFE_componentWillUpdate!="function"&&typeof o.componentWillUpdate!="function"||(typeof o.componentWillUpdate=="function"&&o.componentWillUpdate(r,S,s),typeof o.UNSAFE_componentWillUpdate=="function"&&o.UNSAFE_componentWillUpdate(r,S,s)),typeof o.componentDidUpdate=="function"&&(t.flags|=4),typeof o.getSnapshotBeforeUpdate=="function"&&(t.flags|=1024)):(typeof o.componentDidUpdate!="function"||u===e.memoizedProps&&h===e.memoizedState||(t.flags|=4),typeof o.getSnapshotBeforeUpdate!="function"||u===e.memoizedProps&&h===e.memoizedState||(t.flags|=1024),t.memoizedProps=r,t.memoizedState=S),o.props=r,o.state=S,o.context=s,r=c):(typeof o.componentDidUpdate!="function"||u===e.memoizedProps&&h===e.memoizedState||(t.flags|=4),typeof o.getSnapshotBeforeUpdate!="function"||u===e.memoizedProps&&h===e.memoizedState||(t.flags|=1024),r=!1)}return Ai(e,t,n,r,i,l)}function Ai(e,t,n,r,l,i){Ya(e,t);var o=(t.flags&128)!==0;if(!r&&!o)return l&&Pu(t,n,!1),ot(e,t,i);r=t.stateNode,Pd.current=t;var u=o&&typeof n.getDerivedStateFromError!="function"?null:r.render();return t.flags|=1,e!==null&&o?(t.child=xn(t,e.child,null,i),t.child=xn(t,null,u,i)):pe(e,t,u,i),t.memoizedState=r.state,l&&Pu(t,n,!0),t.child}function Ga(e){var t=e.stateNode;t.pendingContext?ju(e,t.pendingContext,t.pendingContext!==t.context):t.context&&ju(e,t.context,!1),Po(e,t.containerInfo)}function Hu(e,t,n,r,l){return wn(),ko(l),t.flags|=256,pe(e,t,n,r),t.child}var Bi={dehydrated:null,treeContext:null,retryLane:0};function Vi(e){return{baseLanes:e,cachePool:null,transitions:null}}function Xa(e,t,n){var r=t.pendingProps,l=Q.current,i=!1,o=(t.flags&128)!==0,u;if((u=o)||(u=e!==null&&e.memoizedState===null?!1:(l&2)!==0),u?(i=!0,t.flags&=-129):(e===null||e.memoizedState!==null)&&(l|=1),U(Q,l&1),e===null)return Di(t),e=t.memoizedState,e!==null&&(e=e.dehydrated,e!==null)?(t.mode&1?e.data==="$!"?t.lanes=8:t.lanes=1073741824:t.lanes=1,null):(o=r.children,e=r.fallback,i?(r=t.mode,i=t.child,o={mode:"hidden",children:o},!(r&1)&&i!==null?(i.childLanes=0,i.pendingProps=o):i=jl(o,r,0,null),e=Vt(e,r,n,null),i.return=t,e.return=t,i.sibling=e,t.child=i,t.child.memoizedState=Vi(n),t.memoizedState=Bi,e):Io(t,o));if(l=e.memoizedState,l!==null&&(u=l.dehydrated,u!==null))return zd(e,t,o,r,u,l,n);if(i){i=r.fallback,o=t.mode,l=e.child,u=l.sibling;var s={mode:"hidden",children:r.children};return!(o&1)&&t.child!==l?(r=t.child,r.childLanes=0,r.pendingProps=s,t.deletions=null):(r=Pt(l,s),r.subtreeFlags=l.subtreeFlags&14680064),u!==null?i=Pt(u,i):(i=Vt(i,o,n,null),i.flags|=2),i.return=t,r.return=t,r.sibling=i,t.child=r,r=i,i=t.child,o=e.child.memoizedState,o=o===null?Vi(n):{baseLanes:o.baseLanes|n,cachePool:null,transitions:o.transitions},i.memoizedState=o,i.childLanes=e.childLanes&~n,t.memoizedState=Bi,r}return i=e.child,e=i.sibling,r=Pt(i,{mode:"visible",children:r.children}),!(t.mode&1)&&(r.lanes=n),r.return=t,r.sibling=null,e!==null&&(n=t.deletions,n===null?(t.deletions=[e],t.flags|=16):n.push(e)),t.child=r,t.memoizedState=null,r}function Io(e,t){return t=jl({mode:"visible",children:t},e.mode,0,null),t.return=e,e.child=t}function Lr(e,t,n,r){return r!==null&&ko(r),xn(t,e.child,null,n),e=Io(t,t.pendingProps.children),e.flags|=2,t.memoizedState=null,e}function zd(e,t,n,r,l,i,o){if(n)return t.flags&256?(t.flags&=-257,r=ni(Error(w(422))),Lr(e,t,o,r)):t.memoizedState!==null?(t.child=e.child,t.flags|=128,null):(i=r.fallback,l=t.mode,r=jl({mode:"visible",children:r.children},l,0,null),i=Vt(i,l,o,null),i.flags|=2,r.return=t,i.return=t,r.sibling=i,t.child=r,t.mode&1&&xn(t,e.child,null,o),t.child.memoizedState=Vi(o),t.memoizedState=Bi,i);if(!(t.mode&1))return Lr(e,t,o,null);if(l.data==="$!"){if(r=l.nextSibling&&l.nextSibling.dataset,r)var u=r.dgst;return r=u,i=Error(w(419)),r=ni(i,r,void 0),Lr(e,t,o,r)}if(u=(o&e.childLanes)!==0,ye||u){if(r=ne,r!==null){switch(o&-o){case 4:l=2;break;case 16:l=8;break;case 64:case 128:case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:case 4194304:case 8388608:case 16777216:case 33554432:case 67108864:l=32;break;case 536870912:l=268435456;break;default:l=0}l=l&(r.suspendedLanes|o)?0:l,l!==0&&l!==i.retryLane&&(i.retryLane=l,it(e,l),$e(r,e,l,-1))}return Vo(),r=ni(Error(w(421))),Lr(e,t,o,r)}return l.data==="$?"?(t.flags|=128,t.child=e.child,t=Vd.bind(null,e),l._reactRetry=t,null):(e=i.treeContext,Ce=Et(l.nextSibling),Ee=t,W=!0,Fe=null,e!==null&&(Pe[ze++]=et,Pe[ze++]=tt,Pe[ze++]=Ht,et=e.id,tt=e.overflow,Ht=t),t=Io(t,r.children),t.flags|=4096,t)}function Qu(e,t,n){e.lanes|=t;var r=e.alternate;r!==null&&(r.lanes|=t),Oi(e.return,t,n)}function ri(e,t,n,r,l){var i=e.memoizedState;i===null?e.memoizedState={isBackwards:t,rendering:null,renderingStartTime:0,last:r,tail:n,tailMode:l}:(i.isBackwards=t,i.rendering=null,i.renderingStartTime=0,i.last=r,i.tail=n,i.tailMode=l)}function Za(e,t,n){var r=t.pendingProps,l=r.revealOrder,i=r.tail;if(pe(e,t,r.children,n),r=Q.current,r&2)r=r&1|2,t.flags|=128;else{if(e!==null&&e.flags&128)e:for(e=t.child;e!==null;){if(e.tag===13)e.memoizedState!==null&&Qu(e,n,t);else if(e.tag===19)Qu(e,n,t);else if(e.child!==null){e.child.return=e,e=e.child;continue}if(e===t)break e;for(;e.sibling===null;){if(e.return===null||e.return===t)break e;e=e.return}e.sibling.return=e.return,e=e.sibling}r&=1}if(U(Q,r),!(t.mode&1))t.memoizedState=null;else switch(l){case"forwards":for(n=t.child,l=null;n!==null;)e=n.alternate,e!==null&&sl(e)===null&&(l=n),n=n.sibling;n=l,n===null?(l=t.child,t.child=null):(l=n.sibling,n.sibling=null),ri(t,!1,l,n,i);break;case"backwards":for(n=null,l=t.child,t.child=null;l!==null;){if(e=l.alternate,e!==null&&sl(e)===null){t.child=l;break}e=l.sibling,l.sibling=n,n=l,l=e}ri(t,!0,n,null,i);break;case"together":ri(t,!1,null,null,void 0);break;default:t.memoizedState=null}return t.child}function Vr(e,t){!(t.mode&1)&&e!==null&&(e.alternate=null,t.alternate=null,t.flags|=2)}function ot(e,t,n){if(e!==null&&(t.dependencies=e.dependencies),Kt|=t.lanes,!(n&t.childLanes))return null;if(e!==null&&t.child!==e.child)throw Error(w(153));if(t.child!==null){for(e=t.child,n=Pt(e,e.pendingProps),t.child=n,n.return=t;e.sibling!==null;)e=e.sibling,n=n.sibling=Pt(e,e.pendingProps),n.return=t;n.sibling=null}return t.child}function Ld(e,t,n){switch(t.tag){case 3:Ga(t),wn();break;case 5:ka(t);break;case 1:xe(t.type)&&nl(t);break;case 4:Po(t,t.stateNode.containerInfo);break;case 10:var r=t.type._context,l=t.memoizedProps.value;U(il,r._currentValue),r._currentValue=l;break;case 13:if(r=t.memoizedState,r!==null)return r.dehydrated!==null?(U(Q,Q.current&1),t.flags|=128,null):n&t.child.childLanes?Xa(e,t,n):(U(Q,Q.current&1),e=ot(e,t,n),e!==null?e.sibling:null);U(Q,Q.current&1);break;case 19:if(r=(n&t.childLanes)!==0,e.flags&128){if(r)return Za(e,t,n);t.flags|=128}if(l=t.memoizedState,l!==null&&(l.rendering=null,l.tail=null,l.lastEffect=null),U(Q,Q.current),r)break;return null;case 22:case 23:return t.lanes=0,Ka(e,t,n)}return ot(e,t,n)}var Ja,Wi,qa,ba;Ja=function(e,t){for(var n=t.child;n!==null;){if(n.tag===5||n.tag===6)e.appendChild(n.stateNode);else if(n.tag!==4&&n.child!==null){n.child.return=n,n=n.child;continue}if(n===t)break;for(;n.sibling===null;){if(n.return===null||n.return===t)return;n=n.return}n.sibling.return=n.return,n=n.sibling}};Wi=function(){};qa=function(e,t,n,r){var l=e.memoizedProps;if(l!==r){e=t.stateNode,At(Ye.current);var i=null;switch(n){case"input":l=fi(e,l),r=fi(e,r),i=[];break;case"select":l=Y({},l,{value:void 0}),r=Y({},r,{value:void 0}),i=[];break;case"textarea":l=hi(e,l),r=hi(e,r),i=[];break;default:typeof l.onClick!="function"&&typeof r.onClick=="function"&&(e.onclick=el)}vi(n,r);var o;n=null;for(c in l)if(!r.hasOwnProperty(c)&&l.hasOwnProperty(c)&&l[c]!=null)if(c==="style"){var u=l[c];for(o in u)u.hasOwnProperty(o)&&(n||(n={}),n[o]="")}else c!=="dangerouslySetInnerHTML"&&c!=="children"&&c!=="suppressContentEditableWarning"&&c!=="suppressHydrationWarning"&&c!=="autoFocus"&&(Gn.hasOwnProperty(c)?i||(i=[]):(i=i||[]).push(c,null));for(c in r){var s=r[c];if(u=l!=null?l[c]:void 0,r.hasOwnProperty(c)&&s!==u&&(s!=null||u!=null))if(c==="style")if(u){for(o in u)!u.hasOwnProperty(o)||s&&s.hasOwnProperty(o)||(n||(n={}),n[o]="");for(o in s)s.hasOwnProperty(o)&&u[o]!==s[o]&&(n||(n={}),n[o]=s[o])}else n||(i||(i=[]),i.push(c,n)),n=s;else c==="dangerouslySetInnerHTML"?(s=s?s.__html:void 0,u=u?u.__html:void 0,s!=null&&u!==s&&(i=i||[]).push(c,s)):c==="children"?typeof s!="string"&&typeof s!="number"||(i=i||[]).push(c,""+s):c!=="suppressContentEditableWarning"&&c!=="suppressHydrationWarning"&&(Gn.hasOwnProperty(c)?(s!=null&&c==="onScroll"&&$("scroll",e),i||u===s||(i=[])):(i=i||[]).push(c,s))}n&&(i=i||[]).push("style",n);var c=i;(t.updateQueue=c)&&(t.flags|=4)}};ba=function(e,t,n,r){n!==r&&(t.flags|=4)};function Rn(e,t){if(!W)switch(e.tailMode){case"hidden":t=e.tail;for(var n=null;t!==null;)t.alternate!==null&&(n=t),t=t.sibling;n===null?e.tail=null:n.sibling=null;break;case"collapsed":n=e.tail;for(var r=null;n!==null;)n.alternate!==null&&(r=n),n=n.sibling;r===null?t||e.tail===null?e.tail=null:e.tail.sibling=null:r.sibling=null}}function se(e){var t=e.alternate!==null&&e.alternate.child===e.child,n=0,r=0;if(t)for(var l=e.child;l!==null;)n|=l.lanes|l.childLanes,r|=l.subtreeFlags&14680064,r|=l.flags&14680064,l.return=e,l=l.sibling;else for(l=e.child;l!==null;)n|=l.lanes|l.childLanes,r|=l.subtreeFlags,r|=l.flags,l.return=e,l=l.sibling;return e.subtreeFlags|=r,e.childLanes=n,t}function Td(e,t,n){var r=t.pendingProps;switch(So(t),t.tag){case 2:case 16:case 15:case 0:case 11:case 7:case 8:case 12:case 9:case 14:return se(t),null;case 1:return xe(t.type)&&tl(),se(t),null;case 3:return r=t.stateNode,Sn(),A(we),A(ce),Lo(),r.pendingContext&&(r.context=r.pendingContext,r.pendingContext=null),(e===null||e.child===null)&&(Pr(t)?t.flags|=4:e===null||e.memoizedState.isDehydrated&&!(t.flags&256)||(t.flags|=1024,Fe!==null&&(Ji(Fe),Fe=null))),Wi(e,t),se(t),null;case 5:zo(t);var l=At(or.current);if(n=t.type,e!==null&&t.stateNode!=null)qa(e,t,n,r,l),e.ref!==t.ref&&(t.flags|=512,t.flags|=2097152);else{if(!r){if(t.stateNode===null)throw Error(w(166));return se(t),null}if(e=At(Ye.current),Pr(t)){r=t.stateNode,n=t.type;var i=t.memoizedProps;switch(r[Qe]=t,r[lr]=i,e=(t.mode&1)!==0,n){case"dialog":$("cancel",r),$("close",r);break;case"iframe":case"object":case"embed":$("load",r);break;case"video":case"audio":for(l=0;l<Un.length;l++)$(Un[l],r);break;case"source":$("error",r);break;case"img":case"image":case"link":$("error",r),$("load",r);break;case"details":$("toggle",r);break;case"input":eu(r,i),$("invalid",r);break;case"select":r._wrapperState={wasMultiple:!!i.multiple},$("invalid",r);break;case"textarea":nu(r,i),$("invalid",r)}vi(n,i),l=null;for(var o in i)if(i.hasOwnProperty(o)){var u=i[o];o==="children"?typeof u=="string"?r.textContent!==u&&(i.suppressHydrationWarning!==!0&&jr(r.textContent,u,e),l=["children",u]):typeof u=="number"&&r.textContent!==""+u&&(i.suppressHydrationWarning!==!0&&jr(r.textContent,u,e),l=["children",""+u]):Gn.hasOwnProperty(o)&&u!=null&&o==="onScroll"&&$("scroll",r)}switch(n){case"input":wr(r),tu(r,i,!0);break;case"textarea":wr(r),ru(r);break;case"select":case"option":break;default:typeof i.onClick=="function"&&(r.onclick=el)}r=l,t.updateQueue=r,r!==null&&(t.flags|=4)}else{o=l.nodeType===9?l:l.ownerDocument,e==="http://www.w3.org/1999/xhtml"&&(e=js(n)),e==="http://www.w3.org/1999/xhtml"?n==="script"?(e=o.createElement("div"),e.innerHTML="<script><\/script>",e=e.removeChild(e.firstChild)):typeof r.is=="string"?e=o.createElement(n,{is:r.is}):(e=o.createElement(n),n==="select"&&(o=e,r.multiple?o.multiple=!0:r.size&&(o.size=r.size))):e=o.createElementNS(e,n),e[Qe]=t,e[lr]=r,Ja(e,t,!1,!1),t.stateNode=e;e:{switch(o=gi(n,r),n){case"dialog":$("cancel",e),$("close",e),l=r;break;case"iframe":case"object":case"embed":$("load",e),l=r;break;case"video":case"audio":for(l=0;l<Un.length;l++)$(Un[l],e);l=r;break;case"source":$("error",e),l=r;break;case"img":case"image":case"link":$("error",e),$("load",e),l=r;break;case"details":$("toggle",e),l=r;break;case"input":eu(e,r),l=fi(e,r),$("invalid",e);break;case"option":l=r;break;case"select":e._wrapperState={wasMultiple:!!r.multiple},l=Y({},r,{value:void 0}),$("invalid",e);break;case"textarea":nu(e,r),l=hi(e,r),$("invalid",e);break;default:l=r}vi(n,l),u=l;for(i in u)if(u.hasOwnProperty(i)){var s=u[i];i==="style"?Ls(e,s):i==="dangerouslySetInnerHTML"?(s=s?s.__html:void 0,s!=null&&Ps(e,s)):i==="children"?typeof s=="string"?(n!=="textarea"||s!=="")&&Xn(e,s):typeof s=="number"&&Xn(e,""+s):i!=="suppressContentEditableWarning"&&i!=="suppressHydrationWarning"&&i!=="autoFocus"&&(Gn.hasOwnProperty(i)?s!=null&&i==="onScroll"&&$("scroll",e):s!=null&&io(e,i,s,o))}switch(n){case"input":wr(e),tu(e,r,!1);break;case"textarea":wr(e),ru(e);break;case"option":r.value!=null&&e.setAttribute("value",""+zt(r.value));break;case"select":e.multiple=!!r.multiple,i=r.value,i!=null?fn(e,!!r.multiple,i,!1):r.defaultValue!=null&&fn(e,!!r.multiple,r.defaultValue,!0);break;default:typeof l.onClick=="function"&&(e.onclick=el)}switch(n){case"button":case"input":case"select":case"textarea":r=!!r.autoFocus;break e;case"img":r=!0;break e;default:r=!1}}r&&(t.flags|=4)}t.ref!==null&&(t.flags|=512,t.flags|=2097152)}return se(t),null;case 6:if(e&&t.stateNode!=null)ba(e,t,e.memoizedProps,r);else{if(typeof r!="string"&&t.stateNode===null)throw Error(w(166));if(n=At(or.current),At(Ye.current),Pr(t)){if(r=t.stateNode,n=t.memoizedProps,r[Qe]=t,(i=r.nodeValue!==n)&&(e=Ee,e!==null))switch(e.tag){case 3:jr(r.nodeValue,n,(e.mode&1)!==0);break;case 5:e.memoizedProps.suppressHydrationWarning!==!0&&jr(r.nodeValue,n,(e.mode&1)!==0)}i&&(t.flags|=4)}else r=(n.nodeType===9?n:n.ownerDocument).createTextNode(r),r[Qe]=t,t.stateNode=r}return se(t),null;case 13:if(A(Q),r=t.memoizedState,e===null||e.memoizedState!==null&&e.memoizedState.dehydrated!==null){if(W&&Ce!==null&&t.mode&1&&!(t.flags&128))ga(),wn(),t.flags|=98560,i=!1;else if(i=Pr(t),r!==null&&r.dehydrated!==null){if(e===null){if(!i)throw Error(w(318));if(i=t.memoizedState,i=i!==null?i.dehydrated:null,!i)throw Error(w(317));i[Qe]=t}else wn(),!(t.flags&128)&&(t.memoizedState=null),t.flags|=4;se(t),i=!1}else Fe!==null&&(Ji(Fe),Fe=null),i=!0;if(!i)return t.flags&65536?t:null}return t.flags&128?(t.lanes=n,t):(r=r!==null,r!==(e!==null&&e.memoizedState!==null)&&r&&(t.child.flags|=8192,t.mode&1&&(e===null||Q.current&1?ee===0&&(ee=3):Vo())),t.updateQueue!==null&&(t.flags|=4),se(t),null);case 4:return Sn(),Wi(e,t),e===null&&nr(t.stateNode.containerInfo),se(t),null;case 10:return No(t.type._context),se(t),null;case 17:return xe(t.type)&&tl(),se(t),null;case 19:if(A(Q),i=t.memoizedState,i===null)return se(t),null;if(r=(t.flags&128)!==0,o=i.rendering,o===null)if(r)Rn(i,!1);else{if(ee!==0||e!==null&&e.flags&128)for(e=t.child;e!==null;){if(o=sl(e),o!==null){for(t.flags|=128,Rn(i,!1),r=o.updateQueue,r!==null&&(t.updateQueue=r,t.flags|=4),t.subtreeFlags=0,r=n,n=t.child;n!==null;)i=n,e=r,i.flags&=14680066,o=i.alternate,o===null?(i.childLanes=0,i.lanes=e,i.child=null,i.subtreeFlags=0,i.memoizedProps=null,i.memoizedState=null,i.updateQueue=null,i.dependencies=null,i.stateNode=null):(i.childLanes=o.childLanes,i.lanes=o.lanes,i.child=o.child,i.subtreeFlags=0,i.deletions=null,i.memoizedProps=o.memoizedProps,i.memoizedState=o.memoizedState,i.updateQueue=o.updateQueue,i.type=o.type,e=o.dependencies,i.dependencies=e===null?null:{lanes:e.lanes,firstContext:e.firstContext}),n=n.sibling;return U(Q,Q.current&1|2),t.child}e=e.sibling}i.tail!==null&&Z()>Cn&&(t.flags|=128,r=!0,Rn(i,!1),t.lanes=4194304)}else{if(!r)if(e=sl(o),e!==null){if(t.flags|=128,r=!0,n=e.updateQueue,n!==null&&(t.updateQueue=n,t.flags|=4),Rn(i,!0),i.tail===null&&i.tailMode==="hidden"&&!o.alternate&&!W)return se(t),null}else 2*Z()-i.renderingStartTime>Cn&&n!==1073741824&&(t.flags|=128,r=!0,Rn(i,!1),t.lanes=4194304);i.isBackwards?(o.sibling=t.child,t.child=o):(n=i.last,n!==null?n.sibling=o:t.child=o,i.last=o)}return i.tail!==null?(t=i.tail,i.rendering=t,i.tail=t.sibling,i.renderingStartTime=Z(),t.sibling=null,n=Q.current,U(Q,r?n&1|2:n&1),t):(se(t),null);case 22:case 23:return Bo(),r=t.memoizedState!==null,e!==null&&e.memoizedState!==null!==r&&(t.flags|=8192),r&&t.mode&1?ke&1073741824&&(se(t),t.subtreeFlags&6&&(t.flags|=8192)):se(t),null;case 24:return null;case 25:return null}throw Error(w(156,t.tag))}function Md(e,t){switch(So(t),t.tag){case 1:return xe(t.type)&&tl(),e=t.flags,e&65536?(t.flags=e&-65537|128,t):null;case 3:return Sn(),A(we),A(ce),Lo(),e=t.flags,e&65536&&!(e&128)?(t.flags=e&-65537|128,t):null;case 5:return zo(t),null;case 13:if(A(Q),e=t.memoizedState,e!==null&&e.dehydrated!==null){if(t.alternate===null)throw Error(w(340));wn()}return e=t.flags,e&65536?(t.flags=e&-65537|128,t):null;case 19:return A(Q),null;case 4:return Sn(),null;case 10:return No(t.type._context),null;case 22:case 23:return Bo(),null;case 24:return null;default:return null}}var Tr=!1,ae=!1,Rd=typeof WeakSet=="function"?WeakSet:Set,N=null;function an(e,t){var n=e.ref;if(n!==null)if(typeof n=="function")try{n(null)}catch(r){G(e,t,r)}else n.current=null}function Hi(e,t,n){try{n()}catch(r){G(e,t,r)}}var Ku=!1;function Dd(e,t){if(ji=Jr,e=la(),wo(e)){if("selectionStart"in e)var n={start:e.selectionStart,end:e.selectionEnd};else e:{n=(n=e.ownerDocument)&&n.defaultView||window;var r=n.getSelection&&n.getSelection();if(r&&r.rangeCount!==0){n=r.anchorNode;var l=r.anchorOffset,i=r.focusNode;r=r.focusOffset;try{n.nodeType,i.nodeType}catch{n=null;break e}var o=0,u=-1,s=-1,c=0,g=0,m=e,h=null;t:for(;;){for(var x;m!==n||l!==0&&m.nodeType!==3||(u=o+l),m!==i||r!==0&&m.nodeType!==3||(s=o+r),m.nodeType===3&&(o+=m.nodeValue.length),(x=m.firstChild)!==null;)h=m,m=x;for(;;){if(m===e)break t;if(h===n&&++c===l&&(u=o),h===i&&++g===r&&(s=o),(x=m.nextSibling)!==null)break;m=h,h=m.parentNode}m=x}n=u===-1||s===-1?null:{start:u,end:s}}else n=null}n=n||{start:0,end:0}}else n=null;for(Pi={focusedElem:e,selectionRange:n},Jr=!1,N=t;N!==null;)if(t=N,e=t.child,(t.subtreeFlags&1028)!==0&&e!==null)e.return=t,N=e;else for(;N!==null;){t=N;try{var S=t.alternate;if(t.flags&1024)switch(t.tag){case 0:case 11:case 15:break;case 1:if(S!==null){var k=S.memoizedProps,F=S.memoizedState,f=t.stateNode,a=f.getSnapshotBeforeUpdate(t.elementType===t.type?k:Oe(t.type,k),F);f.__reactInternalSnapshotBeforeUpdate=a}break;case 3:var p=t.stateNode.containerInfo;p.nodeType===1?p.textContent="":p.nodeType===9&&p.documentElement&&p.removeChild(p.documentElement);break;case 5:case 6:case 4:case 17:break;default:throw Error(w(163))}}catch(y){G(t,t.return,y)}if(e=t.sibling,e!==null){e.return=t.return,N=e;break}N=t.return}return S=Ku,Ku=!1,S}function Qn(e,t,n){var r=t.updateQueue;if(r=r!==null?r.lastEffect:null,r!==null){var l=r=r.next;do{if((l.tag&e)===e){var i=l.destroy;l.destroy=void 0,i!==void 0&&Hi(t,n,i)}l=l.next}while(l!==r)}}function Nl(e,t){if(t=t.updateQueue,t=t!==null?t.lastEffect:null,t!==null){var n=t=t.next;do{if((n.tag&e)===e){var r=n.create;n.destroy=r()}n=n.next}while(n!==t)}}function Qi(e){var t=e.ref;if(t!==null){var n=e.stateNode;switch(e.tag){case 5:e=n;break;default:e=n}typeof t=="function"?t(e):t.current=e}}function ec(e){var t=e.alternate;t!==null&&(e.alternate=null,ec(t)),e.child=null,e.deletions=null,e.sibling=null,e.tag===5&&(t=e.stateNode,t!==null&&(delete t[Qe],delete t[lr],delete t[Ti],delete t[vd],delete t[gd])),e.stateNode=null,e.return=null,e.dependencies=null,e.memoizedProps=null,e.memoizedState=null,e.pendingProps=null,e.stateNode=null,e.updateQueue=null}function tc(e){return e.tag===5||e.tag===3||e.tag===4}function Yu(e){e:for(;;){for(;e.sibling===null;){if(e.return===null||tc(e.return))return null;e=e.return}for(e.sibling.return=e.return,e=e.sibling;e.tag!==5&&e.tag!==6&&e.tag!==18;){if(e.flags&2||e.child===null||e.tag===4)continue e;e.child.return=e,e=e.child}if(!(e.flags&2))return e.stateNode}}function Ki(e,t,n){var r=e.tag;if(r===5||r===6)e=e.stateNode,t?n.nodeType===8?n.parentNode.insertBefore(e,t):n.insertBefore(e,t):(n.nodeType===8?(t=n.parentNode,t.insertBefore(e,n)):(t=n,t.appendChild(e)),n=n._reactRootContainer,n!=null||t.onclick!==null||(t.onclick=el));else if(r!==4&&(e=e.child,e!==null))for(Ki(e,t,n),e=e.sibling;e!==null;)Ki(e,t,n),e=e.sibling}function Yi(e,t,n){var r=e.tag;if(r===5||r===6)e=e.stateNode,t?n.insertBefore(e,t):n.appendChild(e);else if(r!==4&&(e=e.child,e!==null))for(Yi(e,t,n),e=e.sibling;e!==null;)Yi(e,t,n),e=e.sibling}var le=null,Ie=!1;function ft(e,t,n){for(n=n.child;n!==null;)nc(e,t,n),n=n.sibling}function nc(e,t,n){if(Ke&&typeof Ke.onCommitFiberUnmount=="function")try{Ke.onCommitFiberUnmount(gl,n)}catch{}switch(n.tag){case 5:ae||an(n,t);case 6:var r=le,l=Ie;le=null,ft(e,t,n),le=r,Ie=l,le!==null&&(Ie?(e=le,n=n.stateNode,e.nodeType===8?e.parentNode.removeChild(n):e.removeChild(n)):le.removeChild(n.stateNode));break;case 18:le!==null&&(Ie?(e=le,n=n.stateNode,e.nodeType===8?Zl(e.parentNode,n):e.nodeType===1&&Zl(e,n),bn(e)):Zl(le,n.stateNode));break;case 4:r=le,l=Ie,le=n.stateNode.containerInfo,Ie=!0,ft(e,t,n),le=r,Ie=l;break;case 0:case 11:case 14:case 15:if(!ae&&(r=n.updateQueue,r!==null&&(r=r.lastEffect,r!==null))){l=r=r.next;do{var i=l,o=i.destroy;i=i.tag,o!==void 0&&(i&2||i&4)&&Hi(n,t,o),l=l.next}while(l!==r)}ft(e,t,n);break;case 1:if(!ae&&(an(n,t),r=n.stateNode,typeof r.componentWillUnmount=="function"))try{r.props=n.memoizedProps,r.state=n.memoizedState,r.componentWillUnmount()}catch(u){G(n,t,u)}ft(e,t,n);break;case 21:ft(e,t,n);break;case 22:n.mode&1?(ae=(r=ae)||n.memoizedState!==null,ft(e,t,n),ae=r):ft(e,t,n);break;default:ft(e,t,n)}}function Gu(e){var t=e.updateQueue;if(t!==null){e.updateQueue=null;var n=e.stateNode;n===null&&(n=e.stateNode=new Rd),t.forEach(function(r){var l=Wd.bind(null,e,r);n.has(r)||(n.add(r),r.then(l,l))})}}function De(e,t){var n=t.deletions;if(n!==null)for(var r=0;r<n.length;r++){var l=n[r];try{var i=e,o=t,u=o;e:for(;u!==null;){switch(u.tag){case 5:le=u.stateNode,Ie=!1;break e;case 3:le=u.stateNode.containerInfo,Ie=!0;break e;case 4:le=u.stateNode.containerInfo,Ie=!0;break e}u=u.return}if(le===null)throw Error(w(160));nc(i,o,l),le=null,Ie=!1;var s=l.alternate;s!==null&&(s.return=null),l.return=null}catch(c){G(l,t,c)}}if(t.subtreeFlags&12854)for(t=t.child;t!==null;)rc(t,e),t=t.sibling}function rc(e,t){var n=e.alternate,r=e.flags;switch(e.tag){case 0:case 11:case 14:case 15:if(De(t,e),We(e),r&4){try{Qn(3,e,e.return),Nl(3,e)}catch(k){G(e,e.return,k)}try{Qn(5,e,e.return)}catch(k){G(e,e.return,k)}}break;case 1:De(t,e),We(e),r&512&&n!==null&&an(n,n.return);break;case 5:if(De(t,e),We(e),r&512&&n!==null&&an(n,n.return),e.flags&32){var l=e.stateNode;try{Xn(l,"")}catch(k){G(e,e.return,k)}}if(r&4&&(l=e.stateNode,l!=null)){var i=e.memoizedProps,o=n!==null?n.memoizedProps:i,u=e.type,s=e.updateQueue;if(e.updateQueue=null,s!==null)try{u==="input"&&i.type==="radio"&&i.name!=null&&Ns(l,i),gi(u,o);var c=gi(u,i);for(o=0;o<s.length;o+=2){var g=s[o],m=s[o+1];g==="style"?Ls(l,m):g==="dangerouslySetInnerHTML"?Ps(l,m):g==="children"?Xn(l,m):io(l,g,m,c)}switch(u){case"input":di(l,i);break;case"textarea":_s(l,i);break;case"select":var h=l._wrapperState.wasMultiple;l._wrapperState.wasMultiple=!!i.multiple;var x=i.value;x!=null?fn(l,!!i.multiple,x,!1):h!==!!i.multiple&&(i.defaultValue!=null?fn(l,!!i.multiple,i.defaultValue,!0):fn(l,!!i.multiple,i.multiple?[]:"",!1))}l[lr]=i}catch(k){G(e,e.return,k)}}break;case 6:if(De(t,e),We(e),r&4){if(e.stateNode===null)throw Error(w(162));l=e.stateNode,i=e.memoizedProps;try{l.nodeValue=i}catch(k){G(e,e.return,k)}}break;case 3:if(De(t,e),We(e),r&4&&n!==null&&n.memoizedState.isDehydrated)try{bn(t.containerInfo)}catch(k){G(e,e.return,k)}break;case 4:De(t,e),We(e);break;case 13:De(t,e),We(e),l=e.child,l.flags&8192&&(i=l.memoizedState!==null,l.stateNode.isHidden=i,!i||l.alternate!==null&&l.alternate.memoizedState!==null||($o=Z())),r&4&&Gu(e);break;case 22:if(g=n!==null&&n.memoizedState!==null,e.mode&1?(ae=(c=ae)||g,De(t,e),ae=c):De(t,e),We(e),r&8192){if(c=e.memoizedState!==null,(e.stateNode.isHidden=c)&&!g&&e.mode&1)for(N=e,g=e.child;g!==null;){for(m=N=g;N!==null;){switch(h=N,x=h.child,h.tag){case 0:case 11:case 14:case 15:Qn(4,h,h.return);break;case 1:an(h,h.return);var S=h.stateNode;if(typeof S.componentWillUnmount=="function"){r=h,n=h.return;try{t=r,S.props=t.memoizedProps,S.state=t.memoizedState,S.componentWillUnmount()}catch(k){G(r,n,k)}}break;case 5:an(h,h.return);break;case 22:if(h.memoizedState!==null){Zu(m);continue}}x!==null?(x.return=h,N=x):Zu(m)}g=g.sibling}e:for(g=null,m=e;;){if(m.tag===5){if(g===null){g=m;try{l=m.stateNode,c?(i=l.style,typeof i.setProperty=="function"?i.setProperty("display","none","important"):i.display="none"):(u=m.stateNode,s=m.memoizedProps.style,o=s!=null&&s.hasOwnProperty("display")?s.display:null,u.style.display=zs("display",o))}catch(k){G(e,e.return,k)}}}else if(m.tag===6){if(g===null)try{m.stateNode.nodeValue=c?"":m.memoizedProps}catch(k){G(e,e.return,k)}}else if((m.tag!==22&&m.tag!==23||m.memoizedState===null||m===e)&&m.child!==null){m.child.return=m,m=m.child;continue}if(m===e)break e;for(;m.sibling===null;){if(m.return===null||m.return===e)break e;g===m&&(g=null),m=m.return}g===m&&(g=null),m.sibling.return=m.return,m=m.sibling}}break;case 19:De(t,e),We(e),r&4&&Gu(e);break;case 21:break;default:De(t,e),We(e)}}function We(e){var t=e.flags;if(t&2){try{e:{for(var n=e.return;n!==null;){if(tc(n)){var r=n;break e}n=n.return}throw Error(w(160))}switch(r.tag){case 5:var l=r.stateNode;r.flags&32&&(Xn(l,""),r.flags&=-33);var i=Yu(e);Yi(e,i,l);break;case 3:case 4:var o=r.stateNode.containerInfo,u=Yu(e);Ki(e,u,o);break;default:throw Error(w(161))}}catch(s){G(e,e.return,s)}e.flags&=-3}t&4096&&(e.flags&=-4097)}function Od(e,t,n){N=e,lc(e)}function lc(e,t,n){for(var r=(e.mode&1)!==0;N!==null;){var l=N,i=l.child;if(l.tag===22&&r){var o=l.memoizedState!==null||Tr;if(!o){var u=l.alternate,s=u!==null&&u.memoizedState!==null||ae;u=Tr;var c=ae;if(Tr=o,(ae=s)&&!c)for(N=l;N!==null;)o=N,s=o.child,o.tag===22&&o.memoizedState!==null?Ju(l):s!==null?(s.return=o,N=s):Ju(l);for(;i!==null;)N=i,lc(i),i=i.sibling;N=l,Tr=u,ae=c}Xu(e)}else l.subtreeFlags&8772&&i!==null?(i.return=l,N=i):Xu(e)}}function Xu(e){for(;N!==null;){var t=N;if(t.flags&8772){var n=t.alternate;try{if(t.flags&8772)switch(t.tag){case 0:case 11:case 15:ae||Nl(5,t);break;case 1:var r=t.stateNode;if(t.flags&4&&!ae)if(n===null)r.componentDidMount();else{var l=t.elementType===t.type?n.memoizedProps:Oe(t.type,n.memoizedProps);r.componentDidUpdate(l,n.memoizedState,r.__reactInternalSnapshotBeforeUpdate)}var i=t.updateQueue;i!==null&&Ru(t,i,r);break;case 3:var o=t.updateQueue;if(o!==null){if(n=null,t.child!==null)switch(t.child.tag){case 5:n=t.child.stateNode;break;case 1:n=t.child.stateNode}Ru(t,o,n)}break;case 5:var u=t.stateNode;if(n===null&&t.flags&4){n=u;var s=t.memoizedProps;switch(t.type){case"button":case"input":case"select":case"textarea":s.autoFocus&&n.focus();break;case"img":s.src&&(n.src=s.src)}}break;case 6:break;case 4:break;case 12:break;case 13:if(t.memoizedState===null){var c=t.alternate;if(c!==null){var g=c.memoizedState;if(g!==null){var m=g.dehydrated;m!==null&&bn(m)}}}break;case 19:case 17:case 21:case 22:case 23:case 25:break;default:throw Error(w(163))}ae||t.flags&512&&Qi(t)}catch(h){G(t,t.return,h)}}if(t===e){N=null;break}if(n=t.sibling,n!==null){n.return=t.return,N=n;break}N=t.return}}function Zu(e){for(;N!==null;){var t=N;if(t===e){N=null;break}var n=t.sibling;if(n!==null){n.return=t.return,N=n;break}N=t.return}}function Ju(e){for(;N!==null;){var t=N;try{switch(t.tag){case 0:case 11:case 15:var n=t.return;try{Nl(4,t)}catch(s){G(t,n,s)}break;case 1:var r=t.stateNode;if(typeof r.componentDidMount=="function"){var l=t.return;try{r.componentDidMount()}catch(s){G(t,l,s)}}var i=t.return;try{Qi(t)}catch(s){G(t,i,s)}break;case 5:var o=t.return;try{Qi(t)}catch(s){G(t,o,s)}}}catch(s){G(t,t.return,s)}if(t===e){N=null;break}var u=t.sibling;if(u!==null){u.return=t.return,N=u;break}N=t.return}}var Id=Math.ceil,fl=ut.ReactCurrentDispatcher,Fo=ut.ReactCurrentOwner,Te=ut.ReactCurrentBatchConfig,D=0,ne=null,J=null,ie=0,ke=0,cn=Mt(0),ee=0,cr=null,Kt=0,_l=0,Uo=0,Kn=null,ge=null,$o=0,Cn=1/0,Je=null,dl=!1,Gi=null,_t=null,Mr=!1,xt=null,pl=0,Yn=0,Xi=null,Wr=-1,Hr=0;function he(){return D&6?Z():Wr!==-1?Wr:Wr=Z()}function jt(e){return e.mode&1?D&2&&ie!==0?ie&-ie:wd.transition!==null?(Hr===0&&(Hr=Vs()),Hr):(e=I,e!==0||(e=window.event,e=e===void 0?16:Xs(e.type)),e):1}function $e(e,t,n,r){if(50<Yn)throw Yn=0,Xi=null,Error(w(185));dr(e,n,r),(!(D&2)||e!==ne)&&(e===ne&&(!(D&2)&&(_l|=n),ee===4&&yt(e,ie)),Se(e,r),n===1&&D===0&&!(t.mode&1)&&(Cn=Z()+500,kl&&Rt()))}function Se(e,t){var n=e.callbackNode;wf(e,t);var r=Zr(e,e===ne?ie:0);if(r===0)n!==null&&ou(n),e.callbackNode=null,e.callbackPriority=0;else if(t=r&-r,e.callbackPriority!==t){if(n!=null&&ou(n),t===1)e.tag===0?yd(qu.bind(null,e)):ha(qu.bind(null,e)),hd(function(){!(D&6)&&Rt()}),n=null;else{switch(Ws(r)){case 1:n=co;break;case 4:n=As;break;case 16:n=Xr;break;case 536870912:n=Bs;break;default:n=Xr}n=dc(n,ic.bind(null,e))}e.callbackPriority=t,e.callbackNode=n}}function ic(e,t){if(Wr=-1,Hr=0,D&6)throw Error(w(327));var n=e.callbackNode;if(vn()&&e.callbackNode!==n)return null;var r=Zr(e,e===ne?ie:0);if(r===0)return null;if(r&30||r&e.expiredLanes||t)t=hl(e,r);else{t=r;var l=D;D|=2;var i=uc();(ne!==e||ie!==t)&&(Je=null,Cn=Z()+500,Bt(e,t));do try{$d();break}catch(u){oc(e,u)}while(!0);Eo(),fl.current=i,D=l,J!==null?t=0:(ne=null,ie=0,t=ee)}if(t!==0){if(t===2&&(l=ki(e),l!==0&&(r=l,t=Zi(e,l))),t===1)throw n=cr,Bt(e,0),yt(e,r),Se(e,Z()),n;if(t===6)yt(e,r);else{if(l=e.current.alternate,!(r&30)&&!Fd(l)&&(t=hl(e,r),t===2&&(i=ki(e),i!==0&&(r=i,t=Zi(e,i))),t===1))throw n=cr,Bt(e,0),yt(e,r),Se(e,Z()),n;switch(e.finishedWork=l,e.finishedLanes=r,t){case 0:case 1:throw Error(w(345));case 2:Ft(e,ge,Je);break;case 3:if(yt(e,r),(r&130023424)===r&&(t=$o+500-Z(),10<t)){if(Zr(e,0)!==0)break;if(l=e.suspendedLanes,(l&r)!==r){he(),e.pingedLanes|=e.suspendedLanes&l;break}e.timeoutHandle=Li(Ft.bind(null,e,ge,Je),t);break}Ft(e,ge,Je);break;case 4:if(yt(e,r),(r&4194240)===r)break;for(t=e.eventTimes,l=-1;0<r;){var o=31-Ue(r);i=1<<o,o=t[o],o>l&&(l=o),r&=~i}if(r=l,r=Z()-r,r=(120>r?120:480>r?480:1080>r?1080:1920>r?1920:3e3>r?3e3:4320>r?4320:1960*Id(r/1960))-r,10<r){e.timeoutHandle=Li(Ft.bind(null,e,ge,Je),r);break}Ft(e,ge,Je);break;case 5:Ft(e,ge,Je);break;default:throw Error(w(329))}}}return Se(e,Z()),e.callbackNode===n?ic.bind(null,e):null}function Zi(e,t){var n=Kn;return e.current.memoizedState.isDehydrated&&(Bt(e,t).flags|=256),e=hl(e,t),e!==2&&(t=ge,ge=n,t!==null&&Ji(t)),e}function Ji(e){ge===null?ge=e:ge.push.apply(ge,e)}function Fd(e){for(var t=e;;){if(t.flags&16384){var n=t.updateQueue;if(n!==null&&(n=n.stores,n!==null))for(var r=0;r<n.length;r++){var l=n[r],i=l.getSnapshot;l=l.value;try{if(!Ae(i(),l))return!1}catch{return!1}}}if(n=t.child,t.subtreeFlags&16384&&n!==null)n.return=t,t=n;else{if(t===e)break;for(;t.sibling===null;){if(t.return===null||t.return===e)return!0;t=t.return}t.sibling.return=t.return,t=t.sibling}}return!0}function yt(e,t){for(t&=~Uo,t&=~_l,e.suspendedLanes|=t,e.pingedLanes&=~t,e=e.expirationTimes;0<t;){var n=31-Ue(t),r=1<<n;e[n]=-1,t&=~r}}function qu(e){if(D&6)throw Error(w(327));vn();var t=Zr(e,0);if(!(t&1))return Se(e,Z()),null;var n=hl(e,t);if(e.tag!==0&&n===2){var r=ki(e);r!==0&&(t=r,n=Zi(e,r))}if(n===1)throw n=cr,Bt(e,0),yt(e,t),Se(e,Z()),n;if(n===6)throw Error(w(345));return e.finishedWork=e.current.alternate,e.finishedLanes=t,Ft(e,ge,Je),Se(e,Z()),null}function Ao(e,t){var n=D;D|=1;try{return e(t)}finally{D=n,D===0&&(Cn=Z()+500,kl&&Rt())}}function Yt(e){xt!==null&&xt.tag===0&&!(D&6)&&vn();var t=D;D|=1;var n=Te.transition,r=I;try{if(Te.transition=null,I=1,e)return e()}finally{I=r,Te.transition=n,D=t,!(D&6)&&Rt()}}function Bo(){ke=cn.current,A(cn)}function Bt(e,t){e.finishedWork=null,e.finishedLanes=0;var n=e.timeoutHandle;if(n!==-1&&(e.timeoutHandle=-1,pd(n)),J!==null)for(n=J.return;n!==null;){var r=n;switch(So(r),r.tag){case 1:r=r.type.childContextTypes,r!=null&&tl();break;case 3:Sn(),A(we),A(ce),Lo();break;case 5:zo(r);break;case 4:Sn();break;case 13:A(Q);break;case 19:A(Q);break;case 10:No(r.type._context);break;case 22:case 23:Bo()}n=n.return}if(ne=e,J=e=Pt(e.current,null),ie=ke=t,ee=0,cr=null,Uo=_l=Kt=0,ge=Kn=null,$t!==null){for(t=0;t<$t.length;t++)if(n=$t[t],r=n.interleaved,r!==null){n.interleaved=null;var l=r.next,i=n.pending;if(i!==null){var o=i.next;i.next=l,r.next=o}n.pending=r}$t=null}return e}function oc(e,t){do{var n=J;try{if(Eo(),Ar.current=cl,al){for(var r=K.memoizedState;r!==null;){var l=r.queue;l!==null&&(l.pending=null),r=r.next}al=!1}if(Qt=0,te=b=K=null,Hn=!1,ur=0,Fo.current=null,n===null||n.return===null){ee=1,cr=t,J=null;break}e:{var i=e,o=n.return,u=n,s=t;if(t=ie,u.flags|=32768,s!==null&&typeof s=="object"&&typeof s.then=="function"){var c=s,g=u,m=g.tag;if(!(g.mode&1)&&(m===0||m===11||m===15)){var h=g.alternate;h?(g.updateQueue=h.updateQueue,g.memoizedState=h.memoizedState,g.lanes=h.lanes):(g.updateQueue=null,g.memoizedState=null)}var x=$u(o);if(x!==null){x.flags&=-257,Au(x,o,u,i,t),x.mode&1&&Uu(i,c,t),t=x,s=c;var S=t.updateQueue;if(S===null){var k=new Set;k.add(s),t.updateQueue=k}else S.add(s);break e}else{if(!(t&1)){Uu(i,c,t),Vo();break e}s=Error(w(426))}}else if(W&&u.mode&1){var F=$u(o);if(F!==null){!(F.flags&65536)&&(F.flags|=256),Au(F,o,u,i,t),ko(kn(s,u));break e}}i=s=kn(s,u),ee!==4&&(ee=2),Kn===null?Kn=[i]:Kn.push(i),i=o;do{switch(i.tag){case 3:i.flags|=65536,t&=-t,i.lanes|=t;var f=Wa(i,s,t);Mu(i,f);break e;case 1:u=s;var a=i.type,p=i.stateNode;if(!(i.flags&128)&&(typeof a.getDerivedStateFromError=="function"||p!==null&&typeof p.componentDidCatch=="function"&&(_t===null||!_t.has(p)))){i.flags|=65536,t&=-t,i.lanes|=t;var y=Ha(i,u,t);Mu(i,y);break e}}i=i.return}while(i!==null)}ac(n)}catch(C){t=C,J===n&&n!==null&&(J=n=n.return);continue}break}while(!0)}function uc(){var e=fl.current;return fl.current=cl,e===null?cl:e}function Vo(){(ee===0||ee===3||ee===2)&&(ee=4),ne===null||!(Kt&268435455)&&!(_l&268435455)||yt(ne,ie)}function hl(e,t){var n=D;D|=2;var r=uc();(ne!==e||ie!==t)&&(Je=null,Bt(e,t));do try{Ud();break}catch(l){oc(e,l)}while(!0);if(Eo(),D=n,fl.current=r,J!==null)throw Error(w(261));return ne=null,ie=0,ee}function Ud(){for(;J!==null;)sc(J)}function $d(){for(;J!==null&&!cf();)sc(J)}function sc(e){var t=fc(e.alternate,e,ke);e.memoizedProps=e.pendingProps,t===null?ac(e):J=t,Fo.current=null}function ac(e){var t=e;do{var n=t.alternate;if(e=t.return,t.flags&32768){if(n=Md(n,t),n!==null){n.flags&=32767,J=n;return}if(e!==null)e.flags|=32768,e.subtreeFlags=0,e.deletions=null;else{ee=6,J=null;return}}else if(n=Td(n,t,ke),n!==null){J=n;return}if(t=t.sibling,t!==null){J=t;return}J=t=e}while(t!==null);ee===0&&(ee=5)}function Ft(e,t,n){var r=I,l=Te.transition;try{Te.transition=null,I=1,Ad(e,t,n,r)}finally{Te.transition=l,I=r}return null}function Ad(e,t,n,r){do vn();while(xt!==null);if(D&6)throw Error(w(327));n=e.finishedWork;var l=e.finishedLanes;if(n===null)return null;if(e.finishedWork=null,e.finishedLanes=0,n===e.current)throw Error(w(177));e.callbackNode=null,e.callbackPriority=0;var i=n.lanes|n.childLanes;if(xf(e,i),e===ne&&(J=ne=null,ie=0),!(n.subtreeFlags&2064)&&!(n.flags&2064)||Mr||(Mr=!0,dc(Xr,function(){return vn(),null})),i=(n.flags&15990)!==0,n.subtreeFlags&15990||i){i=Te.transition,Te.transition=null;var o=I;I=1;var u=D;D|=4,Fo.current=null,Dd(e,n),rc(n,e),od(Pi),Jr=!!ji,Pi=ji=null,e.current=n,Od(n),ff(),D=u,I=o,Te.transition=i}else e.current=n;if(Mr&&(Mr=!1,xt=e,pl=l),i=e.pendingLanes,i===0&&(_t=null),hf(n.stateNode),Se(e,Z()),t!==null)for(r=e.onRecoverableError,n=0;n<t.length;n++)l=t[n],r(l.value,{componentStack:l.stack,digest:l.digest});if(dl)throw dl=!1,e=Gi,Gi=null,e;return pl&1&&e.tag!==0&&vn(),i=e.pendingLanes,i&1?e===Xi?Yn++:(Yn=0,Xi=e):Yn=0,Rt(),null}function vn(){if(xt!==null){var e=Ws(pl),t=Te.transition,n=I;try{if(Te.transition=null,I=16>e?16:e,xt===null)var r=!1;else{if(e=xt,xt=null,pl=0,D&6)throw Error(w(331));var l=D;for(D|=4,N=e.current;N!==null;){var i=N,o=i.child;if(N.flags&16){var u=i.deletions;if(u!==null){for(var s=0;s<u.length;s++){var c=u[s];for(N=c;N!==null;){var g=N;switch(g.tag){case 0:case 11:case 15:Qn(8,g,i)}var m=g.child;if(m!==null)m.return=g,N=m;else for(;N!==null;){g=N;var h=g.sibling,x=g.return;if(ec(g),g===c){N=null;break}if(h!==null){h.return=x,N=h;break}N=x}}}var S=i.alternate;if(S!==null){var k=S.child;if(k!==null){S.child=null;do{var F=k.sibling;k.sibling=null,k=F}while(k!==null)}}N=i}}if(i.subtreeFlags&2064&&o!==null)o.return=i,N=o;else e:for(;N!==null;){if(i=N,i.flags&2048)switch(i.tag){case 0:case 11:case 15:Qn(9,i,i.return)}var f=i.sibling;if(f!==null){f.return=i.return,N=f;break e}N=i.return}}var a=e.current;for(N=a;N!==null;){o=N;var p=o.child;if(o.subtreeFlags&2064&&p!==null)p.return=o,N=p;else e:for(o=a;N!==null;){if(u=N,u.flags&2048)try{switch(u.tag){case 0:case 11:case 15:Nl(9,u)}}catch(C){G(u,u.return,C)}if(u===o){N=null;break e}var y=u.sibling;if(y!==null){y.return=u.return,N=y;break e}N=u.return}}if(D=l,Rt(),Ke&&typeof Ke.onPostCommitFiberRoot=="function")try{Ke.onPostCommitFiberRoot(gl,e)}catch{}r=!0}return r}finally{I=n,Te.transition=t}}return!1}function bu(e,t,n){t=kn(n,t),t=Wa(e,t,1),e=Nt(e,t,1),t=he(),e!==null&&(dr(e,1,t),Se(e,t))}function G(e,t,n){if(e.tag===3)bu(e,e,n);else for(;t!==null;){if(t.tag===3){bu(t,e,n);break}else if(t.tag===1){var r=t.stateNode;if(typeof t.type.getDerivedStateFromError=="function"||typeof r.componentDidCatch=="function"&&(_t===null||!_t.has(r))){e=kn(n,e),e=Ha(t,e,1),t=Nt(t,e,1),e=he(),t!==null&&(dr(t,1,e),Se(t,e));break}}t=t.return}}function Bd(e,t,n){var r=e.pingCache;r!==null&&r.delete(t),t=he(),e.pingedLanes|=e.suspendedLanes&n,ne===e&&(ie&n)===n&&(ee===4||ee===3&&(ie&130023424)===ie&&500>Z()-$o?Bt(e,0):Uo|=n),Se(e,t)}function cc(e,t){t===0&&(e.mode&1?(t=kr,kr<<=1,!(kr&130023424)&&(kr=4194304)):t=1);var n=he();e=it(e,t),e!==null&&(dr(e,t,n),Se(e,n))}function Vd(e){var t=e.memoizedState,n=0;t!==null&&(n=t.retryLane),cc(e,n)}function Wd(e,t){var n=0;switch(e.tag){case 13:var r=e.stateNode,l=e.memoizedState;l!==null&&(n=l.retryLane);break;case 19:r=e.stateNode;break;default:throw Error(w(314))}r!==null&&r.delete(t),cc(e,n)}var fc;fc=function(e,t,n){if(e!==null)if(e.memoizedProps!==t.pendingProps||we.current)ye=!0;else{if(!(e.lanes&n)&&!(t.flags&128))return ye=!1,Ld(e,t,n);ye=!!(e.flags&131072)}else ye=!1,W&&t.flags&1048576&&ma(t,ll,t.index);switch(t.lanes=0,t.tag){case 2:var r=t.type;Vr(e,t),e=t.pendingProps;var l=yn(t,ce.current);mn(t,n),l=Mo(null,t,r,e,l,n);var i=Ro();return t.flags|=1,typeof l=="object"&&l!==null&&typeof l.render=="function"&&l.$$typeof===void 0?(t.tag=1,t.memoizedState=null,t.updateQueue=null,xe(r)?(i=!0,nl(t)):i=!1,t.memoizedState=l.state!==null&&l.state!==void 0?l.state:null,jo(t),l.updater=El,t.stateNode=l,l._reactInternals=t,Fi(t,r,e,n),t=Ai(null,t,r,!0,i,n)):(t.tag=0,W&&i&&xo(t),pe(null,t,l,n),t=t.child),t;case 16:r=t.elementType;e:{switch(Vr(e,t),e=t.pendingProps,l=r._init,r=l(r._payload),t.type=r,l=t.tag=Qd(r),e=Oe(r,e),l){case 0:t=$i(null,t,r,e,n);break e;case 1:t=Wu(null,t,r,e,n);break e;case 11:t=Bu(null,t,r,e,n);break e;case 14:t=Vu(null,t,r,Oe(r.type,e),n);break e}throw Error(w(306,r,""))}return t;case 0:return r=t.type,l=t.pendingProps,l=t.elementType===r?l:Oe(r,l),$i(e,t,r,l,n);case 1:return r=t.type,l=t.pendingProps,l=t.elementType===r?l:Oe(r,l),Wu(e,t,r,l,n);case 3:e:{if(Ga(t),e===null)throw Error(w(387));r=t.pendingProps,i=t.memoizedState,l=i.element,Sa(e,t),ul(t,r,null,n);var o=t.memoizedState;if(r=o.element,i.isDehydrated)if(i={element:r,isDehydrated:!1,cache:o.cache,pendingSuspenseBoundaries:o.pendingSuspenseBoundaries,transitions:o.transitions},t.updateQueue.baseState=i,t.memoizedState=i,t.flags&256){l=kn(Error(w(423)),t),t=Hu(e,t,r,n,l);break e}else if(r!==l){l=kn(Error(w(424)),t),t=Hu(e,t,r,n,l);break e}else for(Ce=Et(t.stateNode.containerInfo.firstChild),Ee=t,W=!0,Fe=null,n=wa(t,null,r,n),t.child=n;n;)n.flags=n.flags&-3|4096,n=n.sibling;else{if(wn(),r===l){t=ot(e,t,n);break e}pe(e,t,r,n)}t=t.child}return t;case 5:return ka(t),e===null&&Di(t),r=t.type,l=t.pendingProps,i=e!==null?e.memoizedProps:null,o=l.children,zi(r,l)?o=null:i!==null&&zi(r,i)&&(t.flags|=32),Ya(e,t),pe(e,t,o,n),t.child;case 6:return e===null&&Di(t),null;case 13:return Xa(e,t,n);case 4:return Po(t,t.stateNode.containerInfo),r=t.pendingProps,e===null?t.child=xn(t,null,r,n):pe(e,t,r,n),t.child;case 11:return r=t.type,l=t.pendingProps,l=t.elementType===r?l:Oe(r,l),Bu(e,t,r,l,n);case 7:return pe(e,t,t.pendingProps,n),t.child;case 8:return pe(e,t,t.pendingProps.children,n),t.child;case 12:return pe(e,t,t.pendingProps.children,n),t.child;case 10:e:{if(r=t.type._context,l=t.pendingProps,i=t.memoizedProps,o=l.value,U(il,r._currentValue),r._currentValue=o,i!==null)if(Ae(i.value,o)){if(i.children===l.children&&!we.current){t=ot(e,t,n);break e}}else for(i=t.child,i!==null&&(i.return=t);i!==null;){var u=i.dependencies;if(u!==null){o=i.child;for(var s=u.firstContext;s!==null;){if(s.context===r){if(i.tag===1){s=nt(-1,n&-n),s.tag=2;var c=i.updateQueue;if(c!==null){c=c.shared;var g=c.pending;g===null?s.next=s:(s.next=g.next,g.next=s),c.pending=s}}i.lanes|=n,s=i.alternate,s!==null&&(s.lanes|=n),Oi(i.return,n,t),u.lanes|=n;break}s=s.next}}else if(i.tag===10)o=i.type===t.type?null:i.child;else if(i.tag===18){if(o=i.return,o===null)throw Error(w(341));o.lanes|=n,u=o.alternate,u!==null&&(u.lanes|=n),Oi(o,n,t),o=i.sibling}else o=i.child;if(o!==null)o.return=i;else for(o=i;o!==null;){if(o===t){o=null;break}if(i=o.sibling,i!==null){i.return=o.return,o=i;break}o=o.return}i=o}pe(e,t,l.children,n),t=t.child}return t;case 9:return l=t.type,r=t.pendingProps.children,mn(t,n),l=Me(l),r=r(l),t.flags|=1,pe(e,t,r,n),t.child;case 14:return r=t.type,l=Oe(r,t.pendingProps),l=Oe(r.type,l),Vu(e,t,r,l,n);case 15:return Qa(e,t,t.type,t.pendingProps,n);case 17:return r=t.type,l=t.pendingProps,l=t.elementType===r?l:Oe(r,l),Vr(e,t),t.tag=1,xe(r)?(e=!0,nl(t)):e=!1,mn(t,n),Va(t,r,l),Fi(t,r,l,n),Ai(null,t,r,!0,e,n);case 19:return Za(e,t,n);case 22:return Ka(e,t,n)}throw Error(w(156,t.tag))};function dc(e,t){return $s(e,t)}function Hd(e,t,n,r){this.tag=e,this.key=n,this.sibling=this.child=this.return=this.stateNode=this.type=this.elementType=null,this.index=0,this.ref=null,this.pendingProps=t,this.dependencies=this.memoizedState=this.updateQueue=this.memoizedProps=null,this.mode=r,this.subtreeFlags=this.flags=0,this.deletions=null,this.childLanes=this.lanes=0,this.alternate=null}function Le(e,t,n,r){return new Hd(e,t,n,r)}function Wo(e){return e=e.prototype,!(!e||!e.isReactComponent)}function Qd(e){if(typeof e=="function")return Wo(e)?1:0;if(e!=null){if(e=e.$$typeof,e===uo)return 11;if(e===so)return 14}return 2}function Pt(e,t){var n=e.alternate;return n===null?(n=Le(e.tag,t,e.key,e.mode),n.elementType=e.elementType,n.type=e.type,n.stateNode=e.stateNode,n.alternate=e,e.alternate=n):(n.pendingProps=t,n.type=e.type,n.flags=0,n.subtreeFlags=0,n.deletions=null),n.flags=e.flags&14680064,n.childLanes=e.childLanes,n.lanes=e.lanes,n.child=e.child,n.memoizedProps=e.memoizedProps,n.memoizedState=e.memoizedState,n.updateQueue=e.updateQueue,t=e.dependencies,n.dependencies=t===null?null:{lanes:t.lanes,firstContext:t.firstContext},n.sibling=e.sibling,n.index=e.index,n.ref=e.ref,n}function Qr(e,t,n,r,l,i){var o=2;if(r=e,typeof e=="function")Wo(e)&&(o=1);else if(typeof e=="string")o=5;else e:switch(e){case bt:return Vt(n.children,l,i,t);case oo:o=8,l|=8;break;case ui:return e=Le(12,n,t,l|2),e.elementType=ui,e.lanes=i,e;case si:return e=Le(13,n,t,l),e.elementType=si,e.lanes=i,e;case ai:return e=Le(19,n,t,l),e.elementType=ai,e.lanes=i,e;case ks:return jl(n,l,i,t);default:if(typeof e=="object"&&e!==null)switch(e.$$typeof){case xs:o=10;break e;case Ss:o=9;break e;case uo:o=11;break e;case so:o=14;break e;case pt:o=16,r=null;break e}throw Error(w(130,e==null?e:typeof e,""))}return t=Le(o,n,t,l),t.elementType=e,t.type=r,t.lanes=i,t}function Vt(e,t,n,r){return e=Le(7,e,r,t),e.lanes=n,e}function jl(e,t,n,r){return e=Le(22,e,r,t),e.elementType=ks,e.lanes=n,e.stateNode={isHidden:!1},e}function li(e,t,n){return e=Le(6,e,null,t),e.lanes=n,e}function ii(e,t,n){return t=Le(4,e.children!==null?e.children:[],e.key,t),t.lanes=n,t.stateNode={containerInfo:e.containerInfo,pendingChildren:null,implementation:e.implementation},t}function Kd(e,t,n,r,l){this.tag=t,this.containerInfo=e,this.finishedWork=this.pingCache=this.current=this.pendingChildren=null,this.timeoutHandle=-1,this.callbackNode=this.pendingContext=this.context=null,this.callbackPriority=0,this.eventTimes=$l(0),this.expirationTimes=$l(-1),this.entangledLanes=this.finishedLanes=this.mutableReadLanes=this.expiredLanes=this.pingedLanes=this.suspendedLanes=this.pendingLanes=0,this.entanglements=$l(0),this.identifierPrefix=r,this.onRecoverableError=l,this.mutableSourceEagerHydrationData=null}function Ho(e,t,n,r,l,i,o,u,s){return e=new Kd(e,t,n,u,s),t===1?(t=1,i===!0&&(t|=8)):t=0,i=Le(3,null,null,t),e.current=i,i.stateNode=e,i.memoizedState={element:r,isDehydrated:n,cache:null,transitions:null,pendingSuspenseBoundaries:null},jo(i),e}function Yd(e,t,n){var r=3<arguments.length&&arguments[3]!==void 0?arguments[3]:null;return{$$typeof:qt,key:r==null?null:""+r,children:e,containerInfo:t,implementation:n}}function pc(e){if(!e)return Lt;e=e._reactInternals;e:{if(Xt(e)!==e||e.tag!==1)throw Error(w(170));var t=e;do{switch(t.tag){case 3:t=t.stateNode.context;break e;case 1:if(xe(t.type)){t=t.stateNode.__reactInternalMemoizedMergedChildContext;break e}}t=t.return}while(t!==null);throw Error(w(171))}if(e.tag===1){var n=e.type;if(xe(n))return pa(e,n,t)}return t}function hc(e,t,n,r,l,i,o,u,s){return e=Ho(n,r,!0,e,l,i,o,u,s),e.context=pc(null),n=e.current,r=he(),l=jt(n),i=nt(r,l),i.callback=t??null,Nt(n,i,l),e.current.lanes=l,dr(e,l,r),Se(e,r),e}function Pl(e,t,n,r){var l=t.current,i=he(),o=jt(l);return n=pc(n),t.context===null?t.context=n:t.pendingContext=n,t=nt(i,o),t.payload={element:e},r=r===void 0?null:r,r!==null&&(t.callback=r),e=Nt(l,t,o),e!==null&&($e(e,l,o,i),$r(e,l,o)),o}function ml(e){if(e=e.current,!e.child)return null;switch(e.child.tag){case 5:return e.child.stateNode;default:return e.child.stateNode}}function es(e,t){if(e=e.memoizedState,e!==null&&e.dehydrated!==null){var n=e.retryLane;e.retryLane=n!==0&&n<t?n:t}}function Qo(e,t){es(e,t),(e=e.alternate)&&es(e,t)}function Gd(){return null}var mc=typeof reportError=="function"?reportError:function(e){console.error(e)};function Ko(e){this._internalRoot=e}zl.prototype.render=Ko.prototype.render=function(e){var t=this._internalRoot;if(t===null)throw Error(w(409));Pl(e,t,null,null)};zl.prototype.unmount=Ko.prototype.unmount=function(){var e=this._internalRoot;if(e!==null){this._internalRoot=null;var t=e.containerInfo;Yt(function(){Pl(null,e,null,null)}),t[lt]=null}};function zl(e){this._internalRoot=e}zl.prototype.unstable_scheduleHydration=function(e){if(e){var t=Ks();e={blockedOn:null,target:e,priority:t};for(var n=0;n<gt.length&&t!==0&&t<gt[n].priority;n++);gt.splice(n,0,e),n===0&&Gs(e)}};function Yo(e){return!(!e||e.nodeType!==1&&e.nodeType!==9&&e.nodeType!==11)}function Ll(e){return!(!e||e.nodeType!==1&&e.nodeType!==9&&e.nodeType!==11&&(e.nodeType!==8||e.nodeValue!==" react-mount-point-unstable "))}function ts(){}function Xd(e,t,n,r,l){if(l){if(typeof r=="function"){var i=r;r=function(){var c=ml(o);i.call(c)}}var o=hc(t,r,e,0,null,!1,!1,"",ts);return e._reactRootContainer=o,e[lt]=o.current,nr(e.nodeType===8?e.parentNode:e),Yt(),o}for(;l=e.lastChild;)e.removeChild(l);if(typeof r=="function"){var u=r;r=function(){var c=ml(s);u.call(c)}}var s=Ho(e,0,!1,null,null,!1,!1,"",ts);return e._reactRootContainer=s,e[lt]=s.current,nr(e.nodeType===8?e.parentNode:e),Yt(function(){Pl(t,s,n,r)}),s}function Tl(e,t,n,r,l){var i=n._reactRootContainer;if(i){var o=i;if(typeof l=="function"){var u=l;l=function(){var s=ml(o);u.call(s)}}Pl(t,o,e,l)}else o=Xd(n,t,e,l,r);return ml(o)}Hs=function(e){switch(e.tag){case 3:var t=e.stateNode;if(t.current.memoizedState.isDehydrated){var n=Fn(t.pendingLanes);n!==0&&(fo(t,n|1),Se(t,Z()),!(D&6)&&(Cn=Z()+500,Rt()))}break;case 13:Yt(function(){var r=it(e,1);if(r!==null){var l=he();$e(r,e,1,l)}}),Qo(e,1)}};po=function(e){if(e.tag===13){var t=it(e,134217728);if(t!==null){var n=he();$e(t,e,134217728,n)}Qo(e,134217728)}};Qs=function(e){if(e.tag===13){var t=jt(e),n=it(e,t);if(n!==null){var r=he();$e(n,e,t,r)}Qo(e,t)}};Ks=function(){return I};Ys=function(e,t){var n=I;try{return I=e,t()}finally{I=n}};wi=function(e,t,n){switch(t){case"input":if(di(e,n),t=n.name,n.type==="radio"&&t!=null){for(n=e;n.parentNode;)n=n.parentNode;for(n=n.querySelectorAll("input[name="+JSON.stringify(""+t)+'][type="radio"]'),t=0;t<n.length;t++){var r=n[t];if(r!==e&&r.form===e.form){var l=Sl(r);if(!l)throw Error(w(90));Es(r),di(r,l)}}}break;case"textarea":_s(e,n);break;case"select":t=n.value,t!=null&&fn(e,!!n.multiple,t,!1)}};Rs=Ao;Ds=Yt;var Zd={usingClientEntryPoint:!1,Events:[hr,rn,Sl,Ts,Ms,Ao]},Dn={findFiberByHostInstance:Ut,bundleType:0,version:"18.3.1",rendererPackageName:"react-dom"},Jd={bundleType:Dn.bundleType,version:Dn.version,rendererPackageName:Dn.rendererPackageName,rendererConfig:Dn.rendererConfig,overrideHookState:null,overrideHookStateDeletePath:null,overrideHookStateRenamePath:null,overrideProps:null,overridePropsDeletePath:null,overridePropsRenamePath:null,setErrorHandler:null,setSuspenseHandler:null,scheduleUpdate:null,currentDispatcherRef:ut.ReactCurrentDispatcher,findHostInstanceByFiber:function(e){return e=Fs(e),e===null?null:e.stateNode},findFiberByHostInstance:Dn.findFiberByHostInstance||Gd,findHostInstancesForRefresh:null,scheduleRefresh:null,scheduleRoot:null,setRefreshHandler:null,getCurrentFiber:null,reconcilerVersion:"18.3.1-next-f1338f8080-20240426"};if(typeof __REACT_DEVTOOLS_GLOBAL_HOOK__<"u"){var Rr=__REACT_DEVTOOLS_GLOBAL_HOOK__;if(!Rr.isDisabled&&Rr.supportsFiber)try{gl=Rr.inject(Jd),Ke=Rr}catch{}}_e.__SECRET_INTERNALS_DO_NOT_USE_OR_YOU_WILL_BE_FIRED=Zd;_e.createPortal=function(e,t){var n=2<arguments.length&&arguments[2]!==void 0?arguments[2]:null;if(!Yo(t))throw Error(w(200));return Yd(e,t,null,n)};_e.createRoot=function(e,t){if(!Yo(e))throw Error(w(299));var n=!1,r="",l=mc;return t!=null&&(t.unstable_strictMode===!0&&(n=!0),t.identifierPrefix!==void 0&&(r=t.identifierPrefix),t.onRecoverableError!==void 0&&(l=t.onRecoverableError)),t=Ho(e,1,!1,null,null,n,!1,r,l),e[lt]=t.current,nr(e.nodeType===8?e.parentNode:e),new Ko(t)};_e.findDOMNode=function(e){if(e==null)return null;if(e.nodeType===1)return e;var t=e._reactInternals;if(t===void 0)throw typeof e.render=="function"?Error(w(188)):(e=Object.keys(e).join(","),Error(w(268,e)));return e=Fs(t),e=e===null?null:e.stateNode,e};_e.flushSync=function(e){return Yt(e)};_e.hydrate=function(e,t,n){if(!Ll(t))throw Error(w(200));return Tl(null,e,t,!0,n)};_e.hydrateRoot=function(e,t,n){if(!Yo(e))throw Error(w(405));var r=n!=null&&n.hydratedSources||null,l=!1,i="",o=mc;if(n!=null&&(n.unstable_strictMode===!0&&(l=!0),n.identifierPrefix!==void 0&&(i=n.identifierPrefix),n.onRecoverableError!==void 0&&(o=n.onRecoverableError)),t=hc(t,null,e,1,n??null,l,!1,i,o),e[lt]=t.current,nr(e),r)for(e=0;e<r.length;e++)n=r[e],l=n._getVersion,l=l(n._source),t.mutableSourceEagerHydrationData==null?t.mutableSourceEagerHydrationData=[n,l]:t.mutableSourceEagerHydrationData.push(n,l);return new zl(t)};_e.render=function(e,t,n){if(!Ll(t))throw Error(w(200));return Tl(null,e,t,!1,n)};_e.unmountComponentAtNode=function(e){if(!Ll(e))throw Error(w(40));return e._reactRootContainer?(Yt(function(){Tl(null,null,e,!1,function(){e._reactRootContainer=null,e[lt]=null})}),!0):!1};_e.unstable_batchedUpdates=Ao;_e.unstable_renderSubtreeIntoContainer=function(e,t,n,r){if(!Ll(n))throw Error(w(200));if(e==null||e._reactInternals===void 0)throw Error(w(38));return Tl(e,t,n,!1,r)};_e.version="18.3.1-next-f1338f8080-20240426";function vc(){if(!(typeof __REACT_DEVTOOLS_GLOBAL_HOOK__>"u"||typeof __REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE!="function"))try{__REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE(vc)}catch(e){console.error(e)}}vc(),vs.exports=_e;var qd=vs.exports,gc,ns=qd;gc=ns.createRoot,ns.hydrateRoot;const yc="data:image/svg+xml,%3c?xml%20version='1.0'%20encoding='utf-8'?%3e%3csvg%20fill='%23000000'%20width='800px'%20height='800px'%20viewBox='0%200%2024%2024'%20role='img'%20xmlns='http://www.w3.org/2000/svg'%3e%3ctitle%3eOpenAI%20icon%3c/title%3e%3cpath%20d='M22.2819%209.8211a5.9847%205.9847%200%200%200-.5157-4.9108%206.0462%206.0462%200%200%200-6.5098-2.9A6.0651%206.0651%200%200%200%204.9807%204.1818a5.9847%205.9847%200%200%200-3.9977%202.9%206.0462%206.0462%200%200%200%20.7427%207.0966%205.98%205.98%200%200%200%20.511%204.9107%206.051%206.051%200%200%200%206.5146%202.9001A5.9847%205.9847%200%200%200%2013.2599%2024a6.0557%206.0557%200%200%200%205.7718-4.2058%205.9894%205.9894%200%200%200%203.9977-2.9001%206.0557%206.0557%200%200%200-.7475-7.0729zm-9.022%2012.6081a4.4755%204.4755%200%200%201-2.8764-1.0408l.1419-.0804%204.7783-2.7582a.7948.7948%200%200%200%20.3927-.6813v-6.7369l2.02%201.1686a.071.071%200%200%201%20.038.052v5.5826a4.504%204.504%200%200%201-4.4945%204.4944zm-9.6607-4.1254a4.4708%204.4708%200%200%201-.5346-3.0137l.142.0852%204.783%202.7582a.7712.7712%200%200%200%20.7806%200l5.8428-3.3685v2.3324a.0804.0804%200%200%201-.0332.0615L9.74%2019.9502a4.4992%204.4992%200%200%201-6.1408-1.6464zM2.3408%207.8956a4.485%204.485%200%200%201%202.3655-1.9728V11.6a.7664.7664%200%200%200%20.3879.6765l5.8144%203.3543-2.0201%201.1685a.0757.0757%200%200%201-.071%200l-4.8303-2.7865A4.504%204.504%200%200%201%202.3408%207.872zm16.5963%203.8558L13.1038%208.364%2015.1192%207.2a.0757.0757%200%200%201%20.071%200l4.8303%202.7913a4.4944%204.4944%200%200%201-.6765%208.1042v-5.6772a.79.79%200%200%200-.407-.667zm2.0107-3.0231l-.142-.0852-4.7735-2.7818a.7759.7759%200%200%200-.7854%200L9.409%209.2297V6.8974a.0662.0662%200%200%201%20.0284-.0615l4.8303-2.7866a4.4992%204.4992%200%200%201%206.6802%204.66zM8.3065%2012.863l-2.02-1.1638a.0804.0804%200%200%201-.038-.0567V6.0742a4.4992%204.4992%200%200%201%207.3757-3.4537l-.142.0805L8.704%205.459a.7948.7948%200%200%200-.3927.6813zm1.0976-2.3654l2.602-1.4998%202.6069%201.4998v2.9994l-2.5974%201.4997-2.6067-1.4997Z",wc="data:image/svg+xml,%3csvg%20width='256px'%20height='176px'%20viewBox='0%200%20256%20176'%20version='1.1'%20xmlns='http://www.w3.org/2000/svg'%20preserveAspectRatio='xMidYMid'%3e%3ctitle%3eAnthropic%3c/title%3e%3cg%20fill='%23181818'%3e%3cpath%20d='M147.486878,0%20C147.486878,0%20217.568251,175.780074%20217.568251,175.780074%20C217.568251,175.780074%20256,175.780074%20256,175.780074%20C256,175.780074%20185.918621,0%20185.918621,0%20C185.918621,0%20147.486878,0%20147.486878,0%20C147.486878,0%20147.486878,0%20147.486878,0%20Z'/%3e%3cpath%20d='M66.1828124,106.221191%20C66.1828124,106.221191%2090.1624677,44.4471185%2090.1624677,44.4471185%20C90.1624677,44.4471185%20114.142128,106.221191%20114.142128,106.221191%20C114.142128,106.221191%2066.1828124,106.221191%2066.1828124,106.221191%20C66.1828124,106.221191%2066.1828124,106.221191%2066.1828124,106.221191%20Z%20M70.0705318,0%20C70.0705318,0%200,175.780074%200,175.780074%20C0,175.780074%2039.179211,175.780074%2039.179211,175.780074%20C39.179211,175.780074%2053.5097704,138.86606%2053.5097704,138.86606%20C53.5097704,138.86606%20126.817544,138.86606%20126.817544,138.86606%20C126.817544,138.86606%20141.145724,175.780074%20141.145724,175.780074%20C141.145724,175.780074%20180.324935,175.780074%20180.324935,175.780074%20C180.324935,175.780074%20110.254409,0%20110.254409,0%20C110.254409,0%2070.0705318,0%2070.0705318,0%20C70.0705318,0%2070.0705318,0%2070.0705318,0%20Z'/%3e%3c/g%3e%3c/svg%3e",xc="/static/assets/google-gemini-logo-Boy8wUYg.svg",bd="data:image/svg+xml,%3csvg%20viewBox='0%200%20128%20128'%20xmlns='http://www.w3.org/2000/svg'%20aria-label='Azure'%3e%3cdefs%3e%3clinearGradient%20id='a'%20x1='0'%20y1='0'%20x2='1'%20y2='1'%3e%3cstop%20stop-color='%23114A8B'/%3e%3cstop%20offset='1'%20stop-color='%230669BC'/%3e%3c/linearGradient%3e%3c/defs%3e%3cpath%20fill='url(%23a)'%20d='M20%20110L55%2010h38L50%20118a6%206%200%200%201-5%204H20z'/%3e%3cpath%20fill='%230078d4'%20d='M92%2078H48l34%2032h28z'/%3e%3c/svg%3e",ep="data:image/svg+xml,%3c?xml%20version='1.0'%20encoding='utf-8'?%3e%3csvg%20fill='%23000000'%20width='800px'%20height='800px'%20viewBox='0%200%2024%2024'%20role='img'%20xmlns='http://www.w3.org/2000/svg'%3e%3ctitle%3eOpenRouter%3c/title%3e%3cpath%20d='M3%2020l9-16%209%2016H3zm9-4a2%202%200%201%200%200-4%202%202%200%200%200%200%204z'/%3e%3c/svg%3e",tp="data:image/svg+xml,%3csvg%20viewBox='0%200%2024%2024'%20xmlns='http://www.w3.org/2000/svg'%20aria-label='LiteLLM'%3e%3cg%20fill='none'%20stroke='currentColor'%20stroke-width='1.6'%20stroke-linecap='round'%20stroke-linejoin='round'%3e%3crect%20x='3'%20y='3'%20width='18'%20height='18'%20rx='3'/%3e%3cpath%20d='M7%2017V7h4M7%2017h10'/%3e%3c/g%3e%3c/svg%3e";function mt(e,t,n){return d.jsxs("svg",{width:t,height:t,viewBox:"0 0 24 24","aria-label":n,role:"img",children:[d.jsx("title",{children:n}),e]})}const vt=({children:e})=>d.jsx("g",{fill:"none",stroke:"currentColor",strokeWidth:1.6,strokeLinecap:"round",strokeLinejoin:"round",children:e});function be(e,t,n){return d.jsx("img",{src:e,width:n,height:n,alt:t,title:t,style:{display:"inline-block"}})}function rs(e,t=16){const n=(e||"").toLowerCase();return n.includes("gpt")||n.includes("o4")||n.startsWith("openai")?be(yc,"GPT",t):n.includes("claude")?be(wc,"Claude",t):n.includes("gemini")?be(xc,"Gemini",t):n.includes("llama")?mt(d.jsxs(vt,{children:[d.jsx("path",{d:"M6 17c3 1 9 1 12 0"}),d.jsx("path",{d:"M8 17V9l2-2 2 2v8"}),d.jsx("path",{d:"M10 7l1-2 1 2"})]}),t,"Llama"):n.includes("mistral")||n.includes("mixtral")?mt(d.jsxs(vt,{children:[d.jsx("path",{d:"M3 9h10c2 0 2-3 0-3"}),d.jsx("path",{d:"M3 15h14c3 0 3-4 0-4"})]}),t,"Mistral"):n.includes("qwen")?mt(d.jsxs(vt,{children:[d.jsx("path",{d:"M6 12a6 6 0 1 1 6 6"}),d.jsx("path",{d:"M12 18l3-3"})]}),t,"Qwen"):n.includes("deepseek")?mt(d.jsxs(vt,{children:[d.jsx("path",{d:"M4 12l8-8 8 8-8 8z"}),d.jsx("path",{d:"M8 12l4-4 4 4-4 4z"})]}),t,"DeepSeek"):n.includes("phi")?mt(d.jsxs(vt,{children:[d.jsx("circle",{cx:"12",cy:"12",r:"7"}),d.jsx("path",{d:"M12 5v14M8 10h8"})]}),t,"Phi"):mt(d.jsx(vt,{children:d.jsx("circle",{cx:"12",cy:"12",r:"8"})}),t,"Model")}function np(e,t=16){const n=(e||"").toLowerCase();return n.includes("openrouter")?be(ep,"OpenRouter",t):n.includes("litellm")?be(tp,"LiteLLM",t):n.includes("openai")?be(yc,"OpenAI",t):n.includes("anthropic")?be(wc,"Anthropic",t):n.includes("gemini")||n.includes("google")?be(xc,"Google",t):n.includes("azure")?be(bd,"Azure",t):n.includes("ollama")?mt(d.jsxs(vt,{children:[d.jsx("path",{d:"M7 14a3 3 0 0 1 6 0v3H7z"}),d.jsx("path",{d:"M13 14a3 3 0 1 1 3 3"})]}),t,"Ollama"):mt(d.jsx(vt,{children:d.jsx("rect",{x:"5",y:"5",width:"14",height:"14",rx:"3"})}),t,"Provider")}function rp(e){const t=e.split(/\r?\n/),n=[];let r=0;for(;r<t.length;){const i=t[r].match(/^```\s*([\w+-]*)\s*$/);if(i){const u=i[1]||"";r++;const s=[];for(;r<t.length&&!/^```\s*$/.test(t[r]);)s.push(t[r]),r++;r<t.length&&/^```\s*$/.test(t[r])&&r++,n.push({type:"code",lang:u,code:s.join(`
-`)});continue}const o=[];for(;r<t.length&&!/^```/.test(t[r]);)o.push(t[r]),r++;o.length&&n.push({type:"text",text:o.join(`
-`)})}return n}function lp(e){const t=[];let n=0;const r=()=>`${n}-${Math.random().toString(36).slice(2,7)}`;for(;n<e.length;){const l=e[n];if(/^\s*---+\s*$/.test(l)){t.push(d.jsx("hr",{className:"border-white/10"},r())),n++;continue}const i=l.match(/^(#{1,3})\s+(.*)$/);if(i){const u=i[1].length,s=i[2];u===1?t.push(d.jsx("h2",{className:"mt-4",children:s},r())):u===2?t.push(d.jsx("h3",{className:"mt-3",children:s},r())):t.push(d.jsx("h4",{className:"mt-2",children:s},r())),n++;continue}if(/^\s*[-*]\s+/.test(l)){const u=[];for(;n<e.length&&/^\s*[-*]\s+/.test(e[n]);)u.push(e[n].replace(/^\s*[-*]\s+/,"")),n++;t.push(d.jsx("ul",{className:"list-disc pl-6 space-y-1",children:u.map((s,c)=>d.jsx("li",{children:s},c))},r()));continue}if(/^\s*\d+\.\s+/.test(l)){const u=[];for(;n<e.length&&/^\s*\d+\.\s+/.test(e[n]);)u.push(e[n].replace(/^\s*\d+\.\s+/,"")),n++;t.push(d.jsx("ol",{className:"list-decimal pl-6 space-y-1",children:u.map((s,c)=>d.jsx("li",{children:s},c))},r()));continue}if(l.includes("|")){const u=[],s=n;for(;n<e.length&&e[n].includes("|");)u.push(e[n]),n++;if(u.length>=2&&/\|/.test(u[0])&&/-/.test(u[1])){const c=h=>h.split("|").map(x=>x.trim()).filter((x,S,k)=>!(S===0&&h.trim().startsWith("|"))&&!(S===k.length-1&&h.trim().endsWith("|"))),g=c(u[0]),m=u.slice(2).map(c);t.push(d.jsx("div",{className:"overflow-x-auto",children:d.jsxs("table",{className:"w-full text-sm border-collapse",children:[d.jsx("thead",{children:d.jsx("tr",{children:g.map((h,x)=>d.jsx("th",{className:"text-left font-semibold px-3 py-2 border-b border-white/10",children:h},x))})}),d.jsx("tbody",{children:m.map((h,x)=>d.jsx("tr",{className:"odd:bg-white/5",children:h.map((S,k)=>d.jsx("td",{className:"px-3 py-2 align-top border-b border-white/5",children:S},k))},x))})]})},r()));continue}else n=s}const o=[];for(;n<e.length&&e[n].trim()!=="";)o.push(e[n]),n++;for(t.push(d.jsx("p",{className:"whitespace-pre-wrap leading-relaxed",children:o.join(`
-`)},r()));n<e.length&&e[n].trim()==="";)n++}return t}function ip({content:e,wrapDefault:t}){const n=O.useMemo(()=>e.replace(/\r/g,"").replace(/^\uFEFF/,""),[e]),r=O.useMemo(()=>rp(n),[n]);return d.jsx("div",{className:"prose prose-invert max-w-none",children:r.map((l,i)=>l.type==="text"?d.jsx("div",{children:lp(l.text.split(`
-`))},i):d.jsx(op,{lang:l.lang,code:l.code,defaultWrap:!!t},i))})}function op({lang:e,code:t,defaultWrap:n}){const[r,l]=O.useState(!!n),i=async()=>{try{await navigator.clipboard.writeText(t)}catch{}};return d.jsxs("div",{className:"rounded-lg border border-white/10 overflow-hidden",children:[d.jsxs("div",{className:"flex items-center justify-between px-3 py-1.5 text-xs bg-slate-800/60 border-b border-white/10",children:[d.jsx("div",{className:"uppercase tracking-wide text-slate-300",children:e||"text"}),d.jsxs("div",{className:"flex items-center gap-2",children:[d.jsx("button",{className:"px-2 py-0.5 rounded bg-white/10 hover:bg-white/15",onClick:()=>l(o=>!o),children:r?"No wrap":"Wrap"}),d.jsx("button",{className:"px-2 py-0.5 rounded bg-white/10 hover:bg-white/15",onClick:i,children:"Copy"})]})]}),d.jsx("pre",{className:`text-sm p-3 ${r?"whitespace-pre-wrap break-words":"whitespace-pre overflow-x-auto"}`,children:d.jsx("code",{children:t})})]})}const ls={theme:"dark",density:"comfortable",fontScale:1,defaultReasoning:!1,codeWrapDefault:!1};function qi(){try{const e=localStorage.getItem("appSettings");if(e)return{...ls,...JSON.parse(e)}}catch{}return ls}function Sc(e){const t=document.body;t.classList.toggle("theme-light",e.theme==="light"),t.classList.toggle("theme-dark",e.theme==="dark"),t.classList.toggle("density-compact",e.density==="compact"),t.style.setProperty("--font-scale",String(e.fontScale))}function up({open:e,onClose:t,onSave:n}){const[r,l]=O.useState(qi());return O.useEffect(()=>{e&&l(qi())},[e]),e?d.jsxs("div",{className:"fixed inset-0 z-50 flex items-center justify-center",children:[d.jsx("div",{className:"absolute inset-0 bg-black/60",onClick:t}),d.jsxs("div",{className:"relative w-full max-w-lg glass rounded-lg p-4",children:[d.jsxs("div",{className:"flex items-center justify-between mb-3",children:[d.jsx("h2",{className:"text-lg font-semibold",children:"Settings"}),d.jsx("button",{className:"px-2 py-1 rounded border border-white/10 hover:bg-white/10",onClick:t,children:"Close"})]}),d.jsxs("div",{className:"space-y-4 text-sm",children:[d.jsxs("div",{children:[d.jsx("label",{className:"block mb-1 text-slate-300",children:"Theme"}),d.jsxs("select",{className:"w-full bg-slate-800/60 border border-white/10 rounded px-2 py-1",value:r.theme,onChange:i=>l(o=>({...o,theme:i.target.value})),children:[d.jsx("option",{value:"dark",children:"Dark"}),d.jsx("option",{value:"light",children:"Light"})]})]}),d.jsxs("div",{children:[d.jsx("label",{className:"block mb-1 text-slate-300",children:"Density"}),d.jsxs("select",{className:"w-full bg-slate-800/60 border border-white/10 rounded px-2 py-1",value:r.density,onChange:i=>l(o=>({...o,density:i.target.value})),children:[d.jsx("option",{value:"comfortable",children:"Comfortable"}),d.jsx("option",{value:"compact",children:"Compact"})]})]}),d.jsxs("div",{children:[d.jsx("label",{className:"block mb-1 text-slate-300",children:"Font scale"}),d.jsx("input",{type:"range",min:.9,max:1.2,step:.05,value:r.fontScale,onChange:i=>l(o=>({...o,fontScale:Number(i.target.value)})),className:"w-full"})]}),d.jsxs("div",{className:"flex items-center gap-2",children:[d.jsx("input",{id:"def-reason",type:"checkbox",checked:r.defaultReasoning,onChange:i=>l(o=>({...o,defaultReasoning:i.target.checked}))}),d.jsx("label",{htmlFor:"def-reason",children:"Enable reasoning by default"})]}),d.jsxs("div",{className:"flex items-center gap-2",children:[d.jsx("input",{id:"code-wrap",type:"checkbox",checked:r.codeWrapDefault,onChange:i=>l(o=>({...o,codeWrapDefault:i.target.checked}))}),d.jsx("label",{htmlFor:"code-wrap",children:"Wrap code blocks by default"})]})]}),d.jsxs("div",{className:"mt-4 flex justify-end gap-2",children:[d.jsx("button",{className:"px-3 py-1.5 rounded border border-white/10 hover:bg-white/10",onClick:t,children:"Cancel"}),d.jsx("button",{className:"btn-primary",onClick:()=>{localStorage.setItem("appSettings",JSON.stringify(r)),Sc(r),n(r)},children:"Save"})]})]})]}):null}function sp(e){const t=new Date,n=new Date(t.getFullYear(),t.getMonth(),t.getDate()).getTime(),r=n-24*60*60*1e3,l=new Date(e.getFullYear(),e.getMonth(),e.getDate()).getTime();return l===n?"Today":l===r?"Yesterday":e.toLocaleDateString()}async function dt(e,t){const n=await fetch(e,t);if(!n.ok)throw new Error(`${n.status}`);return n.json()}function ap(){const[e,t]=O.useState([]),[n,r]=O.useState(""),[l,i]=O.useState(null),[o,u]=O.useState([{role:"system",content:"You are a helpful assistant."}]),[s,c]=O.useState(""),[g,m]=O.useState("openai"),[h,x]=O.useState(""),[S,k]=O.useState([]),[F,f]=O.useState(!1),[a,p]=O.useState(!1),[y,C]=O.useState(""),_=O.useRef(null),[j,P]=O.useState(!1),[H,M]=O.useState(!1),[fe,Dt]=O.useState(qi()),Ge=O.useMemo(()=>e.filter(v=>(v.title||"").toLowerCase().includes(n.toLowerCase())),[e,n]),Zt=O.useMemo(()=>{const v=Ge.filter(re=>re.pinned),L=Ge.filter(re=>!re.pinned),V={Today:[],Yesterday:[],Earlier:[]},q=new Date,de=new Date(q.getFullYear(),q.getMonth(),q.getDate()).getTime(),Ve=de-24*60*60*1e3;for(const re of L){const Ot=re.updated_at?new Date(re.updated_at).getTime():0;Ot>=de?V.Today.push(re):Ot>=Ve?V.Yesterday.push(re):V.Earlier.push(re)}return{pinned:v,byDay:V}},[Ge]);async function vr(v){try{await dt(`/api/conversations/${encodeURIComponent(v)}`,{method:"DELETE"})}catch{}await Be(),l===v&&(i(null),u([{role:"system",content:"You are a helpful assistant."}]))}O.useEffect(()=>{(async()=>(await Be(),await T()))()},[]),O.useEffect(()=>{const v=_.current;if(!v)return;const L=()=>{P(v.scrollTop+v.clientHeight<v.scrollHeight-200)};return v.addEventListener("scroll",L),L(),()=>v.removeEventListener("scroll",L)},[]),O.useEffect(()=>{Sc(fe)},[fe]),O.useEffect(()=>{const v=_.current;!v||j||(v.scrollTop=v.scrollHeight)},[o,y]);async function Be(){var L;const v=await dt("/api/conversations");t(v.conversations||[]),!l&&((L=v.conversations)!=null&&L[0])&&await st(v.conversations[0].id)}async function st(v){i(v);const L=await dt(`/api/conversations/${encodeURIComponent(v)}`);u(L.messages||[{role:"system",content:"You are a helpful assistant."}])}async function E(){const v=await dt("/api/conversations",{method:"POST",headers:{"Content-Type":"application/json"},body:JSON.stringify({})});i(v.id),await Be(),await st(v.id)}async function z(v){await dt(`/api/conversations/${encodeURIComponent(v.id)}`,{method:"PATCH",headers:{"Content-Type":"application/json"},body:JSON.stringify({pinned:!v.pinned})}),await Be()}async function T(){const v=await dt("/api/settings");v.provider&&m(v.provider),await X(v.provider||g),v.model&&x(v.model)}async function B(v){l&&(await dt(`/api/conversations/${encodeURIComponent(l)}`,{method:"PATCH",headers:{"Content-Type":"application/json"},body:JSON.stringify({messages:v})}),u(v),await Be())}async function X(v){const L=await dt(`/api/models?provider=${encodeURIComponent(v)}`);k(L.models||[])}async function at(){const v=s.trim();if(!v||!l)return;c("");const L={role:"user",content:v},V=[...o,L];u(V);const q=window.location.protocol==="https:"?"wss":"ws",de=new WebSocket(`${q}://${window.location.host}/ws/chat`);f(!0);let Ve="";C(""),de.onopen=()=>{de.send(JSON.stringify({messages:V,provider:g,model:h,conversation_id:l,reasoning:a}))},de.onmessage=re=>{const Ot=re.data;if(Ot==="[END]"){f(!1),u(Ml=>[...Ml,{role:"assistant",content:Ve}]),C(""),Be();return}Ve+=Ot,C(Ve)},de.onerror=()=>f(!1),de.onclose=()=>f(!1)}function Xe({m:v,idx:L}){const[V,q]=O.useState(!1),[de,Ve]=O.useState(v.content),re=v.role==="user",Ot=async()=>{try{await navigator.clipboard.writeText(v.content)}catch{}},Ml=async()=>{const Ze=o.filter((ct,Rl)=>Rl!==L);await B(Ze)},kc=async()=>{const Ze=o.map((ct,Rl)=>Rl===L?{...ct,content:de}:ct);await B(Ze),q(!1)},Cc=async()=>{let Ze=null;for(let ct=L-1;ct>=0;ct--)if(o[ct].role==="user"){Ze=o[ct].content;break}Ze&&(c(Ze),await at())};return d.jsxs("div",{className:`flex gap-3 ${v.role==="user"?"justify-end":""}`,children:[v.role==="assistant"&&d.jsx("div",{className:"w-8 h-8 rounded-full bg-brand flex items-center justify-center",children:rs(h,16)}),d.jsxs("div",{className:`group rounded-2xl px-3 py-2 border relative ${v.role==="user"?"bg-slate-800/60 border-white/10":"bg-slate-900/60 border-white/10"} shadow-[inset_0_1px_0_rgba(255,255,255,0.05)]`,style:{maxWidth:"80%"},children:[d.jsxs("div",{className:"absolute -top-2 right-1 opacity-0 group-hover:opacity-100 transition text-xs flex gap-2",children:[d.jsx("button",{className:"px-2 py-0.5 bg-white/10 rounded",onClick:Ot,children:"Copy"}),v.role==="assistant"&&d.jsx("button",{className:"px-2 py-0.5 bg-white/10 rounded",onClick:Cc,children:"Regenerate"}),re&&!V&&d.jsx("button",{className:"px-2 py-0.5 bg-white/10 rounded",onClick:()=>q(!0),children:"Edit"}),d.jsx("button",{className:"px-2 py-0.5 bg-white/10 rounded",onClick:Ml,children:"Delete"}),V&&d.jsxs(d.Fragment,{children:[d.jsx("button",{className:"px-2 py-0.5 bg-brand rounded",onClick:kc,children:"Save"}),d.jsx("button",{className:"px-2 py-0.5 bg-white/10 rounded",onClick:()=>{q(!1),Ve(v.content)},children:"Cancel"})]})]}),V?d.jsx("textarea",{className:"w-full bg-slate-800/60 border border-white/10 rounded p-2 text-sm",rows:Math.min(10,Math.max(3,v.content.split(`
-`).length)),value:de,onChange:Ze=>Ve(Ze.target.value)}):d.jsx("div",{className:"text-slate-100 text-sm",children:v.role==="assistant"?d.jsxs(d.Fragment,{children:[v.reasoning&&d.jsx("div",{className:"mb-2 rounded-lg border border-amber-300/20 bg-amber-900/10 p-2 text-amber-200 text-xs",children:v.reasoning}),d.jsx(ip,{content:v.content,wrapDefault:fe.codeWrapDefault})]}):d.jsx("div",{className:"whitespace-pre-wrap",children:v.content})})]}),v.role==="user"&&d.jsx("div",{className:"w-8 h-8 rounded-full bg-brand flex items-center justify-center",children:"U"})]})}return d.jsxs("div",{className:"h-screen grid grid-cols-[300px_1fr] gap-0",children:[d.jsxs("aside",{className:"glass border-r",children:[d.jsxs("div",{className:"p-3 flex items-center gap-2",children:[d.jsx("button",{className:"btn-primary",onClick:E,children:"New"}),d.jsx("input",{className:"ml-auto bg-slate-800/60 border border-white/10 rounded px-2 py-1 w-full",placeholder:"Search",value:n,onChange:v=>r(v.target.value)})]}),d.jsxs("div",{className:"overflow-y-auto min-h-0 p-2 space-y-2",children:[Zt.pinned.length>0&&d.jsxs("div",{children:[d.jsx("div",{className:"px-2 text-xs uppercase text-slate-400 mb-1",children:"Pinned"}),d.jsx("div",{className:"space-y-1",children:Zt.pinned.map(v=>d.jsx("div",{className:`w-full px-2 py-1 rounded hover:bg-white/5 ${l===v.id?"bg-white/10":""}`,children:d.jsxs("div",{className:"flex items-center justify-between gap-2",children:[d.jsx("button",{className:"flex-1 text-left truncate",onClick:()=>st(v.id),children:v.title||"Untitled"}),d.jsxs("div",{className:"flex items-center gap-1 text-xs text-slate-400",children:[d.jsx("button",{className:"px-1 hover:text-white",onClick:L=>{L.stopPropagation(),z(v)},children:"Unpin"}),d.jsx("button",{className:"px-1 text-red-300 hover:text-red-200",onClick:L=>{L.stopPropagation(),vr(v.id)},children:"Delete"})]})]})},v.id))})]}),Object.entries(Zt.byDay).map(([v,L])=>L.length?d.jsxs("div",{children:[d.jsx("div",{className:"px-2 text-xs uppercase text-slate-400 mb-1",children:v}),d.jsx("div",{className:"space-y-1",children:L.map(V=>d.jsx("div",{className:`w-full px-2 py-1 rounded hover:bg-white/5 ${l===V.id?"bg-white/10":""}`,children:d.jsxs("div",{className:"flex items-center justify-between gap-2",children:[d.jsx("button",{className:"flex-1 text-left truncate",onClick:()=>st(V.id),children:V.title||"Untitled"}),d.jsxs("div",{className:"flex items-center gap-1 text-xs text-slate-400",children:[d.jsx("button",{className:"px-1 hover:text-white",onClick:q=>{q.stopPropagation(),z(V)},children:"Pin"}),d.jsx("button",{className:"px-1 text-red-300 hover:text-red-200",onClick:q=>{q.stopPropagation(),vr(V.id)},children:"Delete"})]})]})},V.id))})]},v):null)]})]}),d.jsxs("main",{className:"flex flex-col min-h-0",children:[d.jsxs("header",{className:"glass flex items-center justify-between px-4 py-2 border-b",children:[d.jsx("h1",{className:"font-semibold",children:"ChatUI"}),d.jsxs("div",{className:"flex items-center gap-2",children:[d.jsxs("div",{className:"flex items-center gap-1 text-sm text-slate-300",children:[np(g,16),d.jsx("span",{className:"hidden md:inline",children:g})]}),d.jsx("select",{className:"bg-slate-800/60 border border-white/10 rounded px-2 py-1",value:g,onChange:async v=>{const L=v.target.value;m(L),await X(L)},children:["openai","openrouter","anthropic","google","azure","ollama"].map(v=>d.jsx("option",{value:v,children:v},v))}),d.jsxs("select",{className:"bg-slate-800/60 border border-white/10 rounded px-2 py-1",value:h,onChange:v=>x(v.target.value),children:[d.jsx("option",{value:"",children:"Select a model"}),S.map(v=>d.jsx("option",{value:v.id,children:v.name||v.id},v.id))]}),d.jsxs("label",{className:"text-sm flex items-center gap-1",children:[d.jsx("input",{type:"checkbox",checked:a,onChange:v=>p(v.target.checked)})," Reasoning"]}),d.jsx("button",{className:"px-2 py-1 rounded border border-white/10 hover:bg-white/10",onClick:()=>M(!0),children:"Settings"})]})]}),d.jsxs("div",{ref:_,className:"flex-1 overflow-y-auto p-4",children:[o.filter(v=>v.role!=="system").length===0&&d.jsxs("div",{className:"max-w-2xl mx-auto p-4 rounded-lg border border-white/10 bg-slate-900/60",children:[d.jsx("div",{className:"mb-2 text-slate-300",children:"Try one of these"}),d.jsx("div",{className:"flex flex-wrap gap-2",children:["Summarize an article","Write Python","Explain a concept","Create a plan"].map((v,L)=>d.jsx("button",{className:"px-3 py-1 rounded border border-white/10 hover:bg-white/5",onClick:()=>c(v),children:v},L))})]}),d.jsxs("div",{className:"max-w-3xl mx-auto space-y-3",children:[(()=>{const v=[];let L=null;return o.filter(q=>q.role!=="system").forEach((q,de)=>{if(q.created_at){const Ve=new Date(q.created_at),re=sp(Ve);re!==L&&(L=re,v.push(d.jsx("div",{className:"sticky top-2 z-10",children:d.jsx("div",{className:"mx-auto w-fit px-3 py-1 text-xs text-slate-300 border border-white/10 rounded-full bg-slate-900/70 backdrop-blur",children:re})},`sep-${de}`)))}v.push(d.jsx(Xe,{m:q,idx:de},de))}),v})(),y&&d.jsxs("div",{className:"flex gap-3",children:[d.jsx("div",{className:"w-8 h-8 rounded-full bg-brand flex items-center justify-center",children:rs(h,16)}),d.jsx("div",{className:"rounded-2xl px-3 py-2 border bg-slate-900/60 border-white/10",style:{maxWidth:"80%"},children:d.jsx("div",{className:"whitespace-pre-wrap text-slate-100 text-sm",children:y})})]}),F&&!y&&d.jsxs("div",{className:"flex items-center gap-2 text-slate-300 text-sm",children:[d.jsx("span",{className:"w-2 h-2 bg-slate-500 rounded-full animate-pulse"}),"Generating…"]})]})]}),j&&d.jsx("button",{className:"fixed right-6 bottom-24 px-3 py-1.5 rounded-full bg-brand text-white shadow hover:bg-brand-dark",onClick:()=>{const v=_.current;v&&(v.scrollTop=v.scrollHeight)},children:"Jump to latest"}),d.jsxs("form",{className:"glass border-t p-3 flex items-center gap-2",onSubmit:v=>{v.preventDefault(),at()},children:[d.jsx("div",{className:"flex-1",children:d.jsx("textarea",{className:"w-full bg-slate-800/60 border border-white/10 rounded-full px-4 py-2 h-11 resize-none",placeholder:"Ask something...",value:s,onChange:v=>c(v.target.value),onKeyDown:v=>{v.key==="Enter"&&!v.shiftKey&&(v.preventDefault(),at())}})}),d.jsx("button",{className:"btn-primary rounded-full h-11 px-5",disabled:!s.trim()||F,type:"submit",children:"Send"})]})]}),d.jsx(up,{open:H,onClose:()=>M(!1),onSave:v=>{Dt(v),M(!1)}})]})}const cp=document.getElementById("root");gc(cp).render(d.jsx(Ac.StrictMode,{children:d.jsx(ap,{})}));
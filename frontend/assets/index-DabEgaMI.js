@@ -1,45 +0,0 @@
-(function(){const t=document.createElement("link").relList;if(t&&t.supports&&t.supports("modulepreload"))return;for(const l of document.querySelectorAll('link[rel="modulepreload"]'))r(l);new MutationObserver(l=>{for(const i of l)if(i.type==="childList")for(const o of i.addedNodes)o.tagName==="LINK"&&o.rel==="modulepreload"&&r(o)}).observe(document,{childList:!0,subtree:!0});function n(l){const i={};return l.integrity&&(i.integrity=l.integrity),l.referrerPolicy&&(i.referrerPolicy=l.referrerPolicy),l.crossOrigin==="use-credentials"?i.credentials="include":l.crossOrigin==="anonymous"?i.credentials="omit":i.credentials="same-origin",i}function r(l){if(l.ep)return;l.ep=!0;const i=n(l);fetch(l.href,i)}})();function Dc(e){return e&&e.__esModule&&Object.prototype.hasOwnProperty.call(e,"default")?e.default:e}var is={exports:{}},vl={},os={exports:{}},R={};/**
- * @license React
- * react.production.min.js
- *
- * Copyright (c) Facebook, Inc. and its affiliates.
- *
- * This source code is licensed under the MIT license found in the
- * LICENSE file in the root directory of this source tree.
- */var fr=Symbol.for("react.element"),Oc=Symbol.for("react.portal"),Ic=Symbol.for("react.fragment"),Fc=Symbol.for("react.strict_mode"),Uc=Symbol.for("react.profiler"),$c=Symbol.for("react.provider"),Vc=Symbol.for("react.context"),Ac=Symbol.for("react.forward_ref"),Bc=Symbol.for("react.suspense"),Hc=Symbol.for("react.memo"),Wc=Symbol.for("react.lazy"),Go=Symbol.iterator;function Qc(e){return e===null||typeof e!="object"?null:(e=Go&&e[Go]||e["@@iterator"],typeof e=="function"?e:null)}var us={isMounted:function(){return!1},enqueueForceUpdate:function(){},enqueueReplaceState:function(){},enqueueSetState:function(){}},ss=Object.assign,as={};function kn(e,t,n){this.props=e,this.context=t,this.refs=as,this.updater=n||us}kn.prototype.isReactComponent={};kn.prototype.setState=function(e,t){if(typeof e!="object"&&typeof e!="function"&&e!=null)throw Error("setState(...): takes an object of state variables to update or a function which returns an object of state variables.");this.updater.enqueueSetState(this,e,t,"setState")};kn.prototype.forceUpdate=function(e){this.updater.enqueueForceUpdate(this,e,"forceUpdate")};function cs(){}cs.prototype=kn.prototype;function bi(e,t,n){this.props=e,this.context=t,this.refs=as,this.updater=n||us}var eo=bi.prototype=new cs;eo.constructor=bi;ss(eo,kn.prototype);eo.isPureReactComponent=!0;var Xo=Array.isArray,fs=Object.prototype.hasOwnProperty,to={current:null},ds={key:!0,ref:!0,__self:!0,__source:!0};function ps(e,t,n){var r,l={},i=null,o=null;if(t!=null)for(r in t.ref!==void 0&&(o=t.ref),t.key!==void 0&&(i=""+t.key),t)fs.call(t,r)&&!ds.hasOwnProperty(r)&&(l[r]=t[r]);var u=arguments.length-2;if(u===1)l.children=n;else if(1<u){for(var s=Array(u),c=0;c<u;c++)s[c]=arguments[c+2];l.children=s}if(e&&e.defaultProps)for(r in u=e.defaultProps,u)l[r]===void 0&&(l[r]=u[r]);return{$$typeof:fr,type:e,key:i,ref:o,props:l,_owner:to.current}}function Kc(e,t){return{$$typeof:fr,type:e.type,key:t,ref:e.ref,props:e.props,_owner:e._owner}}function no(e){return typeof e=="object"&&e!==null&&e.$$typeof===fr}function Yc(e){var t={"=":"=0",":":"=2"};return"$"+e.replace(/[=:]/g,function(n){return t[n]})}var Zo=/\/+/g;function Dl(e,t){return typeof e=="object"&&e!==null&&e.key!=null?Yc(""+e.key):t.toString(36)}function Dr(e,t,n,r,l){var i=typeof e;(i==="undefined"||i==="boolean")&&(e=null);var o=!1;if(e===null)o=!0;else switch(i){case"string":case"number":o=!0;break;case"object":switch(e.$$typeof){case fr:case Oc:o=!0}}if(o)return o=e,l=l(o),e=r===""?"."+Dl(o,0):r,Xo(l)?(n="",e!=null&&(n=e.replace(Zo,"$&/")+"/"),Dr(l,t,n,"",function(c){return c})):l!=null&&(no(l)&&(l=Kc(l,n+(!l.key||o&&o.key===l.key?"":(""+l.key).replace(Zo,"$&/")+"/")+e)),t.push(l)),1;if(o=0,r=r===""?".":r+":",Xo(e))for(var u=0;u<e.length;u++){i=e[u];var s=r+Dl(i,u);o+=Dr(i,t,n,s,l)}else if(s=Qc(e),typeof s=="function")for(e=s.call(e),u=0;!(i=e.next()).done;)i=i.value,s=r+Dl(i,u++),o+=Dr(i,t,n,s,l);else if(i==="object")throw t=String(e),Error("Objects are not valid as a React child (found: "+(t==="[object Object]"?"object with keys {"+Object.keys(e).join(", ")+"}":t)+"). If you meant to render a collection of children, use an array instead.");return o}function gr(e,t,n){if(e==null)return e;var r=[],l=0;return Dr(e,r,"","",function(i){return t.call(n,i,l++)}),r}function Gc(e){if(e._status===-1){var t=e._result;t=t(),t.then(function(n){(e._status===0||e._status===-1)&&(e._status=1,e._result=n)},function(n){(e._status===0||e._status===-1)&&(e._status=2,e._result=n)}),e._status===-1&&(e._status=0,e._result=t)}if(e._status===1)return e._result.default;throw e._result}var ve={current:null},Or={transition:null},Xc={ReactCurrentDispatcher:ve,ReactCurrentBatchConfig:Or,ReactCurrentOwner:to};function hs(){throw Error("act(...) is not supported in production builds of React.")}R.Children={map:gr,forEach:function(e,t,n){gr(e,function(){t.apply(this,arguments)},n)},count:function(e){var t=0;return gr(e,function(){t++}),t},toArray:function(e){return gr(e,function(t){return t})||[]},only:function(e){if(!no(e))throw Error("React.Children.only expected to receive a single React element child.");return e}};R.Component=kn;R.Fragment=Ic;R.Profiler=Uc;R.PureComponent=bi;R.StrictMode=Fc;R.Suspense=Bc;R.__SECRET_INTERNALS_DO_NOT_USE_OR_YOU_WILL_BE_FIRED=Xc;R.act=hs;R.cloneElement=function(e,t,n){if(e==null)throw Error("React.cloneElement(...): The argument must be a React element, but you passed "+e+".");var r=ss({},e.props),l=e.key,i=e.ref,o=e._owner;if(t!=null){if(t.ref!==void 0&&(i=t.ref,o=to.current),t.key!==void 0&&(l=""+t.key),e.type&&e.type.defaultProps)var u=e.type.defaultProps;for(s in t)fs.call(t,s)&&!ds.hasOwnProperty(s)&&(r[s]=t[s]===void 0&&u!==void 0?u[s]:t[s])}var s=arguments.length-2;if(s===1)r.children=n;else if(1<s){u=Array(s);for(var c=0;c<s;c++)u[c]=arguments[c+2];r.children=u}return{$$typeof:fr,type:e.type,key:l,ref:i,props:r,_owner:o}};R.createContext=function(e){return e={$$typeof:Vc,_currentValue:e,_currentValue2:e,_threadCount:0,Provider:null,Consumer:null,_defaultValue:null,_globalName:null},e.Provider={$$typeof:$c,_context:e},e.Consumer=e};R.createElement=ps;R.createFactory=function(e){var t=ps.bind(null,e);return t.type=e,t};R.createRef=function(){return{current:null}};R.forwardRef=function(e){return{$$typeof:Ac,render:e}};R.isValidElement=no;R.lazy=function(e){return{$$typeof:Wc,_payload:{_status:-1,_result:e},_init:Gc}};R.memo=function(e,t){return{$$typeof:Hc,type:e,compare:t===void 0?null:t}};R.startTransition=function(e){var t=Or.transition;Or.transition={};try{e()}finally{Or.transition=t}};R.unstable_act=hs;R.useCallback=function(e,t){return ve.current.useCallback(e,t)};R.useContext=function(e){return ve.current.useContext(e)};R.useDebugValue=function(){};R.useDeferredValue=function(e){return ve.current.useDeferredValue(e)};R.useEffect=function(e,t){return ve.current.useEffect(e,t)};R.useId=function(){return ve.current.useId()};R.useImperativeHandle=function(e,t,n){return ve.current.useImperativeHandle(e,t,n)};R.useInsertionEffect=function(e,t){return ve.current.useInsertionEffect(e,t)};R.useLayoutEffect=function(e,t){return ve.current.useLayoutEffect(e,t)};R.useMemo=function(e,t){return ve.current.useMemo(e,t)};R.useReducer=function(e,t,n){return ve.current.useReducer(e,t,n)};R.useRef=function(e){return ve.current.useRef(e)};R.useState=function(e){return ve.current.useState(e)};R.useSyncExternalStore=function(e,t,n){return ve.current.useSyncExternalStore(e,t,n)};R.useTransition=function(){return ve.current.useTransition()};R.version="18.3.1";os.exports=R;var O=os.exports;const Zc=Dc(O);/**
- * @license React
- * react-jsx-runtime.production.min.js
- *
- * Copyright (c) Facebook, Inc. and its affiliates.
- *
- * This source code is licensed under the MIT license found in the
- * LICENSE file in the root directory of this source tree.
- */var Jc=O,qc=Symbol.for("react.element"),bc=Symbol.for("react.fragment"),e0=Object.prototype.hasOwnProperty,t0=Jc.__SECRET_INTERNALS_DO_NOT_USE_OR_YOU_WILL_BE_FIRED.ReactCurrentOwner,n0={key:!0,ref:!0,__self:!0,__source:!0};function ms(e,t,n){var r,l={},i=null,o=null;n!==void 0&&(i=""+n),t.key!==void 0&&(i=""+t.key),t.ref!==void 0&&(o=t.ref);for(r in t)e0.call(t,r)&&!n0.hasOwnProperty(r)&&(l[r]=t[r]);if(e&&e.defaultProps)for(r in t=e.defaultProps,t)l[r]===void 0&&(l[r]=t[r]);return{$$typeof:qc,type:e,key:i,ref:o,props:l,_owner:t0.current}}vl.Fragment=bc;vl.jsx=ms;vl.jsxs=ms;is.exports=vl;var p=is.exports,vs={exports:{}},je={},gs={exports:{}},ys={};/**
- * @license React
- * scheduler.production.min.js
- *
- * Copyright (c) Facebook, Inc. and its affiliates.
- *
- * This source code is licensed under the MIT license found in the
- * LICENSE file in the root directory of this source tree.
- */(function(e){function t(E,z){var T=E.length;E.push(z);e:for(;0<T;){var B=T-1>>>1,Z=E[B];if(0<l(Z,z))E[B]=z,E[T]=Z,T=B;else break e}}function n(E){return E.length===0?null:E[0]}function r(E){if(E.length===0)return null;var z=E[0],T=E.pop();if(T!==z){E[0]=T;e:for(var B=0,Z=E.length,at=Z>>>1;B<at;){var Ze=2*(B+1)-1,v=E[Ze],L=Ze+1,H=E[L];if(0>l(v,T))L<Z&&0>l(H,v)?(E[B]=H,E[L]=T,B=L):(E[B]=v,E[Ze]=T,B=Ze);else if(L<Z&&0>l(H,T))E[B]=H,E[L]=T,B=L;else break e}}return z}function l(E,z){var T=E.sortIndex-z.sortIndex;return T!==0?T:E.id-z.id}if(typeof performance=="object"&&typeof performance.now=="function"){var i=performance;e.unstable_now=function(){return i.now()}}else{var o=Date,u=o.now();e.unstable_now=function(){return o.now()-u}}var s=[],c=[],g=1,m=null,h=3,x=!1,S=!1,k=!1,U=typeof setTimeout=="function"?setTimeout:null,f=typeof clearTimeout=="function"?clearTimeout:null,a=typeof setImmediate<"u"?setImmediate:null;typeof navigator<"u"&&navigator.scheduling!==void 0&&navigator.scheduling.isInputPending!==void 0&&navigator.scheduling.isInputPending.bind(navigator.scheduling);function d(E){for(var z=n(c);z!==null;){if(z.callback===null)r(c);else if(z.startTime<=E)r(c),z.sortIndex=z.expirationTime,t(s,z);else break;z=n(c)}}function y(E){if(k=!1,d(E),!S)if(n(s)!==null)S=!0,Be(C);else{var z=n(c);z!==null&&st(y,z.startTime-E)}}function C(E,z){S=!1,k&&(k=!1,f(P),P=-1),x=!0;var T=h;try{for(d(z),m=n(s);m!==null&&(!(m.expirationTime>z)||E&&!de());){var B=m.callback;if(typeof B=="function"){m.callback=null,h=m.priorityLevel;var Z=B(m.expirationTime<=z);z=e.unstable_now(),typeof Z=="function"?m.callback=Z:m===n(s)&&r(s),d(z)}else r(s);m=n(s)}if(m!==null)var at=!0;else{var Ze=n(c);Ze!==null&&st(y,Ze.startTime-z),at=!1}return at}finally{m=null,h=T,x=!1}}var _=!1,j=null,P=-1,Q=5,M=-1;function de(){return!(e.unstable_now()-M<Q)}function Mt(){if(j!==null){var E=e.unstable_now();M=E;var z=!0;try{z=j(!0,E)}finally{z?Xe():(_=!1,j=null)}}else _=!1}var Xe;if(typeof a=="function")Xe=function(){a(Mt)};else if(typeof MessageChannel<"u"){var Gt=new MessageChannel,vr=Gt.port2;Gt.port1.onmessage=Mt,Xe=function(){vr.postMessage(null)}}else Xe=function(){U(Mt,0)};function Be(E){j=E,_||(_=!0,Xe())}function st(E,z){P=U(function(){E(e.unstable_now())},z)}e.unstable_IdlePriority=5,e.unstable_ImmediatePriority=1,e.unstable_LowPriority=4,e.unstable_NormalPriority=3,e.unstable_Profiling=null,e.unstable_UserBlockingPriority=2,e.unstable_cancelCallback=function(E){E.callback=null},e.unstable_continueExecution=function(){S||x||(S=!0,Be(C))},e.unstable_forceFrameRate=function(E){0>E||125<E?console.error("forceFrameRate takes a positive int between 0 and 125, forcing frame rates higher than 125 fps is not supported"):Q=0<E?Math.floor(1e3/E):5},e.unstable_getCurrentPriorityLevel=function(){return h},e.unstable_getFirstCallbackNode=function(){return n(s)},e.unstable_next=function(E){switch(h){case 1:case 2:case 3:var z=3;break;default:z=h}var T=h;h=z;try{return E()}finally{h=T}},e.unstable_pauseExecution=function(){},e.unstable_requestPaint=function(){},e.unstable_runWithPriority=function(E,z){switch(E){case 1:case 2:case 3:case 4:case 5:break;default:E=3}var T=h;h=E;try{return z()}finally{h=T}},e.unstable_scheduleCallback=function(E,z,T){var B=e.unstable_now();switch(typeof T=="object"&&T!==null?(T=T.delay,T=typeof T=="number"&&0<T?B+T:B):T=B,E){case 1:var Z=-1;break;case 2:Z=250;break;case 5:Z=1073741823;break;case 4:Z=1e4;break;default:Z=5e3}return Z=T+Z,E={id:g++,callback:z,priorityLevel:E,startTime:T,expirationTime:Z,sortIndex:-1},T>B?(E.sortIndex=T,t(c,E),n(s)===null&&E===n(c)&&(k?(f(P),P=-1):k=!0,st(y,T-B))):(E.sortIndex=Z,t(s,E),S||x||(S=!0,Be(C))),E},e.unstable_shouldYield=de,e.unstable_wrapCallback=function(E){var z=h;return function(){var T=h;h=z;try{return E.apply(this,arguments)}finally{h=T}}}})(ys);gs.exports=ys;var r0=gs.exports;/**
- * @license React
- * react-dom.production.min.js
- *
- * Copyright (c) Facebook, Inc. and its affiliates.
- *
- * This source code is licensed under the MIT license found in the
- * LICENSE file in the root directory of this source tree.
- */var l0=O,_e=r0;function w(e){for(var t="https://reactjs.org/docs/error-decoder.html?invariant="+e,n=1;n<arguments.length;n++)t+="&args[]="+encodeURIComponent(arguments[n]);return"Minified React error #"+e+"; visit "+t+" for the full message or use the non-minified dev environment for full errors and additional helpful warnings."}var ws=new Set,Gn={};function Kt(e,t){mn(e,t),mn(e+"Capture",t)}function mn(e,t){for(Gn[e]=t,e=0;e<t.length;e++)ws.add(t[e])}var rt=!(typeof window>"u"||typeof window.document>"u"||typeof window.document.createElement>"u"),oi=Object.prototype.hasOwnProperty,i0=/^[:A-Z_a-z\u00C0-\u00D6\u00D8-\u00F6\u00F8-\u02FF\u0370-\u037D\u037F-\u1FFF\u200C-\u200D\u2070-\u218F\u2C00-\u2FEF\u3001-\uD7FF\uF900-\uFDCF\uFDF0-\uFFFD][:A-Z_a-z\u00C0-\u00D6\u00D8-\u00F6\u00F8-\u02FF\u0370-\u037D\u037F-\u1FFF\u200C-\u200D\u2070-\u218F\u2C00-\u2FEF\u3001-\uD7FF\uF900-\uFDCF\uFDF0-\uFFFD\-.0-9\u00B7\u0300-\u036F\u203F-\u2040]*$/,Jo={},qo={};function o0(e){return oi.call(qo,e)?!0:oi.call(Jo,e)?!1:i0.test(e)?qo[e]=!0:(Jo[e]=!0,!1)}function u0(e,t,n,r){if(n!==null&&n.type===0)return!1;switch(typeof t){case"function":case"symbol":return!0;case"boolean":return r?!1:n!==null?!n.acceptsBooleans:(e=e.toLowerCase().slice(0,5),e!=="data-"&&e!=="aria-");default:return!1}}function s0(e,t,n,r){if(t===null||typeof t>"u"||u0(e,t,n,r))return!0;if(r)return!1;if(n!==null)switch(n.type){case 3:return!t;case 4:return t===!1;case 5:return isNaN(t);case 6:return isNaN(t)||1>t}return!1}function ge(e,t,n,r,l,i,o){this.acceptsBooleans=t===2||t===3||t===4,this.attributeName=r,this.attributeNamespace=l,this.mustUseProperty=n,this.propertyName=e,this.type=t,this.sanitizeURL=i,this.removeEmptyString=o}var ue={};"children dangerouslySetInnerHTML defaultValue defaultChecked innerHTML suppressContentEditableWarning suppressHydrationWarning style".split(" ").forEach(function(e){ue[e]=new ge(e,0,!1,e,null,!1,!1)});[["acceptCharset","accept-charset"],["className","class"],["htmlFor","for"],["httpEquiv","http-equiv"]].forEach(function(e){var t=e[0];ue[t]=new ge(t,1,!1,e[1],null,!1,!1)});["contentEditable","draggable","spellCheck","value"].forEach(function(e){ue[e]=new ge(e,2,!1,e.toLowerCase(),null,!1,!1)});["autoReverse","externalResourcesRequired","focusable","preserveAlpha"].forEach(function(e){ue[e]=new ge(e,2,!1,e,null,!1,!1)});"allowFullScreen async autoFocus autoPlay controls default defer disabled disablePictureInPicture disableRemotePlayback formNoValidate hidden loop noModule noValidate open playsInline readOnly required reversed scoped seamless itemScope".split(" ").forEach(function(e){ue[e]=new ge(e,3,!1,e.toLowerCase(),null,!1,!1)});["checked","multiple","muted","selected"].forEach(function(e){ue[e]=new ge(e,3,!0,e,null,!1,!1)});["capture","download"].forEach(function(e){ue[e]=new ge(e,4,!1,e,null,!1,!1)});["cols","rows","size","span"].forEach(function(e){ue[e]=new ge(e,6,!1,e,null,!1,!1)});["rowSpan","start"].forEach(function(e){ue[e]=new ge(e,5,!1,e.toLowerCase(),null,!1,!1)});var ro=/[\-:]([a-z])/g;function lo(e){return e[1].toUpperCase()}"accent-height alignment-baseline arabic-form baseline-shift cap-height clip-path clip-rule color-interpolation color-interpolation-filters color-profile color-rendering dominant-baseline enable-background fill-opacity fill-rule flood-color flood-opacity font-family font-size font-size-adjust font-stretch font-style font-variant font-weight glyph-name glyph-orientation-horizontal glyph-orientation-vertical horiz-adv-x horiz-origin-x image-rendering letter-spacing lighting-color marker-end marker-mid marker-start overline-position overline-thickness paint-order panose-1 pointer-events rendering-intent shape-rendering stop-color stop-opacity strikethrough-position strikethrough-thickness stroke-dasharray stroke-dashoffset stroke-linecap stroke-linejoin stroke-miterlimit stroke-opacity stroke-width text-anchor text-decoration text-rendering underline-position underline-thickness unicode-bidi unicode-range units-per-em v-alphabetic v-hanging v-ideographic v-mathematical vector-effect vert-adv-y vert-origin-x vert-origin-y word-spacing writing-mode xmlns:xlink x-height".split(" ").forEach(function(e){var t=e.replace(ro,lo);ue[t]=new ge(t,1,!1,e,null,!1,!1)});"xlink:actuate xlink:arcrole xlink:role xlink:show xlink:title xlink:type".split(" ").forEach(function(e){var t=e.replace(ro,lo);ue[t]=new ge(t,1,!1,e,"http://www.w3.org/1999/xlink",!1,!1)});["xml:base","xml:lang","xml:space"].forEach(function(e){var t=e.replace(ro,lo);ue[t]=new ge(t,1,!1,e,"http://www.w3.org/XML/1998/namespace",!1,!1)});["tabIndex","crossOrigin"].forEach(function(e){ue[e]=new ge(e,1,!1,e.toLowerCase(),null,!1,!1)});ue.xlinkHref=new ge("xlinkHref",1,!1,"xlink:href","http://www.w3.org/1999/xlink",!0,!1);["src","href","action","formAction"].forEach(function(e){ue[e]=new ge(e,1,!1,e.toLowerCase(),null,!0,!0)});function io(e,t,n,r){var l=ue.hasOwnProperty(t)?ue[t]:null;(l!==null?l.type!==0:r||!(2<t.length)||t[0]!=="o"&&t[0]!=="O"||t[1]!=="n"&&t[1]!=="N")&&(s0(t,n,l,r)&&(n=null),r||l===null?o0(t)&&(n===null?e.removeAttribute(t):e.setAttribute(t,""+n)):l.mustUseProperty?e[l.propertyName]=n===null?l.type===3?!1:"":n:(t=l.attributeName,r=l.attributeNamespace,n===null?e.removeAttribute(t):(l=l.type,n=l===3||l===4&&n===!0?"":""+n,r?e.setAttributeNS(r,t,n):e.setAttribute(t,n))))}var ut=l0.__SECRET_INTERNALS_DO_NOT_USE_OR_YOU_WILL_BE_FIRED,yr=Symbol.for("react.element"),Zt=Symbol.for("react.portal"),Jt=Symbol.for("react.fragment"),oo=Symbol.for("react.strict_mode"),ui=Symbol.for("react.profiler"),xs=Symbol.for("react.provider"),Ss=Symbol.for("react.context"),uo=Symbol.for("react.forward_ref"),si=Symbol.for("react.suspense"),ai=Symbol.for("react.suspense_list"),so=Symbol.for("react.memo"),pt=Symbol.for("react.lazy"),ks=Symbol.for("react.offscreen"),bo=Symbol.iterator;function Nn(e){return e===null||typeof e!="object"?null:(e=bo&&e[bo]||e["@@iterator"],typeof e=="function"?e:null)}var G=Object.assign,Ol;function Rn(e){if(Ol===void 0)try{throw Error()}catch(n){var t=n.stack.trim().match(/\n( *(at )?)/);Ol=t&&t[1]||""}return`
-`+Ol+e}var Il=!1;function Fl(e,t){if(!e||Il)return"";Il=!0;var n=Error.prepareStackTrace;Error.prepareStackTrace=void 0;try{if(t)if(t=function(){throw Error()},Object.defineProperty(t.prototype,"props",{set:function(){throw Error()}}),typeof Reflect=="object"&&Reflect.construct){try{Reflect.construct(t,[])}catch(c){var r=c}Reflect.construct(e,[],t)}else{try{t.call()}catch(c){r=c}e.call(t.prototype)}else{try{throw Error()}catch(c){r=c}e()}}catch(c){if(c&&r&&typeof c.stack=="string"){for(var l=c.stack.split(`
-`),i=r.stack.split(`
-`),o=l.length-1,u=i.length-1;1<=o&&0<=u&&l[o]!==i[u];)u--;for(;1<=o&&0<=u;o--,u--)if(l[o]!==i[u]){if(o!==1||u!==1)do if(o--,u--,0>u||l[o]!==i[u]){var s=`
-`+l[o].replace(" at new "," at ");return e.displayName&&s.includes("<anonymous>")&&(s=s.replace("<anonymous>",e.displayName)),s}while(1<=o&&0<=u);break}}}finally{Il=!1,Error.prepareStackTrace=n}return(e=e?e.displayName||e.name:"")?Rn(e):""}function a0(e){switch(e.tag){case 5:return Rn(e.type);case 16:return Rn("Lazy");case 13:return Rn("Suspense");case 19:return Rn("SuspenseList");case 0:case 2:case 15:return e=Fl(e.type,!1),e;case 11:return e=Fl(e.type.render,!1),e;case 1:return e=Fl(e.type,!0),e;default:return""}}function ci(e){if(e==null)return null;if(typeof e=="function")return e.displayName||e.name||null;if(typeof e=="string")return e;switch(e){case Jt:return"Fragment";case Zt:return"Portal";case ui:return"Profiler";case oo:return"StrictMode";case si:return"Suspense";case ai:return"SuspenseList"}if(typeof e=="object")switch(e.$$typeof){case Ss:return(e.displayName||"Context")+".Consumer";case xs:return(e._context.displayName||"Context")+".Provider";case uo:var t=e.render;return e=e.displayName,e||(e=t.displayName||t.name||"",e=e!==""?"ForwardRef("+e+")":"ForwardRef"),e;case so:return t=e.displayName||null,t!==null?t:ci(e.type)||"Memo";case pt:t=e._payload,e=e._init;try{return ci(e(t))}catch{}}return null}function c0(e){var t=e.type;switch(e.tag){case 24:return"Cache";case 9:return(t.displayName||"Context")+".Consumer";case 10:return(t._context.displayName||"Context")+".Provider";case 18:return"DehydratedFragment";case 11:return e=t.render,e=e.displayName||e.name||"",t.displayName||(e!==""?"ForwardRef("+e+")":"ForwardRef");case 7:return"Fragment";case 5:return t;case 4:return"Portal";case 3:return"Root";case 6:return"Text";case 16:return ci(t);case 8:return t===oo?"StrictMode":"Mode";case 22:return"Offscreen";case 12:return"Profiler";case 21:return"Scope";case 13:return"Suspense";case 19:return"SuspenseList";case 25:return"TracingMarker";case 1:case 0:case 17:case 2:case 14:case 15:if(typeof t=="function")return t.displayName||t.name||null;if(typeof t=="string")return t}return null}function jt(e){switch(typeof e){case"boolean":case"number":case"string":case"undefined":return e;case"object":return e;default:return""}}function Cs(e){var t=e.type;return(e=e.nodeName)&&e.toLowerCase()==="input"&&(t==="checkbox"||t==="radio")}function f0(e){var t=Cs(e)?"checked":"value",n=Object.getOwnPropertyDescriptor(e.constructor.prototype,t),r=""+e[t];if(!e.hasOwnProperty(t)&&typeof n<"u"&&typeof n.get=="function"&&typeof n.set=="function"){var l=n.get,i=n.set;return Object.defineProperty(e,t,{configurable:!0,get:function(){return l.call(this)},set:function(o){r=""+o,i.call(this,o)}}),Object.defineProperty(e,t,{enumerable:n.enumerable}),{getValue:function(){return r},setValue:function(o){r=""+o},stopTracking:function(){e._valueTracker=null,delete e[t]}}}}function wr(e){e._valueTracker||(e._valueTracker=f0(e))}function Es(e){if(!e)return!1;var t=e._valueTracker;if(!t)return!0;var n=t.getValue(),r="";return e&&(r=Cs(e)?e.checked?"true":"false":e.value),e=r,e!==n?(t.setValue(e),!0):!1}function Kr(e){if(e=e||(typeof document<"u"?document:void 0),typeof e>"u")return null;try{return e.activeElement||e.body}catch{return e.body}}function fi(e,t){var n=t.checked;return G({},t,{defaultChecked:void 0,defaultValue:void 0,value:void 0,checked:n??e._wrapperState.initialChecked})}function eu(e,t){var n=t.defaultValue==null?"":t.defaultValue,r=t.checked!=null?t.checked:t.defaultChecked;n=jt(t.value!=null?t.value:n),e._wrapperState={initialChecked:r,initialValue:n,controlled:t.type==="checkbox"||t.type==="radio"?t.checked!=null:t.value!=null}}function Ns(e,t){t=t.checked,t!=null&&io(e,"checked",t,!1)}function di(e,t){Ns(e,t);var n=jt(t.value),r=t.type;if(n!=null)r==="number"?(n===0&&e.value===""||e.value!=n)&&(e.value=""+n):e.value!==""+n&&(e.value=""+n);else if(r==="submit"||r==="reset"){e.removeAttribute("value");return}t.hasOwnProperty("value")?pi(e,t.type,n):t.hasOwnProperty("defaultValue")&&pi(e,t.type,jt(t.defaultValue)),t.checked==null&&t.defaultChecked!=null&&(e.defaultChecked=!!t.defaultChecked)}function tu(e,t,n){if(t.hasOwnProperty("value")||t.hasOwnProperty("defaultValue")){var r=t.type;if(!(r!=="submit"&&r!=="reset"||t.value!==void 0&&t.value!==null))return;t=""+e._wrapperState.initialValue,n||t===e.value||(e.value=t),e.defaultValue=t}n=e.name,n!==""&&(e.name=""),e.defaultChecked=!!e._wrapperState.initialChecked,n!==""&&(e.name=n)}function pi(e,t,n){(t!=="number"||Kr(e.ownerDocument)!==e)&&(n==null?e.defaultValue=""+e._wrapperState.initialValue:e.defaultValue!==""+n&&(e.defaultValue=""+n))}var Dn=Array.isArray;function an(e,t,n,r){if(e=e.options,t){t={};for(var l=0;l<n.length;l++)t["$"+n[l]]=!0;for(n=0;n<e.length;n++)l=t.hasOwnProperty("$"+e[n].value),e[n].selected!==l&&(e[n].selected=l),l&&r&&(e[n].defaultSelected=!0)}else{for(n=""+jt(n),t=null,l=0;l<e.length;l++){if(e[l].value===n){e[l].selected=!0,r&&(e[l].defaultSelected=!0);return}t!==null||e[l].disabled||(t=e[l])}t!==null&&(t.selected=!0)}}function hi(e,t){if(t.dangerouslySetInnerHTML!=null)throw Error(w(91));return G({},t,{value:void 0,defaultValue:void 0,children:""+e._wrapperState.initialValue})}function nu(e,t){var n=t.value;if(n==null){if(n=t.children,t=t.defaultValue,n!=null){if(t!=null)throw Error(w(92));if(Dn(n)){if(1<n.length)throw Error(w(93));n=n[0]}t=n}t==null&&(t=""),n=t}e._wrapperState={initialValue:jt(n)}}function _s(e,t){var n=jt(t.value),r=jt(t.defaultValue);n!=null&&(n=""+n,n!==e.value&&(e.value=n),t.defaultValue==null&&e.defaultValue!==n&&(e.defaultValue=n)),r!=null&&(e.defaultValue=""+r)}function ru(e){var t=e.textContent;t===e._wrapperState.initialValue&&t!==""&&t!==null&&(e.value=t)}function js(e){switch(e){case"svg":return"http://www.w3.org/2000/svg";case"math":return"http://www.w3.org/1998/Math/MathML";default:return"http://www.w3.org/1999/xhtml"}}function mi(e,t){return e==null||e==="http://www.w3.org/1999/xhtml"?js(t):e==="http://www.w3.org/2000/svg"&&t==="foreignObject"?"http://www.w3.org/1999/xhtml":e}var xr,Ps=function(e){return typeof MSApp<"u"&&MSApp.execUnsafeLocalFunction?function(t,n,r,l){MSApp.execUnsafeLocalFunction(function(){return e(t,n,r,l)})}:e}(function(e,t){if(e.namespaceURI!=="http://www.w3.org/2000/svg"||"innerHTML"in e)e.innerHTML=t;else{for(xr=xr||document.createElement("div"),xr.innerHTML="<svg>"+t.valueOf().toString()+"</svg>",t=xr.firstChild;e.firstChild;)e.removeChild(e.firstChild);for(;t.firstChild;)e.appendChild(t.firstChild)}});function Xn(e,t){if(t){var n=e.firstChild;if(n&&n===e.lastChild&&n.nodeType===3){n.nodeValue=t;return}}e.textContent=t}var Fn={animationIterationCount:!0,aspectRatio:!0,borderImageOutset:!0,borderImageSlice:!0,borderImageWidth:!0,boxFlex:!0,boxFlexGroup:!0,boxOrdinalGroup:!0,columnCount:!0,columns:!0,flex:!0,flexGrow:!0,flexPositive:!0,flexShrink:!0,flexNegative:!0,flexOrder:!0,gridArea:!0,gridRow:!0,gridRowEnd:!0,gridRowSpan:!0,gridRowStart:!0,gridColumn:!0,gridColumnEnd:!0,gridColumnSpan:!0,gridColumnStart:!0,fontWeight:!0,lineClamp:!0,lineHeight:!0,opacity:!0,order:!0,orphans:!0,tabSize:!0,widows:!0,zIndex:!0,zoom:!0,fillOpacity:!0,floodOpacity:!0,stopOpacity:!0,strokeDasharray:!0,strokeDashoffset:!0,strokeMiterlimit:!0,strokeOpacity:!0,strokeWidth:!0},d0=["Webkit","ms","Moz","O"];Object.keys(Fn).forEach(function(e){d0.forEach(function(t){t=t+e.charAt(0).toUpperCase()+e.substring(1),Fn[t]=Fn[e]})});function zs(e,t,n){return t==null||typeof t=="boolean"||t===""?"":n||typeof t!="number"||t===0||Fn.hasOwnProperty(e)&&Fn[e]?(""+t).trim():t+"px"}function Ls(e,t){e=e.style;for(var n in t)if(t.hasOwnProperty(n)){var r=n.indexOf("--")===0,l=zs(n,t[n],r);n==="float"&&(n="cssFloat"),r?e.setProperty(n,l):e[n]=l}}var p0=G({menuitem:!0},{area:!0,base:!0,br:!0,col:!0,embed:!0,hr:!0,img:!0,input:!0,keygen:!0,link:!0,meta:!0,param:!0,source:!0,track:!0,wbr:!0});function vi(e,t){if(t){if(p0[e]&&(t.children!=null||t.dangerouslySetInnerHTML!=null))throw Error(w(137,e));if(t.dangerouslySetInnerHTML!=null){if(t.children!=null)throw Error(w(60));if(typeof t.dangerouslySetInnerHTML!="object"||!("__html"in t.dangerouslySetInnerHTML))throw Error(w(61))}if(t.style!=null&&typeof t.style!="object")throw Error(w(62))}}function gi(e,t){if(e.indexOf("-")===-1)return typeof t.is=="string";switch(e){case"annotation-xml":case"color-profile":case"font-face":case"font-face-src":case"font-face-uri":case"font-face-format":case"font-face-name":case"missing-glyph":return!1;default:return!0}}var yi=null;function ao(e){return e=e.target||e.srcElement||window,e.correspondingUseElement&&(e=e.correspondingUseElement),e.nodeType===3?e.parentNode:e}var wi=null,cn=null,fn=null;function lu(e){if(e=hr(e)){if(typeof wi!="function")throw Error(w(280));var t=e.stateNode;t&&(t=Sl(t),wi(e.stateNode,e.type,t))}}function Ts(e){cn?fn?fn.push(e):fn=[e]:cn=e}function Ms(){if(cn){var e=cn,t=fn;if(fn=cn=null,lu(e),t)for(e=0;e<t.length;e++)lu(t[e])}}function Rs(e,t){return e(t)}function Ds(){}var Ul=!1;function Os(e,t,n){if(Ul)return e(t,n);Ul=!0;try{return Rs(e,t,n)}finally{Ul=!1,(cn!==null||fn!==null)&&(Ds(),Ms())}}function Zn(e,t){var n=e.stateNode;if(n===null)return null;var r=Sl(n);if(r===null)return null;n=r[t];e:switch(t){case"onClick":case"onClickCapture":case"onDoubleClick":case"onDoubleClickCapture":case"onMouseDown":case"onMouseDownCapture":case"onMouseMove":case"onMouseMoveCapture":case"onMouseUp":case"onMouseUpCapture":case"onMouseEnter":(r=!r.disabled)||(e=e.type,r=!(e==="button"||e==="input"||e==="select"||e==="textarea")),e=!r;break e;default:e=!1}if(e)return null;if(n&&typeof n!="function")throw Error(w(231,t,typeof n));return n}var xi=!1;if(rt)try{var _n={};Object.defineProperty(_n,"passive",{get:function(){xi=!0}}),window.addEventListener("test",_n,_n),window.removeEventListener("test",_n,_n)}catch{xi=!1}function h0(e,t,n,r,l,i,o,u,s){var c=Array.prototype.slice.call(arguments,3);try{t.apply(n,c)}catch(g){this.onError(g)}}var Un=!1,Yr=null,Gr=!1,Si=null,m0={onError:function(e){Un=!0,Yr=e}};function v0(e,t,n,r,l,i,o,u,s){Un=!1,Yr=null,h0.apply(m0,arguments)}function g0(e,t,n,r,l,i,o,u,s){if(v0.apply(this,arguments),Un){if(Un){var c=Yr;Un=!1,Yr=null}else throw Error(w(198));Gr||(Gr=!0,Si=c)}}function Yt(e){var t=e,n=e;if(e.alternate)for(;t.return;)t=t.return;else{e=t;do t=e,t.flags&4098&&(n=t.return),e=t.return;while(e)}return t.tag===3?n:null}function Is(e){if(e.tag===13){var t=e.memoizedState;if(t===null&&(e=e.alternate,e!==null&&(t=e.memoizedState)),t!==null)return t.dehydrated}return null}function iu(e){if(Yt(e)!==e)throw Error(w(188))}function y0(e){var t=e.alternate;if(!t){if(t=Yt(e),t===null)throw Error(w(188));return t!==e?null:e}for(var n=e,r=t;;){var l=n.return;if(l===null)break;var i=l.alternate;if(i===null){if(r=l.return,r!==null){n=r;continue}break}if(l.child===i.child){for(i=l.child;i;){if(i===n)return iu(l),e;if(i===r)return iu(l),t;i=i.sibling}throw Error(w(188))}if(n.return!==r.return)n=l,r=i;else{for(var o=!1,u=l.child;u;){if(u===n){o=!0,n=l,r=i;break}if(u===r){o=!0,r=l,n=i;break}u=u.sibling}if(!o){for(u=i.child;u;){if(u===n){o=!0,n=i,r=l;break}if(u===r){o=!0,r=i,n=l;break}u=u.sibling}if(!o)throw Error(w(189))}}if(n.alternate!==r)throw Error(w(190))}if(n.tag!==3)throw Error(w(188));return n.stateNode.current===n?e:t}function Fs(e){return e=y0(e),e!==null?Us(e):null}function Us(e){if(e.tag===5||e.tag===6)return e;for(e=e.child;e!==null;){var t=Us(e);if(t!==null)return t;e=e.sibling}return null}var $s=_e.unstable_scheduleCallback,ou=_e.unstable_cancelCallback,w0=_e.unstable_shouldYield,x0=_e.unstable_requestPaint,J=_e.unstable_now,S0=_e.unstable_getCurrentPriorityLevel,co=_e.unstable_ImmediatePriority,Vs=_e.unstable_UserBlockingPriority,Xr=_e.unstable_NormalPriority,k0=_e.unstable_LowPriority,As=_e.unstable_IdlePriority,gl=null,Ye=null;function C0(e){if(Ye&&typeof Ye.onCommitFiberRoot=="function")try{Ye.onCommitFiberRoot(gl,e,void 0,(e.current.flags&128)===128)}catch{}}var $e=Math.clz32?Math.clz32:_0,E0=Math.log,N0=Math.LN2;function _0(e){return e>>>=0,e===0?32:31-(E0(e)/N0|0)|0}var Sr=64,kr=4194304;function On(e){switch(e&-e){case 1:return 1;case 2:return 2;case 4:return 4;case 8:return 8;case 16:return 16;case 32:return 32;case 64:case 128:case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:return e&4194240;case 4194304:case 8388608:case 16777216:case 33554432:case 67108864:return e&130023424;case 134217728:return 134217728;case 268435456:return 268435456;case 536870912:return 536870912;case 1073741824:return 1073741824;default:return e}}function Zr(e,t){var n=e.pendingLanes;if(n===0)return 0;var r=0,l=e.suspendedLanes,i=e.pingedLanes,o=n&268435455;if(o!==0){var u=o&~l;u!==0?r=On(u):(i&=o,i!==0&&(r=On(i)))}else o=n&~l,o!==0?r=On(o):i!==0&&(r=On(i));if(r===0)return 0;if(t!==0&&t!==r&&!(t&l)&&(l=r&-r,i=t&-t,l>=i||l===16&&(i&4194240)!==0))return t;if(r&4&&(r|=n&16),t=e.entangledLanes,t!==0)for(e=e.entanglements,t&=r;0<t;)n=31-$e(t),l=1<<n,r|=e[n],t&=~l;return r}function j0(e,t){switch(e){case 1:case 2:case 4:return t+250;case 8:case 16:case 32:case 64:case 128:case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:return t+5e3;case 4194304:case 8388608:case 16777216:case 33554432:case 67108864:return-1;case 134217728:case 268435456:case 536870912:case 1073741824:return-1;default:return-1}}function P0(e,t){for(var n=e.suspendedLanes,r=e.pingedLanes,l=e.expirationTimes,i=e.pendingLanes;0<i;){var o=31-$e(i),u=1<<o,s=l[o];s===-1?(!(u&n)||u&r)&&(l[o]=j0(u,t)):s<=t&&(e.expiredLanes|=u),i&=~u}}function ki(e){return e=e.pendingLanes&-1073741825,e!==0?e:e&1073741824?1073741824:0}function Bs(){var e=Sr;return Sr<<=1,!(Sr&4194240)&&(Sr=64),e}function $l(e){for(var t=[],n=0;31>n;n++)t.push(e);return t}function dr(e,t,n){e.pendingLanes|=t,t!==536870912&&(e.suspendedLanes=0,e.pingedLanes=0),e=e.eventTimes,t=31-$e(t),e[t]=n}function z0(e,t){var n=e.pendingLanes&~t;e.pendingLanes=t,e.suspendedLanes=0,e.pingedLanes=0,e.expiredLanes&=t,e.mutableReadLanes&=t,e.entangledLanes&=t,t=e.entanglements;var r=e.eventTimes;for(e=e.expirationTimes;0<n;){var l=31-$e(n),i=1<<l;t[l]=0,r[l]=-1,e[l]=-1,n&=~i}}function fo(e,t){var n=e.entangledLanes|=t;for(e=e.entanglements;n;){var r=31-$e(n),l=1<<r;l&t|e[r]&t&&(e[r]|=t),n&=~l}}var F=0;function Hs(e){return e&=-e,1<e?4<e?e&268435455?16:536870912:4:1}var Ws,po,Qs,Ks,Ys,Ci=!1,Cr=[],wt=null,xt=null,St=null,Jn=new Map,qn=new Map,mt=[],L0="mousedown mouseup touchcancel touchend touchstart auxclick dblclick pointercancel pointerdown pointerup dragend dragstart drop compositionend compositionstart keydown keypress keyup input textInput copy cut paste click change contextmenu reset submit".split(" ");function uu(e,t){switch(e){case"focusin":case"focusout":wt=null;break;case"dragenter":case"dragleave":xt=null;break;case"mouseover":case"mouseout":St=null;break;case"pointerover":case"pointerout":Jn.delete(t.pointerId);break;case"gotpointercapture":case"lostpointercapture":qn.delete(t.pointerId)}}function jn(e,t,n,r,l,i){return e===null||e.nativeEvent!==i?(e={blockedOn:t,domEventName:n,eventSystemFlags:r,nativeEvent:i,targetContainers:[l]},t!==null&&(t=hr(t),t!==null&&po(t)),e):(e.eventSystemFlags|=r,t=e.targetContainers,l!==null&&t.indexOf(l)===-1&&t.push(l),e)}function T0(e,t,n,r,l){switch(t){case"focusin":return wt=jn(wt,e,t,n,r,l),!0;case"dragenter":return xt=jn(xt,e,t,n,r,l),!0;case"mouseover":return St=jn(St,e,t,n,r,l),!0;case"pointerover":var i=l.pointerId;return Jn.set(i,jn(Jn.get(i)||null,e,t,n,r,l)),!0;case"gotpointercapture":return i=l.pointerId,qn.set(i,jn(qn.get(i)||null,e,t,n,r,l)),!0}return!1}function Gs(e){var t=It(e.target);if(t!==null){var n=Yt(t);if(n!==null){if(t=n.tag,t===13){if(t=Is(n),t!==null){e.blockedOn=t,Ys(e.priority,function(){Qs(n)});return}}else if(t===3&&n.stateNode.current.memoizedState.isDehydrated){e.blockedOn=n.tag===3?n.stateNode.containerInfo:null;return}}}e.blockedOn=null}function Ir(e){if(e.blockedOn!==null)return!1;for(var t=e.targetContainers;0<t.length;){var n=Ei(e.domEventName,e.eventSystemFlags,t[0],e.nativeEvent);if(n===null){n=e.nativeEvent;var r=new n.constructor(n.type,n);yi=r,n.target.dispatchEvent(r),yi=null}else return t=hr(n),t!==null&&po(t),e.blockedOn=n,!1;t.shift()}return!0}function su(e,t,n){Ir(e)&&n.delete(t)}function M0(){Ci=!1,wt!==null&&Ir(wt)&&(wt=null),xt!==null&&Ir(xt)&&(xt=null),St!==null&&Ir(St)&&(St=null),Jn.forEach(su),qn.forEach(su)}function Pn(e,t){e.blockedOn===t&&(e.blockedOn=null,Ci||(Ci=!0,_e.unstable_scheduleCallback(_e.unstable_NormalPriority,M0)))}function bn(e){function t(l){return Pn(l,e)}if(0<Cr.length){Pn(Cr[0],e);for(var n=1;n<Cr.length;n++){var r=Cr[n];r.blockedOn===e&&(r.blockedOn=null)}}for(wt!==null&&Pn(wt,e),xt!==null&&Pn(xt,e),St!==null&&Pn(St,e),Jn.forEach(t),qn.forEach(t),n=0;n<mt.length;n++)r=mt[n],r.blockedOn===e&&(r.blockedOn=null);for(;0<mt.length&&(n=mt[0],n.blockedOn===null);)Gs(n),n.blockedOn===null&&mt.shift()}var dn=ut.ReactCurrentBatchConfig,Jr=!0;function R0(e,t,n,r){var l=F,i=dn.transition;dn.transition=null;try{F=1,ho(e,t,n,r)}finally{F=l,dn.transition=i}}function D0(e,t,n,r){var l=F,i=dn.transition;dn.transition=null;try{F=4,ho(e,t,n,r)}finally{F=l,dn.transition=i}}function ho(e,t,n,r){if(Jr){var l=Ei(e,t,n,r);if(l===null)Xl(e,t,r,qr,n),uu(e,r);else if(T0(l,e,t,n,r))r.stopPropagation();else if(uu(e,r),t&4&&-1<L0.indexOf(e)){for(;l!==null;){var i=hr(l);if(i!==null&&Ws(i),i=Ei(e,t,n,r),i===null&&Xl(e,t,r,qr,n),i===l)break;l=i}l!==null&&r.stopPropagation()}else Xl(e,t,r,null,n)}}var qr=null;function Ei(e,t,n,r){if(qr=null,e=ao(r),e=It(e),e!==null)if(t=Yt(e),t===null)e=null;else if(n=t.tag,n===13){if(e=Is(t),e!==null)return e;e=null}else if(n===3){if(t.stateNode.current.memoizedState.isDehydrated)return t.tag===3?t.stateNode.containerInfo:null;e=null}else t!==e&&(e=null);return qr=e,null}function Xs(e){switch(e){case"cancel":case"click":case"close":case"contextmenu":case"copy":case"cut":case"auxclick":case"dblclick":case"dragend":case"dragstart":case"drop":case"focusin":case"focusout":case"input":case"invalid":case"keydown":case"keypress":case"keyup":case"mousedown":case"mouseup":case"paste":case"pause":case"play":case"pointercancel":case"pointerdown":case"pointerup":case"ratechange":case"reset":case"resize":case"seeked":case"submit":case"touchcancel":case"touchend":case"touchstart":case"volumechange":case"change":case"selectionchange":case"textInput":case"compositionstart":case"compositionend":case"compositionupdate":case"beforeblur":case"afterblur":case"beforeinput":case"blur":case"fullscreenchange":case"focus":case"hashchange":case"popstate":case"select":case"selectstart":return 1;case"drag":case"dragenter":case"dragexit":case"dragleave":case"dragover":case"mousemove":case"mouseout":case"mouseover":case"pointermove":case"pointerout":case"pointerover":case"scroll":case"toggle":case"touchmove":case"wheel":case"mouseenter":case"mouseleave":case"pointerenter":case"pointerleave":return 4;case"message":switch(S0()){case co:return 1;case Vs:return 4;case Xr:case k0:return 16;case As:return 536870912;default:return 16}default:return 16}}var gt=null,mo=null,Fr=null;function Zs(){if(Fr)return Fr;var e,t=mo,n=t.length,r,l="value"in gt?gt.value:gt.textContent,i=l.length;for(e=0;e<n&&t[e]===l[e];e++);var o=n-e;for(r=1;r<=o&&t[n-r]===l[i-r];r++);return Fr=l.slice(e,1<r?1-r:void 0)}function Ur(e){var t=e.keyCode;return"charCode"in e?(e=e.charCode,e===0&&t===13&&(e=13)):e=t,e===10&&(e=13),32<=e||e===13?e:0}function Er(){return!0}function au(){return!1}function Pe(e){function t(n,r,l,i,o){this._reactName=n,this._targetInst=l,this.type=r,this.nativeEvent=i,this.target=o,this.currentTarget=null;for(var u in e)e.hasOwnProperty(u)&&(n=e[u],this[u]=n?n(i):i[u]);return this.isDefaultPrevented=(i.defaultPrevented!=null?i.defaultPrevented:i.returnValue===!1)?Er:au,this.isPropagationStopped=au,this}return G(t.prototype,{preventDefault:function(){this.defaultPrevented=!0;var n=this.nativeEvent;n&&(n.preventDefault?n.preventDefault():typeof n.returnValue!="unknown"&&(n.returnValue=!1),this.isDefaultPrevented=Er)},stopPropagation:function(){var n=this.nativeEvent;n&&(n.stopPropagation?n.stopPropagation():typeof n.cancelBubble!="unknown"&&(n.cancelBubble=!0),this.isPropagationStopped=Er)},persist:function(){},isPersistent:Er}),t}var Cn={eventPhase:0,bubbles:0,cancelable:0,timeStamp:function(e){return e.timeStamp||Date.now()},defaultPrevented:0,isTrusted:0},vo=Pe(Cn),pr=G({},Cn,{view:0,detail:0}),O0=Pe(pr),Vl,Al,zn,yl=G({},pr,{screenX:0,screenY:0,clientX:0,clientY:0,pageX:0,pageY:0,ctrlKey:0,shiftKey:0,altKey:0,metaKey:0,getModifierState:go,button:0,buttons:0,relatedTarget:function(e){return e.relatedTarget===void 0?e.fromElement===e.srcElement?e.toElement:e.fromElement:e.relatedTarget},movementX:function(e){return"movementX"in e?e.movementX:(e!==zn&&(zn&&e.type==="mousemove"?(Vl=e.screenX-zn.screenX,Al=e.screenY-zn.screenY):Al=Vl=0,zn=e),Vl)},movementY:function(e){return"movementY"in e?e.movementY:Al}}),cu=Pe(yl),I0=G({},yl,{dataTransfer:0}),F0=Pe(I0),U0=G({},pr,{relatedTarget:0}),Bl=Pe(U0),$0=G({},Cn,{animationName:0,elapsedTime:0,pseudoElement:0}),V0=Pe($0),A0=G({},Cn,{clipboardData:function(e){return"clipboardData"in e?e.clipboardData:window.clipboardData}}),B0=Pe(A0),H0=G({},Cn,{data:0}),fu=Pe(H0),W0={Esc:"Escape",Spacebar:" ",Left:"ArrowLeft",Up:"ArrowUp",Right:"ArrowRight",Down:"ArrowDown",Del:"Delete",Win:"OS",Menu:"ContextMenu",Apps:"ContextMenu",Scroll:"ScrollLock",MozPrintableKey:"Unidentified"},Q0={8:"Backspace",9:"Tab",12:"Clear",13:"Enter",16:"Shift",17:"Control",18:"Alt",19:"Pause",20:"CapsLock",27:"Escape",32:" ",33:"PageUp",34:"PageDown",35:"End",36:"Home",37:"ArrowLeft",38:"ArrowUp",39:"ArrowRight",40:"ArrowDown",45:"Insert",46:"Delete",112:"F1",113:"F2",114:"F3",115:"F4",116:"F5",117:"F6",118:"F7",119:"F8",120:"F9",121:"F10",122:"F11",123:"F12",144:"NumLock",145:"ScrollLock",224:"Meta"},K0={Alt:"altKey",Control:"ctrlKey",Meta:"metaKey",Shift:"shiftKey"};function Y0(e){var t=this.nativeEvent;return t.getModifierState?t.getModifierState(e):(e=K0[e])?!!t[e]:!1}function go(){return Y0}var G0=G({},pr,{key:function(e){if(e.key){var t=W0[e.key]||e.key;if(t!=="Unidentified")return t}return e.type==="keypress"?(e=Ur(e),e===13?"Enter":String.fromCharCode(e)):e.type==="keydown"||e.type==="keyup"?Q0[e.keyCode]||"Unidentified":""},code:0,location:0,ctrlKey:0,shiftKey:0,altKey:0,metaKey:0,repeat:0,locale:0,getModifierState:go,charCode:function(e){return e.type==="keypress"?Ur(e):0},keyCode:function(e){return e.type==="keydown"||e.type==="keyup"?e.keyCode:0},which:function(e){return e.type==="keypress"?Ur(e):e.type==="keydown"||e.type==="keyup"?e.keyCode:0}}),X0=Pe(G0),Z0=G({},yl,{pointerId:0,width:0,height:0,pressure:0,tangentialPressure:0,tiltX:0,tiltY:0,twist:0,pointerType:0,isPrimary:0}),du=Pe(Z0),J0=G({},pr,{touches:0,targetTouches:0,changedTouches:0,altKey:0,metaKey:0,ctrlKey:0,shiftKey:0,getModifierState:go}),q0=Pe(J0),b0=G({},Cn,{propertyName:0,elapsedTime:0,pseudoElement:0}),ef=Pe(b0),tf=G({},yl,{deltaX:function(e){return"deltaX"in e?e.deltaX:"wheelDeltaX"in e?-e.wheelDeltaX:0},deltaY:function(e){return"deltaY"in e?e.deltaY:"wheelDeltaY"in e?-e.wheelDeltaY:"wheelDelta"in e?-e.wheelDelta:0},deltaZ:0,deltaMode:0}),nf=Pe(tf),rf=[9,13,27,32],yo=rt&&"CompositionEvent"in window,$n=null;rt&&"documentMode"in document&&($n=document.documentMode);var lf=rt&&"TextEvent"in window&&!$n,Js=rt&&(!yo||$n&&8<$n&&11>=$n),pu=" ",hu=!1;function qs(e,t){switch(e){case"keyup":return rf.indexOf(t.keyCode)!==-1;case"keydown":return t.keyCode!==229;case"keypress":case"mousedown":case"focusout":return!0;default:return!1}}function bs(e){return e=e.detail,typeof e=="object"&&"data"in e?e.data:null}var qt=!1;function of(e,t){switch(e){case"compositionend":return bs(t);case"keypress":return t.which!==32?null:(hu=!0,pu);case"textInput":return e=t.data,e===pu&&hu?null:e;default:return null}}function uf(e,t){if(qt)return e==="compositionend"||!yo&&qs(e,t)?(e=Zs(),Fr=mo=gt=null,qt=!1,e):null;switch(e){case"paste":return null;case"keypress":if(!(t.ctrlKey||t.altKey||t.metaKey)||t.ctrlKey&&t.altKey){if(t.char&&1<t.char.length)return t.char;if(t.which)return String.fromCharCode(t.which)}return null;case"compositionend":return Js&&t.locale!=="ko"?null:t.data;default:return null}}var sf={color:!0,date:!0,datetime:!0,"datetime-local":!0,email:!0,month:!0,number:!0,password:!0,range:!0,search:!0,tel:!0,text:!0,time:!0,url:!0,week:!0};function mu(e){var t=e&&e.nodeName&&e.nodeName.toLowerCase();return t==="input"?!!sf[e.type]:t==="textarea"}function ea(e,t,n,r){Ts(r),t=br(t,"onChange"),0<t.length&&(n=new vo("onChange","change",null,n,r),e.push({event:n,listeners:t}))}var Vn=null,er=null;function af(e){fa(e,0)}function wl(e){var t=tn(e);if(Es(t))return e}function cf(e,t){if(e==="change")return t}var ta=!1;if(rt){var Hl;if(rt){var Wl="oninput"in document;if(!Wl){var vu=document.createElement("div");vu.setAttribute("oninput","return;"),Wl=typeof vu.oninput=="function"}Hl=Wl}else Hl=!1;ta=Hl&&(!document.documentMode||9<document.documentMode)}function gu(){Vn&&(Vn.detachEvent("onpropertychange",na),er=Vn=null)}function na(e){if(e.propertyName==="value"&&wl(er)){var t=[];ea(t,er,e,ao(e)),Os(af,t)}}function ff(e,t,n){e==="focusin"?(gu(),Vn=t,er=n,Vn.attachEvent("onpropertychange",na)):e==="focusout"&&gu()}function df(e){if(e==="selectionchange"||e==="keyup"||e==="keydown")return wl(er)}function pf(e,t){if(e==="click")return wl(t)}function hf(e,t){if(e==="input"||e==="change")return wl(t)}function mf(e,t){return e===t&&(e!==0||1/e===1/t)||e!==e&&t!==t}var Ae=typeof Object.is=="function"?Object.is:mf;function tr(e,t){if(Ae(e,t))return!0;if(typeof e!="object"||e===null||typeof t!="object"||t===null)return!1;var n=Object.keys(e),r=Object.keys(t);if(n.length!==r.length)return!1;for(r=0;r<n.length;r++){var l=n[r];if(!oi.call(t,l)||!Ae(e[l],t[l]))return!1}return!0}function yu(e){for(;e&&e.firstChild;)e=e.firstChild;return e}function wu(e,t){var n=yu(e);e=0;for(var r;n;){if(n.nodeType===3){if(r=e+n.textContent.length,e<=t&&r>=t)return{node:n,offset:t-e};e=r}e:{for(;n;){if(n.nextSibling){n=n.nextSibling;break e}n=n.parentNode}n=void 0}n=yu(n)}}function ra(e,t){return e&&t?e===t?!0:e&&e.nodeType===3?!1:t&&t.nodeType===3?ra(e,t.parentNode):"contains"in e?e.contains(t):e.compareDocumentPosition?!!(e.compareDocumentPosition(t)&16):!1:!1}function la(){for(var e=window,t=Kr();t instanceof e.HTMLIFrameElement;){try{var n=typeof t.contentWindow.location.href=="string"}catch{n=!1}if(n)e=t.contentWindow;else break;t=Kr(e.document)}return t}function wo(e){var t=e&&e.nodeName&&e.nodeName.toLowerCase();return t&&(t==="input"&&(e.type==="text"||e.type==="search"||e.type==="tel"||e.type==="url"||e.type==="password")||t==="textarea"||e.contentEditable==="true")}function vf(e){var t=la(),n=e.focusedElem,r=e.selectionRange;if(t!==n&&n&&n.ownerDocument&&ra(n.ownerDocument.documentElement,n)){if(r!==null&&wo(n)){if(t=r.start,e=r.end,e===void 0&&(e=t),"selectionStart"in n)n.selectionStart=t,n.selectionEnd=Math.min(e,n.value.length);else if(e=(t=n.ownerDocument||document)&&t.defaultView||window,e.getSelection){e=e.getSelection();var l=n.textContent.length,i=Math.min(r.start,l);r=r.end===void 0?i:Math.min(r.end,l),!e.extend&&i>r&&(l=r,r=i,i=l),l=wu(n,i);var o=wu(n,r);l&&o&&(e.rangeCount!==1||e.anchorNode!==l.node||e.anchorOffset!==l.offset||e.focusNode!==o.node||e.focusOffset!==o.offset)&&(t=t.createRange(),t.setStart(l.node,l.offset),e.removeAllRanges(),i>r?(e.addRange(t),e.extend(o.node,o.offset)):(t.setEnd(o.node,o.offset),e.addRange(t)))}}for(t=[],e=n;e=e.parentNode;)e.nodeType===1&&t.push({element:e,left:e.scrollLeft,top:e.scrollTop});for(typeof n.focus=="function"&&n.focus(),n=0;n<t.length;n++)e=t[n],e.element.scrollLeft=e.left,e.element.scrollTop=e.top}}var gf=rt&&"documentMode"in document&&11>=document.documentMode,bt=null,Ni=null,An=null,_i=!1;function xu(e,t,n){var r=n.window===n?n.document:n.nodeType===9?n:n.ownerDocument;_i||bt==null||bt!==Kr(r)||(r=bt,"selectionStart"in r&&wo(r)?r={start:r.selectionStart,end:r.selectionEnd}:(r=(r.ownerDocument&&r.ownerDocument.defaultView||window).getSelection(),r={anchorNode:r.anchorNode,anchorOffset:r.anchorOffset,focusNode:r.focusNode,focusOffset:r.focusOffset}),An&&tr(An,r)||(An=r,r=br(Ni,"onSelect"),0<r.length&&(t=new vo("onSelect","select",null,t,n),e.push({event:t,listeners:r}),t.target=bt)))}function Nr(e,t){var n={};return n[e.toLowerCase()]=t.toLowerCase(),n["Webkit"+e]="webkit"+t,n["Moz"+e]="moz"+t,n}var en={animationend:Nr("Animation","AnimationEnd"),animationiteration:Nr("Animation","AnimationIteration"),animationstart:Nr("Animation","AnimationStart"),transitionend:Nr("Transition","TransitionEnd")},Ql={},ia={};rt&&(ia=document.createElement("div").style,"AnimationEvent"in window||(delete en.animationend.animation,delete en.animationiteration.animation,delete en.animationstart.animation),"TransitionEvent"in window||delete en.transitionend.transition);function xl(e){if(Ql[e])return Ql[e];if(!en[e])return e;var t=en[e],n;for(n in t)if(t.hasOwnProperty(n)&&n in ia)return Ql[e]=t[n];return e}var oa=xl("animationend"),ua=xl("animationiteration"),sa=xl("animationstart"),aa=xl("transitionend"),ca=new Map,Su="abort auxClick cancel canPlay canPlayThrough click close contextMenu copy cut drag dragEnd dragEnter dragExit dragLeave dragOver dragStart drop durationChange emptied encrypted ended error gotPointerCapture input invalid keyDown keyPress keyUp load loadedData loadedMetadata loadStart lostPointerCapture mouseDown mouseMove mouseOut mouseOver mouseUp paste pause play playing pointerCancel pointerDown pointerMove pointerOut pointerOver pointerUp progress rateChange reset resize seeked seeking stalled submit suspend timeUpdate touchCancel touchEnd touchStart volumeChange scroll toggle touchMove waiting wheel".split(" ");function zt(e,t){ca.set(e,t),Kt(t,[e])}for(var Kl=0;Kl<Su.length;Kl++){var Yl=Su[Kl],yf=Yl.toLowerCase(),wf=Yl[0].toUpperCase()+Yl.slice(1);zt(yf,"on"+wf)}zt(oa,"onAnimationEnd");zt(ua,"onAnimationIteration");zt(sa,"onAnimationStart");zt("dblclick","onDoubleClick");zt("focusin","onFocus");zt("focusout","onBlur");zt(aa,"onTransitionEnd");mn("onMouseEnter",["mouseout","mouseover"]);mn("onMouseLeave",["mouseout","mouseover"]);mn("onPointerEnter",["pointerout","pointerover"]);mn("onPointerLeave",["pointerout","pointerover"]);Kt("onChange","change click focusin focusout input keydown keyup selectionchange".split(" "));Kt("onSelect","focusout contextmenu dragend focusin keydown keyup mousedown mouseup selectionchange".split(" "));Kt("onBeforeInput",["compositionend","keypress","textInput","paste"]);Kt("onCompositionEnd","compositionend focusout keydown keypress keyup mousedown".split(" "));Kt("onCompositionStart","compositionstart focusout keydown keypress keyup mousedown".split(" "));Kt("onCompositionUpdate","compositionupdate focusout keydown keypress keyup mousedown".split(" "));var In="abort canplay canplaythrough durationchange emptied encrypted ended error loadeddata loadedmetadata loadstart pause play playing progress ratechange resize seeked seeking stalled suspend timeupdate volumechange waiting".split(" "),xf=new Set("cancel close invalid load scroll toggle".split(" ").concat(In));function ku(e,t,n){var r=e.type||"unknown-event";e.currentTarget=n,g0(r,t,void 0,e),e.currentTarget=null}function fa(e,t){t=(t&4)!==0;for(var n=0;n<e.length;n++){var r=e[n],l=r.event;r=r.listeners;e:{var i=void 0;if(t)for(var o=r.length-1;0<=o;o--){var u=r[o],s=u.instance,c=u.currentTarget;if(u=u.listener,s!==i&&l.isPropagationStopped())break e;ku(l,u,c),i=s}else for(o=0;o<r.length;o++){if(u=r[o],s=u.instance,c=u.currentTarget,u=u.listener,s!==i&&l.isPropagationStopped())break e;ku(l,u,c),i=s}}}if(Gr)throw e=Si,Gr=!1,Si=null,e}function V(e,t){var n=t[Ti];n===void 0&&(n=t[Ti]=new Set);var r=e+"__bubble";n.has(r)||(da(t,e,2,!1),n.add(r))}function Gl(e,t,n){var r=0;t&&(r|=4),da(n,e,r,t)}var _r="_reactListening"+Math.random().toString(36).slice(2);function nr(e){if(!e[_r]){e[_r]=!0,ws.forEach(function(n){n!=="selectionchange"&&(xf.has(n)||Gl(n,!1,e),Gl(n,!0,e))});var t=e.nodeType===9?e:e.ownerDocument;t===null||t[_r]||(t[_r]=!0,Gl("selectionchange",!1,t))}}function da(e,t,n,r){switch(Xs(t)){case 1:var l=R0;break;case 4:l=D0;break;default:l=ho}n=l.bind(null,t,n,e),l=void 0,!xi||t!=="touchstart"&&t!=="touchmove"&&t!=="wheel"||(l=!0),r?l!==void 0?e.addEventListener(t,n,{capture:!0,passive:l}):e.addEventListener(t,n,!0):l!==void 0?e.addEventListener(t,n,{passive:l}):e.addEventListener(t,n,!1)}function Xl(e,t,n,r,l){var i=r;if(!(t&1)&&!(t&2)&&r!==null)e:for(;;){if(r===null)return;var o=r.tag;if(o===3||o===4){var u=r.stateNode.containerInfo;if(u===l||u.nodeType===8&&u.parentNode===l)break;if(o===4)for(o=r.return;o!==null;){var s=o.tag;if((s===3||s===4)&&(s=o.stateNode.containerInfo,s===l||s.nodeType===8&&s.parentNode===l))return;o=o.return}for(;u!==null;){if(o=It(u),o===null)return;if(s=o.tag,s===5||s===6){r=i=o;continue e}u=u.parentNode}}r=r.return}Os(function(){var c=i,g=ao(n),m=[];e:{var h=ca.get(e);if(h!==void 0){var x=vo,S=e;switch(e){case"keypress":if(Ur(n)===0)break e;case"keydown":case"keyup":x=X0;break;case"focusin":S="focus",x=Bl;break;case"focusout":S="blur",x=Bl;break;case"beforeblur":case"afterblur":x=Bl;break;case"click":if(n.button===2)break e;case"auxclick":case"dblclick":case"mousedown":case"mousemove":case"mouseup":case"mouseout":case"mouseover":case"contextmenu":x=cu;break;case"drag":case"dragend":case"dragenter":case"dragexit":case"dragleave":case"dragover":case"dragstart":case"drop":x=F0;break;case"touchcancel":case"touchend":case"touchmove":case"touchstart":x=q0;break;case oa:case ua:case sa:x=V0;break;case aa:x=ef;break;case"scroll":x=O0;break;case"wheel":x=nf;break;case"copy":case"cut":case"paste":x=B0;break;case"gotpointercapture":case"lostpointercapture":case"pointercancel":case"pointerdown":case"pointermove":case"pointerout":case"pointerover":case"pointerup":x=du}var k=(t&4)!==0,U=!k&&e==="scroll",f=k?h!==null?h+"Capture":null:h;k=[];for(var a=c,d;a!==null;){d=a;var y=d.stateNode;if(d.tag===5&&y!==null&&(d=y,f!==null&&(y=Zn(a,f),y!=null&&k.push(rr(a,y,d)))),U)break;a=a.return}0<k.length&&(h=new x(h,S,null,n,g),m.push({event:h,listeners:k}))}}if(!(t&7)){e:{if(h=e==="mouseover"||e==="pointerover",x=e==="mouseout"||e==="pointerout",h&&n!==yi&&(S=n.relatedTarget||n.fromElement)&&(It(S)||S[lt]))break e;if((x||h)&&(h=g.window===g?g:(h=g.ownerDocument)?h.defaultView||h.parentWindow:window,x?(S=n.relatedTarget||n.toElement,x=c,S=S?It(S):null,S!==null&&(U=Yt(S),S!==U||S.tag!==5&&S.tag!==6)&&(S=null)):(x=null,S=c),x!==S)){if(k=cu,y="onMouseLeave",f="onMouseEnter",a="mouse",(e==="pointerout"||e==="pointerover")&&(k=du,y="onPointerLeave",f="onPointerEnter",a="pointer"),U=x==null?h:tn(x),d=S==null?h:tn(S),h=new k(y,a+"leave",x,n,g),h.target=U,h.relatedTarget=d,y=null,It(g)===c&&(k=new k(f,a+"enter",S,n,g),k.target=d,k.relatedTarget=U,y=k),U=y,x&&S)t:{for(k=x,f=S,a=0,d=k;d;d=Xt(d))a++;for(d=0,y=f;y;y=Xt(y))d++;for(;0<a-d;)k=Xt(k),a--;for(;0<d-a;)f=Xt(f),d--;for(;a--;){if(k===f||f!==null&&k===f.alternate)break t;k=Xt(k),f=Xt(f)}k=null}else k=null;x!==null&&Cu(m,h,x,k,!1),S!==null&&U!==null&&Cu(m,U,S,k,!0)}}e:{if(h=c?tn(c):window,x=h.nodeName&&h.nodeName.toLowerCase(),x==="select"||x==="input"&&h.type==="file")var C=cf;else if(mu(h))if(ta)C=hf;else{C=df;var _=ff}else(x=h.nodeName)&&x.toLowerCase()==="input"&&(h.type==="checkbox"||h.type==="radio")&&(C=pf);if(C&&(C=C(e,c))){ea(m,C,n,g);break e}_&&_(e,h,c),e==="focusout"&&(_=h._wrapperState)&&_.controlled&&h.type==="number"&&pi(h,"number",h.value)}switch(_=c?tn(c):window,e){case"focusin":(mu(_)||_.contentEditable==="true")&&(bt=_,Ni=c,An=null);break;case"focusout":An=Ni=bt=null;break;case"mousedown":_i=!0;break;case"contextmenu":case"mouseup":case"dragend":_i=!1,xu(m,n,g);break;case"selectionchange":if(gf)break;case"keydown":case"keyup":xu(m,n,g)}var j;if(yo)e:{switch(e){case"compositionstart":var P="onCompositionStart";break e;case"compositionend":P="onCompositionEnd";break e;case"compositionupdate":P="onCompositionUpdate";break e}P=void 0}else qt?qs(e,n)&&(P="onCompositionEnd"):e==="keydown"&&n.keyCode===229&&(P="onCompositionStart");P&&(Js&&n.locale!=="ko"&&(qt||P!=="onCompositionStart"?P==="onCompositionEnd"&&qt&&(j=Zs()):(gt=g,mo="value"in gt?gt.value:gt.textContent,qt=!0)),_=br(c,P),0<_.length&&(P=new fu(P,e,null,n,g),m.push({event:P,listeners:_}),j?P.data=j:(j=bs(n),j!==null&&(P.data=j)))),(j=lf?of(e,n):uf(e,n))&&(c=br(c,"onBeforeInput"),0<c.length&&(g=new fu("onBeforeInput","beforeinput",null,n,g),m.push({event:g,listeners:c}),g.data=j))}fa(m,t)})}function rr(e,t,n){return{instance:e,listener:t,currentTarget:n}}function br(e,t){for(var n=t+"Capture",r=[];e!==null;){var l=e,i=l.stateNode;l.tag===5&&i!==null&&(l=i,i=Zn(e,n),i!=null&&r.unshift(rr(e,i,l)),i=Zn(e,t),i!=null&&r.push(rr(e,i,l))),e=e.return}return r}function Xt(e){if(e===null)return null;do e=e.return;while(e&&e.tag!==5);return e||null}function Cu(e,t,n,r,l){for(var i=t._reactName,o=[];n!==null&&n!==r;){var u=n,s=u.alternate,c=u.stateNode;if(s!==null&&s===r)break;u.tag===5&&c!==null&&(u=c,l?(s=Zn(n,i),s!=null&&o.unshift(rr(n,s,u))):l||(s=Zn(n,i),s!=null&&o.push(rr(n,s,u)))),n=n.return}o.length!==0&&e.push({event:t,listeners:o})}var Sf=/\r\n?/g,kf=/\u0000|\uFFFD/g;function Eu(e){return(typeof e=="string"?e:""+e).replace(Sf,`
-`).replace(kf,"")}function jr(e,t,n){if(t=Eu(t),Eu(e)!==t&&n)throw Error(w(425))}function el(){}var ji=null,Pi=null;function zi(e,t){return e==="textarea"||e==="noscript"||typeof t.children=="string"||typeof t.children=="number"||typeof t.dangerouslySetInnerHTML=="object"&&t.dangerouslySetInnerHTML!==null&&t.dangerouslySetInnerHTML.__html!=null}var Li=typeof setTimeout=="function"?setTimeout:void 0,Cf=typeof clearTimeout=="function"?clearTimeout:void 0,Nu=typeof Promise=="function"?Promise:void 0,Ef=typeof queueMicrotask=="function"?queueMicrotask:typeof Nu<"u"?function(e){return Nu.resolve(null).then(e).catch(Nf)}:Li;function Nf(e){setTimeout(function(){throw e})}function Zl(e,t){var n=t,r=0;do{var l=n.nextSibling;if(e.removeChild(n),l&&l.nodeType===8)if(n=l.data,n==="/$"){if(r===0){e.removeChild(l),bn(t);return}r--}else n!=="$"&&n!=="$?"&&n!=="$!"||r++;n=l}while(n);bn(t)}function kt(e){for(;e!=null;e=e.nextSibling){var t=e.nodeType;if(t===1||t===3)break;if(t===8){if(t=e.data,t==="$"||t==="$!"||t==="$?")break;if(t==="/$")return null}}return e}function _u(e){e=e.previousSibling;for(var t=0;e;){if(e.nodeType===8){var n=e.data;if(n==="$"||n==="$!"||n==="$?"){if(t===0)return e;t--}else n==="/$"&&t++}e=e.previousSibling}return null}var En=Math.random().toString(36).slice(2),Ke="__reactFiber$"+En,lr="__reactProps$"+En,lt="__reactContainer$"+En,Ti="__reactEvents$"+En,_f="__reactListeners$"+En,jf="__reactHandles$"+En;function It(e){var t=e[Ke];if(t)return t;for(var n=e.parentNode;n;){if(t=n[lt]||n[Ke]){if(n=t.alternate,t.child!==null||n!==null&&n.child!==null)for(e=_u(e);e!==null;){if(n=e[Ke])return n;e=_u(e)}return t}e=n,n=e.parentNode}return null}function hr(e){return e=e[Ke]||e[lt],!e||e.tag!==5&&e.tag!==6&&e.tag!==13&&e.tag!==3?null:e}function tn(e){if(e.tag===5||e.tag===6)return e.stateNode;throw Error(w(33))}function Sl(e){return e[lr]||null}var Mi=[],nn=-1;function Lt(e){return{current:e}}function A(e){0>nn||(e.current=Mi[nn],Mi[nn]=null,nn--)}function $(e,t){nn++,Mi[nn]=e.current,e.current=t}var Pt={},fe=Lt(Pt),xe=Lt(!1),At=Pt;function vn(e,t){var n=e.type.contextTypes;if(!n)return Pt;var r=e.stateNode;if(r&&r.__reactInternalMemoizedUnmaskedChildContext===t)return r.__reactInternalMemoizedMaskedChildContext;var l={},i;for(i in n)l[i]=t[i];return r&&(e=e.stateNode,e.__reactInternalMemoizedUnmaskedChildContext=t,e.__reactInternalMemoizedMaskedChildContext=l),l}function Se(e){return e=e.childContextTypes,e!=null}function tl(){A(xe),A(fe)}function ju(e,t,n){if(fe.current!==Pt)throw Error(w(168));$(fe,t),$(xe,n)}function pa(e,t,n){var r=e.stateNode;if(t=t.childContextTypes,typeof r.getChildContext!="function")return n;r=r.getChildContext();for(var l in r)if(!(l in t))throw Error(w(108,c0(e)||"Unknown",l));return G({},n,r)}function nl(e){return e=(e=e.stateNode)&&e.__reactInternalMemoizedMergedChildContext||Pt,At=fe.current,$(fe,e),$(xe,xe.current),!0}function Pu(e,t,n){var r=e.stateNode;if(!r)throw Error(w(169));n?(e=pa(e,t,At),r.__reactInternalMemoizedMergedChildContext=e,A(xe),A(fe),$(fe,e)):A(xe),$(xe,n)}var be=null,kl=!1,Jl=!1;function ha(e){be===null?be=[e]:be.push(e)}function Pf(e){kl=!0,ha(e)}function Tt(){if(!Jl&&be!==null){Jl=!0;var e=0,t=F;try{var n=be;for(F=1;e<n.length;e++){var r=n[e];do r=r(!0);while(r!==null)}be=null,kl=!1}catch(l){throw be!==null&&(be=be.slice(e+1)),$s(co,Tt),l}finally{F=t,Jl=!1}}return null}var rn=[],ln=0,rl=null,ll=0,ze=[],Le=0,Bt=null,et=1,tt="";function Dt(e,t){rn[ln++]=ll,rn[ln++]=rl,rl=e,ll=t}function ma(e,t,n){ze[Le++]=et,ze[Le++]=tt,ze[Le++]=Bt,Bt=e;var r=et;e=tt;var l=32-$e(r)-1;r&=~(1<<l),n+=1;var i=32-$e(t)+l;if(30<i){var o=l-l%5;i=(r&(1<<o)-1).toString(32),r>>=o,l-=o,et=1<<32-$e(t)+l|n<<l|r,tt=i+e}else et=1<<i|n<<l|r,tt=e}function xo(e){e.return!==null&&(Dt(e,1),ma(e,1,0))}function So(e){for(;e===rl;)rl=rn[--ln],rn[ln]=null,ll=rn[--ln],rn[ln]=null;for(;e===Bt;)Bt=ze[--Le],ze[Le]=null,tt=ze[--Le],ze[Le]=null,et=ze[--Le],ze[Le]=null}var Ne=null,Ee=null,W=!1,Ue=null;function va(e,t){var n=Te(5,null,null,0);n.elementType="DELETED",n.stateNode=t,n.return=e,t=e.deletions,t===null?(e.deletions=[n],e.flags|=16):t.push(n)}function zu(e,t){switch(e.tag){case 5:var n=e.type;return t=t.nodeType!==1||n.toLowerCase()!==t.nodeName.toLowerCase()?null:t,t!==null?(e.stateNode=t,Ne=e,Ee=kt(t.firstChild),!0):!1;case 6:return t=e.pendingProps===""||t.nodeType!==3?null:t,t!==null?(e.stateNode=t,Ne=e,Ee=null,!0):!1;case 13:return t=t.nodeType!==8?null:t,t!==null?(n=Bt!==null?{id:et,overflow:tt}:null,e.memoizedState={dehydrated:t,treeContext:n,retryLane:1073741824},n=Te(18,null,null,0),n.stateNode=t,n.return=e,e.child=n,Ne=e,Ee=null,!0):!1;default:return!1}}function Ri(e){return(e.mode&1)!==0&&(e.flags&128)===0}function Di(e){if(W){var t=Ee;if(t){var n=t;if(!zu(e,t)){if(Ri(e))throw Error(w(418));t=kt(n.nextSibling);var r=Ne;t&&zu(e,t)?va(r,n):(e.flags=e.flags&-4097|2,W=!1,Ne=e)}}else{if(Ri(e))throw Error(w(418));e.flags=e.flags&-4097|2,W=!1,Ne=e}}}function Lu(e){for(e=e.return;e!==null&&e.tag!==5&&e.tag!==3&&e.tag!==13;)e=e.return;Ne=e}function Pr(e){if(e!==Ne)return!1;if(!W)return Lu(e),W=!0,!1;var t;if((t=e.tag!==3)&&!(t=e.tag!==5)&&(t=e.type,t=t!=="head"&&t!=="body"&&!zi(e.type,e.memoizedProps)),t&&(t=Ee)){if(Ri(e))throw ga(),Error(w(418));for(;t;)va(e,t),t=kt(t.nextSibling)}if(Lu(e),e.tag===13){if(e=e.memoizedState,e=e!==null?e.dehydrated:null,!e)throw Error(w(317));e:{for(e=e.nextSibling,t=0;e;){if(e.nodeType===8){var n=e.data;if(n==="/$"){if(t===0){Ee=kt(e.nextSibling);break e}t--}else n!=="$"&&n!=="$!"&&n!=="$?"||t++}e=e.nextSibling}Ee=null}}else Ee=Ne?kt(e.stateNode.nextSibling):null;return!0}function ga(){for(var e=Ee;e;)e=kt(e.nextSibling)}function gn(){Ee=Ne=null,W=!1}function ko(e){Ue===null?Ue=[e]:Ue.push(e)}var zf=ut.ReactCurrentBatchConfig;function Ln(e,t,n){if(e=n.ref,e!==null&&typeof e!="function"&&typeof e!="object"){if(n._owner){if(n=n._owner,n){if(n.tag!==1)throw Error(w(309));var r=n.stateNode}if(!r)throw Error(w(147,e));var l=r,i=""+e;return t!==null&&t.ref!==null&&typeof t.ref=="function"&&t.ref._stringRef===i?t.ref:(t=function(o){var u=l.refs;o===null?delete u[i]:u[i]=o},t._stringRef=i,t)}if(typeof e!="string")throw Error(w(284));if(!n._owner)throw Error(w(290,e))}return e}function zr(e,t){throw e=Object.prototype.toString.call(t),Error(w(31,e==="[object Object]"?"object with keys {"+Object.keys(t).join(", ")+"}":e))}function Tu(e){var t=e._init;return t(e._payload)}function ya(e){function t(f,a){if(e){var d=f.deletions;d===null?(f.deletions=[a],f.flags|=16):d.push(a)}}function n(f,a){if(!e)return null;for(;a!==null;)t(f,a),a=a.sibling;return null}function r(f,a){for(f=new Map;a!==null;)a.key!==null?f.set(a.key,a):f.set(a.index,a),a=a.sibling;return f}function l(f,a){return f=_t(f,a),f.index=0,f.sibling=null,f}function i(f,a,d){return f.index=d,e?(d=f.alternate,d!==null?(d=d.index,d<a?(f.flags|=2,a):d):(f.flags|=2,a)):(f.flags|=1048576,a)}function o(f){return e&&f.alternate===null&&(f.flags|=2),f}function u(f,a,d,y){return a===null||a.tag!==6?(a=li(d,f.mode,y),a.return=f,a):(a=l(a,d),a.return=f,a)}function s(f,a,d,y){var C=d.type;return C===Jt?g(f,a,d.props.children,y,d.key):a!==null&&(a.elementType===C||typeof C=="object"&&C!==null&&C.$$typeof===pt&&Tu(C)===a.type)?(y=l(a,d.props),y.ref=Ln(f,a,d),y.return=f,y):(y=Qr(d.type,d.key,d.props,null,f.mode,y),y.ref=Ln(f,a,d),y.return=f,y)}function c(f,a,d,y){return a===null||a.tag!==4||a.stateNode.containerInfo!==d.containerInfo||a.stateNode.implementation!==d.implementation?(a=ii(d,f.mode,y),a.return=f,a):(a=l(a,d.children||[]),a.return=f,a)}function g(f,a,d,y,C){return a===null||a.tag!==7?(a=Vt(d,f.mode,y,C),a.return=f,a):(a=l(a,d),a.return=f,a)}function m(f,a,d){if(typeof a=="string"&&a!==""||typeof a=="number")return a=li(""+a,f.mode,d),a.return=f,a;if(typeof a=="object"&&a!==null){switch(a.$$typeof){case yr:return d=Qr(a.type,a.key,a.props,null,f.mode,d),d.ref=Ln(f,null,a),d.return=f,d;case Zt:return a=ii(a,f.mode,d),a.return=f,a;case pt:var y=a._init;return m(f,y(a._payload),d)}if(Dn(a)||Nn(a))return a=Vt(a,f.mode,d,null),a.return=f,a;zr(f,a)}return null}function h(f,a,d,y){var C=a!==null?a.key:null;if(typeof d=="string"&&d!==""||typeof d=="number")return C!==null?null:u(f,a,""+d,y);if(typeof d=="object"&&d!==null){switch(d.$$typeof){case yr:return d.key===C?s(f,a,d,y):null;case Zt:return d.key===C?c(f,a,d,y):null;case pt:return C=d._init,h(f,a,C(d._payload),y)}if(Dn(d)||Nn(d))return C!==null?null:g(f,a,d,y,null);zr(f,d)}return null}function x(f,a,d,y,C){if(typeof y=="string"&&y!==""||typeof y=="number")return f=f.get(d)||null,u(a,f,""+y,C);if(typeof y=="object"&&y!==null){switch(y.$$typeof){case yr:return f=f.get(y.key===null?d:y.key)||null,s(a,f,y,C);case Zt:return f=f.get(y.key===null?d:y.key)||null,c(a,f,y,C);case pt:var _=y._init;return x(f,a,d,_(y._payload),C)}if(Dn(y)||Nn(y))return f=f.get(d)||null,g(a,f,y,C,null);zr(a,y)}return null}function S(f,a,d,y){for(var C=null,_=null,j=a,P=a=0,Q=null;j!==null&&P<d.length;P++){j.index>P?(Q=j,j=null):Q=j.sibling;var M=h(f,j,d[P],y);if(M===null){j===null&&(j=Q);break}e&&j&&M.alternate===null&&t(f,j),a=i(M,a,P),_===null?C=M:_.sibling=M,_=M,j=Q}if(P===d.length)return n(f,j),W&&Dt(f,P),C;if(j===null){for(;P<d.length;P++)j=m(f,d[P],y),j!==null&&(a=i(j,a,P),_===null?C=j:_.sibling=j,_=j);return W&&Dt(f,P),C}for(j=r(f,j);P<d.length;P++)Q=x(j,f,P,d[P],y),Q!==null&&(e&&Q.alternate!==null&&j.delete(Q.key===null?P:Q.key),a=i(Q,a,P),_===null?C=Q:_.sibling=Q,_=Q);return e&&j.forEach(function(de){return t(f,de)}),W&&Dt(f,P),C}function k(f,a,d,y){var C=Nn(d);if(typeof C!="function")throw Error(w(150));if(d=C.call(d),d==null)throw Error(w(151));for(var _=C=null,j=a,P=a=0,Q=null,M=d.next();j!==null&&!M.done;P++,M=d.next()){j.index>P?(Q=j,j=null):Q=j.sibling;var de=h(f,j,M.value,y);if(de===null){j===null&&(j=Q);break}e&&j&&de.alternate===null&&t(f,j),a=i(de,a,P),_===null?C=de:_.sibling=de,_=de,j=Q}if(M.done)return n(f,j),W&&Dt(f,P),C;if(j===null){for(;!M.done;P++,M=d.next())M=m(f,M.value,y),M!==null&&(a=i(M,a,P),_===null?C=M:_.sibling=M,_=M);return W&&Dt(f,P),C}for(j=r(f,j);!M.done;P++,M=d.next())M=x(j,f,P,M.value,y),M!==null&&(e&&M.alternate!==null&&j.delete(M.key===null?P:M.key),a=i(M,a,P),_===null?C=M:_.sibling=M,_=M);return e&&j.forEach(function(Mt){return t(f,Mt)}),W&&Dt(f,P),C}function U(f,a,d,y){if(typeof d=="object"&&d!==null&&d.type===Jt&&d.key===null&&(d=d.props.children),typeof d=="object"&&d!==null){switch(d.$$typeof){case yr:e:{for(var C=d.key,_=a;_!==null;){if(_.key===C){if(C=d.type,C===Jt){if(_.tag===7){n(f,_.sibling),a=l(_,d.props.children),a.return=f,f=a;break e}}else if(_.elementType===C||typeof C=="object"&&C!==null&&C.$$typeof===pt&&Tu(C)===_.type){n(f,_.sibling),a=l(_,d.props),a.ref=Ln(f,_,d),a.return=f,f=a;break e}n(f,_);break}else t(f,_);_=_.sibling}d.type===Jt?(a=Vt(d.props.children,f.mode,y,d.key),a.return=f,f=a):(y=Qr(d.type,d.key,d.props,null,f.mode,y),y.ref=Ln(f,a,d),y.return=f,f=y)}return o(f);case Zt:e:{for(_=d.key;a!==null;){if(a.key===_)if(a.tag===4&&a.stateNode.containerInfo===d.containerInfo&&a.stateNode.implementation===d.implementation){n(f,a.sibling),a=l(a,d.children||[]),a.return=f,f=a;break e}else{n(f,a);break}else t(f,a);a=a.sibling}a=ii(d,f.mode,y),a.return=f,f=a}return o(f);case pt:return _=d._init,U(f,a,_(d._payload),y)}if(Dn(d))return S(f,a,d,y);if(Nn(d))return k(f,a,d,y);zr(f,d)}return typeof d=="string"&&d!==""||typeof d=="number"?(d=""+d,a!==null&&a.tag===6?(n(f,a.sibling),a=l(a,d),a.return=f,f=a):(n(f,a),a=li(d,f.mode,y),a.return=f,f=a),o(f)):n(f,a)}return U}var yn=ya(!0),wa=ya(!1),il=Lt(null),ol=null,on=null,Co=null;function Eo(){Co=on=ol=null}function No(e){var t=il.current;A(il),e._currentValue=t}function Oi(e,t,n){for(;e!==null;){var r=e.alternate;if((e.childLanes&t)!==t?(e.childLanes|=t,r!==null&&(r.childLanes|=t)):r!==null&&(r.childLanes&t)!==t&&(r.childLanes|=t),e===n)break;e=e.return}}function pn(e,t){ol=e,Co=on=null,e=e.dependencies,e!==null&&e.firstContext!==null&&(e.lanes&t&&(we=!0),e.firstContext=null)}function Re(e){var t=e._currentValue;if(Co!==e)if(e={context:e,memoizedValue:t,next:null},on===null){if(ol===null)throw Error(w(308));on=e,ol.dependencies={lanes:0,firstContext:e}}else on=on.next=e;return t}var Ft=null;function _o(e){Ft===null?Ft=[e]:Ft.push(e)}function xa(e,t,n,r){var l=t.interleaved;return l===null?(n.next=n,_o(t)):(n.next=l.next,l.next=n),t.interleaved=n,it(e,r)}function it(e,t){e.lanes|=t;var n=e.alternate;for(n!==null&&(n.lanes|=t),n=e,e=e.return;e!==null;)e.childLanes|=t,n=e.alternate,n!==null&&(n.childLanes|=t),n=e,e=e.return;return n.tag===3?n.stateNode:null}var ht=!1;function jo(e){e.updateQueue={baseState:e.memoizedState,firstBaseUpdate:null,lastBaseUpdate:null,shared:{pending:null,interleaved:null,lanes:0},effects:null}}function Sa(e,t){e=e.updateQueue,t.updateQueue===e&&(t.updateQueue={baseState:e.baseState,firstBaseUpdate:e.firstBaseUpdate,lastBaseUpdate:e.lastBaseUpdate,shared:e.shared,effects:e.effects})}function nt(e,t){return{eventTime:e,lane:t,tag:0,payload:null,callback:null,next:null}}function Ct(e,t,n){var r=e.updateQueue;if(r===null)return null;if(r=r.shared,D&2){var l=r.pending;return l===null?t.next=t:(t.next=l.next,l.next=t),r.pending=t,it(e,n)}return l=r.interleaved,l===null?(t.next=t,_o(r)):(t.next=l.next,l.next=t),r.interleaved=t,it(e,n)}function $r(e,t,n){if(t=t.updateQueue,t!==null&&(t=t.shared,(n&4194240)!==0)){var r=t.lanes;r&=e.pendingLanes,n|=r,t.lanes=n,fo(e,n)}}function Mu(e,t){var n=e.updateQueue,r=e.alternate;if(r!==null&&(r=r.updateQueue,n===r)){var l=null,i=null;if(n=n.firstBaseUpdate,n!==null){do{var o={eventTime:n.eventTime,lane:n.lane,tag:n.tag,payload:n.payload,callback:n.callback,next:null};i===null?l=i=o:i=i.next=o,n=n.next}while(n!==null);i===null?l=i=t:i=i.next=t}else l=i=t;n={baseState:r.baseState,firstBaseUpdate:l,lastBaseUpdate:i,shared:r.shared,effects:r.effects},e.updateQueue=n;return}e=n.lastBaseUpdate,e===null?n.firstBaseUpdate=t:e.next=t,n.lastBaseUpdate=t}function ul(e,t,n,r){var l=e.updateQueue;ht=!1;var i=l.firstBaseUpdate,o=l.lastBaseUpdate,u=l.shared.pending;if(u!==null){l.shared.pending=null;var s=u,c=s.next;s.next=null,o===null?i=c:o.next=c,o=s;var g=e.alternate;g!==null&&(g=g.updateQueue,u=g.lastBaseUpdate,u!==o&&(u===null?g.firstBaseUpdate=c:u.next=c,g.lastBaseUpdate=s))}if(i!==null){var m=l.baseState;o=0,g=c=s=null,u=i;do{var h=u.lane,x=u.eventTime;if((r&h)===h){g!==null&&(g=g.next={eventTime:x,lane:0,tag:u.tag,payload:u.payload,callback:u.callback,next:null});e:{var S=e,k=u;switch(h=t,x=n,k.tag){case 1:if(S=k.payload,typeof S=="function"){m=S.call(x,m,h);break e}m=S;break e;case 3:S.flags=S.flags&-65537|128;case 0:if(S=k.payload,h=typeof S=="function"?S.call(x,m,h):S,h==null)break e;m=G({},m,h);break e;case 2:ht=!0}}u.callback!==null&&u.lane!==0&&(e.flags|=64,h=l.effects,h===null?l.effects=[u]:h.push(u))}else x={eventTime:x,lane:h,tag:u.tag,payload:u.payload,callback:u.callback,next:null},g===null?(c=g=x,s=m):g=g.next=x,o|=h;if(u=u.next,u===null){if(u=l.shared.pending,u===null)break;h=u,u=h.next,h.next=null,l.lastBaseUpdate=h,l.shared.pending=null}}while(!0);if(g===null&&(s=m),l.baseState=s,l.firstBaseUpdate=c,l.lastBaseUpdate=g,t=l.shared.interleaved,t!==null){l=t;do o|=l.lane,l=l.next;while(l!==t)}else i===null&&(l.shared.lanes=0);Wt|=o,e.lanes=o,e.memoizedState=m}}function Ru(e,t,n){if(e=t.effects,t.effects=null,e!==null)for(t=0;t<e.length;t++){var r=e[t],l=r.callback;if(l!==null){if(r.callback=null,r=n,typeof l!="function")throw Error(w(191,l));l.call(r)}}}var mr={},Ge=Lt(mr),ir=Lt(mr),or=Lt(mr);function Ut(e){if(e===mr)throw Error(w(174));return e}function Po(e,t){switch($(or,t),$(ir,e),$(Ge,mr),e=t.nodeType,e){case 9:case 11:t=(t=t.documentElement)?t.namespaceURI:mi(null,"");break;default:e=e===8?t.parentNode:t,t=e.namespaceURI||null,e=e.tagName,t=mi(t,e)}A(Ge),$(Ge,t)}function wn(){A(Ge),A(ir),A(or)}function ka(e){Ut(or.current);var t=Ut(Ge.current),n=mi(t,e.type);t!==n&&($(ir,e),$(Ge,n))}function zo(e){ir.current===e&&(A(Ge),A(ir))}var K=Lt(0);function sl(e){for(var t=e;t!==null;){if(t.tag===13){var n=t.memoizedState;if(n!==null&&(n=n.dehydrated,n===null||n.data==="$?"||n.data==="$!"))return t}else if(t.tag===19&&t.memoizedProps.revealOrder!==void 0){if(t.flags&128)return t}else if(t.child!==null){t.child.return=t,t=t.child;continue}if(t===e)break;for(;t.sibling===null;){if(t.return===null||t.return===e)return null;t=t.return}t.sibling.return=t.return,t=t.sibling}return null}var ql=[];function Lo(){for(var e=0;e<ql.length;e++)ql[e]._workInProgressVersionPrimary=null;ql.length=0}var Vr=ut.ReactCurrentDispatcher,bl=ut.ReactCurrentBatchConfig,Ht=0,Y=null,ee=null,ne=null,al=!1,Bn=!1,ur=0,Lf=0;function se(){throw Error(w(321))}function To(e,t){if(t===null)return!1;for(var n=0;n<t.length&&n<e.length;n++)if(!Ae(e[n],t[n]))return!1;return!0}function Mo(e,t,n,r,l,i){if(Ht=i,Y=t,t.memoizedState=null,t.updateQueue=null,t.lanes=0,Vr.current=e===null||e.memoizedState===null?Df:Of,e=n(r,l),Bn){i=0;do{if(Bn=!1,ur=0,25<=i)throw Error(w(301));i+=1,ne=ee=null,t.updateQueue=null,Vr.current=If,e=n(r,l)}while(Bn)}if(Vr.current=cl,t=ee!==null&&ee.next!==null,Ht=0,ne=ee=Y=null,al=!1,t)throw Error(w(300));return e}function Ro(){var e=ur!==0;return ur=0,e}function Qe(){var e={memoizedState:null,baseState:null,baseQueue:null,queue:null,next:null};return ne===null?Y.memoizedState=ne=e:ne=ne.next=e,ne}function De(){if(ee===null){var e=Y.alternate;e=e!==null?e.memoizedState:null}else e=ee.next;var t=ne===null?Y.memoizedState:ne.next;if(t!==null)ne=t,ee=e;else{if(e===null)throw Error(w(310));ee=e,e={memoizedState:ee.memoizedState,baseState:ee.baseState,baseQueue:ee.baseQueue,queue:ee.queue,next:null},ne===null?Y.memoizedState=ne=e:ne=ne.next=e}return ne}function sr(e,t){return typeof t=="function"?t(e):t}function ei(e){var t=De(),n=t.queue;if(n===null)throw Error(w(311));n.lastRenderedReducer=e;var r=ee,l=r.baseQueue,i=n.pending;if(i!==null){if(l!==null){var o=l.next;l.next=i.next,i.next=o}r.baseQueue=l=i,n.pending=null}if(l!==null){i=l.next,r=r.baseState;var u=o=null,s=null,c=i;do{var g=c.lane;if((Ht&g)===g)s!==null&&(s=s.next={lane:0,action:c.action,hasEagerState:c.hasEagerState,eagerState:c.eagerState,next:null}),r=c.hasEagerState?c.eagerState:e(r,c.action);else{var m={lane:g,action:c.action,hasEagerState:c.hasEagerState,eagerState:c.eagerState,next:null};s===null?(u=s=m,o=r):s=s.next=m,Y.lanes|=g,Wt|=g}c=c.next}while(c!==null&&c!==i);s===null?o=r:s.next=u,Ae(r,t.memoizedState)||(we=!0),t.memoizedState=r,t.baseState=o,t.baseQueue=s,n.lastRenderedState=r}if(e=n.interleaved,e!==null){l=e;do i=l.lane,Y.lanes|=i,Wt|=i,l=l.next;while(l!==e)}else l===null&&(n.lanes=0);return[t.memoizedState,n.dispatch]}function ti(e){var t=De(),n=t.queue;if(n===null)throw Error(w(311));n.lastRenderedReducer=e;var r=n.dispatch,l=n.pending,i=t.memoizedState;if(l!==null){n.pending=null;var o=l=l.next;do i=e(i,o.action),o=o.next;while(o!==l);Ae(i,t.memoizedState)||(we=!0),t.memoizedState=i,t.baseQueue===null&&(t.baseState=i),n.lastRenderedState=i}return[i,r]}function Ca(){}function Ea(e,t){var n=Y,r=De(),l=t(),i=!Ae(r.memoizedState,l);if(i&&(r.memoizedState=l,we=!0),r=r.queue,Do(ja.bind(null,n,r,e),[e]),r.getSnapshot!==t||i||ne!==null&&ne.memoizedState.tag&1){if(n.flags|=2048,ar(9,_a.bind(null,n,r,l,t),void 0,null),re===null)throw Error(w(349));Ht&30||Na(n,t,l)}return l}function Na(e,t,n){e.flags|=16384,e={getSnapshot:t,value:n},t=Y.updateQueue,t===null?(t={lastEffect:null,stores:null},Y.updateQueue=t,t.stores=[e]):(n=t.stores,n===null?t.stores=[e]:n.push(e))}function _a(e,t,n,r){t.value=n,t.getSnapshot=r,Pa(t)&&za(e)}function ja(e,t,n){return n(function(){Pa(t)&&za(e)})}function Pa(e){var t=e.getSnapshot;e=e.value;try{var n=t();return!Ae(e,n)}catch{return!0}}function za(e){var t=it(e,1);t!==null&&Ve(t,e,1,-1)}function Du(e){var t=Qe();return typeof e=="function"&&(e=e()),t.memoizedState=t.baseState=e,e={pending:null,interleaved:null,lanes:0,dispatch:null,lastRenderedReducer:sr,lastRenderedState:e},t.queue=e,e=e.dispatch=Rf.bind(null,Y,e),[t.memoizedState,e]}function ar(e,t,n,r){return e={tag:e,create:t,destroy:n,deps:r,next:null},t=Y.updateQueue,t===null?(t={lastEffect:null,stores:null},Y.updateQueue=t,t.lastEffect=e.next=e):(n=t.lastEffect,n===null?t.lastEffect=e.next=e:(r=n.next,n.next=e,e.next=r,t.lastEffect=e)),e}function La(){return De().memoizedState}function Ar(e,t,n,r){var l=Qe();Y.flags|=e,l.memoizedState=ar(1|t,n,void 0,r===void 0?null:r)}function Cl(e,t,n,r){var l=De();r=r===void 0?null:r;var i=void 0;if(ee!==null){var o=ee.memoizedState;if(i=o.destroy,r!==null&&To(r,o.deps)){l.memoizedState=ar(t,n,i,r);return}}Y.flags|=e,l.memoizedState=ar(1|t,n,i,r)}function Ou(e,t){return Ar(8390656,8,e,t)}function Do(e,t){return Cl(2048,8,e,t)}function Ta(e,t){return Cl(4,2,e,t)}function Ma(e,t){return Cl(4,4,e,t)}function Ra(e,t){if(typeof t=="function")return e=e(),t(e),function(){t(null)};if(t!=null)return e=e(),t.current=e,function(){t.current=null}}function Da(e,t,n){return n=n!=null?n.concat([e]):null,Cl(4,4,Ra.bind(null,t,e),n)}function Oo(){}function Oa(e,t){var n=De();t=t===void 0?null:t;var r=n.memoizedState;return r!==null&&t!==null&&To(t,r[1])?r[0]:(n.memoizedState=[e,t],e)}function Ia(e,t){var n=De();t=t===void 0?null:t;var r=n.memoizedState;return r!==null&&t!==null&&To(t,r[1])?r[0]:(e=e(),n.memoizedState=[e,t],e)}function Fa(e,t,n){return Ht&21?(Ae(n,t)||(n=Bs(),Y.lanes|=n,Wt|=n,e.baseState=!0),t):(e.baseState&&(e.baseState=!1,we=!0),e.memoizedState=n)}function Tf(e,t){var n=F;F=n!==0&&4>n?n:4,e(!0);var r=bl.transition;bl.transition={};try{e(!1),t()}finally{F=n,bl.transition=r}}function Ua(){return De().memoizedState}function Mf(e,t,n){var r=Nt(e);if(n={lane:r,action:n,hasEagerState:!1,eagerState:null,next:null},$a(e))Va(t,n);else if(n=xa(e,t,n,r),n!==null){var l=me();Ve(n,e,r,l),Aa(n,t,r)}}function Rf(e,t,n){var r=Nt(e),l={lane:r,action:n,hasEagerState:!1,eagerState:null,next:null};if($a(e))Va(t,l);else{var i=e.alternate;if(e.lanes===0&&(i===null||i.lanes===0)&&(i=t.lastRenderedReducer,i!==null))try{var o=t.lastRenderedState,u=i(o,n);if(l.hasEagerState=!0,l.eagerState=u,Ae(u,o)){var s=t.interleaved;s===null?(l.next=l,_o(t)):(l.next=s.next,s.next=l),t.interleaved=l;return}}catch{}finally{}n=xa(e,t,l,r),n!==null&&(l=me(),Ve(n,e,r,l),Aa(n,t,r))}}function $a(e){var t=e.alternate;return e===Y||t!==null&&t===Y}function Va(e,t){Bn=al=!0;var n=e.pending;n===null?t.next=t:(t.next=n.next,n.next=t),e.pending=t}function Aa(e,t,n){if(n&4194240){var r=t.lanes;r&=e.pendingLanes,n|=r,t.lanes=n,fo(e,n)}}var cl={readContext:Re,useCallback:se,useContext:se,useEffect:se,useImperativeHandle:se,useInsertionEffect:se,useLayoutEffect:se,useMemo:se,useReducer:se,useRef:se,useState:se,useDebugValue:se,useDeferredValue:se,useTransition:se,useMutableSource:se,useSyncExternalStore:se,useId:se,unstable_isNewReconciler:!1},Df={readContext:Re,useCallback:function(e,t){return Qe().memoizedState=[e,t===void 0?null:t],e},useContext:Re,useEffect:Ou,useImperativeHandle:function(e,t,n){return n=n!=null?n.concat([e]):null,Ar(4194308,4,Ra.bind(null,t,e),n)},useLayoutEffect:function(e,t){return Ar(4194308,4,e,t)},useInsertionEffect:function(e,t){return Ar(4,2,e,t)},useMemo:function(e,t){var n=Qe();return t=t===void 0?null:t,e=e(),n.memoizedState=[e,t],e},useReducer:function(e,t,n){var r=Qe();return t=n!==void 0?n(t):t,r.memoizedState=r.baseState=t,e={pending:null,interleaved:null,lanes:0,dispatch:null,lastRenderedReducer:e,lastRenderedState:t},r.queue=e,e=e.dispatch=Mf.bind(null,Y,e),[r.memoizedState,e]},useRef:function(e){var t=Qe();return e={current:e},t.memoizedState=e},useState:Du,useDebugValue:Oo,useDeferredValue:function(e){return Qe().memoizedState=e},useTransition:function(){var e=Du(!1),t=e[0];return e=Tf.bind(null,e[1]),Qe().memoizedState=e,[t,e]},useMutableSource:function(){},useSyncExternalStore:function(e,t,n){var r=Y,l=Qe();if(W){if(n===void 0)throw Error(w(407));n=n()}else{if(n=t(),re===null)throw Error(w(349));Ht&30||Na(r,t,n)}l.memoizedState=n;var i={value:n,getSnapshot:t};return l.queue=i,Ou(ja.bind(null,r,i,e),[e]),r.flags|=2048,ar(9,_a.bind(null,r,i,n,t),void 0,null),n},useId:function(){var e=Qe(),t=re.identifierPrefix;if(W){var n=tt,r=et;n=(r&~(1<<32-$e(r)-1)).toString(32)+n,t=":"+t+"R"+n,n=ur++,0<n&&(t+="H"+n.toString(32)),t+=":"}else n=Lf++,t=":"+t+"r"+n.toString(32)+":";return e.memoizedState=t},unstable_isNewReconciler:!1},Of={readContext:Re,useCallback:Oa,useContext:Re,useEffect:Do,useImperativeHandle:Da,useInsertionEffect:Ta,useLayoutEffect:Ma,useMemo:Ia,useReducer:ei,useRef:La,useState:function(){return ei(sr)},useDebugValue:Oo,useDeferredValue:function(e){var t=De();return Fa(t,ee.memoizedState,e)},useTransition:function(){var e=ei(sr)[0],t=De().memoizedState;return[e,t]},useMutableSource:Ca,useSyncExternalStore:Ea,useId:Ua,unstable_isNewReconciler:!1},If={readContext:Re,useCallback:Oa,useContext:Re,useEffect:Do,useImperativeHandle:Da,useInsertionEffect:Ta,useLayoutEffect:Ma,useMemo:Ia,useReducer:ti,useRef:La,useState:function(){return ti(sr)},useDebugValue:Oo,useDeferredValue:function(e){var t=De();return ee===null?t.memoizedState=e:Fa(t,ee.memoizedState,e)},useTransition:function(){var e=ti(sr)[0],t=De().memoizedState;return[e,t]},useMutableSource:Ca,useSyncExternalStore:Ea,useId:Ua,unstable_isNewReconciler:!1};function Ie(e,t){if(e&&e.defaultProps){t=G({},t),e=e.defaultProps;for(var n in e)t[n]===void 0&&(t[n]=e[n]);return t}return t}function Ii(e,t,n,r){t=e.memoizedState,n=n(r,t),n=n==null?t:G({},t,n),e.memoizedState=n,e.lanes===0&&(e.updateQueue.baseState=n)}var El={isMounted:function(e){return(e=e._reactInternals)?Yt(e)===e:!1},enqueueSetState:function(e,t,n){e=e._reactInternals;var r=me(),l=Nt(e),i=nt(r,l);i.payload=t,n!=null&&(i.callback=n),t=Ct(e,i,l),t!==null&&(Ve(t,e,l,r),$r(t,e,l))},enqueueReplaceState:function(e,t,n){e=e._reactInternals;var r=me(),l=Nt(e),i=nt(r,l);i.tag=1,i.payload=t,n!=null&&(i.callback=n),t=Ct(e,i,l),t!==null&&(Ve(t,e,l,r),$r(t,e,l))},enqueueForceUpdate:function(e,t){e=e._reactInternals;var n=me(),r=Nt(e),l=nt(n,r);l.tag=2,t!=null&&(l.callback=t),t=Ct(e,l,r),t!==null&&(Ve(t,e,r,n),$r(t,e,r))}};function Iu(e,t,n,r,l,i,o){return e=e.stateNode,typeof e.shouldComponentUpdate=="function"?e.shouldComponentUpdate(r,i,o):t.prototype&&t.prototype.isPureReactComponent?!tr(n,r)||!tr(l,i):!0}function Ba(e,t,n){var r=!1,l=Pt,i=t.contextType;return typeof i=="object"&&i!==null?i=Re(i):(l=Se(t)?At:fe.current,r=t.contextTypes,i=(r=r!=null)?vn(e,l):Pt),t=new t(n,i),e.memoizedState=t.state!==null&&t.state!==void 0?t.state:null,t.updater=El,e.stateNode=t,t._reactInternals=e,r&&(e=e.stateNode,e.__reactInternalMemoizedUnmaskedChildContext=l,e.__reactInternalMemoizedMaskedChildContext=i),t}function Fu(e,t,n,r){e=t.state,typeof t.componentWillReceiveProps=="function"&&t.componentWillReceiveProps(n,r),typeof t.UNSAFE_componentWillReceiveProps=="function"&&t.UNSAFE_componentWillReceiveProps(n,r),t.state!==e&&El.enqueueReplaceState(t,t.state,null)}function Fi(e,t,n,r){var l=e.stateNode;l.props=n,l.state=e.memoizedState,l.refs={},jo(e);var i=t.contextType;typeof i=="object"&&i!==null?l.context=Re(i):(i=Se(t)?At:fe.current,l.context=vn(e,i)),l.state=e.memoizedState,i=t.getDerivedStateFromProps,typeof i=="function"&&(Ii(e,t,i,n),l.state=e.memoizedState),typeof t.getDerivedStateFromProps=="function"||typeof l.getSnapshotBeforeUpdate=="function"||typeof l.UNSAFE_componentWillMount!="function"&&typeof l.componentWillMount!="function"||(t=l.state,typeof l.componentWillMount=="function"&&l.componentWillMount(),typeof l.UNSAFE_componentWillMount=="function"&&l.UNSAFE_componentWillMount(),t!==l.state&&El.enqueueReplaceState(l,l.state,null),ul(e,n,l,r),l.state=e.memoizedState),typeof l.componentDidMount=="function"&&(e.flags|=4194308)}function xn(e,t){try{var n="",r=t;do n+=a0(r),r=r.return;while(r);var l=n}catch(i){l=`
-Error generating stack: `+i.message+`
-`+i.stack}return{value:e,source:t,stack:l,digest:null}}function ni(e,t,n){return{value:e,source:null,stack:n??null,digest:t??null}}function Ui(e,t){try{console.error(t.value)}catch(n){setTimeout(function(){throw n})}}var Ff=typeof WeakMap=="function"?WeakMap:Map;function Ha(e,t,n){n=nt(-1,n),n.tag=3,n.payload={element:null};var r=t.value;return n.callback=function(){dl||(dl=!0,Gi=r),Ui(e,t)},n}function Wa(e,t,n){n=nt(-1,n),n.tag=3;var r=e.type.getDerivedStateFromError;if(typeof r=="function"){var l=t.value;n.payload=function(){return r(l)},n.callback=function(){Ui(e,t)}}var i=e.stateNode;return i!==null&&typeof i.componentDidCatch=="function"&&(n.callback=function(){Ui(e,t),typeof r!="function"&&(Et===null?Et=new Set([this]):Et.add(this));var o=t.stack;this.componentDidCatch(t.value,{componentStack:o!==null?o:""})}),n}function Uu(e,t,n){var r=e.pingCache;if(r===null){r=e.pingCache=new Ff;var l=new Set;r.set(t,l)}else l=r.get(t),l===void 0&&(l=new Set,r.set(t,l));l.has(n)||(l.add(n),e=Jf.bind(null,e,t,n),t.then(e,e))}function $u(e){do{var t;if((t=e.tag===13)&&(t=e.memoizedState,t=t!==null?t.dehydrated!==null:!0),t)return e;e=e.return}while(e!==null);return null}function Vu(e,t,n,r,l){return e.mode&1?(e.flags|=65536,e.lanes=l,e):(e===t?e.flags|=65536:(e.flags|=128,n.flags|=131072,n.flags&=-52805,n.tag===1&&(n.alternate===null?n.tag=17:(t=nt(-1,1),t.tag=2,Ct(n,t,1))),n.lanes|=1),e)}var Uf=ut.ReactCurrentOwner,we=!1;function he(e,t,n,r){t.child=e===null?wa(t,null,n,r):yn(t,e.child,n,r)}function Au(e,t,n,r,l){n=n.render;var i=t.ref;return pn(t,l),r=Mo(e,t,n,r,i,l),n=Ro(),e!==null&&!we?(t.updateQueue=e.updateQueue,t.flags&=-2053,e.lanes&=~l,ot(e,t,l)):(W&&n&&xo(t),t.flags|=1,he(e,t,r,l),t.child)}function Bu(e,t,n,r,l){if(e===null){var i=n.type;return typeof i=="function"&&!Ho(i)&&i.defaultProps===void 0&&n.compare===null&&n.defaultProps===void 0?(t.tag=15,t.type=i,Qa(e,t,i,r,l)):(e=Qr(n.type,null,r,t,t.mode,l),e.ref=t.ref,e.return=t,t.child=e)}if(i=e.child,!(e.lanes&l)){var o=i.memoizedProps;if(n=n.compare,n=n!==null?n:tr,n(o,r)&&e.ref===t.ref)return ot(e,t,l)}return t.flags|=1,e=_t(i,r),e.ref=t.ref,e.return=t,t.child=e}function Qa(e,t,n,r,l){if(e!==null){var i=e.memoizedProps;if(tr(i,r)&&e.ref===t.ref)if(we=!1,t.pendingProps=r=i,(e.lanes&l)!==0)e.flags&131072&&(we=!0);else return t.lanes=e.lanes,ot(e,t,l)}return $i(e,t,n,r,l)}function Ka(e,t,n){var r=t.pendingProps,l=r.children,i=e!==null?e.memoizedState:null;if(r.mode==="hidden")if(!(t.mode&1))t.memoizedState={baseLanes:0,cachePool:null,transitions:null},$(sn,Ce),Ce|=n;else{if(!(n&1073741824))return e=i!==null?i.baseLanes|n:n,t.lanes=t.childLanes=1073741824,t.memoizedState={baseLanes:e,cachePool:null,transitions:null},t.updateQueue=null,$(sn,Ce),Ce|=e,null;t.memoizedState={baseLanes:0,cachePool:null,transitions:null},r=i!==null?i.baseLanes:n,$(sn,Ce),Ce|=r}else i!==null?(r=i.baseLanes|n,t.memoizedState=null):r=n,$(sn,Ce),Ce|=r;return he(e,t,l,n),t.child}function Ya(e,t){var n=t.ref;(e===null&&n!==null||e!==null&&e.ref!==n)&&(t.flags|=512,t.flags|=2097152)}function $i(e,t,n,r,l){var i=Se(n)?At:fe.current;return i=vn(t,i),pn(t,l),n=Mo(e,t,n,r,i,l),r=Ro(),e!==null&&!we?(t.updateQueue=e.updateQueue,t.flags&=-2053,e.lanes&=~l,ot(e,t,l)):(W&&r&&xo(t),t.flags|=1,he(e,t,n,l),t.child)}function Hu(e,t,n,r,l){if(Se(n)){var i=!0;nl(t)}else i=!1;if(pn(t,l),t.stateNode===null)Br(e,t),Ba(t,n,r),Fi(t,n,r,l),r=!0;else if(e===null){var o=t.stateNode,u=t.memoizedProps;o.props=u;var s=o.context,c=n.contextType;typeof c=="object"&&c!==null?c=Re(c):(c=Se(n)?At:fe.current,c=vn(t,c));var g=n.getDerivedStateFromProps,m=typeof g=="function"||typeof o.getSnapshotBeforeUpdate=="function";m||typeof o.UNSAFE_componentWillReceiveProps!="function"&&typeof o.componentWillReceiveProps!="function"||(u!==r||s!==c)&&Fu(t,o,r,c),ht=!1;var h=t.memoizedState;o.state=h,ul(t,r,o,l),s=t.memoizedState,u!==r||h!==s||xe.current||ht?(typeof g=="function"&&(Ii(t,n,g,r),s=t.memoizedState),(u=ht||Iu(t,n,u,r,h,s,c))?(m||typeof o.UNSAFE_componentWillMount!="function"&&typeof o.componentWillMount!="function"||(typeof o.componentWillMount=="function"&&o.componentWillMount(),typeof o.UNSAFE_componentWillMount=="function"&&o.UNSAFE_componentWillMount()),typeof o.componentDidMount=="function"&&(t.flags|=4194308)):(typeof o.componentDidMount=="function"&&(t.flags|=4194308),t.memoizedProps=r,t.memoizedState=s),o.props=r,o.state=s,o.context=c,r=u):(typeof o.componentDidMount=="function"&&(t.flags|=4194308),r=!1)}else{o=t.stateNode,Sa(e,t),u=t.memoizedProps,c=t.type===t.elementType?u:Ie(t.type,u),o.props=c,m=t.pendingProps,h=o.context,s=n.contextType,typeof s=="object"&&s!==null?s=Re(s):(s=Se(n)?At:fe.current,s=vn(t,s));var x=n.getDerivedStateFromProps;(g=typeof x=="function"||typeof o.getSnapshotBeforeUpdate=="function")||typeof o.UNSAFE_componentWillReceiveProps!="function"&&typeof o.componentWillReceiveProps!="function"||(u!==m||h!==s)&&Fu(t,o,r,s),ht=!1,h=t.memoizedState,o.state=h,ul(t,r,o,l);var S=t.memoizedState;u!==m||h!==S||xe.current||ht?(typeof x=="function"&&(Ii(t,n,x,r),S=t.memoizedState),(c=ht||Iu(t,n,c,r,h,S,s)||!1)?(g||typeof o.UNSAFE_componentWillUpdate!="function"&&typeof o.componentWillUpdate!="function"||(typeof o.componentWillUpdate=="function"&&o.componentWillUpdate(r,S,s),typeof o.UNSAFE_componentWillUpdate=="function"&&o.UNSAFE_componentWillUpdate(r,S,s)),typeof o.componentDidUpdate=="function"&&(t.flags|=4),typeof o.getSnapshotBeforeUpdate=="function"&&(t.flags|=1024)):(typeof o.componentDidUpdate!="function"||u===e.memoizedProps&&h===e.memoizedState||(t.flags|=4),typeof o.getSnapshotBeforeUpdate!="function"||u===e.memoizedProps&&h===e.memoizedState||(t.flags|=1024),t.memoizedProps=r,t.memoizedState=S),o.props=r,o.state=S,o.context=s,r=c):(typeof o.componentDidUpdate!="function"||u===e.memoizedProps&&h===e.memoizedState||(t.flags|=4),typeof o.getSnapshotBeforeUpdate!="function"||u===e.memoizedProps&&h===e.memoizedState||(t.flags|=1024),r=!1)}return Vi(e,t,n,r,i,l)}function Vi(e,t,n,r,l,i){Ya(e,t);var o=(t.flags&128)!==0;if(!r&&!o)return l&&Pu(t,n,!1),ot(e,t,i);r=t.stateNode,Uf.current=t;var u=o&&typeof n.getDerivedStateFromError!="function"?null:r.render();return t.flags|=1,e!==null&&o?(t.child=yn(t,e.child,null,i),t.child=yn(t,null,u,i)):he(e,t,u,i),t.memoizedState=r.state,l&&Pu(t,n,!0),t.child}function Ga(e){var t=e.stateNode;t.pendingContext?ju(e,t.pendingContext,t.pendingContext!==t.context):t.context&&ju(e,t.context,!1),Po(e,t.containerInfo)}function Wu(e,t,n,r,l){return gn(),ko(l),t.flags|=256,he(e,t,n,r),t.child}var Ai={dehydrated:null,treeContext:null,retryLane:0};function Bi(e){return{baseLanes:e,cachePool:null,transitions:null}}function Xa(e,t,n){var r=t.pendingProps,l=K.current,i=!1,o=(t.flags&128)!==0,u;if((u=o)||(u=e!==null&&e.memoizedState===null?!1:(l&2)!==0),u?(i=!0,t.flags&=-129):(e===null||e.memoizedState!==null)&&(l|=1),$(K,l&1),e===null)return Di(t),e=t.memoizedState,e!==null&&(e=e.dehydrated,e!==null)?(t.mode&1?e.data==="$!"?t.lanes=8:t.lanes=1073741824:t.lanes=1,null):(o=r.children,e=r.fallback,i?(r=t.mode,i=t.child,o={mode:"hidden",children:o},!(r&1)&&i!==null?(i.childLanes=0,i.pendingProps=o):i=jl(o,r,0,null),e=Vt(e,r,n,null),i.return=t,e.return=t,i.sibling=e,t.child=i,t.child.memoizedState=Bi(n),t.memoizedState=Ai,e):Io(t,o));if(l=e.memoizedState,l!==null&&(u=l.dehydrated,u!==null))return $f(e,t,o,r,u,l,n);if(i){i=r.fallback,o=t.mode,l=e.child,u=l.sibling;var s={mode:"hidden",children:r.children};return!(o&1)&&t.child!==l?(r=t.child,r.childLanes=0,r.pendingProps=s,t.deletions=null):(r=_t(l,s),r.subtreeFlags=l.subtreeFlags&14680064),u!==null?i=_t(u,i):(i=Vt(i,o,n,null),i.flags|=2),i.return=t,r.return=t,r.sibling=i,t.child=r,r=i,i=t.child,o=e.child.memoizedState,o=o===null?Bi(n):{baseLanes:o.baseLanes|n,cachePool:null,transitions:o.transitions},i.memoizedState=o,i.childLanes=e.childLanes&~n,t.memoizedState=Ai,r}return i=e.child,e=i.sibling,r=_t(i,{mode:"visible",children:r.children}),!(t.mode&1)&&(r.lanes=n),r.return=t,r.sibling=null,e!==null&&(n=t.deletions,n===null?(t.deletions=[e],t.flags|=16):n.push(e)),t.child=r,t.memoizedState=null,r}function Io(e,t){return t=jl({mode:"visible",children:t},e.mode,0,null),t.return=e,e.child=t}function Lr(e,t,n,r){return r!==null&&ko(r),yn(t,e.child,null,n),e=Io(t,t.pendingProps.children),e.flags|=2,t.memoizedState=null,e}function $f(e,t,n,r,l,i,o){if(n)return t.flags&256?(t.flags&=-257,r=ni(Error(w(422))),Lr(e,t,o,r)):t.memoizedState!==null?(t.child=e.child,t.flags|=128,null):(i=r.fallback,l=t.mode,r=jl({mode:"visible",children:r.children},l,0,null),i=Vt(i,l,o,null),i.flags|=2,r.return=t,i.return=t,r.sibling=i,t.child=r,t.mode&1&&yn(t,e.child,null,o),t.child.memoizedState=Bi(o),t.memoizedState=Ai,i);if(!(t.mode&1))return Lr(e,t,o,null);if(l.data==="$!"){if(r=l.nextSibling&&l.nextSibling.dataset,r)var u=r.dgst;return r=u,i=Error(w(419)),r=ni(i,r,void 0),Lr(e,t,o,r)}if(u=(o&e.childLanes)!==0,we||u){if(r=re,r!==null){switch(o&-o){case 4:l=2;break;case 16:l=8;break;case 64:case 128:case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:case 4194304:case 8388608:case 16777216:case 33554432:case 67108864:l=32;break;case 536870912:l=268435456;break;default:l=0}l=l&(r.suspendedLanes|o)?0:l,l!==0&&l!==i.retryLane&&(i.retryLane=l,it(e,l),Ve(r,e,l,-1))}return Bo(),r=ni(Error(w(421))),Lr(e,t,o,r)}return l.data==="$?"?(t.flags|=128,t.child=e.child,t=qf.bind(null,e),l._reactRetry=t,null):(e=i.treeContext,Ee=kt(l.nextSibling),Ne=t,W=!0,Ue=null,e!==null&&(ze[Le++]=et,ze[Le++]=tt,ze[Le++]=Bt,et=e.id,tt=e.overflow,Bt=t),t=Io(t,r.children),t.flags|=4096,t)}function Qu(e,t,n){e.lanes|=t;var r=e.alternate;r!==null&&(r.lanes|=t),Oi(e.return,t,n)}function ri(e,t,n,r,l){var i=e.memoizedState;i===null?e.memoizedState={isBackwards:t,rendering:null,renderingStartTime:0,last:r,tail:n,tailMode:l}:(i.isBackwards=t,i.rendering=null,i.renderingStartTime=0,i.last=r,i.tail=n,i.tailMode=l)}function Za(e,t,n){var r=t.pendingProps,l=r.revealOrder,i=r.tail;if(he(e,t,r.children,n),r=K.current,r&2)r=r&1|2,t.flags|=128;else{if(e!==null&&e.flags&128)e:for(e=t.child;e!==null;){if(e.tag===13)e.memoizedState!==null&&Qu(e,n,t);else if(e.tag===19)Qu(e,n,t);else if(e.child!==null){e.child.return=e,e=e.child;continue}if(e===t)break e;for(;e.sibling===null;){if(e.return===null||e.return===t)break e;e=e.return}e.sibling.return=e.return,e=e.sibling}r&=1}if($(K,r),!(t.mode&1))t.memoizedState=null;else switch(l){case"forwards":for(n=t.child,l=null;n!==null;)e=n.alternate,e!==null&&sl(e)===null&&(l=n),n=n.sibling;n=l,n===null?(l=t.child,t.child=null):(l=n.sibling,n.sibling=null),ri(t,!1,l,n,i);break;case"backwards":for(n=null,l=t.child,t.child=null;l!==null;){if(e=l.alternate,e!==null&&sl(e)===null){t.child=l;break}e=l.sibling,l.sibling=n,n=l,l=e}ri(t,!0,n,null,i);break;case"together":ri(t,!1,null,null,void 0);break;default:t.memoizedState=null}return t.child}function Br(e,t){!(t.mode&1)&&e!==null&&(e.alternate=null,t.alternate=null,t.flags|=2)}function ot(e,t,n){if(e!==null&&(t.dependencies=e.dependencies),Wt|=t.lanes,!(n&t.childLanes))return null;if(e!==null&&t.child!==e.child)throw Error(w(153));if(t.child!==null){for(e=t.child,n=_t(e,e.pendingProps),t.child=n,n.return=t;e.sibling!==null;)e=e.sibling,n=n.sibling=_t(e,e.pendingProps),n.return=t;n.sibling=null}return t.child}function Vf(e,t,n){switch(t.tag){case 3:Ga(t),gn();break;case 5:ka(t);break;case 1:Se(t.type)&&nl(t);break;case 4:Po(t,t.stateNode.containerInfo);break;case 10:var r=t.type._context,l=t.memoizedProps.value;$(il,r._currentValue),r._currentValue=l;break;case 13:if(r=t.memoizedState,r!==null)return r.dehydrated!==null?($(K,K.current&1),t.flags|=128,null):n&t.child.childLanes?Xa(e,t,n):($(K,K.current&1),e=ot(e,t,n),e!==null?e.sibling:null);$(K,K.current&1);break;case 19:if(r=(n&t.childLanes)!==0,e.flags&128){if(r)return Za(e,t,n);t.flags|=128}if(l=t.memoizedState,l!==null&&(l.rendering=null,l.tail=null,l.lastEffect=null),$(K,K.current),r)break;return null;case 22:case 23:return t.lanes=0,Ka(e,t,n)}return ot(e,t,n)}var Ja,Hi,qa,ba;Ja=function(e,t){for(var n=t.child;n!==null;){if(n.tag===5||n.tag===6)e.appendChild(n.stateNode);else if(n.tag!==4&&n.child!==null){n.child.return=n,n=n.child;continue}if(n===t)break;for(;n.sibling===null;){if(n.return===null||n.return===t)return;n=n.return}n.sibling.return=n.return,n=n.sibling}};Hi=function(){};qa=function(e,t,n,r){var l=e.memoizedProps;if(l!==r){e=t.stateNode,Ut(Ge.current);var i=null;switch(n){case"input":l=fi(e,l),r=fi(e,r),i=[];break;case"select":l=G({},l,{value:void 0}),r=G({},r,{value:void 0}),i=[];break;case"textarea":l=hi(e,l),r=hi(e,r),i=[];break;default:typeof l.onClick!="function"&&typeof r.onClick=="function"&&(e.onclick=el)}vi(n,r);var o;n=null;for(c in l)if(!r.hasOwnProperty(c)&&l.hasOwnProperty(c)&&l[c]!=null)if(c==="style"){var u=l[c];for(o in u)u.hasOwnProperty(o)&&(n||(n={}),n[o]="")}else c!=="dangerouslySetInnerHTML"&&c!=="children"&&c!=="suppressContentEditableWarning"&&c!=="suppressHydrationWarning"&&c!=="autoFocus"&&(Gn.hasOwnProperty(c)?i||(i=[]):(i=i||[]).push(c,null));for(c in r){var s=r[c];if(u=l!=null?l[c]:void 0,r.hasOwnProperty(c)&&s!==u&&(s!=null||u!=null))if(c==="style")if(u){for(o in u)!u.hasOwnProperty(o)||s&&s.hasOwnProperty(o)||(n||(n={}),n[o]="");for(o in s)s.hasOwnProperty(o)&&u[o]!==s[o]&&(n||(n={}),n[o]=s[o])}else n||(i||(i=[]),i.push(c,n)),n=s;else c==="dangerouslySetInnerHTML"?(s=s?s.__html:void 0,u=u?u.__html:void 0,s!=null&&u!==s&&(i=i||[]).push(c,s)):c==="children"?typeof s!="string"&&typeof s!="number"||(i=i||[]).push(c,""+s):c!=="suppressContentEditableWarning"&&c!=="suppressHydrationWarning"&&(Gn.hasOwnProperty(c)?(s!=null&&c==="onScroll"&&V("scroll",e),i||u===s||(i=[])):(i=i||[]).push(c,s))}n&&(i=i||[]).push("style",n);var c=i;(t.updateQueue=c)&&(t.flags|=4)}};ba=function(e,t,n,r){n!==r&&(t.flags|=4)};function Tn(e,t){if(!W)switch(e.tailMode){case"hidden":t=e.tail;for(var n=null;t!==null;)t.alternate!==null&&(n=t),t=t.sibling;n===null?e.tail=null:n.sibling=null;break;case"collapsed":n=e.tail;for(var r=null;n!==null;)n.alternate!==null&&(r=n),n=n.sibling;r===null?t||e.tail===null?e.tail=null:e.tail.sibling=null:r.sibling=null}}function ae(e){var t=e.alternate!==null&&e.alternate.child===e.child,n=0,r=0;if(t)for(var l=e.child;l!==null;)n|=l.lanes|l.childLanes,r|=l.subtreeFlags&14680064,r|=l.flags&14680064,l.return=e,l=l.sibling;else for(l=e.child;l!==null;)n|=l.lanes|l.childLanes,r|=l.subtreeFlags,r|=l.flags,l.return=e,l=l.sibling;return e.subtreeFlags|=r,e.childLanes=n,t}function Af(e,t,n){var r=t.pendingProps;switch(So(t),t.tag){case 2:case 16:case 15:case 0:case 11:case 7:case 8:case 12:case 9:case 14:return ae(t),null;case 1:return Se(t.type)&&tl(),ae(t),null;case 3:return r=t.stateNode,wn(),A(xe),A(fe),Lo(),r.pendingContext&&(r.context=r.pendingContext,r.pendingContext=null),(e===null||e.child===null)&&(Pr(t)?t.flags|=4:e===null||e.memoizedState.isDehydrated&&!(t.flags&256)||(t.flags|=1024,Ue!==null&&(Ji(Ue),Ue=null))),Hi(e,t),ae(t),null;case 5:zo(t);var l=Ut(or.current);if(n=t.type,e!==null&&t.stateNode!=null)qa(e,t,n,r,l),e.ref!==t.ref&&(t.flags|=512,t.flags|=2097152);else{if(!r){if(t.stateNode===null)throw Error(w(166));return ae(t),null}if(e=Ut(Ge.current),Pr(t)){r=t.stateNode,n=t.type;var i=t.memoizedProps;switch(r[Ke]=t,r[lr]=i,e=(t.mode&1)!==0,n){case"dialog":V("cancel",r),V("close",r);break;case"iframe":case"object":case"embed":V("load",r);break;case"video":case"audio":for(l=0;l<In.length;l++)V(In[l],r);break;case"source":V("error",r);break;case"img":case"image":case"link":V("error",r),V("load",r);break;case"details":V("toggle",r);break;case"input":eu(r,i),V("invalid",r);break;case"select":r._wrapperState={wasMultiple:!!i.multiple},V("invalid",r);break;case"textarea":nu(r,i),V("invalid",r)}vi(n,i),l=null;for(var o in i)if(i.hasOwnProperty(o)){var u=i[o];o==="children"?typeof u=="string"?r.textContent!==u&&(i.suppressHydrationWarning!==!0&&jr(r.textContent,u,e),l=["children",u]):typeof u=="number"&&r.textContent!==""+u&&(i.suppressHydrationWarning!==!0&&jr(r.textContent,u,e),l=["children",""+u]):Gn.hasOwnProperty(o)&&u!=null&&o==="onScroll"&&V("scroll",r)}switch(n){case"input":wr(r),tu(r,i,!0);break;case"textarea":wr(r),ru(r);break;case"select":case"option":break;default:typeof i.onClick=="function"&&(r.onclick=el)}r=l,t.updateQueue=r,r!==null&&(t.flags|=4)}else{o=l.nodeType===9?l:l.ownerDocument,e==="http://www.w3.org/1999/xhtml"&&(e=js(n)),e==="http://www.w3.org/1999/xhtml"?n==="script"?(e=o.createElement("div"),e.innerHTML="<script><\/script>",e=e.removeChild(e.firstChild)):typeof r.is=="string"?e=o.createElement(n,{is:r.is}):(e=o.createElement(n),n==="select"&&(o=e,r.multiple?o.multiple=!0:r.size&&(o.size=r.size))):e=o.createElementNS(e,n),e[Ke]=t,e[lr]=r,Ja(e,t,!1,!1),t.stateNode=e;e:{switch(o=gi(n,r),n){case"dialog":V("cancel",e),V("close",e),l=r;break;case"iframe":case"object":case"embed":V("load",e),l=r;break;case"video":case"audio":for(l=0;l<In.length;l++)V(In[l],e);l=r;break;case"source":V("error",e),l=r;break;case"img":case"image":case"link":V("error",e),V("load",e),l=r;break;case"details":V("toggle",e),l=r;break;case"input":eu(e,r),l=fi(e,r),V("invalid",e);break;case"option":l=r;break;case"select":e._wrapperState={wasMultiple:!!r.multiple},l=G({},r,{value:void 0}),V("invalid",e);break;case"textarea":nu(e,r),l=hi(e,r),V("invalid",e);break;default:l=r}vi(n,l),u=l;for(i in u)if(u.hasOwnProperty(i)){var s=u[i];i==="style"?Ls(e,s):i==="dangerouslySetInnerHTML"?(s=s?s.__html:void 0,s!=null&&Ps(e,s)):i==="children"?typeof s=="string"?(n!=="textarea"||s!=="")&&Xn(e,s):typeof s=="number"&&Xn(e,""+s):i!=="suppressContentEditableWarning"&&i!=="suppressHydrationWarning"&&i!=="autoFocus"&&(Gn.hasOwnProperty(i)?s!=null&&i==="onScroll"&&V("scroll",e):s!=null&&io(e,i,s,o))}switch(n){case"input":wr(e),tu(e,r,!1);break;case"textarea":wr(e),ru(e);break;case"option":r.value!=null&&e.setAttribute("value",""+jt(r.value));break;case"select":e.multiple=!!r.multiple,i=r.value,i!=null?an(e,!!r.multiple,i,!1):r.defaultValue!=null&&an(e,!!r.multiple,r.defaultValue,!0);break;default:typeof l.onClick=="function"&&(e.onclick=el)}switch(n){case"button":case"input":case"select":case"textarea":r=!!r.autoFocus;break e;case"img":r=!0;break e;default:r=!1}}r&&(t.flags|=4)}t.ref!==null&&(t.flags|=512,t.flags|=2097152)}return ae(t),null;case 6:if(e&&t.stateNode!=null)ba(e,t,e.memoizedProps,r);else{if(typeof r!="string"&&t.stateNode===null)throw Error(w(166));if(n=Ut(or.current),Ut(Ge.current),Pr(t)){if(r=t.stateNode,n=t.memoizedProps,r[Ke]=t,(i=r.nodeValue!==n)&&(e=Ne,e!==null))switch(e.tag){case 3:jr(r.nodeValue,n,(e.mode&1)!==0);break;case 5:e.memoizedProps.suppressHydrationWarning!==!0&&jr(r.nodeValue,n,(e.mode&1)!==0)}i&&(t.flags|=4)}else r=(n.nodeType===9?n:n.ownerDocument).createTextNode(r),r[Ke]=t,t.stateNode=r}return ae(t),null;case 13:if(A(K),r=t.memoizedState,e===null||e.memoizedState!==null&&e.memoizedState.dehydrated!==null){if(W&&Ee!==null&&t.mode&1&&!(t.flags&128))ga(),gn(),t.flags|=98560,i=!1;else if(i=Pr(t),r!==null&&r.dehydrated!==null){if(e===null){if(!i)throw Error(w(318));if(i=t.memoizedState,i=i!==null?i.dehydrated:null,!i)throw Error(w(317));i[Ke]=t}else gn(),!(t.flags&128)&&(t.memoizedState=null),t.flags|=4;ae(t),i=!1}else Ue!==null&&(Ji(Ue),Ue=null),i=!0;if(!i)return t.flags&65536?t:null}return t.flags&128?(t.lanes=n,t):(r=r!==null,r!==(e!==null&&e.memoizedState!==null)&&r&&(t.child.flags|=8192,t.mode&1&&(e===null||K.current&1?te===0&&(te=3):Bo())),t.updateQueue!==null&&(t.flags|=4),ae(t),null);case 4:return wn(),Hi(e,t),e===null&&nr(t.stateNode.containerInfo),ae(t),null;case 10:return No(t.type._context),ae(t),null;case 17:return Se(t.type)&&tl(),ae(t),null;case 19:if(A(K),i=t.memoizedState,i===null)return ae(t),null;if(r=(t.flags&128)!==0,o=i.rendering,o===null)if(r)Tn(i,!1);else{if(te!==0||e!==null&&e.flags&128)for(e=t.child;e!==null;){if(o=sl(e),o!==null){for(t.flags|=128,Tn(i,!1),r=o.updateQueue,r!==null&&(t.updateQueue=r,t.flags|=4),t.subtreeFlags=0,r=n,n=t.child;n!==null;)i=n,e=r,i.flags&=14680066,o=i.alternate,o===null?(i.childLanes=0,i.lanes=e,i.child=null,i.subtreeFlags=0,i.memoizedProps=null,i.memoizedState=null,i.updateQueue=null,i.dependencies=null,i.stateNode=null):(i.childLanes=o.childLanes,i.lanes=o.lanes,i.child=o.child,i.subtreeFlags=0,i.deletions=null,i.memoizedProps=o.memoizedProps,i.memoizedState=o.memoizedState,i.updateQueue=o.updateQueue,i.type=o.type,e=o.dependencies,i.dependencies=e===null?null:{lanes:e.lanes,firstContext:e.firstContext}),n=n.sibling;return $(K,K.current&1|2),t.child}e=e.sibling}i.tail!==null&&J()>Sn&&(t.flags|=128,r=!0,Tn(i,!1),t.lanes=4194304)}else{if(!r)if(e=sl(o),e!==null){if(t.flags|=128,r=!0,n=e.updateQueue,n!==null&&(t.updateQueue=n,t.flags|=4),Tn(i,!0),i.tail===null&&i.tailMode==="hidden"&&!o.alternate&&!W)return ae(t),null}else 2*J()-i.renderingStartTime>Sn&&n!==1073741824&&(t.flags|=128,r=!0,Tn(i,!1),t.lanes=4194304);i.isBackwards?(o.sibling=t.child,t.child=o):(n=i.last,n!==null?n.sibling=o:t.child=o,i.last=o)}return i.tail!==null?(t=i.tail,i.rendering=t,i.tail=t.sibling,i.renderingStartTime=J(),t.sibling=null,n=K.current,$(K,r?n&1|2:n&1),t):(ae(t),null);case 22:case 23:return Ao(),r=t.memoizedState!==null,e!==null&&e.memoizedState!==null!==r&&(t.flags|=8192),r&&t.mode&1?Ce&1073741824&&(ae(t),t.subtreeFlags&6&&(t.flags|=8192)):ae(t),null;case 24:return null;case 25:return null}throw Error(w(156,t.tag))}function Bf(e,t){switch(So(t),t.tag){case 1:return Se(t.type)&&tl(),e=t.flags,e&65536?(t.flags=e&-65537|128,t):null;case 3:return wn(),A(xe),A(fe),Lo(),e=t.flags,e&65536&&!(e&128)?(t.flags=e&-65537|128,t):null;case 5:return zo(t),null;case 13:if(A(K),e=t.memoizedState,e!==null&&e.dehydrated!==null){if(t.alternate===null)throw Error(w(340));gn()}return e=t.flags,e&65536?(t.flags=e&-65537|128,t):null;case 19:return A(K),null;case 4:return wn(),null;case 10:return No(t.type._context),null;case 22:case 23:return Ao(),null;case 24:return null;default:return null}}var Tr=!1,ce=!1,Hf=typeof WeakSet=="function"?WeakSet:Set,N=null;function un(e,t){var n=e.ref;if(n!==null)if(typeof n=="function")try{n(null)}catch(r){X(e,t,r)}else n.current=null}function Wi(e,t,n){try{n()}catch(r){X(e,t,r)}}var Ku=!1;function Wf(e,t){if(ji=Jr,e=la(),wo(e)){if("selectionStart"in e)var n={start:e.selectionStart,end:e.selectionEnd};else e:{n=(n=e.ownerDocument)&&n.defaultView||window;var r=n.getSelection&&n.getSelection();if(r&&r.rangeCount!==0){n=r.anchorNode;var l=r.anchorOffset,i=r.focusNode;r=r.focusOffset;try{n.nodeType,i.nodeType}catch{n=null;break e}var o=0,u=-1,s=-1,c=0,g=0,m=e,h=null;t:for(;;){for(var x;m!==n||l!==0&&m.nodeType!==3||(u=o+l),m!==i||r!==0&&m.nodeType!==3||(s=o+r),m.nodeType===3&&(o+=m.nodeValue.length),(x=m.firstChild)!==null;)h=m,m=x;for(;;){if(m===e)break t;if(h===n&&++c===l&&(u=o),h===i&&++g===r&&(s=o),(x=m.nextSibling)!==null)break;m=h,h=m.parentNode}m=x}n=u===-1||s===-1?null:{start:u,end:s}}else n=null}n=n||{start:0,end:0}}else n=null;for(Pi={focusedElem:e,selectionRange:n},Jr=!1,N=t;N!==null;)if(t=N,e=t.child,(t.subtreeFlags&1028)!==0&&e!==null)e.return=t,N=e;else for(;N!==null;){t=N;try{var S=t.alternate;if(t.flags&1024)switch(t.tag){case 0:case 11:case 15:break;case 1:if(S!==null){var k=S.memoizedProps,U=S.memoizedState,f=t.stateNode,a=f.getSnapshotBeforeUpdate(t.elementType===t.type?k:Ie(t.type,k),U);f.__reactInternalSnapshotBeforeUpdate=a}break;case 3:var d=t.stateNode.containerInfo;d.nodeType===1?d.textContent="":d.nodeType===9&&d.documentElement&&d.removeChild(d.documentElement);break;case 5:case 6:case 4:case 17:break;default:throw Error(w(163))}}catch(y){X(t,t.return,y)}if(e=t.sibling,e!==null){e.return=t.return,N=e;break}N=t.return}return S=Ku,Ku=!1,S}function Hn(e,t,n){var r=t.updateQueue;if(r=r!==null?r.lastEffect:null,r!==null){var l=r=r.next;do{if((l.tag&e)===e){var i=l.destroy;l.destroy=void 0,i!==void 0&&Wi(t,n,i)}l=l.next}while(l!==r)}}function Nl(e,t){if(t=t.updateQueue,t=t!==null?t.lastEffect:null,t!==null){var n=t=t.next;do{if((n.tag&e)===e){var r=n.create;n.destroy=r()}n=n.next}while(n!==t)}}function Qi(e){var t=e.ref;if(t!==null){var n=e.stateNode;switch(e.tag){case 5:e=n;break;default:e=n}typeof t=="function"?t(e):t.current=e}}function ec(e){var t=e.alternate;t!==null&&(e.alternate=null,ec(t)),e.child=null,e.deletions=null,e.sibling=null,e.tag===5&&(t=e.stateNode,t!==null&&(delete t[Ke],delete t[lr],delete t[Ti],delete t[_f],delete t[jf])),e.stateNode=null,e.return=null,e.dependencies=null,e.memoizedProps=null,e.memoizedState=null,e.pendingProps=null,e.stateNode=null,e.updateQueue=null}function tc(e){return e.tag===5||e.tag===3||e.tag===4}function Yu(e){e:for(;;){for(;e.sibling===null;){if(e.return===null||tc(e.return))return null;e=e.return}for(e.sibling.return=e.return,e=e.sibling;e.tag!==5&&e.tag!==6&&e.tag!==18;){if(e.flags&2||e.child===null||e.tag===4)continue e;e.child.return=e,e=e.child}if(!(e.flags&2))return e.stateNode}}function Ki(e,t,n){var r=e.tag;if(r===5||r===6)e=e.stateNode,t?n.nodeType===8?n.parentNode.insertBefore(e,t):n.insertBefore(e,t):(n.nodeType===8?(t=n.parentNode,t.insertBefore(e,n)):(t=n,t.appendChild(e)),n=n._reactRootContainer,n!=null||t.onclick!==null||(t.onclick=el));else if(r!==4&&(e=e.child,e!==null))for(Ki(e,t,n),e=e.sibling;e!==null;)Ki(e,t,n),e=e.sibling}function Yi(e,t,n){var r=e.tag;if(r===5||r===6)e=e.stateNode,t?n.insertBefore(e,t):n.appendChild(e);else if(r!==4&&(e=e.child,e!==null))for(Yi(e,t,n),e=e.sibling;e!==null;)Yi(e,t,n),e=e.sibling}var ie=null,Fe=!1;function ft(e,t,n){for(n=n.child;n!==null;)nc(e,t,n),n=n.sibling}function nc(e,t,n){if(Ye&&typeof Ye.onCommitFiberUnmount=="function")try{Ye.onCommitFiberUnmount(gl,n)}catch{}switch(n.tag){case 5:ce||un(n,t);case 6:var r=ie,l=Fe;ie=null,ft(e,t,n),ie=r,Fe=l,ie!==null&&(Fe?(e=ie,n=n.stateNode,e.nodeType===8?e.parentNode.removeChild(n):e.removeChild(n)):ie.removeChild(n.stateNode));break;case 18:ie!==null&&(Fe?(e=ie,n=n.stateNode,e.nodeType===8?Zl(e.parentNode,n):e.nodeType===1&&Zl(e,n),bn(e)):Zl(ie,n.stateNode));break;case 4:r=ie,l=Fe,ie=n.stateNode.containerInfo,Fe=!0,ft(e,t,n),ie=r,Fe=l;break;case 0:case 11:case 14:case 15:if(!ce&&(r=n.updateQueue,r!==null&&(r=r.lastEffect,r!==null))){l=r=r.next;do{var i=l,o=i.destroy;i=i.tag,o!==void 0&&(i&2||i&4)&&Wi(n,t,o),l=l.next}while(l!==r)}ft(e,t,n);break;case 1:if(!ce&&(un(n,t),r=n.stateNode,typeof r.componentWillUnmount=="function"))try{r.props=n.memoizedProps,r.state=n.memoizedState,r.componentWillUnmount()}catch(u){X(n,t,u)}ft(e,t,n);break;case 21:ft(e,t,n);break;case 22:n.mode&1?(ce=(r=ce)||n.memoizedState!==null,ft(e,t,n),ce=r):ft(e,t,n);break;default:ft(e,t,n)}}function Gu(e){var t=e.updateQueue;if(t!==null){e.updateQueue=null;var n=e.stateNode;n===null&&(n=e.stateNode=new Hf),t.forEach(function(r){var l=bf.bind(null,e,r);n.has(r)||(n.add(r),r.then(l,l))})}}function Oe(e,t){var n=t.deletions;if(n!==null)for(var r=0;r<n.length;r++){var l=n[r];try{var i=e,o=t,u=o;e:for(;u!==null;){switch(u.tag){case 5:ie=u.stateNode,Fe=!1;break e;case 3:ie=u.stateNode.containerInfo,Fe=!0;break e;case 4:ie=u.stateNode.containerInfo,Fe=!0;break e}u=u.return}if(ie===null)throw Error(w(160));nc(i,o,l),ie=null,Fe=!1;var s=l.alternate;s!==null&&(s.return=null),l.return=null}catch(c){X(l,t,c)}}if(t.subtreeFlags&12854)for(t=t.child;t!==null;)rc(t,e),t=t.sibling}function rc(e,t){var n=e.alternate,r=e.flags;switch(e.tag){case 0:case 11:case 14:case 15:if(Oe(t,e),We(e),r&4){try{Hn(3,e,e.return),Nl(3,e)}catch(k){X(e,e.return,k)}try{Hn(5,e,e.return)}catch(k){X(e,e.return,k)}}break;case 1:Oe(t,e),We(e),r&512&&n!==null&&un(n,n.return);break;case 5:if(Oe(t,e),We(e),r&512&&n!==null&&un(n,n.return),e.flags&32){var l=e.stateNode;try{Xn(l,"")}catch(k){X(e,e.return,k)}}if(r&4&&(l=e.stateNode,l!=null)){var i=e.memoizedProps,o=n!==null?n.memoizedProps:i,u=e.type,s=e.updateQueue;if(e.updateQueue=null,s!==null)try{u==="input"&&i.type==="radio"&&i.name!=null&&Ns(l,i),gi(u,o);var c=gi(u,i);for(o=0;o<s.length;o+=2){var g=s[o],m=s[o+1];g==="style"?Ls(l,m):g==="dangerouslySetInnerHTML"?Ps(l,m):g==="children"?Xn(l,m):io(l,g,m,c)}switch(u){case"input":di(l,i);break;case"textarea":_s(l,i);break;case"select":var h=l._wrapperState.wasMultiple;l._wrapperState.wasMultiple=!!i.multiple;var x=i.value;x!=null?an(l,!!i.multiple,x,!1):h!==!!i.multiple&&(i.defaultValue!=null?an(l,!!i.multiple,i.defaultValue,!0):an(l,!!i.multiple,i.multiple?[]:"",!1))}l[lr]=i}catch(k){X(e,e.return,k)}}break;case 6:if(Oe(t,e),We(e),r&4){if(e.stateNode===null)throw Error(w(162));l=e.stateNode,i=e.memoizedProps;try{l.nodeValue=i}catch(k){X(e,e.return,k)}}break;case 3:if(Oe(t,e),We(e),r&4&&n!==null&&n.memoizedState.isDehydrated)try{bn(t.containerInfo)}catch(k){X(e,e.return,k)}break;case 4:Oe(t,e),We(e);break;case 13:Oe(t,e),We(e),l=e.child,l.flags&8192&&(i=l.memoizedState!==null,l.stateNode.isHidden=i,!i||l.alternate!==null&&l.alternate.memoizedState!==null||($o=J())),r&4&&Gu(e);break;case 22:if(g=n!==null&&n.memoizedState!==null,e.mode&1?(ce=(c=ce)||g,Oe(t,e),ce=c):Oe(t,e),We(e),r&8192){if(c=e.memoizedState!==null,(e.stateNode.isHidden=c)&&!g&&e.mode&1)for(N=e,g=e.child;g!==null;){for(m=N=g;N!==null;){switch(h=N,x=h.child,h.tag){case 0:case 11:case 14:case 15:Hn(4,h,h.return);break;case 1:un(h,h.return);var S=h.stateNode;if(typeof S.componentWillUnmount=="function"){r=h,n=h.return;try{t=r,S.props=t.memoizedProps,S.state=t.memoizedState,S.componentWillUnmount()}catch(k){X(r,n,k)}}break;case 5:un(h,h.return);break;case 22:if(h.memoizedState!==null){Zu(m);continue}}x!==null?(x.return=h,N=x):Zu(m)}g=g.sibling}e:for(g=null,m=e;;){if(m.tag===5){if(g===null){g=m;try{l=m.stateNode,c?(i=l.style,typeof i.setProperty=="function"?i.setProperty("display","none","important"):i.display="none"):(u=m.stateNode,s=m.memoizedProps.style,o=s!=null&&s.hasOwnProperty("display")?s.display:null,u.style.display=zs("display",o))}catch(k){X(e,e.return,k)}}}else if(m.tag===6){if(g===null)try{m.stateNode.nodeValue=c?"":m.memoizedProps}catch(k){X(e,e.return,k)}}else if((m.tag!==22&&m.tag!==23||m.memoizedState===null||m===e)&&m.child!==null){m.child.return=m,m=m.child;continue}if(m===e)break e;for(;m.sibling===null;){if(m.return===null||m.return===e)break e;g===m&&(g=null),m=m.return}g===m&&(g=null),m.sibling.return=m.return,m=m.sibling}}break;case 19:Oe(t,e),We(e),r&4&&Gu(e);break;case 21:break;default:Oe(t,e),We(e)}}function We(e){var t=e.flags;if(t&2){try{e:{for(var n=e.return;n!==null;){if(tc(n)){var r=n;break e}n=n.return}throw Error(w(160))}switch(r.tag){case 5:var l=r.stateNode;r.flags&32&&(Xn(l,""),r.flags&=-33);var i=Yu(e);Yi(e,i,l);break;case 3:case 4:var o=r.stateNode.containerInfo,u=Yu(e);Ki(e,u,o);break;default:throw Error(w(161))}}catch(s){X(e,e.return,s)}e.flags&=-3}t&4096&&(e.flags&=-4097)}function Qf(e,t,n){N=e,lc(e)}function lc(e,t,n){for(var r=(e.mode&1)!==0;N!==null;){var l=N,i=l.child;if(l.tag===22&&r){var o=l.memoizedState!==null||Tr;if(!o){var u=l.alternate,s=u!==null&&u.memoizedState!==null||ce;u=Tr;var c=ce;if(Tr=o,(ce=s)&&!c)for(N=l;N!==null;)o=N,s=o.child,o.tag===22&&o.memoizedState!==null?Ju(l):s!==null?(s.return=o,N=s):Ju(l);for(;i!==null;)N=i,lc(i),i=i.sibling;N=l,Tr=u,ce=c}Xu(e)}else l.subtreeFlags&8772&&i!==null?(i.return=l,N=i):Xu(e)}}function Xu(e){for(;N!==null;){var t=N;if(t.flags&8772){var n=t.alternate;try{if(t.flags&8772)switch(t.tag){case 0:case 11:case 15:ce||Nl(5,t);break;case 1:var r=t.stateNode;if(t.flags&4&&!ce)if(n===null)r.componentDidMount();else{var l=t.elementType===t.type?n.memoizedProps:Ie(t.type,n.memoizedProps);r.componentDidUpdate(l,n.memoizedState,r.__reactInternalSnapshotBeforeUpdate)}var i=t.updateQueue;i!==null&&Ru(t,i,r);break;case 3:var o=t.updateQueue;if(o!==null){if(n=null,t.child!==null)switch(t.child.tag){case 5:n=t.child.stateNode;break;case 1:n=t.child.stateNode}Ru(t,o,n)}break;case 5:var u=t.stateNode;if(n===null&&t.flags&4){n=u;var s=t.memoizedProps;switch(t.type){case"button":case"input":case"select":case"textarea":s.autoFocus&&n.focus();break;case"img":s.src&&(n.src=s.src)}}break;case 6:break;case 4:break;case 12:break;case 13:if(t.memoizedState===null){var c=t.alternate;if(c!==null){var g=c.memoizedState;if(g!==null){var m=g.dehydrated;m!==null&&bn(m)}}}break;case 19:case 17:case 21:case 22:case 23:case 25:break;default:throw Error(w(163))}ce||t.flags&512&&Qi(t)}catch(h){X(t,t.return,h)}}if(t===e){N=null;break}if(n=t.sibling,n!==null){n.return=t.return,N=n;break}N=t.return}}function Zu(e){for(;N!==null;){var t=N;if(t===e){N=null;break}var n=t.sibling;if(n!==null){n.return=t.return,N=n;break}N=t.return}}function Ju(e){for(;N!==null;){var t=N;try{switch(t.tag){case 0:case 11:case 15:var n=t.return;try{Nl(4,t)}catch(s){X(t,n,s)}break;case 1:var r=t.stateNode;if(typeof r.componentDidMount=="function"){var l=t.return;try{r.componentDidMount()}catch(s){X(t,l,s)}}var i=t.return;try{Qi(t)}catch(s){X(t,i,s)}break;case 5:var o=t.return;try{Qi(t)}catch(s){X(t,o,s)}}}catch(s){X(t,t.return,s)}if(t===e){N=null;break}var u=t.sibling;if(u!==null){u.return=t.return,N=u;break}N=t.return}}var Kf=Math.ceil,fl=ut.ReactCurrentDispatcher,Fo=ut.ReactCurrentOwner,Me=ut.ReactCurrentBatchConfig,D=0,re=null,q=null,oe=0,Ce=0,sn=Lt(0),te=0,cr=null,Wt=0,_l=0,Uo=0,Wn=null,ye=null,$o=0,Sn=1/0,qe=null,dl=!1,Gi=null,Et=null,Mr=!1,yt=null,pl=0,Qn=0,Xi=null,Hr=-1,Wr=0;function me(){return D&6?J():Hr!==-1?Hr:Hr=J()}function Nt(e){return e.mode&1?D&2&&oe!==0?oe&-oe:zf.transition!==null?(Wr===0&&(Wr=Bs()),Wr):(e=F,e!==0||(e=window.event,e=e===void 0?16:Xs(e.type)),e):1}function Ve(e,t,n,r){if(50<Qn)throw Qn=0,Xi=null,Error(w(185));dr(e,n,r),(!(D&2)||e!==re)&&(e===re&&(!(D&2)&&(_l|=n),te===4&&vt(e,oe)),ke(e,r),n===1&&D===0&&!(t.mode&1)&&(Sn=J()+500,kl&&Tt()))}function ke(e,t){var n=e.callbackNode;P0(e,t);var r=Zr(e,e===re?oe:0);if(r===0)n!==null&&ou(n),e.callbackNode=null,e.callbackPriority=0;else if(t=r&-r,e.callbackPriority!==t){if(n!=null&&ou(n),t===1)e.tag===0?Pf(qu.bind(null,e)):ha(qu.bind(null,e)),Ef(function(){!(D&6)&&Tt()}),n=null;else{switch(Hs(r)){case 1:n=co;break;case 4:n=Vs;break;case 16:n=Xr;break;case 536870912:n=As;break;default:n=Xr}n=dc(n,ic.bind(null,e))}e.callbackPriority=t,e.callbackNode=n}}function ic(e,t){if(Hr=-1,Wr=0,D&6)throw Error(w(327));var n=e.callbackNode;if(hn()&&e.callbackNode!==n)return null;var r=Zr(e,e===re?oe:0);if(r===0)return null;if(r&30||r&e.expiredLanes||t)t=hl(e,r);else{t=r;var l=D;D|=2;var i=uc();(re!==e||oe!==t)&&(qe=null,Sn=J()+500,$t(e,t));do try{Xf();break}catch(u){oc(e,u)}while(!0);Eo(),fl.current=i,D=l,q!==null?t=0:(re=null,oe=0,t=te)}if(t!==0){if(t===2&&(l=ki(e),l!==0&&(r=l,t=Zi(e,l))),t===1)throw n=cr,$t(e,0),vt(e,r),ke(e,J()),n;if(t===6)vt(e,r);else{if(l=e.current.alternate,!(r&30)&&!Yf(l)&&(t=hl(e,r),t===2&&(i=ki(e),i!==0&&(r=i,t=Zi(e,i))),t===1))throw n=cr,$t(e,0),vt(e,r),ke(e,J()),n;switch(e.finishedWork=l,e.finishedLanes=r,t){case 0:case 1:throw Error(w(345));case 2:Ot(e,ye,qe);break;case 3:if(vt(e,r),(r&130023424)===r&&(t=$o+500-J(),10<t)){if(Zr(e,0)!==0)break;if(l=e.suspendedLanes,(l&r)!==r){me(),e.pingedLanes|=e.suspendedLanes&l;break}e.timeoutHandle=Li(Ot.bind(null,e,ye,qe),t);break}Ot(e,ye,qe);break;case 4:if(vt(e,r),(r&4194240)===r)break;for(t=e.eventTimes,l=-1;0<r;){var o=31-$e(r);i=1<<o,o=t[o],o>l&&(l=o),r&=~i}if(r=l,r=J()-r,r=(120>r?120:480>r?480:1080>r?1080:1920>r?1920:3e3>r?3e3:4320>r?4320:1960*Kf(r/1960))-r,10<r){e.timeoutHandle=Li(Ot.bind(null,e,ye,qe),r);break}Ot(e,ye,qe);break;case 5:Ot(e,ye,qe);break;default:throw Error(w(329))}}}return ke(e,J()),e.callbackNode===n?ic.bind(null,e):null}function Zi(e,t){var n=Wn;return e.current.memoizedState.isDehydrated&&($t(e,t).flags|=256),e=hl(e,t),e!==2&&(t=ye,ye=n,t!==null&&Ji(t)),e}function Ji(e){ye===null?ye=e:ye.push.apply(ye,e)}function Yf(e){for(var t=e;;){if(t.flags&16384){var n=t.updateQueue;if(n!==null&&(n=n.stores,n!==null))for(var r=0;r<n.length;r++){var l=n[r],i=l.getSnapshot;l=l.value;try{if(!Ae(i(),l))return!1}catch{return!1}}}if(n=t.child,t.subtreeFlags&16384&&n!==null)n.return=t,t=n;else{if(t===e)break;for(;t.sibling===null;){if(t.return===null||t.return===e)return!0;t=t.return}t.sibling.return=t.return,t=t.sibling}}return!0}function vt(e,t){for(t&=~Uo,t&=~_l,e.suspendedLanes|=t,e.pingedLanes&=~t,e=e.expirationTimes;0<t;){var n=31-$e(t),r=1<<n;e[n]=-1,t&=~r}}function qu(e){if(D&6)throw Error(w(327));hn();var t=Zr(e,0);if(!(t&1))return ke(e,J()),null;var n=hl(e,t);if(e.tag!==0&&n===2){var r=ki(e);r!==0&&(t=r,n=Zi(e,r))}if(n===1)throw n=cr,$t(e,0),vt(e,t),ke(e,J()),n;if(n===6)throw Error(w(345));return e.finishedWork=e.current.alternate,e.finishedLanes=t,Ot(e,ye,qe),ke(e,J()),null}function Vo(e,t){var n=D;D|=1;try{return e(t)}finally{D=n,D===0&&(Sn=J()+500,kl&&Tt())}}function Qt(e){yt!==null&&yt.tag===0&&!(D&6)&&hn();var t=D;D|=1;var n=Me.transition,r=F;try{if(Me.transition=null,F=1,e)return e()}finally{F=r,Me.transition=n,D=t,!(D&6)&&Tt()}}function Ao(){Ce=sn.current,A(sn)}function $t(e,t){e.finishedWork=null,e.finishedLanes=0;var n=e.timeoutHandle;if(n!==-1&&(e.timeoutHandle=-1,Cf(n)),q!==null)for(n=q.return;n!==null;){var r=n;switch(So(r),r.tag){case 1:r=r.type.childContextTypes,r!=null&&tl();break;case 3:wn(),A(xe),A(fe),Lo();break;case 5:zo(r);break;case 4:wn();break;case 13:A(K);break;case 19:A(K);break;case 10:No(r.type._context);break;case 22:case 23:Ao()}n=n.return}if(re=e,q=e=_t(e.current,null),oe=Ce=t,te=0,cr=null,Uo=_l=Wt=0,ye=Wn=null,Ft!==null){for(t=0;t<Ft.length;t++)if(n=Ft[t],r=n.interleaved,r!==null){n.interleaved=null;var l=r.next,i=n.pending;if(i!==null){var o=i.next;i.next=l,r.next=o}n.pending=r}Ft=null}return e}function oc(e,t){do{var n=q;try{if(Eo(),Vr.current=cl,al){for(var r=Y.memoizedState;r!==null;){var l=r.queue;l!==null&&(l.pending=null),r=r.next}al=!1}if(Ht=0,ne=ee=Y=null,Bn=!1,ur=0,Fo.current=null,n===null||n.return===null){te=1,cr=t,q=null;break}e:{var i=e,o=n.return,u=n,s=t;if(t=oe,u.flags|=32768,s!==null&&typeof s=="object"&&typeof s.then=="function"){var c=s,g=u,m=g.tag;if(!(g.mode&1)&&(m===0||m===11||m===15)){var h=g.alternate;h?(g.updateQueue=h.updateQueue,g.memoizedState=h.memoizedState,g.lanes=h.lanes):(g.updateQueue=null,g.memoizedState=null)}var x=$u(o);if(x!==null){x.flags&=-257,Vu(x,o,u,i,t),x.mode&1&&Uu(i,c,t),t=x,s=c;var S=t.updateQueue;if(S===null){var k=new Set;k.add(s),t.updateQueue=k}else S.add(s);break e}else{if(!(t&1)){Uu(i,c,t),Bo();break e}s=Error(w(426))}}else if(W&&u.mode&1){var U=$u(o);if(U!==null){!(U.flags&65536)&&(U.flags|=256),Vu(U,o,u,i,t),ko(xn(s,u));break e}}i=s=xn(s,u),te!==4&&(te=2),Wn===null?Wn=[i]:Wn.push(i),i=o;do{switch(i.tag){case 3:i.flags|=65536,t&=-t,i.lanes|=t;var f=Ha(i,s,t);Mu(i,f);break e;case 1:u=s;var a=i.type,d=i.stateNode;if(!(i.flags&128)&&(typeof a.getDerivedStateFromError=="function"||d!==null&&typeof d.componentDidCatch=="function"&&(Et===null||!Et.has(d)))){i.flags|=65536,t&=-t,i.lanes|=t;var y=Wa(i,u,t);Mu(i,y);break e}}i=i.return}while(i!==null)}ac(n)}catch(C){t=C,q===n&&n!==null&&(q=n=n.return);continue}break}while(!0)}function uc(){var e=fl.current;return fl.current=cl,e===null?cl:e}function Bo(){(te===0||te===3||te===2)&&(te=4),re===null||!(Wt&268435455)&&!(_l&268435455)||vt(re,oe)}function hl(e,t){var n=D;D|=2;var r=uc();(re!==e||oe!==t)&&(qe=null,$t(e,t));do try{Gf();break}catch(l){oc(e,l)}while(!0);if(Eo(),D=n,fl.current=r,q!==null)throw Error(w(261));return re=null,oe=0,te}function Gf(){for(;q!==null;)sc(q)}function Xf(){for(;q!==null&&!w0();)sc(q)}function sc(e){var t=fc(e.alternate,e,Ce);e.memoizedProps=e.pendingProps,t===null?ac(e):q=t,Fo.current=null}function ac(e){var t=e;do{var n=t.alternate;if(e=t.return,t.flags&32768){if(n=Bf(n,t),n!==null){n.flags&=32767,q=n;return}if(e!==null)e.flags|=32768,e.subtreeFlags=0,e.deletions=null;else{te=6,q=null;return}}else if(n=Af(n,t,Ce),n!==null){q=n;return}if(t=t.sibling,t!==null){q=t;return}q=t=e}while(t!==null);te===0&&(te=5)}function Ot(e,t,n){var r=F,l=Me.transition;try{Me.transition=null,F=1,Zf(e,t,n,r)}finally{Me.transition=l,F=r}return null}function Zf(e,t,n,r){do hn();while(yt!==null);if(D&6)throw Error(w(327));n=e.finishedWork;var l=e.finishedLanes;if(n===null)return null;if(e.finishedWork=null,e.finishedLanes=0,n===e.current)throw Error(w(177));e.callbackNode=null,e.callbackPriority=0;var i=n.lanes|n.childLanes;if(z0(e,i),e===re&&(q=re=null,oe=0),!(n.subtreeFlags&2064)&&!(n.flags&2064)||Mr||(Mr=!0,dc(Xr,function(){return hn(),null})),i=(n.flags&15990)!==0,n.subtreeFlags&15990||i){i=Me.transition,Me.transition=null;var o=F;F=1;var u=D;D|=4,Fo.current=null,Wf(e,n),rc(n,e),vf(Pi),Jr=!!ji,Pi=ji=null,e.current=n,Qf(n),x0(),D=u,F=o,Me.transition=i}else e.current=n;if(Mr&&(Mr=!1,yt=e,pl=l),i=e.pendingLanes,i===0&&(Et=null),C0(n.stateNode),ke(e,J()),t!==null)for(r=e.onRecoverableError,n=0;n<t.length;n++)l=t[n],r(l.value,{componentStack:l.stack,digest:l.digest});if(dl)throw dl=!1,e=Gi,Gi=null,e;return pl&1&&e.tag!==0&&hn(),i=e.pendingLanes,i&1?e===Xi?Qn++:(Qn=0,Xi=e):Qn=0,Tt(),null}function hn(){if(yt!==null){var e=Hs(pl),t=Me.transition,n=F;try{if(Me.transition=null,F=16>e?16:e,yt===null)var r=!1;else{if(e=yt,yt=null,pl=0,D&6)throw Error(w(331));var l=D;for(D|=4,N=e.current;N!==null;){var i=N,o=i.child;if(N.flags&16){var u=i.deletions;if(u!==null){for(var s=0;s<u.length;s++){var c=u[s];for(N=c;N!==null;){var g=N;switch(g.tag){case 0:case 11:case 15:Hn(8,g,i)}var m=g.child;if(m!==null)m.return=g,N=m;else for(;N!==null;){g=N;var h=g.sibling,x=g.return;if(ec(g),g===c){N=null;break}if(h!==null){h.return=x,N=h;break}N=x}}}var S=i.alternate;if(S!==null){var k=S.child;if(k!==null){S.child=null;do{var U=k.sibling;k.sibling=null,k=U}while(k!==null)}}N=i}}if(i.subtreeFlags&2064&&o!==null)o.return=i,N=o;else e:for(;N!==null;){if(i=N,i.flags&2048)switch(i.tag){case 0:case 11:case 15:Hn(9,i,i.return)}var f=i.sibling;if(f!==null){f.return=i.return,N=f;break e}N=i.return}}var a=e.current;for(N=a;N!==null;){o=N;var d=o.child;if(o.subtreeFlags&2064&&d!==null)d.return=o,N=d;else e:for(o=a;N!==null;){if(u=N,u.flags&2048)try{switch(u.tag){case 0:case 11:case 15:Nl(9,u)}}catch(C){X(u,u.return,C)}if(u===o){N=null;break e}var y=u.sibling;if(y!==null){y.return=u.return,N=y;break e}N=u.return}}if(D=l,Tt(),Ye&&typeof Ye.onPostCommitFiberRoot=="function")try{Ye.onPostCommitFiberRoot(gl,e)}catch{}r=!0}return r}finally{F=n,Me.transition=t}}return!1}function bu(e,t,n){t=xn(n,t),t=Ha(e,t,1),e=Ct(e,t,1),t=me(),e!==null&&(dr(e,1,t),ke(e,t))}function X(e,t,n){if(e.tag===3)bu(e,e,n);else for(;t!==null;){if(t.tag===3){bu(t,e,n);break}else if(t.tag===1){var r=t.stateNode;if(typeof t.type.getDerivedStateFromError=="function"||typeof r.componentDidCatch=="function"&&(Et===null||!Et.has(r))){e=xn(n,e),e=Wa(t,e,1),t=Ct(t,e,1),e=me(),t!==null&&(dr(t,1,e),ke(t,e));break}}t=t.return}}function Jf(e,t,n){var r=e.pingCache;r!==null&&r.delete(t),t=me(),e.pingedLanes|=e.suspendedLanes&n,re===e&&(oe&n)===n&&(te===4||te===3&&(oe&130023424)===oe&&500>J()-$o?$t(e,0):Uo|=n),ke(e,t)}function cc(e,t){t===0&&(e.mode&1?(t=kr,kr<<=1,!(kr&130023424)&&(kr=4194304)):t=1);var n=me();e=it(e,t),e!==null&&(dr(e,t,n),ke(e,n))}function qf(e){var t=e.memoizedState,n=0;t!==null&&(n=t.retryLane),cc(e,n)}function bf(e,t){var n=0;switch(e.tag){case 13:var r=e.stateNode,l=e.memoizedState;l!==null&&(n=l.retryLane);break;case 19:r=e.stateNode;break;default:throw Error(w(314))}r!==null&&r.delete(t),cc(e,n)}var fc;fc=function(e,t,n){if(e!==null)if(e.memoizedProps!==t.pendingProps||xe.current)we=!0;else{if(!(e.lanes&n)&&!(t.flags&128))return we=!1,Vf(e,t,n);we=!!(e.flags&131072)}else we=!1,W&&t.flags&1048576&&ma(t,ll,t.index);switch(t.lanes=0,t.tag){case 2:var r=t.type;Br(e,t),e=t.pendingProps;var l=vn(t,fe.current);pn(t,n),l=Mo(null,t,r,e,l,n);var i=Ro();return t.flags|=1,typeof l=="object"&&l!==null&&typeof l.render=="function"&&l.$$typeof===void 0?(t.tag=1,t.memoizedState=null,t.updateQueue=null,Se(r)?(i=!0,nl(t)):i=!1,t.memoizedState=l.state!==null&&l.state!==void 0?l.state:null,jo(t),l.updater=El,t.stateNode=l,l._reactInternals=t,Fi(t,r,e,n),t=Vi(null,t,r,!0,i,n)):(t.tag=0,W&&i&&xo(t),he(null,t,l,n),t=t.child),t;case 16:r=t.elementType;e:{switch(Br(e,t),e=t.pendingProps,l=r._init,r=l(r._payload),t.type=r,l=t.tag=td(r),e=Ie(r,e),l){case 0:t=$i(null,t,r,e,n);break e;case 1:t=Hu(null,t,r,e,n);break e;case 11:t=Au(null,t,r,e,n);break e;case 14:t=Bu(null,t,r,Ie(r.type,e),n);break e}throw Error(w(306,r,""))}return t;case 0:return r=t.type,l=t.pendingProps,l=t.elementType===r?l:Ie(r,l),$i(e,t,r,l,n);case 1:return r=t.type,l=t.pendingProps,l=t.elementType===r?l:Ie(r,l),Hu(e,t,r,l,n);case 3:e:{if(Ga(t),e===null)throw Error(w(387));r=t.pendingProps,i=t.memoizedState,l=i.element,Sa(e,t),ul(t,r,null,n);var o=t.memoizedState;if(r=o.element,i.isDehydrated)if(i={element:r,isDehydrated:!1,cache:o.cache,pendingSuspenseBoundaries:o.pendingSuspenseBoundaries,transitions:o.transitions},t.updateQueue.baseState=i,t.memoizedState=i,t.flags&256){l=xn(Error(w(423)),t),t=Wu(e,t,r,n,l);break e}else if(r!==l){l=xn(Error(w(424)),t),t=Wu(e,t,r,n,l);break e}else for(Ee=kt(t.stateNode.containerInfo.firstChild),Ne=t,W=!0,Ue=null,n=wa(t,null,r,n),t.child=n;n;)n.flags=n.flags&-3|4096,n=n.sibling;else{if(gn(),r===l){t=ot(e,t,n);break e}he(e,t,r,n)}t=t.child}return t;case 5:return ka(t),e===null&&Di(t),r=t.type,l=t.pendingProps,i=e!==null?e.memoizedProps:null,o=l.children,zi(r,l)?o=null:i!==null&&zi(r,i)&&(t.flags|=32),Ya(e,t),he(e,t,o,n),t.child;case 6:return e===null&&Di(t),null;case 13:return Xa(e,t,n);case 4:return Po(t,t.stateNode.containerInfo),r=t.pendingProps,e===null?t.child=yn(t,null,r,n):he(e,t,r,n),t.child;case 11:return r=t.type,l=t.pendingProps,l=t.elementType===r?l:Ie(r,l),Au(e,t,r,l,n);case 7:return he(e,t,t.pendingProps,n),t.child;case 8:return he(e,t,t.pendingProps.children,n),t.child;case 12:return he(e,t,t.pendingProps.children,n),t.child;case 10:e:{if(r=t.type._context,l=t.pendingProps,i=t.memoizedProps,o=l.value,$(il,r._currentValue),r._currentValue=o,i!==null)if(Ae(i.value,o)){if(i.children===l.children&&!xe.current){t=ot(e,t,n);break e}}else for(i=t.child,i!==null&&(i.return=t);i!==null;){var u=i.dependencies;if(u!==null){o=i.child;for(var s=u.firstContext;s!==null;){if(s.context===r){if(i.tag===1){s=nt(-1,n&-n),s.tag=2;var c=i.updateQueue;if(c!==null){c=c.shared;var g=c.pending;g===null?s.next=s:(s.next=g.next,g.next=s),c.pending=s}}i.lanes|=n,s=i.alternate,s!==null&&(s.lanes|=n),Oi(i.return,n,t),u.lanes|=n;break}s=s.next}}else if(i.tag===10)o=i.type===t.type?null:i.child;else if(i.tag===18){if(o=i.return,o===null)throw Error(w(341));o.lanes|=n,u=o.alternate,u!==null&&(u.lanes|=n),Oi(o,n,t),o=i.sibling}else o=i.child;if(o!==null)o.return=i;else for(o=i;o!==null;){if(o===t){o=null;break}if(i=o.sibling,i!==null){i.return=o.return,o=i;break}o=o.return}i=o}he(e,t,l.children,n),t=t.child}return t;case 9:return l=t.type,r=t.pendingProps.children,pn(t,n),l=Re(l),r=r(l),t.flags|=1,he(e,t,r,n),t.child;case 14:return r=t.type,l=Ie(r,t.pendingProps),l=Ie(r.type,l),Bu(e,t,r,l,n);case 15:return Qa(e,t,t.type,t.pendingProps,n);case 17:return r=t.type,l=t.pendingProps,l=t.elementType===r?l:Ie(r,l),Br(e,t),t.tag=1,Se(r)?(e=!0,nl(t)):e=!1,pn(t,n),Ba(t,r,l),Fi(t,r,l,n),Vi(null,t,r,!0,e,n);case 19:return Za(e,t,n);case 22:return Ka(e,t,n)}throw Error(w(156,t.tag))};function dc(e,t){return $s(e,t)}function ed(e,t,n,r){this.tag=e,this.key=n,this.sibling=this.child=this.return=this.stateNode=this.type=this.elementType=null,this.index=0,this.ref=null,this.pendingProps=t,this.dependencies=this.memoizedState=this.updateQueue=this.memoizedProps=null,this.mode=r,this.subtreeFlags=this.flags=0,this.deletions=null,this.childLanes=this.lanes=0,this.alternate=null}function Te(e,t,n,r){return new ed(e,t,n,r)}function Ho(e){return e=e.prototype,!(!e||!e.isReactComponent)}function td(e){if(typeof e=="function")return Ho(e)?1:0;if(e!=null){if(e=e.$$typeof,e===uo)return 11;if(e===so)return 14}return 2}function _t(e,t){var n=e.alternate;return n===null?(n=Te(e.tag,t,e.key,e.mode),n.elementType=e.elementType,n.type=e.type,n.stateNode=e.stateNode,n.alternate=e,e.alternate=n):(n.pendingProps=t,n.type=e.type,n.flags=0,n.subtreeFlags=0,n.deletions=null),n.flags=e.flags&14680064,n.childLanes=e.childLanes,n.lanes=e.lanes,n.child=e.child,n.memoizedProps=e.memoizedProps,n.memoizedState=e.memoizedState,n.updateQueue=e.updateQueue,t=e.dependencies,n.dependencies=t===null?null:{lanes:t.lanes,firstContext:t.firstContext},n.sibling=e.sibling,n.index=e.index,n.ref=e.ref,n}function Qr(e,t,n,r,l,i){var o=2;if(r=e,typeof e=="function")Ho(e)&&(o=1);else if(typeof e=="string")o=5;else e:switch(e){case Jt:return Vt(n.children,l,i,t);case oo:o=8,l|=8;break;case ui:return e=Te(12,n,t,l|2),e.elementType=ui,e.lanes=i,e;case si:return e=Te(13,n,t,l),e.elementType=si,e.lanes=i,e;case ai:return e=Te(19,n,t,l),e.elementType=ai,e.lanes=i,e;case ks:return jl(n,l,i,t);default:if(typeof e=="object"&&e!==null)switch(e.$$typeof){case xs:o=10;break e;case Ss:o=9;break e;case uo:o=11;break e;case so:o=14;break e;case pt:o=16,r=null;break e}throw Error(w(130,e==null?e:typeof e,""))}return t=Te(o,n,t,l),t.elementType=e,t.type=r,t.lanes=i,t}function Vt(e,t,n,r){return e=Te(7,e,r,t),e.lanes=n,e}function jl(e,t,n,r){return e=Te(22,e,r,t),e.elementType=ks,e.lanes=n,e.stateNode={isHidden:!1},e}function li(e,t,n){return e=Te(6,e,null,t),e.lanes=n,e}function ii(e,t,n){return t=Te(4,e.children!==null?e.children:[],e.key,t),t.lanes=n,t.stateNode={containerInfo:e.containerInfo,pendingChildren:null,implementation:e.implementation},t}function nd(e,t,n,r,l){this.tag=t,this.containerInfo=e,this.finishedWork=this.pingCache=this.current=this.pendingChildren=null,this.timeoutHandle=-1,this.callbackNode=this.pendingContext=this.context=null,this.callbackPriority=0,this.eventTimes=$l(0),this.expirationTimes=$l(-1),this.entangledLanes=this.finishedLanes=this.mutableReadLanes=this.expiredLanes=this.pingedLanes=this.suspendedLanes=this.pendingLanes=0,this.entanglements=$l(0),this.identifierPrefix=r,this.onRecoverableError=l,this.mutableSourceEagerHydrationData=null}function Wo(e,t,n,r,l,i,o,u,s){return e=new nd(e,t,n,u,s),t===1?(t=1,i===!0&&(t|=8)):t=0,i=Te(3,null,null,t),e.current=i,i.stateNode=e,i.memoizedState={element:r,isDehydrated:n,cache:null,transitions:null,pendingSuspenseBoundaries:null},jo(i),e}function rd(e,t,n){var r=3<arguments.length&&arguments[3]!==void 0?arguments[3]:null;return{$$typeof:Zt,key:r==null?null:""+r,children:e,containerInfo:t,implementation:n}}function pc(e){if(!e)return Pt;e=e._reactInternals;e:{if(Yt(e)!==e||e.tag!==1)throw Error(w(170));var t=e;do{switch(t.tag){case 3:t=t.stateNode.context;break e;case 1:if(Se(t.type)){t=t.stateNode.__reactInternalMemoizedMergedChildContext;break e}}t=t.return}while(t!==null);throw Error(w(171))}if(e.tag===1){var n=e.type;if(Se(n))return pa(e,n,t)}return t}function hc(e,t,n,r,l,i,o,u,s){return e=Wo(n,r,!0,e,l,i,o,u,s),e.context=pc(null),n=e.current,r=me(),l=Nt(n),i=nt(r,l),i.callback=t??null,Ct(n,i,l),e.current.lanes=l,dr(e,l,r),ke(e,r),e}function Pl(e,t,n,r){var l=t.current,i=me(),o=Nt(l);return n=pc(n),t.context===null?t.context=n:t.pendingContext=n,t=nt(i,o),t.payload={element:e},r=r===void 0?null:r,r!==null&&(t.callback=r),e=Ct(l,t,o),e!==null&&(Ve(e,l,o,i),$r(e,l,o)),o}function ml(e){if(e=e.current,!e.child)return null;switch(e.child.tag){case 5:return e.child.stateNode;default:return e.child.stateNode}}function es(e,t){if(e=e.memoizedState,e!==null&&e.dehydrated!==null){var n=e.retryLane;e.retryLane=n!==0&&n<t?n:t}}function Qo(e,t){es(e,t),(e=e.alternate)&&es(e,t)}function ld(){return null}var mc=typeof reportError=="function"?reportError:function(e){console.error(e)};function Ko(e){this._internalRoot=e}zl.prototype.render=Ko.prototype.render=function(e){var t=this._internalRoot;if(t===null)throw Error(w(409));Pl(e,t,null,null)};zl.prototype.unmount=Ko.prototype.unmount=function(){var e=this._internalRoot;if(e!==null){this._internalRoot=null;var t=e.containerInfo;Qt(function(){Pl(null,e,null,null)}),t[lt]=null}};function zl(e){this._internalRoot=e}zl.prototype.unstable_scheduleHydration=function(e){if(e){var t=Ks();e={blockedOn:null,target:e,priority:t};for(var n=0;n<mt.length&&t!==0&&t<mt[n].priority;n++);mt.splice(n,0,e),n===0&&Gs(e)}};function Yo(e){return!(!e||e.nodeType!==1&&e.nodeType!==9&&e.nodeType!==11)}function Ll(e){return!(!e||e.nodeType!==1&&e.nodeType!==9&&e.nodeType!==11&&(e.nodeType!==8||e.nodeValue!==" react-mount-point-unstable "))}function ts(){}function id(e,t,n,r,l){if(l){if(typeof r=="function"){var i=r;r=function(){var c=ml(o);i.call(c)}}var o=hc(t,r,e,0,null,!1,!1,"",ts);return e._reactRootContainer=o,e[lt]=o.current,nr(e.nodeType===8?e.parentNode:e),Qt(),o}for(;l=e.lastChild;)e.removeChild(l);if(typeof r=="function"){var u=r;r=function(){var c=ml(s);u.call(c)}}var s=Wo(e,0,!1,null,null,!1,!1,"",ts);return e._reactRootContainer=s,e[lt]=s.current,nr(e.nodeType===8?e.parentNode:e),Qt(function(){Pl(t,s,n,r)}),s}function Tl(e,t,n,r,l){var i=n._reactRootContainer;if(i){var o=i;if(typeof l=="function"){var u=l;l=function(){var s=ml(o);u.call(s)}}Pl(t,o,e,l)}else o=id(n,t,e,l,r);return ml(o)}Ws=function(e){switch(e.tag){case 3:var t=e.stateNode;if(t.current.memoizedState.isDehydrated){var n=On(t.pendingLanes);n!==0&&(fo(t,n|1),ke(t,J()),!(D&6)&&(Sn=J()+500,Tt()))}break;case 13:Qt(function(){var r=it(e,1);if(r!==null){var l=me();Ve(r,e,1,l)}}),Qo(e,1)}};po=function(e){if(e.tag===13){var t=it(e,134217728);if(t!==null){var n=me();Ve(t,e,134217728,n)}Qo(e,134217728)}};Qs=function(e){if(e.tag===13){var t=Nt(e),n=it(e,t);if(n!==null){var r=me();Ve(n,e,t,r)}Qo(e,t)}};Ks=function(){return F};Ys=function(e,t){var n=F;try{return F=e,t()}finally{F=n}};wi=function(e,t,n){switch(t){case"input":if(di(e,n),t=n.name,n.type==="radio"&&t!=null){for(n=e;n.parentNode;)n=n.parentNode;for(n=n.querySelectorAll("input[name="+JSON.stringify(""+t)+'][type="radio"]'),t=0;t<n.length;t++){var r=n[t];if(r!==e&&r.form===e.form){var l=Sl(r);if(!l)throw Error(w(90));Es(r),di(r,l)}}}break;case"textarea":_s(e,n);break;case"select":t=n.value,t!=null&&an(e,!!n.multiple,t,!1)}};Rs=Vo;Ds=Qt;var od={usingClientEntryPoint:!1,Events:[hr,tn,Sl,Ts,Ms,Vo]},Mn={findFiberByHostInstance:It,bundleType:0,version:"18.3.1",rendererPackageName:"react-dom"},ud={bundleType:Mn.bundleType,version:Mn.version,rendererPackageName:Mn.rendererPackageName,rendererConfig:Mn.rendererConfig,overrideHookState:null,overrideHookStateDeletePath:null,overrideHookStateRenamePath:null,overrideProps:null,overridePropsDeletePath:null,overridePropsRenamePath:null,setErrorHandler:null,setSuspenseHandler:null,scheduleUpdate:null,currentDispatcherRef:ut.ReactCurrentDispatcher,findHostInstanceByFiber:function(e){return e=Fs(e),e===null?null:e.stateNode},findFiberByHostInstance:Mn.findFiberByHostInstance||ld,findHostInstancesForRefresh:null,scheduleRefresh:null,scheduleRoot:null,setRefreshHandler:null,getCurrentFiber:null,reconcilerVersion:"18.3.1-next-f1338f8080-20240426"};if(typeof __REACT_DEVTOOLS_GLOBAL_HOOK__<"u"){var Rr=__REACT_DEVTOOLS_GLOBAL_HOOK__;if(!Rr.isDisabled&&Rr.supportsFiber)try{gl=Rr.inject(ud),Ye=Rr}catch{}}je.__SECRET_INTERNALS_DO_NOT_USE_OR_YOU_WILL_BE_FIRED=od;je.createPortal=function(e,t){var n=2<arguments.length&&arguments[2]!==void 0?arguments[2]:null;if(!Yo(t))throw Error(w(200));return rd(e,t,null,n)};je.createRoot=function(e,t){if(!Yo(e))throw Error(w(299));var n=!1,r="",l=mc;return t!=null&&(t.unstable_strictMode===!0&&(n=!0),t.identifierPrefix!==void 0&&(r=t.identifierPrefix),t.onRecoverableError!==void 0&&(l=t.onRecoverableError)),t=Wo(e,1,!1,null,null,n,!1,r,l),e[lt]=t.current,nr(e.nodeType===8?e.parentNode:e),new Ko(t)};je.findDOMNode=function(e){if(e==null)return null;if(e.nodeType===1)return e;var t=e._reactInternals;if(t===void 0)throw typeof e.render=="function"?Error(w(188)):(e=Object.keys(e).join(","),Error(w(268,e)));return e=Fs(t),e=e===null?null:e.stateNode,e};je.flushSync=function(e){return Qt(e)};je.hydrate=function(e,t,n){if(!Ll(t))throw Error(w(200));return Tl(null,e,t,!0,n)};je.hydrateRoot=function(e,t,n){if(!Yo(e))throw Error(w(405));var r=n!=null&&n.hydratedSources||null,l=!1,i="",o=mc;if(n!=null&&(n.unstable_strictMode===!0&&(l=!0),n.identifierPrefix!==void 0&&(i=n.identifierPrefix),n.onRecoverableError!==void 0&&(o=n.onRecoverableError)),t=hc(t,null,e,1,n??null,l,!1,i,o),e[lt]=t.current,nr(e),r)for(e=0;e<r.length;e++)n=r[e],l=n._getVersion,l=l(n._source),t.mutableSourceEagerHydrationData==null?t.mutableSourceEagerHydrationData=[n,l]:t.mutableSourceEagerHydrationData.push(n,l);return new zl(t)};je.render=function(e,t,n){if(!Ll(t))throw Error(w(200));return Tl(null,e,t,!1,n)};je.unmountComponentAtNode=function(e){if(!Ll(e))throw Error(w(40));return e._reactRootContainer?(Qt(function(){Tl(null,null,e,!1,function(){e._reactRootContainer=null,e[lt]=null})}),!0):!1};je.unstable_batchedUpdates=Vo;je.unstable_renderSubtreeIntoContainer=function(e,t,n,r){if(!Ll(n))throw Error(w(200));if(e==null||e._reactInternals===void 0)throw Error(w(38));return Tl(e,t,n,!1,r)};je.version="18.3.1-next-f1338f8080-20240426";function vc(){if(!(typeof __REACT_DEVTOOLS_GLOBAL_HOOK__>"u"||typeof __REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE!="function"))try{__REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE(vc)}catch(e){console.error(e)}}vc(),vs.exports=je;var sd=vs.exports,gc,ns=sd;gc=ns.createRoot,ns.hydrateRoot;const yc="data:image/svg+xml,%3c?xml%20version='1.0'%20encoding='utf-8'?%3e%3csvg%20fill='%23000000'%20width='800px'%20height='800px'%20viewBox='0%200%2024%2024'%20role='img'%20xmlns='http://www.w3.org/2000/svg'%3e%3ctitle%3eOpenAI%20icon%3c/title%3e%3cpath%20d='M22.2819%209.8211a5.9847%205.9847%200%200%200-.5157-4.9108%206.0462%206.0462%200%200%200-6.5098-2.9A6.0651%206.0651%200%200%200%204.9807%204.1818a5.9847%205.9847%200%200%200-3.9977%202.9%206.0462%206.0462%200%200%200%20.7427%207.0966%205.98%205.98%200%200%200%20.511%204.9107%206.051%206.051%200%200%200%206.5146%202.9001A5.9847%205.9847%200%200%200%2013.2599%2024a6.0557%206.0557%200%200%200%205.7718-4.2058%205.9894%205.9894%200%200%200%203.9977-2.9001%206.0557%206.0557%200%200%200-.7475-7.0729zm-9.022%2012.6081a4.4755%204.4755%200%200%201-2.8764-1.0408l.1419-.0804%204.7783-2.7582a.7948.7948%200%200%200%20.3927-.6813v-6.7369l2.02%201.1686a.071.071%200%200%201%20.038.052v5.5826a4.504%204.504%200%200%201-4.4945%204.4944zm-9.6607-4.1254a4.4708%204.4708%200%200%201-.5346-3.0137l.142.0852%204.783%202.7582a.7712.7712%200%200%200%20.7806%200l5.8428-3.3685v2.3324a.0804.0804%200%200%201-.0332.0615L9.74%2019.9502a4.4992%204.4992%200%200%201-6.1408-1.6464zM2.3408%207.8956a4.485%204.485%200%200%201%202.3655-1.9728V11.6a.7664.7664%200%200%200%20.3879.6765l5.8144%203.3543-2.0201%201.1685a.0757.0757%200%200%201-.071%200l-4.8303-2.7865A4.504%204.504%200%200%201%202.3408%207.872zm16.5963%203.8558L13.1038%208.364%2015.1192%207.2a.0757.0757%200%200%201%20.071%200l4.8303%202.7913a4.4944%204.4944%200%200%201-.6765%208.1042v-5.6772a.79.79%200%200%200-.407-.667zm2.0107-3.0231l-.142-.0852-4.7735-2.7818a.7759.7759%200%200%200-.7854%200L9.409%209.2297V6.8974a.0662.0662%200%200%201%20.0284-.0615l4.8303-2.7866a4.4992%204.4992%200%200%201%206.6802%204.66zM8.3065%2012.863l-2.02-1.1638a.0804.0804%200%200%201-.038-.0567V6.0742a4.4992%204.4992%200%200%201%207.3757-3.4537l-.142.0805L8.704%205.459a.7948.7948%200%200%200-.3927.6813zm1.0976-2.3654l2.602-1.4998%202.6069%201.4998v2.9994l-2.5974%201.4997-2.6067-1.4997Z",wc="data:image/svg+xml,%3csvg%20width='256px'%20height='176px'%20viewBox='0%200%20256%20176'%20version='1.1'%20xmlns='http://www.w3.org/2000/svg'%20preserveAspectRatio='xMidYMid'%3e%3ctitle%3eAnthropic%3c/title%3e%3cg%20fill='%23181818'%3e%3cpath%20d='M147.486878,0%20C147.486878,0%20217.568251,175.780074%20217.568251,175.780074%20C217.568251,175.780074%20256,175.780074%20256,175.780074%20C256,175.780074%20185.918621,0%20185.918621,0%20C185.918621,0%20147.486878,0%20147.486878,0%20C147.486878,0%20147.486878,0%20147.486878,0%20Z'/%3e%3cpath%20d='M66.1828124,106.221191%20C66.1828124,106.221191%2090.1624677,44.4471185%2090.1624677,44.4471185%20C90.1624677,44.4471185%20114.142128,106.221191%20114.142128,106.221191%20C114.142128,106.221191%2066.1828124,106.221191%2066.1828124,106.221191%20C66.1828124,106.221191%2066.1828124,106.221191%2066.1828124,106.221191%20Z%20M70.0705318,0%20C70.0705318,0%200,175.780074%200,175.780074%20C0,175.780074%2039.179211,175.780074%2039.179211,175.780074%20C39.179211,175.780074%2053.5097704,138.86606%2053.5097704,138.86606%20C53.5097704,138.86606%20126.817544,138.86606%20126.817544,138.86606%20C126.817544,138.86606%20141.145724,175.780074%20141.145724,175.780074%20C141.145724,175.780074%20180.324935,175.780074%20180.324935,175.780074%20C180.324935,175.780074%20110.254409,0%20110.254409,0%20C110.254409,0%2070.0705318,0%2070.0705318,0%20C70.0705318,0%2070.0705318,0%2070.0705318,0%20Z'/%3e%3c/g%3e%3c/svg%3e",xc="/static/assets/google-gemini-logo-Boy8wUYg.svg",ad="data:image/svg+xml,%3csvg%20viewBox='0%200%20128%20128'%20xmlns='http://www.w3.org/2000/svg'%20aria-label='Azure'%3e%3cdefs%3e%3clinearGradient%20id='a'%20x1='0'%20y1='0'%20x2='1'%20y2='1'%3e%3cstop%20stop-color='%23114A8B'/%3e%3cstop%20offset='1'%20stop-color='%230669BC'/%3e%3c/linearGradient%3e%3c/defs%3e%3cpath%20fill='url(%23a)'%20d='M20%20110L55%2010h38L50%20118a6%206%200%200%201-5%204H20z'/%3e%3cpath%20fill='%230078d4'%20d='M92%2078H48l34%2032h28z'/%3e%3c/svg%3e",cd="data:image/svg+xml,%3c?xml%20version='1.0'%20encoding='utf-8'?%3e%3csvg%20fill='%23000000'%20width='800px'%20height='800px'%20viewBox='0%200%2024%2024'%20role='img'%20xmlns='http://www.w3.org/2000/svg'%3e%3ctitle%3eOpenRouter%3c/title%3e%3cpath%20d='M3%2020l9-16%209%2016H3zm9-4a2%202%200%201%200%200-4%202%202%200%200%200%200%204z'/%3e%3c/svg%3e",fd="data:image/svg+xml,%3csvg%20viewBox='0%200%2024%2024'%20xmlns='http://www.w3.org/2000/svg'%20aria-label='LiteLLM'%3e%3cg%20fill='none'%20stroke='currentColor'%20stroke-width='1.6'%20stroke-linecap='round'%20stroke-linejoin='round'%3e%3crect%20x='3'%20y='3'%20width='18'%20height='18'%20rx='3'/%3e%3cpath%20d='M7%2017V7h4M7%2017h10'/%3e%3c/g%3e%3c/svg%3e",Sc="data:image/svg+xml,%3csvg%20fill='currentColor'%20fill-rule='evenodd'%20height='1em'%20style='flex:none;line-height:1'%20viewBox='0%200%2024%2024'%20width='1em'%20xmlns='http://www.w3.org/2000/svg'%3e%3ctitle%3eCohere%3c/title%3e%3cpath%20clip-rule='evenodd'%20d='M8.128%2014.099c.592%200%201.77-.033%203.398-.703%201.897-.781%205.672-2.2%208.395-3.656%201.905-1.018%202.74-2.366%202.74-4.18A4.56%204.56%200%200018.1%201H7.549A6.55%206.55%200%20001%207.55c0%203.617%202.745%206.549%207.128%206.549z'%3e%3c/path%3e%3cpath%20clip-rule='evenodd'%20d='M9.912%2018.61a4.387%204.387%200%20012.705-4.052l3.323-1.38c3.361-1.394%207.06%201.076%207.06%204.715a5.104%205.104%200%2001-5.105%205.104l-3.597-.001a4.386%204.386%200%2001-4.386-4.387z'%3e%3c/path%3e%3cpath%20d='M4.776%2014.962A3.775%203.775%200%20001%2018.738v.489a3.776%203.776%200%20007.551%200v-.49a3.775%203.775%200%2000-3.775-3.775z'%3e%3c/path%3e%3c/svg%3e",kc="data:image/svg+xml,%3csvg%20fill='currentColor'%20fill-rule='evenodd'%20height='1em'%20style='flex:none;line-height:1'%20viewBox='0%200%2024%2024'%20width='1em'%20xmlns='http://www.w3.org/2000/svg'%3e%3ctitle%3eMistral%3c/title%3e%3cpath%20clip-rule='evenodd'%20d='M3.428%203.4h3.429v3.428h3.429v3.429h-.002%203.431V6.828h3.427V3.4h3.43v13.714H24v3.429H13.714v-3.428h-3.428v-3.429h-3.43v3.428h3.43v3.429H0v-3.429h3.428V3.4zm10.286%2013.715h3.428v-3.429h-3.427v3.429z'%3e%3c/path%3e%3c/svg%3e",Cc="data:image/svg+xml,%3csvg%20fill='currentColor'%20fill-rule='evenodd'%20height='1em'%20style='flex:none;line-height:1'%20viewBox='0%200%2024%2024'%20width='1em'%20xmlns='http://www.w3.org/2000/svg'%3e%3ctitle%3eQwen%3c/title%3e%3cpath%20d='M12.604%201.34c.393.69.784%201.382%201.174%202.075a.18.18%200%2000.157.091h5.552c.174%200%20.322.11.446.327l1.454%202.57c.19.337.24.478.024.837-.26.43-.513.864-.76%201.3l-.367.658c-.106.196-.223.28-.04.512l2.652%204.637c.172.301.111.494-.043.77-.437.785-.882%201.564-1.335%202.34-.159.272-.352.375-.68.37-.777-.016-1.552-.01-2.327.016a.099.099%200%2000-.081.05%20575.097%20575.097%200%2001-2.705%204.74c-.169.293-.38.363-.725.364-.997.003-2.002.004-3.017.002a.537.537%200%2001-.465-.271l-1.335-2.323a.09.09%200%2000-.083-.049H4.982c-.285.03-.553-.001-.805-.092l-1.603-2.77a.543.543%200%2001-.002-.54l1.207-2.12a.198.198%200%20000-.197%20550.951%20550.951%200%2001-1.875-3.272l-.79-1.395c-.16-.31-.173-.496.095-.965.465-.813.927-1.625%201.387-2.436.132-.234.304-.334.584-.335a338.3%20338.3%200%20012.589-.001.124.124%200%2000.107-.063l2.806-4.895a.488.488%200%2001.422-.246c.524-.001%201.053%200%201.583-.006L11.704%201c.341-.003.724.032.9.34zm-3.432.403a.06.06%200%2000-.052.03L6.254%206.788a.157.157%200%2001-.135.078H3.253c-.056%200-.07.025-.041.074l5.81%2010.156c.025.042.013.062-.034.063l-2.795.015a.218.218%200%2000-.2.116l-1.32%202.31c-.044.078-.021.118.068.118l5.716.008c.046%200%20.08.02.104.061l1.403%202.454c.046.081.092.082.139%200l5.006-8.76.783-1.382a.055.055%200%2001.096%200l1.424%202.53a.122.122%200%2000.107.062l2.763-.02a.04.04%200%2000.035-.02.041.041%200%20000-.04l-2.9-5.086a.108.108%200%20010-.113l.293-.507%201.12-1.977c.024-.041.012-.062-.035-.062H9.2c-.059%200-.073-.026-.043-.077l1.434-2.505a.107.107%200%20000-.114L9.225%201.774a.06.06%200%2000-.053-.031zm6.29%208.02c.046%200%20.058.02.034.06l-.832%201.465-2.613%204.585a.056.056%200%2001-.05.029.058.058%200%2001-.05-.029L8.498%209.841c-.02-.034-.01-.052.028-.054l.216-.012%206.722-.012z'%3e%3c/path%3e%3c/svg%3e",Ec="data:image/svg+xml,%3csvg%20fill='currentColor'%20fill-rule='evenodd'%20height='1em'%20style='flex:none;line-height:1'%20viewBox='0%200%2024%2024'%20width='1em'%20xmlns='http://www.w3.org/2000/svg'%3e%3ctitle%3eDeepSeek%3c/title%3e%3cpath%20d='M23.748%204.482c-.254-.124-.364.113-.512.234-.051.039-.094.09-.137.136-.372.397-.806.657-1.373.626-.829-.046-1.537.214-2.163.848-.133-.782-.575-1.248-1.247-1.548-.352-.156-.708-.311-.955-.65-.172-.241-.219-.51-.305-.774-.055-.16-.11-.323-.293-.35-.2.031-.278.136-.356.276-.313.572-.434%201.202-.422%201.84.027%201.436.633%202.58%201.838%203.393.137.093.172.187.129.323-.082.28-.18.552-.266.833-.055.179-.137.217-.329.14a5.526%205.526%200%2001-1.736-1.18c-.857-.828-1.631-1.742-2.597-2.458a11.365%2011.365%200%2000-.689-.471c-.985-.957.13-1.743.388-1.836.27-.098.093-.432-.779-.428-.872.004-1.67.295-2.687.684a3.055%203.055%200%2001-.465.137%209.597%209.597%200%2000-2.883-.102c-1.885.21-3.39%201.102-4.497%202.623C.082%208.606-.231%2010.684.152%2012.85c.403%202.284%201.569%204.175%203.36%205.653%201.858%201.533%203.997%202.284%206.438%202.14%201.482-.085%203.133-.284%204.994-1.86.47.234.962.327%201.78.397.63.059%201.236-.03%201.705-.128.735-.156.684-.837.419-.961-2.155-1.004-1.682-.595-2.113-.926%201.096-1.296%202.746-2.642%203.392-7.003.05-.347.007-.565%200-.845-.004-.17.035-.237.23-.256a4.173%204.173%200%20001.545-.475c1.396-.763%201.96-2.015%202.093-3.517.02-.23-.004-.467-.247-.588zM11.581%2018c-2.089-1.642-3.102-2.183-3.52-2.16-.392.024-.321.471-.235.763.09.288.207.486.371.739.114.167.192.416-.113.603-.673.416-1.842-.14-1.897-.167-1.361-.802-2.5-1.86-3.301-3.307-.774-1.393-1.224-2.887-1.298-4.482-.02-.386.093-.522.477-.592a4.696%204.696%200%20011.529-.039c2.132.312%203.946%201.265%205.468%202.774.868.86%201.525%201.887%202.202%202.891.72%201.066%201.494%202.082%202.48%202.914.348.292.625.514.891.677-.802.09-2.14.11-3.054-.614zm1-6.44a.306.306%200%2001.415-.287.302.302%200%2001.2.288.306.306%200%2001-.31.307.303.303%200%2001-.304-.308zm3.11%201.596c-.2.081-.399.151-.59.16a1.245%201.245%200%2001-.798-.254c-.274-.23-.47-.358-.552-.758a1.73%201.73%200%2001.016-.588c.07-.327-.008-.537-.239-.727-.187-.156-.426-.199-.688-.199a.559.559%200%2001-.254-.078c-.11-.054-.2-.19-.114-.358.028-.054.16-.186.192-.21.356-.202.767-.136%201.146.016.352.144.618.408%201.001.782.391.451.462.576.685.914.176.265.336.537.445.848.067.195-.019.354-.25.452z'%3e%3c/path%3e%3c/svg%3e",Nc="data:image/svg+xml,%3csvg%20fill='currentColor'%20fill-rule='evenodd'%20height='1em'%20style='flex:none;line-height:1'%20viewBox='0%200%2024%2024'%20width='1em'%20xmlns='http://www.w3.org/2000/svg'%3e%3ctitle%3eGroq%3c/title%3e%3cpath%20d='M12.036%202c-3.853-.035-7%203-7.036%206.781-.035%203.782%203.055%206.872%206.908%206.907h2.42v-2.566h-2.292c-2.407.028-4.38-1.866-4.408-4.23-.029-2.362%201.901-4.298%204.308-4.326h.1c2.407%200%204.358%201.915%204.365%204.278v6.305c0%202.342-1.944%204.25-4.323%204.279a4.375%204.375%200%2001-3.033-1.252l-1.851%201.818A7%207%200%200012.029%2022h.092c3.803-.056%206.858-3.083%206.879-6.816v-6.5C18.907%204.963%2015.817%202%2012.036%202z'%3e%3c/path%3e%3c/svg%3e",_c="data:image/svg+xml,%3csvg%20fill='currentColor'%20fill-rule='evenodd'%20height='1em'%20style='flex:none;line-height:1'%20viewBox='0%200%2024%2024'%20width='1em'%20xmlns='http://www.w3.org/2000/svg'%3e%3ctitle%3eFireworks%3c/title%3e%3cpath%20clip-rule='evenodd'%20d='M14.8%205l-2.801%206.795L9.195%205H7.397l3.072%207.428a1.64%201.64%200%20003.038.002L16.598%205H14.8zm1.196%2010.352l5.124-5.244-.699-1.669-5.596%205.739a1.664%201.664%200%2000-.343%201.807%201.642%201.642%200%20001.516%201.012L16%2017l8-.02-.699-1.669-7.303.041h-.002zM2.88%2010.104l.699-1.669%205.596%205.739c.468.479.603%201.189.343%201.807a1.643%201.643%200%2001-1.516%201.012l-8-.018-.002.002.699-1.669%207.303.042-5.122-5.246z'%3e%3c/path%3e%3c/svg%3e",jc="data:image/svg+xml,%3csvg%20fill='currentColor'%20fill-rule='evenodd'%20height='1em'%20style='flex:none;line-height:1'%20viewBox='0%200%2024%2024'%20width='1em'%20xmlns='http://www.w3.org/2000/svg'%3e%3ctitle%3ePerplexity%3c/title%3e%3cpath%20d='M19.785%200v7.272H22.5V17.62h-2.935V24l-7.037-6.194v6.145h-1.091v-6.152L4.392%2024v-6.465H1.5V7.188h2.884V0l7.053%206.494V.19h1.09v6.49L19.786%200zm-7.257%209.044v7.319l5.946%205.234V14.44l-5.946-5.397zm-1.099-.08l-5.946%205.398v7.235l5.946-5.234V8.965zm8.136%207.58h1.844V8.349H13.46l6.105%205.54v2.655zm-8.982-8.28H2.59v8.195h1.8v-2.576l6.192-5.62zM5.475%202.476v4.71h5.115l-5.115-4.71zm13.219%200l-5.115%204.71h5.115v-4.71z'%3e%3c/path%3e%3c/svg%3e",Pc="data:image/svg+xml,%3csvg%20fill='currentColor'%20fill-rule='evenodd'%20height='1em'%20style='flex:none;line-height:1'%20viewBox='0%200%2024%2024'%20width='1em'%20xmlns='http://www.w3.org/2000/svg'%3e%3ctitle%3etogether.ai%3c/title%3e%3cpath%20d='M17.385%2011.23a4.615%204.615%200%20100-9.23%204.615%204.615%200%20000%209.23zm0%2010.77a4.615%204.615%200%20100-9.23%204.615%204.615%200%20000%209.23zm-10.77%200a4.615%204.615%200%20100-9.23%204.615%204.615%200%20000%209.23z'%20opacity='.2'%3e%3c/path%3e%3ccircle%20cx='6.615'%20cy='6.615'%20r='4.615'%3e%3c/circle%3e%3c/svg%3e",zc="data:image/svg+xml,%3csvg%20fill='currentColor'%20fill-rule='evenodd'%20height='1em'%20style='flex:none;line-height:1'%20viewBox='0%200%2024%2024'%20width='1em'%20xmlns='http://www.w3.org/2000/svg'%3e%3ctitle%3eBedrock%3c/title%3e%3cpath%20d='M13.05%2015.513h3.08c.214%200%20.389.177.389.394v1.82a1.704%201.704%200%20011.296%201.661c0%20.943-.755%201.708-1.685%201.708-.931%200-1.686-.765-1.686-1.708%200-.807.554-1.484%201.297-1.662v-1.425h-2.69v4.663a.395.395%200%2001-.188.338l-2.69%201.641a.385.385%200%2001-.405-.002l-4.926-3.086a.395.395%200%2001-.185-.336V16.3L2.196%2014.87A.395.395%200%20012%2014.555L2%2014.528V9.406c0-.14.073-.27.192-.34l2.465-1.462V4.448c0-.129.062-.249.165-.322l.021-.014L9.77%201.058a.385.385%200%2001.407%200l2.69%201.675a.395.395%200%2001.185.336V7.6h3.856V5.683a1.704%201.704%200%2001-1.296-1.662c0-.943.755-1.708%201.685-1.708.931%200%201.685.765%201.685%201.708%200%20.807-.553%201.484-1.296%201.662v2.311a.391.391%200%2001-.389.394h-4.245v1.806h6.624a1.69%201.69%200%20011.64-1.313c.93%200%201.685.764%201.685%201.707%200%20.943-.754%201.708-1.685%201.708a1.69%201.69%200%2001-1.64-1.314H13.05v1.937h4.953l.915%201.18a1.66%201.66%200%2001.84-.227c.931%200%201.685.764%201.685%201.707%200%20.943-.754%201.708-1.685%201.708-.93%200-1.685-.765-1.685-1.708%200-.346.102-.668.276-.937l-.724-.935H13.05v1.806zM9.973%201.856L7.93%203.122V6.09h-.778V3.604L5.435%204.669v2.945l2.11%201.36L9.712%207.61V5.334h.778V7.83c0%20.136-.07.263-.184.335L7.963%209.638v2.081l1.422%201.009-.446.646-1.406-.998-1.53%201.005-.423-.66%201.605-1.055v-1.99L5.038%208.29l-2.26%201.34v1.676l1.972-1.189.398.677-2.37%201.429V14.3l2.166%201.258%202.27-1.368.397.677-2.176%201.311V19.3l1.876%201.175%202.365-1.426.398.678-2.017%201.216%201.918%201.201%202.298-1.403v-5.78l-4.758%202.893-.4-.675%205.158-3.136V3.289L9.972%201.856zM16.13%2018.47a.913.913%200%2000-.908.92c0%20.507.406.918.908.918a.913.913%200%2000.907-.919.913.913%200%2000-.907-.92zm3.63-3.81a.913.913%200%2000-.908.92c0%20.508.406.92.907.92a.913.913%200%2000.908-.92.913.913%200%2000-.908-.92zm1.555-4.99a.913.913%200%2000-.908.92c0%20.507.407.918.908.918a.913.913%200%2000.907-.919.913.913%200%2000-.907-.92zM17.296%203.1a.913.913%200%2000-.907.92c0%20.508.406.92.907.92a.913.913%200%2000.908-.92.913.913%200%2000-.908-.92z'%3e%3c/path%3e%3c/svg%3e",Lc="/static/assets/huggingface-CLEMSkp0.svg",dd="data:image/svg+xml,%3csvg%20fill='currentColor'%20fill-rule='evenodd'%20height='1em'%20style='flex:none;line-height:1'%20viewBox='0%200%2024%2024'%20width='1em'%20xmlns='http://www.w3.org/2000/svg'%3e%3ctitle%3eAWS%3c/title%3e%3cpath%20d='M6.763%2011.212c0%20.296.032.535.088.71.064.176.144.368.256.576.04.063.056.127.056.183%200%20.08-.048.16-.152.24l-.503.335a.383.383%200%2001-.208.072c-.08%200-.16-.04-.239-.112a2.47%202.47%200%2001-.287-.375%206.18%206.18%200%2001-.248-.471c-.622.734-1.405%201.101-2.347%201.101-.67%200-1.205-.191-1.596-.574-.39-.384-.59-.894-.59-1.533%200-.678.24-1.23.726-1.644.487-.415%201.133-.623%201.955-.623.272%200%20.551.024.846.064.296.04.6.104.918.176v-.583c0-.607-.127-1.03-.375-1.277-.255-.248-.686-.367-1.3-.367-.28%200-.568.031-.863.103-.295.072-.583.16-.862.272-.09.04-.184.075-.28.104a.488.488%200%2001-.127.023c-.112%200-.168-.08-.168-.247v-.391c0-.128.016-.224.056-.28a.597.597%200%2001.224-.167%204.577%204.577%200%20011.005-.36%204.84%204.84%200%20011.246-.151c.95%200%201.644.216%202.091.647.44.43.662%201.085.662%201.963v2.586h.016zm-3.24%201.214c.263%200%20.534-.048.822-.144a1.78%201.78%200%2000.758-.51%201.27%201.27%200%2000.272-.512c.047-.191.08-.423.08-.694v-.335a6.66%206.66%200%2000-.735-.136%206.02%206.02%200%2000-.75-.048c-.535%200-.926.104-1.19.32-.263.215-.39.518-.39.917%200%20.375.095.655.295.846.191.2.47.296.838.296zm6.41.862c-.144%200-.24-.024-.304-.08-.064-.048-.12-.16-.168-.311L7.586%206.726a1.398%201.398%200%2001-.072-.32c0-.128.064-.2.191-.2h.783c.151%200%20.255.025.31.08.065.048.113.16.16.312l1.342%205.284%201.245-5.284c.04-.16.088-.264.151-.312a.549.549%200%2001.32-.08h.638c.152%200%20.256.025.32.08.063.048.12.16.151.312l1.261%205.348%201.381-5.348c.048-.16.104-.264.16-.312a.52.52%200%2001.311-.08h.743c.127%200%20.2.065.2.2%200%20.04-.009.08-.017.128a1.137%201.137%200%2001-.056.2l-1.923%206.17c-.048.16-.104.263-.168.311a.51.51%200%2001-.303.08h-.687c-.15%200-.255-.024-.32-.08-.063-.056-.119-.16-.15-.32L12.32%207.747l-1.23%205.14c-.04.16-.087.264-.15.32-.065.056-.177.08-.32.08l-.686.001zm10.256.215c-.415%200-.83-.048-1.229-.143-.399-.096-.71-.2-.918-.32-.128-.071-.215-.151-.247-.223a.563.563%200%2001-.048-.224v-.407c0-.167.064-.247.183-.247.048%200%20.096.008.144.024.048.016.12.048.2.08.271.12.566.215.878.279.32.064.63.096.95.096.502%200%20.894-.088%201.165-.264a.86.86%200%2000.415-.758.777.777%200%2000-.215-.559c-.144-.151-.416-.287-.807-.415l-1.157-.36c-.583-.183-1.014-.454-1.277-.813a1.902%201.902%200%2001-.4-1.158c0-.335.073-.63.216-.886.144-.255.335-.479.575-.654.24-.184.51-.32.83-.415.32-.096.655-.136%201.006-.136.175%200%20.36.008.535.032.183.024.35.056.518.088.16.04.312.08.455.127.144.048.256.096.336.144a.69.69%200%2001.24.2.43.43%200%2001.071.263v.375c0%20.168-.064.256-.184.256a.83.83%200%2001-.303-.096%203.652%203.652%200%2000-1.532-.311c-.455%200-.815.071-1.062.223-.248.152-.375.383-.375.71%200%20.224.08.416.24.567.16.152.454.304.877.44l1.134.358c.574.184.99.44%201.237.767.247.327.367.702.367%201.117%200%20.343-.072.655-.207.926a2.157%202.157%200%2001-.583.703c-.248.2-.543.343-.886.447-.36.111-.734.167-1.142.167z'%3e%3c/path%3e%3cpath%20d='M.378%2015.475c3.384%201.963%207.56%203.153%2011.877%203.153%202.914%200%206.114-.607%209.06-1.852.44-.2.814.287.383.607-2.626%201.94-6.442%202.969-9.722%202.969-4.598%200-8.74-1.7-11.87-4.526-.247-.223-.024-.527.272-.351zm23.531-.2c.287.36-.08%202.826-1.485%204.007-.215.184-.423.088-.327-.151l.175-.439c.343-.88.802-2.198.52-2.555-.336-.43-2.22-.207-3.074-.103-.255.032-.295-.192-.063-.36%201.5-1.053%203.967-.75%204.254-.399z'%3e%3c/path%3e%3c/svg%3e";function Kn(e,t,n){return p.jsxs("svg",{width:t,height:t,viewBox:"0 0 24 24","aria-label":n,role:"img",children:[p.jsx("title",{children:n}),e]})}const Yn=({children:e})=>p.jsx("g",{fill:"none",stroke:"currentColor",strokeWidth:1.6,strokeLinecap:"round",strokeLinejoin:"round",children:e});function I(e,t,n){return p.jsx("img",{src:e,width:n,height:n,alt:t,title:t,style:{display:"inline-block"}})}function rs(e,t=16){const n=(e||"").toLowerCase();return n.includes("gpt")||n.includes("o4")||n.startsWith("openai")?I(yc,"GPT",t):n.includes("claude")?I(wc,"Claude",t):n.includes("gemini")?I(xc,"Gemini",t):n.includes("cohere")?I(Sc,"Cohere",t):n.includes("llama")?Kn(p.jsxs(Yn,{children:[p.jsx("path",{d:"M6 17c3 1 9 1 12 0"}),p.jsx("path",{d:"M8 17V9l2-2 2 2v8"}),p.jsx("path",{d:"M10 7l1-2 1 2"})]}),t,"Llama"):n.includes("mistral")||n.includes("mixtral")?I(kc,"Mistral",t):n.includes("qwen")?I(Cc,"Qwen",t):n.includes("deepseek")?I(Ec,"DeepSeek",t):n.includes("groq")?I(Nc,"Groq",t):n.includes("fireworks")?I(_c,"Fireworks",t):n.includes("perplexity")?I(jc,"Perplexity",t):n.includes("together")?I(Pc,"Together AI",t):n.includes("bedrock")||n.includes("aws")||n.includes("amazon")?I(zc,"Bedrock",t):n.includes("hugging")||n.includes("hf")?I(Lc,"Hugging Face",t):n.includes("phi")?Kn(p.jsxs(Yn,{children:[p.jsx("circle",{cx:"12",cy:"12",r:"7"}),p.jsx("path",{d:"M12 5v14M8 10h8"})]}),t,"Phi"):Kn(p.jsx(Yn,{children:p.jsx("circle",{cx:"12",cy:"12",r:"8"})}),t,"Model")}function pd(e,t=16){const n=(e||"").toLowerCase();return n.includes("openrouter")?I(cd,"OpenRouter",t):n.includes("litellm")?I(fd,"LiteLLM",t):n.includes("cohere")?I(Sc,"Cohere",t):n.includes("openai")?I(yc,"OpenAI",t):n.includes("anthropic")?I(wc,"Anthropic",t):n.includes("gemini")||n.includes("google")?I(xc,"Google",t):n.includes("azure")?I(ad,"Azure",t):n.includes("mistral")?I(kc,"Mistral",t):n.includes("qwen")||n.includes("alibaba")?I(Cc,"Qwen",t):n.includes("deepseek")?I(Ec,"DeepSeek",t):n.includes("groq")?I(Nc,"Groq",t):n.includes("fireworks")?I(_c,"Fireworks",t):n.includes("perplexity")?I(jc,"Perplexity",t):n.includes("together")?I(Pc,"Together AI",t):n.includes("bedrock")?I(zc,"Bedrock",t):n.includes("aws")||n.includes("amazon")?I(dd,"AWS",t):n.includes("hugging")||n.includes("huggingface")?I(Lc,"Hugging Face",t):n.includes("ollama")?Kn(p.jsxs(Yn,{children:[p.jsx("path",{d:"M7 14a3 3 0 0 1 6 0v3H7z"}),p.jsx("path",{d:"M13 14a3 3 0 1 1 3 3"})]}),t,"Ollama"):Kn(p.jsx(Yn,{children:p.jsx("rect",{x:"5",y:"5",width:"14",height:"14",rx:"3"})}),t,"Provider")}function hd(e){const t=e.split(/\r?\n/),n=[];let r=0;for(;r<t.length;){const i=t[r].match(/^```\s*([\w+-]*)\s*$/);if(i){const u=i[1]||"";r++;const s=[];for(;r<t.length&&!/^```\s*$/.test(t[r]);)s.push(t[r]),r++;r<t.length&&/^```\s*$/.test(t[r])&&r++,n.push({type:"code",lang:u,code:s.join(`
-`)});continue}const o=[];for(;r<t.length&&!/^```/.test(t[r]);)o.push(t[r]),r++;o.length&&n.push({type:"text",text:o.join(`
-`)})}return n}function md(e){const t=[];let n=0;const r=()=>`${n}-${Math.random().toString(36).slice(2,7)}`;for(;n<e.length;){const l=e[n];if(/^\s*---+\s*$/.test(l)){t.push(p.jsx("hr",{className:"border-white/10"},r())),n++;continue}const i=l.match(/^(#{1,3})\s+(.*)$/);if(i){const u=i[1].length,s=i[2];u===1?t.push(p.jsx("h2",{className:"mt-4",children:s},r())):u===2?t.push(p.jsx("h3",{className:"mt-3",children:s},r())):t.push(p.jsx("h4",{className:"mt-2",children:s},r())),n++;continue}if(/^\s*[-*]\s+/.test(l)){const u=[];for(;n<e.length&&/^\s*[-*]\s+/.test(e[n]);)u.push(e[n].replace(/^\s*[-*]\s+/,"")),n++;t.push(p.jsx("ul",{className:"list-disc pl-6 space-y-1",children:u.map((s,c)=>p.jsx("li",{children:s},c))},r()));continue}if(/^\s*\d+\.\s+/.test(l)){const u=[];for(;n<e.length&&/^\s*\d+\.\s+/.test(e[n]);)u.push(e[n].replace(/^\s*\d+\.\s+/,"")),n++;t.push(p.jsx("ol",{className:"list-decimal pl-6 space-y-1",children:u.map((s,c)=>p.jsx("li",{children:s},c))},r()));continue}if(l.includes("|")){const u=[],s=n;for(;n<e.length&&e[n].includes("|");)u.push(e[n]),n++;if(u.length>=2&&/\|/.test(u[0])&&/-/.test(u[1])){const c=h=>h.split("|").map(x=>x.trim()).filter((x,S,k)=>!(S===0&&h.trim().startsWith("|"))&&!(S===k.length-1&&h.trim().endsWith("|"))),g=c(u[0]),m=u.slice(2).map(c);t.push(p.jsx("div",{className:"overflow-x-auto",children:p.jsxs("table",{className:"w-full text-sm border-collapse",children:[p.jsx("thead",{children:p.jsx("tr",{children:g.map((h,x)=>p.jsx("th",{className:"text-left font-semibold px-3 py-2 border-b border-white/10",children:h},x))})}),p.jsx("tbody",{children:m.map((h,x)=>p.jsx("tr",{className:"odd:bg-white/5",children:h.map((S,k)=>p.jsx("td",{className:"px-3 py-2 align-top border-b border-white/5",children:S},k))},x))})]})},r()));continue}else n=s}const o=[];for(;n<e.length&&e[n].trim()!=="";)o.push(e[n]),n++;for(t.push(p.jsx("p",{className:"whitespace-pre-wrap leading-relaxed",children:o.join(`
-`)},r()));n<e.length&&e[n].trim()==="";)n++}return t}function vd({content:e,wrapDefault:t}){const n=O.useMemo(()=>e.replace(/\r/g,"").replace(/^\uFEFF/,""),[e]),r=O.useMemo(()=>hd(n),[n]);return p.jsx("div",{className:"prose prose-invert max-w-none",children:r.map((l,i)=>l.type==="text"?p.jsx("div",{children:md(l.text.split(`
-`))},i):p.jsx(gd,{lang:l.lang,code:l.code,defaultWrap:!!t},i))})}function gd({lang:e,code:t,defaultWrap:n}){const[r,l]=O.useState(!!n),i=async()=>{try{await navigator.clipboard.writeText(t)}catch{}};return p.jsxs("div",{className:"rounded-lg border border-white/10 overflow-hidden",children:[p.jsxs("div",{className:"flex items-center justify-between px-3 py-1.5 text-xs bg-slate-800/60 border-b border-white/10",children:[p.jsx("div",{className:"uppercase tracking-wide text-slate-300",children:e||"text"}),p.jsxs("div",{className:"flex items-center gap-2",children:[p.jsx("button",{className:"px-2 py-0.5 rounded bg-white/10 hover:bg-white/15",onClick:()=>l(o=>!o),children:r?"No wrap":"Wrap"}),p.jsx("button",{className:"px-2 py-0.5 rounded bg-white/10 hover:bg-white/15",onClick:i,children:"Copy"})]})]}),p.jsx("pre",{className:`text-sm p-3 ${r?"whitespace-pre-wrap break-words":"whitespace-pre overflow-x-auto"}`,children:p.jsx("code",{children:t})})]})}const ls={theme:"dark",density:"comfortable",fontScale:1,defaultReasoning:!1,codeWrapDefault:!1};function qi(){try{const e=localStorage.getItem("appSettings");if(e)return{...ls,...JSON.parse(e)}}catch{}return ls}function Tc(e){const t=document.body;t.classList.toggle("theme-light",e.theme==="light"),t.classList.toggle("theme-dark",e.theme==="dark"),t.classList.toggle("density-compact",e.density==="compact"),t.style.setProperty("--font-scale",String(e.fontScale))}function yd({open:e,onClose:t,onSave:n}){const[r,l]=O.useState(qi());return O.useEffect(()=>{e&&l(qi())},[e]),e?p.jsxs("div",{className:"fixed inset-0 z-50 flex items-center justify-center",children:[p.jsx("div",{className:"absolute inset-0 bg-black/60",onClick:t}),p.jsxs("div",{className:"relative w-full max-w-lg glass rounded-lg p-4",children:[p.jsxs("div",{className:"flex items-center justify-between mb-3",children:[p.jsx("h2",{className:"text-lg font-semibold",children:"Settings"}),p.jsx("button",{className:"px-2 py-1 rounded border border-white/10 hover:bg-white/10",onClick:t,children:"Close"})]}),p.jsxs("div",{className:"space-y-4 text-sm",children:[p.jsxs("div",{children:[p.jsx("label",{className:"block mb-1 text-slate-300",children:"Theme"}),p.jsxs("select",{className:"w-full bg-slate-800/60 border border-white/10 rounded px-2 py-1",value:r.theme,onChange:i=>l(o=>({...o,theme:i.target.value})),children:[p.jsx("option",{value:"dark",children:"Dark"}),p.jsx("option",{value:"light",children:"Light"})]})]}),p.jsxs("div",{children:[p.jsx("label",{className:"block mb-1 text-slate-300",children:"Density"}),p.jsxs("select",{className:"w-full bg-slate-800/60 border border-white/10 rounded px-2 py-1",value:r.density,onChange:i=>l(o=>({...o,density:i.target.value})),children:[p.jsx("option",{value:"comfortable",children:"Comfortable"}),p.jsx("option",{value:"compact",children:"Compact"})]})]}),p.jsxs("div",{children:[p.jsx("label",{className:"block mb-1 text-slate-300",children:"Font scale"}),p.jsx("input",{type:"range",min:.9,max:1.2,step:.05,value:r.fontScale,onChange:i=>l(o=>({...o,fontScale:Number(i.target.value)})),className:"w-full"})]}),p.jsxs("div",{className:"flex items-center gap-2",children:[p.jsx("input",{id:"def-reason",type:"checkbox",checked:r.defaultReasoning,onChange:i=>l(o=>({...o,defaultReasoning:i.target.checked}))}),p.jsx("label",{htmlFor:"def-reason",children:"Enable reasoning by default"})]}),p.jsxs("div",{className:"flex items-center gap-2",children:[p.jsx("input",{id:"code-wrap",type:"checkbox",checked:r.codeWrapDefault,onChange:i=>l(o=>({...o,codeWrapDefault:i.target.checked}))}),p.jsx("label",{htmlFor:"code-wrap",children:"Wrap code blocks by default"})]})]}),p.jsxs("div",{className:"mt-4 flex justify-end gap-2",children:[p.jsx("button",{className:"px-3 py-1.5 rounded border border-white/10 hover:bg-white/10",onClick:t,children:"Cancel"}),p.jsx("button",{className:"btn-primary",onClick:()=>{localStorage.setItem("appSettings",JSON.stringify(r)),Tc(r),n(r)},children:"Save"})]})]})]}):null}function wd(e){const t=new Date,n=new Date(t.getFullYear(),t.getMonth(),t.getDate()).getTime(),r=n-24*60*60*1e3,l=new Date(e.getFullYear(),e.getMonth(),e.getDate()).getTime();return l===n?"Today":l===r?"Yesterday":e.toLocaleDateString()}async function dt(e,t){const n=await fetch(e,t);if(!n.ok)throw new Error(`${n.status}`);return n.json()}function xd(){const[e,t]=O.useState([]),[n,r]=O.useState(""),[l,i]=O.useState(null),[o,u]=O.useState([{role:"system",content:"You are a helpful assistant."}]),[s,c]=O.useState(""),[g,m]=O.useState("openai"),[h,x]=O.useState(""),[S,k]=O.useState([]),[U,f]=O.useState(!1),[a,d]=O.useState(!1),[y,C]=O.useState(""),_=O.useRef(null),[j,P]=O.useState(!1),[Q,M]=O.useState(!1),[de,Mt]=O.useState(qi()),Xe=O.useMemo(()=>e.filter(v=>(v.title||"").toLowerCase().includes(n.toLowerCase())),[e,n]),Gt=O.useMemo(()=>{const v=Xe.filter(le=>le.pinned),L=Xe.filter(le=>!le.pinned),H={Today:[],Yesterday:[],Earlier:[]},b=new Date,pe=new Date(b.getFullYear(),b.getMonth(),b.getDate()).getTime(),He=pe-24*60*60*1e3;for(const le of L){const Rt=le.updated_at?new Date(le.updated_at).getTime():0;Rt>=pe?H.Today.push(le):Rt>=He?H.Yesterday.push(le):H.Earlier.push(le)}return{pinned:v,byDay:H}},[Xe]);async function vr(v){try{await dt(`/api/conversations/${encodeURIComponent(v)}`,{method:"DELETE"})}catch{}await Be(),l===v&&(i(null),u([{role:"system",content:"You are a helpful assistant."}]))}O.useEffect(()=>{(async()=>(await Be(),await T()))()},[]),O.useEffect(()=>{const v=_.current;if(!v)return;const L=()=>{P(v.scrollTop+v.clientHeight<v.scrollHeight-200)};return v.addEventListener("scroll",L),L(),()=>v.removeEventListener("scroll",L)},[]),O.useEffect(()=>{Tc(de)},[de]),O.useEffect(()=>{const v=_.current;!v||j||(v.scrollTop=v.scrollHeight)},[o,y]);async function Be(){var L;const v=await dt("/api/conversations");t(v.conversations||[]),!l&&((L=v.conversations)!=null&&L[0])&&await st(v.conversations[0].id)}async function st(v){i(v);const L=await dt(`/api/conversations/${encodeURIComponent(v)}`);u(L.messages||[{role:"system",content:"You are a helpful assistant."}])}async function E(){const v=await dt("/api/conversations",{method:"POST",headers:{"Content-Type":"application/json"},body:JSON.stringify({})});i(v.id),await Be(),await st(v.id)}async function z(v){await dt(`/api/conversations/${encodeURIComponent(v.id)}`,{method:"PATCH",headers:{"Content-Type":"application/json"},body:JSON.stringify({pinned:!v.pinned})}),await Be()}async function T(){const v=await dt("/api/settings");v.provider&&m(v.provider),await Z(v.provider||g),v.model&&x(v.model)}async function B(v){l&&(await dt(`/api/conversations/${encodeURIComponent(l)}`,{method:"PATCH",headers:{"Content-Type":"application/json"},body:JSON.stringify({messages:v})}),u(v),await Be())}async function Z(v){const L=await dt(`/api/models?provider=${encodeURIComponent(v)}`);k(L.models||[])}async function at(){const v=s.trim();if(!v||!l)return;c("");const L={role:"user",content:v},H=[...o,L];u(H);const b=window.location.protocol==="https:"?"wss":"ws",pe=new WebSocket(`${b}://${window.location.host}/ws/chat`);f(!0);let He="";C(""),pe.onopen=()=>{pe.send(JSON.stringify({messages:H,provider:g,model:h,conversation_id:l,reasoning:a}))},pe.onmessage=le=>{const Rt=le.data;if(Rt==="[END]"){f(!1),u(Ml=>[...Ml,{role:"assistant",content:He}]),C(""),Be();return}He+=Rt,C(He)},pe.onerror=()=>f(!1),pe.onclose=()=>f(!1)}function Ze({m:v,idx:L}){const[H,b]=O.useState(!1),[pe,He]=O.useState(v.content),le=v.role==="user",Rt=async()=>{try{await navigator.clipboard.writeText(v.content)}catch{}},Ml=async()=>{const Je=o.filter((ct,Rl)=>Rl!==L);await B(Je)},Mc=async()=>{const Je=o.map((ct,Rl)=>Rl===L?{...ct,content:pe}:ct);await B(Je),b(!1)},Rc=async()=>{let Je=null;for(let ct=L-1;ct>=0;ct--)if(o[ct].role==="user"){Je=o[ct].content;break}Je&&(c(Je),await at())};return p.jsxs("div",{className:`flex gap-3 ${v.role==="user"?"justify-end":""}`,children:[v.role==="assistant"&&p.jsx("div",{className:"w-8 h-8 rounded-full bg-brand flex items-center justify-center",children:rs(h,16)}),p.jsxs("div",{className:`group rounded-2xl px-3 py-2 border relative ${v.role==="user"?"bg-slate-800/60 border-white/10":"bg-slate-900/60 border-white/10"} shadow-[inset_0_1px_0_rgba(255,255,255,0.05)]`,style:{maxWidth:"80%"},children:[p.jsxs("div",{className:"absolute -top-2 right-1 opacity-0 group-hover:opacity-100 transition text-xs flex gap-2",children:[p.jsx("button",{className:"px-2 py-0.5 bg-white/10 rounded",onClick:Rt,children:"Copy"}),v.role==="assistant"&&p.jsx("button",{className:"px-2 py-0.5 bg-white/10 rounded",onClick:Rc,children:"Regenerate"}),le&&!H&&p.jsx("button",{className:"px-2 py-0.5 bg-white/10 rounded",onClick:()=>b(!0),children:"Edit"}),p.jsx("button",{className:"px-2 py-0.5 bg-white/10 rounded",onClick:Ml,children:"Delete"}),H&&p.jsxs(p.Fragment,{children:[p.jsx("button",{className:"px-2 py-0.5 bg-brand rounded",onClick:Mc,children:"Save"}),p.jsx("button",{className:"px-2 py-0.5 bg-white/10 rounded",onClick:()=>{b(!1),He(v.content)},children:"Cancel"})]})]}),H?p.jsx("textarea",{className:"w-full bg-slate-800/60 border border-white/10 rounded p-2 text-sm",rows:Math.min(10,Math.max(3,v.content.split(`
-`).length)),value:pe,onChange:Je=>He(Je.target.value)}):p.jsx("div",{className:"text-slate-100 text-sm",children:v.role==="assistant"?p.jsxs(p.Fragment,{children:[v.reasoning&&p.jsx("div",{className:"mb-2 rounded-lg border border-amber-300/20 bg-amber-900/10 p-2 text-amber-200 text-xs",children:v.reasoning}),p.jsx(vd,{content:v.content,wrapDefault:de.codeWrapDefault})]}):p.jsx("div",{className:"whitespace-pre-wrap",children:v.content})})]}),v.role==="user"&&p.jsx("div",{className:"w-8 h-8 rounded-full bg-brand flex items-center justify-center",children:"U"})]})}return p.jsxs("div",{className:"h-screen grid grid-cols-[300px_1fr] gap-0",children:[p.jsxs("aside",{className:"glass border-r",children:[p.jsxs("div",{className:"p-3 flex items-center gap-2",children:[p.jsx("button",{className:"btn-primary",onClick:E,children:"New"}),p.jsx("input",{className:"ml-auto bg-slate-800/60 border border-white/10 rounded px-2 py-1 w-full",placeholder:"Search",value:n,onChange:v=>r(v.target.value)})]}),p.jsxs("div",{className:"overflow-y-auto min-h-0 p-2 space-y-2",children:[Gt.pinned.length>0&&p.jsxs("div",{children:[p.jsx("div",{className:"px-2 text-xs uppercase text-slate-400 mb-1",children:"Pinned"}),p.jsx("div",{className:"space-y-1",children:Gt.pinned.map(v=>p.jsx("div",{className:`w-full px-2 py-1 rounded hover:bg-white/5 ${l===v.id?"bg-white/10":""}`,children:p.jsxs("div",{className:"flex items-center justify-between gap-2",children:[p.jsx("button",{className:"flex-1 text-left truncate",onClick:()=>st(v.id),children:v.title||"Untitled"}),p.jsxs("div",{className:"flex items-center gap-1 text-xs text-slate-400",children:[p.jsx("button",{className:"px-1 hover:text-white",onClick:L=>{L.stopPropagation(),z(v)},children:"Unpin"}),p.jsx("button",{className:"px-1 text-red-300 hover:text-red-200",onClick:L=>{L.stopPropagation(),vr(v.id)},children:"Delete"})]})]})},v.id))})]}),Object.entries(Gt.byDay).map(([v,L])=>L.length?p.jsxs("div",{children:[p.jsx("div",{className:"px-2 text-xs uppercase text-slate-400 mb-1",children:v}),p.jsx("div",{className:"space-y-1",children:L.map(H=>p.jsx("div",{className:`w-full px-2 py-1 rounded hover:bg-white/5 ${l===H.id?"bg-white/10":""}`,children:p.jsxs("div",{className:"flex items-center justify-between gap-2",children:[p.jsx("button",{className:"flex-1 text-left truncate",onClick:()=>st(H.id),children:H.title||"Untitled"}),p.jsxs("div",{className:"flex items-center gap-1 text-xs text-slate-400",children:[p.jsx("button",{className:"px-1 hover:text-white",onClick:b=>{b.stopPropagation(),z(H)},children:"Pin"}),p.jsx("button",{className:"px-1 text-red-300 hover:text-red-200",onClick:b=>{b.stopPropagation(),vr(H.id)},children:"Delete"})]})]})},H.id))})]},v):null)]})]}),p.jsxs("main",{className:"flex flex-col min-h-0",children:[p.jsxs("header",{className:"glass flex items-center justify-between px-4 py-2 border-b",children:[p.jsx("h1",{className:"font-semibold",children:"ChatUI"}),p.jsxs("div",{className:"flex items-center gap-2",children:[p.jsxs("div",{className:"flex items-center gap-1 text-sm text-slate-300",children:[pd(g,16),p.jsx("span",{className:"hidden md:inline",children:g})]}),p.jsx("select",{className:"bg-slate-800/60 border border-white/10 rounded px-2 py-1",value:g,onChange:async v=>{const L=v.target.value;m(L),await Z(L)},children:["openai","openrouter","anthropic","google","azure","ollama"].map(v=>p.jsx("option",{value:v,children:v},v))}),p.jsxs("select",{className:"bg-slate-800/60 border border-white/10 rounded px-2 py-1",value:h,onChange:v=>x(v.target.value),children:[p.jsx("option",{value:"",children:"Select a model"}),S.map(v=>p.jsx("option",{value:v.id,children:v.name||v.id},v.id))]}),p.jsxs("label",{className:"text-sm flex items-center gap-1",children:[p.jsx("input",{type:"checkbox",checked:a,onChange:v=>d(v.target.checked)})," Reasoning"]}),p.jsx("button",{className:"px-2 py-1 rounded border border-white/10 hover:bg-white/10",onClick:()=>M(!0),children:"Settings"})]})]}),p.jsxs("div",{ref:_,className:"flex-1 overflow-y-auto p-4",children:[o.filter(v=>v.role!=="system").length===0&&p.jsxs("div",{className:"max-w-2xl mx-auto p-4 rounded-lg border border-white/10 bg-slate-900/60",children:[p.jsx("div",{className:"mb-2 text-slate-300",children:"Try one of these"}),p.jsx("div",{className:"flex flex-wrap gap-2",children:["Summarize an article","Write Python","Explain a concept","Create a plan"].map((v,L)=>p.jsx("button",{className:"px-3 py-1 rounded border border-white/10 hover:bg-white/5",onClick:()=>c(v),children:v},L))})]}),p.jsxs("div",{className:"max-w-3xl mx-auto space-y-3",children:[(()=>{const v=[];let L=null;return o.filter(b=>b.role!=="system").forEach((b,pe)=>{if(b.created_at){const He=new Date(b.created_at),le=wd(He);le!==L&&(L=le,v.push(p.jsx("div",{className:"sticky top-2 z-10",children:p.jsx("div",{className:"mx-auto w-fit px-3 py-1 text-xs text-slate-300 border border-white/10 rounded-full bg-slate-900/70 backdrop-blur",children:le})},`sep-${pe}`)))}v.push(p.jsx(Ze,{m:b,idx:pe},pe))}),v})(),y&&p.jsxs("div",{className:"flex gap-3",children:[p.jsx("div",{className:"w-8 h-8 rounded-full bg-brand flex items-center justify-center",children:rs(h,16)}),p.jsx("div",{className:"rounded-2xl px-3 py-2 border bg-slate-900/60 border-white/10",style:{maxWidth:"80%"},children:p.jsx("div",{className:"whitespace-pre-wrap text-slate-100 text-sm",children:y})})]}),U&&!y&&p.jsxs("div",{className:"flex items-center gap-2 text-slate-300 text-sm",children:[p.jsx("span",{className:"w-2 h-2 bg-slate-500 rounded-full animate-pulse"}),"Generating…"]})]})]}),j&&p.jsx("button",{className:"fixed right-6 bottom-24 px-3 py-1.5 rounded-full bg-brand text-white shadow hover:bg-brand-dark",onClick:()=>{const v=_.current;v&&(v.scrollTop=v.scrollHeight)},children:"Jump to latest"}),p.jsxs("form",{className:"glass border-t p-3 flex items-center gap-2",onSubmit:v=>{v.preventDefault(),at()},children:[p.jsx("div",{className:"flex-1",children:p.jsx("textarea",{className:"w-full bg-slate-800/60 border border-white/10 rounded-full px-4 py-2 h-11 resize-none",placeholder:"Ask something...",value:s,onChange:v=>c(v.target.value),onKeyDown:v=>{v.key==="Enter"&&!v.shiftKey&&(v.preventDefault(),at())}})}),p.jsx("button",{className:"btn-primary rounded-full h-11 px-5",disabled:!s.trim()||U,type:"submit",children:"Send"})]})]}),p.jsx(yd,{open:Q,onClose:()=>M(!1),onSave:v=>{Mt(v),M(!1)}})]})}const Sd=document.getElementById("root");gc(Sd).render(p.jsx(Zc.StrictMode,{children:p.jsx(xd,{})}));
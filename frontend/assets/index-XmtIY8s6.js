@@ -1,40 +0,0 @@
-(function(){const t=document.createElement("link").relList;if(t&&t.supports&&t.supports("modulepreload"))return;for(const l of document.querySelectorAll('link[rel="modulepreload"]'))r(l);new MutationObserver(l=>{for(const u of l)if(u.type==="childList")for(const i of u.addedNodes)i.tagName==="LINK"&&i.rel==="modulepreload"&&r(i)}).observe(document,{childList:!0,subtree:!0});function n(l){const u={};return l.integrity&&(u.integrity=l.integrity),l.referrerPolicy&&(u.referrerPolicy=l.referrerPolicy),l.crossOrigin==="use-credentials"?u.credentials="include":l.crossOrigin==="anonymous"?u.credentials="omit":u.credentials="same-origin",u}function r(l){if(l.ep)return;l.ep=!0;const u=n(l);fetch(l.href,u)}})();function lc(e){return e&&e.__esModule&&Object.prototype.hasOwnProperty.call(e,"default")?e.default:e}var Qo={exports:{}},ul={},Ko={exports:{}},R={};/**
- * @license React
- * react.production.min.js
- *
- * Copyright (c) Facebook, Inc. and its affiliates.
- *
- * This source code is licensed under the MIT license found in the
- * LICENSE file in the root directory of this source tree.
- */var bn=Symbol.for("react.element"),uc=Symbol.for("react.portal"),ic=Symbol.for("react.fragment"),oc=Symbol.for("react.strict_mode"),sc=Symbol.for("react.profiler"),ac=Symbol.for("react.provider"),cc=Symbol.for("react.context"),fc=Symbol.for("react.forward_ref"),dc=Symbol.for("react.suspense"),pc=Symbol.for("react.memo"),mc=Symbol.for("react.lazy"),Ii=Symbol.iterator;function hc(e){return e===null||typeof e!="object"?null:(e=Ii&&e[Ii]||e["@@iterator"],typeof e=="function"?e:null)}var Yo={isMounted:function(){return!1},enqueueForceUpdate:function(){},enqueueReplaceState:function(){},enqueueSetState:function(){}},Xo=Object.assign,Go={};function fn(e,t,n){this.props=e,this.context=t,this.refs=Go,this.updater=n||Yo}fn.prototype.isReactComponent={};fn.prototype.setState=function(e,t){if(typeof e!="object"&&typeof e!="function"&&e!=null)throw Error("setState(...): takes an object of state variables to update or a function which returns an object of state variables.");this.updater.enqueueSetState(this,e,t,"setState")};fn.prototype.forceUpdate=function(e){this.updater.enqueueForceUpdate(this,e,"forceUpdate")};function Zo(){}Zo.prototype=fn.prototype;function Vu(e,t,n){this.props=e,this.context=t,this.refs=Go,this.updater=n||Yo}var Bu=Vu.prototype=new Zo;Bu.constructor=Vu;Xo(Bu,fn.prototype);Bu.isPureReactComponent=!0;var Di=Array.isArray,Jo=Object.prototype.hasOwnProperty,Wu={current:null},qo={key:!0,ref:!0,__self:!0,__source:!0};function bo(e,t,n){var r,l={},u=null,i=null;if(t!=null)for(r in t.ref!==void 0&&(i=t.ref),t.key!==void 0&&(u=""+t.key),t)Jo.call(t,r)&&!qo.hasOwnProperty(r)&&(l[r]=t[r]);var o=arguments.length-2;if(o===1)l.children=n;else if(1<o){for(var s=Array(o),f=0;f<o;f++)s[f]=arguments[f+2];l.children=s}if(e&&e.defaultProps)for(r in o=e.defaultProps,o)l[r]===void 0&&(l[r]=o[r]);return{$$typeof:bn,type:e,key:u,ref:i,props:l,_owner:Wu.current}}function vc(e,t){return{$$typeof:bn,type:e.type,key:t,ref:e.ref,props:e.props,_owner:e._owner}}function Hu(e){return typeof e=="object"&&e!==null&&e.$$typeof===bn}function yc(e){var t={"=":"=0",":":"=2"};return"$"+e.replace(/[=:]/g,function(n){return t[n]})}var Fi=/\/+/g;function xl(e,t){return typeof e=="object"&&e!==null&&e.key!=null?yc(""+e.key):t.toString(36)}function Er(e,t,n,r,l){var u=typeof e;(u==="undefined"||u==="boolean")&&(e=null);var i=!1;if(e===null)i=!0;else switch(u){case"string":case"number":i=!0;break;case"object":switch(e.$$typeof){case bn:case uc:i=!0}}if(i)return i=e,l=l(i),e=r===""?"."+xl(i,0):r,Di(l)?(n="",e!=null&&(n=e.replace(Fi,"$&/")+"/"),Er(l,t,n,"",function(f){return f})):l!=null&&(Hu(l)&&(l=vc(l,n+(!l.key||i&&i.key===l.key?"":(""+l.key).replace(Fi,"$&/")+"/")+e)),t.push(l)),1;if(i=0,r=r===""?".":r+":",Di(e))for(var o=0;o<e.length;o++){u=e[o];var s=r+xl(u,o);i+=Er(u,t,n,s,l)}else if(s=hc(e),typeof s=="function")for(e=s.call(e),o=0;!(u=e.next()).done;)u=u.value,s=r+xl(u,o++),i+=Er(u,t,n,s,l);else if(u==="object")throw t=String(e),Error("Objects are not valid as a React child (found: "+(t==="[object Object]"?"object with keys {"+Object.keys(e).join(", ")+"}":t)+"). If you meant to render a collection of children, use an array instead.");return i}function ir(e,t,n){if(e==null)return e;var r=[],l=0;return Er(e,r,"","",function(u){return t.call(n,u,l++)}),r}function gc(e){if(e._status===-1){var t=e._result;t=t(),t.then(function(n){(e._status===0||e._status===-1)&&(e._status=1,e._result=n)},function(n){(e._status===0||e._status===-1)&&(e._status=2,e._result=n)}),e._status===-1&&(e._status=0,e._result=t)}if(e._status===1)return e._result.default;throw e._result}var ce={current:null},Cr={transition:null},wc={ReactCurrentDispatcher:ce,ReactCurrentBatchConfig:Cr,ReactCurrentOwner:Wu};function es(){throw Error("act(...) is not supported in production builds of React.")}R.Children={map:ir,forEach:function(e,t,n){ir(e,function(){t.apply(this,arguments)},n)},count:function(e){var t=0;return ir(e,function(){t++}),t},toArray:function(e){return ir(e,function(t){return t})||[]},only:function(e){if(!Hu(e))throw Error("React.Children.only expected to receive a single React element child.");return e}};R.Component=fn;R.Fragment=ic;R.Profiler=sc;R.PureComponent=Vu;R.StrictMode=oc;R.Suspense=dc;R.__SECRET_INTERNALS_DO_NOT_USE_OR_YOU_WILL_BE_FIRED=wc;R.act=es;R.cloneElement=function(e,t,n){if(e==null)throw Error("React.cloneElement(...): The argument must be a React element, but you passed "+e+".");var r=Xo({},e.props),l=e.key,u=e.ref,i=e._owner;if(t!=null){if(t.ref!==void 0&&(u=t.ref,i=Wu.current),t.key!==void 0&&(l=""+t.key),e.type&&e.type.defaultProps)var o=e.type.defaultProps;for(s in t)Jo.call(t,s)&&!qo.hasOwnProperty(s)&&(r[s]=t[s]===void 0&&o!==void 0?o[s]:t[s])}var s=arguments.length-2;if(s===1)r.children=n;else if(1<s){o=Array(s);for(var f=0;f<s;f++)o[f]=arguments[f+2];r.children=o}return{$$typeof:bn,type:e.type,key:l,ref:u,props:r,_owner:i}};R.createContext=function(e){return e={$$typeof:cc,_currentValue:e,_currentValue2:e,_threadCount:0,Provider:null,Consumer:null,_defaultValue:null,_globalName:null},e.Provider={$$typeof:ac,_context:e},e.Consumer=e};R.createElement=bo;R.createFactory=function(e){var t=bo.bind(null,e);return t.type=e,t};R.createRef=function(){return{current:null}};R.forwardRef=function(e){return{$$typeof:fc,render:e}};R.isValidElement=Hu;R.lazy=function(e){return{$$typeof:mc,_payload:{_status:-1,_result:e},_init:gc}};R.memo=function(e,t){return{$$typeof:pc,type:e,compare:t===void 0?null:t}};R.startTransition=function(e){var t=Cr.transition;Cr.transition={};try{e()}finally{Cr.transition=t}};R.unstable_act=es;R.useCallback=function(e,t){return ce.current.useCallback(e,t)};R.useContext=function(e){return ce.current.useContext(e)};R.useDebugValue=function(){};R.useDeferredValue=function(e){return ce.current.useDeferredValue(e)};R.useEffect=function(e,t){return ce.current.useEffect(e,t)};R.useId=function(){return ce.current.useId()};R.useImperativeHandle=function(e,t,n){return ce.current.useImperativeHandle(e,t,n)};R.useInsertionEffect=function(e,t){return ce.current.useInsertionEffect(e,t)};R.useLayoutEffect=function(e,t){return ce.current.useLayoutEffect(e,t)};R.useMemo=function(e,t){return ce.current.useMemo(e,t)};R.useReducer=function(e,t,n){return ce.current.useReducer(e,t,n)};R.useRef=function(e){return ce.current.useRef(e)};R.useState=function(e){return ce.current.useState(e)};R.useSyncExternalStore=function(e,t,n){return ce.current.useSyncExternalStore(e,t,n)};R.useTransition=function(){return ce.current.useTransition()};R.version="18.3.1";Ko.exports=R;var ue=Ko.exports;const Sc=lc(ue);/**
- * @license React
- * react-jsx-runtime.production.min.js
- *
- * Copyright (c) Facebook, Inc. and its affiliates.
- *
- * This source code is licensed under the MIT license found in the
- * LICENSE file in the root directory of this source tree.
- */var kc=ue,xc=Symbol.for("react.element"),Ec=Symbol.for("react.fragment"),Cc=Object.prototype.hasOwnProperty,_c=kc.__SECRET_INTERNALS_DO_NOT_USE_OR_YOU_WILL_BE_FIRED.ReactCurrentOwner,Nc={key:!0,ref:!0,__self:!0,__source:!0};function ts(e,t,n){var r,l={},u=null,i=null;n!==void 0&&(u=""+n),t.key!==void 0&&(u=""+t.key),t.ref!==void 0&&(i=t.ref);for(r in t)Cc.call(t,r)&&!Nc.hasOwnProperty(r)&&(l[r]=t[r]);if(e&&e.defaultProps)for(r in t=e.defaultProps,t)l[r]===void 0&&(l[r]=t[r]);return{$$typeof:xc,type:e,key:u,ref:i,props:l,_owner:_c.current}}ul.Fragment=Ec;ul.jsx=ts;ul.jsxs=ts;Qo.exports=ul;var C=Qo.exports,ns={exports:{}},xe={},rs={exports:{}},ls={};/**
- * @license React
- * scheduler.production.min.js
- *
- * Copyright (c) Facebook, Inc. and its affiliates.
- *
- * This source code is licensed under the MIT license found in the
- * LICENSE file in the root directory of this source tree.
- */(function(e){function t(x,L){var T=x.length;x.push(L);e:for(;0<T;){var $=T-1>>>1,Y=x[$];if(0<l(Y,L))x[$]=L,x[T]=Y,T=$;else break e}}function n(x){return x.length===0?null:x[0]}function r(x){if(x.length===0)return null;var L=x[0],T=x.pop();if(T!==L){x[0]=T;e:for(var $=0,Y=x.length,lr=Y>>>1;$<lr;){var St=2*($+1)-1,kl=x[St],kt=St+1,ur=x[kt];if(0>l(kl,T))kt<Y&&0>l(ur,kl)?(x[$]=ur,x[kt]=T,$=kt):(x[$]=kl,x[St]=T,$=St);else if(kt<Y&&0>l(ur,T))x[$]=ur,x[kt]=T,$=kt;else break e}}return L}function l(x,L){var T=x.sortIndex-L.sortIndex;return T!==0?T:x.id-L.id}if(typeof performance=="object"&&typeof performance.now=="function"){var u=performance;e.unstable_now=function(){return u.now()}}else{var i=Date,o=i.now();e.unstable_now=function(){return i.now()-o}}var s=[],f=[],h=1,m=null,p=3,g=!1,w=!1,k=!1,I=typeof setTimeout=="function"?setTimeout:null,c=typeof clearTimeout=="function"?clearTimeout:null,a=typeof setImmediate<"u"?setImmediate:null;typeof navigator<"u"&&navigator.scheduling!==void 0&&navigator.scheduling.isInputPending!==void 0&&navigator.scheduling.isInputPending.bind(navigator.scheduling);function d(x){for(var L=n(f);L!==null;){if(L.callback===null)r(f);else if(L.startTime<=x)r(f),L.sortIndex=L.expirationTime,t(s,L);else break;L=n(f)}}function v(x){if(k=!1,d(x),!w)if(n(s)!==null)w=!0,Dt(E);else{var L=n(f);L!==null&&mn(v,L.startTime-x)}}function E(x,L){w=!1,k&&(k=!1,c(z),z=-1),g=!0;var T=p;try{for(d(L),m=n(s);m!==null&&(!(m.expirationTime>L)||x&&!ye());){var $=m.callback;if(typeof $=="function"){m.callback=null,p=m.priorityLevel;var Y=$(m.expirationTime<=L);L=e.unstable_now(),typeof Y=="function"?m.callback=Y:m===n(s)&&r(s),d(L)}else r(s);m=n(s)}if(m!==null)var lr=!0;else{var St=n(f);St!==null&&mn(v,St.startTime-L),lr=!1}return lr}finally{m=null,p=T,g=!1}}var P=!1,N=null,z=-1,V=5,j=-1;function ye(){return!(e.unstable_now()-j<V)}function qe(){if(N!==null){var x=e.unstable_now();j=x;var L=!0;try{L=N(!0,x)}finally{L?be():(P=!1,N=null)}}else P=!1}var be;if(typeof a=="function")be=function(){a(qe)};else if(typeof MessageChannel<"u"){var S=new MessageChannel,ne=S.port2;S.port1.onmessage=qe,be=function(){ne.postMessage(null)}}else be=function(){I(qe,0)};function Dt(x){N=x,P||(P=!0,be())}function mn(x,L){z=I(function(){x(e.unstable_now())},L)}e.unstable_IdlePriority=5,e.unstable_ImmediatePriority=1,e.unstable_LowPriority=4,e.unstable_NormalPriority=3,e.unstable_Profiling=null,e.unstable_UserBlockingPriority=2,e.unstable_cancelCallback=function(x){x.callback=null},e.unstable_continueExecution=function(){w||g||(w=!0,Dt(E))},e.unstable_forceFrameRate=function(x){0>x||125<x?console.error("forceFrameRate takes a positive int between 0 and 125, forcing frame rates higher than 125 fps is not supported"):V=0<x?Math.floor(1e3/x):5},e.unstable_getCurrentPriorityLevel=function(){return p},e.unstable_getFirstCallbackNode=function(){return n(s)},e.unstable_next=function(x){switch(p){case 1:case 2:case 3:var L=3;break;default:L=p}var T=p;p=L;try{return x()}finally{p=T}},e.unstable_pauseExecution=function(){},e.unstable_requestPaint=function(){},e.unstable_runWithPriority=function(x,L){switch(x){case 1:case 2:case 3:case 4:case 5:break;default:x=3}var T=p;p=x;try{return L()}finally{p=T}},e.unstable_scheduleCallback=function(x,L,T){var $=e.unstable_now();switch(typeof T=="object"&&T!==null?(T=T.delay,T=typeof T=="number"&&0<T?$+T:$):T=$,x){case 1:var Y=-1;break;case 2:Y=250;break;case 5:Y=1073741823;break;case 4:Y=1e4;break;default:Y=5e3}return Y=T+Y,x={id:h++,callback:L,priorityLevel:x,startTime:T,expirationTime:Y,sortIndex:-1},T>$?(x.sortIndex=T,t(f,x),n(s)===null&&x===n(f)&&(k?(c(z),z=-1):k=!0,mn(v,T-$))):(x.sortIndex=Y,t(s,x),w||g||(w=!0,Dt(E))),x},e.unstable_shouldYield=ye,e.unstable_wrapCallback=function(x){var L=p;return function(){var T=p;p=L;try{return x.apply(this,arguments)}finally{p=T}}}})(ls);rs.exports=ls;var Pc=rs.exports;/**
- * @license React
- * react-dom.production.min.js
- *
- * Copyright (c) Facebook, Inc. and its affiliates.
- *
- * This source code is licensed under the MIT license found in the
- * LICENSE file in the root directory of this source tree.
- */var zc=ue,ke=Pc;function y(e){for(var t="https://reactjs.org/docs/error-decoder.html?invariant="+e,n=1;n<arguments.length;n++)t+="&args[]="+encodeURIComponent(arguments[n]);return"Minified React error #"+e+"; visit "+t+" for the full message or use the non-minified dev environment for full errors and additional helpful warnings."}var us=new Set,Dn={};function Mt(e,t){rn(e,t),rn(e+"Capture",t)}function rn(e,t){for(Dn[e]=t,e=0;e<t.length;e++)us.add(t[e])}var Ye=!(typeof window>"u"||typeof window.document>"u"||typeof window.document.createElement>"u"),Gl=Object.prototype.hasOwnProperty,Lc=/^[:A-Z_a-z\u00C0-\u00D6\u00D8-\u00F6\u00F8-\u02FF\u0370-\u037D\u037F-\u1FFF\u200C-\u200D\u2070-\u218F\u2C00-\u2FEF\u3001-\uD7FF\uF900-\uFDCF\uFDF0-\uFFFD][:A-Z_a-z\u00C0-\u00D6\u00D8-\u00F6\u00F8-\u02FF\u0370-\u037D\u037F-\u1FFF\u200C-\u200D\u2070-\u218F\u2C00-\u2FEF\u3001-\uD7FF\uF900-\uFDCF\uFDF0-\uFFFD\-.0-9\u00B7\u0300-\u036F\u203F-\u2040]*$/,Ui={},$i={};function Tc(e){return Gl.call($i,e)?!0:Gl.call(Ui,e)?!1:Lc.test(e)?$i[e]=!0:(Ui[e]=!0,!1)}function jc(e,t,n,r){if(n!==null&&n.type===0)return!1;switch(typeof t){case"function":case"symbol":return!0;case"boolean":return r?!1:n!==null?!n.acceptsBooleans:(e=e.toLowerCase().slice(0,5),e!=="data-"&&e!=="aria-");default:return!1}}function Rc(e,t,n,r){if(t===null||typeof t>"u"||jc(e,t,n,r))return!0;if(r)return!1;if(n!==null)switch(n.type){case 3:return!t;case 4:return t===!1;case 5:return isNaN(t);case 6:return isNaN(t)||1>t}return!1}function fe(e,t,n,r,l,u,i){this.acceptsBooleans=t===2||t===3||t===4,this.attributeName=r,this.attributeNamespace=l,this.mustUseProperty=n,this.propertyName=e,this.type=t,this.sanitizeURL=u,this.removeEmptyString=i}var te={};"children dangerouslySetInnerHTML defaultValue defaultChecked innerHTML suppressContentEditableWarning suppressHydrationWarning style".split(" ").forEach(function(e){te[e]=new fe(e,0,!1,e,null,!1,!1)});[["acceptCharset","accept-charset"],["className","class"],["htmlFor","for"],["httpEquiv","http-equiv"]].forEach(function(e){var t=e[0];te[t]=new fe(t,1,!1,e[1],null,!1,!1)});["contentEditable","draggable","spellCheck","value"].forEach(function(e){te[e]=new fe(e,2,!1,e.toLowerCase(),null,!1,!1)});["autoReverse","externalResourcesRequired","focusable","preserveAlpha"].forEach(function(e){te[e]=new fe(e,2,!1,e,null,!1,!1)});"allowFullScreen async autoFocus autoPlay controls default defer disabled disablePictureInPicture disableRemotePlayback formNoValidate hidden loop noModule noValidate open playsInline readOnly required reversed scoped seamless itemScope".split(" ").forEach(function(e){te[e]=new fe(e,3,!1,e.toLowerCase(),null,!1,!1)});["checked","multiple","muted","selected"].forEach(function(e){te[e]=new fe(e,3,!0,e,null,!1,!1)});["capture","download"].forEach(function(e){te[e]=new fe(e,4,!1,e,null,!1,!1)});["cols","rows","size","span"].forEach(function(e){te[e]=new fe(e,6,!1,e,null,!1,!1)});["rowSpan","start"].forEach(function(e){te[e]=new fe(e,5,!1,e.toLowerCase(),null,!1,!1)});var Qu=/[\-:]([a-z])/g;function Ku(e){return e[1].toUpperCase()}"accent-height alignment-baseline arabic-form baseline-shift cap-height clip-path clip-rule color-interpolation color-interpolation-filters color-profile color-rendering dominant-baseline enable-background fill-opacity fill-rule flood-color flood-opacity font-family font-size font-size-adjust font-stretch font-style font-variant font-weight glyph-name glyph-orientation-horizontal glyph-orientation-vertical horiz-adv-x horiz-origin-x image-rendering letter-spacing lighting-color marker-end marker-mid marker-start overline-position overline-thickness paint-order panose-1 pointer-events rendering-intent shape-rendering stop-color stop-opacity strikethrough-position strikethrough-thickness stroke-dasharray stroke-dashoffset stroke-linecap stroke-linejoin stroke-miterlimit stroke-opacity stroke-width text-anchor text-decoration text-rendering underline-position underline-thickness unicode-bidi unicode-range units-per-em v-alphabetic v-hanging v-ideographic v-mathematical vector-effect vert-adv-y vert-origin-x vert-origin-y word-spacing writing-mode xmlns:xlink x-height".split(" ").forEach(function(e){var t=e.replace(Qu,Ku);te[t]=new fe(t,1,!1,e,null,!1,!1)});"xlink:actuate xlink:arcrole xlink:role xlink:show xlink:title xlink:type".split(" ").forEach(function(e){var t=e.replace(Qu,Ku);te[t]=new fe(t,1,!1,e,"http://www.w3.org/1999/xlink",!1,!1)});["xml:base","xml:lang","xml:space"].forEach(function(e){var t=e.replace(Qu,Ku);te[t]=new fe(t,1,!1,e,"http://www.w3.org/XML/1998/namespace",!1,!1)});["tabIndex","crossOrigin"].forEach(function(e){te[e]=new fe(e,1,!1,e.toLowerCase(),null,!1,!1)});te.xlinkHref=new fe("xlinkHref",1,!1,"xlink:href","http://www.w3.org/1999/xlink",!0,!1);["src","href","action","formAction"].forEach(function(e){te[e]=new fe(e,1,!1,e.toLowerCase(),null,!0,!0)});function Yu(e,t,n,r){var l=te.hasOwnProperty(t)?te[t]:null;(l!==null?l.type!==0:r||!(2<t.length)||t[0]!=="o"&&t[0]!=="O"||t[1]!=="n"&&t[1]!=="N")&&(Rc(t,n,l,r)&&(n=null),r||l===null?Tc(t)&&(n===null?e.removeAttribute(t):e.setAttribute(t,""+n)):l.mustUseProperty?e[l.propertyName]=n===null?l.type===3?!1:"":n:(t=l.attributeName,r=l.attributeNamespace,n===null?e.removeAttribute(t):(l=l.type,n=l===3||l===4&&n===!0?"":""+n,r?e.setAttributeNS(r,t,n):e.setAttribute(t,n))))}var Je=zc.__SECRET_INTERNALS_DO_NOT_USE_OR_YOU_WILL_BE_FIRED,or=Symbol.for("react.element"),$t=Symbol.for("react.portal"),At=Symbol.for("react.fragment"),Xu=Symbol.for("react.strict_mode"),Zl=Symbol.for("react.profiler"),is=Symbol.for("react.provider"),os=Symbol.for("react.context"),Gu=Symbol.for("react.forward_ref"),Jl=Symbol.for("react.suspense"),ql=Symbol.for("react.suspense_list"),Zu=Symbol.for("react.memo"),tt=Symbol.for("react.lazy"),ss=Symbol.for("react.offscreen"),Ai=Symbol.iterator;function hn(e){return e===null||typeof e!="object"?null:(e=Ai&&e[Ai]||e["@@iterator"],typeof e=="function"?e:null)}var H=Object.assign,El;function En(e){if(El===void 0)try{throw Error()}catch(n){var t=n.stack.trim().match(/\n( *(at )?)/);El=t&&t[1]||""}return`
-`+El+e}var Cl=!1;function _l(e,t){if(!e||Cl)return"";Cl=!0;var n=Error.prepareStackTrace;Error.prepareStackTrace=void 0;try{if(t)if(t=function(){throw Error()},Object.defineProperty(t.prototype,"props",{set:function(){throw Error()}}),typeof Reflect=="object"&&Reflect.construct){try{Reflect.construct(t,[])}catch(f){var r=f}Reflect.construct(e,[],t)}else{try{t.call()}catch(f){r=f}e.call(t.prototype)}else{try{throw Error()}catch(f){r=f}e()}}catch(f){if(f&&r&&typeof f.stack=="string"){for(var l=f.stack.split(`
-`),u=r.stack.split(`
-`),i=l.length-1,o=u.length-1;1<=i&&0<=o&&l[i]!==u[o];)o--;for(;1<=i&&0<=o;i--,o--)if(l[i]!==u[o]){if(i!==1||o!==1)do if(i--,o--,0>o||l[i]!==u[o]){var s=`
-`+l[i].replace(" at new "," at ");return e.displayName&&s.includes("<anonymous>")&&(s=s.replace("<anonymous>",e.displayName)),s}while(1<=i&&0<=o);break}}}finally{Cl=!1,Error.prepareStackTrace=n}return(e=e?e.displayName||e.name:"")?En(e):""}function Oc(e){switch(e.tag){case 5:return En(e.type);case 16:return En("Lazy");case 13:return En("Suspense");case 19:return En("SuspenseList");case 0:case 2:case 15:return e=_l(e.type,!1),e;case 11:return e=_l(e.type.render,!1),e;case 1:return e=_l(e.type,!0),e;default:return""}}function bl(e){if(e==null)return null;if(typeof e=="function")return e.displayName||e.name||null;if(typeof e=="string")return e;switch(e){case At:return"Fragment";case $t:return"Portal";case Zl:return"Profiler";case Xu:return"StrictMode";case Jl:return"Suspense";case ql:return"SuspenseList"}if(typeof e=="object")switch(e.$$typeof){case os:return(e.displayName||"Context")+".Consumer";case is:return(e._context.displayName||"Context")+".Provider";case Gu:var t=e.render;return e=e.displayName,e||(e=t.displayName||t.name||"",e=e!==""?"ForwardRef("+e+")":"ForwardRef"),e;case Zu:return t=e.displayName||null,t!==null?t:bl(e.type)||"Memo";case tt:t=e._payload,e=e._init;try{return bl(e(t))}catch{}}return null}function Mc(e){var t=e.type;switch(e.tag){case 24:return"Cache";case 9:return(t.displayName||"Context")+".Consumer";case 10:return(t._context.displayName||"Context")+".Provider";case 18:return"DehydratedFragment";case 11:return e=t.render,e=e.displayName||e.name||"",t.displayName||(e!==""?"ForwardRef("+e+")":"ForwardRef");case 7:return"Fragment";case 5:return t;case 4:return"Portal";case 3:return"Root";case 6:return"Text";case 16:return bl(t);case 8:return t===Xu?"StrictMode":"Mode";case 22:return"Offscreen";case 12:return"Profiler";case 21:return"Scope";case 13:return"Suspense";case 19:return"SuspenseList";case 25:return"TracingMarker";case 1:case 0:case 17:case 2:case 14:case 15:if(typeof t=="function")return t.displayName||t.name||null;if(typeof t=="string")return t}return null}function ht(e){switch(typeof e){case"boolean":case"number":case"string":case"undefined":return e;case"object":return e;default:return""}}function as(e){var t=e.type;return(e=e.nodeName)&&e.toLowerCase()==="input"&&(t==="checkbox"||t==="radio")}function Ic(e){var t=as(e)?"checked":"value",n=Object.getOwnPropertyDescriptor(e.constructor.prototype,t),r=""+e[t];if(!e.hasOwnProperty(t)&&typeof n<"u"&&typeof n.get=="function"&&typeof n.set=="function"){var l=n.get,u=n.set;return Object.defineProperty(e,t,{configurable:!0,get:function(){return l.call(this)},set:function(i){r=""+i,u.call(this,i)}}),Object.defineProperty(e,t,{enumerable:n.enumerable}),{getValue:function(){return r},setValue:function(i){r=""+i},stopTracking:function(){e._valueTracker=null,delete e[t]}}}}function sr(e){e._valueTracker||(e._valueTracker=Ic(e))}function cs(e){if(!e)return!1;var t=e._valueTracker;if(!t)return!0;var n=t.getValue(),r="";return e&&(r=as(e)?e.checked?"true":"false":e.value),e=r,e!==n?(t.setValue(e),!0):!1}function Ir(e){if(e=e||(typeof document<"u"?document:void 0),typeof e>"u")return null;try{return e.activeElement||e.body}catch{return e.body}}function eu(e,t){var n=t.checked;return H({},t,{defaultChecked:void 0,defaultValue:void 0,value:void 0,checked:n??e._wrapperState.initialChecked})}function Vi(e,t){var n=t.defaultValue==null?"":t.defaultValue,r=t.checked!=null?t.checked:t.defaultChecked;n=ht(t.value!=null?t.value:n),e._wrapperState={initialChecked:r,initialValue:n,controlled:t.type==="checkbox"||t.type==="radio"?t.checked!=null:t.value!=null}}function fs(e,t){t=t.checked,t!=null&&Yu(e,"checked",t,!1)}function tu(e,t){fs(e,t);var n=ht(t.value),r=t.type;if(n!=null)r==="number"?(n===0&&e.value===""||e.value!=n)&&(e.value=""+n):e.value!==""+n&&(e.value=""+n);else if(r==="submit"||r==="reset"){e.removeAttribute("value");return}t.hasOwnProperty("value")?nu(e,t.type,n):t.hasOwnProperty("defaultValue")&&nu(e,t.type,ht(t.defaultValue)),t.checked==null&&t.defaultChecked!=null&&(e.defaultChecked=!!t.defaultChecked)}function Bi(e,t,n){if(t.hasOwnProperty("value")||t.hasOwnProperty("defaultValue")){var r=t.type;if(!(r!=="submit"&&r!=="reset"||t.value!==void 0&&t.value!==null))return;t=""+e._wrapperState.initialValue,n||t===e.value||(e.value=t),e.defaultValue=t}n=e.name,n!==""&&(e.name=""),e.defaultChecked=!!e._wrapperState.initialChecked,n!==""&&(e.name=n)}function nu(e,t,n){(t!=="number"||Ir(e.ownerDocument)!==e)&&(n==null?e.defaultValue=""+e._wrapperState.initialValue:e.defaultValue!==""+n&&(e.defaultValue=""+n))}var Cn=Array.isArray;function Jt(e,t,n,r){if(e=e.options,t){t={};for(var l=0;l<n.length;l++)t["$"+n[l]]=!0;for(n=0;n<e.length;n++)l=t.hasOwnProperty("$"+e[n].value),e[n].selected!==l&&(e[n].selected=l),l&&r&&(e[n].defaultSelected=!0)}else{for(n=""+ht(n),t=null,l=0;l<e.length;l++){if(e[l].value===n){e[l].selected=!0,r&&(e[l].defaultSelected=!0);return}t!==null||e[l].disabled||(t=e[l])}t!==null&&(t.selected=!0)}}function ru(e,t){if(t.dangerouslySetInnerHTML!=null)throw Error(y(91));return H({},t,{value:void 0,defaultValue:void 0,children:""+e._wrapperState.initialValue})}function Wi(e,t){var n=t.value;if(n==null){if(n=t.children,t=t.defaultValue,n!=null){if(t!=null)throw Error(y(92));if(Cn(n)){if(1<n.length)throw Error(y(93));n=n[0]}t=n}t==null&&(t=""),n=t}e._wrapperState={initialValue:ht(n)}}function ds(e,t){var n=ht(t.value),r=ht(t.defaultValue);n!=null&&(n=""+n,n!==e.value&&(e.value=n),t.defaultValue==null&&e.defaultValue!==n&&(e.defaultValue=n)),r!=null&&(e.defaultValue=""+r)}function Hi(e){var t=e.textContent;t===e._wrapperState.initialValue&&t!==""&&t!==null&&(e.value=t)}function ps(e){switch(e){case"svg":return"http://www.w3.org/2000/svg";case"math":return"http://www.w3.org/1998/Math/MathML";default:return"http://www.w3.org/1999/xhtml"}}function lu(e,t){return e==null||e==="http://www.w3.org/1999/xhtml"?ps(t):e==="http://www.w3.org/2000/svg"&&t==="foreignObject"?"http://www.w3.org/1999/xhtml":e}var ar,ms=function(e){return typeof MSApp<"u"&&MSApp.execUnsafeLocalFunction?function(t,n,r,l){MSApp.execUnsafeLocalFunction(function(){return e(t,n,r,l)})}:e}(function(e,t){if(e.namespaceURI!=="http://www.w3.org/2000/svg"||"innerHTML"in e)e.innerHTML=t;else{for(ar=ar||document.createElement("div"),ar.innerHTML="<svg>"+t.valueOf().toString()+"</svg>",t=ar.firstChild;e.firstChild;)e.removeChild(e.firstChild);for(;t.firstChild;)e.appendChild(t.firstChild)}});function Fn(e,t){if(t){var n=e.firstChild;if(n&&n===e.lastChild&&n.nodeType===3){n.nodeValue=t;return}}e.textContent=t}var Pn={animationIterationCount:!0,aspectRatio:!0,borderImageOutset:!0,borderImageSlice:!0,borderImageWidth:!0,boxFlex:!0,boxFlexGroup:!0,boxOrdinalGroup:!0,columnCount:!0,columns:!0,flex:!0,flexGrow:!0,flexPositive:!0,flexShrink:!0,flexNegative:!0,flexOrder:!0,gridArea:!0,gridRow:!0,gridRowEnd:!0,gridRowSpan:!0,gridRowStart:!0,gridColumn:!0,gridColumnEnd:!0,gridColumnSpan:!0,gridColumnStart:!0,fontWeight:!0,lineClamp:!0,lineHeight:!0,opacity:!0,order:!0,orphans:!0,tabSize:!0,widows:!0,zIndex:!0,zoom:!0,fillOpacity:!0,floodOpacity:!0,stopOpacity:!0,strokeDasharray:!0,strokeDashoffset:!0,strokeMiterlimit:!0,strokeOpacity:!0,strokeWidth:!0},Dc=["Webkit","ms","Moz","O"];Object.keys(Pn).forEach(function(e){Dc.forEach(function(t){t=t+e.charAt(0).toUpperCase()+e.substring(1),Pn[t]=Pn[e]})});function hs(e,t,n){return t==null||typeof t=="boolean"||t===""?"":n||typeof t!="number"||t===0||Pn.hasOwnProperty(e)&&Pn[e]?(""+t).trim():t+"px"}function vs(e,t){e=e.style;for(var n in t)if(t.hasOwnProperty(n)){var r=n.indexOf("--")===0,l=hs(n,t[n],r);n==="float"&&(n="cssFloat"),r?e.setProperty(n,l):e[n]=l}}var Fc=H({menuitem:!0},{area:!0,base:!0,br:!0,col:!0,embed:!0,hr:!0,img:!0,input:!0,keygen:!0,link:!0,meta:!0,param:!0,source:!0,track:!0,wbr:!0});function uu(e,t){if(t){if(Fc[e]&&(t.children!=null||t.dangerouslySetInnerHTML!=null))throw Error(y(137,e));if(t.dangerouslySetInnerHTML!=null){if(t.children!=null)throw Error(y(60));if(typeof t.dangerouslySetInnerHTML!="object"||!("__html"in t.dangerouslySetInnerHTML))throw Error(y(61))}if(t.style!=null&&typeof t.style!="object")throw Error(y(62))}}function iu(e,t){if(e.indexOf("-")===-1)return typeof t.is=="string";switch(e){case"annotation-xml":case"color-profile":case"font-face":case"font-face-src":case"font-face-uri":case"font-face-format":case"font-face-name":case"missing-glyph":return!1;default:return!0}}var ou=null;function Ju(e){return e=e.target||e.srcElement||window,e.correspondingUseElement&&(e=e.correspondingUseElement),e.nodeType===3?e.parentNode:e}var su=null,qt=null,bt=null;function Qi(e){if(e=nr(e)){if(typeof su!="function")throw Error(y(280));var t=e.stateNode;t&&(t=cl(t),su(e.stateNode,e.type,t))}}function ys(e){qt?bt?bt.push(e):bt=[e]:qt=e}function gs(){if(qt){var e=qt,t=bt;if(bt=qt=null,Qi(e),t)for(e=0;e<t.length;e++)Qi(t[e])}}function ws(e,t){return e(t)}function Ss(){}var Nl=!1;function ks(e,t,n){if(Nl)return e(t,n);Nl=!0;try{return ws(e,t,n)}finally{Nl=!1,(qt!==null||bt!==null)&&(Ss(),gs())}}function Un(e,t){var n=e.stateNode;if(n===null)return null;var r=cl(n);if(r===null)return null;n=r[t];e:switch(t){case"onClick":case"onClickCapture":case"onDoubleClick":case"onDoubleClickCapture":case"onMouseDown":case"onMouseDownCapture":case"onMouseMove":case"onMouseMoveCapture":case"onMouseUp":case"onMouseUpCapture":case"onMouseEnter":(r=!r.disabled)||(e=e.type,r=!(e==="button"||e==="input"||e==="select"||e==="textarea")),e=!r;break e;default:e=!1}if(e)return null;if(n&&typeof n!="function")throw Error(y(231,t,typeof n));return n}var au=!1;if(Ye)try{var vn={};Object.defineProperty(vn,"passive",{get:function(){au=!0}}),window.addEventListener("test",vn,vn),window.removeEventListener("test",vn,vn)}catch{au=!1}function Uc(e,t,n,r,l,u,i,o,s){var f=Array.prototype.slice.call(arguments,3);try{t.apply(n,f)}catch(h){this.onError(h)}}var zn=!1,Dr=null,Fr=!1,cu=null,$c={onError:function(e){zn=!0,Dr=e}};function Ac(e,t,n,r,l,u,i,o,s){zn=!1,Dr=null,Uc.apply($c,arguments)}function Vc(e,t,n,r,l,u,i,o,s){if(Ac.apply(this,arguments),zn){if(zn){var f=Dr;zn=!1,Dr=null}else throw Error(y(198));Fr||(Fr=!0,cu=f)}}function It(e){var t=e,n=e;if(e.alternate)for(;t.return;)t=t.return;else{e=t;do t=e,t.flags&4098&&(n=t.return),e=t.return;while(e)}return t.tag===3?n:null}function xs(e){if(e.tag===13){var t=e.memoizedState;if(t===null&&(e=e.alternate,e!==null&&(t=e.memoizedState)),t!==null)return t.dehydrated}return null}function Ki(e){if(It(e)!==e)throw Error(y(188))}function Bc(e){var t=e.alternate;if(!t){if(t=It(e),t===null)throw Error(y(188));return t!==e?null:e}for(var n=e,r=t;;){var l=n.return;if(l===null)break;var u=l.alternate;if(u===null){if(r=l.return,r!==null){n=r;continue}break}if(l.child===u.child){for(u=l.child;u;){if(u===n)return Ki(l),e;if(u===r)return Ki(l),t;u=u.sibling}throw Error(y(188))}if(n.return!==r.return)n=l,r=u;else{for(var i=!1,o=l.child;o;){if(o===n){i=!0,n=l,r=u;break}if(o===r){i=!0,r=l,n=u;break}o=o.sibling}if(!i){for(o=u.child;o;){if(o===n){i=!0,n=u,r=l;break}if(o===r){i=!0,r=u,n=l;break}o=o.sibling}if(!i)throw Error(y(189))}}if(n.alternate!==r)throw Error(y(190))}if(n.tag!==3)throw Error(y(188));return n.stateNode.current===n?e:t}function Es(e){return e=Bc(e),e!==null?Cs(e):null}function Cs(e){if(e.tag===5||e.tag===6)return e;for(e=e.child;e!==null;){var t=Cs(e);if(t!==null)return t;e=e.sibling}return null}var _s=ke.unstable_scheduleCallback,Yi=ke.unstable_cancelCallback,Wc=ke.unstable_shouldYield,Hc=ke.unstable_requestPaint,K=ke.unstable_now,Qc=ke.unstable_getCurrentPriorityLevel,qu=ke.unstable_ImmediatePriority,Ns=ke.unstable_UserBlockingPriority,Ur=ke.unstable_NormalPriority,Kc=ke.unstable_LowPriority,Ps=ke.unstable_IdlePriority,il=null,Ae=null;function Yc(e){if(Ae&&typeof Ae.onCommitFiberRoot=="function")try{Ae.onCommitFiberRoot(il,e,void 0,(e.current.flags&128)===128)}catch{}}var Me=Math.clz32?Math.clz32:Zc,Xc=Math.log,Gc=Math.LN2;function Zc(e){return e>>>=0,e===0?32:31-(Xc(e)/Gc|0)|0}var cr=64,fr=4194304;function _n(e){switch(e&-e){case 1:return 1;case 2:return 2;case 4:return 4;case 8:return 8;case 16:return 16;case 32:return 32;case 64:case 128:case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:return e&4194240;case 4194304:case 8388608:case 16777216:case 33554432:case 67108864:return e&130023424;case 134217728:return 134217728;case 268435456:return 268435456;case 536870912:return 536870912;case 1073741824:return 1073741824;default:return e}}function $r(e,t){var n=e.pendingLanes;if(n===0)return 0;var r=0,l=e.suspendedLanes,u=e.pingedLanes,i=n&268435455;if(i!==0){var o=i&~l;o!==0?r=_n(o):(u&=i,u!==0&&(r=_n(u)))}else i=n&~l,i!==0?r=_n(i):u!==0&&(r=_n(u));if(r===0)return 0;if(t!==0&&t!==r&&!(t&l)&&(l=r&-r,u=t&-t,l>=u||l===16&&(u&4194240)!==0))return t;if(r&4&&(r|=n&16),t=e.entangledLanes,t!==0)for(e=e.entanglements,t&=r;0<t;)n=31-Me(t),l=1<<n,r|=e[n],t&=~l;return r}function Jc(e,t){switch(e){case 1:case 2:case 4:return t+250;case 8:case 16:case 32:case 64:case 128:case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:return t+5e3;case 4194304:case 8388608:case 16777216:case 33554432:case 67108864:return-1;case 134217728:case 268435456:case 536870912:case 1073741824:return-1;default:return-1}}function qc(e,t){for(var n=e.suspendedLanes,r=e.pingedLanes,l=e.expirationTimes,u=e.pendingLanes;0<u;){var i=31-Me(u),o=1<<i,s=l[i];s===-1?(!(o&n)||o&r)&&(l[i]=Jc(o,t)):s<=t&&(e.expiredLanes|=o),u&=~o}}function fu(e){return e=e.pendingLanes&-1073741825,e!==0?e:e&1073741824?1073741824:0}function zs(){var e=cr;return cr<<=1,!(cr&4194240)&&(cr=64),e}function Pl(e){for(var t=[],n=0;31>n;n++)t.push(e);return t}function er(e,t,n){e.pendingLanes|=t,t!==536870912&&(e.suspendedLanes=0,e.pingedLanes=0),e=e.eventTimes,t=31-Me(t),e[t]=n}function bc(e,t){var n=e.pendingLanes&~t;e.pendingLanes=t,e.suspendedLanes=0,e.pingedLanes=0,e.expiredLanes&=t,e.mutableReadLanes&=t,e.entangledLanes&=t,t=e.entanglements;var r=e.eventTimes;for(e=e.expirationTimes;0<n;){var l=31-Me(n),u=1<<l;t[l]=0,r[l]=-1,e[l]=-1,n&=~u}}function bu(e,t){var n=e.entangledLanes|=t;for(e=e.entanglements;n;){var r=31-Me(n),l=1<<r;l&t|e[r]&t&&(e[r]|=t),n&=~l}}var M=0;function Ls(e){return e&=-e,1<e?4<e?e&268435455?16:536870912:4:1}var Ts,ei,js,Rs,Os,du=!1,dr=[],ot=null,st=null,at=null,$n=new Map,An=new Map,rt=[],ef="mousedown mouseup touchcancel touchend touchstart auxclick dblclick pointercancel pointerdown pointerup dragend dragstart drop compositionend compositionstart keydown keypress keyup input textInput copy cut paste click change contextmenu reset submit".split(" ");function Xi(e,t){switch(e){case"focusin":case"focusout":ot=null;break;case"dragenter":case"dragleave":st=null;break;case"mouseover":case"mouseout":at=null;break;case"pointerover":case"pointerout":$n.delete(t.pointerId);break;case"gotpointercapture":case"lostpointercapture":An.delete(t.pointerId)}}function yn(e,t,n,r,l,u){return e===null||e.nativeEvent!==u?(e={blockedOn:t,domEventName:n,eventSystemFlags:r,nativeEvent:u,targetContainers:[l]},t!==null&&(t=nr(t),t!==null&&ei(t)),e):(e.eventSystemFlags|=r,t=e.targetContainers,l!==null&&t.indexOf(l)===-1&&t.push(l),e)}function tf(e,t,n,r,l){switch(t){case"focusin":return ot=yn(ot,e,t,n,r,l),!0;case"dragenter":return st=yn(st,e,t,n,r,l),!0;case"mouseover":return at=yn(at,e,t,n,r,l),!0;case"pointerover":var u=l.pointerId;return $n.set(u,yn($n.get(u)||null,e,t,n,r,l)),!0;case"gotpointercapture":return u=l.pointerId,An.set(u,yn(An.get(u)||null,e,t,n,r,l)),!0}return!1}function Ms(e){var t=Ct(e.target);if(t!==null){var n=It(t);if(n!==null){if(t=n.tag,t===13){if(t=xs(n),t!==null){e.blockedOn=t,Os(e.priority,function(){js(n)});return}}else if(t===3&&n.stateNode.current.memoizedState.isDehydrated){e.blockedOn=n.tag===3?n.stateNode.containerInfo:null;return}}}e.blockedOn=null}function _r(e){if(e.blockedOn!==null)return!1;for(var t=e.targetContainers;0<t.length;){var n=pu(e.domEventName,e.eventSystemFlags,t[0],e.nativeEvent);if(n===null){n=e.nativeEvent;var r=new n.constructor(n.type,n);ou=r,n.target.dispatchEvent(r),ou=null}else return t=nr(n),t!==null&&ei(t),e.blockedOn=n,!1;t.shift()}return!0}function Gi(e,t,n){_r(e)&&n.delete(t)}function nf(){du=!1,ot!==null&&_r(ot)&&(ot=null),st!==null&&_r(st)&&(st=null),at!==null&&_r(at)&&(at=null),$n.forEach(Gi),An.forEach(Gi)}function gn(e,t){e.blockedOn===t&&(e.blockedOn=null,du||(du=!0,ke.unstable_scheduleCallback(ke.unstable_NormalPriority,nf)))}function Vn(e){function t(l){return gn(l,e)}if(0<dr.length){gn(dr[0],e);for(var n=1;n<dr.length;n++){var r=dr[n];r.blockedOn===e&&(r.blockedOn=null)}}for(ot!==null&&gn(ot,e),st!==null&&gn(st,e),at!==null&&gn(at,e),$n.forEach(t),An.forEach(t),n=0;n<rt.length;n++)r=rt[n],r.blockedOn===e&&(r.blockedOn=null);for(;0<rt.length&&(n=rt[0],n.blockedOn===null);)Ms(n),n.blockedOn===null&&rt.shift()}var en=Je.ReactCurrentBatchConfig,Ar=!0;function rf(e,t,n,r){var l=M,u=en.transition;en.transition=null;try{M=1,ti(e,t,n,r)}finally{M=l,en.transition=u}}function lf(e,t,n,r){var l=M,u=en.transition;en.transition=null;try{M=4,ti(e,t,n,r)}finally{M=l,en.transition=u}}function ti(e,t,n,r){if(Ar){var l=pu(e,t,n,r);if(l===null)Fl(e,t,r,Vr,n),Xi(e,r);else if(tf(l,e,t,n,r))r.stopPropagation();else if(Xi(e,r),t&4&&-1<ef.indexOf(e)){for(;l!==null;){var u=nr(l);if(u!==null&&Ts(u),u=pu(e,t,n,r),u===null&&Fl(e,t,r,Vr,n),u===l)break;l=u}l!==null&&r.stopPropagation()}else Fl(e,t,r,null,n)}}var Vr=null;function pu(e,t,n,r){if(Vr=null,e=Ju(r),e=Ct(e),e!==null)if(t=It(e),t===null)e=null;else if(n=t.tag,n===13){if(e=xs(t),e!==null)return e;e=null}else if(n===3){if(t.stateNode.current.memoizedState.isDehydrated)return t.tag===3?t.stateNode.containerInfo:null;e=null}else t!==e&&(e=null);return Vr=e,null}function Is(e){switch(e){case"cancel":case"click":case"close":case"contextmenu":case"copy":case"cut":case"auxclick":case"dblclick":case"dragend":case"dragstart":case"drop":case"focusin":case"focusout":case"input":case"invalid":case"keydown":case"keypress":case"keyup":case"mousedown":case"mouseup":case"paste":case"pause":case"play":case"pointercancel":case"pointerdown":case"pointerup":case"ratechange":case"reset":case"resize":case"seeked":case"submit":case"touchcancel":case"touchend":case"touchstart":case"volumechange":case"change":case"selectionchange":case"textInput":case"compositionstart":case"compositionend":case"compositionupdate":case"beforeblur":case"afterblur":case"beforeinput":case"blur":case"fullscreenchange":case"focus":case"hashchange":case"popstate":case"select":case"selectstart":return 1;case"drag":case"dragenter":case"dragexit":case"dragleave":case"dragover":case"mousemove":case"mouseout":case"mouseover":case"pointermove":case"pointerout":case"pointerover":case"scroll":case"toggle":case"touchmove":case"wheel":case"mouseenter":case"mouseleave":case"pointerenter":case"pointerleave":return 4;case"message":switch(Qc()){case qu:return 1;case Ns:return 4;case Ur:case Kc:return 16;case Ps:return 536870912;default:return 16}default:return 16}}var ut=null,ni=null,Nr=null;function Ds(){if(Nr)return Nr;var e,t=ni,n=t.length,r,l="value"in ut?ut.value:ut.textContent,u=l.length;for(e=0;e<n&&t[e]===l[e];e++);var i=n-e;for(r=1;r<=i&&t[n-r]===l[u-r];r++);return Nr=l.slice(e,1<r?1-r:void 0)}function Pr(e){var t=e.keyCode;return"charCode"in e?(e=e.charCode,e===0&&t===13&&(e=13)):e=t,e===10&&(e=13),32<=e||e===13?e:0}function pr(){return!0}function Zi(){return!1}function Ee(e){function t(n,r,l,u,i){this._reactName=n,this._targetInst=l,this.type=r,this.nativeEvent=u,this.target=i,this.currentTarget=null;for(var o in e)e.hasOwnProperty(o)&&(n=e[o],this[o]=n?n(u):u[o]);return this.isDefaultPrevented=(u.defaultPrevented!=null?u.defaultPrevented:u.returnValue===!1)?pr:Zi,this.isPropagationStopped=Zi,this}return H(t.prototype,{preventDefault:function(){this.defaultPrevented=!0;var n=this.nativeEvent;n&&(n.preventDefault?n.preventDefault():typeof n.returnValue!="unknown"&&(n.returnValue=!1),this.isDefaultPrevented=pr)},stopPropagation:function(){var n=this.nativeEvent;n&&(n.stopPropagation?n.stopPropagation():typeof n.cancelBubble!="unknown"&&(n.cancelBubble=!0),this.isPropagationStopped=pr)},persist:function(){},isPersistent:pr}),t}var dn={eventPhase:0,bubbles:0,cancelable:0,timeStamp:function(e){return e.timeStamp||Date.now()},defaultPrevented:0,isTrusted:0},ri=Ee(dn),tr=H({},dn,{view:0,detail:0}),uf=Ee(tr),zl,Ll,wn,ol=H({},tr,{screenX:0,screenY:0,clientX:0,clientY:0,pageX:0,pageY:0,ctrlKey:0,shiftKey:0,altKey:0,metaKey:0,getModifierState:li,button:0,buttons:0,relatedTarget:function(e){return e.relatedTarget===void 0?e.fromElement===e.srcElement?e.toElement:e.fromElement:e.relatedTarget},movementX:function(e){return"movementX"in e?e.movementX:(e!==wn&&(wn&&e.type==="mousemove"?(zl=e.screenX-wn.screenX,Ll=e.screenY-wn.screenY):Ll=zl=0,wn=e),zl)},movementY:function(e){return"movementY"in e?e.movementY:Ll}}),Ji=Ee(ol),of=H({},ol,{dataTransfer:0}),sf=Ee(of),af=H({},tr,{relatedTarget:0}),Tl=Ee(af),cf=H({},dn,{animationName:0,elapsedTime:0,pseudoElement:0}),ff=Ee(cf),df=H({},dn,{clipboardData:function(e){return"clipboardData"in e?e.clipboardData:window.clipboardData}}),pf=Ee(df),mf=H({},dn,{data:0}),qi=Ee(mf),hf={Esc:"Escape",Spacebar:" ",Left:"ArrowLeft",Up:"ArrowUp",Right:"ArrowRight",Down:"ArrowDown",Del:"Delete",Win:"OS",Menu:"ContextMenu",Apps:"ContextMenu",Scroll:"ScrollLock",MozPrintableKey:"Unidentified"},vf={8:"Backspace",9:"Tab",12:"Clear",13:"Enter",16:"Shift",17:"Control",18:"Alt",19:"Pause",20:"CapsLock",27:"Escape",32:" ",33:"PageUp",34:"PageDown",35:"End",36:"Home",37:"ArrowLeft",38:"ArrowUp",39:"ArrowRight",40:"ArrowDown",45:"Insert",46:"Delete",112:"F1",113:"F2",114:"F3",115:"F4",116:"F5",117:"F6",118:"F7",119:"F8",120:"F9",121:"F10",122:"F11",123:"F12",144:"NumLock",145:"ScrollLock",224:"Meta"},yf={Alt:"altKey",Control:"ctrlKey",Meta:"metaKey",Shift:"shiftKey"};function gf(e){var t=this.nativeEvent;return t.getModifierState?t.getModifierState(e):(e=yf[e])?!!t[e]:!1}function li(){return gf}var wf=H({},tr,{key:function(e){if(e.key){var t=hf[e.key]||e.key;if(t!=="Unidentified")return t}return e.type==="keypress"?(e=Pr(e),e===13?"Enter":String.fromCharCode(e)):e.type==="keydown"||e.type==="keyup"?vf[e.keyCode]||"Unidentified":""},code:0,location:0,ctrlKey:0,shiftKey:0,altKey:0,metaKey:0,repeat:0,locale:0,getModifierState:li,charCode:function(e){return e.type==="keypress"?Pr(e):0},keyCode:function(e){return e.type==="keydown"||e.type==="keyup"?e.keyCode:0},which:function(e){return e.type==="keypress"?Pr(e):e.type==="keydown"||e.type==="keyup"?e.keyCode:0}}),Sf=Ee(wf),kf=H({},ol,{pointerId:0,width:0,height:0,pressure:0,tangentialPressure:0,tiltX:0,tiltY:0,twist:0,pointerType:0,isPrimary:0}),bi=Ee(kf),xf=H({},tr,{touches:0,targetTouches:0,changedTouches:0,altKey:0,metaKey:0,ctrlKey:0,shiftKey:0,getModifierState:li}),Ef=Ee(xf),Cf=H({},dn,{propertyName:0,elapsedTime:0,pseudoElement:0}),_f=Ee(Cf),Nf=H({},ol,{deltaX:function(e){return"deltaX"in e?e.deltaX:"wheelDeltaX"in e?-e.wheelDeltaX:0},deltaY:function(e){return"deltaY"in e?e.deltaY:"wheelDeltaY"in e?-e.wheelDeltaY:"wheelDelta"in e?-e.wheelDelta:0},deltaZ:0,deltaMode:0}),Pf=Ee(Nf),zf=[9,13,27,32],ui=Ye&&"CompositionEvent"in window,Ln=null;Ye&&"documentMode"in document&&(Ln=document.documentMode);var Lf=Ye&&"TextEvent"in window&&!Ln,Fs=Ye&&(!ui||Ln&&8<Ln&&11>=Ln),eo=" ",to=!1;function Us(e,t){switch(e){case"keyup":return zf.indexOf(t.keyCode)!==-1;case"keydown":return t.keyCode!==229;case"keypress":case"mousedown":case"focusout":return!0;default:return!1}}function $s(e){return e=e.detail,typeof e=="object"&&"data"in e?e.data:null}var Vt=!1;function Tf(e,t){switch(e){case"compositionend":return $s(t);case"keypress":return t.which!==32?null:(to=!0,eo);case"textInput":return e=t.data,e===eo&&to?null:e;default:return null}}function jf(e,t){if(Vt)return e==="compositionend"||!ui&&Us(e,t)?(e=Ds(),Nr=ni=ut=null,Vt=!1,e):null;switch(e){case"paste":return null;case"keypress":if(!(t.ctrlKey||t.altKey||t.metaKey)||t.ctrlKey&&t.altKey){if(t.char&&1<t.char.length)return t.char;if(t.which)return String.fromCharCode(t.which)}return null;case"compositionend":return Fs&&t.locale!=="ko"?null:t.data;default:return null}}var Rf={color:!0,date:!0,datetime:!0,"datetime-local":!0,email:!0,month:!0,number:!0,password:!0,range:!0,search:!0,tel:!0,text:!0,time:!0,url:!0,week:!0};function no(e){var t=e&&e.nodeName&&e.nodeName.toLowerCase();return t==="input"?!!Rf[e.type]:t==="textarea"}function As(e,t,n,r){ys(r),t=Br(t,"onChange"),0<t.length&&(n=new ri("onChange","change",null,n,r),e.push({event:n,listeners:t}))}var Tn=null,Bn=null;function Of(e){Js(e,0)}function sl(e){var t=Ht(e);if(cs(t))return e}function Mf(e,t){if(e==="change")return t}var Vs=!1;if(Ye){var jl;if(Ye){var Rl="oninput"in document;if(!Rl){var ro=document.createElement("div");ro.setAttribute("oninput","return;"),Rl=typeof ro.oninput=="function"}jl=Rl}else jl=!1;Vs=jl&&(!document.documentMode||9<document.documentMode)}function lo(){Tn&&(Tn.detachEvent("onpropertychange",Bs),Bn=Tn=null)}function Bs(e){if(e.propertyName==="value"&&sl(Bn)){var t=[];As(t,Bn,e,Ju(e)),ks(Of,t)}}function If(e,t,n){e==="focusin"?(lo(),Tn=t,Bn=n,Tn.attachEvent("onpropertychange",Bs)):e==="focusout"&&lo()}function Df(e){if(e==="selectionchange"||e==="keyup"||e==="keydown")return sl(Bn)}function Ff(e,t){if(e==="click")return sl(t)}function Uf(e,t){if(e==="input"||e==="change")return sl(t)}function $f(e,t){return e===t&&(e!==0||1/e===1/t)||e!==e&&t!==t}var De=typeof Object.is=="function"?Object.is:$f;function Wn(e,t){if(De(e,t))return!0;if(typeof e!="object"||e===null||typeof t!="object"||t===null)return!1;var n=Object.keys(e),r=Object.keys(t);if(n.length!==r.length)return!1;for(r=0;r<n.length;r++){var l=n[r];if(!Gl.call(t,l)||!De(e[l],t[l]))return!1}return!0}function uo(e){for(;e&&e.firstChild;)e=e.firstChild;return e}function io(e,t){var n=uo(e);e=0;for(var r;n;){if(n.nodeType===3){if(r=e+n.textContent.length,e<=t&&r>=t)return{node:n,offset:t-e};e=r}e:{for(;n;){if(n.nextSibling){n=n.nextSibling;break e}n=n.parentNode}n=void 0}n=uo(n)}}function Ws(e,t){return e&&t?e===t?!0:e&&e.nodeType===3?!1:t&&t.nodeType===3?Ws(e,t.parentNode):"contains"in e?e.contains(t):e.compareDocumentPosition?!!(e.compareDocumentPosition(t)&16):!1:!1}function Hs(){for(var e=window,t=Ir();t instanceof e.HTMLIFrameElement;){try{var n=typeof t.contentWindow.location.href=="string"}catch{n=!1}if(n)e=t.contentWindow;else break;t=Ir(e.document)}return t}function ii(e){var t=e&&e.nodeName&&e.nodeName.toLowerCase();return t&&(t==="input"&&(e.type==="text"||e.type==="search"||e.type==="tel"||e.type==="url"||e.type==="password")||t==="textarea"||e.contentEditable==="true")}function Af(e){var t=Hs(),n=e.focusedElem,r=e.selectionRange;if(t!==n&&n&&n.ownerDocument&&Ws(n.ownerDocument.documentElement,n)){if(r!==null&&ii(n)){if(t=r.start,e=r.end,e===void 0&&(e=t),"selectionStart"in n)n.selectionStart=t,n.selectionEnd=Math.min(e,n.value.length);else if(e=(t=n.ownerDocument||document)&&t.defaultView||window,e.getSelection){e=e.getSelection();var l=n.textContent.length,u=Math.min(r.start,l);r=r.end===void 0?u:Math.min(r.end,l),!e.extend&&u>r&&(l=r,r=u,u=l),l=io(n,u);var i=io(n,r);l&&i&&(e.rangeCount!==1||e.anchorNode!==l.node||e.anchorOffset!==l.offset||e.focusNode!==i.node||e.focusOffset!==i.offset)&&(t=t.createRange(),t.setStart(l.node,l.offset),e.removeAllRanges(),u>r?(e.addRange(t),e.extend(i.node,i.offset)):(t.setEnd(i.node,i.offset),e.addRange(t)))}}for(t=[],e=n;e=e.parentNode;)e.nodeType===1&&t.push({element:e,left:e.scrollLeft,top:e.scrollTop});for(typeof n.focus=="function"&&n.focus(),n=0;n<t.length;n++)e=t[n],e.element.scrollLeft=e.left,e.element.scrollTop=e.top}}var Vf=Ye&&"documentMode"in document&&11>=document.documentMode,Bt=null,mu=null,jn=null,hu=!1;function oo(e,t,n){var r=n.window===n?n.document:n.nodeType===9?n:n.ownerDocument;hu||Bt==null||Bt!==Ir(r)||(r=Bt,"selectionStart"in r&&ii(r)?r={start:r.selectionStart,end:r.selectionEnd}:(r=(r.ownerDocument&&r.ownerDocument.defaultView||window).getSelection(),r={anchorNode:r.anchorNode,anchorOffset:r.anchorOffset,focusNode:r.focusNode,focusOffset:r.focusOffset}),jn&&Wn(jn,r)||(jn=r,r=Br(mu,"onSelect"),0<r.length&&(t=new ri("onSelect","select",null,t,n),e.push({event:t,listeners:r}),t.target=Bt)))}function mr(e,t){var n={};return n[e.toLowerCase()]=t.toLowerCase(),n["Webkit"+e]="webkit"+t,n["Moz"+e]="moz"+t,n}var Wt={animationend:mr("Animation","AnimationEnd"),animationiteration:mr("Animation","AnimationIteration"),animationstart:mr("Animation","AnimationStart"),transitionend:mr("Transition","TransitionEnd")},Ol={},Qs={};Ye&&(Qs=document.createElement("div").style,"AnimationEvent"in window||(delete Wt.animationend.animation,delete Wt.animationiteration.animation,delete Wt.animationstart.animation),"TransitionEvent"in window||delete Wt.transitionend.transition);function al(e){if(Ol[e])return Ol[e];if(!Wt[e])return e;var t=Wt[e],n;for(n in t)if(t.hasOwnProperty(n)&&n in Qs)return Ol[e]=t[n];return e}var Ks=al("animationend"),Ys=al("animationiteration"),Xs=al("animationstart"),Gs=al("transitionend"),Zs=new Map,so="abort auxClick cancel canPlay canPlayThrough click close contextMenu copy cut drag dragEnd dragEnter dragExit dragLeave dragOver dragStart drop durationChange emptied encrypted ended error gotPointerCapture input invalid keyDown keyPress keyUp load loadedData loadedMetadata loadStart lostPointerCapture mouseDown mouseMove mouseOut mouseOver mouseUp paste pause play playing pointerCancel pointerDown pointerMove pointerOut pointerOver pointerUp progress rateChange reset resize seeked seeking stalled submit suspend timeUpdate touchCancel touchEnd touchStart volumeChange scroll toggle touchMove waiting wheel".split(" ");function yt(e,t){Zs.set(e,t),Mt(t,[e])}for(var Ml=0;Ml<so.length;Ml++){var Il=so[Ml],Bf=Il.toLowerCase(),Wf=Il[0].toUpperCase()+Il.slice(1);yt(Bf,"on"+Wf)}yt(Ks,"onAnimationEnd");yt(Ys,"onAnimationIteration");yt(Xs,"onAnimationStart");yt("dblclick","onDoubleClick");yt("focusin","onFocus");yt("focusout","onBlur");yt(Gs,"onTransitionEnd");rn("onMouseEnter",["mouseout","mouseover"]);rn("onMouseLeave",["mouseout","mouseover"]);rn("onPointerEnter",["pointerout","pointerover"]);rn("onPointerLeave",["pointerout","pointerover"]);Mt("onChange","change click focusin focusout input keydown keyup selectionchange".split(" "));Mt("onSelect","focusout contextmenu dragend focusin keydown keyup mousedown mouseup selectionchange".split(" "));Mt("onBeforeInput",["compositionend","keypress","textInput","paste"]);Mt("onCompositionEnd","compositionend focusout keydown keypress keyup mousedown".split(" "));Mt("onCompositionStart","compositionstart focusout keydown keypress keyup mousedown".split(" "));Mt("onCompositionUpdate","compositionupdate focusout keydown keypress keyup mousedown".split(" "));var Nn="abort canplay canplaythrough durationchange emptied encrypted ended error loadeddata loadedmetadata loadstart pause play playing progress ratechange resize seeked seeking stalled suspend timeupdate volumechange waiting".split(" "),Hf=new Set("cancel close invalid load scroll toggle".split(" ").concat(Nn));function ao(e,t,n){var r=e.type||"unknown-event";e.currentTarget=n,Vc(r,t,void 0,e),e.currentTarget=null}function Js(e,t){t=(t&4)!==0;for(var n=0;n<e.length;n++){var r=e[n],l=r.event;r=r.listeners;e:{var u=void 0;if(t)for(var i=r.length-1;0<=i;i--){var o=r[i],s=o.instance,f=o.currentTarget;if(o=o.listener,s!==u&&l.isPropagationStopped())break e;ao(l,o,f),u=s}else for(i=0;i<r.length;i++){if(o=r[i],s=o.instance,f=o.currentTarget,o=o.listener,s!==u&&l.isPropagationStopped())break e;ao(l,o,f),u=s}}}if(Fr)throw e=cu,Fr=!1,cu=null,e}function F(e,t){var n=t[Su];n===void 0&&(n=t[Su]=new Set);var r=e+"__bubble";n.has(r)||(qs(t,e,2,!1),n.add(r))}function Dl(e,t,n){var r=0;t&&(r|=4),qs(n,e,r,t)}var hr="_reactListening"+Math.random().toString(36).slice(2);function Hn(e){if(!e[hr]){e[hr]=!0,us.forEach(function(n){n!=="selectionchange"&&(Hf.has(n)||Dl(n,!1,e),Dl(n,!0,e))});var t=e.nodeType===9?e:e.ownerDocument;t===null||t[hr]||(t[hr]=!0,Dl("selectionchange",!1,t))}}function qs(e,t,n,r){switch(Is(t)){case 1:var l=rf;break;case 4:l=lf;break;default:l=ti}n=l.bind(null,t,n,e),l=void 0,!au||t!=="touchstart"&&t!=="touchmove"&&t!=="wheel"||(l=!0),r?l!==void 0?e.addEventListener(t,n,{capture:!0,passive:l}):e.addEventListener(t,n,!0):l!==void 0?e.addEventListener(t,n,{passive:l}):e.addEventListener(t,n,!1)}function Fl(e,t,n,r,l){var u=r;if(!(t&1)&&!(t&2)&&r!==null)e:for(;;){if(r===null)return;var i=r.tag;if(i===3||i===4){var o=r.stateNode.containerInfo;if(o===l||o.nodeType===8&&o.parentNode===l)break;if(i===4)for(i=r.return;i!==null;){var s=i.tag;if((s===3||s===4)&&(s=i.stateNode.containerInfo,s===l||s.nodeType===8&&s.parentNode===l))return;i=i.return}for(;o!==null;){if(i=Ct(o),i===null)return;if(s=i.tag,s===5||s===6){r=u=i;continue e}o=o.parentNode}}r=r.return}ks(function(){var f=u,h=Ju(n),m=[];e:{var p=Zs.get(e);if(p!==void 0){var g=ri,w=e;switch(e){case"keypress":if(Pr(n)===0)break e;case"keydown":case"keyup":g=Sf;break;case"focusin":w="focus",g=Tl;break;case"focusout":w="blur",g=Tl;break;case"beforeblur":case"afterblur":g=Tl;break;case"click":if(n.button===2)break e;case"auxclick":case"dblclick":case"mousedown":case"mousemove":case"mouseup":case"mouseout":case"mouseover":case"contextmenu":g=Ji;break;case"drag":case"dragend":case"dragenter":case"dragexit":case"dragleave":case"dragover":case"dragstart":case"drop":g=sf;break;case"touchcancel":case"touchend":case"touchmove":case"touchstart":g=Ef;break;case Ks:case Ys:case Xs:g=ff;break;case Gs:g=_f;break;case"scroll":g=uf;break;case"wheel":g=Pf;break;case"copy":case"cut":case"paste":g=pf;break;case"gotpointercapture":case"lostpointercapture":case"pointercancel":case"pointerdown":case"pointermove":case"pointerout":case"pointerover":case"pointerup":g=bi}var k=(t&4)!==0,I=!k&&e==="scroll",c=k?p!==null?p+"Capture":null:p;k=[];for(var a=f,d;a!==null;){d=a;var v=d.stateNode;if(d.tag===5&&v!==null&&(d=v,c!==null&&(v=Un(a,c),v!=null&&k.push(Qn(a,v,d)))),I)break;a=a.return}0<k.length&&(p=new g(p,w,null,n,h),m.push({event:p,listeners:k}))}}if(!(t&7)){e:{if(p=e==="mouseover"||e==="pointerover",g=e==="mouseout"||e==="pointerout",p&&n!==ou&&(w=n.relatedTarget||n.fromElement)&&(Ct(w)||w[Xe]))break e;if((g||p)&&(p=h.window===h?h:(p=h.ownerDocument)?p.defaultView||p.parentWindow:window,g?(w=n.relatedTarget||n.toElement,g=f,w=w?Ct(w):null,w!==null&&(I=It(w),w!==I||w.tag!==5&&w.tag!==6)&&(w=null)):(g=null,w=f),g!==w)){if(k=Ji,v="onMouseLeave",c="onMouseEnter",a="mouse",(e==="pointerout"||e==="pointerover")&&(k=bi,v="onPointerLeave",c="onPointerEnter",a="pointer"),I=g==null?p:Ht(g),d=w==null?p:Ht(w),p=new k(v,a+"leave",g,n,h),p.target=I,p.relatedTarget=d,v=null,Ct(h)===f&&(k=new k(c,a+"enter",w,n,h),k.target=d,k.relatedTarget=I,v=k),I=v,g&&w)t:{for(k=g,c=w,a=0,d=k;d;d=Ft(d))a++;for(d=0,v=c;v;v=Ft(v))d++;for(;0<a-d;)k=Ft(k),a--;for(;0<d-a;)c=Ft(c),d--;for(;a--;){if(k===c||c!==null&&k===c.alternate)break t;k=Ft(k),c=Ft(c)}k=null}else k=null;g!==null&&co(m,p,g,k,!1),w!==null&&I!==null&&co(m,I,w,k,!0)}}e:{if(p=f?Ht(f):window,g=p.nodeName&&p.nodeName.toLowerCase(),g==="select"||g==="input"&&p.type==="file")var E=Mf;else if(no(p))if(Vs)E=Uf;else{E=Df;var P=If}else(g=p.nodeName)&&g.toLowerCase()==="input"&&(p.type==="checkbox"||p.type==="radio")&&(E=Ff);if(E&&(E=E(e,f))){As(m,E,n,h);break e}P&&P(e,p,f),e==="focusout"&&(P=p._wrapperState)&&P.controlled&&p.type==="number"&&nu(p,"number",p.value)}switch(P=f?Ht(f):window,e){case"focusin":(no(P)||P.contentEditable==="true")&&(Bt=P,mu=f,jn=null);break;case"focusout":jn=mu=Bt=null;break;case"mousedown":hu=!0;break;case"contextmenu":case"mouseup":case"dragend":hu=!1,oo(m,n,h);break;case"selectionchange":if(Vf)break;case"keydown":case"keyup":oo(m,n,h)}var N;if(ui)e:{switch(e){case"compositionstart":var z="onCompositionStart";break e;case"compositionend":z="onCompositionEnd";break e;case"compositionupdate":z="onCompositionUpdate";break e}z=void 0}else Vt?Us(e,n)&&(z="onCompositionEnd"):e==="keydown"&&n.keyCode===229&&(z="onCompositionStart");z&&(Fs&&n.locale!=="ko"&&(Vt||z!=="onCompositionStart"?z==="onCompositionEnd"&&Vt&&(N=Ds()):(ut=h,ni="value"in ut?ut.value:ut.textContent,Vt=!0)),P=Br(f,z),0<P.length&&(z=new qi(z,e,null,n,h),m.push({event:z,listeners:P}),N?z.data=N:(N=$s(n),N!==null&&(z.data=N)))),(N=Lf?Tf(e,n):jf(e,n))&&(f=Br(f,"onBeforeInput"),0<f.length&&(h=new qi("onBeforeInput","beforeinput",null,n,h),m.push({event:h,listeners:f}),h.data=N))}Js(m,t)})}function Qn(e,t,n){return{instance:e,listener:t,currentTarget:n}}function Br(e,t){for(var n=t+"Capture",r=[];e!==null;){var l=e,u=l.stateNode;l.tag===5&&u!==null&&(l=u,u=Un(e,n),u!=null&&r.unshift(Qn(e,u,l)),u=Un(e,t),u!=null&&r.push(Qn(e,u,l))),e=e.return}return r}function Ft(e){if(e===null)return null;do e=e.return;while(e&&e.tag!==5);return e||null}function co(e,t,n,r,l){for(var u=t._reactName,i=[];n!==null&&n!==r;){var o=n,s=o.alternate,f=o.stateNode;if(s!==null&&s===r)break;o.tag===5&&f!==null&&(o=f,l?(s=Un(n,u),s!=null&&i.unshift(Qn(n,s,o))):l||(s=Un(n,u),s!=null&&i.push(Qn(n,s,o)))),n=n.return}i.length!==0&&e.push({event:t,listeners:i})}var Qf=/\r\n?/g,Kf=/\u0000|\uFFFD/g;function fo(e){return(typeof e=="string"?e:""+e).replace(Qf,`
-`).replace(Kf,"")}function vr(e,t,n){if(t=fo(t),fo(e)!==t&&n)throw Error(y(425))}function Wr(){}var vu=null,yu=null;function gu(e,t){return e==="textarea"||e==="noscript"||typeof t.children=="string"||typeof t.children=="number"||typeof t.dangerouslySetInnerHTML=="object"&&t.dangerouslySetInnerHTML!==null&&t.dangerouslySetInnerHTML.__html!=null}var wu=typeof setTimeout=="function"?setTimeout:void 0,Yf=typeof clearTimeout=="function"?clearTimeout:void 0,po=typeof Promise=="function"?Promise:void 0,Xf=typeof queueMicrotask=="function"?queueMicrotask:typeof po<"u"?function(e){return po.resolve(null).then(e).catch(Gf)}:wu;function Gf(e){setTimeout(function(){throw e})}function Ul(e,t){var n=t,r=0;do{var l=n.nextSibling;if(e.removeChild(n),l&&l.nodeType===8)if(n=l.data,n==="/$"){if(r===0){e.removeChild(l),Vn(t);return}r--}else n!=="$"&&n!=="$?"&&n!=="$!"||r++;n=l}while(n);Vn(t)}function ct(e){for(;e!=null;e=e.nextSibling){var t=e.nodeType;if(t===1||t===3)break;if(t===8){if(t=e.data,t==="$"||t==="$!"||t==="$?")break;if(t==="/$")return null}}return e}function mo(e){e=e.previousSibling;for(var t=0;e;){if(e.nodeType===8){var n=e.data;if(n==="$"||n==="$!"||n==="$?"){if(t===0)return e;t--}else n==="/$"&&t++}e=e.previousSibling}return null}var pn=Math.random().toString(36).slice(2),$e="__reactFiber$"+pn,Kn="__reactProps$"+pn,Xe="__reactContainer$"+pn,Su="__reactEvents$"+pn,Zf="__reactListeners$"+pn,Jf="__reactHandles$"+pn;function Ct(e){var t=e[$e];if(t)return t;for(var n=e.parentNode;n;){if(t=n[Xe]||n[$e]){if(n=t.alternate,t.child!==null||n!==null&&n.child!==null)for(e=mo(e);e!==null;){if(n=e[$e])return n;e=mo(e)}return t}e=n,n=e.parentNode}return null}function nr(e){return e=e[$e]||e[Xe],!e||e.tag!==5&&e.tag!==6&&e.tag!==13&&e.tag!==3?null:e}function Ht(e){if(e.tag===5||e.tag===6)return e.stateNode;throw Error(y(33))}function cl(e){return e[Kn]||null}var ku=[],Qt=-1;function gt(e){return{current:e}}function U(e){0>Qt||(e.current=ku[Qt],ku[Qt]=null,Qt--)}function D(e,t){Qt++,ku[Qt]=e.current,e.current=t}var vt={},oe=gt(vt),me=gt(!1),Lt=vt;function ln(e,t){var n=e.type.contextTypes;if(!n)return vt;var r=e.stateNode;if(r&&r.__reactInternalMemoizedUnmaskedChildContext===t)return r.__reactInternalMemoizedMaskedChildContext;var l={},u;for(u in n)l[u]=t[u];return r&&(e=e.stateNode,e.__reactInternalMemoizedUnmaskedChildContext=t,e.__reactInternalMemoizedMaskedChildContext=l),l}function he(e){return e=e.childContextTypes,e!=null}function Hr(){U(me),U(oe)}function ho(e,t,n){if(oe.current!==vt)throw Error(y(168));D(oe,t),D(me,n)}function bs(e,t,n){var r=e.stateNode;if(t=t.childContextTypes,typeof r.getChildContext!="function")return n;r=r.getChildContext();for(var l in r)if(!(l in t))throw Error(y(108,Mc(e)||"Unknown",l));return H({},n,r)}function Qr(e){return e=(e=e.stateNode)&&e.__reactInternalMemoizedMergedChildContext||vt,Lt=oe.current,D(oe,e),D(me,me.current),!0}function vo(e,t,n){var r=e.stateNode;if(!r)throw Error(y(169));n?(e=bs(e,t,Lt),r.__reactInternalMemoizedMergedChildContext=e,U(me),U(oe),D(oe,e)):U(me),D(me,n)}var We=null,fl=!1,$l=!1;function ea(e){We===null?We=[e]:We.push(e)}function qf(e){fl=!0,ea(e)}function wt(){if(!$l&&We!==null){$l=!0;var e=0,t=M;try{var n=We;for(M=1;e<n.length;e++){var r=n[e];do r=r(!0);while(r!==null)}We=null,fl=!1}catch(l){throw We!==null&&(We=We.slice(e+1)),_s(qu,wt),l}finally{M=t,$l=!1}}return null}var Kt=[],Yt=0,Kr=null,Yr=0,Ce=[],_e=0,Tt=null,He=1,Qe="";function xt(e,t){Kt[Yt++]=Yr,Kt[Yt++]=Kr,Kr=e,Yr=t}function ta(e,t,n){Ce[_e++]=He,Ce[_e++]=Qe,Ce[_e++]=Tt,Tt=e;var r=He;e=Qe;var l=32-Me(r)-1;r&=~(1<<l),n+=1;var u=32-Me(t)+l;if(30<u){var i=l-l%5;u=(r&(1<<i)-1).toString(32),r>>=i,l-=i,He=1<<32-Me(t)+l|n<<l|r,Qe=u+e}else He=1<<u|n<<l|r,Qe=e}function oi(e){e.return!==null&&(xt(e,1),ta(e,1,0))}function si(e){for(;e===Kr;)Kr=Kt[--Yt],Kt[Yt]=null,Yr=Kt[--Yt],Kt[Yt]=null;for(;e===Tt;)Tt=Ce[--_e],Ce[_e]=null,Qe=Ce[--_e],Ce[_e]=null,He=Ce[--_e],Ce[_e]=null}var Se=null,we=null,A=!1,Oe=null;function na(e,t){var n=Ne(5,null,null,0);n.elementType="DELETED",n.stateNode=t,n.return=e,t=e.deletions,t===null?(e.deletions=[n],e.flags|=16):t.push(n)}function yo(e,t){switch(e.tag){case 5:var n=e.type;return t=t.nodeType!==1||n.toLowerCase()!==t.nodeName.toLowerCase()?null:t,t!==null?(e.stateNode=t,Se=e,we=ct(t.firstChild),!0):!1;case 6:return t=e.pendingProps===""||t.nodeType!==3?null:t,t!==null?(e.stateNode=t,Se=e,we=null,!0):!1;case 13:return t=t.nodeType!==8?null:t,t!==null?(n=Tt!==null?{id:He,overflow:Qe}:null,e.memoizedState={dehydrated:t,treeContext:n,retryLane:1073741824},n=Ne(18,null,null,0),n.stateNode=t,n.return=e,e.child=n,Se=e,we=null,!0):!1;default:return!1}}function xu(e){return(e.mode&1)!==0&&(e.flags&128)===0}function Eu(e){if(A){var t=we;if(t){var n=t;if(!yo(e,t)){if(xu(e))throw Error(y(418));t=ct(n.nextSibling);var r=Se;t&&yo(e,t)?na(r,n):(e.flags=e.flags&-4097|2,A=!1,Se=e)}}else{if(xu(e))throw Error(y(418));e.flags=e.flags&-4097|2,A=!1,Se=e}}}function go(e){for(e=e.return;e!==null&&e.tag!==5&&e.tag!==3&&e.tag!==13;)e=e.return;Se=e}function yr(e){if(e!==Se)return!1;if(!A)return go(e),A=!0,!1;var t;if((t=e.tag!==3)&&!(t=e.tag!==5)&&(t=e.type,t=t!=="head"&&t!=="body"&&!gu(e.type,e.memoizedProps)),t&&(t=we)){if(xu(e))throw ra(),Error(y(418));for(;t;)na(e,t),t=ct(t.nextSibling)}if(go(e),e.tag===13){if(e=e.memoizedState,e=e!==null?e.dehydrated:null,!e)throw Error(y(317));e:{for(e=e.nextSibling,t=0;e;){if(e.nodeType===8){var n=e.data;if(n==="/$"){if(t===0){we=ct(e.nextSibling);break e}t--}else n!=="$"&&n!=="$!"&&n!=="$?"||t++}e=e.nextSibling}we=null}}else we=Se?ct(e.stateNode.nextSibling):null;return!0}function ra(){for(var e=we;e;)e=ct(e.nextSibling)}function un(){we=Se=null,A=!1}function ai(e){Oe===null?Oe=[e]:Oe.push(e)}var bf=Je.ReactCurrentBatchConfig;function Sn(e,t,n){if(e=n.ref,e!==null&&typeof e!="function"&&typeof e!="object"){if(n._owner){if(n=n._owner,n){if(n.tag!==1)throw Error(y(309));var r=n.stateNode}if(!r)throw Error(y(147,e));var l=r,u=""+e;return t!==null&&t.ref!==null&&typeof t.ref=="function"&&t.ref._stringRef===u?t.ref:(t=function(i){var o=l.refs;i===null?delete o[u]:o[u]=i},t._stringRef=u,t)}if(typeof e!="string")throw Error(y(284));if(!n._owner)throw Error(y(290,e))}return e}function gr(e,t){throw e=Object.prototype.toString.call(t),Error(y(31,e==="[object Object]"?"object with keys {"+Object.keys(t).join(", ")+"}":e))}function wo(e){var t=e._init;return t(e._payload)}function la(e){function t(c,a){if(e){var d=c.deletions;d===null?(c.deletions=[a],c.flags|=16):d.push(a)}}function n(c,a){if(!e)return null;for(;a!==null;)t(c,a),a=a.sibling;return null}function r(c,a){for(c=new Map;a!==null;)a.key!==null?c.set(a.key,a):c.set(a.index,a),a=a.sibling;return c}function l(c,a){return c=mt(c,a),c.index=0,c.sibling=null,c}function u(c,a,d){return c.index=d,e?(d=c.alternate,d!==null?(d=d.index,d<a?(c.flags|=2,a):d):(c.flags|=2,a)):(c.flags|=1048576,a)}function i(c){return e&&c.alternate===null&&(c.flags|=2),c}function o(c,a,d,v){return a===null||a.tag!==6?(a=Kl(d,c.mode,v),a.return=c,a):(a=l(a,d),a.return=c,a)}function s(c,a,d,v){var E=d.type;return E===At?h(c,a,d.props.children,v,d.key):a!==null&&(a.elementType===E||typeof E=="object"&&E!==null&&E.$$typeof===tt&&wo(E)===a.type)?(v=l(a,d.props),v.ref=Sn(c,a,d),v.return=c,v):(v=Mr(d.type,d.key,d.props,null,c.mode,v),v.ref=Sn(c,a,d),v.return=c,v)}function f(c,a,d,v){return a===null||a.tag!==4||a.stateNode.containerInfo!==d.containerInfo||a.stateNode.implementation!==d.implementation?(a=Yl(d,c.mode,v),a.return=c,a):(a=l(a,d.children||[]),a.return=c,a)}function h(c,a,d,v,E){return a===null||a.tag!==7?(a=zt(d,c.mode,v,E),a.return=c,a):(a=l(a,d),a.return=c,a)}function m(c,a,d){if(typeof a=="string"&&a!==""||typeof a=="number")return a=Kl(""+a,c.mode,d),a.return=c,a;if(typeof a=="object"&&a!==null){switch(a.$$typeof){case or:return d=Mr(a.type,a.key,a.props,null,c.mode,d),d.ref=Sn(c,null,a),d.return=c,d;case $t:return a=Yl(a,c.mode,d),a.return=c,a;case tt:var v=a._init;return m(c,v(a._payload),d)}if(Cn(a)||hn(a))return a=zt(a,c.mode,d,null),a.return=c,a;gr(c,a)}return null}function p(c,a,d,v){var E=a!==null?a.key:null;if(typeof d=="string"&&d!==""||typeof d=="number")return E!==null?null:o(c,a,""+d,v);if(typeof d=="object"&&d!==null){switch(d.$$typeof){case or:return d.key===E?s(c,a,d,v):null;case $t:return d.key===E?f(c,a,d,v):null;case tt:return E=d._init,p(c,a,E(d._payload),v)}if(Cn(d)||hn(d))return E!==null?null:h(c,a,d,v,null);gr(c,d)}return null}function g(c,a,d,v,E){if(typeof v=="string"&&v!==""||typeof v=="number")return c=c.get(d)||null,o(a,c,""+v,E);if(typeof v=="object"&&v!==null){switch(v.$$typeof){case or:return c=c.get(v.key===null?d:v.key)||null,s(a,c,v,E);case $t:return c=c.get(v.key===null?d:v.key)||null,f(a,c,v,E);case tt:var P=v._init;return g(c,a,d,P(v._payload),E)}if(Cn(v)||hn(v))return c=c.get(d)||null,h(a,c,v,E,null);gr(a,v)}return null}function w(c,a,d,v){for(var E=null,P=null,N=a,z=a=0,V=null;N!==null&&z<d.length;z++){N.index>z?(V=N,N=null):V=N.sibling;var j=p(c,N,d[z],v);if(j===null){N===null&&(N=V);break}e&&N&&j.alternate===null&&t(c,N),a=u(j,a,z),P===null?E=j:P.sibling=j,P=j,N=V}if(z===d.length)return n(c,N),A&&xt(c,z),E;if(N===null){for(;z<d.length;z++)N=m(c,d[z],v),N!==null&&(a=u(N,a,z),P===null?E=N:P.sibling=N,P=N);return A&&xt(c,z),E}for(N=r(c,N);z<d.length;z++)V=g(N,c,z,d[z],v),V!==null&&(e&&V.alternate!==null&&N.delete(V.key===null?z:V.key),a=u(V,a,z),P===null?E=V:P.sibling=V,P=V);return e&&N.forEach(function(ye){return t(c,ye)}),A&&xt(c,z),E}function k(c,a,d,v){var E=hn(d);if(typeof E!="function")throw Error(y(150));if(d=E.call(d),d==null)throw Error(y(151));for(var P=E=null,N=a,z=a=0,V=null,j=d.next();N!==null&&!j.done;z++,j=d.next()){N.index>z?(V=N,N=null):V=N.sibling;var ye=p(c,N,j.value,v);if(ye===null){N===null&&(N=V);break}e&&N&&ye.alternate===null&&t(c,N),a=u(ye,a,z),P===null?E=ye:P.sibling=ye,P=ye,N=V}if(j.done)return n(c,N),A&&xt(c,z),E;if(N===null){for(;!j.done;z++,j=d.next())j=m(c,j.value,v),j!==null&&(a=u(j,a,z),P===null?E=j:P.sibling=j,P=j);return A&&xt(c,z),E}for(N=r(c,N);!j.done;z++,j=d.next())j=g(N,c,z,j.value,v),j!==null&&(e&&j.alternate!==null&&N.delete(j.key===null?z:j.key),a=u(j,a,z),P===null?E=j:P.sibling=j,P=j);return e&&N.forEach(function(qe){return t(c,qe)}),A&&xt(c,z),E}function I(c,a,d,v){if(typeof d=="object"&&d!==null&&d.type===At&&d.key===null&&(d=d.props.children),typeof d=="object"&&d!==null){switch(d.$$typeof){case or:e:{for(var E=d.key,P=a;P!==null;){if(P.key===E){if(E=d.type,E===At){if(P.tag===7){n(c,P.sibling),a=l(P,d.props.children),a.return=c,c=a;break e}}else if(P.elementType===E||typeof E=="object"&&E!==null&&E.$$typeof===tt&&wo(E)===P.type){n(c,P.sibling),a=l(P,d.props),a.ref=Sn(c,P,d),a.return=c,c=a;break e}n(c,P);break}else t(c,P);P=P.sibling}d.type===At?(a=zt(d.props.children,c.mode,v,d.key),a.return=c,c=a):(v=Mr(d.type,d.key,d.props,null,c.mode,v),v.ref=Sn(c,a,d),v.return=c,c=v)}return i(c);case $t:e:{for(P=d.key;a!==null;){if(a.key===P)if(a.tag===4&&a.stateNode.containerInfo===d.containerInfo&&a.stateNode.implementation===d.implementation){n(c,a.sibling),a=l(a,d.children||[]),a.return=c,c=a;break e}else{n(c,a);break}else t(c,a);a=a.sibling}a=Yl(d,c.mode,v),a.return=c,c=a}return i(c);case tt:return P=d._init,I(c,a,P(d._payload),v)}if(Cn(d))return w(c,a,d,v);if(hn(d))return k(c,a,d,v);gr(c,d)}return typeof d=="string"&&d!==""||typeof d=="number"?(d=""+d,a!==null&&a.tag===6?(n(c,a.sibling),a=l(a,d),a.return=c,c=a):(n(c,a),a=Kl(d,c.mode,v),a.return=c,c=a),i(c)):n(c,a)}return I}var on=la(!0),ua=la(!1),Xr=gt(null),Gr=null,Xt=null,ci=null;function fi(){ci=Xt=Gr=null}function di(e){var t=Xr.current;U(Xr),e._currentValue=t}function Cu(e,t,n){for(;e!==null;){var r=e.alternate;if((e.childLanes&t)!==t?(e.childLanes|=t,r!==null&&(r.childLanes|=t)):r!==null&&(r.childLanes&t)!==t&&(r.childLanes|=t),e===n)break;e=e.return}}function tn(e,t){Gr=e,ci=Xt=null,e=e.dependencies,e!==null&&e.firstContext!==null&&(e.lanes&t&&(pe=!0),e.firstContext=null)}function ze(e){var t=e._currentValue;if(ci!==e)if(e={context:e,memoizedValue:t,next:null},Xt===null){if(Gr===null)throw Error(y(308));Xt=e,Gr.dependencies={lanes:0,firstContext:e}}else Xt=Xt.next=e;return t}var _t=null;function pi(e){_t===null?_t=[e]:_t.push(e)}function ia(e,t,n,r){var l=t.interleaved;return l===null?(n.next=n,pi(t)):(n.next=l.next,l.next=n),t.interleaved=n,Ge(e,r)}function Ge(e,t){e.lanes|=t;var n=e.alternate;for(n!==null&&(n.lanes|=t),n=e,e=e.return;e!==null;)e.childLanes|=t,n=e.alternate,n!==null&&(n.childLanes|=t),n=e,e=e.return;return n.tag===3?n.stateNode:null}var nt=!1;function mi(e){e.updateQueue={baseState:e.memoizedState,firstBaseUpdate:null,lastBaseUpdate:null,shared:{pending:null,interleaved:null,lanes:0},effects:null}}function oa(e,t){e=e.updateQueue,t.updateQueue===e&&(t.updateQueue={baseState:e.baseState,firstBaseUpdate:e.firstBaseUpdate,lastBaseUpdate:e.lastBaseUpdate,shared:e.shared,effects:e.effects})}function Ke(e,t){return{eventTime:e,lane:t,tag:0,payload:null,callback:null,next:null}}function ft(e,t,n){var r=e.updateQueue;if(r===null)return null;if(r=r.shared,O&2){var l=r.pending;return l===null?t.next=t:(t.next=l.next,l.next=t),r.pending=t,Ge(e,n)}return l=r.interleaved,l===null?(t.next=t,pi(r)):(t.next=l.next,l.next=t),r.interleaved=t,Ge(e,n)}function zr(e,t,n){if(t=t.updateQueue,t!==null&&(t=t.shared,(n&4194240)!==0)){var r=t.lanes;r&=e.pendingLanes,n|=r,t.lanes=n,bu(e,n)}}function So(e,t){var n=e.updateQueue,r=e.alternate;if(r!==null&&(r=r.updateQueue,n===r)){var l=null,u=null;if(n=n.firstBaseUpdate,n!==null){do{var i={eventTime:n.eventTime,lane:n.lane,tag:n.tag,payload:n.payload,callback:n.callback,next:null};u===null?l=u=i:u=u.next=i,n=n.next}while(n!==null);u===null?l=u=t:u=u.next=t}else l=u=t;n={baseState:r.baseState,firstBaseUpdate:l,lastBaseUpdate:u,shared:r.shared,effects:r.effects},e.updateQueue=n;return}e=n.lastBaseUpdate,e===null?n.firstBaseUpdate=t:e.next=t,n.lastBaseUpdate=t}function Zr(e,t,n,r){var l=e.updateQueue;nt=!1;var u=l.firstBaseUpdate,i=l.lastBaseUpdate,o=l.shared.pending;if(o!==null){l.shared.pending=null;var s=o,f=s.next;s.next=null,i===null?u=f:i.next=f,i=s;var h=e.alternate;h!==null&&(h=h.updateQueue,o=h.lastBaseUpdate,o!==i&&(o===null?h.firstBaseUpdate=f:o.next=f,h.lastBaseUpdate=s))}if(u!==null){var m=l.baseState;i=0,h=f=s=null,o=u;do{var p=o.lane,g=o.eventTime;if((r&p)===p){h!==null&&(h=h.next={eventTime:g,lane:0,tag:o.tag,payload:o.payload,callback:o.callback,next:null});e:{var w=e,k=o;switch(p=t,g=n,k.tag){case 1:if(w=k.payload,typeof w=="function"){m=w.call(g,m,p);break e}m=w;break e;case 3:w.flags=w.flags&-65537|128;case 0:if(w=k.payload,p=typeof w=="function"?w.call(g,m,p):w,p==null)break e;m=H({},m,p);break e;case 2:nt=!0}}o.callback!==null&&o.lane!==0&&(e.flags|=64,p=l.effects,p===null?l.effects=[o]:p.push(o))}else g={eventTime:g,lane:p,tag:o.tag,payload:o.payload,callback:o.callback,next:null},h===null?(f=h=g,s=m):h=h.next=g,i|=p;if(o=o.next,o===null){if(o=l.shared.pending,o===null)break;p=o,o=p.next,p.next=null,l.lastBaseUpdate=p,l.shared.pending=null}}while(!0);if(h===null&&(s=m),l.baseState=s,l.firstBaseUpdate=f,l.lastBaseUpdate=h,t=l.shared.interleaved,t!==null){l=t;do i|=l.lane,l=l.next;while(l!==t)}else u===null&&(l.shared.lanes=0);Rt|=i,e.lanes=i,e.memoizedState=m}}function ko(e,t,n){if(e=t.effects,t.effects=null,e!==null)for(t=0;t<e.length;t++){var r=e[t],l=r.callback;if(l!==null){if(r.callback=null,r=n,typeof l!="function")throw Error(y(191,l));l.call(r)}}}var rr={},Ve=gt(rr),Yn=gt(rr),Xn=gt(rr);function Nt(e){if(e===rr)throw Error(y(174));return e}function hi(e,t){switch(D(Xn,t),D(Yn,e),D(Ve,rr),e=t.nodeType,e){case 9:case 11:t=(t=t.documentElement)?t.namespaceURI:lu(null,"");break;default:e=e===8?t.parentNode:t,t=e.namespaceURI||null,e=e.tagName,t=lu(t,e)}U(Ve),D(Ve,t)}function sn(){U(Ve),U(Yn),U(Xn)}function sa(e){Nt(Xn.current);var t=Nt(Ve.current),n=lu(t,e.type);t!==n&&(D(Yn,e),D(Ve,n))}function vi(e){Yn.current===e&&(U(Ve),U(Yn))}var B=gt(0);function Jr(e){for(var t=e;t!==null;){if(t.tag===13){var n=t.memoizedState;if(n!==null&&(n=n.dehydrated,n===null||n.data==="$?"||n.data==="$!"))return t}else if(t.tag===19&&t.memoizedProps.revealOrder!==void 0){if(t.flags&128)return t}else if(t.child!==null){t.child.return=t,t=t.child;continue}if(t===e)break;for(;t.sibling===null;){if(t.return===null||t.return===e)return null;t=t.return}t.sibling.return=t.return,t=t.sibling}return null}var Al=[];function yi(){for(var e=0;e<Al.length;e++)Al[e]._workInProgressVersionPrimary=null;Al.length=0}var Lr=Je.ReactCurrentDispatcher,Vl=Je.ReactCurrentBatchConfig,jt=0,W=null,G=null,J=null,qr=!1,Rn=!1,Gn=0,ed=0;function re(){throw Error(y(321))}function gi(e,t){if(t===null)return!1;for(var n=0;n<t.length&&n<e.length;n++)if(!De(e[n],t[n]))return!1;return!0}function wi(e,t,n,r,l,u){if(jt=u,W=t,t.memoizedState=null,t.updateQueue=null,t.lanes=0,Lr.current=e===null||e.memoizedState===null?ld:ud,e=n(r,l),Rn){u=0;do{if(Rn=!1,Gn=0,25<=u)throw Error(y(301));u+=1,J=G=null,t.updateQueue=null,Lr.current=id,e=n(r,l)}while(Rn)}if(Lr.current=br,t=G!==null&&G.next!==null,jt=0,J=G=W=null,qr=!1,t)throw Error(y(300));return e}function Si(){var e=Gn!==0;return Gn=0,e}function Ue(){var e={memoizedState:null,baseState:null,baseQueue:null,queue:null,next:null};return J===null?W.memoizedState=J=e:J=J.next=e,J}function Le(){if(G===null){var e=W.alternate;e=e!==null?e.memoizedState:null}else e=G.next;var t=J===null?W.memoizedState:J.next;if(t!==null)J=t,G=e;else{if(e===null)throw Error(y(310));G=e,e={memoizedState:G.memoizedState,baseState:G.baseState,baseQueue:G.baseQueue,queue:G.queue,next:null},J===null?W.memoizedState=J=e:J=J.next=e}return J}function Zn(e,t){return typeof t=="function"?t(e):t}function Bl(e){var t=Le(),n=t.queue;if(n===null)throw Error(y(311));n.lastRenderedReducer=e;var r=G,l=r.baseQueue,u=n.pending;if(u!==null){if(l!==null){var i=l.next;l.next=u.next,u.next=i}r.baseQueue=l=u,n.pending=null}if(l!==null){u=l.next,r=r.baseState;var o=i=null,s=null,f=u;do{var h=f.lane;if((jt&h)===h)s!==null&&(s=s.next={lane:0,action:f.action,hasEagerState:f.hasEagerState,eagerState:f.eagerState,next:null}),r=f.hasEagerState?f.eagerState:e(r,f.action);else{var m={lane:h,action:f.action,hasEagerState:f.hasEagerState,eagerState:f.eagerState,next:null};s===null?(o=s=m,i=r):s=s.next=m,W.lanes|=h,Rt|=h}f=f.next}while(f!==null&&f!==u);s===null?i=r:s.next=o,De(r,t.memoizedState)||(pe=!0),t.memoizedState=r,t.baseState=i,t.baseQueue=s,n.lastRenderedState=r}if(e=n.interleaved,e!==null){l=e;do u=l.lane,W.lanes|=u,Rt|=u,l=l.next;while(l!==e)}else l===null&&(n.lanes=0);return[t.memoizedState,n.dispatch]}function Wl(e){var t=Le(),n=t.queue;if(n===null)throw Error(y(311));n.lastRenderedReducer=e;var r=n.dispatch,l=n.pending,u=t.memoizedState;if(l!==null){n.pending=null;var i=l=l.next;do u=e(u,i.action),i=i.next;while(i!==l);De(u,t.memoizedState)||(pe=!0),t.memoizedState=u,t.baseQueue===null&&(t.baseState=u),n.lastRenderedState=u}return[u,r]}function aa(){}function ca(e,t){var n=W,r=Le(),l=t(),u=!De(r.memoizedState,l);if(u&&(r.memoizedState=l,pe=!0),r=r.queue,ki(pa.bind(null,n,r,e),[e]),r.getSnapshot!==t||u||J!==null&&J.memoizedState.tag&1){if(n.flags|=2048,Jn(9,da.bind(null,n,r,l,t),void 0,null),q===null)throw Error(y(349));jt&30||fa(n,t,l)}return l}function fa(e,t,n){e.flags|=16384,e={getSnapshot:t,value:n},t=W.updateQueue,t===null?(t={lastEffect:null,stores:null},W.updateQueue=t,t.stores=[e]):(n=t.stores,n===null?t.stores=[e]:n.push(e))}function da(e,t,n,r){t.value=n,t.getSnapshot=r,ma(t)&&ha(e)}function pa(e,t,n){return n(function(){ma(t)&&ha(e)})}function ma(e){var t=e.getSnapshot;e=e.value;try{var n=t();return!De(e,n)}catch{return!0}}function ha(e){var t=Ge(e,1);t!==null&&Ie(t,e,1,-1)}function xo(e){var t=Ue();return typeof e=="function"&&(e=e()),t.memoizedState=t.baseState=e,e={pending:null,interleaved:null,lanes:0,dispatch:null,lastRenderedReducer:Zn,lastRenderedState:e},t.queue=e,e=e.dispatch=rd.bind(null,W,e),[t.memoizedState,e]}function Jn(e,t,n,r){return e={tag:e,create:t,destroy:n,deps:r,next:null},t=W.updateQueue,t===null?(t={lastEffect:null,stores:null},W.updateQueue=t,t.lastEffect=e.next=e):(n=t.lastEffect,n===null?t.lastEffect=e.next=e:(r=n.next,n.next=e,e.next=r,t.lastEffect=e)),e}function va(){return Le().memoizedState}function Tr(e,t,n,r){var l=Ue();W.flags|=e,l.memoizedState=Jn(1|t,n,void 0,r===void 0?null:r)}function dl(e,t,n,r){var l=Le();r=r===void 0?null:r;var u=void 0;if(G!==null){var i=G.memoizedState;if(u=i.destroy,r!==null&&gi(r,i.deps)){l.memoizedState=Jn(t,n,u,r);return}}W.flags|=e,l.memoizedState=Jn(1|t,n,u,r)}function Eo(e,t){return Tr(8390656,8,e,t)}function ki(e,t){return dl(2048,8,e,t)}function ya(e,t){return dl(4,2,e,t)}function ga(e,t){return dl(4,4,e,t)}function wa(e,t){if(typeof t=="function")return e=e(),t(e),function(){t(null)};if(t!=null)return e=e(),t.current=e,function(){t.current=null}}function Sa(e,t,n){return n=n!=null?n.concat([e]):null,dl(4,4,wa.bind(null,t,e),n)}function xi(){}function ka(e,t){var n=Le();t=t===void 0?null:t;var r=n.memoizedState;return r!==null&&t!==null&&gi(t,r[1])?r[0]:(n.memoizedState=[e,t],e)}function xa(e,t){var n=Le();t=t===void 0?null:t;var r=n.memoizedState;return r!==null&&t!==null&&gi(t,r[1])?r[0]:(e=e(),n.memoizedState=[e,t],e)}function Ea(e,t,n){return jt&21?(De(n,t)||(n=zs(),W.lanes|=n,Rt|=n,e.baseState=!0),t):(e.baseState&&(e.baseState=!1,pe=!0),e.memoizedState=n)}function td(e,t){var n=M;M=n!==0&&4>n?n:4,e(!0);var r=Vl.transition;Vl.transition={};try{e(!1),t()}finally{M=n,Vl.transition=r}}function Ca(){return Le().memoizedState}function nd(e,t,n){var r=pt(e);if(n={lane:r,action:n,hasEagerState:!1,eagerState:null,next:null},_a(e))Na(t,n);else if(n=ia(e,t,n,r),n!==null){var l=ae();Ie(n,e,r,l),Pa(n,t,r)}}function rd(e,t,n){var r=pt(e),l={lane:r,action:n,hasEagerState:!1,eagerState:null,next:null};if(_a(e))Na(t,l);else{var u=e.alternate;if(e.lanes===0&&(u===null||u.lanes===0)&&(u=t.lastRenderedReducer,u!==null))try{var i=t.lastRenderedState,o=u(i,n);if(l.hasEagerState=!0,l.eagerState=o,De(o,i)){var s=t.interleaved;s===null?(l.next=l,pi(t)):(l.next=s.next,s.next=l),t.interleaved=l;return}}catch{}finally{}n=ia(e,t,l,r),n!==null&&(l=ae(),Ie(n,e,r,l),Pa(n,t,r))}}function _a(e){var t=e.alternate;return e===W||t!==null&&t===W}function Na(e,t){Rn=qr=!0;var n=e.pending;n===null?t.next=t:(t.next=n.next,n.next=t),e.pending=t}function Pa(e,t,n){if(n&4194240){var r=t.lanes;r&=e.pendingLanes,n|=r,t.lanes=n,bu(e,n)}}var br={readContext:ze,useCallback:re,useContext:re,useEffect:re,useImperativeHandle:re,useInsertionEffect:re,useLayoutEffect:re,useMemo:re,useReducer:re,useRef:re,useState:re,useDebugValue:re,useDeferredValue:re,useTransition:re,useMutableSource:re,useSyncExternalStore:re,useId:re,unstable_isNewReconciler:!1},ld={readContext:ze,useCallback:function(e,t){return Ue().memoizedState=[e,t===void 0?null:t],e},useContext:ze,useEffect:Eo,useImperativeHandle:function(e,t,n){return n=n!=null?n.concat([e]):null,Tr(4194308,4,wa.bind(null,t,e),n)},useLayoutEffect:function(e,t){return Tr(4194308,4,e,t)},useInsertionEffect:function(e,t){return Tr(4,2,e,t)},useMemo:function(e,t){var n=Ue();return t=t===void 0?null:t,e=e(),n.memoizedState=[e,t],e},useReducer:function(e,t,n){var r=Ue();return t=n!==void 0?n(t):t,r.memoizedState=r.baseState=t,e={pending:null,interleaved:null,lanes:0,dispatch:null,lastRenderedReducer:e,lastRenderedState:t},r.queue=e,e=e.dispatch=nd.bind(null,W,e),[r.memoizedState,e]},useRef:function(e){var t=Ue();return e={current:e},t.memoizedState=e},useState:xo,useDebugValue:xi,useDeferredValue:function(e){return Ue().memoizedState=e},useTransition:function(){var e=xo(!1),t=e[0];return e=td.bind(null,e[1]),Ue().memoizedState=e,[t,e]},useMutableSource:function(){},useSyncExternalStore:function(e,t,n){var r=W,l=Ue();if(A){if(n===void 0)throw Error(y(407));n=n()}else{if(n=t(),q===null)throw Error(y(349));jt&30||fa(r,t,n)}l.memoizedState=n;var u={value:n,getSnapshot:t};return l.queue=u,Eo(pa.bind(null,r,u,e),[e]),r.flags|=2048,Jn(9,da.bind(null,r,u,n,t),void 0,null),n},useId:function(){var e=Ue(),t=q.identifierPrefix;if(A){var n=Qe,r=He;n=(r&~(1<<32-Me(r)-1)).toString(32)+n,t=":"+t+"R"+n,n=Gn++,0<n&&(t+="H"+n.toString(32)),t+=":"}else n=ed++,t=":"+t+"r"+n.toString(32)+":";return e.memoizedState=t},unstable_isNewReconciler:!1},ud={readContext:ze,useCallback:ka,useContext:ze,useEffect:ki,useImperativeHandle:Sa,useInsertionEffect:ya,useLayoutEffect:ga,useMemo:xa,useReducer:Bl,useRef:va,useState:function(){return Bl(Zn)},useDebugValue:xi,useDeferredValue:function(e){var t=Le();return Ea(t,G.memoizedState,e)},useTransition:function(){var e=Bl(Zn)[0],t=Le().memoizedState;return[e,t]},useMutableSource:aa,useSyncExternalStore:ca,useId:Ca,unstable_isNewReconciler:!1},id={readContext:ze,useCallback:ka,useContext:ze,useEffect:ki,useImperativeHandle:Sa,useInsertionEffect:ya,useLayoutEffect:ga,useMemo:xa,useReducer:Wl,useRef:va,useState:function(){return Wl(Zn)},useDebugValue:xi,useDeferredValue:function(e){var t=Le();return G===null?t.memoizedState=e:Ea(t,G.memoizedState,e)},useTransition:function(){var e=Wl(Zn)[0],t=Le().memoizedState;return[e,t]},useMutableSource:aa,useSyncExternalStore:ca,useId:Ca,unstable_isNewReconciler:!1};function je(e,t){if(e&&e.defaultProps){t=H({},t),e=e.defaultProps;for(var n in e)t[n]===void 0&&(t[n]=e[n]);return t}return t}function _u(e,t,n,r){t=e.memoizedState,n=n(r,t),n=n==null?t:H({},t,n),e.memoizedState=n,e.lanes===0&&(e.updateQueue.baseState=n)}var pl={isMounted:function(e){return(e=e._reactInternals)?It(e)===e:!1},enqueueSetState:function(e,t,n){e=e._reactInternals;var r=ae(),l=pt(e),u=Ke(r,l);u.payload=t,n!=null&&(u.callback=n),t=ft(e,u,l),t!==null&&(Ie(t,e,l,r),zr(t,e,l))},enqueueReplaceState:function(e,t,n){e=e._reactInternals;var r=ae(),l=pt(e),u=Ke(r,l);u.tag=1,u.payload=t,n!=null&&(u.callback=n),t=ft(e,u,l),t!==null&&(Ie(t,e,l,r),zr(t,e,l))},enqueueForceUpdate:function(e,t){e=e._reactInternals;var n=ae(),r=pt(e),l=Ke(n,r);l.tag=2,t!=null&&(l.callback=t),t=ft(e,l,r),t!==null&&(Ie(t,e,r,n),zr(t,e,r))}};function Co(e,t,n,r,l,u,i){return e=e.stateNode,typeof e.shouldComponentUpdate=="function"?e.shouldComponentUpdate(r,u,i):t.prototype&&t.prototype.isPureReactComponent?!Wn(n,r)||!Wn(l,u):!0}function za(e,t,n){var r=!1,l=vt,u=t.contextType;return typeof u=="object"&&u!==null?u=ze(u):(l=he(t)?Lt:oe.current,r=t.contextTypes,u=(r=r!=null)?ln(e,l):vt),t=new t(n,u),e.memoizedState=t.state!==null&&t.state!==void 0?t.state:null,t.updater=pl,e.stateNode=t,t._reactInternals=e,r&&(e=e.stateNode,e.__reactInternalMemoizedUnmaskedChildContext=l,e.__reactInternalMemoizedMaskedChildContext=u),t}function _o(e,t,n,r){e=t.state,typeof t.componentWillReceiveProps=="function"&&t.componentWillReceiveProps(n,r),typeof t.UNSAFE_componentWillReceiveProps=="function"&&t.UNSAFE_componentWillReceiveProps(n,r),t.state!==e&&pl.enqueueReplaceState(t,t.state,null)}function Nu(e,t,n,r){var l=e.stateNode;l.props=n,l.state=e.memoizedState,l.refs={},mi(e);var u=t.contextType;typeof u=="object"&&u!==null?l.context=ze(u):(u=he(t)?Lt:oe.current,l.context=ln(e,u)),l.state=e.memoizedState,u=t.getDerivedStateFromProps,typeof u=="function"&&(_u(e,t,u,n),l.state=e.memoizedState),typeof t.getDerivedStateFromProps=="function"||typeof l.getSnapshotBeforeUpdate=="function"||typeof l.UNSAFE_componentWillMount!="function"&&typeof l.componentWillMount!="function"||(t=l.state,typeof l.componentWillMount=="function"&&l.componentWillMount(),typeof l.UNSAFE_componentWillMount=="function"&&l.UNSAFE_componentWillMount(),t!==l.state&&pl.enqueueReplaceState(l,l.state,null),Zr(e,n,l,r),l.state=e.memoizedState),typeof l.componentDidMount=="function"&&(e.flags|=4194308)}function an(e,t){try{var n="",r=t;do n+=Oc(r),r=r.return;while(r);var l=n}catch(u){l=`
-Error generating stack: `+u.message+`
-`+u.stack}return{value:e,source:t,stack:l,digest:null}}function Hl(e,t,n){return{value:e,source:null,stack:n??null,digest:t??null}}function Pu(e,t){try{console.error(t.value)}catch(n){setTimeout(function(){throw n})}}var od=typeof WeakMap=="function"?WeakMap:Map;function La(e,t,n){n=Ke(-1,n),n.tag=3,n.payload={element:null};var r=t.value;return n.callback=function(){tl||(tl=!0,Fu=r),Pu(e,t)},n}function Ta(e,t,n){n=Ke(-1,n),n.tag=3;var r=e.type.getDerivedStateFromError;if(typeof r=="function"){var l=t.value;n.payload=function(){return r(l)},n.callback=function(){Pu(e,t)}}var u=e.stateNode;return u!==null&&typeof u.componentDidCatch=="function"&&(n.callback=function(){Pu(e,t),typeof r!="function"&&(dt===null?dt=new Set([this]):dt.add(this));var i=t.stack;this.componentDidCatch(t.value,{componentStack:i!==null?i:""})}),n}function No(e,t,n){var r=e.pingCache;if(r===null){r=e.pingCache=new od;var l=new Set;r.set(t,l)}else l=r.get(t),l===void 0&&(l=new Set,r.set(t,l));l.has(n)||(l.add(n),e=kd.bind(null,e,t,n),t.then(e,e))}function Po(e){do{var t;if((t=e.tag===13)&&(t=e.memoizedState,t=t!==null?t.dehydrated!==null:!0),t)return e;e=e.return}while(e!==null);return null}function zo(e,t,n,r,l){return e.mode&1?(e.flags|=65536,e.lanes=l,e):(e===t?e.flags|=65536:(e.flags|=128,n.flags|=131072,n.flags&=-52805,n.tag===1&&(n.alternate===null?n.tag=17:(t=Ke(-1,1),t.tag=2,ft(n,t,1))),n.lanes|=1),e)}var sd=Je.ReactCurrentOwner,pe=!1;function se(e,t,n,r){t.child=e===null?ua(t,null,n,r):on(t,e.child,n,r)}function Lo(e,t,n,r,l){n=n.render;var u=t.ref;return tn(t,l),r=wi(e,t,n,r,u,l),n=Si(),e!==null&&!pe?(t.updateQueue=e.updateQueue,t.flags&=-2053,e.lanes&=~l,Ze(e,t,l)):(A&&n&&oi(t),t.flags|=1,se(e,t,r,l),t.child)}function To(e,t,n,r,l){if(e===null){var u=n.type;return typeof u=="function"&&!Ti(u)&&u.defaultProps===void 0&&n.compare===null&&n.defaultProps===void 0?(t.tag=15,t.type=u,ja(e,t,u,r,l)):(e=Mr(n.type,null,r,t,t.mode,l),e.ref=t.ref,e.return=t,t.child=e)}if(u=e.child,!(e.lanes&l)){var i=u.memoizedProps;if(n=n.compare,n=n!==null?n:Wn,n(i,r)&&e.ref===t.ref)return Ze(e,t,l)}return t.flags|=1,e=mt(u,r),e.ref=t.ref,e.return=t,t.child=e}function ja(e,t,n,r,l){if(e!==null){var u=e.memoizedProps;if(Wn(u,r)&&e.ref===t.ref)if(pe=!1,t.pendingProps=r=u,(e.lanes&l)!==0)e.flags&131072&&(pe=!0);else return t.lanes=e.lanes,Ze(e,t,l)}return zu(e,t,n,r,l)}function Ra(e,t,n){var r=t.pendingProps,l=r.children,u=e!==null?e.memoizedState:null;if(r.mode==="hidden")if(!(t.mode&1))t.memoizedState={baseLanes:0,cachePool:null,transitions:null},D(Zt,ge),ge|=n;else{if(!(n&1073741824))return e=u!==null?u.baseLanes|n:n,t.lanes=t.childLanes=1073741824,t.memoizedState={baseLanes:e,cachePool:null,transitions:null},t.updateQueue=null,D(Zt,ge),ge|=e,null;t.memoizedState={baseLanes:0,cachePool:null,transitions:null},r=u!==null?u.baseLanes:n,D(Zt,ge),ge|=r}else u!==null?(r=u.baseLanes|n,t.memoizedState=null):r=n,D(Zt,ge),ge|=r;return se(e,t,l,n),t.child}function Oa(e,t){var n=t.ref;(e===null&&n!==null||e!==null&&e.ref!==n)&&(t.flags|=512,t.flags|=2097152)}function zu(e,t,n,r,l){var u=he(n)?Lt:oe.current;return u=ln(t,u),tn(t,l),n=wi(e,t,n,r,u,l),r=Si(),e!==null&&!pe?(t.updateQueue=e.updateQueue,t.flags&=-2053,e.lanes&=~l,Ze(e,t,l)):(A&&r&&oi(t),t.flags|=1,se(e,t,n,l),t.child)}function jo(e,t,n,r,l){if(he(n)){var u=!0;Qr(t)}else u=!1;if(tn(t,l),t.stateNode===null)jr(e,t),za(t,n,r),Nu(t,n,r,l),r=!0;else if(e===null){var i=t.stateNode,o=t.memoizedProps;i.props=o;var s=i.context,f=n.contextType;typeof f=="object"&&f!==null?f=ze(f):(f=he(n)?Lt:oe.current,f=ln(t,f));var h=n.getDerivedStateFromProps,m=typeof h=="function"||typeof i.getSnapshotBeforeUpdate=="function";m||typeof i.UNSAFE_componentWillReceiveProps!="function"&&typeof i.componentWillReceiveProps!="function"||(o!==r||s!==f)&&_o(t,i,r,f),nt=!1;var p=t.memoizedState;i.state=p,Zr(t,r,i,l),s=t.memoizedState,o!==r||p!==s||me.current||nt?(typeof h=="function"&&(_u(t,n,h,r),s=t.memoizedState),(o=nt||Co(t,n,o,r,p,s,f))?(m||typeof i.UNSAFE_componentWillMount!="function"&&typeof i.componentWillMount!="function"||(typeof i.componentWillMount=="function"&&i.componentWillMount(),typeof i.UNSAFE_componentWillMount=="function"&&i.UNSAFE_componentWillMount()),typeof i.componentDidMount=="function"&&(t.flags|=4194308)):(typeof i.componentDidMount=="function"&&(t.flags|=4194308),t.memoizedProps=r,t.memoizedState=s),i.props=r,i.state=s,i.context=f,r=o):(typeof i.componentDidMount=="function"&&(t.flags|=4194308),r=!1)}else{i=t.stateNode,oa(e,t),o=t.memoizedProps,f=t.type===t.elementType?o:je(t.type,o),i.props=f,m=t.pendingProps,p=i.context,s=n.contextType,typeof s=="object"&&s!==null?s=ze(s):(s=he(n)?Lt:oe.current,s=ln(t,s));var g=n.getDerivedStateFromProps;(h=typeof g=="function"||typeof i.getSnapshotBeforeUpdate=="function")||typeof i.UNSAFE_componentWillReceiveProps!="function"&&typeof i.componentWillReceiveProps!="function"||(o!==m||p!==s)&&_o(t,i,r,s),nt=!1,p=t.memoizedState,i.state=p,Zr(t,r,i,l);var w=t.memoizedState;o!==m||p!==w||me.current||nt?(typeof g=="function"&&(_u(t,n,g,r),w=t.memoizedState),(f=nt||Co(t,n,f,r,p,w,s)||!1)?(h||typeof i.UNSAFE_componentWillUpdate!="function"&&typeof i.componentWillUpdate!="function"||(typeof i.componentWillUpdate=="function"&&i.componentWillUpdate(r,w,s),typeof i.UNSAFE_componentWillUpdate=="function"&&i.UNSAFE_componentWillUpdate(r,w,s)),typeof i.componentDidUpdate=="function"&&(t.flags|=4),typeof i.getSnapshotBeforeUpdate=="function"&&(t.flags|=1024)):(typeof i.componentDidUpdate!="function"||o===e.memoizedProps&&p===e.memoizedState||(t.flags|=4),typeof i.getSnapshotBeforeUpdate!="function"||o===e.memoizedProps&&p===e.memoizedState||(t.flags|=1024),t.memoizedProps=r,t.memoizedState=w),i.props=r,i.state=w,i.context=s,r=f):(typeof i.componentDidUpdate!="function"||o===e.memoizedProps&&p===e.memoizedState||(t.flags|=4),typeof i.getSnapshotBeforeUpdate!="function"||o===e.memoizedProps&&p===e.memoizedState||(t.flags|=1024),r=!1)}return Lu(e,t,n,r,u,l)}function Lu(e,t,n,r,l,u){Oa(e,t);var i=(t.flags&128)!==0;if(!r&&!i)return l&&vo(t,n,!1),Ze(e,t,u);r=t.stateNode,sd.current=t;var o=i&&typeof n.getDerivedStateFromError!="function"?null:r.render();return t.flags|=1,e!==null&&i?(t.child=on(t,e.child,null,u),t.child=on(t,null,o,u)):se(e,t,o,u),t.memoizedState=r.state,l&&vo(t,n,!0),t.child}function Ma(e){var t=e.stateNode;t.pendingContext?ho(e,t.pendingContext,t.pendingContext!==t.context):t.context&&ho(e,t.context,!1),hi(e,t.containerInfo)}function Ro(e,t,n,r,l){return un(),ai(l),t.flags|=256,se(e,t,n,r),t.child}var Tu={dehydrated:null,treeContext:null,retryLane:0};function ju(e){return{baseLanes:e,cachePool:null,transitions:null}}function Ia(e,t,n){var r=t.pendingProps,l=B.current,u=!1,i=(t.flags&128)!==0,o;if((o=i)||(o=e!==null&&e.memoizedState===null?!1:(l&2)!==0),o?(u=!0,t.flags&=-129):(e===null||e.memoizedState!==null)&&(l|=1),D(B,l&1),e===null)return Eu(t),e=t.memoizedState,e!==null&&(e=e.dehydrated,e!==null)?(t.mode&1?e.data==="$!"?t.lanes=8:t.lanes=1073741824:t.lanes=1,null):(i=r.children,e=r.fallback,u?(r=t.mode,u=t.child,i={mode:"hidden",children:i},!(r&1)&&u!==null?(u.childLanes=0,u.pendingProps=i):u=vl(i,r,0,null),e=zt(e,r,n,null),u.return=t,e.return=t,u.sibling=e,t.child=u,t.child.memoizedState=ju(n),t.memoizedState=Tu,e):Ei(t,i));if(l=e.memoizedState,l!==null&&(o=l.dehydrated,o!==null))return ad(e,t,i,r,o,l,n);if(u){u=r.fallback,i=t.mode,l=e.child,o=l.sibling;var s={mode:"hidden",children:r.children};return!(i&1)&&t.child!==l?(r=t.child,r.childLanes=0,r.pendingProps=s,t.deletions=null):(r=mt(l,s),r.subtreeFlags=l.subtreeFlags&14680064),o!==null?u=mt(o,u):(u=zt(u,i,n,null),u.flags|=2),u.return=t,r.return=t,r.sibling=u,t.child=r,r=u,u=t.child,i=e.child.memoizedState,i=i===null?ju(n):{baseLanes:i.baseLanes|n,cachePool:null,transitions:i.transitions},u.memoizedState=i,u.childLanes=e.childLanes&~n,t.memoizedState=Tu,r}return u=e.child,e=u.sibling,r=mt(u,{mode:"visible",children:r.children}),!(t.mode&1)&&(r.lanes=n),r.return=t,r.sibling=null,e!==null&&(n=t.deletions,n===null?(t.deletions=[e],t.flags|=16):n.push(e)),t.child=r,t.memoizedState=null,r}function Ei(e,t){return t=vl({mode:"visible",children:t},e.mode,0,null),t.return=e,e.child=t}function wr(e,t,n,r){return r!==null&&ai(r),on(t,e.child,null,n),e=Ei(t,t.pendingProps.children),e.flags|=2,t.memoizedState=null,e}function ad(e,t,n,r,l,u,i){if(n)return t.flags&256?(t.flags&=-257,r=Hl(Error(y(422))),wr(e,t,i,r)):t.memoizedState!==null?(t.child=e.child,t.flags|=128,null):(u=r.fallback,l=t.mode,r=vl({mode:"visible",children:r.children},l,0,null),u=zt(u,l,i,null),u.flags|=2,r.return=t,u.return=t,r.sibling=u,t.child=r,t.mode&1&&on(t,e.child,null,i),t.child.memoizedState=ju(i),t.memoizedState=Tu,u);if(!(t.mode&1))return wr(e,t,i,null);if(l.data==="$!"){if(r=l.nextSibling&&l.nextSibling.dataset,r)var o=r.dgst;return r=o,u=Error(y(419)),r=Hl(u,r,void 0),wr(e,t,i,r)}if(o=(i&e.childLanes)!==0,pe||o){if(r=q,r!==null){switch(i&-i){case 4:l=2;break;case 16:l=8;break;case 64:case 128:case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:case 4194304:case 8388608:case 16777216:case 33554432:case 67108864:l=32;break;case 536870912:l=268435456;break;default:l=0}l=l&(r.suspendedLanes|i)?0:l,l!==0&&l!==u.retryLane&&(u.retryLane=l,Ge(e,l),Ie(r,e,l,-1))}return Li(),r=Hl(Error(y(421))),wr(e,t,i,r)}return l.data==="$?"?(t.flags|=128,t.child=e.child,t=xd.bind(null,e),l._reactRetry=t,null):(e=u.treeContext,we=ct(l.nextSibling),Se=t,A=!0,Oe=null,e!==null&&(Ce[_e++]=He,Ce[_e++]=Qe,Ce[_e++]=Tt,He=e.id,Qe=e.overflow,Tt=t),t=Ei(t,r.children),t.flags|=4096,t)}function Oo(e,t,n){e.lanes|=t;var r=e.alternate;r!==null&&(r.lanes|=t),Cu(e.return,t,n)}function Ql(e,t,n,r,l){var u=e.memoizedState;u===null?e.memoizedState={isBackwards:t,rendering:null,renderingStartTime:0,last:r,tail:n,tailMode:l}:(u.isBackwards=t,u.rendering=null,u.renderingStartTime=0,u.last=r,u.tail=n,u.tailMode=l)}function Da(e,t,n){var r=t.pendingProps,l=r.revealOrder,u=r.tail;if(se(e,t,r.children,n),r=B.current,r&2)r=r&1|2,t.flags|=128;else{if(e!==null&&e.flags&128)e:for(e=t.child;e!==null;){if(e.tag===13)e.memoizedState!==null&&Oo(e,n,t);else if(e.tag===19)Oo(e,n,t);else if(e.child!==null){e.child.return=e,e=e.child;continue}if(e===t)break e;for(;e.sibling===null;){if(e.return===null||e.return===t)break e;e=e.return}e.sibling.return=e.return,e=e.sibling}r&=1}if(D(B,r),!(t.mode&1))t.memoizedState=null;else switch(l){case"forwards":for(n=t.child,l=null;n!==null;)e=n.alternate,e!==null&&Jr(e)===null&&(l=n),n=n.sibling;n=l,n===null?(l=t.child,t.child=null):(l=n.sibling,n.sibling=null),Ql(t,!1,l,n,u);break;case"backwards":for(n=null,l=t.child,t.child=null;l!==null;){if(e=l.alternate,e!==null&&Jr(e)===null){t.child=l;break}e=l.sibling,l.sibling=n,n=l,l=e}Ql(t,!0,n,null,u);break;case"together":Ql(t,!1,null,null,void 0);break;default:t.memoizedState=null}return t.child}function jr(e,t){!(t.mode&1)&&e!==null&&(e.alternate=null,t.alternate=null,t.flags|=2)}function Ze(e,t,n){if(e!==null&&(t.dependencies=e.dependencies),Rt|=t.lanes,!(n&t.childLanes))return null;if(e!==null&&t.child!==e.child)throw Error(y(153));if(t.child!==null){for(e=t.child,n=mt(e,e.pendingProps),t.child=n,n.return=t;e.sibling!==null;)e=e.sibling,n=n.sibling=mt(e,e.pendingProps),n.return=t;n.sibling=null}return t.child}function cd(e,t,n){switch(t.tag){case 3:Ma(t),un();break;case 5:sa(t);break;case 1:he(t.type)&&Qr(t);break;case 4:hi(t,t.stateNode.containerInfo);break;case 10:var r=t.type._context,l=t.memoizedProps.value;D(Xr,r._currentValue),r._currentValue=l;break;case 13:if(r=t.memoizedState,r!==null)return r.dehydrated!==null?(D(B,B.current&1),t.flags|=128,null):n&t.child.childLanes?Ia(e,t,n):(D(B,B.current&1),e=Ze(e,t,n),e!==null?e.sibling:null);D(B,B.current&1);break;case 19:if(r=(n&t.childLanes)!==0,e.flags&128){if(r)return Da(e,t,n);t.flags|=128}if(l=t.memoizedState,l!==null&&(l.rendering=null,l.tail=null,l.lastEffect=null),D(B,B.current),r)break;return null;case 22:case 23:return t.lanes=0,Ra(e,t,n)}return Ze(e,t,n)}var Fa,Ru,Ua,$a;Fa=function(e,t){for(var n=t.child;n!==null;){if(n.tag===5||n.tag===6)e.appendChild(n.stateNode);else if(n.tag!==4&&n.child!==null){n.child.return=n,n=n.child;continue}if(n===t)break;for(;n.sibling===null;){if(n.return===null||n.return===t)return;n=n.return}n.sibling.return=n.return,n=n.sibling}};Ru=function(){};Ua=function(e,t,n,r){var l=e.memoizedProps;if(l!==r){e=t.stateNode,Nt(Ve.current);var u=null;switch(n){case"input":l=eu(e,l),r=eu(e,r),u=[];break;case"select":l=H({},l,{value:void 0}),r=H({},r,{value:void 0}),u=[];break;case"textarea":l=ru(e,l),r=ru(e,r),u=[];break;default:typeof l.onClick!="function"&&typeof r.onClick=="function"&&(e.onclick=Wr)}uu(n,r);var i;n=null;for(f in l)if(!r.hasOwnProperty(f)&&l.hasOwnProperty(f)&&l[f]!=null)if(f==="style"){var o=l[f];for(i in o)o.hasOwnProperty(i)&&(n||(n={}),n[i]="")}else f!=="dangerouslySetInnerHTML"&&f!=="children"&&f!=="suppressContentEditableWarning"&&f!=="suppressHydrationWarning"&&f!=="autoFocus"&&(Dn.hasOwnProperty(f)?u||(u=[]):(u=u||[]).push(f,null));for(f in r){var s=r[f];if(o=l!=null?l[f]:void 0,r.hasOwnProperty(f)&&s!==o&&(s!=null||o!=null))if(f==="style")if(o){for(i in o)!o.hasOwnProperty(i)||s&&s.hasOwnProperty(i)||(n||(n={}),n[i]="");for(i in s)s.hasOwnProperty(i)&&o[i]!==s[i]&&(n||(n={}),n[i]=s[i])}else n||(u||(u=[]),u.push(f,n)),n=s;else f==="dangerouslySetInnerHTML"?(s=s?s.__html:void 0,o=o?o.__html:void 0,s!=null&&o!==s&&(u=u||[]).push(f,s)):f==="children"?typeof s!="string"&&typeof s!="number"||(u=u||[]).push(f,""+s):f!=="suppressContentEditableWarning"&&f!=="suppressHydrationWarning"&&(Dn.hasOwnProperty(f)?(s!=null&&f==="onScroll"&&F("scroll",e),u||o===s||(u=[])):(u=u||[]).push(f,s))}n&&(u=u||[]).push("style",n);var f=u;(t.updateQueue=f)&&(t.flags|=4)}};$a=function(e,t,n,r){n!==r&&(t.flags|=4)};function kn(e,t){if(!A)switch(e.tailMode){case"hidden":t=e.tail;for(var n=null;t!==null;)t.alternate!==null&&(n=t),t=t.sibling;n===null?e.tail=null:n.sibling=null;break;case"collapsed":n=e.tail;for(var r=null;n!==null;)n.alternate!==null&&(r=n),n=n.sibling;r===null?t||e.tail===null?e.tail=null:e.tail.sibling=null:r.sibling=null}}function le(e){var t=e.alternate!==null&&e.alternate.child===e.child,n=0,r=0;if(t)for(var l=e.child;l!==null;)n|=l.lanes|l.childLanes,r|=l.subtreeFlags&14680064,r|=l.flags&14680064,l.return=e,l=l.sibling;else for(l=e.child;l!==null;)n|=l.lanes|l.childLanes,r|=l.subtreeFlags,r|=l.flags,l.return=e,l=l.sibling;return e.subtreeFlags|=r,e.childLanes=n,t}function fd(e,t,n){var r=t.pendingProps;switch(si(t),t.tag){case 2:case 16:case 15:case 0:case 11:case 7:case 8:case 12:case 9:case 14:return le(t),null;case 1:return he(t.type)&&Hr(),le(t),null;case 3:return r=t.stateNode,sn(),U(me),U(oe),yi(),r.pendingContext&&(r.context=r.pendingContext,r.pendingContext=null),(e===null||e.child===null)&&(yr(t)?t.flags|=4:e===null||e.memoizedState.isDehydrated&&!(t.flags&256)||(t.flags|=1024,Oe!==null&&(Au(Oe),Oe=null))),Ru(e,t),le(t),null;case 5:vi(t);var l=Nt(Xn.current);if(n=t.type,e!==null&&t.stateNode!=null)Ua(e,t,n,r,l),e.ref!==t.ref&&(t.flags|=512,t.flags|=2097152);else{if(!r){if(t.stateNode===null)throw Error(y(166));return le(t),null}if(e=Nt(Ve.current),yr(t)){r=t.stateNode,n=t.type;var u=t.memoizedProps;switch(r[$e]=t,r[Kn]=u,e=(t.mode&1)!==0,n){case"dialog":F("cancel",r),F("close",r);break;case"iframe":case"object":case"embed":F("load",r);break;case"video":case"audio":for(l=0;l<Nn.length;l++)F(Nn[l],r);break;case"source":F("error",r);break;case"img":case"image":case"link":F("error",r),F("load",r);break;case"details":F("toggle",r);break;case"input":Vi(r,u),F("invalid",r);break;case"select":r._wrapperState={wasMultiple:!!u.multiple},F("invalid",r);break;case"textarea":Wi(r,u),F("invalid",r)}uu(n,u),l=null;for(var i in u)if(u.hasOwnProperty(i)){var o=u[i];i==="children"?typeof o=="string"?r.textContent!==o&&(u.suppressHydrationWarning!==!0&&vr(r.textContent,o,e),l=["children",o]):typeof o=="number"&&r.textContent!==""+o&&(u.suppressHydrationWarning!==!0&&vr(r.textContent,o,e),l=["children",""+o]):Dn.hasOwnProperty(i)&&o!=null&&i==="onScroll"&&F("scroll",r)}switch(n){case"input":sr(r),Bi(r,u,!0);break;case"textarea":sr(r),Hi(r);break;case"select":case"option":break;default:typeof u.onClick=="function"&&(r.onclick=Wr)}r=l,t.updateQueue=r,r!==null&&(t.flags|=4)}else{i=l.nodeType===9?l:l.ownerDocument,e==="http://www.w3.org/1999/xhtml"&&(e=ps(n)),e==="http://www.w3.org/1999/xhtml"?n==="script"?(e=i.createElement("div"),e.innerHTML="<script><\/script>",e=e.removeChild(e.firstChild)):typeof r.is=="string"?e=i.createElement(n,{is:r.is}):(e=i.createElement(n),n==="select"&&(i=e,r.multiple?i.multiple=!0:r.size&&(i.size=r.size))):e=i.createElementNS(e,n),e[$e]=t,e[Kn]=r,Fa(e,t,!1,!1),t.stateNode=e;e:{switch(i=iu(n,r),n){case"dialog":F("cancel",e),F("close",e),l=r;break;case"iframe":case"object":case"embed":F("load",e),l=r;break;case"video":case"audio":for(l=0;l<Nn.length;l++)F(Nn[l],e);l=r;break;case"source":F("error",e),l=r;break;case"img":case"image":case"link":F("error",e),F("load",e),l=r;break;case"details":F("toggle",e),l=r;break;case"input":Vi(e,r),l=eu(e,r),F("invalid",e);break;case"option":l=r;break;case"select":e._wrapperState={wasMultiple:!!r.multiple},l=H({},r,{value:void 0}),F("invalid",e);break;case"textarea":Wi(e,r),l=ru(e,r),F("invalid",e);break;default:l=r}uu(n,l),o=l;for(u in o)if(o.hasOwnProperty(u)){var s=o[u];u==="style"?vs(e,s):u==="dangerouslySetInnerHTML"?(s=s?s.__html:void 0,s!=null&&ms(e,s)):u==="children"?typeof s=="string"?(n!=="textarea"||s!=="")&&Fn(e,s):typeof s=="number"&&Fn(e,""+s):u!=="suppressContentEditableWarning"&&u!=="suppressHydrationWarning"&&u!=="autoFocus"&&(Dn.hasOwnProperty(u)?s!=null&&u==="onScroll"&&F("scroll",e):s!=null&&Yu(e,u,s,i))}switch(n){case"input":sr(e),Bi(e,r,!1);break;case"textarea":sr(e),Hi(e);break;case"option":r.value!=null&&e.setAttribute("value",""+ht(r.value));break;case"select":e.multiple=!!r.multiple,u=r.value,u!=null?Jt(e,!!r.multiple,u,!1):r.defaultValue!=null&&Jt(e,!!r.multiple,r.defaultValue,!0);break;default:typeof l.onClick=="function"&&(e.onclick=Wr)}switch(n){case"button":case"input":case"select":case"textarea":r=!!r.autoFocus;break e;case"img":r=!0;break e;default:r=!1}}r&&(t.flags|=4)}t.ref!==null&&(t.flags|=512,t.flags|=2097152)}return le(t),null;case 6:if(e&&t.stateNode!=null)$a(e,t,e.memoizedProps,r);else{if(typeof r!="string"&&t.stateNode===null)throw Error(y(166));if(n=Nt(Xn.current),Nt(Ve.current),yr(t)){if(r=t.stateNode,n=t.memoizedProps,r[$e]=t,(u=r.nodeValue!==n)&&(e=Se,e!==null))switch(e.tag){case 3:vr(r.nodeValue,n,(e.mode&1)!==0);break;case 5:e.memoizedProps.suppressHydrationWarning!==!0&&vr(r.nodeValue,n,(e.mode&1)!==0)}u&&(t.flags|=4)}else r=(n.nodeType===9?n:n.ownerDocument).createTextNode(r),r[$e]=t,t.stateNode=r}return le(t),null;case 13:if(U(B),r=t.memoizedState,e===null||e.memoizedState!==null&&e.memoizedState.dehydrated!==null){if(A&&we!==null&&t.mode&1&&!(t.flags&128))ra(),un(),t.flags|=98560,u=!1;else if(u=yr(t),r!==null&&r.dehydrated!==null){if(e===null){if(!u)throw Error(y(318));if(u=t.memoizedState,u=u!==null?u.dehydrated:null,!u)throw Error(y(317));u[$e]=t}else un(),!(t.flags&128)&&(t.memoizedState=null),t.flags|=4;le(t),u=!1}else Oe!==null&&(Au(Oe),Oe=null),u=!0;if(!u)return t.flags&65536?t:null}return t.flags&128?(t.lanes=n,t):(r=r!==null,r!==(e!==null&&e.memoizedState!==null)&&r&&(t.child.flags|=8192,t.mode&1&&(e===null||B.current&1?Z===0&&(Z=3):Li())),t.updateQueue!==null&&(t.flags|=4),le(t),null);case 4:return sn(),Ru(e,t),e===null&&Hn(t.stateNode.containerInfo),le(t),null;case 10:return di(t.type._context),le(t),null;case 17:return he(t.type)&&Hr(),le(t),null;case 19:if(U(B),u=t.memoizedState,u===null)return le(t),null;if(r=(t.flags&128)!==0,i=u.rendering,i===null)if(r)kn(u,!1);else{if(Z!==0||e!==null&&e.flags&128)for(e=t.child;e!==null;){if(i=Jr(e),i!==null){for(t.flags|=128,kn(u,!1),r=i.updateQueue,r!==null&&(t.updateQueue=r,t.flags|=4),t.subtreeFlags=0,r=n,n=t.child;n!==null;)u=n,e=r,u.flags&=14680066,i=u.alternate,i===null?(u.childLanes=0,u.lanes=e,u.child=null,u.subtreeFlags=0,u.memoizedProps=null,u.memoizedState=null,u.updateQueue=null,u.dependencies=null,u.stateNode=null):(u.childLanes=i.childLanes,u.lanes=i.lanes,u.child=i.child,u.subtreeFlags=0,u.deletions=null,u.memoizedProps=i.memoizedProps,u.memoizedState=i.memoizedState,u.updateQueue=i.updateQueue,u.type=i.type,e=i.dependencies,u.dependencies=e===null?null:{lanes:e.lanes,firstContext:e.firstContext}),n=n.sibling;return D(B,B.current&1|2),t.child}e=e.sibling}u.tail!==null&&K()>cn&&(t.flags|=128,r=!0,kn(u,!1),t.lanes=4194304)}else{if(!r)if(e=Jr(i),e!==null){if(t.flags|=128,r=!0,n=e.updateQueue,n!==null&&(t.updateQueue=n,t.flags|=4),kn(u,!0),u.tail===null&&u.tailMode==="hidden"&&!i.alternate&&!A)return le(t),null}else 2*K()-u.renderingStartTime>cn&&n!==1073741824&&(t.flags|=128,r=!0,kn(u,!1),t.lanes=4194304);u.isBackwards?(i.sibling=t.child,t.child=i):(n=u.last,n!==null?n.sibling=i:t.child=i,u.last=i)}return u.tail!==null?(t=u.tail,u.rendering=t,u.tail=t.sibling,u.renderingStartTime=K(),t.sibling=null,n=B.current,D(B,r?n&1|2:n&1),t):(le(t),null);case 22:case 23:return zi(),r=t.memoizedState!==null,e!==null&&e.memoizedState!==null!==r&&(t.flags|=8192),r&&t.mode&1?ge&1073741824&&(le(t),t.subtreeFlags&6&&(t.flags|=8192)):le(t),null;case 24:return null;case 25:return null}throw Error(y(156,t.tag))}function dd(e,t){switch(si(t),t.tag){case 1:return he(t.type)&&Hr(),e=t.flags,e&65536?(t.flags=e&-65537|128,t):null;case 3:return sn(),U(me),U(oe),yi(),e=t.flags,e&65536&&!(e&128)?(t.flags=e&-65537|128,t):null;case 5:return vi(t),null;case 13:if(U(B),e=t.memoizedState,e!==null&&e.dehydrated!==null){if(t.alternate===null)throw Error(y(340));un()}return e=t.flags,e&65536?(t.flags=e&-65537|128,t):null;case 19:return U(B),null;case 4:return sn(),null;case 10:return di(t.type._context),null;case 22:case 23:return zi(),null;case 24:return null;default:return null}}var Sr=!1,ie=!1,pd=typeof WeakSet=="function"?WeakSet:Set,_=null;function Gt(e,t){var n=e.ref;if(n!==null)if(typeof n=="function")try{n(null)}catch(r){Q(e,t,r)}else n.current=null}function Ou(e,t,n){try{n()}catch(r){Q(e,t,r)}}var Mo=!1;function md(e,t){if(vu=Ar,e=Hs(),ii(e)){if("selectionStart"in e)var n={start:e.selectionStart,end:e.selectionEnd};else e:{n=(n=e.ownerDocument)&&n.defaultView||window;var r=n.getSelection&&n.getSelection();if(r&&r.rangeCount!==0){n=r.anchorNode;var l=r.anchorOffset,u=r.focusNode;r=r.focusOffset;try{n.nodeType,u.nodeType}catch{n=null;break e}var i=0,o=-1,s=-1,f=0,h=0,m=e,p=null;t:for(;;){for(var g;m!==n||l!==0&&m.nodeType!==3||(o=i+l),m!==u||r!==0&&m.nodeType!==3||(s=i+r),m.nodeType===3&&(i+=m.nodeValue.length),(g=m.firstChild)!==null;)p=m,m=g;for(;;){if(m===e)break t;if(p===n&&++f===l&&(o=i),p===u&&++h===r&&(s=i),(g=m.nextSibling)!==null)break;m=p,p=m.parentNode}m=g}n=o===-1||s===-1?null:{start:o,end:s}}else n=null}n=n||{start:0,end:0}}else n=null;for(yu={focusedElem:e,selectionRange:n},Ar=!1,_=t;_!==null;)if(t=_,e=t.child,(t.subtreeFlags&1028)!==0&&e!==null)e.return=t,_=e;else for(;_!==null;){t=_;try{var w=t.alternate;if(t.flags&1024)switch(t.tag){case 0:case 11:case 15:break;case 1:if(w!==null){var k=w.memoizedProps,I=w.memoizedState,c=t.stateNode,a=c.getSnapshotBeforeUpdate(t.elementType===t.type?k:je(t.type,k),I);c.__reactInternalSnapshotBeforeUpdate=a}break;case 3:var d=t.stateNode.containerInfo;d.nodeType===1?d.textContent="":d.nodeType===9&&d.documentElement&&d.removeChild(d.documentElement);break;case 5:case 6:case 4:case 17:break;default:throw Error(y(163))}}catch(v){Q(t,t.return,v)}if(e=t.sibling,e!==null){e.return=t.return,_=e;break}_=t.return}return w=Mo,Mo=!1,w}function On(e,t,n){var r=t.updateQueue;if(r=r!==null?r.lastEffect:null,r!==null){var l=r=r.next;do{if((l.tag&e)===e){var u=l.destroy;l.destroy=void 0,u!==void 0&&Ou(t,n,u)}l=l.next}while(l!==r)}}function ml(e,t){if(t=t.updateQueue,t=t!==null?t.lastEffect:null,t!==null){var n=t=t.next;do{if((n.tag&e)===e){var r=n.create;n.destroy=r()}n=n.next}while(n!==t)}}function Mu(e){var t=e.ref;if(t!==null){var n=e.stateNode;switch(e.tag){case 5:e=n;break;default:e=n}typeof t=="function"?t(e):t.current=e}}function Aa(e){var t=e.alternate;t!==null&&(e.alternate=null,Aa(t)),e.child=null,e.deletions=null,e.sibling=null,e.tag===5&&(t=e.stateNode,t!==null&&(delete t[$e],delete t[Kn],delete t[Su],delete t[Zf],delete t[Jf])),e.stateNode=null,e.return=null,e.dependencies=null,e.memoizedProps=null,e.memoizedState=null,e.pendingProps=null,e.stateNode=null,e.updateQueue=null}function Va(e){return e.tag===5||e.tag===3||e.tag===4}function Io(e){e:for(;;){for(;e.sibling===null;){if(e.return===null||Va(e.return))return null;e=e.return}for(e.sibling.return=e.return,e=e.sibling;e.tag!==5&&e.tag!==6&&e.tag!==18;){if(e.flags&2||e.child===null||e.tag===4)continue e;e.child.return=e,e=e.child}if(!(e.flags&2))return e.stateNode}}function Iu(e,t,n){var r=e.tag;if(r===5||r===6)e=e.stateNode,t?n.nodeType===8?n.parentNode.insertBefore(e,t):n.insertBefore(e,t):(n.nodeType===8?(t=n.parentNode,t.insertBefore(e,n)):(t=n,t.appendChild(e)),n=n._reactRootContainer,n!=null||t.onclick!==null||(t.onclick=Wr));else if(r!==4&&(e=e.child,e!==null))for(Iu(e,t,n),e=e.sibling;e!==null;)Iu(e,t,n),e=e.sibling}function Du(e,t,n){var r=e.tag;if(r===5||r===6)e=e.stateNode,t?n.insertBefore(e,t):n.appendChild(e);else if(r!==4&&(e=e.child,e!==null))for(Du(e,t,n),e=e.sibling;e!==null;)Du(e,t,n),e=e.sibling}var b=null,Re=!1;function et(e,t,n){for(n=n.child;n!==null;)Ba(e,t,n),n=n.sibling}function Ba(e,t,n){if(Ae&&typeof Ae.onCommitFiberUnmount=="function")try{Ae.onCommitFiberUnmount(il,n)}catch{}switch(n.tag){case 5:ie||Gt(n,t);case 6:var r=b,l=Re;b=null,et(e,t,n),b=r,Re=l,b!==null&&(Re?(e=b,n=n.stateNode,e.nodeType===8?e.parentNode.removeChild(n):e.removeChild(n)):b.removeChild(n.stateNode));break;case 18:b!==null&&(Re?(e=b,n=n.stateNode,e.nodeType===8?Ul(e.parentNode,n):e.nodeType===1&&Ul(e,n),Vn(e)):Ul(b,n.stateNode));break;case 4:r=b,l=Re,b=n.stateNode.containerInfo,Re=!0,et(e,t,n),b=r,Re=l;break;case 0:case 11:case 14:case 15:if(!ie&&(r=n.updateQueue,r!==null&&(r=r.lastEffect,r!==null))){l=r=r.next;do{var u=l,i=u.destroy;u=u.tag,i!==void 0&&(u&2||u&4)&&Ou(n,t,i),l=l.next}while(l!==r)}et(e,t,n);break;case 1:if(!ie&&(Gt(n,t),r=n.stateNode,typeof r.componentWillUnmount=="function"))try{r.props=n.memoizedProps,r.state=n.memoizedState,r.componentWillUnmount()}catch(o){Q(n,t,o)}et(e,t,n);break;case 21:et(e,t,n);break;case 22:n.mode&1?(ie=(r=ie)||n.memoizedState!==null,et(e,t,n),ie=r):et(e,t,n);break;default:et(e,t,n)}}function Do(e){var t=e.updateQueue;if(t!==null){e.updateQueue=null;var n=e.stateNode;n===null&&(n=e.stateNode=new pd),t.forEach(function(r){var l=Ed.bind(null,e,r);n.has(r)||(n.add(r),r.then(l,l))})}}function Te(e,t){var n=t.deletions;if(n!==null)for(var r=0;r<n.length;r++){var l=n[r];try{var u=e,i=t,o=i;e:for(;o!==null;){switch(o.tag){case 5:b=o.stateNode,Re=!1;break e;case 3:b=o.stateNode.containerInfo,Re=!0;break e;case 4:b=o.stateNode.containerInfo,Re=!0;break e}o=o.return}if(b===null)throw Error(y(160));Ba(u,i,l),b=null,Re=!1;var s=l.alternate;s!==null&&(s.return=null),l.return=null}catch(f){Q(l,t,f)}}if(t.subtreeFlags&12854)for(t=t.child;t!==null;)Wa(t,e),t=t.sibling}function Wa(e,t){var n=e.alternate,r=e.flags;switch(e.tag){case 0:case 11:case 14:case 15:if(Te(t,e),Fe(e),r&4){try{On(3,e,e.return),ml(3,e)}catch(k){Q(e,e.return,k)}try{On(5,e,e.return)}catch(k){Q(e,e.return,k)}}break;case 1:Te(t,e),Fe(e),r&512&&n!==null&&Gt(n,n.return);break;case 5:if(Te(t,e),Fe(e),r&512&&n!==null&&Gt(n,n.return),e.flags&32){var l=e.stateNode;try{Fn(l,"")}catch(k){Q(e,e.return,k)}}if(r&4&&(l=e.stateNode,l!=null)){var u=e.memoizedProps,i=n!==null?n.memoizedProps:u,o=e.type,s=e.updateQueue;if(e.updateQueue=null,s!==null)try{o==="input"&&u.type==="radio"&&u.name!=null&&fs(l,u),iu(o,i);var f=iu(o,u);for(i=0;i<s.length;i+=2){var h=s[i],m=s[i+1];h==="style"?vs(l,m):h==="dangerouslySetInnerHTML"?ms(l,m):h==="children"?Fn(l,m):Yu(l,h,m,f)}switch(o){case"input":tu(l,u);break;case"textarea":ds(l,u);break;case"select":var p=l._wrapperState.wasMultiple;l._wrapperState.wasMultiple=!!u.multiple;var g=u.value;g!=null?Jt(l,!!u.multiple,g,!1):p!==!!u.multiple&&(u.defaultValue!=null?Jt(l,!!u.multiple,u.defaultValue,!0):Jt(l,!!u.multiple,u.multiple?[]:"",!1))}l[Kn]=u}catch(k){Q(e,e.return,k)}}break;case 6:if(Te(t,e),Fe(e),r&4){if(e.stateNode===null)throw Error(y(162));l=e.stateNode,u=e.memoizedProps;try{l.nodeValue=u}catch(k){Q(e,e.return,k)}}break;case 3:if(Te(t,e),Fe(e),r&4&&n!==null&&n.memoizedState.isDehydrated)try{Vn(t.containerInfo)}catch(k){Q(e,e.return,k)}break;case 4:Te(t,e),Fe(e);break;case 13:Te(t,e),Fe(e),l=e.child,l.flags&8192&&(u=l.memoizedState!==null,l.stateNode.isHidden=u,!u||l.alternate!==null&&l.alternate.memoizedState!==null||(Ni=K())),r&4&&Do(e);break;case 22:if(h=n!==null&&n.memoizedState!==null,e.mode&1?(ie=(f=ie)||h,Te(t,e),ie=f):Te(t,e),Fe(e),r&8192){if(f=e.memoizedState!==null,(e.stateNode.isHidden=f)&&!h&&e.mode&1)for(_=e,h=e.child;h!==null;){for(m=_=h;_!==null;){switch(p=_,g=p.child,p.tag){case 0:case 11:case 14:case 15:On(4,p,p.return);break;case 1:Gt(p,p.return);var w=p.stateNode;if(typeof w.componentWillUnmount=="function"){r=p,n=p.return;try{t=r,w.props=t.memoizedProps,w.state=t.memoizedState,w.componentWillUnmount()}catch(k){Q(r,n,k)}}break;case 5:Gt(p,p.return);break;case 22:if(p.memoizedState!==null){Uo(m);continue}}g!==null?(g.return=p,_=g):Uo(m)}h=h.sibling}e:for(h=null,m=e;;){if(m.tag===5){if(h===null){h=m;try{l=m.stateNode,f?(u=l.style,typeof u.setProperty=="function"?u.setProperty("display","none","important"):u.display="none"):(o=m.stateNode,s=m.memoizedProps.style,i=s!=null&&s.hasOwnProperty("display")?s.display:null,o.style.display=hs("display",i))}catch(k){Q(e,e.return,k)}}}else if(m.tag===6){if(h===null)try{m.stateNode.nodeValue=f?"":m.memoizedProps}catch(k){Q(e,e.return,k)}}else if((m.tag!==22&&m.tag!==23||m.memoizedState===null||m===e)&&m.child!==null){m.child.return=m,m=m.child;continue}if(m===e)break e;for(;m.sibling===null;){if(m.return===null||m.return===e)break e;h===m&&(h=null),m=m.return}h===m&&(h=null),m.sibling.return=m.return,m=m.sibling}}break;case 19:Te(t,e),Fe(e),r&4&&Do(e);break;case 21:break;default:Te(t,e),Fe(e)}}function Fe(e){var t=e.flags;if(t&2){try{e:{for(var n=e.return;n!==null;){if(Va(n)){var r=n;break e}n=n.return}throw Error(y(160))}switch(r.tag){case 5:var l=r.stateNode;r.flags&32&&(Fn(l,""),r.flags&=-33);var u=Io(e);Du(e,u,l);break;case 3:case 4:var i=r.stateNode.containerInfo,o=Io(e);Iu(e,o,i);break;default:throw Error(y(161))}}catch(s){Q(e,e.return,s)}e.flags&=-3}t&4096&&(e.flags&=-4097)}function hd(e,t,n){_=e,Ha(e)}function Ha(e,t,n){for(var r=(e.mode&1)!==0;_!==null;){var l=_,u=l.child;if(l.tag===22&&r){var i=l.memoizedState!==null||Sr;if(!i){var o=l.alternate,s=o!==null&&o.memoizedState!==null||ie;o=Sr;var f=ie;if(Sr=i,(ie=s)&&!f)for(_=l;_!==null;)i=_,s=i.child,i.tag===22&&i.memoizedState!==null?$o(l):s!==null?(s.return=i,_=s):$o(l);for(;u!==null;)_=u,Ha(u),u=u.sibling;_=l,Sr=o,ie=f}Fo(e)}else l.subtreeFlags&8772&&u!==null?(u.return=l,_=u):Fo(e)}}function Fo(e){for(;_!==null;){var t=_;if(t.flags&8772){var n=t.alternate;try{if(t.flags&8772)switch(t.tag){case 0:case 11:case 15:ie||ml(5,t);break;case 1:var r=t.stateNode;if(t.flags&4&&!ie)if(n===null)r.componentDidMount();else{var l=t.elementType===t.type?n.memoizedProps:je(t.type,n.memoizedProps);r.componentDidUpdate(l,n.memoizedState,r.__reactInternalSnapshotBeforeUpdate)}var u=t.updateQueue;u!==null&&ko(t,u,r);break;case 3:var i=t.updateQueue;if(i!==null){if(n=null,t.child!==null)switch(t.child.tag){case 5:n=t.child.stateNode;break;case 1:n=t.child.stateNode}ko(t,i,n)}break;case 5:var o=t.stateNode;if(n===null&&t.flags&4){n=o;var s=t.memoizedProps;switch(t.type){case"button":case"input":case"select":case"textarea":s.autoFocus&&n.focus();break;case"img":s.src&&(n.src=s.src)}}break;case 6:break;case 4:break;case 12:break;case 13:if(t.memoizedState===null){var f=t.alternate;if(f!==null){var h=f.memoizedState;if(h!==null){var m=h.dehydrated;m!==null&&Vn(m)}}}break;case 19:case 17:case 21:case 22:case 23:case 25:break;default:throw Error(y(163))}ie||t.flags&512&&Mu(t)}catch(p){Q(t,t.return,p)}}if(t===e){_=null;break}if(n=t.sibling,n!==null){n.return=t.return,_=n;break}_=t.return}}function Uo(e){for(;_!==null;){var t=_;if(t===e){_=null;break}var n=t.sibling;if(n!==null){n.return=t.return,_=n;break}_=t.return}}function $o(e){for(;_!==null;){var t=_;try{switch(t.tag){case 0:case 11:case 15:var n=t.return;try{ml(4,t)}catch(s){Q(t,n,s)}break;case 1:var r=t.stateNode;if(typeof r.componentDidMount=="function"){var l=t.return;try{r.componentDidMount()}catch(s){Q(t,l,s)}}var u=t.return;try{Mu(t)}catch(s){Q(t,u,s)}break;case 5:var i=t.return;try{Mu(t)}catch(s){Q(t,i,s)}}}catch(s){Q(t,t.return,s)}if(t===e){_=null;break}var o=t.sibling;if(o!==null){o.return=t.return,_=o;break}_=t.return}}var vd=Math.ceil,el=Je.ReactCurrentDispatcher,Ci=Je.ReactCurrentOwner,Pe=Je.ReactCurrentBatchConfig,O=0,q=null,X=null,ee=0,ge=0,Zt=gt(0),Z=0,qn=null,Rt=0,hl=0,_i=0,Mn=null,de=null,Ni=0,cn=1/0,Be=null,tl=!1,Fu=null,dt=null,kr=!1,it=null,nl=0,In=0,Uu=null,Rr=-1,Or=0;function ae(){return O&6?K():Rr!==-1?Rr:Rr=K()}function pt(e){return e.mode&1?O&2&&ee!==0?ee&-ee:bf.transition!==null?(Or===0&&(Or=zs()),Or):(e=M,e!==0||(e=window.event,e=e===void 0?16:Is(e.type)),e):1}function Ie(e,t,n,r){if(50<In)throw In=0,Uu=null,Error(y(185));er(e,n,r),(!(O&2)||e!==q)&&(e===q&&(!(O&2)&&(hl|=n),Z===4&&lt(e,ee)),ve(e,r),n===1&&O===0&&!(t.mode&1)&&(cn=K()+500,fl&&wt()))}function ve(e,t){var n=e.callbackNode;qc(e,t);var r=$r(e,e===q?ee:0);if(r===0)n!==null&&Yi(n),e.callbackNode=null,e.callbackPriority=0;else if(t=r&-r,e.callbackPriority!==t){if(n!=null&&Yi(n),t===1)e.tag===0?qf(Ao.bind(null,e)):ea(Ao.bind(null,e)),Xf(function(){!(O&6)&&wt()}),n=null;else{switch(Ls(r)){case 1:n=qu;break;case 4:n=Ns;break;case 16:n=Ur;break;case 536870912:n=Ps;break;default:n=Ur}n=qa(n,Qa.bind(null,e))}e.callbackPriority=t,e.callbackNode=n}}function Qa(e,t){if(Rr=-1,Or=0,O&6)throw Error(y(327));var n=e.callbackNode;if(nn()&&e.callbackNode!==n)return null;var r=$r(e,e===q?ee:0);if(r===0)return null;if(r&30||r&e.expiredLanes||t)t=rl(e,r);else{t=r;var l=O;O|=2;var u=Ya();(q!==e||ee!==t)&&(Be=null,cn=K()+500,Pt(e,t));do try{wd();break}catch(o){Ka(e,o)}while(!0);fi(),el.current=u,O=l,X!==null?t=0:(q=null,ee=0,t=Z)}if(t!==0){if(t===2&&(l=fu(e),l!==0&&(r=l,t=$u(e,l))),t===1)throw n=qn,Pt(e,0),lt(e,r),ve(e,K()),n;if(t===6)lt(e,r);else{if(l=e.current.alternate,!(r&30)&&!yd(l)&&(t=rl(e,r),t===2&&(u=fu(e),u!==0&&(r=u,t=$u(e,u))),t===1))throw n=qn,Pt(e,0),lt(e,r),ve(e,K()),n;switch(e.finishedWork=l,e.finishedLanes=r,t){case 0:case 1:throw Error(y(345));case 2:Et(e,de,Be);break;case 3:if(lt(e,r),(r&130023424)===r&&(t=Ni+500-K(),10<t)){if($r(e,0)!==0)break;if(l=e.suspendedLanes,(l&r)!==r){ae(),e.pingedLanes|=e.suspendedLanes&l;break}e.timeoutHandle=wu(Et.bind(null,e,de,Be),t);break}Et(e,de,Be);break;case 4:if(lt(e,r),(r&4194240)===r)break;for(t=e.eventTimes,l=-1;0<r;){var i=31-Me(r);u=1<<i,i=t[i],i>l&&(l=i),r&=~u}if(r=l,r=K()-r,r=(120>r?120:480>r?480:1080>r?1080:1920>r?1920:3e3>r?3e3:4320>r?4320:1960*vd(r/1960))-r,10<r){e.timeoutHandle=wu(Et.bind(null,e,de,Be),r);break}Et(e,de,Be);break;case 5:Et(e,de,Be);break;default:throw Error(y(329))}}}return ve(e,K()),e.callbackNode===n?Qa.bind(null,e):null}function $u(e,t){var n=Mn;return e.current.memoizedState.isDehydrated&&(Pt(e,t).flags|=256),e=rl(e,t),e!==2&&(t=de,de=n,t!==null&&Au(t)),e}function Au(e){de===null?de=e:de.push.apply(de,e)}function yd(e){for(var t=e;;){if(t.flags&16384){var n=t.updateQueue;if(n!==null&&(n=n.stores,n!==null))for(var r=0;r<n.length;r++){var l=n[r],u=l.getSnapshot;l=l.value;try{if(!De(u(),l))return!1}catch{return!1}}}if(n=t.child,t.subtreeFlags&16384&&n!==null)n.return=t,t=n;else{if(t===e)break;for(;t.sibling===null;){if(t.return===null||t.return===e)return!0;t=t.return}t.sibling.return=t.return,t=t.sibling}}return!0}function lt(e,t){for(t&=~_i,t&=~hl,e.suspendedLanes|=t,e.pingedLanes&=~t,e=e.expirationTimes;0<t;){var n=31-Me(t),r=1<<n;e[n]=-1,t&=~r}}function Ao(e){if(O&6)throw Error(y(327));nn();var t=$r(e,0);if(!(t&1))return ve(e,K()),null;var n=rl(e,t);if(e.tag!==0&&n===2){var r=fu(e);r!==0&&(t=r,n=$u(e,r))}if(n===1)throw n=qn,Pt(e,0),lt(e,t),ve(e,K()),n;if(n===6)throw Error(y(345));return e.finishedWork=e.current.alternate,e.finishedLanes=t,Et(e,de,Be),ve(e,K()),null}function Pi(e,t){var n=O;O|=1;try{return e(t)}finally{O=n,O===0&&(cn=K()+500,fl&&wt())}}function Ot(e){it!==null&&it.tag===0&&!(O&6)&&nn();var t=O;O|=1;var n=Pe.transition,r=M;try{if(Pe.transition=null,M=1,e)return e()}finally{M=r,Pe.transition=n,O=t,!(O&6)&&wt()}}function zi(){ge=Zt.current,U(Zt)}function Pt(e,t){e.finishedWork=null,e.finishedLanes=0;var n=e.timeoutHandle;if(n!==-1&&(e.timeoutHandle=-1,Yf(n)),X!==null)for(n=X.return;n!==null;){var r=n;switch(si(r),r.tag){case 1:r=r.type.childContextTypes,r!=null&&Hr();break;case 3:sn(),U(me),U(oe),yi();break;case 5:vi(r);break;case 4:sn();break;case 13:U(B);break;case 19:U(B);break;case 10:di(r.type._context);break;case 22:case 23:zi()}n=n.return}if(q=e,X=e=mt(e.current,null),ee=ge=t,Z=0,qn=null,_i=hl=Rt=0,de=Mn=null,_t!==null){for(t=0;t<_t.length;t++)if(n=_t[t],r=n.interleaved,r!==null){n.interleaved=null;var l=r.next,u=n.pending;if(u!==null){var i=u.next;u.next=l,r.next=i}n.pending=r}_t=null}return e}function Ka(e,t){do{var n=X;try{if(fi(),Lr.current=br,qr){for(var r=W.memoizedState;r!==null;){var l=r.queue;l!==null&&(l.pending=null),r=r.next}qr=!1}if(jt=0,J=G=W=null,Rn=!1,Gn=0,Ci.current=null,n===null||n.return===null){Z=1,qn=t,X=null;break}e:{var u=e,i=n.return,o=n,s=t;if(t=ee,o.flags|=32768,s!==null&&typeof s=="object"&&typeof s.then=="function"){var f=s,h=o,m=h.tag;if(!(h.mode&1)&&(m===0||m===11||m===15)){var p=h.alternate;p?(h.updateQueue=p.updateQueue,h.memoizedState=p.memoizedState,h.lanes=p.lanes):(h.updateQueue=null,h.memoizedState=null)}var g=Po(i);if(g!==null){g.flags&=-257,zo(g,i,o,u,t),g.mode&1&&No(u,f,t),t=g,s=f;var w=t.updateQueue;if(w===null){var k=new Set;k.add(s),t.updateQueue=k}else w.add(s);break e}else{if(!(t&1)){No(u,f,t),Li();break e}s=Error(y(426))}}else if(A&&o.mode&1){var I=Po(i);if(I!==null){!(I.flags&65536)&&(I.flags|=256),zo(I,i,o,u,t),ai(an(s,o));break e}}u=s=an(s,o),Z!==4&&(Z=2),Mn===null?Mn=[u]:Mn.push(u),u=i;do{switch(u.tag){case 3:u.flags|=65536,t&=-t,u.lanes|=t;var c=La(u,s,t);So(u,c);break e;case 1:o=s;var a=u.type,d=u.stateNode;if(!(u.flags&128)&&(typeof a.getDerivedStateFromError=="function"||d!==null&&typeof d.componentDidCatch=="function"&&(dt===null||!dt.has(d)))){u.flags|=65536,t&=-t,u.lanes|=t;var v=Ta(u,o,t);So(u,v);break e}}u=u.return}while(u!==null)}Ga(n)}catch(E){t=E,X===n&&n!==null&&(X=n=n.return);continue}break}while(!0)}function Ya(){var e=el.current;return el.current=br,e===null?br:e}function Li(){(Z===0||Z===3||Z===2)&&(Z=4),q===null||!(Rt&268435455)&&!(hl&268435455)||lt(q,ee)}function rl(e,t){var n=O;O|=2;var r=Ya();(q!==e||ee!==t)&&(Be=null,Pt(e,t));do try{gd();break}catch(l){Ka(e,l)}while(!0);if(fi(),O=n,el.current=r,X!==null)throw Error(y(261));return q=null,ee=0,Z}function gd(){for(;X!==null;)Xa(X)}function wd(){for(;X!==null&&!Wc();)Xa(X)}function Xa(e){var t=Ja(e.alternate,e,ge);e.memoizedProps=e.pendingProps,t===null?Ga(e):X=t,Ci.current=null}function Ga(e){var t=e;do{var n=t.alternate;if(e=t.return,t.flags&32768){if(n=dd(n,t),n!==null){n.flags&=32767,X=n;return}if(e!==null)e.flags|=32768,e.subtreeFlags=0,e.deletions=null;else{Z=6,X=null;return}}else if(n=fd(n,t,ge),n!==null){X=n;return}if(t=t.sibling,t!==null){X=t;return}X=t=e}while(t!==null);Z===0&&(Z=5)}function Et(e,t,n){var r=M,l=Pe.transition;try{Pe.transition=null,M=1,Sd(e,t,n,r)}finally{Pe.transition=l,M=r}return null}function Sd(e,t,n,r){do nn();while(it!==null);if(O&6)throw Error(y(327));n=e.finishedWork;var l=e.finishedLanes;if(n===null)return null;if(e.finishedWork=null,e.finishedLanes=0,n===e.current)throw Error(y(177));e.callbackNode=null,e.callbackPriority=0;var u=n.lanes|n.childLanes;if(bc(e,u),e===q&&(X=q=null,ee=0),!(n.subtreeFlags&2064)&&!(n.flags&2064)||kr||(kr=!0,qa(Ur,function(){return nn(),null})),u=(n.flags&15990)!==0,n.subtreeFlags&15990||u){u=Pe.transition,Pe.transition=null;var i=M;M=1;var o=O;O|=4,Ci.current=null,md(e,n),Wa(n,e),Af(yu),Ar=!!vu,yu=vu=null,e.current=n,hd(n),Hc(),O=o,M=i,Pe.transition=u}else e.current=n;if(kr&&(kr=!1,it=e,nl=l),u=e.pendingLanes,u===0&&(dt=null),Yc(n.stateNode),ve(e,K()),t!==null)for(r=e.onRecoverableError,n=0;n<t.length;n++)l=t[n],r(l.value,{componentStack:l.stack,digest:l.digest});if(tl)throw tl=!1,e=Fu,Fu=null,e;return nl&1&&e.tag!==0&&nn(),u=e.pendingLanes,u&1?e===Uu?In++:(In=0,Uu=e):In=0,wt(),null}function nn(){if(it!==null){var e=Ls(nl),t=Pe.transition,n=M;try{if(Pe.transition=null,M=16>e?16:e,it===null)var r=!1;else{if(e=it,it=null,nl=0,O&6)throw Error(y(331));var l=O;for(O|=4,_=e.current;_!==null;){var u=_,i=u.child;if(_.flags&16){var o=u.deletions;if(o!==null){for(var s=0;s<o.length;s++){var f=o[s];for(_=f;_!==null;){var h=_;switch(h.tag){case 0:case 11:case 15:On(8,h,u)}var m=h.child;if(m!==null)m.return=h,_=m;else for(;_!==null;){h=_;var p=h.sibling,g=h.return;if(Aa(h),h===f){_=null;break}if(p!==null){p.return=g,_=p;break}_=g}}}var w=u.alternate;if(w!==null){var k=w.child;if(k!==null){w.child=null;do{var I=k.sibling;k.sibling=null,k=I}while(k!==null)}}_=u}}if(u.subtreeFlags&2064&&i!==null)i.return=u,_=i;else e:for(;_!==null;){if(u=_,u.flags&2048)switch(u.tag){case 0:case 11:case 15:On(9,u,u.return)}var c=u.sibling;if(c!==null){c.return=u.return,_=c;break e}_=u.return}}var a=e.current;for(_=a;_!==null;){i=_;var d=i.child;if(i.subtreeFlags&2064&&d!==null)d.return=i,_=d;else e:for(i=a;_!==null;){if(o=_,o.flags&2048)try{switch(o.tag){case 0:case 11:case 15:ml(9,o)}}catch(E){Q(o,o.return,E)}if(o===i){_=null;break e}var v=o.sibling;if(v!==null){v.return=o.return,_=v;break e}_=o.return}}if(O=l,wt(),Ae&&typeof Ae.onPostCommitFiberRoot=="function")try{Ae.onPostCommitFiberRoot(il,e)}catch{}r=!0}return r}finally{M=n,Pe.transition=t}}return!1}function Vo(e,t,n){t=an(n,t),t=La(e,t,1),e=ft(e,t,1),t=ae(),e!==null&&(er(e,1,t),ve(e,t))}function Q(e,t,n){if(e.tag===3)Vo(e,e,n);else for(;t!==null;){if(t.tag===3){Vo(t,e,n);break}else if(t.tag===1){var r=t.stateNode;if(typeof t.type.getDerivedStateFromError=="function"||typeof r.componentDidCatch=="function"&&(dt===null||!dt.has(r))){e=an(n,e),e=Ta(t,e,1),t=ft(t,e,1),e=ae(),t!==null&&(er(t,1,e),ve(t,e));break}}t=t.return}}function kd(e,t,n){var r=e.pingCache;r!==null&&r.delete(t),t=ae(),e.pingedLanes|=e.suspendedLanes&n,q===e&&(ee&n)===n&&(Z===4||Z===3&&(ee&130023424)===ee&&500>K()-Ni?Pt(e,0):_i|=n),ve(e,t)}function Za(e,t){t===0&&(e.mode&1?(t=fr,fr<<=1,!(fr&130023424)&&(fr=4194304)):t=1);var n=ae();e=Ge(e,t),e!==null&&(er(e,t,n),ve(e,n))}function xd(e){var t=e.memoizedState,n=0;t!==null&&(n=t.retryLane),Za(e,n)}function Ed(e,t){var n=0;switch(e.tag){case 13:var r=e.stateNode,l=e.memoizedState;l!==null&&(n=l.retryLane);break;case 19:r=e.stateNode;break;default:throw Error(y(314))}r!==null&&r.delete(t),Za(e,n)}var Ja;Ja=function(e,t,n){if(e!==null)if(e.memoizedProps!==t.pendingProps||me.current)pe=!0;else{if(!(e.lanes&n)&&!(t.flags&128))return pe=!1,cd(e,t,n);pe=!!(e.flags&131072)}else pe=!1,A&&t.flags&1048576&&ta(t,Yr,t.index);switch(t.lanes=0,t.tag){case 2:var r=t.type;jr(e,t),e=t.pendingProps;var l=ln(t,oe.current);tn(t,n),l=wi(null,t,r,e,l,n);var u=Si();return t.flags|=1,typeof l=="object"&&l!==null&&typeof l.render=="function"&&l.$$typeof===void 0?(t.tag=1,t.memoizedState=null,t.updateQueue=null,he(r)?(u=!0,Qr(t)):u=!1,t.memoizedState=l.state!==null&&l.state!==void 0?l.state:null,mi(t),l.updater=pl,t.stateNode=l,l._reactInternals=t,Nu(t,r,e,n),t=Lu(null,t,r,!0,u,n)):(t.tag=0,A&&u&&oi(t),se(null,t,l,n),t=t.child),t;case 16:r=t.elementType;e:{switch(jr(e,t),e=t.pendingProps,l=r._init,r=l(r._payload),t.type=r,l=t.tag=_d(r),e=je(r,e),l){case 0:t=zu(null,t,r,e,n);break e;case 1:t=jo(null,t,r,e,n);break e;case 11:t=Lo(null,t,r,e,n);break e;case 14:t=To(null,t,r,je(r.type,e),n);break e}throw Error(y(306,r,""))}return t;case 0:return r=t.type,l=t.pendingProps,l=t.elementType===r?l:je(r,l),zu(e,t,r,l,n);case 1:return r=t.type,l=t.pendingProps,l=t.elementType===r?l:je(r,l),jo(e,t,r,l,n);case 3:e:{if(Ma(t),e===null)throw Error(y(387));r=t.pendingProps,u=t.memoizedState,l=u.element,oa(e,t),Zr(t,r,null,n);var i=t.memoizedState;if(r=i.element,u.isDehydrated)if(u={element:r,isDehydrated:!1,cache:i.cache,pendingSuspenseBoundaries:i.pendingSuspenseBoundaries,transitions:i.transitions},t.updateQueue.baseState=u,t.memoizedState=u,t.flags&256){l=an(Error(y(423)),t),t=Ro(e,t,r,n,l);break e}else if(r!==l){l=an(Error(y(424)),t),t=Ro(e,t,r,n,l);break e}else for(we=ct(t.stateNode.containerInfo.firstChild),Se=t,A=!0,Oe=null,n=ua(t,null,r,n),t.child=n;n;)n.flags=n.flags&-3|4096,n=n.sibling;else{if(un(),r===l){t=Ze(e,t,n);break e}se(e,t,r,n)}t=t.child}return t;case 5:return sa(t),e===null&&Eu(t),r=t.type,l=t.pendingProps,u=e!==null?e.memoizedProps:null,i=l.children,gu(r,l)?i=null:u!==null&&gu(r,u)&&(t.flags|=32),Oa(e,t),se(e,t,i,n),t.child;case 6:return e===null&&Eu(t),null;case 13:return Ia(e,t,n);case 4:return hi(t,t.stateNode.containerInfo),r=t.pendingProps,e===null?t.child=on(t,null,r,n):se(e,t,r,n),t.child;case 11:return r=t.type,l=t.pendingProps,l=t.elementType===r?l:je(r,l),Lo(e,t,r,l,n);case 7:return se(e,t,t.pendingProps,n),t.child;case 8:return se(e,t,t.pendingProps.children,n),t.child;case 12:return se(e,t,t.pendingProps.children,n),t.child;case 10:e:{if(r=t.type._context,l=t.pendingProps,u=t.memoizedProps,i=l.value,D(Xr,r._currentValue),r._currentValue=i,u!==null)if(De(u.value,i)){if(u.children===l.children&&!me.current){t=Ze(e,t,n);break e}}else for(u=t.child,u!==null&&(u.return=t);u!==null;){var o=u.dependencies;if(o!==null){i=u.child;for(var s=o.firstContext;s!==null;){if(s.context===r){if(u.tag===1){s=Ke(-1,n&-n),s.tag=2;var f=u.updateQueue;if(f!==null){f=f.shared;var h=f.pending;h===null?s.next=s:(s.next=h.next,h.next=s),f.pending=s}}u.lanes|=n,s=u.alternate,s!==null&&(s.lanes|=n),Cu(u.return,n,t),o.lanes|=n;break}s=s.next}}else if(u.tag===10)i=u.type===t.type?null:u.child;else if(u.tag===18){if(i=u.return,i===null)throw Error(y(341));i.lanes|=n,o=i.alternate,o!==null&&(o.lanes|=n),Cu(i,n,t),i=u.sibling}else i=u.child;if(i!==null)i.return=u;else for(i=u;i!==null;){if(i===t){i=null;break}if(u=i.sibling,u!==null){u.return=i.return,i=u;break}i=i.return}u=i}se(e,t,l.children,n),t=t.child}return t;case 9:return l=t.type,r=t.pendingProps.children,tn(t,n),l=ze(l),r=r(l),t.flags|=1,se(e,t,r,n),t.child;case 14:return r=t.type,l=je(r,t.pendingProps),l=je(r.type,l),To(e,t,r,l,n);case 15:return ja(e,t,t.type,t.pendingProps,n);case 17:return r=t.type,l=t.pendingProps,l=t.elementType===r?l:je(r,l),jr(e,t),t.tag=1,he(r)?(e=!0,Qr(t)):e=!1,tn(t,n),za(t,r,l),Nu(t,r,l,n),Lu(null,t,r,!0,e,n);case 19:return Da(e,t,n);case 22:return Ra(e,t,n)}throw Error(y(156,t.tag))};function qa(e,t){return _s(e,t)}function Cd(e,t,n,r){this.tag=e,this.key=n,this.sibling=this.child=this.return=this.stateNode=this.type=this.elementType=null,this.index=0,this.ref=null,this.pendingProps=t,this.dependencies=this.memoizedState=this.updateQueue=this.memoizedProps=null,this.mode=r,this.subtreeFlags=this.flags=0,this.deletions=null,this.childLanes=this.lanes=0,this.alternate=null}function Ne(e,t,n,r){return new Cd(e,t,n,r)}function Ti(e){return e=e.prototype,!(!e||!e.isReactComponent)}function _d(e){if(typeof e=="function")return Ti(e)?1:0;if(e!=null){if(e=e.$$typeof,e===Gu)return 11;if(e===Zu)return 14}return 2}function mt(e,t){var n=e.alternate;return n===null?(n=Ne(e.tag,t,e.key,e.mode),n.elementType=e.elementType,n.type=e.type,n.stateNode=e.stateNode,n.alternate=e,e.alternate=n):(n.pendingProps=t,n.type=e.type,n.flags=0,n.subtreeFlags=0,n.deletions=null),n.flags=e.flags&14680064,n.childLanes=e.childLanes,n.lanes=e.lanes,n.child=e.child,n.memoizedProps=e.memoizedProps,n.memoizedState=e.memoizedState,n.updateQueue=e.updateQueue,t=e.dependencies,n.dependencies=t===null?null:{lanes:t.lanes,firstContext:t.firstContext},n.sibling=e.sibling,n.index=e.index,n.ref=e.ref,n}function Mr(e,t,n,r,l,u){var i=2;if(r=e,typeof e=="function")Ti(e)&&(i=1);else if(typeof e=="string")i=5;else e:switch(e){case At:return zt(n.children,l,u,t);case Xu:i=8,l|=8;break;case Zl:return e=Ne(12,n,t,l|2),e.elementType=Zl,e.lanes=u,e;case Jl:return e=Ne(13,n,t,l),e.elementType=Jl,e.lanes=u,e;case ql:return e=Ne(19,n,t,l),e.elementType=ql,e.lanes=u,e;case ss:return vl(n,l,u,t);default:if(typeof e=="object"&&e!==null)switch(e.$$typeof){case is:i=10;break e;case os:i=9;break e;case Gu:i=11;break e;case Zu:i=14;break e;case tt:i=16,r=null;break e}throw Error(y(130,e==null?e:typeof e,""))}return t=Ne(i,n,t,l),t.elementType=e,t.type=r,t.lanes=u,t}function zt(e,t,n,r){return e=Ne(7,e,r,t),e.lanes=n,e}function vl(e,t,n,r){return e=Ne(22,e,r,t),e.elementType=ss,e.lanes=n,e.stateNode={isHidden:!1},e}function Kl(e,t,n){return e=Ne(6,e,null,t),e.lanes=n,e}function Yl(e,t,n){return t=Ne(4,e.children!==null?e.children:[],e.key,t),t.lanes=n,t.stateNode={containerInfo:e.containerInfo,pendingChildren:null,implementation:e.implementation},t}function Nd(e,t,n,r,l){this.tag=t,this.containerInfo=e,this.finishedWork=this.pingCache=this.current=this.pendingChildren=null,this.timeoutHandle=-1,this.callbackNode=this.pendingContext=this.context=null,this.callbackPriority=0,this.eventTimes=Pl(0),this.expirationTimes=Pl(-1),this.entangledLanes=this.finishedLanes=this.mutableReadLanes=this.expiredLanes=this.pingedLanes=this.suspendedLanes=this.pendingLanes=0,this.entanglements=Pl(0),this.identifierPrefix=r,this.onRecoverableError=l,this.mutableSourceEagerHydrationData=null}function ji(e,t,n,r,l,u,i,o,s){return e=new Nd(e,t,n,o,s),t===1?(t=1,u===!0&&(t|=8)):t=0,u=Ne(3,null,null,t),e.current=u,u.stateNode=e,u.memoizedState={element:r,isDehydrated:n,cache:null,transitions:null,pendingSuspenseBoundaries:null},mi(u),e}function Pd(e,t,n){var r=3<arguments.length&&arguments[3]!==void 0?arguments[3]:null;return{$$typeof:$t,key:r==null?null:""+r,children:e,containerInfo:t,implementation:n}}function ba(e){if(!e)return vt;e=e._reactInternals;e:{if(It(e)!==e||e.tag!==1)throw Error(y(170));var t=e;do{switch(t.tag){case 3:t=t.stateNode.context;break e;case 1:if(he(t.type)){t=t.stateNode.__reactInternalMemoizedMergedChildContext;break e}}t=t.return}while(t!==null);throw Error(y(171))}if(e.tag===1){var n=e.type;if(he(n))return bs(e,n,t)}return t}function ec(e,t,n,r,l,u,i,o,s){return e=ji(n,r,!0,e,l,u,i,o,s),e.context=ba(null),n=e.current,r=ae(),l=pt(n),u=Ke(r,l),u.callback=t??null,ft(n,u,l),e.current.lanes=l,er(e,l,r),ve(e,r),e}function yl(e,t,n,r){var l=t.current,u=ae(),i=pt(l);return n=ba(n),t.context===null?t.context=n:t.pendingContext=n,t=Ke(u,i),t.payload={element:e},r=r===void 0?null:r,r!==null&&(t.callback=r),e=ft(l,t,i),e!==null&&(Ie(e,l,i,u),zr(e,l,i)),i}function ll(e){if(e=e.current,!e.child)return null;switch(e.child.tag){case 5:return e.child.stateNode;default:return e.child.stateNode}}function Bo(e,t){if(e=e.memoizedState,e!==null&&e.dehydrated!==null){var n=e.retryLane;e.retryLane=n!==0&&n<t?n:t}}function Ri(e,t){Bo(e,t),(e=e.alternate)&&Bo(e,t)}function zd(){return null}var tc=typeof reportError=="function"?reportError:function(e){console.error(e)};function Oi(e){this._internalRoot=e}gl.prototype.render=Oi.prototype.render=function(e){var t=this._internalRoot;if(t===null)throw Error(y(409));yl(e,t,null,null)};gl.prototype.unmount=Oi.prototype.unmount=function(){var e=this._internalRoot;if(e!==null){this._internalRoot=null;var t=e.containerInfo;Ot(function(){yl(null,e,null,null)}),t[Xe]=null}};function gl(e){this._internalRoot=e}gl.prototype.unstable_scheduleHydration=function(e){if(e){var t=Rs();e={blockedOn:null,target:e,priority:t};for(var n=0;n<rt.length&&t!==0&&t<rt[n].priority;n++);rt.splice(n,0,e),n===0&&Ms(e)}};function Mi(e){return!(!e||e.nodeType!==1&&e.nodeType!==9&&e.nodeType!==11)}function wl(e){return!(!e||e.nodeType!==1&&e.nodeType!==9&&e.nodeType!==11&&(e.nodeType!==8||e.nodeValue!==" react-mount-point-unstable "))}function Wo(){}function Ld(e,t,n,r,l){if(l){if(typeof r=="function"){var u=r;r=function(){var f=ll(i);u.call(f)}}var i=ec(t,r,e,0,null,!1,!1,"",Wo);return e._reactRootContainer=i,e[Xe]=i.current,Hn(e.nodeType===8?e.parentNode:e),Ot(),i}for(;l=e.lastChild;)e.removeChild(l);if(typeof r=="function"){var o=r;r=function(){var f=ll(s);o.call(f)}}var s=ji(e,0,!1,null,null,!1,!1,"",Wo);return e._reactRootContainer=s,e[Xe]=s.current,Hn(e.nodeType===8?e.parentNode:e),Ot(function(){yl(t,s,n,r)}),s}function Sl(e,t,n,r,l){var u=n._reactRootContainer;if(u){var i=u;if(typeof l=="function"){var o=l;l=function(){var s=ll(i);o.call(s)}}yl(t,i,e,l)}else i=Ld(n,t,e,l,r);return ll(i)}Ts=function(e){switch(e.tag){case 3:var t=e.stateNode;if(t.current.memoizedState.isDehydrated){var n=_n(t.pendingLanes);n!==0&&(bu(t,n|1),ve(t,K()),!(O&6)&&(cn=K()+500,wt()))}break;case 13:Ot(function(){var r=Ge(e,1);if(r!==null){var l=ae();Ie(r,e,1,l)}}),Ri(e,1)}};ei=function(e){if(e.tag===13){var t=Ge(e,134217728);if(t!==null){var n=ae();Ie(t,e,134217728,n)}Ri(e,134217728)}};js=function(e){if(e.tag===13){var t=pt(e),n=Ge(e,t);if(n!==null){var r=ae();Ie(n,e,t,r)}Ri(e,t)}};Rs=function(){return M};Os=function(e,t){var n=M;try{return M=e,t()}finally{M=n}};su=function(e,t,n){switch(t){case"input":if(tu(e,n),t=n.name,n.type==="radio"&&t!=null){for(n=e;n.parentNode;)n=n.parentNode;for(n=n.querySelectorAll("input[name="+JSON.stringify(""+t)+'][type="radio"]'),t=0;t<n.length;t++){var r=n[t];if(r!==e&&r.form===e.form){var l=cl(r);if(!l)throw Error(y(90));cs(r),tu(r,l)}}}break;case"textarea":ds(e,n);break;case"select":t=n.value,t!=null&&Jt(e,!!n.multiple,t,!1)}};ws=Pi;Ss=Ot;var Td={usingClientEntryPoint:!1,Events:[nr,Ht,cl,ys,gs,Pi]},xn={findFiberByHostInstance:Ct,bundleType:0,version:"18.3.1",rendererPackageName:"react-dom"},jd={bundleType:xn.bundleType,version:xn.version,rendererPackageName:xn.rendererPackageName,rendererConfig:xn.rendererConfig,overrideHookState:null,overrideHookStateDeletePath:null,overrideHookStateRenamePath:null,overrideProps:null,overridePropsDeletePath:null,overridePropsRenamePath:null,setErrorHandler:null,setSuspenseHandler:null,scheduleUpdate:null,currentDispatcherRef:Je.ReactCurrentDispatcher,findHostInstanceByFiber:function(e){return e=Es(e),e===null?null:e.stateNode},findFiberByHostInstance:xn.findFiberByHostInstance||zd,findHostInstancesForRefresh:null,scheduleRefresh:null,scheduleRoot:null,setRefreshHandler:null,getCurrentFiber:null,reconcilerVersion:"18.3.1-next-f1338f8080-20240426"};if(typeof __REACT_DEVTOOLS_GLOBAL_HOOK__<"u"){var xr=__REACT_DEVTOOLS_GLOBAL_HOOK__;if(!xr.isDisabled&&xr.supportsFiber)try{il=xr.inject(jd),Ae=xr}catch{}}xe.__SECRET_INTERNALS_DO_NOT_USE_OR_YOU_WILL_BE_FIRED=Td;xe.createPortal=function(e,t){var n=2<arguments.length&&arguments[2]!==void 0?arguments[2]:null;if(!Mi(t))throw Error(y(200));return Pd(e,t,null,n)};xe.createRoot=function(e,t){if(!Mi(e))throw Error(y(299));var n=!1,r="",l=tc;return t!=null&&(t.unstable_strictMode===!0&&(n=!0),t.identifierPrefix!==void 0&&(r=t.identifierPrefix),t.onRecoverableError!==void 0&&(l=t.onRecoverableError)),t=ji(e,1,!1,null,null,n,!1,r,l),e[Xe]=t.current,Hn(e.nodeType===8?e.parentNode:e),new Oi(t)};xe.findDOMNode=function(e){if(e==null)return null;if(e.nodeType===1)return e;var t=e._reactInternals;if(t===void 0)throw typeof e.render=="function"?Error(y(188)):(e=Object.keys(e).join(","),Error(y(268,e)));return e=Es(t),e=e===null?null:e.stateNode,e};xe.flushSync=function(e){return Ot(e)};xe.hydrate=function(e,t,n){if(!wl(t))throw Error(y(200));return Sl(null,e,t,!0,n)};xe.hydrateRoot=function(e,t,n){if(!Mi(e))throw Error(y(405));var r=n!=null&&n.hydratedSources||null,l=!1,u="",i=tc;if(n!=null&&(n.unstable_strictMode===!0&&(l=!0),n.identifierPrefix!==void 0&&(u=n.identifierPrefix),n.onRecoverableError!==void 0&&(i=n.onRecoverableError)),t=ec(t,null,e,1,n??null,l,!1,u,i),e[Xe]=t.current,Hn(e),r)for(e=0;e<r.length;e++)n=r[e],l=n._getVersion,l=l(n._source),t.mutableSourceEagerHydrationData==null?t.mutableSourceEagerHydrationData=[n,l]:t.mutableSourceEagerHydrationData.push(n,l);return new gl(t)};xe.render=function(e,t,n){if(!wl(t))throw Error(y(200));return Sl(null,e,t,!1,n)};xe.unmountComponentAtNode=function(e){if(!wl(e))throw Error(y(40));return e._reactRootContainer?(Ot(function(){Sl(null,null,e,!1,function(){e._reactRootContainer=null,e[Xe]=null})}),!0):!1};xe.unstable_batchedUpdates=Pi;xe.unstable_renderSubtreeIntoContainer=function(e,t,n,r){if(!wl(n))throw Error(y(200));if(e==null||e._reactInternals===void 0)throw Error(y(38));return Sl(e,t,n,!1,r)};xe.version="18.3.1-next-f1338f8080-20240426";function nc(){if(!(typeof __REACT_DEVTOOLS_GLOBAL_HOOK__>"u"||typeof __REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE!="function"))try{__REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE(nc)}catch(e){console.error(e)}}nc(),ns.exports=xe;var Rd=ns.exports,rc,Ho=Rd;rc=Ho.createRoot,Ho.hydrateRoot;function Xl(e,t=16){const n=(e||"").toLowerCase(),r={width:t,height:t};return n.includes("gpt")||n.includes("o4")||n.startsWith("openai")?C.jsx("span",{title:"GPT",style:r,children:"🤖"}):n.includes("claude")?C.jsx("span",{title:"Claude",style:r,children:"🧠"}):n.includes("gemini")?C.jsx("span",{title:"Gemini",style:r,children:"✨"}):n.includes("llama")||n.includes("llama3")||n.includes("llama-")?C.jsx("span",{title:"Llama",style:r,children:"🦙"}):n.includes("mistral")?C.jsx("span",{title:"Mistral",style:r,children:"🌬️"}):n.includes("qwen")?C.jsx("span",{title:"Qwen",style:r,children:"🐉"}):n.includes("deepseek")?C.jsx("span",{title:"DeepSeek",style:r,children:"🕵️"}):n.includes("mixtral")?C.jsx("span",{title:"Mixtral",style:r,children:"🌪️"}):n.includes("phi")?C.jsx("span",{title:"Phi",style:r,children:"🧩"}):C.jsx("span",{title:"Model",style:r,children:"🔷"})}function Od(e,t=16){const n=(e||"").toLowerCase(),r={width:t,height:t};return n.includes("openrouter")?C.jsx("span",{title:"OpenRouter",style:r,children:"⛵"}):n.includes("openai")?C.jsx("span",{title:"OpenAI",style:r,children:"⭕"}):n.includes("anthropic")?C.jsx("span",{title:"Anthropic",style:r,children:"🅰️"}):n.includes("gemini")||n.includes("google")?C.jsx("span",{title:"Google",style:r,children:"🅶"}):n.includes("azure")?C.jsx("span",{title:"Azure",style:r,children:"🅰️"}):n.includes("ollama")?C.jsx("span",{title:"Ollama",style:r,children:"🐏"}):C.jsx("span",{title:"Provider",style:r,children:"🔹"})}async function Ut(e,t){const n=await fetch(e,t);if(!n.ok)throw new Error(`${n.status}`);return n.json()}function Md(){const[e,t]=ue.useState([]),[n,r]=ue.useState(""),[l,u]=ue.useState(null),[i,o]=ue.useState([{role:"system",content:"You are a helpful assistant."}]),[s,f]=ue.useState(""),[h,m]=ue.useState("openai"),[p,g]=ue.useState(""),[w,k]=ue.useState([]),[I,c]=ue.useState(!1),[a,d]=ue.useState(!1),[v,E]=ue.useState(""),P=ue.useMemo(()=>e.filter(S=>(S.title||"").toLowerCase().includes(n.toLowerCase())),[e,n]);ue.useEffect(()=>{(async()=>(await N(),await ye()))()},[]);async function N(){var ne;const S=await Ut("/api/conversations");t(S.conversations||[]),!l&&((ne=S.conversations)!=null&&ne[0])&&await z(S.conversations[0].id)}async function z(S){u(S);const ne=await Ut(`/api/conversations/${encodeURIComponent(S)}`);o(ne.messages||[{role:"system",content:"You are a helpful assistant."}])}async function V(){const S=await Ut("/api/conversations",{method:"POST",headers:{"Content-Type":"application/json"},body:JSON.stringify({})});u(S.id),await N(),await z(S.id)}async function j(S){await Ut(`/api/conversations/${encodeURIComponent(S.id)}`,{method:"PATCH",headers:{"Content-Type":"application/json"},body:JSON.stringify({pinned:!S.pinned})}),await N()}async function ye(){const S=await Ut("/api/settings");S.provider&&m(S.provider),await qe(S.provider||h),S.model&&g(S.model)}async function qe(S){const ne=await Ut(`/api/models?provider=${encodeURIComponent(S)}`);k(ne.models||[])}async function be(){const S=s.trim();if(!S||!l)return;f("");const ne={role:"user",content:S},Dt=[...i,ne];o(Dt);const mn=window.location.protocol==="https:"?"wss":"ws",x=new WebSocket(`${mn}://${window.location.host}/ws/chat`);c(!0);let L="";E(""),x.onopen=()=>{x.send(JSON.stringify({messages:Dt,provider:h,model:p,conversation_id:l,reasoning:a}))},x.onmessage=T=>{const $=T.data;if($==="[END]"){c(!1),o(Y=>[...Y,{role:"assistant",content:L}]),E(""),N();return}L+=$,E(L)},x.onerror=()=>c(!1),x.onclose=()=>c(!1)}return C.jsxs("div",{className:"h-screen grid grid-cols-[300px_1fr] gap-0",children:[C.jsxs("aside",{className:"border-r border-white/10 bg-slate-900/60 backdrop-blur",children:[C.jsxs("div",{className:"p-3 flex items-center gap-2",children:[C.jsx("button",{className:"btn-primary",onClick:V,children:"New"}),C.jsx("input",{className:"ml-auto bg-slate-800/60 border border-white/10 rounded px-2 py-1 w-full",placeholder:"Search",value:n,onChange:S=>r(S.target.value)})]}),C.jsx("div",{className:"px-3 space-y-1 overflow-y-auto h-[calc(100vh-48px)]",children:P.map(S=>C.jsxs("div",{className:`flex items-center gap-2 px-2 py-2 rounded hover:bg-white/5 cursor-pointer ${S.id===l?"bg-white/10":""}`,onClick:()=>z(S.id),children:[C.jsxs("div",{className:"flex-1 truncate",children:[C.jsx("div",{className:"text-sm font-medium",children:S.title||"Conversation"}),C.jsx("div",{className:"text-xs text-slate-400",children:S.updated_at?new Date(S.updated_at).toLocaleString():""})]}),C.jsx("button",{className:"text-yellow-400",title:S.pinned?"Unpin":"Pin",onClick:ne=>{ne.stopPropagation(),j(S)},children:S.pinned?"★":"☆"})]},S.id))})]}),C.jsxs("main",{className:"flex flex-col min-h-0",children:[C.jsxs("header",{className:"flex items-center justify-between px-4 py-2 border-b border-white/10 bg-slate-900/60 backdrop-blur",children:[C.jsx("h1",{className:"font-semibold",children:"ChatUI"}),C.jsxs("div",{className:"flex items-center gap-2",children:[C.jsxs("div",{className:"flex items-center gap-1 text-sm text-slate-300",children:[Od(h,16),C.jsx("span",{className:"hidden md:inline",children:h})]}),C.jsxs("select",{className:"bg-slate-800/60 border border-white/10 rounded px-2 py-1",value:h,onChange:S=>{m(S.target.value),qe(S.target.value)},children:[C.jsx("option",{value:"openai",children:"OpenAI"}),C.jsx("option",{value:"openrouter",children:"OpenRouter"}),C.jsx("option",{value:"azure",children:"Azure OpenAI"}),C.jsx("option",{value:"anthropic",children:"Anthropic"}),C.jsx("option",{value:"gemini",children:"Gemini"}),C.jsx("option",{value:"ollama",children:"Ollama (local)"})]}),C.jsxs("div",{className:"flex items-center gap-1 text-sm text-slate-300",children:[Xl(p,16),C.jsx("span",{className:"hidden md:inline",children:p||"model"})]}),C.jsxs("select",{className:"bg-slate-800/60 border border-white/10 rounded px-2 py-1",value:p,onChange:S=>g(S.target.value),children:[C.jsx("option",{value:"",children:"Select a model"}),w.map(S=>C.jsx("option",{value:S.id,children:S.name||S.id},S.id))]}),C.jsxs("label",{className:"text-sm flex items-center gap-1",children:[C.jsx("input",{type:"checkbox",checked:a,onChange:S=>d(S.target.checked)})," Reasoning"]})]})]}),C.jsxs("div",{className:"flex-1 overflow-y-auto p-4",children:[i.filter(S=>S.role!=="system").length===0&&C.jsxs("div",{className:"max-w-2xl mx-auto p-4 rounded-lg border border-white/10 bg-slate-900/60",children:[C.jsx("div",{className:"mb-2 text-slate-300",children:"Try one of these"}),C.jsx("div",{className:"flex flex-wrap gap-2",children:["Summarize an article","Write Python","Explain a concept","Create a plan"].map((S,ne)=>C.jsx("button",{className:"px-3 py-1 rounded border border-white/10 hover:bg-white/5",onClick:()=>f(S),children:S},ne))})]}),C.jsxs("div",{className:"max-w-3xl mx-auto space-y-3",children:[i.filter(S=>S.role!=="system").map((S,ne)=>C.jsxs("div",{className:`flex gap-3 ${S.role==="user"?"justify-end":""}`,children:[S.role==="assistant"&&C.jsx("div",{className:"w-8 h-8 rounded-full bg-brand flex items-center justify-center",children:Xl(p,16)}),C.jsx("div",{className:`rounded-2xl px-3 py-2 border ${S.role==="user"?"bg-slate-800/60 border-white/10":"bg-slate-900/60 border-white/10"}`,style:{maxWidth:"80%"},children:C.jsx("div",{className:"whitespace-pre-wrap text-slate-100 text-sm",children:S.content})}),S.role==="user"&&C.jsx("div",{className:"w-8 h-8 rounded-full bg-brand flex items-center justify-center",children:"U"})]},ne)),v&&C.jsxs("div",{className:"flex gap-3",children:[C.jsx("div",{className:"w-8 h-8 rounded-full bg-brand flex items-center justify-center",children:Xl(p,16)}),C.jsx("div",{className:"rounded-2xl px-3 py-2 border bg-slate-900/60 border-white/10",style:{maxWidth:"80%"},children:C.jsx("div",{className:"whitespace-pre-wrap text-slate-100 text-sm",children:v})})]})]})]}),C.jsxs("form",{className:"border-t border-white/10 p-3 flex items-end gap-2 bg-slate-900/60",onSubmit:S=>{S.preventDefault(),be()},children:[C.jsx("textarea",{className:"flex-1 bg-slate-800/60 border border-white/10 rounded-md p-2 min-h-[44px] max-h-40",placeholder:"Ask something...",value:s,onChange:S=>f(S.target.value),onKeyDown:S=>{S.key==="Enter"&&!S.shiftKey&&(S.preventDefault(),be())}}),C.jsx("button",{className:"btn-primary",disabled:!s.trim()||I,type:"submit",children:"Send"})]})]})]})}const Id=document.getElementById("root");rc(Id).render(C.jsx(Sc.StrictMode,{children:C.jsx(Md,{})}));
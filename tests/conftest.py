@@ -0,0 +1,28 @@
+import pytest
+
+from backend.storage import ConversationStore
+
+
+@pytest.fixture
+def store(tmp_path):
+    return ConversationStore(tmp_path / "conversations", write_behind_delay=0)
+
+
+@pytest.fixture
+def app_module(tmp_path, monkeypatch, store):
+    """backend.app with its stores and settings file moved into ``tmp_path``."""
+    import backend.app as A
+    from backend.usage import UsageStore
+
+    monkeypatch.setattr(A, "store", store)
+    monkeypatch.setattr(A, "usage_store", UsageStore(tmp_path / "usage"))
+    monkeypatch.setattr(A, "SETTINGS_PATH", tmp_path / "settings.json")
+    return A
+
+
+@pytest.fixture
+def client(app_module):
+    from fastapi.testclient import TestClient
+
+    # No lifespan: the startup tasks (asset scan, SDK imports) are not needed here
+    return TestClient(app_module.app)
@@ -0,0 +1,89 @@
+import gzip
+import io
+import json
+
+import pytest
+
+from backend import archive
+from backend.storage import ConversationStore
+
+
+def _conv(cid, updated="2024-01-01T00:00:00Z", text="hi"):
+    return {"id": cid, "title": cid, "updated_at": updated, "messages": [{"role": "user", "content": text}]}
+
+
+def _export(store, fmt, compression):
+    return b"".join(archive.export_stream(store, fmt, compression))
+
+
+@pytest.mark.parametrize("fmt", archive.FORMATS)
+@pytest.mark.parametrize("compression", [c for c in archive.COMPRESSIONS if c != "zstd" or archive.zstandard])
+def test_export_import_round_trip(tmp_path, fmt, compression):
+    src = ConversationStore(tmp_path / "src", write_behind_delay=0)
+    for i in range(3):
+        src.save(f"c{i}", _conv(f"c{i}", text=f"m{i}"))
+    data = _export(src, fmt, compression)
+
+    records = list(archive.read_archive(io.BytesIO(data)))
+    assert sorted(r["id"] for r in records) == ["c0", "c1", "c2"]
+    dst = ConversationStore(tmp_path / "dst", write_behind_delay=0)
+    assert dst.import_conversations(records) == {"imported": 3, "replaced": 0, "skipped": 0}
+    assert dst.load("c1")["messages"][0]["content"] == "m1"
+
+
+def test_bad_entries_are_reported_not_fatal():
+    lines = [json.dumps(_conv("ok")), "{broken", json.dumps({"id": "../x", "messages": []}), ""]
+    records = list(archive.read_archive(io.BytesIO("\n".join(lines).encode())))
+    assert [r["id"] for r in records if isinstance(r, dict)] == ["ok"]
+    errors = [r for r in records if isinstance(r, str)]
+    assert errors[0].startswith("line 2: invalid JSON")
+    assert "invalid id" in errors[1]
+
+
+@pytest.mark.parametrize("policy,expected", [("newer", "new"), ("skip", "old"), ("replace", "old2")])
+def test_duplicates_within_a_batch_follow_the_policy(policy, expected):
+    records = iter([
+        _conv("c", "2024-01-02T00:00:00Z", "new"),
+        _conv("c", "2024-01-01T00:00:00Z", "old"),
+    ])
+    if policy == "skip":
+        records = iter([_conv("c", text="old"), _conv("c", text="new")])
+    elif policy == "replace":
+        records = iter([_conv("c", text="old1"), _conv("c", text="old2")])
+    batch, errors, duplicates = archive.next_batch(records, 10, policy)
+    assert (len(batch), errors, duplicates) == (1, [], 1)
+    assert batch[0]["messages"][0]["content"] == expected
+
+
+def test_check_options():
+    with pytest.raises(ValueError):
+        archive.check_options("zip", "none")
+    with pytest.raises(ValueError):
+        archive.check_options("ndjson", "bz2")
+
+
+# --- Endpoints ---
+
+def test_import_endpoint_merges_by_policy(client, store):
+    store.save("c1", _conv("c1", "2024-01-02T00:00:00Z", "stored"))
+    upload = gzip.compress("\n".join(json.dumps(c) for c in [
+        _conv("c1", "2024-01-01T00:00:00Z", "older"),
+        _conv("c2", text="new"),
+    ]).encode())
+    r = client.post("/api/import", content=upload)
+    summary = r.json()
+    assert r.status_code == 200
+    assert (summary["imported"], summary["skipped"]) == (1, 1)
+    assert store.load("c1")["messages"][0]["content"] == "stored"
+
+    r = client.post("/api/import?on_conflict=replace", content=upload)
+    assert r.json()["replaced"] == 2
+    assert store.load("c1")["messages"][0]["content"] == "older"
+
+
+def test_export_endpoint(client, store):
+    store.save("c1", _conv("c1"))
+    r = client.get("/api/export?format=tar&compression=gzip")
+    assert r.headers["content-type"] == "application/gzip"
+    assert [c["id"] for c in archive.read_archive(io.BytesIO(r.content))] == ["c1"]
+    assert client.get("/api/export?format=zip").status_code == 400
@@ -0,0 +1,31 @@
+import json
+
+
+def _lines(r):
+    return sorted((json.loads(line) for line in r.text.splitlines()), key=lambda x: x.get("index", -1))
+
+
+def test_every_item_gets_a_line(client, app_module, monkeypatch):
+    async def batch_item(index, item, defaults):
+        if item.get("explode"):
+            raise KeyError("boom")
+        return {"index": index, "answer": item["prompt"]}
+
+    monkeypatch.setattr(app_module, "_batch_item", batch_item)
+    body = "\n".join([json.dumps({"prompt": "a"}), json.dumps({"explode": True}), "{not json", json.dumps({"prompt": "d"})])
+    r = client.post("/api/chat/batch", content=body, headers={"Content-Type": "application/x-ndjson"})
+    assert r.status_code == 200
+    lines = _lines(r)
+    assert [x["index"] for x in lines] == [0, 1, 2, 3]
+    assert lines[0]["answer"] == "a"
+    assert lines[1]["error"] == "'boom'"
+    assert lines[2]["error"].startswith("invalid JSON")
+    assert lines[3]["answer"] == "d"
+
+
+def test_provider_error_is_reported_per_item(client, app_module, monkeypatch):
+    monkeypatch.setattr(app_module, "chat_once", lambda *a, **kw: "[Provider error: rate limited]")
+    r = client.post("/api/chat/batch", json={"items": [{"prompt": "a"}]})
+    (line,) = _lines(r)
+    assert line["error"] == "rate limited"
+    assert "answer" not in line
@@ -0,0 +1,62 @@
+import asyncio
+
+from backend.coalesce import Coalescer, request_key, wanted
+
+
+def test_wanted_is_opt_in():
+    assert not wanted({}, {})
+    assert wanted({"coalesce": True}, {})
+    assert wanted({}, {"coalesce_requests": True})
+    assert not wanted({"coalesce": False}, {"coalesce_requests": True})
+
+
+def test_request_key_is_canonical():
+    a = request_key("chat", provider="p", model="m", messages=[{"role": "user", "content": "q"}])
+    b = request_key("chat", messages=[{"content": "q", "role": "user"}], model="m", provider="p")
+    assert a == b
+    assert a != request_key("chat", provider="p", model="m2", messages=[{"role": "user", "content": "q"}])
+    assert a != request_key("stream", provider="p", model="m", messages=[{"role": "user", "content": "q"}])
+
+
+def test_identical_calls_share_one_run():
+    calls = []
+
+    async def run():
+        c = Coalescer()
+
+        async def factory():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return "answer"
+
+        results = await asyncio.gather(*(c.run("k", factory) for _ in range(3)))
+        # Nothing is kept once the call is done
+        later = await c.run("k", factory)
+        return results, later, c.joined
+
+    results, later, joined = asyncio.run(run())
+    assert [r for r, _ in results] == ["answer"] * 3
+    assert [j for _, j in results] == [False, True, True]
+    assert later == ("answer", False)
+    assert joined == 2
+    assert len(calls) == 2
+
+
+def test_leader_leaving_does_not_stop_the_call():
+    async def run():
+        c = Coalescer()
+        done = asyncio.Event()
+
+        async def factory():
+            await asyncio.sleep(0.02)
+            done.set()
+            return "answer"
+
+        leader = asyncio.ensure_future(c.run("k", factory))
+        await asyncio.sleep(0)
+        joiner = asyncio.ensure_future(c.run("k", factory))
+        await asyncio.sleep(0)
+        leader.cancel()
+        return await joiner, done.is_set()
+
+    assert asyncio.run(run()) == (("answer", True), True)
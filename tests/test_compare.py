@@ -0,0 +1,38 @@
+def _fake_stream(messages, provider=None, model=None, on_usage=None):
+    if provider == "down":
+        # chat_once's fallback reports failures as reply text
+        yield "[Provider error: 503 Service Unavailable]"
+        return
+    yield "Reasoning: think\nAnswer: "
+    yield f"from {provider}"
+
+
+def _compare(client, app_module, monkeypatch, targets, **body):
+    monkeypatch.setattr(app_module, "chat_stream", _fake_stream)
+    return client.post("/api/chat/compare", json={
+        "targets": [{"provider": p, "model": "m"} for p in targets],
+        "messages": [{"role": "user", "content": "q"}],
+        **body,
+    })
+
+
+def test_failed_target_reports_error_not_content(client, app_module, monkeypatch):
+    r = _compare(client, app_module, monkeypatch, ["down", "up"])
+    down, up = r.json()["results"]
+    assert down["error"] == "503 Service Unavailable"
+    assert down["content"] == ""
+    assert "error" not in up
+    assert up["content"] == "from up"
+    assert up["reasoning"] == "think"
+
+
+def test_failed_target_is_not_chosen_and_counts_as_error(client, app_module, monkeypatch, store):
+    client.post("/api/conversations", json={"id": "c1", "title": "t"})
+    _compare(client, app_module, monkeypatch, ["down", "up"], conversation_id="c1")
+    reply = store.load("c1", cache=False)["messages"][-1]
+    assert reply["content"] == "from up"
+    assert [a.get("error") for a in reply["alternatives"]] == ["503 Service Unavailable", None]
+
+    rows = app_module.usage_store.query(granularity="total")["rows"]
+    errors = {row["provider"]: row["errors"] for row in rows}
+    assert errors == {"down": 1, "up": 0}
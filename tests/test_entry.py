@@ -0,0 +1,67 @@
+import socket
+
+import pytest
+
+
+@pytest.fixture
+def entry(monkeypatch):
+    # Importing the launcher sets these defaults for the process; keep them scoped
+    monkeypatch.setenv("FERN_LAUNCH_T0", "0")
+    monkeypatch.setenv("FERN_WRITE_BEHIND_MS", "0")
+    import backend.entry as E
+    return E
+
+
+@pytest.fixture
+def taken():
+    sock = socket.socket()
+    sock.bind(("127.0.0.1", 0))
+    sock.listen()
+    yield sock.getsockname()[1]
+    sock.close()
+
+
+def test_bind_prefers_the_given_port(entry):
+    probe = socket.socket()
+    probe.bind(("127.0.0.1", 0))
+    port = probe.getsockname()[1]
+    probe.close()
+    sock = entry.bind_socket("127.0.0.1", port, fallback=True)
+    try:
+        assert sock.getsockname()[1] == port
+    finally:
+        sock.close()
+
+
+def test_bind_falls_back_when_port_is_taken(entry, taken):
+    sock = entry.bind_socket("127.0.0.1", taken, fallback=True)
+    try:
+        assert sock.getsockname()[1] not in (0, taken)
+    finally:
+        sock.close()
+
+
+def test_explicit_port_is_strict(entry, taken):
+    with pytest.raises(OSError):
+        entry.bind_socket("127.0.0.1", taken)
+
+
+def test_describe_tcp(entry):
+    sock = entry.bind_socket("127.0.0.1", 0)
+    try:
+        info = entry.describe(sock)
+        assert info["url"] == f"http://127.0.0.1:{info['port']}"
+    finally:
+        sock.close()
+
+
+@pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="no Unix domain sockets")
+def test_describe_uds_has_no_url(entry, tmp_path):
+    path = str(tmp_path / "fern.sock")
+    sock = entry.bind_socket(uds=path)
+    try:
+        info = entry.describe(sock)
+        assert info["uds"] == path
+        assert "url" not in info
+    finally:
+        sock.close()
@@ -0,0 +1,60 @@
+def _new(client, cid="c1"):
+    client.post("/api/conversations", json={"id": cid, "title": "t"})
+    return cid
+
+
+def test_append_edit_delete_truncate(client):
+    cid = _new(client)
+    r = client.post(f"/api/conversations/{cid}/messages", json={"messages": [
+        {"role": "user", "content": "a"},
+        {"role": "assistant", "content": "b"},
+        {"role": "user", "content": "c"},
+    ]})
+    assert r.status_code == 200
+    ids = [m["id"] for m in r.json()["messages"]]
+
+    r = client.patch(f"/api/conversations/{cid}/messages/{ids[1]}", json={"content": "B"})
+    assert r.json()["message"]["content"] == "B"
+
+    client.delete(f"/api/conversations/{cid}/messages/{ids[2]}")
+    conv = client.get(f"/api/conversations/{cid}").json()
+    assert [m["content"] for m in conv["messages"]] == ["a", "B"]
+
+    r = client.post(f"/api/conversations/{cid}/truncate", json={"after": ids[0]})
+    assert r.json()["count"] == 1
+
+
+def test_etag_tracks_version(client):
+    cid = _new(client)
+    r = client.get(f"/api/conversations/{cid}")
+    etag = r.headers["ETag"]
+    r = client.post(f"/api/conversations/{cid}/messages", json={"role": "user", "content": "x"}, headers={"If-Match": etag})
+    assert r.status_code == 200
+    assert r.headers["ETag"] != etag
+
+
+def test_stale_if_match_is_rejected(client):
+    cid = _new(client)
+    stale = client.get(f"/api/conversations/{cid}").headers["ETag"]
+    client.post(f"/api/conversations/{cid}/messages", json={"role": "user", "content": "first"})
+    r = client.post(f"/api/conversations/{cid}/messages", json={"role": "user", "content": "second"}, headers={"If-Match": stale})
+    assert r.status_code == 412
+    assert [m["content"] for m in client.get(f"/api/conversations/{cid}").json()["messages"]] == ["first"]
+
+    r = client.patch(f"/api/conversations/{cid}", json={"title": "x"}, headers={"If-Match": stale})
+    assert r.status_code == 412
+
+
+def test_unknown_message_and_conversation(client):
+    cid = _new(client)
+    assert client.patch(f"/api/conversations/{cid}/messages/nope", json={"content": "x"}).status_code == 404
+    assert client.post("/api/conversations/missing/messages", json={"role": "user", "content": "x"}).status_code == 404
+    assert client.post(f"/api/conversations/{cid}/messages", json={"role": "bogus"}).status_code == 400
+
+
+def test_append_after_delete_is_not_found(client):
+    cid = _new(client)
+    client.delete(f"/api/conversations/{cid}")
+    r = client.post(f"/api/conversations/{cid}/messages", json={"role": "user", "content": "late"})
+    assert r.status_code == 404
+    assert cid not in [c["id"] for c in client.get("/api/conversations").json()["conversations"]]
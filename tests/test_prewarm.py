@@ -0,0 +1,55 @@
+import types
+
+import pytest
+
+from backend import llm
+
+
+class FakeHttp:
+    def __init__(self, limits=None):
+        self.limits = limits
+        self.heads = []
+
+    def head(self, url, timeout=None):
+        self.heads.append(url)
+
+
+class FakeOpenAI:
+    def __init__(self, api_key=None, base_url=None, http_client=None):
+        self.base_url = base_url or "https://api.openai.com/v1/"
+        self.http_client = http_client
+
+
+@pytest.fixture
+def fake_openai(monkeypatch):
+    module = types.SimpleNamespace(OpenAI=FakeOpenAI, DefaultHttpxClient=FakeHttp)
+    monkeypatch.setattr(llm, "sdk", lambda name: module if name == "openai" else None)
+    monkeypatch.setattr(llm, "_clients", {})
+    monkeypatch.setattr(llm, "_transports", {})
+    monkeypatch.setenv("OPENAI_API_KEY", "sk-test")
+    return module
+
+
+def test_prewarm_connects_through_the_injected_http_client(fake_openai):
+    report = llm.prewarm_provider("openai", "gpt-4o-mini")
+    assert report["ok"], report
+    client = llm._compat_client("openai")
+    assert client.http_client.heads == ["https://api.openai.com/v1/"]
+    assert client.http_client.limits.keepalive_expiry == llm.POOL_KEEPALIVE
+
+
+def test_prewarm_reuses_the_pooled_client(fake_openai):
+    llm.prewarm_provider("openai", "m")
+    llm.prewarm_provider("openai", "m")
+    assert len(llm._clients) == 1
+    assert llm._compat_client("openai").http_client.heads == ["https://api.openai.com/v1/"] * 2
+
+
+def test_prewarm_reports_a_missing_key(fake_openai, monkeypatch):
+    monkeypatch.delenv("OPENAI_API_KEY")
+    report = llm.prewarm_provider("openai", "m")
+    assert report == {**report, "ok": False, "error": "provider not configured"}
+
+
+def test_unknown_provider_is_not_configured():
+    assert llm.prewarm_provider("nope", "m")["ok"] is False
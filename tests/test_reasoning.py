@@ -0,0 +1,75 @@
+import random
+
+import pytest
+
+from backend.reasoning import ANSWER, ANSWER_RESET, REASONING, ReasoningDelta, ReasoningSplitter, split_reasoning
+
+CASES = [
+    ("plain answer", (None, "plain answer")),
+    ("Reasoning: think\nAnswer: 42", ("think", "42")),
+    ("**Reasoning:** think\n\n**Answer:** 42", ("think", "42")),
+    ("Reasoning: think\n\nthe answer", ("think", "the answer")),
+    # "Answer:" takes precedence over an earlier blank line
+    ("Reasoning: step one\n\nstep two\nAnswer: 42", ("step one\n\nstep two", "42")),
+    ("Reasoning: a\n\nb\n\n**Answer:** c", ("a\n\nb", "c")),
+    # Never got to an answer: the reply is kept whole
+    ("Reasoning: only this", ("only this", "Reasoning: only this")),
+]
+
+
+@pytest.mark.parametrize("text,expected", CASES)
+def test_split(text, expected):
+    assert split_reasoning(text) == expected
+
+
+def _feed(chunks):
+    splitter = ReasoningSplitter()
+    pieces = []
+    for c in chunks:
+        pieces += splitter.feed(c)
+    pieces += splitter.close()
+    return splitter.result(), pieces
+
+
+def _replay(pieces):
+    """What a client applying the pieces in order ends up showing."""
+    channels = {REASONING: "", ANSWER: ""}
+    for channel, text in pieces:
+        if channel == ANSWER_RESET:
+            assert channels[ANSWER].endswith(text)
+            channels[ANSWER] = channels[ANSWER][: len(channels[ANSWER]) - len(text)]
+        else:
+            channels[channel] += text
+    return channels[REASONING], channels[ANSWER]
+
+
+@pytest.mark.parametrize("text,expected", CASES)
+def test_split_does_not_depend_on_chunking(text, expected):
+    assert _feed(list(text))[0] == expected
+    rng = random.Random(text)
+    for _ in range(20):
+        cuts = sorted(rng.sample(range(1, len(text)), min(3, len(text) - 1)))
+        chunks = [text[i:j] for i, j in zip([0] + cuts, cuts + [len(text)])]
+        (reasoning, answer), pieces = _feed(chunks)
+        assert (reasoning, answer) == expected
+        if reasoning is not None and answer != text:
+            # Live pieces add up to the final split (the kept-whole case aside)
+            streamed = _replay(pieces)
+            assert (streamed[0].strip(), streamed[1].strip()) == expected
+
+
+def test_answer_streams_before_the_reply_ends():
+    splitter = ReasoningSplitter()
+    assert splitter.feed("Reasoning: think\nAnswer: ") == [(REASONING, "think")]
+    assert splitter.feed("forty") == [(ANSWER, "forty")]
+
+
+def test_late_marker_takes_the_answer_back():
+    _, pieces = _feed(["Reasoning: one\n\n", "two\n", "Answer: 42"])
+    assert pieces[-3:] == [(ANSWER_RESET, "two"), (REASONING, "\n\ntwo"), (ANSWER, "42")]
+    assert _replay(pieces) == ("one\n\ntwo", "42")
+
+
+def test_native_reasoning_passes_through():
+    (reasoning, answer), _ = _feed([ReasoningDelta("hmm"), "42"])
+    assert (reasoning, answer) == ("hmm", "42")
@@ -0,0 +1,85 @@
+import json
+
+
+def _events(text):
+    events = []
+    for block in text.split("\n\n"):
+        fields = {}
+        for line in block.splitlines():
+            name, _, value = line.partition(": ")
+            fields[name] = value
+        if "event" in fields:
+            events.append((fields["event"], json.loads(fields["data"]), fields.get("id")))
+    return events
+
+
+def _fake_stream(messages, provider=None, model=None, on_usage=None):
+    yield "Reasoning: think"
+    yield "\nAnswer: forty"
+    yield " two"
+    if on_usage:
+        on_usage({"prompt_tokens": 3, "completion_tokens": 2, "cached_tokens": 0})
+
+
+def test_stream_events_and_saved_reply(client, app_module, monkeypatch, store):
+    monkeypatch.setattr(app_module, "chat_stream", _fake_stream)
+    client.post("/api/conversations", json={"id": "c1", "title": "t"})
+    r = client.post("/api/chat/stream", json={"messages": [{"role": "user", "content": "q"}], "conversation_id": "c1"})
+    assert r.headers["content-type"].startswith("text/event-stream")
+    events = _events(r.text)
+    assert [e[0] for e in events] == ["start", "reasoning", "token", "token", "usage", "end"]
+    assert "".join(d["text"] for kind, d, _ in events if kind == "token") == "forty two"
+    end = events[-1][1]
+    assert (end["reasoning"], end["answer"], end["error"]) == ("think", "forty two", None)
+    assert events[-2][1]["prompt_tokens"] == 3
+
+    reply = store.load("c1")["messages"][-1]
+    assert reply["id"] == end["message_id"]
+    assert (reply["content"], reply["reasoning"]) == ("forty two", "think")
+
+
+def test_late_answer_marker_is_taken_back(client, app_module, monkeypatch, store):
+    def late_marker(messages, provider=None, model=None, on_usage=None):
+        yield "Reasoning: step one\n\n"
+        yield "step two continues here\n"
+        yield "Answer: 42"
+
+    monkeypatch.setattr(app_module, "chat_stream", late_marker)
+    client.post("/api/conversations", json={"id": "c1", "title": "t"})
+    r = client.post("/api/chat/stream", json={"messages": [{"role": "user", "content": "q"}], "conversation_id": "c1"})
+    answer = reasoning = ""
+    for kind, d, _ in _events(r.text):
+        if kind == "token":
+            answer += d["text"]
+        elif kind == "reasoning":
+            reasoning += d["text"]
+        elif kind == "answer_reset":
+            assert answer.endswith(d["text"])
+            answer = answer[: len(answer) - len(d["text"])]
+    assert answer == "42"
+    assert reasoning == "step one\n\nstep two continues here"
+    reply = store.load("c1")["messages"][-1]
+    assert (reply["content"], reply["reasoning"]) == ("42", "step one\n\nstep two continues here")
+
+
+def test_resume_from_last_event_id(client, app_module, monkeypatch):
+    monkeypatch.setattr(app_module, "chat_stream", _fake_stream)
+    r = client.post("/api/chat/stream", json={"messages": [{"role": "user", "content": "q"}], "stream_id": "s-resume"})
+    events = _events(r.text)
+    # The client saw up to the first answer chunk
+    seen = next(eid for kind, d, eid in events if kind == "token")
+    r = client.get("/api/chat/stream/s-resume", headers={"Last-Event-ID": seen})
+    resumed = _events(r.text)
+    assert resumed[0][1]["offset"] == int(seen)
+    assert [d["text"] for kind, d, _ in resumed if kind == "token"] == [" two"]
+
+
+def test_unknown_stream(client):
+    assert client.get("/api/chat/stream/nope").status_code == 404
+
+
+def test_stream_id_in_use(client, app_module, monkeypatch):
+    monkeypatch.setattr(app_module, "chat_stream", _fake_stream)
+    body = {"messages": [{"role": "user", "content": "q"}], "stream_id": "s-taken"}
+    client.post("/api/chat/stream", json=body)
+    assert client.post("/api/chat/stream", json=body).status_code == 409
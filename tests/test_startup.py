@@ -0,0 +1,51 @@
+import subprocess
+import sys
+import types
+from pathlib import Path
+
+from backend import llm
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+def test_importing_the_app_loads_no_provider_sdk():
+    code = (
+        "import sys; import backend.app; "
+        "print(sorted(m for m in ('openai', 'anthropic', 'google.generativeai', 'ollama', 'httpx') if m in sys.modules))"
+    )
+    out = subprocess.run([sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True, timeout=60)
+    assert out.returncode == 0, out.stderr
+    assert out.stdout.strip().splitlines()[-1] == "[]"
+
+
+def test_sdk_is_imported_once_and_timed(monkeypatch):
+    calls = []
+    fake = types.ModuleType("fake_sdk")
+
+    def import_module(name):
+        calls.append(name)
+        return fake
+
+    monkeypatch.setattr(llm, "_sdks", {})
+    monkeypatch.setattr(llm, "sdk_import_ms", {})
+    monkeypatch.setattr(llm.importlib, "import_module", import_module)
+    assert llm.sdk("openai") is fake
+    assert llm.sdk("openai") is fake
+    assert calls == ["openai"]
+    assert "openai" in llm.sdk_import_ms
+
+
+def test_missing_sdk_resolves_to_none(monkeypatch):
+    def import_module(name):
+        raise ImportError(name)
+
+    monkeypatch.setattr(llm, "_sdks", {})
+    monkeypatch.setattr(llm.importlib, "import_module", import_module)
+    assert llm.sdk("anthropic") is None
+
+
+def test_startup_report(client):
+    client.get("/api/health")
+    report = client.get("/api/startup").json()
+    assert "import_ms" in report and "first_health_ms" in report
+    assert report["budget_ms"] > 0
@@ -0,0 +1,77 @@
+import gzip
+
+import pytest
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.routing import Mount, Route
+from starlette.testclient import TestClient
+
+from backend.static import IMMUTABLE, REVALIDATE, AssetFiles, IndexPage, live_assets, orphans, precompress
+
+BUNDLE = "index-AbCd1234.js"
+OLD_BUNDLE = "index-Old12345.js"
+
+
+@pytest.fixture
+def dist(tmp_path):
+    (tmp_path / "assets").mkdir()
+    (tmp_path / "index.html").write_text(f'<script src="/assets/{BUNDLE}"></script>' + " " * 2000)
+    (tmp_path / "assets" / BUNDLE).write_text("import './chunk-XyZw9876.js';" + "x" * 4000)
+    (tmp_path / "assets" / "chunk-XyZw9876.js").write_text("y" * 10)
+    (tmp_path / "assets" / OLD_BUNDLE).write_text("old")
+    (tmp_path / "favicon.svg").write_text("<svg/>")
+    return tmp_path
+
+
+def _client(dist):
+    index = IndexPage(dist / "index.html")
+    app = Starlette(routes=[
+        Route("/", lambda request: index.response(request)),
+        Mount("/", AssetFiles(directory=dist, live=live_assets(dist))),
+    ])
+    return TestClient(app)
+
+
+def test_live_assets_follow_index_and_bundles(dist):
+    assert live_assets(dist) == {f"assets/{BUNDLE}", "assets/chunk-XyZw9876.js"}
+    assert orphans(dist) == [dist / "assets" / OLD_BUNDLE]
+
+
+def test_hashed_files_are_immutable_and_compressed(dist):
+    client = _client(dist)
+    r = client.get(f"/assets/{BUNDLE}", headers={"Accept-Encoding": "gzip"})
+    assert r.headers["cache-control"] == IMMUTABLE
+    assert r.headers["content-encoding"] == "gzip"
+    assert r.text.startswith("import")
+    r = client.get("/favicon.svg")
+    assert r.headers["cache-control"] == REVALIDATE
+    assert "content-encoding" not in r.headers
+
+
+def test_stale_bundles_are_not_served(dist):
+    assert _client(dist).get(f"/assets/{OLD_BUNDLE}").status_code == 404
+
+
+def test_precompressed_variant_is_preferred(dist):
+    assert precompress(dist) >= 1
+    variant = dist / "assets" / f"{BUNDLE}.gz"
+    assert gzip.decompress(variant.read_bytes()).startswith(b"import")
+    r = _client(dist).get(f"/assets/{BUNDLE}", headers={"Accept-Encoding": "gzip"})
+    assert r.headers["content-encoding"] == "gzip"
+
+
+def test_etag_revalidation(dist):
+    client = _client(dist)
+    etag = client.get("/favicon.svg").headers["etag"]
+    assert client.get("/favicon.svg", headers={"If-None-Match": etag}).status_code == 304
+
+
+def test_index_page_from_memory_tracks_the_file(dist):
+    client = _client(dist)
+    r = client.get("/", headers={"Accept-Encoding": "gzip"})
+    assert r.headers["content-encoding"] == "gzip"
+    etag = r.headers["etag"]
+    assert client.get("/", headers={"If-None-Match": etag}).status_code == 304
+    (dist / "index.html").write_text("<p>rebuilt</p>")
+    r = client.get("/", headers={"If-None-Match": etag})
+    assert r.status_code == 200 and r.text == "<p>rebuilt</p>"
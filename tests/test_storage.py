@@ -0,0 +1,239 @@
+import asyncio
+
+import pytest
+
+from backend import storage
+from backend.storage import ConversationNotFound, ConversationStore, MessageNotFound, VersionConflict
+
+
+def _conv(cid="c1", n=0):
+    return {"id": cid, "title": "t", "messages": [{"role": "user", "content": f"m{i}"} for i in range(n)]}
+
+
+def test_message_ops_go_to_the_journal(store):
+    store.save("c1", _conv(n=1))
+    conv = store.append_messages("c1", [{"role": "assistant", "content": "hi"}])
+    assert store.journal_path("c1").exists()
+    mid = conv["messages"][1]["id"]
+    store.edit_message("c1", mid, {"content": "hello", "partial": True})
+    store.edit_message("c1", mid, {"partial": False})
+    fresh = ConversationStore(store.root, write_behind_delay=0).load("c1")
+    assert fresh["messages"][1]["content"] == "hello"
+    assert "partial" not in fresh["messages"][1]
+    assert fresh["version"] == 4
+
+
+def test_torn_journal_tail_is_ignored(store):
+    store.save("c1", _conv(n=1))
+    store.append_messages("c1", [{"role": "assistant", "content": "ok"}])
+    with open(store.journal_path("c1"), "ab") as f:
+        f.write(b'{"op": "append", "v": 9')
+    fresh = ConversationStore(store.root, write_behind_delay=0)
+    assert [m["content"] for m in fresh.load("c1")["messages"]] == ["m0", "ok"]
+    for text in ("two", "three"):
+        fresh.append_messages("c1", [{"role": "user", "content": text}])
+    again = ConversationStore(store.root, write_behind_delay=0).load("c1")
+    assert [m["content"] for m in again["messages"]] == ["m0", "ok", "two", "three"]
+    assert again["version"] == 4
+    assert store.journal_path("c1").read_bytes().endswith(b"\n")
+
+
+def test_journal_missing_only_its_newline_keeps_the_record(store):
+    store.save("c1", _conv(n=1))
+    store.append_messages("c1", [{"role": "assistant", "content": "ok"}])
+    path = store.journal_path("c1")
+    path.write_bytes(path.read_bytes().rstrip(b"\n"))
+    fresh = ConversationStore(store.root, write_behind_delay=0)
+    fresh.append_messages("c1", [{"role": "user", "content": "next"}])
+    again = ConversationStore(store.root, write_behind_delay=0).load("c1")
+    assert [m["content"] for m in again["messages"]] == ["m0", "ok", "next"]
+
+
+def test_message_ops_do_not_revive_a_deleted_conversation(store):
+    store.save("c1", _conv(n=1))
+    store.delete("c1")
+    with pytest.raises(ConversationNotFound):
+        store.append_messages("c1", [{"role": "user", "content": "late"}])
+    assert not store.exists("c1")
+
+
+def test_journal_is_compacted(store, monkeypatch):
+    monkeypatch.setattr(storage, "JOURNAL_COMPACT_OPS", 3)
+    store.save("c1", _conv())
+    for i in range(3):
+        store.append_messages("c1", [{"role": "user", "content": str(i)}])
+    assert not store.journal_path("c1").exists()
+    assert len(store.load("c1")["messages"]) == 3
+
+
+def test_expected_version(store):
+    store.save("c1", _conv(n=1))
+    with pytest.raises(VersionConflict) as e:
+        store.append_messages("c1", [{"role": "user", "content": "x"}], expected_version=0)
+    assert e.value.current == 1
+    with pytest.raises(MessageNotFound):
+        store.delete_message("c1", "missing")
+
+
+def test_save_later_coalesces_and_is_readable(tmp_path):
+
+    store = ConversationStore(tmp_path, write_behind_delay=0.05)
+
+    async def run():
+        store.save_later("c1", _conv(n=1))
+        store.save_later("c1", _conv(n=2))
+        assert len(store.load("c1")["messages"]) == 2  # visible before the flush
+        assert store.find_snapshot("c1") is None
+        await asyncio.sleep(0.2)
+
+    asyncio.run(run())
+    assert len(ConversationStore(tmp_path).load("c1")["messages"]) == 2
+
+
+def test_contended_lock_waits_off_the_event_loop(store):
+    from backend.storage import _FileLock
+
+    other = _FileLock(store.lock_dir / "c1.lock")  # stands in for another worker
+    assert other.acquire()
+
+    async def run():
+        ticks = 0
+        entered = asyncio.Event()
+
+        async def writer():
+            async with store.lock("c1"):
+                entered.set()
+
+        task = asyncio.create_task(writer())
+        for _ in range(5):
+            await asyncio.sleep(0.01)
+            ticks += 1
+        assert not entered.is_set()
+        other.release()
+        await asyncio.wait_for(task, 2)
+        return ticks
+
+    assert asyncio.run(run()) == 5
+    assert not store._flocks
+
+
+def test_lock_held_on_the_loop_is_not_shared_with_threads(store):
+    store.save("c1", _conv(n=1))
+
+    async def run():
+        async with store.lock("c1"):
+            # Re-entrant on the loop's thread, exclusive for a worker thread
+            assert store._acquire("c1", blocking=False)
+            store._release("c1")
+            return await asyncio.to_thread(store._acquire, "c1", False)
+
+    assert asyncio.run(run()) is False
+    assert not store._flocks
+
+
+def test_background_migration_alongside_writes(tmp_path):
+    store = ConversationStore(tmp_path, write_behind_delay=0, compression="none")
+    for i in range(5):
+        store.save(f"c{i}", _conv(f"c{i}", n=1))
+    store.compression = "gzip"
+
+    async def run():
+        async def write(cid):
+            for _ in range(5):
+                async with store.lock(cid):
+                    store.append_messages(cid, [{"role": "user", "content": "more"}])
+                await asyncio.sleep(0)
+
+        migration = asyncio.create_task(store.migrate_in_background(pause=0))
+        await asyncio.gather(*(write(f"c{i}") for i in range(5)))
+        return await migration
+
+    asyncio.run(run())
+    for i in range(5):
+        assert len(ConversationStore(tmp_path, write_behind_delay=0).load(f"c{i}")["messages"]) == 6
+    assert not store._flocks
+
+
+# --- cache ---
+
+def test_cache_serves_repeat_reads_as_copies(store):
+    store.save("c1", _conv(n=2))
+    store.load("c1")
+    before = store.cache_info()["hits"]
+    conv = store.load("c1")
+    assert store.cache_info()["hits"] == before + 1
+    conv["messages"].append({"role": "user", "content": "not saved"})
+    conv["title"] = "changed"
+    again = store.load("c1")
+    assert len(again["messages"]) == 2
+    assert again["title"] == "t"
+
+
+def test_cache_notices_writes_from_another_process(store):
+    store.save("c1", _conv(n=1))
+    store.load("c1")
+    other = ConversationStore(store.root, write_behind_delay=0)
+    other.append_messages("c1", [{"role": "assistant", "content": "from elsewhere"}])
+    assert store.load("c1")["messages"][-1]["content"] == "from elsewhere"
+
+
+def test_cache_stays_within_its_byte_limit(tmp_path):
+    store = ConversationStore(tmp_path, write_behind_delay=0, cache_bytes=2000)
+    for i in range(10):
+        store.save(f"c{i}", _conv(f"c{i}", n=5))
+        store.load(f"c{i}")
+    info = store.cache_info()
+    assert 0 < info["entries"] < 10
+    assert info["bytes"] <= 2000
+    # Least recently used go first
+    assert "c9" in store._cache and "c0" not in store._cache
+
+
+def test_uncached_reads_leave_the_cache_alone(tmp_path):
+    store = ConversationStore(tmp_path, write_behind_delay=0)
+    store.save("c1", _conv(n=1))
+    store._forget("c1")
+    store.load("c1", cache=False)
+    assert store.cache_info()["entries"] == 0
+
+
+# --- compressed snapshots ---
+
+COMPRESSIONS = [c for c in storage.SNAPSHOT_FORMATS if c != "zstd" or storage.zstandard is not None]
+
+
+@pytest.mark.parametrize("compression", COMPRESSIONS)
+def test_snapshot_formats_read_back(tmp_path, compression):
+    store = ConversationStore(tmp_path, write_behind_delay=0, compression=compression, cache_bytes=0)
+    store.save("c1", _conv(n=3))
+    assert store.find_snapshot("c1").name == "c1" + storage.SNAPSHOT_FORMATS[compression]
+    # Every format is readable whatever the store writes
+    plain = ConversationStore(tmp_path, write_behind_delay=0, cache_bytes=0)
+    assert [m["content"] for m in plain.load("c1")["messages"]] == ["m0", "m1", "m2"]
+
+
+@pytest.mark.parametrize("compression", [c for c in COMPRESSIONS if c != "none"])
+def test_migrate_converts_and_keeps_the_version(tmp_path, compression):
+    store = ConversationStore(tmp_path, write_behind_delay=0, compression="none")
+    store.save("c1", _conv(n=50))
+    store.append_messages("c1", [{"role": "assistant", "content": "journaled"}])
+    version = store.load("c1")["version"]
+
+    converted, before, after = store.migrate(compression)
+    assert converted == 1 and after < before
+    assert store.find_snapshot("c1").name.endswith(storage.SNAPSHOT_FORMATS[compression])
+    assert not store.journal_path("c1").exists()
+    conv = ConversationStore(tmp_path, write_behind_delay=0).load("c1")
+    assert conv["version"] == version
+    assert conv["messages"][-1]["content"] == "journaled"
+    # Already converted: left alone
+    assert store.migrate(compression)[0] == 0
+
+
+def test_unreadable_snapshot_is_set_aside(tmp_path):
+    store = ConversationStore(tmp_path, write_behind_delay=0, compression="gzip")
+    store.save("c1", _conv(n=1))
+    store.find_snapshot("c1").write_bytes(b"\x1f\x8b not gzip")
+    store._forget("c1")
+    assert store.load("c1")["messages"] == []
+    assert list(tmp_path.glob("c1.json.gz.corrupt-*"))
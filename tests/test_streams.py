@@ -0,0 +1,138 @@
+import asyncio
+
+import pytest
+
+from backend import streams
+
+
+def _run(coro):
+    return asyncio.run(coro)
+
+
+def test_follow_replays_from_offset():
+    async def go():
+        s = streams.StreamSession("s1")
+        for c in ("a", "b", "c"):
+            s.push(c)
+        s.finish()
+        return [c async for c in s.follow(1)]
+
+    assert _run(go()) == ["b", "c"]
+
+
+def test_follow_waits_for_new_chunks():
+    async def go():
+        s = streams.StreamSession("s2")
+        seen = []
+
+        async def reader():
+            async for c in s.follow():
+                seen.append(c)
+
+        t = asyncio.ensure_future(reader())
+        await asyncio.sleep(0)
+        s.push("x")
+        await asyncio.sleep(0)
+        s.push("y")
+        s.finish()
+        await t
+        return seen
+
+    assert _run(go()) == ["x", "y"]
+
+
+def test_cancel_after_finish_lets_finalizer_run():
+    async def go():
+        saved = []
+
+        async def on_finish(st):
+            await asyncio.sleep(0.01)
+            saved.append(st.text())
+
+        s = streams.StreamSession("s3")
+        s.task = asyncio.ensure_future(streams.pump(s, iter(["a", "b"]), on_finish=on_finish))
+        while not s.done:
+            await asyncio.sleep(0.001)
+        s.cancel()
+        await s.task
+        return saved
+
+    assert _run(go()) == ["ab"]
+
+
+# --- Generations saved into a conversation ---
+
+def _fake_stream(chunks, fail=None):
+    def chat_stream(messages, provider=None, model=None, on_usage=None):
+        yield from chunks
+        if fail:
+            raise RuntimeError(fail)
+    return chat_stream
+
+
+def _generate(A, monkeypatch, chunks, fail=None, cid="c1"):
+    monkeypatch.setattr(A, "chat_stream", _fake_stream(chunks, fail))
+
+    def start(session, chunks, checkpoint=None, on_finish=None):
+        # Checkpoint after every chunk
+        session.task = asyncio.ensure_future(streams.pump(session, chunks, checkpoint, on_finish, interval=0.0))
+        return session
+
+    monkeypatch.setattr(streams, "start", start)
+
+    async def go():
+        s = await A._open_stream([{"role": "user", "content": "q"}], [], "p", "m", cid)
+        await s.task
+        return s
+
+    return _run(go())
+
+
+def test_checkpoints_journal_only_new_text(app_module, monkeypatch, store):
+    chunks = ["word " * 200] * 30
+    s = _generate(app_module, monkeypatch, chunks)
+    conv = store.load("c1", cache=False)
+    reply = conv["messages"][-1]
+    assert reply["id"] == s.message_id
+    assert reply["content"] == "".join(chunks)
+    assert "partial" not in reply
+    # Linear in the reply: far below the sum of every checkpoint's full text
+    assert store.journal_path("c1").stat().st_size < 3 * len("".join(chunks))
+
+
+def test_checkpoint_after_a_late_answer_marker_rewrites_the_reply(app_module, monkeypatch, store):
+    seen = []
+    update = app_module._update_message
+
+    async def watch(cid, mid, fields, extend=False):
+        await update(cid, mid, fields, extend)
+        reply = store.load(cid, cache=False)["messages"][-1]
+        seen.append((reply.get("reasoning"), reply["content"]))
+
+    monkeypatch.setattr(app_module, "_update_message", watch)
+    _generate(app_module, monkeypatch, ["Reasoning: one\n\n", "two\n", "Answer: 42"])
+    # Once the marker arrives, "two" is no longer saved as answer text
+    assert seen[2] == ("one\n\ntwo", "42")
+    assert seen[-1] == ("one\n\ntwo", "42")
+
+
+def test_failed_stream_keeps_text_and_clears_partial(app_module, monkeypatch, store):
+    _generate(app_module, monkeypatch, ["half ", "a reply"], fail="boom")
+    reply = store.load("c1", cache=False)["messages"][-1]
+    assert reply["content"] == "half a reply"
+    assert "partial" not in reply
+
+
+def test_failed_stream_without_text_leaves_no_reply(app_module, monkeypatch, store):
+    _generate(app_module, monkeypatch, [], fail="boom")
+    assert [m["role"] for m in store.load("c1", cache=False)["messages"]] == ["user"]
+
+
+def test_refused_stream_records_nothing(app_module, monkeypatch, store):
+    def refuse(*a, **kw):
+        raise RuntimeError("too many concurrent streams")
+
+    monkeypatch.setattr(streams, "create", refuse)
+    with pytest.raises(RuntimeError):
+        _run(app_module._open_stream([{"role": "user", "content": "q"}], [], "p", "m", "c1"))
+    assert not store.exists("c1")
@@ -0,0 +1,50 @@
+import json
+import time
+
+from backend.llm import usage_from
+from backend.usage import UsageStore, _cost, _metrics
+
+
+def test_anthropic_prompt_includes_cached_tokens():
+    raw = {"input_tokens": 10, "output_tokens": 5, "cache_read_input_tokens": 90, "cache_creation_input_tokens": 20}
+    assert usage_from("anthropic", raw) == {"prompt_tokens": 120, "completion_tokens": 5, "cached_tokens": 90}
+
+
+def test_openai_usage_is_unchanged():
+    raw = {"prompt_tokens": 100, "completion_tokens": 5, "prompt_tokens_details": {"cached_tokens": 90}}
+    assert usage_from("openai", raw) == {"prompt_tokens": 100, "completion_tokens": 5, "cached_tokens": 90}
+
+
+def test_cost_of_a_cached_anthropic_call():
+    usage = usage_from("anthropic", {"input_tokens": 10, "output_tokens": 0, "cache_read_input_tokens": 90})
+    price = {"prompt": 3.0, "cached": 0.3, "completion": 15.0}
+    # 10 uncached + 90 cached prompt tokens
+    assert _cost(price, _metrics(usage)) == (10 * 3.0 + 90 * 0.3) / 1_000_000
+
+
+def _totals(store):
+    rows = store.query(granularity="total", group_by=[])["rows"]
+    return rows[0] if rows else {}
+
+
+def test_workers_sharing_a_directory_add_up(tmp_path):
+    a, b = UsageStore(tmp_path), UsageStore(tmp_path)
+    usage = {"prompt_tokens": 10, "completion_tokens": 1}
+    for _ in range(3):
+        a.record("openai", "m", usage)
+        b.record("openai", "m", usage)
+    for store in (a, b, UsageStore(tmp_path)):
+        assert _totals(store)["requests"] == 6
+        assert _totals(store)["prompt_tokens"] == 60
+    day = time.strftime("%Y-%m-%d", time.gmtime())
+    assert json.loads((tmp_path / "hourly" / f"{day}.json").read_text())["_n"] == 6
+
+
+def test_rollups_catch_up_with_the_raw_log(tmp_path):
+    store = UsageStore(tmp_path)
+    store.record("openai", "m", {"prompt_tokens": 1})
+    # A crash between the raw append and the rollup write
+    day = time.strftime("%Y-%m-%d", time.gmtime())
+    with open(tmp_path / "raw" / f"{day}.ndjson", "a") as fh:
+        fh.write(json.dumps({"ts": time.time(), "provider": "openai", "model": "m", "prompt_tokens": 2}) + "\n")
+    assert _totals(UsageStore(tmp_path))["prompt_tokens"] == 3
@@ -194,6 +194,15 @@ export default function App() {
     applyModelTheme(provider, model)
   }, [provider, model])
 
+  // Open the provider connection (and load Ollama models) before the first prompt.
+  // Only from the model selector, for a model the user just picked: the model
+  // restored at startup (or left over from another provider) may never be
+  // used, and Ollama would keep it loaded
+  function prewarm(prov: string, mdl: string) {
+    if (!prov || !mdl) return
+    fetch('/api/prewarm', { method: 'POST', headers: { 'Content-Type': 'application/json' }, body: JSON.stringify({ provider: prov, model: mdl }) }).catch(()=>{})
+  }
+
   useEffect(() => {
     // auto scroll on new content unless user scrolled up
     const el = scrollRef.current
@@ -519,7 +528,7 @@ export default function App() {
               <select className="shrink-0 w-[8.25rem] sm:w-[10.5rem] md:w-[12.5rem]" value={provider} onChange={async e=>{ const p=e.target.value; setProvider(p); await populateModels(p); }}>
                 {['openai','openrouter','anthropic','gemini','azure','ollama','together','fireworks','perplexity','mistral','deepseek','cohere','litellm','vllm'].map(p => <option key={p} value={p}>{p}</option>)}
               </select>
-              <select className="shrink-0 w-[10.5rem] md:w-[15rem] lg:w-[19rem]" value={model} onChange={e=>setModel(e.target.value)}>
+              <select className="shrink-0 w-[10.5rem] md:w-[15rem] lg:w-[19rem]" value={model} onChange={e=>{ setModel(e.target.value); prewarm(provider, e.target.value) }}>
                 <option value="">Select a model</option>
                 {models.map(m => <option key={m.id} value={m.id}>{m.name||m.id}</option>)}
               </select>
@@ -17,6 +17,8 @@ export default defineConfig({
   },
   build: {
     outDir: './dist',
+    // .vite/manifest.json tells the backend which hashed bundles are current
+    manifest: true,
     emptyOutDir: true,
   },
 })